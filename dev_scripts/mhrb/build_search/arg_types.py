@@ -0,0 +1,29 @@
+"""
+Filename: arg_types.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+argparse argument types shared by the build search scripts.
+"""
+
+import argparse
+
+def skill_level(s):
+    """
+    Parses SKILL_ID=LEVEL into (skill ID, level).
+    """
+    (skill_id, sep, level) = s.partition("=")
+    if (sep == "") or (not level.isdigit()):
+        raise argparse.ArgumentTypeError(f"Expected SKILL_ID=LEVEL, got: {s}")
+    return (skill_id, int(level))
+
+def slot_sizes(s):
+    """
+    Parses comma-separated decoration slot sizes (e.g. 3,1) into a tuple. An empty string means no slots.
+    """
+    if s == "":
+        return ()
+    try:
+        return tuple(int(x) for x in s.split(","))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Expected comma-separated slot sizes, got: {s}")
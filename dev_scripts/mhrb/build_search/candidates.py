@@ -0,0 +1,35 @@
+"""
+Filename: candidates.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+The pieces that the search can put in each slot.
+"""
+
+from .catalogue import ARMOUR_SLOTS
+
+class Candidate:
+    """
+    A piece that the search can put in a slot, with everything the search needs precomputed.
+    """
+    __slots__ = ["piece", "members", "levels", "mask", "deco_slots", "deco_levels", "deco_total"]
+
+    def __init__(self, piece, query, fitter):
+        self.piece = piece
+        self.members = [piece] # Every piece that this candidate stands for (see pruning.py)
+        self.levels = query.levels_of(piece.skills)
+        self.mask = query.mask_of(self.levels)
+        self.deco_slots = piece.deco_slots
+        self.deco_levels = tuple(fitter.max_levels_of(piece.deco_slots))
+        self.deco_total = sum(fitter.max_total[x] for x in piece.deco_slots)
+
+def slot_candidates(catalogue, query, fitter):
+    """
+    Returns {slot ID: [Candidate, ...]}, with the most useful candidates first.
+    """
+    ret = {}
+    for slot_id in ARMOUR_SLOTS:
+        candidates = [Candidate(x, query, fitter) for x in catalogue.pieces[slot_id]]
+        candidates.sort(key=lambda x: (-(sum(x.levels) + x.deco_total), -x.piece.defense))
+        ret[slot_id] = candidates
+    return ret
@@ -0,0 +1,125 @@
+"""
+Filename: catalogue.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Loads the skills, decorations and armour from the code generator's hardcoded data, for the build search.
+"""
+
+import os
+import json
+
+from ..code_generators.armour import armour_piece_name
+from ..code_generators.decorations import deco_name
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../code_generators/hardcoded_data")
+WEAPON_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../kiranico_scrape/output")
+
+WEAPON_CATEGORIES = [
+    "greatsword",
+    "longsword",
+    "swordandshield",
+    "dualblades",
+    "lance",
+    "gunlance",
+    "hammer",
+    "huntinghorn",
+    "switchaxe",
+    "chargeblade",
+    "insectglaive",
+    "lightbowgun",
+    "heavybowgun",
+    "bow",
+]
+
+ARMOUR_SLOTS = ["head", "chest", "arms", "waist", "legs"]
+
+MAX_DECO_SLOT_SIZE = 4
+
+class ArmourPiece:
+    __slots__ = ["set_id", "set_name", "slot_id", "name", "rarity", "defense", "deco_slots", "skills"]
+
+    def __init__(self, set_id, set_name, slot_id, name, rarity, defense, deco_slots, skills):
+        self.set_id = set_id
+        self.set_name = set_name
+        self.slot_id = slot_id
+        self.name = name
+        self.rarity = rarity
+        self.defense = defense       # At level 1
+        self.deco_slots = deco_slots # Tuple of slot sizes, largest first
+        self.skills = skills         # {skill ID: level}
+
+    def __repr__(self):
+        return f"<ArmourPiece {self.name!r}>"
+
+class Decoration:
+    __slots__ = ["deco_id", "name", "slot_size", "skills"]
+
+    def __init__(self, deco_id, name, slot_size, skills):
+        self.deco_id = deco_id
+        self.name = name
+        self.slot_size = slot_size
+        self.skills = skills # {skill ID: level}
+
+    def __repr__(self):
+        return f"<Decoration {self.name!r}>"
+
+class Catalogue:
+    def __init__(self, skills_data, decos_data, armour_data, naming_schemes_data):
+        self.skill_max_levels = {obj["id"]: obj["maxLevels"] for obj in skills_data}
+        self.skill_names = {obj["id"]: obj["name"] for obj in skills_data}
+
+        self.decos = []
+        for [deco_id, obj] in decos_data:
+            assert 1 <= obj["slotSize"] <= MAX_DECO_SLOT_SIZE
+            assert all(k in self.skill_max_levels for k in obj["skills"])
+            self.decos.append(Decoration(deco_id, deco_name(obj), obj["slotSize"], dict(obj["skills"])))
+
+        self.pieces = {slot_id: [] for slot_id in ARMOUR_SLOTS}
+        for [set_id, obj] in armour_data:
+            for slot_id in ARMOUR_SLOTS:
+                if obj["pieces"][slot_id] is None:
+                    continue
+                (deco_slots, skills) = obj["pieces"][slot_id]
+                assert all(1 <= x <= MAX_DECO_SLOT_SIZE for x in deco_slots)
+                assert all(k in self.skill_max_levels for k in skills)
+                self.pieces[slot_id].append(ArmourPiece(
+                    set_id,
+                    obj["setName"],
+                    slot_id,
+                    armour_piece_name(obj, naming_schemes_data, slot_id),
+                    obj["rarity"],
+                    obj["defenses"]["defLvl1"],
+                    tuple(sorted(deco_slots, reverse=True)),
+                    dict(skills),
+                ))
+
+    def num_pieces(self):
+        return sum(len(x) for x in self.pieces.values())
+
+def _read_json(data_dir, filename):
+    with open(os.path.join(data_dir, filename), encoding="utf-8", mode="r") as f:
+        return json.loads(f.read())
+
+def load_catalogue(data_dir=DATA_DIR):
+    return Catalogue(
+        _read_json(data_dir, "skills.json"),
+        _read_json(data_dir, "decorations.json"),
+        _read_json(data_dir, "armour.json"),
+        _read_json(data_dir, "armour_naming_schemes.json"),
+    )
+
+def load_weapon_slot_configs(weapon_data_dir=WEAPON_DATA_DIR):
+    """
+    Returns {weapon category: {decoration slot sizes (largest first): [weapon name, ...]}}, from the scraped weapons.
+    """
+    ret = {}
+    for category in WEAPON_CATEGORIES:
+        configs = {}
+        for tree in _read_json(weapon_data_dir, f"weapons_{category}.json").values():
+            for obj in tree.values():
+                assert all(1 <= x <= MAX_DECO_SLOT_SIZE for x in obj["decoSlots"])
+                deco_slots = tuple(sorted(obj["decoSlots"], reverse=True))
+                configs.setdefault(deco_slots, []).append(obj["name"])
+        ret[category] = configs
+    return ret
@@ -0,0 +1,119 @@
+"""
+Filename: deco_fitting.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Decides whether a set of free decoration slots can make up the rest of a skill query, and if so, with which
+decorations.
+
+Skill levels are tuples with one entry per query skill, in the same order as the query.
+
+This is a search over states of (number of free slots of each size, levels still needed of each skill). Each step
+fills the largest free slot with one of the decorations that fit it (or leaves it empty). Greedily picking the
+"best" decoration isn't enough, since decorations can have several skills and slots of different sizes compete for
+the same decorations. States are memoised (with an LRU bound), so the same leftover slots and deficits are only ever
+solved once, no matter which armour combination they came from.
+"""
+
+import functools
+
+from .catalogue import MAX_DECO_SLOT_SIZE
+
+DEFAULT_CACHE_SIZE = 1 << 18
+
+class DecoFitter:
+    def __init__(self, decos, skill_ids, cache_size=DEFAULT_CACHE_SIZE):
+        self.skill_ids = skill_ids
+
+        # Memoised by state, with at most cache_size states kept (least recently used ones are evicted first)
+        self._solve = functools.lru_cache(maxsize=cache_size)(self._solve_uncached)
+
+        # Only the decorations that have a query skill, and aren't beaten by another decoration that fits in the same
+        # slot and gives at least as many levels of every query skill. These are {slot size: [(levels, deco), ...]},
+        # with the best decorations first.
+        self.options = {}
+        for size in range(1, MAX_DECO_SLOT_SIZE + 1):
+            candidates = []
+            for deco in decos:
+                levels = tuple(deco.skills.get(x, 0) for x in skill_ids)
+                if (deco.slot_size <= size) and any(levels):
+                    candidates.append((levels, deco))
+            candidates.sort(key=lambda x: (-sum(x[0]), x[1].slot_size, x[1].deco_id))
+            self.options[size] = _drop_dominated(candidates)
+
+        # The most levels of each skill that a slot of each size can give, for bounding
+        self.max_levels = {0: tuple(0 for _ in skill_ids)}
+        self.max_total = {0: 0}
+        for (size, options) in self.options.items():
+            self.max_levels[size] = tuple(max((x[0][i] for x in options), default=0) for i in range(len(skill_ids)))
+            self.max_total[size] = max((sum(x[0]) for x in options), default=0)
+
+    def max_levels_of(self, slot_sizes):
+        """
+        Returns the most levels of each skill that could possibly be put into the slots (though not all at once).
+        """
+        ret = [0] * len(self.skill_ids)
+        for size in slot_sizes:
+            for (i, v) in enumerate(self.max_levels[size]):
+                ret[i] += v
+        return ret
+
+    def fit(self, deficits, slot_sizes):
+        """
+        Finds decorations that make up the deficits (levels still needed of each skill, which can be zero or
+        negative) using the slots (sizes, in any order).
+
+        Returns [(slot size, decoration), ...] for every slot that gets a decoration, or None if it can't be done.
+        """
+        if all(x <= 0 for x in deficits):
+            return []
+        counts = [0] * MAX_DECO_SLOT_SIZE
+        for size in slot_sizes:
+            counts[size - 1] += 1
+        ret = self._solve(tuple(counts), tuple(max(x, 0) for x in deficits))
+        return None if (ret is None) else list(ret)
+
+    def cache_info(self):
+        return self._solve.cache_info()
+
+    def _solve_uncached(self, counts, deficits):
+        """
+        counts is the number of free slots of each size (size 1 first), and deficits are never negative, so that
+        equivalent states share the same memo entry.
+
+        Returns a tuple of (slot size, decoration), or None.
+        """
+        if not any(deficits):
+            return ()
+
+        # Bounds: could the slots possibly cover the deficits?
+        capacity = [0] * len(deficits)
+        capacity_total = 0
+        for (i, count) in enumerate(counts):
+            if count > 0:
+                max_levels = self.max_levels[i + 1]
+                for s in range(len(deficits)):
+                    capacity[s] += count * max_levels[s]
+                capacity_total += count * self.max_total[i + 1]
+        if (sum(deficits) > capacity_total) or any(d > c for (d, c) in zip(deficits, capacity)):
+            return None
+
+        # Fill the largest slot first. It either gets one of the decorations that fit it, or stays empty.
+        size = max(i + 1 for (i, count) in enumerate(counts) if count > 0)
+        new_counts = list(counts)
+        new_counts[size - 1] -= 1
+        new_counts = tuple(new_counts)
+        for (levels, deco) in self.options[size]:
+            if not any((l > 0) and (d > 0) for (l, d) in zip(levels, deficits)):
+                continue
+            ret = self._solve(new_counts, tuple(max(d - l, 0) for (d, l) in zip(deficits, levels)))
+            if ret is not None:
+                return ((size, deco),) + ret
+        return self._solve(new_counts, deficits)
+
+def _drop_dominated(candidates):
+    ret = []
+    for (levels, deco) in candidates:
+        if not any(all(a >= b for (a, b) in zip(other, levels)) for (other, _) in ret):
+            ret.append((levels, deco))
+    return ret
@@ -0,0 +1,203 @@
+"""
+Filename: parallel_search.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Runs the build search across a process pool.
+
+The search is split into shards, one for each combination of weapon decoration slots, head candidate and chest
+candidate (after pruning). Each shard is an ordinary search with the head and chest fixed, so shards are independent
+and roughly even in size. Builds are streamed back as each shard finishes, so the first ones arrive long before the
+whole search is done.
+
+Stopping early (by reaching max_results, calling cancel(), or just no longer iterating) cancels every shard that
+hasn't started, and tells running shards to stop (they check every so often, not just when they find a build).
+"""
+
+import os
+import threading
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+
+from .catalogue import DATA_DIR, load_catalogue
+from .deco_fitting import DecoFitter
+from .search import SkillQuery, search
+from .pruning import pruned_slot_candidates
+
+class Shard:
+    __slots__ = ["targets", "weapon_slots", "extra_slots", "extra_skills", "head", "chest", "max_results"]
+
+    def __init__(self, targets, weapon_slots, extra_slots, extra_skills, head, chest, max_results):
+        self.targets = targets
+        self.weapon_slots = weapon_slots
+        self.extra_slots = extra_slots
+        self.extra_skills = extra_skills
+        self.head = head   # Index into the pruned head candidates
+        self.chest = chest # Index into the pruned chest candidates
+        self.max_results = max_results
+
+#
+# WORKERS
+#
+
+_worker_data_dir = DATA_DIR
+_worker_cancel_event = None
+_worker_catalogue = None
+_worker_queries = {} # {query key: (pruned candidates, DecoFitter)}, since workers get many shards of the same query
+
+def _init_worker(data_dir, cancel_event):
+    global _worker_data_dir
+    global _worker_cancel_event
+    _worker_data_dir = data_dir
+    _worker_cancel_event = cancel_event
+    return
+
+def _query_key(targets, weapon_slots, extra_slots, extra_skills):
+    return (tuple(targets.items()), weapon_slots, extra_slots, tuple(sorted(extra_skills.items())))
+
+def _shard_builds(catalogue, query_cache, shard, should_stop):
+    """
+    Yields the shard's builds. query_cache holds what's shared between shards of the same query. should_stop is passed
+    on to search.search().
+    """
+    query = SkillQuery(
+        catalogue,
+        shard.targets,
+        extra_slots=shard.weapon_slots + shard.extra_slots,
+        extra_skills=shard.extra_skills,
+    )
+    key = _query_key(shard.targets, shard.weapon_slots, shard.extra_slots, shard.extra_skills)
+    if key not in query_cache:
+        query_cache[key] = (pruned_slot_candidates(catalogue, query)[0], DecoFitter(catalogue.decos, query.skill_ids))
+    (candidates, fitter) = query_cache[key]
+    candidates = dict(candidates)
+    candidates["head"] = [candidates["head"][shard.head]]
+    candidates["chest"] = [candidates["chest"][shard.chest]]
+    yield from search(catalogue, query, candidates, fitter, should_stop)
+    return
+
+def _run_shard(shard):
+    """
+    Runs in a worker process. Returns (the shard, [Build, ...]).
+    """
+    global _worker_catalogue
+    if _worker_catalogue is None:
+        _worker_catalogue = load_catalogue(_worker_data_dir)
+    ret = []
+    for build in _shard_builds(_worker_catalogue, _worker_queries, shard, _worker_cancel_event.is_set):
+        ret.append(build)
+        if (shard.max_results is not None) and (len(ret) >= shard.max_results):
+            break
+    return (shard, ret)
+
+#
+# SEARCH
+#
+
+class ParallelSearch:
+    def __init__(self, targets, weapon_slot_configs=((),), extra_slots=(), extra_skills=None, jobs=None,
+                 max_results=None, data_dir=DATA_DIR):
+        """
+        Searches once for each weapon slot configuration (a tuple of decoration slot sizes). extra_slots and
+        extra_skills (e.g. from the talisman) are included in every search.
+
+        Iterating over this yields (weapon slots, Build) as builds are found, and stops after max_results builds (or
+        never, if None). jobs defaults to the number of CPUs. With one job, shards run in order in this process, so
+        builds come out in the same order as search.search().
+
+        Raises ValueError if the query is invalid.
+        """
+        self.targets = dict(targets)
+        self.weapon_slot_configs = list(dict.fromkeys(tuple(sorted(x, reverse=True)) for x in weapon_slot_configs))
+        self.extra_slots = tuple(extra_slots)
+        self.extra_skills = dict(extra_skills or {})
+        self.jobs = jobs or os.cpu_count() or 1
+        self.max_results = max_results
+        self.data_dir = data_dir
+
+        self._cancelled = threading.Event()
+        self._cancel_event = None
+
+        self.catalogue = load_catalogue(data_dir)
+        self._queries = {}
+        self.pruning_stats = {} # {weapon slots: PruningStats}
+        self.shards = []
+        for weapon_slots in self.weapon_slot_configs:
+            query = SkillQuery(
+                self.catalogue,
+                self.targets,
+                extra_slots=weapon_slots + self.extra_slots,
+                extra_skills=self.extra_skills,
+            )
+            (candidates, self.pruning_stats[weapon_slots]) = pruned_slot_candidates(self.catalogue, query)
+            key = _query_key(self.targets, weapon_slots, self.extra_slots, self.extra_skills)
+            self._queries[key] = (candidates, DecoFitter(self.catalogue.decos, query.skill_ids))
+            for head in range(len(candidates["head"])):
+                for chest in range(len(candidates["chest"])):
+                    self.shards.append(Shard(
+                        self.targets,
+                        weapon_slots,
+                        self.extra_slots,
+                        self.extra_skills,
+                        head,
+                        chest,
+                        max_results,
+                    ))
+
+    def cancel(self):
+        """
+        Stops the search. Can be called from any thread.
+        """
+        self._cancelled.set()
+        if self._cancel_event is not None:
+            self._cancel_event.set()
+        return
+
+    def __iter__(self):
+        num_results = 0
+        for (weapon_slots, build) in self._results():
+            if self._cancelled.is_set():
+                break
+            yield (weapon_slots, build)
+            num_results += 1
+            if (self.max_results is not None) and (num_results >= self.max_results):
+                break
+        self.cancel()
+        return
+
+    def _results(self):
+        if (self.jobs > 1) and (len(self.shards) > 1):
+            try:
+                self._cancel_event = multiprocessing.Event()
+                executor = ProcessPoolExecutor(
+                    max_workers=min(self.jobs, len(self.shards)),
+                    initializer=_init_worker,
+                    initargs=(self.data_dir, self._cancel_event),
+                )
+            except (OSError, NotImplementedError) as e:
+                print(f"Unable to start worker processes ({e}). Running serially instead.")
+            else:
+                yield from self._results_parallel(executor)
+                return
+        for shard in self.shards:
+            for build in _shard_builds(self.catalogue, self._queries, shard, self._cancelled.is_set):
+                yield (shard.weapon_slots, build)
+        return
+
+    def _results_parallel(self, executor):
+        pending = set()
+        try:
+            pending = {executor.submit(_run_shard, x) for x in self.shards}
+            while pending and (not self._cancelled.is_set()):
+                (done, pending) = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                for future in done:
+                    (shard, builds) = future.result()
+                    for build in builds:
+                        yield (shard.weapon_slots, build)
+        finally:
+            # Also reached if the caller stops iterating
+            self._cancel_event.set()
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=True)
+        return
@@ -0,0 +1,105 @@
+"""
+Filename: pruning.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Shrinks each slot's pieces down to what's worth searching for a particular query.
+
+    1. Pieces that give the same levels of the query skills and have the same decoration slots are interchangeable
+       as far as the query is concerned, so they're collapsed into one equivalence class. The search only sees one
+       candidate per class, and every build it finds lists the rest of the class as alternatives.
+    2. A class is dropped if another class in the same slot dominates it, i.e. gives at least as many levels of every
+       query skill, has at least as many decoration slots that are at least as large, and has at least as much
+       defense.
+
+Dropped pieces can still be part of a build that reaches the query, but there's always a build that's at least as
+good everywhere with the dominating piece instead.
+"""
+
+import math
+from collections import defaultdict
+
+from .catalogue import ARMOUR_SLOTS
+from .deco_fitting import DecoFitter
+from .candidates import Candidate
+
+class PruningStats:
+    def __init__(self):
+        self.pieces = {}     # {slot ID: number of pieces}
+        self.classes = {}    # {slot ID: number of equivalence classes}
+        self.candidates = {} # {slot ID: number of classes left after dropping dominated ones}
+
+    def combinations_before(self):
+        return math.prod(self.pieces.values())
+
+    def combinations_after(self):
+        return math.prod(self.candidates.values())
+
+    def summary_str(self):
+        lines = []
+        for slot_id in ARMOUR_SLOTS:
+            lines.append(f"    {slot_id:>5}: {self.pieces[slot_id]:>4} pieces -> {self.classes[slot_id]:>4} classes "
+                         f"-> {self.candidates[slot_id]:>4} undominated")
+        before = self.combinations_before()
+        after = self.combinations_after()
+        ratio = f"{before / after:,.0f}x fewer" if (after > 0) else "nothing left"
+        lines.append(f"    Combinations: {before:,} -> {after:,} ({ratio})")
+        return "Pruning:\n" + "\n".join(lines)
+
+def _slots_dominate(a, b):
+    """
+    Whether decoration slots a (largest first) can hold anything that slots b (largest first) can.
+    """
+    return (len(a) >= len(b)) and all(x >= y for (x, y) in zip(a, b))
+
+def _dominates(a, b):
+    """
+    Whether candidate a is at least as good as candidate b for the query.
+    """
+    return (
+        all(x >= y for (x, y) in zip(a.levels, b.levels))
+        and _slots_dominate(a.deco_slots, b.deco_slots)
+        and (a.piece.defense >= b.piece.defense)
+    )
+
+def _equivalence_classes(candidates):
+    classes = defaultdict(list)
+    for c in candidates:
+        classes[(c.levels, c.deco_slots)].append(c)
+    ret = []
+    for members in classes.values():
+        members.sort(key=lambda x: (-x.piece.defense, x.piece.set_id))
+        representative = members[0] # The one with the most defense
+        representative.members = [x.piece for x in members]
+        ret.append(representative)
+    return ret
+
+def _drop_dominated(candidates):
+    # Stronger candidates first, so most dominated ones are caught by comparing against only a few others
+    candidates = sorted(candidates, key=lambda x: (-(sum(x.levels) + x.deco_total), -x.piece.defense))
+    ret = []
+    for c in candidates:
+        if not any(_dominates(other, c) for other in ret):
+            ret = [other for other in ret if not _dominates(c, other)]
+            ret.append(c)
+    return ret
+
+def pruned_slot_candidates(catalogue, query):
+    """
+    Returns ({slot ID: [Candidate, ...]}, PruningStats), with the most useful candidates first. search.search() uses
+    these by default.
+    """
+    fitter = DecoFitter(catalogue.decos, query.skill_ids)
+    stats = PruningStats()
+    ret = {}
+    for slot_id in ARMOUR_SLOTS:
+        pieces = catalogue.pieces[slot_id]
+        classes = _equivalence_classes(Candidate(x, query, fitter) for x in pieces)
+        candidates = _drop_dominated(classes)
+        candidates.sort(key=lambda x: (-(sum(x.levels) + x.deco_total), -x.piece.defense))
+
+        stats.pieces[slot_id] = len(pieces)
+        stats.classes[slot_id] = len(classes)
+        stats.candidates[slot_id] = len(candidates)
+        ret[slot_id] = candidates
+    return (ret, stats)
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+"""
+Filename: run_build_search.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Searches for armour combinations that reach a set of skill levels.
+
+The search is split across `--jobs` processes (one per CPU by default). With more than one job, builds are printed in
+whatever order the processes find them.
+
+Example:
+    python3 -m dev_scripts.mhrb.build_search.run_build_search \\
+        --skill weakness_exploit=3 --skill critical_boost=3 --skill critical_eye=5 --weapon-slots 3,1
+"""
+
+import os
+import time
+import argparse
+
+from .arg_types import skill_level, slot_sizes
+from .parallel_search import ParallelSearch
+
+DEFAULT_LIMIT = 20
+
+def main():
+    parser = argparse.ArgumentParser(description="Search for armour combinations with a set of skills.")
+    parser.add_argument("--skill", type=skill_level, action="append", default=[], required=True,
+                        help="A skill to search for, as SKILL_ID=LEVEL. Can be given more than once.")
+    parser.add_argument("--weapon-slots", type=slot_sizes, default=(),
+                        help="The weapon's decoration slot sizes, e.g. 3,1.")
+    parser.add_argument("--talisman-slots", type=slot_sizes, default=(),
+                        help="The talisman's decoration slot sizes, e.g. 2,1.")
+    parser.add_argument("--talisman-skill", type=skill_level, action="append", default=[],
+                        help="A skill on the talisman, as SKILL_ID=LEVEL. Can be given more than once.")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT,
+                        help=f"Stop after this many builds. Use 0 to find them all. Defaults to {DEFAULT_LIMIT}.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of processes to search with. Defaults to the number of CPUs.")
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
+    start_time = time.perf_counter()
+    try:
+        parallel_search = ParallelSearch(
+            dict(args.skill),
+            weapon_slot_configs=[args.weapon_slots],
+            extra_slots=args.talisman_slots,
+            extra_skills=dict(args.talisman_skill),
+            jobs=args.jobs,
+            max_results=(args.limit or None),
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    (pruning_stats,) = parallel_search.pruning_stats.values()
+    print(pruning_stats.summary_str())
+    print()
+
+    num_builds = 0
+    for (_, build) in parallel_search:
+        num_builds += 1
+        print(f"Build {num_builds} ({build.defense()} defense):")
+        print(build.summary_str())
+        print()
+    if num_builds == args.limit:
+        print(f"Stopped after {args.limit} builds.")
+    print(f"Found {num_builds} builds in {time.perf_counter() - start_time:.2f} seconds.")
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+"""
+Filename: run_top_builds.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Reports the highest-defense builds for each weapon category that reach a set of skill levels.
+
+Each category is searched with every decoration slot configuration that its weapons have (except those that another of
+its configurations beats outright, e.g. 2,1 when there's also 2,1,1). All configurations of all categories go into one
+search, split across `--jobs` processes (one per CPU by default).
+
+Example:
+    python3 -m dev_scripts.mhrb.build_search.run_top_builds \\
+        --skill weakness_exploit=3 --skill critical_boost=3 --skill critical_eye=5 --top 3
+"""
+
+import os
+import time
+import argparse
+from collections import defaultdict
+
+from .arg_types import skill_level, slot_sizes
+from .catalogue import WEAPON_CATEGORIES, load_weapon_slot_configs
+from .parallel_search import ParallelSearch
+
+DEFAULT_TOP = 5
+MAX_WEAPON_NAMES = 3
+
+def _useful_slot_configs(configs):
+    """
+    Drops every slot configuration (largest first) that another configuration can do everything of.
+    """
+    def beats(a, b):
+        return (a != b) and (len(a) >= len(b)) and all(x >= y for (x, y) in zip(a, b))
+    return [a for a in configs if not any(beats(b, a) for b in configs)]
+
+def main():
+    parser = argparse.ArgumentParser(description="Report the highest-defense builds for each weapon category.")
+    parser.add_argument("--skill", type=skill_level, action="append", default=[], required=True,
+                        help="A skill to search for, as SKILL_ID=LEVEL. Can be given more than once.")
+    parser.add_argument("--talisman-slots", type=slot_sizes, default=(),
+                        help="The talisman's decoration slot sizes, e.g. 2,1.")
+    parser.add_argument("--talisman-skill", type=skill_level, action="append", default=[],
+                        help="A skill on the talisman, as SKILL_ID=LEVEL. Can be given more than once.")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"Number of builds to report for each category. Defaults to {DEFAULT_TOP}.")
+    parser.add_argument("--limit", type=int, default=0,
+                        help="Stop searching after this many builds in total, in which case the report only covers "
+                             "the builds found so far. Defaults to 0, which searches everything.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of processes to search with. Defaults to the number of CPUs.")
+    args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    if args.top < 1:
+        parser.error("--top must be at least 1.")
+
+    weapon_names = load_weapon_slot_configs()
+    slot_configs = {k: _useful_slot_configs(list(v)) for (k, v) in weapon_names.items()}
+
+    start_time = time.perf_counter()
+    try:
+        parallel_search = ParallelSearch(
+            dict(args.skill),
+            weapon_slot_configs=[x for configs in slot_configs.values() for x in configs],
+            extra_slots=args.talisman_slots,
+            extra_skills=dict(args.talisman_skill),
+            jobs=args.jobs,
+            max_results=(args.limit or None),
+        )
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Searching {len(parallel_search.weapon_slot_configs)} weapon slot configurations "
+          f"({len(parallel_search.shards)} shards) with {parallel_search.jobs} jobs.")
+    print()
+
+    # Only the best builds of each slot configuration are kept, since that's all the report can show
+    builds = defaultdict(list) # {weapon slots: [Build, ...]}
+    num_builds = 0
+    for (weapon_slots, build) in parallel_search:
+        num_builds += 1
+        builds[weapon_slots].append(build)
+        if len(builds[weapon_slots]) > 2 * args.top:
+            builds[weapon_slots].sort(key=lambda x: -x.defense())
+            del builds[weapon_slots][args.top:]
+    seconds = time.perf_counter() - start_time
+
+    for category in WEAPON_CATEGORIES:
+        top = sorted(
+            ((build, weapon_slots) for weapon_slots in slot_configs[category] for build in builds[weapon_slots]),
+            key=lambda x: -x[0].defense(),
+        )[:args.top]
+        print(f"=== {category} ===")
+        print()
+        if len(top) == 0:
+            print("No builds found.")
+            print()
+        for (i, (build, weapon_slots)) in enumerate(top):
+            names = weapon_names[category][weapon_slots]
+            names_str = ", ".join(names[:MAX_WEAPON_NAMES]) + (", ..." if (len(names) > MAX_WEAPON_NAMES) else "")
+            slots_str = ",".join(str(x) for x in weapon_slots) or "none"
+            print(f"Build {i + 1} ({build.defense()} defense, weapon slots {slots_str}, e.g. {names_str}):")
+            print(build.summary_str())
+            print()
+    if num_builds == args.limit:
+        print(f"Stopped after {args.limit} builds.")
+    print(f"Found {num_builds} builds in {seconds:.2f} seconds.")
+    return
+
+if __name__ == "__main__":
+    main()
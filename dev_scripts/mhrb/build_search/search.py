@@ -0,0 +1,189 @@
+"""
+Filename: search.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Finds every armour combination that can reach a set of skill levels, once decorations are added.
+
+The search picks a piece for each slot in turn (depth-first), and abandons a partial combination as soon as the
+remaining slots can't possibly make up what's missing:
+
+    - Each query skill is one bit of a bitset. Every candidate piece has a bitset of the query skills it gives, and
+      the search tracks which skills are still short, so pieces are only compared on skills that matter.
+    - For each remaining slot, the most levels of each skill that any candidate piece (including decorations in its
+      slots) can give is precomputed, as is the most levels of any skills that it can give in total. If either bound
+      falls short, nothing below the partial combination gets looked at.
+    - Only complete combinations go through decoration fitting (see deco_fitting.py).
+"""
+
+from .catalogue import ARMOUR_SLOTS, MAX_DECO_SLOT_SIZE
+from .deco_fitting import DecoFitter
+from .pruning import pruned_slot_candidates
+
+class SkillQuery:
+    def __init__(self, catalogue, targets, extra_slots=(), extra_skills=None):
+        """
+        targets is {skill ID: level}.
+
+        extra_slots and extra_skills are decoration slot sizes and skills that come from elsewhere (e.g. the weapon and
+        talisman), and are included in every build.
+        """
+        if len(targets) == 0:
+            raise ValueError("A query needs at least one skill.")
+        for (skill_id, level) in targets.items():
+            if skill_id not in catalogue.skill_max_levels:
+                raise ValueError(f"Unknown skill: {skill_id}")
+            if not (1 <= level <= catalogue.skill_max_levels[skill_id]):
+                raise ValueError(f"{skill_id} must be between level 1 and {catalogue.skill_max_levels[skill_id]}.")
+        for size in extra_slots:
+            if not (1 <= size <= MAX_DECO_SLOT_SIZE):
+                raise ValueError(f"Decoration slots must be between size 1 and {MAX_DECO_SLOT_SIZE}.")
+        extra_skills = extra_skills or {}
+        for skill_id in extra_skills:
+            if skill_id not in catalogue.skill_max_levels:
+                raise ValueError(f"Unknown skill: {skill_id}")
+
+        self.skill_ids = list(targets.keys())
+        self.targets = tuple(targets.values())
+        self.extra_slots = tuple(sorted(extra_slots, reverse=True))
+        self.extra_levels = tuple(extra_skills.get(x, 0) for x in self.skill_ids)
+
+    def levels_of(self, skills):
+        return tuple(skills.get(x, 0) for x in self.skill_ids)
+
+    def mask_of(self, levels):
+        ret = 0
+        for (i, v) in enumerate(levels):
+            if v > 0:
+                ret |= 1 << i
+        return ret
+
+class Build:
+    __slots__ = ["pieces", "alternatives", "decorations", "skills"]
+
+    def __init__(self, pieces, alternatives, decorations, skills):
+        self.pieces = pieces             # {slot ID: ArmourPiece}
+        self.alternatives = alternatives # {slot ID: [ArmourPiece, ...]} that can replace the piece in the build
+        self.decorations = decorations   # [(slot size, Decoration), ...]
+        self.skills = skills             # {skill ID: level} of the query skills, including decorations
+
+    def defense(self):
+        return sum(x.defense for x in self.pieces.values())
+
+    def summary_str(self):
+        lines = []
+        for slot_id in ARMOUR_SLOTS:
+            line = f"{slot_id:>5}: {self.pieces[slot_id].name}"
+            if len(self.alternatives[slot_id]) > 0:
+                line += " (or " + ", ".join(x.name for x in self.alternatives[slot_id]) + ")"
+            lines.append(line)
+        if len(self.decorations) > 0:
+            lines.append(" decos: " + ", ".join(f"{deco.name} (in a size {size} slot)"
+                                               for (size, deco) in self.decorations))
+        lines.append("skills: " + ", ".join(f"{k} {v}" for (k, v) in self.skills.items()))
+        return "\n".join(lines)
+
+def search(catalogue, query, candidates=None, fitter=None, should_stop=None):
+    """
+    Yields a Build for every armour combination that reaches the query's skill levels, as they're found.
+
+    By default, the search is over pruning.pruned_slot_candidates(), so each build stands for a whole equivalence
+    class of pieces in each slot (listed as its alternatives), and combinations with dominated pieces are skipped.
+    candidates can be given to search over something else instead (e.g. candidates.slot_candidates() for every
+    piece).
+
+    fitter can be a DecoFitter for the same query to reuse, so that searches over parts of the same query share its
+    memo.
+
+    should_stop can be a function that's called throughout the search (not just when a build is found), and ends the
+    search early once it returns True. It's for stopping the search from another thread or process.
+    """
+    if fitter is None:
+        fitter = DecoFitter(catalogue.decos, query.skill_ids)
+    if candidates is None:
+        (candidates, _) = pruned_slot_candidates(catalogue, query)
+    per_slot = [candidates[x] for x in ARMOUR_SLOTS]
+    num_skills = len(query.skill_ids)
+    targets = query.targets
+
+    # rest_levels[i] and rest_total[i] bound what slots i onwards can add, with decorations
+    rest_levels = [(0,) * num_skills for _ in range(len(per_slot) + 1)]
+    rest_total = [0] * (len(per_slot) + 1)
+    for i in range(len(per_slot) - 1, -1, -1):
+        best = [0] * num_skills
+        best_total = 0
+        for c in per_slot[i]:
+            for s in range(num_skills):
+                best[s] = max(best[s], c.levels[s] + c.deco_levels[s])
+            best_total = max(best_total, sum(c.levels) + c.deco_total)
+        rest_levels[i] = tuple(a + b for (a, b) in zip(rest_levels[i + 1], best))
+        rest_total[i] = rest_total[i + 1] + best_total
+
+    extra_deco_levels = tuple(fitter.max_levels_of(query.extra_slots))
+    extra_deco_total = sum(fitter.max_total[x] for x in query.extra_slots)
+
+    chosen = [None] * len(per_slot)
+
+    def reachable(i, levels, deco_levels, deco_total, short_mask):
+        """
+        Whether slots i onwards could possibly make up what's still short.
+        """
+        if not short_mask:
+            return True
+        missing_total = 0
+        for s in range(num_skills):
+            missing = targets[s] - levels[s]
+            if missing > 0:
+                if missing > deco_levels[s] + rest_levels[i][s]:
+                    return False
+                missing_total += missing
+        return missing_total <= deco_total + rest_total[i]
+
+    def recurse(i, levels, deco_levels, deco_total, short_mask):
+        if i == len(per_slot):
+            yield from _finish(chosen, levels, short_mask)
+            return
+        if (should_stop is not None) and should_stop():
+            return
+
+        for c in per_slot[i]:
+            new_levels = tuple(a + b for (a, b) in zip(levels, c.levels))
+            new_deco_levels = tuple(a + b for (a, b) in zip(deco_levels, c.deco_levels))
+            new_deco_total = deco_total + c.deco_total
+            new_short_mask = short_mask
+            if short_mask & c.mask:
+                for s in range(num_skills):
+                    if (short_mask >> s) & 1 and new_levels[s] >= targets[s]:
+                        new_short_mask &= ~(1 << s)
+            # Checked here rather than at the start of the call, since most candidates fail it
+            if reachable(i + 1, new_levels, new_deco_levels, new_deco_total, new_short_mask):
+                chosen[i] = c
+                yield from recurse(i + 1, new_levels, new_deco_levels, new_deco_total, new_short_mask)
+        return
+
+    def _finish(chosen, levels, short_mask):
+        if short_mask:
+            slots = query.extra_slots + sum((c.deco_slots for c in chosen), ())
+            deficits = tuple(t - l for (t, l) in zip(targets, levels))
+            decorations = fitter.fit(deficits, slots)
+            if decorations is None:
+                return
+        else:
+            decorations = []
+        skills = list(levels)
+        for (_, deco) in decorations:
+            for (s, skill_id) in enumerate(query.skill_ids):
+                skills[s] += deco.skills.get(skill_id, 0)
+        yield Build(
+            {slot_id: c.piece for (slot_id, c) in zip(ARMOUR_SLOTS, chosen)},
+            {slot_id: c.members[1:] for (slot_id, c) in zip(ARMOUR_SLOTS, chosen)},
+            decorations,
+            dict(zip(query.skill_ids, skills)),
+        )
+        return
+
+    initial_levels = query.extra_levels
+    initial_short_mask = query.mask_of(tuple(t - l for (t, l) in zip(targets, initial_levels)))
+    if reachable(0, initial_levels, extra_deco_levels, extra_deco_total, initial_short_mask):
+        yield from recurse(0, initial_levels, extra_deco_levels, extra_deco_total, initial_short_mask)
+    return
@@ -0,0 +1,254 @@
+"""
+Filename: test_build_search.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Checks the build search against brute force, on small randomly generated catalogues (small enough that every armour
+combination and every way of filling the decoration slots can be tried).
+
+Run it from the repository root:
+
+    python3 -m pytest dev_scripts/mhrb/build_search
+"""
+
+import os
+import json
+import random
+import itertools
+
+import pytest
+
+from .catalogue import ARMOUR_SLOTS, MAX_DECO_SLOT_SIZE, Catalogue
+from .candidates import Candidate, slot_candidates
+from .deco_fitting import DecoFitter
+from .pruning import _dominates, pruned_slot_candidates
+from .search import SkillQuery, search
+from .parallel_search import ParallelSearch
+
+SEEDS = range(8)
+
+SKILL_IDS = ["skill_a", "skill_b", "skill_c", "skill_d"]
+SKILL_MAX_LEVEL = 5
+
+NAMING_SCHEMES_DATA = {"synthetic": ["Head", "Chest", "Arms", "Waist", "Legs"]}
+
+#
+# SYNTHETIC CATALOGUES
+#
+
+def _random_skills(rng, max_skills):
+    skill_ids = rng.sample(SKILL_IDS, rng.randint(0, max_skills))
+    return {x: rng.randint(1, 2) for x in skill_ids}
+
+def _synthetic_data(seed, num_sets=5, num_decos=6):
+    """
+    Returns (skills data, decorations data, armour data), in the same format as the hardcoded data.
+
+    Skills, decoration slots and defense are drawn from few enough values that many pieces end up in the same
+    equivalence class, or dominated by another piece.
+    """
+    rng = random.Random(seed)
+    skills_data = [{"id": x, "name": x.title(), "maxLevels": SKILL_MAX_LEVEL} for x in SKILL_IDS]
+
+    decos_data = []
+    for deco_id in range(1, num_decos + 1):
+        skills = _random_skills(rng, 2) or {rng.choice(SKILL_IDS): 1}
+        decos_data.append([deco_id, {"name": f"Deco {deco_id}", "slotSize": rng.randint(1, MAX_DECO_SLOT_SIZE),
+                                     "skills": skills}])
+
+    armour_data = []
+    for set_id in range(1, num_sets + 1):
+        pieces = {}
+        for slot_id in ARMOUR_SLOTS:
+            deco_slots = [rng.randint(1, MAX_DECO_SLOT_SIZE) for _ in range(rng.randint(0, 2))]
+            pieces[slot_id] = [deco_slots, _random_skills(rng, 2)]
+        armour_data.append([set_id, {
+            "rarity": 1,
+            "setName": f"Set {set_id}",
+            "prefix": f"Set {set_id}",
+            "namingScheme": "synthetic",
+            "suffix": "",
+            "pieces": pieces,
+            "defenses": {"defLvl1": rng.randint(1, 3)},
+        }])
+    return (skills_data, decos_data, armour_data)
+
+def _synthetic_catalogue(seed):
+    return Catalogue(*_synthetic_data(seed), NAMING_SCHEMES_DATA)
+
+def _synthetic_query(catalogue, seed):
+    rng = random.Random(seed)
+    targets = {x: rng.randint(2, 5) for x in rng.sample(SKILL_IDS, 4)}
+    return SkillQuery(catalogue, targets, extra_slots=(rng.randint(1, MAX_DECO_SLOT_SIZE),))
+
+#
+# BRUTE FORCE
+#
+
+def _exhaustive_fit(decos, skill_ids, deficits, slot_sizes):
+    """
+    Whether the decorations can make up the deficits in the slots, by trying every decoration (or none) in every slot.
+    Levels are capped at the deficits, so only the distinct partial totals have to be kept.
+    """
+    deficits = tuple(max(x, 0) for x in deficits)
+    reachable = {(0,) * len(deficits)}
+    for size in slot_sizes:
+        options = [tuple(deco.skills.get(x, 0) for x in skill_ids) for deco in decos if deco.slot_size <= size]
+        reachable |= {tuple(min(a + b, d) for (a, b, d) in zip(levels, option, deficits))
+                      for levels in reachable for option in options}
+    return deficits in reachable
+
+def _brute_force_builds(catalogue, query):
+    """
+    Returns every armour combination that reaches the query, as a set of (set ID, ...) in ARMOUR_SLOTS order.
+    """
+    ret = set()
+    fits = {} # {(deficits, slot sizes): whether they can be made up}, since many combinations leave the same ones
+    for pieces in itertools.product(*(catalogue.pieces[x] for x in ARMOUR_SLOTS)):
+        levels = list(query.extra_levels)
+        for piece in pieces:
+            for (s, v) in enumerate(query.levels_of(piece.skills)):
+                levels[s] += v
+        deficits = tuple(t - l for (t, l) in zip(query.targets, levels))
+        slot_sizes = tuple(sorted(query.extra_slots + sum((x.deco_slots for x in pieces), ())))
+        if (deficits, slot_sizes) not in fits:
+            fits[(deficits, slot_sizes)] = _exhaustive_fit(catalogue.decos, query.skill_ids, deficits, slot_sizes)
+        if fits[(deficits, slot_sizes)]:
+            ret.add(tuple(x.set_id for x in pieces))
+    return ret
+
+def _build_key(build):
+    return tuple(build.pieces[x].set_id for x in ARMOUR_SLOTS)
+
+def _expanded_build_keys(build):
+    """
+    Every combination that the build stands for, with its alternatives swapped in.
+    """
+    per_slot = [[build.pieces[x]] + build.alternatives[x] for x in ARMOUR_SLOTS]
+    return {tuple(x.set_id for x in pieces) for pieces in itertools.product(*per_slot)}
+
+def _check_build(query, build):
+    """
+    Checks that the build's decorations fit in its slots, and that its skills are right and reach the query.
+    """
+    free_slots = sorted(query.extra_slots + sum((build.pieces[x].deco_slots for x in ARMOUR_SLOTS), ()))
+    for (size, deco) in build.decorations:
+        assert deco.slot_size <= size
+        free_slots.remove(size)
+    levels = list(query.extra_levels)
+    for piece in list(build.pieces.values()) + [deco for (_, deco) in build.decorations]:
+        for (s, v) in enumerate(query.levels_of(piece.skills)):
+            levels[s] += v
+    assert build.skills == dict(zip(query.skill_ids, levels))
+    assert all(l >= t for (l, t) in zip(levels, query.targets))
+    return
+
+#
+# TESTS
+#
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_search_matches_brute_force(seed):
+    catalogue = _synthetic_catalogue(seed)
+    query = _synthetic_query(catalogue, seed)
+    fitter = DecoFitter(catalogue.decos, query.skill_ids)
+
+    builds = list(search(catalogue, query, candidates=slot_candidates(catalogue, query, fitter), fitter=fitter))
+    for build in builds:
+        assert all(len(x) == 0 for x in build.alternatives.values())
+        _check_build(query, build)
+    keys = [_build_key(x) for x in builds]
+    assert len(keys) == len(set(keys))
+    assert set(keys) == _brute_force_builds(catalogue, query)
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_pruned_search_matches_unpruned(seed):
+    catalogue = _synthetic_catalogue(seed)
+    query = _synthetic_query(catalogue, seed)
+    fitter = DecoFitter(catalogue.decos, query.skill_ids)
+
+    unpruned = {_build_key(x) for x in search(catalogue, query, slot_candidates(catalogue, query, fitter), fitter)}
+    pruned_builds = list(search(catalogue, query))
+    for build in pruned_builds:
+        _check_build(query, build)
+    expanded = [key for build in pruned_builds for key in _expanded_build_keys(build)]
+    assert len(expanded) == len(set(expanded)) # Each combination belongs to one build
+    expanded = set(expanded)
+
+    # With the alternatives expanded, the pruned search finds exactly the unpruned builds that don't use a dominated
+    # piece.
+    (candidates, _) = pruned_slot_candidates(catalogue, query)
+    kept = [{piece.set_id for c in candidates[x] for piece in c.members} for x in ARMOUR_SLOTS]
+    assert expanded == {key for key in unpruned if all(k in s for (k, s) in zip(key, kept))}
+
+    # Every dropped piece is dominated by a piece that was kept, so swapping those in for the dropped pieces of an
+    # unpruned build must give a build that the pruned search found.
+    replacements = []
+    for (slot_id, kept_set_ids) in zip(ARMOUR_SLOTS, kept):
+        by_set_id = {piece.set_id: Candidate(piece, query, fitter) for piece in catalogue.pieces[slot_id]}
+        slot_replacements = {}
+        for (set_id, c) in by_set_id.items():
+            if set_id in kept_set_ids:
+                slot_replacements[set_id] = set_id
+            else:
+                slot_replacements[set_id] = next(x for x in kept_set_ids if _dominates(by_set_id[x], c))
+        replacements.append(slot_replacements)
+    for key in unpruned:
+        assert tuple(r[k] for (k, r) in zip(key, replacements)) in expanded
+
+@pytest.mark.parametrize("seed", SEEDS)
+def test_deco_fitter_matches_exhaustive_fitter(seed):
+    rng = random.Random(seed)
+    catalogue = Catalogue(*_synthetic_data(seed, num_decos=8), NAMING_SCHEMES_DATA)
+    skill_ids = rng.sample(SKILL_IDS, 3)
+    fitter = DecoFitter(catalogue.decos, skill_ids, cache_size=64) # Small enough that states get evicted
+
+    for _ in range(300):
+        deficits = tuple(rng.randint(-1, 4) for _ in skill_ids)
+        slot_sizes = [rng.randint(1, MAX_DECO_SLOT_SIZE) for _ in range(rng.randint(0, 6))]
+        ret = fitter.fit(deficits, slot_sizes)
+        assert (ret is not None) == _exhaustive_fit(catalogue.decos, skill_ids, deficits, slot_sizes)
+        if ret is None:
+            continue
+        free_slots = list(slot_sizes)
+        levels = [0] * len(skill_ids)
+        for (size, deco) in ret:
+            assert deco.slot_size <= size
+            free_slots.remove(size)
+            for (s, skill_id) in enumerate(skill_ids):
+                levels[s] += deco.skills.get(skill_id, 0)
+        assert all(l >= d for (l, d) in zip(levels, deficits))
+
+def _write_data_dir(data_dir, seed):
+    (skills_data, decos_data, armour_data) = _synthetic_data(seed)
+    for (filename, data) in [
+                ("skills.json", skills_data),
+                ("decorations.json", decos_data),
+                ("armour.json", armour_data),
+                ("armour_naming_schemes.json", NAMING_SCHEMES_DATA),
+            ]:
+        with open(os.path.join(data_dir, filename), encoding="utf-8", mode="w") as f:
+            f.write(json.dumps(data))
+    return
+
+def _parallel_search_results(data_dir, query, jobs):
+    parallel_search = ParallelSearch(
+        dict(zip(query.skill_ids, query.targets)),
+        weapon_slot_configs=[(), (1,), (3, 1)],
+        extra_slots=query.extra_slots,
+        jobs=jobs,
+        data_dir=data_dir,
+    )
+    ret = []
+    for (weapon_slots, build) in parallel_search:
+        alternatives = tuple(tuple(x.set_id for x in build.alternatives[s]) for s in ARMOUR_SLOTS)
+        ret.append((weapon_slots, _build_key(build), alternatives))
+    assert len(ret) == len(set(ret))
+    return set(ret)
+
+@pytest.mark.parametrize("seed", SEEDS[:3])
+def test_parallel_search_matches_serial(seed, tmp_path):
+    _write_data_dir(tmp_path, seed)
+    query = _synthetic_query(_synthetic_catalogue(seed), seed)
+    serial = _parallel_search_results(tmp_path, query, jobs=1)
+    assert _parallel_search_results(tmp_path, query, jobs=2) == serial
@@ -8,7 +8,7 @@ Parses armour from './hardcoded_data/' to generate the corresponding source file
 import os
 import json
 
-from utils import skill_id_to_object_name, to_name_filter_string
+from .utils import skill_id_to_object_name, to_name_filter_string
 
 source_template = """\
 import {{
@@ -83,6 +83,26 @@ def slot_id_to_index(slot_id):
         "legs":  4,
     }[slot_id]
 
+def armour_piece_name(obj, naming_schemes_data, slot_id):
+    # obj["prefix"] can be either a single string or a list of 5 (corresponding to slots)
+    prefixes = [obj["prefix"]]*5 if isinstance(obj["prefix"], str) else obj["prefix"]
+    naming_scheme = naming_schemes_data[obj["namingScheme"]]
+    suffix = obj["suffix"]
+    assert isinstance(prefixes, list)
+    assert len(prefixes) == 5
+    assert all(isinstance(x, str) for x in prefixes)
+
+    name_components = []
+
+    prefix = prefixes[slot_id_to_index(slot_id)]
+    if prefix != "":
+        name_components.append(prefix)
+    name_components.append(naming_scheme[slot_id_to_index(slot_id)])
+    if suffix != "":
+        name_components.append(suffix)
+
+    return " ".join(name_components)
+
 def make_skills_str(skills, seen_skill_objs):
     entries = []
     for (skill_id, level) in skills.items():
@@ -109,14 +129,6 @@ def generate_armour_source_file(armour_data, naming_schemes_data):
 
         piece_strs = {}
 
-        # obj["prefix"] can be either a single string or a list of 5 (corresponding to slots)
-        prefixes = [obj["prefix"]]*5 if isinstance(obj["prefix"], str) else obj["prefix"]
-        naming_scheme = naming_schemes_data[obj["namingScheme"]]
-        suffix = obj["suffix"]
-        assert isinstance(prefixes, list)
-        assert len(prefixes) == 5
-        assert all(isinstance(x, str) for x in prefixes)
-        
         assert set(obj["pieces"].keys()) == {"head", "chest", "arms", "waist", "legs"}
         for (slot_id, piece_data) in obj["pieces"].items():
             if piece_data is None:
@@ -131,16 +143,7 @@ def generate_armour_source_file(armour_data, naming_schemes_data):
             assert isinstance(skills, dict)
             assert all(isinstance(k, str) and isinstance(v, int) for (k, v) in skills.items())
 
-            name_components = []
-
-            prefix = prefixes[slot_id_to_index(slot_id)]
-            if prefix != "":
-                name_components.append(prefix)
-            name_components.append(naming_scheme[slot_id_to_index(slot_id)])
-            if suffix != "":
-                name_components.append(suffix)
-
-            name = " ".join(name_components)
+            name = armour_piece_name(obj, naming_schemes_data, slot_id)
 
             piece_strs[slot_id] = piece_fmt.format(
                 set_id= json.dumps(set_id),
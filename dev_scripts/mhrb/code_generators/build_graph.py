@@ -0,0 +1,201 @@
+"""
+Filename: build_graph.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Incremental builds for the code generator.
+
+Each target is one output file, built by a function of some JSON input files. The target also lists the Python
+modules its build function depends on, so that changing the generator itself also rebuilds everything it affects.
+
+The build state records, for every target, the SHA-256 of each input and module it was last built from, and of the
+output it produced:
+
+    {"<output file name>": {"inputs": {"<path>": "<sha256>", ...}, "params": ..., "output": "<sha256>"}, ...}
+
+A target is only rebuilt if any of those hashes changed (including the output itself, e.g. if it was edited or
+deleted by hand), or if it's built with different parameters.
+"""
+
+import os
+import json
+import time
+import traceback
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+
+from ..common import output_files
+
+class Target:
+    def __init__(self, output, inputs, modules, build_fn, params=None):
+        self.output = output     # Output file name
+        self.inputs = inputs     # Paths of JSON files. These are parsed and passed to build_fn in the same order.
+        self.modules = modules   # Paths of Python modules that build_fn depends on. These are only hashed.
+        self.build_fn = build_fn # Returns (output file contents, message to print)
+        self.params = params     # Any other options that change the output. Must be JSON-serializable.
+
+    def dependencies(self):
+        return self.inputs + self.modules
+
+class InputCache:
+    """
+    Reads input files, and keeps the parsed data of each one for as long as its contents stay the same.
+    """
+    def __init__(self):
+        self._contents = {} # {path: (sha256, bytes)}, only kept for one build
+        self._parsed = {}   # {path: (sha256, parsed data)}
+        self._preloaded = {} # {path: (sha256, parsed data)}, for data that didn't come from a file
+
+    def preload(self, path, data):
+        """
+        Uses data instead of reading the file at path. The hash is of data's canonical JSON serialization, so it won't
+        match the file's hash even if the data is the same.
+        """
+        sha256 = output_files.sha256_hex(json.dumps(data, sort_keys=True).encode("utf-8"))
+        self._preloaded[path] = (sha256, data)
+        return
+
+    def start_build(self):
+        self._contents = {}
+        return
+
+    def sha256(self, path):
+        if path in self._preloaded:
+            return self._preloaded[path][0]
+        if path not in self._contents:
+            with open(path, "rb") as f:
+                data = f.read()
+            self._contents[path] = (output_files.sha256_hex(data), data)
+        return self._contents[path][0]
+
+    def parse(self, path):
+        if path in self._preloaded:
+            return self._preloaded[path][1]
+        sha256 = self.sha256(path)
+        if (path not in self._parsed) or (self._parsed[path][0] != sha256):
+            self._parsed[path] = (sha256, json.loads(self._contents[path][1].decode("utf-8")))
+        return self._parsed[path][1]
+
+class Builder:
+    def __init__(self, output_dir_path, state_path):
+        self.output_dir_path = output_dir_path
+        self.state_path = state_path
+        self.inputs = InputCache()
+
+    def _read_state(self):
+        try:
+            with open(self.state_path, encoding="utf-8", mode="r") as f:
+                return json.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return {} # A missing or broken state file just means everything gets rebuilt
+
+    def _write_state(self, state):
+        output_files.write_if_changed(self.state_path, json.dumps(state, sort_keys=True, indent=4) + "\n")
+        return
+
+    def _record(self, target, output_sha256):
+        return {
+            "inputs": {k: self.inputs.sha256(k) for k in target.dependencies()},
+            "params": target.params,
+            "output": output_sha256,
+        }
+
+    def stale_targets(self, targets, state):
+        ret = []
+        for target in targets:
+            output_sha256 = output_files.file_sha256(os.path.join(self.output_dir_path, target.output))
+            if state.get(target.output) != self._record(target, output_sha256):
+                ret.append(target)
+        return ret
+
+    def _build_all(self, stale, jobs):
+        """
+        Yields (target, build_fn's result) for every stale target, in order.
+
+        With more than one job, the build functions are run across a process pool. Their results are still yielded
+        in order, so the output doesn't depend on which ones finish first.
+        """
+        calls = [(target.build_fn, [self.inputs.parse(x) for x in target.inputs]) for target in stale]
+        if (jobs > 1) and (len(calls) > 1):
+            try:
+                executor = ProcessPoolExecutor(max_workers=min(jobs, len(calls)))
+            except (OSError, NotImplementedError) as e:
+                print(f"Unable to start worker processes ({e}). Running serially instead.")
+            else:
+                with executor:
+                    futures = [executor.submit(build_fn, *args) for (build_fn, args) in calls]
+                    for (target, future) in zip(stale, futures):
+                        yield (target, future.result())
+                return
+        for (target, (build_fn, args)) in zip(stale, calls):
+            yield (target, build_fn(*args))
+        return
+
+    def build(self, targets, force=False, jobs=1):
+        """
+        Rebuilds every stale target (or every target, if force is set). Build functions must be picklable (e.g.
+        module-level functions) if jobs is more than 1.
+
+        Returns (the targets that were rebuilt, seconds taken).
+        """
+        start_time = time.perf_counter()
+        self.inputs.start_build()
+        state = self._read_state()
+        stale = list(targets) if force else self.stale_targets(targets, state)
+
+        with output_files.OutputDir(self.output_dir_path) as output_dir:
+            try:
+                for (target, (content, message)) in self._build_all(stale, jobs):
+                    output_dir.write(target.output, content)
+                    state[target.output] = self._record(target, output_dir.manifest[target.output])
+                    if message:
+                        print(message)
+            finally:
+                # Whatever did get built is still recorded if a later target fails
+                self._write_state(state)
+        return (stale, time.perf_counter() - start_time)
+
+    def watch(self, targets, jobs=1, poll_seconds=0.2):
+        """
+        Builds, then keeps polling every input and module for changes, rebuilding whatever's stale each time.
+
+        Parsed inputs are kept in memory between builds, so only files that actually changed get parsed again.
+        Errors (e.g. an input that's been saved half-way) are printed, and the next change is waited for.
+
+        Modules that have already been imported can't be rebuilt from, so this returns the path of the first module
+        that changes. Callers should restart (e.g. by re-executing the script).
+        """
+        data_paths = sorted(set(chain.from_iterable(x.inputs for x in targets)))
+        module_paths = sorted(set(chain.from_iterable(x.modules for x in targets)))
+        stats = None
+        while True:
+            new_stats = _stat_all(data_paths + module_paths)
+            if stats is not None:
+                for path in module_paths:
+                    if new_stats[path] != stats[path]:
+                        return path
+            if new_stats != stats:
+                stats = new_stats
+                try:
+                    (rebuilt, seconds) = self.build(targets, jobs=jobs)
+                except Exception:
+                    traceback.print_exc()
+                    print("Build failed. Waiting for changes...")
+                else:
+                    if len(rebuilt) > 0:
+                        names = ", ".join(x.output for x in rebuilt) if (len(rebuilt) <= 3) else f"{len(rebuilt)} files"
+                        print(f"Regenerated {names} in {seconds * 1000:.0f} ms. Waiting for changes...")
+            time.sleep(poll_seconds)
+
+def _stat_all(paths):
+    """
+    Returns {path: (mtime, size)}, with None for files that don't exist.
+    """
+    ret = {}
+    for path in paths:
+        try:
+            st = os.stat(path)
+            ret[path] = (st.st_mtime_ns, st.st_size)
+        except FileNotFoundError:
+            ret[path] = None
+    return ret
@@ -8,7 +8,7 @@ Parses skills from './hardcoded_data/' to generate the corresponding source file
 import os
 import json
 
-from utils import skill_id_to_object_name, to_name_filter_string
+from .utils import skill_id_to_object_name, to_name_filter_string
 
 source_template = """\
 import {{type Decoration}} from "../../common/types";
@@ -44,6 +44,12 @@ array_entry_fmt = """\
     }},\
 """
 
+def deco_name(obj):
+    if isinstance(obj.get("verbatimName"), str):
+        assert str(obj["slotSize"]) in obj["verbatimName"] # We expect the jewel size to be in there somewhere
+        return obj["verbatimName"]
+    return obj["name"] + " Jewel " + str(obj["slotSize"])
+
 def generate_decos_source_file(json_data, scraped_json_data):
     assert isinstance(json_data, list)
     assert isinstance(scraped_json_data, list)
@@ -73,12 +79,7 @@ def generate_decos_source_file(json_data, scraped_json_data):
         assert isinstance(obj["skills"], dict)
         assert isinstance(obj["icon"], str)
 
-        actual_name = None
-        if isinstance(obj.get("verbatimName"), str):
-            actual_name = obj["verbatimName"]
-            assert str(obj["slotSize"]) in actual_name # We expect the jewel size to be in there somewhere
-        else:
-            actual_name = obj["name"] + " Jewel " + str(obj["slotSize"])
+        actual_name = deco_name(obj)
         names_found.add(actual_name)
 
         skills_entries = []
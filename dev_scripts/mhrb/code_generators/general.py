@@ -6,7 +6,7 @@ Author:   simshadows <contact@simshadows.com>
 import os
 import json
 
-from utils import ramp_id_to_object_name, to_name_filter_string
+from .utils import ramp_id_to_object_name, to_name_filter_string
 
 source_template = """\
 import {{type {obj_type}}} from "../../common/types";
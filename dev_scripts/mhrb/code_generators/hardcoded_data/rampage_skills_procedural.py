@@ -15,8 +15,8 @@ _to_roman = {
     4: "IV",
 }
 
-def _ele(name, short_id_prefix):
-    id_prefix = name.lower()
+def _ele(name, id_prefix, short_id_prefix):
+    # id_prefix is given separately from the name, since the IDs have to match the IDs in the scraped weapon data.
     return chain(
         ({
             "id":      f"{id_prefix}_boost_{i}",
@@ -67,11 +67,11 @@ def _stat(name, short_id_prefix, generate_effect):
 
 def get_procedural_rampage_skills():
     return list(chain(
-        _ele("Fire"      , "fi"),
-        _ele("Water"     , "wa"),
-        _ele("Thunder"   , "th"),
-        _ele("Ice"       , "ic"),
-        _ele("Dragão"    , "dr"),
+        _ele("Fire"      , "fire"   , "fi"),
+        _ele("Water"     , "water"  , "wa"),
+        _ele("Thunder"   , "thunder", "th"),
+        _ele("Ice"       , "ice"    , "ic"),
+        _ele("Dragão"    , "dragon" , "dr"),
         _stat("Poison"   , "po", True ),
         _stat("Paralysis", "pa", True ),
         _stat("Sleep"    , "sl", True ),
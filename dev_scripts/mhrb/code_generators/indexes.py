@@ -0,0 +1,167 @@
+"""
+Filename: indexes.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Precomputes lookup indexes over the skill, rampage skill, decoration, armour and weapon data, so that the app can
+look things up without building maps at startup, or scanning the whole catalogue.
+
+Everything is referred to by its position in the corresponding generated array, so the indexes are just arrays of
+integers:
+
+    skill index          position in skillsArray
+    rampage skill index  position in rampsArray
+    decoration index     position in decosArray
+    armour piece ref     (position of the set in armourSetsArray * 5) + slot index (head=0, chest=1, ..., legs=4)
+    weapon index         position in that category's weapons array (trees in order, then the weapons in each tree)
+    category index       position in WEAPON_CATEGORIES, which is also the order of the weapon chunk manifest
+
+The *Order arrays are each array's positions, sorted by a key. The app looks things up by key with a binary search
+over these. Strings are sorted by UTF-16 code units, since that's how Javascript compares them.
+
+Indexes that have one row per skill are in skillsArray order, and each row is written as flat [ref, level, ...] pairs.
+
+rampToWeapons has one row per rampage skill, in rampsArray order. Each row is written as one run per weapon category,
+[category index, number of weapons, weapon index, weapon index, ...], so the category isn't repeated for every weapon.
+
+weaponTreeOffsets has where each tree starts in its category's weapons array, plus the number of weapons at the end,
+so tree t is made of weapons offsets[t] up to (but not including) offsets[t + 1].
+
+These are resolved into objects by 'src/mhrb/_app/database/generated_code/indexes.ts' and 'lookups.ts'.
+"""
+
+import json
+
+from .armour import slot_id_to_index
+
+source_template = """\
+import {{
+    type WeaponCategory,
+}} from "../../common/types";
+
+export const skillIdOrder: Readonly<number[]> = {skill_id_order};
+export const skillShortIdOrder: Readonly<number[]> = {skill_short_id_order};
+export const rampIdOrder: Readonly<number[]> = {ramp_id_order};
+export const rampShortIdOrder: Readonly<number[]> = {ramp_short_id_order};
+export const decoIdOrder: Readonly<number[]> = {deco_id_order};
+export const armourSetIdOrder: Readonly<number[]> = {armour_set_id_order};
+
+export const weaponIdOrders: {{readonly [K in WeaponCategory]: Readonly<number[]>}} = {{
+{weapon_id_orders}
+}};
+
+export const weaponTreeOffsets: {{readonly [K in WeaponCategory]: Readonly<number[]>}} = {{
+{weapon_tree_offsets}
+}};
+
+// [armour piece ref, level, ...] for each skill
+export const skillToArmourPieces: Readonly<Readonly<number[]>[]> = [
+{skill_to_armour_pieces}
+];
+
+// [decoration index, level, ...] for each skill
+export const skillToDecos: Readonly<Readonly<number[]>[]> = [
+{skill_to_decos}
+];
+
+// [category index, number of weapons, weapon index, ...] runs for each rampage skill
+export const rampToWeapons: Readonly<Readonly<number[]>[]> = [
+{ramp_to_weapons}
+];
+"""
+
+category_entry_fmt = """\
+    {category}: {entry},\
+"""
+
+row_fmt = """\
+    {row},\
+"""
+
+def _compact(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=True)
+
+def _rows(rows):
+    return "\n".join(row_fmt.format(row=_compact(x)) for x in rows)
+
+def _category_entries(entries):
+    return "\n".join(category_entry_fmt.format(category=k, entry=_compact(v)) for (k, v) in entries.items())
+
+def _sort_key(key):
+    # Javascript compares strings by UTF-16 code units, which isn't always the same as Python's code point order
+    return key.encode("utf-16-be") if isinstance(key, str) else key
+
+def _order(keys):
+    keys = list(keys)
+    if len(set(keys)) != len(keys):
+        raise ValueError("Duplicate keys: " + str(sorted(k for k in set(keys) if keys.count(k) > 1)))
+    return sorted(range(len(keys)), key=lambda i: _sort_key(keys[i]))
+
+def generate_indexes_source_file(skills_data, ramps_data, decos_data, armour_data, weapon_data):
+    assert isinstance(skills_data, list)
+    assert isinstance(ramps_data, list)
+    assert isinstance(decos_data, list)
+    assert isinstance(armour_data, list)
+    assert isinstance(weapon_data, dict)
+
+    skill_indices = {obj["id"]: i for (i, obj) in enumerate(skills_data)}
+    assert len(skill_indices) == len(skills_data) # Check for duplicates
+
+    skill_to_armour_pieces = [[] for _ in skills_data]
+    for (set_index, [_, obj]) in enumerate(armour_data):
+        for (slot_id, piece_data) in obj["pieces"].items():
+            if piece_data is None:
+                continue
+            ref = (set_index * 5) + slot_id_to_index(slot_id)
+            for (skill_id, level) in piece_data[1].items():
+                if skill_id not in skill_indices:
+                    raise ValueError(f"Armour set {obj['setName']} has an unknown skill: {skill_id}")
+                skill_to_armour_pieces[skill_indices[skill_id]].extend([ref, level])
+
+    skill_to_decos = [[] for _ in skills_data]
+    for (deco_index, [deco_id, obj]) in enumerate(decos_data):
+        for (skill_id, level) in obj["skills"].items():
+            if skill_id not in skill_indices:
+                raise ValueError(f"Decoration {deco_id} has an unknown skill: {skill_id}")
+            skill_to_decos[skill_indices[skill_id]].extend([deco_index, level])
+
+    ramp_indices = {obj["id"]: i for (i, obj) in enumerate(ramps_data)}
+    assert len(ramp_indices) == len(ramps_data) # Check for duplicates
+
+    weapon_id_orders = {}
+    weapon_tree_offsets = {}
+    ramp_to_weapons = [[] for _ in ramps_data]
+    for (category_index, (category, category_data)) in enumerate(weapon_data.items()):
+        weapon_ids = []
+        offsets = []
+        ramp_to_category_weapons = [[] for _ in ramps_data]
+        for tree_data in category_data.values():
+            offsets.append(len(weapon_ids))
+            for (weapon_id, obj) in tree_data.items():
+                weapon_index = len(weapon_ids)
+                weapon_ids.append(weapon_id)
+                ramp_ids = {ramp_id for slot in obj["rampSkills"] for [ramp_id, _] in slot}
+                for ramp_id in sorted(ramp_ids):
+                    if ramp_id not in ramp_indices:
+                        raise ValueError(f"Weapon {category} {weapon_id} has an unknown rampage skill: {ramp_id}")
+                    ramp_to_category_weapons[ramp_indices[ramp_id]].append(weapon_index)
+        offsets.append(len(weapon_ids))
+        weapon_id_orders[category] = _order(weapon_ids)
+        weapon_tree_offsets[category] = offsets
+        for (row, weapon_indices) in zip(ramp_to_weapons, ramp_to_category_weapons):
+            if len(weapon_indices) > 0:
+                row.extend([category_index, len(weapon_indices)] + weapon_indices)
+
+    return source_template.format(
+        skill_id_order=_compact(_order(obj["id"] for obj in skills_data)),
+        skill_short_id_order=_compact(_order(obj["shortId"] for obj in skills_data)),
+        ramp_id_order=_compact(_order(obj["id"] for obj in ramps_data)),
+        ramp_short_id_order=_compact(_order(obj["shortID"] for obj in ramps_data)),
+        deco_id_order=_compact(_order(deco_id for [deco_id, _] in decos_data)),
+        armour_set_id_order=_compact(_order(set_id for [set_id, _] in armour_data)),
+        weapon_id_orders=_category_entries(weapon_id_orders),
+        weapon_tree_offsets=_category_entries(weapon_tree_offsets),
+        skill_to_armour_pieces=_rows(skill_to_armour_pieces),
+        skill_to_decos=_rows(skill_to_decos),
+        ramp_to_weapons=_rows(ramp_to_weapons),
+    )
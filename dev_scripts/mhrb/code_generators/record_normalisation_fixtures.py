@@ -0,0 +1,58 @@
+"""
+Filename: record_normalisation_fixtures.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Records what this package's to_name_filter_string() and to_trigrams() give for a set of strings, so that the app's
+Javascript implementations can be checked against them (by 'src/mhrb/_app/common/mappings.test.ts').
+
+Run it from the repository root after changing either implementation:
+
+    python3 -m dev_scripts.mhrb.code_generators.record_normalisation_fixtures
+"""
+
+import os
+import json
+
+from .utils import to_name_filter_string, to_trigrams
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "normalisation_fixtures.json")
+
+TEST_STRINGS = [
+    "",
+    "ab",
+    "Attack Boost",
+    "Reforço de Ataque",
+    "Reforço de Defesa ",
+    "Azure Era \"Soaring Dragão\"",
+    "Kamura Cleaver I",
+    "ÉCLAIR",
+    "ΣΑΣ", # Final sigma
+    "İstanbul", # Lowercases to more than one code point
+    "STRAßE ẞ",
+    "a\tb\nc\r\nd\ve\ff",
+    "a\u00a0b\u1680c\u2000d\u2005e\u200af",
+    "a\u2028b\u2029c\u202fd\u205fe\u3000f\ufeffg",
+    "a\u200bb\u0085c\u180ed", # Not whitespace in Javascript
+    "\U0001F600 Great Sword \U0001F600", # Outside the BMP, so it's two UTF-16 code units
+    "\U0001D400\U0001D401\U0001D402\U0001D403",
+]
+
+def run():
+    cases = []
+    for s in TEST_STRINGS:
+        filter_string = to_name_filter_string(s)
+        cases.append({
+                "input": s,
+                "filterString": filter_string,
+                "trigrams": sorted(to_trigrams(filter_string)),
+            })
+    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
+    with open(OUTPUT_PATH, "w", encoding="utf-8") as f:
+        # ASCII-only, so that every code point (including the odd whitespace ones) survives editors and diffs intact.
+        json.dump(cases, f, ensure_ascii=True, indent=4)
+        f.write("\n")
+    print(f"Wrote {len(cases)} cases to {OUTPUT_PATH}")
+
+if __name__ == '__main__':
+    run()
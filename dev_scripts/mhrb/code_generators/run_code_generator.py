@@ -4,20 +4,37 @@
 Filename: run_code_generator.py
 Author:   simshadows <contact@simshadows.com>
 
-Runs the code generator.
+Runs the code generator. Run it from the repository root with `yarn run-code-generators`, or:
+
+    python3 -m dev_scripts.mhrb.code_generators.run_code_generator
+
+Generated files are only regenerated if something they depend on has changed (see build_graph.py). Use `--force`
+to regenerate everything.
+
+Files are generated in parallel across `--jobs` processes (one per CPU by default).
+
+With `--watch`, this keeps running and regenerates files within moments of their inputs being saved.
 """
 
 import os
+import sys
 import json
+import argparse
+import functools
 
-from general import generate_source_file
-from utils import ramp_id_to_object_name
+from .general import generate_source_file
+from .build_graph import Target, Builder
+from .utils import ramp_id_to_object_name
 
-from skills import generate_skills_source_file
-from decorations import generate_decos_source_file
-from armour import generate_armour_source_file
-from weapons import generate_weapon_source_files
-from hardcoded_data.rampage_skills_procedural import get_procedural_rampage_skills
+from .skills import generate_skills_source_file
+from .decorations import generate_decos_source_file
+from .armour import generate_armour_source_file
+from .weapons import generate_weapon_source_files
+from .weapons_json import generate_weapon_payload_source_files
+from .weapon_chunks import generate_weapon_chunks_source_file
+from .indexes import generate_indexes_source_file
+from .search_index import generate_search_index_source_file
+from .hardcoded_data.rampage_skills_procedural import get_procedural_rampage_skills
 
 GENERATED_CODE_NOTICE = """\
 /*
@@ -62,7 +79,35 @@ GENERATED_CODE_NOTICE = """\
 DATA_PATH_FMT = "./dev_scripts/mhrb/code_generators/hardcoded_data/{s}"
 SCRAPED_DECOS_PATH = "./dev_scripts/mhrb/kiranico_scrape/downloaded_data/downloaded_data_decorations.json"
 
-OUTPUT_PATH_FMT = "./src/mhrb/_app/database/generated_code/{s}"
+MODULE_PATH_FMT = "./dev_scripts/mhrb/code_generators/{s}"
+WEAPON_DATA_FMT = "../../kiranico_scrape/output/weapons_{category}.json"
+
+OUTPUT_DIR = "./src/mhrb/_app/database/generated_code/"
+BUILD_STATE_PATH = "./dev_scripts/mhrb/code_generators/build_state.json"
+
+WATCH_POLL_SECONDS = 0.2
+
+# "ts" writes each weapon as a Typescript object literal (weapons.py), while "json" writes compact JSON payloads that
+# are loaded at runtime (weapons_json.py). Both export the same arrays. The committed files use the default.
+WEAPON_FORMATS = ["ts", "json"]
+DEFAULT_WEAPON_FORMAT = "json"
+
+WEAPON_CATEGORIES = [
+    "greatsword",
+    "longsword",
+    "swordandshield",
+    "dualblades",
+    "lance",
+    "gunlance",
+    "hammer",
+    "huntinghorn",
+    "switchaxe",
+    "chargeblade",
+    "insectglaive",
+    "lightbowgun",
+    "heavybowgun",
+    "bow",
+]
 
 def read_data(s):
     with open(DATA_PATH_FMT.format(s=s), encoding="utf-8", mode="r") as f:
@@ -70,78 +115,258 @@ def read_data(s):
 def read_deco_data():
     with open(SCRAPED_DECOS_PATH, encoding="utf-8", mode="r") as f:
         return json.loads(f.read())
+def read_weapon_data():
+    return {category: read_data(WEAPON_DATA_FMT.format(category=category)) for category in WEAPON_CATEGORIES}
 
-def write_source_file(s, data):
-    assert isinstance(data, str)
-    with open(OUTPUT_PATH_FMT.format(s=s), "w") as f:
-        f.write(GENERATED_CODE_NOTICE + data)
+#
+# TARGETS
+#
 
-def run():
-    print(f"Current working directory: {os.getcwd()}")
+def _data_path(s):
+    return DATA_PATH_FMT.format(s=s)
+def _module_path(s):
+    return MODULE_PATH_FMT.format(s=s)
+
+# Every target depends on this module too, since it has the generated code notice and the target definitions.
+_COMMON_MODULES = [_module_path("run_code_generator.py"), _module_path("utils.py")]
+_WEAPON_MODULES = [_module_path("weapons.py")] + [_module_path("weapons_details/" + x) for x in [
+    "sharpness.py",
+    "gunlance.py",
+    "huntinghorn.py",
+    "switchaxe.py",
+    "chargeblade.py",
+    "insectglaive.py",
+    "bowguns.py",
+    "bow.py",
+]] + [_module_path("weapons_json.py")]
+
+def _build_skills(skills_data):
+    return (
+        GENERATED_CODE_NOTICE + generate_skills_source_file(skills_data),
+        f"Discovered {len(skills_data)} skills.",
+    )
 
-    skills_data = read_data("skills.json")
-    write_source_file("_generated_skills.ts", generate_skills_source_file(skills_data))
-    print(f"Discovered {len(skills_data)} skills.")
-
-    ramps_data = get_procedural_rampage_skills() + read_data("rampage_skills_individual.json")
-    write_source_file(
-        "_generated_rampage_skills.ts",
-        generate_source_file(
-            {
-                "keys": ["id", "shortID", "name"],
-                "array": "rampsArray",
-                "type": "RampageSkill",
-                "obj_name_map": ramp_id_to_object_name,
-            },
-            ramps_data,
+def _get_ramps_data(ramps_data_individual):
+    return get_procedural_rampage_skills() + ramps_data_individual
+
+def _build_rampage_skills(ramps_data_individual):
+    ramps_data = _get_ramps_data(ramps_data_individual)
+    source = generate_source_file(
+        {
+            "keys": ["id", "shortID", "name"],
+            "array": "rampsArray",
+            "type": "RampageSkill",
+            "obj_name_map": ramp_id_to_object_name,
+        },
+        ramps_data,
+    )
+    return (GENERATED_CODE_NOTICE + source, f"Discovered {len(ramps_data)} rampage skills.")
+
+def _build_decos(decos_data, decos_data_scraped):
+    return (
+        GENERATED_CODE_NOTICE + generate_decos_source_file(decos_data, decos_data_scraped),
+        f"Discovered {len(decos_data)} decorations.",
+    )
+
+def _build_armour(armour_data, armour_naming_schemes_data):
+    return (
+        GENERATED_CODE_NOTICE + generate_armour_source_file(armour_data, armour_naming_schemes_data),
+        f"Discovered {len(armour_data)} armour sets.",
+    )
+
+def _build_weapons(category, weapon_format, category_data):
+    if weapon_format == "json":
+        source = generate_weapon_payload_source_files({category: category_data})[category]
+    else:
+        source = generate_weapon_source_files({category: category_data})[category]
+    return (GENERATED_CODE_NOTICE + source, f"Discovered {len(category_data)} weapon trees of category '{category}'.")
+
+def _build_weapon_chunks(*weapon_data_per_category):
+    assert len(weapon_data_per_category) == len(WEAPON_CATEGORIES)
+    weapon_data = dict(zip(WEAPON_CATEGORIES, weapon_data_per_category))
+    return (
+        GENERATED_CODE_NOTICE + generate_weapon_chunks_source_file(weapon_data),
+        f"Discovered {len(weapon_data)} weapon chunks.",
+    )
+
+def _build_indexes(skills_data, ramps_data_individual, decos_data, armour_data, *weapon_data_per_category):
+    assert len(weapon_data_per_category) == len(WEAPON_CATEGORIES)
+    weapon_data = dict(zip(WEAPON_CATEGORIES, weapon_data_per_category))
+    return (
+        GENERATED_CODE_NOTICE + generate_indexes_source_file(
+            skills_data,
+            _get_ramps_data(ramps_data_individual),
+            decos_data,
+            armour_data,
+            weapon_data,
         ),
+        "Generated lookup indexes.",
     )
-    print(f"Discovered {len(ramps_data)} rampage skills.")
-
-    decos_data = read_data("decorations.json")
-    decos_data_scraped = read_deco_data()
-    write_source_file("_generated_decorations.ts", generate_decos_source_file(decos_data, decos_data_scraped))
-    print(f"Discovered {len(decos_data)} decorations.")
-
-    armour_data = read_data("armour.json")
-    armour_naming_schemes_data = read_data("armour_naming_schemes.json")
-    write_source_file("_generated_armour.ts", generate_armour_source_file(armour_data, armour_naming_schemes_data))
-    print(f"Discovered {len(armour_data)} armour sets.")
-
-    weapon_data = {
-        "greatsword":     read_data("../../kiranico_scrape/output/weapons_greatsword.json"    ),
-        "longsword":      read_data("../../kiranico_scrape/output/weapons_longsword.json"     ),
-        "swordandshield": read_data("../../kiranico_scrape/output/weapons_swordandshield.json"),
-        "dualblades":     read_data("../../kiranico_scrape/output/weapons_dualblades.json"    ),
-        "lance":          read_data("../../kiranico_scrape/output/weapons_lance.json"         ),
-        "gunlance":       read_data("../../kiranico_scrape/output/weapons_gunlance.json"      ),
-        "hammer":         read_data("../../kiranico_scrape/output/weapons_hammer.json"        ),
-        "huntinghorn":    read_data("../../kiranico_scrape/output/weapons_huntinghorn.json"   ),
-        "switchaxe":      read_data("../../kiranico_scrape/output/weapons_switchaxe.json"     ),
-        "chargeblade":    read_data("../../kiranico_scrape/output/weapons_chargeblade.json"   ),
-        "insectglaive":   read_data("../../kiranico_scrape/output/weapons_insectglaive.json"  ),
-        "lightbowgun":    read_data("../../kiranico_scrape/output/weapons_lightbowgun.json"   ),
-        "heavybowgun":    read_data("../../kiranico_scrape/output/weapons_heavybowgun.json"   ),
-        "bow":            read_data("../../kiranico_scrape/output/weapons_bow.json"           ),
-    }
-    weapon_source_files_content = generate_weapon_source_files(weapon_data)
-    write_source_file("_generated_weapon_greatsword.ts"    , weapon_source_files_content["greatsword"    ])
-    write_source_file("_generated_weapon_longsword.ts"     , weapon_source_files_content["longsword"     ])
-    write_source_file("_generated_weapon_swordandshield.ts", weapon_source_files_content["swordandshield"])
-    write_source_file("_generated_weapon_dualblades.ts"    , weapon_source_files_content["dualblades"    ])
-    write_source_file("_generated_weapon_lance.ts"         , weapon_source_files_content["lance"         ])
-    write_source_file("_generated_weapon_gunlance.ts"      , weapon_source_files_content["gunlance"      ])
-    write_source_file("_generated_weapon_hammer.ts"        , weapon_source_files_content["hammer"        ])
-    write_source_file("_generated_weapon_huntinghorn.ts"   , weapon_source_files_content["huntinghorn"   ])
-    write_source_file("_generated_weapon_switchaxe.ts"     , weapon_source_files_content["switchaxe"     ])
-    write_source_file("_generated_weapon_chargeblade.ts"   , weapon_source_files_content["chargeblade"   ])
-    write_source_file("_generated_weapon_insectglaive.ts"  , weapon_source_files_content["insectglaive"  ])
-    write_source_file("_generated_weapon_lightbowgun.ts"   , weapon_source_files_content["lightbowgun"   ])
-    write_source_file("_generated_weapon_heavybowgun.ts"   , weapon_source_files_content["heavybowgun"   ])
-    write_source_file("_generated_weapon_bow.ts"           , weapon_source_files_content["bow"           ])
-    for (k, v) in weapon_data.items():
-        print(f"Discovered {len(v)} weapon trees of category '{k}'.")
 
-if __name__ == "__main__":
-    run()
+def _build_search_index(skills_data, decos_data, armour_data, armour_naming_schemes_data, *weapon_data_per_category):
+    assert len(weapon_data_per_category) == len(WEAPON_CATEGORIES)
+    weapon_data = dict(zip(WEAPON_CATEGORIES, weapon_data_per_category))
+    return (
+        GENERATED_CODE_NOTICE + generate_search_index_source_file(
+            skills_data,
+            decos_data,
+            armour_data,
+            armour_naming_schemes_data,
+            weapon_data,
+        ),
+        "Generated search index.",
+    )
+
+def weapon_data_path(category):
+    return _data_path(WEAPON_DATA_FMT.format(category=category))
+
+def get_targets(weapon_format=DEFAULT_WEAPON_FORMAT):
+    targets = [
+        Target(
+            "_generated_skills.ts",
+            [_data_path("skills.json")],
+            _COMMON_MODULES + [_module_path("skills.py")],
+            _build_skills,
+        ),
+        Target(
+            "_generated_rampage_skills.ts",
+            [_data_path("rampage_skills_individual.json")],
+            _COMMON_MODULES + [_module_path("general.py"), _module_path("hardcoded_data/rampage_skills_procedural.py")],
+            _build_rampage_skills,
+        ),
+        Target(
+            "_generated_decorations.ts",
+            [_data_path("decorations.json"), SCRAPED_DECOS_PATH],
+            _COMMON_MODULES + [_module_path("decorations.py")],
+            _build_decos,
+        ),
+        Target(
+            "_generated_armour.ts",
+            [_data_path("armour.json"), _data_path("armour_naming_schemes.json")],
+            _COMMON_MODULES + [_module_path("armour.py")],
+            _build_armour,
+        ),
+    ]
+    for category in WEAPON_CATEGORIES:
+        targets.append(Target(
+            f"_generated_weapon_{category}.ts",
+            [weapon_data_path(category)],
+            _COMMON_MODULES + _WEAPON_MODULES,
+            functools.partial(_build_weapons, category, weapon_format),
+            params={"weapon_format": weapon_format},
+        ))
+    # Only depends on the weapon data for the manifest's counts, so it doesn't need rebuilding for a new weapon format
+    targets.append(Target(
+        "_generated_weapon_chunks.ts",
+        [weapon_data_path(x) for x in WEAPON_CATEGORIES],
+        _COMMON_MODULES + [_module_path("weapon_chunks.py")],
+        _build_weapon_chunks,
+    ))
+    targets.append(Target(
+        "_generated_indexes.ts",
+        [
+            _data_path("skills.json"),
+            _data_path("rampage_skills_individual.json"),
+            _data_path("decorations.json"),
+            _data_path("armour.json"),
+        ] + [weapon_data_path(x) for x in WEAPON_CATEGORIES],
+        _COMMON_MODULES + [
+            _module_path("indexes.py"),
+            _module_path("armour.py"),
+            _module_path("hardcoded_data/rampage_skills_procedural.py"),
+        ],
+        _build_indexes,
+    ))
+    targets.append(Target(
+        "_generated_search_index.ts",
+        [
+            _data_path("skills.json"),
+            _data_path("decorations.json"),
+            _data_path("armour.json"),
+            _data_path("armour_naming_schemes.json"),
+        ] + [weapon_data_path(x) for x in WEAPON_CATEGORIES],
+        _COMMON_MODULES + [
+            _module_path("search_index.py"),
+            _module_path("armour.py"),
+            _module_path("decorations.py"),
+        ],
+        _build_search_index,
+    ))
+    return targets
+
+#
+# RUN
+#
+
+def run(weapon_data=None, force=False, jobs=1, weapon_format=DEFAULT_WEAPON_FORMAT):
+    """
+    Only regenerates files whose inputs (or generator code) changed since they were last generated. Set force to
+    regenerate everything anyway.
 
+    With more than one job, files are generated in parallel across that many processes. The output is the same
+    either way.
+
+    weapon_data is the contents of every weapons_*.json file, as {category: data}. This lets the output of
+    process_downloaded_data.process() be passed in directly. If None, the files are read.
+
+    weapon_format is one of WEAPON_FORMATS.
+    """
+    print(f"Current working directory: {os.getcwd()}")
+
+    builder = Builder(OUTPUT_DIR, BUILD_STATE_PATH)
+    if weapon_data is not None:
+        for (category, category_data) in weapon_data.items():
+            builder.inputs.preload(weapon_data_path(category), category_data)
+
+    targets = get_targets(weapon_format)
+    (rebuilt, seconds) = builder.build(targets, force=force, jobs=jobs)
+    print(f"Regenerated {len(rebuilt)} of {len(targets)} files in {seconds:.2f} seconds.")
+    return
+
+def watch(jobs=1, poll_seconds=WATCH_POLL_SECONDS, weapon_format=DEFAULT_WEAPON_FORMAT):
+    """
+    Regenerates files as their inputs change, until interrupted.
+
+    If the code generator itself changes, the script restarts itself so the new code gets used.
+    """
+    print(f"Current working directory: {os.getcwd()}")
+    print(f"Watching for changes every {poll_seconds} seconds. Press Ctrl+C to stop.")
+
+    builder = Builder(OUTPUT_DIR, BUILD_STATE_PATH)
+    changed_module = builder.watch(get_targets(weapon_format), jobs=jobs, poll_seconds=poll_seconds)
+
+    print(f"{changed_module} changed. Restarting...")
+    sys.stdout.flush()
+    os.execv(sys.executable, [sys.executable] + sys.argv)
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the code generator.")
+    parser.add_argument("--force", action="store_true",
+                        help="Regenerate every file, even if nothing changed.")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of processes to generate files with. Use 1 to generate everything in this "
+                             "process. Defaults to the number of CPUs.")
+    parser.add_argument("--weapon-format", choices=WEAPON_FORMATS, default=DEFAULT_WEAPON_FORMAT,
+                        help="How weapon data is written: \"ts\" for Typescript object literals, or \"json\" for "
+                             "JSON payloads that are parsed at runtime.")
+    parser.add_argument("--watch", action="store_true",
+                        help="Keep running, and regenerate files whenever their inputs change.")
+    parser.add_argument("--poll-seconds", type=float, default=WATCH_POLL_SECONDS,
+                        help="How often --watch checks for changes.")
+    args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+
+    if args.watch:
+        if args.force:
+            run(force=True, jobs=args.jobs, weapon_format=args.weapon_format)
+        try:
+            watch(jobs=args.jobs, poll_seconds=args.poll_seconds, weapon_format=args.weapon_format)
+        except KeyboardInterrupt:
+            pass
+    else:
+        run(force=args.force, jobs=args.jobs, weapon_format=args.weapon_format)
+    return
+
+if __name__ == "__main__":
+    main()
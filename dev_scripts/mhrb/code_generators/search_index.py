@@ -0,0 +1,114 @@
+"""
+Filename: search_index.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Builds a trigram index over the name filter strings of every skill, decoration, armour piece and weapon, so that
+name searches don't have to scan the whole catalogue.
+
+Every searchable object is a document, numbered in this order:
+
+    1. skills, in skillsArray order
+    2. decorations, in decosArray order
+    3. armour pieces, in armourSetsArray order, then slot order (head, chest, arms, waist, legs), skipping sets
+       that don't have a piece in that slot
+    4. weapons, in WEAPON_CATEGORIES order (the same order as the chunk manifest in weapon_chunks.py), then in the
+       order of that category's array
+    5. weapon trees, in WEAPON_CATEGORIES order, then in tree order
+
+Each document's fields are the same strings as its filter helpers:
+
+    skills and decorations  nameLower
+    armour pieces           nameLower, setNameLower, hintStrLower
+    weapons                 nameLower
+    weapon trees            treeNameLower (of the tree's weapons)
+
+Tree names are indexed once per tree rather than once per weapon. The app expands a matching tree into its weapons
+with weaponTreeOffsets from the lookup indexes (indexes.py).
+
+The index maps every trigram (three consecutive code points) of each field to the sorted list of documents that
+have it. Postings are delta-encoded, i.e. each number is the difference from the previous document number.
+
+A document that has every trigram of a query isn't guaranteed to contain the query, so candidates still need to be
+checked against their fields. This is done by 'src/mhrb/_app/database/generated_code/search.ts'.
+"""
+
+import json
+from collections import defaultdict
+
+from .utils import to_name_filter_string, to_trigrams
+from .armour import armour_piece_name
+from .decorations import deco_name
+
+ARMOUR_SLOTS = ["head", "chest", "arms", "waist", "legs"]
+
+source_template = """\
+export const searchNumDocs: number = {num_docs};
+
+export const searchTrigrams: Readonly<string[]> = {trigrams};
+
+// Delta-encoded document numbers for each trigram, in the same order as searchTrigrams
+export const searchPostings: Readonly<Readonly<number[]>[]> = [
+{postings}
+];
+"""
+
+postings_fmt = """\
+    {postings},\
+"""
+
+def _compact(obj):
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=True)
+
+def _document_fields(skills_data, decos_data, armour_data, armour_naming_schemes_data, weapon_data):
+    for obj in skills_data:
+        yield [obj["name"]]
+    for [_, obj] in decos_data:
+        yield [deco_name(obj)]
+    for [_, obj] in armour_data:
+        for slot_id in ARMOUR_SLOTS:
+            if obj["pieces"][slot_id] is not None:
+                yield [armour_piece_name(obj, armour_naming_schemes_data, slot_id), obj["setName"], obj["searchHint"]]
+    for category_data in weapon_data.values():
+        for tree_data in category_data.values():
+            for obj in tree_data.values():
+                yield [obj["name"]]
+    for category_data in weapon_data.values():
+        for tree_name in category_data.keys():
+            yield [tree_name]
+    return
+
+def generate_search_index_source_file(skills_data, decos_data, armour_data, armour_naming_schemes_data, weapon_data):
+    assert isinstance(skills_data, list)
+    assert isinstance(decos_data, list)
+    assert isinstance(armour_data, list)
+    assert isinstance(weapon_data, dict)
+
+    postings = defaultdict(list)
+    num_docs = 0
+    for (doc, fields) in enumerate(_document_fields(
+        skills_data,
+        decos_data,
+        armour_data,
+        armour_naming_schemes_data,
+        weapon_data,
+    )):
+        trigrams = set()
+        for field in fields:
+            trigrams.update(to_trigrams(to_name_filter_string(field)))
+        for trigram in trigrams:
+            postings[trigram].append(doc) # Documents are visited in order, so this stays sorted
+        num_docs += 1
+
+    trigrams = sorted(postings.keys())
+    postings_entries = []
+    for trigram in trigrams:
+        docs = postings[trigram]
+        deltas = [docs[0]] + [b - a for (a, b) in zip(docs, docs[1:])]
+        postings_entries.append(postings_fmt.format(postings=_compact(deltas)))
+
+    return source_template.format(
+        num_docs=num_docs,
+        trigrams=_compact(trigrams),
+        postings="\n".join(postings_entries),
+    )
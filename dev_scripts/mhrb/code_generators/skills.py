@@ -8,7 +8,7 @@ Parses skills from './hardcoded_data/' to generate the corresponding source file
 import os
 import json
 
-from utils import skill_id_to_object_name, to_name_filter_string
+from .utils import skill_id_to_object_name, to_name_filter_string
 
 icon_name_to_image_id = {
     "blue"     : "skill_icon_blue",
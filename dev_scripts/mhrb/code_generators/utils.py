@@ -13,8 +13,16 @@ def skill_id_to_object_name(skill_id):
 def ramp_id_to_object_name(ramp_id):
     return f"__generated_ramp__{ramp_id}"
 
+# Javascript's /\s/, which doesn't match quite the same characters as Python's.
+_js_whitespace_re = re.compile("[\t\n\v\f\r \u00a0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff]")
+
 def to_name_filter_string(s):
     # IMPORTANT: Please maintain parity between this Python implementation and the Javascript implementation.
     # TODO: Also strip out punctuation?
-    return re.sub("\\s", "", s.lower())
+    return _js_whitespace_re.sub("", s.lower())
+
+def to_trigrams(s):
+    # IMPORTANT: Please maintain parity between this Python implementation and the Javascript implementation.
+    # Works on code points, so in Javascript, the string has to be split with Array.from().
+    return set(s[i:i+3] for i in range(len(s) - 2))
 
@@ -0,0 +1,60 @@
+"""
+Filename: weapon_chunks.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Generates the source file that lets each weapon category be loaded on demand.
+
+Every category's '_generated_weapon_*.ts' gets a dynamic import() entry point, which webpack splits into its own
+chunk, along with a manifest of what's in each chunk. These are used by
+'src/mhrb/_app/database/generated_code/weapons.ts'.
+"""
+
+source_template = """\
+import {{
+    type Weapon,
+    type WeaponCategory,
+}} from "../../common/types";
+
+export interface WeaponChunkInfo {{
+    readonly module:     string;
+    readonly numTrees:   number;
+    readonly numWeapons: number;
+}}
+
+export const weaponChunkManifest: {{readonly [K in WeaponCategory]: WeaponChunkInfo}} = {{
+{manifest_entries}
+}};
+
+export const weaponChunkLoaders: {{readonly [K in WeaponCategory]: () => Promise<Readonly<Weapon[]>>}} = {{
+{loader_entries}
+}};
+"""
+
+manifest_entry_fmt = """\
+    {category}: {{module: "{module}", numTrees: {num_trees}, numWeapons: {num_weapons}}},\
+"""
+
+loader_entry_fmt = """\
+    {category}: () => import(/* webpackChunkName: "mhrb/weapons_{category}" */ "./{module}").then((m) => m.{category}sArray),\
+"""
+
+def weapon_module_name(category):
+    return f"_generated_weapon_{category}"
+
+def generate_weapon_chunks_source_file(weapon_data):
+    manifest_entries = []
+    loader_entries = []
+    for (category, category_data) in weapon_data.items():
+        module = weapon_module_name(category)
+        manifest_entries.append(manifest_entry_fmt.format(
+            category=category,
+            module=module,
+            num_trees=len(category_data),
+            num_weapons=sum(len(x) for x in category_data.values()),
+        ))
+        loader_entries.append(loader_entry_fmt.format(category=category, module=module))
+    return source_template.format(
+        manifest_entries="\n".join(manifest_entries),
+        loader_entries="\n".join(loader_entries),
+    )
@@ -8,16 +8,16 @@ Processes weapon data to generate the corresponding source file.
 import os
 import json
 
-from weapons_details.sharpness    import generate_sharpness_source_lines
-from weapons_details.gunlance     import generate_gunlance_source_lines
-from weapons_details.huntinghorn  import generate_huntinghorn_source_lines
-from weapons_details.switchaxe    import generate_switchaxe_source_lines
-from weapons_details.chargeblade  import generate_chargeblade_source_lines
-from weapons_details.insectglaive import generate_insectglaive_source_lines
-from weapons_details.bowguns      import generate_bowgun_source_lines
-from weapons_details.bow          import generate_bow_source_lines
+from .weapons_details.sharpness    import generate_sharpness_source_lines
+from .weapons_details.gunlance     import generate_gunlance_source_lines
+from .weapons_details.huntinghorn  import generate_huntinghorn_source_lines
+from .weapons_details.switchaxe    import generate_switchaxe_source_lines
+from .weapons_details.chargeblade  import generate_chargeblade_source_lines
+from .weapons_details.insectglaive import generate_insectglaive_source_lines
+from .weapons_details.bowguns      import generate_bowgun_source_lines
+from .weapons_details.bow          import generate_bow_source_lines
 
-from utils import ramp_id_to_object_name, to_name_filter_string
+from .utils import ramp_id_to_object_name, to_name_filter_string
 
 source_template = """\
 import {{
@@ -85,7 +85,7 @@ ramp_skill_entry_fmt = """\
             [{ramp_ref}, {inherited_from_weapon}],\
 """
 
-_to_type_ref = {
+to_type_ref = {
     "greatsword":     "Greatsword",
     "longsword":      "Longsword",
     "swordandshield": "SwordAndShield",
@@ -102,7 +102,7 @@ _to_type_ref = {
     "bow":            "Bow",
 }
 
-_melee_weapons = {
+melee_weapons = {
     "greatsword",
     "longsword",
     "swordandshield",
@@ -148,7 +148,7 @@ def _get_ramp_skills_str(category, ramps_json_data, seen_ramp_objs):
 
 def _get_special_mechanics_str(category, obj):
     entries = []
-    if category in _melee_weapons:
+    if category in melee_weapons:
         entries.append(generate_sharpness_source_lines(obj))
 
     if category == "gunlance":
@@ -169,7 +169,7 @@ def _get_special_mechanics_str(category, obj):
     return "".join(f"\n\n{x}" for x in entries)
 
 def _generate_category_source_file(category, category_data):
-    category_type_ref = _to_type_ref[category]
+    category_type_ref = to_type_ref[category]
 
     objects_entries = []
     array_entries = []
@@ -0,0 +1,200 @@
+"""
+Filename: weapons_json.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Generates each weapon category's source file as a compact JSON payload. This is the default weapon format, and
+weapons.py is still available with `--weapon-format ts`.
+
+weapons.py writes every weapon out as a Typescript object literal, which the browser has to parse and evaluate as
+code at startup. Here, the same data goes into a single string that's passed to JSON.parse(), which is much faster
+for the browser to get through, and compresses better. The generated file exports the same array as weapons.py's,
+so nothing else needs to change. The payload is rehydrated (FrozenMaps, rampage skill and weapon references, filter
+helpers) by 'src/mhrb/_app/database/generated_code/weapon_payloads.ts'.
+
+Payload format:
+
+    {
+        "category": "<category>",
+        "trees": [
+            ["<tree name>", [
+                {
+                    "id": ..., "name": ..., "rarity": ..., "endlineTag": ...,
+                    "attack": ..., "affinity": ..., "defense": ..., "decoSlots": [...],
+                    "eleStat": [["<ele/stat>", <value>], ...],
+                    "rampSkills": [[["<ramp skill id>", "<inherited from weapon id>" or null], ...], ...],
+                    <special mechanics, with the same names and structure as the Typescript Weapon types, except
+                     that bowgun ammo is {"<ammo type>": [available, ammo capacity], ...}>
+                },
+                ...
+            ]],
+            ...
+        ]
+    }
+"""
+
+import json
+from itertools import chain, product
+
+from .weapons import to_type_ref, melee_weapons
+
+source_template = """\
+import {{
+    type {category_type_ref},
+}} from "../../common/types";
+
+import {{
+    loadWeaponPayload,
+}} from "./weapon_payloads";
+
+const payload = '{payload}';
+
+export const {category}sArray: Readonly<{category_type_ref}[]> = loadWeaponPayload<{category_type_ref}>(payload);
+"""
+
+#
+# SPECIAL MECHANICS
+#
+# These mirror the generators in './weapons_details/'.
+#
+
+def _sharpness(obj):
+    assert len(obj["baseSharpness"]) == 6
+    assert len(obj["maxSharpness"]) == 6
+    return {
+        "baseSharpness": obj["baseSharpness"] + [0], # TODO: UNDO HACK
+        "maxSharpness": obj["maxSharpness"] + [0],   # TODO: UNDO HACK
+    }
+
+def _huntinghorn_songs(so):
+    return {"x": so["x_x"], "a": so["a_a"], "xa": so["xa_xa"]}
+
+def _bowgun_ammo(a):
+    assert len(a) == 26
+    def numbered(keys, expected_length):
+        for k in keys:
+            assert len(a[k]) == expected_length
+            for (i, [available, capacity]) in enumerate(a[k]):
+                yield (f"{k}_{i+1}", [available, capacity])
+        return
+    def unique(suffixes, make_piercing):
+        prefixes = [""] if (not make_piercing) else ["", "piercing_"]
+        for (prefix, suffix) in product(prefixes, suffixes):
+            [(available, capacity),] = a[prefix + suffix]
+            yield (prefix + suffix, [available, capacity])
+        return
+    return dict(chain(
+        numbered(["normal", "pierce", "spread", "shrapnel", "sticky", "cluster"], 3),
+        unique(["fire", "water", "thunder", "ice", "dragon"], True),
+        numbered(["poison", "paralysis", "sleep", "exhaust", "recover"], 2),
+        unique(["demon", "armor", "slicing", "wyvern", "tranq"], False),
+    ))
+
+def _bowgun_stats(so):
+    return {
+        "deviation": {
+            "severity": so["deviation"]["severity"],
+            "left": so["deviation"]["left"],
+            "right": so["deviation"]["right"],
+        },
+        "recoil": so["recoil"],
+        "reload": so["reload"],
+        "ammo": _bowgun_ammo(so["ammo"]),
+    }
+
+def _bow_stats(so):
+    assert len(so["compatibleCoatings"]) == 7
+    assert len(so["chargeShot"]) in {so["baseChargeLevelLimit"], so["baseChargeLevelLimit"] + 1}
+    return {
+        "arcShot": so["arcShot"],
+        "baseChargeLevelLimit": so["baseChargeLevelLimit"],
+        "chargeShot": so["chargeShot"],
+        "compatibleCoatings": so["compatibleCoatings"],
+    }
+
+def _special_mechanics(category, obj):
+    ret = {}
+    if category in melee_weapons:
+        ret.update(_sharpness(obj))
+
+    if category == "gunlance":
+        ret["gunlanceStats"] = {
+            "shellingType": obj["gunlanceStats"]["shellingType"],
+            "shellingLevel": obj["gunlanceStats"]["shellingLevel"],
+        }
+    elif category == "huntinghorn":
+        ret["huntinghornSongs"] = _huntinghorn_songs(obj["huntinghornSongs"])
+    elif category == "switchaxe":
+        ret["switchaxeStats"] = {
+            "phialType": obj["switchaxeStats"]["phialType"],
+            "phialValue": obj["switchaxeStats"]["phialValue"],
+        }
+    elif category == "chargeblade":
+        ret["chargebladeStats"] = {"phialType": obj["chargebladeStats"]["phialType"]}
+    elif category == "insectglaive":
+        ret["insectglaiveStats"] = {"kinsectLevel": obj["insectglaiveStats"]["kinsectLevel"]}
+    elif (category == "lightbowgun") or (category == "heavybowgun"):
+        ret["bowgunStats"] = _bowgun_stats(obj["bowgunStats"])
+    elif category == "bow":
+        ret["bowStats"] = _bow_stats(obj["bowStats"])
+
+    return ret
+
+#
+# PAYLOAD
+#
+
+def _weapon_entry(category, weapon_id, obj):
+    assert isinstance(weapon_id, str)
+    assert isinstance(obj["rarity"], int)
+    assert obj["endlineTag"] in {"", "hr"}
+    assert isinstance(obj["name"], str)
+    assert isinstance(obj["attack"], int)
+    assert isinstance(obj["affinity"], int)
+    assert isinstance(obj["defense"], int)
+    assert isinstance(obj["decoSlots"], list) and all(isinstance(x, int) for x in obj["decoSlots"])
+    assert isinstance(obj["eleStat"], dict) and all(isinstance(x, int) for x in obj["eleStat"].values())
+    assert isinstance(obj["rampSkills"], list)
+
+    ret = {
+        "id": weapon_id,
+        "name": obj["name"],
+        "rarity": obj["rarity"],
+        "endlineTag": obj["endlineTag"],
+
+        "attack": obj["attack"],
+        "affinity": obj["affinity"],
+        "defense": obj["defense"],
+        "decoSlots": obj["decoSlots"],
+        "eleStat": [[k, v] for (k, v) in obj["eleStat"].items()],
+
+        "rampSkills": [
+            [[ramp_id, (inherited_from or None)] for [ramp_id, inherited_from] in slot]
+            for slot in obj["rampSkills"]
+        ],
+    }
+    ret.update(_special_mechanics(category, obj))
+    return ret
+
+def weapon_payload(category, category_data):
+    trees = []
+    for (tree_name, tree_data) in category_data.items():
+        assert isinstance(tree_name, str)
+        trees.append([tree_name, [_weapon_entry(category, k, v) for (k, v) in tree_data.items()]])
+    return {"category": category, "trees": trees}
+
+def _to_string_literal_contents(s):
+    # json.dumps() already escapes everything outside of printable ASCII (including line terminators), so only the
+    # quote and backslashes are left.
+    return s.replace("\\", "\\\\").replace("'", "\\'")
+
+def generate_weapon_payload_source_files(weapon_data):
+    ret = {}
+    for (category, category_data) in weapon_data.items():
+        payload_str = json.dumps(weapon_payload(category, category_data), separators=(",", ":"), ensure_ascii=True)
+        ret[category] = source_template.format(
+            category=category,
+            category_type_ref=to_type_ref[category],
+            payload=_to_string_literal_contents(payload_str),
+        )
+    return ret
@@ -0,0 +1,111 @@
+"""
+Filename: output_files.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Writes generated files, but only touches the ones whose contents actually changed.
+
+Rewriting a file with identical contents still bumps its mtime, which is enough for webpack to rebuild (and
+re-typecheck) everything that imports it. Instead, each new file's hash is compared with what's already on disk,
+and only changed files are replaced (via a temporary file and an atomic rename, so nothing ever sees a half-written
+file).
+
+A manifest of every file's SHA-256 is kept alongside the files:
+
+    _manifest.json    {"<file name>": "<sha256>", ...}
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+MANIFEST_FILENAME = "_manifest.json"
+
+def sha256_hex(data):
+    return hashlib.sha256(data).hexdigest()
+
+def file_sha256(path):
+    """
+    Returns None if the file doesn't exist.
+    """
+    try:
+        with open(path, "rb") as f:
+            return sha256_hex(f.read())
+    except FileNotFoundError:
+        return None
+
+def atomic_write(path, data):
+    dir_path = os.path.dirname(os.path.abspath(path))
+    os.makedirs(dir_path, exist_ok=True)
+    (fd, tmp_path) = tempfile.mkstemp(dir=dir_path, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.chmod(tmp_path, 0o644) # mkstemp() only gives the owner access
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return
+
+def write_if_changed(path, data):
+    """
+    data can be str (written as UTF-8) or bytes.
+
+    Returns (whether the file was written, SHA-256 of the contents).
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    sha256 = sha256_hex(data)
+    if file_sha256(path) == sha256:
+        return (False, sha256)
+    atomic_write(path, data)
+    return (True, sha256)
+
+class OutputDir:
+    """
+    A directory of generated files, with a manifest.
+
+    Files that aren't written during a run keep their existing manifest entries, so a run that only regenerates
+    some of the files still leaves a complete manifest.
+    """
+    def __init__(self, dir_path):
+        self.dir_path = dir_path
+        self.written = []
+        self.unchanged = []
+        self.manifest = self._read_manifest()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def _manifest_path(self):
+        return os.path.join(self.dir_path, MANIFEST_FILENAME)
+
+    def _read_manifest(self):
+        try:
+            with open(self._manifest_path(), encoding="utf-8", mode="r") as f:
+                return json.loads(f.read())
+        except (FileNotFoundError, ValueError):
+            return {} # A broken manifest just gets rebuilt
+
+    def write(self, filename, data):
+        """
+        Returns whether the file was written.
+        """
+        (written, sha256) = write_if_changed(os.path.join(self.dir_path, filename), data)
+        (self.written if written else self.unchanged).append(filename)
+        self.manifest[filename] = sha256
+        return written
+
+    def close(self):
+        manifest_str = json.dumps(self.manifest, sort_keys=True, indent=4) + "\n"
+        write_if_changed(self._manifest_path(), manifest_str)
+        return
+
+    def summary_str(self):
+        return f"{len(self.written)} files written, {len(self.unchanged)} unchanged"
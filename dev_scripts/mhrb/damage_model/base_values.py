@@ -0,0 +1,219 @@
+"""
+Filename: base_values.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+The weapon's base values after rampage skills, ported from model/calculate/step1_get_base_values.ts.
+
+Only rampage skills that affect effective raw, element or status are ported. The rest (gunlance shelling, hunting horn
+songs, phials, kinsects, bow charge shots, bowgun ammo and handling, etc.) don't change anything here, so they're
+skipped just like rampage skills the calculator hasn't implemented. Weapon special selections (bowgun mods) aren't
+supported.
+
+Rampage skills are applied one weapon at a time (in plain Python), but only once for each distinct weapon and
+rampage skill choice in a batch. Rampage skills that depend on calculator state (e.g. Anti-Aerial Species) are
+recorded as flags, so that the state can be applied per row by the batch evaluator.
+"""
+
+import numpy as np
+
+from .weapon_table import ELE_STAT_TYPES, NUM_ELEMENTS
+
+_ELEMENTS = ELE_STAT_TYPES[:NUM_ELEMENTS]
+
+# Flags for rampage skills that depend on calculator state
+RAMP_FLAGS = [
+    "anti_aerial_species",
+    "anti_aquatic_species",
+    "wyvern_exploit",
+    "kushala_daora_soul",
+    "narwa_soul",
+    "valstrax_soul",
+]
+
+class BaseValues:
+    __slots__ = [
+        "base_raw",
+        "base_raw_add",
+        "base_affinity",
+        "ele_stat",
+        "min_sharpness",
+        "max_sharpness",
+        "flags",
+
+        "is_melee",
+        "weapon_name",
+        "deferred_ops_1",
+        "deferred_ops_2",
+    ]
+
+    def __init__(self, table, row):
+        self.base_raw = table.attack[row]
+        self.base_raw_add = 0
+        self.base_affinity = table.affinity[row]
+        self.ele_stat = {k: table.ele_stat[row, i] for (i, k) in enumerate(ELE_STAT_TYPES)
+                         if not np.isnan(table.ele_stat[row, i])} # {element/status: value}
+        self.min_sharpness = list(table.base_sharpness[row])
+        self.max_sharpness = list(table.max_sharpness[row])
+        self.flags = set() # Rampage skills in RAMP_FLAGS
+
+        self.is_melee = bool(table.is_melee[row])
+        self.weapon_name = table.names[row]
+        self.deferred_ops_1 = []
+        self.deferred_ops_2 = []
+
+#
+# RAMPAGE SKILL OPERATIONS
+#
+
+def _raw_add(v, value):
+    v.base_raw_add += value
+    return
+
+def _affinity_add(v, value):
+    v.base_affinity += value
+    return
+
+def _surge(v, raw, affinity):
+    v.base_raw_add += raw
+    v.base_affinity += affinity
+    return
+
+def _boost_ele_stat(v, ele_stat, value):
+    if ele_stat not in v.ele_stat:
+        raise ValueError(f"Weapon {v.weapon_name} has no {ele_stat} to boost.")
+    v.ele_stat[ele_stat] += value
+    return
+
+def _set_ele_stat(v, ele_stat, value, raw):
+    v.ele_stat[ele_stat] = value
+    v.base_raw_add += raw
+    return
+
+def _elemental_boost(v, value):
+    def op():
+        for k in list(v.ele_stat):
+            if k in _ELEMENTS:
+                v.ele_stat[k] += value
+        return
+    v.deferred_ops_2.append(op)
+    return
+
+def _secondary_ele(v, ele, value, add_to_primary):
+    def op():
+        # The rampage skill is ignored if the weapon already has the element
+        if ele in v.ele_stat:
+            return
+        for k in list(v.ele_stat):
+            v.ele_stat[k] += add_to_primary
+        v.ele_stat[ele] = value
+        return
+    v.deferred_ops_1.append(op)
+    return
+
+def _elemental_surge(v):
+    def op():
+        # Statuses are dropped
+        v.ele_stat = {k: x + 10 for (k, x) in v.ele_stat.items() if k in _ELEMENTS}
+        v.base_raw_add += -15
+        return
+    v.deferred_ops_2.append(op)
+    return
+
+def _non_elemental_boost(v):
+    def op():
+        if len(v.ele_stat) == 0:
+            v.base_raw_add += 10
+        return
+    v.deferred_ops_2.append(op)
+    return
+
+def _sharpness_type(v, min_sharpness, max_sharpness, raw):
+    if not v.is_melee:
+        raise ValueError(f"Weapon {v.weapon_name} has no sharpness.")
+    v.min_sharpness = list(min_sharpness)
+    v.max_sharpness = list(max_sharpness)
+    v.base_raw_add += raw
+    return
+
+def _get_ramp_skill_ops():
+    """
+    Returns {rampage skill ID: (function, args...)}.
+    """
+    ret = {
+        "attack_boost_1": (_raw_add, 4),
+        "attack_boost_2": (_raw_add, 6),
+        "attack_boost_3": (_raw_add, 8),
+        "attack_boost_4": (_raw_add, 10),
+
+        "affinity_boost_1": (_affinity_add, 4),
+        "affinity_boost_2": (_affinity_add, 6),
+        "affinity_boost_3": (_affinity_add, 8),
+        "affinity_boost_4": (_affinity_add, 10),
+
+        "elemental_boost_1": (_elemental_boost, 5),
+        "elemental_boost_2": (_elemental_boost, 7),
+        "elemental_boost_3": (_elemental_boost, 10),
+
+        "attack_surge":    (_surge, 20, -30),
+        "elemental_surge": (_elemental_surge,),
+        "affinity_surge":  (_surge, -10, 20),
+
+        "sharpness_type_1": (_sharpness_type, [100,150,50,20,30,0,0], [100,150,50,20,30,50,0], 0),
+        "sharpness_type_2": (_sharpness_type, [20,80,150,100,0,0,0], [20,80,150,100,40,10,0], 0),
+        "sharpness_type_3": (_sharpness_type, [70,70,30,30,100,0,0], [70,70,30,30,150,0,0], -10),
+        "sharpness_type_4": (_sharpness_type, [50,80,70,160,10,30,0], [50,80,70,160,10,30,0], -20), # Full bar
+
+        "non_elemental_boost": (_non_elemental_boost,),
+
+        "kinsect_level_boost_3": (_raw_add, -10),
+        "kinsect_level_boost_4": (_raw_add, -20),
+
+        "close_range_coating_boost": (_raw_add, -5),
+        "use_poison_coating_2":      (_raw_add, -5),
+        "use_para_coating_2":        (_raw_add, -10),
+        "use_sleep_coating_2":       (_raw_add, -10),
+        "use_exhaust_coating":       (_raw_add, 10), # Not a typo
+    }
+    for ele in _ELEMENTS:
+        for (level, value) in [(1, 4), (2, 6), (3, 8), (4, 10)]:
+            ret[f"{ele}_boost_{level}"] = (_boost_ele_stat, ele, value)
+        for (level, value, raw) in [(1, 10, 0), (2, 15, 0), (3, 20, -5), (4, 30, -10)]:
+            ret[f"{ele}_{level}"] = (_set_ele_stat, ele, value, raw)
+        for (level, value, add_to_primary) in [(1, 10, 0), (2, 20, 5), (3, 30, 10)]:
+            ret[f"secondary_{ele}_{level}"] = (_secondary_ele, ele, value, add_to_primary)
+    for (stat, boosts, sets) in [
+                ("poison"   , [3, 5, 7], [(10, 0), (20, -10), (30, -20)]),
+                ("paralysis", [2, 4, 6], [(10, 0), (15, -10), (20, -20)]),
+                ("sleep"    , [2, 4, 6], [(10, 0), (12, -10), (15, -20)]),
+                ("blast"    , [3, 5, 7], [(10, 0), (15, -10), (20, -20)]),
+            ]:
+        for (i, value) in enumerate(boosts):
+            ret[f"{stat}_boost_{i + 1}"] = (_boost_ele_stat, stat, value)
+        for (i, (value, raw)) in enumerate(sets):
+            ret[f"{stat}_{i + 1}"] = (_set_ele_stat, stat, value, raw)
+    return ret
+
+_RAMP_SKILL_OPS = _get_ramp_skill_ops()
+
+def get_base_values(table, row, ramp_skill_ids):
+    """
+    Applies the rampage skills (IDs, in any order) to the weapon in the table row. Unknown rampage skill IDs are
+    ignored.
+
+    Raises ValueError if a rampage skill boosts an element or status that the weapon doesn't have, or changes the
+    sharpness of a ranged weapon.
+    """
+    v = BaseValues(table, row)
+    for ramp_skill_id in ramp_skill_ids:
+        if ramp_skill_id in RAMP_FLAGS:
+            v.flags.add(ramp_skill_id)
+            continue
+        op = _RAMP_SKILL_OPS.get(ramp_skill_id)
+        if op is not None:
+            op[0](v, *op[1:])
+    for op in v.deferred_ops_1:
+        op()
+    for op in v.deferred_ops_2:
+        op()
+    return v
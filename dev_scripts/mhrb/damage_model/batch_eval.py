@@ -0,0 +1,319 @@
+"""
+Filename: batch_eval.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Calculates effective raw, element and status for a batch of rows at once, ported from model/calculate/index.ts.
+
+Each row is a weapon (a row of the WeaponTable), a choice of rampage skills, skill levels, calculator states, petalace
+attack up and the number of Ibushi armour pieces. Everything but the weapon and rampage skills can be a NumPy column
+(one value per row) or a scalar (the same for every row).
+
+Rampage skills are applied once for each distinct weapon and rampage skill choice in the batch, and kept for later
+batches. Everything after that (skills, buffs, sharpness, handicraft and crits) is done with whole columns at a time.
+
+Only the stages of the calculator that lead to effective raw, element and status are ported (i.e. not defense,
+sharpness use, bowgun ammo, etc.).
+"""
+
+import numpy as np
+
+from .weapon_table import ELE_STAT_TYPES, NUM_ELEMENTS, NUM_SHARPNESS_LEVELS
+from .base_values import RAMP_FLAGS, get_base_values
+from .skill_contributions import SkillContributionsCalculator, get_state_columns, get_misc_buff_contributions
+
+RAW_SHARPNESS_MODIFIERS = np.array([
+    0.50, # 1: Red
+    0.75, # 2: Orange
+    1.00, # 3: Yellow
+    1.05, # 4: Green
+    1.20, # 5: Blue
+    1.32, # 6: White
+    1.39, # 7: Purple
+])
+
+ELEMENTAL_SHARPNESS_MODIFIERS = np.array([
+    0.25,   # 1: Red
+    0.50,   # 2: Orange
+    0.75,   # 3: Yellow
+    1.00,   # 4: Green
+    1.0625, # 5: Blue
+    1.15,   # 6: White
+    1.25,   # 7: Purple
+])
+
+NARWA_SOUL_AFFINITY_BY_IBUSHI_PIECES = np.array([0, 4, 6, 10, 12, 40])
+
+# (rampage skill flag, rampage skill state, multiplier)
+_RAW_POST_TRUNC_MUL_RAMP_SKILLS = [
+    ("anti_aerial_species",  "Anti-Aerial Species (AA)",   1.05),
+    ("anti_aquatic_species", "Anti-Aquatic Species (AAQ)", 1.10),
+    ("wyvern_exploit",       "Wyvern Exploit (WYX)",       1.05),
+]
+KUSHALA_DAORA_SOUL_AFFINITY_BY_STATE = np.array([0, 25, 30])
+VALSTRAX_SOUL_DRAGON_MUL = 1.2
+
+class BatchResults:
+    __slots__ = [
+        "effective_raw",
+        "effective_ele_stat",   # Shape (n, len(ELE_STAT_TYPES)). NaN where the weapon doesn't have it.
+        "effective_element",    # Sum over the weapon's elements (zero if none)
+        "effective_status",     # Sum over the weapon's statuses (zero if none)
+
+        "attack",               # Post-base raw
+        "affinity",
+        "raw_crit_modifier",
+        "elemental_crit_modifier",
+        "raw_sharpness_modifier",       # NaN for ranged weapons
+        "elemental_sharpness_modifier", # NaN for ranged weapons
+        "real_sharpness",               # Shape (n, NUM_SHARPNESS_LEVELS). Zeros for ranged weapons.
+    ]
+
+#
+# SHARPNESS
+#
+
+def _apply_handicraft(max_sharpness, handicraft_level):
+    """
+    Removes (50 - 10 * handicraft level) hits from the top of each bar.
+    """
+    hits_to_subtract = 50 - (handicraft_level * 10)
+    # Hits in every colour above each colour
+    hits_above = np.cumsum(max_sharpness[:, ::-1], axis=1)[:, ::-1] - max_sharpness
+    removed = np.clip(hits_to_subtract[:, np.newaxis] - hits_above, 0, max_sharpness)
+    return max_sharpness - removed
+
+def _apply_sharpness_level_reduction(real_sharpness, sharpness_level_reduction):
+    """
+    Removes the highest colours of each bar, one for each level of reduction. Red is never removed.
+    """
+    present = real_sharpness > 0
+    present[:, 0] = False
+    # Colours present at or above each colour
+    rank_from_top = np.cumsum(present[:, ::-1], axis=1)[:, ::-1]
+    removed = present & (rank_from_top <= sharpness_level_reduction[:, np.newaxis])
+    return np.where(removed, 0, real_sharpness)
+
+def _highest_sharpness_index(real_sharpness):
+    """
+    Returns -1 for empty bars.
+    """
+    present = real_sharpness > 0
+    return np.where(present.any(axis=1), NUM_SHARPNESS_LEVELS - 1 - np.argmax(present[:, ::-1], axis=1), -1)
+
+def _bludgeoner_mul(bludgeoner_level, highest_sharpness_index):
+    return np.select(
+        [
+            (bludgeoner_level == 1) & (highest_sharpness_index <= 2), # Yellow or lower
+            (bludgeoner_level == 2) & (highest_sharpness_index <= 2), # Yellow or lower
+            (bludgeoner_level == 3) & (highest_sharpness_index <= 3), # Green or lower
+        ],
+        [1.05, 1.1, 1.1],
+        default=1,
+    )
+
+#
+# CRITS
+#
+
+def _crit_modifier(crit_chance, crit_damage, blunder_damage):
+    # Negative affinity causes chance for "blunder"
+    blunder_chance = -np.maximum(crit_chance, -1)
+    return np.where(
+        crit_chance < 0,
+        (blunder_damage * blunder_chance) + (1 - blunder_chance),
+        (crit_damage * crit_chance) + (1 - crit_chance),
+    )
+
+#
+# EVALUATOR
+#
+
+class BatchEvaluator:
+    def __init__(self, table, skill_max_levels):
+        self.table = table
+        self.skill_calculator = SkillContributionsCalculator(skill_max_levels)
+        self._base_values = {} # {(row, rampage skill IDs): BaseValues}
+
+    def base_values(self, row, ramp_skill_ids):
+        key = (row, tuple(ramp_skill_ids))
+        if key not in self._base_values:
+            self._base_values[key] = get_base_values(self.table, row, ramp_skill_ids)
+        return self._base_values[key]
+
+    def evaluate(self, rows, ramp_choice=0, ramp_choices=((),), skills=None, states=None, petalace_attack_up=0,
+                 ibushi_pieces=0):
+        """
+        rows is a column of WeaponTable rows. ramp_choices is a list of rampage skill ID lists, and ramp_choice is a
+        column of indices into it (so that each row can have different rampage skills). skills is {skill ID: level
+        column}, and states is {state name: state column} (see skill_contributions.DEFAULT_STATES).
+
+        Returns BatchResults.
+
+        Raises ValueError if any of the inputs are invalid, or if a rampage skill can't be used on the weapon.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.ndim != 1:
+            raise ValueError("rows must be a 1-dimensional column.")
+        n = len(rows)
+        if np.any((rows < 0) | (rows >= len(self.table))):
+            raise ValueError("rows must be rows of the weapon table.")
+        ramp_choice = np.broadcast_to(np.asarray(ramp_choice, dtype=np.int64), (n,))
+        if np.any((ramp_choice < 0) | (ramp_choice >= len(ramp_choices))):
+            raise ValueError("ramp_choice must be indices into ramp_choices.")
+        ibushi_pieces = np.broadcast_to(np.asarray(ibushi_pieces, dtype=np.int64), (n,))
+        if np.any((ibushi_pieces < 0) | (ibushi_pieces >= len(NARWA_SOUL_AFFINITY_BY_IBUSHI_PIECES))):
+            raise ValueError("ibushi_pieces must be 0 to 5.")
+
+        states = get_state_columns(states or {}, n)
+        b = self._gather_base_values(rows, ramp_choice, ramp_choices)
+        s = self.skill_calculator.calculate(skills or {}, states, n)
+        m = get_misc_buff_contributions(states, petalace_attack_up)
+        is_melee = self.table.is_melee[rows]
+
+        # Rampage skills that depend on calculator state
+        b_raw_post_trunc_mul = np.ones(n)
+        for (flag, state_name, mul) in _RAW_POST_TRUNC_MUL_RAMP_SKILLS:
+            b_raw_post_trunc_mul = b_raw_post_trunc_mul * np.where(b["flags"][flag] & (states[state_name] == 1), mul, 1)
+        b_affinity_add = np.where(
+            b["flags"]["kushala_daora_soul"],
+            KUSHALA_DAORA_SOUL_AFFINITY_BY_STATE[states["Kushala Daora Soul (KUS)"]],
+            0,
+        )
+        b_ele_stat_mul = np.ones((n, len(ELE_STAT_TYPES)))
+        dragon = ELE_STAT_TYPES.index("dragon")
+        b_ele_stat_mul[:, dragon] = np.where(
+            b["flags"]["valstrax_soul"] & (states["Valstrax Soul (VAS)"] == 1),
+            VALSTRAX_SOUL_DRAGON_MUL,
+            1,
+        )
+
+        #
+        # Sharpness (melee only)
+        #
+
+        min_total = b["min_sharpness"].sum(axis=1)
+        max_total = b["max_sharpness"].sum(axis=1)
+        bar_is_full = (min_total == max_total)
+        bad_bars = is_melee & (~bar_is_full) & (min_total + 50 != max_total)
+        if np.any(bad_bars):
+            bad_name = self.table.names[rows[np.argmax(bad_bars)]]
+            raise ValueError(f"Sharpness bar mismatch for {bad_name}.")
+        # If the bar is full, we consider handicraft to be max for this calculation.
+        effective_handicraft_level = np.where(bar_is_full, 5, s.handicraft_level)
+
+        real_sharpness = _apply_handicraft(b["max_sharpness"], effective_handicraft_level)
+        real_sharpness = _apply_sharpness_level_reduction(real_sharpness, m.sharpness_level_reduction)
+        real_sharpness[~is_melee] = 0
+        highest_sharpness_index = _highest_sharpness_index(real_sharpness)
+        assert np.all(highest_sharpness_index[is_melee] >= 0)
+
+        raw_sharpness_modifier = np.where(is_melee, RAW_SHARPNESS_MODIFIERS[highest_sharpness_index], np.nan)
+        elemental_sharpness_modifier = np.where(
+            is_melee,
+            ELEMENTAL_SHARPNESS_MODIFIERS[highest_sharpness_index],
+            np.nan,
+        )
+        bludgeoner_mul = np.where(is_melee, _bludgeoner_mul(s.bludgeoner_level, highest_sharpness_index), 1)
+
+        narwa_soul_affinity_add = np.where(
+            b["flags"]["narwa_soul"],
+            NARWA_SOUL_AFFINITY_BY_IBUSHI_PIECES[ibushi_pieces],
+            0,
+        )
+
+        #
+        # Post-base values
+        #
+
+        base_raw = np.trunc(b["base_raw"] + b["base_raw_add"] + 0.1)
+        postbase_raw = (
+            (np.trunc((base_raw * s.raw_mul * m.raw_mul * bludgeoner_mul) + 0.1) + s.raw_add + m.raw_add)
+            * b_raw_post_trunc_mul * s.raw_post_trunc_mul
+        )
+        postbase_affinity = (
+            b["base_affinity"] + b_affinity_add + s.affinity_add + m.affinity_add + narwa_soul_affinity_add
+        )
+
+        postbase_ele_stat = np.empty((n, len(ELE_STAT_TYPES)))
+        for (i, k) in enumerate(ELE_STAT_TYPES):
+            x = b["ele_stat"][:, i] * getattr(s, k + "_mul") * b_ele_stat_mul[:, i]
+            if i < NUM_ELEMENTS:
+                x = x * m.ele_mul
+            postbase_ele_stat[:, i] = np.trunc(x) + getattr(s, k + "_add")
+
+        #
+        # Crit modifiers
+        #
+
+        crit_chance = np.minimum(postbase_affinity, 100) / 100 # Clip values to 1 or less
+        raw_crit_modifier = _crit_modifier(crit_chance, s.raw_critical_damage, s.raw_blunder_damage)
+        elemental_crit_modifier = _crit_modifier(crit_chance, s.elemental_critical_damage, s.elemental_blunder_damage)
+
+        #
+        # Effective values
+        #
+
+        effective_raw = postbase_raw * raw_crit_modifier
+        effective_raw = np.where(is_melee, effective_raw * raw_sharpness_modifier, effective_raw)
+
+        effective_ele_stat = postbase_ele_stat.copy()
+        effective_element = effective_ele_stat[:, :NUM_ELEMENTS] * elemental_crit_modifier[:, np.newaxis]
+        effective_element = np.where(
+            is_melee[:, np.newaxis],
+            effective_element * elemental_sharpness_modifier[:, np.newaxis],
+            effective_element,
+        )
+        effective_ele_stat[:, :NUM_ELEMENTS] = effective_element
+
+        ret = BatchResults()
+        ret.effective_raw = effective_raw
+        ret.effective_ele_stat = effective_ele_stat
+        ret.effective_element = np.nansum(effective_ele_stat[:, :NUM_ELEMENTS], axis=1)
+        ret.effective_status = np.nansum(effective_ele_stat[:, NUM_ELEMENTS:], axis=1)
+        ret.attack = postbase_raw
+        ret.affinity = postbase_affinity
+        ret.raw_crit_modifier = raw_crit_modifier
+        ret.elemental_crit_modifier = elemental_crit_modifier
+        ret.raw_sharpness_modifier = raw_sharpness_modifier
+        ret.elemental_sharpness_modifier = elemental_sharpness_modifier
+        ret.real_sharpness = real_sharpness
+        return ret
+
+    def _gather_base_values(self, rows, ramp_choice, ramp_choices):
+        """
+        Returns the base values as {name: column}, with the flags as {flag: column}.
+        """
+        num_choices = len(ramp_choices)
+        (keys, inverse) = np.unique(rows * num_choices + ramp_choice, return_inverse=True)
+        k = len(keys)
+
+        base_raw = np.empty(k)
+        base_raw_add = np.empty(k)
+        base_affinity = np.empty(k)
+        ele_stat = np.full((k, len(ELE_STAT_TYPES)), np.nan)
+        min_sharpness = np.empty((k, NUM_SHARPNESS_LEVELS), dtype=np.int64)
+        max_sharpness = np.empty((k, NUM_SHARPNESS_LEVELS), dtype=np.int64)
+        flags = np.zeros((k, len(RAMP_FLAGS)), dtype=bool)
+        for (i, key) in enumerate(keys.tolist()):
+            (row, choice) = divmod(key, num_choices)
+            v = self.base_values(row, ramp_choices[choice])
+            base_raw[i] = v.base_raw
+            base_raw_add[i] = v.base_raw_add
+            base_affinity[i] = v.base_affinity
+            for (ele_stat_id, value) in v.ele_stat.items():
+                ele_stat[i, ELE_STAT_TYPES.index(ele_stat_id)] = value
+            min_sharpness[i] = v.min_sharpness
+            max_sharpness[i] = v.max_sharpness
+            for (j, flag) in enumerate(RAMP_FLAGS):
+                flags[i, j] = (flag in v.flags)
+
+        return {
+            "base_raw":      base_raw[inverse],
+            "base_raw_add":  base_raw_add[inverse],
+            "base_affinity": base_affinity[inverse],
+            "ele_stat":      ele_stat[inverse],
+            "min_sharpness": min_sharpness[inverse],
+            "max_sharpness": max_sharpness[inverse],
+            "flags":         {flag: flags[inverse, j] for (j, flag) in enumerate(RAMP_FLAGS)},
+        }
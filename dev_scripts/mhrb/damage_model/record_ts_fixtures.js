@@ -0,0 +1,313 @@
+/*
+ * Author:  simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ *
+ * Records the app's own calculator results (model/calculate) for a set of cases, so that the Python batch evaluator
+ * can be cross-checked against them with run_cross_check.py.
+ *
+ * The app's TypeScript is transpiled on the fly with the project's Babel presets, so this has to run from the project
+ * root with the project's dev dependencies available:
+ *
+ *     yarn node ./dev_scripts/mhrb/damage_model/record_ts_fixtures.js
+ *
+ * Cases are every weapon under a standard set of skills, every rampage skill that depends on calculator state (on every
+ * weapon that has it), and then randomly generated cases (weapon, rampage skills, skills, calculator states, petalace
+ * and Ibushi pieces). The random cases are seeded, so re-running this after a
+ * calculator change only changes the expected results.
+ */
+
+const fs = require("fs");
+const path = require("path");
+const babel = require("@babel/core");
+
+const APP_DIR = path.resolve(__dirname, "../../../src/mhrb/_app");
+const OUTPUT_PATH = path.resolve(__dirname, "fixtures/calc_fixtures.json");
+
+const NUM_RANDOM_CASES = 1000;
+const RANDOM_SEED = 2022;
+
+const STANDARD_SKILLS = [
+    ["attack_boost",     7],
+    ["critical_eye",     7],
+    ["critical_boost",   3],
+    ["weakness_exploit", 3],
+    ["handicraft",       5],
+];
+
+// Skills that the random cases are mostly made of
+const RELEVANT_SKILLS = [
+    "affinity_sliding", "Agitador", "attack_boost", "bludgeoner", "counterstrike", "critical_boost",
+    "critical_draw", "critical_element", "critical_eye", "dragonheart", "fortify", "handicraft", "heroics",
+    "kushala_blessing", "latent_power", "masters_touch", "maximum_might", "minds_eye", "offensive_guard",
+    "peak_performance", "punishing_draw", "razor_sharp", "Indignação", "Ressuscitar", "teostra_blessing",
+    "weakness_exploit",
+    "fire_attack", "water_attack", "thunder_attack", "ice_attack", "dragon_attack",
+    "poison_attack", "paralysis_attack", "sleep_attack", "blast_attack",
+];
+
+// Rampage skills that depend on calculator state: {rampage skill ID: [state name, active states]}
+const STATEFUL_RAMP_SKILLS = new Map([
+    ["anti_aerial_species",  ["Anti-Aerial Species (AA)",   [1]]],
+    ["anti_aquatic_species", ["Anti-Aquatic Species (AAQ)", [1]]],
+    ["wyvern_exploit",       ["Wyvern Exploit (WYX)",       [1]]],
+    ["kushala_daora_soul",   ["Kushala Daora Soul (KUS)",   [1, 2]]],
+    ["valstrax_soul",        ["Valstrax Soul (VAS)",        [1]]],
+]);
+const NARWA_SOUL_IBUSHI_PIECES = [1, 2, 3, 4, 5];
+
+const IBUSHI_SET_ID = 144;
+const ARMOUR_SLOTS = ["head", "chest", "arms", "waist", "legs"];
+
+/*** Loading the app's code ***/
+
+require.extensions[".ts"] = (module, filename) => {
+    const result = babel.transformSync(fs.readFileSync(filename, "utf8"), {
+        filename: filename,
+        babelrc: false,
+        configFile: false,
+        presets: [
+            ["@babel/preset-env", {targets: {node: "current"}}],
+            "@babel/preset-typescript",
+        ],
+    });
+    module._compile(result.code, filename);
+};
+// Images just become their paths
+for (const ext of [".svg", ".png", ".jpg"]) {
+    require.extensions[ext] = (module, filename) => {
+        module.exports = filename;
+    };
+}
+
+// The calculator logs a lot
+function quietly(fn) {
+    const [log, warn] = [console.log, console.warn];
+    console.log = () => {};
+    console.warn = () => {};
+    try {
+        return fn();
+    } finally {
+        [console.log, console.warn] = [log, warn];
+    }
+}
+
+const {
+    db,
+    weaponCategories,
+    preloadAllWeaponCategories,
+    getLoadedWeaponCategory,
+    weaponsWithRampSkill,
+} = quietly(() => require(path.join(APP_DIR, "database")));
+const {CalcState} = require(path.join(APP_DIR, "model/calc_state"));
+const {calculateBuildPerformance} = require(path.join(APP_DIR, "model/calculate"));
+
+// The app loads weapons one category at a time, so they're all loaded by main() before any cases are made.
+// {map: {category: weapon map}, array: every weapon}
+const weapons = {map: {}, array: []};
+
+async function loadAllWeapons() {
+    await preloadAllWeaponCategories();
+    for (const category of weaponCategories) {
+        weapons.map[category] = getLoadedWeaponCategory(category);
+        weapons.array.push(...weapons.map[category].values());
+    }
+}
+
+/*** Cases ***/
+
+// mulberry32
+function makeRandom(seed) {
+    let a = seed;
+    return () => {
+        a |= 0;
+        a = (a + 0x6D2B79F5) | 0;
+        let t = Math.imul(a ^ (a >>> 15), 1 | a);
+        t = (t + Math.imul(t ^ (t >>> 7), 61 | t)) ^ t;
+        return ((t ^ (t >>> 14)) >>> 0) / 4294967296;
+    };
+}
+
+function standardCases() {
+    const ret = [];
+    for (const [category, categoryWeapons] of Object.entries(weapons.map)) {
+        for (const weaponID of categoryWeapons.keys()) {
+            ret.push({
+                category:   category,
+                weaponID:   weaponID,
+                rampSkills: [],
+                skills:     STANDARD_SKILLS,
+                states:     {},
+                petalace:   null,
+                ibushiPieces: 0,
+            });
+        }
+    }
+    return ret;
+}
+
+// Every weapon with a rampage skill that depends on calculator state (or Ibushi pieces), in every active state
+function statefulRampSkillCases() {
+    const ret = [];
+    const makeCase = (weapon, rampSkillID, states, ibushiPieces) => ({
+        category:   weapon.category,
+        weaponID:   weapon.id,
+        rampSkills: [rampSkillID],
+        skills:     STANDARD_SKILLS,
+        states:     states,
+        petalace:   null,
+        ibushiPieces: ibushiPieces,
+    });
+    // Only weapons that can have one of the rampage skills need to be looked at, but they're still visited in the
+    // usual weapon order so that the cases come out in the same order.
+    const candidates = new Set();
+    for (const id of ["narwa_soul", ...STATEFUL_RAMP_SKILLS.keys()]) {
+        for (const weapon of weaponsWithRampSkill(db.weaponRampSkills.longIdsMap.get(id))) candidates.add(weapon);
+    }
+    for (const weapon of weapons.array) {
+        if (!candidates.has(weapon)) continue;
+        for (const slot of weapon.rampSkills) {
+            for (const [rampSkillRO, _] of slot) {
+                const id = rampSkillRO.id;
+                if (id === "narwa_soul") {
+                    for (const n of NARWA_SOUL_IBUSHI_PIECES) ret.push(makeCase(weapon, id, {}, n));
+                } else if (STATEFUL_RAMP_SKILLS.has(id)) {
+                    const [stateName, activeStates] = STATEFUL_RAMP_SKILLS.get(id);
+                    for (const x of activeStates) ret.push(makeCase(weapon, id, {[stateName]: x}, 0));
+                }
+            }
+        }
+    }
+    return ret;
+}
+
+function randomCases(n) {
+    const random = makeRandom(RANDOM_SEED);
+    const randInt = (x) => Math.floor(random() * x);
+    const choice = (arr) => arr[randInt(arr.length)];
+
+    const allSkillIDs = Array.from(db.skills.longIdsMap.keys());
+    const petalaceIDs = Array.from(db.petalaces.map.keys());
+    const stateSpec = new CalcState().getSpecification();
+
+    const ret = [];
+    for (let i = 0; i < n; ++i) {
+        const category = choice(Object.keys(weapons.map));
+        const weapon = choice(Array.from(weapons.map[category].values()));
+
+        const rampSkills = [];
+        for (const slot of weapon.rampSkills) {
+            if ((slot.length > 0) && (random() < 0.8)) rampSkills.push(choice(slot)[0].id);
+        }
+
+        const skills = new Map();
+        const numSkills = randInt(10);
+        for (let j = 0; j < numSkills; ++j) {
+            const skillID = (random() < 0.8) ? choice(RELEVANT_SKILLS) : choice(allSkillIDs);
+            const maxLevels = db.skills.longIdsMap.get(skillID).maxLevels;
+            skills.set(skillID, randInt(maxLevels + 1) + 1); // Sometimes over the max, which gets clipped
+        }
+
+        const states = {};
+        for (const groupSpec of stateSpec.values()) {
+            for (const [stateName, spec] of groupSpec.entries()) {
+                // Only some states are changed, so that most cases look like real builds
+                if (random() < 0.3) states[stateName] = randInt(spec.presentations.length);
+            }
+        }
+
+        ret.push({
+            category:   category,
+            weaponID:   weapon.id,
+            rampSkills: rampSkills,
+            skills:     Array.from(skills.entries()),
+            states:     states,
+            petalace:   (random() < 0.5) ? choice(petalaceIDs) : null,
+            ibushiPieces: randInt(6),
+        });
+    }
+    return ret;
+}
+
+/*** Running the calculator ***/
+
+function makeCalcState(states) {
+    const calcState = new CalcState();
+    // Setting states directly, since setState() also switches off states that can't be active together.
+    for (const [stateName, value] of Object.entries(states)) {
+        let found = false;
+        for (const groupMap of calcState._state.values()) {
+            if (groupMap.has(stateName)) {
+                groupMap.set(stateName, value);
+                found = true;
+            }
+        }
+        if (!found) throw new Error("Unknown state " + stateName);
+    }
+    return calcState;
+}
+
+function makeBuild(c) {
+    const weapon = weapons.map[c.category].get(c.weaponID);
+    const rampSkills = c.rampSkills.map((id) => db.weaponRampSkills.longIdsMap.get(id));
+    const skills = new Map(c.skills.map(([id, level]) => [id, [db.skills.longIdsMap.get(id), level]]));
+    const ibushiSet = db.armour.map.get(IBUSHI_SET_ID);
+    const armour = {};
+    for (const [i, slotID] of ARMOUR_SLOTS.entries()) {
+        armour[slotID] = (i < c.ibushiPieces) ? ibushiSet[slotID] : null;
+    }
+    const petalace = (c.petalace === null) ? null : db.petalaces.map.get(c.petalace);
+
+    return {
+        getWeaponObjRO:              () => weapon,
+        getRampSkills:               () => rampSkills,
+        getWeaponSpecialSelectionRO: () => null,
+        getArmourROs:                () => armour,
+        getPetalaceObjRO:            () => petalace,
+        getCurrentSkills:            () => new Map(skills),
+    };
+}
+
+function undefinedToNull(x) {
+    return (x === undefined) ? null : x;
+}
+
+function runCase(c) {
+    const petalace = (c.petalace === null) ? null : db.petalaces.map.get(c.petalace);
+    const inputs = {...c, petalaceAttackUp: (petalace === null) ? 0 : petalace.attackUp};
+    let r;
+    try {
+        r = quietly(() => calculateBuildPerformance({readonly: db}, makeBuild(c), makeCalcState(c.states)));
+    } catch (e) {
+        // These would be bugs in this script rather than the calculator rejecting the case
+        if ((e instanceof TypeError) || (e instanceof ReferenceError)) throw e;
+        return {inputs: inputs, error: String(e)};
+    }
+    return {
+        inputs: inputs,
+        expected: {
+            effectiveRaw:               r.effectiveRaw,
+            effectiveEleStat:           Object.fromEntries(r.effectiveEleStat.entries()),
+            affinity:                   r.affinity,
+            rawCritModifier:            r.rawCritModifier,
+            elementalCritModifier:      r.elementalCritModifier,
+            rawSharpnessModifier:       undefinedToNull(r.rawSharpnessModifier),
+            elementalSharpnessModifier: undefinedToNull(r.elementalSharpnessModifier),
+            realSharpnessBar:           undefinedToNull(r.realSharpnessBar),
+        },
+    };
+}
+
+async function main() {
+    await loadAllWeapons();
+    const cases = standardCases().concat(statefulRampSkillCases(), randomCases(NUM_RANDOM_CASES));
+    const results = cases.map(runCase);
+    const numErrors = results.filter((x) => x.error !== undefined).length;
+
+    // One case per line, to keep diffs readable
+    const lines = results.map((x) => JSON.stringify(x));
+    fs.mkdirSync(path.dirname(OUTPUT_PATH), {recursive: true});
+    fs.writeFileSync(OUTPUT_PATH, "[\n" + lines.join(",\n") + "\n]\n");
+    console.log(`Recorded ${results.length} cases (${numErrors} raised errors) to ${OUTPUT_PATH}`);
+}
+
+main();
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+
+"""
+Filename: run_batch_eval.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Evaluates every weapon of every category (without rampage skills) under one set of skills and calculator states, and
+reports the best weapons of each category.
+
+Example:
+    python3 -m dev_scripts.mhrb.damage_model.run_batch_eval \\
+        --skill attack_boost=7 --skill critical_eye=7 --skill critical_boost=3 --skill weakness_exploit=3 \\
+        --skill handicraft=5 --state "Song: Attack Up=1" --top 3
+"""
+
+import time
+import argparse
+
+import numpy as np
+
+from .weapon_table import WEAPON_CATEGORIES, ELE_STAT_TYPES, load_weapon_table, load_skill_max_levels
+from .batch_eval import BatchEvaluator
+
+DEFAULT_TOP = 5
+
+_SORT_KEYS = {
+    "raw":     "effective_raw",
+    "element": "effective_element",
+    "status":  "effective_status",
+}
+
+def _skill_level(s):
+    (skill_id, sep, level) = s.partition("=")
+    if (sep == "") or (not level.isdigit()):
+        raise argparse.ArgumentTypeError(f"Expected SKILL_ID=LEVEL, got: {s}")
+    return (skill_id, int(level))
+
+def _state_value(s):
+    # State names can have spaces and punctuation, but never "="
+    (state_name, sep, value) = s.rpartition("=")
+    if (sep == "") or (not value.isdigit()):
+        raise argparse.ArgumentTypeError(f"Expected STATE_NAME=VALUE, got: {s}")
+    return (state_name, int(value))
+
+def _ele_stat_str(values):
+    return ", ".join(f"{k} {v:.1f}" for (k, v) in zip(ELE_STAT_TYPES, values) if not np.isnan(v))
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate every weapon under a set of skills and calculator states.")
+    parser.add_argument("--skill", type=_skill_level, action="append", default=[],
+                        help="A skill level, as SKILL_ID=LEVEL. Can be given more than once.")
+    parser.add_argument("--state", type=_state_value, action="append", default=[],
+                        help="A calculator state, as STATE_NAME=VALUE (e.g. \"Song: Attack Up=1\"). States that "
+                             "aren't given take the app's initial state. Can be given more than once.")
+    parser.add_argument("--sort", choices=list(_SORT_KEYS), default="raw",
+                        help="What to rank weapons by. Defaults to raw.")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP,
+                        help=f"Number of weapons to report for each category. Defaults to {DEFAULT_TOP}.")
+    args = parser.parse_args()
+
+    if args.top < 1:
+        parser.error("--top must be at least 1.")
+
+    table = load_weapon_table()
+    evaluator = BatchEvaluator(table, load_skill_max_levels())
+    rows = np.arange(len(table))
+
+    start_time = time.perf_counter()
+    try:
+        results = evaluator.evaluate(rows, skills=dict(args.skill), states=dict(args.state))
+    except ValueError as e:
+        parser.error(str(e))
+    seconds = time.perf_counter() - start_time
+
+    sort_values = getattr(results, _SORT_KEYS[args.sort])
+    for category in WEAPON_CATEGORIES:
+        category_rows = table.rows_of_category(category)
+        top = category_rows[np.argsort(-sort_values[category_rows], kind="stable")][:args.top]
+        print(f"=== {category} ===")
+        print()
+        for row in top:
+            print(f"{table.names[row]}: EFR {results.effective_raw[row]:.2f} "
+                  f"(attack {results.attack[row]:.1f}, affinity {results.affinity[row]:.0f}%)")
+            ele_stat_str = _ele_stat_str(results.effective_ele_stat[row])
+            if ele_stat_str != "":
+                print(f"    {ele_stat_str}")
+        print()
+    print(f"Evaluated {len(rows)} weapons in {seconds * 1000:.1f} ms.")
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+"""
+Filename: run_cross_check.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Cross-checks the batch evaluator against the app's own calculator, using the results that record_ts_fixtures.js
+recorded in fixtures/calc_fixtures.json.
+
+Every case that the app's calculator accepted is evaluated in a single batch, and every result is compared. Cases that
+the app's calculator rejected must raise ValueError here too.
+
+Exits with status 1 if anything doesn't match.
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+
+import numpy as np
+
+from .weapon_table import ELE_STAT_TYPES, load_weapon_table, load_skill_max_levels
+from .skill_contributions import DEFAULT_STATES
+from .batch_eval import BatchEvaluator
+
+FIXTURES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures/calc_fixtures.json")
+
+RELATIVE_TOLERANCE = 1e-9
+MAX_REPORTED_MISMATCHES = 20
+
+def _batch_inputs(table, cases):
+    """
+    Returns keyword arguments for BatchEvaluator.evaluate() that evaluate every case in one batch.
+    """
+    ramp_choices = list(dict.fromkeys(tuple(c["rampSkills"]) for c in cases))
+    ramp_choice_indices = {x: i for (i, x) in enumerate(ramp_choices)}
+
+    skills = {}
+    for (i, c) in enumerate(cases):
+        for (skill_id, level) in c["skills"]:
+            if skill_id not in skills:
+                skills[skill_id] = np.zeros(len(cases), dtype=np.int64)
+            skills[skill_id][i] = level
+
+    # Cases that don't set a state use its initial state
+    states = {
+        state_name: np.array([c["states"].get(state_name, default) for c in cases], dtype=np.int64)
+        for (state_name, default) in DEFAULT_STATES.items()
+    }
+
+    return {
+        "rows":               np.array([table.row_of(c["category"], c["weaponID"]) for c in cases]),
+        "ramp_choice":        np.array([ramp_choice_indices[tuple(c["rampSkills"])] for c in cases]),
+        "ramp_choices":       ramp_choices,
+        "skills":             skills,
+        "states":             states,
+        "petalace_attack_up": np.array([c["petalaceAttackUp"] for c in cases]),
+        "ibushi_pieces":      np.array([c["ibushiPieces"] for c in cases]),
+    }
+
+def _mismatches(results, i, expected):
+    """
+    Yields (name, actual, expected) for every value of row i that doesn't match.
+    """
+    def close(a, b):
+        if b is None:
+            return np.isnan(a)
+        return bool(np.isclose(a, b, rtol=RELATIVE_TOLERANCE, atol=0))
+
+    for (name, attr) in [
+                ("effectiveRaw",               "effective_raw"),
+                ("affinity",                   "affinity"),
+                ("rawCritModifier",            "raw_crit_modifier"),
+                ("elementalCritModifier",      "elemental_crit_modifier"),
+                ("rawSharpnessModifier",       "raw_sharpness_modifier"),
+                ("elementalSharpnessModifier", "elemental_sharpness_modifier"),
+            ]:
+        actual = getattr(results, attr)[i]
+        if not close(actual, expected[name]):
+            yield (name, actual, expected[name])
+
+    actual_ele_stat = {k: results.effective_ele_stat[i, j] for (j, k) in enumerate(ELE_STAT_TYPES)
+                       if not np.isnan(results.effective_ele_stat[i, j])}
+    if (set(actual_ele_stat) != set(expected["effectiveEleStat"])) \
+            or (not all(close(v, expected["effectiveEleStat"][k]) for (k, v) in actual_ele_stat.items())):
+        yield ("effectiveEleStat", actual_ele_stat, expected["effectiveEleStat"])
+
+    expected_sharpness = expected["realSharpnessBar"] or [0] * results.real_sharpness.shape[1]
+    if list(results.real_sharpness[i]) != expected_sharpness:
+        yield ("realSharpnessBar", list(results.real_sharpness[i]), expected["realSharpnessBar"])
+    return
+
+def main():
+    parser = argparse.ArgumentParser(description="Cross-check the batch evaluator against the app's calculator.")
+    parser.add_argument("--fixtures", default=FIXTURES_PATH,
+                        help="Fixtures recorded by record_ts_fixtures.js. Defaults to the ones in this directory.")
+    args = parser.parse_args()
+
+    with open(args.fixtures, encoding="utf-8", mode="r") as f:
+        fixtures = json.loads(f.read())
+    table = load_weapon_table()
+    evaluator = BatchEvaluator(table, load_skill_max_levels())
+
+    ok_fixtures = [x for x in fixtures if "error" not in x]
+    error_fixtures = [x for x in fixtures if "error" in x]
+
+    start_time = time.perf_counter()
+    results = evaluator.evaluate(**_batch_inputs(table, [x["inputs"] for x in ok_fixtures]))
+    seconds = time.perf_counter() - start_time
+
+    num_failures = 0
+    for (i, fixture) in enumerate(ok_fixtures):
+        mismatches = list(_mismatches(results, i, fixture["expected"]))
+        if len(mismatches) > 0:
+            num_failures += 1
+            if num_failures <= MAX_REPORTED_MISMATCHES:
+                print(f"Mismatch for {json.dumps(fixture['inputs'], ensure_ascii=False)}")
+                for (name, actual, expected) in mismatches:
+                    print(f"    {name}: got {actual}, expected {expected}")
+
+    for fixture in error_fixtures:
+        try:
+            evaluator.evaluate(**_batch_inputs(table, [fixture["inputs"]]))
+        except ValueError:
+            continue
+        num_failures += 1
+        print(f"Expected ValueError ({fixture['error']}) for {json.dumps(fixture['inputs'], ensure_ascii=False)}")
+
+    print(f"Evaluated {len(ok_fixtures)} cases in one batch in {seconds * 1000:.1f} ms.")
+    print(f"{len(fixtures) - num_failures} of {len(fixtures)} cases match the app's calculator.")
+    if num_failures > 0:
+        sys.exit(1)
+    return
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,383 @@
+"""
+Filename: skill_contributions.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Skill and buff contributions for a batch of rows, ported from model/calculate/step2_get_skill_contributions.ts and
+model/calculate/step3_get_misc_buff_contributions.ts.
+
+Each skill's effect is written as a table of contributions by level, so that a whole column of skill levels can be
+looked up at once. Only the skills that affect effective raw, element or status are ported (defense and bowgun
+handling are left out).
+
+Calculator states (skill states, rampage skill states, item box and misc. buffs) use the same names and initial states
+as model/calc_state.ts. Unlike the app, states aren't made mutually exclusive (e.g. Demondrug and Mega Demondrug can
+both be active), so it's up to the caller to pick sensible combinations.
+"""
+
+import numpy as np
+
+from .weapon_table import ELE_STAT_TYPES, NUM_ELEMENTS
+
+RAW_BLUNDER_DAMAGE_MULTIPLIER = 0.75
+ELEMENTAL_BLUNDER_DAMAGE_MULTIPLIER = 1 # Nothing happens
+
+CRITICAL_BOOST_DAMAGE_MULTIPLIERS = [1.25, 1.30, 1.35, 1.40]    # By level, starting at level 0
+CRITICAL_ELEMENT_DAMAGE_MULTIPLIERS = [1.00, 1.05, 1.10, 1.15] # By level, starting at level 0
+
+# {state name: initial state}
+DEFAULT_STATES = {
+    # Item Box
+    "Powercharm":       1,
+    "Powertalon":       1,
+    "Armorcharm":       1,
+    "Armortalon":       1,
+    "Might Seed":       1,
+    "Demon Powder":     1,
+    "Demondrug":        0,
+    "Mega Demondrug":   1,
+    "Adamant Seed":     0,
+    "Hardshell Powder": 0,
+    "Armorskin":        0,
+    "Mega Armorskin":   0,
+
+    # Misc.
+    "Petalace Attack (Max)":              0,
+    "Dango Booster":                      1,
+    "Song: Infernal Melody":              0,
+    "Song: Attack Up":                    0,
+    "Song: Afinidade Up":                 0,
+    "Song: Elem. Reforço de Ataque":      0,
+    "Palico: Rousing Roar":               0,
+    "Palico: Power Drum":                 0,
+    "LBG Switch Skill: Elemental Reload": 0,
+    "Reduce Sharpness Level":             0, # 0 to 5
+
+    # Skill States
+    "Afinidade Sliding (AFS)":   0,
+    "Agitador (AGI)":            0,
+    "Counterstrike (CS)":        0,
+    "Critical Draw (CD)":        0,
+    "Dragãoheart (DH)":          0,
+    "Fortify (FOR)":             0, # 0 to 2
+    "Heroics (HER)":             0,
+    "Latent Power (LP)":         0,
+    "Maximum Might (MM)":        0,
+    "Mind's Eye (ME)":           0,
+    "Offensive Guard (OG)":      0,
+    "Desempenho Máximo (PP)":    0,
+    "Punishing Draw (PD)":       0,
+    "Indignação (RES)":          0,
+    "Ressuscitar (RSC)":         0,
+    "Explor. de Fraqueza (WEX)": 1,
+
+    # Rampage Skill States
+    "Anti-Aerial Species (AA)":   0,
+    "Anti-Aquatic Species (AAQ)": 0,
+    "Kushala Daora Soul (KUS)":   0, # 0 to 2
+    "Valstrax Soul (VAS)":        0,
+    "Wyvern Exploit (WYX)":       0,
+}
+
+# {state name: number of possible states}, for states that aren't binary
+_NON_BINARY_STATES = {
+    "Reduce Sharpness Level":   6,
+    "Fortify (FOR)":            3,
+    "Kushala Daora Soul (KUS)": 3,
+}
+
+def get_state_columns(states, n):
+    """
+    Returns {state name: int column with n rows} for every state, taking initial states from DEFAULT_STATES for any
+    state that isn't given. states is {state name: column, or scalar}.
+
+    Raises ValueError if a state name is unknown, or a state is out of range.
+    """
+    ret = {}
+    for (state_name, default) in DEFAULT_STATES.items():
+        ret[state_name] = np.broadcast_to(np.asarray(default, dtype=np.int64), (n,))
+    for (state_name, value) in states.items():
+        if state_name not in DEFAULT_STATES:
+            raise ValueError(f"Unknown state: {state_name}")
+        column = np.broadcast_to(np.asarray(value, dtype=np.int64), (n,))
+        if np.any((column < 0) | (column >= _NON_BINARY_STATES.get(state_name, 2))):
+            raise ValueError(f"Invalid state for {state_name}")
+        ret[state_name] = column
+    return ret
+
+# Skills whose level is used directly, rather than through a table of contributions
+LEVEL_SKILLS = ["bludgeoner", "handicraft", "masters_touch", "razor_sharp"]
+
+#
+# SKILL TABLES
+#
+
+# Contributions that add up, that multiply, and that replace the default (for the crit damage multipliers, since only
+# one skill sets each of them)
+_ADD_FIELDS = ["raw_add", "affinity_add"] + [f"{k}_add" for k in ELE_STAT_TYPES]
+_MUL_FIELDS = ["raw_mul", "raw_post_trunc_mul"] + [f"{k}_mul" for k in ELE_STAT_TYPES]
+_SET_FIELDS = {
+    "raw_critical_damage":       CRITICAL_BOOST_DAMAGE_MULTIPLIERS[0],
+    "elemental_critical_damage": CRITICAL_ELEMENT_DAMAGE_MULTIPLIERS[0],
+}
+
+def _get_skill_ops():
+    """
+    Returns {skill ID: (state name that must be active, or None, {level: {field: value}})}.
+
+    Levels that aren't in the table are invalid (and do nothing).
+    """
+    ret = {
+        "affinity_sliding": ("Afinidade Sliding (AFS)", {
+            1: {"affinity_add": 30},
+        }),
+        "Agitador": ("Agitador (AGI)", {
+            1: {"raw_add":  4, "affinity_add":  3},
+            2: {"raw_add":  8, "affinity_add":  5},
+            3: {"raw_add": 12, "affinity_add":  7},
+            4: {"raw_add": 16, "affinity_add": 10},
+            5: {"raw_add": 20, "affinity_add": 15},
+        }),
+        "attack_boost": (None, {
+            1: {"raw_add":  3},
+            2: {"raw_add":  6},
+            3: {"raw_add":  9},
+            4: {"raw_add":  7, "raw_mul": 1.05},
+            5: {"raw_add":  8, "raw_mul": 1.06},
+            6: {"raw_add":  9, "raw_mul": 1.08},
+            7: {"raw_add": 10, "raw_mul": 1.10},
+        }),
+        "counterstrike": ("Counterstrike (CS)", {
+            1: {"raw_add": 10},
+            2: {"raw_add": 15},
+            3: {"raw_add": 25},
+        }),
+        "critical_boost": (None, {
+            lvl: {"raw_critical_damage": CRITICAL_BOOST_DAMAGE_MULTIPLIERS[lvl]} for lvl in (1, 2, 3)
+        }),
+        "critical_draw": ("Critical Draw (CD)", {
+            1: {"affinity_add": 10},
+            2: {"affinity_add": 20},
+            3: {"affinity_add": 40},
+        }),
+        "critical_element": (None, {
+            lvl: {"elemental_critical_damage": CRITICAL_ELEMENT_DAMAGE_MULTIPLIERS[lvl]} for lvl in (1, 2, 3)
+        }),
+        "critical_eye": (None, {
+            1: {"affinity_add":  5},
+            2: {"affinity_add": 10},
+            3: {"affinity_add": 15},
+            4: {"affinity_add": 20},
+            5: {"affinity_add": 25},
+            6: {"affinity_add": 30},
+            7: {"affinity_add": 40},
+        }),
+        "dragonheart": ("Dragãoheart (DH)", {
+            1: {},
+            2: {},
+            3: {},
+            4: {"raw_mul": 1.05},
+            5: {"raw_mul": 1.10},
+        }),
+        "heroics": ("Heroics (HER)", {
+            1: {},
+            2: {"raw_mul": 1.05},
+            3: {"raw_mul": 1.05},
+            4: {"raw_mul": 1.10},
+            5: {"raw_mul": 1.30},
+        }),
+        "kushala_blessing": (None, {
+            1: {"water_mul": 1.05, "ice_mul": 1.05},
+            2: {"water_mul": 1.10, "ice_mul": 1.10},
+            3: {"water_mul": 1.10, "ice_mul": 1.10},
+            4: {"water_mul": 1.10, "ice_mul": 1.10},
+        }),
+        "latent_power": ("Latent Power (LP)", {
+            1: {"affinity_add": 10},
+            2: {"affinity_add": 20},
+            3: {"affinity_add": 30},
+            4: {"affinity_add": 40},
+            5: {"affinity_add": 50},
+        }),
+        "maximum_might": ("Maximum Might (MM)", {
+            1: {"affinity_add": 10},
+            2: {"affinity_add": 20},
+            3: {"affinity_add": 30},
+        }),
+        "minds_eye": ("Mind's Eye (ME)", {
+            1: {"raw_post_trunc_mul": 1.10},
+            2: {"raw_post_trunc_mul": 1.15},
+            3: {"raw_post_trunc_mul": 1.30},
+        }),
+        "offensive_guard": ("Offensive Guard (OG)", {
+            1: {"raw_mul": 1.05},
+            2: {"raw_mul": 1.10},
+            3: {"raw_mul": 1.15},
+        }),
+        "peak_performance": ("Desempenho Máximo (PP)", {
+            1: {"raw_add":  5},
+            2: {"raw_add": 10},
+            3: {"raw_add": 20},
+        }),
+        "punishing_draw": ("Punishing Draw (PD)", {
+            1: {"raw_add": 2},
+            2: {"raw_add": 5},
+            3: {"raw_add": 7},
+        }),
+        # TODO: Levels 4 and 5 are missing from the calculator too (it has three "case 3" labels).
+        "Indignação": ("Indignação (RES)", {
+            1: {"raw_add":  5},
+            2: {"raw_add": 10},
+            3: {"raw_add": 15},
+        }),
+        "Ressuscitar": ("Ressuscitar (RSC)", {
+            1: {"raw_add":  5},
+            2: {"raw_add": 10},
+            3: {"raw_add": 20},
+        }),
+        "teostra_blessing": (None, {
+            1: {"fire_mul": 1.05, "blast_mul": 1.05},
+            2: {"fire_mul": 1.10, "blast_mul": 1.10},
+            3: {"fire_mul": 1.10, "blast_mul": 1.10},
+            4: {"fire_mul": 1.10, "blast_mul": 1.10},
+        }),
+        "weakness_exploit": ("Explor. de Fraqueza (WEX)", {
+            1: {"affinity_add": 15},
+            2: {"affinity_add": 30},
+            3: {"affinity_add": 50},
+        }),
+    }
+    for ele in ELE_STAT_TYPES[:NUM_ELEMENTS]:
+        ret[f"{ele}_attack"] = (None, {
+            1: {f"{ele}_add": 2},
+            2: {f"{ele}_add": 3},
+            3: {f"{ele}_add": 4, f"{ele}_mul": 1.05},
+            4: {f"{ele}_add": 4, f"{ele}_mul": 1.10},
+            5: {f"{ele}_add": 4, f"{ele}_mul": 1.20},
+        })
+    for stat in ELE_STAT_TYPES[NUM_ELEMENTS:]:
+        ret[f"{stat}_attack"] = (None, {
+            1: {f"{stat}_add": 1, f"{stat}_mul": 1.05},
+            2: {f"{stat}_add": 2, f"{stat}_mul": 1.10},
+            3: {f"{stat}_add": 5, f"{stat}_mul": 1.20},
+        })
+    return ret
+
+_SKILL_OPS = _get_skill_ops()
+
+# Fortify is a binary skill. Its contribution depends on the state instead.
+FORTIFY_RAW_MUL_BY_STATE = np.array([1, 1.10, 1.20])
+
+def _neutral_value(field):
+    if field in _SET_FIELDS:
+        return _SET_FIELDS[field]
+    return 1 if (field in _MUL_FIELDS) else 0
+
+def _get_skill_tables(skill_max_levels):
+    """
+    Returns {skill ID: (state name or None, {field: array of values, indexed by level})}.
+    """
+    ret = {}
+    for (skill_id, (state_name, levels)) in _SKILL_OPS.items():
+        assert skill_id in skill_max_levels, f"Skill ID {skill_id} not present in the database."
+        size = max(skill_max_levels[skill_id], max(levels)) + 1
+        fields = {field for contributions in levels.values() for field in contributions}
+        tables = {}
+        for field in fields:
+            table = np.full(size, _neutral_value(field), dtype=np.float64)
+            for (level, contributions) in levels.items():
+                table[level] = contributions.get(field, _neutral_value(field))
+            tables[field] = table
+        ret[skill_id] = (state_name, tables)
+    return ret
+
+#
+# CONTRIBUTIONS
+#
+
+class SkillContributions:
+    def __init__(self, n):
+        for field in _ADD_FIELDS:
+            setattr(self, field, np.zeros(n))
+        for field in _MUL_FIELDS:
+            setattr(self, field, np.ones(n))
+        for (field, value) in _SET_FIELDS.items():
+            setattr(self, field, np.full(n, value, dtype=np.float64))
+        for skill_id in LEVEL_SKILLS:
+            setattr(self, skill_id + "_level", np.zeros(n, dtype=np.int64))
+
+        self.raw_blunder_damage = RAW_BLUNDER_DAMAGE_MULTIPLIER
+        self.elemental_blunder_damage = ELEMENTAL_BLUNDER_DAMAGE_MULTIPLIER
+
+class SkillContributionsCalculator:
+    def __init__(self, skill_max_levels):
+        self.skill_max_levels = skill_max_levels
+        self._tables = _get_skill_tables(skill_max_levels)
+
+    def calculate(self, skills, states, n):
+        """
+        skills is {skill ID: level column, or scalar}, and states is from get_state_columns(). Levels are clipped to the
+        skill's maximum.
+
+        Raises ValueError if a skill ID is unknown or a level is negative.
+        """
+        v = SkillContributions(n)
+        for (skill_id, levels) in skills.items():
+            if skill_id not in self.skill_max_levels:
+                raise ValueError(f"Unknown skill ID: {skill_id}")
+            levels = np.broadcast_to(np.asarray(levels, dtype=np.int64), (n,))
+            if np.any(levels < 0):
+                raise ValueError(f"Negative level for {skill_id}")
+            levels = np.minimum(levels, self.skill_max_levels[skill_id])
+
+            if skill_id in LEVEL_SKILLS:
+                setattr(v, skill_id + "_level", levels.copy())
+            elif skill_id == "fortify":
+                fortify_state = states["Fortify (FOR)"]
+                v.raw_mul = v.raw_mul * np.where(levels > 0, FORTIFY_RAW_MUL_BY_STATE[fortify_state], 1)
+            elif skill_id in self._tables:
+                (state_name, tables) = self._tables[skill_id]
+                active = (levels > 0) if (state_name is None) else ((levels > 0) & (states[state_name] == 1))
+                for (field, table) in tables.items():
+                    if field in _SET_FIELDS:
+                        setattr(v, field, np.where(active, table[levels], getattr(v, field)))
+                    elif field in _MUL_FIELDS:
+                        setattr(v, field, getattr(v, field) * np.where(active, table[levels], 1))
+                    else:
+                        setattr(v, field, getattr(v, field) + np.where(active, table[levels], 0))
+        return v
+
+class MiscBuffContributions:
+    __slots__ = ["raw_add", "raw_mul", "affinity_add", "ele_mul", "sharpness_level_reduction"]
+
+def get_misc_buff_contributions(states, petalace_attack_up):
+    """
+    states is from get_state_columns(). petalace_attack_up is the equipped petalace's attack up (a column, or a
+    scalar), used if "Petalace Attack (Max)" is active.
+    """
+    def active(state_name):
+        return states[state_name] == 1
+
+    v = MiscBuffContributions()
+    v.raw_add = (
+        np.where(active("Powercharm"), 6, 0)
+        + np.where(active("Powertalon"), 9, 0)
+        + np.where(active("Might Seed"), 10, 0)
+        + np.where(active("Demon Powder"), 10, 0)
+        + np.where(active("Demondrug"), 5, 0)
+        + np.where(active("Mega Demondrug"), 7, 0)
+        + np.where(active("Petalace Attack (Max)"), petalace_attack_up, 0)
+        + np.where(active("Dango Booster"), 9, 0)
+    )
+    # Infernal Melody overwrites the Attack Up song
+    v.raw_mul = (
+        np.where(active("Song: Infernal Melody"), 1.20, np.where(active("Song: Attack Up"), 1.10, 1))
+        * np.where(active("Palico: Power Drum"), 1.05, 1)
+    )
+    v.affinity_add = (
+        np.where(active("Song: Afinidade Up"), 20, 0)
+        + np.where(active("Palico: Rousing Roar"), 30, 0)
+    )
+    v.ele_mul = np.where(active("Song: Elem. Reforço de Ataque"), 1.10, 1)
+    v.sharpness_level_reduction = np.asarray(states["Reduce Sharpness Level"], dtype=np.int64)
+    return v
@@ -0,0 +1,122 @@
+"""
+Filename: weapon_table.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Loads every weapon of every category into one table of NumPy columns (one row per weapon), for the batch evaluator.
+
+The weapons are read from the scraped weapon data that the code generator turns into the weapon database, so this is
+the same data the app calculates with.
+"""
+
+import os
+import json
+
+import numpy as np
+
+WEAPON_DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../kiranico_scrape/output")
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../code_generators/hardcoded_data")
+
+WEAPON_CATEGORIES = [
+    "greatsword",
+    "longsword",
+    "swordandshield",
+    "dualblades",
+    "lance",
+    "gunlance",
+    "hammer",
+    "huntinghorn",
+    "switchaxe",
+    "chargeblade",
+    "insectglaive",
+    "lightbowgun",
+    "heavybowgun",
+    "bow",
+]
+
+MELEE_CATEGORIES = set(WEAPON_CATEGORIES) - {"lightbowgun", "heavybowgun", "bow"}
+
+# Column order of every per-element/status array
+ELE_STAT_TYPES = ["fire", "water", "thunder", "ice", "dragon", "poison", "paralysis", "sleep", "blast"]
+NUM_ELEMENTS = 5 # The first five are elements, and the rest are statuses
+
+NUM_SHARPNESS_LEVELS = 7 # Red to purple. The scraped data stops at white, so purple is always zero.
+
+class WeaponTable:
+    def __init__(self, weapon_data):
+        """
+        weapon_data is {category: scraped weapon data (tree name --> weapon ID --> weapon)}.
+        """
+        self.categories = []   # Category ID of each row
+        self.ids = []          # Weapon ID of each row (unique within the category)
+        self.names = []
+        self.ramp_skills = []  # Rampage skill slots of each row, each a list of possible rampage skill IDs
+        self._rows = {}        # {(category, weapon ID): row}
+
+        category_indices = []
+        attack = []
+        affinity = []
+        ele_stat = []
+        base_sharpness = []
+        max_sharpness = []
+        for (category_index, category) in enumerate(WEAPON_CATEGORIES):
+            for tree_data in weapon_data[category].values():
+                for (weapon_id, obj) in tree_data.items():
+                    assert all(k in ELE_STAT_TYPES for k in obj["eleStat"])
+                    self._rows[(category, weapon_id)] = len(self.ids)
+                    self.categories.append(category)
+                    self.ids.append(weapon_id)
+                    self.names.append(obj["name"])
+                    self.ramp_skills.append([[ramp_id for [ramp_id, _] in slot] for slot in obj["rampSkills"]])
+
+                    category_indices.append(category_index)
+                    attack.append(obj["attack"])
+                    affinity.append(obj["affinity"])
+                    # An element/status that's absent is NaN, so that it can be told apart from one that's zero
+                    ele_stat.append([obj["eleStat"].get(k, np.nan) for k in ELE_STAT_TYPES])
+                    if category in MELEE_CATEGORIES:
+                        assert len(obj["baseSharpness"]) == len(obj["maxSharpness"]) == NUM_SHARPNESS_LEVELS - 1
+                        base_sharpness.append(obj["baseSharpness"] + [0])
+                        max_sharpness.append(obj["maxSharpness"] + [0])
+                    else:
+                        base_sharpness.append([0] * NUM_SHARPNESS_LEVELS)
+                        max_sharpness.append([0] * NUM_SHARPNESS_LEVELS)
+
+        self.category_index = np.array(category_indices, dtype=np.int8) # Index into WEAPON_CATEGORIES
+        self.is_melee = np.array([x in MELEE_CATEGORIES for x in self.categories], dtype=bool)
+        self.attack = np.array(attack, dtype=np.float64)
+        self.affinity = np.array(affinity, dtype=np.float64)
+        self.ele_stat = np.array(ele_stat, dtype=np.float64).reshape(-1, len(ELE_STAT_TYPES))
+        self.base_sharpness = np.array(base_sharpness, dtype=np.int64).reshape(-1, NUM_SHARPNESS_LEVELS)
+        self.max_sharpness = np.array(max_sharpness, dtype=np.int64).reshape(-1, NUM_SHARPNESS_LEVELS)
+
+    def __len__(self):
+        return len(self.ids)
+
+    def row_of(self, category, weapon_id):
+        """
+        Raises ValueError if there's no such weapon.
+        """
+        row = self._rows.get((category, weapon_id))
+        if row is None:
+            raise ValueError(f"Unknown weapon: {category} {weapon_id}")
+        return row
+
+    def rows_of_category(self, category):
+        return np.flatnonzero(self.category_index == WEAPON_CATEGORIES.index(category))
+
+def _read_json(path):
+    with open(path, encoding="utf-8", mode="r") as f:
+        return json.loads(f.read())
+
+def load_weapon_table(weapon_data_dir=WEAPON_DATA_DIR):
+    return WeaponTable({
+        category: _read_json(os.path.join(weapon_data_dir, f"weapons_{category}.json"))
+        for category in WEAPON_CATEGORIES
+    })
+
+def load_skill_max_levels(data_dir=DATA_DIR):
+    """
+    Returns {skill ID: max level}.
+    """
+    return {obj["id"]: obj["maxLevels"] for obj in _read_json(os.path.join(data_dir, "skills.json"))}
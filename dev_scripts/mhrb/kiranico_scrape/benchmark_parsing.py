@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+
+"""
+Filename: benchmark_parsing.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Benchmarks the HTML parsing done by kiranico_scrape.py, for every installed parser backend, with and without
+the page strainers.
+
+The pages are read from kiranico_scrape.py's page cache, so you'll need to have run the scraper at least once.
+
+Each configuration is also checked to produce exactly the same data as the baseline configuration (html.parser
+without strainers).
+
+Usage:
+    python3 -m dev_scripts.mhrb.kiranico_scrape.benchmark_parsing [--cache-dir ./html_cache] [--limit 200]
+"""
+
+import os
+import json
+import time
+import argparse
+import tracemalloc
+import urllib.parse
+
+from . import html_cache
+from . import kiranico_scrape as ks
+
+BASELINE = ("html.parser", False)
+
+def get_page_type(url):
+    if url.endswith("/data/decorations"):
+        return "decos"
+    elif "scope=wp" in url:
+        return "weapon_category"
+    else:
+        return "weapon"
+
+def get_parse_fn(url):
+    page_type = get_page_type(url)
+    if page_type == "decos":
+        return ks.parse_decos_page
+    elif page_type == "weapon_category":
+        # We only match on path and query so that pages cached from a different host still work.
+        for (weapon_category, weapon_category_url, tagset) in ks.WEAPON_URLS:
+            if urllib.parse.urlsplit(url)[2:4] == urllib.parse.urlsplit(weapon_category_url)[2:4]:
+                return lambda content: ks.parse_weapon_category_page(weapon_category, tagset, content)
+        raise ValueError("Unknown weapon category page: " + url)
+    else:
+        return ks.parse_weapon_page
+
+def read_pages(cache_dir, limit):
+    """
+    Returns [(page type, url, content), ...]. Listing pages are always included, but weapon pages are capped at
+    the limit.
+    """
+    urls_dir = os.path.join(cache_dir, "urls")
+    pages = []
+    num_weapon_pages = 0
+    for file_name in sorted(os.listdir(urls_dir)):
+        with open(os.path.join(urls_dir, file_name), encoding="utf-8", mode="r") as f:
+            entry = json.loads(f.read())
+        page_type = get_page_type(entry["url"])
+        if page_type == "weapon":
+            if (limit is not None) and (num_weapon_pages >= limit):
+                continue
+            num_weapon_pages += 1
+        pages.append((page_type, entry["url"], html_cache.read_body(cache_dir, entry)))
+    return pages
+
+def run_config(pages, parser_backend, use_strainers):
+    ks.configure_parsing(parser_backend, use_strainers)
+
+    results = []
+    seconds_per_type = {}
+    for (page_type, url, content) in pages:
+        parse_fn = get_parse_fn(url)
+        start_time = time.perf_counter()
+        results.append(parse_fn(content))
+        seconds_per_type.setdefault(page_type, []).append(time.perf_counter() - start_time)
+
+    # Memory is measured in a separate pass since tracing slows everything down.
+    peak_bytes = 0
+    for (page_type, url, content) in pages:
+        parse_fn = get_parse_fn(url)
+        tracemalloc.start()
+        parse_fn(content)
+        peak_bytes = max(peak_bytes, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    return (results, seconds_per_type, peak_bytes)
+
+def run(cache_dir, limit):
+    pages = read_pages(cache_dir, limit)
+    if len(pages) == 0:
+        print(f"No pages found in {cache_dir}. Run kiranico_scrape.py first.")
+        return
+    page_types = sorted(set(x[0] for x in pages))
+    print(f"Read {len(pages)} pages ({', '.join(f'{sum(1 for x in pages if x[0] == k)} {k}' for k in page_types)}).")
+    print()
+
+    configs = [BASELINE]
+    for parser_backend in ks.get_available_parser_backends():
+        for use_strainers in [False, True]:
+            if ((parser_backend, use_strainers) != BASELINE) and not ((parser_backend == "html5lib") and use_strainers):
+                configs.append((parser_backend, use_strainers))
+
+    header = f"{'backend':<12} {'strainers':<10} {'total s':>8} {'speedup':>8} {'peak KiB':>9} {'mem ratio':>9}"
+    header += "".join(f" {'ms/' + k:>20}" for k in page_types)
+    print(header)
+    print("-" * len(header))
+
+    baseline = None
+    for (parser_backend, use_strainers) in configs:
+        (results, seconds_per_type, peak_bytes) = run_config(pages, parser_backend, use_strainers)
+        total_seconds = sum(sum(x) for x in seconds_per_type.values())
+
+        if baseline is None:
+            baseline = (results, total_seconds, peak_bytes)
+        elif results != baseline[0]:
+            raise ValueError(f"Results from {parser_backend} (strainers={use_strainers}) don't match the baseline.")
+
+        line = f"{parser_backend:<12} {'yes' if use_strainers else 'no':<10} {total_seconds:>8.2f}"
+        line += f" {baseline[1] / total_seconds:>7.1f}x {peak_bytes / 1024:>9.0f} {baseline[2] / peak_bytes:>8.1f}x"
+        line += "".join(f" {sum(x) / len(x) * 1000:>20.2f}" for x in (seconds_per_type[k] for k in page_types))
+        print(line)
+
+    print()
+    print("All configurations produced identical results.")
+    return
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark HTML parsing over pages saved in the page cache.")
+    parser.add_argument("--cache-dir", default=html_cache.DEFAULT_CACHE_DIR,
+                        help="Directory of the on-disk page cache.")
+    parser.add_argument("--limit", type=int, default=None,
+                        help="Maximum number of individual weapon pages to include.")
+    args = parser.parse_args()
+    run(args.cache_dir, args.limit)
+    return
+
+if __name__ == "__main__":
+    main()
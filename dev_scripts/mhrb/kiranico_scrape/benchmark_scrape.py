@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+"""
+Filename: benchmark_scrape.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+End-to-end throughput benchmark of kiranico_scrape.py against mock_kiranico_server.py, so no network access is
+needed.
+
+Each run starts from an empty page cache in a temporary directory, and is checked to produce exactly the same data
+as the first run.
+
+Usage:
+    python3 -m dev_scripts.mhrb.kiranico_scrape.benchmark_scrape fixtures.zip \\
+        [--concurrency 1 4 8 16] [--latency 0.05] [--rate-limit 50]
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import contextlib
+
+from . import http_session
+from . import fixture_archive
+from . import mock_kiranico_server
+from . import kiranico_scrape as ks
+
+def run_scrape(base_url, max_concurrency, requests_per_second, verbose):
+    """
+    Returns (seconds, number of requests, scraped data).
+    """
+    requests_before = http_session.stats.snapshot()["requests"]
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # The scraper's progress output is too noisy to be useful here.
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(sys.stdout if verbose else devnull):
+            start_time = time.perf_counter()
+            ks.run(
+                cache_dir=os.path.join(tmp_dir, "html_cache"),
+                requests_per_second=requests_per_second,
+                max_concurrency=max_concurrency,
+                checkpoint_dir=os.path.join(tmp_dir, "checkpoints"),
+                output_dir=os.path.join(tmp_dir, "downloaded_data"),
+                base_url=base_url,
+                telemetry_log_path=os.path.join(tmp_dir, "telemetry.jsonl"),
+            )
+            seconds = time.perf_counter() - start_time
+        with open(os.path.join(tmp_dir, "downloaded_data/downloaded_data.json"), encoding="utf-8", mode="r") as f:
+            data = json.loads(f.read())
+    num_requests = http_session.stats.snapshot()["requests"] - requests_before
+    return (seconds, num_requests, data)
+
+def run(archive_path, concurrency_levels, requests_per_second, server_kwargs, verbose):
+    archive = fixture_archive.Archive(archive_path)
+    server = mock_kiranico_server.MockServer(archive, **server_kwargs)
+    server.start()
+    print(f"Serving {len(archive)} recorded responses at {server.base_url}")
+    print()
+
+    header = f"{'concurrency':>11} {'seconds':>8} {'pages/s':>8} {'requests':>8} {'throttled':>9}"
+    print(header)
+    print("-" * len(header))
+
+    baseline = None
+    try:
+        for max_concurrency in concurrency_levels:
+            throttled_before = server.stats.snapshot()["throttled"]
+            (seconds, num_requests, data) = run_scrape(server.base_url, max_concurrency, requests_per_second,
+                                                       verbose)
+            throttled = server.stats.snapshot()["throttled"] - throttled_before
+
+            if baseline is None:
+                baseline = data
+            elif data != baseline:
+                raise ValueError(f"Scraped data with a concurrency of {max_concurrency} doesn't match the first run.")
+
+            num_pages = num_requests - throttled
+            print(f"{max_concurrency:>11} {seconds:>8.2f} {num_pages / seconds:>8.1f} {num_requests:>8} {throttled:>9}")
+    finally:
+        server.stop()
+
+    print()
+    print("All runs produced identical results.")
+    return
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark kiranico_scrape.py against a local mock server.")
+    parser.add_argument("archive",
+                        help="Fixture archive, as recorded by kiranico_scrape.py --record.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8, 16],
+                        help="Values of --max-concurrency to benchmark.")
+    parser.add_argument("--requests-per-second", type=float, default=1000.0,
+                        help="Scraper's own request rate limit. This is set high by default so the server is the "
+                             "bottleneck.")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Seconds the server waits before every response.")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Random variation (+/- seconds) added to the latency.")
+    parser.add_argument("--rate-limit", type=float, default=None,
+                        help="Requests per second beyond which the server answers with 429 Too Many Requests.")
+    parser.add_argument("--throttle-probability", type=float, default=0.0,
+                        help="Chance of the server answering any request with 429 Too Many Requests.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Show the scraper's output.")
+    args = parser.parse_args()
+
+    server_kwargs = {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "rate_limit": args.rate_limit,
+        "throttle_probability": args.throttle_probability,
+    }
+    run(args.archive, args.concurrency, args.requests_per_second, server_kwargs, args.verbose)
+    return
+
+if __name__ == "__main__":
+    main()
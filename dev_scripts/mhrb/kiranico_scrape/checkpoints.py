@@ -0,0 +1,85 @@
+"""
+Filename: checkpoints.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Scrape checkpoints, used by kiranico_scrape.py to resume a scrape that failed part-way through.
+
+Layout of the checkpoint directory:
+
+    decorations.json                        Parsed decorations page.
+    categories/<category>.json              Finished weapon category, exactly as it goes into downloaded_data.json.
+    weapons/<category>/<sha1 of url>.json   Parsed individual weapon page.
+
+Each checkpoint is written (atomically) as soon as its result is available, so a crash never leaves a half-written
+checkpoint behind.
+
+Only the individual weapon pages are checkpointed within a category. The listing page is always parsed again on
+resume, so fixes to the listing parser take effect without having to redownload any weapon pages.
+"""
+
+import os
+import json
+import shutil
+import threading
+
+from . import html_cache
+
+DEFAULT_CHECKPOINT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "checkpoints")
+
+#
+# COUNTERS
+#
+
+class CheckpointStats:
+    def __init__(self, saved=0, resumed=0):
+        self.saved = saved     # Checkpoints written during this run
+        self.resumed = resumed # Checkpoints from a previous run that let us skip work
+        self._lock = threading.Lock()
+
+    def record(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {"saved": self.saved, "resumed": self.resumed}
+
+    def summary_str(self):
+        return f"{self.saved} saved, {self.resumed} resumed from a previous run"
+
+stats = CheckpointStats()
+
+#
+# CHECKPOINTS
+#
+
+def decos_path(checkpoint_dir):
+    return os.path.join(checkpoint_dir, "decorations.json")
+
+def category_path(checkpoint_dir, weapon_category):
+    return os.path.join(checkpoint_dir, "categories", weapon_category + ".json")
+
+def weapon_path(checkpoint_dir, weapon_category, url):
+    return os.path.join(checkpoint_dir, "weapons", weapon_category, html_cache.url_key(url) + ".json")
+
+def load(path):
+    """
+    Returns the checkpointed data, or None if there's no checkpoint.
+    """
+    try:
+        with open(path, encoding="utf-8", mode="r") as f:
+            data = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    stats.record("resumed")
+    return data
+
+def save(path, data):
+    html_cache.atomic_write(path, json.dumps(data, sort_keys=True, indent=4).encode("utf-8"))
+    stats.record("saved")
+    return
+
+def clear(checkpoint_dir):
+    shutil.rmtree(checkpoint_dir, ignore_errors=True)
+    return
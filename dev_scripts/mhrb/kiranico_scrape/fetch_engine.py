@@ -0,0 +1,232 @@
+"""
+Filename: fetch_engine.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+asyncio-based download engine used by kiranico_scrape.py.
+
+All downloads go through a single global limiter:
+    - a token bucket that caps the sustained request rate (with bursts of up to `max_concurrency` requests), and
+    - a cap on the number of requests in flight at any one time.
+
+If a host responds with 429 Too Many Requests or 503 Service Unavailable, every request to that host is held back
+until the Retry-After period (or our own exponential backoff, if the server didn't send one) has passed.
+
+If a recorder (see fixture_archive.py) is given, every page is downloaded in full (i.e. no conditional requests)
+and recorded.
+
+download() and parse() can also fill in a telemetry record for the page (see telemetry.py).
+
+The blocking HTTP requests themselves are made by http_session on a small thread pool, and CPU-bound parsing is
+handed off to a small process pool so it doesn't hold up the event loop.
+"""
+
+import time
+import asyncio
+import functools
+import urllib.parse
+import email.utils
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from . import http_session
+from . import html_cache
+from .telemetry import Telemetry, new_page_record, timed_call
+
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_PARSE_WORKERS = 2
+
+MAX_RETRIES = 5
+BACKOFF_BASE_SECONDS = 2.0
+BACKOFF_MAX_SECONDS = 120.0
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        assert rate > 0
+        assert capacity >= 1
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + ((now - self._updated) * self.rate))
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+def parse_retry_after(value):
+    """
+    Returns the number of seconds to wait according to a Retry-After header, or None if it can't be read.
+    """
+    if value is None:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+class FetchEngine:
+    def __init__(
+        self,
+        *,
+        requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+        max_concurrency=DEFAULT_MAX_CONCURRENCY,
+        parse_workers=DEFAULT_PARSE_WORKERS,
+        parse_initializer=None,
+        parse_initargs=(),
+        cache_dir=html_cache.DEFAULT_CACHE_DIR,
+        offline=False,
+        recorder=None,
+        telemetry=None,
+    ):
+        assert isinstance(max_concurrency, int) and (max_concurrency > 0)
+        assert isinstance(parse_workers, int) and (parse_workers >= 0)
+
+        self.cache_dir = cache_dir
+        self.offline = offline
+        self.recorder = recorder
+        self.telemetry = Telemetry() if (telemetry is None) else telemetry
+        assert not (offline and (recorder is not None)), "Can't record without making requests."
+
+        self.throttled = 0 # Number of 429/503 responses received
+
+        self._bucket = TokenBucket(requests_per_second, max_concurrency)
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._host_resume_at = {} # {host: time.monotonic() value}
+
+        http_session.configure(pool_size=max_concurrency)
+        self._fetch_executor = ThreadPoolExecutor(max_concurrency)
+        # With no parse workers, parsing is just done in the event loop thread.
+        self._parse_executor = None
+        if parse_workers > 0:
+            self._parse_executor = ProcessPoolExecutor(
+                parse_workers,
+                initializer=parse_initializer,
+                initargs=parse_initargs,
+            )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        self._fetch_executor.shutdown()
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown()
+        return
+
+    async def _wait_for_host(self, host):
+        while True:
+            delay = self._host_resume_at.get(host, 0.0) - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _back_off_host(self, host, delay):
+        resume_at = time.monotonic() + delay
+        self._host_resume_at[host] = max(self._host_resume_at.get(host, 0.0), resume_at)
+        return
+
+    async def get(self, url, headers=None):
+        """
+        Makes a rate-limited GET request, retrying if the server tells us to slow down.
+
+        Besides http_session's timings, response.timings also has the time spent waiting on the rate limiter
+        (including backoff), and the number of retries.
+        """
+        host = urllib.parse.urlsplit(url).netloc
+        loop = asyncio.get_running_loop()
+        request_fn = functools.partial(http_session.get, url, headers=headers)
+
+        wait_seconds = 0.0
+        attempt = 0
+        while True:
+            wait_start_time = time.perf_counter()
+            await self._wait_for_host(host)
+            async with self._concurrency:
+                await self._bucket.acquire()
+                wait_seconds += time.perf_counter() - wait_start_time
+                response = await loop.run_in_executor(self._fetch_executor, request_fn)
+
+            if (response.status_code not in (429, 503)) or (attempt >= MAX_RETRIES):
+                response.timings["wait"] = wait_seconds
+                response.timings["retries"] = attempt
+                return response
+
+            self.throttled += 1
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = BACKOFF_BASE_SECONDS * (2 ** attempt)
+            delay = min(delay, BACKOFF_MAX_SECONDS)
+            print(f"Got HTTP {response.status_code} from {host}. Backing off for {delay:.1f} seconds.")
+            self._back_off_host(host, delay)
+            attempt += 1
+
+    async def download(self, url, record=None):
+        """
+        Returns the body of the page, going through the on-disk page cache.
+        """
+        if record is None:
+            record = new_page_record(url, None, None) # Just thrown away
+
+        entry = html_cache.lookup(self.cache_dir, url)
+
+        if self.offline:
+            if entry is None:
+                raise FileNotFoundError("Page is not in the cache (required in offline mode): " + url)
+            html_cache.stats.record("offline")
+            body = html_cache.read_body(self.cache_dir, entry)
+            record.update({"cache": "offline", "bytes": len(body)})
+            return body
+
+        if self.recorder is not None:
+            entry = None # A 304 wouldn't give us anything to record
+        response = await self.get(url, headers=html_cache.conditional_headers(entry))
+        record.update({k: response.timings[k] for k in ("wait", "retries", "dns", "connect", "tls", "ttfb",
+                                                         "transfer", "wire_bytes")})
+        record["status"] = response.status_code
+
+        if (response.status_code == 304) and (entry is not None):
+            html_cache.stats.record("revalidated")
+            body = html_cache.read_body(self.cache_dir, entry)
+            record.update({"cache": "revalidated", "bytes": len(body)})
+            return body
+
+        response.raise_for_status()
+        html_cache.store(self.cache_dir, url, response.content, response.headers)
+        html_cache.stats.record("downloaded")
+        if self.recorder is not None:
+            self.recorder.record(url, response.status_code, response.headers, response.content)
+        record.update({"cache": "downloaded", "bytes": len(response.content)})
+        return response.content
+
+    async def parse(self, fn, *args, record=None):
+        """
+        Runs a CPU-bound parsing function. fn and its arguments must be picklable.
+        """
+        if self._parse_executor is None:
+            (result, parse_seconds, extract_seconds) = timed_call(fn, *args)
+        else:
+            loop = asyncio.get_running_loop()
+            (result, parse_seconds, extract_seconds) = await loop.run_in_executor(
+                self._parse_executor,
+                functools.partial(timed_call, fn, *args),
+            )
+        if record is not None:
+            record["parse"] += parse_seconds
+            record["extract"] += extract_seconds
+        return result
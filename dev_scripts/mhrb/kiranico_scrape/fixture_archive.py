@@ -0,0 +1,94 @@
+"""
+Filename: fixture_archive.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Archives of recorded Kiranico responses, written by `kiranico_scrape.py --record` and served back by
+mock_kiranico_server.py.
+
+An archive is a zip file:
+
+    index.json          {"<path>?<query>": {"status": ..., "headers": {...}, "sha256": ...}, ...}
+    bodies/<sha256>     Response body, already decoded (i.e. no content encoding).
+
+Responses are keyed by path and query only, so an archive recorded from the live site can be replayed from any
+host. Bodies are content-addressed, so identical pages are only stored once.
+"""
+
+import os
+import json
+import tempfile
+import zipfile
+import hashlib
+import urllib.parse
+
+# Only headers that still make sense for a decoded body are kept. Everything else (content encoding, lengths,
+# cookies, etc.) is left to whatever serves the archive.
+RECORDED_HEADERS = ["Content-Type", "ETag", "Last-Modified", "Cache-Control"]
+
+def archive_key(url):
+    parts = urllib.parse.urlsplit(url)
+    return parts.path + "?" + parts.query
+
+class Recorder:
+    def __init__(self, path):
+        self.path = path
+        self._index = {}
+        self._stored = set() # sha256 of every body written so far
+        # Written to a temporary file first, so a failed recording never replaces a good archive.
+        dir_path = os.path.dirname(os.path.abspath(path))
+        os.makedirs(dir_path, exist_ok=True)
+        (fd, self._tmp_path) = tempfile.mkstemp(dir=dir_path, prefix=".tmp-", suffix=".zip")
+        os.close(fd)
+        os.chmod(self._tmp_path, 0o644) # mkstemp() only gives the owner access
+        self._zip = zipfile.ZipFile(self._tmp_path, mode="w", compression=zipfile.ZIP_DEFLATED)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close(finished=(exc_type is None))
+        return False
+
+    def record(self, url, status, headers, body):
+        sha256 = hashlib.sha256(body).hexdigest()
+        if sha256 not in self._stored:
+            self._zip.writestr("bodies/" + sha256, body)
+            self._stored.add(sha256)
+        self._index[archive_key(url)] = {
+            "status": status,
+            "headers": {k: headers[k] for k in RECORDED_HEADERS if k in headers},
+            "sha256": sha256,
+        }
+        return
+
+    def close(self, finished=True):
+        if finished:
+            self._zip.writestr("index.json", json.dumps(self._index, sort_keys=True, indent=4))
+        self._zip.close()
+        if finished:
+            os.replace(self._tmp_path, self.path)
+        else:
+            os.unlink(self._tmp_path)
+        return
+
+class Archive:
+    def __init__(self, path):
+        self.path = path
+        with zipfile.ZipFile(path, mode="r") as z:
+            self._index = json.loads(z.read("index.json"))
+            # Archives are small enough to just keep every body in memory.
+            self._bodies = {x["sha256"]: z.read("bodies/" + x["sha256"]) for x in self._index.values()}
+
+    def __len__(self):
+        return len(self._index)
+
+    def lookup(self, url):
+        """
+        Returns (status, headers, body), or None if the URL isn't in the archive. url can also be just the path
+        and query.
+        """
+        entry = self._index.get(archive_key(url))
+        if entry is None:
+            return None
+        return (entry["status"], dict(entry["headers"]), self._bodies[entry["sha256"]])
@@ -0,0 +1,111 @@
+"""
+Filename: html_cache.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+On-disk cache of downloaded pages, used by kiranico_scrape.py.
+
+Layout of the cache directory:
+
+    urls/<sha1 of url>.json    {"url": ..., "etag": ..., "last_modified": ..., "sha256": ...}
+    objects/<sha256 of body>   Raw response body.
+
+Bodies are content-addressed, so identical pages are only ever stored once, and an index entry is only updated
+to point to a new body after that body has been completely written. All writes go through a temporary file and
+an atomic rename, so it's safe for multiple processes and threads to share the same cache directory.
+"""
+
+import os
+import json
+import hashlib
+import threading
+
+from ..common.output_files import atomic_write
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "html_cache")
+
+#
+# COUNTERS
+#
+
+class CacheStats:
+    def __init__(self, revalidated=0, downloaded=0, offline=0):
+        self.revalidated = revalidated # Conditional requests answered with 304 Not Modified
+        self.downloaded = downloaded   # Full page downloads
+        self.offline = offline         # Pages served from the cache without making any request
+        self._lock = threading.Lock()
+
+    def record(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {"revalidated": self.revalidated, "downloaded": self.downloaded, "offline": self.offline}
+
+    def summary_str(self):
+        return (f"{self.downloaded} downloaded, {self.revalidated} not modified (served from cache), "
+                f"{self.offline} served offline")
+
+stats = CacheStats()
+
+#
+# CACHE
+#
+
+def url_key(url):
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()
+
+def content_hash(body):
+    return hashlib.sha256(body).hexdigest()
+
+def _entry_path(cache_dir, url):
+    return os.path.join(cache_dir, "urls", url_key(url) + ".json")
+
+def _object_path(cache_dir, sha256):
+    return os.path.join(cache_dir, "objects", sha256)
+
+def lookup(cache_dir, url):
+    """
+    Returns the index entry for the URL, or None if the URL isn't cached (or its body has gone missing).
+    """
+    try:
+        with open(_entry_path(cache_dir, url), encoding="utf-8", mode="r") as f:
+            entry = json.loads(f.read())
+    except FileNotFoundError:
+        return None
+    if not os.path.isfile(_object_path(cache_dir, entry["sha256"])):
+        return None
+    return entry
+
+def read_body(cache_dir, entry):
+    with open(_object_path(cache_dir, entry["sha256"]), mode="rb") as f:
+        body = f.read()
+    if content_hash(body) != entry["sha256"]:
+        raise ValueError("Corrupted cache object for URL: " + entry["url"])
+    return body
+
+def store(cache_dir, url, body, headers):
+    sha256 = content_hash(body)
+    object_path = _object_path(cache_dir, sha256)
+    if not os.path.isfile(object_path):
+        atomic_write(object_path, body)
+
+    entry = {
+        "url": url,
+        "etag": headers.get("ETag"),
+        "last_modified": headers.get("Last-Modified"),
+        "sha256": sha256,
+    }
+    atomic_write(_entry_path(cache_dir, url), json.dumps(entry, sort_keys=True, indent=4).encode("utf-8"))
+    return entry
+
+def conditional_headers(entry):
+    headers = {}
+    if entry is None:
+        return headers
+    if entry["etag"] is not None:
+        headers["If-None-Match"] = entry["etag"]
+    if entry["last_modified"] is not None:
+        headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
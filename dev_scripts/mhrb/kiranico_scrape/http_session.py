@@ -0,0 +1,186 @@
+"""
+Filename: http_session.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Process-level pooled HTTP session used by kiranico_scrape.py.
+
+Every process gets exactly one requests.Session, which keeps connections alive and reuses them across requests
+(and across threads). We also count new connections (i.e. TCP+TLS handshakes) so we can tell how many requests
+actually benefited from connection reuse.
+
+Each response also carries a `timings` dict, breaking the request down into DNS, connect, TLS, time to first byte
+and transfer time (see telemetry.py), along with the number of bytes received over the wire.
+
+Brotli content encoding is only negotiated if urllib3 can decode it, which requires the `brotli` (or
+`brotlicffi`) package to be installed. Otherwise, we fall back to gzip/deflate.
+"""
+
+import os
+import time
+import socket
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+from urllib3.util.request import ACCEPT_ENCODING
+
+DEFAULT_POOL_SIZE = 4
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+_pool_size = DEFAULT_POOL_SIZE
+
+# Timings of the request currently being made by each thread. Connections add their setup times to it.
+_local = threading.local()
+
+#
+# COUNTERS
+#
+
+class ConnectionStats:
+    def __init__(self, requests=0, handshakes=0, seconds=0.0):
+        self.requests = requests
+        self.handshakes = handshakes
+        self.seconds = seconds # Total time spent in requests
+        self._lock = threading.Lock()
+
+    def record_request(self, seconds):
+        with self._lock:
+            self.requests += 1
+            self.seconds += seconds
+
+    def record_handshake(self):
+        with self._lock:
+            self.handshakes += 1
+
+    def snapshot(self):
+        with self._lock:
+            return {"requests": self.requests, "handshakes": self.handshakes, "seconds": self.seconds}
+
+    @property
+    def reused(self):
+        return max(self.requests - self.handshakes, 0)
+
+    def summary_str(self):
+        avg_ms = (self.seconds / self.requests * 1000) if (self.requests > 0) else 0.0
+        return (f"{self.requests} requests, {self.handshakes} handshakes, {self.reused} reused connections, "
+                f"{avg_ms:.1f} ms average per request")
+
+stats = ConnectionStats()
+
+def _add_timing(k, seconds):
+    timings = getattr(_local, "timings", None)
+    if timings is not None:
+        timings[k] += seconds
+    return
+
+class _TimedConnectionMixin:
+    def _new_conn(self):
+        # Counted here rather than in the pool, since urllib3 also reconnects existing connection objects.
+        stats.record_handshake()
+        start_time = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+        except socket.gaierror:
+            addresses = [] # Let urllib3 try again, and raise its usual error
+        resolved_time = time.perf_counter()
+        _add_timing("dns", resolved_time - start_time)
+
+        # We connect to the address we just resolved, so the name isn't looked up twice. If that doesn't work, we
+        # fall back to letting urllib3 try every address.
+        dns_host = self._dns_host
+        try:
+            if len(addresses) > 0:
+                self._dns_host = addresses[0][4][0]
+            sock = super()._new_conn()
+        except NewConnectionError:
+            self._dns_host = dns_host
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = dns_host
+        self._connected_time = time.perf_counter()
+        _add_timing("connect", self._connected_time - resolved_time)
+        return sock
+
+class _TimedHTTPConnection(_TimedConnectionMixin, HTTPConnection):
+    pass
+
+class _TimedHTTPSConnection(_TimedConnectionMixin, HTTPSConnection):
+    def connect(self):
+        # Everything after the TCP connection is up is the TLS handshake.
+        self._connected_time = None
+        super().connect()
+        if self._connected_time is not None:
+            _add_timing("tls", time.perf_counter() - self._connected_time)
+        return
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+#
+# SESSION
+#
+
+def configure(pool_size):
+    global _pool_size
+    global _session
+    assert isinstance(pool_size, int) and (pool_size > 0)
+    with _session_lock:
+        _pool_size = pool_size
+        _session = None # Rebuilt on next use
+    return
+
+def get_session():
+    global _session
+    global _session_pid
+    with _session_lock:
+        # Connections must never be shared across a fork, so a child process always builds its own session.
+        if (_session is None) or (_session_pid != os.getpid()):
+            _session = _new_session(_pool_size)
+            _session_pid = os.getpid()
+        return _session
+
+def _new_session(pool_size):
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+    adapter.poolmanager.pool_classes_by_scheme = {
+        "http": _TimedHTTPConnectionPool,
+        "https": _TimedHTTPSConnectionPool,
+    }
+
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Accept-Encoding"] = ACCEPT_ENCODING # Includes "br" if a brotli decoder is installed
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+def get(url, **kwargs):
+    timings = {"dns": 0.0, "connect": 0.0, "tls": 0.0, "ttfb": 0.0, "transfer": 0.0, "wire_bytes": 0}
+    _local.timings = timings
+    start_time = time.perf_counter()
+    try:
+        # Streaming lets us time the headers and the body separately. Reading .content still gets us the whole body
+        # (and releases the connection back to the pool).
+        response = get_session().get(url, stream=True, **kwargs)
+        headers_time = time.perf_counter()
+        response.content
+    finally:
+        _local.timings = None
+    end_time = time.perf_counter()
+
+    setup_seconds = timings["dns"] + timings["connect"] + timings["tls"]
+    timings["ttfb"] = max(headers_time - start_time - setup_seconds, 0.0)
+    timings["transfer"] = end_time - headers_time
+    timings["wire_bytes"] = response.raw.tell() # Before content decoding
+    response.timings = timings
+
+    stats.record_request(end_time - start_time)
+    return response
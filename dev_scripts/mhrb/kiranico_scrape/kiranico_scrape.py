@@ -5,26 +5,69 @@ Filename: kiranico_scrape.py
 Author:   simshadows <contact@simshadows.com>
 License:  GNU Affero General Public License v3 (AGPL-3.0)
 
-This script was built to scrape <https://mhrise.kiranico.com/> and dump the files into `./downloaded_data`.
+This script was built to scrape <https://mhrise.kiranico.com/> and dump the files into `downloaded_data`.
 
-The contents of `./downloaded_data` will need to be processed by another script to use in the builder program.
+The contents of `downloaded_data` will need to be processed by another script to use in the builder program.
 
 Dependencies:
     python3 -m pip install requests
     python3 -m pip install beautifulsoup4
+    python3 -m pip install brotli # Optional. Enables brotli content encoding.
+    python3 -m pip install lxml   # Optional. Much faster HTML parser backend.
 
 NOTE: To avoid server-side request limits, we intentionally don't download pages aggressively.
-      This script will take a while to run.
+      All downloads go through the rate limiter in fetch_engine.py (see `--requests-per-second` and
+      `--max-concurrency`), which also backs off whenever the server tells us to slow down.
+
+Every downloaded page is also kept in an on-disk cache (`html_cache` by default). Later runs only make
+conditional requests for cached pages, and `--offline` re-parses everything purely from the cache.
+
+`--incremental` compares the weapon category listings against the existing `downloaded_data.json`, and only
+downloads the individual pages of new or changed weapons. Since a weapon's rampage skills, rarity and defense
+are only shown on its own page, changes to only those won't be picked up by an incremental scrape.
+
+Results are checkpointed (`checkpoints` by default) as they arrive. If the scrape fails part-way through (e.g.
+on one of the parser asserts), everything that did finish is kept, and rerunning with `--resume` only redoes the
+work that's missing. Checkpoints are cleared after a successful scrape, or when starting a scrape without
+`--resume`.
+
+`--base-url` points the scraper at a different host (e.g. mock_kiranico_server.py), and `--record` saves every
+response into a fixture archive that mock_kiranico_server.py can replay (see fixture_archive.py).
+
+Each page's download and parse times are logged to `telemetry.jsonl` (see telemetry.py, and
+`--telemetry-log`), and summarised at the end of the run.
+
+`--output-format` picks the layout of the weapon data written to `downloaded_data` (see scrape_output.py). The
+`shards` and `jsonl` layouts are written as results arrive, so process_downloaded_data.py can start on them before
+the scrape has finished.
+
+The default paths of all of these are relative to this script's directory, not the working directory.
 """
 
 import os
 import sys
 import re
 import json
-import requests
-import multiprocessing as mp
+import time
+import asyncio
+import argparse
+import traceback
+import importlib.util
+import urllib.parse
+
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer, UnicodeDammit
+
+from . import http_session
+from . import html_cache
+from . import fetch_engine
+from . import checkpoints
+from . import scrape_output
+from . import fixture_archive
+from . import telemetry
 
-from bs4 import BeautifulSoup, NavigableString
+DEFAULT_BASE_URL = "https://mhrise.kiranico.com"
+
+DECOS_URL = "https://mhrise.kiranico.com/pt-BR/data/decorations"
 
 WEAPON_URLS = [
     ("greatsword"    , "https://mhrise.kiranico.com/pt-BR/data/weapons?scope=wp&value=0" , {"elestat", "melee"}),
@@ -43,20 +86,87 @@ WEAPON_URLS = [
     ("bow"           , "https://mhrise.kiranico.com/pt-BR/data/weapons?scope=wp&value=11", {"elestat"}),
 ]
 
+# BeautifulSoup tree builders, in order of preference. html.parser is part of the standard library, so it's
+# always available.
+PARSER_BACKENDS = [
+    ("lxml"       , "lxml"),
+    ("html5lib"   , "html5lib"),
+    ("html.parser", None),
+]
+# html5lib is correct but slow, so we never pick it automatically.
+AUTO_PARSER_BACKENDS = ["lxml", "html.parser"]
+
+# The subtrees each page type actually needs. Everything else on the page is skipped while parsing, so it never
+# gets built into the tree in the first place.
+PAGE_STRAINERS = {
+    "weapon"         : SoupStrainer(["dl", "tbody"], attrs={"class": ["grid", "divide-gray-200"]}),
+    "weapon_category": SoupStrainer("tbody", attrs={"class": "bg-white"}),
+    "decos"          : SoupStrainer("tbody"),
+}
+
 module_dir_abs = os.path.dirname(os.path.abspath(__file__))
 
+DEFAULT_OUTPUT_DIR = os.path.join(module_dir_abs, "downloaded_data")
+
+# Set by run(). Every URL we download is moved over to this host (see site_url()).
+_base_url = DEFAULT_BASE_URL
+
+# Set by configure_parsing(). In the fetch engine's parse workers, this is done by the worker initializer.
+_parser_backend = "html.parser"
+_use_strainers = True
+
 #
 # UTILITIES
 #
 
-def download(url):
-    return BeautifulSoup(requests.get(url).content, "html.parser")
+def get_available_parser_backends():
+    return [k for (k, module_name) in PARSER_BACKENDS if (module_name is None) or importlib.util.find_spec(module_name)]
+
+def configure_parsing(parser_backend="auto", use_strainers=True):
+    global _parser_backend
+    global _use_strainers
+    available = get_available_parser_backends()
+    if parser_backend == "auto":
+        parser_backend = next(x for x in AUTO_PARSER_BACKENDS if x in available)
+    elif parser_backend not in available:
+        raise ValueError(f"Parser backend '{parser_backend}' is not installed. Available: {', '.join(available)}")
+    _parser_backend = parser_backend
+    _use_strainers = use_strainers
+    return parser_backend
+
+# The parse_*() functions below are handed off to the fetch engine's parse workers, so they take the raw page
+# content (rather than a soup object), and must only return plain picklable data.
+def make_soup(content, page_type):
+    start_time = time.perf_counter()
+    if _parser_backend == "html5lib":
+        # html5lib does its own encoding detection (which gets things wrong if the page doesn't declare one),
+        # and it always builds the whole tree, so strainers don't work with it anyway.
+        soup = BeautifulSoup(UnicodeDammit(content, is_html=True).unicode_markup, _parser_backend)
+    elif _use_strainers:
+        soup = BeautifulSoup(content, _parser_backend, parse_only=PAGE_STRAINERS[page_type])
+    else:
+        soup = BeautifulSoup(content, _parser_backend)
+    telemetry.note_parse_time(time.perf_counter() - start_time)
+    return soup
+
+def site_url(url):
+    """
+    Moves a URL on Kiranico (or a relative one) over to the configured base URL, keeping the path and query.
+    """
+    url = urllib.parse.urljoin(DEFAULT_BASE_URL + "/", url)
+    if (_base_url == DEFAULT_BASE_URL) or (not url.startswith(DEFAULT_BASE_URL + "/")):
+        return url
+    return _base_url.rstrip("/") + url[len(DEFAULT_BASE_URL):]
 
 def fwrite_json(path, data=None):
-    with open(path, encoding="utf-8", mode="w") as f:
-        f.write(json.dumps(data, sort_keys=True, indent=4))
+    # Written atomically so an interrupted run never leaves a truncated file behind.
+    html_cache.atomic_write(path, json.dumps(data, sort_keys=True, indent=4).encode("utf-8"))
     return
 
+def parse_listing_number(c):
+    m = re.search("-?[0-9]+", c.get_text())
+    return None if (m is None) else int(m.group(0))
+
 def process_string_to_identifier(s):
     s = s.strip().replace("-", " ").replace("+", "plus").split()
     m = {"I": "1", "II": "2", "III": "3", "IV": "4", "V": "5", "VI": "6"}
@@ -67,8 +177,8 @@ def process_string_to_identifier(s):
 # WEAPON SCRAPER ###############################################################
 ################################################################################
 
-def scrape_weapon_page(url, name, category, tagset):
-    soup = download(url)
+def parse_weapon_page(content):
+    soup = make_soup(content, "weapon")
 
     c = soup.find_all("dl", "grid")
     assert len(c) == 1
@@ -107,8 +217,389 @@ def scrape_weapon_page(url, name, category, tagset):
             "ramps": rampage_skills,
         }
 
-def scrape_weapon_category_page(weapon_category, url, tagset):
-    soup = download(url)
+async def scrape_weapon_page(engine, url, name, category, tagset, checkpoint_dir):
+    path = checkpoints.weapon_path(checkpoint_dir, category, url)
+    data = checkpoints.load(path)
+    if data is None:
+        record = telemetry.new_page_record(url, category, "weapon")
+        content = await engine.download(site_url(url), record=record)
+        data = await engine.parse(parse_weapon_page, content, record=record)
+        engine.telemetry.finish_page(record)
+        checkpoints.save(path, data)
+    return data
+
+def scrape_weapon_category_row(weapon_category, tagset, c2):
+    assert len(c2) == 7
+    weapon_name = c2.contents[1].contents[0].contents[0].contents[0]
+    weapon_page_url = c2.contents[1].contents[0].contents[0]["href"]
+    decos = []
+    elestat = {}
+    base_sharpness = None
+    max_sharpness = None
+
+    gunlance_stats = None
+    huntinghorn_songs = None
+    switchaxe_stats = None
+    chargeblade_stats = None
+    insectglaive_stats = None
+    bow_stats = None
+    bowgun_stats = None
+
+    num_decos = len(c2.contents[1].contents) - 1
+    assert (num_decos >= 0) and (num_decos <= 3)
+    for i in range(num_decos):
+        v2 = c2.contents[1].contents[i + 1]["src"]
+        if "deco1.png" in v2:
+            decos.append(1)
+        elif "deco2.png" in v2:
+            decos.append(2)
+        elif "deco3.png" in v2:
+            decos.append(3)
+    decos.sort(reverse=True)
+
+    if "elestat" in tagset:
+        for c3 in c2.contents[4].contents:
+            if (len(c3.contents) == 2) and (c3.contents[0].name == "svg"):
+                icon = c3.contents[0].contents[0]["src"]
+                elestat_value = int(c3.contents[1].strip())
+
+                elestat_type = None
+                if "ElementType1.png" in icon:
+                    elestat_type = "fire"
+                elif "ElementType2.png" in icon:
+                    elestat_type = "water"
+                elif "ElementType3.png" in icon:
+                    elestat_type = "thunder"
+                elif "ElementType4.png" in icon:
+                    elestat_type = "ice"
+                elif "ElementType5.png" in icon:
+                    elestat_type = "dragon"
+                elif "ElementType6.png" in icon:
+                    elestat_type = "poison"
+                elif "ElementType7.png" in icon:
+                    elestat_type = "sleep"
+                elif "ElementType8.png" in icon:
+                    elestat_type = "paralysis"
+                elif "ElementType9.png" in icon:
+                    elestat_type = "blast"
+
+                assert elestat_type is not None
+                assert elestat_value > 0
+
+                assert elestat_type not in elestat
+                elestat[elestat_type] = elestat_value
+
+    if "melee" in tagset:
+        base_sharpness = []
+        max_sharpness = []
+
+        v2a = c2.contents[5].contents[0].contents[0]
+        v2b = c2.contents[5].contents[0].contents[1]
+        assert (len(v2a) == 7) and (len(v2b) == 7) # sharpness levels
+        for c3 in v2a.contents:
+            sharpness_value = int(c3["style"][7:-28]) * 5
+            base_sharpness.append(sharpness_value)
+        for c3 in v2b.contents:
+            sharpness_value = int(c3["style"][7:-28]) * 5
+            max_sharpness.append(sharpness_value)
+
+    if weapon_category == "gunlance":
+        gunlance_stats = {}
+        special_mech_str = str(c2.contents[6].contents[0].contents[0]).strip()
+        substrs = special_mech_str.split()
+
+        gunlance_stats["shelling_type"] = process_string_to_identifier(" ".join(substrs[:-1]))
+        gunlance_stats["shelling_level"] = int(substrs[-1])
+
+    if weapon_category == "huntinghorn":
+        huntinghorn_songs = {}
+        huntinghorn_songs["x_x"] = process_string_to_identifier(str(c2.contents[6].contents[0].contents[0]))
+        huntinghorn_songs["a_a"] = process_string_to_identifier(str(c2.contents[6].contents[1].contents[0]))
+        huntinghorn_songs["xa_xa"] = process_string_to_identifier(str(c2.contents[6].contents[2].contents[0]))
+
+    if weapon_category == "switchaxe":
+        switchaxe_stats = {}
+        special_mech_str = str(c2.contents[6].contents[0].contents[0]).strip()
+
+        # We see if there's a number at the end of the string
+        substrs = special_mech_str.split()
+        phial_value = None
+        try:
+            phial_value = int(substrs[-1])
+            special_mech_str = " ".join(substrs[:-1])
+        except ValueError: # Happens if the last string isn't an int, which can happen
+            pass
+
+        switchaxe_stats["phial_type"] = process_string_to_identifier(special_mech_str)
+        switchaxe_stats["phial_value"] = phial_value
+
+    if weapon_category == "chargeblade":
+        chargeblade_stats = {}
+        chargeblade_stats["phial_type"] = process_string_to_identifier(str(c2.contents[6].contents[0].contents[0]).strip())
+
+    if weapon_category == "insectglaive":
+        insectglaive_stats = {}
+        special_mech_str = str(c2.contents[6].contents[0].contents[0]).strip()
+        assert special_mech_str[:14] == "Kinsect Level "
+        kinsect_level = int(special_mech_str[14:])
+        insectglaive_stats["kinsect_level"] = kinsect_level
+
+    if weapon_category == "bow":
+        bow_stats = {}
+
+        special_mech_1_str = str(c2.contents[5].contents[0].contents[0]).strip()
+        special_mech_2 = c2.contents[5].contents[1:]
+        special_mech_3 = c2.contents[6].contents
+
+        bow_stats["arc_shot"] = process_string_to_identifier(special_mech_1_str)
+        assert len(bow_stats["arc_shot"]) != 0
+
+        bow_stats["charge_shot"] = []
+        bow_stats["base_charge_level_limit"] = None # We calculate this in the loop
+        in_grey = False # For debugging
+        for (i, c3) in enumerate(special_mech_2):
+            if len(c3.contents) == 0:
+                continue
+
+            classes = c3.get("class", [])
+            if len(classes) == 0:
+                assert not in_grey
+                bow_stats["base_charge_level_limit"] = i + 1
+            else:
+                assert len(classes) == 1
+                in_grey = True
+
+            substrs = str(c3.contents[0]).split()
+            assert len(substrs) == 3
+            assert substrs[1] == "Level"
+            charge_shot_type_id = process_string_to_identifier(substrs[0])
+            charge_shot_level = int(substrs[2]) # Implicit check for string formatting
+            assert charge_shot_level > 0
+            bow_stats["charge_shot"].append([charge_shot_type_id, charge_shot_level])
+
+        bow_stats["compatible_coatings"] = {}
+        def read_coating(c3, expected_coating_type):
+            coating_type_id = process_string_to_identifier(expected_coating_type)
+            compatibility = None # We calculate soon
+
+            classes = c3.get("class", [])
+            if len(classes) == 0:
+                # Text is not specially formatted, so it's a regular coating
+                compatibility = 1
+            else:
+                assert len(classes) == 1
+                # Text is either formatted grey (meaning disabled), or green (meaning it's the "plus" version)
+                if classes[0] == "text-gray-400":
+                    compatibility = 0
+                elif classes[0] == "text-green-500":
+                    compatibility = 2
+                else:
+                    raise ValueError("Unexpected HTML class name.")
+
+            bow_stats["compatible_coatings"][coating_type_id] = compatibility
+
+        assert len(special_mech_3) == 7
+        read_coating(special_mech_3[0], "Close-range Coating")
+        read_coating(special_mech_3[1], "Power Coating"      )
+        read_coating(special_mech_3[2], "Poison Coating"     )
+        read_coating(special_mech_3[3], "Para Coating"       )
+        read_coating(special_mech_3[4], "Sleep Coating"      )
+        read_coating(special_mech_3[5], "Blast Coating"      )
+        read_coating(special_mech_3[6], "Exhaust Coating"    )
+
+    if weapon_category == "lightbowgun" or weapon_category == "heavybowgun":
+        bowgun_stats = {}
+
+        c3 = c2.contents[5].contents[0].contents[0]
+
+        assert len(c3) == 5 # Number of tables in c3
+        c4a = c3.contents[0]
+        c4b = c3.contents[1].contents[0]
+        c4c = c3.contents[2].contents[0]
+        c4d = c3.contents[3].contents[0]
+        c4e = c3.contents[4].contents[0]
+
+        assert len(c4a) == 3 # Number of rows
+        deviation_str = str(c4a.contents[0].contents[0]).strip()
+        recoil_str    = str(c4a.contents[1].contents[0]).strip()
+        reload_str    = str(c4a.contents[2].contents[0]).strip()
+
+        deviation_substrs = deviation_str.split()
+        if len(deviation_substrs) == 2:
+            assert deviation_substrs[0] == "Deviation"
+            assert deviation_substrs[1] == "None" # Can only be None
+            bowgun_stats["deviation"] = {
+                "severity": 0,
+                "left": False,
+                "right": False,
+            }
+        elif len(deviation_substrs) == 3:
+            assert deviation_substrs[0] == "Deviation"
+            severity = 0
+            left = False
+            right = False
+            
+            if deviation_substrs[1] == "L":
+                left = True
+            elif deviation_substrs[1] == "R":
+                right = True
+            elif deviation_substrs[1] == "LR":
+                left = True
+                right = True
+            else:
+                raise ValueError("Unexpected string")
+
+            severity = {
+                "Mild": 1,
+                "Severe": 2
+            }[deviation_substrs[2]]
+
+            bowgun_stats["deviation"] = {
+                "severity": severity,
+                "left": left,
+                "right": right,
+            }
+        else:
+            raise ValueError("Unexpected length")
+
+        recoil_substrs = recoil_str.split()
+        assert recoil_substrs[0] == "Recoil"
+        recoil_tup = tuple(recoil_substrs[1:])
+        bowgun_stats["recoil"] = {
+            #("Smallest",): 0, # Doesn't exist at base configuration
+            #("Very", "Low"): 1, # Doesn't exist at base configuration
+            #("Low",): 2, # (See the last entry...)
+            ("Some",): 3,
+            ("Average",): 4,
+            ("High",): 5,
+
+            ("Very", "Low"): 2, # Kiranico mistakenly writes "Very Low" instead of "Low".
+        }[recoil_tup]
+
+        reload_substrs = reload_str.split()
+        assert reload_substrs[0] == "Reload"
+        reload_tup = tuple(reload_substrs[1:])
+        bowgun_stats["reload"] = {
+            #("Slowest",): 0, # Doesn't exist at base configuration
+            ("Very", "Slow"): 1,
+            ("Slow",): 2,
+            ("Below", "Avg."): 3,
+            ("Average",): 4,
+            ("Above", "Avg."): 5,
+            ("Fast",): 6,
+            #("Very", "Fast"): 7, # Doesn't exist at base configuration
+            #("Fastest",): 8, # Doesn't exist at base configuration
+        }[reload_tup]
+
+        ammo_stats = bowgun_stats["ammo"] = {}
+        def parse_row(c5, expected_first_cell, expected_cols):
+            assert len(c5) == expected_cols
+            assert str(c5.contents[0].contents[0]) == expected_first_cell
+
+            ret2 = []
+            for c6 in c5.contents[1:]:
+                classes = tuple(c6.get("class", []))
+
+                if classes == tuple():
+                    available = True
+                elif classes == ("text-gray-400",):
+                    available = False
+                else:
+                    raise ValueError("Unexpected HTML classes: " + str(classes))
+
+                ammo_capacity = int(c6.contents[0])
+
+                assert ammo_capacity >= 0
+                assert ammo_capacity < 10 # Sanity check. If a new weapon comes out that exceeds this, update the check!
+                assert not (available and (ammo_capacity == 0)) # This shouldn't exist
+
+                ret2.append({"available": available, "ammo_capacity": ammo_capacity})
+            return ret2
+
+        assert len(c4b) == 6 # Number of rows
+        ammo_stats["normal"]   = parse_row(c4b.contents[0], "Nrm", 4)
+        ammo_stats["pierce"]   = parse_row(c4b.contents[1], "Prc", 4)
+        ammo_stats["spread"]   = parse_row(c4b.contents[2], "Spr", 4)
+        ammo_stats["shrapnel"] = parse_row(c4b.contents[3], "Shr", 4)
+        ammo_stats["sticky"]   = parse_row(c4b.contents[4], "Sti", 4)
+        ammo_stats["cluster"]  = parse_row(c4b.contents[5], "Clu", 4)
+
+        assert len(c4c) == 5 # Number of rows
+        ammo_stats["fire"]    = parse_row(c4c.contents[0], "Fir/P.", 3)
+        ammo_stats["water"]   = parse_row(c4c.contents[1], "Wat/P.", 3)
+        ammo_stats["thunder"] = parse_row(c4c.contents[2], "Thn/P.", 3)
+        ammo_stats["ice"]     = parse_row(c4c.contents[3], "Ice/P.", 3)
+        ammo_stats["dragon"]  = parse_row(c4c.contents[4], "Dra/P.", 3)
+
+        assert len(c4d) == 5 # Number of rows
+        ammo_stats["poison"]    = parse_row(c4d.contents[0], "Poi", 3)
+        ammo_stats["paralysis"] = parse_row(c4d.contents[1], "Par", 3)
+        ammo_stats["sleep"]     = parse_row(c4d.contents[2], "Sle", 3)
+        ammo_stats["exhaust"]   = parse_row(c4d.contents[3], "Exh", 3)
+        ammo_stats["recover"]   = parse_row(c4d.contents[4], "Rec", 3)
+
+        assert len(c4e) == 5 # Number of rows
+        ammo_stats["demon"]   = parse_row(c4e.contents[0], "Dem", 2)
+        ammo_stats["armor"]   = parse_row(c4e.contents[1], "Amr", 2)
+        ammo_stats["slicing"] = parse_row(c4e.contents[2], "Sli", 2)
+        ammo_stats["wyvern"]  = parse_row(c4e.contents[3], "Wyv", 2)
+        ammo_stats["tranq"]   = parse_row(c4e.contents[4], "Tra", 2)
+
+        # Now, we do some further processing to separate the piercing elemental ammo
+
+        def reprocess_ele_ammo(k):
+            x = ammo_stats[k]
+            assert len(x) == 2
+            ammo_stats["piercing_"+k] = [x.pop()]
+            assert len(x) == 1
+        reprocess_ele_ammo("fire")
+        reprocess_ele_ammo("water")
+        reprocess_ele_ammo("thunder")
+        reprocess_ele_ammo("ice")
+        reprocess_ele_ammo("dragon")
+
+    data = {}
+    data["name"] = str(weapon_name)
+    data["decos"] = decos
+    data["elestat"] = elestat
+    if base_sharpness is not None:
+        data["base_sharpness"] = base_sharpness
+    if max_sharpness is not None:
+        data["max_sharpness"] = max_sharpness
+    if gunlance_stats is not None:
+        data["gunlance_stats"] = gunlance_stats
+    if huntinghorn_songs is not None:
+        data["huntinghorn_songs"] = huntinghorn_songs
+    if switchaxe_stats is not None:
+        data["switchaxe_stats"] = switchaxe_stats
+    if chargeblade_stats is not None:
+        data["chargeblade_stats"] = chargeblade_stats
+    if insectglaive_stats is not None:
+        data["insectglaive_stats"] = insectglaive_stats
+    if bow_stats is not None:
+        data["bow_stats"] = bow_stats
+    if bowgun_stats is not None:
+        data["bowgun_stats"] = bowgun_stats
+
+    # Attack and affinity are also shown on the listing page. We only use these to detect changed weapons for
+    # incremental scrapes, since the weapon page itself remains the authoritative source.
+    listing_stats = {
+        "attack": parse_listing_number(c2.contents[2]),
+        "affinity": parse_listing_number(c2.contents[3]),
+    }
+
+    return (weapon_page_url, data, listing_stats)
+
+def weapon_row_unchanged(row_data, listing_stats, previous):
+    if previous is None:
+        return False
+    if any(previous.get(k) != v for (k, v) in row_data.items()):
+        return False
+    # Anything we couldn't read off the listing counts as changed, so we err on the side of refetching.
+    return all((v is not None) and (previous.get(k) == v) for (k, v) in listing_stats.items())
+
+def parse_weapon_category_page(weapon_category, tagset, content):
+    soup = make_soup(content, "weapon_category")
 
     c = soup.find_all("tbody", "bg-white")
     assert len(c) == 1
@@ -116,373 +607,69 @@ def scrape_weapon_category_page(weapon_category, url, tagset):
 
     #print(weapon_category + ": " + str(len(c.contents)) + " children.")
 
-    ret = []
-    for (table_index, c2) in enumerate(c.contents):
-        print(str(weapon_category) + " " + str(table_index) + " / " + str(len(c.contents)))
-
-        assert len(c2) == 7
-        weapon_name = c2.contents[1].contents[0].contents[0].contents[0]
-        weapon_page_url = c2.contents[1].contents[0].contents[0]["href"]
-        decos = []
-        elestat = {}
-        base_sharpness = None
-        max_sharpness = None
-
-        gunlance_stats = None
-        huntinghorn_songs = None
-        switchaxe_stats = None
-        chargeblade_stats = None
-        insectglaive_stats = None
-        bow_stats = None
-        bowgun_stats = None
-
-        num_decos = len(c2.contents[1].contents) - 1
-        assert (num_decos >= 0) and (num_decos <= 3)
-        for i in range(num_decos):
-            v2 = c2.contents[1].contents[i + 1]["src"]
-            if "deco1.png" in v2:
-                decos.append(1)
-            elif "deco2.png" in v2:
-                decos.append(2)
-            elif "deco3.png" in v2:
-                decos.append(3)
-        decos.sort(reverse=True)
-
-        if "elestat" in tagset:
-            for c3 in c2.contents[4].contents:
-                if (len(c3.contents) == 2) and (c3.contents[0].name == "svg"):
-                    icon = c3.contents[0].contents[0]["src"]
-                    elestat_value = int(c3.contents[1].strip())
-
-                    elestat_type = None
-                    if "ElementType1.png" in icon:
-                        elestat_type = "fire"
-                    elif "ElementType2.png" in icon:
-                        elestat_type = "water"
-                    elif "ElementType3.png" in icon:
-                        elestat_type = "thunder"
-                    elif "ElementType4.png" in icon:
-                        elestat_type = "ice"
-                    elif "ElementType5.png" in icon:
-                        elestat_type = "dragon"
-                    elif "ElementType6.png" in icon:
-                        elestat_type = "poison"
-                    elif "ElementType7.png" in icon:
-                        elestat_type = "sleep"
-                    elif "ElementType8.png" in icon:
-                        elestat_type = "paralysis"
-                    elif "ElementType9.png" in icon:
-                        elestat_type = "blast"
-
-                    assert elestat_type is not None
-                    assert elestat_value > 0
-
-                    assert elestat_type not in elestat
-                    elestat[elestat_type] = elestat_value
-
-        if "melee" in tagset:
-            base_sharpness = []
-            max_sharpness = []
-
-            v2a = c2.contents[5].contents[0].contents[0]
-            v2b = c2.contents[5].contents[0].contents[1]
-            assert (len(v2a) == 7) and (len(v2b) == 7) # sharpness levels
-            for c3 in v2a.contents:
-                sharpness_value = int(c3["style"][7:-28]) * 5
-                base_sharpness.append(sharpness_value)
-            for c3 in v2b.contents:
-                sharpness_value = int(c3["style"][7:-28]) * 5
-                max_sharpness.append(sharpness_value)
-
-        if weapon_category == "gunlance":
-            gunlance_stats = {}
-            special_mech_str = str(c2.contents[6].contents[0].contents[0]).strip()
-            substrs = special_mech_str.split()
-
-            gunlance_stats["shelling_type"] = process_string_to_identifier(" ".join(substrs[:-1]))
-            gunlance_stats["shelling_level"] = int(substrs[-1])
-
-        if weapon_category == "huntinghorn":
-            huntinghorn_songs = {}
-            huntinghorn_songs["x_x"] = process_string_to_identifier(str(c2.contents[6].contents[0].contents[0]))
-            huntinghorn_songs["a_a"] = process_string_to_identifier(str(c2.contents[6].contents[1].contents[0]))
-            huntinghorn_songs["xa_xa"] = process_string_to_identifier(str(c2.contents[6].contents[2].contents[0]))
-
-        if weapon_category == "switchaxe":
-            switchaxe_stats = {}
-            special_mech_str = str(c2.contents[6].contents[0].contents[0]).strip()
-
-            # We see if there's a number at the end of the string
-            substrs = special_mech_str.split()
-            phial_value = None
-            try:
-                phial_value = int(substrs[-1])
-                special_mech_str = " ".join(substrs[:-1])
-            except ValueError: # Happens if the last string isn't an int, which can happen
-                pass
-
-            switchaxe_stats["phial_type"] = process_string_to_identifier(special_mech_str)
-            switchaxe_stats["phial_value"] = phial_value
-
-        if weapon_category == "chargeblade":
-            chargeblade_stats = {}
-            chargeblade_stats["phial_type"] = process_string_to_identifier(str(c2.contents[6].contents[0].contents[0]).strip())
-
-        if weapon_category == "insectglaive":
-            insectglaive_stats = {}
-            special_mech_str = str(c2.contents[6].contents[0].contents[0]).strip()
-            assert special_mech_str[:14] == "Kinsect Level "
-            kinsect_level = int(special_mech_str[14:])
-            insectglaive_stats["kinsect_level"] = kinsect_level
-
-        if weapon_category == "bow":
-            bow_stats = {}
-
-            special_mech_1_str = str(c2.contents[5].contents[0].contents[0]).strip()
-            special_mech_2 = c2.contents[5].contents[1:]
-            special_mech_3 = c2.contents[6].contents
-
-            bow_stats["arc_shot"] = process_string_to_identifier(special_mech_1_str)
-            assert len(bow_stats["arc_shot"]) != 0
-
-            bow_stats["charge_shot"] = []
-            bow_stats["base_charge_level_limit"] = None # We calculate this in the loop
-            in_grey = False # For debugging
-            for (i, c3) in enumerate(special_mech_2):
-                if len(c3.contents) == 0:
-                    continue
-
-                classes = c3.get("class", [])
-                if len(classes) == 0:
-                    assert not in_grey
-                    bow_stats["base_charge_level_limit"] = i + 1
-                else:
-                    assert len(classes) == 1
-                    in_grey = True
-
-                substrs = str(c3.contents[0]).split()
-                assert len(substrs) == 3
-                assert substrs[1] == "Level"
-                charge_shot_type_id = process_string_to_identifier(substrs[0])
-                charge_shot_level = int(substrs[2]) # Implicit check for string formatting
-                assert charge_shot_level > 0
-                bow_stats["charge_shot"].append([charge_shot_type_id, charge_shot_level])
-
-            bow_stats["compatible_coatings"] = {}
-            def read_coating(c3, expected_coating_type):
-                coating_type_id = process_string_to_identifier(expected_coating_type)
-                compatibility = None # We calculate soon
-
-                classes = c3.get("class", [])
-                if len(classes) == 0:
-                    # Text is not specially formatted, so it's a regular coating
-                    compatibility = 1
-                else:
-                    assert len(classes) == 1
-                    # Text is either formatted grey (meaning disabled), or green (meaning it's the "plus" version)
-                    if classes[0] == "text-gray-400":
-                        compatibility = 0
-                    elif classes[0] == "text-green-500":
-                        compatibility = 2
-                    else:
-                        raise ValueError("Unexpected HTML class name.")
-
-                bow_stats["compatible_coatings"][coating_type_id] = compatibility
-
-            assert len(special_mech_3) == 7
-            read_coating(special_mech_3[0], "Close-range Coating")
-            read_coating(special_mech_3[1], "Power Coating"      )
-            read_coating(special_mech_3[2], "Poison Coating"     )
-            read_coating(special_mech_3[3], "Para Coating"       )
-            read_coating(special_mech_3[4], "Sleep Coating"      )
-            read_coating(special_mech_3[5], "Blast Coating"      )
-            read_coating(special_mech_3[6], "Exhaust Coating"    )
-
-        if weapon_category == "lightbowgun" or weapon_category == "heavybowgun":
-            bowgun_stats = {}
-
-            c3 = c2.contents[5].contents[0].contents[0]
-
-            assert len(c3) == 5 # Number of tables in c3
-            c4a = c3.contents[0]
-            c4b = c3.contents[1].contents[0]
-            c4c = c3.contents[2].contents[0]
-            c4d = c3.contents[3].contents[0]
-            c4e = c3.contents[4].contents[0]
-
-            assert len(c4a) == 3 # Number of rows
-            deviation_str = str(c4a.contents[0].contents[0]).strip()
-            recoil_str    = str(c4a.contents[1].contents[0]).strip()
-            reload_str    = str(c4a.contents[2].contents[0]).strip()
-
-            deviation_substrs = deviation_str.split()
-            if len(deviation_substrs) == 2:
-                assert deviation_substrs[0] == "Deviation"
-                assert deviation_substrs[1] == "None" # Can only be None
-                bowgun_stats["deviation"] = {
-                    "severity": 0,
-                    "left": False,
-                    "right": False,
-                }
-            elif len(deviation_substrs) == 3:
-                assert deviation_substrs[0] == "Deviation"
-                severity = 0
-                left = False
-                right = False
-                
-                if deviation_substrs[1] == "L":
-                    left = True
-                elif deviation_substrs[1] == "R":
-                    right = True
-                elif deviation_substrs[1] == "LR":
-                    left = True
-                    right = True
-                else:
-                    raise ValueError("Unexpected string")
-
-                severity = {
-                    "Mild": 1,
-                    "Severe": 2
-                }[deviation_substrs[2]]
-
-                bowgun_stats["deviation"] = {
-                    "severity": severity,
-                    "left": left,
-                    "right": right,
-                }
-            else:
-                raise ValueError("Unexpected length")
-
-            recoil_substrs = recoil_str.split()
-            assert recoil_substrs[0] == "Recoil"
-            recoil_tup = tuple(recoil_substrs[1:])
-            bowgun_stats["recoil"] = {
-                #("Smallest",): 0, # Doesn't exist at base configuration
-                #("Very", "Low"): 1, # Doesn't exist at base configuration
-                #("Low",): 2, # (See the last entry...)
-                ("Some",): 3,
-                ("Average",): 4,
-                ("High",): 5,
-
-                ("Very", "Low"): 2, # Kiranico mistakenly writes "Very Low" instead of "Low".
-            }[recoil_tup]
-
-            reload_substrs = reload_str.split()
-            assert reload_substrs[0] == "Reload"
-            reload_tup = tuple(reload_substrs[1:])
-            bowgun_stats["reload"] = {
-                #("Slowest",): 0, # Doesn't exist at base configuration
-                ("Very", "Slow"): 1,
-                ("Slow",): 2,
-                ("Below", "Avg."): 3,
-                ("Average",): 4,
-                ("Above", "Avg."): 5,
-                ("Fast",): 6,
-                #("Very", "Fast"): 7, # Doesn't exist at base configuration
-                #("Fastest",): 8, # Doesn't exist at base configuration
-            }[reload_tup]
-
-            ammo_stats = bowgun_stats["ammo"] = {}
-            def parse_row(c5, expected_first_cell, expected_cols):
-                assert len(c5) == expected_cols
-                assert str(c5.contents[0].contents[0]) == expected_first_cell
-
-                ret2 = []
-                for c6 in c5.contents[1:]:
-                    classes = tuple(c6.get("class", []))
-
-                    if classes == tuple():
-                        available = True
-                    elif classes == ("text-gray-400",):
-                        available = False
-                    else:
-                        raise ValueError("Unexpected HTML classes: " + str(classes))
-
-                    ammo_capacity = int(c6.contents[0])
-
-                    assert ammo_capacity >= 0
-                    assert ammo_capacity < 10 # Sanity check. If a new weapon comes out that exceeds this, update the check!
-                    assert not (available and (ammo_capacity == 0)) # This shouldn't exist
-
-                    ret2.append({"available": available, "ammo_capacity": ammo_capacity})
-                return ret2
-
-            assert len(c4b) == 6 # Number of rows
-            ammo_stats["normal"]   = parse_row(c4b.contents[0], "Nrm", 4)
-            ammo_stats["pierce"]   = parse_row(c4b.contents[1], "Prc", 4)
-            ammo_stats["spread"]   = parse_row(c4b.contents[2], "Spr", 4)
-            ammo_stats["shrapnel"] = parse_row(c4b.contents[3], "Shr", 4)
-            ammo_stats["sticky"]   = parse_row(c4b.contents[4], "Sti", 4)
-            ammo_stats["cluster"]  = parse_row(c4b.contents[5], "Clu", 4)
-
-            assert len(c4c) == 5 # Number of rows
-            ammo_stats["fire"]    = parse_row(c4c.contents[0], "Fir/P.", 3)
-            ammo_stats["water"]   = parse_row(c4c.contents[1], "Wat/P.", 3)
-            ammo_stats["thunder"] = parse_row(c4c.contents[2], "Thn/P.", 3)
-            ammo_stats["ice"]     = parse_row(c4c.contents[3], "Ice/P.", 3)
-            ammo_stats["dragon"]  = parse_row(c4c.contents[4], "Dra/P.", 3)
-
-            assert len(c4d) == 5 # Number of rows
-            ammo_stats["poison"]    = parse_row(c4d.contents[0], "Poi", 3)
-            ammo_stats["paralysis"] = parse_row(c4d.contents[1], "Par", 3)
-            ammo_stats["sleep"]     = parse_row(c4d.contents[2], "Sle", 3)
-            ammo_stats["exhaust"]   = parse_row(c4d.contents[3], "Exh", 3)
-            ammo_stats["recover"]   = parse_row(c4d.contents[4], "Rec", 3)
-
-            assert len(c4e) == 5 # Number of rows
-            ammo_stats["demon"]   = parse_row(c4e.contents[0], "Dem", 2)
-            ammo_stats["armor"]   = parse_row(c4e.contents[1], "Amr", 2)
-            ammo_stats["slicing"] = parse_row(c4e.contents[2], "Sli", 2)
-            ammo_stats["wyvern"]  = parse_row(c4e.contents[3], "Wyv", 2)
-            ammo_stats["tranq"]   = parse_row(c4e.contents[4], "Tra", 2)
-
-            # Now, we do some further processing to separate the piercing elemental ammo
-
-            def reprocess_ele_ammo(k):
-                x = ammo_stats[k]
-                assert len(x) == 2
-                ammo_stats["piercing_"+k] = [x.pop()]
-                assert len(x) == 1
-            reprocess_ele_ammo("fire")
-            reprocess_ele_ammo("water")
-            reprocess_ele_ammo("thunder")
-            reprocess_ele_ammo("ice")
-            reprocess_ele_ammo("dragon")
-            
-        #data = {}
-        data = scrape_weapon_page(weapon_page_url, weapon_name, weapon_category, tagset)
-
-        data["name"] = str(weapon_name)
-        data["decos"] = decos
-        data["elestat"] = elestat
-        if base_sharpness is not None:
-            data["base_sharpness"] = base_sharpness
-        if max_sharpness is not None:
-            data["max_sharpness"] = max_sharpness
-        if gunlance_stats is not None:
-            data["gunlance_stats"] = gunlance_stats
-        if huntinghorn_songs is not None:
-            data["huntinghorn_songs"] = huntinghorn_songs
-        if switchaxe_stats is not None:
-            data["switchaxe_stats"] = switchaxe_stats
-        if chargeblade_stats is not None:
-            data["chargeblade_stats"] = chargeblade_stats
-        if insectglaive_stats is not None:
-            data["insectglaive_stats"] = insectglaive_stats
-        if bow_stats is not None:
-            data["bow_stats"] = bow_stats
-        if bowgun_stats is not None:
-            data["bowgun_stats"] = bowgun_stats
-
-        ret.append(data)
-    return ret
+    return [scrape_weapon_category_row(weapon_category, tagset, c2) for c2 in c.contents]
+
+async def scrape_weapon_category_page(engine, weapon_category, url, tagset, checkpoint_dir, output,
+                                      previous_data=None):
+    ret = checkpoints.load(checkpoints.category_path(checkpoint_dir, weapon_category))
+    if ret is not None:
+        print(f"{weapon_category}: Resumed from checkpoint.")
+        for data in ret:
+            output.add_weapon(weapon_category, data)
+        output.finish_category(weapon_category, ret)
+        return
+
+    start_time = time.perf_counter()
+    record = telemetry.new_page_record(url, weapon_category, "weapon_category")
+    content = await engine.download(site_url(url), record=record)
+
+    # The listing page already carries most of the stats, so we parse all rows up-front and only the
+    # individual weapon pages (for rarity, defense and ramps) are left to be downloaded.
+    rows = await engine.parse(parse_weapon_category_page, weapon_category, tagset, content, record=record)
+    engine.telemetry.finish_page(record)
+
+    # For incremental scrapes, weapons whose listing row hasn't changed are copied from the previous data.
+    previous = {} if (previous_data is None) else {x["name"]: x for x in previous_data}
+    refetch = [
+        not weapon_row_unchanged(row_data, listing_stats, previous.get(row_data["name"]))
+        for (_, row_data, listing_stats) in rows
+    ]
+
+    async def op_weapon_page(table_index, weapon_page_url, row_data):
+        if not refetch[table_index]:
+            data = dict(previous[row_data["name"]])
+        else:
+            data = await scrape_weapon_page(engine, weapon_page_url, row_data["name"], weapon_category, tagset,
+                                            checkpoint_dir)
+            data.update(row_data)
+            print(str(weapon_category) + " " + str(table_index) + " / " + str(len(rows)))
+        output.add_weapon(weapon_category, data)
+        return data
+
+    # Weapon pages are all requested at once, and it's up to the engine's rate limiter to pace them.
+    # If one of them fails, we still let the others finish so they get checkpointed.
+    ret = await asyncio.gather(*(
+        op_weapon_page(table_index, weapon_page_url, row_data)
+        for (table_index, (weapon_page_url, row_data, _)) in enumerate(rows)
+    ), return_exceptions=True)
+    for x in ret:
+        if isinstance(x, BaseException):
+            raise x
+
+    if previous_data is not None:
+        print(f"{weapon_category}: {sum(refetch)} / {len(rows)} weapon pages refetched.")
+    checkpoints.save(checkpoints.category_path(checkpoint_dir, weapon_category), ret)
+    output.finish_category(weapon_category, ret)
+    engine.telemetry.finish_category(weapon_category, time.perf_counter() - start_time)
+    return
+
 
 ################################################################################
 # DECORATION SCRAPER ###########################################################
 ################################################################################
 
-def scrape_decos_page(url):
-    soup = download(url)
+def parse_decos_page(content):
+    soup = make_soup(content, "decos")
 
     c = soup.find_all("tbody")
     assert len(c) == 1
@@ -496,6 +683,17 @@ def scrape_decos_page(url):
         deco_name = str(c2.contents[1].contents[0].contents[0])
         ret.append({"deco_name": deco_name})
 
+    return ret
+
+async def scrape_decos_page(engine, url, checkpoint_dir):
+    path = checkpoints.decos_path(checkpoint_dir)
+    ret = checkpoints.load(path)
+    if ret is None:
+        record = telemetry.new_page_record(url, None, "decos")
+        content = await engine.download(site_url(url), record=record)
+        ret = await engine.parse(parse_decos_page, content, record=record)
+        engine.telemetry.finish_page(record)
+        checkpoints.save(path, ret)
     print(f"Discovered {len(ret)} decorations")
     return ret
 
@@ -503,37 +701,159 @@ def scrape_decos_page(url):
 # (The rest) ###################################################################
 ################################################################################
 
-def op(obj):
-    (weapon_category, weapon_category_url, tagset) = obj
-    return (weapon_category, scrape_weapon_category_page(weapon_category, weapon_category_url, tagset))
-
-def run():
+async def run_async(engine_kwargs, incremental, checkpoint_dir, resume, output_dir, output_format):
     try:
-        os.makedirs("downloaded_data")
+        os.makedirs(output_dir)
     except FileExistsError:
         pass
-    #######################
-    # STEP 1: Decorations #
-    #######################
-    deco_data = scrape_decos_page("https://mhrise.kiranico.com/pt-BR/data/decorations")
-    fwrite_json("downloaded_data/downloaded_data_decorations.json", data=deco_data)
-    print("----------------------\n")
-
-    ###################
-    # STEP 2: Weapons #
-    ###################
-    ## comentado para ver se o codigo de baixo funciona
-    #with mp.Pool(len(WEAPON_URLS)) as pool:
-    #    result = pool.map(op, WEAPON_URLS)
-    with mp.Pool(min(len(WEAPON_URLS), 14)) as pool:
-        result = pool.map(op, WEAPON_URLS)
-
-        data = {}
-        for (weapon_category, obj) in result:
-            data[weapon_category] = obj
-        fwrite_json("downloaded_data/downloaded_data.json", data=data)
+
+    if not resume:
+        checkpoints.clear(checkpoint_dir)
+
+    previous_data = {}
+    if incremental:
+        # Previous data is read from the same layout we're about to write.
+        previous_path = os.path.join(output_dir, scrape_output.OUTPUT_PATHS[output_format])
+        reader = scrape_output.open_reader(previous_path)
+        for (weapon_category, _, _) in WEAPON_URLS:
+            try:
+                previous_data[weapon_category] = reader[weapon_category]
+            except (FileNotFoundError, KeyError):
+                print(f"{weapon_category}: No previous data found in {previous_path}. Falling back to a full scrape.")
+
+    output = scrape_output.open_writer(output_format, output_dir)
+    with fetch_engine.FetchEngine(**engine_kwargs) as engine:
+        #######################
+        # STEP 1: Decorations #
+        #######################
+        deco_data = await scrape_decos_page(engine, DECOS_URL, checkpoint_dir)
+        fwrite_json(os.path.join(output_dir, "downloaded_data_decorations.json"), data=deco_data)
+        print("----------------------\n")
+
+        ###################
+        # STEP 2: Weapons #
+        ###################
+        # All categories are scraped at the same time. The engine's rate limiter is shared by all of them.
+        # A failed category doesn't stop the others, so everything else still gets checkpointed.
+        result = await asyncio.gather(*(
+            scrape_weapon_category_page(engine, weapon_category, url, tagset, checkpoint_dir, output,
+                                        previous_data.get(weapon_category))
+            for (weapon_category, url, tagset) in WEAPON_URLS
+        ), return_exceptions=True)
+
+        failed = []
+        for ((weapon_category, _, _), obj) in zip(WEAPON_URLS, result):
+            if isinstance(obj, BaseException):
+                failed.append(weapon_category)
+                print(f"\n{weapon_category} failed:", file=sys.stderr)
+                traceback.print_exception(type(obj), obj, obj.__traceback__)
+        output.close(finished=(len(failed) == 0))
+
+        print("----------------------\n")
+        print("Connections: " + http_session.stats.summary_str())
+        print("Cache: " + html_cache.stats.summary_str())
+        print("Checkpoints: " + checkpoints.stats.summary_str())
+        print(f"Throttled: {engine.throttled} responses asked us to back off.")
+        print()
+        print("Telemetry: " + engine.telemetry.summary_str())
+
+    if len(failed) > 0:
+        raise RuntimeError(f"Failed to scrape: {', '.join(failed)}. "
+                           "Finished work has been checkpointed, so rerun with --resume to pick up from here.")
+
+    checkpoints.clear(checkpoint_dir)
+    return
+
+def run(
+    cache_dir=html_cache.DEFAULT_CACHE_DIR,
+    offline=False,
+    incremental=False,
+    requests_per_second=fetch_engine.DEFAULT_REQUESTS_PER_SECOND,
+    max_concurrency=fetch_engine.DEFAULT_MAX_CONCURRENCY,
+    parser_backend="auto",
+    checkpoint_dir=checkpoints.DEFAULT_CHECKPOINT_DIR,
+    resume=False,
+    output_dir=DEFAULT_OUTPUT_DIR,
+    output_format="json",
+    base_url=DEFAULT_BASE_URL,
+    record_path=None,
+    telemetry_log_path=telemetry.DEFAULT_LOG_PATH,
+):
+    global _base_url
+    if (record_path is not None) and (resume or incremental):
+        raise ValueError("Recording needs every page to be downloaded, so it can't be combined with "
+                         "--resume or --incremental.")
+    _base_url = base_url
+
+    parser_backend = configure_parsing(parser_backend)
+    print(f"Using HTML parser backend: {parser_backend}")
+
+    engine_kwargs = {
+        "requests_per_second": requests_per_second,
+        "max_concurrency": max_concurrency,
+        "parse_initializer": configure_parsing,
+        "parse_initargs": (parser_backend,),
+        "cache_dir": cache_dir,
+        "offline": offline,
+    }
+    with telemetry.Telemetry(telemetry_log_path) as t:
+        engine_kwargs["telemetry"] = t
+        if record_path is None:
+            asyncio.run(run_async(engine_kwargs, incremental, checkpoint_dir, resume, output_dir, output_format))
+        else:
+            # The archive is only saved if the whole scrape succeeds.
+            with fixture_archive.Recorder(record_path) as recorder:
+                engine_kwargs["recorder"] = recorder
+                asyncio.run(run_async(engine_kwargs, incremental, checkpoint_dir, resume, output_dir, output_format))
+            print(f"Recorded every response to {record_path}")
+    return
+
+def main():
+    parser = argparse.ArgumentParser(description="Scrape weapon and decoration data from Kiranico.")
+    parser.add_argument("--cache-dir", default=html_cache.DEFAULT_CACHE_DIR,
+                        help="Directory of the on-disk page cache.")
+    parser.add_argument("--offline", action="store_true",
+                        help="Don't make any requests. Every page is read from the cache instead.")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only download the pages of weapons that are new or changed since the last scrape.")
+    parser.add_argument("--requests-per-second", type=float, default=fetch_engine.DEFAULT_REQUESTS_PER_SECOND,
+                        help="Sustained request rate limit.")
+    parser.add_argument("--max-concurrency", type=int, default=fetch_engine.DEFAULT_MAX_CONCURRENCY,
+                        help="Maximum number of requests in flight at any one time.")
+    parser.add_argument("--parser", default="auto", choices=["auto"] + [k for (k, _) in PARSER_BACKENDS],
+                        help="HTML parser backend. 'auto' picks the fastest one installed.")
+    parser.add_argument("--checkpoint-dir", default=checkpoints.DEFAULT_CHECKPOINT_DIR,
+                        help="Directory to keep checkpoints in while scraping.")
+    parser.add_argument("--resume", action="store_true",
+                        help="Pick up from the checkpoints left behind by a failed scrape.")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR,
+                        help="Directory to write the scraped data to.")
+    parser.add_argument("--output-format", default="json", choices=scrape_output.OUTPUT_FORMATS,
+                        help="Layout of the weapon data written to the output directory.")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL,
+                        help="Scrape this host instead of Kiranico, e.g. a mock_kiranico_server.py instance.")
+    parser.add_argument("--record", metavar="ARCHIVE", default=None,
+                        help="Record every response into this fixture archive (a .zip file).")
+    parser.add_argument("--telemetry-log", default=telemetry.DEFAULT_LOG_PATH,
+                        help="JSON Lines file to log per-page timings to.")
+    args = parser.parse_args()
+    run(
+        cache_dir=args.cache_dir,
+        offline=args.offline,
+        incremental=args.incremental,
+        requests_per_second=args.requests_per_second,
+        max_concurrency=args.max_concurrency,
+        parser_backend=args.parser,
+        checkpoint_dir=args.checkpoint_dir,
+        resume=args.resume,
+        output_dir=args.output_dir,
+        output_format=args.output_format,
+        base_url=args.base_url,
+        record_path=args.record,
+        telemetry_log_path=args.telemetry_log,
+    )
     return
 
 if __name__ == '__main__':
-    run()
+    main()
 
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+"""
+Filename: mock_kiranico_server.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Local stand-in for <https://mhrise.kiranico.com/> that replays a fixture archive recorded with
+`kiranico_scrape.py --record`.
+
+The server can add latency to every response, and can throttle clients with 429 Too Many Requests (either past a
+request rate limit, or at random). Conditional requests and gzip are supported so that the scraper's page cache and
+content decoding get exercised too.
+
+Usage:
+    python3 -m dev_scripts.mhrb.kiranico_scrape.mock_kiranico_server fixtures.zip \\
+        --port 8000 --latency 0.05 --rate-limit 20
+
+Then point the scraper at it:
+    python3 -m dev_scripts.mhrb.kiranico_scrape.kiranico_scrape --base-url http://127.0.0.1:8000
+"""
+
+import sys
+import gzip
+import time
+import random
+import hashlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from . import fixture_archive
+
+class ServerStats:
+    def __init__(self, served=0, not_modified=0, throttled=0, missing=0):
+        self.served = served             # Full responses
+        self.not_modified = not_modified # 304 responses
+        self.throttled = throttled       # 429 responses
+        self.missing = missing           # 404 responses (i.e. not in the archive)
+        self._lock = threading.Lock()
+
+    def record(self, field):
+        with self._lock:
+            setattr(self, field, getattr(self, field) + 1)
+
+    def snapshot(self):
+        with self._lock:
+            return {"served": self.served, "not_modified": self.not_modified, "throttled": self.throttled,
+                    "missing": self.missing}
+
+    def summary_str(self):
+        return (f"{self.served} served, {self.not_modified} not modified, {self.throttled} throttled, "
+                f"{self.missing} not found")
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket. Unlike fetch_engine.TokenBucket, requests over the limit are rejected rather than
+    delayed.
+    """
+    def __init__(self, rate):
+        self.rate = rate
+        self._tokens = rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.rate, self._tokens + ((now - self._updated) * self.rate))
+            self._updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1" # Needed for keep-alive
+
+    def log_message(self, format, *args):
+        if self.server.mock.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, headers, body=b""):
+        self.send_response(status)
+        for (k, v) in headers.items():
+            self.send_header(k, v)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+        return
+
+    def do_GET(self):
+        mock = self.server.mock
+        if mock.latency > 0 or mock.jitter > 0:
+            time.sleep(max(mock.latency + random.uniform(-mock.jitter, mock.jitter), 0.0))
+
+        throttled = (mock.rate_limiter is not None) and (not mock.rate_limiter.try_acquire())
+        throttled = throttled or (random.random() < mock.throttle_probability)
+        if throttled:
+            mock.stats.record("throttled")
+            self._send(429, {"Retry-After": str(mock.retry_after)})
+            return
+
+        response = mock.lookup(self.path)
+        if response is None:
+            mock.stats.record("missing")
+            self._send(404, {"Content-Type": "text/plain"}, b"Not in the fixture archive.")
+            return
+        (status, headers, body, compressed_body) = response
+
+        if self.headers.get("If-None-Match") == headers["ETag"]:
+            mock.stats.record("not_modified")
+            self._send(304, {"ETag": headers["ETag"]})
+            return
+
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            headers["Content-Encoding"] = "gzip"
+            body = compressed_body
+        mock.stats.record("served")
+        self._send(status, headers, body)
+        return
+
+    do_HEAD = do_GET
+
+class MockServer:
+    def __init__(self, archive, *, host="127.0.0.1", port=0, latency=0.0, jitter=0.0, rate_limit=None,
+                 throttle_probability=0.0, retry_after=1, verbose=False):
+        self.archive = archive
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limiter = None if (rate_limit is None) else _RateLimiter(rate_limit)
+        self.throttle_probability = throttle_probability
+        self.retry_after = retry_after
+        self.verbose = verbose
+
+        self.stats = ServerStats()
+        self._prepared = {} # {path: (status, headers, body, gzipped body)}
+        self._prepared_lock = threading.Lock()
+
+        self._httpd = ThreadingHTTPServer((host, port), _Handler)
+        self._httpd.daemon_threads = True
+        self._httpd.mock = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        (host, port) = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def lookup(self, path):
+        with self._prepared_lock:
+            if path not in self._prepared:
+                response = self.archive.lookup(path)
+                if response is None:
+                    return None
+                (status, headers, body) = response
+                # Archives recorded from a server that doesn't send ETags still get one, so the scraper's
+                # conditional requests can be tested.
+                headers.setdefault("ETag", '"' + hashlib.sha256(body).hexdigest()[:32] + '"')
+                self._prepared[path] = (status, headers, body, gzip.compress(body))
+            (status, headers, body, compressed_body) = self._prepared[path]
+        return (status, dict(headers), body, compressed_body)
+
+    def start(self):
+        """
+        Serves requests on a background thread.
+        """
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return
+
+    def serve_forever(self):
+        self._httpd.serve_forever()
+        return
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        return
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a fixture archive as a stand-in for Kiranico.")
+    parser.add_argument("archive",
+                        help="Fixture archive, as recorded by kiranico_scrape.py --record.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0,
+                        help="Seconds to wait before every response.")
+    parser.add_argument("--jitter", type=float, default=0.0,
+                        help="Random variation (+/- seconds) added to the latency.")
+    parser.add_argument("--rate-limit", type=float, default=None,
+                        help="Requests per second beyond which clients get 429 Too Many Requests.")
+    parser.add_argument("--throttle-probability", type=float, default=0.0,
+                        help="Chance of answering any request with 429 Too Many Requests.")
+    parser.add_argument("--retry-after", type=int, default=1,
+                        help="Retry-After value (in seconds) sent with 429 responses.")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Log every request.")
+    args = parser.parse_args()
+
+    archive = fixture_archive.Archive(args.archive)
+    server = MockServer(
+        archive,
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit,
+        throttle_probability=args.throttle_probability,
+        retry_after=args.retry_after,
+        verbose=args.verbose,
+    )
+    print(f"Serving {len(archive)} recorded responses at {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    print("\n" + server.stats.summary_str())
+    return
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,20 @@ Author:   simshadows <contact@simshadows.com>
 
 This script was built to parse the downloaded Kiranico data, as downloaded by kiranico_scrape.py.
 
+Any of kiranico_scrape.py's output layouts can be read (see scrape_output.py). Pass the output path with `--input`.
+With `--follow`, this script can be started while kiranico_scrape.py is still writing shards or JSON Lines, and
+each category is processed as soon as it's been scraped.
+
+This module can also be imported. process() runs every stage in memory and returns the same structures that get
+written to the weapons_*.json files, and each stage is also available on its own:
+
+    STAGE 1   build_data_spec()              Reprocess the hardcoded part.
+    STAGE 2   read_input()                   Read the input.
+    STAGE 3   resolve_ramp_inheritance()     Process rampage skill inheritance.
+    STAGE 4   reorder_to_spec()              Rearrange to match spec ordering.
+    STAGE 5   to_output_structures()         Convert to the output format.
+              render_category()              Produce the output file contents.
+
 !!!!!!!!!!!!!!!!!!!!!!
 !!!!!!!! NOTE !!!!!!!!
 !!!!!!!!!!!!!!!!!!!!!!
@@ -25,26 +39,33 @@ Known duplicates:
 import os
 import re
 import json
+import argparse
 from itertools import chain, zip_longest
 from collections import defaultdict, OrderedDict
 
-from hardcoded_data.greatsword     import HARDCODED_GS_SPEC
-from hardcoded_data.longsword      import HARDCODED_LS_SPEC
-from hardcoded_data.swordandshield import HARDCODED_SNS_SPEC
-from hardcoded_data.dualblades     import HARDCODED_DB_SPEC
-from hardcoded_data.lance          import HARDCODED_L_SPEC
-from hardcoded_data.gunlance       import HARDCODED_GL_SPEC
-from hardcoded_data.hammer         import HARDCODED_H_SPEC
-from hardcoded_data.huntinghorn    import HARDCODED_HH_SPEC
-from hardcoded_data.switchaxe      import HARDCODED_SA_SPEC
-from hardcoded_data.chargeblade    import HARDCODED_CB_SPEC
-from hardcoded_data.insectglaive   import HARDCODED_IG_SPEC
-from hardcoded_data.lightbowgun    import HARDCODED_LBG_SPEC
-from hardcoded_data.heavybowgun    import HARDCODED_HBG_SPEC
-from hardcoded_data.bow            import HARDCODED_B_SPEC
+from .hardcoded_data.greatsword     import HARDCODED_GS_SPEC
+from .hardcoded_data.longsword      import HARDCODED_LS_SPEC
+from .hardcoded_data.swordandshield import HARDCODED_SNS_SPEC
+from .hardcoded_data.dualblades     import HARDCODED_DB_SPEC
+from .hardcoded_data.lance          import HARDCODED_L_SPEC
+from .hardcoded_data.gunlance       import HARDCODED_GL_SPEC
+from .hardcoded_data.hammer         import HARDCODED_H_SPEC
+from .hardcoded_data.huntinghorn    import HARDCODED_HH_SPEC
+from .hardcoded_data.switchaxe      import HARDCODED_SA_SPEC
+from .hardcoded_data.chargeblade    import HARDCODED_CB_SPEC
+from .hardcoded_data.insectglaive   import HARDCODED_IG_SPEC
+from .hardcoded_data.lightbowgun    import HARDCODED_LBG_SPEC
+from .hardcoded_data.heavybowgun    import HARDCODED_HBG_SPEC
+from .hardcoded_data.bow            import HARDCODED_B_SPEC
+
+from . import scrape_output
+from . import upgrade_trees
+
+# Shared with the code generator
+from ..common import output_files
 
 DATABASE_DIR = "../../data/"
-SRC_FILE_PATH = "./downloaded_data/downloaded_data.json"
+SRC_FILE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "downloaded_data/downloaded_data.json")
 
 # Specification to build the data
 # {category: [(tree name, [(name, id, rarity), ...]), ...]}
@@ -71,133 +92,157 @@ module_dir_abs = os.path.dirname(os.path.abspath(__file__))
 # STAGE 1: Reprocess the hardcoded part
 #
 
-data_spec = {}
+def build_data_spec(specs):
+    """
+    Returns {category: {weapon name: {id, parent_id, tree_name, endline_tag, tagset}, ...}, ...}
+    """
+    data_spec = {}
+
+    for (weapon_category, (weapon_trees, tagset)) in specs.items():
+        submap = data_spec[weapon_category] = {}
+        ids_seen = set()
+        for (tree_name, base_parent_weapon_id, weapons_array) in weapon_trees:
+            curr_parent_weapon_id = base_parent_weapon_id
+            for (i, (weapon_name, weapon_id)) in enumerate(weapons_array):
 
-for (weapon_category, (weapon_trees, tagset)) in DATA_SPEC_HARDCODED.items():
-    submap = data_spec[weapon_category] = {}
-    ids_seen = set()
-    for (tree_name, base_parent_weapon_id, weapons_array) in weapon_trees:
-        curr_parent_weapon_id = base_parent_weapon_id
-        for (i, (weapon_name, weapon_id)) in enumerate(weapons_array):
+                if weapon_id in ids_seen:
+                    raise ValueError("IDs must be unique within each weapon category. Bad ID: " + weapon_id)
+                ids_seen.add(weapon_id)
 
-            if weapon_id in ids_seen:
-                raise ValueError("IDs must be unique within each weapon category. Bad ID: " + weapon_id)
-            ids_seen.add(weapon_id)
+                submap[weapon_name] = {
+                        "id":        weapon_id,
+                        "parent_id": curr_parent_weapon_id,
+                        "tree_name": tree_name,
+                        "endline_tag": ("hr" if (i == (len(weapons_array) - 1)) else ""),
+                        "tagset": tagset,
+                    }
 
-            submap[weapon_name] = {
-                    "id":        weapon_id,
-                    "parent_id": curr_parent_weapon_id,
-                    "tree_name": tree_name,
-                    "endline_tag": ("hr" if (i == (len(weapons_array) - 1)) else ""),
-                    "tagset": tagset,
-                }
+                curr_parent_weapon_id = weapon_id
 
-            curr_parent_weapon_id = weapon_id
+    return data_spec
 
 #
 # STAGE 2: Read the input
 #
 
-# {category: {tree name: {id: {weapon data}, ...}, ...}, ...}
-data = defaultdict(lambda : defaultdict(dict))
-
-# {category: {id: {weapon data}, ...}, ...}
-# This one will be used for graph traversal.
-# Usefully, it also helps us check for duplicates.
-data_flat_per_category = defaultdict(dict)
-
-raw_data = None
-with open(SRC_FILE_PATH, encoding="utf-8", mode="r") as f:
-    raw_data = json.loads(f.read())
-
-for (weapon_category, spec_subdict) in data_spec.items():
-    raw_sublist = raw_data[weapon_category]
-
-    for obj in raw_sublist:
-
-            name = obj["name"]
-
-            if name not in spec_subdict:
-                raise ValueError(f"Weapon {name} ({weapon_category}) present in data file, but not in the hardcoded spec.")
-
-            weapon_id = spec_subdict[name]["id"]
-            rarity = obj["rarity"]
-            tree_name = spec_subdict[name]["tree_name"]
-            endline_tag = spec_subdict[name]["endline_tag"]
-
-            d = {
-                    "id":          weapon_id, # This is here for convenience
-                    "parent_id":   spec_subdict[name]["parent_id"],
-                    "rarity":      rarity,
-                    "endline_tag": endline_tag,
-
-                    "name":       name,
-                    "attack":     int(obj["attack"]),
-                    "affinity":   int(obj["affinity"]),
-                    "defense":    int(obj["defense"]),
-                    "deco_slots": obj["decos"],
-                    "elestat":    obj["elestat"],
-
-                    "ramp_skills": [x for x in obj["ramps"] if (len(x) > 0)], # Filter out empty ramp option lists
-                }
-            if "melee" in spec_subdict[name]["tagset"]:
-                d["base_sharpness"] = obj["base_sharpness"][:-1] # Remove the last sharpness level
-                d["max_sharpness"] = obj["max_sharpness"][:-1] # Remove the last sharpness level
-            if weapon_category == "gunlance":
-                d["gunlance_stats"] = obj["gunlance_stats"]
-            if weapon_category == "huntinghorn":
-                d["huntinghorn_songs"] = obj["huntinghorn_songs"]
-            if weapon_category == "switchaxe":
-                d["switchaxe_stats"] = obj["switchaxe_stats"]
-            if weapon_category == "chargeblade":
-                d["chargeblade_stats"] = obj["chargeblade_stats"]
-            if weapon_category == "insectglaive":
-                d["insectglaive_stats"] = obj["insectglaive_stats"]
-            if weapon_category == "bow":
-                d["bow_stats"] = obj["bow_stats"]
-            if (weapon_category == "lightbowgun") or (weapon_category == "heavybowgun"):
-                d["bowgun_stats"] = obj["bowgun_stats"]
-
-            data[weapon_category][tree_name][weapon_id] = d
-
-            if weapon_id in data_flat_per_category[weapon_category]:
-                raise ValueError(f"Duplicate weapon ID: {weapon_id}")
-            data_flat_per_category[weapon_category][weapon_id] = d
+def read_input(raw_data, data_spec):
+    """
+    raw_data only needs to support raw_data[category], so a scrape_output reader works too. Categories are only read
+    as we get to them, so this works for scrape output that's still being written.
+
+    Returns (data, data_flat_per_category):
+        data: {category: {tree name: {id: {weapon data}, ...}, ...}, ...}
+        data_flat_per_category: {category: {id: {weapon data}, ...}, ...}
+    """
+    data = defaultdict(lambda : defaultdict(dict))
+
+    # This one will be used for graph traversal.
+    # Usefully, it also helps us check for duplicates.
+    data_flat_per_category = defaultdict(dict)
+
+    for (weapon_category, spec_subdict) in data_spec.items():
+        raw_sublist = raw_data[weapon_category]
+
+        for obj in raw_sublist:
+
+                name = obj["name"]
+
+                if name not in spec_subdict:
+                    raise ValueError(f"Weapon {name} ({weapon_category}) present in data file, but not in the hardcoded spec.")
+
+                weapon_id = spec_subdict[name]["id"]
+                rarity = obj["rarity"]
+                tree_name = spec_subdict[name]["tree_name"]
+                endline_tag = spec_subdict[name]["endline_tag"]
+
+                d = {
+                        "id":          weapon_id, # This is here for convenience
+                        "parent_id":   spec_subdict[name]["parent_id"],
+                        "rarity":      rarity,
+                        "endline_tag": endline_tag,
+
+                        "name":       name,
+                        "attack":     int(obj["attack"]),
+                        "affinity":   int(obj["affinity"]),
+                        "defense":    int(obj["defense"]),
+                        "deco_slots": obj["decos"],
+                        "elestat":    obj["elestat"],
+
+                        "ramp_skills": [x for x in obj["ramps"] if (len(x) > 0)], # Filter out empty ramp option lists
+                    }
+                if "melee" in spec_subdict[name]["tagset"]:
+                    d["base_sharpness"] = obj["base_sharpness"][:-1] # Remove the last sharpness level
+                    d["max_sharpness"] = obj["max_sharpness"][:-1] # Remove the last sharpness level
+                if weapon_category == "gunlance":
+                    d["gunlance_stats"] = obj["gunlance_stats"]
+                if weapon_category == "huntinghorn":
+                    d["huntinghorn_songs"] = obj["huntinghorn_songs"]
+                if weapon_category == "switchaxe":
+                    d["switchaxe_stats"] = obj["switchaxe_stats"]
+                if weapon_category == "chargeblade":
+                    d["chargeblade_stats"] = obj["chargeblade_stats"]
+                if weapon_category == "insectglaive":
+                    d["insectglaive_stats"] = obj["insectglaive_stats"]
+                if weapon_category == "bow":
+                    d["bow_stats"] = obj["bow_stats"]
+                if (weapon_category == "lightbowgun") or (weapon_category == "heavybowgun"):
+                    d["bowgun_stats"] = obj["bowgun_stats"]
+
+                data[weapon_category][tree_name][weapon_id] = d
+
+                if weapon_id in data_flat_per_category[weapon_category]:
+                    raise ValueError(f"Duplicate weapon ID: {weapon_id}")
+                data_flat_per_category[weapon_category][weapon_id] = d
+
+    return (data, data_flat_per_category)
 
 #
 # STAGE 3: Process rampage skill inheritance
 #
 
-for (weapon_category, category_data) in data_flat_per_category.items():
-    for (weapon_id, weapon_data) in category_data.items():
-
-        if not all(all(isinstance(y, str) for y in x) for x in weapon_data["ramp_skills"]):
-            raise TypeError("Expected strings.")
-
-        ramp_skills = [[(y, "") for y in x] for x in weapon_data["ramp_skills"]] # Pre-fill with native ramp skills
-        ramp_skills_seen = [set(x) for x in weapon_data["ramp_skills"]]
-
-        def traverse(d):
-            if d["parent_id"] == None:
-                return # No parent
-            d = category_data[d["parent_id"]] # Move up to parent
-
-            if len(d["ramp_skills"]) != len(ramp_skills):
-                raise Exception("Not allowed for children to have different number of rampage skill slots (for now).")
-
-            for (i, ramp_slot_options) in enumerate(d["ramp_skills"]):
-                for ramp_skill_id in ramp_slot_options:
-
-                    if ramp_skill_id in ramp_skills_seen[i]:
-                        continue
-
-                    ramp_skills[i].append((ramp_skill_id, d["id"]))
-                    ramp_skills_seen[i].add(ramp_skill_id)
-            traverse(d)
-
-        traverse(weapon_data)
-
-        weapon_data["ramp_skills_including_inheritance"] = ramp_skills # Add new field
+def _inherit_ramp_skills(weapon_data, parent_data):
+    """
+    Returns the weapon's rampage skills including inheritance, as [[(ramp skill id, inherited from weapon id), ...], ...].
+    Native rampage skills come first (with "" instead of a weapon id), then everything new from the parent's list,
+    which already goes in the same order up the tree. parent_data must already be resolved.
+    """
+    if not all(all(isinstance(y, str) for y in x) for x in weapon_data["ramp_skills"]):
+        raise TypeError("Expected strings.")
+
+    ramp_skills = [[(y, "") for y in x] for x in weapon_data["ramp_skills"]] # Pre-fill with native ramp skills
+    if parent_data is None:
+        return ramp_skills # No parent
+
+    parent_ramp_skills = parent_data["ramp_skills_including_inheritance"]
+    if len(parent_ramp_skills) != len(ramp_skills):
+        raise Exception("Not allowed for children to have different number of rampage skill slots (for now).")
+
+    for (i, parent_slot) in enumerate(parent_ramp_skills):
+        seen = set(weapon_data["ramp_skills"][i])
+        for (ramp_skill_id, inherited_from) in parent_slot:
+            if ramp_skill_id not in seen:
+                ramp_skills[i].append((ramp_skill_id, inherited_from or parent_data["id"]))
+    return ramp_skills
+
+def resolve_ramp_inheritance(data_flat_per_category):
+    """
+    Adds the "ramp_skills_including_inheritance" field to every weapon, in-place.
+
+    Weapons are resolved parents-first, so each one only needs to look at its parent.
+    """
+    for (weapon_category, category_data) in data_flat_per_category.items():
+        parent_ids = {k: v["parent_id"] for (k, v) in category_data.items()}
+
+        def resolve_weapon(weapon_id, parent_data):
+            weapon_data = category_data[weapon_id]
+            weapon_data["ramp_skills_including_inheritance"] = _inherit_ramp_skills(weapon_data, parent_data) # Add new field
+            return weapon_data
+
+        try:
+            upgrade_trees.resolve(parent_ids, resolve_weapon)
+        except ValueError as e:
+            raise ValueError(f"Bad {weapon_category} upgrade tree. {e}")
+    return
 
 #
 # STAGE 4: Rearrange to match spec ordering.
@@ -206,38 +251,138 @@ for (weapon_category, category_data) in data_flat_per_category.items():
 #          Also, we unicode-encode strings here.
 #
 
-# {category: {tree name: {id: {weapon data}, ...}, ...}, ...}
-tmp_data = {}
-for (weapon_category, (category_spec, _)) in DATA_SPEC_HARDCODED.items():
-    submap = tmp_data[weapon_category] = OrderedDict()
-    for (tree_name, _, tree_data) in category_spec:
+def reorder_to_spec(data, specs):
+    """
+    Returns {category: {tree name: {id: {weapon data}, ...}, ...}, ...}, in spec order.
+    """
+    tmp_data = {}
+    for (weapon_category, (category_spec, _)) in specs.items():
+        submap = tmp_data[weapon_category] = OrderedDict()
+        for (tree_name, _, tree_data) in category_spec:
 
-        if tree_name in submap:
-            raise ValueError("Duplicate tree name: " + weapon_category + " " + tree_name)
+            if tree_name in submap:
+                raise ValueError("Duplicate tree name: " + weapon_category + " " + tree_name)
 
-        subsubmap = submap[tree_name] = OrderedDict()
-        submap.move_to_end(tree_name, last=True)
-        for (weapon_name, weapon_id) in tree_data:
+            subsubmap = submap[tree_name] = OrderedDict()
+            submap.move_to_end(tree_name, last=True)
+            for (weapon_name, weapon_id) in tree_data:
 
-            if weapon_id in subsubmap:
-                raise ValueError("Duplicate weapon id: " + weapon_category + " " + tree_name + " " + weapon_id)
+                if weapon_id in subsubmap:
+                    raise ValueError("Duplicate weapon id: " + weapon_category + " " + tree_name + " " + weapon_id)
 
-            try:
-                subsubmap[weapon_id] = data[weapon_category][tree_name][weapon_id] # Throws exception if data is missing
-            except KeyError:
-                raise KeyError("Missing in data: " + weapon_category + " " + tree_name + " " + weapon_name + " " + weapon_id)
-            subsubmap.move_to_end(weapon_id, last=True)
+                try:
+                    subsubmap[weapon_id] = data[weapon_category][tree_name][weapon_id] # Throws exception if data is missing
+                except KeyError:
+                    raise KeyError("Missing in data: " + weapon_category + " " + tree_name + " " + weapon_name + " " + weapon_id)
+                subsubmap.move_to_end(weapon_id, last=True)
 
-            if subsubmap[weapon_id]["name"] != weapon_name:
-                raise ValueError("Something went wrong here.")
+                if subsubmap[weapon_id]["name"] != weapon_name:
+                    raise ValueError("Something went wrong here.")
 
-            subsubmap[weapon_id]["name"] = subsubmap[weapon_id]["name"]
-data = tmp_data
+                subsubmap[weapon_id]["name"] = subsubmap[weapon_id]["name"]
+    return tmp_data
 
 #
 # STAGE 5: Produce Output
 #
 
+def _to_output_weapon(weapon_data):
+    ret = {
+        "rarity": weapon_data["rarity"],
+        "endlineTag": weapon_data["endline_tag"],
+
+        "name": weapon_data["name"],
+        "attack": weapon_data["attack"],
+        "affinity": weapon_data["affinity"],
+        "defense": weapon_data["defense"],
+        "decoSlots": list(weapon_data["deco_slots"]),
+        "eleStat": dict(weapon_data["elestat"]),
+
+        "rampSkills": [[list(x) for x in slot] for slot in weapon_data["ramp_skills_including_inheritance"]],
+    }
+
+    if "max_sharpness" in weapon_data:
+        ret["baseSharpness"] = list(weapon_data["base_sharpness"])
+        ret["maxSharpness"] = list(weapon_data["max_sharpness"])
+
+    if "gunlance_stats" in weapon_data:
+        ret["gunlanceStats"] = {
+            "shellingType": weapon_data["gunlance_stats"]["shelling_type"],
+            "shellingLevel": weapon_data["gunlance_stats"]["shelling_level"],
+        }
+
+    if "huntinghorn_songs" in weapon_data:
+        ret["huntinghornSongs"] = dict(weapon_data["huntinghorn_songs"])
+
+    if "switchaxe_stats" in weapon_data:
+        ret["switchaxeStats"] = {
+            "phialType": weapon_data["switchaxe_stats"]["phial_type"],
+            "phialValue": weapon_data["switchaxe_stats"]["phial_value"],
+        }
+
+    if "chargeblade_stats" in weapon_data:
+        ret["chargebladeStats"] = {
+            "phialType": weapon_data["chargeblade_stats"]["phial_type"],
+        }
+
+    if "insectglaive_stats" in weapon_data:
+        ret["insectglaiveStats"] = {
+            "kinsectLevel": weapon_data["insectglaive_stats"]["kinsect_level"],
+        }
+
+    if "bow_stats" in weapon_data:
+        ret["bowStats"] = {
+            "arcShot": weapon_data["bow_stats"]["arc_shot"],
+            "baseChargeLevelLimit": weapon_data["bow_stats"]["base_charge_level_limit"],
+            "chargeShot": [list(x) for x in weapon_data["bow_stats"]["charge_shot"]],
+            "compatibleCoatings": dict(weapon_data["bow_stats"]["compatible_coatings"]),
+        }
+
+    if "bowgun_stats" in weapon_data:
+        so = weapon_data["bowgun_stats"]
+        assert len(so["ammo"]) == 6 + 5 + 5 + 5 + 5
+        ret["bowgunStats"] = {
+            "deviation": dict(so["deviation"]),
+            "recoil": so["recoil"],
+            "reload": so["reload"],
+            "ammo": {k: [[x["available"], x["ammo_capacity"]] for x in v] for (k, v) in so["ammo"].items()},
+        }
+
+    return ret
+
+def to_output_structures(data):
+    """
+    Returns {category: {tree name: {id: {weapon data}, ...}, ...}, ...}, where each category's structure is exactly
+    what gets written to (and read back from) its weapons_*.json file.
+    """
+    return {
+        weapon_category: {
+            tree_name: {weapon_id: _to_output_weapon(weapon_data) for (weapon_id, weapon_data) in tree_data.items()}
+            for (tree_name, tree_data) in category_data.items()
+        }
+        for (weapon_category, category_data) in data.items()
+    }
+
+def process(raw_data, specs=DATA_SPEC_HARDCODED):
+    """
+    Runs every stage in memory.
+
+    raw_data is the scraped data as {category: [weapon, ...], ...} (or anything that can be indexed by category).
+    Returns the contents of every weapons_*.json file as {category: {tree name: {id: {weapon data}, ...}, ...}, ...}
+    """
+    data_spec = build_data_spec(specs)
+    (data, data_flat_per_category) = read_input(raw_data, data_spec)
+    resolve_ramp_inheritance(data_flat_per_category)
+    data = reorder_to_spec(data, specs)
+    return to_output_structures(data)
+
+
+#
+# OUTPUT FILE RENDERING
+#
+# The output files are hand-formatted rather than just json.dumps()'d so they stay readable (and diffable).
+#
+
 outer_fmt = """\
 {{
 {children}
@@ -383,6 +528,7 @@ bowgun_stats_fmt = """,
 """
 
 
+
 def process_ramp_skills(lst):
     slot_strs = []
     for slot in lst:
@@ -392,72 +538,67 @@ def process_ramp_skills(lst):
         slot_strs.append(ramp_fmt.format(ramp_skills=",\n".join(inner)))
     return ",\n".join(slot_strs)
 
-
-for (weapon_category, _) in data_spec.items():
-    #dst_file_name = "TODO.weapons_" + weapon_category + ".json"
-    dst_file_name = "weapons_" + weapon_category + ".json"
-    dst_file_path = os.path.join(module_dir_abs, DATABASE_DIR, dst_file_name)
-
-    spec_subdict = data_spec[weapon_category]
-    data_subdict = data[weapon_category]
-
+def render_category(category_data):
+    """
+    Produces the contents of a weapons_*.json file from one category of process()'s output.
+    """
     tree_strs = []
-    for (tree_name, tree_data) in data_subdict.items():
+    for (tree_name, tree_data) in category_data.items():
 
         weapon_strs = []
         for (weapon_id, weapon_data) in tree_data.items():
             special_mechanics = ""
-            
-            if "max_sharpness" in weapon_data:
+
+            if "maxSharpness" in weapon_data:
                 special_mechanics += sharpness_fmt.format(
-                        base_sharpness=",".join(str(x) for x in weapon_data["base_sharpness"]),
-                        max_sharpness=",".join(str(x) for x in weapon_data["max_sharpness"]),
+                        base_sharpness=",".join(str(x) for x in weapon_data["baseSharpness"]),
+                        max_sharpness=",".join(str(x) for x in weapon_data["maxSharpness"]),
                     )
 
-            if "gunlance_stats" in weapon_data:
+            if "gunlanceStats" in weapon_data:
                 special_mechanics += gunlance_stats_fmt.format(
-                        shelling_type=str(weapon_data["gunlance_stats"]["shelling_type"]),
-                        shelling_level=str(weapon_data["gunlance_stats"]["shelling_level"]),
+                        shelling_type=str(weapon_data["gunlanceStats"]["shellingType"]),
+                        shelling_level=str(weapon_data["gunlanceStats"]["shellingLevel"]),
                     )
 
-            if "huntinghorn_songs" in weapon_data:
+            if "huntinghornSongs" in weapon_data:
                 special_mechanics += huntinghorn_songs_fmt.format(
-                        songs=", ".join(f"\"{k}\":\"{v}\"" for (k, v) in weapon_data["huntinghorn_songs"].items()),
+                        songs=", ".join(f"\"{k}\":\"{v}\"" for (k, v) in weapon_data["huntinghornSongs"].items()),
                     )
 
-            if "switchaxe_stats" in weapon_data:
+            if "switchaxeStats" in weapon_data:
                 phial_value_str = "null"
-                if weapon_data["switchaxe_stats"]["phial_value"] != None:
-                    phial_value_str = str(weapon_data["switchaxe_stats"]["phial_value"])
+                if weapon_data["switchaxeStats"]["phialValue"] != None:
+                    phial_value_str = str(weapon_data["switchaxeStats"]["phialValue"])
 
                 special_mechanics += switchaxe_stats_fmt.format(
-                        phial_type=str(weapon_data["switchaxe_stats"]["phial_type"]),
+                        phial_type=str(weapon_data["switchaxeStats"]["phialType"]),
                         phial_value=phial_value_str,
                     )
 
-            if "chargeblade_stats" in weapon_data:
+            if "chargebladeStats" in weapon_data:
                 special_mechanics += chargeblade_stats_fmt.format(
-                        phial_type=str(weapon_data["chargeblade_stats"]["phial_type"]),
+                        phial_type=str(weapon_data["chargebladeStats"]["phialType"]),
                     )
 
-            if "insectglaive_stats" in weapon_data:
+            if "insectglaiveStats" in weapon_data:
                 special_mechanics += insectglaive_stats_fmt.format(
-                        kinsect_level=str(weapon_data["insectglaive_stats"]["kinsect_level"]),
+                        kinsect_level=str(weapon_data["insectglaiveStats"]["kinsectLevel"]),
                     )
 
-            if "bow_stats" in weapon_data:
+            if "bowStats" in weapon_data:
                 charge_shot_substrs = []
-                for (charge_shot_type, level) in weapon_data["bow_stats"]["charge_shot"]:
+                for (charge_shot_type, level) in weapon_data["bowStats"]["chargeShot"]:
                     charge_shot_substrs.append(charge_shot_fmt.format(
                             charge_shot_type=charge_shot_type,
                             level=level,
                         ))
 
-                compatible_coatings = weapon_data["bow_stats"]["compatible_coatings"]
+                compatible_coatings = weapon_data["bowStats"]["compatibleCoatings"]
 
                 special_mechanics += bow_stats_fmt.format(
-                        arc_shot=str(weapon_data["bow_stats"]["arc_shot"]),
-                        base_charge_level_limit=str(weapon_data["bow_stats"]["base_charge_level_limit"]),
+                        arc_shot=str(weapon_data["bowStats"]["arcShot"]),
+                        base_charge_level_limit=str(weapon_data["bowStats"]["baseChargeLevelLimit"]),
                         charge_shot=",\n".join(charge_shot_substrs),
 
                         close_range_coating=str(compatible_coatings["close_range_coating"]),
@@ -469,14 +610,11 @@ for (weapon_category, _) in data_spec.items():
                         exhaust_coating=str(compatible_coatings["exhaust_coating"]),
                     )
 
-            if "bowgun_stats" in weapon_data:
-                so = weapon_data["bowgun_stats"]
+            if "bowgunStats" in weapon_data:
+                so = weapon_data["bowgunStats"]
 
-                assert len(so["ammo"]) == 6 + 5 + 5 + 5 + 5
-                ammo_kwargs = {}
                 # We're not gonna check every individual key because it will be caught later anyway
-                for (k, v) in so["ammo"].items():
-                    ammo_kwargs["ammo_" + k] = json.dumps([[x["available"], x["ammo_capacity"]] for x in v])
+                ammo_kwargs = {("ammo_" + k): json.dumps(v) for (k, v) in so["ammo"].items()}
 
                 special_mechanics += bowgun_stats_fmt.format(
                         deviation_severity=so["deviation"]["severity"],
@@ -493,16 +631,16 @@ for (weapon_category, _) in data_spec.items():
                     weapon_id=weapon_id,
 
                     rarity=str(weapon_data["rarity"]),
-                    endline_tag=weapon_data["endline_tag"],
-                    
+                    endline_tag=weapon_data["endlineTag"],
+
                     name=json.dumps(weapon_data["name"]),
                     attack=str(weapon_data["attack"]),
                     affinity=str(weapon_data["affinity"]),
                     defense=str(weapon_data["defense"]),
-                    deco_slots=",".join(str(x) for x in weapon_data["deco_slots"]),
-                    elestat=", ".join(f"\"{k}\": {v}" for (k, v) in weapon_data["elestat"].items()),
-                    
-                    ramp_skills=process_ramp_skills(weapon_data["ramp_skills_including_inheritance"]),
+                    deco_slots=",".join(str(x) for x in weapon_data["decoSlots"]),
+                    elestat=", ".join(f"\"{k}\": {v}" for (k, v) in weapon_data["eleStat"].items()),
+
+                    ramp_skills=process_ramp_skills(weapon_data["rampSkills"]),
 
                     special_mechanics=special_mechanics,
                 ))
@@ -512,9 +650,42 @@ for (weapon_category, _) in data_spec.items():
                 weapons=",\n".join(weapon_strs),
             ))
 
-    file_data = outer_fmt.format(children=",\n".join(tree_strs))
-    print(file_data)
+    return outer_fmt.format(children=",\n".join(tree_strs))
+
+def write_outputs(processed_data, database_dir=os.path.join(module_dir_abs, DATABASE_DIR), verbose=True):
+    """
+    Only files whose contents changed are replaced (see output_files.py).
+
+    Returns the output_files.OutputDir that was written to.
+    """
+    with output_files.OutputDir(database_dir) as output_dir:
+        for (weapon_category, category_data) in processed_data.items():
+            #dst_file_name = "TODO.weapons_" + weapon_category + ".json"
+            dst_file_name = "weapons_" + weapon_category + ".json"
 
-    with open(dst_file_path, "w") as f:
-        f.write(file_data)
+            file_data = render_category(category_data)
+            if verbose:
+                print(file_data)
+
+            output_dir.write(dst_file_name, file_data)
+    return output_dir
+
+#
+# CLI
+#
 
+def main():
+    parser = argparse.ArgumentParser(description="Process the data downloaded by kiranico_scrape.py.")
+    parser.add_argument("--input", default=SRC_FILE_PATH,
+                        help="Scrape output to read: a .json file, a .jsonl file, or a directory of shards.")
+    parser.add_argument("--follow", action="store_true",
+                        help="Wait for categories that the scraper hasn't written yet.")
+    args = parser.parse_args()
+
+    raw_data = scrape_output.open_reader(args.input, follow=args.follow)
+    output_dir = write_outputs(process(raw_data))
+    print(f"Output: {output_dir.summary_str()}")
+    return
+
+if __name__ == "__main__":
+    main()
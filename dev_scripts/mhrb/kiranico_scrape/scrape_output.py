@@ -0,0 +1,241 @@
+"""
+Filename: scrape_output.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Writers and readers for the weapon data produced by kiranico_scrape.py.
+
+There are three layouts:
+
+    json     downloaded_data/downloaded_data.json
+             One JSON object of {category: [weapon, ...]}, written once everything has been scraped.
+
+    shards   downloaded_data/weapons/<category>.json
+             One JSON array of weapons per category, each written as soon as that category is finished.
+
+    jsonl    downloaded_data/downloaded_data.jsonl
+             JSON Lines, written as each weapon arrives. Weapons come in no particular order, one per line as
+             {"category": ..., "weapon": {...}}. Once a category is finished, it's followed by a line of
+             {"category": ..., "count": <number of weapons>}.
+
+All writes are atomic (or append-only, in the case of jsonl), so readers only ever see finished categories.
+Readers can also follow the output of a scrape that's still in progress, picking up each category as soon as it's
+finished.
+"""
+
+import os
+import json
+import time
+
+from . import html_cache
+
+OUTPUT_FORMATS = ["json", "shards", "jsonl"]
+
+# Relative to the downloaded_data directory
+OUTPUT_PATHS = {
+    "json"  : "downloaded_data.json",
+    "shards": "weapons",
+    "jsonl" : "downloaded_data.jsonl",
+}
+
+DEFAULT_FOLLOW_POLL_SECONDS = 0.5
+DEFAULT_FOLLOW_TIMEOUT_SECONDS = 300.0
+
+def _dumps(data):
+    return json.dumps(data, sort_keys=True, indent=4)
+
+#
+# WRITERS
+#
+
+class JSONWriter:
+    def __init__(self, path):
+        self.path = path
+        self._data = {}
+
+    def add_weapon(self, weapon_category, weapon):
+        return
+
+    def finish_category(self, weapon_category, weapons):
+        self._data[weapon_category] = weapons
+        return
+
+    def close(self, finished):
+        # Unlike the other layouts, nothing is written unless every category was scraped.
+        if finished:
+            html_cache.atomic_write(self.path, _dumps(self._data).encode("utf-8"))
+        return
+
+class ShardsWriter:
+    def __init__(self, path):
+        self.path = path
+        # Old shards are removed so anything following the output never mistakes them for new ones.
+        if os.path.isdir(path):
+            for file_name in os.listdir(path):
+                if file_name.endswith(".json"):
+                    os.remove(os.path.join(path, file_name))
+        os.makedirs(path, exist_ok=True)
+
+    def add_weapon(self, weapon_category, weapon):
+        return
+
+    def finish_category(self, weapon_category, weapons):
+        html_cache.atomic_write(os.path.join(self.path, weapon_category + ".json"), _dumps(weapons).encode("utf-8"))
+        return
+
+    def close(self, finished):
+        return
+
+class JSONLinesWriter:
+    def __init__(self, path):
+        self.path = path
+        self._f = open(path, encoding="utf-8", mode="w")
+
+    def _write_line(self, obj):
+        self._f.write(json.dumps(obj, sort_keys=True) + "\n")
+        self._f.flush()
+        return
+
+    def add_weapon(self, weapon_category, weapon):
+        self._write_line({"category": weapon_category, "weapon": weapon})
+        return
+
+    def finish_category(self, weapon_category, weapons):
+        self._write_line({"category": weapon_category, "count": len(weapons)})
+        return
+
+    def close(self, finished):
+        self._f.close()
+        return
+
+_WRITERS = {
+    "json"  : JSONWriter,
+    "shards": ShardsWriter,
+    "jsonl" : JSONLinesWriter,
+}
+
+def open_writer(output_format, downloaded_data_dir):
+    return _WRITERS[output_format](os.path.join(downloaded_data_dir, OUTPUT_PATHS[output_format]))
+
+#
+# READERS
+#
+
+def detect_format(path):
+    # Only the name is used since, when following a scrape, the path might not exist yet.
+    if path.endswith(".jsonl"):
+        return "jsonl"
+    elif path.endswith(".json"):
+        return "json"
+    else:
+        return "shards"
+
+def _wait(path, follow, waited_since, what):
+    if not follow:
+        raise FileNotFoundError(f"{what} not found in {path}.")
+    if time.monotonic() - waited_since > follow["timeout"]:
+        raise TimeoutError(f"Gave up waiting for {what} in {path}.")
+    time.sleep(follow["poll"])
+    return
+
+class JSONReader:
+    def __init__(self, path, follow=None):
+        self.path = path
+        self.follow = follow
+        self._data = None
+
+    def __getitem__(self, weapon_category):
+        waited_since = time.monotonic()
+        while self._data is None:
+            try:
+                with open(self.path, encoding="utf-8", mode="r") as f:
+                    self._data = json.loads(f.read())
+            except FileNotFoundError:
+                _wait(self.path, self.follow, waited_since, "Scrape output")
+        return self._data[weapon_category]
+
+class ShardsReader:
+    """
+    Only reads each shard when it's asked for, so only one category needs to be in memory at a time.
+    """
+    def __init__(self, path, follow=None):
+        self.path = path
+        self.follow = follow
+
+    def __getitem__(self, weapon_category):
+        path = os.path.join(self.path, weapon_category + ".json")
+        waited_since = time.monotonic()
+        while True:
+            try:
+                with open(path, encoding="utf-8", mode="r") as f:
+                    return json.loads(f.read())
+            except FileNotFoundError:
+                _wait(self.path, self.follow, waited_since, f"Shard for {weapon_category}")
+
+class JSONLinesReader:
+    """
+    Reads lines only as far as needed to finish the requested category. Weapons of other categories that were read
+    along the way are kept until they're asked for.
+    """
+    def __init__(self, path, follow=None):
+        self.path = path
+        self.follow = follow
+        self._f = None
+        self._partial_line = ""
+        self._weapons = {}  # {category: [weapon, ...]}
+        self._finished = {} # {category: [weapon, ...]}
+
+    def _read_line(self):
+        """
+        Returns the next complete line, or None if we've caught up with the writer.
+        """
+        if self._f is None:
+            if not os.path.isfile(self.path):
+                return None
+            self._f = open(self.path, encoding="utf-8", mode="r")
+        line = self._f.readline()
+        if not line.endswith("\n"):
+            # The writer hasn't finished this line yet, so we keep what we've got and try again later.
+            self._partial_line += line
+            return None
+        line = self._partial_line + line
+        self._partial_line = ""
+        return line
+
+    def __getitem__(self, weapon_category):
+        waited_since = time.monotonic()
+        while weapon_category not in self._finished:
+            line = self._read_line()
+            if line is None:
+                _wait(self.path, self.follow, waited_since, f"Weapons for {weapon_category}")
+                continue
+            waited_since = time.monotonic()
+
+            obj = json.loads(line)
+            category = obj["category"]
+            if "weapon" in obj:
+                self._weapons.setdefault(category, []).append(obj["weapon"])
+            else:
+                weapons = self._weapons.pop(category, [])
+                if len(weapons) != obj["count"]:
+                    raise ValueError(f"Expected {obj['count']} weapons for {category}, but read {len(weapons)}.")
+                self._finished[category] = weapons
+        return self._finished.pop(weapon_category)
+
+_READERS = {
+    "json"  : JSONReader,
+    "shards": ShardsReader,
+    "jsonl" : JSONLinesReader,
+}
+
+def open_reader(path, follow=False, poll_seconds=DEFAULT_FOLLOW_POLL_SECONDS,
+                timeout_seconds=DEFAULT_FOLLOW_TIMEOUT_SECONDS):
+    """
+    Returns an object that can be indexed by weapon category to get that category's list of weapons. Each category
+    can only be read once.
+
+    If follow is set, reading a category that isn't available yet waits for the scraper to write it, until nothing
+    new has been written for timeout_seconds.
+    """
+    follow = {"poll": poll_seconds, "timeout": timeout_seconds} if follow else None
+    return _READERS[detect_format(path)](path, follow)
@@ -0,0 +1,171 @@
+"""
+Filename: telemetry.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Per-page timing telemetry for kiranico_scrape.py.
+
+Every page gets one record, tagged with its category and page type, covering:
+
+    wait       Time spent held back by the rate limiter (including any backoff after being throttled).
+    dns        Name resolution, if a new connection had to be made.
+    connect    TCP connection, if a new connection had to be made.
+    tls        TLS handshake, if a new connection had to be made.
+    ttfb       From sending the request to receiving the response headers.
+    transfer   Reading the response body.
+    parse      Building the BeautifulSoup tree.
+    extract    Pulling the data out of the tree.
+
+It also records the response status, how the cache was used, the number of retries, and the size of the body (both
+as sent over the wire and after decoding). All times are in seconds.
+
+Records are written as JSON Lines as they're finished, alongside one record of wall time per weapon category. At the
+end of the run, summary() gives percentiles per phase, the slowest pages, and per-category wall times.
+"""
+
+import os
+import math
+import json
+import time
+
+PHASES = ["wait", "dns", "connect", "tls", "ttfb", "transfer", "parse", "extract"]
+
+DEFAULT_LOG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "telemetry.jsonl")
+NUM_SLOWEST_PAGES = 10
+
+#
+# PARSE TIMING
+#
+# make_soup() reports how long it spent building trees. timed_call() runs in whichever process does the parsing,
+# and uses that to split the total time into parsing and extraction.
+#
+
+_parse_seconds = 0.0
+
+def note_parse_time(seconds):
+    global _parse_seconds
+    _parse_seconds += seconds
+    return
+
+def timed_call(fn, *args):
+    """
+    Returns (fn(*args), seconds spent parsing, seconds spent extracting).
+    """
+    global _parse_seconds
+    _parse_seconds = 0.0
+    start_time = time.perf_counter()
+    result = fn(*args)
+    total_seconds = time.perf_counter() - start_time
+    return (result, _parse_seconds, max(total_seconds - _parse_seconds, 0.0))
+
+#
+# RECORDS
+#
+
+def new_page_record(url, category, page_type):
+    record = {
+        "type": "page",
+        "url": url,
+        "category": category,
+        "page_type": page_type,
+        "status": None,
+        "cache": None,
+        "retries": 0,
+        "bytes": 0,
+        "wire_bytes": 0,
+    }
+    record.update({k: 0.0 for k in PHASES})
+    return record
+
+def page_seconds(record):
+    """
+    Time actually spent on the page. Waiting on the rate limiter isn't counted, since it depends more on how many
+    other pages were queued up at the time than on the page itself.
+    """
+    return sum(record[k] for k in PHASES if k != "wait")
+
+def percentile(values, p):
+    """
+    Nearest-rank percentile. values must already be sorted.
+    """
+    if len(values) == 0:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(values)), 1)
+    return values[rank - 1]
+
+class Telemetry:
+    def __init__(self, log_path=None):
+        self.pages = []
+        self.category_seconds = {}
+        self._log = None if (log_path is None) else open(log_path, encoding="utf-8", mode="w")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+        return False
+
+    def close(self):
+        if self._log is not None:
+            self._write(dict(self.summary(), type="summary"))
+            self._log.close()
+            self._log = None
+        return
+
+    def _write(self, record):
+        if self._log is not None:
+            self._log.write(json.dumps(record, sort_keys=True) + "\n")
+            self._log.flush()
+        return
+
+    def finish_page(self, record):
+        self.pages.append(record)
+        self._write(record)
+        return
+
+    def finish_category(self, category, seconds):
+        self.category_seconds[category] = seconds
+        self._write({"type": "category", "category": category, "seconds": seconds})
+        return
+
+    def summary(self):
+        phases = {}
+        for k in PHASES:
+            values = sorted(x[k] for x in self.pages)
+            phases[k] = {
+                "p50": percentile(values, 50),
+                "p95": percentile(values, 95),
+                "total": sum(values),
+            }
+        slowest = sorted(self.pages, key=page_seconds, reverse=True)[:NUM_SLOWEST_PAGES]
+        return {
+            "pages": len(self.pages),
+            "bytes": sum(x["bytes"] for x in self.pages),
+            "wire_bytes": sum(x["wire_bytes"] for x in self.pages),
+            "retries": sum(x["retries"] for x in self.pages),
+            "phases": phases,
+            "slowest_pages": [{"url": x["url"], "category": x["category"], "seconds": page_seconds(x)}
+                              for x in slowest],
+            "category_seconds": dict(self.category_seconds),
+        }
+
+    def summary_str(self):
+        s = self.summary()
+        lines = [
+            f"{s['pages']} pages, {s['bytes'] / 1e6:.1f} MB ({s['wire_bytes'] / 1e6:.1f} MB over the wire), "
+            f"{s['retries']} retries",
+            "",
+            f"    {'phase':<10} {'p50 ms':>9} {'p95 ms':>9} {'total s':>9}",
+        ]
+        for (k, v) in s["phases"].items():
+            lines.append(f"    {k:<10} {v['p50'] * 1000:>9.1f} {v['p95'] * 1000:>9.1f} {v['total']:>9.2f}")
+        lines.append("")
+        lines.append("Slowest pages (not counting time spent waiting on the rate limiter):")
+        for x in s["slowest_pages"]:
+            lines.append(f"    {x['seconds'] * 1000:>9.1f} ms  {x['category'] or '-':<15} {x['url']}")
+        lines.append("")
+        lines.append("Wall time per category:")
+        for (k, v) in sorted(s["category_seconds"].items(), key=lambda x: x[1], reverse=True):
+            lines.append(f"    {k:<15} {v:>8.2f} s")
+        return "\n".join(lines)
@@ -0,0 +1,57 @@
+"""
+Filename: upgrade_trees.py
+Author:   simshadows <contact@simshadows.com>
+License:  GNU Affero General Public License v3 (AGPL-3.0)
+
+Helpers for upgrade trees, where each node (e.g. a weapon) has at most one parent it was upgraded from.
+
+Trees are given as {node id: parent id}, with a parent id of None for roots. Nothing here cares what the nodes are,
+so this works for weapon trees, and would work just as well for anything else that upgrades (e.g. armour).
+
+Everything is iterative, so deep upgrade chains can't hit Python's recursion limit.
+"""
+
+from collections import deque
+
+def topological_order(parent_ids):
+    """
+    Returns every node id, ordered so that each parent comes before all of its children. Roots (and siblings) keep
+    the order they were given in.
+
+    Raises ValueError if a parent doesn't exist, or if there's a cycle.
+    """
+    children = {k: [] for k in parent_ids.keys()}
+    roots = []
+    for (node_id, parent_id) in parent_ids.items():
+        if parent_id is None:
+            roots.append(node_id)
+        elif parent_id not in children:
+            raise ValueError(f"Orphaned node {node_id}: parent {parent_id} doesn't exist.")
+        else:
+            children[parent_id].append(node_id)
+
+    ret = []
+    queue = deque(roots)
+    while len(queue) > 0:
+        node_id = queue.popleft()
+        ret.append(node_id)
+        queue.extend(children[node_id])
+
+    if len(ret) < len(parent_ids):
+        # Anything left over can't be reached from a root, so it must be in (or hang off) a cycle.
+        ordered = set(ret)
+        unreachable = [k for k in parent_ids.keys() if k not in ordered]
+        raise ValueError("Cycle in upgrade tree, involving: " + ", ".join(str(x) for x in unreachable))
+    return ret
+
+def resolve(parent_ids, resolve_fn):
+    """
+    Calls resolve_fn(node id, parent's result) for every node, parents first. The parent's result is None for roots.
+
+    Returns {node id: result}.
+    """
+    ret = {}
+    for node_id in topological_order(parent_ids):
+        parent_id = parent_ids[node_id]
+        ret[node_id] = resolve_fn(node_id, None if (parent_id is None) else ret[parent_id])
+    return ret
@@ -0,0 +1,42 @@
+/*
+ * Author:  simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ *
+ * The code generator builds the search index with its Python implementations of toNameFilterString() and
+ * toTrigrams(), and the app queries it with these ones, so they're checked here against what the Python
+ * implementations gave for a set of strings. After changing either implementation, re-record the fixtures from the
+ * repository root with:
+ *
+ *     python3 -m dev_scripts.mhrb.code_generators.record_normalisation_fixtures
+ */
+
+import fs from "fs";
+import path from "path";
+
+import {
+    toNameFilterString,
+    toTrigrams,
+} from "./mappings";
+
+const FIXTURES_PATH = path.resolve(
+    __dirname,
+    "../../../../dev_scripts/mhrb/code_generators/fixtures/normalisation_fixtures.json",
+);
+
+type NormalisationFixture = {
+    input:        string;
+    filterString: string;
+    trigrams:     string[];
+};
+
+// DANGER: Type assertion!
+const fixtures = JSON.parse(fs.readFileSync(FIXTURES_PATH, "utf8")) as NormalisationFixture[];
+
+describe("Name filter strings", () => {
+    test.each(fixtures.map((f) => [f.input, f]))("%j", (_, f) => {
+        const filterString = toNameFilterString(f.input);
+        expect(filterString).toBe(f.filterString);
+        // Sorted the same way on both sides, since Python sorts by code point rather than by UTF-16 code unit
+        expect(Array.from(toTrigrams(filterString)).sort()).toEqual([...f.trigrams].sort());
+    });
+});
@@ -21,6 +21,16 @@ export function toNameFilterString(s: string): string {
     return s.toLowerCase().replace(/\s/g, "");
 }
 
+export function toTrigrams(s: string): Set<string> {
+    // IMPORTANT: Please maintain parity between this Javascript implementation and the Python implementation.
+    const codePoints = Array.from(s); // The Python implementation works on code points
+    const ret = new Set<string>();
+    for (let i = 0; i + 3 <= codePoints.length; ++i) {
+        ret.add(codePoints.slice(i, i + 3).join(""));
+    }
+    return ret;
+}
+
 export function glShellingTypeName(s: GLShellingType): string {
     switch (s) {
         default: console.error(`Unexpected value: ${s}`); // Fallthrough for graceful failure
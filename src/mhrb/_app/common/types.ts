@@ -378,7 +378,7 @@ export type BowgunAmmoMapMutable = {
     [K in BowgunAmmoType]: {
         available:    boolean;
         ammoCapacity: number;
-        recoil?:      BowgunRecoil; // TODO: I don't know why this is a thing
+        recoil?:      BowgunRecoil | null; // TODO: I don't know why this is a thing. (null is for wyvern ammo.)
         reload?:      BowgunReload; // TODO: I don't know why this is a thing
     };
 }
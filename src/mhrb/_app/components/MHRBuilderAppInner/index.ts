@@ -20,6 +20,14 @@ import {
 import {
     callTtlDecr,
 } from "../../utils";
+import {
+    armourPiecesWithSkill,
+    decosWithSkill,
+    searchByName,
+    loadWeaponCategory,
+    getLoadedWeaponCategory,
+    weaponCategories,
+} from "../../database";
 import {Build} from "../../model/build";
 import {CalcState} from "../../model/calc_state";
 import {calculateBuildPerformance} from "../../model/calculate/index";
@@ -44,7 +52,7 @@ export class MHRBuilderAppInner extends React.Component<any, any> {
         super(props);
 
         this.state = {
-                build: getBuildFromQueryString(this.props.rawDataRO),
+                build: this.props.initialBuild,
                 calcState: new CalcState(),
             };
 
@@ -79,9 +87,11 @@ export class MHRBuilderAppInner extends React.Component<any, any> {
     // i.e. when the user presses the back-button on the browser
     handlePopState(e) {
         console.log("handlePopState() called. Updating build.");
-        this.setState({
-                view: "main", // Reset to main view
-                build: getBuildFromQueryString(this.props.rawDataRO),
+        getBuildFromQueryString(this.props.rawDataRO).then((build) => {
+                this.setState({
+                        view: "main", // Reset to main view
+                        build: build,
+                    });
             });
     }
 
@@ -314,7 +324,10 @@ export class MHRBuilderAppInner extends React.Component<any, any> {
                 element(WeaponSelectView,
                     {
                     ref: this.myRefs.weaponSelectView,
-                    allWeaponsArray: rawData.readonly.weapons.array,
+                    weaponCategories: weaponCategories,
+                    loadWeaponCategory: loadWeaponCategory,
+                    getLoadedWeaponCategory: getLoadedWeaponCategory,
+                    searchByName: searchByName,
                     currentSelectedWeapon: this.state.build.getWeaponObjRO(),
                     handleSelectWeapon: (weaponRO) => {this.handleSelectWeapon(weaponRO)},
                     },
@@ -330,6 +343,8 @@ export class MHRBuilderAppInner extends React.Component<any, any> {
                     {
                     ref: this.myRefs.armourSelectView,
                     allArmourArrays: rawData.readonly.armour.arrays,
+                    searchByName: searchByName,
+                    armourPiecesWithSkill: armourPiecesWithSkill,
                     currentSelectedArmour: this.state.build.getArmourROs(),
                     handleSelectArmourPiece: (armourPieceRO) => {this.handleSelectArmourPiece(armourPieceRO)},
                     },
@@ -378,6 +393,8 @@ export class MHRBuilderAppInner extends React.Component<any, any> {
                     {
                     ref: this.myRefs.decoSelectView,
                     allDecosArray: rawData.readonly.decorations.array,
+                    searchByName: searchByName,
+                    decosWithSkill: decosWithSkill,
                     handleSelectDecoration: (__a, __b, __c) => {this.handleSelectDecoration(__a, __b, __c)},
                     },
                     null,
@@ -190,23 +190,25 @@ export class ArmourSelectView extends React.Component<any, any> {
         }
     }
 
+    // Armour pieces whose piece, set or hint names match the filter, or that have a skill whose name matches. Uses the
+    // search index and the skill index, so only the matches get visited.
+    _getMatchingArmourPieces() {
+        const results = this.props.searchByName(this.state.filterByName);
+        const ret = new Set(results.armourPieces);
+        for (const skillRO of results.skills) {
+            for (const [armourPieceRO, skillLevel] of this.props.armourPiecesWithSkill(skillRO)) {
+                ret.add(armourPieceRO);
+            }
+        }
+        return ret;
+    }
+
     _getFilteredArmourArray() {
+        // Everything matches an empty filter
+        const matches = (this.state.filterByName === "") ? null : this._getMatchingArmourPieces();
         const filterFn = (element) => {
-                let matchesASkillName = false;
-                for (const [skillRO, skillLevel] of element.skills) {
-                    if (skillRO.filterHelpers.nameLower.includes(this.state.filterByName)) {
-                        matchesASkillName = true;
-                        break;
-                    }
-                }
-
                 return (
-                    (
-                        element.filterHelpers.nameLower.includes(this.state.filterByName)
-                        || element.filterHelpers.setNameLower.includes(this.state.filterByName)
-                        || element.filterHelpers.hintStrLower.includes(this.state.filterByName)
-                        || matchesASkillName
-                    )
+                    ((matches === null) || matches.has(element))
                     && ((this.state.filterByTier == "") || (element.tierID == this.state.filterByTier))
                 );
             };
@@ -262,6 +264,8 @@ export class ArmourSelectView extends React.Component<any, any> {
     render() {
         check.isStr(this.state.filterByName);
         check.isObj(this.props.allArmourArrays);
+        check.isFunction(this.props.searchByName);
+        check.isFunction(this.props.armourPiecesWithSkill);
         check.isObj(this.props.currentSelectedArmour);
         check.isFunction(this.props.handleSelectArmourPiece);
 
@@ -107,21 +107,25 @@ export class DecorationSelectView extends React.Component<any, any> {
         this.props.handleSelectDecoration(decoRO, this.state.querySlotID, this.state.queryDecoSlotID);
     }
 
+    // Decorations whose names match the filter, or that have a skill whose name matches. Uses the search index and the
+    // skill index, so only the matches get visited.
+    _getMatchingDecos() {
+        const results = this.props.searchByName(this.state.filterByName);
+        const ret = new Set(results.decorations);
+        for (const skillRO of results.skills) {
+            for (const [decoRO, skillLevel] of this.props.decosWithSkill(skillRO)) {
+                ret.add(decoRO);
+            }
+        }
+        return ret;
+    }
+
     _getFilteredDecosArray() {
+        // Everything matches an empty filter
+        const matches = (this.state.filterByName === "") ? null : this._getMatchingDecos();
         const op = (element) => {
-                let matchesASkillName = false;
-                for (const [skillRO, skillLevel] of element.skills) {
-                    if (skillRO.filterHelpers.nameLower.includes(this.state.filterByName)) {
-                        matchesASkillName = true;
-                        break;
-                    }
-                }
-
                 return (
-                    (
-                        element.filterHelpers.nameLower.includes(this.state.filterByName)
-                        || matchesASkillName
-                    )
+                    ((matches === null) || matches.has(element))
                     && (element.slotSize <= this.state.queryMaxDecoSlotSize)
                 );
             };
@@ -133,6 +137,8 @@ export class DecorationSelectView extends React.Component<any, any> {
         check.isInt(this.state.queryDecoSlotID);
         assert((this.state.queryDecoSlotID >= 0) && (this.state.queryDecoSlotID < 3));
         check.isObj(this.props.allDecosArray);
+        check.isFunction(this.props.searchByName);
+        check.isFunction(this.props.decosWithSkill);
         check.isFunction(this.props.handleSelectDecoration);
 
         const filteredDecosArray = this._getFilteredDecosArray();
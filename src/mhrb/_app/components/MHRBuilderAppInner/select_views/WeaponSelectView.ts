@@ -173,9 +173,41 @@ export class WeaponSelectView extends React.Component {
         super(props);
         this.state = {
                 filterByName: "", // Empty string by default
-                filterByCategory: "", // Empty string, or a weapon category string
+                // Empty string, or a weapon category string.
+                // Starts at the current weapon's category since it's already loaded, and the others might not be.
+                filterByCategory: this.props.currentSelectedWeapon.category,
                 filterByEndlineTag: "hr", // Empty string, or a weapon endline tag string
+                numCategoriesLoaded: 0, // Only used to re-render when a weapon category finishes loading
             };
+        this._requestedCategories = new Set();
+    }
+
+    componentDidMount() {
+        this._loadNeededCategories();
+    }
+    componentDidUpdate() {
+        this._loadNeededCategories();
+    }
+
+    // Weapons are loaded one category at a time, so only the categories the filters need are loaded
+    _getNeededCategories() {
+        return (this.state.filterByCategory == "") ? this.props.weaponCategories : [this.state.filterByCategory];
+    }
+
+    _loadNeededCategories() {
+        for (const weaponCategory of this._getNeededCategories()) {
+            if (this._requestedCategories.has(weaponCategory)) continue;
+            this._requestedCategories.add(weaponCategory);
+            this.props.loadWeaponCategory(weaponCategory).then(
+                () => {
+                    this.setState((state) => ({numCategoriesLoaded: state.numCategoriesLoaded + 1}));
+                },
+                (err) => {
+                    console.error(err);
+                    this._requestedCategories.delete(weaponCategory); // Try again on the next update
+                },
+            );
+        }
     }
 
     handleSelectWeapon(weaponRO) {
@@ -205,17 +237,30 @@ export class WeaponSelectView extends React.Component {
     }
 
     _getFilteredWeaponsArray() {
+        // Everything matches an empty filter. Otherwise, the search index finds the weapon and tree name matches.
+        const matches = (this.state.filterByName === "")
+            ? null
+            : new Set(this.props.searchByName(this.state.filterByName).weapons);
         const op = (element) => {
                 return (
-                    (
-                        element.filterHelpers.nameLower.includes(this.state.filterByName)
-                        || element.filterHelpers.treeNameLower.includes(this.state.filterByName)
-                    )
+                    ((matches === null) || matches.has(element))
                     && ((this.state.filterByEndlineTag == "") || (element.endlineTag == this.state.filterByEndlineTag))
                     && ((this.state.filterByCategory == "") || (element.category == this.state.filterByCategory))
                 );
             };
-        return this.props.allWeaponsArray.filter(op);
+        const ret = [];
+        for (const weaponCategory of this._getNeededCategories()) {
+            const weaponsMap = this.props.getLoadedWeaponCategory(weaponCategory);
+            if (weaponsMap === null) continue;
+            for (const weaponRO of weaponsMap.values()) {
+                if (op(weaponRO)) ret.push(weaponRO);
+            }
+        }
+        return ret;
+    }
+
+    _isLoadingCategories() {
+        return this._getNeededCategories().some((x) => (this.props.getLoadedWeaponCategory(x) === null));
     }
 
     _renderCategoryFilterButton(weaponCategory) {
@@ -259,7 +304,10 @@ export class WeaponSelectView extends React.Component {
 
     render() {
         check.isStr(this.state.filterByName);
-        check.isObj(this.props.allWeaponsArray);
+        check.isArr(this.props.weaponCategories);
+        check.isFunction(this.props.loadWeaponCategory);
+        check.isFunction(this.props.getLoadedWeaponCategory);
+        check.isFunction(this.props.searchByName);
         check.isObj(this.props.currentSelectedWeapon);
         check.isFunction(this.props.handleSelectWeapon);
 
@@ -298,6 +346,7 @@ export class WeaponSelectView extends React.Component {
                 this._renderCategoryFilterButton("bow"           ),
                 this._renderEmptyEndlineFilterBox(),
             ),
+            (this._isLoadingCategories() ? element("div", null, "Loading weapons...") : null),
             element(WeaponSelectionTable,
                 {
                 dataArray: filteredWeaponsArray,
@@ -40,8 +40,10 @@ import {
 } from "../../common/types";
 
 import {
-    __generated_skill__affinity_sliding,
     __generated_skill__Agitador,
+    __generated_skill__Indignação,
+    __generated_skill__Ressuscitar,
+    __generated_skill__affinity_sliding,
     __generated_skill__ammo_up,
     __generated_skill__artillery,
     __generated_skill__attack_boost,
@@ -125,8 +127,6 @@ import {
     __generated_skill__recovery_speed,
     __generated_skill__recovery_up,
     __generated_skill__reload_speed,
-    __generated_skill__Indignação,
-    __generated_skill__Ressuscitar,
     __generated_skill__sleep_attack,
     __generated_skill__sleep_resistance,
     __generated_skill__slugger,
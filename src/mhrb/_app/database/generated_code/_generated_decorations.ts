@@ -38,8 +38,10 @@
 import {type Decoration} from "../../common/types";
 
 import {
-    __generated_skill__affinity_sliding,
     __generated_skill__Agitador,
+    __generated_skill__Indignação,
+    __generated_skill__Ressuscitar,
+    __generated_skill__affinity_sliding,
     __generated_skill__ammo_up,
     __generated_skill__artillery,
     __generated_skill__attack_boost,
@@ -119,8 +121,6 @@ import {
     __generated_skill__recovery_up,
     __generated_skill__redirection,
     __generated_skill__reload_speed,
-    __generated_skill__Indignação,
-    __generated_skill__Ressuscitar,
     __generated_skill__sleep_attack,
     __generated_skill__sleep_resistance,
     __generated_skill__slugger,
@@ -494,7 +494,7 @@ export const decosArray: Readonly<Decoration[]> = [
     },
     {
         id: 125,
-        name: "Hard Dragão Jewel 3",
+        name: "Hard Drag\u00e3o Jewel 3",
 
         slotSize: 3,
         rarity: 9,
@@ -504,7 +504,7 @@ export const decosArray: Readonly<Decoration[]> = [
 
         icon: "orange",
         filterHelpers: {
-            nameLower: "harddragonjewel3",
+            nameLower: "harddrag\u00e3ojewel3",
         }
     },
     {
@@ -959,7 +959,7 @@ export const decosArray: Readonly<Decoration[]> = [
     },
     {
         id: 156,
-        name: "Dragão Jewel+ 2",
+        name: "Drag\u00e3o Jewel+ 2",
 
         slotSize: 2,
         rarity: 8,
@@ -969,7 +969,7 @@ export const decosArray: Readonly<Decoration[]> = [
 
         icon: "orange",
         filterHelpers: {
-            nameLower: "dragonjewel+2",
+            nameLower: "drag\u00e3ojewel+2",
         }
     },
     {
@@ -1094,7 +1094,7 @@ export const decosArray: Readonly<Decoration[]> = [
     },
     {
         id: 165,
-        name: "Hard Dragão Res Jewel 4",
+        name: "Hard Drag\u00e3o Res Jewel 4",
 
         slotSize: 4,
         rarity: 8,
@@ -1104,7 +1104,7 @@ export const decosArray: Readonly<Decoration[]> = [
 
         icon: "orange",
         filterHelpers: {
-            nameLower: "harddragonresjewel4",
+            nameLower: "harddrag\u00e3oresjewel4",
         }
     },
     {
@@ -2324,7 +2324,7 @@ export const decosArray: Readonly<Decoration[]> = [
     },
     {
         id: 81,
-        name: "Dragão Jewel 1",
+        name: "Drag\u00e3o Jewel 1",
 
         slotSize: 1,
         rarity: 5,
@@ -2334,7 +2334,7 @@ export const decosArray: Readonly<Decoration[]> = [
 
         icon: "orange",
         filterHelpers: {
-            nameLower: "dragonjewel1",
+            nameLower: "drag\u00e3ojewel1",
         }
     },
     {
@@ -2624,7 +2624,7 @@ export const decosArray: Readonly<Decoration[]> = [
     },
     {
         id: 101,
-        name: "Dragão Res Jewel 1",
+        name: "Drag\u00e3o Res Jewel 1",
 
         slotSize: 1,
         rarity: 4,
@@ -2634,7 +2634,7 @@ export const decosArray: Readonly<Decoration[]> = [
 
         icon: "orange",
         filterHelpers: {
-            nameLower: "dragonresjewel1",
+            nameLower: "drag\u00e3oresjewel1",
         }
     },
 ];
@@ -0,0 +1,568 @@
+/*
+ *      SSSSSSSSSSSSSSS TTTTTTTTTTTTTTTTTTTTTTT     OOOOOOOOO     PPPPPPPPPPPPPPPPP   
+ *    SS:::::::::::::::ST:::::::::::::::::::::T   OO:::::::::OO   P::::::::::::::::P  
+ *   S:::::SSSSSS::::::ST:::::::::::::::::::::T OO:::::::::::::OO P::::::PPPPPP:::::P 
+ *   S:::::S     SSSSSSST:::::TT:::::::TT:::::TO:::::::OOO:::::::OPP:::::P     P:::::P
+ *   S:::::S            TTTTTT  T:::::T  TTTTTTO::::::O   O::::::O  P::::P     P:::::P
+ *   S:::::S                    T:::::T        O:::::O     O:::::O  P::::P     P:::::P
+ *    S::::SSSS                 T:::::T        O:::::O     O:::::O  P::::PPPPPP:::::P 
+ *     SS::::::SSSSS            T:::::T        O:::::O     O:::::O  P:::::::::::::PP  
+ *       SSS::::::::SS          T:::::T        O:::::O     O:::::O  P::::PPPPPPPPP    
+ *          SSSSSS::::S         T:::::T        O:::::O     O:::::O  P::::P            
+ *               S:::::S        T:::::T        O:::::O     O:::::O  P::::P            
+ *               S:::::S        T:::::T        O::::::O   O::::::O  P::::P            
+ *   SSSSSSS     S:::::S      TT:::::::TT      O:::::::OOO:::::::OPP::::::PP          
+ *   S::::::SSSSSS:::::S      T:::::::::T       OO:::::::::::::OO P::::::::P          
+ *   S:::::::::::::::SS       T:::::::::T         OO:::::::::OO   P::::::::P          
+ *    SSSSSSSSSSSSSSS         TTTTTTTTTTT           OOOOOOOOO     PPPPPPPPPP
+ *
+ *
+ * This is a generated source code file.
+ *
+ * Do NOT edit this file directly!
+ *
+ * Instead, you must edit the corresponding code generator files located in /dev_scripts at
+ * the root of this repository, then run the code generators with the following command:
+ *      $ yarn run-code-generators
+ *
+ * (ASCII art generated using <https://patorjk.com/software/taag/#p=display&h=0&f=Doh&t=STOP>)
+ *
+ */
+
+
+/*
+ * Code Generator Author: simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ */
+
+import {
+    type WeaponCategory,
+} from "../../common/types";
+
+export const skillIdOrder: Readonly<number[]> = [19,89,90,18,20,21,22,23,111,8,17,24,25,26,27,28,29,30,31,32,112,33,34,35,36,37,38,39,40,113,41,42,4,13,43,44,45,46,0,9,47,48,49,50,51,52,53,54,55,56,57,58,59,3,12,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,6,15,75,76,77,5,14,78,79,80,114,81,82,83,84,85,86,87,115,88,7,16,91,92,93,94,95,96,97,98,99,100,101,102,103,2,11,104,116,105,117,1,10,106,107,108,109,110];
+export const skillShortIdOrder: Readonly<number[]> = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117];
+export const rampIdOrder: Readonly<number[]> = [174,175,104,105,106,107,116,211,212,204,205,203,100,101,102,103,132,133,114,97,98,99,94,95,96,227,228,229,220,192,168,169,230,111,112,113,121,122,134,135,60,61,62,63,56,57,58,59,67,68,231,213,108,109,110,115,172,173,4,5,6,7,0,1,2,3,11,12,214,209,207,206,208,210,136,137,232,221,46,47,48,49,42,43,44,45,53,54,215,153,154,155,156,157,222,202,223,233,234,224,235,164,165,81,82,83,78,79,80,190,84,85,147,148,149,140,150,151,152,144,145,146,141,142,143,162,163,73,74,75,70,71,72,189,76,77,69,13,55,176,177,179,178,180,41,27,181,182,183,184,138,139,64,65,66,8,9,10,50,51,52,36,37,38,22,23,24,117,118,119,120,126,127,128,123,124,125,129,130,131,160,161,236,89,90,91,86,87,88,191,92,93,216,187,188,237,158,159,185,186,166,167,170,171,225,32,33,34,35,28,29,30,31,39,40,217,200,201,196,197,194,195,193,198,199,226,18,19,20,21,14,15,16,17,25,26,218,238,219];
+export const rampShortIdOrder: Readonly<number[]> = [227,235,236,237,238,228,229,230,231,232,233,234,104,105,106,107,116,211,212,174,175,204,205,202,203,100,101,102,103,114,94,95,96,97,98,99,190,189,191,220,192,168,169,111,112,113,121,122,56,57,58,59,67,68,69,64,65,66,60,61,62,63,108,109,110,115,172,173,209,0,1,2,3,11,12,13,8,9,10,4,5,6,7,207,206,208,210,221,42,43,44,45,53,54,55,50,51,52,46,47,48,49,153,154,155,156,157,222,223,132,133,134,135,136,137,138,139,224,164,165,78,79,80,84,85,81,82,83,147,148,149,140,150,151,152,144,145,146,141,142,143,162,163,70,71,72,76,77,73,74,75,181,182,176,177,179,178,180,183,184,170,171,160,161,126,127,128,123,124,125,117,118,119,120,129,130,131,86,87,88,92,93,89,90,91,158,159,187,188,166,167,185,186,225,28,29,30,31,39,40,41,36,37,38,32,33,34,35,200,201,196,197,193,194,195,198,199,226,14,15,16,17,25,26,27,22,23,24,18,19,20,21,213,214,215,216,217,218,219];
+export const decoIdOrder: Readonly<number[]> = [65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64];
+export const armourSetIdOrder: Readonly<number[]> = [0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,127,128,129,130,131,132,133,134,135,136,137,138,139,140,141,142,143,144,145,146,147,148,149,150,151,152,153,154,155,156,157,158,159,160,161,162,163,164,165,166,167,168,169,170,171,172,173,174,175,176,177,178,179,180,181,182,183,184,185,186,187,188];
+
+export const weaponIdOrders: {readonly [K in WeaponCategory]: Readonly<number[]>} = {
+    greatsword: [30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,0,1,2,3,4,5,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,6,7,8,95,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,9,10,11,120,121,122,123,124,125,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,126,127,128,129,130,131],
+    longsword: [33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,0,1,2,3,4,5,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,6,7,8,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,9,10,11,124,125,126,127,128,129,130,131,132,133,134,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,135,136,137,138,139,140],
+    swordandshield: [30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,0,1,2,3,4,5,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,6,7,8,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,9,10,11,122,123,124,125,126,127,128,129,130,131,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,132,133,134,135,136,137],
+    dualblades: [33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,0,1,2,3,4,5,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,6,7,8,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,9,10,11,121,122,123,124,125,126,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,127,128,129,130,131,132],
+    lance: [33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,0,1,2,3,4,5,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,6,7,8,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,9,10,11,125,126,127,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,128,129,130,131,132,133],
+    gunlance: [33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,0,1,2,3,4,5,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,6,7,8,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,9,10,11,127,128,129,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,130,131,132,133,134,135],
+    hammer: [33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,0,1,2,3,4,5,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,6,7,8,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,9,10,11,123,124,125,126,127,128,129,130,131,132,133,134,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,135,136,137,138,139,140],
+    huntinghorn: [30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,0,1,2,3,4,5,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,6,7,8,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,9,10,11,124,125,126,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,127,128,129,130,131,132],
+    switchaxe: [35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,0,1,2,3,4,5,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,6,7,8,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,9,10,11,12,127,128,129,130,131,132,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,133,134,135,136,137,138],
+    chargeblade: [35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,0,1,2,3,4,5,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,6,7,8,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,114,115,116,117,118,119],
+    insectglaive: [33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,0,1,2,3,4,5,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,6,7,8,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,123,124,125,126,127,128],
+    lightbowgun: [36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,0,1,2,3,4,5,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,6,7,8,99,100,101,102,103,104,105,106,107,108,109,110,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,111,112,113,114,115,116],
+    heavybowgun: [34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,0,1,2,3,4,5,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,6,7,8,96,97,98,99,100,101,102,103,104,105,106,107,108,109,110,111,112,113,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,114,115,116,117,118,119],
+    bow: [32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,0,1,2,3,4,5,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,6,7,8,102,103,104,105,106,107,108,109,110,111,112,113,114,115,116,117,118,119,120,121,122,123,124,125,126,9,10,11,127,128,129,130,131,132,133,134,135,136,137,138,139,140,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,141,142,143,144,145,146],
+};
+
+export const weaponTreeOffsets: {readonly [K in WeaponCategory]: Readonly<number[]>} = {
+    greatsword: [0,6,9,12,15,18,21,24,27,30,33,36,42,45,48,51,54,57,63,65,68,71,74,77,80,83,86,89,92,95,98,101,103,105,107,109,111,114,117,120,123,126,132],
+    longsword: [0,6,9,12,15,18,21,24,27,33,36,39,42,45,48,51,54,57,63,66,69,72,75,81,84,87,90,93,96,99,101,104,107,110,113,115,118,120,122,124,126,130,133,135,141],
+    swordandshield: [0,6,9,12,15,18,21,24,27,30,36,39,42,45,48,51,54,57,60,66,69,72,75,78,81,84,87,90,93,97,100,102,104,107,110,113,116,118,120,122,124,127,130,132,138],
+    dualblades: [0,6,9,12,15,18,21,27,30,33,36,39,42,45,48,51,54,57,63,66,69,72,75,78,81,84,87,90,93,96,98,101,103,105,107,109,112,115,118,121,124,127,133],
+    lance: [0,6,9,12,15,18,21,24,30,33,36,39,42,45,49,52,55,58,61,67,70,73,76,79,82,85,88,91,94,98,101,104,107,109,112,114,116,118,121,125,128,134],
+    gunlance: [0,6,9,12,15,18,21,24,30,33,36,39,43,46,49,52,56,59,65,68,72,75,78,82,86,89,92,95,98,101,104,107,110,112,115,117,119,121,124,127,130,136],
+    hammer: [0,6,9,12,15,18,21,24,30,33,36,39,42,45,48,51,54,57,60,66,69,72,75,78,81,85,88,91,94,97,100,103,106,109,112,115,117,119,121,123,125,128,132,135,141],
+    huntinghorn: [0,6,9,12,15,18,21,24,27,30,36,39,42,45,48,51,54,57,60,65,68,71,74,77,80,86,89,92,95,98,101,103,106,108,110,112,114,117,121,124,127,133],
+    switchaxe: [0,6,9,13,16,19,22,25,29,35,38,41,44,47,50,53,57,60,64,70,73,76,79,82,85,89,92,95,99,102,105,108,110,113,115,117,119,121,124,127,130,133,139],
+    chargeblade: [0,6,9,13,16,19,23,26,32,35,38,41,44,47,50,53,59,62,65,68,71,74,77,80,83,86,89,92,94,96,98,100,102,105,108,111,114,120],
+    insectglaive: [0,6,9,12,15,18,21,27,30,33,36,39,42,45,48,54,57,60,63,66,69,72,75,78,81,87,90,93,96,99,102,105,107,109,111,113,116,120,123,129],
+    lightbowgun: [0,6,9,12,15,19,23,26,30,36,39,42,45,48,52,55,58,64,67,70,73,77,80,83,86,89,92,94,97,99,101,103,105,108,111,117],
+    heavybowgun: [0,6,9,12,16,19,22,25,28,34,37,40,43,46,49,53,56,62,65,68,71,74,77,80,83,86,89,92,94,96,98,100,102,105,108,111,114,120],
+    bow: [0,6,9,12,15,18,22,26,29,32,38,41,44,47,50,53,56,59,65,68,71,74,77,80,84,87,93,96,99,102,105,108,111,114,116,118,120,122,124,127,130,133,136,139,141,147],
+};
+
+// [armour piece ref, level, ...] for each skill
+export const skillToArmourPieces: Readonly<Readonly<number[]>[]> = [
+    [110,1,112,1,114,1,153,2,290,1,294,1,400,1,402,1,404,2,533,3,566,3,568,2,865,1,867,2,869,2,935,3],
+    [40,1,43,1,115,1,118,2,226,2,285,1,286,1,287,1,345,1,347,1,348,2,446,2,449,3,541,3,745,2,748,2,770,1,772,1,773,3,796,2,799,3],
+    [127,1,137,2,223,2,407,2,417,3,892,3],
+    [25,1,27,1,37,1,375,2,376,1,377,1,395,2,397,1,855,2,857,3],
+    [231,1,233,2,236,1,238,2,510,1,511,1,512,1,513,1,514,1,616,1,618,3,619,1,621,1,623,3,624,1,806,2,807,1,808,2],
+    [60,1,65,1,106,1,108,1,198,2,355,2,360,2,365,1,367,2,386,1,388,2,483,1,701,1,702,1,703,1,800,1,802,2,846,1,848,2,895,3,900,3],
+    [91,1,93,1,185,1,366,1,368,1,369,1,460,2,462,1,801,1,803,2,810,1,812,2,860,1,862,3],
+    [205,1,575,1,576,1,578,1,835,1,836,1,837,1],
+    [241,1,244,1,626,2,629,1],
+    [171,2,173,1],
+    [70,1,86,1,89,2],
+    [58,1,59,1],
+    [835,1,839,2],
+    [145,2,148,1,808,3],
+    [55,1,57,1,62,1,64,1,67,1,69,1,357,1,359,1,362,1,364,1,425,2,429,1,846,1,847,2,897,1,898,1,899,1,902,1,903,1,904,1,910,2,914,1],
+    [140,1,142,1,520,2,522,1,811,2,813,1,920,2,922,1],
+    [27,1,28,1,225,1,228,1,377,2,378,1,540,2,543,1,837,2,838,1],
+    [150,1,152,1,530,2,532,1],
+    [36,1,122,1,180,1,396,1,455,1,472,1,754,1,820,1,856,1,877,1],
+    [258,1,259,1,263,1,264,1,305,1,309,1,556,1,558,2,559,1,561,1,563,2,564,1,650,1,654,3,697,2,711,1,790,3],
+    [107,1,155,1,159,1,387,1,388,1,389,1,535,2,539,1,767,1,847,1,848,2,881,1],
+    [76,1,77,1,436,1,437,2,710,1,714,2,728,1,733,1,786,1,787,2],
+    [16,1,19,1,26,1,29,1,97,1,120,1,121,1,139,1,277,1,278,2,290,1,292,1,293,1,294,1,341,1,344,2,376,1,378,2,379,1,419,2,452,2,470,1,471,1,472,2,510,1,513,2,592,2,593,2,605,1,606,1,607,2,608,2,609,1,765,2,766,1,769,2,817,3,825,1,826,1,827,2,828,1,836,1,838,2,839,2,875,1,876,2,877,2,890,2,893,1,894,2,930,2],
+    [73,1,482,1,484,1,515,2,518,1,700,2,701,1,915,2,918,1,925,1,927,2],
+    [210,1,212,1,266,1,268,1,495,1,497,1,499,1,926,1,928,2],
+    [165,1,316,1,317,2,440,2,460,1,463,1,661,1,662,2],
+    [207,1,208,1,577,2,578,1],
+    [6,1,10,1,12,1,141,1,143,1,265,2,331,1,335,1,337,1,338,1,339,1,496,1,521,2,522,1,523,1,630,2,634,2,756,2,759,2,921,2,922,1,923,1],
+    [635,1],
+    [286,1,289,1,542,1,544,1,601,1,603,1,604,1],
+    [427,1,631,1,828,1,912,1],
+    [685,1],
+    [634,1,755,1],
+    [701,1,702,1,703,1,704,1],
+    [22,1,38,1,196,1,199,1,222,1,224,1,297,1,299,2,372,2,374,1,396,1,398,2,481,2,484,1,585,1,587,3,589,1,612,1,614,2,672,2,674,2,717,1,722,1,726,1,731,1,745,2,746,2,747,1,832,2,833,1,834,2,856,2,858,3],
+    [31,1,270,1,273,2,391,1,392,1,393,1,851,1,852,1,853,1],
+    [571,1,678,1,679,2,705,1,707,1,933,1,934,1],
+    [215,1,306,1,307,1,580,2,583,1,650,1,651,1,652,1,726,1,731,1,865,1,866,1,869,1],
+    [177,1,178,1,230,1,231,1,235,1,236,1,572,1,573,2,615,2,616,1,620,2,621,1,747,2,748,1,867,1,868,1],
+    [3,1,20,1,21,1,23,1,35,1,39,1,42,1,43,1,61,1,63,1,66,1,68,1,104,1,139,1,217,1,218,2,221,1,224,1,234,2,239,2,281,1,284,1,295,1,296,1,326,1,327,2,328,1,347,2,348,1,349,1,370,1,371,2,373,2,384,2,395,1,397,2,399,1,419,2,582,1,583,2,585,1,586,1,589,2,596,2,598,1,599,1,616,2,619,2,621,2,624,2,690,4,705,3,706,1,707,1,708,1,751,1,752,2,753,1,772,2,773,1,774,2,830,1,831,2,833,2,844,2,855,1,857,2,859,1,891,2,894,2],
+    [10,1,11,1,32,1,33,1,121,1,200,2,203,1,204,1,335,1,336,1,337,2,390,1,392,2,393,1,470,1,471,2,473,1,474,1,490,1,493,2,494,1,760,2,761,1,762,2,763,2,850,3,852,1,853,3,875,1,876,2,878,1,879,1],
+    [34,1,88,1,430,1,448,1,696,1,790,1,798,1],
+    [0,1,179,1,207,1,209,1,240,1,242,1,325,1,577,1,579,2,625,1,627,2,750,2,752,1,920,2,921,1,927,1,929,2],
+    [735,1,736,1,737,1,738,1,739,1],
+    [315,1,316,1,318,1,660,1,661,2,663,2,680,2,682,1,683,1,860,1,861,1,862,1,863,3],
+    [105,1,109,1,187,1,189,1,282,1,283,1,385,1,389,1,411,1,462,1,464,2,485,1,486,1,597,1,598,2,715,1,720,1,845,1,849,2,862,2,864,1,886,1,888,2],
+    [92,1,232,1,237,1,257,1,259,1,262,1,264,1,280,1,282,1,284,1,312,1,366,1,367,1,368,1,556,1,557,1,559,1,561,1,562,1,564,1,595,1,596,1,597,1,599,2,617,1,622,1,657,2,658,1,700,2,702,1,704,1,718,1,723,1,729,1,734,1,801,2,802,2,803,1,830,2,831,1,832,1,834,1],
+    [336,2,509,2,532,1,645,1,649,1,716,1,721,1,761,2,763,1,931,1,932,2],
+    [48,1,128,1,275,1,276,1,353,1,354,1,405,1,408,1,409,1,511,1,514,1,590,1,591,2,715,1,720,1,749,1,778,1,779,1,870,1,871,1,874,1],
+    [30,1,300,1,390,1,500,1,526,1,850,1],
+    [80,1,81,1,214,1,245,1,250,1,287,1,288,1,430,1,431,2,499,1,545,1,548,1,549,1,550,1,553,1,554,1,602,1,603,1],
+    [7,1,9,1,267,2,330,1,332,1,334,1,631,1,632,2,740,2,755,1,757,1,759,1],
+    [545,1,546,1,549,1,550,1,551,1,554,1,633,1,640,1,780,2],
+    [13,1,123,1,124,1,201,1,202,1,320,1,321,1,324,1,338,1,473,2,474,1,491,1,492,2,665,1,666,2,668,1,669,1,710,1,713,1,714,1,716,1,721,1,727,1,728,1,732,1,733,1,761,1,763,2,764,2,878,3,879,2,881,3,882,2],
+    [488,1,489,2,711,2,712,1,719,1,724,1,882,1,932,3,937,2,938,1],
+    [341,1,645,1,647,2,681,1,683,1,684,2,695,2,698,1,699,1,766,1,767,1,768,1,883,1,884,1],
+    [271,1,272,1,273,1,646,1,647,1,648,1,649,1,925,2,929,1],
+    [2,1,133,1,327,1,412,1,413,2,510,1,511,1,514,1,675,2,676,1,677,1,678,1,752,1,887,2,888,2,889,1,935,2,936,2,937,1],
+    [101,1,381,1,906,1],
+    [5,1,134,1,330,1,333,2,414,1,755,1,758,2,887,1,889,2],
+    [15,1,176,1,190,1,193,1,206,1,340,1,475,1,477,1,478,1,576,1,765,1,766,1,768,1],
+    [220,1,399,1,461,1,585,1,859,1,861,2],
+    [696,1,697,1,698,1,699,1],
+    [295,1,296,1,298,1,356,1,357,1,359,1,361,1,362,1,364,1,610,1,611,1,612,1,613,1,614,1,676,1,677,1,679,1,895,1,896,2,897,1,899,1,900,1,901,2,902,1,904,1],
+    [160,1,227,1,542,1,640,1,780,1],
+    [204,1,490,1,491,1,494,1,712,1,713,1,787,1,788,1,881,1],
+    [117,1,276,1,279,1,351,1,465,1,467,1,468,1,591,1,594,2,729,1,734,1,776,2,777,1,820,2,870,1,872,1,873,1],
+    [99,1,454,1,812,1,819,1,928,1],
+    [706,1,709,1,855,1,856,1,859,1],
+    [100,1,147,1,194,1,380,1,383,1,478,1,479,1,527,2,528,1,581,1,582,1,675,1,676,1,678,1,840,2,843,1],
+    [359,1,364,1,586,1,588,2,662,1,664,1,700,2,701,1,847,2,896,1,899,2,901,1,904,2,925,1,926,2],
+    [49,1,352,1,354,2,779,2,785,1,876,2],
+    [50,1,420,1,421,2,905,1,906,2],
+    [131,1,157,1,410,1,411,1,414,1,516,1,517,1,537,2,538,1,695,2,881,1,882,2,885,2,886,1,916,1,917,1,918,1],
+    [322,1,324,1,470,1,474,1,485,1,488,1,666,1,667,1,669,1,725,1,730,1,875,1,877,1,879,1,931,2,933,1],
+    [45,1,243,1,291,1,350,1,605,1,606,1,609,1,625,1,628,2,727,1,732,1,775,1,778,2],
+    [11,1,401,1,402,1,404,1,465,1,468,2,703,2,866,1,867,1,869,1,870,1,873,2],
+    [75,1,435,2,439,1,516,1,519,1,698,1,699,1,785,2,789,1,916,1,919,2],
+    [119,1,138,1,313,1,418,2,469,2,486,2,488,1,511,1,512,1,656,1,658,1,718,1,723,1,872,1,874,2,893,2],
+    [345,1,525,1,528,1,529,1,770,1,771,2],
+    [307,1,308,1,652,1,653,1,654,1,777,2,779,1],
+    [17,1,111,1,216,1,219,1,342,1,400,1,401,1,403,1,581,1,582,1,584,1,748,1,749,2,767,1,769,1,811,1,813,1,814,1,840,1,841,1,842,1,865,1,866,1,868,1,880,2,883,1],
+    [385,1,386,1,845,2,846,1],
+    [146,1,149,1,186,1,188,1,310,1,312,1,461,1,463,1,464,1,526,1,529,1,655,2,657,1,725,1,730,1,861,1,864,1],
+    [255,1,256,1,260,1,261,1,311,1,314,1,555,2,556,1,560,2,561,1,656,2,659,1,931,1,934,2],
+    [72,1,90,1,94,1,154,2,365,2,369,1,534,2,800,2,804,1],
+    [21,1,24,1,113,1,127,1,129,1,143,1,144,2,371,1,374,1,407,1,409,1,523,1,524,2,696,1,697,1,698,1,831,2,834,1,923,1,924,2],
+    [8,1,56,1,125,1,141,1,142,1,211,1,213,1,333,1,405,1,406,1,426,2,428,1,496,1,498,2,521,1,522,1,524,1,756,1,758,2,805,1,806,1,809,1,911,2,913,1,921,1,922,1,924,1],
+    [71,1,151,2,531,2,670,1,671,1,855,1,856,1,859,1],
+    [270,1,271,1,274,1,308,1,645,1,646,1,649,1,651,1,653,1,738,2,739,1,798,1,851,1,852,2,935,1,937,1,939,1,940,2,941,1,942,1,944,1],
+    [325,1,329,1,600,1,601,1,602,1,736,2,738,1,750,1,754,1,805,2,809,1,936,1,938,1,939,1],
+    [102,1,128,1,275,1,277,1,381,2,382,1,408,1,409,1,590,1,592,2,719,1,724,1,841,2,842,1],
+    [197,1,255,1,256,1,260,1,261,1,480,1,482,1,483,1,555,2,556,1,560,2,561,1,872,1],
+    [132,1,195,1,332,1,412,1,480,1,481,1,757,1,787,1,788,1,887,2],
+    [130,1,229,1,245,1,248,1,250,1,253,1,315,1,319,1,410,1,544,1,545,1,548,1,550,1,553,1,660,1,664,2,850,1,853,1,854,1,885,1,886,1,889,1,905,1,910,1,914,2,930,3],
+    [41,1,44,1,202,1,203,1,346,2,349,1,492,1,493,2,770,1,771,2],
+    [74,1,517,1,519,1,670,1,671,1,673,1,875,1,877,1,917,1,919,1],
+    [14,1,116,1,320,1,323,1,339,1,466,2,665,1,668,1,672,1,674,2,717,1,722,1,760,1,762,1,764,1,871,2,923,1,924,1],
+    [46,1,47,1,103,1,350,1,351,1,352,1,382,2,383,1,775,1,776,1,777,1,842,2,843,1],
+    [156,1,158,1,804,2,807,2,809,1,915,2],
+    [720,1,721,1,722,1,723,1,724,1,730,1,731,1,732,1,733,1,734,1],
+    [18,1,19,1,76,1,104,1,190,1,192,1,343,2,344,1,384,1,435,1,436,2,475,1,477,1,768,2,769,1,785,1,786,2,825,1,829,2,840,1,844,2],
+    [706,1,707,1,708,1,709,1],
+    [725,1,726,1,727,1,728,1,729,1,730,1,731,1,732,1,733,1,734,1],
+    [78,1,79,1,438,2,439,1,680,2,681,1,788,2,789,1,880,2,884,1],
+    [4,1,126,1,127,1,326,1,329,2,406,1,407,1,751,1,754,2,819,2],
+    [358,2,363,2,574,1,610,1,611,1,735,1,737,2,746,1,747,1,898,2,903,2,933,1,940,1,941,1,943,1],
+    [191,1,213,1,246,1,247,1,249,1,251,1,252,1,254,1,269,1,475,1,476,1,497,1,498,1,546,1,547,1,549,1,551,1,552,1,554,1,911,1,912,3,913,1],
+    [715,1,716,1,717,1,718,1,719,1,720,1,721,1,722,1,723,1,724,1],
+    [135,1,136,1,175,2,177,1,291,1,293,1,415,1,416,2,570,2,572,1,606,1,608,1,826,1,829,2,890,1,891,2],
+    [1,1,257,1,262,1,326,2,328,1,555,1,557,1,558,1,560,1,562,1,563,1,751,2,753,1,810,2,814,1],
+    [],
+    [941,1,943,2],
+    [942,2,944,1],
+    [],
+    [],
+    [883,1,884,1,915,1,916,1],
+    [],
+];
+
+// [decoration index, level, ...] for each skill
+export const skillToDecos: Readonly<Readonly<number[]>[]> = [
+    [19,3,50,2,141,1],
+    [20,3,51,2,142,1],
+    [21,3,52,2,143,1],
+    [22,3,53,2,144,1],
+    [23,3,54,2,145,1],
+    [138,1],
+    [79,1],
+    [78,1],
+    [77,1],
+    [59,3,161,1],
+    [60,3,162,1],
+    [61,3,163,1],
+    [62,3,164,1],
+    [63,3,165,1],
+    [160,1],
+    [159,1],
+    [158,1],
+    [157,1],
+    [139,1],
+    [84,1],
+    [87,1],
+    [93,1],
+    [105,1],
+    [6,2,91,1],
+    [16,2,126,1],
+    [109,1],
+    [48,3,140,1],
+    [58,3,156,1],
+    [24,1],
+    [12,2,115,1],
+    [],
+    [],
+    [147,1],
+    [],
+    [13,2,137,1],
+    [114,1],
+    [86,1],
+    [5,2,90,1],
+    [27,2,92,1],
+    [106,1],
+    [28,5,32,3,49,2,146,1],
+    [152,1],
+    [45,2,128,1],
+    [],
+    [3,2,113,1],
+    [36,2,118,1],
+    [38,2,119,1],
+    [15,3,120,1],
+    [41,2,95,1],
+    [154,1],
+    [40,3,150,1],
+    [57,3,155,1],
+    [0,2,67,1],
+    [35,2,101,1],
+    [34,2,100,1],
+    [66,1],
+    [1,2,68,1],
+    [97,1],
+    [135,1],
+    [55,3,149,1],
+    [56,3,132,1],
+    [69,1],
+    [],
+    [80,1],
+    [153,1],
+    [99,1],
+    [9,2,94,1],
+    [148,1],
+    [65,1],
+    [104,1],
+    [8,2,96,1],
+    [151,1],
+    [4,2,89,1],
+    [75,1],
+    [88,1],
+    [125,1],
+    [83,1],
+    [74,1],
+    [2,2,103,1],
+    [76,1],
+    [37,2,117,1],
+    [121,1],
+    [70,1],
+    [107,1],
+    [72,1],
+    [108,1],
+    [46,3,133,1],
+    [47,2,134,1],
+    [110,1],
+    [82,1],
+    [81,1],
+    [11,2,123,1],
+    [71,1],
+    [98,1],
+    [44,2,127,1],
+    [17,3,131,1],
+    [73,1],
+    [10,2,102,1],
+    [18,3,136,1],
+    [64,3,116,1],
+    [],
+    [33,3,111,1],
+    [],
+    [],
+    [14,2,112,1],
+    [39,3,129,1],
+    [85,1],
+    [30,4,43,3,124,1],
+    [],
+    [42,3,122,1],
+    [7,2,130,1],
+    [26,1],
+    [],
+    [],
+    [31,1],
+    [29,1],
+    [],
+    [25,1],
+];
+
+// [category index, number of weapons, weapon index, ...] runs for each rampage skill
+export const rampToWeapons: Readonly<Readonly<number[]>[]> = [
+    [0,9,51,52,53,71,72,73,80,81,82,1,15,9,10,11,21,22,23,24,25,26,54,55,56,63,64,65,2,6,45,46,47,104,105,106,3,9,33,34,35,54,55,56,63,64,65,4,7,45,46,47,48,76,77,78,5,17,12,13,14,39,40,41,42,43,44,45,68,69,70,71,89,90,91,6,6,36,37,38,78,79,80,7,18,9,10,11,12,13,14,15,16,17,42,43,44,45,46,47,71,72,73,8,11,9,10,11,12,53,54,55,56,70,71,72,9,9,6,7,8,35,36,37,62,63,64,10,12,27,28,29,36,37,38,60,61,62,63,64,65,13,15,6,7,8,47,48,49,50,51,52,77,78,79,96,97,98],
+    [0,3,53,81,82,1,5,11,22,23,64,65,2,5,81,82,83,105,106,3,3,35,55,56,4,2,47,48,5,6,41,42,70,71,90,91,6,2,37,38,7,7,10,11,13,14,43,44,47,8,3,56,71,72,9,3,8,36,37,10,6,38,61,62,84,85,86,13,5,7,8,78,79,98],
+    [0,1,82,1,2,23,65,2,3,82,83,106,3,1,56,4,1,48,5,1,71,6,1,38,7,2,14,44,8,1,72,10,2,62,86,13,1,79],
+    [],
+    [0,6,126,127,128,129,130,131,1,6,135,136,137,138,139,140,2,6,132,133,134,135,136,137,3,6,127,128,129,130,131,132,4,6,128,129,130,131,132,133,5,6,130,131,132,133,134,135,6,6,135,136,137,138,139,140,7,6,127,128,129,130,131,132,8,6,133,134,135,136,137,138,9,6,114,115,116,117,118,119,10,6,123,124,125,126,127,128,13,6,141,142,143,144,145,146],
+    [0,4,128,129,130,131,1,3,138,139,140,2,3,135,136,137,3,3,130,131,132,4,3,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,3,136,137,138,9,3,117,118,119,10,3,126,127,128,13,3,144,145,146],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128,13,2,145,146],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [3,5,128,129,130,131,132],
+    [3,3,130,131,132],
+    [3,1,132],
+    [11,6,111,112,113,114,115,116,12,6,114,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,1,116],
+    [0,15,9,10,11,54,55,56,68,69,70,71,72,73,86,87,88,1,12,24,25,26,36,37,38,81,82,83,90,91,92,2,12,9,10,11,21,22,23,24,25,26,51,52,53,3,15,6,7,8,30,31,32,69,70,71,78,79,80,81,82,83,4,9,9,10,11,15,16,17,79,80,81,5,10,6,7,8,43,44,45,82,83,84,85,6,9,6,7,8,12,13,14,91,92,93,7,12,6,7,8,9,10,11,51,52,53,57,58,59,8,15,6,7,8,35,36,37,50,51,52,89,90,91,92,93,94,9,16,16,17,18,19,20,21,22,23,24,25,41,42,43,59,60,61,10,12,9,10,11,18,19,20,72,73,74,75,76,77,13,10,9,10,11,44,45,46,80,81,82,83],
+    [0,7,10,11,55,56,69,70,88,1,6,26,37,38,82,83,92,2,5,10,11,23,52,53,3,10,8,31,32,70,71,79,80,118,119,120,4,4,10,11,80,81,5,6,7,8,45,83,84,85,6,4,7,8,14,93,7,3,52,53,59,8,9,7,8,16,17,18,36,37,52,91,9,9,17,18,42,43,60,61,111,112,113,10,8,10,11,19,20,74,120,121,122,13,5,10,11,46,82,83],
+    [0,1,56,2,1,53,3,1,120,4,2,16,17,5,1,85,7,1,53,8,1,18,9,2,18,113,10,3,20,121,122],
+    [1,2,133,134,10,1,122,13,2,139,140],
+    [0,6,126,127,128,129,130,131,1,6,135,136,137,138,139,140,2,6,132,133,134,135,136,137,3,6,127,128,129,130,131,132,4,6,128,129,130,131,132,133,5,6,130,131,132,133,134,135,6,6,135,136,137,138,139,140,7,6,127,128,129,130,131,132,8,6,133,134,135,136,137,138,9,6,114,115,116,117,118,119,10,6,123,124,125,126,127,128,13,6,141,142,143,144,145,146],
+    [0,4,128,129,130,131,1,3,138,139,140,2,3,135,136,137,3,3,130,131,132,4,3,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,3,136,137,138,9,3,117,118,119,10,3,126,127,128,13,3,144,145,146],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128,13,2,145,146],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [3,5,128,129,130,131,132],
+    [3,3,130,131,132],
+    [3,1,132],
+    [11,6,111,112,113,114,115,116,12,6,114,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,1,116],
+    [0,9,21,22,23,83,84,85,95,96,97,1,9,6,7,8,42,43,44,107,108,109,2,9,15,16,17,54,55,56,110,111,112,3,12,9,10,11,18,19,20,45,46,47,90,91,92,4,6,91,92,93,101,102,103,5,12,18,19,20,46,47,48,49,50,51,104,105,106,6,9,54,55,56,85,86,87,109,110,111,7,9,15,16,17,77,78,79,95,96,97,8,18,19,20,21,44,45,46,47,48,49,50,51,52,92,93,94,102,103,104,9,12,13,14,15,32,33,34,35,36,37,86,87,88,10,9,30,31,32,75,76,77,99,100,101,13,12,56,57,58,71,72,73,93,94,95,108,109,110],
+    [0,4,23,85,96,97,1,13,8,44,78,79,80,81,82,83,84,85,86,108,109,2,4,17,56,111,112,3,10,11,19,20,46,47,72,73,74,91,92,4,3,93,102,103,5,7,20,48,56,57,58,105,106,6,4,56,87,110,111,7,3,17,79,97,8,6,21,45,46,94,103,104,9,6,15,44,45,46,87,88,10,7,32,42,43,44,77,100,101,13,10,18,19,20,21,58,73,94,95,109,110],
+    [1,1,80,3,1,74,5,2,57,58,8,1,46,9,1,46,10,1,44,13,1,21],
+    [],
+    [0,6,126,127,128,129,130,131,1,6,135,136,137,138,139,140,2,6,132,133,134,135,136,137,3,6,127,128,129,130,131,132,4,6,128,129,130,131,132,133,5,6,130,131,132,133,134,135,6,6,135,136,137,138,139,140,7,6,127,128,129,130,131,132,8,6,133,134,135,136,137,138,9,6,114,115,116,117,118,119,10,6,123,124,125,126,127,128,13,6,141,142,143,144,145,146],
+    [0,4,128,129,130,131,1,3,138,139,140,2,3,135,136,137,3,3,130,131,132,4,3,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,3,136,137,138,9,3,117,118,119,10,3,126,127,128,13,3,144,145,146],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128,13,2,145,146],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [3,5,128,129,130,131,132],
+    [3,3,130,131,132],
+    [3,1,132],
+    [11,6,111,112,113,114,115,116,12,6,114,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,1,116],
+    [0,6,6,7,8,89,90,91,1,6,12,13,14,48,49,50,2,3,84,85,86,3,6,39,40,41,84,85,86,4,3,6,7,8,5,8,78,79,80,81,82,83,84,85,6,7,57,58,59,81,82,83,84,7,7,89,90,91,117,118,119,120,8,4,95,96,97,98,9,3,23,24,25,10,5,63,64,65,107,108,13,6,41,42,43,99,100,101],
+    [0,4,7,8,90,91,1,4,13,14,49,50,2,7,85,86,95,96,97,98,99,3,4,40,41,85,86,4,2,7,8,5,3,79,80,81,6,3,82,83,84,7,4,90,91,119,120,8,3,96,97,98,9,2,24,25,10,9,45,46,47,64,65,90,91,92,108,13,2,43,101],
+    [0,1,8,2,1,86,3,1,41,4,1,8,5,1,81,6,1,84,7,2,91,120,9,1,25,10,2,65,92],
+    [2,1,96],
+    [0,6,126,127,128,129,130,131,1,6,135,136,137,138,139,140,2,6,132,133,134,135,136,137,3,6,127,128,129,130,131,132,4,6,128,129,130,131,132,133,5,6,130,131,132,133,134,135,6,6,135,136,137,138,139,140,7,6,127,128,129,130,131,132,8,6,133,134,135,136,137,138,9,6,114,115,116,117,118,119,10,6,123,124,125,126,127,128,13,6,141,142,143,144,145,146],
+    [0,4,128,129,130,131,1,3,138,139,140,2,3,135,136,137,3,3,130,131,132,4,3,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,3,136,137,138,9,3,117,118,119,10,3,126,127,128,13,3,144,145,146],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128,13,2,145,146],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [3,5,128,129,130,131,132],
+    [3,3,130,131,132],
+    [3,1,132],
+    [11,6,111,112,113,114,115,116,12,6,114,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,1,116],
+    [0,2,61,62,1,4,126,127,128,129,6,4,128,129,130,131,8,6,47,48,49,127,128,129,9,3,71,72,73,10,3,113,114,115,13,3,90,91,92],
+    [0,3,120,121,122,1,2,128,129,3,3,115,116,117,6,2,130,131,7,3,83,84,85,8,2,49,129,9,4,73,108,109,110,10,5,87,88,89,114,115,13,2,91,92],
+    [0,4,98,99,100,122,1,3,110,111,112,2,3,113,114,115,3,4,93,94,95,117,4,3,104,105,106,5,3,107,108,109,6,3,112,113,114,7,5,84,85,98,99,100,8,3,105,106,107,9,4,89,90,91,110,10,4,89,102,103,104,13,3,111,112,113],
+    [0,1,100,1,1,112,2,1,115,3,1,95,4,1,106,5,1,109,6,1,114,7,1,100,8,1,107,9,1,91,10,1,104,13,1,113],
+    [0,5,127,128,129,130,131,1,5,136,137,138,139,140,2,5,133,134,135,136,137,3,5,128,129,130,131,132,4,5,129,130,131,132,133,5,5,131,132,133,134,135,6,5,136,137,138,139,140,7,5,128,129,130,131,132,8,5,134,135,136,137,138,9,5,115,116,117,118,119,10,5,124,125,126,127,128,13,5,142,143,144,145,146],
+    [0,4,128,129,130,131,1,3,138,139,140,2,3,135,136,137,3,3,130,131,132,4,3,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,3,136,137,138,9,3,117,118,119,10,3,126,127,128,13,3,144,145,146],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128,13,2,145,146],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [3,5,128,129,130,131,132],
+    [3,3,130,131,132],
+    [3,1,132],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,1,116],
+    [0,17,27,28,29,30,31,32,40,41,45,46,47,65,66,67,111,112,113,1,12,51,52,53,54,55,56,69,70,71,101,102,103,2,12,18,19,20,42,43,44,45,46,47,66,67,68,3,3,15,16,17,4,16,12,13,14,33,34,35,73,74,75,76,77,78,121,122,123,124,5,6,9,10,11,12,13,14,6,6,18,19,20,88,89,90,7,6,39,40,41,42,43,44,8,9,38,39,40,79,80,81,82,83,84,9,13,19,20,21,22,23,24,25,68,69,70,71,72,73,10,6,33,34,35,66,67,68],
+    [0,1,47,1,2,71,103,2,4,20,43,44,68,3,1,17,4,3,35,74,75,5,3,33,34,35,6,5,20,72,73,74,90,7,1,41,9,5,20,21,22,69,70,10,1,68],
+    [5,1,35,9,1,22],
+    [0,5,127,128,129,130,131,1,5,136,137,138,139,140,2,5,133,134,135,136,137,3,5,128,129,130,131,132,4,5,129,130,131,132,133,5,5,131,132,133,134,135,6,5,136,137,138,139,140,7,5,128,129,130,131,132,8,5,134,135,136,137,138,9,5,115,116,117,118,119,10,5,124,125,126,127,128],
+    [0,3,129,130,131,1,1,140,2,1,137,3,1,132,4,1,133,5,3,133,134,135,6,3,138,139,140,7,3,130,131,132,8,1,138,9,1,119,10,1,128],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [11,1,116,12,1,119],
+    [1,3,72,73,74,2,2,100,101,3,6,18,19,20,112,113,114,4,3,118,119,120,5,3,98,99,100,6,3,45,46,47,7,6,86,87,88,121,122,123,8,3,124,125,126,9,3,105,106,107,10,3,93,94,95],
+    [1,1,74,2,1,101,3,1,20,4,1,120,5,1,100,6,2,46,47],
+    [6,1,47],
+    [0,4,128,129,130,131,1,4,137,138,139,140,2,4,134,135,136,137,3,4,129,130,131,132,4,4,130,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,4,135,136,137,138,9,4,116,117,118,119,10,4,125,126,127,128],
+    [0,3,129,130,131,1,1,140,2,1,137,3,1,132,4,1,133,5,3,133,134,135,6,3,138,139,140,7,3,130,131,132,8,1,138,9,1,119,10,1,128],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [11,4,113,114,115,116,12,4,116,117,118,119],
+    [11,1,116,12,1,119],
+    [0,6,33,34,35,114,115,116,1,3,87,88,89,2,6,57,58,59,124,125,126,3,3,81,82,83,4,7,94,95,96,97,125,126,127,5,10,52,53,54,55,56,57,58,127,128,129,6,3,51,52,53,7,3,27,28,29,8,7,60,61,62,63,130,131,132,9,3,65,66,67,10,6,12,13,14,15,16,17],
+    [0,1,116,2,2,59,126,4,4,96,97,126,127,5,3,54,55,129,8,3,62,63,132],
+    [4,1,127],
+    [0,4,128,129,130,131,1,4,137,138,139,140,2,4,134,135,136,137,3,4,129,130,131,132,4,4,130,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,4,135,136,137,138,9,4,116,117,118,119,10,4,125,126,127,128],
+    [0,3,129,130,131,1,1,140,2,1,137,3,1,132,4,1,133,5,3,133,134,135,6,3,138,139,140,7,3,130,131,132,8,1,138,9,1,119,10,1,128],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [11,4,113,114,115,116,12,4,116,117,118,119],
+    [11,1,116,12,1,119],
+    [0,3,92,93,94,1,3,104,105,106,2,3,107,108,109,3,3,87,88,89,4,3,98,99,100,5,3,101,102,103,6,3,103,104,105,7,6,92,93,94,124,125,126,8,3,99,100,101,9,3,83,84,85,10,3,96,97,98,13,3,102,103,104],
+    [0,1,94,1,4,106,115,116,117,2,1,109,3,6,89,98,99,100,103,104,4,4,100,109,110,111,5,4,103,112,113,114,6,1,105,7,6,94,103,104,105,125,126,8,4,101,110,111,112,9,1,85,10,1,98,13,1,104],
+    [1,1,117,3,1,100,4,1,111,5,1,114,7,2,105,126,8,1,112],
+    [0,4,128,129,130,131,1,4,137,138,139,140,2,4,134,135,136,137,3,4,129,130,131,132,4,4,130,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,4,135,136,137,138,9,4,116,117,118,119,10,4,125,126,127,128,13,4,143,144,145,146],
+    [0,3,129,130,131,1,1,140,2,1,137,3,1,132,4,1,133,5,3,133,134,135,6,3,138,139,140,7,3,130,131,132,8,1,138,9,1,119,10,1,128,13,1,146],
+    [0,1,131,5,1,135,6,1,140,7,1,132],
+    [0,72,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,65,66,67,83,84,85,89,90,91,126,127,128,129,130,131,1,92,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,135,136,137,138,139,140,2,69,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,104,105,106,132,133,134,135,136,137,3,81,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,72,73,74,75,76,77,81,82,83,84,85,86,112,113,114,115,116,117,127,128,129,130,131,132,4,73,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,91,92,93,125,126,127,128,129,130,131,132,133,5,88,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,130,131,132,133,134,135,6,69,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,85,86,87,135,136,137,138,139,140,7,69,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,74,75,76,127,128,129,130,131,132,8,80,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,92,93,94,95,96,97,98,124,125,126,133,134,135,136,137,138,9,74,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,65,66,67,71,72,73,102,103,104,105,106,107,108,109,110,114,115,116,117,118,119,10,57,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,75,76,77,123,124,125,126,127,128,11,67,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,105,106,107,111,112,113,114,115,116,12,80,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,111,112,113,114,115,116,117,118,119,13,92,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,71,72,73,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,105,106,107,127,128,129,130,131,132,141,142,143,144,145,146],
+    [0,85,3,4,5,9,10,11,18,19,20,21,22,23,27,28,29,30,31,32,34,35,38,39,40,41,42,43,44,45,46,47,48,49,50,52,53,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,101,102,103,104,105,106,107,108,128,129,130,131,1,83,3,4,5,7,8,10,11,14,24,25,26,29,30,31,32,33,34,35,36,37,38,39,40,41,46,47,48,49,50,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,80,86,88,89,90,91,92,94,95,104,105,106,113,114,118,119,120,121,122,123,126,127,128,129,130,131,132,137,138,139,140,2,92,3,4,5,6,7,8,9,10,11,13,14,16,17,21,22,23,24,25,26,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,54,55,56,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,105,106,107,108,109,116,117,118,119,120,121,127,128,129,134,135,136,137,3,102,3,4,5,6,7,8,10,11,12,13,14,18,19,20,23,24,25,26,27,28,29,30,31,32,34,35,37,38,39,40,41,42,43,44,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,96,97,101,102,103,104,105,106,109,110,111,114,116,117,118,119,120,121,122,123,124,125,126,129,130,131,132,4,81,3,4,5,9,10,11,12,13,14,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,43,44,47,48,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,107,108,112,113,114,115,126,127,130,131,132,133,5,89,3,4,5,6,7,8,11,12,13,14,19,20,21,22,23,26,27,28,29,30,31,32,33,34,35,36,37,38,41,42,43,44,45,46,47,48,49,50,51,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,93,94,101,102,103,110,111,115,116,117,118,132,133,134,135,6,103,3,4,5,6,7,8,9,10,11,12,13,14,16,17,21,22,23,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,49,50,51,52,53,54,55,56,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,115,116,117,118,119,120,121,122,128,129,130,131,137,138,139,140,7,90,3,4,5,6,7,8,9,10,11,16,17,19,20,21,22,23,24,25,26,28,29,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,101,102,106,107,108,109,110,111,114,115,116,129,130,131,132,8,103,3,4,5,6,7,8,9,10,11,12,14,15,18,19,20,21,23,24,25,26,27,28,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,55,56,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,108,109,113,114,115,116,117,118,121,122,123,126,127,128,129,135,136,137,138,9,81,3,4,5,7,8,9,10,11,12,13,14,15,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,46,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,92,93,94,95,96,97,98,99,104,107,109,110,116,117,118,119,10,98,3,4,5,6,7,8,9,10,11,13,14,15,16,17,23,24,25,26,27,28,29,30,31,32,34,35,37,38,44,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,105,106,107,108,109,110,113,114,115,116,117,118,119,125,126,127,128,11,74,3,4,5,6,7,8,9,10,11,13,14,15,16,17,18,20,21,22,32,33,34,35,36,37,38,39,40,41,45,46,47,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,92,93,97,98,99,100,101,102,107,113,114,115,116,12,76,3,4,5,6,7,8,9,10,11,17,18,19,20,21,23,24,25,26,27,30,31,32,33,34,35,36,37,38,39,40,41,42,46,47,48,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,92,93,105,106,107,112,113,116,117,118,119,13,105,3,4,5,6,7,8,9,10,11,13,14,15,16,17,20,21,22,23,24,25,30,31,34,35,36,37,38,39,40,41,42,43,44,45,46,48,49,50,51,52,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,88,89,90,91,92,93,94,95,97,98,100,101,102,103,104,107,114,115,116,117,118,119,120,121,128,129,131,132,143,144,145,146],
+    [0,37,11,20,22,23,28,29,31,32,35,41,42,43,44,46,47,49,50,61,62,73,88,93,94,102,104,106,108,109,110,117,118,119,123,124,125,130,131,1,29,25,26,32,38,40,41,56,61,62,67,68,89,92,95,105,106,114,119,121,123,124,125,127,128,129,131,132,139,140,2,26,7,8,11,23,26,29,35,43,44,47,49,50,64,65,106,108,109,117,119,121,122,123,128,129,136,137,3,37,7,8,13,14,19,20,26,29,32,43,44,53,61,62,63,64,65,77,80,83,88,89,97,102,104,106,107,108,111,117,120,122,123,125,126,131,132,4,31,11,13,14,29,31,32,37,38,44,55,56,57,65,66,67,68,69,74,75,78,81,99,100,108,113,115,116,117,127,132,133,5,39,8,14,29,30,31,32,33,34,35,44,45,47,48,49,50,51,58,63,64,65,66,67,77,81,84,85,88,89,90,91,102,103,111,116,118,119,120,134,135,6,43,8,10,11,14,22,23,29,35,40,41,50,53,64,65,66,67,68,72,73,74,76,77,78,79,80,89,90,93,98,99,104,105,116,118,120,122,123,124,129,130,131,139,140,7,43,9,10,11,20,25,26,29,35,37,38,40,41,42,43,44,59,63,64,65,66,67,73,78,79,82,83,84,85,87,88,90,91,93,94,102,107,109,111,112,113,116,131,132,8,38,8,12,20,21,24,26,27,28,34,51,52,68,69,70,71,72,75,80,81,83,84,85,86,87,88,91,100,101,109,114,116,118,119,120,128,129,137,138,9,33,11,12,31,34,35,36,37,40,43,51,52,57,58,59,60,61,64,67,73,80,81,82,84,85,93,95,97,99,100,101,110,118,119,10,48,7,8,11,14,17,26,29,31,32,52,53,54,55,56,57,58,59,67,68,70,71,74,79,80,83,84,85,86,87,88,89,90,91,92,95,97,98,106,108,110,111,112,115,117,118,119,127,128,11,35,7,8,9,10,11,16,17,18,21,22,35,40,41,47,62,63,64,65,66,69,71,72,76,79,82,84,85,93,98,100,102,103,104,115,116,12,25,8,11,20,21,24,33,38,39,48,53,54,55,60,61,73,75,76,79,84,85,93,107,113,118,119,13,36,6,7,8,11,16,17,24,25,31,37,42,43,45,46,52,57,58,63,64,67,75,76,83,92,95,103,104,115,117,119,121,122,123,129,145,146],
+    [0,8,23,29,44,50,62,119,125,131,1,5,62,68,129,132,140,2,5,50,56,65,129,137,3,6,14,20,62,123,126,132,4,5,32,57,71,72,133,5,10,22,23,32,35,48,50,51,64,91,135,6,11,11,23,41,56,65,66,67,68,74,131,140,7,8,11,26,64,79,85,88,91,132,8,7,21,28,69,81,88,129,138,9,5,12,37,58,82,119,10,11,32,53,56,71,80,86,89,92,118,119,128,11,6,11,18,22,63,72,116,12,4,21,39,55,119,13,5,8,25,58,64,146],
+    [0,89,6,7,8,9,10,11,15,16,17,18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,95,96,97,126,127,128,129,130,131,1,98,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,107,108,109,130,131,132,135,136,137,138,139,140,2,98,6,7,8,9,10,11,18,19,20,24,25,26,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,110,111,112,132,133,134,135,136,137,3,81,15,16,17,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,90,91,92,112,113,114,127,128,129,130,131,132,4,89,6,7,8,9,10,11,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,101,102,103,128,129,130,131,132,133,5,98,6,7,8,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,104,105,106,130,131,132,133,134,135,6,91,18,19,20,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,109,110,111,135,136,137,138,139,140,7,77,6,7,8,9,10,11,21,22,23,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,127,128,129,130,131,132,8,85,6,7,8,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,102,103,104,124,125,126,133,134,135,136,137,138,9,72,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,86,87,88,105,106,107,114,115,116,117,118,119,10,90,6,7,8,9,10,11,15,16,17,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,99,100,101,123,124,125,126,127,128,11,82,6,7,8,9,10,11,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,86,87,88,108,109,110,111,112,113,114,115,116,12,67,9,10,11,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,114,115,116,117,118,119,13,98,9,10,11,15,16,17,18,19,20,21,26,27,28,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,108,109,110,124,125,126,133,134,135,141,142,143,144,145,146],
+    [0,65,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,48,49,50,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,82,97,103,104,128,129,130,131,1,80,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,34,35,37,38,41,45,46,47,48,49,50,51,52,53,54,55,56,59,60,61,62,63,64,65,66,67,68,70,71,73,74,79,80,81,82,83,84,85,86,97,98,99,100,101,102,103,109,118,119,137,138,139,140,2,68,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,36,37,38,48,49,50,58,59,62,63,64,65,66,67,68,69,70,71,74,76,77,82,83,88,89,90,91,92,97,98,99,112,118,119,134,135,136,137,3,62,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,28,29,31,32,36,37,38,39,40,41,42,43,44,47,50,56,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,92,101,102,113,114,129,130,131,132,4,69,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,38,39,40,41,51,52,53,54,58,59,60,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,86,87,88,89,90,91,92,93,95,96,97,103,112,113,130,131,132,133,5,55,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,37,38,53,54,55,61,62,63,64,65,66,67,68,69,70,71,74,76,77,92,93,94,99,100,106,115,116,132,133,134,135,6,67,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,34,35,38,39,40,41,42,43,44,45,46,47,62,63,64,65,66,67,68,69,70,71,72,73,74,95,96,97,98,99,100,101,102,111,117,118,125,126,127,137,138,139,140,7,61,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,38,44,50,55,56,62,63,64,65,66,67,68,69,70,74,75,76,81,82,83,84,85,86,87,88,106,107,129,130,131,132,8,74,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,37,42,43,47,48,49,59,61,62,63,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,104,113,114,121,122,123,125,126,135,136,137,138,9,64,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,39,40,42,43,45,46,48,49,50,51,52,55,56,57,58,59,60,61,62,63,64,65,66,67,70,76,77,78,79,88,94,95,106,107,116,117,118,119,10,61,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,39,40,41,42,43,44,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,83,84,85,86,87,88,89,101,125,126,127,128,11,72,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,43,44,46,47,49,50,51,52,53,54,55,56,57,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,88,97,98,109,110,113,114,115,116,12,56,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,36,50,51,52,53,54,55,57,58,59,60,61,62,63,64,65,66,67,68,69,70,76,94,95,116,117,118,119,13,66,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,38,39,40,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,85,86,110,116,117,125,126,135,143,144,145,146],
+    [0,8,4,5,26,64,76,104,130,131,1,10,4,5,17,35,47,80,98,119,139,140,2,13,4,5,38,70,71,77,83,89,99,101,119,136,137,3,9,4,5,38,68,74,102,114,131,132,4,18,4,5,20,40,41,43,44,53,54,59,60,72,87,90,97,113,132,133,5,15,4,5,17,23,38,55,57,58,94,100,116,123,126,134,135,6,13,4,5,44,45,46,47,68,96,118,126,127,139,140,7,10,4,5,8,23,56,67,76,107,131,132,8,12,4,5,43,49,63,78,114,122,123,126,137,138,9,9,4,5,46,49,79,95,107,118,119,10,6,4,5,41,44,127,128,11,7,4,5,51,98,110,115,116,12,13,4,5,51,52,53,54,55,66,67,70,95,118,119,13,12,4,5,6,7,8,21,40,70,117,126,145,146],
+    [0,2,5,131,1,4,5,133,134,140,2,3,5,71,137,3,2,5,132,4,5,5,41,54,60,133,5,2,5,135,6,4,5,47,127,140,7,2,5,132,8,3,5,123,138,9,2,5,119,10,2,5,128,11,2,5,116,12,3,5,52,119,13,4,5,139,140,146],
+    [0,5,127,128,129,130,131,1,5,136,137,138,139,140,2,4,134,135,136,137,3,4,129,130,131,132,4,5,129,130,131,132,133,5,5,131,132,133,134,135,6,5,136,137,138,139,140,7,5,128,129,130,131,132,8,5,134,135,136,137,138,9,5,115,116,117,118,119,10,4,125,126,127,128,13,4,143,144,145,146],
+    [0,3,129,130,131,1,3,138,139,140,4,3,131,132,133,5,3,133,134,135,6,3,138,139,140,7,3,130,131,132,8,3,136,137,138,9,3,117,118,119],
+    [0,1,131,1,1,140,4,1,133,5,1,135,6,1,140,7,1,132],
+    [0,89,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,45,46,47,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,98,99,100,114,115,116,126,127,128,129,130,131,1,89,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,110,111,112,115,116,117,130,131,132,135,136,137,138,139,140,2,98,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,42,43,44,45,46,47,51,52,53,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,113,114,115,124,125,126,132,133,134,135,136,137,3,69,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,39,40,41,51,52,53,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,93,94,95,98,99,100,127,128,129,130,131,132,4,89,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,104,105,106,109,110,111,121,122,123,124,128,129,130,131,132,133,5,86,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,33,34,35,36,37,38,49,50,51,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,87,88,89,90,91,92,93,94,95,96,97,107,108,109,112,113,114,127,128,129,130,131,132,133,134,135,6,76,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,112,113,114,135,136,137,138,139,140,7,80,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,39,40,41,42,43,44,48,49,50,51,52,53,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,98,99,100,103,104,105,121,122,123,124,125,126,127,128,129,130,131,132,8,85,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,47,48,49,57,58,59,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,105,106,107,110,111,112,130,131,132,133,134,135,136,137,138,9,71,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,89,90,91,102,103,104,111,112,113,114,115,116,117,118,119,10,64,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,102,103,104,116,117,118,119,123,124,125,126,127,128,11,67,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,89,90,91,94,95,96,111,112,113,114,115,116,12,76,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,40,41,42,46,47,48,56,57,58,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,89,90,91,105,106,107,108,109,110,114,115,116,117,118,119,13,90,0,1,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,59,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,111,112,113,133,134,135,136,137,138,141,142,143,144,145,146],
+    [0,68,2,3,4,5,6,7,8,9,10,11,12,13,14,16,17,18,19,20,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,63,64,65,66,67,68,69,70,71,72,73,76,78,79,80,81,82,83,84,85,115,116,120,121,122,128,129,130,131,1,76,2,3,4,5,6,7,8,15,16,17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,95,99,100,101,102,103,117,137,138,139,140,2,72,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,73,74,75,76,77,79,80,81,82,83,90,91,92,95,96,97,98,99,102,103,125,126,134,135,136,137,3,55,2,3,4,5,6,7,8,9,10,11,12,13,14,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,68,100,129,130,131,132,4,71,2,3,4,5,6,7,8,9,10,11,12,13,14,17,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,64,65,66,67,68,69,75,83,84,87,111,122,123,124,130,131,132,133,5,69,2,3,4,5,6,7,8,9,10,11,12,13,14,17,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,73,74,75,76,77,92,93,94,96,97,114,121,122,123,128,129,132,133,134,135,6,76,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,67,68,69,70,71,72,73,74,77,78,79,80,101,102,125,126,127,132,133,134,137,138,139,140,7,60,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,20,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,66,67,69,70,105,122,123,125,126,129,130,131,132,8,60,2,3,4,5,6,7,8,9,10,11,12,13,14,15,24,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,59,60,61,62,63,78,87,88,112,131,132,135,136,137,138,9,58,2,3,4,5,6,7,8,9,10,11,12,13,14,15,21,22,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,75,76,77,78,79,81,82,103,104,112,113,116,117,118,119,10,51,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,21,22,23,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,58,59,118,119,125,126,127,128,11,62,2,3,4,5,6,7,8,9,10,11,12,13,14,21,22,24,25,26,27,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,64,65,66,75,76,77,78,79,96,113,114,115,116,12,55,2,3,4,5,6,7,8,9,10,11,13,14,15,24,28,29,30,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,63,64,65,66,67,98,99,106,107,116,117,118,119,13,62,2,3,4,5,6,7,8,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,24,25,31,32,33,34,35,36,37,38,39,40,41,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,57,58,70,76,134,135,137,138,143,144,145,146],
+    [0,8,14,107,108,116,121,122,130,131,1,8,17,31,32,100,122,123,139,140,2,14,34,35,36,37,38,41,92,96,98,99,103,126,136,137,3,6,25,26,105,106,131,132,4,12,23,28,29,32,34,35,41,54,60,124,132,133,5,14,28,29,35,51,93,94,97,117,118,122,123,129,134,135,6,16,11,28,29,30,31,32,59,70,71,74,121,122,127,134,139,140,7,11,34,35,36,37,38,70,110,111,123,131,132,8,13,33,34,35,36,37,38,39,40,117,118,132,137,138,9,7,30,31,98,99,104,118,119,10,10,25,26,27,28,29,109,110,119,127,128,11,9,22,34,35,65,66,101,102,115,116,12,8,32,33,34,35,36,99,118,119,13,10,36,37,38,39,40,120,121,138,145,146],
+    [0,6,126,127,128,129,130,131,1,6,135,136,137,138,139,140,2,6,132,133,134,135,136,137,3,6,127,128,129,130,131,132,4,6,128,129,130,131,132,133,5,6,130,131,132,133,134,135,6,6,135,136,137,138,139,140,7,6,127,128,129,130,131,132,8,6,133,134,135,136,137,138,9,6,114,115,116,117,118,119,10,6,123,124,125,126,127,128,11,6,111,112,113,114,115,116,12,6,114,115,116,117,118,119,13,6,141,142,143,144,145,146],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128,13,2,145,146],
+    [0,4,128,129,130,131,1,4,137,138,139,140,2,4,134,135,136,137,3,4,129,130,131,132,4,4,130,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,4,135,136,137,138,9,4,116,117,118,119,10,4,125,126,127,128,11,4,113,114,115,116,12,4,116,117,118,119,13,4,143,144,145,146],
+    [0,4,128,129,130,131,1,4,137,138,139,140,2,4,134,135,136,137,3,4,129,130,131,132,4,4,130,131,132,133,5,4,132,133,134,135,6,4,137,138,139,140,7,4,129,130,131,132,8,4,135,136,137,138,9,4,116,117,118,119,10,4,125,126,127,128],
+    [0,3,129,130,131,1,3,138,139,140,2,3,135,136,137,3,3,130,131,132,4,3,131,132,133,5,3,133,134,135,6,3,138,139,140,7,3,130,131,132,8,3,136,137,138,9,3,117,118,119,10,3,126,127,128],
+    [0,2,130,131,1,2,139,140,2,2,136,137,3,2,131,132,4,2,132,133,5,2,134,135,6,2,139,140,7,2,131,132,8,2,137,138,9,2,118,119,10,2,127,128],
+    [0,1,131,1,1,140,2,1,137,3,1,132,4,1,133,5,1,135,6,1,140,7,1,132,8,1,138,9,1,119,10,1,128],
+    [0,9,12,13,14,42,43,44,75,76,79,9,11,50,51,52,78,79,80,81,82,102,103,104],
+    [0,1,44,9,4,52,79,103,104],
+    [5,5,131,132,133,134,135],
+    [5,3,133,134,135],
+    [5,1,135],
+    [5,5,131,132,133,134,135],
+    [5,3,133,134,135],
+    [5,1,135],
+    [5,5,131,132,133,134,135],
+    [5,3,133,134,135],
+    [5,1,135],
+    [7,5,128,129,130,131,132],
+    [7,3,130,131,132],
+    [7,5,128,129,130,131,132],
+    [7,3,130,131,132],
+    [7,5,128,129,130,131,132],
+    [7,3,130,131,132],
+    [7,5,128,129,130,131,132],
+    [7,3,130,131,132],
+    [8,6,133,134,135,136,137,138,9,6,114,115,116,117,118,119],
+    [8,5,134,135,136,137,138],
+    [8,3,136,137,138],
+    [8,1,138],
+    [8,5,134,135,136,137,138],
+    [8,3,136,137,138],
+    [8,1,138],
+    [8,5,134,135,136,137,138],
+    [8,3,136,137,138],
+    [8,1,138],
+    [8,5,134,135,136,137,138],
+    [8,3,136,137,138],
+    [8,1,138],
+    [10,27,39,40,41,42,43,44,57,58,59,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95],
+    [10,5,124,125,126,127,128],
+    [10,3,126,127,128],
+    [10,2,127,128],
+    [10,1,128],
+    [11,16,15,16,17,18,20,21,22,80,81,82,111,112,113,114,115,116,12,51,16,17,18,19,20,21,24,40,41,42,43,44,45,46,47,48,59,60,61,62,63,64,65,66,67,71,72,73,74,75,76,77,78,79,98,99,102,103,104,108,109,110,111,112,113,114,115,116,117,118,119],
+    [11,10,9,10,11,17,18,22,82,114,115,116,12,13,18,42,45,61,64,73,99,110,112,113,117,118,119],
+    [11,15,12,13,14,67,68,69,94,95,96,111,112,113,114,115,116,12,24,37,38,39,40,41,42,43,44,45,46,47,48,77,78,79,102,103,104,114,115,116,117,118,119],
+    [11,5,14,96,114,115,116,12,5,45,79,117,118,119],
+    [11,24,23,24,25,26,27,28,29,37,38,42,43,44,45,46,47,55,56,57,111,112,113,114,115,116,12,35,37,38,39,40,41,42,53,54,55,62,63,64,65,66,67,80,81,82,89,90,91,94,95,102,103,104,108,109,110,114,115,116,117,118,119],
+    [11,6,28,29,38,114,115,116,12,9,90,91,103,104,109,110,117,118,119],
+    [11,6,64,65,66,89,90,91,12,32,9,10,11,43,44,45,46,47,48,59,60,61,68,69,70,71,72,73,74,75,76,77,78,79,86,87,88,100,101,105,106,107],
+    [11,7,39,40,41,65,66,90,91,12,15,44,45,48,72,73,74,75,76,77,78,79,82,87,88,101],
+    [11,3,45,46,47,12,8,6,7,8,86,87,88,96,97],
+    [12,2,88,97],
+    [11,7,52,53,54,76,83,84,85,12,25,6,7,8,12,13,14,15,16,17,18,19,20,21,34,35,36,40,41,42,83,84,85,111,112,113],
+    [12,5,7,8,15,85,113],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [12,1,119],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [11,1,116,12,1,119],
+    [11,6,111,112,113,114,115,116,12,6,114,115,116,117,118,119],
+    [11,3,114,115,116,12,3,117,118,119],
+    [11,6,111,112,113,114,115,116],
+    [11,5,112,113,114,115,116],
+    [11,5,112,113,114,115,116],
+    [11,5,112,113,114,115,116],
+    [11,3,114,115,116],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [11,5,112,113,114,115,116,12,5,115,116,117,118,119],
+    [11,2,115,116,12,2,118,119],
+    [12,6,114,115,116,117,118,119],
+    [12,6,114,115,116,117,118,119],
+    [13,15,62,63,64,65,66,67,68,69,70,84,85,86,136,137,138],
+    [13,9,74,75,76,77,78,79,105,106,107],
+    [13,3,53,54,55],
+    [13,3,144,145,146],
+    [13,6,141,142,143,144,145,146],
+    [13,6,141,142,143,144,145,146],
+    [13,1,146],
+    [13,4,143,144,145,146],
+    [13,1,146],
+    [13,4,143,144,145,146],
+    [13,1,146],
+    [13,5,142,143,144,145,146],
+    [13,5,142,143,144,145,146],
+    [13,19,12,13,14,15,16,17,26,27,28,31,68,69,70,105,106,107,130,131,132],
+    [13,6,141,142,143,144,145,146],
+    [13,6,141,142,143,144,145,146],
+    [13,6,141,142,143,144,145,146],
+    [13,5,142,143,144,145,146],
+    [13,5,142,143,144,145,146],
+    [13,5,142,143,144,145,146],
+    [13,2,145,146],
+    [13,1,146],
+    [0,5,98,99,100,101,102,1,9,110,111,112,113,114,131,132,133,134,2,13,12,13,14,15,16,17,100,101,113,114,115,116,117,3,8,93,94,95,96,97,118,119,120,4,5,104,105,106,107,108,5,8,98,99,100,107,108,109,110,111,6,11,15,16,17,106,107,108,112,113,114,115,116,7,5,98,99,100,101,102,8,5,105,106,107,108,109,9,5,89,90,91,92,93,10,11,54,55,56,57,58,59,102,103,104,105,106,11,5,89,90,91,92,93,12,5,89,90,91,92,93,13,7,111,112,113,114,115,139,140],
+    [0,6,83,84,85,114,115,116,1,5,6,7,8,131,132,2,9,15,16,17,69,70,71,124,125,126,3,3,9,10,11,4,6,91,92,93,125,126,127,5,9,18,19,20,124,125,126,127,128,129,6,9,45,46,47,85,86,87,106,107,108,7,3,15,16,17,8,6,92,93,94,130,131,132,9,3,13,14,15,10,3,75,76,77,11,9,36,37,38,39,40,41,108,109,110,12,3,25,26,27,13,6,71,72,73,124,125,126],
+    [0,6,71,72,73,117,118,119,1,6,24,25,26,54,55,56,2,14,27,28,29,39,40,41,45,46,47,97,98,99,102,103,3,6,6,7,8,63,64,65,4,10,23,39,40,41,52,53,54,76,77,78,5,12,12,13,14,43,44,45,92,93,94,95,96,97,6,10,12,13,14,30,31,32,59,78,79,80,7,8,7,8,9,10,11,71,72,73,8,7,9,10,11,12,50,51,52,9,6,62,63,64,71,72,73,10,3,27,28,29,11,6,39,40,41,67,68,69,13,9,41,42,43,44,45,46,50,51,52],
+    [0,5,51,52,53,105,106,1,5,9,10,11,120,121,2,5,90,91,92,120,121,3,3,33,34,35,4,6,45,46,47,48,114,115,5,7,39,40,41,42,43,44,45,6,5,21,22,23,119,120,7,2,108,109,8,6,53,54,55,56,115,116,9,2,96,97,10,3,36,37,38,11,8,42,43,44,45,46,47,99,100,12,2,96,97,13,5,96,97,98,118,119],
+    [0,6,48,49,50,117,118,119,1,3,66,67,68,2,3,48,49,50,3,3,12,13,14,4,3,70,71,72,5,3,21,22,23,6,3,39,40,41,7,3,24,25,26,8,4,25,26,27,28,9,7,9,10,11,12,13,14,15,10,3,69,70,71,11,3,70,71,72,12,3,19,20,21,13,7,22,23,24,25,99,100,101],
+    [0,27,24,25,26,27,28,29,30,31,32,33,34,35,65,66,67,77,78,79,80,81,82,83,84,85,89,90,91,1,20,12,13,14,51,52,53,54,55,56,93,94,95,96,97,98,99,100,101,102,103,2,35,66,67,68,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,105,106,3,12,48,49,50,51,52,53,54,55,56,84,85,86,4,12,18,19,20,21,22,23,82,83,84,85,86,87,5,23,9,10,11,12,13,14,15,16,17,18,19,20,21,22,23,78,79,80,81,82,83,84,85,6,27,21,22,23,42,43,44,45,46,47,48,49,50,51,52,53,54,55,56,94,95,96,97,98,99,100,101,102,7,21,18,19,20,21,22,23,24,25,26,27,28,29,45,46,47,54,55,56,57,58,59,8,14,22,23,24,25,26,27,28,38,39,40,95,96,97,98,9,9,6,7,8,47,48,49,50,51,52,10,24,33,34,35,45,46,47,78,79,80,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,11,13,48,49,50,51,52,53,54,55,56,57,108,109,110,12,22,16,17,18,19,20,21,22,23,24,25,26,27,49,50,51,52,53,54,55,80,81,82,13,9,29,30,31,47,48,49,50,51,52],
+    [0,3,21,22,23,1,3,42,43,44,2,3,54,55,56,3,3,45,46,47,4,3,42,43,44,5,6,46,47,48,49,50,51,6,3,54,55,56,7,3,77,78,79,8,3,19,20,21,9,6,32,33,34,35,36,37,10,3,30,31,32,11,4,15,16,17,18,13,6,56,57,58,93,94,95],
+    [0,3,86,87,88,1,3,90,91,92,2,6,21,22,23,24,25,26,3,6,78,79,80,81,82,83,4,3,79,80,81,5,4,82,83,84,85,6,3,91,92,93,7,3,57,58,59,8,6,89,90,91,92,93,94,10,6,72,73,74,75,76,77,11,3,80,81,82,12,10,12,13,14,15,16,17,18,19,20,21,13,4,80,81,82,83],
+    [0,5,109,110,120,121,122,1,6,124,125,126,127,128,129,2,6,39,40,41,106,122,123,3,8,107,108,115,116,117,121,122,123,4,8,30,31,32,33,34,35,116,117,5,12,30,31,32,33,34,35,88,89,90,91,119,120,6,12,30,31,32,106,107,108,123,124,128,129,130,131,7,2,112,113,8,5,119,120,127,128,129,9,5,100,101,108,109,110,10,5,111,112,113,114,115,11,5,33,34,35,103,104,12,2,100,101,13,5,90,91,92,122,123],
+    [0,2,107,108,1,2,122,123,3,2,105,106,5,2,117,118,6,2,121,122,7,2,110,111,8,2,117,118,9,2,98,99,10,2,109,110,11,2,101,102,12,2,98,99,13,2,120,121],
+    [0,2,99,100,1,2,111,112,2,2,114,115,3,2,94,95,4,2,105,106,5,2,108,109,6,2,113,114,7,2,99,100,8,2,106,107,9,2,90,91,10,2,103,104,11,2,90,91,12,2,90,91,13,2,112,113],
+    [0,2,103,104,1,2,118,119,2,2,118,119,3,2,101,102,4,2,112,113,5,2,115,116,6,2,117,118,7,2,106,107,8,2,113,114,9,2,94,95,10,2,107,108,11,2,97,98,12,2,94,95,13,2,116,117],
+    [0,3,92,93,94,1,3,104,105,106,2,3,107,108,109,3,3,87,88,89,4,3,98,99,100,5,3,101,102,103,6,3,103,104,105,7,3,92,93,94,8,3,99,100,101,9,3,83,84,85,10,3,96,97,98,11,3,83,84,85,12,3,83,84,85,13,3,102,103,104],
+    [0,2,101,102,1,2,113,114,2,2,116,117,3,2,96,97,4,2,107,108,5,2,110,111,6,2,115,116,7,2,101,102,8,2,108,109,9,2,92,93,10,2,105,106,11,2,92,93,12,2,92,93,13,2,114,115],
+    [0,2,105,106,1,2,120,121,2,2,120,121,3,2,103,104,4,2,114,115,6,2,119,120,7,2,108,109,8,2,115,116,9,2,96,97,11,2,99,100,12,2,96,97,13,2,118,119],
+    [0,2,109,110,1,2,124,125,2,2,122,123,3,2,107,108,4,2,116,117,5,2,119,120,6,2,123,124,7,2,112,113,8,2,119,120,9,2,100,101,10,2,111,112,11,2,103,104,12,2,100,101,13,2,122,123],
+    [8,9,13,14,15,41,42,43,82,83,84],
+    [0,18,6,7,8,15,16,17,18,19,20,68,69,70,71,72,73,80,81,82,1,24,18,19,20,21,22,23,24,25,26,33,34,35,63,64,65,81,82,83,101,102,103,115,116,117,2,18,24,25,26,69,70,71,72,73,74,75,76,77,81,82,83,84,85,86,3,12,27,28,29,54,55,56,69,70,71,98,99,100,4,24,6,7,8,49,50,51,52,53,54,55,56,57,67,68,69,82,83,84,85,86,87,109,110,111,5,10,68,69,70,71,72,73,74,75,76,77,6,13,33,34,35,36,37,38,66,67,68,81,82,83,84,7,9,42,43,44,48,49,50,65,66,67,8,18,35,36,37,57,58,59,70,71,72,73,74,75,76,77,78,110,111,112,9,18,23,24,25,38,39,40,59,60,61,74,75,76,77,78,79,80,81,82,10,9,15,16,17,60,61,62,63,64,65,11,16,26,27,28,29,52,53,54,77,78,79,86,87,88,94,95,96,12,9,34,35,36,65,66,67,86,87,88,13,12,65,66,67,68,69,70,77,78,79,127,128,129],
+    [0,15,24,25,26,27,28,29,30,31,32,33,34,35,123,124,125,1,14,69,70,71,72,73,74,96,97,98,99,100,101,102,103,2,15,18,19,20,57,58,59,87,88,89,90,91,92,127,128,129,3,6,15,16,17,109,110,111,4,7,18,19,20,94,95,96,97,5,10,52,53,54,55,56,57,58,121,122,123,6,15,18,19,20,57,58,59,94,95,96,97,98,99,100,101,102,7,6,54,55,56,57,58,59,8,4,60,61,62,63,9,6,47,48,49,50,51,52,11,13,48,49,50,51,52,53,54,55,56,57,105,106,107,12,7,49,50,51,52,53,54,55,13,9,26,27,28,84,85,86,127,128,129],
+    [8,6,81,97,98,121,122,123],
+    [0,51,12,13,14,27,28,29,30,31,32,33,34,35,54,55,56,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,91,95,96,97,111,112,113,123,124,125,1,25,14,21,22,23,24,25,26,42,43,44,60,61,62,87,88,89,95,99,100,101,102,103,107,108,109,2,21,27,28,29,36,37,38,51,52,53,63,64,65,66,67,68,90,91,92,110,111,112,3,31,39,40,41,51,52,53,60,61,62,63,64,65,66,67,68,69,70,71,75,76,77,81,82,83,86,90,91,92,124,125,126,4,26,12,13,14,15,16,17,33,34,35,55,56,57,58,59,60,65,66,67,68,69,101,102,103,118,119,120,5,15,36,37,38,49,50,51,62,63,64,65,66,67,104,105,106,6,43,9,10,11,12,13,14,51,52,53,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,89,90,100,101,102,109,110,111,7,34,12,13,14,15,16,17,20,27,28,29,51,52,53,63,64,65,66,67,68,69,70,95,96,97,114,115,116,117,118,119,120,124,125,126,8,26,24,67,68,69,70,71,72,73,74,75,76,77,78,79,80,81,82,83,84,85,86,87,88,102,103,104,9,34,16,17,18,19,20,21,22,23,24,25,56,57,58,59,60,61,65,66,67,68,69,70,71,72,73,77,78,79,86,87,88,111,112,113,10,29,12,13,14,15,16,17,18,19,20,46,47,51,52,53,54,55,56,57,58,59,66,67,68,99,100,101,120,121,122],
+    [3,3,109,110,111],
+    [0,5,4,5,30,31,32,1,8,4,5,39,40,41,84,85,86,2,10,4,5,6,7,8,127,128,129,130,131,3,8,4,5,42,43,44,121,122,123,4,14,4,5,21,22,23,36,37,38,88,89,90,91,92,93,5,20,4,5,65,66,67,86,87,88,89,90,91,92,93,94,95,96,97,98,99,100,6,14,4,5,69,70,71,72,73,74,97,98,99,132,133,134,7,5,4,5,36,37,38,8,14,4,5,16,17,18,44,45,46,47,48,49,50,51,52,9,2,4,5,10,8,4,5,6,7,8,120,121,122,11,14,4,5,6,7,8,9,10,11,86,87,88,105,106,107,12,5,4,5,74,75,76,13,14,4,5,6,7,8,38,39,40,108,109,110,124,125,126],
+    [7,12,21,22,23,68,69,70,95,96,97,103,104,105],
+    [0,5,127,128,129,130,131,1,5,136,137,138,139,140,2,5,133,134,135,136,137,3,5,128,129,130,131,132,4,5,129,130,131,132,133,5,5,131,132,133,134,135,6,5,136,137,138,139,140,7,5,128,129,130,131,132,8,5,134,135,136,137,138,9,5,115,116,117,118,119,10,5,124,125,126,127,128,13,5,142,143,144,145,146],
+    [0,14,39,40,41,63,64,65,66,67,68,69,70,71,72,73,1,21,15,16,17,18,19,20,21,22,23,24,25,26,30,31,32,33,34,35,48,49,50,2,21,12,13,14,15,16,17,33,34,35,36,37,38,95,96,97,98,99,102,103,130,131,3,6,24,25,26,27,28,29,4,13,27,28,29,30,31,32,33,34,35,121,122,123,124,5,18,27,28,29,30,31,32,33,34,35,36,37,38,89,90,91,95,96,97,6,15,15,16,17,27,28,29,30,31,32,33,34,35,125,126,127,7,27,9,10,11,34,35,36,37,38,80,81,82,83,84,85,86,87,88,89,90,91,117,118,119,120,121,122,123,8,15,13,14,15,32,33,34,35,36,37,38,39,40,41,42,43,9,14,21,22,29,30,31,32,33,34,35,36,37,38,39,40,10,34,24,25,26,27,28,29,30,31,32,54,55,56,57,58,59,81,82,83,84,85,86,87,88,89,90,91,92,93,94,95,116,117,118,119,11,12,9,10,11,12,13,14,61,62,63,64,65,66,12,12,31,32,33,34,35,36,53,54,55,77,78,79,13,24,6,7,8,12,13,14,15,16,17,35,36,37,38,39,40,41,42,43,44,45,46,136,137,138],
+    [0,3,111,112,113,1,15,45,46,47,48,49,50,51,52,53,54,55,56,84,85,86,2,11,78,79,80,81,82,83,84,85,86,130,131,3,12,36,37,38,39,40,41,42,43,44,124,125,126,4,9,88,89,90,91,92,93,118,119,120,5,3,124,125,126,6,15,42,43,44,45,46,47,69,70,71,72,73,74,132,133,134,7,6,74,75,76,114,115,116,10,6,39,40,41,42,43,44,13,9,53,54,55,130,131,132,133,134,135],
+    [5,15,30,31,32,33,34,35,112,113,114,121,122,123,124,125,126],
+];
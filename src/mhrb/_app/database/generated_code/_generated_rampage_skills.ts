@@ -376,85 +376,85 @@ export const __generated_ramp__rapid_fire_ice: RampageSkill = {
 export const __generated_ramp__dragon_boost_1: RampageSkill = {
     id: "dragon_boost_1",
     shortID: "drb1",
-    name: "Dragão Boost I",
+    name: "Drag\u00e3o Boost I",
 };
 
 export const __generated_ramp__dragon_boost_2: RampageSkill = {
     id: "dragon_boost_2",
     shortID: "drb2",
-    name: "Dragão Boost II",
+    name: "Drag\u00e3o Boost II",
 };
 
 export const __generated_ramp__dragon_boost_3: RampageSkill = {
     id: "dragon_boost_3",
     shortID: "drb3",
-    name: "Dragão Boost III",
+    name: "Drag\u00e3o Boost III",
 };
 
 export const __generated_ramp__dragon_boost_4: RampageSkill = {
     id: "dragon_boost_4",
     shortID: "drb4",
-    name: "Dragão Boost IV",
+    name: "Drag\u00e3o Boost IV",
 };
 
 export const __generated_ramp__dragon_1: RampageSkill = {
     id: "dragon_1",
     shortID: "drx1",
-    name: "Dragão I",
+    name: "Drag\u00e3o I",
 };
 
 export const __generated_ramp__dragon_2: RampageSkill = {
     id: "dragon_2",
     shortID: "drx2",
-    name: "Dragão II",
+    name: "Drag\u00e3o II",
 };
 
 export const __generated_ramp__dragon_3: RampageSkill = {
     id: "dragon_3",
     shortID: "drx3",
-    name: "Dragão III",
+    name: "Drag\u00e3o III",
 };
 
 export const __generated_ramp__dragon_4: RampageSkill = {
     id: "dragon_4",
     shortID: "drx4",
-    name: "Dragão IV",
+    name: "Drag\u00e3o IV",
 };
 
 export const __generated_ramp__secondary_dragon_1: RampageSkill = {
     id: "secondary_dragon_1",
     shortID: "drs1",
-    name: "Secondary Dragão I",
+    name: "Secondary Drag\u00e3o I",
 };
 
 export const __generated_ramp__secondary_dragon_2: RampageSkill = {
     id: "secondary_dragon_2",
     shortID: "drs2",
-    name: "Secondary Dragão II",
+    name: "Secondary Drag\u00e3o II",
 };
 
 export const __generated_ramp__secondary_dragon_3: RampageSkill = {
     id: "secondary_dragon_3",
     shortID: "drs3",
-    name: "Secondary Dragão III",
+    name: "Secondary Drag\u00e3o III",
 };
 
 export const __generated_ramp__dragon_effect_1: RampageSkill = {
     id: "dragon_effect_1",
     shortID: "dre1",
-    name: "Dragão Effect I",
+    name: "Drag\u00e3o Effect I",
 };
 
 export const __generated_ramp__dragon_effect_2: RampageSkill = {
     id: "dragon_effect_2",
     shortID: "dre2",
-    name: "Dragão Effect II",
+    name: "Drag\u00e3o Effect II",
 };
 
 export const __generated_ramp__rapid_fire_dragon: RampageSkill = {
     id: "rapid_fire_dragon",
     shortID: "drr1",
-    name: "Rapid Fire Dragão",
+    name: "Rapid Fire Drag\u00e3o",
 };
 
 export const __generated_ramp__poison_boost_1: RampageSkill = {
@@ -640,25 +640,25 @@ export const __generated_ramp__blast_3: RampageSkill = {
 export const __generated_ramp__attack_boost_1: RampageSkill = {
     id: "attack_boost_1",
     shortID: "atb1",
-    name: "Reforço de Ataque I",
+    name: "Refor\u00e7o de Ataque I",
 };
 
 export const __generated_ramp__attack_boost_2: RampageSkill = {
     id: "attack_boost_2",
     shortID: "atb2",
-    name: "Reforço de Ataque II",
+    name: "Refor\u00e7o de Ataque II",
 };
 
 export const __generated_ramp__attack_boost_3: RampageSkill = {
     id: "attack_boost_3",
     shortID: "atb3",
-    name: "Reforço de Ataque III",
+    name: "Refor\u00e7o de Ataque III",
 };
 
 export const __generated_ramp__attack_boost_4: RampageSkill = {
     id: "attack_boost_4",
     shortID: "atb4",
-    name: "Reforço de Ataque IV",
+    name: "Refor\u00e7o de Ataque IV",
 };
 
 export const __generated_ramp__affinity_boost_1: RampageSkill = {
@@ -706,19 +706,19 @@ export const __generated_ramp__elemental_boost_3: RampageSkill = {
 export const __generated_ramp__defense_boost_1: RampageSkill = {
     id: "defense_boost_1",
     shortID: "deb1",
-    name: "Reforço de Defesa  I",
+    name: "Refor\u00e7o de Defesa  I",
 };
 
 export const __generated_ramp__defense_boost_2: RampageSkill = {
     id: "defense_boost_2",
     shortID: "deb2",
-    name: "Reforço de Defesa  II",
+    name: "Refor\u00e7o de Defesa  II",
 };
 
 export const __generated_ramp__defense_boost_3: RampageSkill = {
     id: "defense_boost_3",
     shortID: "deb3",
-    name: "Reforço de Defesa  III",
+    name: "Refor\u00e7o de Defesa  III",
 };
 
 export const __generated_ramp__attack_surge: RampageSkill = {
@@ -922,19 +922,19 @@ export const __generated_ramp__phial_paralysis_3: RampageSkill = {
 export const __generated_ramp__phial_dragon_1: RampageSkill = {
     id: "phial_dragon_1",
     shortID: "phdr1",
-    name: "Phial: Dragão I",
+    name: "Phial: Drag\u00e3o I",
 };
 
 export const __generated_ramp__phial_dragon_2: RampageSkill = {
     id: "phial_dragon_2",
     shortID: "phdr2",
-    name: "Phial: Dragão II",
+    name: "Phial: Drag\u00e3o II",
 };
 
 export const __generated_ramp__phial_dragon_3: RampageSkill = {
     id: "phial_dragon_3",
     shortID: "phdr3",
-    name: "Phial: Dragão III",
+    name: "Phial: Drag\u00e3o III",
 };
 
 export const __generated_ramp__phial_exhaust_1: RampageSkill = {
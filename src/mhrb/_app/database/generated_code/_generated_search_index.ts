@@ -0,0 +1,3557 @@
+/*
+ *      SSSSSSSSSSSSSSS TTTTTTTTTTTTTTTTTTTTTTT     OOOOOOOOO     PPPPPPPPPPPPPPPPP   
+ *    SS:::::::::::::::ST:::::::::::::::::::::T   OO:::::::::OO   P::::::::::::::::P  
+ *   S:::::SSSSSS::::::ST:::::::::::::::::::::T OO:::::::::::::OO P::::::PPPPPP:::::P 
+ *   S:::::S     SSSSSSST:::::TT:::::::TT:::::TO:::::::OOO:::::::OPP:::::P     P:::::P
+ *   S:::::S            TTTTTT  T:::::T  TTTTTTO::::::O   O::::::O  P::::P     P:::::P
+ *   S:::::S                    T:::::T        O:::::O     O:::::O  P::::P     P:::::P
+ *    S::::SSSS                 T:::::T        O:::::O     O:::::O  P::::PPPPPP:::::P 
+ *     SS::::::SSSSS            T:::::T        O:::::O     O:::::O  P:::::::::::::PP  
+ *       SSS::::::::SS          T:::::T        O:::::O     O:::::O  P::::PPPPPPPPP    
+ *          SSSSSS::::S         T:::::T        O:::::O     O:::::O  P::::P            
+ *               S:::::S        T:::::T        O:::::O     O:::::O  P::::P            
+ *               S:::::S        T:::::T        O::::::O   O::::::O  P::::P            
+ *   SSSSSSS     S:::::S      TT:::::::TT      O:::::::OOO:::::::OPP::::::PP          
+ *   S::::::SSSSSS:::::S      T:::::::::T       OO:::::::::::::OO P::::::::P          
+ *   S:::::::::::::::SS       T:::::::::T         OO:::::::::OO   P::::::::P          
+ *    SSSSSSSSSSSSSSS         TTTTTTTTTTT           OOOOOOOOO     PPPPPPPPPP
+ *
+ *
+ * This is a generated source code file.
+ *
+ * Do NOT edit this file directly!
+ *
+ * Instead, you must edit the corresponding code generator files located in /dev_scripts at
+ * the root of this repository, then run the code generators with the following command:
+ *      $ yarn run-code-generators
+ *
+ * (ASCII art generated using <https://patorjk.com/software/taag/#p=display&h=0&f=Doh&t=STOP>)
+ *
+ */
+
+
+/*
+ * Code Generator Author: simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ */
+
+export const searchNumDocs: number = 3564;
+
+export const searchTrigrams: Readonly<string[]> = ["\"dr","\"so","&co","&ja","&va","'ho","'o-","'sa","'sb","'sc","'sd","'se","'sf","'sg","'sh","'si","'sj","'sk","'sl","'sm","'sn","'so","'sp","'sr","'ss","'st","'sv","'sw","'th","(bo","(dr","(fi","(h)","(hi","(ic","(pa","(th","(v)","(vi",")ii","++4","-'o","-do","-ha","-hi","-ka","-ku","-la","-me","-pr","-pu","-st","-ti","-up","-ya",".bl",".bo",".ca",".de",".ii",".st","/ra",":fi","<to","a\"s","a's","a(d","a(f","a(i","a(p","a(t","a-k","aad","aag","aal","aar","aax","aba","abb","abe","abi","abl","abo","abr","abs","abu","aby","ac.","aca","ace","ach","aci","ack","acl","aco","acr","acu","acy","ada","add","ade","adf","adg","adi","adj","adl","adm","ado","adr","ads","adu","adv","ady","aed","aef","aeg","aei","ael","aer","aes","afe","aff","afi","afo","aft","aga","agb","agc","agd","age","agg","agh","agi","agl","agm","agn","ago","agp","agr","ags","agt","agu","ag\u00e3","ah.","aha","ahe","ahn","aho","aid","aif","aii","aij","aik","ail","aim","ain","air","ais","ait","aiv","aja","aje","aji","aka","akb","akc","akd","ake","akg","aki","akl","akn","ako","akr","aks","akt","al'","al.","al/","ala","alb","alc","ald","ale","alf","alg","alh","ali","alj","alk","all","alm","alo","als","alt","alu","alv","aly","ama","amb","ame","ami","amj","amm","amo","amp","ams","amu","an'","ana","anb","anc","and","ane","anf","ang","anh","ani","anj","ank","anm","ann","ano","ans","ant","anu","any","aob","aor","aos","aot","apa","ape","apf","aph","api","apj","apl","apo","app","apt","apu","aqu","ar\"","ara","arb","arc","ard","are","arf","arg","arh","ari","ark","arl","arm","aro","arp","arq","arr","ars","art","aru","arv","arw","arx","arz","asa","asc","ase","ash","asi","ask","asl","aso","asp","ass","ast","asu","asw","at'","ata","atb","atc","atd","ate","ath","ati","atl","atn","ato","atp","atr","ats","att","atu","atw","atx","atz","auc","aug","aul","aun","aur","aus","ava","ave","avy","awb","awg","awi","awj","awk","awl","awn","aws","awt","awy","axb","axc","axe","axg","axh","axi","axm","axs","axt","axx","aya","ayb","aye","aym","ayn","ayo","aze","azi","azo","azu","azy","a\u00e7\u00e3","bab","bad","bag","bal","ban","bap","bar","bas","bat","bau","bav","bay","baz","bbe","bbi","bbl","bea","bed","beh","bei","bel","ben","ber","bes","bi-","bia","bic","big","bih","bii","bim","bin","bis","bit","biv","bix","bla","ble","bli","blo","blu","bly","bna","bod","bog","bol","bom","bon","boo","bos","bot","bou","bow","bpl","bra","bre","bri","bru","bso","bub","bud","bug","bul","bun","bur","bus","bys","byt","c.b","cac","cai","cal","can","cap","car","cas","cat","caw","cbe","ce\"","ce)","cea","ceb","cec","cef","ceh","cei","cej","cel","cem","cen","cep","cer","ces","cet","ceu","cev","cfu","cha","chb","chd","che","chf","chg","chh","chi","chj","chm","chn","cho","chp","chr","chs","cht","chw","chx","cia","cic","cii","cim","cin","cip","cir","cis","cit","ck-","cka","ckb","cke","cki","ckj","ckl","ckm","ckr","cks","cky","cla","cle","clo","clu","cly","cma","coc","coi","col","com","con","coo","cop","cor","cou","cov","cpo","cra","cre","cri","cro","cru","cry","cr\u00ed","csh","cta","cte","cti","cud","cug","cui","cun","cur","cus","cut","cyb","cyc","cyg","cyh","cyl","cyo","cyt","cza","d's","d-m","dab","dac","dad","dae","dag","dai","dak","dal","dam","dan","dao","dar","das","dat","dav","daw","dax","day","dba","dbl","dbo","dbr","dbu","dca","dch","dcl","dco","dcr","dda","dde","ddi","ddl","ddn","ddr","ddy","dea","deb","dec","ded","dee","def","deh","dei","dej","dek","del","dem","den","deo","der","des","dev","dew","dey","dfa","dfi","dfl","dfr","dge","dgl","dgo","dgr","dgy","dha","dhe","dho","dhu","dia","dib","dic","die","dig","dii","din","dir","dis","diu","div","dja","dje","dji","dka","dla","dle","dlo","dlu","dly","dma","dmi","dmo","dna","do:","dob","doc","dog","doi","dom","don","doo","dor","dos","dot","dou","dow","dpi","dpr","dra","dre","dri","dro","dru","dsa","dsc","dsh","dsi","dsl","dso","dsp","dss","dst","dsx","dta","dth","dtr","dtw","dua","dun","duo","dup","dur","dus","dux","dva","dve","dvo","dwa","dwi","dyb","dyg","dyi","dys","e&v","e's","e)s","e-d","e-p","e-u","e.>","ead","eag","eak","eal","eam","ean","eap","ear","eas","eat","eav","eax","eba","ebb","ebe","ebl","ebo","ebr","ebu","ec.","eca","ech","eci","eck","ecl","eco","ecr","ecs","ect","ecu","eda","edb","edc","edd","ede","edf","edg","edh","edi","edj","edk","edl","edm","edn","edo","edr","eds","edt","edu","edv","edw","edx","ee.","ee2","eed","eel","eem","een","eep","eer","eet","eev","eex","eez","ef'","efa","efc","efe","efh","efi","efk","efl","efo","efr","efs","efu","ega","ege","egg","egi","egl","egr","egu","egw","eh.","eha","ehe","eho","ehr","ei-","eib","eic","eid","eie","eig","eih","eii","eil","eim","eir","eis","eit","eiv","eiz","eje","eka","eke","eki","ekl","eku","el+","el.","el1","el2","el3","el4","ela","elb","elc","eld","ele","elf","elg","elh","eli","ell","elm","elo","elp","elr","els","elt","elu","elv","elw","elx","ely","ema","emb","eme","emg","emi","emo","emp","en'","en)","ena","enb","enc","end","ene","eng","enh","eni","enk","enl","enm","enn","eno","enr","ens","ent","enu","env","enz","eob","eof","eoj","eol","eon","eor","eos","epa","epe","epi","epj","epl","epo","epr","ept","epy","equ","er'","er(","er)","era","erb","erc","erd","ere","erf","erg","erh","eri","erj","erl","erm","ern","ero","erp","err","ers","ert","eru","erv","erw","erx","ery","es(","esa","esc","ese","esh","esi","esj","esl","eso","esp","ess","est","esu","esv","esw","esx","eta","etb","ete","eth","eti","eto","etr","ets","ett","etu","etw","etx","eud","eun","eup","eus","eva","eve","evi","evo","evt","ewa","ewd","ewe","ewi","exa","exb","exc","exd","exg","exh","exk","exl","exm","exo","exp","exs","ext","exw","exx","eyb","eye","eyg","eyh","eyi","eyj","eym","eyp","eyt","eza","eze","ezu","f's","fad","fai","fal","fam","fan","far","fas","fat","fau","fcr","fea","fec","fee","fei","fel","fen","fer","fes","fet","feu","ffa","ffe","ffi","ffl","fgl","fgo","fho","fib","fic","fie","fig","fii","fil","fin","fio","fir","fis","fiv","fku","fl.","fla","fle","fli","flm","flo","flu","fly","fma","fme","fmu","fna","fni","foc","fog","fol","fon","foo","for","fox","fpr","fra","fre","fri","fro","fsc","fsi","fta","ftb","fth","fti","ftj","ful","fun","fur","fwi","g's","gab","gac","gad","gag","gah","gai","gak","gal","gam","gan","gar","gas","gat","gau","gax","gaz","gba","gbe","gbl","gbo","gbr","gca","gcl","gco","gda","gdo","gdr","gdu","gea","geb","gec","ged","gef","geg","geh","gei","gek","gel","gem","gen","geo","gep","ger","ges","get","geu","gew","gfa","gfi","gfl","gfu","gge","ggh","ggi","ggl","ggr","ggu","gha","ghe","ghg","gho","ghp","ghr","ght","ghv","gi&","gia","gib","gic","gif","gig","gih","gii","gim","gin","gir","gis","git","giv","gix","gje","gka","gla","gle","gli","glo","gma","gme","gmo","gna","gne","gni","gnm","go'","goa","gob","god","gog","goi","gol","gom","gon","goo","gor","gos","got","gou","gph","gpi","gpr","gra","gre","gri","gro","gru","gr\u00ed","gsc","gse","gsh","gsl","gsp","gss","gst","gsw","gta","gte","gth","gto","gtr","gtu","gua","gue","gui","gul","gun","gur","gwa","gwe","gwh","gwy","gy'","gyj","gyt","g\u00e3o","h)s","h.b","hab","hac","had","haf","hag","hai","hak","hal","ham","han","hao","hap","har","has","hat","hau","haw","hax","haz","hbl","hbo","hbr","hbu","hca","hcl","hco","hcr","hda","hde","hdo","hdr","hea","hed","hee","hef","hei","hek","hel","hem","hen","heo","hep","her","hes","het","heu","hez","hfi","hfl","hfr","hgl","hgr","hgu","hha","hhe","hho","hi'","hi(","hia","hib","hic","hid","hie","hif","hig","hih","hii","hil","him","hin","hio","hip","hir","his","hit","hix","hje","hka","hli","hlo","hma","hmu","hni","hoa","hoc","hoe","hof","hol","hom","hon","hoo","hop","hor","hot","hou","hov","how","hpa","hpl","hpo","hpr","hre","hri","hro","hsh","hsi","hsp","hst","ht&","ht'","htb","htc","htd","hte","htf","htg","hth","hti","htm","htn","hto","htr","hts","htw","hty","hum","hun","hur","hva","hve","hvo","hwa","hwe","hy'","hyp","hys","hyt","h\u00e9e","i&j","i's","i(h","i(v","i-k","i-p","iaa","iab","iac","iad","iai","ial","iam","ian","iap","ias","iat","iax","iba","ibi","ibl","ibo","ibp","ibr","ibu","ica","icb","ice","icf","ich","ici","ick","icl","icm","ico","icp","icr","ics","ict","ida","idb","idc","idd","ide","idf","idg","idh","idi","idm","ido","idr","ids","idt","idu","idv","ie'","ieb","iec","ied","ief","ieg","iel","ien","ier","ies","iet","iew","ife","ifi","ifl","ifo","ifr","ift","ify","iga","ige","igh","igi","igl","igm","ign","igr","igu","iha","ihe","iii","iim","ijo","ika","ikb","ikc","ike","ikg","ikh","ikm","iko","iks","ikt","ikv","il'","ila","ilb","ild","ile","ilg","ilh","ili","ill","ilm","ilo","ilp","ils","ilt","ilv","ilx","ima","imc","ime","imi","imm","imo","imp","ims","imu","imy","in'","in(","ina","inb","inc","ind","ine","inf","ing","inh","ini","inj","ink","inl","inm","inn","ino","ins","int","iny","iob","ioc","ioe","ion","ior","ios","iot","iou","iov","iox","ipa","ipe","ipj","ipl","ipo","ipp","ipr","ips","iqu","ir-","ira","ire","iri","irm","iro","irr","irs","irt","iru","is)","isa","isc","isd","ise","isg","ish","isi","isj","isk","isl","ism","isn","iso","isp","isr","iss","ist","isw","it'","ita","itc","ite","ith","iti","itj","itm","ito","itr","its","itt","itu","itw","itx","ity","itz","ium","iva","ive","ivi","ivo","iwo","ixf","iya","iyo","iza","ize","izo","izu","izz","jaa","jab","jac","jae","jag","jah","jal","jan","jap","jas","jaw","jel","jew","jii","jin","jod","jou","jul","jum","jyu","k(h","k(v","k-'","k.c","k.i","kab","kad","kae","kai","kaj","kak","kal","kam","kan","kao","kar","kat","kbl","kbo","kbr","kcl","kco","kda","kea","keb","ked","kee","kei","kel","kem","keq","ker","ket","kew","kfi","kgl","kgr","khe","kid","kii","kim","kin","kir","kit","kiy","kje","kla","kle","klo","klu","kma","kmk","kna","kni","kno","kof","koi","koj","kon","kor","kot","kou","koy","kra","kre","kri","kro","ksc","ksh","ksi","ksl","ksp","kst","ksw","kto","ktr","kts","kub","kuc","kug","kuh","kuk","kul","kum","kur","kus","kut","kux","kve","ky-","kyc","kyr","k\u00fcr","l's","l++","l+2","l+3","l+4","l-s","l.b","l/r","laa","lab","lac","lad","lae","lag","lah","lai","lam","lan","lap","lar","las","lat","lau","lav","law","lax","lay","laz","lba","lbe","lbi","lbl","lbo","lbr","lbu","lch","lcl","lco","lcr","ld'","lda","ldb","lde","ldf","ldg","ldh","ldi","ldj","ldo","ldr","ldt","le)","lea","leb","lec","led","lee","lef","leg","leh","lei","lej","lel","lem","len","leo","ler","les","let","leu","lev","lew","lex","ley","lfa","lfe","lfi","lfo","lfu","lga","lge","lgi","lgl","lgr","lgu","lha","lhe","lho","lia","lic","lid","lie","lig","lii","lim","lin","lio","lis","lit","liz","lje","lky","lk\u00fc","ll-","lla","llb","lld","lle","llf","llg","lli","llj","lll","llo","llr","lls","llu","llv","lly","lma","lmi","lms","lmu","lmx","lmy","lni","lo-","loa","lob","loc","lod","lof","log","loi","lon","loo","lor","los","lot","lou","lov","low","loy","lpa","lph","lpi","lra","lre","lri","lro","lru","lsa","lse","lsh","lsi","lsl","lsp","lss","lst","lsw","lsx","lta","ltb","ltc","lte","ltg","lth","lti","ltj","ltl","lto","ltr","lts","ltv","ltx","lu'","lu-","lub","luc","lud","lug","luk","lul","lum","lun","lup","lur","lus","lut","luv","lva","lve","lvi","lvo","lwa","lwe","lyb","lyc","lyd","lyg","lyh","lyi","lyn","lys","lyt","lyv","lyw","lyz","m's","mac","mad","mae","mag","mai","mak","mal","man","map","mar","mas","mat","mau","maw","max","mba","mbe","mbi","mbl","mbo","mbr","mca","mcl","mco","me-","mea","meb","med","mef","mei","mel","mem","men","meo","meq","mer","mes","met","mgl","mgr","mgu","mha","mhe","mho","mia","mic","mie","mig","mii","mil","min","mir","mis","mit","miw","miz","mje","mk.","mla","mlo","mma","mme","mmi","mmo","mna","mob","moh","moi","mon","mor","mos","mot","mou","mpa","mpe","mph","mpi","mpk","mpl","mpm","mpr","mra","mro","msa","msc","msh","mso","msp","msw","mto","mtr","muc","mud","mum","mur","mus","mwa","myn","myo","myt","m\u00e1x","n's","n(v","n)s","na-","naa","nab","nac","nad","nag","nah","nai","nak","nal","nam","nan","nap","nar","nas","nat","nau","naw","nax","nay","na\u00e7","nba","nbe","nbl","nbo","nbr","nca","nce","nch","nci","nco","ncr","ncu","ncy","nd'","nd-","nda","ndb","ndc","nde","ndf","ndg","ndh","ndi","ndm","ndo","ndp","ndr","nds","ndt","ndu","ndv","ndy","ne-","nea","neb","nec","ned","nee","nef","neg","neh","nei","nej","nek","nel","nem","nen","nep","ner","nes","net","nev","nex","ney","nfa","nfe","nfl","nfu","ng'","nga","ngb","ngc","ngd","nge","ngf","ngg","ngh","ngi","ngj","ngk","ngl","ngm","ngn","ngo","ngp","ngr","ngs","ngt","ngu","ngw","nha","nhe","nho","nia","nic","nid","nie","nif","nig","nii","nin","nip","nis","niv","nix","niy","niz","nja","nje","nka","nke","nki","nko","nla","nli","nlo","nma","nme","nna","nne","nni","nno","nob","noc","nof","nog","noh","noi","nom","non","nop","nor","nos","nou","nov","now","noy","npo","nqu","nra","nre","nri","nro","nru","nsa","nsb","nsc","nse","nsi","nsp","nst","nsu","nsw","nta","ntb","nte","ntg","nth","nti","ntj","ntl","ntm","nto","ntp","ntr","nts","ntu","ntw","ntz","nub","nug","nul","nup","nur","nuw","nuy","nva","nwa","nyj","nyn","nza","o'h","o's","o't","o-h","o-l","o:f","oab","oad","oaf","oah","oaj","oak","oar","oas","oat","oax","oba","obb","obe","obi","obl","obo","obr","obu","oca","oce","oci","ock","oco","ocr","ocu","ocy","oda","ode","odi","odl","odo","odr","ods","odu","odw","ody","oel","oen","oet","off","ofg","ofh","ofi","ofl","ofm","ofn","ofp","ofr","oft","ofw","og'","oga","ogb","oge","ogf","ogg","ogi","ogn","ogo","ogr","ogu","ogy","oha","ohe","ohi","oho","oib","oic","oid","oii","oil","oir","ois","oiv","oje","oka","okb","oke","oki","oks","okt","ola","old","ole","olh","oli","oll","olo","olt","olu","olv","oly","oma","omb","omc","ome","omg","omh","omi","omj","oml","omm","omn","omo","omp","omr","oms","omt","omx","om\u00e1","on'","ona","onb","onc","ond","one","onf","ong","onh","oni","onj","onk","onl","onm","ono","onq","onr","ons","ont","onu","onv","onw","onx","ony","ood","oof","ook","oom","oon","oos","oot","opd","ope","oph","opl","opo","opp","or'","or.","ora","orb","orc","ord","ore","org","ori","orj","orm","orn","oro","orp","orr","ors","ort","oru","orv","orx","ory","or\u00e7","os'","osa","osb","osc","osf","osg","osh","osi","osk","osl","osm","osn","oso","osp","osr","oss","ost","osv","osw","osx","ot'","ota","otb","otc","ote","otg","oth","oti","otj","otm","oto","otr","ots","ott","otu","otv","otx","oub","ouc","oud","oug","oul","oun","oup","our","ous","out","ova","ove","owa","owb","owc","owe","owf","owg","owh","owi","owj","owl","own","owo","ows","owv","oxh","oxi","oxy","oya","oyc","oye","oyg","oyh","oym","oyo","oys","oyv","oyx","oze","ozz","pac","pad","pag","pai","pal","pan","par","pat","pau","pav","paw","pdr","pe&","pea","pec","ped","pee","pei","pel","pen","pep","per","pes","pet","pfr","pha","phe","phi","phl","pho","phy","ph\u00e9","pic","pid","pie","pik","pin","pio","pip","pir","pit","pje","pki","pla","ple","pli","plo","plu","ply","pma","pno","poe","pof","poi","pol","pon","poo","pop","por","pos","pot","pou","pow","ppe","pra","pre","pri","pro","psi","pta","pte","ptu","puk","pul","pum","pun","pur","pyb","pys","qor","qua","que","qui","r\"d","r's","r(b","r)i","r-t","r.d","ra\"","ra'","ra(","raa","rab","rac","rad","raf","rag","rah","rai","raj","rak","ral","ram","ran","rao","rap","raq","rar","ras","rat","raw","rax","ray","raz","rba","rbe","rbl","rbo","rbr","rbs","rca","rce","rch","rci","rcl","rco","rcr","rdb","rdc","rdd","rde","rdf","rdg","rdh","rdi","rdl","rdm","rdr","rds","rdt","rdu","rdv","rdw","rdy","re'","re)","rea","reb","rec","red","ree","ref","reg","reh","rei","rej","rel","rem","ren","rep","rer","res","ret","reu","rev","rew","rex","rey","rfa","rfe","rfl","rfr","rfs","rga","rge","rgl","rgo","rgr","rgu","rgw","rha","rhe","rho","rhu","ria","rib","ric","rid","rie","rif","rig","rii","rik","ril","rim","rin","rio","rip","rir","ris","rit","riv","riw","rix","riz","rja","rje","rkf","rko","rks","rkt","rla","rlc","rle","rlf","rlo","rlr","rls","rlt","rlu","rlv","rly","rma","rmb","rmc","rme","rmg","rmh","rmi","rmj","rml","rmm","rmo","rms","rmw","rn'","rna","rnb","rnc","rne","rnf","rni","rnk","rnl","rnm","rno","rnp","rnr","rns","rnu","roa","rob","roc","rod","rof","rog","roi","rok","rol","rom","ron","roo","rop","ror","ros","rot","rou","rov","row","rox","roy","roz","rpa","rpe","rph","rpi","rpj","rpl","rpo","rpr","rqu","rra","rre","rri","rro","rru","rsa","rsc","rse","rsh","rsi","rsl","rso","rsp","rst","rsw","rsx","rta","rtb","rte","rth","rti","rtj","rtl","rto","rtr","rts","rtu","rty","rue","rug","rui","ruk","rul","rum","run","rur","rus","rva","rve","rvi","rvo","rwa","rwe","rxi","ryb","ryf","ryi","ryj","ryr","rys","ryu","rzu","r\u00e7o","r\u00edt","r\u00ed\u00f0","s'h","s(h","s(v","s.s","sab","sac","sae","sag","sai","sal","san","sar","sas","sat","sau","sav","saw","sax","sba","sbe","sbl","sbo","sbr","sca","sce","sch","sci","scl","sco","scr","scu","scy","sda","sde","sdo","sdr","sea","seb","sec","sed","seg","seh","sei","sej","sel","sem","sen","ser","set","sex","sey","sfa","sfe","sfi","sfl","sfo","sfu","sgh","sgl","sgr","sgu","sha","shb","shd","she","shg","shh","shi","shj","shk","sho","shr","shs","shu","shx","shy","sib","sic","sie","sii","sil","sim","sin","sio","siq","sis","siv","sja","sje","sk(","ska","ske","ski","skl","skn","sks","sku","skx","sky","sla","sle","sli","slo","slu","sma","smb","sme","smi","sms","sna","sne","sni","sno","soa","sob","soi","sol","som","son","sop","sor","sos","sou","spa","spe","sph","spi","spl","spo","spr","squ","sra","sre","sri","sro","sru","ssa","ssb","sse","ssf","ssg","ssh","ssi","ssj","ssl","sso","ssp","ssr","sst","ssu","ssy","st(","st)","sta","stb","ste","sth","sti","stj","stk","stl","stn","sto","stp","str","sts","stt","stu","stw","stx","sub","suc","sui","sum","sun","sup","sur","sus","suz","sva","sve","svi","swe","swi","swo","syf","syr","t&c","t's","t(h","t(v","tab","tac","tad","taf","tag","tai","tak","tal","tam","tan","taq","tar","tas","tat","tau","tax","taz","tba","tbl","tbo","tbr","tbu","tca","tch","tcl","tco","tde","tdr","tdu","tea","teb","tec","ted","tee","tef","tei","tej","tek","tel","tem","ten","teo","ter","tes","tet","tex","tfl","tga","tgl","tgr","tgu","tha","thb","thc","thd","the","thf","thg","thh","thi","thj","thl","thm","tho","thp","thr","ths","tht","thu","thv","thw","thx","thy","tia","tib","tic","tid","tie","tif","tig","tih","tii","til","tin","tio","tip","tis","tit","tiv","tiz","tja","tje","tki","tla","tle","tli","tlo","tma","tmi","tni","tno","to'","toa","tob","tod","tof","toi","tom","ton","too","tor","tos","tot","tou","tov","tow","tox","tpl","tpo","tpr","tra","tre","tri","tro","tru","ts(","tsa","tsc","tsh","tsi","tsl","tsp","tsq","tss","tst","tsu","tsw","tsx","tta","tte","tth","tti","ttl","tud","tun","tur","tus","tut","tva","tve","twi","twr","twy","tyb","tyc","tyh","tyj","tym","typ","tyr","tze","tzk","u's","u-y","ual","uar","uaw","uax","ubb","ubi","ubl","ubo","ubr","uca","uch","uck","ucl","uco","ucr","uda","udb","udd","ude","udg","udh","udr","uds","udt","uee","uej","uer","ues","uez","ufl","uga","ugc","uge","ugg","ugh","ugi","ugj","ugl","ugm","ugr","ugs","ugw","uha","uhe","uho","uhy","uic","uid","uie","uii","uil","uir","uis","uit","uka","uke","uki","ukr","uku","uld","ule","ulg","uli","ull","uln","ulo","ulp","ulr","ult","ulu","ulv","um'","uma","umb","umi","uml","umm","umo","ump","ums","un(","una","unb","unc","und","une","ung","unh","uni","unj","unl","unn","uno","unr","uns","unt","unu","unv","uoh","uoi","uor","upe","upi","ura","urb","urc","urd","ure","urg","urh","uri","url","urm","urn","uro","urp","urr","urs","urt","urv","ury","usa","usb","usc","use","usf","usg","ush","usi","usj","usk","usl","usm","uso","usp","usr","ust","usu","usv","usy","utb","utc","ute","uti","uto","utr","uts","utt","uva","uwa","uwh","uye","uzu","v)s","vac","vad","vah","vai","val","vam","van","vap","var","vas","vat","ve'","ve-","ved","vee","veg","vei","vej","vel","ven","vep","ver","ves","vev","vic","vid","vil","vin","vip","vis","viz","voj","vol","vor","vta","vyb","wa'","wab","wag","wah","wai","wak","wal","wam","wan","war","was","wat","wax","wbl","wbo","wch","wcl","wdr","wea","web","wee","weh","wei","wel","wer","wfa","wfe","wfi","wgl","wgu","whe","whi","wid","wif","wii","wil","win","wio","wir","wis","wit","wiv","wje","wkr","wks","wle","wli","wnb","wni","wnp","wnr","wns","wnt","wof","woi","woo","wor","wro","wsc","wsh","wsi","wsl","wst","wto","wyr","wyv","xar","xbl","xbr","xcl","xco","xdi","xeb","xei","xel","xen","xeo","xes","xev","xfu","xgl","xgn","xgr","xgu","xha","xhe","xho","xic","xii","xil","xim","xio","xka","xla","xma","xor","xpa","xpe","xpl","xsa","xsk","xsl","xsw","xta","xte","xtr","xwa","xwh","xys","y's","y-h","ya-","yad","yak","yal","yam","yba","ybe","ybl","ybo","ybr","ybu","yca","ycl","yco","yda","yei","yej","yek","yel","yer","yet","yfl","yfr","yga","ygl","ygr","yha","yhe","yii","yin","yje","yle","yma","ymo","yne","yni","yob","yoh","yon","ype","ypl","ypn","ypo","yra","yri","yrm","ysa","yse","ysh","ysi","ysm","ysp","yss","yst","yta","yte","yth","ytr","ytu","yup","yur","yva","yve","ywa","yze","zab","zah","zam","zan","zar","zeb","zed","zei","zej","zel","zen","zer","zes","zin","zkr","zoo","zor","zua","zub","zuc","zud","zuf","zug","zuh","zuk","zum","zun","zur","zus","zut","zuv","zyc","zza","\u00e1xi","\u00e3o\"","\u00e3o)","\u00e3oa","\u00e3od","\u00e3og","\u00e3oh","\u00e3oj","\u00e3om","\u00e3or","\u00e3os","\u00e3ot","\u00e3ov","\u00e3ow","\u00e7oc","\u00e7od","\u00e7\u00e3o","\u00edti","\u00ed\u00f0r","\u00f0r'","\u00fcre"];
+
+// Delta-encoded document numbers for each trigram, in the same order as searchTrigrams
+export const searchPostings: Readonly<Readonly<number[]>[]> = [
+    [1396],
+    [2983],
+    [2962],
+    [3013,73],
+    [2961],
+    [1998,1,875],
+    [2078],
+    [1838,1,1,493,486],
+    [1117,1,97,337,372,268,197,1,364,1,128,22,1,1],
+    [302,295,376,143,139,165,345,1,1,264,31,149,91,10,22,117,191,1],
+    [1234,205,1,1,625,244,1,394,112],
+    [70,56,88,901,409,541,519,332],
+    [927,5,5,5,476,1,131,1,236,544,375,35,79,76,1],
+    [303,295,376,145,716,1,264,1,701,55,29,77,1],
+    [299,209,4,6,2,2,72,184,4,6,2,2,132,5,5,5,31,673,145,360,1,555,9],
+    [1394],
+    [2332],
+    [1433,1,55],
+    [1579,679,112,1,368,1],
+    [300,295,376,1365,518,38],
+    [2454],
+    [511,10,260,10,1403],
+    [510,270,146,5,5,5,300,1,196,139,1,250,922,130],
+    [509,10,260,10,592,141,267,37,1,759,50,1,174,60,43,1],
+    [1213,1,39,1,269,468,268,1,193,425,1,81],
+    [68,1961,1,72,89,2,179,80,102,31,163,1],
+    [301,295,376,1407],
+    [2644],
+    [2000],
+    [117],
+    [3105,124,204],
+    [3108,438],
+    [513,1,1,1,1,266,1,1,1,1],
+    [513,1,1,1,1,266,1,1,1,1],
+    [3230,84,120,113],
+    [3106,125,82,122],
+    [3107,438],
+    [503,1,1,1,1,266,1,1,1,1],
+    [503,1,1,1,1,266,1,1,1,1,1848,1,1,1],
+    [2626,1],
+    [146],
+    [2078],
+    [1392,1,1680],
+    [2013,1],
+    [2531,1],
+    [478,1,1,1,1,328,1,1,1,1,73,1,1,1,1,2250,33,45,9,62,90,3,37,29,48,4,19,4],
+    [373,1,1,1,1,257,1,1,1,1,390,1,1,1,1,2013,85,58,68,54,109,115],
+    [2078],
+    [1392,1,1680],
+    [1959,1],
+    [453,1,1,1,1,258,1,1,1,1,2284,85,95,29,53,34,128,113],
+    [351,1,1,1,1,388,1,1,1,1,353,1,1,1,1,1923,89,126,127],
+    [508,10,260,10],
+    [116],
+    [373,1,1,1,1,257,1,1,1,1,390,1,1,1,1,2013,85,58,68,54,109,115],
+    [2357,1,1,1,1,1,109,1,1,1,1,1],
+    [2606,1,1,1,1,1,43,1,1,61,1,1,1,1,1,1,1,1,1,1,1,109,1,1,1,1,1],
+    [2389,1],
+    [106],
+    [2098],
+    [351,3,389,2,1,354,1,1,1,1],
+    [73],
+    [3074,488],
+    [3074,488],
+    [2983],
+    [934,2,1,2,2,1,292,147,13,128,1,1,119,144,1,1,135,138,129,1,1,1,137,1,1,1,117,1,1,1,130,1,119,1,1,111,2,1,140],
+    [3105,124,204],
+    [3108,438],
+    [3230,84,120,113],
+    [3106,125,82,122],
+    [3107,438],
+    [373,1,1,1,1,257,1,1,1,1,249,1,1,1,1,137,1,1,1,1,2013,85,58,40,28,34,20,70,39,30,48,23,14],
+    [2470],
+    [1686,1],
+    [2138],
+    [889,1992,1],
+    [1594,629],
+    [1472,1,1,1351,1],
+    [1274,1,1],
+    [440,358,503,1,41,1,33,1,4,279,43,1,1,40],
+    [2489,1],
+    [62,40,472,1,1,1,1,304,1,1,1,1,252,97,1,26,1,1,1,1,1,67,1,11,1,199,61,1,1,73,77,1,1,83,1,1,146,1,17,1,1,16,366,40,1,99,1,7,93,152,3,121,1,100,86,41,48,26,50,44,43,43,31,76,38],
+    [370,253,376,139,544,346,514,75,18,189,24,75,1,1,1],
+    [286,57,23,1,1,1,1,45,80,45,41,30,8,1,1,1,1,127,72,25,88,5,55,1,1,1,1,86,22,164,1,1832,1,1,1,1,119,2,1,1,81,1,1,118,1,1,1,109,1,1,1],
+    [226],
+    [2785,1],
+    [1230,2,142,2,142,2,116,2,142,2,81,54,2,139,2,125,2,138,2,121,2,131,2,114,2,115,2,140,2],
+    [2357,1,1,1,1,1],
+    [463,1,1,1,1,333,1,1,1,1,105,1115,718,1,257,57,87,115,37,93,22],
+    [133,105,48,15,5,5,5,5,5,5,27,17,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,25,10,10,10,5,5,5,5,6,5,5,5,5,15,5,5,20,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,5,20,12,5,5,5,15,17,5,25,11,15,5,11,14,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,37,5,23,1,1,216,1,111,1,495,73,1,27,1,1,728],
+    [343,5,130,1,1,1,1,8,5,116,5,194,1,1,1,1,28,5,238,5,523,1,102,1,147,1,1,219,1,1,1,1,113,1,1,1,60,1,1,134,1,1,116,1,271,1,1,68,1,1,1,115,1,1,160,33,45,164,37,81,23],
+    [205,700,460,618,1,1],
+    [0,1,1,1,1,1,1,1,1,215,191,335,357,101,1,7,133,152,1,1,210,188,1,1,129,47,90,1,1,394,1,368,1,1],
+    [1130,1,1,1,1,1,42,39,1,1,800],
+    [369,115,2,55,81,147,2,52,67,17,91,769],
+    [345,152,116,236,59,179,708,1,1,266,1,532],
+    [538,1,1,1,1,278,1,1,1,1,376,1799,44,34,55,40,49,52,25,54,33,24,39,55,20],
+    [955,1,1,1,1],
+    [478,1,1,1,1,328,1,1,1,1,73,1,1,1,1,632,90,1,102,1,147,1,1,535,1,1,116,1,37,234,1,1,68,1,1,1,158,46,45,28,10,23,22,23,9,9,43,10,30,42,18,3,16,21,20,9,26,22,4,9,10,4,29],
+    [892],
+    [18,27,1,65,33,379,1,1,1,1,328,1,1,1,1,277,1,5,1,1,3,1,1,4,1,1,1,1,1,1,1,1,2,1,1,4,3,1,8,1,7,1,3,1,1,1,2,1,8,1,1,9,4,1,1,6,5,1,8,1,1,16,1,1,1,1,1,6,13,1,1,6,16,1,2,1,1,1,1,1,16,1,11,1,21,12,7,8,2,1,1,1,1,1,15,25,1,40,4,1,24,13,16,1,1,1,1,1,67,1,1,1,1,11,1,1,4,1,1,1,1,10,20,1,1,1,1,1,13,1,1,86,106,1,1,85,82,130,178,1,1,1,1,1,11,1,12,1,1,1,1,4,3,3,13,1,5,1,1,21,1,1,2,1,18,1,5,1,1,1,1,1,22,1,1,3,52,1,1,122,1,1,1],
+    [151,78],
+    [289,5,143,147,5,206,165,5,15,1231,1116],
+    [99,1081,39,1,481,1,173,494],
+    [191,37],
+    [1157,1,627],
+    [1840],
+    [19,384,1,1,1,1,257,1,1,1,1,405,1,1,1,1,107,1,1,38,112,220,1,354,164,244,256,73,1,42,315,85,75,137,72,38,72],
+    [1120,1,1,1,1,604,670,1],
+    [65,23,196,295,376],
+    [96,1514,1],
+    [2808],
+    [2831,1,1],
+    [2467],
+    [2537,1,1],
+    [2639,1,1],
+    [2817],
+    [344,144,1,1,1,1,4,116,228,1,1,1,1,4,238,1735,1,335,248],
+    [2527],
+    [58],
+    [441,358],
+    [2525,1,47,1,1,15,1],
+    [18],
+    [416,335,357],
+    [55,129,1168,1],
+    [217,68,295,333,743,1,1,830],
+    [561,308],
+    [562,308],
+    [1474],
+    [558,177,215,1,1,1,1,302,1,1,1,1,1,43,1,79,1,12,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,129,1,1,1,1,1,47,1,83,1,1,1,1,1,136,1,1,1,1,1,128,1,1,1,1,1,119,15,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,87,1,24,1,1,1,1,1,16,73,3,2,21,1,1,1,1,1,80,40,22,1,1,1,1,1,42,44,44,42,41,41,44,41,42,37,39,35,37,45],
+    [309,1,1,1,1,58,1,70,121,66,1,1,1,1,59,1,1,177,139,1,1,11,1,1,1,1,182,230,1,1,80,38,1,4,12,284,1,1,1065,1,85,40,33,7,97,28,128,197],
+    [559,308],
+    [19,1336,1,296,550,1,1,1,7,1,1,1,1,1,271,105,1,1,1,364,365,119],
+    [368,71,182,176,107,93,544,1,1,1,1,932,1,1,1,1,1,40,1],
+    [560,308,252,1,1,1,1],
+    [528,1,1,1,1,330,1,1,1,1,2152,45,46,37,45,41,43,40,42,38,41,34,36,42],
+    [319,1,1,1,1,326,1,1,1,1,390,1,1,1,1,78,1,1,1,1,92,191,1,473,1,1,1,109,1,1,522,1,1,493,18,110,80,131,65,84],
+    [2117,1,1,5,1],
+    [542,282,67,15,893,1,1,575,1,1,440],
+    [867,1,1,1,1,815,1],
+    [361,1,319,1,2309,110,62,105,109,49,28],
+    [910,898,1,1,1,1,1,30,54,1],
+    [4,9,30,98,31,9,82,20,969,144,253,457,1,149,1,171,1,1,536,17,122,68,56,113,49,42],
+    [2723,1,1,1,1,1],
+    [366,1,1,1,1,43,206,1,1,1,1,125,247,1,1,1,1,106,839,1,1,1,1,1,103,1052,1,1,1,1,119,2,1,1,81,1,1,118,1,1,1,109,1,1,1],
+    [284,153,101,41,216,25,67],
+    [1210,1,1],
+    [413,1,1,1,1,66,265,1,1,1,1,16,337,1,1,1,1,981,6,1105],
+    [1381,875,1,27],
+    [1280,1],
+    [1248,36,6,18,15,33,301,100,218,132,386,18,250,65],
+    [2793],
+    [428,1,1,1,1,331,1,1,1,1,1413,1,287,1,937],
+    [294,1,1,1,1,2,5,5,5,5,5,5,27,6,11,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,55,5,5,5,5,6,5,5,5,14,1,1,1,1,2,5,5,20,5,5,5,5,5,5,5,5,5,14,5,7,5,5,5,5,5,5,5,8,25,37,5,5,5,5,5,5,5,32,5,5,5,5,10,17,5,25,20,1,1,1,1,2,5,11,5,9,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,42,523,106,1,261,222,1,189,360,105],
+    [1068,1,1,1,1],
+    [112,24,118,40,1,1,1,1,120,171,1,1,1,1,160,212,1,1,1,1,490,96,31,1,66,1,1,57,677,1,102,1,135,106,118,1],
+    [508,10,260,10,162,669,1,42,1,555,1,1,1,1,621,1,1,1,1],
+    [914,1,1,1,1,207,1,1,1,1,1259],
+    [64,849],
+    [2477,1,1,1,1,1,12,1,1,19,1,1,2,1,2,1,4,1,1,1,1,1,1,7,1,1,37,1,1,1,1,5,9,1,1,1,1,1,1,1,1],
+    [414,335,143,1,1,1,1,210,407,1,1,540,637,1,116,1,1,208,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [277],
+    [2445],
+    [512,10,260,10,104,245,157,1,332,1],
+    [1273],
+    [1183],
+    [1576],
+    [75,1195,186,177,58,31,128,43,148,1,21,67,1,1,126,117],
+    [2515],
+    [887,1,1,1,1,407,1,230,156,1543,62,90,69,48,23],
+    [483,1,1,1,1,281,1,1,1,1,2708],
+    [383,1,1,1,1,267,1,1,1,1,229,1,1,1,1,162,1,1,1,1,124,1,89,1,447,1,1,126,1,1,48,1,1,197,298,119,1,103,161,73,154,29,95,46,39,14,62,54,36,38,31,48,23],
+    [1139,1],
+    [1283,1,1],
+    [682,1592],
+    [2667,1],
+    [1838,1,1,419,1],
+    [2606,1,1,1,1,1],
+    [73],
+    [62,31,811,1,1,1,1,236,36,521,1,93,1,1,41,1,1,59,133,1,312,1,676,46,45,38,45,41,43,40,42,37,41,35,35,43],
+    [737,632,1,1,612,1,133,369,1,62,1,2,1,185],
+    [736,688,1,25,141,56,338,356],
+    [37,304,1,1,1,1,264,1,1,1,1,470,1,1,1,1,477,1319],
+    [38,73,33,144,295,372,1,1,1,1,271,130,14,144,118,58,86,137,141,83,44,140,25,22,34,42,103,30,67,1,8,40,78,24,15,142],
+    [1618,782],
+    [1230,144,144,118,144,57,80,141,53,74,102,38,123,79,54,116,117,142],
+    [1589,1],
+    [103,5,1945,1,1,352,1,102,1,1],
+    [204,11],
+    [1195,1,934,1,260,270,1,1],
+    [23,82,12,26,10,4,45,17,28,77,1,1,1,1,60,1,1,1,1,207,1,1,1,1,97,1,1,1,1,271,1,1,1,1,79,1,1,1,1,364,274,53,1,384,129,11,1,1,406,1,197,1,131,42,24,61,42,41,45,34,49,75,40,73],
+    [564,1,1,1,1,304,1,1,1,1,410,1,564,1,104,1,311,1,216,91,1,1,67,1,393,82,94,32,96,114,74],
+    [528,1,1,1,1,16,1,1,1,1,278,1,1,1,1,28,1,1,1,1,328,9,224,1,173,1,1,555,126,52,625,50,7,30,15,26,20,29,8,38,7,15,26,35,8,34,6,16,26,31,7,20,21,29,5,36,27,15],
+    [355,392,197,1,1,1,1,156,128,47,97,6,1,137,118,117,27,137,141,127,112,28,123,133,116,36,1,1,79,142,67,46,44,39,44,41,44,40,42,37,40,36,35,43],
+    [1662,1,2,1,400,392,230,100,1,642],
+    [2126],
+    [188,2713],
+    [6,9,182,2909,125,26,56,110,12],
+    [433,79,10,6,1,1,1,1,7,243,10,29,40,1,1,1,1,1,22,8,1,1,1,1,1,84,646,1,434,755,1,196,45,46,37,45,41,43,40,42,38,41,34,36,42],
+    [155,80,66,10,5,5,5,5,49,15,5,10,35,5,5,5,15,50,10,31,10,20,5,5,25,10,5,5,10,10,26,10,5,10,5,13,67,10,40,17,10,15,17,56,5,30,18,10,5,5,5,15,15,42,709,412,1,1,1,261,1,1,37,1,250,1],
+    [33,870,6,1,1,1,1,202,1,1,1,1,485,1,41,1,509,1,70,1,1,477,114,29,1,45,129,46,4,79,85,44,40,42,37,40,36,35,43,7],
+    [97,1,1532,184,1,61,1,1,102,1,51,1,306,1,69,513,246],
+    [138,31,91],
+    [20,73,1117,1,1,113,1,1,157,1,1,109,1,1,347,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,2,9,13,1,1,10,1,1,4,1,2,1,1,1,1,7,1,1,1,1,7,1,1,1,1,1,4,1,1,1,1,1,1,1,1,4,1,2,2,7,11,1,1,1,1,1,43,1,1,159,1,1,247,1,1,119,1,1,97,1,1,161,1],
+    [1300,383,1,391,517,186],
+    [1256,1,1,1,1,1,136,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,30,99,1,1,1,1,1,131,1,1,1,1,1,29,107,1,1,1,1,1,54,74,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,102,1,9,1,1,1,1,1,115,1,1,1,1,1,127,15,1,1,1,1,1,42,44,44,42,41,41,44,41,42,37,39,35,37,45],
+    [1237,1],
+    [284,1,1,1,1,291,1,1,1,1,372,1,1,1,1,171,1,1,1,1,1,63,1,63,1,1,1,1,1,127,9,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,129,1,1,1,1,1,131,1,1,1,1,1,136,1,1,1,1,1,128,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,112,1,1,1,1,1,115,1,1,1,1,1,142,42,44,44,42,41,41,44,41,42,37,39,35,37],
+    [2379],
+    [403,1,1,1,1,126,1,1,1,1,127,1,1,1,1,147,1,1,1,1,254,1,1,1,1,62,1,44,1,1,103,1,17,1,14,1,1,10,1,77,1,179,1,90,1,648,156,518,8,36,41,9,36,30,56,32,46,3,45,27,38,12,36,24,6,50],
+    [470,262],
+    [9,1,1,1,1,1,1,1,1,7,5,30,12,1,29,3,16,101,194,56,262,17,357,287,2,284,1,1,10,1,1,4,1,1,1,1,5,1,8,1,2,1,1,1,1,1,2,1,1,4,1,2,1,7,1,1,8,1,5,1,15,1,1,3,2,1,1,1,13,1,1,1,7,1,1,1,1,1,12,7,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,4,1,1,1,4,1,1,1,1,1,1,1,2,1,1,1,6,12,1,1,10,1,2,1,1,1,1,1,1,1,4,4,1,10,1,1,1,1,1,488,1,1,31,42,458],
+    [55,129,171,392,346,1,10,133,155,1,48,27,171,1,5,180,308,1,1,3,120,38,39,130,1,228,124,39,216],
+    [1141,189,235,1,487,1,1,400,4,1],
+    [1740],
+    [107,327,38,216,46,158,1,1,1,1,95,187,1,12,1,321,1,1,127,23,1,1,73,47,42,1,225,523,114,1,116,1,1,208,45,35,11,37,45,41,44,31,8,42,38,41,34,36,43],
+    [468,262,1294],
+    [27,1108,132,18,37,1,85,138,133,134,136,141,133,139,120,129,117,120,53],
+    [206,327,1,1,1,1,278,1,1,1,1,2195,36,50,36,86,32,46,48,77,36,30,50],
+    [2683,1],
+    [469,262],
+    [518,1,1,1,1,266,1,1,1,1,723,331,83,1,364,1,381,1,65,1,1,18,6,23,1,20,1,2,8,8,1,4,18],
+    [1412,1,404,1,939,1,1],
+    [730,1,1,1,1,543,1,787],
+    [275,2,1,15,5,165,1,1,1,1,20,1,1,1,1,1,96,5,179,28,1,1,1,1,36,1,1,1,1,125,15,206,93,1,50,1,11,1,1,37,354,56,1,1,281,21,437,249,1,1,126,87,9,38,9,1,38,49,13,48,54,37,5,38,33,17,16,6,6,45,24,13,33],
+    [1496,2,2,1,2,2,2,1],
+    [176,98,1655,1,1310,239],
+    [287,295],
+    [893,58,283,147,141,121,144,137,138,129,1,139,1,119,1,132,1,119,113,1,142,62,46,45,38,45,41,43,40,42,37,41,35,35,43],
+    [334,1,339,1,418,1,1202,677,1,52,173,125,235],
+    [1633,1342],
+    [205,282,285,373,1,1,103,1,224,1,568,1],
+    [1339],
+    [2497],
+    [2192],
+    [73,9,1,1386,1,1,22,1,165,1,835,1,49,48,1,1,199,1],
+    [187],
+    [1318],
+    [64],
+    [1156,336,548],
+    [30,2359,1,585],
+    [1417,195],
+    [22,84],
+    [1396],
+    [6,9,51,131,80,282,1,1,1,1,304,1,1,1,1,274,1,1,103,1,1,96,127,1,118,305,93,1,51,1,51,217,1,1,16,63,198,25,161,73,128,1,1,10,110,5,57,68,26,11,45,64,46,3,9,19],
+    [285,244,51,283,93,155,61,1,160,62,344,1,98,1,1,39,94,21],
+    [674,1,450,1,1,1,1,702,624,426,1,26,1,57],
+    [26,27,1,20,59,2,1,1,1,1,1,1,5,2,2,1,6,1,2,1,3,2,7,1,1,1,1,1,1,1,1,25,166,321,196,21,101,266,1,76,99,3,105,175,101,169,141,236,1,28,9,27,2,6,220,1,1],
+    [92,763,1,1,1,1,1,44,441,184,154,1,540,1,110,258,1,1],
+    [284,295,376,1291,495],
+    [28,131,54,220,105,1,1,1,1,278,1,1,1,1,37,124,394,673,86,547,314,44,34,55,40,49,52,3,22,54,33,24,39,55,20],
+    [1970],
+    [458,1,1,1,1,11,1,1,1,1,248,1,1,1,1,76,1,1,1,1,549,1,113,1,80,1,1,119,1,1,1,18,1,8,1,4,6,22,2,1,7,1,14,1,9,1,5,1,2,5,4,12,1,1,1,21,1,167,25,1,1,48,1,27,1,11,1,85,1,78,250,146,1,95,1,1,192,23,21,34,13,39,33,48,11,27,46,11,25,4,41,37,3,52,38,1,20,6,32],
+    [1162,178,1,20,334,1,1199,35,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [423,1,1,1,1,331,1,1,1,1,459,1142,1,1,551,370,228],
+    [889,223,13,1,1,1,1,826,16,150,1,80,1,1,1,205,1,1,22,1,1],
+    [417,335,357,63,1,206,42,1,44,1,1,284,127,871,19,1,661],
+    [44,40,11,26,73,37,1592,1,66,1,1],
+    [1423],
+    [393,1,1,1,1,308,1,1,1,1,354,1,1,1,1,48,89,1,272,248,155,1,165,385,1,197,1,1,61,1,45,76,2,9,1,168,43,60,79,47,51,28,43,47,61],
+    [584,5,206,1012,165,280,155,1],
+    [21,22,32,136,1036,1,1,454,523,226,253,60,54,209,529],
+    [1298,1,332,1,1],
+    [31,1,233,1336,1,76,47,81],
+    [934,1,1,1,1,1,1,1,1,1,1373,705,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [960,5,15,1353],
+    [314,1,1,1,1,326,1,1,1,1,390,1,1,1,1,313,1,1,883,1,1,503,1,1,125,1,1,185,76,123,35,42,153,39],
+    [458,1,1,1,1,263,1,1,1,1,183,431,1,365,310,1,1,76,1,101,1,1,130,707,133,95,25,85,91,26],
+    [897,1,1,1,1,1354,196],
+    [1688,981],
+    [354,392,166,191,85,24,112,12,13,1,1,60,70,1,4,93,15,3,10,1,1,146,218,10,1,5,1,25,6,14,1,207,1,1,20,1,19,1,1,3,1,1,1,92,16,1,38,1,98,220],
+    [156,81,2179,1],
+    [433,1,8,61,10,175,6,79,10,78,124,6,21,98],
+    [485,285,141],
+    [1250,1,1],
+    [1674,1,1,1,1,1,70,954],
+    [506,10,15,245,10,79,138,5,8,100,685,408,1,65,1,475,1,1],
+    [8,9,13,1,30,6,1,83,32,12,34,46,627,23,5,5,5,340,1,1,46,1,1,114,312,1,1,67,58,1,150,300,102,150,1,44,101,1,54,7,1,1,94,1,16,44,1,1],
+    [97,270,71,182,176,200,145],
+    [1403,1,1,1,1,1,125,1],
+    [1253,1,1],
+    [22,1194,1,1,71,1,17,1,14,1,1,31,1,275,1,139,263],
+    [309,1,1,1,1,316,1,1,1,1,390,1,1,1,1,182,323,586],
+    [1562,1,26,1,8,1,1,697,1,415],
+    [1227,144,406,137],
+    [1,9,53,55,40,20,7,83,12,55,2,87,24,1,1,1,1,223,2,33,1,1,1,1,45,166,5,5,5,154,2,223,1,1,115,1,626,1,535,52,1,111,1,1,37,277,8,161,84,118,54,18],
+    [66,15,17,16,35,90,50,1,1,1,1,49,76,1,1,1,1,46,1,1,1,1,22,39,1,1,1,1,11,1,1,1,1,32,1,1,1,1,22,120,1,1,1,1,19,1,1,1,1,58,1,1,1,1,11,1,1,1,1,12,14,42,58,1,1,1,1,120,119,40,829,1,1,84,69,1,1,1,274,1,1,84,1,82,1,1,334,2,3,33,1,2,22,17,6,5,36,2,46,21,1,16,32,13,18,15,1,8,22,8,9,20,4,16,27,2,8,18,18,1,3,21,5,41,1,8],
+    [94,64,110,36,1,1,1,1,316,1,1,1,1,390,1,1,1,1,1127,193,1,7,112,1,325,1],
+    [1732,1,282,605],
+    [1974,1],
+    [720,1,1,1,1,401,109,652,1,1,324,1,1,1,1,1,634,159,45,85,198,49,77],
+    [1961],
+    [1889,1101,8,1,14,8,1,1,5,4,11,13,10,2,1,7,1,9,18,8,1,1,6,12,17,2,1,10,3,7,22,2,1,4,2,18,6,8,2,7,26,3,3,3,1,1,7,10,14,6,2,1,4,4,22,1,8,2,1,8,14,13,1,1,8,1,23,7,1,4,3,1,4,21,2,1,4,2,17,4,6,1,1,8,4,21,8,1,1,3],
+    [619,124,5,102,288,12,78,1,2,299,1,203,1259],
+    [0,1,1,1,1,1,1,1,1,215,1634,1,1,67,957],
+    [1177,572,94,175,108,419],
+    [378,1,1,1,1,257,1,1,1,1,390,1,1,1,1,155],
+    [995,105,5],
+    [2344],
+    [1417],
+    [1240,147,262,142,137,140,130,140,251,121,256],
+    [926,1,4,1,4,1,4,1,184,932,2,215,1,228,1,1,70,1,174,1,1],
+    [371,159,162,172,146,487,2,3,2,2,3,1170,1,1,5,1,95,1],
+    [1000,1,1,1,1,64,1,1,1,1],
+    [2191],
+    [1493,1,875,155],
+    [303,5,5,5,5,5,5,8,19,5,12,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,11,14,10,15,5,5,5,5,5,6,5,5,5,20,5,5,1,19,5,5,5,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,5,6,21,5,5,5,5,5,10,17,5,25,26,5,11,4,10,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,1,36,5,6,1,1,1,1,1,42,6,4,45,24,1,1,1,1,1,43,1,40,246,645,3,610,1,4,32],
+    [2009,110],
+    [1148,1,40,1],
+    [2494],
+    [1319,1,94,10,1,105,1,91,1,832],
+    [123,85],
+    [1391,250],
+    [201],
+    [1571,1,150,128,866,139,1],
+    [1388,1,1,180,16,1,63,1,1],
+    [2449],
+    [2982],
+    [946],
+    [947],
+    [1142,1,1,448,1,1,45,1,578,1,1,1,1,1,8,1,1,4,1,2,1,6,1,1,1,1,1,4,1,2,1,8,1,1,1,1,1,2,1,2,1,1,2,1,1,10,1,5,1,6,1,5,1,1,2,1,2,1,2,1,1,1,1,1,1,8,2,1,5,1,34,1,1,37,1,22],
+    [948,1387],
+    [944],
+    [69,2130,1,87,152,28],
+    [945],
+    [610,5,226,5],
+    [3025,46,44,39,44,41,44,40,42,37,40,36,35,43],
+    [1084,5],
+    [1139,1],
+    [1183,90,303,698,241,340,1],
+    [510,270,472,125,1,1,260,1,1,142,1,404,1,1,138,1,1,370,1,1,101,1],
+    [1239,1],
+    [1115,1,1,1,1],
+    [2501,1],
+    [137,31,91,660,1,1,1,1,456,237,1,24,144,135,1,1,268,40,100,333,39,184,181,83,45,41,83,42,113],
+    [217,1233],
+    [84,106,980,287,1,1,63,175,1063,1,29,35,1],
+    [950,1,1,1,1,274,1,143,1,22,1,120,1,117,1,133,1,1,1,7,1,136,1,140,1,126,1,139,1,122,1,132,1,115,1,116,1,141,1,27,1],
+    [2587],
+    [89],
+    [1704,1,1],
+    [2211,1116],
+    [309,1,1,1,1,316,1,1,1,1,390,1,1,1,1,833,1,1,136,1,1,117,1,1,5,1,397,1,404,1,125,40,97,28,128,197],
+    [23,1815,1,1,496,463],
+    [1515,944,1],
+    [2192],
+    [26,367,1,1,1,1,76,1,1,1,1,228,1,1,1,1,96,1,1,1,1,254,1,1,1,1,105,1,160,21,67,1,44,1,1,4,1,1,3,248,14,1,139,1,1,113,52,63,1,311,10,1,197,1,1,61,1,45,76,2,178,10,33,14,39,7,26,53,6,27,14,32,19,21,7,34,9,28,19,36,25,13,21,38],
+    [458,1,1,1,1,263,1,1,1,1,599,1,1,277,1,101,264,10,1,35,1,1,76,1,940,133,95,25,85,91,26],
+    [1480,870,533],
+    [1126],
+    [2524],
+    [2501,1],
+    [919,1,1,1,1,456,262,144,135,1,1,268,140,372,58,1,64,1,241,83,45,41,83,42,113],
+    [2208],
+    [1274,1,1],
+    [29,101,32,71,12],
+    [1436,1,58,497,1,1,75,1,1,880,1,1],
+    [2208],
+    [1872],
+    [2288,1,1],
+    [292,5,143,147,5,206,165,5,15,135,586,1,1,385,1,1,1,1,110,217,1],
+    [2911,1],
+    [166,60,32,480,1,1,1,1,559,1,41,1,25,1,1,6,1,4,279,85,85,55,1,1,1,354,1,1,1,240,1,20,1,1,37,1],
+    [779,10],
+    [478,1,1,1,1,328,1,1,1,1,2327,33,45,164,37,81,23],
+    [2138],
+    [322,330,394,175],
+    [323,330,394,318],
+    [319,330,394],
+    [1479,35,976],
+    [320,330,394],
+    [1953,1,349,1,1],
+    [448,1,1,1,1,130,67,1,1,1,1,57,1,1,1,1,67,10,2011,146,1,1,129,169,84,118,54,18],
+    [155,80,1039,1,1,1116,1,404,1,219,18,110,80,131,65,81,3,44],
+    [321,330,394],
+    [1043,1,1,1,1],
+    [8,9,94,26,7,24,27,64,16,861,1,5,1,1,3,1,1,4,1,1,1,1,1,1,1,1,2,1,1,4,3,1,8,1,7,1,3,1,1,1,2,1,8,1,1,6,3,4,1,1,6,5,1,8,1,1,16,1,1,1,1,1,6,13,1,1,6,16,1,2,1,1,1,1,1,16,1,11,1,33,7,8,2,1,1,1,1,1,15,25,1,7,37,1,12,1,1,23,16,1,1,1,1,1,67,1,1,1,1,11,1,1,4,1,1,1,1,10,20,1,1,1,1,1,13,1,1,24,113,58,1,16,1,1,266,1,1,60,127,1,1,1,1,1,11,1,12,1,1,1,1,4,3,3,13,1,5,1,1,22,1,2,1,18,1,5,1,1,1,1,1,22,1,1,3,61,1,66,32,69,1,54,3,100,1,42,1,1],
+    [33,9,20,40,28,32,71,12,258,1,1,1,1,266,1,1,1,1,361,386,97,61,310,1,35,167,270,1,76,93,72,145,1,61,1],
+    [24,1528,1,1,1,539,1,182,389,10,1,1],
+    [574,1,1,1,1,304,1,1,1,1,426,4,1,290,1,1,150,1,1,83,1,1,149,1,1,13,1,1,7,1,402,1,11,1,99,1,14,1,1,360,1,100,86,41,48,26,50,44,43,43,31,76,38],
+    [25,202,1726,1,32,1,20,1,1,13,1],
+    [29],
+    [366,1,1,1,1,249,1,1,1,1,372,1,1,1,1,2105,1,1,1,1,119,2,1,1,81,1,1,118,1,1,1,109,1,1,1],
+    [1238],
+    [2920,1],
+    [139,31,91,970,37,1,1,105,43,1,1,99,118,144,137,141,127,140,123,58,1,1,43,1,1,28,35,55,19,6,1,1,7,109,9,92,41],
+    [26,140,92,880,544,346,183,331,93,692],
+    [329,1,1,1,1,271,1,1,1,1,372,1,1,1,1,203,1,149,1,1,124,1,2,1,5,1,125,1,136,1,131,1,1,135,1,1,1,1,1,136,1,1,135,1,127,1,1,1,1,1,110,1,253,1,1,121,1,1,103,1,41,5,7,33,2,41,43,40,42,2,42,41,39,36,41,35,38],
+    [93,24,253,132,25,96,114,117,5,140],
+    [523,332,598],
+    [27,149,98],
+    [2771],
+    [28,114,279,335,104,1746,1,1,1,1,1,4,1,2,1,1,15,10,1,1,7,1,1,1,7,1,24,1,5,1,2,2,1,9,1,1,5,1,1,1,1,1,1,1,1,1,1,1,26,1,1,16,1,1,1,25,1,33,1,2,1,1,1,1,1,1,1,1,1,1,1,7,1,2,1,2,1,1,9,1,2,1,1,1,1,1,3,10,1,5,1,5,1,1,6,4,1,4,1,1,1,1,1,1,17,1,5,1,1,1,1,1,1,1,1,2,1,3,2,1,1,1,1,1,1,1,2,1,1,1,1,2,2,1,1,1,1,1],
+    [337,87,253,82,337],
+    [133,105,48,15,5,5,5,5,5,5,12,5,10,8,1,1,1,1,5,5,5,5,5,5,5,5,5,3,12,7,1,1,1,1,4,5,5,5,5,5,5,5,10,5,10,10,10,10,5,5,5,5,6,5,5,5,5,15,5,5,5,5,3,1,1,1,1,3,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,5,5,5,8,10,3,12,10,10,10,1,1,1,1,3,5,5,5,5,5,5,5,5,5,10,12,5,5,5,15,17,5,25,11,15,5,11,7,1,1,1,1,3,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,17,10,5,359,1,1075,441,106,1,1,1,1,57,62,2,1,1,39,42,1,1,37,81,1,1,1,17,92,1,1,1],
+    [75,39,35,776,5,5,5,243,87,1,1,1,183,120,146,128,43,148,1,232,241],
+    [523,1,1,1,1,328,1,1,1,1,429,565,71,34,312,377],
+    [2597,1],
+    [226],
+    [29,101,103],
+    [1481,1],
+    [110,15,123,2583,1,1],
+    [434,254,303,1162,1,474,471,209],
+    [674],
+    [1495,37,780,454,1,18,1],
+    [924,1,1,1,1,1,1,1,1,1,235,1,751,1,860,239,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [1230,2,142,2,142,2,116,2,142,2,135,2,139,2,125,2,138,2,121,2,131,2,114,2,115,2,140,2],
+    [1863],
+    [2357,1,1,1,1,1,109,1,1,1,1,1],
+    [1767],
+    [2451],
+    [37,1,73,33,60,1828,1,452,163,1],
+    [463,1,1,1,1,21,1,1,1,1,308,1,1,1,1,36,1,1,1,1,478,1,242,1,280,83,1,94,431,221,1,65,1,1,18,6,23,1,20,1,2,8,8,1,4,164,57,87,13,83,19,37,93,16,6,68],
+    [30,175,704,334,1146,1],
+    [31,1,233,19,295,376,190,1,1,328,1,125,1,123,319,1,150,1,573,1,55,1],
+    [1280,1,1,1052,117,135,1,207,1,1],
+    [1216,1,1,35,1,1,275,1,1,502,308,1,119,1],
+    [1388,1,1],
+    [2091,1],
+    [1396],
+    [3230,84,120,113],
+    [3],
+    [1147,1312,1,433,1],
+    [2865,1,1],
+    [2072,1,1],
+    [2044,1],
+    [1363,1,111,1,204,1,11,1,5,1,2,1,5,1,8,1,2,1,1,2,1,2,1,5,1,2,9,1,8,1,5,1,15,1,7,1,15,1,8,1,1,1,21,1,2,1,2,1,2,1,2,1,2,1,1,2,1,8,1,1,5,1,2,1,2,1,2,1,1,19,1,11,1,2,1,2,1,2,5,4,11,1,1,1,112,1,102,1,191,1],
+    [133,59,46],
+    [2165,1,1,1,1,1,1,1,1,1,1,1],
+    [1475,1],
+    [2302,294,231],
+    [2552,1],
+    [12,60,48,60,41,61,843,4,139,1,37,3,31,1,1,220,1,5,1,23,1,32,1,429,296,1,1,1,1,1,80,70,392,49],
+    [193,93,15,5,5,5,5,5,5,27,17,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,25,10,10,10,5,5,5,5,6,5,5,5,5,15,5,5,20,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,5,20,12,5,5,5,15,17,5,25,11,15,5,11,14,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,37,5,23,1,323,1,347,1,125,567,1],
+    [3046,38,47,130,269],
+    [77],
+    [1812,130],
+    [2201],
+    [28,5,79,47,43,11,81,1,1,1,1,36,1,183,1,1,1,1,67,1,1,1,1,81,1,113,1,1,1,1,117,1,1,1,1,52,1,1,1,1,124,1,127,196,169,1,60,347,208,1,1,1,45,1,1,44,41,13,157,1,1,160,304,1,1,49,2,44,83,46,39,44,40,2,40,37,40,36,35,43,4],
+    [418,3,253,79,3],
+    [2713],
+    [504,10,260,10,570,99,31,1,1,3,73,1,26,1,8,1,1,665,1,1,30,1,381,1,1,5,1,95,1,125,1],
+    [47,1078,1,1,1,1],
+    [420,335],
+    [422,335],
+    [304,1,1,1,1,35,5,130,1,1,1,1,8,5,116,5,8,1,1,1,1,182,1,1,1,1,28,5,171,1,1,1,1,63,5,64,1,86,1,68,1,139,15,25,1,83,1,20,1,1,16,1,102,1,147,1,1,172,1,362,1,1,18,98,1,271,1,1,68,1,1,1,133,63,42,39,26,7,45,53,32,79,1,36,40,36,5,23],
+    [225],
+    [419,335],
+    [2979,1,1],
+    [2085,1,1,1,1,41,1,1,286,13,1,1],
+    [675],
+    [736,1,433,1],
+    [750,3,1,1,1,1],
+    [3072,213,83,75],
+    [1325,1,1],
+    [1107],
+    [93,1890,1,1,270],
+    [1178,1,272,1],
+    [2122,760],
+    [1234,124,1,1],
+    [165,87,1113,122,1,1315,1,1],
+    [1013,1,1,1,1],
+    [2732,1],
+    [124,85,696,510,1],
+    [90,115],
+    [2078],
+    [1866],
+    [114,1039,54,1,407,1357],
+    [414,335,357,1657,1],
+    [1342,151,1,6,1,76,1,322,1,196,71,1,352,43,1,368,1],
+    [223,46],
+    [228,1262,1,1,539,373,1,1],
+    [2098],
+    [71],
+    [81,144,926,1,63,503],
+    [1483],
+    [1219,1,19,1,184,1,1,144,52,1,1,26,1,1,149,301,392],
+    [419,335,376,1,1,1,1,1,42,1,1,4,4,45,24,1,1,1,1,1,43,1,146,1,139,645,3,557],
+    [56,306,320,885,446,1,298,29],
+    [1477,1,1,34,1,1,503,400],
+    [1216,1,1],
+    [1285],
+    [907,576,520],
+    [85,217,5,5,5,5,5,5,27,5,5,7,5,5,5,5,5,5,5,20,5,10,5,5,5,5,5,5,5,5,15,25,10,5,5,5,5,6,5,5,5,20,5,5,15,5,5,5,5,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,3,5,25,5,23,9,5,5,5,5,5,5,5,15,5,12,5,5,5,5,10,17,5,25,26,5,11,4,5,23,5,5,5,5,5,5,5,5,5,5,5,5,42,1788,1],
+    [1144,781,137,537],
+    [1441,42,282,1,906],
+    [34,2227],
+    [907],
+    [1767],
+    [1574,1,223,134,1,1,67,1,204,1,1,250,443],
+    [35,197,2730],
+    [86,1,77,87,233,285],
+    [2034],
+    [55,129,1611,1,1,234,32,1,911],
+    [338,87,253,82,337,671,1,1,532,107,187,269,1,1],
+    [37,1,74,33,54,5,6,734,1,1,1,1,226,648,313,507,1],
+    [914,506,271,973,1,1,106,1,1,1],
+    [345,5,142,5,116,5,226,5,59,179,5,893,3],
+    [2123,88,673,1],
+    [36,3],
+    [1246,691],
+    [1496,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [1667,760],
+    [79,34,2,32,16,83],
+    [2462,1],
+    [538,1,1,1,1,278,1,1,1,1,2175,44,34,55,40,49,52,25,54,33,24,39,55,20],
+    [1116],
+    [949,505,1,650],
+    [1255,941,292,220],
+    [48,849,1,1,1,1],
+    [1186,14],
+    [957],
+    [1567,446,1,782],
+    [956],
+    [955],
+    [959],
+    [958],
+    [1337,1,23,2,1,1,23,1,1,1,612,480,1,570,7],
+    [2252],
+    [70,56,88,2669],
+    [1392,1,1680],
+    [343,268,474],
+    [345,133,1,1,1,1,131,197,1,1,1,1,273,526,1,102,1,147,1,1,535,1,1,116,1,271,1,1,68,1,1,1,277,33,45,164,37,81,23],
+    [18],
+    [344,268,474,1731],
+    [1439,1,1,80,38,1,4,12],
+    [1068,1,1,1,1,451,657,1,103],
+    [887,1,1,1,1,2337,62,90,69,48,23],
+    [108,247,392,357,1180],
+    [897,1,1,1,1,214,1,1,1,1],
+    [29,1367,269,1,1,766,73,458],
+    [1234,147,141,121,144,137,138,129,1,139,1,119,1,132,1,119,113,1,142,62,46,45,38,45,41,43,40,42,37,41,35,35,43],
+    [1125,1,1,1,1,33,199,1344,190],
+    [609,1,1,1,1],
+    [342,268,474,93,572,94,175,108,419],
+    [341,268,474],
+    [1571,1,150,128,1005,1],
+    [1083,1,1,1,1,552,1],
+    [1183,90,303,698,241],
+    [1468,12],
+    [137,1026,1,1,33,1,626,170,1,1,25,1,377],
+    [139,27,10,1560,270,141,265,468,99,1],
+    [133,1323],
+    [2312],
+    [2676,1,117,1],
+    [1093,1,1202],
+    [1478,1,143,1,1],
+    [2208,693],
+    [2135],
+    [1667],
+    [146,4,201,1,1,1,1,158,1,1,1,1,226,1,1,1,1,36,1,1,1,1,313,1,1,1,1,56,1,140,1,107,1,68,1,39,2,63,1,126,1,162,1,167,1,79,1,140,1,1,36,1,106,1,75,1,128,1,184,1,60,1,168,89,126,127],
+    [1481,1],
+    [2462,1],
+    [1240,147,262,142,137,140,130,140,251,121,256],
+    [136,5,40,711,1214,1],
+    [2069,1],
+    [22,72,324,1,1,1,1,331,1,1,1,1,400,1,85,724,105,1,1,289,1,1,77,148,1,481,213,83,75],
+    [527,332,457,1,136],
+    [526,332,376],
+    [40,311,1,1,1,1,388,1,1,1,1,353,1,1,1,1,374,1,1548,89,126,127],
+    [45,1258,1115],
+    [40,66,40,4,17,97],
+    [1315,734],
+    [1136,1,5,1,5,1,5,1,2,1,2,1,2,1,8,1,8,1,7,4,2,1,2,1,8,1,14,1,12,9,1,17,1,1,1,21,1,23,1,2,1,20,1,11,1,33,15,2,1,1,1,42,1,44,1,37,161,1,670,1,1,1,13,1,12,1,2,1,5,1,17,1,5,1,23,1,2,1,18,1,5,1,1,1,24,1],
+    [272],
+    [1512],
+    [336,1,1,1,1,183,153,1,1,1,1,175,240,1,1,1,1,724,1,410,1,1,443,1,1,136,51,339,126,227],
+    [1225,1,1,91,51,1,1,404,1,1,135,1,1,1050],
+    [174,339,1,1,1,1,266,1,1,1,1,105,1,1,1,1,264,1,140,1,107,1,173,1,126,1,162,1,167,1,79,1,25,33,1,1,74,1,43,1,106,1,75,1,71,1,1,55,1,98,1,85,1,60,1],
+    [266,928],
+    [2,9,34,58,4,6,22,44,24,46,8,24,947,1,2,141,1,2,66,75,1,1,1,1,114,1,2,69,72,1,2,99,1,1,33,1,2,82,29,1,26,1,2,43,80,1,1,2,76,1,1,59,1,2,46,74,1,2,12,118,1,2,100,13,1,2,114,1,2,96,1,39,1,1,1,1,2,87,63,26,44,75,89,38,166],
+    [18,58,35,33,99,281,331,1,1,1,1,356,55,98,34,18,63,58,1,1,1,1,1,6,4,1,56,1,1,1,1,11,1,1,4,1,1,1,1,10,20,1,1,1,1,1,94,7,54,94,109,71,77,133,60,104,78,90,7,1,98,166],
+    [525,332,409,40,7,1,87,287,281,20,1,1,370,114],
+    [46,2235],
+    [1967],
+    [151,78,1995,1],
+    [82,95,2467],
+    [1327,785,1],
+    [140,8,13],
+    [25,150,114,5,143,147,5,206,165,5,15,195,1,8,1,48,59,1,2,1,32,1,1,79,1,20,1,1,15,506,1,32,1,20,1,1,13,1,324,45,1,64,10],
+    [353,392,357,1755],
+    [1955],
+    [135,874,1146],
+    [2211,1116],
+    [351,392,357,500,359,1,1],
+    [1005],
+    [1206,910],
+    [173],
+    [206,368,1,1,1,1,304,1,1,1,1,391,1,329,1,1,150,1,1,83,1,1,164,1,1,54,368,1,99,1,255,34,87,1,100,86,41,48,26,50,44,43,43,31,76,38],
+    [2465,1],
+    [55,110,15,4,68,1102,291,776],
+    [26,1413,1,41,1,909],
+    [89],
+    [1146,6,53,12,3,6,3,49,39,15,35,3,3,20,11,1,11,30,62,3,6,11,8,1,44,15,788,103,48,9,18,378],
+    [18,81,1139,463,1,173,78,1,349,1,1,280,245],
+    [115,32,1033,241,1,1,541,405],
+    [1689,1],
+    [508,1,1,1,1,266,1,1,1,1],
+    [41,1,228,1,1135,132,857,1],
+    [1319,1,1169,1,1],
+    [152,6,33,27,10,40],
+    [1448,1],
+    [2822],
+    [1723,1,61,52,870,1],
+    [1792,1],
+    [1882],
+    [52],
+    [1157,1,1304,1],
+    [1006,315,809,1,1,126],
+    [1580,1,259],
+    [83],
+    [1240,147,262,142,137,140,130,140,150,101,121,256],
+    [3074,488],
+    [738,1,1,1,1],
+    [2195,1],
+    [2711,1,1],
+    [1556,1,1091,1],
+    [2233],
+    [403,1,1,1,1,36,1,1,1,1,217,1,1,1,1,27,1,1,1,1,349,1,1,1,1,21,1,1,1,1,107,1,1,1820,85,75,12,39,29,57,50,22,19,19,72,10],
+    [1288,565,105,224,88,377],
+    [19,2056],
+    [1474],
+    [278],
+    [1354,267,416,1037,488],
+    [46,39,1139,112,56,1,518,399,1,8,54,1,1,200,116,382],
+    [2133,1],
+    [109],
+    [4,9,24,6,37,43,13,5,31,9,27,46,9,20,969,24,120,119,134,457,1,149,1,8,1,1,161,1,1,25,15,382,1,113,17,122,68,56,113,49,42],
+    [160,4,76,652,1174,215,527],
+    [1547,1,178,1,1,339,331,1,428],
+    [363,1,1,23,1,1,1,1,172,1,1,1,1,121,1,1,9,1,1,1,1,168,1,1,1,1,50,5,5,5,51,1,1,64,1,1,1,1,58,1,1,1,1,162,1,65,1,73,193,1,1,199,1,30,1,38,1,1,1,63,1,78,1,1,105,1,1,46,78,1,12,26,1,337,1,370,23,19,24,39,22,42,30,11,21,24,34,38,11,75,28,12,62,11],
+    [2188,1],
+    [158,196,1,391,1,356,1],
+    [284,295,376],
+    [65,30,53,13,81,995,1534,116,1],
+    [2981],
+    [1349,1,1,211,1],
+    [1582],
+    [88],
+    [693],
+    [138,13,1826,1,271],
+    [1011],
+    [1008,742,1],
+    [179,1179,1,333,1,446,1,264,1,249,1,1,116,1,1],
+    [2993,34,9,80,2,40,1,82,1,42,85],
+    [1549],
+    [1564,25,1,1,56,1141,1],
+    [2338],
+    [1610,1,539,1,1],
+    [54,19,23],
+    [174,76],
+    [720,1,1,1,1,849,1437,45,85,198,49,77],
+    [2530],
+    [1007],
+    [352,392,357,1326],
+    [2678,16,114],
+    [157,21,2246],
+    [160,1041,1,37,147,139,123,142,137,140,130,140,120,131,121,114,48,94],
+    [2069,1,761,1,1],
+    [2528,1,1],
+    [2320,1,1,121,1],
+    [1442,1,1],
+    [2961],
+    [1115,1,1,1,1,946,84,814],
+    [773,1,1,1,1],
+    [1392,1,1680],
+    [1959,1],
+    [116],
+    [3074,488],
+    [96,3,52,40,38,55,5,5,143,142,5,5,206,97,63,5,5,15,177,1,809,841],
+    [950,1,1,1,1,350,1,907,1,1,1,1,1],
+    [75,1108,87,3,183,39,81,146,128,43,148,1,232,241],
+    [50,853,762,1],
+    [138,31,91,1806,215,128],
+    [1592,1,52],
+    [64,123,1152,1156,1,1],
+    [43,1,77,110,58,5,143,147,5,206,165,5,15,134,1,132,1,1,425,1,1,1,1,1,16,1,1,7,1,1,3,9,19,1,9,1,1,3,9,1,1,9,1,1,4,1,2,5,4,1,11,1,1,1,1,1,185,1,1,75,1,1,242,1,1,1,47,1,1,400,151,112,529],
+    [925,5,5,5,2011,1,1],
+    [0,3,19,59,13,20,35,90,50,1,1,1,1,11,1,1,1,1,1,1,1,1,1,65,1,1,1,1,36,1,1,1,1,162,1,1,1,1,36,1,1,1,1,1,1,1,1,1,6,1,1,1,1,110,1,1,1,1,103,42,58,1,1,1,1,54,1,1,1,1,1,1,1,1,1,6,1,1,1,1,101,12,42,17,18,1,1,2,12,128,65,1,295,1,1,37,6,137,47,13,1,97,1,1,44,472,1,29,143,1,1,23,1,204,79,213,83,75],
+    [303,5,5,5,5,5,5,27,5,12,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,25,10,15,5,5,5,5,5,6,5,5,5,20,5,5,20,5,5,5,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,5,27,5,5,5,5,5,10,17,5,25,26,5,11,4,10,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,37,5,6,1,1,1,1,1,42,6,4,45,24,1,1,1,1,1,43,1,40,246,418,110,117,3,610,1,4,32],
+    [2282,1,42,55,1,61],
+    [1466,1,883,109,1,354],
+    [2208],
+    [983,1111,1],
+    [42,1100,1,1,3,48,1,34,64,18,4,1,80,1,1,1,1,1,15,199,1,13,6,371,1,1,377,1,26,1,51,1,197],
+    [527,332,379,215,1182,22,40,9,50,15,63,1,26,1,1,20,10,1,28,34,13,1,1,13,1,1,1,1,1],
+    [545,10,272,10,84],
+    [110,15,123,2533],
+    [2471,1,1,1,1,1],
+    [1929,1,866,40],
+    [2130,1],
+    [93,31,85,1025],
+    [1577,1],
+    [56,1131,69,1,1,1,1,1,389,1],
+    [85,1,1,77,87,81,194,20,10,51,221,10,20,64,1536],
+    [1768,1,1,1005,90,1,1],
+    [949],
+    [79,36,32,16,83,1250,1,1,1,1,1,1,1,1,1,1,1,1,1,158,760],
+    [2105],
+    [2433],
+    [1163,1,1,315,515,1,1,25,1,124],
+    [1478,1,143,1,1,584,693],
+    [1240,147,131,2,129,18,124,137,140,1,1,36,1,91,64,1,1,74,251,121,256],
+    [40,54,242,1,1,1,1,336,1,1,1,1,415,1,1,1,1,1319,450,692],
+    [2112,1],
+    [353,392,357,73,1,8,1,48,59,1,2,1,32,1,1,79,1,20,1,1,15,508,392,45,1,64,10],
+    [351,392,357,859,1,1],
+    [115,32,18,87,256,1,1,1,1,266,1,1,1,1,725,1,1053,1,377,1],
+    [158,110,1051,1,1169,1,1],
+    [2822],
+    [1723,1,68,1,89,825,1],
+    [1321],
+    [2488],
+    [2195,1,177,1,1],
+    [1515,106,199,1,634,397,1],
+    [95,259,1,388,1,1,1,1,356,1,245,1,1,211,1,414,1,271],
+    [1750,1,1276,89,126,127],
+    [2530],
+    [352,392,357,1326],
+    [1201,1,37,147,139,123,142,137,140,130,140,87,33,131,121,114,142],
+    [1100,1,1,1,1],
+    [3074,488],
+    [3008,53,35,38,25,11,41,53,76,152,37],
+    [86,2,6,1,1200,1,1,31,1,463,1],
+    [422,335,353,1,1,1,1,53,61,1,4,139,1,7,136,1,4,113,1,7,136,1,7,129,1,7,133,1,4,122,1,47,1,17,74,1,122,1,53,79,1,115,1,7,50,59,1,64,77,1,4],
+    [50],
+    [1292,1,178,32,1,402,1,1,224,39,1,1,339,58,1,1,21,1,1,144,1,1,149,1,1],
+    [7,9,180,142,87,253,82,337,147,1,58,209,15,1,203,132,72,1,135,277,1,69],
+    [2982,1],
+    [441,358],
+    [485,285,141,41],
+    [45],
+    [1249],
+    [1489],
+    [1178,1,1285],
+    [2772,1,1],
+    [40,106,4,17,97,1892,1,380,1,1],
+    [2139,1],
+    [1115,1,1,1,1,265,1277,1],
+    [1465],
+    [1646,46,1,436,525,1,1,228,1],
+    [22,14,4],
+    [106,22,92],
+    [1358,1,1045,1],
+    [2072,1,1,725],
+    [955,1,1,1,1,1426,125,1,1],
+    [954,1685,1,1],
+    [288,295,376,1091,1],
+    [1792,1,1],
+    [982,215,1345,39,19,1,1,1,1,1],
+    [333,214,10,51,221,10,84,215],
+    [74,1793,1,1,48,21,1,1,1,1,1,959,1,1],
+    [1114],
+    [2837,1,1,1,1,1],
+    [950,1,647,1,393,1,11,1,1,22,9,7,1,4,30,1,1,1,1,1],
+    [329,214,10,51,221,10,84,61,892],
+    [111,1204,826,4,1,1,38],
+    [2658,1,1],
+    [453,1,1,1,1,258,1,1,1,1,2284,85,95,29,53,34,128,113],
+    [717,1407,1,792,1],
+    [456,262],
+    [2190],
+    [1175,1],
+    [457,262,1122,1],
+    [453,262,1301,1],
+    [1137,6,6,6,3,3,3,9,3,6,3,11,3,9,15,22,18,1,8,15,6,3,15,3,15,6,3,9,17,25,1,8,1,11,21,3,9,9,3,6,15,12,3,75,115,3,3,6,6,3,6,9,3,1,3,3,3,3,12,9,6,16,8,9,3,1,3,9,1,23,3,3,3,3,3,1,3,3,6,1,6,3,3,3,1,20,6,6,3,3,23,1,62,52,59,12,9,3,6,14,18,35,9,1,12,6,3,7,3,6,3,6,3,7,3,1,3,18,7,6,1,3,3,3,5,11,6,3,9,1,15,7,6,3,3,3,9,9,6,24,3,13,6,6,1,5,1,5,12,3,15,3,3,3,6,3,9,27,12,18,3,1,11,9,1,14,6,19,31,47,18,92,65,28],
+    [2288,1,1,125,10,1,1,1,1,39,1,313,1,39],
+    [454,262],
+    [2543,1],
+    [715,1,1,1,1,726,1,301,1,568,50,1,1,500],
+    [3003,85,95,29,53,34,128,113],
+    [455,810,135,411,130,280,139,114,6,123],
+    [1834],
+    [118,1,5,2,4,1,2,4,7,2,4,15,2,1,17,1,6,6,11,5,3,16,5,14,3,4,5,7,1,6],
+    [1322,1,23,1,1,996,441,1,1,269,443],
+    [1512],
+    [1558],
+    [2881,1],
+    [1463,1],
+    [118,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,11,1,2,4,1,1,1,1,3,3,1,2,2,1,1,1,1,1,10],
+    [2717,1,1,1,1,1],
+    [143,83,2,1,5,4,2,9,2,2,1,2,1,1,1,1,1,1,1,1,1,2,1,1,1,1,2,1,1,1,1,1,1,1,1,1,1],
+    [144,39,6,1,4,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,3,2,1,2,1,1,2,2,1,1,1,1,1,1,1,2,2,3,11,6],
+    [137,1,1,1,1,6,2,1,11,23,1,1,1,1,3,1,1,12,1,1,1,23],
+    [133,2,1,6,9,6,1,2,4,2,7,1,1,1,1,1,1,1,1],
+    [413,1,1,1,1,331,1,1,1,1,353,1,1,1,1,573,12,41,1,44,451,1,10,7,430,1,1,72,448],
+    [1380,540,1,579,377,71,1,1,9,8,1,534,47],
+    [338,340,419],
+    [152,66,1010,1,143,1,143,1,4,113,1,71,72,1,136,1,6,134,1,126,1,139,1,76,46,1,23,109,1,115,1,116,1,141,1],
+    [33,5,107,65,308,1,1,1,1,266,1,1,1,1,117,1,1,1,1,197,1,1,1,1,119,414,176,1,410,1,1,585,1,202,46,83,54,31,44,40,11,31,37,40,36,35,43],
+    [339,340,419,544,1060],
+    [919,1,1,1,1,1000,1144,83,45,41,83,42,113],
+    [1204,1,436,420],
+    [113,1467,1,1,668,1,135,1,32,1,209,1,126],
+    [56,9,54,67,165,1,1,1,1,143,1,1,1,1,241,1,1,1,1,103,1,1,1,1,246,1,1,1,1,140,1,1,34,1,1,223,1,21,1,125,1,239,42,1,1,154,1,1,1,1,70,1,1,1,1,1,1,1,1,1,1,1,29,19,1,122,1,1,73,1,135,1,1,1,1,1,1,1,1,1,1,1,1,1,1,256,1,107,1,1,89,89,40,86,127,146],
+    [299,5,5,5,5,5,5,27,17,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,50,5,5,5,5,5,6,5,5,5,20,5,5,20,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,5,5,5,8,25,37,5,5,5,5,5,5,5,27,5,5,5,5,5,10,22,5,5,5,5,5,26,5,11,14,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,42,665],
+    [88,435,332,158,1,1,1,1,216,43,104,141,121,144,137,138,642,189,67],
+    [2817],
+    [337,3,337,3,416,3,1091,140],
+    [421,255,1,1,1,1,76,1,410,537,1,1,80],
+    [292,5,143,147,5,206,165,5,15,135,2442],
+    [488,1,1,1,1,348,1,1,1,1,2313,248],
+    [336,340,419,284],
+    [2703,165],
+    [1095,1,1,1,1],
+    [344,5,142,5,116,5,226,5,238,5,559,1,813,370,1,1,134,1,1,58,87,38,212,37,113,41],
+    [30,300,214,10,51,221,10,84,398,157,1,157,420,1,1,3],
+    [1193,331],
+    [38,12,95,65,526,1,373,1,1,1,1],
+    [1870,1],
+    [1583,1,779,1,1,286,1],
+    [104,333,1,1,1,1,354,1,1,1,1,426,1,1,142,1,1,404,1,1,95,40,1,1,834,1,215,34,167,105,81,101],
+    [60,16,2218,1],
+    [2739,1,1,61,52,32,6],
+    [513,1,1,1,1,266,1,1,1,1],
+    [855,1,1,1,1,1,503,1,1,49,842,1,43,1,106,1,271,1,1,1,392,488],
+    [1160,1,880,1,246,1,1,213,355,1,31,1,29,1,57],
+    [418,1,1,1,1,29,262,40,1,1,1,1,995,249,1,130,761,1,178,213,83,75],
+    [45,103,13,13,29,39,8,875,1,1,1,1,1051,1,1,529,1,115,84,1],
+    [1292,1,4,112,1,428,1,308,112,1,306,46,1],
+    [202,250,262,869,1,289,1,784,1,1,137,1],
+    [76,44,101,227,262,182,1,3,1225,1],
+    [95,1316,92,70,333,1,75,83,58,48,1,237,76,85,1,22,1,1,80,128,1,1,115,1,42],
+    [894,1233,1,1,408,1,1,218,1,1],
+    [1834],
+    [449,262],
+    [1294,406],
+    [256,100,1,1,1,1,323,1,1,1,1,208,91,1,1,1,1,457,260,1,1,49,167,1,345,1,1,24,1,486,135,267,308],
+    [1471,1041,36],
+    [74,72,4,17,97,446,1,1,1,1,533,1,53,1,23,1,1,157,1,1,109,1,1,92,1,20,1,772,1],
+    [38,25,40,5,37,65,5,895,1,1,1,1,43,1,1,203,324,1,1,344,1,1,265,3,101,152,1,1,27,12,92,6,82,1,118,184,169,84,118,54,18],
+    [1894,1,5,1,2,1,2,1,651,1,2,1,2,1,2,1,2,1],
+    [450,262],
+    [1210,1,1],
+    [953],
+    [1194,169,1,869,841,488],
+    [266],
+    [51,124,98],
+    [25,1928,1,32,1,20,1,1,13,1,798,1],
+    [2760,1,1],
+    [33,69,807,1,1,1,1,1,1,1,1,1,317,1,287,1,123,141,1,274,1,129,1,139,1,119,1,251,1,113,1,203,1,45,1,44,38,1,44,41,43,1,39,1,41,1,36,1,40,35,1,34,1,42,1],
+    [7,977],
+    [338,87,253,82,337,206,209],
+    [1127],
+    [196,80],
+    [28,1835],
+    [79,2185],
+    [16],
+    [2552,1],
+    [1244,1,282,1,407,1,135,277,1],
+    [1171,186],
+    [68,231,1,1,1,1,215,1,1,1,1,72,1,1,1,1,190,1,1,1,1,178,1,1,1,1,239,1,204,1,14,1,5,1,1,109,1,214,1,60,1,8,1,193,1,70,1,47,162,1,59,1,215,50,1,5,1,105,1,5,1,116,7,1,1,25,1,1,7,1],
+    [117],
+    [2625,1,1,1,479,438],
+    [1,1,101,4,1018,45,386,1,281,1,47,1,1,1,166,204,1,10,47,1,5,1,4,1,107,70,236,1,140,43,56,1],
+    [292,295,376,193,13,53,1,8,37,1,19,66,21,144,109,1,5,1,2,69,75,102,1,34,141,127,140,62,58,1,2,133,33,1,31,42,1,5,1,2,2,1,114,89,41,1,5,1,1,1,1,2],
+    [77,115,549,173,3,324,1,62,1,797,392,105,213,1,85,49],
+    [1313,1,55,1,1,817,1,297,1,321],
+    [9,3,98,3,64,3,99,3,1057,628,294,269,152],
+    [1630,37],
+    [291,238,1,2,54,156,121,1,2,52,44,266,1,596,25,3,6,50,1,5,1,148,221,1,86,11,1,195,1,167],
+    [289,239,56,154,124,98,679,1,312,6,82,7,1,8,1,126,1,62,661],
+    [203,927,1,1,1,54,69,1,1,1,9,1,10,22,1,2,1,35,1,2,1,33,1,4,1,11,42,1,2,1,29,1,14,1,36,26,1,64,98,1,30,1,95,27,1,15,1,39,1,11,1,11,1,1,1,3,1,5,1,2,1,2,1,2,1,2,2,7,1,11,1,2,1,11,1,5,1,2,1,2,1,8,1,1,2,1,5,1,2,1,2,1,2,1,2,1,2,1,5,1,2,2,2,16,1,1,1,48,1,96,1,1,33,1,22,1,5,1,11,1,1,46,1,1,1,12,1,1,33,1,35,1,2,1,12,54,1,19,10,1,14,1,13,10,1,62,1,27,1,11,1,1,5,1,22,23,1,30,1,15,1,2,1,11,1,8,1,5,1,59,1,14,1,5,1,17,1,2,1],
+    [120,7,8,24,3,4,16,15,5,1,9,1,8,5,6,2,9,2,4,8,1,7,883,1],
+    [173,94,1099,1,5,1,349,61,1],
+    [67,672,176,153,1,1,1,1,454,305,232,243,257],
+    [1191,1,49,1,71,1,1,1,1,1,288,12,95,1,1,154,107,67,35,267,1,323],
+    [57,845,227,315,712,1,1,303,388,1],
+    [78,215,295,569,1,1,93,434,1,1,611,247,1,94],
+    [10,1,48,119,1,101,1,919,119,1,1,1381,40,1],
+    [35,6,229,314,1,1,1,1,6,1,1,1,1,80,82,9,11,8,1,1,1,1,70,1,1,1,1,47,51,204,56,25,12,107,9,1,57,57,18,1,1,4,1,42,1,2,1,1,4,1,7,15,10,1,4,1,1,1,3,13,1,1,32,1,1,80,1,30,1,1,4,1,78,1,53,138,35,93,1,1,64,1,1,19,55,37,84,1,1,131,1,1,63,53,44,1,1,1,209,34],
+    [224,117,5,142,5,38,78,5,226,5,20,99,119,5,237,1,1,419,548,1,749,43,46,44,75,89,38],
+    [1592,1,1212],
+    [290,295,155,176,45,173,126,67,621,135,272,451,1],
+    [2456],
+    [960,1,1,1,1,6,1,1,1,1,123],
+    [21,65,1,77,19,28,40,651,1917],
+    [505,2,8,2,258,2,8,2],
+    [40,1101],
+    [111,33,1193,1,22,942,294,458,7],
+    [76,827,1391,1],
+    [92,36,65,23,4,1298,744,1,516,1],
+    [9,1,1,1,1,1,1,1,1,7,35,12,30,3,30,110,1237,1,59,1,1,1,48,1,11,1,8,1,2,1,11,1,5,1,2,2,1,6,2,20,1,1,1,735,9],
+    [160,17,1,1,1,1,59,39,1,1,1,1],
+    [18,934,236,675,488,1,1,1,1,1,447,1],
+    [2651,1],
+    [1005,1,1,1,1,206,55,150,31,1,100,4,1,210,7,28,1,1,1,1,1,21,203,71,125,1,1,1,82,60,182,90,106,166],
+    [33,9,20,28,9,3,71,28,66,226,1,1,1,1,84,5,5,5,2,3,2,3,2,13,5,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,12,2,4,6,2,3,2,3,2,3,2,3,2,8,2,3,2,11,20,2,3,27,5,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,6,1,1,1,1,3,5,9,3,2,3,2,3,2,3,2,6,577,1,203,144,1,377,66,249,1,196,145,1],
+    [58,185,47,5,57,147,5,10,71,5,154,30,10,67,110,5,15,120,202,92,1,372,1,1,152,257,231,1,1,113,1,7,267,1,64,1,1,52],
+    [524,332],
+    [1545,127],
+    [1145,1,222,6,161,1,1,1,1,1,710,1],
+    [962,5,5,2,3,2,3,6,2,4,3,23,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,8,2,3,2,20],
+    [736,1,217,46,1,1,1,1,468,1,644,224,235,1,1],
+    [2672],
+    [2043,717,1,1],
+    [2456,129],
+    [2025,1,1,64,1,205,1,203,1],
+    [2648,1],
+    [403,1,1,1,1,257,1,1,1,1,405,1,1,1,1,107,1,1,1442,344,20,9,1,4,1,1,7,15,1,2,7,2,4,3,5,7,6,8,3,2,4,1,6,3,2,21,2,3,4,2,3,3,3,5,8,5,6,3,2,2,1,1,9,1,9,6,7,2,4,2,1,9,16,4,3,2,5,1,10,1,2,5,18,2,3,5,6,3,13,9,2,7,3,7,8,6,6,3,4,1,3,4,4,18,3,3,3,1,8,8,16,9,1,3,4,11,5,2,3,1,4,1,2,6,19,1,3,7,1,1,6,3,19,5],
+    [371,135,10,14,1,161,57,27,10,13,65,1,138,5,2,6,573,1,8,1,1],
+    [2127,1,1,573],
+    [1171],
+    [1668,1,1,1,1,1],
+    [1106],
+    [1206],
+    [1896,6,3,3,652,9,3],
+    [77,5],
+    [919,1,1,1,1,539,1605,83,45,41,83,42,113],
+    [45,1,110,81,94,194,81,251],
+    [485,285,141,41,29,332,1,259,669,243,78,172,1,1,1],
+    [1306,663,20,1,1],
+    [1967,715,187,1,1],
+    [1688],
+    [2335,56,57],
+    [2281],
+    [118,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1481,460,1,433,1,1],
+    [46],
+    [2908,1],
+    [571,308,1518],
+    [572,308,690,666],
+    [2395,1],
+    [573,308,269,735,408],
+    [569,308,946,1,155,129,621,1],
+    [2492,1],
+    [1743],
+    [570,308],
+    [1415,1],
+    [106,118,1841],
+    [609,5,226,5,32,1,1,1,1,548,139,1,665,1,56,1,439],
+    [45,1382,1,1255,1,311,46,42,44,54,26,17,29,41,39,16,32,31,56,15,54],
+    [2685,225],
+    [1083,5],
+    [1015,427,1],
+    [70,56,88,1753,645,1],
+    [1017],
+    [1013],
+    [2806,1],
+    [2828,1],
+    [1014],
+    [2874],
+    [1016],
+    [106],
+    [1249],
+    [398,1,1,1,1,257,1,1,1,1,488,1,1,304,1,101,1,1,601,1,1,73,1,1,382,1,1,1,275,1,96,96,33,91,44,51,23,82,35,84],
+    [1489],
+    [1875],
+    [64],
+    [1450,817,11,1,1],
+    [1630],
+    [434,254,303,187,1,12,1,450,98,47,42,1,634,635,209],
+    [2224,1,106,410],
+    [151,78],
+    [118,67],
+    [927,5,5,5],
+    [2772,1,1],
+    [860,42],
+    [1667,760],
+    [441,358],
+    [1433,1,26,1],
+    [1650,1,813,370,1,1,134,1,1,58,87,38,212,37,113,41],
+    [74,72,4,17,97,2284],
+    [1327,291,538,1,1,187,1,191,1,1,387],
+    [40],
+    [2702],
+    [1206],
+    [64],
+    [74],
+    [2525,1,47,1,16,1],
+    [2849,1],
+    [2533],
+    [1655],
+    [2139,1,821],
+    [928,5],
+    [1246,691],
+    [1125,1,1,1,1,1271],
+    [1435],
+    [1281,1245,48,17],
+    [2895],
+    [18,1366,1016,674,488],
+    [1115,1,1,1,1,775,1,1,4,1,1,1,1,1,1,1,1],
+    [0,9,47,26,37,58,9,93,1366,999,17,1,77,1,262,106,34,37,71,296],
+    [2747,220,1,1],
+    [1110,1,1,1,1,845,1],
+    [1465],
+    [2654,1,1],
+    [201,702,307,1,1,113,1,1,84,73,1,1,109,1,1,7,1,41,46,1,183,1,1,102,1,146,1,1,27,1,70,1,1,59,1,1,247,1,1,119,1,1,46,51,1,1,61,29,1,70,1,1],
+    [2636,1],
+    [47,2694,119,36,1,65],
+    [2653],
+    [2884,1],
+    [2112,1,1,22,1,27,33,12,1],
+    [143,2721],
+    [902],
+    [1363,1],
+    [2889],
+    [938,5],
+    [1162],
+    [48],
+    [1203,215,1,460,627],
+    [339,77,10,253,72,10,337,10],
+    [2224,1],
+    [132,98,698,5,5,5],
+    [22,14,4,9,73,71,14,65,966,426,456,9],
+    [2486,1],
+    [1752],
+    [106,1693,1,1],
+    [47,3,78,92,1029],
+    [148,13,81,921,1,1,184,1,1,271,1,1,371,1,1,115,1,311,37,28,1,1],
+    [140,31,91,985,1,182,1,1,569,1,134,1,109,251,481],
+    [1358,1],
+    [2404,1],
+    [1194],
+    [1525],
+    [2418,656,488],
+    [1352,1],
+    [184,5],
+    [1459,91,1,303,1,217,1,1,435,267,1,22],
+    [122,85,1992,1,1],
+    [200,1418,362,1,1,678],
+    [2233],
+    [2713,98],
+    [540,282],
+    [538,1,1,1,1,278,1,1,1,1,131,1,1,1,1,2040,44,34,55,40,49,52,25,54,33,24,39,55,20],
+    [523,1,1,1,1,328,1,1,1,1,869],
+    [542,282,1552,1,1],
+    [538,282],
+    [913,212,1,1,1,1,527,1,449,1],
+    [1685],
+    [1230,130,14,144,118,58,86,137,141,83,44,140,47,34,42,62,1,1,69,76,40,78,39,87,55],
+    [155,80,304,282,1518,1,457,1],
+    [1283,1,815,39,350],
+    [285,148,96,51,281,2,93,29,126,268,215,458,358,1,1,22,1,1,156,684],
+    [820,1,1,1,1,1375,1,1,84,1,1,98],
+    [2999,44,34,55,40,49,52,25,54,33,24,39,55,20],
+    [371,159,162,172,146],
+    [2259,1,60,1,61],
+    [217],
+    [2692,1],
+    [2093],
+    [1487,1,160,305,1,468,1,20,1],
+    [2711,1,253],
+    [561,308],
+    [2485,338,8,1],
+    [1239,274,1,1,137],
+    [562,308],
+    [1571,1],
+    [1474],
+    [80,1987,916],
+    [1573],
+    [289,5,143,147,5,206,165,5,15,1232,1,1,1,1,1,96,1,1,1],
+    [1397,1,1,1,1,1,1520,62,1,1,1,1,1],
+    [1256,1,1,1,1,1,1210,1,1,1,1,1],
+    [1723,1,158,77,1,1,431,1,40,24],
+    [1384,262],
+    [954,984,1,1,1,1,1,657,1,1,1,1,1],
+    [950,1,1128,1,1,1,1,1,753,1,1,1,1,1],
+    [1175,1,8,1,48,59,1,2,1,32,1,80,1,20,1,423,1,537,1,64,164,1,1,69,1],
+    [2344],
+    [1233,43,104,141,59,1,1,60,144,137,138,642,14,1,1,1,1,1,237],
+    [1583,1],
+    [1838,1,226,194,1,516,1,143,1,42],
+    [25,26,124,98,680,1000,1,32,1,20,1,1,13,1],
+    [28],
+    [59,1,18,13,68,14,29,11,54,881,1,139,16,1,134,1,1,80,38,1,4,12,134,1,23,7,1,111,30,1,74,106,206,224,145,1,1,6],
+    [735,217,583,1,1,1,1,1,262,1,1,1,1,1,544,1,1,1,1,1],
+    [954,714,1,1,1,1,1,1358,44,44,42,41,41,44,41,42,37,39,35,37,45],
+    [919,1,1,1,1,2144,83,45,41,83,42,113],
+    [2658,1,1],
+    [1450],
+    [2739,1],
+    [1212,274,111,539,1,60,93,249,220],
+    [1980,1],
+    [91,1348,1,1,80,38,1,4,12,147,1,158,551],
+    [2050,1],
+    [288,21,1,1,1,1,58,1,6,1,1,1,1,60,141,46,1,1,1,1,6,1,1,1,1,49,1,1,265,51,1,1,11,1,1,1,1,6,1,1,1,1,172,122,1,528,1,1,100,1,906,1,57,1,85,39,1,28,5,7,31,66,28,31,97,180,17],
+    [2495,1,92],
+    [563,308],
+    [1876,1,1,49,746,1],
+    [423,1,1,1,1,331,1,1,1,1,1288,1,1235,228],
+    [559,308,1666],
+    [2531,1],
+    [1737],
+    [2800,1],
+    [2437,1],
+    [24,45,73,80,638,255,1,1,1,1,43,78,63,84,24,24,94,56,64,63,79,3,81,53,6,109,25,55,75,104,20,16,32,1,38,180,25,96,4,1,1,83,31,30,36,1,65,4],
+    [1856],
+    [3013,73],
+    [1190,734,278,1,1,1,388,1,1,1,327,1,1,88,73,239,119],
+    [2927,1],
+    [312,69,251,10,384,10],
+    [122,85],
+    [313,58,11,251,10,49,318,17,10,172,74,1,444,132,1,1,237,12,265,1,1],
+    [309,69,251,10,384,10,929,1],
+    [1179,23,265,299,64,247,294],
+    [310,69,63,188,10,54,318,12,10],
+    [288,295,376,396,1,296],
+    [2869,1],
+    [51,321,257,1,1,1,1,6,1,1,1,1,49,1,318,320,1,460,1,1,34],
+    [19,2193,1,1,1,1,1,743,92,1,28,12,31,66,28,31,97,180,17],
+    [311,69,251,10,384,10],
+    [1010,1,12,1,1,1,1,6,1,1,1,1],
+    [121,4,7,22,20,56,1,5,12,2],
+    [2864],
+    [904,628,451,1,1,350,142,1,1,1,1,1,12,1,1,19,1,1,2,1,2,1,4,1,1,1,1,1,1,7,1,1,37,1,1,1,1,5,9,1,1,1,1,1,1,1,1,281],
+    [2578],
+    [1197,344,1,1,1,1,777,241,267],
+    [291,5,57,15,71,61,86,5,30,124,52,55,110,5,15,15,105,284,1471],
+    [31,529,308,252,1,1,1,1],
+    [1365],
+    [2833],
+    [89,439,1,1,1,1,330,1,1,1,1,346,112,162,111,693,3,246,220,259,45,46,37,45,41,43,40,42,38,41,34,36,42],
+    [1925],
+    [1529,346,839,1,1],
+    [103,5],
+    [1998,1,1],
+    [1174],
+    [162,83,1173,1],
+    [1859,647],
+    [1955],
+    [1665,1],
+    [892,1,1,1,1,297,677,1,8],
+    [319,1,1,1,1,111,215,1,1,1,1,35,303,52,1,1,1,1,174,665,1,1,1,633,1,1,493,18,110,80,131,65,84],
+    [2103,1,1],
+    [52],
+    [1125,1,1,1,1,283,1,242],
+    [559,1,1,1,1,304,1,1,1,1,265,1,66,88,389,1,859,1,91,1,1,357,110,62,105,109,49,28],
+    [408,1,1,1,1,257,1,1,1,1,405,1,1,1,1,2017,209],
+    [2064],
+    [2675],
+    [2117,1,1,5,1,396],
+    [32,2071,1],
+    [1093,1,143,231,196,135,1,1,271,1,1,135,1,86,506,16,39,65],
+    [303,1,1,1,1,1,1,1,1,1,1,5,5,5,5,27,5,12,1,1,1,1,1,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,25,10,15,5,5,5,5,1,1,1,1,1,6,5,1,1,1,1,1,5,20,5,5,16,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,1,1,1,1,1,27,5,5,1,1,1,1,1,5,5,10,17,5,25,26,5,11,4,10,5,8,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,5,5,5,5,5,5,5,5,5,37,5,14,12,42,17,18,1,1,2,140,58,74,1,66,173,28,6,108,21,1,1,6,47,13,1,4,129,10,53,1,1,222,1,1,95,1,77,1,1,48,59,1,1,1,1,1,1,44,1,1,177,1,1,83,2,20,18,8,39,3,39,5,54,8,19,16,29,16,23,2,55,6,19,7,31,18,26,12,15,6,48,2],
+    [135,114,171,335,151,389,1,1,157,1,887,1,1,32,1,1,585],
+    [1713,1,386,1,60,142,1,1],
+    [2153,1,1],
+    [2258],
+    [1365],
+    [1686,1,418],
+    [1238,114,1,1356,100,1,138,1,1],
+    [1342,884],
+    [949,841],
+    [583],
+    [2670,1],
+    [1282,84,1,5,1,2,11,29,1,109,812,699],
+    [2375],
+    [1236],
+    [2953],
+    [361,1,319,1],
+    [2991,28,45,37,9,37,16,29,41,35,9,39,42,19,19,30,11,17,17,36,43],
+    [1738],
+    [53,1,20,132,166,321,196,21,101,266,1,178,381,469,77,1],
+    [1955,787,1,176],
+    [1243,345,521,1,1,719,134,154,40,1,82,43],
+    [1526],
+    [1808,1,1,1,1,1,12,7,1,2,1,5,1,1,1,1,2,1,1,1,1,1,1,3,4,1,1,5,1,1,1,1,1,1,1,2,1,1,7,12,1,11,1,2,1,1,1,1,1,1,1,4,4,1,7,1,1,1,1,1,1,1,1,22,1,640,1,1,1,1,1,4,1,2,1,1,5,1,1,5,1,1,1,10,1,1,7,1,1,1,7,1,8,1,11,4,1,5,1,2,2,1,9,1,1,5,1,1,1,1,1,1,1,1,1,1,1,17,1,1,7,1,1,44,1,33,1,2,1,1,1,1,1,60,1,1],
+    [1550,1],
+    [433,428,124,1067,1224],
+    [1114],
+    [110],
+    [1713,1,1],
+    [2211],
+    [175,98],
+    [3327],
+    [4,9,30,98,31,9,82,20,969,144,253,457,1,149,1,171,1,1,536,17,122,68,56,113,49,42],
+    [783,1,1,1,1],
+    [2723,1,1,1,1,1,109,1,1,1,1,1],
+    [366,1,1,1,1,249,1,1,1,1,372,1,1,1,1,2105,1,1,1,1,119,2,1,1,81,1,1,118,1,1,1,109,1,1,1],
+    [909,298,1],
+    [1224,112,32,144,262,137,138,130,140,123,133,116],
+    [1352,1],
+    [910,3],
+    [112,182,1,1,1,1,210,10,71,1,1,1,1,185,10,162,15,1,1,1,1,617,1,1197,105],
+    [512,10,260,10,104],
+    [62,140,346,1,1,1,1,278,1,1,1,1,70,1,1,1,1,295,166,1,1,787,192,136,1,524,11,26,20,21,24,25,13,33,12,10,31,30,13,29,11,11,31,26,11,16,25,25,10,35,23,20],
+    [33,876,1,1,1,1,324,1,409,297,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,2,9,13,1,1,10,1,1,4,1,2,1,1,1,1,7,1,1,1,1,7,1,1,1,1,1,4,1,1,1,1,1,1,1,1,4,1,2,2,7,11,1,1,1,1,1,423,1,1,515,46,83,85,44,40,42,37,40,36,35,43],
+    [55,65,64,37,297,1,1,1,1,266,1,1,1,1,347,1,245,7,1,19,1,226,1,43,1,747,1,641],
+    [334,1,339,1,218,58,142,1,1202,677,1,1,51,173,125,235],
+    [1417],
+    [28,56,11,38,2,1,1,1,1,1,1,5,2,2,1,6,1,1,1,1,3,2,7,1,1,1,1,1,1,1,1,13,19,210,1,1,1,1,132,1,1,1,1,195,1,1,1,1,105,1,1,1,1,350,474,1,40,87,1,66,1,1,114,115,1,25,55,1,1,1,207,579,110,62,105,18,91,49,28,60],
+    [911,1,844,1,1,911],
+    [351,15,47,35,1,1,1,1,46,121,91,1,1,1,1,29,5,102,145,105,5,484,1,8,1,1,257,1,1,438,1,504,277,169,84,118,54,18],
+    [1417],
+    [1641],
+    [2250,1,1,55,1,29],
+    [2587],
+    [2230],
+    [421,335],
+    [390,28,47,25,212,51,49,40,218],
+    [674,807,1],
+    [1243,482],
+    [362,320,744,51],
+    [364,27,5,70,10,60,154,13,5,95,5,10,175,68,5],
+    [492,352],
+    [1665,1],
+    [1243],
+    [2037,676],
+    [2142,1,122,1],
+    [43,38,158,45,5,5,143,142,5,5,206,97,63,5,5,15,752,1,1,275,110,646,89,32],
+    [1562,1,784,71],
+    [422,335,1474,1],
+    [1489],
+    [1337,1,23,27,1,1,875,1,217,1],
+    [1558],
+    [56,9,54,67,113,5,5,5,5,5,5,22,1,1,1,1,1,17,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,13,37,5,5,5,5,5,6,5,5,5,20,5,5,20,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,5,5,5,8,5,1,1,1,1,16,37,5,5,5,5,5,5,5,8,19,5,5,5,5,5,10,22,5,5,5,5,5,26,5,11,14,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,22,1,1,1,1,16,124,1,1,281,1,365,42,1,1,410,1,1,678,89,126,127],
+    [1872],
+    [356,1,1,1,1,323,1,1,1,1,299,1,1,1,1,421,347,365,286,394,1,1,269,112,308,68],
+    [1363,1],
+    [2264],
+    [57,232,1,1,1,1,291,1,1,1,1,272,42,58,1,1,1,1,104,1,1,1,1,116,148,58,90,1,1,93,28,1,1,364,15,1,1,295,1,1,4,1,1,108,1,38,1,15,223,1,1,5,1,60,35,1,100,25,1],
+    [504,10,260,10,1478,1,270],
+    [1589,1,8,1,1,697,1,756,7],
+    [1462],
+    [398,1,1,1,1,257,1,1,1,1,488,1,1,304,1,101,1,1,601,1,1,73,1,1,382,1,1,1,275,1,96,96,33,91,44,51,23,82,35,84],
+    [1125,1,1,1,1],
+    [2227,1,1],
+    [47],
+    [2531,1,65,1],
+    [365,27,5,23,47,10,60,154,13,5,46,49,5,10,175,68,5],
+    [1872],
+    [1890,1,1,143,1,10],
+    [388,5,29,41,10,60,167,5,52,43,5,10,243,5],
+    [361,320],
+    [924,2,1,2,2,1],
+    [503,1,1,1,1,6,1,1,1,1,256,1,1,1,1,6,1,1,1,1],
+    [343,5,120,1,1,1,1,18,5,116,5,114,1,1,1,1,108,5,238,5,1919,38,48,110,96,38,33,45,45,24,46],
+    [306,174,25,10,111,149,10,27,113,5,90,134,1,983],
+    [307,174,23,10,113,147,10,29,208,845,168,757,1],
+    [513,1,1,1,1,266,1,1,1,1,373,1,140,1,107,1,173,1,126,1,162,1,167,1,79,1,178,1,106,1,75,1,101,27,1,184,1,60,1],
+    [98,54,66,1140,1,106,227,1,446,1,264,1,65,184,1,1,116,1,1],
+    [1432],
+    [308,174,25,10,111,149,10,27,208,572,262,663,1,11,1,1,267,1],
+    [304,174,146,186,208,1020,1],
+    [1242,108,634,89,1,170,1,723],
+    [1310,1,284,1,1,119,1],
+    [305,174,24,10,112,148,10,28,208,364],
+    [80,292,321,318,128,1,72,199,75,48,63,693,249,131,1,88,58],
+    [1450,953,18],
+    [148,13,81],
+    [1237,1,336,1,1218],
+    [110,514,1,1,1,1,182,1,1,1,1,676,1,373,1,1,535,1,459,1,1,1,46,164,488],
+    [506,10,260,10,712,1,114,1,289,1,1,269,1,1,327,64,1,1,373,1,1,53,23,40,5,37,9,30,7,19,7,19,26,15,38,6,26,13,42,24,1,13,23,18,22,12,24,5,7,16,27],
+    [1018,1,1,1,1],
+    [128,21,71,5,14],
+    [1324],
+    [2673,1,1],
+    [1828,52,1],
+    [363,26,5,70,10,60,155,12,5,95,5,10,176,67,5,1440,1,1],
+    [419,335],
+    [1210,1,1768,1,1],
+    [413,1,1,1,1,331,1,1,1,1,353,1,1,1,1,1137,955],
+    [39,1112,1,1,189,273,103,803],
+    [1982,693],
+    [2418],
+    [1315,346],
+    [76],
+    [66,45,1656,425,682],
+    [361,122,198,87,875,1024,1,41,70,1,29,1,61],
+    [493,1,1,1,1,23,270,55,1,1,1,1,1343,769],
+    [58,284,5,142,5,116,5,226,5,154,1,1,1,1,80,5,115,1,1,531,261,1,86,1,1,1,1,1,6,12,7,1,14,1,1,7,1,1,4,1,1,1,1,1,1,11,1,20,1,1,1,1,244,1,1,122,1,1,147,40],
+    [92,101,23,1641,1,53,714,1,1,11,76,1,20,1,1,32,1,1,5,1,110,1,41,19,1,1],
+    [2694],
+    [2373,1],
+    [1788,143,782,16,1],
+    [1619,1],
+    [675],
+    [2590,1],
+    [2800,1],
+    [1518,2,742,1,1,524,1],
+    [189,2469,1],
+    [72,126,136,402,1,356,77,1,973,186,107,1],
+    [1893],
+    [1553,1],
+    [1695,1,1,338,1,273],
+    [418,1,1,1,1,331,1,1,1,1,2315,213,83,75],
+    [2962],
+    [2302],
+    [1387,1323],
+    [1240],
+    [1649,689,628],
+    [1435,608],
+    [2860],
+    [1928],
+    [489,352,1227],
+    [2896,1],
+    [1529],
+    [2370,1],
+    [2614],
+    [24,1688,486,796,6,4,10,2,21,13,1,6,1,14,10,8,7,3,23,13,7,1,13,19,6,3,24,13,1,3,28,1,4,12,3,11,10,1,4,2,3,31,9,3,6,14,5,16,3,13,6,14,3,1,2,12,10,8,5,3,18,4,34,16,1],
+    [1115,1,1,1,1,672,798,125,1,1],
+    [1585],
+    [142,80,638,934,140],
+    [2589],
+    [2,9,48,44,70,6,88,14,18,1,1,1,1,291,1,1,1,1,372,1,1,1,1,257,144,58,1,85,118,144,137,82,29,1,29,43,46,38,140,46,77,133,54,1,61,117,63,1,1,25,1,1,44,1,1,4,87,63,26,44,75,89,38,166],
+    [1565,1,458],
+    [395,80,60,172,100,10,248],
+    [488,352],
+    [1856],
+    [2452],
+    [1325,1,1],
+    [1438],
+    [1460,1,922,1,1,239,280,25],
+    [131,124],
+    [3029,131,206,37,42,71],
+    [2194],
+    [3013,73],
+    [924,2,1,2,2,1],
+    [513,1,1,1,1,266,1,1,1,1],
+    [503,1,1,1,1,266,1,1,1,1],
+    [478,1,1,1,1,328,1,1,1,1,2327,33,45,164,37,81,23],
+    [453,1,1,1,1,258,1,1,1,1,2284,85,95,29,53,34,128,113],
+    [2138],
+    [574,1,1,1,1,304,1,1,1,1,721,1,1,150,1,1,83,1,1,164,1,1,422,1,99,1,255,34,87,1,11,1,1,87,86,41,48,26,50,44,43,43,31,76,38],
+    [2202,1,1,1,391],
+    [1785],
+    [2510,1],
+    [93,122,1064,103,1,317,137,146,1,1,542],
+    [2066],
+    [206,262,1,1,1,1,258,1,1,1,1,456,87,1,461,1,1269,38,48,110,96,38,33,45,45,24,46],
+    [2593,1,1],
+    [611,5,63,72,10,81,5],
+    [158,110,2745,73,239,119],
+    [1085,5,8,10,1231,1],
+    [2124,1],
+    [2138],
+    [275,228,1,1,1,1,266,1,1,1,1,377,1,17,1,1292,1],
+    [2917,1,9,1],
+    [337,87,253,82,337],
+    [306,174,25,10,111,91,58,10,27,113,5,90],
+    [924,1,1,1,1,1,1,1,1,1,2087,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [37,1,166,1361,1,1225,1,32],
+    [2091,1],
+    [3,9,168,102,986,1,37,3,31,1,1,220,1,5,1,56,1,19,408,1,1,110,1,1,1,1,1,1,1,1,1,1,1,50,93,29,1,2,1,1,1,1,1,103,1,1,63,341,1,1,179,38,47,99,31,53,120,96,17],
+    [2201],
+    [504,10,260,10,437,133,640,427],
+    [165,87,926,1,272,1,669,1],
+    [81,33,111,3,1262,1,1,1,1,372,538,1,1,566],
+    [1178,1,272,1],
+    [1285],
+    [36,3,268,5,10,59,75,25,146,5,10,10,66,95,208,5,10,10,1152],
+    [2034],
+    [55,129,2791],
+    [23,34,1189,691],
+    [113],
+    [18,2266,533,147],
+    [2979,1],
+    [2794,1],
+    [513,1,1,1,1,266,1,1,1,1,373,1,140,1,107,1,173,1,126,1,162,1,167,1,79,1,178,1,106,1,75,1,128,1,184,1,60,1],
+    [107,150,1181,818,1,138,1],
+    [82,1245],
+    [1009],
+    [1005],
+    [18,2567,245],
+    [83,923,574,1],
+    [278,165,1,1,1,1,248,1,1,1,1,349,1,1,1,1,2126,39,29,107,41,101],
+    [2190],
+    [1582,1399],
+    [1008],
+    [73],
+    [1007],
+    [2065,898],
+    [1195,1,1467],
+    [2130,1],
+    [1175,1],
+    [98,1260,1,106,227,1,446,1,264,1,249,1,1,5,1,110,1,1],
+    [1197,1080],
+    [152,66,2182,70,88,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [148,13,81,883,1,1,1,1,165],
+    [26,51,115,1247,1,29,1,1,188,1,475,480,1,125,157,49],
+    [778,10,693,1,136,1182,1],
+    [1171],
+    [2391],
+    [1433,1,26,1,1,27,1437],
+    [1246,34,1,656],
+    [2636,1,16],
+    [122,85],
+    [1432],
+    [189,1336],
+    [49],
+    [371,152,1,1,1,1,165,163,1,1,1,1,151,273,1,310,91,43,371,240,1,36,1,1],
+    [1148,1,592,1,141,1,460,150],
+    [24,45,73,80,638,255,1,1,1,1,43,141,108,24,94,56,127,82,62,19,59,109,80,179,20,48,1,38,122,1,1,81,100,1,1,83,1,1,29,30,36,1,65],
+    [1924],
+    [2519,1,43],
+    [1365],
+    [89,14,5],
+    [308,5,10,59,75,25,25,10,52,1,1,1,1,55,5,10,10,66,58,10,27,63,1,1,1,1,141,5,10,10,103,59,86,1,1,132,141,173,142,94,129,287,1,1,95,1,190,1,1,44,1,1,177,1,1,85,46,42,44,54,43,29,41,55,32,31,56,15,54],
+    [1841,1,18,1,1,247,1,1],
+    [1962,1,53,1,8,1,1,11,1],
+    [304,5,10,59,75,25,146,5,10,10,66,95,208,5,10,10],
+    [1132,126,6,35,91,9,6,59,73,6,41,86,6,45,49,27,7,6,39,13,16,10,4,48,6,81,47,7,6,117,10,6,9,16,28,7,25,10,38,6,9,10,95,6,116,7,6,15,4,7,22,25,38,6,12,37,65,6,18,4,58,61],
+    [2445],
+    [2793],
+    [2445],
+    [430,335],
+    [431,335],
+    [35,1322,94,1,28,355,1,28,1,1,111,1,475,60,1,4,3,24,209,1,106,1,1,1,55],
+    [432,335],
+    [428,335],
+    [429,335],
+    [2180,1],
+    [763,1,1,1,1],
+    [3406],
+    [2468,1],
+    [1991],
+    [1716,1,1065,1,112],
+    [297,295,376,1943,1],
+    [85,1510,1,1,3,555,489,474,40,1,82,43],
+    [2822],
+    [296,295,376],
+    [294,295,376],
+    [1526,224,1,483,1,53,1,17,119,1,2,1,39,1],
+    [21,190,952,1,1,145,1,38,1,1,6,231,34,1,1,76,26,1,1,267,1,1,70,45,1,1,284,1,25,43,22,1,1,328,8],
+    [1989,1],
+    [2889],
+    [298,295,376],
+    [589,1,1,1,1,2,2,3,2,3,2,15,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,12,2,3,1,6,2,3,2,3,2,3,2,3,2,8,2,3,2,31,2,5,23,7,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,15,5,10,2,3,2,3,2,3,2,421,338],
+    [2415,1,1],
+    [295,295,376,1308,707],
+    [965,1,1,1,1,2,2,3,2,9,2,3,1,5,21,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,3,2,8,2,3,2],
+    [305,5,10,59,63,12,25,24,10,112,5,10,10,44,22,57,10,28,201,7,5,10,10,190,1053],
+    [2342,1],
+    [1312,782,1,546,1,1],
+    [1358,1,1,325],
+    [1383,961,101],
+    [76,2027,1,16,446,397],
+    [1279,103,1,454,412],
+    [944,1,1,1,1,226,648],
+    [69,2184,1],
+    [1068,1,1,1,1],
+    [2389,1],
+    [2628],
+    [97,1,1040,217,1,326,346,167,1,204,92,1,49,93],
+    [1555,58,1,54,1,1,1,1,1,881],
+    [47,65,1357,1,17,1,98,1,230,1,692,1],
+    [46,24,19,19,1,17,9,25,54,26,9,948,161,1,221,1,111,1,126,134,1,162,23,1,163,1,1,99,1,249,1,1,116,1,1,300,488],
+    [42,57,66,52,35,875,168,1,1,25,1,5,1,259,42,122,833,218,1,1,79,1,8,1],
+    [1459,145,1,13,211,1,515,1,81],
+    [18,13,1,1,9,20,18,14,1,7,30,22,20,56,6,14,38,84,36,1,1,1,1,171,86,1,1,1,1,20,256,10,52,67,1,1,1,1,33,86,1,10,24,2,1,49,54,10,1,12,21,29,1,34,4,1,31,1,1,37,4,42,1,1,12,12,51,1,3,58,1,2,1,1,19,7,1,23,1,24,63,22,1,1,1,49,26,1,4,22,1,86,9,1,1,15,104,29,44,20,13,1,1,1,14,1,1,15,33,1,4,7,10,1,29,1,20,1,13,28,10,1,25,18,49,33,1,1,24,23,1,2,1,1,34,5,1,1,43,64,7,34,58,26,1,4,12,16,2],
+    [1394],
+    [18,510,1,1,1,1,330,1,1,1,1,356,1,1,142,1,1,142,1,1,22,49,1,44,1,1,142,1,1,135,1,1,136,1,1,128,1,1,138,1,1,121,1,1,131,1,1,114,1,1,115,1,1,9,35,1,92,1,1],
+    [136,118,881,115,1,16,141,125,1,12,133,134,136,141,133,139,120,129,117,120],
+    [2871],
+    [1701,1],
+    [294,1,1,1,1,291,1,1,1,1,372,1,1,1,1],
+    [1448,1,195,731],
+    [553,1,1,1,1,278,1,1,1,1,300,1,515,1079,32,1,1,247,18,47,42,67,19,61,23,63,19,56,26,33,50],
+    [753,631,202,1,16,109],
+    [127,85,1199,130,1,1,1,1,407,171,286],
+    [1653,1],
+    [348,268,474],
+    [350,268,474],
+    [349,268,474],
+    [34,7,72,2,32,9,7,74,9,24,1180,76,163,1,108,408,1,1,211,1,1,18],
+    [1115,1,1,1,1,775,1,1,4,1,1,1,1,1,1,1,1],
+    [458,1,1,1,1,152,1,1,1,1,107,1,1,1,1,980,310,1,1,76,1,940,133,95,25,85,91,26],
+    [347,126,1,1,1,1,138,190,1,1,1,1,280,464,1,1,848,601,47,39,33,59,18,9,46,40,31,10,37,55,38,21,38,36],
+    [1414,1246],
+    [346,268,474],
+    [1088,1,1,1,1],
+    [277],
+    [182,52,1743,1,128,1,10,1,1,5,1,8,1,491,1,1,1,10],
+    [148,13,81],
+    [2193],
+    [1454,1],
+    [1547,1],
+    [1013,1,1,1,1],
+    [755,1621,1,1],
+    [131,124],
+    [508,10,260,10],
+    [1116,268,1,368,1,1,85,496,33,424],
+    [0,9,47,26,28,5,4,6,22,30,9,62,31,836,1,1,1,1,61,465,999,17,1,77,1,129,1,93,39,106,34,37,71,296],
+    [1237,382,1,42,1],
+    [1574,1],
+    [153,66,947,123,1,1,145,1,261,1,133,1,135,1,22,118,1,1,4,103,1,1,1,1,25,1,250,1,2,1,41,1,207,1,91,1,1,1,1,28,1],
+    [2732,1],
+    [2548],
+    [1421,1,1,541],
+    [1685],
+    [3106,125,82,122],
+    [6,552,177],
+    [2803,1,1],
+    [2233],
+    [124,85,705,1,1,1,1,1461,1,1,7,64],
+    [1664],
+    [79,1,292,76,1,1,1,1,241,17,1,1,1,1,297,232,1066,38,323,1,76,55,165,1,1,110,169,84,118,54,18],
+    [199,304,1,1,1,1,266,1,1,1,1,638,1,74,1,803,1,68,1],
+    [199],
+    [2910],
+    [2401,1],
+    [1125,1,1,1,1],
+    [1792,1],
+    [5,9,1145,174,819,47,1,225,1,636,328],
+    [110,1637,1],
+    [15],
+    [2120,196,50,1,1,198,302],
+    [9,1,1,1,1,1,1,1,1,6,1,3,24,8,12,30,3,30,110,284,1,1,1,1,330,1,1,1,1,39,317,1,1,142,1,1,142,1,1,37,78,1,1,1,59,1,39,1,42,1,1,54,36,1,1,43,1,1,136,1,1,128,1,1,138,1,1,121,1,1,131,1,1,76,1,1,36,1,1,115,1,1,53,1,1,1,81,1,1,1,1,1,124,183,166,139],
+    [1331,1,113,1,285],
+    [2857],
+    [19,71,416,10,260,10,282,1,1,1,1,213,73,1,1,34,818,1,1,1,1,1,162,214,1,1],
+    [225,2025,1,1,85],
+    [60,85,65,703,585,1,404,1,1,269,1,1,74,1,135,1,116,64,1,1,187,186,1,1,224],
+    [64,1374,1591,131,206,37,42,71],
+    [37,1,166,1070,1,1117,1,404,1],
+    [155,80],
+    [2198],
+    [2032,1,513,1],
+    [2997,6,14,3,15,17,1,7,5,16,7,5,9,9,13,17,4,3,19,7,9,7,3,19,6,1,6,3,6,15,16,7,6,12,9,5,13,29,10,3,21,3,1,13,23,1,6,11,11,11,12,24,1,4,1,3,3,12,4,2,14,3,6,2],
+    [620,176,60],
+    [1834,393,1,1,1,136,1,1,592],
+    [34,238],
+    [1613,1],
+    [996],
+    [205,1745,1],
+    [1552,379,346,389],
+    [508,1,1,1,1,266,1,1,1,1],
+    [311,10,59,75,176,10,10,374,10,10],
+    [41,33,5,191,1,839,1,1,1,1,845,1,189,328,1,1,1,1,1,12,1,1,19,1,1,2,1,2,1,4,1,1,1,1,1,1,7,1,1,37,1,1,1,1,5,9,1,1,1,1,1,1,1,1],
+    [42,2353,1],
+    [1274,1,1701,1],
+    [1412,1,401,1],
+    [1982],
+    [2398,1],
+    [1814,1],
+    [1330],
+    [203,1409,222,1067],
+    [336,87,253,82,337],
+    [304,1,1,1,1,235,1,1,1,1,77,1,1,1,1,197,1,1,1,1,80,1,1,1,1,105,1,1,1,1,132,1,335,1,325,222,1,359,1,593,5,45,18,18,24,26,36,3,37,41,27,17,15,26,52,2,26,49,1,24,12,25],
+    [1553,1,1,1121,1,1],
+    [2223],
+    [1267,279,943,1,1,357],
+    [414,335,357,29,943,284],
+    [2639,1,1],
+    [371,1,70,250,1,1,316,1,1,197,604,669,531,73],
+    [1949,141,638],
+    [2611],
+    [533,1,1,1,1,278,1,1,1,1,73,1,1,1,1,617,1,1,540,277,360,1,116,1,1,203,5,31,14,36,10,26,11,45,30,11,21,23,23,16,32,10,38,29,12,24,10,20,16,34,9],
+    [1250,1],
+    [815,1,1,1,1,589,125,1,145],
+    [1148,1,40,1,129,1],
+    [498,1,1,1,1,348,1,1,1,1,799,1,1174,1,327,359],
+    [118,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [2445],
+    [1448,1],
+    [2793],
+    [2828,1],
+    [1294],
+    [61,93,82],
+    [720,1,1,1,1,474,1,144,1,1,265,1,1,804,1,593,45,85,198,49,77],
+    [513,270],
+    [503,270],
+    [2078],
+    [2389,1],
+    [2098],
+    [1346,1,1438,1,1],
+    [478,1,1,1,1,328,1,1,1,1,73,1,1,1,1,722,1,102,1,147,1,1,535,1,1,116,1,271,1,1,68,1,1,1,277,33,45,9,62,90,3,37,29,48,4,19,4],
+    [2537,1,1],
+    [914,1,1,1,1,1470,104,1,267,1,64,1],
+    [2445],
+    [1298,1],
+    [341,1,1,1,1,264,1,1,1,1,470,1,1,1,1,1371],
+    [284,1,1,1,1,224,10,57,1,1,1,1,199,10,104,59,1,1,1,1,171,1,1,1,1,1,127,1,1,1,1,1,127,9,1,1,1,1,1,133,1,1,1,1,1,85,1,42,1,1,1,1,1,129,1,1,1,1,1,131,1,1,1,1,1,136,1,1,1,1,1,128,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,112,1,1,1,1,1,93,1,21,1,1,1,1,1,142,42,44,44,42,41,41,44,41,42,37,39,35,37],
+    [1141,1616,1,1],
+    [1633],
+    [1298,1,49,213],
+    [1289,1,17,1,14,1,1,307,1,712,712,443],
+    [1153,54,1,65,342],
+    [1420,1552],
+    [114,316,335],
+    [1183],
+    [431,335],
+    [1576],
+    [2763,1],
+    [2861,1,1],
+    [1480,895],
+    [1292,1,219],
+    [453,1,1,1,1,258,1,1,1,1,456,1,269,1,5,1,277,1,17,1,93,1,174,1,107,1,388,1,29,1,238,1,134,1,85,85,95,29,53,34,128,113],
+    [2948,1,1,552,47],
+    [1633],
+    [1357],
+    [75,1195,186,235,31,113,1,14,14,1,1,27,84,1,63,1,21,67,1,1,126,195,301,1,109,7,39],
+    [414,335,357],
+    [1764],
+    [2895],
+    [2515],
+    [432,335],
+    [398,1,1,1,1,26,231,1,1,1,1,100,388,1,1,304,1,101,1,1,601,1,1,73,1,1,382,1,1,1,275,1,96,96,33,91,44,51,23,82,35,84],
+    [1558],
+    [1298,1,195,7,77,243,80,268,396,119,250],
+    [1685],
+    [1236,106,187,547,1,1,443,432],
+    [1685],
+    [3228,62,90,69,48,23],
+    [1814,1],
+    [223,46],
+    [1744,1,1136,1],
+    [1490,1,1,539,373,1,1],
+    [228],
+    [483,1,1,1,1,281,1,1,1,1,2708],
+    [429,335],
+    [2098],
+    [887,1,1,1,1,1006,1,1,197,298,223,161,73,377,62,90,69,48,23],
+    [1115,1,1,1,1,314,1,26,1,1,27],
+    [383,1,1,1,1,267,1,1,1,1,395,1,1,1,1,124,1,89,1,447,1,1,126,1,1,664,1,491,29,95,46,39,130,74],
+    [1162],
+    [2180,1],
+    [129,112],
+    [2930,1,2,1,2,1,2,1,2,1],
+    [2127,1,1],
+    [894],
+    [2932,3,3,3,3],
+    [1139,1],
+    [1283,1,1],
+    [71],
+    [1463,1,1,812],
+    [1641],
+    [1361,30],
+    [81],
+    [2274],
+    [1340,1,36,1,1,260,1,1,142,1,404,1,1,138,1,1,370,1,1],
+    [1718,20],
+    [1215],
+    [225,926,1],
+    [435,1,357,1,901,1,954,453,355],
+    [3406],
+    [2667,1],
+    [375,261,394],
+    [376,261,394],
+    [377,261,394],
+    [373,261,394],
+    [1463,1,1],
+    [373,1,1,1,1,181,76,1,1,1,1,97,293,1,1,1,1,275,1,1,268,1,1,183,1,1,222,1,1,171,1,1,355,1,1,213,165,1,1,147,85,58,68,54,109,115],
+    [374,261,394,269,1],
+    [1414],
+    [62,842,1,1,1,1,2114,46,45,38,45,41,43,40,42,37,41,35,35,43],
+    [3045,85,58,68,54,109,115],
+    [1028,1,1,1,1],
+    [2468,1],
+    [2531,1],
+    [1483],
+    [1195,1,934,1,530,1,1],
+    [2391],
+    [1838,1,1,151,268,1],
+    [146],
+    [167,1,1,1,1,1],
+    [153],
+    [118,1,1,1,1,1,1,1,1,1,1,1,1,1,1,2,11,3,4,2,1,1,3,3,1,2,17],
+    [351,1,1,1,1,388,1,1,1,1,353,1,1,1,1,1923,89,126,127],
+    [2606,1,1,1,1,1,43,1,1,61,1,1,1,1,1],
+    [73],
+    [2881,1],
+    [62,1801],
+    [905,2,1,307,285,1,1,210,83,1,1,103,1,1,81,1,1,183,1,1,394,1,368,1,1],
+    [111,33,992,1,5,1,1,3,1,1,4,1,1,1,1,1,1,1,1,2,1,1,4,3,1,7,1,1,7,1,3,1,1,1,2,1,8,1,1,9,1,1,2,1,1,6,5,1,8,1,1,16,1,1,1,1,1,6,13,1,1,6,16,1,2,1,1,1,1,1,16,1,11,1,33,7,8,2,1,1,1,1,1,15,25,1,44,1,37,16,1,1,1,1,1,67,1,1,1,1,11,1,1,4,1,1,1,1,10,20,1,1,1,1,1,13,1,1,13,1,655,1,1,1,1,1,11,1,12,1,1,1,1,4,3,3,13,1,5,1,1,22,1,2,1,18,1,5,1,1,1,1,1,22,1,1,3,328,1,1,189,46,45,38,45,41,43,40,42,37,41,35,35,43],
+    [2467],
+    [319,1,1,1,1,38,1,287,1,1,1,1,28,1,222,2,137,1,1,1,1,174,665,1,1,1,633,1,1,493,18,110,80,131,65,84],
+    [413,1,1,1,1,331,1,1,1,1,353,1,1,1,1,2092],
+    [2477,1,1,1,1,1,12,1,1,19,1,1,2,1,2,1,4,1,1,1,1,1,1,7,1,1,37,1,1,1,1,5,9,1,1,1,1,1,1,1,1],
+    [93,810,307,1,1,113,1,1,157,1,1,109,1,1,7,1,41,230,1,1,102,1,51,1,94,1,1,27,1,70,1,1,59,1,1,247,1,1,119,1,1,46,1,1,49,1,1,61,29,1,45,25,1,1],
+    [1680,1,1,10,1,1,4,1,1,1,1,5,1,8,1,2,1,1,1,1,1,2,1,1,4,1,2,1,7,1,1,8,1,5,1,15,1,1,3,2,1,1,1,13,10,1,1,1,1,1,12,7,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,4,1,1,1,4,1,1,1,1,1,1,1,2,1,1,1,6,12,1,1,10,1,2,1,1,1,1,1,1,1,4,4,1,10,1,1,1,1,1,135,180],
+    [2102],
+    [904,628,606,197],
+    [8,9,178,80,913,148,13,1,1,60,168,176,46,24,58,1,131,20,1,207,1,1,46,1,109,1,38,1,190,101,1,20,34,103,1],
+    [63,272,2,87,251,2,82,166,5,5,5,154,2,1555,1],
+    [2679,1,1,5,1,95,1],
+    [1493,1],
+    [201,1223,1,1,144,52,1,1,26,1,1,842],
+    [1144,1087,1,10,7,29,1,1,29,36,1],
+    [1239,1,12,125,1,1,260,1,1,142,1,404,1,1,138,1,1,370,1,1,101,1],
+    [137,31,91,1191,166,1,613,433,127,96],
+    [1983,1,133,621],
+    [297,295,376,401,1,1,1115,1,424,1],
+    [2948,1,1,552,47],
+    [1244,1,1,64,1,69,1120,49,1],
+    [737,1772,43,1,324,82,8,1],
+    [1893],
+    [1920,1],
+    [1450,197],
+    [1424,1,166,750],
+    [736],
+    [338,87,253,82,337,888],
+    [2883],
+    [341,1,1,1,1,264,1,1,1,1,470,1,1,1,1,434,43],
+    [2400],
+    [892,1,1,1,1,332,1,143,1,143,1,117,1,71,72,1,136,1,6,134,1,15,1,1,109,1,139,1,122,1,132,1,115,1,116,1,141,1],
+    [2644],
+    [2155],
+    [1600],
+    [1439,1,155,1],
+    [152,66],
+    [85],
+    [37,889,5,5,5,1326,203],
+    [3118,40,1,82,43],
+    [503,1,1,1,1,266,1,1,1,1],
+    [64,123,102,1,1,1,1,291,1,1,1,1,372,1,1,1,1,166,1,1,1,1,1,42,6,4,45,24,1,1,1,1,1,43,1,286,1,1,643,3,86,170,1,1],
+    [1230,406,714,115,1,169,22,40,117,69,73,13],
+    [2775,21],
+    [355,392,416,1,1,68,116,1,1,270,1,1,1,371,1,1,115,1,311,65,1,1,331],
+    [7,9,180,289,285,141,41,292,1,282,1,335,72,1,135,277,1],
+    [1178,1,1620],
+    [288,295,372,1,1,1,1,155,24,654,1,1,123,625,39],
+    [111,1881,1,35,113,44],
+    [1490,1,301,1,400,211,1,231,1,277,1],
+    [130,14,54,35],
+    [38,1644,12,86],
+    [38,107,65,900,1,1,1,1,79,331,346,1,187],
+    [202,1498,858,1,2,1,2,1,1,1,1,2,1],
+    [33,876,1,1,1,1,734,1174,1,202,46,83,85,44,40,42,37,40,36,35,43],
+    [21,141,49,34,273,1,1,1,1,266,1,1,1,1,1266,2,243,1,1,132,1,138,1,1,227,14],
+    [33,9,20,40,71,28,66,487,606,14,77,1,66,677,211,301,145,1],
+    [371,159,162,172,146,1618,20,1],
+    [2560,9,3],
+    [2563],
+    [2448],
+    [1823,1,410,1,1,971,126],
+    [2678,128,1,1],
+    [434,254,303,651,1457,209],
+    [2702],
+    [56,63,67,2214],
+    [339,87,253,82,337],
+    [1618],
+    [1230,144,144,118,144,137,141,127,102,38,123,133,116,117,142],
+    [919,1,1,1,1,1853,1,290,83,45,41,83,42,113],
+    [2111],
+    [296,295,376,1560],
+    [2153,1],
+    [1550,1,286,86,12,1,1],
+    [1589,1,51,420],
+    [294,295,376],
+    [39,1165,1],
+    [339,77,10,253,72,10,337,10,1402,1,1],
+    [113,1155,1,37,3,31,1,1,220,1,5,1,56,1,427,1,1,171,93,29,1,2,1,1,1,1,1,468],
+    [18,239,1323,1,1],
+    [1294,1447],
+    [24,79,5,2214,48,1,459,30,36,1,65],
+    [1251,3,497,341,3,6,124,10,54,110,9,18,3,40,36,125,100],
+    [2094,1,158,1],
+    [47,1150,344,1,1,1,1,168,1,105,487,367,1,1,209,1],
+    [1526,893,1,143],
+    [23,56,2230,38],
+    [1552,282,97,296,1,1,1,20,1,26,109,1,279,90],
+    [1553,1,1,1121,1,1],
+    [143,10,51,11,4],
+    [1195,1,934,1,530,1,1],
+    [2391],
+    [351,1,1,1,1,388,1,1,1,1,353,1,1,1,1,1923,89,126,127],
+    [1700,26,1,1,25,1,109,275,140,1,1,187,219,1],
+    [1244,1,1,64,1,582,616],
+    [2267],
+    [21,181,9,144,392,416,1,1,184,1,1,271,1,1,76,295,1,1,115,1,190,1,1,119,13,1,51,1,1,67,1,1,1,1,1,1,1,1,1,1,1,1,1,1,56,50,128,1,1,11],
+    [56,63,67,248,254,303,2108,209],
+    [1935,1,1,216,1],
+    [23,2044,24,1,2,1,129,1,122,51,1,485,1],
+    [143,10,66],
+    [1726,1,1],
+    [324,1,1,1,1,271,1,1,1,1,372,1,1,1,1,301,1,224,1,82,577,1,1,1,1,1,1,1,1,1,1,1,246,1,404,109,1,1],
+    [105,12,40,90],
+    [65,670,792,1,820,1],
+    [388,1,1,1,1,308,1,1,1,1,354,1,1,1,1,103,117,69,75,198,373,117,310,67,525,42,24,61,42,41,45,34,49,75,40,73],
+    [558,177,1119,1],
+    [498,1,1,1,1,348,1,1,1,1,461,338,1,1174,1,327,359],
+    [1989,1,586,1,1],
+    [2653],
+    [594,5,5,20,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,10,5,33,37,5,5,5,5,5,5,5,27,5,5,5,5],
+    [564,1,1,1,1,304,1,1,1,1,410,1,564,1,104,1,311,1,376,1,393,82,94,32,96,114,74],
+    [970,5,11,32,5,5,5,5,5,5,5,5,5,10,5],
+    [1785],
+    [2799],
+    [2013,1],
+    [56,9,23,140,134,320,1198,1,1],
+    [523,332,645,1,399,1,267,1,395,1,368,1],
+    [1013,1,1,1,1],
+    [1276,1616],
+    [2889],
+    [51,124,98,1230,325,78,1,18,246,1,398,1],
+    [1496,398,1,270,1,392,1,371,1],
+    [60,18,1204,84,1,5,1,2,11,41,1,139,34,1,1,134,1,427,1,2,1,2,1,2,1,138,1,1,1,423,1,87,209],
+    [1316,1,1232,1,1],
+    [106,1401,1,828,225,1,37,340,1,21],
+    [356,1,1,1,1,188,1,1,1,1,22,1,1,1,1,105,1,1,1,1,143,1,1,1,1,48,1,1,1,1,100,1,1,1,1,154,50,9,30,47,1,31,68,141,86,1,1,33,114,1,2,1,1,25,58,1,1,77,87,1,1,49,1,96,126,150,1,99,1,168,208,1,47,52,1,36,41,9,40,1,45,2,1,19,7,50,4,40,2,22,19,38,5,22,9,41,29,6,33,5],
+    [1221,367,1030,1,1,398,45,46,37,45,41,43,40,42,38,41,34,36,42],
+    [2167,3,3,3,136,29],
+    [291,5,57,15,71,61,86,5,30,124,52,55,110,5,15,15,105,504],
+    [1498,7,1,397,1,91,1,1,22,1,154,1,247,1,144,1,289,27,1,51,1,1,4,1],
+    [324,1,1,1,1,271,1,1,1,1,372,1,1,1,1,526,1431,1],
+    [298,295,376],
+    [2817],
+    [2947],
+    [1459],
+    [2190],
+    [337,87,253,82,337],
+    [340,87,253,82,337],
+    [105,12,40,90,2083],
+    [1382],
+    [2299],
+    [1383,1352,1,1],
+    [1644],
+    [1306,1042,1],
+    [1704,1,1,49,31],
+    [747,9],
+    [944,1,1,1,1,284,144,144,118,144,137,141,127,140,123,133,116,117,142,67,46,44,39,44,41,44,40,42,37,40,36,35,43],
+    [1167,112,248,1],
+    [1104],
+    [1662,1,191,1,420,1,50,1105],
+    [1270,367,1061,259],
+    [2507,1,1,306],
+    [2458],
+    [1231,625,62,664],
+    [1665,1,393,127,602,1],
+    [1418,1,997,1,334,1],
+    [139,31,91],
+    [1375],
+    [2066,622],
+    [3286,228,46],
+    [587,5,206,470,1,250,262,668,103,1,141],
+    [2415],
+    [963,5,15],
+    [1577,1,1,1317,1],
+    [373,1,1,1,1,257,1,1,1,1,390,1,1,1,1,2013,85,58,68,54,109,115],
+    [1477,1,1,34,1,1,471,1,31],
+    [52,436,1,1,1,1,348,1,1,1,1,1144,1169,248],
+    [25,363,1,1,1,1,308,1,1,1,1,288,1,1,64,1,1,1,1,364,193,1,270,1,1,1,60,1,32,1,20,1,1,13,1,14,270,1,708,42,24,61,42,41,45,34,49,75,40,73],
+    [44,47,30,110,1930,355,1],
+    [1307,1],
+    [1863],
+    [1282,877,1,455,1],
+    [227],
+    [2518,380],
+    [2126],
+    [28,606,1,1,1,1,527,144,42,273,138,1,1,233,117,310,67],
+    [2112,1,1,22,1,15,12,33,12,1,45,108,1,1,53],
+    [483,1,1,1,1,281,1,1,1,1,2708],
+    [1379,895,627],
+    [295,295,376,646,355,715,187,1,1,110],
+    [336,87,20,1,1,1,1,111,118,19,1,1,1,1,36,23,290,1,1,1,1,43,634,1,1,1447,39,29,107,41,101],
+    [188,1666,1],
+    [2703],
+    [2868],
+    [502,352,641,1421],
+    [501,352,1609,1],
+    [29],
+    [500,352],
+    [498,352],
+    [1653,1,163,1,1010,1,35],
+    [1650,1,813,370,1,1,134,1,1,58,87,38,212,37,113,41],
+    [6,9,835,1,1,1,1,303,1,58,1,1,443,1445,125,26,56,110,12],
+    [344,5,142,5,116,5,226,5,238,5,2065,359],
+    [499,352],
+    [143],
+    [197],
+    [508,1,1,1,1,266,1,1,1,1],
+    [1475,1,495],
+    [1120,1,1,1,1],
+    [58,2763,1],
+    [217,311,1,1,1,1,330,1,1,1,1,254,1,1,1,1,1,1,1,1,1,1073,1,1,1,388,1,1,1,422,45,46,37,45,41,43,40,10,32,38,41,8,26,36,42],
+    [294,1,1,1,1,2,5,5,5,5,5,5,27,6,11,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,55,5,5,5,5,6,5,5,5,14,1,1,1,1,2,5,5,20,5,5,5,5,5,5,5,5,5,14,5,7,5,5,5,5,5,5,5,8,25,37,5,5,5,5,5,5,5,32,5,5,5,5,10,17,5,25,20,1,1,1,1,2,5,11,5,9,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,42,1135,1],
+    [483,1,1,1,1,281,1,1,1,1,511,1,1,778,67,1,1,126,1222],
+    [73,455,1,1,1,1,330,1,1,1,1,1187,1,1,11,221,731,45,46,37,45,41,43,40,42,38,41,34,36,42],
+    [72,1369,612,1,1,410,1,112,276],
+    [1318],
+    [66,1357,106,102,1,1,198,935,1,1],
+    [30,1,30,6,1,115,250,1,8,61,10,175,6,79,9,1,9,69,36,1,1,1,1,1,83,6,21,98,334,165,380,1,917],
+    [1234,328,1],
+    [2058,2,444,1,1,70,1],
+    [1321],
+    [69,2218,40,140],
+    [26,2185,311,1,1,292,511],
+    [166,92,1573,55,1,1,1,316,38,1,1,1,261,1,1,37,1],
+    [155,80,84,1,1,1,1,326,1,1,1,1,390,1,1,1,1,174,1576,1,219,18,110,80,131,65,84],
+    [1181,1,11,25,306,114,1276,1],
+    [2699,259,24],
+    [301,10,5,5,5,5,49,5,10,5,10,35,5,5,5,15,50,10,31,10,20,5,5,25,10,5,5,5,5,10,26,10,5,10,5,13,67,10,40,17,10,15,17,56,5,30,18,10,5,5,5,5,10,15,42,166,565,105,312,377],
+    [2342,1],
+    [1232],
+    [386,271,399],
+    [1392,1,1680],
+    [50],
+    [1312,782,1,611],
+    [165,87,256,1,1,1,1,266,1,1,1,1,665],
+    [1115,1,1,1,1,1037,1],
+    [2642,1,206,1],
+    [33,380,1,1,1,1,331,1,1,1,1,157,1,1,1,1,192,1,1,1,1,538,1245,132,46,83,48,37,44,40,42,37,40,36,35,43],
+    [736,1],
+    [38,65,5,37,65,900,1,1,1,1,96,1,1,113,1,1,35,1,1,1,119,1,1,109,1,1,530,1,1,159,1,1,247,1,1,119,1,1,97,1,1,136,25,1],
+    [3074,488],
+    [1171],
+    [1170,213,561,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,2,9,13,1,1,10,1,1,4,1,2,1,1,1,1,7,1,1,1,1,7,1,1,1,1,1,4,1,1,1,1,1,1,1,1,4,1,2,2,7,11,1,1,1,1,1],
+    [903,701,1,41,581,1,1,591],
+    [736,1,1380,459,1,1,94,88,1,1],
+    [2583],
+    [387,271,399],
+    [889,958,1,1,21,1,48],
+    [2297,1,486],
+    [383,271,399],
+    [2187],
+    [2339,1,25],
+    [2198],
+    [2615,1],
+    [69,73,80,638,825,109,140,410,219],
+    [1214,964,11,14,1,68,1,138,24,115],
+    [1526,174,606],
+    [70,27,1,28,88,924,349,1,92,1,2,1,46,52,70,13,1,110,1,1,102,1,47,381,133,93,258,1,28],
+    [1384,1,455,496],
+    [2363,1,287,1,1],
+    [1068,1,1,1,1,286,1,1,78,594,1,824,172,131,8,198,37,42,71],
+    [1814,1],
+    [543,1,1,1,1,278,1,1,1,1,80,1,1,1,1,903,582,1,593,50,36,50,36,40,41,44,41,52,28,49,25,37],
+    [122,16,31,38,49,4],
+    [2098],
+    [1707,1,11,1,1,61],
+    [1282],
+    [384,271,399,387,619],
+    [1210,1,1,113,1,1,56,101,1,1,109,1,1,347,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,2,2,9,13,1,1,10,1,1,4,1,2,1,1,1,1,7,1,1,1,1,7,1,1,1,1,1,4,1,1,1,1,1,1,1,1,4,1,2,2,7,11,1,1,1,1,1,43,1,1,159,1,1,247,1,1,119,1,1,97,1,1,161,1],
+    [69,1316,959,513],
+    [20,73,2000,352],
+    [463,1,1,1,1,333,1,1,1,1,2196,57,87,115,37,93,22],
+    [93,344,1,1,1,1,354,1,1,1,1,2199,167,105,81,101],
+    [1683,1],
+    [2103,1,859],
+    [1225,1,1,71,1,1,69,1,1,404,1,1,135,1,1,179,28,1,842],
+    [83,21,1021,1,1,1,1,110,1,222,109,1,244,139,120,224,146,147,156,1,29,55,134,1],
+    [423,1,1,1,1,331,1,1,1,1,1397,1,1126,228],
+    [1872],
+    [20,47,1488,370,1,808],
+    [1256,1,1,1,1,1,136,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,30,99,1,1,1,1,1,131,1,1,1,1,1,136,1,1,1,1,1,128,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,112,1,1,1,1,1,115,1,1,1,1,1,142,1,1,1,1,1,42,44,44,42,41,41,44,41,42,37,39,35,37,45],
+    [76,1203,103,1,454,457,1],
+    [2138],
+    [154,82,1736,541,1,193],
+    [2076,1],
+    [2969],
+    [61],
+    [60,2189],
+    [1483],
+    [2551],
+    [1271,1],
+    [1574,1],
+    [1237,1,282,1249,1],
+    [100,844,1,1,1,1,226,648,360],
+    [1709],
+    [1216,1,159],
+    [2919],
+    [3005,29,95,46,39,130,74],
+    [71,198],
+    [564,1,1,1,1,304,1,1,1,1,322,1,87,1,260,1,1,302,1,104,1,311,1,376,1,241,1,1,150,82,94,32,96,114,74],
+    [69],
+    [284,1,1,1,1,291,1,1,1,1,372,1,1,1,1,171,1,1,1,1,1,127,1,1,1,1,1,127,9,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,129,1,1,1,1,1,131,1,1,1,1,1,136,1,1,1,1,1,128,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,112,1,1,1,1,1,115,1,1,1,1,1,142,42,44,44,42,41,41,44,41,42,37,39,35,37],
+    [72,347,335,1499,1],
+    [2450],
+    [1785],
+    [1068,1,1,1,1],
+    [1866],
+    [76],
+    [1241,1,1137,10,1,349,1,1,61,52,32,6,72],
+    [2625,1,1,1],
+    [783,1,1,1,1],
+    [887,1,1,1,1,2337,62,90,69,48,23],
+    [889,797,1],
+    [1138,544,346,366,148,75,18],
+    [463,1,1,1,1,333,1,1,1,1,86,473,1,1,1635,57,87,115,37,93,22],
+    [403,1,1,1,1,257,1,1,1,1,405,1,1,1,1,107,1,1,1462,1,30,1,1,1,324,85,75,137,72,38,72],
+    [891,464,1,56,1,484,1,590],
+    [366,1,1,1,1,249,1,1,1,1,264,108,1,1,1,1,1097,236,772,1,1,1,1,119,2,1,1,81,1,1,118,1,1,1,109,1,1,1],
+    [1247,1,41,1,17,1,14,1,321,551,297,1],
+    [1298,1],
+    [1618,281,144,302,1,54,7,1],
+    [528,1,1,1,1,330,1,1,1,1,22,795,1,1094,240,45,11,35,37,45,41,43,40,42,38,41,34,36,42,14],
+    [1334,1,77,1,270,1],
+    [1156,336,548],
+    [538,1,1,1,1,278,1,1,1,1,110,1,1,1,1,1,1,1,1,1,510,230,1,723,1,591,22,22,23,11,35,20,17,23,22,27,14,38,6,19,20,34,8,25,13,11,30,9,25,30,6,14,29],
+    [97,1115,112,162,111,693,3,246,212,1,7],
+    [5,93,435,1,1,1,1,278,1,1,1,1,536,1,793,189,513,163,14,22,50,36,86,32,46,48,77,36,30,50,16],
+    [1240,147,262,142,137,140,130,140,251,121,256],
+    [1414],
+    [1592,1,625,1,1,1,1,25,1,8,1,11,1,31,1],
+    [1139,1],
+    [89],
+    [1333,1168,1],
+    [1436,1,555,1,295,1,1],
+    [1160,1,125,1,26,1,1,1,1,1,237,58,1,54,1,1,1,1,1,700,1,45,1,1,77,1,4,387,1],
+    [1869,685,91,1,197,1,1,1,1,11,1,16,1,44,1,57],
+    [405,65,196,66,343,647,128,191,1],
+    [1601,1,1142],
+    [9,1,1,1,1,1,1,1,1,7,5,30,12,1,29,3,16,101,1173,2,73,1,210,1,1,10,1,1,4,1,1,1,1,5,1,8,1,2,1,1,1,1,1,2,1,1,4,1,2,1,7,1,1,7,1,1,5,1,15,1,1,3,2,1,1,1,13,1,1,1,7,1,1,1,1,1,4,1,7,7,1,2,1,1,1,1,1,1,1,1,1,1,2,1,1,1,1,1,1,3,4,1,1,1,4,1,1,1,1,1,1,1,2,1,1,1,6,12,1,1,10,1,2,1,1,1,1,1,1,1,4,4,1,10,1,1,1,1,1,563,4,1,382,1,70],
+    [47,368,3,1,1,1,1,328,3,1,1,1,1,350,479,1,398,147,299,1,1,236,10,1,1,5,1,95,1,289,213,83,75],
+    [1487,1],
+    [406,40,5,20,96,100,31,15,20,142,176,25,47,878,1],
+    [112],
+    [1186],
+    [2464],
+    [70,56,88],
+    [1392,1,1680],
+    [108,247,392,357,21,1,1,1,1,510,1,540,1],
+    [1468,357],
+    [1093,1,1041,161],
+    [2,9,34,58,32,44,24,46,32,916,34,144,66,78,118,144,38,99,51,22,9,29,1,29,43,78,1,1,4,140,46,77,12,121,116,117,3,93,1,39,1,1,4,87,63,26,44,75,89,38,166],
+    [2224,1],
+    [2857],
+    [2116],
+    [55,34,95,1396,1,64,308,1,349,1,1,30,130,1],
+    [2258],
+    [46,2059,33,44,529,1,362,488],
+    [109,2024,1],
+    [160,80,2587],
+    [148,13,81,995,1534],
+    [1358,1,333,1,446,1,264,1,249,1,1,116,1,1],
+    [174,76],
+    [2694],
+    [2320,1,1,121,1],
+    [116],
+    [2282,1],
+    [42,503,282,156,311,172,1,163,377,1,1,404,1,367,53,1,135,1],
+    [332,214,61,221,359,463,1,278,1,906],
+    [1184,1,107,1,37,79,1,105,632,308],
+    [1295,1,1,31,1,463,1],
+    [2464,420,1],
+    [333,214,61,221,153,885,1,1,1033,1,1],
+    [329,214,61,221,155,618,1,405,1,1,139,1,1],
+    [1565,1,359,217,1,316,1,297,1],
+    [165,52,35],
+    [1322,1,140,1],
+    [518,1,1,1,1,266,1,1,1,1,943,1],
+    [330,214,61,221,1227,1,1],
+    [1297,455,1141,1],
+    [984],
+    [25,41,39,12,1222,499,1,420,1,306,239],
+    [99,505,1,1,1,1,217,1,1,1,1,312,47,149,1,250,822,1,1,3,110,1,253,1,23,1,250,7],
+    [1000,1,1,1,1,468,1,654,1,1,372,1,202,268,20,15,1,22,12,7,29,16,2,21,11,9,18,9,16,24,16,20,5,17,2,25,17,24,17,20,15,4,18,6,12,37,4,16,5,14,19,4,15,22],
+    [331,275,375],
+    [980,1,1,1,1],
+    [2612,1,215,1,45],
+    [1191,1,548,89,1],
+    [1618,727,1,81],
+    [1604,1],
+    [1459,740,1],
+    [2811],
+    [2199,1,1,58,1,60,1,61,28,1,1,22,1,1,361,1],
+    [1487,1,160,305,1,139,329,1,20,1,248,1,272],
+    [1239,274,1,1,137,833,338],
+    [80,1491,1,1,494,916],
+    [59,1,18,29,66,29,65,1021,295,1,126,1,23,7,1,111,105,1,1,1,309,43,1,1,1,76,1,64,164,1,1,24,11,1,1],
+    [1212,238,36,111,383,1,216,93,249,200,1,19],
+    [1876,1,1,49,568,1,92,85,1],
+    [1737],
+    [122,85,971,1,12,10,1,264,1,175,123,1,63,1,246,1,293,1,552,1,1],
+    [132,22,20,56,6,14],
+    [2864],
+    [1386,936,256,252],
+    [31],
+    [1529,346,839,1,1],
+    [408,1,1,1,1,22,235,1,1,1,1,15,303,87,1,1,1,1,92,117,374,1,1,1432,209],
+    [32,2071,1,417,154],
+    [407,40,5,20,96,100,31,15,20,142,176,25,47,330,1,848,1,1,617],
+    [288,295,366,10,156,123,44,60,10,1,12,1,1,5,1,2,11,29,1,109,60,205,315,121,111,333,1,38,100,1,138,1,1,86],
+    [1236,502,637,578,66,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [372,321,318,821,1,18,1,21,1,38,1,1,392,613],
+    [1713,1,1],
+    [120,101,672,3,473,1,1,585,1,8,1,2,56,97,1],
+    [403,40,5,20,96,100,31,15,20,142,20,156,25,47,274],
+    [76,2039],
+    [1700,85],
+    [1285,836,1],
+    [18,2799,162,1,1],
+    [2065,898],
+    [1433,1,26,1,1,27,1164],
+    [1115,1,1,1,1,43,141,108,118,56,127,163,168,80,179,107,205,100,1,1,83,61],
+    [1211,211,6,21,123,3,8,1,106,24,110,67,1,15,23,6,18,33,21,15,117,6,5,12,9,12,23,340,24,23,1,12,1,8,3,14,1,12,9,1,9,9,3,13,6,5,11,6,1,5,1,18,3,9,37,9,12,19,3,3,1,14,50,18],
+    [95,854,186,115,1,16,55,1,29,1,55,46,1,78,1,12,25,1,1,106,134,136,141,3,130,139,8,1,4,7,100,3,126,117,120],
+    [182,52,2404],
+    [27,53,448,1,1,1,1,330,1,1,1,1,356,1,1,142,1,1,142,1,1,116,1,1,142,1,1,135,1,1,136,1,1,128,1,1,115,1,22,1,1,121,1,1,131,1,1,114,1,1,112,1,1,1,1,1,137,1,1],
+    [2609,111,6,114],
+    [1982,693],
+    [2398,1],
+    [2901],
+    [533,1,1,1,1,278,1,1,1,1,316,115,1,16,141,125,1,12,133,134,136,141,133,139,120,129,117,120,166,36,50,36,86,32,46,48,77,36,30,50],
+    [136,11,9,1,6,43,31,9,1,7,16],
+    [1289,1,1247,1,1,218,1,1],
+    [2871],
+    [2078,605,1],
+    [894,1233,1,1],
+    [1698,1,2,1,73,1,1,21,10,1,1,1,1,1,12,7,1,2,1,5,1,1,1,1,2,1,1,1,1,1,1,3,4,1,1,5,1,1,1,1,1,1,1,2,1,1,7,12,1,11,1,2,1,1,1,1,1,1,1,4,4,1,10,1,1,1,1,1],
+    [1834],
+    [1606],
+    [58,236,1,1,1,1,106,40,5,20,96,24,1,1,1,1,72,31,15,20,142,92,1,1,1,1,80,25,47],
+    [103,5],
+    [1644,1210],
+    [66,39,12,401,1,1,1,1,266,1,1,1,1,502,221],
+    [949,499,1,5,1,245,594,1,80,7],
+    [1846,83,1,746,1,65,1,1,18,6,23,1,20,1,2,8,8,1,4],
+    [895,1275,596,1],
+    [2768],
+    [1655],
+    [553,1,1,1,1,278,1,1,1,1,2176,18,47,42,67,19,61,23,63,19,56,26,33,50],
+    [1758],
+    [1139,1],
+    [256,1191,260,1,1,216,1,371,1,486,135],
+    [1412,1,433,83,1,746,1,65,1,1,13,1,1,3,6,23,1,20,1,2,8,8,1,4],
+    [356,1,1,1,1,323,1,1,1,1,299,1,1,1,1,827,1,1368,308],
+    [73,180,1273],
+    [383,1,1,1,1,267,1,1,1,1,395,1,1,1,1,124,1,89,1,188,1,258,1,1,126,1,1,422,1,1,240,1,415,76,29,95,46,39,130,74],
+    [2425,1,308],
+    [1974,1,1,478],
+    [1219,1,80,325,1,1,651,1,1],
+    [1814,1],
+    [1932,1,1,376,1],
+    [2261],
+    [1471,188,1,1195,1],
+    [14,87,2411],
+    [2548],
+    [1225,1,1,595],
+    [66],
+    [1301,1,284,1],
+    [1712],
+    [1325,1,1,268,1,1,886,1],
+    [146,4,17,97,895,906],
+    [74,1615,1],
+    [1247,1,489],
+    [34,1676,1],
+    [1484,1,1],
+    [1166,38,1,1,71,1,106,8,1],
+    [1112,222,1,220,848,331],
+    [1157,1,1,382,1,1,1,1,141,1,1,869,356],
+    [35,32,60,85,20,67,1,1,1,1,291,1,1,1,1,372,1,1,1,1,372,1,1,85,1,518,126,70,488,1,148,1,1,91,1,1,25,1,1,149,443],
+    [1111],
+    [463,1,1,1,1,21,1,1,1,1,308,1,1,1,1,36,1,1,1,1,567,712,286,285,306,57,87,13,102,37,93,16,6],
+    [215,60,2,1,1754,1,120,1,401,1],
+    [145,65,17,963],
+    [371,159,162,172,146,104],
+    [1110,173,1],
+    [1113,249,23,1199],
+    [63],
+    [2099,437,470,3,30,8,15,11,6,12,4,26,45,12,27,10,2,29,1,1,53,2,29,7,4,10,19,3,15,4,19,4,33,7,5,23,1,9,9,18,9,1],
+    [293,5,189,101,5,179,197,15,1792,1],
+    [1739],
+    [1603],
+    [1795,1,1],
+    [1502,400,1033],
+    [1504,404,265,399],
+    [1496,2,2,1,2,2,2,1,386,1,5,1,2,1,2,1,258,1,2,1,2,1,2,1,383,1,2,1,2,1,2,1,2,1,359,1,2,1,2,1,2,1,2,1],
+    [2206,1,1],
+    [1509,1432],
+    [1499,157,1,248,271,393,375],
+    [1506,1432],
+    [445,5,116,131,15,162,70,1,1,1,1,102,72],
+    [153,66],
+    [176,98,1379,1],
+    [1929,1,1310,239],
+    [1210,1,1],
+    [1998,1],
+    [2066],
+    [2000],
+    [2013,1],
+    [2078],
+    [3074,488],
+    [415,335,357],
+    [65,23,140,1652,1,1],
+    [416,335,357],
+    [413,335,357],
+    [414,335,357],
+    [56,306,320,1009],
+    [417,335,357,606,74,37,1,317,102,488,232,17],
+    [748,1,1,1,1,1503],
+    [4,1170,2027],
+    [1105,1,1,1,1],
+    [2629,1],
+    [162,83],
+    [509,10,219,1,1,1,1,37,10],
+    [287,191,1,1,1,1,29,10,61,199,10,19,1,1,1,1,81,58,5,155,2028,33,45,164,37,81,23],
+    [1500,1,399,1,267,1,1,394,1,66,302,1],
+    [93,430,332,563,1],
+    [348,89,1,1,1,1,175,179,1,1,1,1,291,1908,167,105,81,101],
+    [2766,1],
+    [2195,1,572],
+    [2156,1,1],
+    [1013,1,1,1,1],
+    [1151,1,1,189,141,132,103,379,1,1,422,242,1],
+    [907],
+    [36,3,311,268,474],
+    [48],
+    [2003],
+    [1396,1110],
+    [22,18,226,2445,1],
+    [1225,1,12,78,1,1217,1,8,1,42],
+    [52],
+    [2793,281,488],
+    [1276],
+    [681,87],
+    [720,1,1,1,1,2286,45,85,198,49,77],
+    [2871],
+    [1442,1,1,1448],
+    [349,268,474],
+    [1982,693],
+    [2091,1],
+    [64,10,2775,1],
+    [1655,878],
+    [2961],
+    [928,5],
+    [2962],
+    [902,461,1,1525],
+    [938,5,219],
+    [1752],
+    [2461],
+    [1194,1224,656,488],
+    [2233],
+    [2713],
+    [2106,1],
+    [2711,1],
+    [2920,1],
+    [2136,1],
+    [378,1,1,1,1,257,1,1,1,1,390,1,1,1,1,294,1,630,1,906,1,182,29,43,125,277],
+    [51,1777],
+    [1925],
+    [1203,215,1,460,224,1,1,401],
+    [553,1,1,1,1,278,1,1,1,1,664,403,1,264,1,398,1,444,18,47,42,67,19,61,23,63,19,56,26,33,50],
+    [1243,712],
+    [175,98],
+    [1683,1,74],
+    [43,1025,1,1,1,1],
+    [1139,1],
+    [2150,1],
+    [1172,1],
+    [57],
+    [1005,1,1,1,1],
+    [1140,273,144,54,55,149,80,209,6,50,6,15,32,1,345,90,282],
+    [85,217,5,5,5,5,5,5,27,5,5,7,5,5,5,5,5,5,5,20,5,10,5,5,5,5,5,5,5,5,15,25,10,5,5,5,5,6,5,5,5,20,5,5,15,5,5,5,5,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,3,5,25,5,23,9,5,5,5,5,5,5,5,15,5,12,5,5,5,5,10,17,5,25,26,5,11,4,5,23,5,5,5,5,5,5,5,5,5,5,5,5,42,1788,1],
+    [2247,1,715],
+    [5,9,1145,174,866,1,225,1,26,610,328],
+    [2215],
+    [129,12,31,16,53,22,3],
+    [2760,1,29,35,1],
+    [1420],
+    [1729,1],
+    [1820,1],
+    [1377,1,1,260,1,1,142,1,404,1,1,138,1,1,370,1,1],
+    [435,1,357,1,1856,453,355],
+    [1879,772,1],
+    [892,1,1,1,1,543,1],
+    [1193,677,1],
+    [39],
+    [79,260,77,10,253,72,10,337,10,142,1,1573],
+    [1315,988,1,1,132,1,240,128,1,1],
+    [51,9,18,97,98,871,781,137,537],
+    [139,31,91,970,37,1,1,105,43,1,1,99,118,144,73,1,1,62,141,127,140,123,58,1,1,43,1,1,28,35,55,19,3,3,1,1,7,109,101,41],
+    [2152],
+    [443,1,1,1,1,248,1,1,1,1,349,1,1,1,1,677,1,1,236,715,187,1,1,307,39,29,107,41,101],
+    [1661],
+    [72,362,254,303,1265,1],
+    [26,140,92,61,1,1,1,1,62,264,1,1,1,1,3,387,1,1,1,1,8,126,1,39,67,565,33,1,1,1,69,253,59,252,1,1,123,370,18,110,80,102,29,65,84],
+    [386,271,399],
+    [736,1,433,1,276,1225],
+    [387,271,399,790,1,1],
+    [383,271,399,1244,1,486],
+    [1138,544,70,13,1,262,243,1,1,269,7,1,34,51,258,1],
+    [256],
+    [1707,1,11,1,1],
+    [384,271,399,331,56],
+    [463,1,1,1,1,333,1,1,1,1,2196,57,87,115,37,93,22],
+    [1925,1],
+    [2513,1],
+    [1483,1068],
+    [654,1,1,1,1,613,1,437,473,587,1],
+    [2919,86,29,95,46,39,130,74],
+    [1053,1,1,1,1],
+    [76],
+    [2964],
+    [5,1293,1,113,1,805,1,1,1,1,25,1,20,1,482,1],
+    [405,261,409,211,1,46,103,1,982,1,1,77,1,2,1,143,1,197,1,1,1,1,28,1],
+    [406,40,121,100,31,177,176,25,47,63,415,1],
+    [1969,22,233,1],
+    [25,86,218,1,1,1,1,271,1,1,1,1,372,1,1,1,1,200,1,2,1,149,1,1,124,1,2,1,5,1,94,31,1,136,1,131,1,1,135,1,1,1,1,1,133,1,2,1,1,45,90,1,127,1,1,1,1,1,86,1,23,1,231,1,1,20,1,1,93,28,1,1,103,1,41,5,7,33,2,41,43,40,42,2,42,41,39,36,41,35,38],
+    [2199,1],
+    [60,18,329,40,121,100,31,177,176,25,47,50,108,9,75,1,5,1,2,11,80,1,1,269,1,94,1,18,1,60,1,1,45,1,1,142,1,1,154,1,53,1,1,1,94,1,1,18,4,1,1,303,1,179,4,1,1,25,86],
+    [403,40,121,100,31,177,176,25,47,249,1,1,585,1,11,147],
+    [1421,1,5,1,261,1,133,1,66,1,1,37,1,23,1,32,1,20,1,14,1,70,28,1,84,1,339,1,129,1,65,1,48,1,20,1,2,6,2,8,1],
+    [147,9,7,74,9,24],
+    [1289,1],
+    [1698,1,76,1,1,21],
+    [404,40,121,100,31,177,176,25,47],
+    [253,1047,226,288,1,610,1],
+    [2261],
+    [14,52,1159,1,1,595],
+    [34,630,1,1,1,1,27,1,1,1,1,173,1,1,1,1,50,5,5,5,218,7],
+    [1603,1403,33,23,29,30,45,12,37,2,29,1,56,40,10,22,15,4,19,44,28,10,36],
+    [2165,1,2,1,2,1,2,1,755,1,2,1,2,1,2,1,2,1],
+    [445,121,131,177,70,1,1,1,1,102,72],
+    [153,66],
+    [1048,1,1,1,1,21,1,1,1,1],
+    [1767],
+    [52,309,122,198,87,548,1,1394,1,159],
+    [109],
+    [1377,1,1,41,219,1,1,2,140,1,36,1,1,366,1,1,138,1,1,370,1,1,58,1,29,35,1],
+    [72,262,759,195,565,105,224,88,279,1,1,96],
+    [907,916,1,66,1,1],
+    [93,24],
+    [132,98,110,30,47,10,75,25,96,57,57,15,10,92,5,69,5,5,5,56,100,10,586,1,1,49,703,218,1,41,70,1,29,1],
+    [2281],
+    [493,1,1,1,1,23,270,55,1,1,1,1,2112],
+    [1767,267,158],
+    [356,1,1,1,1,323,1,1,1,1,299,1,1,1,1,827,1,1368,308],
+    [1246,691],
+    [1932,1,1],
+    [2336],
+    [106],
+    [342,5,142,5,116,5,226,5,238,5,26,1,1,1,1,115,147,141,121,144,137,138,13,116,1,139,1,119,1,132,1,119,113,1,142,62,46,45,38,45,41,43,40,42,37,41,35,35,43],
+    [226,900,1634,1],
+    [193,243,358,331,290,1,1346,89],
+    [1138,7,1,4,1,1,14,1,1,35,1,1,1,10,1,11,1,2,46,1,1,3,49,1,34,1,1,4,1,1,1,1,8,2,6,1,10,1,1,1,1,1,7,1,13,6,10,1,64,1,5,1,2,8,1,5,1,1,1,1,1,1,1,590,1,1,861,43],
+    [13,168,102,844,111,1,1,267,1,147,239,1,1,4,1,1,1,1,1,1,1,1,47,46,1,456,103,1,339,38,1,61,39,45,41,8,35,1,40,1,40,46,40,3,38,36,41,35,2,36,1],
+    [1526,1073],
+    [893,58,219,76,166,1,44,1,358,70,1,1,49,215,187,1,91,1,316,1,177,35],
+    [134,56,10,44],
+    [73,27,22,85,918,1,1,1,1,84,1,1,17,130,14,144,118,144,137,141,127,140,123,98,35,116,117,142],
+    [58,942,1,1,1,1,200,1,1,365,1,2,1,81,1,2,1,77,195,1,1,156,6,12,7,1,11,1,1,10,1,1,4,1,1,1,1,1,1,11,1,20,1,1,1,1,19,1,1,440,1,55,40],
+    [253],
+    [83,1379,336,396],
+    [104,1894,1,689],
+    [84,351,241,82,35,1,335,869,1,593,375,1],
+    [49,223,163,358,871,33,122,213,1,1,41,45,9,170,146,110,1,1,33,1,59,128,55,270,355],
+    [1128,957,1,1,1,1],
+    [2650],
+    [1095],
+    [1165,109,1,76,273,373,117,310,67,485,1],
+    [22,14,4],
+    [2874],
+    [674,1,605,1,959,1,43],
+    [33,325,192,135,147,156,619,1,411,1,1,851,1,100,1],
+    [317,42,102,90,26,70,39,42,105,52,104,52,412,393,1065,1],
+    [1203,955,589],
+    [318,42,63,1,1,1,1,35,90,26,70,39,42,29,1,1,1,1,72,52,104,52,802,1,900,1,540,228],
+    [314,20,22,102,90,26,70,39,42,105,52,104,52,55,663,1,253,1,918],
+    [2253,1],
+    [1460,1],
+    [1252,507,1],
+    [315,42,102,90,26,70,39,42,105,52,104,52,570],
+    [1355,1],
+    [383,1,1,1,1,267,1,1,1,1,395,1,1,1,1,124,1,89,1,447,1,1,126,1,1,422,1,1,157,83,1,491,29,95,46,39,130,74],
+    [335,759,197],
+    [2097,1,144,292,1],
+    [559,1,1,1,1,81,1,1,1,1,26,1,8,1,1,1,1,38,1,1,1,1,101,1,1,1,1,21,12,1,1,1,1,11,1,1,1,1,250,1,7,168,45,323,1,80,301,97,1,1,273,1,105,1,91,1,1,30,1,1,106,1,1,1,216,110,62,105,109,49,28],
+    [93,9,15,23,31,91,652,1,1,1,1,315,2,1,144,50,1,1,22,1,19,47,2,1,118,144,2,1,134,89,49,2,1,129,1,52,87,1,119,1,249,2,1,113,1,139,52,1,11,1,2,12,10,11,10,1,19,9,16,21,3,1,13,1,18,13,2,1,10,2,7,7,25,20,5,3,1,14,1,9,2,14,2,12,1,2,7,4,15,13,1,12,12,5,7,1,14,9,17,24,2,9,1,11,5,1,6,11,1,15,6,5,16,1,4],
+    [316,144,116,70,81,157,156,669],
+    [1203],
+    [986,1,1,1,1,48,1,1,1,1],
+    [1215,205,132,215,61,203,71,210,60,182,90,106,166],
+    [27,149,98,1359,806],
+    [1270],
+    [411,261,409],
+    [79,84,52,31,32,616,1509,264,1,41,70,1,29,1],
+    [412,261,409,1543,1,1],
+    [347,14,1,1,1,1,23,1,1,1,1,1,1,1,1,1,11,65,1,1,1,1,138,54,12,1,7,1,1,9,1,1,1,1,1,1,1,1,1,96,1,1,1,1,183,1,1,64,1,1,1,1,1,1,1,1,1,11,11,337,51,76,1,1,64,1,1,74,1,1,28,21,126,8,1,9,1,1,1,142,1,1,9,96,1,1,163,1,123,1,17,545,10,12,21,14,7,24,8,7,26,20,33,6,3,24,14,3,29,16,3,21,7,3,31,9,9,19,19,36,1,2,22,13,3,18,38,17],
+    [132,98,1358,269,1,856,1,20,1,1,32,1,6,1,110,1,60,1,26],
+    [193,23],
+    [409,261,409],
+    [928,5,5,5,1304,1],
+    [3018,45,36,10,37,27,18,9,32,43,33,7,11,16,15,34,4,41,34,36,42,13],
+    [340,30,47,10,75,25,96,46,1,1,1,1,7,57,15,10,92,5,140,100,10],
+    [198,1023],
+    [2618,1,1],
+    [410,261,409],
+    [1078,1,1,1,1],
+    [1621],
+    [68],
+    [2312,29,539],
+    [1414,232,418,373,1],
+    [100,1153,1,328,409,956],
+    [35,32,165,1323,612,3,3,3,6,279,273,37,161,3,3,3,3],
+    [20],
+    [2310,1,517,1,133],
+    [253,711,390,525,46,1,106,1,4,388,1,234,34,40],
+    [2878,1,195,488],
+    [1974,1,1,478],
+    [86,1,77,87,40,5,50,7,15,71,45,16,86,5,23,7,124,24,28,55,110,5,15,15,91,14,504,643,124,1,54,1],
+    [1658],
+    [1224,1467],
+    [28,1191,1],
+    [63,15,343,335,1508,21,1,598,1],
+    [860,1418,1,1,687,1,1],
+    [2606,1,1,1,1,1,4,1,2,1,1,15,10,1,1,7,1,1,1,7,1,24,1,5,1,2,2,1,9,1,1,5,1,1,1,1,1,1,1,1,1,1,1,26,1,1,44,1,33,1,2,1,1,1,1,1],
+    [1498,405,1,270,1,392,1,374,1],
+    [1505,144,346,1,23,1,402,1,349,1,1,69,1,1,1,9,1,2,1,2,1,1,9,1,2,1,2,1,14,1,5,1,5,1,11,1,5,1,1,2,1,8,1,8,1,5,1,2,1,2,2,6,5,1,2,1,2,1,2,1,2,2,1,1,1],
+    [142],
+    [1713,1,74,143,169,1,513,99,16,1],
+    [85,829,438,1,39,1,917,1,62,1,1,698],
+    [1300,1661,1],
+    [1336,289,1,1,284,408,256,414],
+    [2847,141],
+    [2486,1],
+    [2201],
+    [2750],
+    [388,1,1,1,1,308,1,1,1,1,354,1,1,1,1,362,1,1,388,1,734,1,1,1,1,133,1,1,328,42,24,61,42,41,45,34,49,75,40,73],
+    [327,275,376],
+    [243,1262,417,1014,1],
+    [328,275,376],
+    [324,275,376],
+    [325,275,376],
+    [1139,1],
+    [599,1,1,1,1],
+    [326,275,376],
+    [975,1,1,1,1],
+    [1247,1,753,1,976],
+    [2825,1],
+    [205,940,1,1,328,1,568,1],
+    [1523],
+    [1256,1,1,1,1,1,136,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,129,1,1,1,1,1,131,1,1,1,1,1,136,1,1,1,1,1,128,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,124,1,1,1,1,1,112,1,1,1,1,1,115,1,1,1,1,1,142,1,1,1,1,1,42,44,44,42,41,41,44,41,42,37,39,35,37,45],
+    [1459,160,1],
+    [1180,521,1],
+    [293,5,189,101,5,179,197,15,833,1,247],
+    [6,9,60,17,105,80,973,1,1,88,1,362,523,524,356,125,26,56,110,12],
+    [7],
+    [926,5,5,5],
+    [2369],
+    [1530,1,1185],
+    [2281],
+    [2961],
+    [1247,1,1,425,1,1,1,1,1,16,1,1,7,1,1,3,9,19,1,9,1,1,3,9,1,1,9,1,1,4,1,2,5,4,1,11,1,1,1,1,1,1221,529],
+    [93,856,628,1],
+    [1977,1,128,1],
+    [86,2,6,1],
+    [2117,2,5,1,8,1],
+    [1291],
+    [76,19,1062,1,1,527,1,1,611],
+    [276],
+    [110,72,42,10,104,87,253,82,337,59,57,1,27,1,26,1,10,60,43,1,35,1,73,20,35,1,2,1,5,1,110,98,1,60,1,10,95,1,1,42,53,1,10,60,1,193,1,15,1,59,1,12,1,1,240,1,1,1,10,4,1,105,1,155,10,1],
+    [493,1,1,1,1,293,55,1,1,1,1,454],
+    [2341],
+    [2497],
+    [1385],
+    [1462,1341,1,1],
+    [2034,104,679],
+    [1828],
+    [1767,215,210,483],
+    [131,124],
+    [2194],
+    [1493,1],
+    [73,9,1,2711,1],
+    [77,115,1277,1,1,188,1,1238,49],
+    [1451,1,28,1033,1,4,3,24],
+    [154,82,891,1248,120,1],
+    [346,1,1,1,1,264,1,1,1,1,470,1,1,1,1,706,408,1,1,992,126,235],
+    [2117,1,1,5,1,8,1],
+    [1753,1,1],
+    [2546,1,46,1,1],
+    [148,13,26,7,2,46,34],
+    [2076,1],
+    [335,2,87,251,2,82,166,5,5,5,154,2,659,108,172,1,273],
+    [1318,474,1,1,399,776],
+    [2227,1,1,1,79],
+    [106,250,1,1,1,1,323,1,1,1,1,299,1,1,1,1,766,1,1429,308],
+    [28,16,77,110],
+    [1817,1],
+    [61],
+    [1460,1,1468],
+    [2091,1],
+    [64],
+    [5,9,991,1,1,1,1,150,174,866,1,225,1,636,328],
+    [79],
+    [2923,1,1],
+    [1823,1,66,1,1],
+    [1932,1,1],
+    [1246,691,95,1,1,556,1,335],
+    [1454,1],
+    [215,1000,55,150,132,215,61,203,71,210,60,182,90,106,124,42],
+    [2310,1,150],
+    [63,15,2186,21,1],
+    [1156,336,55,1,384,1,1,106],
+    [510,270],
+    [16,80,28,67,18,804,1,1,1,1],
+    [127,85,1226,31,1,347,1,285,1,276,1,129,1,130,73,1,1,84,1],
+    [32,28,18,1,30,54,83,1506,207,1,1,286,1,1,631,13,1],
+    [2376,1,1],
+    [2389,1],
+    [2552,1],
+    [30,2945],
+    [453,1,1,1,1,258,1,1,1,1,456,1,269,1,301,1,93,1,174,1,107,1,418,1,238,1,134,1,85,85,95,29,53,34,128,113],
+    [1612],
+    [2076,1],
+    [80],
+    [1417,533,1],
+    [2071],
+    [1244,1,282,1,407,1,412,1],
+    [1656,1],
+    [1204,1,186],
+    [22,84,25,124,1216,661,129,251,227,1,1,149,1,1],
+    [81,33,111,3,887,1,1,1,1,52,186,66],
+    [1396],
+    [68,231,1,1,1,1,215,1,1,1,1,72,1,1,1,1,190,1,1,1,1,178,1,1,1,1,239,1,204,1,14,1,5,1,1,109,1,214,1,60,1,8,1,193,1,70,1,47,110,52,1,25,34,1,215,50,1,5,1,105,1,5,1,116,7,1,1,25,1,1,7,1],
+    [117],
+    [2625,1,1],
+    [508,10,260,10],
+    [106],
+    [2983],
+    [1234,147,13,128,1,1,119,144,1,1,135,138,129,1,1,1,137,1,1,1,117,1,1,1,130,1,119,1,1,111,2,1,140],
+    [3105,1,1,1,121,1,1,82,1,119,1,1,110,1,1],
+    [1594,876],
+    [102,184,84,70,141,42,175,201,236,1,26,1,1,1,1,8,1,1,716,1,933],
+    [133,105,48,15,5,5,5,5,5,5,12,5,10,11,6,5,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,10,5,10,10,10,10,5,5,5,5,6,5,5,5,5,15,5,5,5,5,6,4,5,5,5,5,5,5,5,5,5,14,12,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,5,5,5,10,12,5,5,5,15,17,5,25,11,15,5,11,10,4,5,8,5,5,5,5,5,5,5,5,5,5,5,5,5,5,5,27,5,8,1,1,1,1,43,23,148,670,6,7,32,1,8,1,1,11,1,1,1,1,176,1,1,90,1,1,1,1,381,1,59,177,1,1],
+    [1483,73,1,53,1,946],
+    [55,129,257,358],
+    [4,9,30,98,31,9,82,20,2,83,71,120,1,1,1,1,17,41,176,70,1,1,1,1,126,255,132,1,11,78,67,1,1,1,1,104,3,147,1,1,7,1,1,1,1,31,263,1,149,1,79,92,1,1,47,1,1,1,1,211,1,45,73,3,2,2,104,40,4,17,8,110,4,58,10,56,39,74,35,14,35,7,21],
+    [284,82,71,142,40,176,200,949,1,1,1,1,775,1,1,1,1],
+    [136,118,164,335,530,1,97,272,1,1,57,506,1,1,1,1,406,165,50,1,1,1,1,5,1],
+    [277,615,1,1,1,1,617,1,1,540,637,1,116,1,1,208,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [887,1,1,1,1,1006,1,1,197,298,223,161,73,377,62,90,69,48,23],
+    [6,9,88,94,91,295,372,1,1,1,1,794,1,1,83,1,1,286,133,1,346,1,1,1,1,273,223,125,26,56,110,12],
+    [1198,1,57,1,1,1,1,1,136,1,1,1,1,1,133,1,1,1,1,1,128,1,1,1,1,1,30,99,1,1,1,1,1,131,1,1,1,1,1,132,4,1,1,1,1,1,128,1,1,1,1,1,134,1,1,1,1,1,115,1,1,1,1,1,116,8,1,1,1,1,1,112,1,1,1,1,1,115,1,1,1,1,1,142,1,1,1,1,1,42,44,44,42,41,41,44,41,42,37,39,35,37,45],
+    [107,296,1,1,1,1,8,249,1,1,1,1,82,323,1,1,1,1,16,1,13,28,49,1,1,51,30,141,60,78,118,15,116,1,1,2,1,1,12,136,141,133,71,1,1,66,120,54,75,117,90,30,9,56,93,85,75,137,72,38,72],
+    [287,295],
+    [73,9,1,1062,1,1,322,1,1,4,1,136,47,1,384,1,500,249,1,180],
+    [106],
+    [1345],
+    [367,71,141,1,1,1,1,29,1,4,1,1,1,1,1,1,172,1,1,1,1,44,1,4,1,147,120,134,1,1,91,1,59,1,1,1,1,74,1,192,1,1,1,1,71,460,1,121,85,1,19],
+    [1,1,64,402,1,1,1,1,76,1,1,1,1,168,1,1,1,1,6,1,1,1,1,96,1,1,1,1,291,78,116,1,1,565,1,1,1,174,1,94,69,1,1,1,274,1,1,167,1,1,315,8,11,1,1,11,1,9,15,1,7,13,1,7,13,6,9,9,1,6,18,2,11,1,10,3,19,12,1,6,2,1,21,10,7,23,3,10,1,7,13,8,3,8,1,8,2,7,1,12,11,1,8,1,15,1,11,1,8,7,2,15,8,7,5,10,2,1,10,1,6,4,24,1,8,13,1,11,9,1],
+    [37,43,43,85,2247,527],
+    [342,5,142,5,116,5,226,5,98,1,1,1,1,47,1,1,1,1,85,2,1,2,2,1,1178,43,1,1,2,1,5,1,4,1,696,46,44,39,44,41,44,40,42,37,40,36,35,43],
+    [510,270,335,1,1,1,1,1736,1],
+    [84,106,980,287,1,1,63,175],
+    [1126,46,1,181,352,33,1,98,1,1,39,94,787,1],
+    [226,66,295,376,1031],
+    [1156,13,53,1,65,107,233,1,5,1,248,1,504,58,1],
+    [1231,37,1,106,144,118,144,137,141,127,140,123,133,33,1,31,42,1,5,1,2,2,1,114,89,41,1,5,1,1,1,1,2],
+    [1002,68],
+    [580,283],
+    [2455,307,50,1],
+    [77,115,1,932,1773,49],
+    [674,1,450,1,1,1,1,112,1,589,1020,57,1],
+    [1415,1,1465,1],
+    [1304,1,797,392],
+    [436,305,53,123,154,1528],
+    [914],
+    [133,4,2,27,10,1280,280,270,406],
+    [2676,1],
+    [136,5,5,4,31],
+    [174,1139,1,139,694],
+    [140,8,13,16],
+    [135,40],
+    [173],
+    [26,154,26,939,1,5,1,14,2,36,1,11,1,11,1,2,46,1,53,1,22,12,1,2,1,2,1,2,9,2,6,1,10,1,1,1,9,1,29,1,64,1,5,1,2,8,1,5,2,1,1,1,845,1,37,65,1],
+    [1837],
+    [2130,1,1],
+    [164,2024,1,619],
+    [138,13,7,214,321,196,21,101,529,21],
+    [179,2814,43],
+    [54],
+    [1407,132,1139],
+    [157,3,18],
+    [2528,1,1],
+    [1115,1,1,1,1],
+    [3108,438],
+    [0,75,21,18,24,11,20,22,69,43,1,1,1,1,1,1,1,1,1,1,5,5,5,5,27,5,12,1,1,1,1,1,5,5,5,5,5,5,20,15,5,5,5,5,5,5,5,25,10,15,5,5,5,5,5,6,5,5,5,20,5,5,16,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,8,25,10,10,17,5,5,5,5,5,5,5,27,5,5,5,5,5,10,17,5,2,5,5,5,8,2,1,1,1,1,20,5,11,4,10,5,8,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,5,5,5,5,5,5,5,5,5,37,5,14,12,33,9,17,18,1,1,2,39,3,66,6,26,85,120,69,77,49,6,73,43,21,47,13,1,66,1,24,52,156,7,128,106,105,168,1,19,185],
+    [110,15,123,307,282,401,179,1354],
+    [56,29,1,1,28,9,23,17,45,42,305,282,930,1,1],
+    [115,32,1054,1,37,1,146,1,120,1,1,9,2,5,123,1,101,1,39,1,29,1,106,1,27,67,1,44,1,129,1,64,1,1,73,1,119,73,31,1,26,1,120,1,113,116,1,1,24,1],
+    [47,3,288,87,253,82,337,131,1,20,123,1,130,1,12,1,117,1,143,1,127,1,1,7,1,140,1,114,1,1,10,1,139,1,122,1,123,1,1,7,1,13,1,1,100,1,116,1,141,1,27,1,7,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [22,14,4,88,92],
+    [557,282,1546,125,1,1],
+    [553,282],
+    [1239,32,1,411,1,317,1,188,471,1,77,1,223],
+    [119,67],
+    [88,25,1091,1,1424,1],
+    [30,74,333,1,1,1,1,113,241,1,1,1,1,37,1912,1,249,167,105,81,101],
+    [855,1,1,1,1,1,554,480,1,5,1,2,1,2,1,772,1,1,1,6],
+    [1127],
+    [9,101,67,102,2463,1],
+    [9,1,1,1,1,1,1,1,1,7,35,12,19,2,9,3,24,6,26,17,1,1,1,1,39,20,4,35,1,1,1,1,552,1,1,1,1,53,503,1,372,1,1,491,41,294,269,1,1],
+    [3001,1,13,18,7,40,5,37,4,8,8,27,1,9,10,19,2,1,39,1,18,23,5,40,3,15,19,4,36,16,25,1,33,1,2,36,1,10],
+    [82,1814,6,3,3],
+    [1967,275,440,53,1,1,1,131,1,1],
+    [2224,1,110],
+    [569,1,1,1,1,304,1,1,1,1,269,277,1,1,139,1,1,173,142,94,129,183,1,1,102,1,1,95,1,190,1,1,44,1,1,177,1,1,85,46,42,44,54,43,29,41,55,32,31,56,15,54],
+    [1013,1,1,1,1],
+    [1630],
+    [1667],
+    [2741],
+    [2246],
+    [579],
+    [529,1,8,1,1,1,1,278,1,1,1,1,39,1,515,759,147,1,86,627,44,34,55,40,49,52,25,54,33,24,39,55,20],
+    [28,69,62,54],
+    [291,295,376,570,1047,1,19],
+    [1859,205],
+    [532,210,124,52,86,68,156,1],
+    [1526,299,25,3,56,1,5,1,467,1,301,62],
+    [433,428,124,1067,1224],
+    [1639,1,312,6,12,70,7,1,8,1],
+    [289,67,1,1,1,1,168,56,99,1,1,1,1,51,124,98,26,1,1,1,1,10,68,690,1428,308],
+    [493,1,1,1,1,348,1,1,1,1,1334,1,62],
+    [2907],
+    [1279,103,1,356,1,97,690],
+    [337,87,253,82,337],
+    [1565,1,428,465,1,1,63,448],
+    [1438],
+    [148,13,81,953,1,422,512,1,4,142,281,1,1,1,1,1,1,1,1,1,1,1,1,1,1,89,1,1,137,1],
+    [189,1057,691,699,1,289],
+    [523,1,1,1,1,328,1,1,1,1,1065,185,1,229,1],
+    [1131,1,125,1,11,33,3,36,3,15,19,59,3,18,5,1,6,3,12,63,3,69,43,12,1,20,9,6,31,6,15,10,6,24,1,23,38,16,6,1,33,12,12,1,5,6,3,3,3,12,12,3,12,6,3,3,9,1,3,6,3,3,3,3,3,6,13,10,1,50,97,1,34,23,6,12,1,6,41,1,14,1,34,30,6,3,67,30,15,24,63,19,9,3,9,1,6,46,16,15,16,3,12,9,6,60,15,6,18,3,48],
+    [35,1322,478,1,28,1,1,111,1,475,301,1,106,1,1,1,55],
+    [1163,1,1,184,1,1,271,1,1,102,1,1,267,1,1,70,45,1,285,1,25,65,1,1,336],
+    [944,1,1,1,1,226,138,510,281,1,238,1,1,297,1,1,320],
+    [127,8,39,38,37,1,865,173,7,1,1,172,1,245,102,1,35,105,237,1,74,240,1,110,1,1,24,67,1,1,50,1,1,213,2],
+    [458,1,1,1,1,11,1,1,1,1,248,1,1,1,1,76,1,1,1,1,744,1,1,154,310,1,1,76,1,562,344,34,13,39,33,48,11,27,46,11,25,4,41,37,3,52,38,1,20,6,32],
+    [420,335,151,548,1,92,1,429,1,128,1,269,1,1],
+    [2548],
+    [199,1953,122,106,1,185],
+    [37,1,74,33,59,6,1184,556,1,247,168,1,1],
+    [1133,126,418,128,142,135,272],
+    [1412,1],
+    [1889],
+    [203,1409],
+    [1148,1],
+    [120,7,7,1,24,3,4,16,8,7,3,2,1,9,1,8,5,6,2,9,1,1,4,8,1,7],
+    [2895],
+    [1162,1768,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [1340,1,20],
+    [1695,1],
+    [1722,61,1],
+    [425,335],
+    [173,94],
+    [426,335],
+    [1221,145,1,5,1],
+    [424,3,332,3],
+    [758,1,1,1,1],
+    [3286,228],
+    [2363,1,1],
+    [423,335],
+    [1495,1421],
+    [73,666,176,86,68,762,140,92,264],
+    [1638,567,494,117,142,24],
+    [1232],
+    [1362],
+    [889,1030,664],
+    [2187],
+    [1068,1,1,1,1,141,1,312,676,1,1,102,104,1,23,1,128],
+    [122,85],
+    [1782],
+    [2060],
+    [67,1058,1,1,1,1,826,166,1],
+    [100,1012,264,144,54,1],
+    [2450],
+    [1241,1],
+    [1618,425,302,1,302,1],
+    [1313,1,1,1,1,1,551],
+    [2669,75],
+    [1000,1,1,1,1,1123,1,1,575,124,1],
+    [1191,1],
+    [1571,1,2,1,138,1,401,24,1,5,1,2,2,1,11,1,20,1,2],
+    [2078],
+    [1606],
+    [58],
+    [1976],
+    [1932,1,1],
+    [1659,1],
+    [1204,1,1,531],
+    [1656,1,549,1,1],
+    [1691,24,74,37,1,317,590],
+    [509,10,260,10,1840,1,1],
+    [2097,1,1,57,1,1,605,1],
+    [266,959,1,1,217,1090,1,1,7,1,42],
+    [902,850,709,388,1],
+    [378,1,1,1,1,257,1,1,1,1,390,1,1,1,1,206,88,1,630,1,140,1,1,31,1,360,372,1,182,29,43,125,277],
+    [57,1115,1,936,1],
+    [435,1,357,1,935,1,920,453,355],
+    [60,18,2225,1,1,132,1],
+    [736,1,433,1,581,1017,1,123,1],
+    [153,66,345,1,1,1,1,304,1,1,1,1,50,5,5,5,179,1,1,1,1,42,120,1,2,1,1,130,1,14,1,29,1,1,230,1,133,1,18,1,104,1,2,1,1,7,1,22,124,27,1,75,1,1,1,1,25,1,11,1,8,1,141,1,1,22,1,1,62,1,2,1,143,1,105,1,91,1,1,1,1,28,1,74,89,82,94,32,96,114,74],
+    [72,37,225,6,77,10,253,72,10,331,6,10,268,1,1,41,219,1,1,142,1,36,1,1,366,1,1,138,1,1,370,1,1],
+    [2034,247],
+    [200,1798,1],
+    [140,31,91,52,1,1,1,1,326,1,1,1,1,390,1,1,1,1,87,226,1,1,73,1,1,729,79,1,1,4,418,1,1,79,1,1,25,1,1,1,97,1,1,185,76,123,35,42,153,39],
+    [79,84,35,48,117,1,1,23,1,1,1,1,1,1,1,1,1,292,1,1,9,1,1,1,1,1,1,1,1,1,283,1,1,64,1,1,1,1,1,1,1,1,1,359,51,142,1,1,104,155,1,9,1,1,1,142,1,1,9,96,1,1,103,1,59,1,123,1,7,555,22,21,21,24,15,46,33,9,38,3,45,3,28,3,40,9,38,37,2,22,16,73],
+    [253,711,682,233,558,1,442],
+    [2249],
+    [914,438,1,305,55,1,386,1],
+    [2750],
+    [243,145,1,1,1,1,308,1,1,1,1,354,1,1,1,1,362,1,1,496,627,1,1,1,1,133,1,1,328,42,24,61,42,41,45,34,49,75,40,73],
+    [1247,1,753,1,823,1,152],
+    [293,295,664],
+    [95,1062,1,1,54,1,54,1,149,1,131,1,135,1,1,77,1,60,1,202,1,70,1,198,11,1,59,1,271,1,105,1,165,1],
+    [83,1379,732],
+    [1798,748,1],
+    [194],
+    [44,77,110],
+    [1823,1,66,1,1],
+    [78,2302,1,260],
+    [1423],
+    [1200,119,1,1,1371,1,45,76,2],
+    [10,1,48,45,74,1,101,1,923,1,1424,1,58,54,1],
+    [1115,450,1],
+    [393,1,1,1,1,308,1,1,1,1,354,1,1,1,1,410,248,155,1,117,1,47,385,1,197,1,1,71,123,1,168,43,60,79,47,51,28,43,47,61],
+    [2732,1],
+    [1377,1,1357,1,1,1],
+    [1129],
+    [1255,941,211,1,184,116,259,1],
+    [84,1140,144,144,262,83,1,53,138,130,85,55,123,133,63,53],
+    [41,229,1222,67,1,2,1,5,1,32,1,5,1,17,1,33,1,338,1],
+    [2243,1,1,195,1],
+    [435,358,2154],
+    [1249,523,1,5,1],
+    [35,1706,1,230,205,1,134,236,25,1,192,1,18,1,195],
+    [1168,267,75,1,5,1,735],
+    [964],
+    [531,334,138,1296,146,110,1,1,221,55],
+    [75],
+    [341,5,142,5,116,5,226,5,238,5,944,1,1,41,54,521],
+    [2765],
+    [21,28,162,61,1053,1,338,456,106,479,114],
+    [224],
+    [1819],
+    [435,358,904,49,706],
+    [964,2080,43,16,30,44,75,89,38,79],
+    [2590,1],
+    [1247,1,1,1779,529],
+    [1421,1,1,541,330,1],
+    [216],
+    [1723,1,158,551],
+    [1631,1],
+    [1298,1],
+    [1592,1,1212],
+    [2177,1,1,9,1,725,1],
+    [66,39,12,40,90,1738,168,1,1],
+    [345,5,142,5,116,5,226,5,238,5,36],
+    [908,1080,97,1,1,1,1,241,267,1,134,1],
+    [740,176],
+    [265,25,295,376,640,1,123,763],
+    [31,1,1295],
+    [2650,156,1],
+    [934,1,1,1,1,1,1,1,1,1,1513,565,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [2316],
+    [2333],
+    [2976,1],
+    [1165,186,273,373,117,310,67],
+    [1980,1,142,696],
+    [164,19,28,40],
+    [1274,1],
+    [86,2798,1],
+    [87],
+    [314,1,1,1,1,326,1,1,1,1,390,1,1,1,1,313,1,1,883,1,1,503,1,1,125,1,1,185,76,123,35,42,153,39],
+    [22,14,4],
+    [36,3],
+    [2258],
+    [2874],
+    [515,1,1,268,1,1],
+    [505,1,1,268,1,1],
+    [351,3,389,2,1,354,1,1,1,1],
+    [495,352,424,1,29,1,41,1,33,1,4,279,85],
+    [497,352],
+    [496,352],
+    [558,177,2225],
+    [1280,1,953,1,96],
+    [188,956,86,2,142,2,142,2,116,2,142,2,135,2,139,2,125,2,138,2,121,2,131,2,114,2,36,1,1,1,76,2,140,2],
+    [355,392,357,721,308,1,1,559],
+    [458,1,1,1,1,212,1,50,1,1,1,1,980,129,1,1,179,1,1,76,1,235,486,219,133,95,25,85,91,26],
+    [354,392,99,1,1,1,1,63,191,38],
+    [6,152,110,226,352,1080],
+    [2275,1,475,1,1],
+    [493,352],
+    [1586,1,862],
+    [2199,1,1,39,1,43],
+    [1607,1,413,171,691],
+    [1118],
+    [33,1103,1,78,337,160,307,1,369,1,276,66,1],
+    [2618,1,1,44,1,89,1,17,1,1,1,97,1,32,1,1,66,1],
+    [358,192,135,147,156,129,807],
+    [111,33,140,295,376,812,79,488,117,197,1],
+    [1129,1173,250,1,43],
+    [1325,1,1,126,121,1,20,1,1,753],
+    [90,1268,1,1,895,548,1,1],
+    [419,335,1558],
+    [302,15,42,102,90,26,20,50,39,37,5,105,52,15,73,16,52,533,1,190,1,32,127,137,849,1],
+    [1420,611,180,91,107,233,1],
+    [897,1,1,1,1,215,139],
+    [1337,1,23,2,1,1,23,1,1,1,1092,1,570,7],
+    [1439,1,1,1264],
+    [1234,1583],
+    [2233,77,1],
+    [2066],
+    [903,212,1265,1,535],
+    [921],
+    [922,574,1,1,1,1,1,1,1,1,1,1,1,1,1,596],
+    [2195,1,511,1,144,1],
+    [923],
+    [919,1118],
+    [2065],
+    [124,22,4,17,42,55],
+    [2967,1],
+    [76,844,604,770,1],
+    [2407,1,176],
+    [914,1,1,1,1,46,193,1,1,160,1,1,33,332,1,1,611,89,281],
+    [506,10,15,245,10,79,138,5,8,2051,83,45,41,83,42,113],
+    [2065],
+    [70,56,88,1228,1,1],
+    [927,5,5,5,845,544,410],
+    [2158],
+    [2747],
+    [2209,1,450,46,114,76,1],
+    [1203,215,1,460],
+    [1550,1],
+    [423,1,1,1,1,331,1,1,1,1,2524,228],
+    [2540,1,345],
+    [303,15,42,102,90,26,20,50,39,37,5,105,52,15,73,16,52,77,545,436,1,701,55,106],
+    [1835,1,8,1,787,1,1,111,1,218],
+    [62,22,11,99,254,1,1,1,1,56,4,6,4,37,1,1,1,1,147,1,1,1,1,64,4,6,4,75,1,1,1,1,33,1,1,1,1,316,13,1,98,16,1,15,49,95,183,1,60,1,17,83,1,1,52,99,1,4,34,130,140,123,133,116,111,189,31,46,11,22,12,38,12,33,41,11,20,12,40,12,30,15,22,27,14,10,4,21,29,6,12,31],
+    [1481,1],
+    [1243,1022,1],
+    [65,16,158,60,15,37,1,1,1,1,1,102,90,26,20,50,39,37,5,18,1,1,1,1,83,52,15,27,5,5,5,31,16,52,62,1,1,1,1,84,56,1,1,90,191,1,51,28,1,1,284,42,1,1,36,15,1,1,295,1,1,4,1,1,54,1,1,52,1,38,1,306,280,89,126,127],
+    [2597,1],
+    [2035,1],
+    [80,68,4,9,57,24,130,131,1,1,1,1,6,1,1,1,1,176,80,1,1,1,1,6,1,1,1,1,137,1,1,1,1,1,1,1,1,1,78,201,25,1,111,1,33,28,75,108,3,386,1,259,1,1,45,180,69,131,1,88,208,1,52,45,46,37,45,41,44,39,42,38,41,34,36,43],
+    [128,92],
+    [1324],
+    [92,101,23,304,270,361,1,1,189,273,28,75,70,69,1,53,237,1,224,1,147,104,1,1,11,29,1,36,5,4,1,1,20,1,1,32,1,1,5,1,2,1,29,1,77,1,41,19,1,1],
+    [72,262,759,425,2,742,1,1,66],
+    [746,1563],
+    [2589],
+    [1103],
+    [2385],
+    [503,1,1,1,1,266,1,1,1,1],
+    [1490,1,1,912,1,1],
+    [1197],
+    [1482,60,1,11,6,3,6,18,3,3,6,3,3,3,6,3,9,3,6,5,11,9,9,1,329,87,1,167,41,69,13,1],
+    [2274,141,1,1,564],
+    [2120,446],
+    [33,9,20,40,426,1,1,1,1,330,1,1,1,1,356,1,1,142,1,1,26,21,1,94,1,1,116,1,1,142,1,1,135,1,1,41,95,1,1,128,1,1,138,1,1,121,1,1,131,1,1,114,1,1,115,1,1,137,1,1],
+    [41,115,81,33,1419,1],
+    [131,124],
+    [6,3,1,1,1,1,1,1,1,1,7,35,12,30,3,30,65,45,1383,1479,125,26,56,110,12],
+    [74,1470,127,417],
+    [2332],
+    [160,13,4,1,1,1,1,18,2,39,13,14,12,1,1,1,1],
+    [503,10,260,10],
+    [341,1,1,1,1,264,1,1,1,1,470,1,1,1,1,474,897],
+    [1764,1146],
+    [1739],
+    [1744,1],
+    [1433,1,26,1,1,27],
+    [688,6,167,877],
+    [558,177,1996],
+    [985,6,21],
+    [2531,1],
+    [361,1,319,1,506,64,84,13,1,1,26,1,1,200,60,1,1,39,1,78,1,23,1,404,1,1,53,1,1,13,33,1,36,1,1,71,1,38,1,259,1,1,101,1],
+    [7,9,180,289,285,141,41,292,1,282,1,335,72,1,135,277,1],
+    [18,239,1011,1,37,3,31,1,1,220,1,5,1,56,1,600,93,29,1,2,1,1,1,1,1,14,1],
+    [2739,1],
+    [91],
+    [300,15,42,102,90,26,20,50,39,37,5,105,52,15,73,16,52,86,1,1,1,1,480,1245],
+    [1218],
+    [2892],
+    [1438,898,693,131,206,37,42,71],
+    [1216,1],
+    [1156,199,1,136,548],
+    [1792,1],
+    [182,52,2404],
+    [1219,1,405,1,1,651,1,1,174],
+    [2983],
+    [511,10,260,10],
+    [2159,1],
+    [1250,1,1,187,1,712,499,1],
+    [383,1,1,1,1,76,1,1,1,1,187,1,1,1,1,142,1,1,1,1,249,1,1,1,1,124,1,89,1,40,407,1,1,126,1,1,422,1,1,240,1,486,5,29,23,72,15,31,39,45,37,48,45,22,7],
+    [5,9,239,691,1,1,1,1,211,15,159,489,377,1,225,1,4,632,328],
+    [1246,691],
+    [226,939,186,273,373,117,80,230,67],
+    [793,1460,1],
+    [100,1153,1,328,409,191,765],
+    [92,834,5,5,5,399,1,182,7,1,286,1,898,34],
+    [86,2,5,1,1,15,839,292,1,5,1,1,42,265,1,20,1,96,1,1,1,1,1,16,1,1,7,1,1,3,9,19,1,9,1,1,3,9,1,1,9,1,1,4,1,2,5,4,1,11,1,1,1,1,1,1221,529],
+    [1828,975,1,1],
+    [346,1,1,1,1,264,1,1,1,1,470,1,1,1,1,359,1,28,273,1,1,620,328,497,126,235],
+    [335,759,661,280,1,191,1,1,1,79],
+    [1005,1,1,1,1,206,55,150,132,215,61,203,1,1,69,210,60,182,90,106,166,7,1,1],
+    [96,31,64,21,298,270,658,1276,1,1,164],
+    [1115,1,1,1,1,272],
+    [1381,88,1,52,1289],
+    [15,2227,268,1,360],
+    [2366,1,1,268,1],
+    [509,10,260,10,1000,37,1,270,1,436,1,51,148],
+    [2914,1],
+    [493,1,1,1,1,348,1,1,1,1,295,86,2,142,2,142,2,116,2,142,2,135,2,139,2,125,2,88,1,49,2,121,2,131,2,114,2,52,1,1,61,2,140,2,2],
+    [1136,1,1527,1,1,106,1,1,1],
+    [506,10,15,245,10,79,138,5,8,426,1,1,751,512,145,1],
+    [2209,1],
+    [2540,1,91,1,1],
+    [559,1,1,1,1,304,1,1,1,1,2120,110,62,105,109,49,28],
+    [33,9,20,40,2018,446],
+    [173,28,66],
+    [1680,1],
+    [1253,1,58,679,168,1,1],
+    [1523,238,56,1],
+    [1469,1,896,1,1,142,1],
+    [1213,1,143,902,1,174,1,18,425,1],
+    [90,1972],
+    [1801],
+    [504,10,260,10],
+    [117],
+    [8,1,1,1,1,1,1,1,1,1,7,35,12,26,1,3,3,801,490,1,78,282,1,1,214,40,179,334,1,47,1,1,15,1,79,1,213,1],
+    [2800,1],
+    [30,1,30,6,1,31,52,32,46,189,1,1,1,1,106,1,1,1,1,221,1,1,1,1,105,1,1,1,1,36,265,1,1,53,1,1,9,47,1,1,84,1,1,12,50,1,1,12,10,1,55,1,1,9,28,78,1,1,1,12,23,1,23,1,82,1,1,12,39,84,1,1,9,1,2,124,1,1,12,116,1,1,70,68,1,1,121,1,1,58,73,1,1,10,1,1,44,58,1,1,12,29,1,20,28,6,7,1,1,10,1,1,69,13,1,16,38,1,1,12,113,213,83,75],
+    [2029,1,72,270,80],
+    [23,11,1294,1,1,380,1,23,7,1,26,1,1,113,1,309,458,1,114,1,18,1,79,1,1,81,1],
+    [140,11,20,24,34,33,13],
+    [2953],
+    [2334],
+    [1303],
+    [68,32,34,110,969,1,1,17,144,144,118,144,46,91,141,127,140,123,83,15,35,116,117,62,1,79],
+    [925,5,5,5],
+    [17,18,23,44,36,31,74,17,654,1,1,1,1,26,1,1,1,1,287,1,121,166,1,205,1,58,1,46,1,28,1,1,56,55,1,56,29,1,42,1,70,1,1,14,1,65,1,73,1,76,1,1,22,1,1,17,1,251,1,42,1,5,1,64,1,41,1,1,1,55,31,31,29,1,1,11,1,1,1,12,10,7,4,10,1,1,3,15,9,16,1,20,3,1,1,12,1,1,17,13,2,1,10,1,1,7,7,25,1,18,1,5,3,1,14,1,1,8,2,14,2,12,1,1,1,7,4,3,12,13,1,1,11,11,1,5,7,1,1,13,8,1,17,1,22,1,2,9,1,1,10,5,1,6,11,1,1,14,6,5,16,1,1,3,3],
+    [585,5,154,107],
+    [2951,1],
+    [101,250,1,1,1,1,388,1,1,1,1,353,1,1,1,1,374,1,903,146,1,1,497,89,126,127],
+    [2554],
+    [961,5,15,120],
+    [2094,1],
+    [1484,1,1],
+    [367,71,86,96,176,60,140],
+    [2093,764],
+    [543,1,1,1,1,278,1,1,1,1,2163,50,36,50,36,40,41,44,41,52,28,49,25,37],
+    [1976],
+    [97,1116,1,54,1,149,1,131,1,214,1,60,1,202,1,70,1,209,1,59,1,9,1,261,1,105,1,165,1],
+    [90,413,1,1,1,1,6,1,1,1,1,256,1,1,1,1,6,1,1,1,1,1275],
+    [1631,1,1],
+    [301,15,144,116,20,50,76,5,157,15,73,68],
+    [1709,716,1],
+    [2379],
+    [1731],
+    [225,1300,725,1,1,85,307],
+    [1138,7,1,4,1,1,14,1,1,35,1,1,1,10,1,11,1,2,46,1,1,3,49,1,34,1,1,4,1,1,1,1,8,2,6,1,10,1,1,1,1,1,7,1,13,6,10,1,64,1,5,1,2,8,1,5,1,1,1,1,1,1,1,119,1,1333,43],
+    [1801],
+    [2621,1,1],
+    [2962],
+    [1215,38,1,1,165,132,215,61,203,71,200,10,60,182,90,106,107,59],
+    [514,270],
+    [504,270],
+    [1334,1,137,1,1],
+    [0,1,1,1,1,1,1,1,1,215,993,1,1],
+    [19,2536,1,1],
+    [2525,1,47,1,1,15,1],
+    [1854,1],
+    [1355,1,199,107,1,87,1,5,1,255,377,1,344],
+    [1631,1,1,742],
+    [736,1,457,233,1,173,1,1,514,182,42,104,131,1,1,306,1],
+    [97,1,1202,672],
+    [9,1,1,1,1,1,1,1,1,7,3,32,12,30,3,72,98,1011,4,1,17,1,14,1,1,70,102,2,2,1,2,2,2,1,871,304,1],
+    [22],
+    [90,1022,246,1,1,35,1,530,667,1,1,75,1,107,55,127,471],
+    [506,10,15,245,10,79,138,5,8,672,346],
+    [8,2204,1,1,1,1,1],
+    [1000,1,1,1,1,64,1,1,1,1,425,2,3,2,2,3,682],
+    [2275,1,50,113],
+    [1771],
+    [309,1,1,1,1,316,1,1,1,1,390,1,1,1,1,1091],
+    [1157,1,1,50,178,138,16,1,1,1,1,92,49,1,1],
+    [1270,1402,26,12,90,1,77,1,34,44],
+    [75,1195,1287],
+    [1532],
+    [2815],
+    [225,1337,1,26,1,8,1,1,650,1,1,45,1,39,81,89,1,1,204],
+    [1240],
+    [411,261,409],
+    [1227,144,406,137],
+    [1649,1317],
+    [2338],
+    [99,52,78,1436,1],
+    [2386,1,369],
+    [79,84,83,2212],
+    [158,110,1051,1,1,109,1,1,235,402,1,357],
+    [1167,66,147,141,121,144,137,138,188,251,203,50,124,82],
+    [2129],
+    [1454,1,43,405,1,208,1,23,1,37,1,22,12,1,357,1,374,1],
+    [118,67,93],
+    [1346,1,1,1437,1,1,269,443],
+    [145,65,1070,1,1],
+    [60,2303,1,1,286,1],
+    [45,18,140,12,203,1,1,1,1,26,1,1,1,1,258,1,1,1,1,39,1,1,1,1,932,1,342,1,1,369,100,191,108,270,7,169,37,47,36,75,7,54,18],
+    [102,812,1,1,1,1,317,1,287,1,264,1,274,1,129,1,139,1,119,1,251,1,54,1,1,57,1,203,46,45,38,45,84,40,42,37,76,35,43],
+    [1,9,20,1,4,26,6,1,59,51,5,29,20,48,19,1,1,1,1,225,1,1,1,1,62,1,1,1,1,264,1,1,1,1,36,11,57,1,1,1,1,194,1,17,14,22,1,1,142,1,1,65,1,1,1,1,7,66,1,1,37,78,1,1,1,142,1,1,51,9,23,1,1,50,1,1,9,1,31,91,4,1,1,14,1,14,70,29,1,1,48,1,1,1,87,1,1,47,1,1,72,1,1,110,1,20,1,1,11,1,12,32,5,1,30,1,21,1,1,11,7,23,1,30,1,1,14,1,1,6,7,1,1,10,1,1,1,1,68,1,1,10,1,14,1,1,38,1,1,140],
+    [677,82,171,10,923,387,1],
+    [403,1,1,1,1,257,1,1,1,1,405,1,1,1,1,107,1,1,857,542,421,85,75,2,135,72,38,72],
+    [341,5,142,5,116,5,226,5,238,5,8,1554],
+    [2860],
+    [1111],
+    [2582],
+    [412,261,409,149],
+    [1856,62,10,697,1,1],
+    [548,1,1,1,1,278,1,1,1,1,369,856,9,90,149,1,123,1,579,37,41,49,46,22,61,42,22,57,27,50,68],
+    [390,75,25,212,100,40,218,1170],
+    [362,2,27,5,70,10,16,44,146,8,13,5,95,5,10,26,149,68,5,177,183,51,248],
+    [1665,1,371,105,1],
+    [81,208,1,1,1,1,115,83,93,1,1,1,1,81,174,17,42,58,1,1,1,1,114,259,1,23,2,1,1,23,1,1,1,20,147,565,139,1,1,145,9,38,27,1,281,289,7,13,488],
+    [2227,1,1],
+    [365,27,5,70,10,60,154,13,5,95,5,10,175,68,5,805],
+    [361,27,5,70,10,60,148,19,5,95,5,10,243,5,827,1,1,154],
+    [98,370,1,1,1,1,258,1,1,1,1,624,1,333,1,173,206,1,1,65,1,264,1,44,136,69,1,1,116,1,1,235,38,27,21,110,96,38,33,45,45,24,46,30],
+    [149,90],
+    [1880,1,792,1,1],
+    [363,26,5,70,10,60,155,12,5,95,5,10,176,67,5,1440,1,1],
+    [66,276,5,142,5,116,5,226,5,238,5,1097,508,50],
+    [1619,1,970,1],
+    [189,9,1946,644,1],
+    [418,1,1,1,1,259,1,7,1,1,9,1,1,1,1,1,1,1,1,1,44,1,1,1,1,43,1,1,1,1,1,1,1,1,1,31,1,1,1,1,709,1,1,140,1,1,196,142,1,1036,213,83,75],
+    [489,352,2153,6,4,10,2,21,13,1,6,1,24,8,7,3,23,13,7,1,13,19,6,3,24,13,1,3,28,1,4,12,3,21,1,4,2,3,31,9,3,6,19,16,3,13,6,14,3,1,2,22,8,5,3,18,4,34,16,1],
+    [2,9,92,76,102,950,144,144,118,144,137,82,29,1,29,43,84,140,46,77,133,116,117,136,1,1,4,87,63,26,44,75,89,38,166],
+    [395,80,13,47,172,100,10,23,225],
+    [2452],
+    [992,1,1,64,1,1,1,1,1,1,1,1,1],
+    [1438,1591,131,206,37,42,71],
+    [158,57,53],
+    [275],
+    [23,13,1,1,1,165,1887,1,883],
+    [278],
+    [508,10,260,10],
+    [49],
+    [569,1,1,1,1,304,1,1,1,1,267,1,1,145,1,1,132,141,171,1,1,140,1,1,94,129,287,1,1,95,1,1,189,1,1,44,1,1,177,1,1,85,46,42,44,54,43,29,41,55,32,31,56,15,54],
+    [2025,1,1],
+    [1275,51,27,66,350,1,88,26,149,95,26,144,45,74,46,39,54,96,63,21,1,15,15,3,7,9,3,9,68,1,21,9,52],
+    [21,190,2608],
+    [94,38,98,1098,1,259,122,1,23,7,1,484,166,1,555,1],
+    [34,79,2,32,16,83],
+    [277,1916],
+    [1664,456,230],
+    [34,238,1013,1094],
+    [79,2070],
+    [304,1,1,1,1,316,1,1,1,1,390,1,1,1,1,308],
+    [1190],
+    [139,1,5,6,4,15,1,13,5,4,2,15,6,8,3,2,6,26,1,13],
+    [2953],
+    [1732,1,282],
+    [198,173,159,162,172,146,104,1220,549],
+    [1819],
+    [1375,1245],
+    [409,261,409,31,173,1,245],
+    [2198],
+    [1303,1067,1],
+    [1974,1],
+    [2066],
+    [2255],
+    [478,1,1,1,1,328,1,1,1,1,299,2028,33,45,164,37,81,23],
+    [720,1,1,1,1,2286,45,19,66,198,49,77,98],
+    [928,5,5,5,1590],
+    [2212,1,1,1,32,1,204],
+    [1385,1199],
+    [1828,718,1,372],
+    [1695,1,1,49,703],
+    [100,34,110,191,1,357,1,419,1,1,17,2,128,14,144,118,144,104,1,1,31,141,127,140,123,98,35,65,1,1,38,11,117,35,107,145,355],
+    [2217],
+    [361,1,319,1],
+    [68,1964,1,845,1],
+    [2216],
+    [2614],
+    [2201],
+    [925,5,5,5],
+    [63],
+    [1961],
+    [102,242,5,54,1,1,1,1,84,5,116,5,47,1,1,1,1,175,5,66,1,1,1,1,26,1,1,1,1,125,1,1,1,1,9,5,93,1,1,49,1,287,1,188,76,1,274,1,129,1,139,1,119,1,174,77,1,113,1,186,17,2,44,2,20,23,1,37,2,12,31,1,41,42,2,20,18,2,40,2,10,25,2,11,29,34,2,7,26,2,41,2],
+    [17,7,80,34,31,91,2488,1,241,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,5,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,3,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,4,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1],
+    [35,1322,478,1,28,1,1,23,88,1,128,1,91,255,301,1,106,1,1,1,55,53,9],
+    [58,185,721,765,1,192,112,65,160,1,150,1,1,22,1,1,100,414],
+    [216,1961,1,1],
+    [506,10,260,10],
+    [2449],
+    [2552,1],
+    [2589,78,1,46,1,61,1],
+    [1589,1,8,1],
+    [1268,1],
+    [1530,1,250,10,925],
+    [1115,1,1,1,1],
+    [588,5,30,57,12,60,10,10,82,5,5,1],
+    [1734,856,1],
+    [503,1,1,1,1,6,1,1,1,1,26,1,1,1,1,226,1,1,1,1,6,1,1,1,1,38,1,1,1,1,2163,50,36,50,36,40,41,44,41,52,28,49,25,37],
+    [1138,12,78,1,2,288,1474],
+    [969,15,15,11,89,10],
+    [0,1,1,1,1,1,1,1,1,215,1703,1034],
+    [1186,14,21,613,23,1,1,368,1,1,1,136,1,1,334],
+    [2951,1,122,488],
+    [2127,1],
+    [198,2685],
+    [272,79,1,1,1,1,388,1,1,1,1,353,1,1,1,1,374,1,1548,89,126,127],
+    [101,15,1131,1,1,1133,646,529],
+    [30,1147,572,94,175,108,402,1,1,15,430],
+    [1171,567,1,5,1,258,615,1,1],
+    [34],
+    [410,261,409],
+    [2415],
+    [1549,36,1,1,16,1,1,8,1,30,24,1,1,1,1,1,156,1,724],
+    [378,1,1,1,1,257,1,1,1,1,390,1,1,1,1],
+    [1192],
+    [142,718,561,1],
+    [1934],
+    [1950,1,13],
+    [205,17],
+    [1423],
+    [1794],
+    [2294,1,241,377],
+    [1795,1,1,134,413],
+    [2277],
+    [1577,1,1,1317,1],
+    [373,1,1,1,1,257,1,1,1,1,390,1,1,1,1,2013,85,58,68,54,109,115],
+    [1564,25,1,1,56,1141,1],
+    [53,1,20,132,166,321,196,21,101,193,1,72,1,178,381,546,1],
+    [1391],
+    [2237,1],
+    [29,101,103],
+    [1478,1,34,1],
+    [1502,119,281,84,1,107,1,840],
+    [2899,1],
+    [375,261,394],
+    [488,1,1,1,1,348,1,1,1,1,2313,248],
+    [68,236,1,1,1,1,316,1,1,1,1,390,1,1,1,1,132,1,262,67,1,1,4,1,547,1,958,63,42,65,105,32,80,76,36],
+    [52,19,198],
+    [2239],
+    [376,25,236,25,369],
+    [1988],
+    [1559,1],
+    [1198,1,1113,568],
+    [351,1,1,1,1,388,1,1,1,1,353,1,1,1,1,374,1,2,1,980,1,564,89,126,127],
+    [272],
+    [25,1928,1,32,1,20,1,1,13,1],
+    [1206],
+    [388,1,1,1,1,172,1,1,1,1,132,1,1,1,1,168,1,1,1,1,116,1,1,64,1,1,1,1,224,1,139,121,1,71,1,231,1,38,1,1,1,63,1,80,231,1,38,1,337,1,370,23,19,24,39,22,42,30,11,21,24,34,38,11,75,28,12,62,11],
+    [2887,1],
+    [1549],
+    [1471,661,380,227,1,1,149,1,1],
+    [131,124],
+    [2261,481,1],
+    [216,2703],
+    [106],
+    [2164],
+    [538,1,1,1,1,278,1,1,1,1,2175,44,34,55,40,49,52,25,54,33,24,39,55,20],
+    [2831,1],
+    [1646,418],
+    [91,1632,1,158,551],
+    [1240,147,262,142,137,140,130,140,99,1,151,121,256],
+    [1414],
+    [121,4,106,17],
+    [2516,1],
+    [2833],
+    [377,25,236,25,369,472,404,253,12,399],
+    [44],
+    [110],
+    [909,1,1,1,1],
+    [373,25,236,25,369],
+    [2162,1],
+    [2624],
+    [81,33,111,3],
+    [2830,134],
+    [1171],
+    [1632],
+    [1357,231,1530,40,1,82,43],
+    [1115,1,1,1,1,990,1,1],
+    [1243,180],
+    [367,71,86,96,176,60,140],
+    [1307,1,323,1,1],
+    [453,1,1,1,1,258,1,1,1,1,456,1,269,1,301,1,93,1,174,1,107,1,418,1,238,1,134,1,85,85,95,29,53,34,128,113],
+    [1814,1],
+    [1463,1,1],
+    [1298,1],
+    [926,1,4,1,4,1,4,1,1130,1,1],
+    [1592,1,465,2,516,1,228],
+    [1550,1,1225,1],
+    [1253,1,40,1210,1],
+    [434,124,130,47,256,863,1,8,290,1,355,119,103,368,209],
+    [2799],
+    [1126,370,2,2,1,2,2,2,1,386,1,5,1,2,1,2,1,258,1,2,1,2,1,2,1,383,1,2,1,2,1,2,1,2,1,359,1,2,1,2,1,2,1,2,1],
+    [2947],
+    [1459],
+    [2275,1,475,1,1],
+    [373,1,1,1,1,257,1,1,1,1,390,1,1,1,1,275,1,1,268,1,1,183,1,1,222,1,1,171,1,1,355,1,1,378,1,1,147,85,58,68,54,109,115],
+    [1612],
+    [508,1,1,1,1,266,1,1,1,1],
+    [374,25,236,25,369,1560],
+    [2914,1],
+    [2177,1,10,1,426,1],
+    [1282],
+    [69,2024,764],
+    [1298,1,517,343,1],
+    [61,93,82,1840,1],
+    [778,1,1,1,1],
+    [2625,1,1],
+    [1247,1,1,1089,690,529],
+    [1992,1],
+    [1985,694,1,1,5,1,95,1],
+    [2,9,92,76,102,950,144,144,118,144,137,82,29,1,29,43,3,77,4,134,1,1,4,46,71,1,5,12,121,116,73,44,136,1,1,4,87,63,26,44,75,89,38,166],
+    [116,427,1,1,1,1,278,1,1,1,1,2163,50,36,50,36,40,41,44,41,52,28,49,25,37],
+    [59,63,51,34,60,1932,1,1],
+    [1965,1],
+    [80,1855,1,462,1,207,1,1,1,6,1,2,1,13,1,1,11,1,8,1,1,8,1,8,1,15,1,5,1,2,2,1,10,1,5,1,1,1,3,1,1,1,19,1,8,1,45,1,33,1,2,1,1,1,62,1],
+    [157,90],
+    [1808,1,1,1,1,1,12,7,1,2,1,5,1,1,1,1,2,1,1,1,1,1,1,3,4,1,1,5,1,1,1,1,1,1,1,2,1,1,7,12,1,11,1,2,1,1,1,1,1,1,1,4,4,1,10,1,1,1,1,1],
+    [66,39,12,832,505,1,927],
+    [2170],
+    [101],
+    [2722,120],
+    [35,32,160,5,67,1,1,1,1,68,159,64,1,1,1,1,94,172,106,1,1,1,1,36,423,1,121,593,5,1,1,481,1,97,144,1,1,25,1,1],
+    [1497,2,3,2,2,3,387,6,3,3,259,6,3,384,9,3,360,3,3,3,3],
+    [2610,111,6,114],
+    [2150,1],
+    [1610,1],
+    [2152],
+    [1976],
+    [2206,1,1,310,380],
+    [284,1,1,1,1,57,5,142,5,82,1,1,1,1,30,5,102,1,1,1,1,120,5,106,1,1,1,1,128,5,36,2,1,1,1,1,1,42,21,1,63,1,1,1,1,1,76,1,1,49,9,1,1,1,1,1,49,1,83,1,1,1,1,1,64,1,1,62,1,1,1,1,1,70,59,1,1,1,1,1,30,101,1,1,1,1,1,69,6,61,1,1,1,1,1,36,92,1,1,1,1,1,134,1,1,1,1,1,54,1,60,1,1,1,1,1,63,61,1,1,1,1,1,112,1,1,1,1,1,115,1,1,1,1,1,114,28,20,22,23,21,44,20,22,41,41,44,41,9,33,16,21,39,17,18,37],
+    [1002,68],
+    [1071],
+    [2528,1,1],
+    [30,920,1,1,1,1,274,1,143,1,22,1,18,3,92,7,1,117,1,133,1,1,1,7,1,136,1,140,1,126,1,139,1,122,1,132,1,115,1,116,1,128,13,1,20,7,1],
+    [97,907,68,460],
+    [1000,68],
+    [174,76,1300,1,67,332,1,359,1,349],
+    [1495],
+    [1001,68],
+    [2828,1],
+    [200,114,1,1,1,1,117,1,208,1,1,1,1,145,1,244,1,1,1,1,313,1,1,746,1,1,135,1,1,408,95,1,1,125,1,1,185,44,32,123,35,42,123,30,39],
+    [1213,1,54,1,149,1,131,1,214,1,60,1,202,1,70,1,209,1,59,1,9,1,261,1,105,1,165,1],
+    [1565,1,560],
+    [1255,941,116,396,58,1,18,1],
+    [1003],
+    [2488],
+    [1980,1,1],
+    [1926,768],
+    [2618,1,1,112,1],
+    [90,329,304,31,146,1025],
+    [919,1,1,1,1,41,390,683,1030,83,45,41,83,42,113],
+    [1879,781],
+    [724,177],
+    [62,10,431,1,1,1,1,6,1,1,1,1,203,53,1,1,1,1,6,1,1,1,1,110,7,1,1,1,1,16,1,1,1,1,1,1,1,1,1,218,1,1,835,342,267,1,422,2,43,3,43,2,35,3,42,3,38,3,41,2,37,3,39,3,35,2,39,2,32,3,33,2,41,2],
+    [2085,1,1,1,103],
+    [253],
+    [1462,99,12,165,1,5,1,19],
+    [1309],
+    [721,177],
+    [1165,186,273,373,117,139,1,170,67],
+    [1762,1,269,1],
+    [2734],
+    [1168,1,751,1,860,229,45,85,198,49,77],
+    [1213,1,54,1,149,1,131,1,214,1,60,1,202,1,70,1,209,1,59,1,271,1,105,1,165,1],
+    [722,177,1190,336,1],
+    [2621,1,1],
+    [2878,1],
+    [2418],
+    [2112,1,1,22,1,27,33,12,1,153,1,1],
+    [34],
+    [2152,103],
+    [2996,49,47,33,5,58,28,40,4,50,1,23,82,3,32,83,1],
+    [503,1,1,1,1,6,1,1,1,1,26,1,1,1,1,226,1,1,1,1,6,1,1,1,1,38,1,1,1,1,2163,50,36,50,36,40,41,44,41,52,28,49,25,37],
+    [1186,14,1874,488],
+    [400,83,1,1,1,1,174,107,1,1,1,1,2708],
+    [1656,1],
+    [1499,406,271,393,375],
+    [1506,1432],
+    [1631,1,1],
+    [773,1,1,1,1],
+    [484,2,283,2],
+    [45,1,2323],
+    [483,285],
+    [428,1,1,1,1,331,1,1,1,1,1207,1,493,1,937],
+    [944,1,1,1,1,247,1,934,1,530,1,1,298,64,46,44,39,44,41,44,40,42,37,40,36,35,43],
+    [301,10,5,5,5,5,49,15,5,10,35,5,5,5,15,50,10,31,10,20,5,5,25,10,5,5,10,10,26,10,5,10,5,13,67,10,40,17,10,15,17,56,5,30,18,10,5,5,5,15,15,42],
+    [2901],
+    [487,285,721,1],
+    [1379,895,250],
+    [156,81,248,283,1,1,1,1],
+    [3480],
+    [2149],
+    [1959,1],
+    [2249,124,1,114],
+    [1110,1,1,1,1],
+    [74],
+    [2415,10,1,1,1,1,39,1,8,1,1,1,15,1,20,1,2,1,2,1,5,1,2,1,8,1,38,1,2,6,9,1,2,1,1,1,219],
+    [271],
+    [1013,1,1,1,1,1225],
+    [256,1191,126,134,1,1,216,1,371,1,187,299,70,32,33],
+    [79],
+    [41,45,1,77,87,14,5,71,5,138,4,5,116,5,155,71,5,238,5,42,1,1,1,1,1,42,6,4,4,1,40,9,1,14,1,1,1,1,1,43,1,8,1,1,1,1,1,27,181,65,10,1,4,6,101,1,1,10,144,98,269,3,67,224,33,106,13,53,1,1,1,111,1,19,1,1,110],
+    [290,1,4,1,7,5,5,5,5,5,5,19,1,7,5,3,9,5,5,5,5,5,5,5,20,7,8,5,5,5,5,5,5,5,3,14,1,7,10,15,5,5,5,5,5,6,5,5,5,7,1,4,1,7,5,5,13,7,5,5,5,5,5,5,5,5,5,14,4,8,5,5,5,5,5,5,5,8,2,1,22,3,7,10,10,7,5,5,5,5,5,5,5,12,1,14,5,5,5,5,5,10,10,7,5,25,13,1,4,1,7,5,2,1,8,4,3,7,1,1,1,1,1,8,5,5,5,5,5,5,5,5,5,5,5,5,5,19,1,17,5,1409,72],
+    [2481,123],
+    [2165,1,1,1,1,1,1,1,1,1,1,1],
+    [443,1,1,1,1,248,1,1,1,1,349,1,1,1,1,275,1068,1,782,39,29,107,41,101],
+    [1306,663,20,1,1],
+    [31,1,10],
+    [2625,1,1,1],
+    [503,1,1,1,1,51,177,38,1,1,1,1,952,1,1,648],
+    [336,87,253,82,337],
+    [188],
+    [443,1,1,1,1,248,1,1,1,1,349,1,1,1,1,677,1,1,123,1,1,111,711,4,12,112,1,1,61,1,1,307,39,29,107,41,101],
+    [1274,1,1375,326,1],
+    [1688],
+    [2009,110],
+    [934,2,1,2,2,1],
+    [935,5],
+    [1656,1,1],
+    [2052],
+    [2424],
+    [1529],
+    [105,12,26,10,4,62,28,2144],
+    [433,428,124],
+    [2335],
+    [1970,1,1,1,475,2,2,4,229],
+    [2703],
+    [1,9,168,102,2319,114,308,45,21,25,37,45,41,41,3,39,42,38,41,34,36,43],
+    [2335],
+    [1148,1,40,1,34],
+    [2691],
+    [28],
+    [1219,1],
+    [2281],
+    [1114,1735,1],
+    [2208],
+    [1731],
+    [2658,1,1],
+    [2316,50,1,1,500],
+    [118,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,138,335,1468,1],
+    [63,15,1247,1,1,437,500,21,1,598,1],
+    [2278,1,1],
+    [860],
+    [2967,1,1],
+    [2494],
+    [2606,1,1,1,1,1,4,1,2,1,1,15,10,1,1,7,1,1,1,7,1,24,1,5,1,2,2,1,9,1,1,5,1,1,1,1,1,1,1,1,1,1,1,26,1,1,44,1,33,1,2,1,1,1,1,1],
+    [2231,1],
+    [110,1388,1,404,1,1,269,1,1,391,1,1,341,32,1,1],
+    [107],
+    [1525],
+    [1320,105,106,92,373,24,403,350,1,70,1,11,3,3,1,10,3,3,15,6,6,12,6,1,3,9,9,6,3,16,3,3,3,5,1],
+    [1600,555,489],
+    [46,62,1,51,80,961,1,37,119,1,27,139,60,1,1,16,1,1,8,1,30,4,1,19,1,1,1,1,1,19,1,97,39,1,97,140,49,23,1,57,140,67,1,17,1,34,97,34,66,1,1,53,63,1,1,49,48,94],
+    [1414],
+    [110,15,123],
+    [1549,684,437,1],
+    [225,2025,1,1,85],
+    [2846,141],
+    [123,19,66],
+    [1641],
+    [1391],
+    [201],
+    [1713,1,74,143,169,1,628,1],
+    [1722,128,523,1],
+    [1352,1,218,1],
+    [2310,1],
+    [2855,1],
+    [1392,1],
+    [3073],
+    [2961,1],
+    [1412,1,401,1],
+    [2711,1],
+    [1138,7,1,4,1,1,14,1,1,35,1,1,1,10,1,11,1,2,46,1,1,3,49,1,34,1,1,4,1,1,1,1,8,2,6,1,10,1,1,1,1,1,7,1,13,6,10,1,64,1,5,1,2,8,1,5,1,1,1,1,1,1,1,119,1,1333,43],
+    [378,1,1,1,1,257,1,1,1,1,390,1,1,1,1,294,1,630,1,906,1,182,29,43,125,277],
+    [1388,1,1],
+    [1911],
+    [1586,1,40,23,1],
+    [1336,289,1,693],
+    [2575],
+    [2449],
+    [2982],
+    [1191,1,49,1,71,1,1,1,1,1,288,107,1,1,154,800],
+    [2908,1],
+    [2397],
+    [571,308,67],
+    [1570,666],
+    [572,308,67],
+    [2395,1],
+    [1142,1,1],
+    [2218,1,1,1,10,1,5,1,2,1,6,1,2,1,5,1,2,1,8,1,6,1,2,1,1,2,1,17,1,6,1,5,1,1,2,1,2,1,2,1,2,2,1,8,2,1,5,1,34,1],
+    [2419,1],
+    [2271,1,1],
+    [2233],
+    [1592,1,1,45,1,654,1],
+    [2222],
+    [1982],
+    [2335],
+    [2293],
+    [573,308,67,202],
+    [1885],
+    [1823,1,155,507,1],
+    [569,308,67],
+    [2108,621,1],
+    [2201],
+    [2200],
+    [2467],
+    [69,7,2211],
+    [2439],
+    [2492,1],
+    [1743],
+    [570,308,67],
+    [1415,1],
+    [2065],
+    [224],
+    [106],
+    [2234,1],
+    [2731],
+    [1568,1,722,1],
+    [1429],
+    [1427,1,1255,1],
+    [45],
+    [2995,30,16,30,12,32,12,27,27,17,9,17,15,14,30,11,29,10,16,16,16,21,10,30,26,10,5,30,24,19],
+    [2685],
+    [2910],
+    [2750],
+    [1438,773],
+    [2531,1],
+    [373,1,1,1,1,257,1,1,1,1,390,1,1,1,1,2013,85,58,68,54,109,115],
+    [2075,323,1],
+    [1139,1,1527,1],
+    [388,1,1,1,1,308,1,1,1,1,354,1,1,1,1,362,1,1,1123,1,1,1,1,133,1,1,328,42,24,61,42,41,45,34,49,75,40,73],
+    [1814,1],
+    [1421,1,697],
+    [1495,574,1,1],
+    [1442,1],
+    [142,360,352,6,1149,846,1,60,60,1],
+    [957,58,168,90,303,698,241],
+    [2831,1,1],
+    [2462,1,124],
+    [1567,446,1,782],
+    [327,174,101,251,125,505,451],
+    [29],
+    [2612,1],
+    [126,88],
+    [2881,1],
+    [1505,1,1430,1,1],
+    [243,267,270,472,125,1,1,260,1,1,142,1,138,45,221,1,1,138,1,1,370,1,1,101,1],
+    [2025,1,1],
+    [2114],
+    [1165,186,273,177,196,427,67],
+    [956],
+    [500,352,1676,1,1],
+    [328,275,376,38],
+    [498,352,1100,1,13],
+    [324,275,356,20,38],
+    [1654,164,163,826,22],
+    [2123,197,1,1,121,1,420],
+    [164,11,1,7,22,6,11,29,22,1,1379,1,1174,1],
+    [959],
+    [325,275,376,38,409],
+    [1239,1],
+    [1115,1,1,1,1,531,1,278,1,534,370,1,1,134,1,1,58,87,38,85,127,37,75,38,41],
+    [1785],
+    [958],
+    [1068,1,1,1,1,67,1],
+    [1814,1,686,1],
+    [2383,1,1,519],
+    [1794],
+    [1460,1,1468],
+    [2624,250],
+    [1274,1,1019,1,241,377],
+    [1195,1,934,1,490,1,1,38,1,1],
+    [2982],
+    [1661],
+    [1157,1],
+    [1244,1,282,1,407,1,412,1],
+    [6,9,116,124,2851,125,26,56,110,12],
+    [1216,1,1,1532],
+    [86],
+    [1230,2,142,2,66,1,1,74,2,116,2,142,2,135,2,139,2,125,2,138,2,121,2,131,2,114,2,115,2,140,2],
+    [2884,1],
+    [1016],
+    [1863],
+    [1337,1,23,2,1,1,23,1,1,1,475,617,1,570,7],
+    [344,5,142,5,116,5,226,5,238,5,1938,127,4,167,39,37,42,70,1],
+    [2003],
+    [87],
+    [720,1,1,1,1,474,1,144,1,1,265,1,1,804,1,593,45,85,198,49,77],
+    [326,275,376],
+    [499,352,340,1,49,1,71,1,1,1,1,1,288,107,1,1,154,800],
+    [143],
+    [197],
+    [2825,1],
+    [1210,1,1],
+    [3168],
+    [1330],
+    [1553,1,1,697,424,1,1],
+    [1616,1],
+    [2901],
+    [1795,1,1],
+    [137,31,91],
+    [919,1,1,1,1,456,262,144,135,1,1,268,140,372,365,83,45,41,83,42,113],
+    [1247,1,586,167,1,976],
+    [197,6,1046,363,319],
+    [2230],
+    [217,336,1,1,1,1,278,1,1,1,1,611,1565,18,47,42,67,19,61,23,63,19,56,26,33,50],
+    [2277],
+    [2760,1,29,35,1],
+    [84,106,146,87,253,82,337,75,287,1,1,63,175],
+    [2237,1],
+    [2899,1],
+    [304,1,1,1,1,93,223,1,1,1,1,34,356,1,1,1,1,132,1,335,1,547,1,200,758,63,42,65,105,32,80,76,36],
+    [1559,1],
+    [2164],
+    [402,261],
+    [398,261,250,1,1,1,1,1249,1,461],
+    [1631,1,1],
+    [399,261,1156],
+    [2398,1],
+    [314,1,1,1,1,326,1,1,1,1,302,1,1,1,1,84,1,1,1,1,186,1,126,1,1,15,1,22,1,61,1,58,1,117,1,133,1,1,1,7,1,136,1,140,1,46,1,1,78,1,56,1,1,81,1,122,1,132,1,115,1,49,1,1,65,1,59,1,1,80,1,27,1,76,76,123,35,42,153,39],
+    [659,1,1,1,1,488,1,1,408,1060,1,1],
+    [543,1,1,1,1,278,1,1,1,1,2163,4,46,36,14,33,3,36,40,12,29,15,29,22,19,4,48,28,6,35,8,25,37,14],
+    [400,261],
+    [2587],
+    [1553,1,1,1121,1,1,147,1],
+    [76],
+    [2983],
+    [3105,124,204],
+    [4,2962],
+    [1396],
+    [2106,1],
+    [43],
+    [141,31,91],
+    [2256,1],
+    [13,168,102],
+    [1252,1178],
+    [3173,169,49],
+    [2428,1],
+    [1649],
+    [36],
+    [22,18],
+    [89],
+    [36,3],
+    [2258],
+    [2258],
+    [2391],
+];
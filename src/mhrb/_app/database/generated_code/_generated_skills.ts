@@ -88,12 +88,12 @@ export const __generated_skill__ice_attack: Skill = {
 export const __generated_skill__dragon_attack: Skill = {
     id: "dragon_attack",
     shortId: 5,
-    name: "Dragão Attack",
+    name: "Drag\u00e3o Attack",
     maxLevels: 5,
 
     iconImgID: "skill_icon_orange",
     filterHelpers: {
-        nameLower: "dragonattack",
+        nameLower: "drag\u00e3oattack",
     }
 };
 
@@ -196,12 +196,12 @@ export const __generated_skill__ice_resistance: Skill = {
 export const __generated_skill__dragon_resistance: Skill = {
     id: "dragon_resistance",
     shortId: 14,
-    name: "Dragão Resistance",
+    name: "Drag\u00e3o Resistance",
     maxLevels: 3,
 
     iconImgID: "skill_icon_orange",
     filterHelpers: {
-        nameLower: "dragonresistance",
+        nameLower: "drag\u00e3oresistance",
     }
 };
 
@@ -261,7 +261,7 @@ export const __generated_skill__affinity_sliding: Skill = {
 
     iconImgID: "skill_icon_pink",
     filterHelpers: {
-        nameLower: "affinitysliding",
+        nameLower: "afinidadesliding",
     }
 };
 
@@ -273,7 +273,7 @@ export const __generated_skill__Agitador: Skill = {
 
     iconImgID: "skill_icon_red",
     filterHelpers: {
-        nameLower: "Agitador",
+        nameLower: "agitador",
     }
 };
 
@@ -304,12 +304,12 @@ export const __generated_skill__artillery: Skill = {
 export const __generated_skill__attack_boost: Skill = {
     id: "attack_boost",
     shortId: 23,
-    name: "Reforço de Ataque",
+    name: "Refor\u00e7o de Ataque",
     maxLevels: 7,
 
     iconImgID: "skill_icon_red",
     filterHelpers: {
-        nameLower: "attackboost",
+        nameLower: "refor\u00e7odeataque",
     }
 };
 
@@ -472,12 +472,12 @@ export const __generated_skill__counterstrike: Skill = {
 export const __generated_skill__critical_boost: Skill = {
     id: "critical_boost",
     shortId: 37,
-    name: "Reforço Crítico",
+    name: "Refor\u00e7o Cr\u00edtico",
     maxLevels: 3,
 
     iconImgID: "skill_icon_pink",
     filterHelpers: {
-        nameLower: "criticalboost",
+        nameLower: "refor\u00e7ocr\u00edtico",
     }
 };
 
@@ -508,24 +508,24 @@ export const __generated_skill__critical_element: Skill = {
 export const __generated_skill__critical_eye: Skill = {
     id: "critical_eye",
     shortId: 40,
-    name: "Olho Crítico",
+    name: "Olho Cr\u00edtico",
     maxLevels: 7,
 
     iconImgID: "skill_icon_pink",
     filterHelpers: {
-        nameLower: "criticaleye",
+        nameLower: "olhocr\u00edtico",
     }
 };
 
 export const __generated_skill__defense_boost: Skill = {
     id: "defense_boost",
     shortId: 41,
-    name: "Reforço de Defesa ",
+    name: "Refor\u00e7o de Defesa ",
     maxLevels: 7,
 
     iconImgID: "skill_icon_gold",
     filterHelpers: {
-        nameLower: "defenseboost",
+        nameLower: "refor\u00e7odedefesa",
     }
 };
 
@@ -556,12 +556,12 @@ export const __generated_skill__divine_blessing: Skill = {
 export const __generated_skill__dragonheart: Skill = {
     id: "dragonheart",
     shortId: 44,
-    name: "Dragãoheart",
+    name: "Drag\u00e3oheart",
     maxLevels: 5,
 
     iconImgID: "skill_icon_orange",
     filterHelpers: {
-        nameLower: "dragonheart",
+        nameLower: "drag\u00e3oheart",
     }
 };
 
@@ -952,12 +952,12 @@ export const __generated_skill__partbreaker: Skill = {
 export const __generated_skill__peak_performance: Skill = {
     id: "peak_performance",
     shortId: 77,
-    name: "Desempenho Máximo",
+    name: "Desempenho M\u00e1ximo",
     maxLevels: 3,
 
     iconImgID: "skill_icon_red",
     filterHelpers: {
-        nameLower: "peakperformance",
+        nameLower: "desempenhom\u00e1ximo",
     }
 };
 
@@ -1106,14 +1106,14 @@ export const __generated_skill__reload_speed: Skill = {
 };
 
 export const __generated_skill__Indignação: Skill = {
-    id: "Indignação",
+    id: "Indigna\u00e7\u00e3o",
     shortId: 90,
-    name: "Indignação",
+    name: "Indigna\u00e7\u00e3o",
     maxLevels: 5,
 
     iconImgID: "skill_icon_orange",
     filterHelpers: {
-        nameLower: "Indignação",
+        nameLower: "indigna\u00e7\u00e3o",
     }
 };
 
@@ -1125,7 +1125,7 @@ export const __generated_skill__Ressuscitar: Skill = {
 
     iconImgID: "skill_icon_orange",
     filterHelpers: {
-        nameLower: "Ressuscitar",
+        nameLower: "ressuscitar",
     }
 };
 
@@ -1317,7 +1317,7 @@ export const __generated_skill__weakness_exploit: Skill = {
 
     iconImgID: "skill_icon_pink",
     filterHelpers: {
-        nameLower: "weaknessexploit",
+        nameLower: "explor.defraqueza",
     }
 };
 
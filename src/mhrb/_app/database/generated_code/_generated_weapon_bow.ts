@@ -36,8111 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type Bow,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__arc_shot_affinity,
-    __generated_ramp__arc_shot_anti_shock,
-    __generated_ramp__arc_shot_recovery,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__close_range_coating_boost,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__firing_charge,
-    __generated_ramp__firing_pierce,
-    __generated_ramp__firing_rapid,
-    __generated_ramp__firing_spread,
-    __generated_ramp__firing_swift,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__lasting_arc_shot,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_coating_boost,
-    __generated_ramp__poison_coating_boost,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_coating_boost,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__use_blast_coating,
-    __generated_ramp__use_exhaust_coating,
-    __generated_ramp__use_para_coating_1,
-    __generated_ramp__use_para_coating_2,
-    __generated_ramp__use_poison_coating_1,
-    __generated_ramp__use_poison_coating_2,
-    __generated_ramp__use_power_coating,
-    __generated_ramp__use_sleep_coating_1,
-    __generated_ramp__use_sleep_coating_2,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_4,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_bow__1a: Bow = {
-    category: "bow",
-    id: "1a",
-
-    name: "Kamura Iron Bow I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 1],
-            ["rapid", 2],
-            ["pierce", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironbowi",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_bow__1b: Bow = {
-    category: "bow",
-    id: "1b",
-
-    name: "Kamura Iron Bow II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 2],
-            ["pierce", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironbowii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_bow__1c: Bow = {
-    category: "bow",
-    id: "1c",
-
-    name: "Kamura Iron Bow III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironbowiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_bow__1d: Bow = {
-    category: "bow",
-    id: "1d",
-
-    name: "Kamura Iron Bow IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironbowiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_bow__1e: Bow = {
-    category: "bow",
-    id: "1e",
-
-    name: "Kamura Iron Bow V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__1d],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1d],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironbowv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_bow__1f: Bow = {
-    category: "bow",
-    id: "1f",
-
-    name: "Kamura Ninja Bow",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_bow__1e],
-            [__generated_ramp__attack_boost_2, __generated_bow__1d],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1d],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjabow",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_bow__2a: Bow = {
-    category: "bow",
-    id: "2a",
-
-    name: "Weaver of Flame I",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_3, __generated_bow__1e],
-            [__generated_ramp__defense_boost_2, __generated_bow__1e],
-            [__generated_ramp__master_rider, __generated_bow__1e],
-            [__generated_ramp__attack_boost_2, __generated_bow__1d],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1d],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["pierce", 3],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "weaverofflamei",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_bow__2b: Bow = {
-    category: "bow",
-    id: "2b",
-
-    name: "Weaver of Flame II",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__fire_boost_1, __generated_bow__2a],
-            [__generated_ramp__affinity_boost_3, __generated_bow__1e],
-            [__generated_ramp__defense_boost_2, __generated_bow__1e],
-            [__generated_ramp__master_rider, __generated_bow__1e],
-            [__generated_ramp__attack_boost_2, __generated_bow__1d],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1d],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "weaverofflameii",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_bow__2c: Bow = {
-    category: "bow",
-    id: "2c",
-
-    name: "Araknatorch",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_bow__2b],
-            [__generated_ramp__fire_boost_1, __generated_bow__2a],
-            [__generated_ramp__affinity_boost_3, __generated_bow__1e],
-            [__generated_ramp__defense_boost_2, __generated_bow__1e],
-            [__generated_ramp__master_rider, __generated_bow__1e],
-            [__generated_ramp__attack_boost_2, __generated_bow__1d],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1d],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 5],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "araknatorch",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_bow__3a: Bow = {
-    category: "bow",
-    id: "3a",
-
-    name: "Blessed Rain I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "blessedraini",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_bow__3b: Bow = {
-    category: "bow",
-    id: "3b",
-
-    name: "Blessed Rain II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__3a],
-            [__generated_ramp__water_boost_1, __generated_bow__3a],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "blessedrainii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_bow__3c: Bow = {
-    category: "bow",
-    id: "3c",
-
-    name: "Heaven's Manna",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__3b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__3a],
-            [__generated_ramp__water_boost_1, __generated_bow__3a],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["rapid", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "heaven'smanna",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_bow__4a: Bow = {
-    category: "bow",
-    id: "4a",
-
-    name: "Dawn Ray Bow I",
-    treeName: "Bishaten Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["pierce", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "dawnraybowi",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_bow__4b: Bow = {
-    category: "bow",
-    id: "4b",
-
-    name: "Dawn Ray Bow II",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__4a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["pierce", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "dawnraybowii",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_bow__4c: Bow = {
-    category: "bow",
-    id: "4c",
-
-    name: "Summit's Grand Glow",
-    treeName: "Bishaten Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__4a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["pierce", 3],
-            ["rapid", 4],
-            ["rapid", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "summit'sgrandglow",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_bow__5a: Bow = {
-    category: "bow",
-    id: "5a",
-
-    name: "Hidden Bow I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__4a],
-            [__generated_ramp__silkbind_boost, __generated_bow__4a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenbowi",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_bow__5b: Bow = {
-    category: "bow",
-    id: "5b",
-
-    name: "Hidden Bow II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__5a],
-            [__generated_ramp__attack_boost_1, __generated_bow__4a],
-            [__generated_ramp__silkbind_boost, __generated_bow__4a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenbowii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_bow__5c: Bow = {
-    category: "bow",
-    id: "5c",
-
-    name: "Night Flight",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__5b],
-            [__generated_ramp__attack_boost_2, __generated_bow__5a],
-            [__generated_ramp__attack_boost_1, __generated_bow__4a],
-            [__generated_ramp__silkbind_boost, __generated_bow__4a],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "nightflight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_bow__6a: Bow = {
-    category: "bow",
-    id: "6a",
-
-    name: "Kadachi Strikebow I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kadachistrikebowi",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_bow__6b: Bow = {
-    category: "bow",
-    id: "6b",
-
-    name: "Kadachi Strikebow II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__6a],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kadachistrikebowii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_bow__6c: Bow = {
-    category: "bow",
-    id: "6c",
-
-    name: "Kadachi Strikebow III",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__6b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__6a],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kadachistrikebowiii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_bow__6d: Bow = {
-    category: "bow",
-    id: "6d",
-
-    name: "Flying Kadachi Striker",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__6c],
-            [__generated_ramp__thunder_boost_2, __generated_bow__6c],
-            [__generated_ramp__attack_boost_1, __generated_bow__6b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__6a],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flyingkadachistriker",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_bow__7a: Bow = {
-    category: "bow",
-    id: "7a",
-
-    name: "Ice Crest I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "icecresti",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_bow__7b: Bow = {
-    category: "bow",
-    id: "7b",
-
-    name: "Ice Crest II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "icecrestii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_bow__7c: Bow = {
-    category: "bow",
-    id: "7c",
-
-    name: "Ice Crest III",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__7b],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "icecrestiii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_bow__7d: Bow = {
-    category: "bow",
-    id: "7d",
-
-    name: "Edelweiss",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_bow__7c],
-            [__generated_ramp__attack_boost_2, __generated_bow__7b],
-            [__generated_ramp__attack_boost_1, __generated_bow__1c],
-            [__generated_ramp__defense_boost_2, __generated_bow__1c],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["rapid", 3],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "edelweiss",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_bow__8a: Bow = {
-    category: "bow",
-    id: "8a",
-
-    name: "Wroggi Revolver I",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__1b],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1b],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "wroggirevolveri",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_bow__8b: Bow = {
-    category: "bow",
-    id: "8b",
-
-    name: "Wroggi Revolver II",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__8a],
-            [__generated_ramp__attack_boost_1, __generated_bow__1b],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "wroggirevolverii",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_bow__8c: Bow = {
-    category: "bow",
-    id: "8c",
-
-    name: "Hoodwinker's Revolver",
-    treeName: "Wroggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__8a],
-            [__generated_ramp__attack_boost_1, __generated_bow__1b],
-            [__generated_ramp__defense_boost_1, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hoodwinker'srevolver",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_bow__9a: Bow = {
-    category: "bow",
-    id: "9a",
-
-    name: "Arzuros Bow I",
-    treeName: "Arzuros Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["spread", 2],
-            ["spread", 1],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosbowi",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_bow__9b: Bow = {
-    category: "bow",
-    id: "9b",
-
-    name: "Arzuros Bow II",
-    treeName: "Arzuros Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__9a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 4],
-            ["spread", 3],
-            ["spread", 1],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosbowii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_bow__9c: Bow = {
-    category: "bow",
-    id: "9c",
-
-    name: "Arzuros' Honeypot",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__9b],
-            [__generated_ramp__defense_boost_1, __generated_bow__9b],
-            [__generated_ramp__small_monster_exploit, __generated_bow__9b],
-            [__generated_ramp__attack_boost_1, __generated_bow__9a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__1b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 5],
-            ["spread", 4],
-            ["spread", 2],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arzuros'honeypot",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_bow__10a: Bow = {
-    category: "bow",
-    id: "10a",
-
-    name: "Iron Bow I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 1],
-            ["pierce", 2],
-            ["spread", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ironbowi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_bow__10b: Bow = {
-    category: "bow",
-    id: "10b",
-
-    name: "Iron Bow II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 2],
-            ["pierce", 2],
-            ["spread", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ironbowii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_bow__10c: Bow = {
-    category: "bow",
-    id: "10c",
-
-    name: "Steel Bow",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 2],
-            ["pierce", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "steelbow",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_bow__10d: Bow = {
-    category: "bow",
-    id: "10d",
-
-    name: "Hunter's Stoutbow I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 2],
-            ["pierce", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'sstoutbowi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_bow__10e: Bow = {
-    category: "bow",
-    id: "10e",
-
-    name: "Hunter's Stoutbow II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'sstoutbowii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_bow__10f: Bow = {
-    category: "bow",
-    id: "10f",
-
-    name: "Hunter's Proudbow",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__10e],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'sproudbow",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_bow__11a: Bow = {
-    category: "bow",
-    id: "11a",
-
-    name: "Yekla Arc I",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__defense_boost_3, __generated_bow__10e],
-            [__generated_ramp__silkbind_boost, __generated_bow__10e],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "yeklaarci",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_bow__11b: Bow = {
-    category: "bow",
-    id: "11b",
-
-    name: "Yekla Arc II",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 8,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__defense_boost_3, __generated_bow__10e],
-            [__generated_ramp__silkbind_boost, __generated_bow__10e],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "yeklaarcii",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_bow__11c: Bow = {
-    category: "bow",
-    id: "11c",
-
-    name: "Herald's Battlebow",
-    treeName: "Ore Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__11b],
-            [__generated_ramp__defense_boost_3, __generated_bow__10e],
-            [__generated_ramp__silkbind_boost, __generated_bow__10e],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["spread", 3],
-            ["spread", 3],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "herald'sbattlebow",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_bow__12a: Bow = {
-    category: "bow",
-    id: "12a",
-
-    name: "Crystalline Flower I",
-    treeName: "Ice Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__silkbind_boost, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 1],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "crystallinefloweri",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_bow__12b: Bow = {
-    category: "bow",
-    id: "12b",
-
-    name: "Crystalline Flower II",
-    treeName: "Ice Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__12a],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__silkbind_boost, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "crystallineflowerii",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_bow__12c: Bow = {
-    category: "bow",
-    id: "12c",
-
-    name: "Heaven's Glaze",
-    treeName: "Ice Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 50]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_bow__12b],
-            [__generated_ramp__attack_boost_2, __generated_bow__12a],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__silkbind_boost, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "heaven'sglaze",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_bow__13a: Bow = {
-    category: "bow",
-    id: "13a",
-
-    name: "Mud Shot I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__silkbind_boost, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 2,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 3],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "mudshoti",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_bow__13b: Bow = {
-    category: "bow",
-    id: "13b",
-
-    name: "Mud Shot II",
-    treeName: "Almudron Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__13a],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__silkbind_boost, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 2,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 3],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "mudshotii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_bow__13c: Bow = {
-    category: "bow",
-    id: "13c",
-
-    name: "Hail of Mud",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_bow__13b],
-            [__generated_ramp__attack_boost_2, __generated_bow__13a],
-            [__generated_ramp__defense_boost_2, __generated_bow__10d],
-            [__generated_ramp__silkbind_boost, __generated_bow__10d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10c],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 2,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 4],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hailofmud",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_bow__14a: Bow = {
-    category: "bow",
-    id: "14a",
-
-    name: "Queen Blaster I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "queenblasteri",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_bow__14b: Bow = {
-    category: "bow",
-    id: "14b",
-
-    name: "Queen Blaster II",
-    treeName: "Rathian Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__14a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "queenblasterii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_bow__14c: Bow = {
-    category: "bow",
-    id: "14c",
-
-    name: "Queen's Melody",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__14a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["rapid", 3],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "queen'smelody",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_bow__15a: Bow = {
-    category: "bow",
-    id: "15a",
-
-    name: "Prominence Bow I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__small_monster_exploit, __generated_bow__14c],
-            [__generated_ramp__attack_boost_1, __generated_bow__14a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 4],
-            ["rapid", 3],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "prominencebowi",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_bow__15b: Bow = {
-    category: "bow",
-    id: "15b",
-
-    name: "Prominence Bow II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__small_monster_exploit, __generated_bow__14c],
-            [__generated_ramp__attack_boost_1, __generated_bow__14a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 4],
-            ["rapid", 4],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "prominencebowii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_bow__15c: Bow = {
-    category: "bow",
-    id: "15c",
-
-    name: "Dark Filament",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__15b],
-            [__generated_ramp__small_monster_exploit, __generated_bow__14c],
-            [__generated_ramp__attack_boost_1, __generated_bow__14a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 4],
-            ["rapid", 4],
-            ["spread", 4],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "darkfilament",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_bow__16a: Bow = {
-    category: "bow",
-    id: "16a",
-
-    name: "Kulu's Flight I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_coating_boost, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["rapid", 2],
-            ["rapid", 2],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kulu'sflighti",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_bow__16b: Bow = {
-    category: "bow",
-    id: "16b",
-
-    name: "Kulu's Flight II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_coating_boost, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__16a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kulu'sflightii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_bow__16c: Bow = {
-    category: "bow",
-    id: "16c",
-
-    name: "Kulu Piercer",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_coating_boost, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__16a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kulupiercer",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_bow__17a: Bow = {
-    category: "bow",
-    id: "17a",
-
-    name: "Khezu Bow I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["spread", 2],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "khezubowi",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_bow__17b: Bow = {
-    category: "bow",
-    id: "17b",
-
-    name: "Khezu Bow II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__17a],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "khezubowii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_bow__17c: Bow = {
-    category: "bow",
-    id: "17c",
-
-    name: "Galvanized Core",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_bow__17b],
-            [__generated_ramp__thunder_boost_1, __generated_bow__17b],
-            [__generated_ramp__attack_boost_2, __generated_bow__17a],
-            [__generated_ramp__attack_boost_1, __generated_bow__10b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__10b],
-            [__generated_ramp__defense_boost_2, __generated_bow__10b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "galvanizedcore",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_bow__18a: Bow = {
-    category: "bow",
-    id: "18a",
-
-    name: "Bone Gun I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 1],
-            ["spread", 2],
-            ["rapid", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "boneguni",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_bow__18b: Bow = {
-    category: "bow",
-    id: "18b",
-
-    name: "Bone Gun II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 2],
-            ["spread", 2],
-            ["rapid", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bonegunii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_bow__18c: Bow = {
-    category: "bow",
-    id: "18c",
-
-    name: "Hyper Bone Gun",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 2],
-            ["spread", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hyperbonegun",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_bow__18d: Bow = {
-    category: "bow",
-    id: "18d",
-
-    name: "Hunter's Bow I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'sbowi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_bow__18e: Bow = {
-    category: "bow",
-    id: "18e",
-
-    name: "Hunter's Bow II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__18d],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'sbowii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_bow__18f: Bow = {
-    category: "bow",
-    id: "18f",
-
-    name: "Master Hunter's Bow",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_bow__18e],
-            [__generated_ramp__attack_boost_2, __generated_bow__18d],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "masterhunter'sbow",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_bow__19a: Bow = {
-    category: "bow",
-    id: "19a",
-
-    name: "Tigrex Archer I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18d],
-            [__generated_ramp__poison_coating_boost, __generated_bow__18d],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexarcheri",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_bow__19b: Bow = {
-    category: "bow",
-    id: "19b",
-
-    name: "Tigrex Archer II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 240,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__19a],
-            [__generated_ramp__poison_coating_boost, __generated_bow__18d],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexarcherii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_bow__19c: Bow = {
-    category: "bow",
-    id: "19c",
-
-    name: "Tigrex Whisker",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 250,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__19b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__19a],
-            [__generated_ramp__poison_coating_boost, __generated_bow__18d],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 5],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexwhisker",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_bow__20a: Bow = {
-    category: "bow",
-    id: "20a",
-
-    name: "Diablos Coilbender I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -20,
-    defense: 10,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__19a],
-            [__generated_ramp__brutal_strike, __generated_bow__19a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18d],
-            [__generated_ramp__poison_coating_boost, __generated_bow__18d],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "diabloscoilbenderi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_bow__20b: Bow = {
-    category: "bow",
-    id: "20b",
-
-    name: "Diablos Coilbender II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 240,
-    affinity: -20,
-    defense: 10,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__20a],
-            [__generated_ramp__attack_boost_2, __generated_bow__19a],
-            [__generated_ramp__brutal_strike, __generated_bow__19a],
-            [__generated_ramp__poison_coating_boost, __generated_bow__18d],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "diabloscoilbenderii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_bow__20c: Bow = {
-    category: "bow",
-    id: "20c",
-
-    name: "Tyrant Bow",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 250,
-    affinity: -20,
-    defense: 15,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__20b],
-            [__generated_ramp__defense_boost_1, __generated_bow__20b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__20a],
-            [__generated_ramp__attack_boost_2, __generated_bow__19a],
-            [__generated_ramp__brutal_strike, __generated_bow__19a],
-            [__generated_ramp__poison_coating_boost, __generated_bow__18d],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 4],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tyrantbow",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_bow__21a: Bow = {
-    category: "bow",
-    id: "21a",
-
-    name: "Usurper's Rumble I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'srumblei",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_bow__21b: Bow = {
-    category: "bow",
-    id: "21b",
-
-    name: "Usurper's Rumble II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__21a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'srumbleii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_bow__21c: Bow = {
-    category: "bow",
-    id: "21c",
-
-    name: "Despot's Earlybolt",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_bow__21b],
-            [__generated_ramp__attack_boost_1, __generated_bow__21a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-            [__generated_ramp__defense_boost_1, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 4],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "despot'searlybolt",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_bow__22a: Bow = {
-    category: "bow",
-    id: "22a",
-
-    name: "Pukei Bow I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__paralysis_coating_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["pierce", 1],
-            ["pierce", 3],
-            ["pierce", 2],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "pukeibowi",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_bow__22b: Bow = {
-    category: "bow",
-    id: "22b",
-
-    name: "Pukei Bow II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__paralysis_coating_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__22a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "pukeibowii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_bow__22c: Bow = {
-    category: "bow",
-    id: "22c",
-
-    name: "Venomtongue Strike",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__paralysis_coating_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_bow__22b],
-            [__generated_ramp__attack_boost_2, __generated_bow__22a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 4],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "venomtonguestrike",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_bow__23a: Bow = {
-    category: "bow",
-    id: "23a",
-
-    name: "Flammenbogen I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 5]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__22a],
-            [__generated_ramp__defense_boost_1, __generated_bow__22a],
-            [__generated_ramp__paralysis_coating_boost, __generated_bow__22a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flammenbogeni",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_bow__23b: Bow = {
-    category: "bow",
-    id: "23b",
-
-    name: "Flammenbogen II",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 7]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_bow__23a],
-            [__generated_ramp__attack_boost_2, __generated_bow__22a],
-            [__generated_ramp__defense_boost_1, __generated_bow__22a],
-            [__generated_ramp__paralysis_coating_boost, __generated_bow__22a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__18c],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flammenbogenii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_bow__23c: Bow = {
-    category: "bow",
-    id: "23c",
-
-    name: "Flaming Rage Bow",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__23b],
-            [__generated_ramp__fire_boost_2, __generated_bow__23b],
-            [__generated_ramp__fire_boost_1, __generated_bow__23a],
-            [__generated_ramp__attack_boost_2, __generated_bow__22a],
-            [__generated_ramp__defense_boost_1, __generated_bow__22a],
-            [__generated_ramp__paralysis_coating_boost, __generated_bow__22a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["rapid", 3],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flamingragebow",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_bow__24a: Bow = {
-    category: "bow",
-    id: "24a",
-
-    name: "Spongia Bow I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-            [__generated_ramp__defense_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["pierce", 1],
-            ["pierce", 2],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "spongiabowi",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_bow__24b: Bow = {
-    category: "bow",
-    id: "24b",
-
-    name: "Spongia Bow II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-            [__generated_ramp__defense_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "spongiabowii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_bow__24c: Bow = {
-    category: "bow",
-    id: "24c",
-
-    name: "Spongia Bow III",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_bow__24b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-            [__generated_ramp__defense_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "spongiabowiii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_bow__24d: Bow = {
-    category: "bow",
-    id: "24d",
-
-    name: "Porifera Bow",
-    treeName: "Royal Ludroth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__24c],
-            [__generated_ramp__water_boost_1, __generated_bow__24b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__18b],
-            [__generated_ramp__defense_boost_1, __generated_bow__18b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "poriferabow",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_bow__25a: Bow = {
-    category: "bow",
-    id: "25a",
-
-    name: "Baggi Bow I",
-    treeName: "Baggi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__18a],
-            [__generated_ramp__defense_boost_1, __generated_bow__18a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["spread", 2],
-            ["rapid", 2],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "baggibowi",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_bow__25b: Bow = {
-    category: "bow",
-    id: "25b",
-
-    name: "Baggi Bow II",
-    treeName: "Baggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__25a],
-            [__generated_ramp__attack_boost_2, __generated_bow__18a],
-            [__generated_ramp__defense_boost_1, __generated_bow__18a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 3],
-            ["rapid", 3],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "baggibowii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_bow__25c: Bow = {
-    category: "bow",
-    id: "25c",
-
-    name: "Hypnoshot",
-    treeName: "Baggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__25a],
-            [__generated_ramp__attack_boost_2, __generated_bow__18a],
-            [__generated_ramp__defense_boost_1, __generated_bow__18a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["spread", 3],
-            ["rapid", 4],
-            ["spread", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hypnoshot",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_bow__26a: Bow = {
-    category: "bow",
-    id: "26a",
-
-    name: "Arko Nulo I",
-    treeName: "Bnahabra Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 1],
-            ["pierce", 2],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloi",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_bow__26b: Bow = {
-    category: "bow",
-    id: "26b",
-
-    name: "Arko Nulo II",
-    treeName: "Bnahabra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 2],
-            ["pierce", 2],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_bow__26c: Bow = {
-    category: "bow",
-    id: "26c",
-
-    name: "Arko Unu",
-    treeName: "Bnahabra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkounu",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_bow__26d: Bow = {
-    category: "bow",
-    id: "26d",
-
-    name: "Arko Nulo Black I",
-    treeName: "Bnahabra Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26c],
-            [__generated_ramp__defense_boost_1, __generated_bow__26c],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloblacki",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_bow__26e: Bow = {
-    category: "bow",
-    id: "26e",
-
-    name: "Arko Nulo Black II",
-    treeName: "Bnahabra Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__dragon_boost_1, __generated_bow__26d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26c],
-            [__generated_ramp__defense_boost_1, __generated_bow__26c],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloblackii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_bow__26f: Bow = {
-    category: "bow",
-    id: "26f",
-
-    name: "Arko Unu Black",
-    treeName: "Bnahabra Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__26e],
-            [__generated_ramp__dragon_boost_1, __generated_bow__26d],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26c],
-            [__generated_ramp__defense_boost_1, __generated_bow__26c],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkounublack",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_bow__27a: Bow = {
-    category: "bow",
-    id: "27a",
-
-    name: "Arko Nulo Yellow I",
-    treeName: "Bnahabra (Thunder)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26c],
-            [__generated_ramp__defense_boost_1, __generated_bow__26c],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloyellowi",
-        treeNameLower: "bnahabra(thunder)",
-    },
-};
-
-const __generated_bow__27b: Bow = {
-    category: "bow",
-    id: "27b",
-
-    name: "Arko Nulo Yellow II",
-    treeName: "Bnahabra (Thunder)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__thunder_boost_1, __generated_bow__27a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26c],
-            [__generated_ramp__defense_boost_1, __generated_bow__26c],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloyellowii",
-        treeNameLower: "bnahabra(thunder)",
-    },
-};
-
-const __generated_bow__27c: Bow = {
-    category: "bow",
-    id: "27c",
-
-    name: "Arko Unu Yellow",
-    treeName: "Bnahabra (Thunder)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__27b],
-            [__generated_ramp__thunder_boost_1, __generated_bow__27a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26c],
-            [__generated_ramp__defense_boost_1, __generated_bow__26c],
-            [__generated_ramp__attack_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkounuyellow",
-        treeNameLower: "bnahabra(thunder)",
-    },
-};
-
-const __generated_bow__28a: Bow = {
-    category: "bow",
-    id: "28a",
-
-    name: "Arko Nulo Red I",
-    treeName: "Bnahabra (Fire)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26a],
-            [__generated_ramp__defense_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloredi",
-        treeNameLower: "bnahabra(fire)",
-    },
-};
-
-const __generated_bow__28b: Bow = {
-    category: "bow",
-    id: "28b",
-
-    name: "Arko Nulo Red II",
-    treeName: "Bnahabra (Fire)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__28a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26a],
-            [__generated_ramp__defense_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonuloredii",
-        treeNameLower: "bnahabra(fire)",
-    },
-};
-
-const __generated_bow__28c: Bow = {
-    category: "bow",
-    id: "28c",
-
-    name: "Arko Unu Red",
-    treeName: "Bnahabra (Fire)",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_bow__28b],
-            [__generated_ramp__attack_boost_1, __generated_bow__28a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26a],
-            [__generated_ramp__defense_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["pierce", 4],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkounured",
-        treeNameLower: "bnahabra(fire)",
-    },
-};
-
-const __generated_bow__29a: Bow = {
-    category: "bow",
-    id: "29a",
-
-    name: "Arko Nulo White I",
-    treeName: "Bnahabra (Ice)",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26a],
-            [__generated_ramp__defense_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 1],
-            ["spread", 2],
-            ["pierce", 2],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonulowhitei",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_bow__29b: Bow = {
-    category: "bow",
-    id: "29b",
-
-    name: "Arko Nulo White II",
-    treeName: "Bnahabra (Ice)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__29a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26a],
-            [__generated_ramp__defense_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["pierce", 3],
-            ["pierce", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkonulowhiteii",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_bow__29c: Bow = {
-    category: "bow",
-    id: "29c",
-
-    name: "Arko Unu White",
-    treeName: "Bnahabra (Ice)",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_bow__29b],
-            [__generated_ramp__attack_boost_1, __generated_bow__29a],
-            [__generated_ramp__affinity_boost_1, __generated_bow__26a],
-            [__generated_ramp__defense_boost_1, __generated_bow__26a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["spread", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arkounuwhite",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_bow__30a: Bow = {
-    category: "bow",
-    id: "30a",
-
-    name: "Sinister Bow I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 4],
-            ["spread", 3],
-            ["spread", 3],
-            ["rapid", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterbowi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_bow__30b: Bow = {
-    category: "bow",
-    id: "30b",
-
-    name: "Sinister Bow II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__30a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 5],
-            ["spread", 3],
-            ["spread", 3],
-            ["rapid", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterbowii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_bow__30c: Bow = {
-    category: "bow",
-    id: "30c",
-
-    name: "Sinister Soulpiercer",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_bow__30b],
-            [__generated_ramp__attack_boost_2, __generated_bow__30a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 5],
-            ["spread", 3],
-            ["spread", 4],
-            ["rapid", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinistersoulpiercer",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_bow__31a: Bow = {
-    category: "bow",
-    id: "31a",
-
-    name: "Kelbi Stingshot I",
-    treeName: "Kelbi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__paralysis_coating_boost, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kelbistingshoti",
-        treeNameLower: "kelbitree",
-    },
-};
-
-const __generated_bow__31b: Bow = {
-    category: "bow",
-    id: "31b",
-
-    name: "Kelbi Stingshot II",
-    treeName: "Kelbi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__paralysis_coating_boost, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kelbistingshotii",
-        treeNameLower: "kelbitree",
-    },
-};
-
-const __generated_bow__31c: Bow = {
-    category: "bow",
-    id: "31c",
-
-    name: "Kelbi Strongshot",
-    treeName: "Kelbi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__paralysis_coating_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__31b],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 3],
-            ["spread", 3],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 2,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kelbistrongshot",
-        treeNameLower: "kelbitree",
-    },
-};
-
-const __generated_bow__32a: Bow = {
-    category: "bow",
-    id: "32a",
-
-    name: "Beast Thunderbow I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__master_rider, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "beastthunderbowi",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_bow__32b: Bow = {
-    category: "bow",
-    id: "32b",
-
-    name: "Beast Thunderbow II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__thunder_boost_1, __generated_bow__32a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "beastthunderbowii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_bow__32c: Bow = {
-    category: "bow",
-    id: "32c",
-
-    name: "Beastking Thunderbow",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__32b],
-            [__generated_ramp__thunder_boost_1, __generated_bow__32a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 3],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "beastkingthunderbow",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_bow__33a: Bow = {
-    category: "bow",
-    id: "33a",
-
-    name: "Azure Elder Bow I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 2],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderbowi",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_bow__33b: Bow = {
-    category: "bow",
-    id: "33b",
-
-    name: "Azure Elder Bow II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_bow__33a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 1],
-            ["pierce", 2],
-            ["rapid", 4],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderbowii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_bow__33c: Bow = {
-    category: "bow",
-    id: "33c",
-
-    name: "Abyssal Gale Bow",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_bow__33b],
-            [__generated_ramp__defense_boost_1, __generated_bow__33a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 3],
-            ["rapid", 4],
-            ["rapid", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgalebow",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_bow__34a: Bow = {
-    category: "bow",
-    id: "34a",
-
-    name: "Thunderbolt Bow I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["spread", 2],
-            ["spread", 3],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltbowi",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_bow__34b: Bow = {
-    category: "bow",
-    id: "34b",
-
-    name: "Abyssal Storm Bow",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__34a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 3],
-            ["spread", 4],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 1,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormbow",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_bow__35a: Bow = {
-    category: "bow",
-    id: "35a",
-
-    name: "Gelosteel Bow I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["pierce", 3],
-            ["pierce", 4],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "icesteelbowi",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_bow__35b: Bow = {
-    category: "bow",
-    id: "35b",
-
-    name: "Daora's Sagittarii",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__35a],
-            [__generated_ramp__affinity_boost_2, __generated_bow__35a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 3],
-            ["pierce", 3],
-            ["pierce", 5],
-            ["pierce", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "daora'ssagittarii",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_bow__36a: Bow = {
-    category: "bow",
-    id: "36a",
-
-    name: "Bow of Hope & Valor I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 3],
-            ["rapid", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bowofhope&valori",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_bow__36b: Bow = {
-    category: "bow",
-    id: "36b",
-
-    name: "Bow of Light & Courage",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__36a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 4],
-            ["rapid", 4],
-            ["rapid", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bowoflight&courage",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_bow__37a: Bow = {
-    category: "bow",
-    id: "37a",
-
-    name: "Genie's Grimoire I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["rapid", 2],
-            ["spread", 4],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "genie'sgrimoirei",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_bow__37b: Bow = {
-    category: "bow",
-    id: "37b",
-
-    name: "Demon's Guidance",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__37a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["rapid", 2],
-            ["spread", 4],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 1,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "demon'sguidance",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_bow__38a: Bow = {
-    category: "bow",
-    id: "38a",
-
-    name: "Redwing Bow I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "redwingbowi",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_bow__38b: Bow = {
-    category: "bow",
-    id: "38b",
-
-    name: "Reddnaught Dragão Arc",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 39]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["spread", 3],
-            ["spread", 4],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reddnaughtdragonarc",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_bow__39a: Bow = {
-    category: "bow",
-    id: "39a",
-
-    name: "Morsel Bowfish I",
-    treeName: "Speartuna Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["spread", 2],
-            ["spread", 2],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "morselbowfishi",
-        treeNameLower: "speartunatree",
-    },
-};
-
-const __generated_bow__39b: Bow = {
-    category: "bow",
-    id: "39b",
-
-    name: "Morsel Bowfish II",
-    treeName: "Speartuna Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__39a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "morselbowfishii",
-        treeNameLower: "speartunatree",
-    },
-};
-
-const __generated_bow__39c: Bow = {
-    category: "bow",
-    id: "39c",
-
-    name: "Ample Bowfish",
-    treeName: "Speartuna Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_bow__39b],
-            [__generated_ramp__affinity_boost_1, __generated_bow__39a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "amplebowfish",
-        treeNameLower: "speartunatree",
-    },
-};
-
-const __generated_bow__40a: Bow = {
-    category: "bow",
-    id: "40a",
-
-    name: "Felyne Bow I",
-    treeName: "Felyne Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: -15,
-    defense: 2,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["spread", 1],
-            ["rapid", 2],
-            ["spread", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "felynebowi",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_bow__40b: Bow = {
-    category: "bow",
-    id: "40b",
-
-    name: "Felyne Bow II",
-    treeName: "Felyne Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -15,
-    defense: 9,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__40a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["spread", 2],
-            ["rapid", 3],
-            ["spread", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "felynebowii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_bow__40c: Bow = {
-    category: "bow",
-    id: "40c",
-
-    name: "Felyne Trickbow",
-    treeName: "Felyne Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: -15,
-    defense: 18,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__40b],
-            [__generated_ramp__attack_boost_1, __generated_bow__40a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 4,
-        chargeShot: [
-            ["spread", 2],
-            ["rapid", 3],
-            ["spread", 3],
-            ["rapid", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 0,
-            para_coating: 2,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "felynetrickbow",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_bow__41a: Bow = {
-    category: "bow",
-    id: "41a",
-
-    name: "Chaos Bow I",
-    treeName: "Chaos Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 2,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "chaosbowi",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_bow__41b: Bow = {
-    category: "bow",
-    id: "41b",
-
-    name: "Chaos Bow II",
-    treeName: "Chaos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__41a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 2,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "chaosbowii",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_bow__41c: Bow = {
-    category: "bow",
-    id: "41c",
-
-    name: "Chaotic Rapture",
-    treeName: "Chaos Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__lasting_arc_shot, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__41a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "brace",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 2,
-            para_coating: 2,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "chaoticrapture",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_bow__42a: Bow = {
-    category: "bow",
-    id: "42a",
-
-    name: "Ivory Bow I",
-    treeName: "Edel Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ivorybowi",
-        treeNameLower: "edeltree",
-    },
-};
-
-const __generated_bow__42b: Bow = {
-    category: "bow",
-    id: "42b",
-
-    name: "Ivory Bow II",
-    treeName: "Edel Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__defense_boost_1, __generated_bow__42a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 3],
-            ["spread", 3],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ivorybowii",
-        treeNameLower: "edeltree",
-    },
-};
-
-const __generated_bow__42c: Bow = {
-    category: "bow",
-    id: "42c",
-
-    name: "Frozen Bow",
-    treeName: "Edel Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_1, __generated_bow__42b],
-            [__generated_ramp__defense_boost_1, __generated_bow__42a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["spread", 3],
-            ["spread", 4],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 2,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "frozenbow",
-        treeNameLower: "edeltree",
-    },
-};
-
-const __generated_bow__43a: Bow = {
-    category: "bow",
-    id: "43a",
-
-    name: "Arachnid Bow I",
-    treeName: "Spio Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 20,
-    defense: 25,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 5],
-            ["pierce", 4],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arachnidbowi",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_bow__43b: Bow = {
-    category: "bow",
-    id: "43b",
-
-    name: "Arachnid Bow II",
-    treeName: "Spio Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 20,
-    defense: 25,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_bow__43a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 5],
-            ["pierce", 4],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arachnidbowii",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_bow__43c: Bow = {
-    category: "bow",
-    id: "43c",
-
-    name: "Arachnid Silverstring",
-    treeName: "Spio Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 20,
-    defense: 25,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__poison_coating_boost, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_bow__43b],
-            [__generated_ramp__defense_boost_1, __generated_bow__43a],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["pierce", 2],
-            ["pierce", 5],
-            ["pierce", 4],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 1,
-            sleep_coating: 2,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arachnidsilverstring",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_bow__44a: Bow = {
-    category: "bow",
-    id: "44a",
-
-    name: "Azure Era Wyrmbow I",
-    treeName: "<TODO: Find out the name of this tree.>",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__water_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 4],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureerawyrmbowi",
-        treeNameLower: "<todo:findoutthenameofthistree.>",
-    },
-};
-
-const __generated_bow__44b: Bow = {
-    category: "bow",
-    id: "44b",
-
-    name: "Azure Era \"Soaring Dragão\"",
-    treeName: "<TODO: Find out the name of this tree.>",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__water_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "recovery",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["spread", 2],
-            ["spread", 3],
-            ["spread", 3],
-            ["spread", 5],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 1,
-            poison_coating: 1,
-            para_coating: 0,
-            sleep_coating: 1,
-            blast_coating: 1,
-            exhaust_coating: 1,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureera\"soaringdragon\"",
-        treeNameLower: "<todo:findoutthenameofthistree.>",
-    },
-};
-
-const __generated_bow__ra: Bow = {
-    category: "bow",
-    id: "ra",
-
-    name: "Rampage Bow I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-        [
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-        ],
-        [
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-        ],
-        [
-            [__generated_ramp__arc_shot_recovery, null],
-            [__generated_ramp__arc_shot_affinity, null],
-            [__generated_ramp__arc_shot_anti_shock, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagebowi",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_bow__rb: Bow = {
-    category: "bow",
-    id: "rb",
-
-    name: "Rampage Bow II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__firing_rapid, null],
-            [__generated_ramp__firing_pierce, null],
-            [__generated_ramp__firing_spread, null],
-        ],
-        [
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__arc_shot_recovery, null],
-            [__generated_ramp__arc_shot_affinity, null],
-            [__generated_ramp__arc_shot_anti_shock, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagebowii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_bow__rc: Bow = {
-    category: "bow",
-    id: "rc",
-
-    name: "Rampage Bow III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__rb],
-            [__generated_ramp__affinity_boost_1, __generated_bow__rb],
-            [__generated_ramp__defense_boost_1, __generated_bow__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__firing_rapid, null],
-            [__generated_ramp__firing_pierce, null],
-            [__generated_ramp__firing_spread, null],
-        ],
-        [
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_para_coating_1, null],
-            [__generated_ramp__use_sleep_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_para_coating_1, null],
-            [__generated_ramp__use_sleep_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__arc_shot_recovery, null],
-            [__generated_ramp__arc_shot_affinity, null],
-            [__generated_ramp__arc_shot_anti_shock, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 1],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagebowiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_bow__rd: Bow = {
-    category: "bow",
-    id: "rd",
-
-    name: "Rampage Bow IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_bow__rb],
-            [__generated_ramp__affinity_boost_1, __generated_bow__rb],
-            [__generated_ramp__defense_boost_1, __generated_bow__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_bow__rc],
-            [__generated_ramp__water_1, __generated_bow__rc],
-            [__generated_ramp__thunder_1, __generated_bow__rc],
-            [__generated_ramp__ice_1, __generated_bow__rc],
-            [__generated_ramp__dragon_1, __generated_bow__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__firing_rapid, null],
-            [__generated_ramp__firing_pierce, null],
-            [__generated_ramp__firing_spread, null],
-        ],
-        [
-            [__generated_ramp__close_range_coating_boost, null],
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_para_coating_1, null],
-            [__generated_ramp__use_sleep_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__close_range_coating_boost, null],
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_para_coating_1, null],
-            [__generated_ramp__use_sleep_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__arc_shot_recovery, null],
-            [__generated_ramp__arc_shot_affinity, null],
-            [__generated_ramp__arc_shot_anti_shock, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagebowiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_bow__re: Bow = {
-    category: "bow",
-    id: "re",
-
-    name: "Rampage Bow V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__attack_boost_2, __generated_bow__rd],
-            [__generated_ramp__affinity_boost_2, __generated_bow__rd],
-            [__generated_ramp__defense_boost_2, __generated_bow__rd],
-            [__generated_ramp__attack_boost_1, __generated_bow__rb],
-            [__generated_ramp__affinity_boost_1, __generated_bow__rb],
-            [__generated_ramp__defense_boost_1, __generated_bow__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_bow__rd],
-            [__generated_ramp__water_2, __generated_bow__rd],
-            [__generated_ramp__thunder_2, __generated_bow__rd],
-            [__generated_ramp__ice_2, __generated_bow__rd],
-            [__generated_ramp__dragon_2, __generated_bow__rd],
-            [__generated_ramp__fire_1, __generated_bow__rc],
-            [__generated_ramp__water_1, __generated_bow__rc],
-            [__generated_ramp__thunder_1, __generated_bow__rc],
-            [__generated_ramp__ice_1, __generated_bow__rc],
-            [__generated_ramp__dragon_1, __generated_bow__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__firing_rapid, null],
-            [__generated_ramp__firing_pierce, null],
-            [__generated_ramp__firing_spread, null],
-            [__generated_ramp__firing_charge, null],
-        ],
-        [
-            [__generated_ramp__close_range_coating_boost, null],
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_para_coating_1, null],
-            [__generated_ramp__use_sleep_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__close_range_coating_boost, null],
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_1, null],
-            [__generated_ramp__use_para_coating_1, null],
-            [__generated_ramp__use_sleep_coating_1, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-        ],
-        [
-            [__generated_ramp__arc_shot_recovery, null],
-            [__generated_ramp__arc_shot_affinity, null],
-            [__generated_ramp__arc_shot_anti_shock, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagebowv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_bow__rf: Bow = {
-    category: "bow",
-    id: "rf",
-
-    name: "Rampage Bow S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__attack_boost_3, __generated_bow__re],
-            [__generated_ramp__affinity_boost_3, __generated_bow__re],
-            [__generated_ramp__attack_boost_2, __generated_bow__rd],
-            [__generated_ramp__affinity_boost_2, __generated_bow__rd],
-            [__generated_ramp__defense_boost_2, __generated_bow__rd],
-            [__generated_ramp__attack_boost_1, __generated_bow__rb],
-            [__generated_ramp__affinity_boost_1, __generated_bow__rb],
-            [__generated_ramp__defense_boost_1, __generated_bow__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__blast_1, __generated_bow__re],
-            [__generated_ramp__fire_2, __generated_bow__rd],
-            [__generated_ramp__water_2, __generated_bow__rd],
-            [__generated_ramp__thunder_2, __generated_bow__rd],
-            [__generated_ramp__ice_2, __generated_bow__rd],
-            [__generated_ramp__dragon_2, __generated_bow__rd],
-            [__generated_ramp__fire_1, __generated_bow__rc],
-            [__generated_ramp__water_1, __generated_bow__rc],
-            [__generated_ramp__thunder_1, __generated_bow__rc],
-            [__generated_ramp__ice_1, __generated_bow__rc],
-            [__generated_ramp__dragon_1, __generated_bow__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__firing_rapid, null],
-            [__generated_ramp__firing_pierce, null],
-            [__generated_ramp__firing_spread, null],
-            [__generated_ramp__firing_charge, null],
-            [__generated_ramp__firing_swift, null],
-        ],
-        [
-            [__generated_ramp__close_range_coating_boost, null],
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_2, null],
-            [__generated_ramp__use_para_coating_2, null],
-            [__generated_ramp__use_sleep_coating_2, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-            [__generated_ramp__use_poison_coating_1, __generated_bow__re],
-            [__generated_ramp__use_para_coating_1, __generated_bow__re],
-            [__generated_ramp__use_sleep_coating_1, __generated_bow__re],
-        ],
-        [
-            [__generated_ramp__close_range_coating_boost, null],
-            [__generated_ramp__use_power_coating, null],
-            [__generated_ramp__use_poison_coating_2, null],
-            [__generated_ramp__use_para_coating_2, null],
-            [__generated_ramp__use_sleep_coating_2, null],
-            [__generated_ramp__use_blast_coating, null],
-            [__generated_ramp__use_exhaust_coating, null],
-            [__generated_ramp__use_poison_coating_1, __generated_bow__re],
-            [__generated_ramp__use_para_coating_1, __generated_bow__re],
-            [__generated_ramp__use_sleep_coating_1, __generated_bow__re],
-        ],
-        [
-            [__generated_ramp__arc_shot_recovery, null],
-            [__generated_ramp__arc_shot_affinity, null],
-            [__generated_ramp__arc_shot_anti_shock, null],
-        ],
-    ],
-
-    bowStats: {
-        arcShot: "affinity",
-        baseChargeLevelLimit: 3,
-        chargeShot: [
-            ["rapid", 2],
-            ["rapid", 2],
-            ["rapid", 3],
-            ["rapid", 3],
-        ],
-        compatibleCoatings: {
-            close_range_coating: 1,
-            power_coating: 0,
-            poison_coating: 0,
-            para_coating: 0,
-            sleep_coating: 0,
-            blast_coating: 0,
-            exhaust_coating: 0,
-        },
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagebows",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"bow","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Iron Bow I","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",1],["rapid",2],["pierce",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"1b","name":"Kamura Iron Bow II","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",2],["pierce",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"1c","name":"Kamura Iron Bow III","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"1d","name":"Kamura Iron Bow IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"1e","name":"Kamura Iron Bow V","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["rapid",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"1f","name":"Kamura Ninja Bow","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["rapid",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}}]],["Rakna-Kadaki Tree",[{"id":"2a","name":"Weaver of Flame I","rarity":6,"endlineTag":"","attack":150,"affinity":20,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["silkbind_boost",null],["affinity_boost_3","1e"],["defense_boost_2","1e"],["master_rider","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["pierce",3],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"2b","name":"Weaver of Flame II","rarity":6,"endlineTag":"","attack":160,"affinity":25,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",29]],"rampSkills":[[["attack_boost_3",null],["fire_boost_2",null],["silkbind_boost",null],["fire_boost_1","2a"],["affinity_boost_3","1e"],["defense_boost_2","1e"],["master_rider","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["pierce",4],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"2c","name":"Araknatorch","rarity":7,"endlineTag":"hr","attack":170,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",33]],"rampSkills":[[["attack_boost_4",null],["fire_boost_2",null],["silkbind_boost",null],["attack_boost_3","2b"],["fire_boost_1","2a"],["affinity_boost_3","1e"],["defense_boost_2","1e"],["master_rider","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["pierce",4],["pierce",5],["pierce",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}}]],["Mizutsune Tree",[{"id":"3a","name":"Blessed Rain I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",11]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"3b","name":"Blessed Rain II","rarity":5,"endlineTag":"","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",13]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"3c","name":"Heaven\'s Manna","rarity":6,"endlineTag":"hr","attack":210,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","3b"],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["rapid",3],["rapid",4],["rapid",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}}]],["Bishaten Tree",[{"id":"4a","name":"Dawn Ray Bow I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["lasting_arc_shot",null],["silkbind_boost",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":4,"chargeShot":[["pierce",1],["rapid",2],["rapid",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"4b","name":"Dawn Ray Bow II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":10,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["lasting_arc_shot",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":4,"chargeShot":[["pierce",2],["rapid",3],["rapid",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"4c","name":"Summit\'s Grand Glow","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":10,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["lasting_arc_shot",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":4,"chargeShot":[["pierce",3],["rapid",4],["rapid",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Nargacuga Tree",[{"id":"5a","name":"Hidden Bow I","rarity":3,"endlineTag":"","attack":130,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["lasting_arc_shot",null],["attack_boost_1","4a"],["silkbind_boost","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":2,"power_coating":0,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"5b","name":"Hidden Bow II","rarity":5,"endlineTag":"","attack":190,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["lasting_arc_shot",null],["attack_boost_2","5a"],["attack_boost_1","4a"],["silkbind_boost","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",2],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":2,"power_coating":0,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"5c","name":"Night Flight","rarity":6,"endlineTag":"hr","attack":210,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["lasting_arc_shot",null],["affinity_boost_1","5b"],["attack_boost_2","5a"],["attack_boost_1","4a"],["silkbind_boost","4a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",3],["pierce",4],["pierce",5]],"compatibleCoatings":{"close_range_coating":2,"power_coating":0,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Tobi-Kadachi Tree",[{"id":"6a","name":"Kadachi Strikebow I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunder_boost_2",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"6b","name":"Kadachi Strikebow II","rarity":3,"endlineTag":"","attack":150,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["thunder_boost_2",null],["affinity_boost_1","6a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"6c","name":"Kadachi Strikebow III","rarity":5,"endlineTag":"","attack":180,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["thunder",21]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["thunder_boost_2",null],["attack_boost_1","6b"],["affinity_boost_1","6a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"6d","name":"Flying Kadachi Striker","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["thunder",23]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunder_boost_3",null],["affinity_boost_2","6c"],["thunder_boost_2","6c"],["attack_boost_1","6b"],["affinity_boost_1","6a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Barioth Tree",[{"id":"7a","name":"Ice Crest I","rarity":2,"endlineTag":"","attack":100,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[["ice",14]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["spread",2],["spread",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"7b","name":"Ice Crest II","rarity":3,"endlineTag":"","attack":120,"affinity":25,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["spread",2],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"7c","name":"Ice Crest III","rarity":5,"endlineTag":"","attack":180,"affinity":25,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",17]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","7b"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"7d","name":"Edelweiss","rarity":6,"endlineTag":"hr","attack":200,"affinity":30,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",19]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","7c"],["attack_boost_2","7b"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["rapid",3],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}}]],["Wroggi Tree",[{"id":"8a","name":"Wroggi Revolver I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["lasting_arc_shot",null],["buddy_rally",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":0,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}},{"id":"8b","name":"Wroggi Revolver II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["lasting_arc_shot",null],["buddy_rally",null],["affinity_boost_1","8a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["rapid",3],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":0,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}},{"id":"8c","name":"Hoodwinker\'s Revolver","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["lasting_arc_shot",null],["buddy_rally",null],["affinity_boost_1","8a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["rapid",3],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":0,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}}]],["Arzuros Tree",[{"id":"9a","name":"Arzuros Bow I","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["spread",2],["spread",1],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"9b","name":"Arzuros Bow II","rarity":2,"endlineTag":"","attack":140,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["small_monster_exploit",null],["attack_boost_1","9a"],["affinity_boost_2","1b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",4],["spread",3],["spread",1],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"9c","name":"Arzuros\' Honeypot","rarity":4,"endlineTag":"hr","attack":190,"affinity":0,"defense":15,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["lasting_arc_shot",null],["attack_boost_2","9b"],["defense_boost_1","9b"],["small_monster_exploit","9b"],["attack_boost_1","9a"],["affinity_boost_2","1b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",5],["spread",4],["spread",2],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}}]],["Ore Tree",[{"id":"10a","name":"Iron Bow I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",1],["pierce",2],["spread",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"10b","name":"Iron Bow II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",2],["pierce",2],["spread",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"10c","name":"Steel Bow","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",2],["pierce",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"10d","name":"Hunter\'s Stoutbow I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",2],["pierce",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"10e","name":"Hunter\'s Stoutbow II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",3],["pierce",3],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"10f","name":"Hunter\'s Proudbow","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",3],["pierce",4],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Ore Tree 2",[{"id":"11a","name":"Yekla Arc I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":5,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["master_rider",null],["defense_boost_3","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":4,"chargeShot":[["spread",2],["spread",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"11b","name":"Yekla Arc II","rarity":5,"endlineTag":"","attack":200,"affinity":0,"defense":8,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["master_rider",null],["defense_boost_3","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":4,"chargeShot":[["spread",2],["spread",3],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"11c","name":"Herald\'s Battlebow","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":10,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["master_rider",null],["affinity_boost_2","11b"],["defense_boost_3","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":4,"chargeShot":[["spread",3],["spread",3],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Ice Tree",[{"id":"12a","name":"Crystalline Flower I","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",40]],"rampSkills":[[["attack_boost_2",null],["ice_boost_1",null],["element_exploit",null],["defense_boost_2","10d"],["silkbind_boost","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",1],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"12b","name":"Crystalline Flower II","rarity":5,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",45]],"rampSkills":[[["attack_boost_3",null],["ice_boost_1",null],["element_exploit",null],["attack_boost_2","12a"],["defense_boost_2","10d"],["silkbind_boost","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"12c","name":"Heaven\'s Glaze","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",50]],"rampSkills":[[["attack_boost_3",null],["ice_boost_2",null],["element_exploit",null],["ice_boost_1","12b"],["attack_boost_2","12a"],["defense_boost_2","10d"],["silkbind_boost","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Almudron Tree",[{"id":"13a","name":"Mud Shot I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",27]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["defense_boost_2","10d"],["silkbind_boost","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":2,"chargeShot":[["spread",1],["spread",3],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"13b","name":"Mud Shot II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",29]],"rampSkills":[[["attack_boost_3",null],["water_boost_1",null],["element_exploit",null],["attack_boost_2","13a"],["defense_boost_2","10d"],["silkbind_boost","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":2,"chargeShot":[["spread",1],["spread",3],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"13c","name":"Hail of Mud","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",34]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["element_exploit",null],["water_boost_1","13b"],["attack_boost_2","13a"],["defense_boost_2","10d"],["silkbind_boost","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":2,"chargeShot":[["spread",1],["spread",4],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}}]],["Rathian Tree",[{"id":"14a","name":"Queen Blaster I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",13]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["small_monster_exploit",null],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"14b","name":"Queen Blaster II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",15]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["small_monster_exploit",null],["attack_boost_1","14a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"14c","name":"Queen\'s Melody","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",16]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["small_monster_exploit",null],["attack_boost_1","14a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["rapid",3],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Rathalos Tree",[{"id":"15a","name":"Prominence Bow I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",17]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["small_monster_exploit","14c"],["attack_boost_1","14a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",4],["rapid",3],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"15b","name":"Prominence Bow II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",21]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["small_monster_exploit","14c"],["attack_boost_1","14a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",4],["rapid",4],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"15c","name":"Dark Filament","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",23]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","15b"],["small_monster_exploit","14c"],["attack_boost_1","14a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",4],["rapid",4],["spread",4],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Kulu-Ya-Ku Tree",[{"id":"16a","name":"Kulu\'s Flight I","rarity":2,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["sleep_coating_boost",null],["spiribird_doubled",null],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["rapid",2],["rapid",2],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":0}}},{"id":"16b","name":"Kulu\'s Flight II","rarity":3,"endlineTag":"","attack":130,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["sleep_coating_boost",null],["spiribird_doubled",null],["attack_boost_1","16a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["rapid",2],["rapid",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":0}}},{"id":"16c","name":"Kulu Piercer","rarity":4,"endlineTag":"hr","attack":160,"affinity":30,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["sleep_coating_boost",null],["spiribird_doubled",null],["attack_boost_1","16a"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["rapid",3],["rapid",4],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":0}}}]],["Khezu Tree",[{"id":"17a","name":"Khezu Bow I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["spread",2],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":1,"blast_coating":0,"exhaust_coating":0}}},{"id":"17b","name":"Khezu Bow II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",21]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","17a"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["spread",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":1,"blast_coating":0,"exhaust_coating":0}}},{"id":"17c","name":"Galvanized Core","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",24]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_3","17b"],["thunder_boost_1","17b"],["attack_boost_2","17a"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["spread",4],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":1,"blast_coating":0,"exhaust_coating":0}}}]],["Bone Tree",[{"id":"18a","name":"Bone Gun I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",1],["spread",2],["rapid",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"18b","name":"Bone Gun II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",2],["spread",2],["rapid",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"18c","name":"Hyper Bone Gun","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",2],["spread",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"18d","name":"Hunter\'s Bow I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["poison_coating_boost",null],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["spread",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"18e","name":"Hunter\'s Bow II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["poison_coating_boost",null],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["spread",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"18f","name":"Master Hunter\'s Bow","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["poison_coating_boost",null],["attack_boost_3","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["spread",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}}]],["Tigrex Tree",[{"id":"19a","name":"Tigrex Archer I","rarity":3,"endlineTag":"","attack":160,"affinity":-25,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["affinity_boost_2","18d"],["poison_coating_boost","18d"],["defense_boost_1","18c"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"19b","name":"Tigrex Archer II","rarity":6,"endlineTag":"","attack":240,"affinity":-25,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","19a"],["poison_coating_boost","18d"],["defense_boost_1","18c"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["rapid",4],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"19c","name":"Tigrex Whisker","rarity":6,"endlineTag":"hr","attack":250,"affinity":-25,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","19b"],["affinity_boost_1","19a"],["poison_coating_boost","18d"],["defense_boost_1","18c"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["rapid",5],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}}]],["Diablos Tree",[{"id":"20a","name":"Diablos Coilbender I","rarity":6,"endlineTag":"","attack":230,"affinity":-20,"defense":10,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["lasting_arc_shot",null],["attack_boost_2","19a"],["brutal_strike","19a"],["affinity_boost_2","18d"],["poison_coating_boost","18d"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":4,"chargeShot":[["rapid",2],["rapid",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"20b","name":"Diablos Coilbender II","rarity":6,"endlineTag":"","attack":240,"affinity":-20,"defense":10,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["lasting_arc_shot",null],["affinity_boost_1","20a"],["attack_boost_2","19a"],["brutal_strike","19a"],["poison_coating_boost","18d"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":4,"chargeShot":[["rapid",2],["rapid",3],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"20c","name":"Tyrant Bow","rarity":7,"endlineTag":"hr","attack":250,"affinity":-20,"defense":15,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["lasting_arc_shot",null],["affinity_boost_2","20b"],["defense_boost_1","20b"],["affinity_boost_1","20a"],["attack_boost_2","19a"],["brutal_strike","19a"],["poison_coating_boost","18d"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":4,"chargeShot":[["rapid",2],["rapid",4],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}}]],["Zinogre Tree",[{"id":"21a","name":"Usurper\'s Rumble I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",14]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"21b","name":"Usurper\'s Rumble II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","21a"],["affinity_boost_2","18c"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"21c","name":"Despot\'s Earlybolt","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","21b"],["attack_boost_1","21a"],["affinity_boost_2","18c"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",4],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}}]],["Pukei-Pukei Tree",[{"id":"22a","name":"Pukei Bow I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["paralysis_coating_boost",null],["affinity_boost_2","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["pierce",1],["pierce",3],["pierce",2]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":1,"exhaust_coating":0}}},{"id":"22b","name":"Pukei Bow II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["paralysis_coating_boost",null],["attack_boost_2","22a"],["affinity_boost_2","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["pierce",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":1,"exhaust_coating":0}}},{"id":"22c","name":"Venomtongue Strike","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["paralysis_coating_boost",null],["defense_boost_1","22b"],["attack_boost_2","22a"],["affinity_boost_2","18c"],["affinity_boost_1","18b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",4],["pierce",3],["pierce",4],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":1,"exhaust_coating":0}}}]],["Anjanath Tree",[{"id":"23a","name":"Flammenbogen I","rarity":3,"endlineTag":"","attack":140,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["fire",5]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","22a"],["defense_boost_1","22a"],["paralysis_coating_boost","22a"],["affinity_boost_2","18c"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":0}}},{"id":"23b","name":"Flammenbogen II","rarity":5,"endlineTag":"","attack":220,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",7]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","23a"],["attack_boost_2","22a"],["defense_boost_1","22a"],["paralysis_coating_boost","22a"],["affinity_boost_2","18c"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":0}}},{"id":"23c","name":"Flaming Rage Bow","rarity":6,"endlineTag":"hr","attack":240,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",9]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","23b"],["fire_boost_2","23b"],["fire_boost_1","23a"],["attack_boost_2","22a"],["defense_boost_1","22a"],["paralysis_coating_boost","22a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["rapid",3],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":0}}}]],["Royal Ludroth Tree",[{"id":"24a","name":"Spongia Bow I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["pierce",1],["pierce",2],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"24b","name":"Spongia Bow II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",22]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["pierce",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"24c","name":"Spongia Bow III","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["water",24]],"rampSkills":[[["attack_boost_2",null],["water_boost_2",null],["waterblight_exploit",null],["water_boost_1","24b"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["pierce",3],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"24d","name":"Porifera Bow","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["water",26]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","24c"],["water_boost_1","24b"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["pierce",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}}]],["Baggi Tree",[{"id":"25a","name":"Baggi Bow I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["poison_coating_boost",null],["buddy_rally",null],["attack_boost_2","18a"],["defense_boost_1","18a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["spread",2],["rapid",2],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":2,"blast_coating":1,"exhaust_coating":1}}},{"id":"25b","name":"Baggi Bow II","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["poison_coating_boost",null],["buddy_rally",null],["affinity_boost_1","25a"],["attack_boost_2","18a"],["defense_boost_1","18a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",3],["rapid",3],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":2,"blast_coating":1,"exhaust_coating":1}}},{"id":"25c","name":"Hypnoshot","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["poison_coating_boost",null],["buddy_rally",null],["affinity_boost_1","25a"],["attack_boost_2","18a"],["defense_boost_1","18a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["spread",3],["rapid",4],["spread",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":2,"blast_coating":1,"exhaust_coating":1}}}]],["Bnahabra Tree",[{"id":"26a","name":"Arko Nulo I","rarity":1,"endlineTag":"","attack":80,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",1],["pierce",2],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"26b","name":"Arko Nulo II","rarity":2,"endlineTag":"","attack":110,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",2],["pierce",2],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"26c","name":"Arko Unu","rarity":3,"endlineTag":"","attack":140,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"26d","name":"Arko Nulo Black I","rarity":4,"endlineTag":"","attack":160,"affinity":15,"defense":0,"decoSlots":[1,1,1],"eleStat":[["dragon",19]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_1",null],["wyvern_exploit",null],["affinity_boost_1","26c"],["defense_boost_1","26c"],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"26e","name":"Arko Nulo Black II","rarity":5,"endlineTag":"","attack":170,"affinity":15,"defense":0,"decoSlots":[1,1,1],"eleStat":[["dragon",21]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_2",null],["wyvern_exploit",null],["dragon_boost_1","26d"],["affinity_boost_1","26c"],["defense_boost_1","26c"],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"26f","name":"Arko Unu Black","rarity":6,"endlineTag":"hr","attack":200,"affinity":20,"defense":0,"decoSlots":[1,1,1],"eleStat":[["dragon",24]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_2","26e"],["dragon_boost_1","26d"],["affinity_boost_1","26c"],["defense_boost_1","26c"],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["spread",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Bnahabra (Thunder)",[{"id":"27a","name":"Arko Nulo Yellow I","rarity":3,"endlineTag":"","attack":140,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",23]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["affinity_boost_1","26c"],["defense_boost_1","26c"],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",2],["pierce",3],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"27b","name":"Arko Nulo Yellow II","rarity":5,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[2],"eleStat":[["thunder",27]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["thunderblight_exploit",null],["thunder_boost_1","27a"],["affinity_boost_1","26c"],["defense_boost_1","26c"],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"27c","name":"Arko Unu Yellow","rarity":6,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[2],"eleStat":[["thunder",29]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_2","27b"],["thunder_boost_1","27a"],["affinity_boost_1","26c"],["defense_boost_1","26c"],["attack_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["spread",3],["pierce",4],["pierce",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Bnahabra (Fire)",[{"id":"28a","name":"Arko Nulo Red I","rarity":2,"endlineTag":"","attack":90,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","26a"],["defense_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"28b","name":"Arko Nulo Red II","rarity":3,"endlineTag":"","attack":130,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["fire",26]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["fireblight_exploit",null],["attack_boost_1","28a"],["affinity_boost_1","26a"],["defense_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"28c","name":"Arko Unu Red","rarity":4,"endlineTag":"hr","attack":140,"affinity":20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",28]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["fire_boost_1","28b"],["attack_boost_1","28a"],["affinity_boost_1","26a"],["defense_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["pierce",4],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Bnahabra (Ice)",[{"id":"29a","name":"Arko Nulo White I","rarity":1,"endlineTag":"","attack":80,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["iceblight_exploit",null],["affinity_boost_1","26a"],["defense_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",1],["spread",2],["pierce",2],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"29b","name":"Arko Nulo White II","rarity":3,"endlineTag":"","attack":140,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["ice",24]],"rampSkills":[[["attack_boost_2",null],["ice_boost_1",null],["iceblight_exploit",null],["attack_boost_1","29a"],["affinity_boost_1","26a"],["defense_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["pierce",3],["pierce",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"29c","name":"Arko Unu White","rarity":5,"endlineTag":"hr","attack":160,"affinity":10,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",26]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["iceblight_exploit",null],["ice_boost_1","29b"],["attack_boost_1","29a"],["affinity_boost_1","26a"],["defense_boost_1","26a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["spread",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Magnamalo Tree",[{"id":"30a","name":"Sinister Bow I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",14]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",4],["spread",3],["spread",3],["rapid",5]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"30b","name":"Sinister Bow II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",16]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","30a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",5],["spread",3],["spread",3],["rapid",5]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}},{"id":"30c","name":"Sinister Soulpiercer","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",19]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","30b"],["attack_boost_2","30a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",5],["spread",3],["spread",4],["rapid",5]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":1,"exhaust_coating":1}}}]],["Kelbi Tree",[{"id":"31a","name":"Kelbi Stingshot I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["lasting_arc_shot",null],["paralysis_coating_boost",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"31b","name":"Kelbi Stingshot II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["lasting_arc_shot",null],["paralysis_coating_boost",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}},{"id":"31c","name":"Kelbi Strongshot","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["lasting_arc_shot",null],["paralysis_coating_boost",null],["attack_boost_1","31b"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",3],["spread",3],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":2,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":1,"blast_coating":0,"exhaust_coating":1}}}]],["Rajang Tree",[{"id":"32a","name":"Beast Thunderbow I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["thunder",9]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["master_rider",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"32b","name":"Beast Thunderbow II","rarity":6,"endlineTag":"","attack":210,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["thunder",10]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["master_rider",null],["thunder_boost_1","32a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"32c","name":"Beastking Thunderbow","rarity":7,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["thunder",11]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["master_rider",null],["affinity_boost_1","32b"],["thunder_boost_1","32a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",3],["pierce",3],["pierce",4],["pierce",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Ibushi Tree",[{"id":"33a","name":"Azure Elder Bow I","rarity":5,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",10]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",2],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"33b","name":"Azure Elder Bow II","rarity":6,"endlineTag":"","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",13]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","33a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",1],["pierce",2],["rapid",4],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}},{"id":"33c","name":"Abyssal Gale Bow","rarity":7,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",15]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","33b"],["defense_boost_1","33a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",3],["rapid",4],["rapid",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":1}}}]],["Narwa Tree",[{"id":"34a","name":"Thunderbolt Bow I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",30]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["spread",2],["spread",3],["pierce",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":0}}},{"id":"34b","name":"Abyssal Storm Bow","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",35]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","34a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",3],["spread",4],["pierce",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":1,"sleep_coating":1,"blast_coating":1,"exhaust_coating":0}}}]],["Kushala Daora Tree",[{"id":"35a","name":"Gelosteel Bow I","rarity":6,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",30]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["pierce",3],["pierce",4],["pierce",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"35b","name":"Daora\'s Sagittarii","rarity":7,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["ice",37]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","35a"],["affinity_boost_2","35a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",3],["pierce",3],["pierce",5],["pierce",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Teostra Tree",[{"id":"36a","name":"Bow of Hope & Valor I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",27]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",3],["rapid",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":0}}},{"id":"36b","name":"Bow of Light & Courage","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",31]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","36a"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",4],["rapid",4],["rapid",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":1,"blast_coating":0,"exhaust_coating":0}}}]],["Chameleos Tree",[{"id":"37a","name":"Genie\'s Grimoire I","rarity":6,"endlineTag":"","attack":220,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["rapid",2],["spread",4],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"37b","name":"Demon\'s Guidance","rarity":7,"endlineTag":"hr","attack":230,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","37a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["rapid",2],["spread",4],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":1,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Valstrax Tree",[{"id":"38a","name":"Redwing Bow I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",36]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["spread",2],["spread",3],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"38b","name":"Reddnaught Drag\\u00e3o Arc","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",39]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["spread",3],["spread",4],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Speartuna Tree",[{"id":"39a","name":"Morsel Bowfish I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["master_rider",null],["anti_aquatic_species",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["spread",2],["spread",2],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}},{"id":"39b","name":"Morsel Bowfish II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["master_rider",null],["anti_aquatic_species",null],["affinity_boost_1","39a"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",2],["spread",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}},{"id":"39c","name":"Ample Bowfish","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["master_rider",null],["anti_aquatic_species",null],["affinity_boost_2","39b"],["affinity_boost_1","39a"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",2],["spread",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}}]],["Felyne Tree",[{"id":"40a","name":"Felyne Bow I","rarity":2,"endlineTag":"","attack":110,"affinity":-15,"defense":2,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["brutal_strike",null],["buddy_rally",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":4,"chargeShot":[["spread",1],["rapid",2],["spread",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"40b","name":"Felyne Bow II","rarity":3,"endlineTag":"","attack":140,"affinity":-15,"defense":9,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["brutal_strike",null],["buddy_rally",null],["attack_boost_1","40a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":4,"chargeShot":[["spread",2],["rapid",3],["spread",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"40c","name":"Felyne Trickbow","rarity":5,"endlineTag":"hr","attack":190,"affinity":-15,"defense":18,"decoSlots":[3,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["brutal_strike",null],["buddy_rally",null],["attack_boost_2","40b"],["attack_boost_1","40a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":4,"chargeShot":[["spread",2],["rapid",3],["spread",3],["rapid",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":0,"para_coating":2,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]],["Chaos Tree",[{"id":"41a","name":"Chaos Bow I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["lasting_arc_shot",null],["spiribird_doubled",null]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",2],["spread",3],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":2,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"41b","name":"Chaos Bow II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["lasting_arc_shot",null],["spiribird_doubled",null],["attack_boost_1","41a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",2],["spread",3],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":2,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"41c","name":"Chaotic Rapture","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["lasting_arc_shot",null],["spiribird_doubled",null],["attack_boost_1","41a"]]],"bowStats":{"arcShot":"brace","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",2],["spread",3],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":2,"para_coating":2,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}}]],["Edel Tree",[{"id":"42a","name":"Ivory Bow I","rarity":2,"endlineTag":"","attack":90,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["spiribird_doubled",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",2],["spread",3],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":2,"blast_coating":1,"exhaust_coating":1}}},{"id":"42b","name":"Ivory Bow II","rarity":3,"endlineTag":"","attack":140,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["spiribird_doubled",null],["defense_boost_1","42a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",3],["spread",3],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":2,"blast_coating":1,"exhaust_coating":1}}},{"id":"42c","name":"Frozen Bow","rarity":5,"endlineTag":"hr","attack":170,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["spiribird_doubled",null],["affinity_boost_1","42b"],["defense_boost_1","42a"]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["spread",3],["spread",4],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":2,"blast_coating":1,"exhaust_coating":1}}}]],["Spio Tree",[{"id":"43a","name":"Arachnid Bow I","rarity":2,"endlineTag":"","attack":90,"affinity":20,"defense":25,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["poison_coating_boost",null],["silkbind_boost",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",5],["pierce",4],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}},{"id":"43b","name":"Arachnid Bow II","rarity":4,"endlineTag":"","attack":150,"affinity":20,"defense":25,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["poison_coating_boost",null],["silkbind_boost",null],["defense_boost_1","43a"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",5],["pierce",4],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}},{"id":"43c","name":"Arachnid Silverstring","rarity":5,"endlineTag":"hr","attack":190,"affinity":20,"defense":25,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["poison_coating_boost",null],["silkbind_boost",null],["defense_boost_2","43b"],["defense_boost_1","43a"]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["pierce",2],["pierce",5],["pierce",4],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":1,"sleep_coating":2,"blast_coating":0,"exhaust_coating":0}}}]],["<TODO: Find out the name of this tree.>",[{"id":"44a","name":"Azure Era Wyrmbow I","rarity":6,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[3],"eleStat":[["water",15]],"rampSkills":[[["affinity_boost_4",null],["water_boost_4",null],["anti_aerial_species",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",2],["spread",3],["spread",4]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}},{"id":"44b","name":"Azure Era \\"Soaring Drag\\u00e3o\\"","rarity":7,"endlineTag":"hr","attack":190,"affinity":20,"defense":0,"decoSlots":[3],"eleStat":[["water",25]],"rampSkills":[[["affinity_boost_4",null],["water_boost_4",null],["anti_aerial_species",null]]],"bowStats":{"arcShot":"recovery","baseChargeLevelLimit":3,"chargeShot":[["spread",2],["spread",3],["spread",3],["spread",5]],"compatibleCoatings":{"close_range_coating":1,"power_coating":1,"poison_coating":1,"para_coating":0,"sleep_coating":1,"blast_coating":1,"exhaust_coating":1}}}]],["Rampage Tree",[{"id":"ra","name":"Rampage Bow I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]],[["use_power_coating",null],["use_poison_coating_1",null]],[["use_power_coating",null],["use_poison_coating_1",null]],[["arc_shot_recovery",null],["arc_shot_affinity",null],["arc_shot_anti_shock",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",1],["rapid",2],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"rb","name":"Rampage Bow II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null]],[["attack_surge",null],["firing_rapid",null],["firing_pierce",null],["firing_spread",null]],[["use_power_coating",null],["use_poison_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["use_power_coating",null],["use_poison_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["arc_shot_recovery",null],["arc_shot_affinity",null],["arc_shot_anti_shock",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",2],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"rc","name":"Rampage Bow III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null],["firing_rapid",null],["firing_pierce",null],["firing_spread",null]],[["use_power_coating",null],["use_poison_coating_1",null],["use_para_coating_1",null],["use_sleep_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["use_power_coating",null],["use_poison_coating_1",null],["use_para_coating_1",null],["use_sleep_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["arc_shot_recovery",null],["arc_shot_affinity",null],["arc_shot_anti_shock",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",1],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"rd","name":"Rampage Bow IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null],["firing_rapid",null],["firing_pierce",null],["firing_spread",null]],[["close_range_coating_boost",null],["use_power_coating",null],["use_poison_coating_1",null],["use_para_coating_1",null],["use_sleep_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["close_range_coating_boost",null],["use_power_coating",null],["use_poison_coating_1",null],["use_para_coating_1",null],["use_sleep_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["arc_shot_recovery",null],["arc_shot_affinity",null],["arc_shot_anti_shock",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"re","name":"Rampage Bow V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_1",null],["affinity_boost_3",null],["defense_boost_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["firing_rapid",null],["firing_pierce",null],["firing_spread",null],["firing_charge",null]],[["close_range_coating_boost",null],["use_power_coating",null],["use_poison_coating_1",null],["use_para_coating_1",null],["use_sleep_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["close_range_coating_boost",null],["use_power_coating",null],["use_poison_coating_1",null],["use_para_coating_1",null],["use_sleep_coating_1",null],["use_blast_coating",null],["use_exhaust_coating",null]],[["arc_shot_recovery",null],["arc_shot_affinity",null],["arc_shot_anti_shock",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}},{"id":"rf","name":"Rampage Bow S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_1",null],["affinity_boost_4",null],["defense_boost_3",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["blast_2",null],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["firing_rapid",null],["firing_pierce",null],["firing_spread",null],["firing_charge",null],["firing_swift",null]],[["close_range_coating_boost",null],["use_power_coating",null],["use_poison_coating_2",null],["use_para_coating_2",null],["use_sleep_coating_2",null],["use_blast_coating",null],["use_exhaust_coating",null],["use_poison_coating_1","re"],["use_para_coating_1","re"],["use_sleep_coating_1","re"]],[["close_range_coating_boost",null],["use_power_coating",null],["use_poison_coating_2",null],["use_para_coating_2",null],["use_sleep_coating_2",null],["use_blast_coating",null],["use_exhaust_coating",null],["use_poison_coating_1","re"],["use_para_coating_1","re"],["use_sleep_coating_1","re"]],[["arc_shot_recovery",null],["arc_shot_affinity",null],["arc_shot_anti_shock",null]]],"bowStats":{"arcShot":"affinity","baseChargeLevelLimit":3,"chargeShot":[["rapid",2],["rapid",2],["rapid",3],["rapid",3]],"compatibleCoatings":{"close_range_coating":1,"power_coating":0,"poison_coating":0,"para_coating":0,"sleep_coating":0,"blast_coating":0,"exhaust_coating":0}}}]]]}';
 
-export const bowsArray: Readonly<Bow[]> = [
-    __generated_bow__1a,
-    __generated_bow__1b,
-    __generated_bow__1c,
-    __generated_bow__1d,
-    __generated_bow__1e,
-    __generated_bow__1f,
-    __generated_bow__2a,
-    __generated_bow__2b,
-    __generated_bow__2c,
-    __generated_bow__3a,
-    __generated_bow__3b,
-    __generated_bow__3c,
-    __generated_bow__4a,
-    __generated_bow__4b,
-    __generated_bow__4c,
-    __generated_bow__5a,
-    __generated_bow__5b,
-    __generated_bow__5c,
-    __generated_bow__6a,
-    __generated_bow__6b,
-    __generated_bow__6c,
-    __generated_bow__6d,
-    __generated_bow__7a,
-    __generated_bow__7b,
-    __generated_bow__7c,
-    __generated_bow__7d,
-    __generated_bow__8a,
-    __generated_bow__8b,
-    __generated_bow__8c,
-    __generated_bow__9a,
-    __generated_bow__9b,
-    __generated_bow__9c,
-    __generated_bow__10a,
-    __generated_bow__10b,
-    __generated_bow__10c,
-    __generated_bow__10d,
-    __generated_bow__10e,
-    __generated_bow__10f,
-    __generated_bow__11a,
-    __generated_bow__11b,
-    __generated_bow__11c,
-    __generated_bow__12a,
-    __generated_bow__12b,
-    __generated_bow__12c,
-    __generated_bow__13a,
-    __generated_bow__13b,
-    __generated_bow__13c,
-    __generated_bow__14a,
-    __generated_bow__14b,
-    __generated_bow__14c,
-    __generated_bow__15a,
-    __generated_bow__15b,
-    __generated_bow__15c,
-    __generated_bow__16a,
-    __generated_bow__16b,
-    __generated_bow__16c,
-    __generated_bow__17a,
-    __generated_bow__17b,
-    __generated_bow__17c,
-    __generated_bow__18a,
-    __generated_bow__18b,
-    __generated_bow__18c,
-    __generated_bow__18d,
-    __generated_bow__18e,
-    __generated_bow__18f,
-    __generated_bow__19a,
-    __generated_bow__19b,
-    __generated_bow__19c,
-    __generated_bow__20a,
-    __generated_bow__20b,
-    __generated_bow__20c,
-    __generated_bow__21a,
-    __generated_bow__21b,
-    __generated_bow__21c,
-    __generated_bow__22a,
-    __generated_bow__22b,
-    __generated_bow__22c,
-    __generated_bow__23a,
-    __generated_bow__23b,
-    __generated_bow__23c,
-    __generated_bow__24a,
-    __generated_bow__24b,
-    __generated_bow__24c,
-    __generated_bow__24d,
-    __generated_bow__25a,
-    __generated_bow__25b,
-    __generated_bow__25c,
-    __generated_bow__26a,
-    __generated_bow__26b,
-    __generated_bow__26c,
-    __generated_bow__26d,
-    __generated_bow__26e,
-    __generated_bow__26f,
-    __generated_bow__27a,
-    __generated_bow__27b,
-    __generated_bow__27c,
-    __generated_bow__28a,
-    __generated_bow__28b,
-    __generated_bow__28c,
-    __generated_bow__29a,
-    __generated_bow__29b,
-    __generated_bow__29c,
-    __generated_bow__30a,
-    __generated_bow__30b,
-    __generated_bow__30c,
-    __generated_bow__31a,
-    __generated_bow__31b,
-    __generated_bow__31c,
-    __generated_bow__32a,
-    __generated_bow__32b,
-    __generated_bow__32c,
-    __generated_bow__33a,
-    __generated_bow__33b,
-    __generated_bow__33c,
-    __generated_bow__34a,
-    __generated_bow__34b,
-    __generated_bow__35a,
-    __generated_bow__35b,
-    __generated_bow__36a,
-    __generated_bow__36b,
-    __generated_bow__37a,
-    __generated_bow__37b,
-    __generated_bow__38a,
-    __generated_bow__38b,
-    __generated_bow__39a,
-    __generated_bow__39b,
-    __generated_bow__39c,
-    __generated_bow__40a,
-    __generated_bow__40b,
-    __generated_bow__40c,
-    __generated_bow__41a,
-    __generated_bow__41b,
-    __generated_bow__41c,
-    __generated_bow__42a,
-    __generated_bow__42b,
-    __generated_bow__42c,
-    __generated_bow__43a,
-    __generated_bow__43b,
-    __generated_bow__43c,
-    __generated_bow__44a,
-    __generated_bow__44b,
-    __generated_bow__ra,
-    __generated_bow__rb,
-    __generated_bow__rc,
-    __generated_bow__rd,
-    __generated_bow__re,
-    __generated_bow__rf,
-];
+export const bowsArray: Readonly<Bow[]> = loadWeaponPayload<Bow>(payload);
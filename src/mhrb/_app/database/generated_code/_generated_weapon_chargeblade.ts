@@ -36,5052 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type ChargeBlade,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__defense_grinder_1,
-    __generated_ramp__defense_grinder_2,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__phial_element,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__poison_boost_3,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_chargeblade__1a: ChargeBlade = {
-    category: "chargeblade",
-    id: "1a",
-
-    name: "Kamura C. Blade I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurac.bladei",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_chargeblade__1b: ChargeBlade = {
-    category: "chargeblade",
-    id: "1b",
-
-    name: "Kamura C. Blade II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurac.bladeii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_chargeblade__1c: ChargeBlade = {
-    category: "chargeblade",
-    id: "1c",
-
-    name: "Kamura C. Blade III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurac.bladeiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_chargeblade__1d: ChargeBlade = {
-    category: "chargeblade",
-    id: "1d",
-
-    name: "Kamura C. Blade IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurac.bladeiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_chargeblade__1e: ChargeBlade = {
-    category: "chargeblade",
-    id: "1e",
-
-    name: "Kamura C. Blade V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__1d],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1d],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurac.bladev",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_chargeblade__1f: ChargeBlade = {
-    category: "chargeblade",
-    id: "1f",
-
-    name: "Kamura Ninja C. Blade",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_chargeblade__1e],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__1d],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1d],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjac.blade",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_chargeblade__2a: ChargeBlade = {
-    category: "chargeblade",
-    id: "2a",
-
-    name: "Dear Lutemis I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [20, 90, 90, 50, 0, 0, 0],
-    maxSharpness:  [20, 90, 90, 100, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "dearlutemisi",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_chargeblade__2b: ChargeBlade = {
-    category: "chargeblade",
-    id: "2b",
-
-    name: "Dear Lutemis II",
-    treeName: "Rathian Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__2a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [20, 100, 60, 110, 10, 0, 0],
-    maxSharpness:  [20, 100, 60, 110, 60, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "dearlutemisii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_chargeblade__2c: ChargeBlade = {
-    category: "chargeblade",
-    id: "2c",
-
-    name: "Dear Lutemia",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_chargeblade__2b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__2a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [10, 110, 40, 120, 20, 0, 0],
-    maxSharpness:  [10, 110, 40, 120, 50, 20, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "dearlutemia",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_chargeblade__3a: ChargeBlade = {
-    category: "chargeblade",
-    id: "3a",
-
-    name: "Weissritter I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "weissritteri",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_chargeblade__3b: ChargeBlade = {
-    category: "chargeblade",
-    id: "3b",
-
-    name: "Weissritter II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 80, 70, 10, 0, 0],
-    maxSharpness:  [40, 50, 80, 70, 50, 10, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "weissritterii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_chargeblade__3c: ChargeBlade = {
-    category: "chargeblade",
-    id: "3c",
-
-    name: "Weissritter III",
-    treeName: "Barioth Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__3b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 80, 90, 40, 0, 0],
-    maxSharpness:  [40, 50, 80, 90, 70, 20, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "weissritteriii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_chargeblade__3d: ChargeBlade = {
-    category: "chargeblade",
-    id: "3d",
-
-    name: "Pavadira",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__3c],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__3b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 90, 60, 0, 0],
-    maxSharpness:  [50, 70, 80, 90, 70, 40, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "pavadira",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_chargeblade__4a: ChargeBlade = {
-    category: "chargeblade",
-    id: "4a",
-
-    name: "Usurper's Lightning I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__3a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__3a],
-            [__generated_ramp__iceblight_exploit, __generated_chargeblade__3a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 90, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 90, 100, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'slightningi",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_chargeblade__4b: ChargeBlade = {
-    category: "chargeblade",
-    id: "4b",
-
-    name: "Usurper's Lightning II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__4a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__3a],
-            [__generated_ramp__iceblight_exploit, __generated_chargeblade__3a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 70, 90, 30, 0, 0],
-    maxSharpness:  [70, 40, 70, 90, 80, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'slightningii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_chargeblade__4c: ChargeBlade = {
-    category: "chargeblade",
-    id: "4c",
-
-    name: "Despot's Thundergale",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_chargeblade__4b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__4a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__3a],
-            [__generated_ramp__iceblight_exploit, __generated_chargeblade__3a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__1c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 100, 40, 0, 0],
-    maxSharpness:  [70, 40, 100, 100, 50, 40, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "despot'sthundergale",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_chargeblade__5a: ChargeBlade = {
-    category: "chargeblade",
-    id: "5a",
-
-    name: "Shovedown Blade I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 80, 70, 20, 0, 0, 0],
-    maxSharpness:  [30, 80, 70, 70, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "shovedownbladei",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_chargeblade__5b: ChargeBlade = {
-    category: "chargeblade",
-    id: "5b",
-
-    name: "Shovedown Blade II",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 60, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 100, 10, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "shovedownbladeii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_chargeblade__5c: ChargeBlade = {
-    category: "chargeblade",
-    id: "5c",
-
-    name: "Spinning Takedown",
-    treeName: "Tetranadon Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_2, __generated_chargeblade__5b],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 110, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 110, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "spinningtakedown",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_chargeblade__6a: ChargeBlade = {
-    category: "chargeblade",
-    id: "6a",
-
-    name: "Giga Grips I",
-    treeName: "Basarios Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 150, 40, 30, 0, 0, 0],
-    maxSharpness:  [30, 150, 40, 80, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "gigagripsi",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_chargeblade__6b: ChargeBlade = {
-    category: "chargeblade",
-    id: "6b",
-
-    name: "Giga Grips II",
-    treeName: "Basarios Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [20, 140, 40, 50, 0, 0, 0],
-    maxSharpness:  [20, 140, 40, 80, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "gigagripsii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_chargeblade__6c: ChargeBlade = {
-    category: "chargeblade",
-    id: "6c",
-
-    name: "Giga Grips III",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__6b],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__6b],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [10, 140, 50, 80, 20, 0, 0],
-    maxSharpness:  [10, 140, 50, 80, 50, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "gigagripsiii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_chargeblade__6d: ChargeBlade = {
-    category: "chargeblade",
-    id: "6d",
-
-    name: "Titan's Vise",
-    treeName: "Basarios Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__poison_boost_2, __generated_chargeblade__6c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__6b],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__6b],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [10, 140, 40, 80, 30, 0, 0],
-    maxSharpness:  [10, 140, 40, 80, 50, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "titan'svise",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_chargeblade__7a: ChargeBlade = {
-    category: "chargeblade",
-    id: "7a",
-
-    name: "Surprise Axe I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__6a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 30, 90, 40, 0, 0, 0],
-    maxSharpness:  [90, 30, 90, 80, 10, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "surpriseaxei",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_chargeblade__7b: ChargeBlade = {
-    category: "chargeblade",
-    id: "7b",
-
-    name: "Surprise Axe II",
-    treeName: "Goss Harag Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_chargeblade__7a],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__6a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 110, 40, 20, 0, 0],
-    maxSharpness:  [90, 40, 110, 40, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "surpriseaxeii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_chargeblade__7c: ChargeBlade = {
-    category: "chargeblade",
-    id: "7c",
-
-    name: "Stunning Axe",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_2, __generated_chargeblade__7b],
-            [__generated_ramp__ice_boost_1, __generated_chargeblade__7a],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__6a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__6a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__5a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__1b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 100, 40, 30, 0, 0],
-    maxSharpness:  [90, 40, 100, 40, 70, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "stunningaxe",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_chargeblade__8a: ChargeBlade = {
-    category: "chargeblade",
-    id: "8a",
-
-    name: "Hyperguard I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "hyperguardi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_chargeblade__8b: ChargeBlade = {
-    category: "chargeblade",
-    id: "8b",
-
-    name: "Hyperguard II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 110, 10, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "hyperguardii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_chargeblade__8c: ChargeBlade = {
-    category: "chargeblade",
-    id: "8c",
-
-    name: "Regas Hyper",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 60, 30, 0, 0, 0],
-    maxSharpness:  [80, 80, 60, 80, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "regashyper",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_chargeblade__8d: ChargeBlade = {
-    category: "chargeblade",
-    id: "8d",
-
-    name: "Elite Blade I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "elitebladei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_chargeblade__8e: ChargeBlade = {
-    category: "chargeblade",
-    id: "8e",
-
-    name: "Elite Blade II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 50, 50, 20, 0, 0],
-    maxSharpness:  [90, 90, 50, 50, 50, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "elitebladeii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_chargeblade__8f: ChargeBlade = {
-    category: "chargeblade",
-    id: "8f",
-
-    name: "Kaiser Blade",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__8e],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 40, 50, 30, 0, 0],
-    maxSharpness:  [90, 90, 40, 50, 50, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kaiserblade",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_chargeblade__9a: ChargeBlade = {
-    category: "chargeblade",
-    id: "9a",
-
-    name: "K. Captain's Blade I",
-    treeName: "Thunder Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__silkbind_boost, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 60, 50, 10, 0, 0],
-    maxSharpness:  [110, 70, 60, 50, 60, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "k.captain'sbladei",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_chargeblade__9b: ChargeBlade = {
-    category: "chargeblade",
-    id: "9b",
-
-    name: "K. Captain's Blade II",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__9a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__silkbind_boost, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [100, 70, 50, 50, 70, 10, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "k.captain'sbladeii",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_chargeblade__9c: ChargeBlade = {
-    category: "chargeblade",
-    id: "9c",
-
-    name: "Die Walk\u00fcre",
-    treeName: "Thunder Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__9b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__9a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__silkbind_boost, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 70, 60, 40, 0, 0],
-    maxSharpness:  [100, 80, 70, 60, 70, 20, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "diewalk\u00fcre",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_chargeblade__10a: ChargeBlade = {
-    category: "chargeblade",
-    id: "10a",
-
-    name: "Biting Edge I",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__9b],
-            [__generated_ramp__thunder_boost_1, __generated_chargeblade__9b],
-            [__generated_ramp__thunderblight_exploit, __generated_chargeblade__9b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__9a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-        ],
-    ],
-
-    baseSharpness: [200, 40, 40, 30, 40, 0, 0],
-    maxSharpness:  [200, 40, 40, 30, 40, 50, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bitingedgei",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_chargeblade__10b: ChargeBlade = {
-    category: "chargeblade",
-    id: "10b",
-
-    name: "Biting Edge II",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__fire_boost_1, __generated_chargeblade__10a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__9b],
-            [__generated_ramp__thunder_boost_1, __generated_chargeblade__9b],
-            [__generated_ramp__thunderblight_exploit, __generated_chargeblade__9b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__9a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-        ],
-    ],
-
-    baseSharpness: [200, 40, 40, 30, 30, 10, 0],
-    maxSharpness:  [200, 40, 40, 30, 30, 60, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bitingedgeii",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_chargeblade__10c: ChargeBlade = {
-    category: "chargeblade",
-    id: "10c",
-
-    name: "Araknablade",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__10b],
-            [__generated_ramp__fire_boost_1, __generated_chargeblade__10a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__9b],
-            [__generated_ramp__thunder_boost_1, __generated_chargeblade__9b],
-            [__generated_ramp__thunderblight_exploit, __generated_chargeblade__9b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__9a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__8c],
-        ],
-    ],
-
-    baseSharpness: [200, 30, 40, 30, 30, 20, 0],
-    maxSharpness:  [200, 30, 40, 30, 30, 70, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "araknablade",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_chargeblade__11a: ChargeBlade = {
-    category: "chargeblade",
-    id: "11a",
-
-    name: "Tigrex Divide I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__silkbind_boost, __generated_chargeblade__8d],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexdividei",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_chargeblade__11b: ChargeBlade = {
-    category: "chargeblade",
-    id: "11b",
-
-    name: "Tigrex Divide II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__11a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__silkbind_boost, __generated_chargeblade__8d],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 60, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexdivideii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_chargeblade__11c: ChargeBlade = {
-    category: "chargeblade",
-    id: "11c",
-
-    name: "Tigrex Blade",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__11b],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__11a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8d],
-            [__generated_ramp__silkbind_boost, __generated_chargeblade__8d],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 50, 20, 0],
-    maxSharpness:  [50, 40, 120, 120, 50, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexblade",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_chargeblade__12a: ChargeBlade = {
-    category: "chargeblade",
-    id: "12a",
-
-    name: "Mizuniya Drill I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8c],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [110, 40, 30, 70, 0, 0, 0],
-    maxSharpness:  [110, 40, 30, 90, 30, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "mizuniyadrilli",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_chargeblade__12b: ChargeBlade = {
-    category: "chargeblade",
-    id: "12b",
-
-    name: "Mizuniya Drill II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__12a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__12a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8c],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [110, 90, 70, 50, 30, 0, 0],
-    maxSharpness:  [110, 90, 70, 50, 60, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "mizuniyadrillii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_chargeblade__12c: ChargeBlade = {
-    category: "chargeblade",
-    id: "12c",
-
-    name: "Final Fieldblade",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__12b],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__12a],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__12a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8c],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 70, 50, 50, 0, 0],
-    maxSharpness:  [110, 70, 70, 50, 50, 50, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "finalfieldblade",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_chargeblade__13a: ChargeBlade = {
-    category: "chargeblade",
-    id: "13a",
-
-    name: "Kadachi Slasher I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [130, 30, 50, 40, 0, 0, 0],
-    maxSharpness:  [130, 30, 50, 90, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kadachislasheri",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_chargeblade__13b: ChargeBlade = {
-    category: "chargeblade",
-    id: "13b",
-
-    name: "Kadachi Slasher II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__13a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [110, 40, 50, 50, 0, 0, 0],
-    maxSharpness:  [110, 40, 50, 50, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kadachislasherii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_chargeblade__13c: ChargeBlade = {
-    category: "chargeblade",
-    id: "13c",
-
-    name: "Kadachi Otenta",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__13b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__13b],
-            [__generated_ramp__thunder_boost_2, __generated_chargeblade__13b],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__13a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8b],
-        ],
-    ],
-
-    baseSharpness: [120, 80, 30, 30, 40, 0, 0],
-    maxSharpness:  [120, 80, 30, 30, 60, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "kadachiotenta",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_chargeblade__14a: ChargeBlade = {
-    category: "chargeblade",
-    id: "14a",
-
-    name: "Wind Thief Sickle I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8a],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 50, 40, 0, 0, 0],
-    maxSharpness:  [70, 40, 50, 90, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefsicklei",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_chargeblade__14b: ChargeBlade = {
-    category: "chargeblade",
-    id: "14b",
-
-    name: "Wind Thief Sickle II",
-    treeName: "Izuchi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__14a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8a],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 40, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 40, 50, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefsickleii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_chargeblade__14c: ChargeBlade = {
-    category: "chargeblade",
-    id: "14c",
-
-    name: "Gale Sickle",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__14b],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__14a],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 50, 50, 50, 0, 0],
-    maxSharpness:  [100, 50, 50, 50, 50, 50, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "galesickle",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_chargeblade__15a: ChargeBlade = {
-    category: "chargeblade",
-    id: "15a",
-
-    name: "Hidden Arsenal I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__14b],
-            [__generated_ramp__small_monster_exploit, __generated_chargeblade__14b],
-            [__generated_ramp__buddy_rally, __generated_chargeblade__14b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenarsenali",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_chargeblade__15b: ChargeBlade = {
-    category: "chargeblade",
-    id: "15b",
-
-    name: "Hidden Arsenal II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__15a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__14b],
-            [__generated_ramp__small_monster_exploit, __generated_chargeblade__14b],
-            [__generated_ramp__buddy_rally, __generated_chargeblade__14b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8a],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 40, 120, 50, 0, 0],
-    maxSharpness:  [70, 70, 40, 120, 80, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenarsenalii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_chargeblade__15c: ChargeBlade = {
-    category: "chargeblade",
-    id: "15c",
-
-    name: "Scream in the Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_grinder_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__15b],
-            [__generated_ramp__defense_grinder_1, __generated_chargeblade__15b],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__15a],
-            [__generated_ramp__small_monster_exploit, __generated_chargeblade__14b],
-            [__generated_ramp__buddy_rally, __generated_chargeblade__14b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__8a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__8a],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 90, 80, 20, 0],
-    maxSharpness:  [70, 40, 100, 90, 80, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "screaminthenight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_chargeblade__16a: ChargeBlade = {
-    category: "chargeblade",
-    id: "16a",
-
-    name: "Bone Strongarm I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bonestrongarmi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_chargeblade__16b: ChargeBlade = {
-    category: "chargeblade",
-    id: "16b",
-
-    name: "Bone Strongarm II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bonestrongarmii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_chargeblade__16c: ChargeBlade = {
-    category: "chargeblade",
-    id: "16c",
-
-    name: "Hard Bone Strongarm",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 0, 0, 0, 0],
-    maxSharpness:  [90, 50, 110, 0, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "hardbonestrongarm",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_chargeblade__16d: ChargeBlade = {
-    category: "chargeblade",
-    id: "16d",
-
-    name: "Bone Blade I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 70, 20, 0, 0, 0],
-    maxSharpness:  [70, 90, 70, 70, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bonebladei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_chargeblade__16e: ChargeBlade = {
-    category: "chargeblade",
-    id: "16e",
-
-    name: "Bone Blade II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16d],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bonebladeii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_chargeblade__16f: ChargeBlade = {
-    category: "chargeblade",
-    id: "16f",
-
-    name: "Bonesilt Veil",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__16e],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16d],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 100, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bonesiltveil",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_chargeblade__17a: ChargeBlade = {
-    category: "chargeblade",
-    id: "17a",
-
-    name: "Jyura Silt I",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__16e],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16e],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__16e],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16d],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 50, 50, 20, 0, 0],
-    maxSharpness:  [90, 90, 50, 50, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "jyurasilti",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_chargeblade__17b: ChargeBlade = {
-    category: "chargeblade",
-    id: "17b",
-
-    name: "Jyura Silt II",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__17a],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__16e],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16e],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__16e],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16d],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-        ],
-    ],
-
-    baseSharpness: [110, 110, 50, 50, 30, 0, 0],
-    maxSharpness:  [110, 110, 50, 50, 70, 10, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "jyurasiltii",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_chargeblade__17c: ChargeBlade = {
-    category: "chargeblade",
-    id: "17c",
-
-    name: "Clutch of the Deep",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__17b],
-            [__generated_ramp__water_boost_1, __generated_chargeblade__17a],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__16e],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__16e],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16d],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-        ],
-    ],
-
-    baseSharpness: [120, 120, 30, 30, 50, 0, 0],
-    maxSharpness:  [120, 120, 30, 30, 80, 20, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "clutchofthedeep",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_chargeblade__18a: ChargeBlade = {
-    category: "chargeblade",
-    id: "18a",
-
-    name: "Axelion Blade I",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [30, 100, 80, 40, 0, 0, 0],
-    maxSharpness:  [30, 100, 80, 80, 10, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "axelionbladei",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_chargeblade__18b: ChargeBlade = {
-    category: "chargeblade",
-    id: "18b",
-
-    name: "Axelion Blade II",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 110, 60, 20, 0, 0],
-    maxSharpness:  [90, 70, 110, 60, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "axelionbladeii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_chargeblade__18c: ChargeBlade = {
-    category: "chargeblade",
-    id: "18c",
-
-    name: "Bardichion Blade",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__18b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 130, 60, 30, 0, 0],
-    maxSharpness:  [90, 40, 130, 60, 50, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bardichionblade",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_chargeblade__19a: ChargeBlade = {
-    category: "chargeblade",
-    id: "19a",
-
-    name: "Bellowing Blow I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 70, 30, 0, 0, 0],
-    maxSharpness:  [80, 70, 70, 80, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bellowingblowi",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_chargeblade__19b: ChargeBlade = {
-    category: "chargeblade",
-    id: "19b",
-
-    name: "Bellowing Blow II",
-    treeName: "Somnacanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__19a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 90, 50, 0, 0, 0],
-    maxSharpness:  [60, 50, 90, 80, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "bellowingblowii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_chargeblade__19c: ChargeBlade = {
-    category: "chargeblade",
-    id: "19c",
-
-    name: "Illusory Frilled Wail",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__19b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__19a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__16c],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16c],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 150, 90, 0, 0, 0],
-    maxSharpness:  [60, 50, 150, 100, 40, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "illusoryfrilledwail",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_chargeblade__20a: ChargeBlade = {
-    category: "chargeblade",
-    id: "20a",
-
-    name: "Poisonous Veil I",
-    treeName: "Poison Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 40, 30, 0, 0, 0],
-    maxSharpness:  [100, 30, 40, 80, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "poisonousveili",
-        treeNameLower: "poisontree",
-    },
-};
-
-const __generated_chargeblade__20b: ChargeBlade = {
-    category: "chargeblade",
-    id: "20b",
-
-    name: "Poisonous Veil II",
-    treeName: "Poison Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [150, 70, 40, 40, 0, 0, 0],
-    maxSharpness:  [150, 70, 40, 40, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "poisonousveilii",
-        treeNameLower: "poisontree",
-    },
-};
-
-const __generated_chargeblade__20c: ChargeBlade = {
-    category: "chargeblade",
-    id: "20c",
-
-    name: "Infected Veil",
-    treeName: "Poison Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__20b],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [170, 70, 40, 60, 10, 0, 0],
-    maxSharpness:  [170, 70, 40, 60, 50, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "infectedveil",
-        treeNameLower: "poisontree",
-    },
-};
-
-const __generated_chargeblade__21a: ChargeBlade = {
-    category: "chargeblade",
-    id: "21a",
-
-    name: "Dragão Veil I",
-    treeName: "Dragão Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__20a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [150, 70, 40, 40, 0, 0, 0],
-    maxSharpness:  [150, 70, 40, 40, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "dragonveili",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_chargeblade__21b: ChargeBlade = {
-    category: "chargeblade",
-    id: "21b",
-
-    name: "Dragão Veil II",
-    treeName: "Dragão Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__21a],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__20a],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 40, 50, 0, 0, 0],
-    maxSharpness:  [160, 50, 40, 50, 50, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "dragonveilii",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_chargeblade__21c: ChargeBlade = {
-    category: "chargeblade",
-    id: "21c",
-
-    name: "Dragãosong",
-    treeName: "Dragão Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__21b],
-            [__generated_ramp__dragon_boost_1, __generated_chargeblade__21b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__21a],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__poison_boost_1, __generated_chargeblade__20a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__20a],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [170, 30, 40, 60, 0, 0, 0],
-    maxSharpness:  [170, 30, 40, 60, 40, 10, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "dragonsong",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_chargeblade__22a: ChargeBlade = {
-    category: "chargeblade",
-    id: "22a",
-
-    name: "Barroth Anchor I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 140, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 140, 50, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "barrothanchori",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_chargeblade__22b: ChargeBlade = {
-    category: "chargeblade",
-    id: "22b",
-
-    name: "Barroth Anchor II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__22a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 160, 20, 0, 0, 0],
-    maxSharpness:  [60, 60, 160, 60, 10, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "barrothanchorii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_chargeblade__22c: ChargeBlade = {
-    category: "chargeblade",
-    id: "22c",
-
-    name: "Rugged Anchor",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__22b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__22a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 160, 70, 0, 0, 0],
-    maxSharpness:  [60, 60, 160, 70, 30, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "ruggedanchor",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_chargeblade__23a: ChargeBlade = {
-    category: "chargeblade",
-    id: "23a",
-
-    name: "Diablos Strongarm I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -30,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__22c],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__22c],
-            [__generated_ramp__brutal_strike, __generated_chargeblade__22c],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 30, 100, 10, 0, 0],
-    maxSharpness:  [50, 160, 30, 100, 50, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "diablosstrongarmi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_chargeblade__23b: ChargeBlade = {
-    category: "chargeblade",
-    id: "23b",
-
-    name: "Diablos Strongarm II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -30,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__23a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__23a],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__22c],
-            [__generated_ramp__brutal_strike, __generated_chargeblade__22c],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 20, 100, 20, 0, 0],
-    maxSharpness:  [50, 160, 20, 100, 60, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "diablosstrongarmii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_chargeblade__23c: ChargeBlade = {
-    category: "chargeblade",
-    id: "23c",
-
-    name: "Cera Strongarm",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: -30,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_2, null],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__23b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__23b],
-            [__generated_ramp__defense_grinder_1, __generated_chargeblade__23b],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__23a],
-            [__generated_ramp__dulling_strike, __generated_chargeblade__23a],
-            [__generated_ramp__brutal_strike, __generated_chargeblade__22c],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 10, 100, 30, 0, 0],
-    maxSharpness:  [50, 160, 10, 100, 50, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "cerastrongarm",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_chargeblade__24a: ChargeBlade = {
-    category: "chargeblade",
-    id: "24a",
-
-    name: "Rough Roller I",
-    treeName: "Volvidon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__22a],
-            [__generated_ramp__brutal_strike, __generated_chargeblade__22a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 70, 40, 0, 0, 0],
-    maxSharpness:  [100, 40, 70, 90, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "roughrolleri",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_chargeblade__24b: ChargeBlade = {
-    category: "chargeblade",
-    id: "24b",
-
-    name: "Rough Roller II",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__24a],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__22a],
-            [__generated_ramp__brutal_strike, __generated_chargeblade__22a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 70, 60, 20, 0, 0],
-    maxSharpness:  [100, 50, 70, 60, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "roughrollerii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_chargeblade__24c: ChargeBlade = {
-    category: "chargeblade",
-    id: "24c",
-
-    name: "Rotaxion",
-    treeName: "Volvidon Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__24b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__24a],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__22a],
-            [__generated_ramp__brutal_strike, __generated_chargeblade__22a],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__16b],
-        ],
-    ],
-
-    baseSharpness: [110, 60, 70, 70, 40, 0, 0],
-    maxSharpness:  [110, 60, 70, 70, 90, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "rotaxion",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_chargeblade__25a: ChargeBlade = {
-    category: "chargeblade",
-    id: "25a",
-
-    name: "Sinister Slasher I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterslasheri",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_chargeblade__25b: ChargeBlade = {
-    category: "chargeblade",
-    id: "25b",
-
-    name: "Sinister Slasher II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__25a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterslasherii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_chargeblade__25c: ChargeBlade = {
-    category: "chargeblade",
-    id: "25c",
-
-    name: "Sinister Shade Axe",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_chargeblade__25b],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__25a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "sinistershadeaxe",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_chargeblade__26a: ChargeBlade = {
-    category: "chargeblade",
-    id: "26a",
-
-    name: "Undying Blade I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 120, 10, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "undyingbladei",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_chargeblade__26b: ChargeBlade = {
-    category: "chargeblade",
-    id: "26b",
-
-    name: "Undying Blade II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_chargeblade__26a],
-        ],
-    ],
-
-    baseSharpness: [20, 40, 100, 90, 0, 0, 0],
-    maxSharpness:  [20, 40, 100, 110, 30, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "undyingbladeii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_chargeblade__26c: ChargeBlade = {
-    category: "chargeblade",
-    id: "26c",
-
-    name: "Ikaji Immortal",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__26b],
-            [__generated_ramp__thunder_boost_1, __generated_chargeblade__26a],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 100, 0, 0, 0],
-    maxSharpness:  [50, 60, 90, 100, 40, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "ikajiimmortal",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_chargeblade__27a: ChargeBlade = {
-    category: "chargeblade",
-    id: "27a",
-
-    name: "Azure Elder Blade I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 6]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderbladei",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_chargeblade__27b: ChargeBlade = {
-    category: "chargeblade",
-    id: "27b",
-
-    name: "Azure Elder Blade II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__27a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderbladeii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_chargeblade__27c: ChargeBlade = {
-    category: "chargeblade",
-    id: "27c",
-
-    name: "Abyssal Gale Ward",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_chargeblade__27b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__27a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgaleward",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_chargeblade__28a: ChargeBlade = {
-    category: "chargeblade",
-    id: "28a",
-
-    name: "Thunderbolt Sawtooth I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltsawtoothi",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_chargeblade__28b: ChargeBlade = {
-    category: "chargeblade",
-    id: "28b",
-
-    name: "Abyssal Storm Ward",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__28a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormward",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_chargeblade__29a: ChargeBlade = {
-    category: "chargeblade",
-    id: "29a",
-
-    name: "Daora's Casca I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 90, 50, 0, 0],
-    maxSharpness:  [70, 40, 100, 90, 70, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "daora'scascai",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_chargeblade__29b: ChargeBlade = {
-    category: "chargeblade",
-    id: "29b",
-
-    name: "Daora's Thwartoise",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__29a],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__29a],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 70, 40, 50, 10, 0],
-    maxSharpness:  [80, 100, 70, 40, 50, 60, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sthwartoise",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_chargeblade__30a: ChargeBlade = {
-    category: "chargeblade",
-    id: "30a",
-
-    name: "Teostra's Striker I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 70, 80, 30, 0, 0],
-    maxSharpness:  [150, 20, 70, 80, 50, 30, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sstrikeri",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_chargeblade__30b: ChargeBlade = {
-    category: "chargeblade",
-    id: "30b",
-
-    name: "Teostra's Nova",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 43]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__30a],
-        ],
-    ],
-
-    baseSharpness: [160, 40, 30, 80, 40, 0, 0],
-    maxSharpness:  [160, 40, 30, 80, 50, 40, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'snova",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_chargeblade__31a: ChargeBlade = {
-    category: "chargeblade",
-    id: "31a",
-
-    name: "Arcane Draw I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [40, 80, 110, 70, 50, 0, 0],
-    maxSharpness:  [40, 80, 110, 70, 60, 40, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "arcanedrawi",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_chargeblade__31b: ChargeBlade = {
-    category: "chargeblade",
-    id: "31b",
-
-    name: "Etherward",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 39]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__31a],
-        ],
-    ],
-
-    baseSharpness: [40, 80, 110, 60, 60, 0, 0],
-    maxSharpness:  [40, 80, 110, 60, 60, 50, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "etherward",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_chargeblade__32a: ChargeBlade = {
-    category: "chargeblade",
-    id: "32a",
-
-    name: "Redwing Edge I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "redwingedgei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_chargeblade__32b: ChargeBlade = {
-    category: "chargeblade",
-    id: "32b",
-
-    name: "Skaltecore",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "skaltecore",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_chargeblade__33a: ChargeBlade = {
-    category: "chargeblade",
-    id: "33a",
-
-    name: "Ricebane I",
-    treeName: "Smithy Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__defense_grinder_1, null],
-        ],
-    ],
-
-    baseSharpness: [120, 70, 60, 0, 0, 0, 0],
-    maxSharpness:  [120, 70, 60, 50, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "ricebanei",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_chargeblade__33b: ChargeBlade = {
-    category: "chargeblade",
-    id: "33b",
-
-    name: "Ricebane II",
-    treeName: "Smithy Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_2, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__33a],
-            [__generated_ramp__defense_grinder_1, __generated_chargeblade__33a],
-        ],
-    ],
-
-    baseSharpness: [160, 70, 60, 10, 0, 0, 0],
-    maxSharpness:  [160, 70, 60, 60, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "ricebaneii",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_chargeblade__33c: ChargeBlade = {
-    category: "chargeblade",
-    id: "33c",
-
-    name: "Pounder of Rice",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__defense_grinder_2, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__33b],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__33b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__33a],
-            [__generated_ramp__defense_grinder_1, __generated_chargeblade__33a],
-        ],
-    ],
-
-    baseSharpness: [160, 60, 50, 30, 0, 0, 0],
-    maxSharpness:  [160, 60, 50, 40, 40, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "pounderofrice",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_chargeblade__34a: ChargeBlade = {
-    category: "chargeblade",
-    id: "34a",
-
-    name: "Cuddly Cat I",
-    treeName: "Felyne Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 100, 30, 10, 0, 0, 0],
-    maxSharpness:  [60, 100, 30, 60, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "cuddlycati",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_chargeblade__34b: ChargeBlade = {
-    category: "chargeblade",
-    id: "34b",
-
-    name: "Cuddly Cat II",
-    treeName: "Felyne Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__34a],
-        ],
-    ],
-
-    baseSharpness: [70, 100, 50, 30, 0, 0, 0],
-    maxSharpness:  [70, 100, 50, 80, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "cuddlycatii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_chargeblade__34c: ChargeBlade = {
-    category: "chargeblade",
-    id: "34c",
-
-    name: "Felyne Fancy",
-    treeName: "Felyne Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__34b],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__34b],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__34a],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 60, 40, 20, 0, 0],
-    maxSharpness:  [80, 100, 60, 40, 60, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "felynefancy",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_chargeblade__35a: ChargeBlade = {
-    category: "chargeblade",
-    id: "35a",
-
-    name: "Mandible Blade I",
-    treeName: "Aelucanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 40, 70, 0, 0, 0],
-    maxSharpness:  [50, 90, 40, 100, 20, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "mandiblebladei",
-        treeNameLower: "aelucanthtree",
-    },
-};
-
-const __generated_chargeblade__35b: ChargeBlade = {
-    category: "chargeblade",
-    id: "35b",
-
-    name: "Mandible Blade II",
-    treeName: "Aelucanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__35a],
-        ],
-    ],
-
-    baseSharpness: [30, 110, 30, 70, 10, 0, 0],
-    maxSharpness:  [30, 110, 30, 70, 60, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "mandiblebladeii",
-        treeNameLower: "aelucanthtree",
-    },
-};
-
-const __generated_chargeblade__35c: ChargeBlade = {
-    category: "chargeblade",
-    id: "35c",
-
-    name: "Maxilla Edge",
-    treeName: "Aelucanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__35b],
-            [__generated_ramp__dragon_boost_2, __generated_chargeblade__35b],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__35a],
-        ],
-    ],
-
-    baseSharpness: [30, 150, 30, 80, 60, 0, 0],
-    maxSharpness:  [30, 150, 30, 80, 90, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "maxillaedge",
-        treeNameLower: "aelucanthtree",
-    },
-};
-
-const __generated_chargeblade__36a: ChargeBlade = {
-    category: "chargeblade",
-    id: "36a",
-
-    name: "Vaik Veil I",
-    treeName: "Vaik Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 70, 30, 0, 0, 0],
-    maxSharpness:  [60, 90, 70, 50, 30, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "vaikveili",
-        treeNameLower: "vaiktree",
-    },
-};
-
-const __generated_chargeblade__36b: ChargeBlade = {
-    category: "chargeblade",
-    id: "36b",
-
-    name: "Vaik Veil II",
-    treeName: "Vaik Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__36a],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 50, 0, 0, 0],
-    maxSharpness:  [50, 90, 60, 60, 40, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "vaikveilii",
-        treeNameLower: "vaiktree",
-    },
-};
-
-const __generated_chargeblade__36c: ChargeBlade = {
-    category: "chargeblade",
-    id: "36c",
-
-    name: "Shieldraad",
-    treeName: "Vaik Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_2, __generated_chargeblade__36b],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__36a],
-        ],
-    ],
-
-    baseSharpness: [60, 100, 70, 50, 20, 0, 0],
-    maxSharpness:  [60, 100, 70, 50, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "element_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "shieldraad",
-        treeNameLower: "vaiktree",
-    },
-};
-
-const __generated_chargeblade__ra: ChargeBlade = {
-    category: "chargeblade",
-    id: "ra",
-
-    name: "Rampage C. Blade I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "rampagec.bladei",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_chargeblade__rb: ChargeBlade = {
-    category: "chargeblade",
-    id: "rb",
-
-    name: "Rampage C. Blade II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "rampagec.bladeii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_chargeblade__rc: ChargeBlade = {
-    category: "chargeblade",
-    id: "rc",
-
-    name: "Rampage C. Blade III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "rampagec.bladeiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_chargeblade__rd: ChargeBlade = {
-    category: "chargeblade",
-    id: "rd",
-
-    name: "Rampage C. Blade IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_chargeblade__rc],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_chargeblade__rc],
-            [__generated_ramp__water_1, __generated_chargeblade__rc],
-            [__generated_ramp__thunder_1, __generated_chargeblade__rc],
-            [__generated_ramp__ice_1, __generated_chargeblade__rc],
-            [__generated_ramp__dragon_1, __generated_chargeblade__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "rampagec.bladeiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_chargeblade__re: ChargeBlade = {
-    category: "chargeblade",
-    id: "re",
-
-    name: "Rampage C. Blade V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__rd],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__rd],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__rd],
-            [__generated_ramp__elemental_boost_1, __generated_chargeblade__rc],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_chargeblade__rd],
-            [__generated_ramp__water_2, __generated_chargeblade__rd],
-            [__generated_ramp__thunder_2, __generated_chargeblade__rd],
-            [__generated_ramp__ice_2, __generated_chargeblade__rd],
-            [__generated_ramp__dragon_2, __generated_chargeblade__rd],
-            [__generated_ramp__fire_1, __generated_chargeblade__rc],
-            [__generated_ramp__water_1, __generated_chargeblade__rc],
-            [__generated_ramp__thunder_1, __generated_chargeblade__rc],
-            [__generated_ramp__ice_1, __generated_chargeblade__rc],
-            [__generated_ramp__dragon_1, __generated_chargeblade__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
-
-    filterHelpers: {
-        nameLower: "rampagec.bladev",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_chargeblade__rf: ChargeBlade = {
-    category: "chargeblade",
-    id: "rf",
-
-    name: "Rampage C. Blade S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_chargeblade__re],
-            [__generated_ramp__affinity_boost_3, __generated_chargeblade__re],
-            [__generated_ramp__attack_boost_2, __generated_chargeblade__rd],
-            [__generated_ramp__affinity_boost_2, __generated_chargeblade__rd],
-            [__generated_ramp__defense_boost_2, __generated_chargeblade__rd],
-            [__generated_ramp__elemental_boost_1, __generated_chargeblade__rc],
-            [__generated_ramp__attack_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__affinity_boost_1, __generated_chargeblade__rb],
-            [__generated_ramp__defense_boost_1, __generated_chargeblade__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_chargeblade__re],
-            [__generated_ramp__paralysis_1, __generated_chargeblade__re],
-            [__generated_ramp__sleep_1, __generated_chargeblade__re],
-            [__generated_ramp__blast_1, __generated_chargeblade__re],
-            [__generated_ramp__fire_2, __generated_chargeblade__rd],
-            [__generated_ramp__water_2, __generated_chargeblade__rd],
-            [__generated_ramp__thunder_2, __generated_chargeblade__rd],
-            [__generated_ramp__ice_2, __generated_chargeblade__rd],
-            [__generated_ramp__dragon_2, __generated_chargeblade__rd],
-            [__generated_ramp__fire_1, __generated_chargeblade__rc],
-            [__generated_ramp__water_1, __generated_chargeblade__rc],
-            [__generated_ramp__thunder_1, __generated_chargeblade__rc],
-            [__generated_ramp__ice_1, __generated_chargeblade__rc],
-            [__generated_ramp__dragon_1, __generated_chargeblade__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
-
-    chargebladeStats: {
-        phialType: "impact_phial",
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagec.blades",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"chargeblade","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura C. Blade I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"1b","name":"Kamura C. Blade II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"1c","name":"Kamura C. Blade III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"1d","name":"Kamura C. Blade IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"1e","name":"Kamura C. Blade V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"1f","name":"Kamura Ninja C. Blade","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Rathian Tree",[{"id":"2a","name":"Dear Lutemis I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[20,90,90,50,0,0,0],"maxSharpness":[20,90,90,100,0,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"2b","name":"Dear Lutemis II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",26]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["small_monster_exploit",null],["attack_boost_1","2a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[20,100,60,110,10,0,0],"maxSharpness":[20,100,60,110,60,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"2c","name":"Dear Lutemia","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["fire",30]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["small_monster_exploit",null],["fire_boost_1","2b"],["attack_boost_1","2a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[10,110,40,120,20,0,0],"maxSharpness":[10,110,40,120,50,20,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Barioth Tree",[{"id":"3a","name":"Weissritter I","rarity":2,"endlineTag":"","attack":90,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[["ice",17]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"3b","name":"Weissritter II","rarity":3,"endlineTag":"","attack":110,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[["ice",19]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,50,80,70,10,0,0],"maxSharpness":[40,50,80,70,50,10,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"3c","name":"Weissritter III","rarity":4,"endlineTag":"","attack":130,"affinity":25,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",22]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","3b"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,50,80,90,40,0,0],"maxSharpness":[40,50,80,90,70,20,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"3d","name":"Pavadira","rarity":5,"endlineTag":"hr","attack":170,"affinity":25,"defense":0,"decoSlots":[1,1,1],"eleStat":[["ice",26]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","3c"],["attack_boost_2","3b"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,90,60,0,0],"maxSharpness":[50,70,80,90,70,40,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Zinogre Tree",[{"id":"4a","name":"Usurper\'s Lightning I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_2","3a"],["affinity_boost_2","3a"],["iceblight_exploit","3a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,90,50,0,0,0],"maxSharpness":[70,40,90,100,0,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"4b","name":"Usurper\'s Lightning II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",23]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","4a"],["affinity_boost_2","3a"],["iceblight_exploit","3a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,70,90,30,0,0],"maxSharpness":[70,40,70,90,80,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"4c","name":"Despot\'s Thundergale","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",26]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","4b"],["attack_boost_1","4a"],["affinity_boost_2","3a"],["iceblight_exploit","3a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,100,100,40,0,0],"maxSharpness":[70,40,100,100,50,40,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Tetranadon Tree",[{"id":"5a","name":"Shovedown Blade I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",13]],"rampSkills":[[["defense_boost_1",null],["water_boost_1",null],["dulling_strike",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[30,80,70,20,0,0,0],"maxSharpness":[30,80,70,70,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"5b","name":"Shovedown Blade II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":10,"decoSlots":[1,1],"eleStat":[["water",15]],"rampSkills":[[["defense_boost_1",null],["water_boost_2",null],["dulling_strike",null],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[40,90,110,60,0,0,0],"maxSharpness":[40,90,110,100,10,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"5c","name":"Spinning Takedown","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":20,"decoSlots":[1,1],"eleStat":[["water",18]],"rampSkills":[[["defense_boost_1",null],["water_boost_3",null],["dulling_strike",null],["water_boost_2","5b"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[40,90,110,110,0,0,0],"maxSharpness":[40,90,110,110,50,0,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Basarios Tree",[{"id":"6a","name":"Giga Grips I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["poison",22]],"rampSkills":[[["defense_boost_1",null],["poison_boost_1",null],["dulling_strike",null],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[30,150,40,30,0,0,0],"maxSharpness":[30,150,40,80,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"6b","name":"Giga Grips II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["poison",23]],"rampSkills":[[["defense_boost_1",null],["poison_boost_2",null],["dulling_strike",null],["poison_boost_1","6a"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[20,140,40,50,0,0,0],"maxSharpness":[20,140,40,80,20,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"6c","name":"Giga Grips III","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":20,"decoSlots":[1],"eleStat":[["poison",25]],"rampSkills":[[["defense_boost_2",null],["poison_boost_2",null],["silkbind_boost",null],["defense_boost_1","6b"],["dulling_strike","6b"],["poison_boost_1","6a"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[10,140,50,80,20,0,0],"maxSharpness":[10,140,50,80,50,20,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"6d","name":"Titan\'s Vise","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":20,"decoSlots":[1],"eleStat":[["poison",29]],"rampSkills":[[["defense_boost_2",null],["poison_boost_3",null],["silkbind_boost",null],["poison_boost_2","6c"],["defense_boost_1","6b"],["dulling_strike","6b"],["poison_boost_1","6a"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[10,140,40,80,30,0,0],"maxSharpness":[10,140,40,80,50,30,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Goss Harag Tree",[{"id":"7a","name":"Surprise Axe I","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["ice",9]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_1",null],["brutal_strike",null],["defense_boost_1","6a"],["poison_boost_1","6a"],["dulling_strike","6a"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[90,30,90,40,0,0,0],"maxSharpness":[90,30,90,80,10,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"7b","name":"Surprise Axe II","rarity":5,"endlineTag":"","attack":190,"affinity":-20,"defense":0,"decoSlots":[2],"eleStat":[["ice",11]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","7a"],["defense_boost_1","6a"],["poison_boost_1","6a"],["dulling_strike","6a"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[90,40,110,40,20,0,0],"maxSharpness":[90,40,110,40,70,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"7c","name":"Stunning Axe","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[2],"eleStat":[["ice",13]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_3",null],["brutal_strike",null],["ice_boost_2","7b"],["ice_boost_1","7a"],["defense_boost_1","6a"],["poison_boost_1","6a"],["dulling_strike","6a"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[90,40,100,40,30,0,0],"maxSharpness":[90,40,100,40,70,10,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Ore Tree",[{"id":"8a","name":"Hyperguard I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"8b","name":"Hyperguard II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,110,10,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"8c","name":"Regas Hyper","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","8b"]]],"baseSharpness":[80,80,60,30,0,0,0],"maxSharpness":[80,80,60,80,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"8d","name":"Elite Blade I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"8e","name":"Elite Blade II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,90,50,50,20,0,0],"maxSharpness":[90,90,50,50,50,20,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"8f","name":"Kaiser Blade","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,90,40,50,30,0,0],"maxSharpness":[90,90,40,50,50,30,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Thunder Tree",[{"id":"9a","name":"K. Captain\'s Blade I","rarity":4,"endlineTag":"","attack":150,"affinity":15,"defense":0,"decoSlots":[3],"eleStat":[["thunder",29]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"]]],"baseSharpness":[110,70,60,50,10,0,0],"maxSharpness":[110,70,60,50,60,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"9b","name":"K. Captain\'s Blade II","rarity":5,"endlineTag":"","attack":160,"affinity":20,"defense":0,"decoSlots":[3],"eleStat":[["thunder",33]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","9a"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"]]],"baseSharpness":[100,70,50,50,30,0,0],"maxSharpness":[100,70,50,50,70,10,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"9c","name":"Die Walk\\u00fcre","rarity":6,"endlineTag":"hr","attack":170,"affinity":20,"defense":0,"decoSlots":[3],"eleStat":[["thunder",37]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","9b"],["attack_boost_1","9a"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"]]],"baseSharpness":[100,80,70,60,40,0,0],"maxSharpness":[100,80,70,60,70,20,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Rakna-Kadaki Tree",[{"id":"10a","name":"Biting Edge I","rarity":6,"endlineTag":"","attack":150,"affinity":25,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",29]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["silkbind_boost",null],["attack_boost_2","9b"],["thunder_boost_1","9b"],["thunderblight_exploit","9b"],["attack_boost_1","9a"],["defense_boost_2","8d"],["affinity_boost_1","8c"]]],"baseSharpness":[200,40,40,30,40,0,0],"maxSharpness":[200,40,40,30,40,50,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"10b","name":"Biting Edge II","rarity":6,"endlineTag":"","attack":160,"affinity":25,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",31]],"rampSkills":[[["attack_boost_3",null],["fire_boost_2",null],["silkbind_boost",null],["fire_boost_1","10a"],["attack_boost_2","9b"],["thunder_boost_1","9b"],["thunderblight_exploit","9b"],["attack_boost_1","9a"],["defense_boost_2","8d"],["affinity_boost_1","8c"]]],"baseSharpness":[200,40,40,30,30,10,0],"maxSharpness":[200,40,40,30,30,60,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"10c","name":"Araknablade","rarity":7,"endlineTag":"hr","attack":170,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",34]],"rampSkills":[[["attack_boost_4",null],["fire_boost_2",null],["silkbind_boost",null],["attack_boost_3","10b"],["fire_boost_1","10a"],["attack_boost_2","9b"],["thunder_boost_1","9b"],["thunderblight_exploit","9b"],["attack_boost_1","9a"],["defense_boost_2","8d"],["affinity_boost_1","8c"]]],"baseSharpness":[200,30,40,30,30,20,0],"maxSharpness":[200,30,40,30,30,70,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Tigrex Tree",[{"id":"11a","name":"Tigrex Divide I","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"11b","name":"Tigrex Divide II","rarity":6,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","11a"],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,60,20,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"11c","name":"Tigrex Blade","rarity":6,"endlineTag":"hr","attack":220,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","11b"],["affinity_boost_1","11a"],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[50,40,120,120,50,20,0],"maxSharpness":[50,40,120,120,50,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Mizutsune Tree",[{"id":"12a","name":"Mizuniya Drill I","rarity":3,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",21]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[110,40,30,70,0,0,0],"maxSharpness":[110,40,30,90,30,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"12b","name":"Mizuniya Drill II","rarity":5,"endlineTag":"","attack":170,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",24]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","12a"],["water_boost_1","12a"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[110,90,70,50,30,0,0],"maxSharpness":[110,90,70,50,60,20,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"12c","name":"Final Fieldblade","rarity":6,"endlineTag":"hr","attack":190,"affinity":20,"defense":0,"decoSlots":[1],"eleStat":[["water",30]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","12b"],["affinity_boost_1","12a"],["water_boost_1","12a"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[110,70,70,50,50,0,0],"maxSharpness":[110,70,70,50,50,50,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Tobi-Kadachi Tree",[{"id":"13a","name":"Kadachi Slasher I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",15]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunder_boost_2",null],["defense_boost_2","8b"]]],"baseSharpness":[130,30,50,40,0,0,0],"maxSharpness":[130,30,50,90,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"13b","name":"Kadachi Slasher II","rarity":3,"endlineTag":"","attack":140,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["thunder_boost_2",null],["affinity_boost_1","13a"],["defense_boost_2","8b"]]],"baseSharpness":[110,40,50,50,0,0,0],"maxSharpness":[110,40,50,50,50,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"13c","name":"Kadachi Otenta","rarity":5,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunder_boost_3",null],["attack_boost_1","13b"],["affinity_boost_2","13b"],["thunder_boost_2","13b"],["affinity_boost_1","13a"],["defense_boost_2","8b"]]],"baseSharpness":[120,80,30,30,40,0,0],"maxSharpness":[120,80,30,30,60,30,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Izuchi Tree",[{"id":"14a","name":"Wind Thief Sickle I","rarity":1,"endlineTag":"","attack":70,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[70,40,50,40,0,0,0],"maxSharpness":[70,40,50,90,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"14b","name":"Wind Thief Sickle II","rarity":2,"endlineTag":"","attack":90,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","14a"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[70,40,40,50,0,0,0],"maxSharpness":[70,40,40,50,50,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"14c","name":"Gale Sickle","rarity":4,"endlineTag":"hr","attack":140,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","14b"],["affinity_boost_1","14a"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[100,50,50,50,50,0,0],"maxSharpness":[100,50,50,50,50,50,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Nargacuga Tree",[{"id":"15a","name":"Hidden Arsenal I","rarity":3,"endlineTag":"","attack":120,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_grinder_1",null],["affinity_boost_2","14b"],["small_monster_exploit","14b"],["buddy_rally","14b"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"15b","name":"Hidden Arsenal II","rarity":5,"endlineTag":"","attack":180,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["defense_grinder_1",null],["attack_boost_2","15a"],["affinity_boost_2","14b"],["small_monster_exploit","14b"],["buddy_rally","14b"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[70,70,40,120,50,0,0],"maxSharpness":[70,70,40,120,80,20,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"15c","name":"Scream in the Night","rarity":6,"endlineTag":"hr","attack":190,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["defense_grinder_2",null],["affinity_boost_1","15b"],["defense_grinder_1","15b"],["attack_boost_2","15a"],["small_monster_exploit","14b"],["buddy_rally","14b"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[70,40,100,90,80,20,0],"maxSharpness":[70,40,100,90,80,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Bone Tree",[{"id":"16a","name":"Bone Strongarm I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"16b","name":"Bone Strongarm II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"16c","name":"Hard Bone Strongarm","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","16b"]]],"baseSharpness":[90,50,60,0,0,0,0],"maxSharpness":[90,50,110,0,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"16d","name":"Bone Blade I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[70,90,70,20,0,0,0],"maxSharpness":[70,90,70,70,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"16e","name":"Bone Blade II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","16d"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"16f","name":"Bonesilt Veil","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","16e"],["attack_boost_2","16d"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,100,20,0,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Jyuratodus Tree",[{"id":"17a","name":"Jyura Silt I","rarity":5,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[1,1,1],"eleStat":[["water",10]],"rampSkills":[[["affinity_boost_1",null],["water_boost_1",null],["brutal_strike",null],["attack_boost_3","16e"],["affinity_boost_2","16e"],["dulling_strike","16e"],["attack_boost_2","16d"],["defense_boost_1","16c"]]],"baseSharpness":[90,90,50,50,20,0,0],"maxSharpness":[90,90,50,50,70,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"17b","name":"Jyura Silt II","rarity":6,"endlineTag":"","attack":220,"affinity":-10,"defense":0,"decoSlots":[1,1,1],"eleStat":[["water",11]],"rampSkills":[[["affinity_boost_1",null],["water_boost_2",null],["brutal_strike",null],["water_boost_1","17a"],["attack_boost_3","16e"],["affinity_boost_2","16e"],["dulling_strike","16e"],["attack_boost_2","16d"],["defense_boost_1","16c"]]],"baseSharpness":[110,110,50,50,30,0,0],"maxSharpness":[110,110,50,50,70,10,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"17c","name":"Clutch of the Deep","rarity":6,"endlineTag":"hr","attack":230,"affinity":-10,"defense":0,"decoSlots":[1,1,1],"eleStat":[["water",12]],"rampSkills":[[["affinity_boost_2",null],["water_boost_2",null],["brutal_strike",null],["affinity_boost_1","17b"],["water_boost_1","17a"],["attack_boost_3","16e"],["dulling_strike","16e"],["attack_boost_2","16d"],["defense_boost_1","16c"]]],"baseSharpness":[120,120,30,30,50,0,0],"maxSharpness":[120,120,30,30,80,20,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Rathalos Tree",[{"id":"18a","name":"Axelion Blade I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",24]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["affinity_boost_2","16c"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[30,100,80,40,0,0,0],"maxSharpness":[30,100,80,80,10,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"18b","name":"Axelion Blade II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",26]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["affinity_boost_2","16c"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[90,70,110,60,20,0,0],"maxSharpness":[90,70,110,60,70,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"18c","name":"Bardichion Blade","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",27]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","18b"],["affinity_boost_2","16c"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[90,40,130,60,30,0,0],"maxSharpness":[90,40,130,60,50,30,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Somnacanth Tree",[{"id":"19a","name":"Bellowing Blow I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",12]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","16c"],["affinity_boost_2","16c"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[80,70,70,30,0,0,0],"maxSharpness":[80,70,70,80,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"19b","name":"Bellowing Blow II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",15]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_1","19a"],["affinity_boost_2","16c"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[60,50,90,50,0,0,0],"maxSharpness":[60,50,90,80,20,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"19c","name":"Illusory Frilled Wail","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["sleep",18]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","19b"],["attack_boost_1","19a"],["affinity_boost_2","16c"],["defense_boost_1","16c"],["affinity_boost_1","16b"]]],"baseSharpness":[60,50,150,90,0,0,0],"maxSharpness":[60,50,150,100,40,0,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Poison Tree",[{"id":"20a","name":"Poisonous Veil I","rarity":2,"endlineTag":"","attack":110,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["poison",8]],"rampSkills":[[["affinity_boost_1",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","16b"],["defense_boost_1","16b"]]],"baseSharpness":[100,30,40,30,0,0,0],"maxSharpness":[100,30,40,80,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"20b","name":"Poisonous Veil II","rarity":4,"endlineTag":"","attack":170,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["poison",11]],"rampSkills":[[["affinity_boost_1",null],["poison_boost_2",null],["dulling_strike",null],["poison_boost_1","20a"],["attack_boost_2","16b"],["defense_boost_1","16b"]]],"baseSharpness":[150,70,40,40,0,0,0],"maxSharpness":[150,70,40,40,50,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"20c","name":"Infected Veil","rarity":5,"endlineTag":"hr","attack":210,"affinity":-10,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",14]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_2",null],["dulling_strike",null],["affinity_boost_1","20b"],["poison_boost_1","20a"],["attack_boost_2","16b"],["defense_boost_1","16b"]]],"baseSharpness":[170,70,40,60,10,0,0],"maxSharpness":[170,70,40,60,50,10,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Drag\\u00e3o Tree",[{"id":"21a","name":"Drag\\u00e3o Veil I","rarity":4,"endlineTag":"","attack":170,"affinity":-10,"defense":0,"decoSlots":[2],"eleStat":[["dragon",12]],"rampSkills":[[["attack_boost_1",null],["dragon_boost_1",null],["element_exploit",null],["affinity_boost_1","20a"],["poison_boost_1","20a"],["dulling_strike","20a"],["attack_boost_2","16b"],["defense_boost_1","16b"]]],"baseSharpness":[150,70,40,40,0,0,0],"maxSharpness":[150,70,40,40,50,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"21b","name":"Drag\\u00e3o Veil II","rarity":5,"endlineTag":"","attack":180,"affinity":-10,"defense":0,"decoSlots":[2,1],"eleStat":[["dragon",24]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_1",null],["element_exploit",null],["attack_boost_1","21a"],["affinity_boost_1","20a"],["poison_boost_1","20a"],["dulling_strike","20a"],["defense_boost_1","16b"]]],"baseSharpness":[160,50,40,50,0,0,0],"maxSharpness":[160,50,40,50,50,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"21c","name":"Drag\\u00e3osong","rarity":6,"endlineTag":"hr","attack":200,"affinity":-5,"defense":0,"decoSlots":[2,1,1],"eleStat":[["dragon",36]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["element_exploit",null],["attack_boost_2","21b"],["dragon_boost_1","21b"],["attack_boost_1","21a"],["affinity_boost_1","20a"],["poison_boost_1","20a"],["dulling_strike","20a"],["defense_boost_1","16b"]]],"baseSharpness":[170,30,40,60,0,0,0],"maxSharpness":[170,30,40,60,40,10,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Barroth Tree",[{"id":"22a","name":"Barroth Anchor I","rarity":2,"endlineTag":"","attack":120,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_2","16b"]]],"baseSharpness":[50,60,140,0,0,0,0],"maxSharpness":[50,60,140,50,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"22b","name":"Barroth Anchor II","rarity":3,"endlineTag":"","attack":170,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","22a"],["attack_boost_2","16b"]]],"baseSharpness":[60,60,160,20,0,0,0],"maxSharpness":[60,60,160,60,10,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"22c","name":"Rugged Anchor","rarity":5,"endlineTag":"hr","attack":210,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","22b"],["defense_boost_1","22a"],["attack_boost_2","16b"]]],"baseSharpness":[60,60,160,70,0,0,0],"maxSharpness":[60,60,160,70,30,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Diablos Tree",[{"id":"23a","name":"Diablos Strongarm I","rarity":6,"endlineTag":"","attack":220,"affinity":-30,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_2","22c"],["defense_boost_2","22c"],["brutal_strike","22c"],["attack_boost_2","16b"]]],"baseSharpness":[50,160,30,100,10,0,0],"maxSharpness":[50,160,30,100,50,10,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"23b","name":"Diablos Strongarm II","rarity":6,"endlineTag":"","attack":230,"affinity":-30,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["defense_grinder_1",null],["affinity_boost_1","23a"],["dulling_strike","23a"],["defense_boost_2","22c"],["brutal_strike","22c"],["attack_boost_2","16b"]]],"baseSharpness":[50,160,20,100,20,0,0],"maxSharpness":[50,160,20,100,60,10,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"23c","name":"Cera Strongarm","rarity":7,"endlineTag":"hr","attack":240,"affinity":-30,"defense":20,"decoSlots":[3],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["defense_grinder_2",null],["affinity_boost_2","23b"],["defense_boost_1","23b"],["defense_grinder_1","23b"],["affinity_boost_1","23a"],["dulling_strike","23a"],["brutal_strike","22c"],["attack_boost_2","16b"]]],"baseSharpness":[50,160,10,100,30,0,0],"maxSharpness":[50,160,10,100,50,30,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Volvidon Tree",[{"id":"24a","name":"Rough Roller I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",15]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["defense_grinder_1",null],["affinity_boost_1","22a"],["brutal_strike","22a"],["attack_boost_2","16b"]]],"baseSharpness":[100,40,70,40,0,0,0],"maxSharpness":[100,40,70,90,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"24b","name":"Rough Roller II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["paralysis",17]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["defense_grinder_1",null],["defense_boost_1","24a"],["affinity_boost_1","22a"],["brutal_strike","22a"],["attack_boost_2","16b"]]],"baseSharpness":[100,50,70,60,20,0,0],"maxSharpness":[100,50,70,60,70,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"24c","name":"Rotaxion","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["paralysis",19]],"rampSkills":[[["attack_boost_4",null],["defense_boost_2",null],["defense_grinder_1",null],["attack_boost_3","24b"],["defense_boost_1","24a"],["affinity_boost_1","22a"],["brutal_strike","22a"],["attack_boost_2","16b"]]],"baseSharpness":[110,60,70,70,40,0,0],"maxSharpness":[110,60,70,70,90,0,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Magnamalo Tree",[{"id":"25a","name":"Sinister Slasher I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",20]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"25b","name":"Sinister Slasher II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",23]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","25a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"25c","name":"Sinister Shade Axe","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",26]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","25b"],["attack_boost_2","25a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Rajang Tree",[{"id":"26a","name":"Undying Blade I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",10]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,120,10,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"26b","name":"Undying Blade II","rarity":6,"endlineTag":"","attack":230,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",14]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","26a"]]],"baseSharpness":[20,40,100,90,0,0,0],"maxSharpness":[20,40,100,110,30,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"26c","name":"Ikaji Immortal","rarity":7,"endlineTag":"hr","attack":240,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","26b"],["thunder_boost_1","26a"]]],"baseSharpness":[50,60,90,100,0,0,0],"maxSharpness":[50,60,90,100,40,10,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Ibushi Tree",[{"id":"27a","name":"Azure Elder Blade I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",6]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"27b","name":"Azure Elder Blade II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",9]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","27a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"27c","name":"Abyssal Gale Ward","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",17]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","27b"],["defense_boost_1","27a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Narwa Tree",[{"id":"28a","name":"Thunderbolt Sawtooth I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",34]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"28b","name":"Abyssal Storm Ward","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",38]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","28a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Kushala Daora Tree",[{"id":"29a","name":"Daora\'s Casca I","rarity":6,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",30]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[70,40,100,90,50,0,0],"maxSharpness":[70,40,100,90,70,30,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"29b","name":"Daora\'s Thwartoise","rarity":7,"endlineTag":"hr","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",36]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","29a"],["affinity_boost_2","29a"]]],"baseSharpness":[80,100,70,40,50,10,0],"maxSharpness":[80,100,70,40,50,60,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Teostra Tree",[{"id":"30a","name":"Teostra\'s Striker I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",38]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[150,20,70,80,30,0,0],"maxSharpness":[150,20,70,80,50,30,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"30b","name":"Teostra\'s Nova","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",43]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","30a"]]],"baseSharpness":[160,40,30,80,40,0,0],"maxSharpness":[160,40,30,80,50,40,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Chameleos Tree",[{"id":"31a","name":"Arcane Draw I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["poison",33]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[40,80,110,70,50,0,0],"maxSharpness":[40,80,110,70,60,40,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"31b","name":"Etherward","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["poison",39]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","31a"]]],"baseSharpness":[40,80,110,60,60,0,0],"maxSharpness":[40,80,110,60,60,50,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Valstrax Tree",[{"id":"32a","name":"Redwing Edge I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",30]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"32b","name":"Skaltecore","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",35]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Smithy Tree",[{"id":"33a","name":"Ricebane I","rarity":3,"endlineTag":"","attack":160,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_1",null],["defense_grinder_1",null]]],"baseSharpness":[120,70,60,0,0,0,0],"maxSharpness":[120,70,60,50,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"33b","name":"Ricebane II","rarity":4,"endlineTag":"","attack":200,"affinity":0,"defense":15,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_2",null],["defense_grinder_2",null],["defense_boost_1","33a"],["defense_grinder_1","33a"]]],"baseSharpness":[160,70,60,10,0,0,0],"maxSharpness":[160,70,60,60,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"33c","name":"Pounder of Rice","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["defense_grinder_2",null],["attack_boost_1","33b"],["defense_boost_2","33b"],["defense_boost_1","33a"],["defense_grinder_1","33a"]]],"baseSharpness":[160,60,50,30,0,0,0],"maxSharpness":[160,60,50,40,40,0,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Felyne Tree",[{"id":"34a","name":"Cuddly Cat I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",20]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["paralysis_boost_1",null]]],"baseSharpness":[60,100,30,10,0,0,0],"maxSharpness":[60,100,30,60,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"34b","name":"Cuddly Cat II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",24]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["paralysis_boost_1",null],["affinity_boost_1","34a"]]],"baseSharpness":[70,100,50,30,0,0,0],"maxSharpness":[70,100,50,80,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"34c","name":"Felyne Fancy","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",28]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["paralysis_boost_1",null],["attack_boost_1","34b"],["affinity_boost_2","34b"],["affinity_boost_1","34a"]]],"baseSharpness":[80,100,60,40,20,0,0],"maxSharpness":[80,100,60,40,60,10,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Aelucanth Tree",[{"id":"35a","name":"Mandible Blade I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["dragon",14]],"rampSkills":[[["attack_boost_1",null],["dragon_boost_2",null],["wyvern_exploit",null]]],"baseSharpness":[50,90,40,70,0,0,0],"maxSharpness":[50,90,40,100,20,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"35b","name":"Mandible Blade II","rarity":3,"endlineTag":"","attack":130,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["dragon",17]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_1","35a"]]],"baseSharpness":[30,110,30,70,10,0,0],"maxSharpness":[30,110,30,70,60,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"35c","name":"Maxilla Edge","rarity":5,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["dragon",22]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_3",null],["wyvern_exploit",null],["attack_boost_2","35b"],["dragon_boost_2","35b"],["attack_boost_1","35a"]]],"baseSharpness":[30,150,30,80,60,0,0],"maxSharpness":[30,150,30,80,90,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]],["Vaik Tree",[{"id":"36a","name":"Vaik Veil I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",17]],"rampSkills":[[["defense_boost_1",null],["water_boost_2",null],["dulling_strike",null]]],"baseSharpness":[60,90,70,30,0,0,0],"maxSharpness":[60,90,70,50,30,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"36b","name":"Vaik Veil II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",22]],"rampSkills":[[["defense_boost_2",null],["water_boost_2",null],["dulling_strike",null],["defense_boost_1","36a"]]],"baseSharpness":[50,90,60,50,0,0,0],"maxSharpness":[50,90,60,60,40,0,0],"chargebladeStats":{"phialType":"element_phial"}},{"id":"36c","name":"Shieldraad","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["water",27]],"rampSkills":[[["defense_boost_2",null],["water_boost_3",null],["dulling_strike",null],["water_boost_2","36b"],["defense_boost_1","36a"]]],"baseSharpness":[60,100,70,50,20,0,0],"maxSharpness":[60,100,70,50,70,0,0],"chargebladeStats":{"phialType":"element_phial"}}]],["Rampage Tree",[{"id":"ra","name":"Rampage C. Blade I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null],["phial_element",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"rb","name":"Rampage C. Blade II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null],["phial_element",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"rc","name":"Rampage C. Blade III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null],["phial_element",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"rd","name":"Rampage C. Blade IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null],["phial_element",null]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"re","name":"Rampage C. Blade V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["phial_element",null]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0],"chargebladeStats":{"phialType":"impact_phial"}},{"id":"rf","name":"Rampage C. Blade S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_2",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["phial_element",null]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0],"chargebladeStats":{"phialType":"impact_phial"}}]]]}';
 
-export const chargebladesArray: Readonly<ChargeBlade[]> = [
-    __generated_chargeblade__1a,
-    __generated_chargeblade__1b,
-    __generated_chargeblade__1c,
-    __generated_chargeblade__1d,
-    __generated_chargeblade__1e,
-    __generated_chargeblade__1f,
-    __generated_chargeblade__2a,
-    __generated_chargeblade__2b,
-    __generated_chargeblade__2c,
-    __generated_chargeblade__3a,
-    __generated_chargeblade__3b,
-    __generated_chargeblade__3c,
-    __generated_chargeblade__3d,
-    __generated_chargeblade__4a,
-    __generated_chargeblade__4b,
-    __generated_chargeblade__4c,
-    __generated_chargeblade__5a,
-    __generated_chargeblade__5b,
-    __generated_chargeblade__5c,
-    __generated_chargeblade__6a,
-    __generated_chargeblade__6b,
-    __generated_chargeblade__6c,
-    __generated_chargeblade__6d,
-    __generated_chargeblade__7a,
-    __generated_chargeblade__7b,
-    __generated_chargeblade__7c,
-    __generated_chargeblade__8a,
-    __generated_chargeblade__8b,
-    __generated_chargeblade__8c,
-    __generated_chargeblade__8d,
-    __generated_chargeblade__8e,
-    __generated_chargeblade__8f,
-    __generated_chargeblade__9a,
-    __generated_chargeblade__9b,
-    __generated_chargeblade__9c,
-    __generated_chargeblade__10a,
-    __generated_chargeblade__10b,
-    __generated_chargeblade__10c,
-    __generated_chargeblade__11a,
-    __generated_chargeblade__11b,
-    __generated_chargeblade__11c,
-    __generated_chargeblade__12a,
-    __generated_chargeblade__12b,
-    __generated_chargeblade__12c,
-    __generated_chargeblade__13a,
-    __generated_chargeblade__13b,
-    __generated_chargeblade__13c,
-    __generated_chargeblade__14a,
-    __generated_chargeblade__14b,
-    __generated_chargeblade__14c,
-    __generated_chargeblade__15a,
-    __generated_chargeblade__15b,
-    __generated_chargeblade__15c,
-    __generated_chargeblade__16a,
-    __generated_chargeblade__16b,
-    __generated_chargeblade__16c,
-    __generated_chargeblade__16d,
-    __generated_chargeblade__16e,
-    __generated_chargeblade__16f,
-    __generated_chargeblade__17a,
-    __generated_chargeblade__17b,
-    __generated_chargeblade__17c,
-    __generated_chargeblade__18a,
-    __generated_chargeblade__18b,
-    __generated_chargeblade__18c,
-    __generated_chargeblade__19a,
-    __generated_chargeblade__19b,
-    __generated_chargeblade__19c,
-    __generated_chargeblade__20a,
-    __generated_chargeblade__20b,
-    __generated_chargeblade__20c,
-    __generated_chargeblade__21a,
-    __generated_chargeblade__21b,
-    __generated_chargeblade__21c,
-    __generated_chargeblade__22a,
-    __generated_chargeblade__22b,
-    __generated_chargeblade__22c,
-    __generated_chargeblade__23a,
-    __generated_chargeblade__23b,
-    __generated_chargeblade__23c,
-    __generated_chargeblade__24a,
-    __generated_chargeblade__24b,
-    __generated_chargeblade__24c,
-    __generated_chargeblade__25a,
-    __generated_chargeblade__25b,
-    __generated_chargeblade__25c,
-    __generated_chargeblade__26a,
-    __generated_chargeblade__26b,
-    __generated_chargeblade__26c,
-    __generated_chargeblade__27a,
-    __generated_chargeblade__27b,
-    __generated_chargeblade__27c,
-    __generated_chargeblade__28a,
-    __generated_chargeblade__28b,
-    __generated_chargeblade__29a,
-    __generated_chargeblade__29b,
-    __generated_chargeblade__30a,
-    __generated_chargeblade__30b,
-    __generated_chargeblade__31a,
-    __generated_chargeblade__31b,
-    __generated_chargeblade__32a,
-    __generated_chargeblade__32b,
-    __generated_chargeblade__33a,
-    __generated_chargeblade__33b,
-    __generated_chargeblade__33c,
-    __generated_chargeblade__34a,
-    __generated_chargeblade__34b,
-    __generated_chargeblade__34c,
-    __generated_chargeblade__35a,
-    __generated_chargeblade__35b,
-    __generated_chargeblade__35c,
-    __generated_chargeblade__36a,
-    __generated_chargeblade__36b,
-    __generated_chargeblade__36c,
-    __generated_chargeblade__ra,
-    __generated_chargeblade__rb,
-    __generated_chargeblade__rc,
-    __generated_chargeblade__rd,
-    __generated_chargeblade__re,
-    __generated_chargeblade__rf,
-];
+export const chargebladesArray: Readonly<ChargeBlade[]> = loadWeaponPayload<ChargeBlade>(payload);
@@ -0,0 +1,81 @@
+/*
+ *      SSSSSSSSSSSSSSS TTTTTTTTTTTTTTTTTTTTTTT     OOOOOOOOO     PPPPPPPPPPPPPPPPP   
+ *    SS:::::::::::::::ST:::::::::::::::::::::T   OO:::::::::OO   P::::::::::::::::P  
+ *   S:::::SSSSSS::::::ST:::::::::::::::::::::T OO:::::::::::::OO P::::::PPPPPP:::::P 
+ *   S:::::S     SSSSSSST:::::TT:::::::TT:::::TO:::::::OOO:::::::OPP:::::P     P:::::P
+ *   S:::::S            TTTTTT  T:::::T  TTTTTTO::::::O   O::::::O  P::::P     P:::::P
+ *   S:::::S                    T:::::T        O:::::O     O:::::O  P::::P     P:::::P
+ *    S::::SSSS                 T:::::T        O:::::O     O:::::O  P::::PPPPPP:::::P 
+ *     SS::::::SSSSS            T:::::T        O:::::O     O:::::O  P:::::::::::::PP  
+ *       SSS::::::::SS          T:::::T        O:::::O     O:::::O  P::::PPPPPPPPP    
+ *          SSSSSS::::S         T:::::T        O:::::O     O:::::O  P::::P            
+ *               S:::::S        T:::::T        O:::::O     O:::::O  P::::P            
+ *               S:::::S        T:::::T        O::::::O   O::::::O  P::::P            
+ *   SSSSSSS     S:::::S      TT:::::::TT      O:::::::OOO:::::::OPP::::::PP          
+ *   S::::::SSSSSS:::::S      T:::::::::T       OO:::::::::::::OO P::::::::P          
+ *   S:::::::::::::::SS       T:::::::::T         OO:::::::::OO   P::::::::P          
+ *    SSSSSSSSSSSSSSS         TTTTTTTTTTT           OOOOOOOOO     PPPPPPPPPP
+ *
+ *
+ * This is a generated source code file.
+ *
+ * Do NOT edit this file directly!
+ *
+ * Instead, you must edit the corresponding code generator files located in /dev_scripts at
+ * the root of this repository, then run the code generators with the following command:
+ *      $ yarn run-code-generators
+ *
+ * (ASCII art generated using <https://patorjk.com/software/taag/#p=display&h=0&f=Doh&t=STOP>)
+ *
+ */
+
+
+/*
+ * Code Generator Author: simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ */
+
+import {
+    type Weapon,
+    type WeaponCategory,
+} from "../../common/types";
+
+export interface WeaponChunkInfo {
+    readonly module:     string;
+    readonly numTrees:   number;
+    readonly numWeapons: number;
+}
+
+export const weaponChunkManifest: {readonly [K in WeaponCategory]: WeaponChunkInfo} = {
+    greatsword: {module: "_generated_weapon_greatsword", numTrees: 42, numWeapons: 132},
+    longsword: {module: "_generated_weapon_longsword", numTrees: 44, numWeapons: 141},
+    swordandshield: {module: "_generated_weapon_swordandshield", numTrees: 44, numWeapons: 138},
+    dualblades: {module: "_generated_weapon_dualblades", numTrees: 42, numWeapons: 133},
+    lance: {module: "_generated_weapon_lance", numTrees: 41, numWeapons: 134},
+    gunlance: {module: "_generated_weapon_gunlance", numTrees: 41, numWeapons: 136},
+    hammer: {module: "_generated_weapon_hammer", numTrees: 44, numWeapons: 141},
+    huntinghorn: {module: "_generated_weapon_huntinghorn", numTrees: 41, numWeapons: 133},
+    switchaxe: {module: "_generated_weapon_switchaxe", numTrees: 42, numWeapons: 139},
+    chargeblade: {module: "_generated_weapon_chargeblade", numTrees: 37, numWeapons: 120},
+    insectglaive: {module: "_generated_weapon_insectglaive", numTrees: 39, numWeapons: 129},
+    lightbowgun: {module: "_generated_weapon_lightbowgun", numTrees: 35, numWeapons: 117},
+    heavybowgun: {module: "_generated_weapon_heavybowgun", numTrees: 37, numWeapons: 120},
+    bow: {module: "_generated_weapon_bow", numTrees: 45, numWeapons: 147},
+};
+
+export const weaponChunkLoaders: {readonly [K in WeaponCategory]: () => Promise<Readonly<Weapon[]>>} = {
+    greatsword: () => import(/* webpackChunkName: "mhrb/weapons_greatsword" */ "./_generated_weapon_greatsword").then((m) => m.greatswordsArray),
+    longsword: () => import(/* webpackChunkName: "mhrb/weapons_longsword" */ "./_generated_weapon_longsword").then((m) => m.longswordsArray),
+    swordandshield: () => import(/* webpackChunkName: "mhrb/weapons_swordandshield" */ "./_generated_weapon_swordandshield").then((m) => m.swordandshieldsArray),
+    dualblades: () => import(/* webpackChunkName: "mhrb/weapons_dualblades" */ "./_generated_weapon_dualblades").then((m) => m.dualbladessArray),
+    lance: () => import(/* webpackChunkName: "mhrb/weapons_lance" */ "./_generated_weapon_lance").then((m) => m.lancesArray),
+    gunlance: () => import(/* webpackChunkName: "mhrb/weapons_gunlance" */ "./_generated_weapon_gunlance").then((m) => m.gunlancesArray),
+    hammer: () => import(/* webpackChunkName: "mhrb/weapons_hammer" */ "./_generated_weapon_hammer").then((m) => m.hammersArray),
+    huntinghorn: () => import(/* webpackChunkName: "mhrb/weapons_huntinghorn" */ "./_generated_weapon_huntinghorn").then((m) => m.huntinghornsArray),
+    switchaxe: () => import(/* webpackChunkName: "mhrb/weapons_switchaxe" */ "./_generated_weapon_switchaxe").then((m) => m.switchaxesArray),
+    chargeblade: () => import(/* webpackChunkName: "mhrb/weapons_chargeblade" */ "./_generated_weapon_chargeblade").then((m) => m.chargebladesArray),
+    insectglaive: () => import(/* webpackChunkName: "mhrb/weapons_insectglaive" */ "./_generated_weapon_insectglaive").then((m) => m.insectglaivesArray),
+    lightbowgun: () => import(/* webpackChunkName: "mhrb/weapons_lightbowgun" */ "./_generated_weapon_lightbowgun").then((m) => m.lightbowgunsArray),
+    heavybowgun: () => import(/* webpackChunkName: "mhrb/weapons_heavybowgun" */ "./_generated_weapon_heavybowgun").then((m) => m.heavybowgunsArray),
+    bow: () => import(/* webpackChunkName: "mhrb/weapons_bow" */ "./_generated_weapon_bow").then((m) => m.bowsArray),
+};
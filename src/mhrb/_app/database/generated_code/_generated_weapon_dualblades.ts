@@ -36,5044 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type DualBlades,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__blast_boost_3,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__hellion_mode,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__paralysis_boost_2,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__secondary_dragon_1,
-    __generated_ramp__secondary_dragon_2,
-    __generated_ramp__secondary_dragon_3,
-    __generated_ramp__secondary_fire_1,
-    __generated_ramp__secondary_fire_2,
-    __generated_ramp__secondary_fire_3,
-    __generated_ramp__secondary_ice_1,
-    __generated_ramp__secondary_ice_2,
-    __generated_ramp__secondary_ice_3,
-    __generated_ramp__secondary_thunder_1,
-    __generated_ramp__secondary_thunder_2,
-    __generated_ramp__secondary_thunder_3,
-    __generated_ramp__secondary_water_1,
-    __generated_ramp__secondary_water_2,
-    __generated_ramp__secondary_water_3,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_dualblades__1a: DualBlades = {
-    category: "dualblades",
-    id: "1a",
-
-    name: "Kamura Glintblades I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraglintbladesi",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_dualblades__1b: DualBlades = {
-    category: "dualblades",
-    id: "1b",
-
-    name: "Kamura Glintblades II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraglintbladesii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_dualblades__1c: DualBlades = {
-    category: "dualblades",
-    id: "1c",
-
-    name: "Kamura Glintblades III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraglintbladesiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_dualblades__1d: DualBlades = {
-    category: "dualblades",
-    id: "1d",
-
-    name: "Kamura Glintblades IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraglintbladesiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_dualblades__1e: DualBlades = {
-    category: "dualblades",
-    id: "1e",
-
-    name: "Kamura Glintblades V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__1d],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1d],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraglintbladesv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_dualblades__1f: DualBlades = {
-    category: "dualblades",
-    id: "1f",
-
-    name: "Kamura Ninja Blades",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_dualblades__1e],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__1d],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1d],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraninjablades",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_dualblades__2a: DualBlades = {
-    category: "dualblades",
-    id: "2a",
-
-    name: "Mud Ripper I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "mudripperi",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_dualblades__2b: DualBlades = {
-    category: "dualblades",
-    id: "2b",
-
-    name: "Mud Ripper II",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__2a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 60, 40, 0, 0],
-    maxSharpness:  [60, 60, 80, 60, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "mudripperii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_dualblades__2c: DualBlades = {
-    category: "dualblades",
-    id: "2c",
-
-    name: "Mud Twister",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_dualblades__2b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__2a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 90, 60, 0, 0],
-    maxSharpness:  [60, 60, 80, 90, 110, 0, 0],
-
-    filterHelpers: {
-        nameLower: "mudtwister",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_dualblades__3a: DualBlades = {
-    category: "dualblades",
-    id: "3a",
-
-    name: "Usurper's Fulgur I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 50, 100, 0, 0, 0],
-    maxSharpness:  [60, 40, 50, 150, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sfulguri",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_dualblades__3b: DualBlades = {
-    category: "dualblades",
-    id: "3b",
-
-    name: "Usurper's Fulgur II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__3a],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 100, 90, 20, 0, 0],
-    maxSharpness:  [60, 30, 100, 90, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sfulgurii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_dualblades__3c: DualBlades = {
-    category: "dualblades",
-    id: "3c",
-
-    name: "Despot's Blitz",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__3b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__3a],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 100, 30, 0, 0],
-    maxSharpness:  [60, 40, 120, 100, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "despot'sblitz",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_dualblades__4a: DualBlades = {
-    category: "dualblades",
-    id: "4a",
-
-    name: "Blizzarioths I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 80, 70, 0, 0, 0],
-    maxSharpness:  [50, 50, 80, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "blizzariothsi",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_dualblades__4b: DualBlades = {
-    category: "dualblades",
-    id: "4b",
-
-    name: "Blizzarioths II",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__4a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 130, 100, 40, 0, 0],
-    maxSharpness:  [50, 30, 130, 100, 80, 10, 0],
-
-    filterHelpers: {
-        nameLower: "blizzariothsii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_dualblades__4c: DualBlades = {
-    category: "dualblades",
-    id: "4c",
-
-    name: "Mountain Blizzarioths",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__4b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__4a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__1c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "mountainblizzarioths",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_dualblades__5a: DualBlades = {
-    category: "dualblades",
-    id: "5a",
-
-    name: "Desperado I",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 50, 30, 0, 0, 0],
-    maxSharpness:  [70, 50, 50, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "desperadoi",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_dualblades__5b: DualBlades = {
-    category: "dualblades",
-    id: "5b",
-
-    name: "Desperado II",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__5a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 50, 0, 0, 0],
-    maxSharpness:  [90, 50, 60, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "desperadoii",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_dualblades__5c: DualBlades = {
-    category: "dualblades",
-    id: "5c",
-
-    name: "The Kid",
-    treeName: "Wroggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__poison_boost_1, __generated_dualblades__5b],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__5a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 80, 20, 0, 0],
-    maxSharpness:  [90, 50, 60, 80, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "thekid",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_dualblades__6a: DualBlades = {
-    category: "dualblades",
-    id: "6a",
-
-    name: "Khezu Daggers I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 8], ["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 60, 70, 40, 0, 0, 0],
-    maxSharpness:  [80, 60, 70, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "khezudaggersi",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_dualblades__6b: DualBlades = {
-    category: "dualblades",
-    id: "6b",
-
-    name: "Khezu Daggers II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10], ["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__6a],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__6a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 50, 0, 0, 0],
-    maxSharpness:  [60, 60, 80, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "khezudaggersii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_dualblades__6c: DualBlades = {
-    category: "dualblades",
-    id: "6c",
-
-    name: "Khezu Skards",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 14], ["thunder", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__paralysis_boost_2, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__6b],
-            [__generated_ramp__paralysis_boost_1, __generated_dualblades__6b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__6a],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__6a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__1b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__1b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 90, 90, 30, 0, 0],
-    maxSharpness:  [40, 50, 90, 90, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "khezuskards",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_dualblades__7a: DualBlades = {
-    category: "dualblades",
-    id: "7a",
-
-    name: "Matched Slicers I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "matchedslicersi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_dualblades__7b: DualBlades = {
-    category: "dualblades",
-    id: "7b",
-
-    name: "Matched Slicers II",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "matchedslicersii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_dualblades__7c: DualBlades = {
-    category: "dualblades",
-    id: "7c",
-
-    name: "Dual Daggers",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dualdaggers",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_dualblades__7d: DualBlades = {
-    category: "dualblades",
-    id: "7d",
-
-    name: "Hurricane I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7c],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hurricanei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_dualblades__7e: DualBlades = {
-    category: "dualblades",
-    id: "7e",
-
-    name: "Hurricane II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7d],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7c],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 70, 50, 20, 0, 0],
-    maxSharpness:  [90, 70, 70, 50, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "hurricaneii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_dualblades__7f: DualBlades = {
-    category: "dualblades",
-    id: "7f",
-
-    name: "Cyclone",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__7e],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7d],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7c],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 100, 60, 30, 0, 0],
-    maxSharpness:  [80, 80, 100, 60, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "cyclone",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_dualblades__8a: DualBlades = {
-    category: "dualblades",
-    id: "8a",
-
-    name: "Rex Slicers I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7d],
-            [__generated_ramp__silkbind_boost, __generated_dualblades__7d],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rexslicersi",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_dualblades__8b: DualBlades = {
-    category: "dualblades",
-    id: "8b",
-
-    name: "Rex Slicers II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__8a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7d],
-            [__generated_ramp__silkbind_boost, __generated_dualblades__7d],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 110, 100, 50, 0, 0],
-    maxSharpness:  [50, 40, 110, 100, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rexslicersii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_dualblades__8c: DualBlades = {
-    category: "dualblades",
-    id: "8c",
-
-    name: "Tigrex Claws",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__8b],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__8a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7d],
-            [__generated_ramp__silkbind_boost, __generated_dualblades__7d],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 100, 120, 70, 20, 0],
-    maxSharpness:  [50, 40, 100, 120, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrexclaws",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_dualblades__9a: DualBlades = {
-    category: "dualblades",
-    id: "9a",
-
-    name: "Morning Dawn I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 90, 60, 0, 0, 0],
-    maxSharpness:  [60, 40, 90, 90, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "morningdawni",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_dualblades__9b: DualBlades = {
-    category: "dualblades",
-    id: "9b",
-
-    name: "Morning Dawn II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__9a],
-            [__generated_ramp__water_boost_1, __generated_dualblades__9a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 100, 80, 30, 0, 0],
-    maxSharpness:  [60, 80, 100, 80, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "morningdawnii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_dualblades__9c: DualBlades = {
-    category: "dualblades",
-    id: "9c",
-
-    name: "Evening Dusk",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__9b],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__9a],
-            [__generated_ramp__water_boost_1, __generated_dualblades__9a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7b],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 90, 40, 0, 0],
-    maxSharpness:  [60, 40, 120, 90, 40, 50, 0],
-
-    filterHelpers: {
-        nameLower: "eveningdusk",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_dualblades__10a: DualBlades = {
-    category: "dualblades",
-    id: "10a",
-
-    name: "Schirmscorn I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "schirmscorni",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_dualblades__10b: DualBlades = {
-    category: "dualblades",
-    id: "10b",
-
-    name: "Schirmscorn II",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__10a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 130, 60, 10, 0, 0],
-    maxSharpness:  [50, 50, 130, 60, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "schirmscornii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_dualblades__10c: DualBlades = {
-    category: "dualblades",
-    id: "10c",
-
-    name: "Daybreak Daggers",
-    treeName: "Aknosom Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_dualblades__10b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__10a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 150, 70, 30, 0, 0],
-    maxSharpness:  [50, 50, 150, 70, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "daybreakdaggers",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_dualblades__11a: DualBlades = {
-    category: "dualblades",
-    id: "11a",
-
-    name: "Kulu's Peck I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 50, 40, 0, 0, 0],
-    maxSharpness:  [80, 80, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulu'specki",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_dualblades__11b: DualBlades = {
-    category: "dualblades",
-    id: "11b",
-
-    name: "Kulu's Peck II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 70, 60, 0, 0, 0],
-    maxSharpness:  [60, 60, 70, 110, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulu'speckii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_dualblades__11c: DualBlades = {
-    category: "dualblades",
-    id: "11c",
-
-    name: "Kulu's Lasher",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 50, 30, 0, 0],
-    maxSharpness:  [60, 80, 80, 50, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulu'slasher",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_dualblades__12a: DualBlades = {
-    category: "dualblades",
-    id: "12a",
-
-    name: "Gelid Mind I",
-    treeName: "Ice Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__spiribird_doubled, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 100, 20, 0, 0, 0],
-    maxSharpness:  [90, 90, 100, 60, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gelidmindi",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_dualblades__12b: DualBlades = {
-    category: "dualblades",
-    id: "12b",
-
-    name: "Gelid Mind II",
-    treeName: "Ice Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_dualblades__12a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__spiribird_doubled, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 110, 30, 0, 0, 0],
-    maxSharpness:  [90, 70, 110, 50, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gelidmindii",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_dualblades__12c: DualBlades = {
-    category: "dualblades",
-    id: "12c",
-
-    name: "Gelid Soul",
-    treeName: "Ice Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__12b],
-            [__generated_ramp__ice_boost_2, __generated_dualblades__12b],
-            [__generated_ramp__ice_boost_1, __generated_dualblades__12a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__spiribird_doubled, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 90, 110, 0, 0, 0],
-    maxSharpness:  [60, 40, 90, 110, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gelidsoul",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_dualblades__13a: DualBlades = {
-    category: "dualblades",
-    id: "13a",
-
-    name: "Hidden Gemini I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__spiribird_doubled, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hiddengeminii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_dualblades__13b: DualBlades = {
-    category: "dualblades",
-    id: "13b",
-
-    name: "Hidden Gemini II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__13a],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__11b],
-            [__generated_ramp__spiribird_doubled, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 120, 100, 50, 0, 0],
-    maxSharpness:  [50, 30, 120, 100, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "hiddengeminiii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_dualblades__13c: DualBlades = {
-    category: "dualblades",
-    id: "13c",
-
-    name: "Night Wings",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__13b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__13a],
-            [__generated_ramp__spiribird_doubled, __generated_dualblades__11b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__11a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 90, 70, 30, 0],
-    maxSharpness:  [70, 40, 100, 90, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "nightwings",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_dualblades__14a: DualBlades = {
-    category: "dualblades",
-    id: "14a",
-
-    name: "Twin Chainsaws I",
-    treeName: "Thunder Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "twinchainsawsi",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_dualblades__14b: DualBlades = {
-    category: "dualblades",
-    id: "14b",
-
-    name: "Twin Chainsaws II",
-    treeName: "Thunder Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__14a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 90, 70, 0, 0, 0],
-    maxSharpness:  [40, 50, 90, 90, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "twinchainsawsii",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_dualblades__14c: DualBlades = {
-    category: "dualblades",
-    id: "14c",
-
-    name: "Guillotines",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__14b],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__14a],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__7a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 120, 100, 10, 0, 0],
-    maxSharpness:  [50, 70, 120, 100, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "guillotines",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_dualblades__15a: DualBlades = {
-    category: "dualblades",
-    id: "15a",
-
-    name: "Dual Hatchets I",
-    treeName: "Ore Tree 2",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 20, 30, 0, 0, 0],
-    maxSharpness:  [90, 60, 20, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dualhatchetsi",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_dualblades__15b: DualBlades = {
-    category: "dualblades",
-    id: "15b",
-
-    name: "Dual Hatchets II",
-    treeName: "Ore Tree 2",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 20, 50, 0, 0, 0],
-    maxSharpness:  [60, 70, 20, 70, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dualhatchetsii",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_dualblades__15c: DualBlades = {
-    category: "dualblades",
-    id: "15c",
-
-    name: "Dual Cleavers",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [80, 60, 60, 50, 50, 0, 0],
-    maxSharpness:  [80, 60, 60, 50, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "dualcleavers",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_dualblades__16a: DualBlades = {
-    category: "dualblades",
-    id: "16a",
-
-    name: "Cerulean Axes I",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__15b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [20, 50, 150, 80, 0, 0, 0],
-    maxSharpness:  [20, 50, 150, 100, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ceruleanaxesi",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_dualblades__16b: DualBlades = {
-    category: "dualblades",
-    id: "16b",
-
-    name: "Cerulean Axes II",
-    treeName: "Arzuros Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__16a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__15b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 100, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ceruleanaxesii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_dualblades__16c: DualBlades = {
-    category: "dualblades",
-    id: "16c",
-
-    name: "Ashigara Axes",
-    treeName: "Arzuros Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__16b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__16a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__15b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 100, 90, 20, 0, 0],
-    maxSharpness:  [70, 70, 100, 90, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "ashigaraaxes",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_dualblades__17a: DualBlades = {
-    category: "dualblades",
-    id: "17a",
-
-    name: "Flammenschild I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__15b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 50, 20, 0, 0, 0],
-    maxSharpness:  [90, 90, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammenschildi",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_dualblades__17b: DualBlades = {
-    category: "dualblades",
-    id: "17b",
-
-    name: "Flammenschild II",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_dualblades__17a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__15b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [130, 80, 70, 50, 20, 0, 0],
-    maxSharpness:  [130, 80, 70, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammenschildii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_dualblades__17c: DualBlades = {
-    category: "dualblades",
-    id: "17c",
-
-    name: "Gnashing Flammenschild",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__17b],
-            [__generated_ramp__fire_boost_2, __generated_dualblades__17b],
-            [__generated_ramp__fire_boost_1, __generated_dualblades__17a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__15b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__15b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__15a],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__7a],
-        ],
-    ],
-
-    baseSharpness: [130, 60, 70, 50, 40, 0, 0],
-    maxSharpness:  [130, 60, 70, 50, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gnashingflammenschild",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_dualblades__18a: DualBlades = {
-    category: "dualblades",
-    id: "18a",
-
-    name: "Bone Hatchets I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonehatchetsi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_dualblades__18b: DualBlades = {
-    category: "dualblades",
-    id: "18b",
-
-    name: "Bone Hatchets II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonehatchetsii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_dualblades__18c: DualBlades = {
-    category: "dualblades",
-    id: "18c",
-
-    name: "Wild Hatchets",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 0, 0, 0, 0],
-    maxSharpness:  [90, 50, 110, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wildhatchets",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_dualblades__18d: DualBlades = {
-    category: "dualblades",
-    id: "18d",
-
-    name: "Talon Carvers I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 70, 20, 0, 0, 0],
-    maxSharpness:  [70, 90, 70, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "taloncarversi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_dualblades__18e: DualBlades = {
-    category: "dualblades",
-    id: "18e",
-
-    name: "Talon Carvers II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "taloncarversii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_dualblades__18f: DualBlades = {
-    category: "dualblades",
-    id: "18f",
-
-    name: "Talon Twins",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__18e],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 80, 70, 10, 0, 0],
-    maxSharpness:  [70, 70, 80, 70, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "talontwins",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_dualblades__19a: DualBlades = {
-    category: "dualblades",
-    id: "19a",
-
-    name: "Twin Flames I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__18e],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18e],
-            [__generated_ramp__dulling_strike, __generated_dualblades__18e],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 90, 80, 60, 40, 0, 0],
-    maxSharpness:  [80, 90, 80, 60, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "twinflamesi",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_dualblades__19b: DualBlades = {
-    category: "dualblades",
-    id: "19b",
-
-    name: "Twin Flames II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__18e],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18e],
-            [__generated_ramp__dulling_strike, __generated_dualblades__18e],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 130, 80, 50, 0, 0],
-    maxSharpness:  [60, 30, 130, 80, 90, 10, 0],
-
-    filterHelpers: {
-        nameLower: "twinflamesii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_dualblades__19c: DualBlades = {
-    category: "dualblades",
-    id: "19c",
-
-    name: "Wyvern Lovers",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__19b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18e],
-            [__generated_ramp__dulling_strike, __generated_dualblades__18e],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 70, 90, 60, 0, 0],
-    maxSharpness:  [80, 50, 70, 90, 90, 20, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernlovers",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_dualblades__20a: DualBlades = {
-    category: "dualblades",
-    id: "20a",
-
-    name: "Diablos Bashers I",
-    treeName: "Diablos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -15,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18d],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 30, 40, 0, 0, 0],
-    maxSharpness:  [110, 70, 30, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "diablosbashersi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_dualblades__20b: DualBlades = {
-    category: "dualblades",
-    id: "20b",
-
-    name: "Diablos Bashers II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -15,
-    defense: 12,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__20a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-        ],
-    ],
-
-    baseSharpness: [150, 100, 40, 60, 0, 0, 0],
-    maxSharpness:  [150, 100, 40, 100, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "diablosbashersii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_dualblades__20c: DualBlades = {
-    category: "dualblades",
-    id: "20c",
-
-    name: "Diablos Mashers",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 250,
-    affinity: -15,
-    defense: 16,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__20b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__20b],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__20a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-        ],
-    ],
-
-    baseSharpness: [130, 50, 30, 90, 0, 0, 0],
-    maxSharpness:  [130, 50, 30, 100, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "diablosmashers",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_dualblades__21a: DualBlades = {
-    category: "dualblades",
-    id: "21a",
-
-    name: "Jyura Duo I",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__20a],
-            [__generated_ramp__dulling_strike, __generated_dualblades__20a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18d],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 40, 60, 10, 0, 0],
-    maxSharpness:  [100, 90, 40, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "jyuraduoi",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_dualblades__21b: DualBlades = {
-    category: "dualblades",
-    id: "21b",
-
-    name: "Jyura Duo II",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__water_boost_1, __generated_dualblades__21a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__20a],
-            [__generated_ramp__dulling_strike, __generated_dualblades__20a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18d],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 50, 50, 20, 0, 0],
-    maxSharpness:  [110, 70, 50, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "jyuraduoii",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_dualblades__21c: DualBlades = {
-    category: "dualblades",
-    id: "21c",
-
-    name: "Jyura Pulverizers",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__21b],
-            [__generated_ramp__water_boost_1, __generated_dualblades__21a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__20a],
-            [__generated_ramp__dulling_strike, __generated_dualblades__20a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18d],
-        ],
-    ],
-
-    baseSharpness: [120, 110, 50, 40, 30, 0, 0],
-    maxSharpness:  [120, 110, 50, 40, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "jyurapulverizers",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_dualblades__22a: DualBlades = {
-    category: "dualblades",
-    id: "22a",
-
-    name: "Kadachi Twinblades I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18c],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__18c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 60, 60, 0, 0, 0],
-    maxSharpness:  [50, 80, 60, 110, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kadachitwinbladesi",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_dualblades__22b: DualBlades = {
-    category: "dualblades",
-    id: "22b",
-
-    name: "Kadachi Twinblades II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__22a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18c],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 30, 40, 40, 0, 0],
-    maxSharpness:  [100, 90, 30, 40, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kadachitwinbladesii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_dualblades__22c: DualBlades = {
-    category: "dualblades",
-    id: "22c",
-
-    name: "Shockblades",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__22b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__22b],
-            [__generated_ramp__thunder_boost_2, __generated_dualblades__22b],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__22a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18c],
-        ],
-    ],
-
-    baseSharpness: [80, 90, 30, 50, 50, 0, 0],
-    maxSharpness:  [80, 90, 30, 50, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "shockblades",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_dualblades__23a: DualBlades = {
-    category: "dualblades",
-    id: "23a",
-
-    name: "Blazeblades I",
-    treeName: "Fire Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 40, 80, 50, 0, 0, 0],
-    maxSharpness:  [80, 40, 80, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "blazebladesi",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_dualblades__23b: DualBlades = {
-    category: "dualblades",
-    id: "23b",
-
-    name: "Blazeblades II",
-    treeName: "Fire Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__23a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 40, 60, 70, 0, 0, 0],
-    maxSharpness:  [80, 40, 60, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "blazebladesii",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_dualblades__23c: DualBlades = {
-    category: "dualblades",
-    id: "23c",
-
-    name: "Infernal Furies",
-    treeName: "Fire Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__23b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__23a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 60, 70, 90, 0, 0, 0],
-    maxSharpness:  [80, 60, 70, 90, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "infernalfuries",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_dualblades__24a: DualBlades = {
-    category: "dualblades",
-    id: "24a",
-
-    name: "Ludroth Pair I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 30, 0, 0, 0],
-    maxSharpness:  [50, 60, 110, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ludrothpairi",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_dualblades__24b: DualBlades = {
-    category: "dualblades",
-    id: "24b",
-
-    name: "Ludroth Pair II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_dualblades__24a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 110, 80, 0, 0, 0],
-    maxSharpness:  [60, 50, 110, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ludrothpairii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_dualblades__24c: DualBlades = {
-    category: "dualblades",
-    id: "24c",
-
-    name: "Double Droth",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__24b],
-            [__generated_ramp__water_boost_1, __generated_dualblades__24a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 20, 80, 90, 20, 0, 0],
-    maxSharpness:  [90, 20, 80, 90, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "doubledroth",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_dualblades__25a: DualBlades = {
-    category: "dualblades",
-    id: "25a",
-
-    name: "Frilled Claw I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__24a],
-            [__generated_ramp__water_boost_1, __generated_dualblades__24a],
-            [__generated_ramp__waterblight_exploit, __generated_dualblades__24a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 30, 0, 0, 0],
-    maxSharpness:  [50, 50, 120, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledclawi",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_dualblades__25b: DualBlades = {
-    category: "dualblades",
-    id: "25b",
-
-    name: "Frilled Claw II",
-    treeName: "Somnacanth Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__25a],
-            [__generated_ramp__water_boost_1, __generated_dualblades__24a],
-            [__generated_ramp__waterblight_exploit, __generated_dualblades__24a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 110, 40, 0, 0, 0],
-    maxSharpness:  [40, 60, 110, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledclawii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_dualblades__25c: DualBlades = {
-    category: "dualblades",
-    id: "25c",
-
-    name: "Illusory Frilled Claw",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__25b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__25a],
-            [__generated_ramp__water_boost_1, __generated_dualblades__24a],
-            [__generated_ramp__waterblight_exploit, __generated_dualblades__24a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 120, 90, 0, 0, 0],
-    maxSharpness:  [50, 90, 120, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "illusoryfrilledclaw",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_dualblades__26a: DualBlades = {
-    category: "dualblades",
-    id: "26a",
-
-    name: "Snow Slicers I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18a],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 80, 30, 0, 0, 0],
-    maxSharpness:  [70, 70, 80, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snowslicersi",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_dualblades__26b: DualBlades = {
-    category: "dualblades",
-    id: "26b",
-
-    name: "Snow Slicers II",
-    treeName: "Lagombi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_dualblades__26a],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__18a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18a],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 100, 40, 0, 0, 0],
-    maxSharpness:  [80, 80, 100, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snowslicersii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_dualblades__26c: DualBlades = {
-    category: "dualblades",
-    id: "26c",
-
-    name: "Snow Sisters",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__26b],
-            [__generated_ramp__small_monster_exploit, __generated_dualblades__26b],
-            [__generated_ramp__ice_boost_1, __generated_dualblades__26a],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__18a],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 100, 90, 10, 0, 0],
-    maxSharpness:  [60, 40, 100, 90, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "snowsisters",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_dualblades__27a: DualBlades = {
-    category: "dualblades",
-    id: "27a",
-
-    name: "Sinister Blades I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterbladesi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_dualblades__27b: DualBlades = {
-    category: "dualblades",
-    id: "27b",
-
-    name: "Sinister Blades II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__27a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterbladesii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_dualblades__27c: DualBlades = {
-    category: "dualblades",
-    id: "27c",
-
-    name: "Sinister Famineblades",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_dualblades__27b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__27a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterfamineblades",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_dualblades__28a: DualBlades = {
-    category: "dualblades",
-    id: "28a",
-
-    name: "Suzuka Takamaru I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 80, 0, 0, 0],
-    maxSharpness:  [60, 40, 120, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "suzukatakamarui",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_dualblades__28b: DualBlades = {
-    category: "dualblades",
-    id: "28b",
-
-    name: "Suzuka Takamaru II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__28a],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 150, 100, 10, 0, 0],
-    maxSharpness:  [60, 30, 150, 100, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "suzukatakamaruii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_dualblades__28c: DualBlades = {
-    category: "dualblades",
-    id: "28c",
-
-    name: "Suzuka Otakemaru",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__28b],
-            [__generated_ramp__thunder_boost_1, __generated_dualblades__28a],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 80, 100, 20, 0, 0],
-    maxSharpness:  [100, 50, 80, 100, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "suzukaotakemaru",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_dualblades__29a: DualBlades = {
-    category: "dualblades",
-    id: "29a",
-
-    name: "Azure Elder Blades I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 6]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderbladesi",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_dualblades__29b: DualBlades = {
-    category: "dualblades",
-    id: "29b",
-
-    name: "Azure Elder Blades II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__29a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderbladesii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_dualblades__29c: DualBlades = {
-    category: "dualblades",
-    id: "29c",
-
-    name: "Abyssal Gale Blades",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_dualblades__29b],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__29a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalgaleblades",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_dualblades__30a: DualBlades = {
-    category: "dualblades",
-    id: "30a",
-
-    name: "Thunderbolt Blades I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 180, 40, 40, 0, 0],
-    maxSharpness:  [20, 20, 180, 40, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "thunderboltbladesi",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_dualblades__30b: DualBlades = {
-    category: "dualblades",
-    id: "30b",
-
-    name: "Abyssal Storm Blades",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__30a],
-        ],
-    ],
-
-    baseSharpness: [20, 10, 220, 40, 60, 0, 0],
-    maxSharpness:  [20, 10, 220, 40, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalstormblades",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_dualblades__31a: DualBlades = {
-    category: "dualblades",
-    id: "31a",
-
-    name: "Rookslayer Handaxes I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 60, 90, 0, 0, 0],
-    maxSharpness:  [60, 90, 60, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rookslayerhandaxesi",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_dualblades__31b: DualBlades = {
-    category: "dualblades",
-    id: "31b",
-
-    name: "Rookslayer Handaxes II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [60, 110, 90, 70, 20, 0, 0],
-    maxSharpness:  [60, 110, 90, 70, 40, 30, 0],
-
-    filterHelpers: {
-        nameLower: "rookslayerhandaxesii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_dualblades__31c: DualBlades = {
-    category: "dualblades",
-    id: "31c",
-
-    name: "Bazelhawk Rookslayer",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__31b],
-            [__generated_ramp__blast_boost_2, __generated_dualblades__31b],
-        ],
-    ],
-
-    baseSharpness: [60, 110, 80, 70, 30, 0, 0],
-    maxSharpness:  [60, 110, 80, 70, 30, 50, 0],
-
-    filterHelpers: {
-        nameLower: "bazelhawkrookslayer",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_dualblades__32a: DualBlades = {
-    category: "dualblades",
-    id: "32a",
-
-    name: "Gelosteel Fang I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 90, 40, 30, 0, 0],
-    maxSharpness:  [100, 90, 90, 40, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "icesteelfangi",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_dualblades__32b: DualBlades = {
-    category: "dualblades",
-    id: "32b",
-
-    name: "Daora's Hook",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__32a],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__32a],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 90, 50, 30, 10, 0],
-    maxSharpness:  [90, 80, 90, 50, 30, 60, 0],
-
-    filterHelpers: {
-        nameLower: "daora'shook",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_dualblades__33a: DualBlades = {
-    category: "dualblades",
-    id: "33a",
-
-    name: "Twin Nails I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 24], ["ice", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 70, 50, 30, 0, 0],
-    maxSharpness:  [80, 70, 70, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "twinnailsi",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_dualblades__33b: DualBlades = {
-    category: "dualblades",
-    id: "33b",
-
-    name: "Fire and Ice",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 36], ["ice", 48]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__33a],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 90, 30, 50, 0, 0],
-    maxSharpness:  [110, 70, 90, 30, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "fireandice",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_dualblades__34a: DualBlades = {
-    category: "dualblades",
-    id: "34a",
-
-    name: "Rouge Flames I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 150, 70, 20, 0, 0],
-    maxSharpness:  [50, 60, 150, 70, 20, 50, 0],
-
-    filterHelpers: {
-        nameLower: "rougeflamesi",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_dualblades__34b: DualBlades = {
-    category: "dualblades",
-    id: "34b",
-
-    name: "Dual Chameleos",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__34a],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 70, 90, 30, 10, 0],
-    maxSharpness:  [90, 60, 70, 90, 30, 60, 0],
-
-    filterHelpers: {
-        nameLower: "dualchameleos",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_dualblades__35a: DualBlades = {
-    category: "dualblades",
-    id: "35a",
-
-    name: "Redwing Blades I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    filterHelpers: {
-        nameLower: "redwingbladesi",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_dualblades__35b: DualBlades = {
-    category: "dualblades",
-    id: "35b",
-
-    name: "Reddnaught Dragão Wing",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    filterHelpers: {
-        nameLower: "reddnaughtdragonwing",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_dualblades__36a: DualBlades = {
-    category: "dualblades",
-    id: "36a",
-
-    name: "Felyne Claws I",
-    treeName: "Felyne Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 5]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__hellion_mode, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 90, 50, 10, 0, 0],
-    maxSharpness:  [100, 50, 90, 50, 10, 50, 0],
-
-    filterHelpers: {
-        nameLower: "felyneclawsi",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_dualblades__36b: DualBlades = {
-    category: "dualblades",
-    id: "36b",
-
-    name: "Felyne Claws II",
-    treeName: "Felyne Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__hellion_mode, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    baseSharpness: [130, 50, 90, 70, 10, 0, 0],
-    maxSharpness:  [130, 50, 90, 70, 10, 50, 0],
-
-    filterHelpers: {
-        nameLower: "felyneclawsii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_dualblades__36c: DualBlades = {
-    category: "dualblades",
-    id: "36c",
-
-    name: "Raging Claws",
-    treeName: "Felyne Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__hellion_mode, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__36b],
-        ],
-    ],
-
-    baseSharpness: [120, 50, 80, 90, 10, 0, 0],
-    maxSharpness:  [120, 50, 80, 90, 10, 50, 0],
-
-    filterHelpers: {
-        nameLower: "ragingclaws",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_dualblades__37a: DualBlades = {
-    category: "dualblades",
-    id: "37a",
-
-    name: "Rainy Jelly I",
-    treeName: "Jelly Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 90, 20, 10, 0, 0],
-    maxSharpness:  [80, 100, 90, 20, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rainyjellyi",
-        treeNameLower: "jellytree",
-    },
-};
-
-const __generated_dualblades__37b: DualBlades = {
-    category: "dualblades",
-    id: "37b",
-
-    name: "Rainy Jelly II",
-    treeName: "Jelly Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__37a],
-        ],
-    ],
-
-    baseSharpness: [70, 110, 80, 20, 20, 0, 0],
-    maxSharpness:  [70, 110, 80, 20, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rainyjellyii",
-        treeNameLower: "jellytree",
-    },
-};
-
-const __generated_dualblades__37c: DualBlades = {
-    category: "dualblades",
-    id: "37c",
-
-    name: "Rain of Gore",
-    treeName: "Jelly Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__37b],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__37b],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__37a],
-        ],
-    ],
-
-    baseSharpness: [100, 130, 80, 10, 30, 0, 0],
-    maxSharpness:  [100, 130, 80, 10, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rainofgore",
-        treeNameLower: "jellytree",
-    },
-};
-
-const __generated_dualblades__38a: DualBlades = {
-    category: "dualblades",
-    id: "38a",
-
-    name: "Qornu Waga I",
-    treeName: "Aelucanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 90, 40, 0, 0, 0],
-    maxSharpness:  [60, 60, 90, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "qornuwagai",
-        treeNameLower: "aelucanthtree",
-    },
-};
-
-const __generated_dualblades__38b: DualBlades = {
-    category: "dualblades",
-    id: "38b",
-
-    name: "Qornu Waga II",
-    treeName: "Aelucanth Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__38a],
-        ],
-    ],
-
-    baseSharpness: [30, 30, 170, 60, 10, 0, 0],
-    maxSharpness:  [30, 30, 170, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "qornuwagaii",
-        treeNameLower: "aelucanthtree",
-    },
-};
-
-const __generated_dualblades__38c: DualBlades = {
-    category: "dualblades",
-    id: "38c",
-
-    name: "Ro Waga",
-    treeName: "Aelucanth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__38b],
-            [__generated_ramp__dragon_boost_2, __generated_dualblades__38b],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__38a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 110, 100, 20, 0, 0],
-    maxSharpness:  [50, 70, 110, 100, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rowaga",
-        treeNameLower: "aelucanthtree",
-    },
-};
-
-const __generated_dualblades__39a: DualBlades = {
-    category: "dualblades",
-    id: "39a",
-
-    name: "Sworn Rapiers I",
-    treeName: "Guild Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 40, 30, 0, 0, 0],
-    maxSharpness:  [90, 90, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "swornrapiersi",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_dualblades__39b: DualBlades = {
-    category: "dualblades",
-    id: "39b",
-
-    name: "Sworn Rapiers II",
-    treeName: "Guild Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 60, 50, 20, 0, 0],
-    maxSharpness:  [50, 70, 60, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "swornrapiersii",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_dualblades__39c: DualBlades = {
-    category: "dualblades",
-    id: "39c",
-
-    name: "Holy Sabers",
-    treeName: "Guild Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__39b],
-            [__generated_ramp__water_boost_2, __generated_dualblades__39b],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 70, 40, 50, 0, 0],
-    maxSharpness:  [50, 90, 70, 40, 90, 10, 0],
-
-    filterHelpers: {
-        nameLower: "holysabers",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_dualblades__40a: DualBlades = {
-    category: "dualblades",
-    id: "40a",
-
-    name: "Altair I",
-    treeName: "Guild Tree 2",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [110, 60, 30, 30, 20, 0, 0],
-    maxSharpness:  [110, 60, 30, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "altairi",
-        treeNameLower: "guildtree2",
-    },
-};
-
-const __generated_dualblades__40b: DualBlades = {
-    category: "dualblades",
-    id: "40b",
-
-    name: "Altair II",
-    treeName: "Guild Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 12,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__40a],
-        ],
-    ],
-
-    baseSharpness: [110, 80, 60, 20, 30, 0, 0],
-    maxSharpness:  [110, 80, 60, 20, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "altairii",
-        treeNameLower: "guildtree2",
-    },
-};
-
-const __generated_dualblades__40c: DualBlades = {
-    category: "dualblades",
-    id: "40c",
-
-    name: "Fortis Gran",
-    treeName: "Guild Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__40b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__40a],
-        ],
-    ],
-
-    baseSharpness: [110, 80, 80, 30, 50, 0, 0],
-    maxSharpness:  [110, 80, 80, 30, 60, 40, 0],
-
-    filterHelpers: {
-        nameLower: "fortisgran",
-        treeNameLower: "guildtree2",
-    },
-};
-
-const __generated_dualblades__41a: DualBlades = {
-    category: "dualblades",
-    id: "41a",
-
-    name: "Stealth Dango I",
-    treeName: "Smithy Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 3]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [90, 30, 90, 40, 0, 0, 0],
-    maxSharpness:  [90, 30, 90, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "stealthdangoi",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_dualblades__41b: DualBlades = {
-    category: "dualblades",
-    id: "41b",
-
-    name: "Stealth Dango II",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 5]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__41a],
-        ],
-    ],
-
-    baseSharpness: [110, 30, 100, 60, 0, 0, 0],
-    maxSharpness:  [110, 30, 100, 90, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "stealthdangoii",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_dualblades__41c: DualBlades = {
-    category: "dualblades",
-    id: "41c",
-
-    name: "Perfected Dango",
-    treeName: "Smithy Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__41b],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__41a],
-        ],
-    ],
-
-    baseSharpness: [130, 40, 110, 70, 0, 0, 0],
-    maxSharpness:  [130, 40, 110, 70, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "perfecteddango",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_dualblades__ra: DualBlades = {
-    category: "dualblades",
-    id: "ra",
-
-    name: "Rampage Twinblades I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagetwinbladesi",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_dualblades__rb: DualBlades = {
-    category: "dualblades",
-    id: "rb",
-
-    name: "Rampage Twinblades II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__secondary_fire_1, null],
-            [__generated_ramp__secondary_water_1, null],
-            [__generated_ramp__secondary_thunder_1, null],
-            [__generated_ramp__secondary_ice_1, null],
-            [__generated_ramp__secondary_dragon_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagetwinbladesii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_dualblades__rc: DualBlades = {
-    category: "dualblades",
-    id: "rc",
-
-    name: "Rampage Twinblades III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__secondary_fire_1, null],
-            [__generated_ramp__secondary_water_1, null],
-            [__generated_ramp__secondary_thunder_1, null],
-            [__generated_ramp__secondary_ice_1, null],
-            [__generated_ramp__secondary_dragon_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagetwinbladesiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_dualblades__rd: DualBlades = {
-    category: "dualblades",
-    id: "rd",
-
-    name: "Rampage Twinblades IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_dualblades__rc],
-            [__generated_ramp__water_1, __generated_dualblades__rc],
-            [__generated_ramp__thunder_1, __generated_dualblades__rc],
-            [__generated_ramp__ice_1, __generated_dualblades__rc],
-            [__generated_ramp__dragon_1, __generated_dualblades__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__secondary_fire_2, null],
-            [__generated_ramp__secondary_water_2, null],
-            [__generated_ramp__secondary_thunder_2, null],
-            [__generated_ramp__secondary_ice_2, null],
-            [__generated_ramp__secondary_dragon_2, null],
-            [__generated_ramp__secondary_fire_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_water_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_thunder_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_ice_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_dragon_1, __generated_dualblades__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagetwinbladesiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_dualblades__re: DualBlades = {
-    category: "dualblades",
-    id: "re",
-
-    name: "Rampage Twinblades V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__rd],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__rd],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__rd],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_dualblades__rd],
-            [__generated_ramp__water_2, __generated_dualblades__rd],
-            [__generated_ramp__thunder_2, __generated_dualblades__rd],
-            [__generated_ramp__ice_2, __generated_dualblades__rd],
-            [__generated_ramp__dragon_2, __generated_dualblades__rd],
-            [__generated_ramp__fire_1, __generated_dualblades__rc],
-            [__generated_ramp__water_1, __generated_dualblades__rc],
-            [__generated_ramp__thunder_1, __generated_dualblades__rc],
-            [__generated_ramp__ice_1, __generated_dualblades__rc],
-            [__generated_ramp__dragon_1, __generated_dualblades__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__secondary_fire_2, null],
-            [__generated_ramp__secondary_water_2, null],
-            [__generated_ramp__secondary_thunder_2, null],
-            [__generated_ramp__secondary_ice_2, null],
-            [__generated_ramp__secondary_dragon_2, null],
-            [__generated_ramp__secondary_fire_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_water_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_thunder_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_ice_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_dragon_1, __generated_dualblades__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rampagetwinbladesv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_dualblades__rf: DualBlades = {
-    category: "dualblades",
-    id: "rf",
-
-    name: "Rampage Twinblades S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_dualblades__re],
-            [__generated_ramp__affinity_boost_3, __generated_dualblades__re],
-            [__generated_ramp__attack_boost_2, __generated_dualblades__rd],
-            [__generated_ramp__affinity_boost_2, __generated_dualblades__rd],
-            [__generated_ramp__defense_boost_2, __generated_dualblades__rd],
-            [__generated_ramp__attack_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__affinity_boost_1, __generated_dualblades__rb],
-            [__generated_ramp__defense_boost_1, __generated_dualblades__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_dualblades__re],
-            [__generated_ramp__paralysis_1, __generated_dualblades__re],
-            [__generated_ramp__sleep_1, __generated_dualblades__re],
-            [__generated_ramp__blast_1, __generated_dualblades__re],
-            [__generated_ramp__fire_2, __generated_dualblades__rd],
-            [__generated_ramp__water_2, __generated_dualblades__rd],
-            [__generated_ramp__thunder_2, __generated_dualblades__rd],
-            [__generated_ramp__ice_2, __generated_dualblades__rd],
-            [__generated_ramp__dragon_2, __generated_dualblades__rd],
-            [__generated_ramp__fire_1, __generated_dualblades__rc],
-            [__generated_ramp__water_1, __generated_dualblades__rc],
-            [__generated_ramp__thunder_1, __generated_dualblades__rc],
-            [__generated_ramp__ice_1, __generated_dualblades__rc],
-            [__generated_ramp__dragon_1, __generated_dualblades__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__secondary_fire_3, null],
-            [__generated_ramp__secondary_water_3, null],
-            [__generated_ramp__secondary_thunder_3, null],
-            [__generated_ramp__secondary_ice_3, null],
-            [__generated_ramp__secondary_dragon_3, null],
-            [__generated_ramp__secondary_fire_2, __generated_dualblades__re],
-            [__generated_ramp__secondary_water_2, __generated_dualblades__re],
-            [__generated_ramp__secondary_thunder_2, __generated_dualblades__re],
-            [__generated_ramp__secondary_ice_2, __generated_dualblades__re],
-            [__generated_ramp__secondary_dragon_2, __generated_dualblades__re],
-            [__generated_ramp__secondary_fire_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_water_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_thunder_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_ice_1, __generated_dualblades__rc],
-            [__generated_ramp__secondary_dragon_1, __generated_dualblades__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagetwinbladess",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"dualblades","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Glintblades I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0]},{"id":"1b","name":"Kamura Glintblades II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0]},{"id":"1c","name":"Kamura Glintblades III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0]},{"id":"1d","name":"Kamura Glintblades IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"1e","name":"Kamura Glintblades V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0]},{"id":"1f","name":"Kamura Ninja Blades","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0]}]],["Almudron Tree",[{"id":"2a","name":"Mud Ripper I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",22]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,50,100,50,0,0,0],"maxSharpness":[50,50,100,80,20,0,0]},{"id":"2b","name":"Mud Ripper II","rarity":6,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",27]],"rampSkills":[[["attack_boost_3",null],["water_boost_1",null],["element_exploit",null],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,60,80,60,40,0,0],"maxSharpness":[60,60,80,60,90,0,0]},{"id":"2c","name":"Mud Twister","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",29]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["element_exploit",null],["water_boost_1","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,60,80,90,60,0,0],"maxSharpness":[60,60,80,90,110,0,0]}]],["Zinogre Tree",[{"id":"3a","name":"Usurper\'s Fulgur I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,40,50,100,0,0,0],"maxSharpness":[60,40,50,150,0,0,0]},{"id":"3b","name":"Usurper\'s Fulgur II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",22]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","3a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,30,100,90,20,0,0],"maxSharpness":[60,30,100,90,70,0,0]},{"id":"3c","name":"Despot\'s Blitz","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",25]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","3b"],["attack_boost_1","3a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,40,120,100,30,0,0],"maxSharpness":[60,40,120,100,50,30,0]}]],["Barioth Tree",[{"id":"4a","name":"Blizzarioths I","rarity":2,"endlineTag":"","attack":90,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,50,80,70,0,0,0],"maxSharpness":[50,50,80,100,20,0,0]},{"id":"4b","name":"Blizzarioths II","rarity":5,"endlineTag":"","attack":160,"affinity":20,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",18]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","4a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,30,130,100,40,0,0],"maxSharpness":[50,30,130,100,80,10,0]},{"id":"4c","name":"Mountain Blizzarioths","rarity":6,"endlineTag":"hr","attack":180,"affinity":20,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","4b"],["attack_boost_2","4a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,80,20,0]}]],["Wroggi Tree",[{"id":"5a","name":"Desperado I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",10]],"rampSkills":[[["affinity_boost_1",null],["poison_boost_1",null],["buddy_rally",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,50,50,30,0,0,0],"maxSharpness":[70,50,50,80,0,0,0]},{"id":"5b","name":"Desperado II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",15]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_1",null],["buddy_rally",null],["affinity_boost_1","5a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,50,60,50,0,0,0],"maxSharpness":[90,50,60,100,0,0,0]},{"id":"5c","name":"The Kid","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",20]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_2",null],["buddy_rally",null],["poison_boost_1","5b"],["affinity_boost_1","5a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,50,60,80,20,0,0],"maxSharpness":[90,50,60,80,60,10,0]}]],["Khezu Tree",[{"id":"6a","name":"Khezu Daggers I","rarity":2,"endlineTag":"","attack":90,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["paralysis",8],["thunder",20]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["paralysis_boost_1",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[80,60,70,40,0,0,0],"maxSharpness":[80,60,70,90,0,0,0]},{"id":"6b","name":"Khezu Daggers II","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["paralysis",10],["thunder",24]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_2",null],["paralysis_boost_1",null],["attack_boost_2","6a"],["thunder_boost_1","6a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[60,60,80,50,0,0,0],"maxSharpness":[60,60,80,100,0,0,0]},{"id":"6c","name":"Khezu Skards","rarity":4,"endlineTag":"hr","attack":150,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[["paralysis",14],["thunder",28]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["paralysis_boost_2",null],["attack_boost_3","6b"],["paralysis_boost_1","6b"],["attack_boost_2","6a"],["thunder_boost_1","6a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[40,50,90,90,30,0,0],"maxSharpness":[40,50,90,90,70,10,0]}]],["Ore Tree",[{"id":"7a","name":"Matched Slicers I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0]},{"id":"7b","name":"Matched Slicers II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,110,10,0,0,0]},{"id":"7c","name":"Dual Daggers","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","7b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,90,0,0,0]},{"id":"7d","name":"Hurricane I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0]},{"id":"7e","name":"Hurricane II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[90,70,70,50,20,0,0],"maxSharpness":[90,70,70,50,60,10,0]},{"id":"7f","name":"Cyclone","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","7e"],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[80,80,100,60,30,0,0],"maxSharpness":[80,80,100,60,60,20,0]}]],["Tigrex Tree",[{"id":"8a","name":"Rex Slicers I","rarity":3,"endlineTag":"","attack":160,"affinity":-25,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","7d"],["silkbind_boost","7d"],["attack_boost_1","7b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0]},{"id":"8b","name":"Rex Slicers II","rarity":6,"endlineTag":"","attack":220,"affinity":-25,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","8a"],["defense_boost_2","7d"],["silkbind_boost","7d"],["attack_boost_1","7b"]]],"baseSharpness":[50,40,110,100,50,0,0],"maxSharpness":[50,40,110,100,80,20,0]},{"id":"8c","name":"Tigrex Claws","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","8b"],["affinity_boost_1","8a"],["defense_boost_2","7d"],["silkbind_boost","7d"],["attack_boost_1","7b"]]],"baseSharpness":[50,40,100,120,70,20,0],"maxSharpness":[50,40,100,120,70,20,0]}]],["Mizutsune Tree",[{"id":"9a","name":"Morning Dawn I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",12]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,40,90,60,0,0,0],"maxSharpness":[60,40,90,90,20,0,0]},{"id":"9b","name":"Morning Dawn II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","9a"],["water_boost_1","9a"],["attack_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,80,100,80,30,0,0],"maxSharpness":[60,80,100,80,60,20,0]},{"id":"9c","name":"Evening Dusk","rarity":6,"endlineTag":"hr","attack":200,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",18]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","9b"],["affinity_boost_1","9a"],["water_boost_1","9a"],["attack_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,40,120,90,40,0,0],"maxSharpness":[60,40,120,90,40,50,0]}]],["Aknosom Tree",[{"id":"10a","name":"Schirmscorn I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",10]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0]},{"id":"10b","name":"Schirmscorn II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",15]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["fireblight_exploit",null],["attack_boost_1","10a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[50,50,130,60,10,0,0],"maxSharpness":[50,50,130,60,40,20,0]},{"id":"10c","name":"Daybreak Daggers","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["fire_boost_1","10b"],["attack_boost_1","10a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[50,50,150,70,30,0,0],"maxSharpness":[50,50,150,70,50,30,0]}]],["Kulu-Ya-Ku Tree",[{"id":"11a","name":"Kulu\'s Peck I","rarity":2,"endlineTag":"","attack":100,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["spiribird_doubled",null],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[80,80,50,40,0,0,0],"maxSharpness":[80,80,50,90,0,0,0]},{"id":"11b","name":"Kulu\'s Peck II","rarity":2,"endlineTag":"","attack":110,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["spiribird_doubled",null],["attack_boost_1","11a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[60,60,70,60,0,0,0],"maxSharpness":[60,60,70,110,0,0,0]},{"id":"11c","name":"Kulu\'s Lasher","rarity":4,"endlineTag":"hr","attack":160,"affinity":20,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["spiribird_doubled",null],["affinity_boost_2","11b"],["attack_boost_1","11a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[60,80,80,50,30,0,0],"maxSharpness":[60,80,80,50,80,0,0]}]],["Ice Tree",[{"id":"12a","name":"Gelid Mind I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",18]],"rampSkills":[[["defense_boost_1",null],["ice_boost_1",null],["dulling_strike",null],["attack_boost_2","11b"],["affinity_boost_2","11b"],["spiribird_doubled","11b"],["attack_boost_1","11a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[90,90,100,20,0,0,0],"maxSharpness":[90,90,100,60,10,0,0]},{"id":"12b","name":"Gelid Mind II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["ice",22]],"rampSkills":[[["defense_boost_1",null],["ice_boost_2",null],["dulling_strike",null],["ice_boost_1","12a"],["attack_boost_2","11b"],["affinity_boost_2","11b"],["spiribird_doubled","11b"],["attack_boost_1","11a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[90,70,110,30,0,0,0],"maxSharpness":[90,70,110,50,30,0,0]},{"id":"12c","name":"Gelid Soul","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",25]],"rampSkills":[[["defense_boost_2",null],["ice_boost_3",null],["dulling_strike",null],["defense_boost_1","12b"],["ice_boost_2","12b"],["ice_boost_1","12a"],["attack_boost_2","11b"],["affinity_boost_2","11b"],["spiribird_doubled","11b"],["attack_boost_1","11a"],["affinity_boost_1","7a"]]],"baseSharpness":[60,40,90,110,0,0,0],"maxSharpness":[60,40,90,110,50,0,0]}]],["Nargacuga Tree",[{"id":"13a","name":"Hidden Gemini I","rarity":3,"endlineTag":"","attack":110,"affinity":40,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["affinity_boost_2","11b"],["spiribird_doubled","11b"],["attack_boost_1","11a"],["defense_boost_2","7a"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0]},{"id":"13b","name":"Hidden Gemini II","rarity":5,"endlineTag":"","attack":180,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","13a"],["affinity_boost_2","11b"],["spiribird_doubled","11b"],["attack_boost_1","11a"],["defense_boost_2","7a"]]],"baseSharpness":[50,30,120,100,50,0,0],"maxSharpness":[50,30,120,100,70,30,0]},{"id":"13c","name":"Night Wings","rarity":6,"endlineTag":"hr","attack":190,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","13b"],["attack_boost_2","13a"],["spiribird_doubled","11b"],["attack_boost_1","11a"],["defense_boost_2","7a"]]],"baseSharpness":[70,40,100,90,70,30,0],"maxSharpness":[70,40,100,90,70,30,0]}]],["Thunder Tree",[{"id":"14a","name":"Twin Chainsaws I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",8]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0]},{"id":"14b","name":"Twin Chainsaws II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",10]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["thunderblight_exploit",null],["thunder_boost_1","14a"],["attack_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[40,50,90,70,0,0,0],"maxSharpness":[40,50,90,90,30,0,0]},{"id":"14c","name":"Guillotines","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",13]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["thunderblight_exploit",null],["affinity_boost_1","14b"],["thunder_boost_1","14a"],["attack_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[50,70,120,100,10,0,0],"maxSharpness":[50,70,120,100,60,0,0]}]],["Ore Tree 2",[{"id":"15a","name":"Dual Hatchets I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["small_monster_exploit",null],["defense_boost_2","7a"]]],"baseSharpness":[90,60,20,30,0,0,0],"maxSharpness":[90,60,20,80,0,0,0]},{"id":"15b","name":"Dual Hatchets II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["small_monster_exploit",null],["attack_boost_1","15a"],["defense_boost_2","7a"]]],"baseSharpness":[60,70,20,50,0,0,0],"maxSharpness":[60,70,20,70,30,0,0]},{"id":"15c","name":"Dual Cleavers","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["small_monster_exploit",null],["affinity_boost_1","15b"],["attack_boost_1","15a"],["defense_boost_2","7a"]]],"baseSharpness":[80,60,60,50,50,0,0],"maxSharpness":[80,60,60,50,50,50,0]}]],["Arzuros Tree",[{"id":"16a","name":"Cerulean Axes I","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_1","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["defense_boost_2","7a"]]],"baseSharpness":[20,50,150,80,0,0,0],"maxSharpness":[20,50,150,100,30,0,0]},{"id":"16b","name":"Cerulean Axes II","rarity":5,"endlineTag":"","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["dulling_strike",null],["defense_boost_1","16a"],["affinity_boost_1","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"]]],"baseSharpness":[50,50,100,100,0,0,0],"maxSharpness":[50,50,100,100,50,0,0]},{"id":"16c","name":"Ashigara Axes","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_2","16b"],["defense_boost_1","16a"],["affinity_boost_1","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"]]],"baseSharpness":[70,70,100,90,20,0,0],"maxSharpness":[70,70,100,90,60,10,0]}]],["Anjanath Tree",[{"id":"17a","name":"Flammenschild I","rarity":3,"endlineTag":"","attack":140,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["fire",10]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["defense_boost_2","7a"]]],"baseSharpness":[90,90,50,20,0,0,0],"maxSharpness":[90,90,50,70,0,0,0]},{"id":"17b","name":"Flammenschild II","rarity":5,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",15]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","17a"],["attack_boost_2","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["defense_boost_2","7a"]]],"baseSharpness":[130,80,70,50,20,0,0],"maxSharpness":[130,80,70,50,70,0,0]},{"id":"17c","name":"Gnashing Flammenschild","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",18]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","17b"],["fire_boost_2","17b"],["fire_boost_1","17a"],["attack_boost_2","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["defense_boost_2","7a"]]],"baseSharpness":[130,60,70,50,40,0,0],"maxSharpness":[130,60,70,50,90,0,0]}]],["Bone Tree",[{"id":"18a","name":"Bone Hatchets I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0]},{"id":"18b","name":"Bone Hatchets II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"18c","name":"Wild Hatchets","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","18b"]]],"baseSharpness":[90,50,60,0,0,0,0],"maxSharpness":[90,50,110,0,0,0,0]},{"id":"18d","name":"Talon Carvers I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[70,90,70,20,0,0,0],"maxSharpness":[70,90,70,70,0,0,0]},{"id":"18e","name":"Talon Carvers II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0]},{"id":"18f","name":"Talon Twins","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[70,70,80,70,10,0,0],"maxSharpness":[70,70,80,70,60,0,0]}]],["Rathalos Tree",[{"id":"19a","name":"Twin Flames I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_3","18e"],["affinity_boost_2","18e"],["dulling_strike","18e"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[80,90,80,60,40,0,0],"maxSharpness":[80,90,80,60,90,0,0]},{"id":"19b","name":"Twin Flames II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_3","18e"],["affinity_boost_2","18e"],["dulling_strike","18e"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[60,30,130,80,50,0,0],"maxSharpness":[60,30,130,80,90,10,0]},{"id":"19c","name":"Wyvern Lovers","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",28]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","19b"],["affinity_boost_2","18e"],["dulling_strike","18e"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[80,50,70,90,60,0,0],"maxSharpness":[80,50,70,90,90,20,0]}]],["Diablos Tree",[{"id":"20a","name":"Diablos Bashers I","rarity":3,"endlineTag":"","attack":170,"affinity":-15,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","18d"],["affinity_boost_2","18d"]]],"baseSharpness":[110,70,30,40,0,0,0],"maxSharpness":[110,70,30,90,0,0,0]},{"id":"20b","name":"Diablos Bashers II","rarity":6,"endlineTag":"","attack":230,"affinity":-15,"defense":12,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_1","20a"],["attack_boost_2","18d"]]],"baseSharpness":[150,100,40,60,0,0,0],"maxSharpness":[150,100,40,100,10,0,0]},{"id":"20c","name":"Diablos Mashers","rarity":6,"endlineTag":"hr","attack":250,"affinity":-15,"defense":16,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["affinity_boost_2","20b"],["defense_boost_1","20b"],["affinity_boost_1","20a"],["attack_boost_2","18d"]]],"baseSharpness":[130,50,30,90,0,0,0],"maxSharpness":[130,50,30,100,40,0,0]}]],["Jyuratodus Tree",[{"id":"21a","name":"Jyura Duo I","rarity":5,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",8]],"rampSkills":[[["affinity_boost_1",null],["water_boost_1",null],["brutal_strike",null],["defense_boost_1","20a"],["dulling_strike","20a"],["attack_boost_2","18d"],["affinity_boost_2","18d"]]],"baseSharpness":[100,90,40,60,10,0,0],"maxSharpness":[100,90,40,60,60,0,0]},{"id":"21b","name":"Jyura Duo II","rarity":5,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",10]],"rampSkills":[[["affinity_boost_1",null],["water_boost_2",null],["brutal_strike",null],["water_boost_1","21a"],["defense_boost_1","20a"],["dulling_strike","20a"],["attack_boost_2","18d"],["affinity_boost_2","18d"]]],"baseSharpness":[110,70,50,50,20,0,0],"maxSharpness":[110,70,50,50,70,0,0]},{"id":"21c","name":"Jyura Pulverizers","rarity":6,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",12]],"rampSkills":[[["affinity_boost_2",null],["water_boost_2",null],["brutal_strike",null],["affinity_boost_1","21b"],["water_boost_1","21a"],["defense_boost_1","20a"],["dulling_strike","20a"],["attack_boost_2","18d"]]],"baseSharpness":[120,110,50,40,30,0,0],"maxSharpness":[120,110,50,40,60,20,0]}]],["Tobi-Kadachi Tree",[{"id":"22a","name":"Kadachi Twinblades I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",12]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunder_boost_2",null],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[50,80,60,60,0,0,0],"maxSharpness":[50,80,60,110,0,0,0]},{"id":"22b","name":"Kadachi Twinblades II","rarity":5,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",15]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["thunder_boost_2",null],["affinity_boost_1","22a"],["attack_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[100,90,30,40,40,0,0],"maxSharpness":[100,90,30,40,90,0,0]},{"id":"22c","name":"Shockblades","rarity":6,"endlineTag":"hr","attack":190,"affinity":10,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunder_boost_3",null],["attack_boost_1","22b"],["affinity_boost_2","22b"],["thunder_boost_2","22b"],["affinity_boost_1","22a"],["defense_boost_1","18c"]]],"baseSharpness":[80,90,30,50,50,0,0],"maxSharpness":[80,90,30,50,80,20,0]}]],["Fire Tree",[{"id":"23a","name":"Blazeblades I","rarity":2,"endlineTag":"","attack":70,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["fire",20]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["dulling_strike",null],["attack_boost_2","18b"],["defense_boost_1","18b"]]],"baseSharpness":[80,40,80,50,0,0,0],"maxSharpness":[80,40,80,100,0,0,0]},{"id":"23b","name":"Blazeblades II","rarity":3,"endlineTag":"","attack":130,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["fire",23]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["dulling_strike",null],["attack_boost_1","23a"],["defense_boost_1","18b"]]],"baseSharpness":[80,40,60,70,0,0,0],"maxSharpness":[80,40,60,100,20,0,0]},{"id":"23c","name":"Infernal Furies","rarity":5,"endlineTag":"hr","attack":160,"affinity":-10,"defense":0,"decoSlots":[1,1],"eleStat":[["fire",30]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["dulling_strike",null],["attack_boost_2","23b"],["attack_boost_1","23a"],["defense_boost_1","18b"]]],"baseSharpness":[80,60,70,90,0,0,0],"maxSharpness":[80,60,70,90,50,0,0]}]],["Royal Ludroth Tree",[{"id":"24a","name":"Ludroth Pair I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[50,60,110,30,0,0,0],"maxSharpness":[50,60,110,80,0,0,0]},{"id":"24b","name":"Ludroth Pair II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",22]],"rampSkills":[[["attack_boost_2",null],["water_boost_2",null],["waterblight_exploit",null],["water_boost_1","24a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[60,50,110,80,0,0,0],"maxSharpness":[60,50,110,110,20,0,0]},{"id":"24c","name":"Double Droth","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",25]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","24b"],["water_boost_1","24a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[90,20,80,90,20,0,0],"maxSharpness":[90,20,80,90,50,20,0]}]],["Somnacanth Tree",[{"id":"25a","name":"Frilled Claw I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",10]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","24a"],["water_boost_1","24a"],["waterblight_exploit","24a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[50,50,120,30,0,0,0],"maxSharpness":[50,50,120,80,0,0,0]},{"id":"25b","name":"Frilled Claw II","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",12]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_1","25a"],["water_boost_1","24a"],["waterblight_exploit","24a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[40,60,110,40,0,0,0],"maxSharpness":[40,60,110,80,10,0,0]},{"id":"25c","name":"Illusory Frilled Claw","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["sleep",15]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","25b"],["attack_boost_1","25a"],["water_boost_1","24a"],["waterblight_exploit","24a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[50,90,120,90,0,0,0],"maxSharpness":[50,90,120,110,30,0,0]}]],["Lagombi Tree",[{"id":"26a","name":"Snow Slicers I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["small_monster_exploit",null],["attack_boost_2","18a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[70,70,80,30,0,0,0],"maxSharpness":[70,70,80,80,0,0,0]},{"id":"26b","name":"Snow Slicers II","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",18]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["small_monster_exploit",null],["ice_boost_1","26a"],["attack_boost_2","18a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[80,80,100,40,0,0,0],"maxSharpness":[80,80,100,90,0,0,0]},{"id":"26c","name":"Snow Sisters","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",22]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["dulling_strike",null],["attack_boost_1","26b"],["small_monster_exploit","26b"],["ice_boost_1","26a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,40,100,90,10,0,0],"maxSharpness":[60,40,100,90,50,10,0]}]],["Magnamalo Tree",[{"id":"27a","name":"Sinister Blades I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",13]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0]},{"id":"27b","name":"Sinister Blades II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",15]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","27a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0]},{"id":"27c","name":"Sinister Famineblades","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",20]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","27b"],["attack_boost_2","27a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0]}]],["Rajang Tree",[{"id":"28a","name":"Suzuka Takamaru I","rarity":5,"endlineTag":"","attack":190,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[60,40,120,80,0,0,0],"maxSharpness":[60,40,120,110,20,0,0]},{"id":"28b","name":"Suzuka Takamaru II","rarity":6,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[["thunder",18]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","28a"]]],"baseSharpness":[60,30,150,100,10,0,0],"maxSharpness":[60,30,150,100,60,0,0]},{"id":"28c","name":"Suzuka Otakemaru","rarity":7,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[["thunder",20]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","28b"],["thunder_boost_1","28a"]]],"baseSharpness":[100,50,80,100,20,0,0],"maxSharpness":[100,50,80,100,60,10,0]}]],["Ibushi Tree",[{"id":"29a","name":"Azure Elder Blades I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",6]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0]},{"id":"29b","name":"Azure Elder Blades II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",8]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","29a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0]},{"id":"29c","name":"Abyssal Gale Blades","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",10]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","29b"],["defense_boost_1","29a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0]}]],["Narwa Tree",[{"id":"30a","name":"Thunderbolt Blades I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",30]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,180,40,40,0,0],"maxSharpness":[20,20,180,40,60,30,0]},{"id":"30b","name":"Abyssal Storm Blades","rarity":7,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",33]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","30a"]]],"baseSharpness":[20,10,220,40,60,0,0],"maxSharpness":[20,10,220,40,70,40,0]}]],["Bazelgeuse Tree",[{"id":"31a","name":"Rookslayer Handaxes I","rarity":6,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",10]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[60,90,60,90,0,0,0],"maxSharpness":[60,90,60,110,30,0,0]},{"id":"31b","name":"Rookslayer Handaxes II","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",12]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[60,110,90,70,20,0,0],"maxSharpness":[60,110,90,70,40,30,0]},{"id":"31c","name":"Bazelhawk Rookslayer","rarity":7,"endlineTag":"hr","attack":210,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",15]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["brutal_strike",null],["defense_boost_1","31b"],["blast_boost_2","31b"]]],"baseSharpness":[60,110,80,70,30,0,0],"maxSharpness":[60,110,80,70,30,50,0]}]],["Kushala Daora Tree",[{"id":"32a","name":"Gelosteel Fang I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["ice",29]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[100,90,90,40,30,0,0],"maxSharpness":[100,90,90,40,50,30,0]},{"id":"32b","name":"Daora\'s Hook","rarity":7,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["ice",32]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","32a"],["affinity_boost_2","32a"]]],"baseSharpness":[90,80,90,50,30,10,0],"maxSharpness":[90,80,90,50,30,60,0]}]],["Teostra Tree",[{"id":"33a","name":"Twin Nails I","rarity":6,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[2],"eleStat":[["blast",24],["ice",36]],"rampSkills":[[["attack_boost_2",null],["blast_boost_2",null],["teostra_soul",null]]],"baseSharpness":[80,70,70,50,30,0,0],"maxSharpness":[80,70,70,50,70,10,0]},{"id":"33b","name":"Fire and Ice","rarity":7,"endlineTag":"hr","attack":180,"affinity":10,"defense":0,"decoSlots":[2],"eleStat":[["blast",36],["ice",48]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["teostra_soul",null],["attack_boost_2","33a"]]],"baseSharpness":[110,70,90,30,50,0,0],"maxSharpness":[110,70,90,30,70,30,0]}]],["Chameleos Tree",[{"id":"34a","name":"Rouge Flames I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",35]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[50,60,150,70,20,0,0],"maxSharpness":[50,60,150,70,20,50,0]},{"id":"34b","name":"Dual Chameleos","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","34a"]]],"baseSharpness":[90,60,70,90,30,10,0],"maxSharpness":[90,60,70,90,30,60,0]}]],["Valstrax Tree",[{"id":"35a","name":"Redwing Blades I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",32]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0]},{"id":"35b","name":"Reddnaught Drag\\u00e3o Wing","rarity":7,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",35]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0]}]],["Felyne Tree",[{"id":"36a","name":"Felyne Claws I","rarity":4,"endlineTag":"","attack":150,"affinity":-10,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",5]],"rampSkills":[[["attack_boost_2",null],["hellion_mode",null],["buddy_rally",null]]],"baseSharpness":[100,50,90,50,10,0,0],"maxSharpness":[100,50,90,50,10,50,0]},{"id":"36b","name":"Felyne Claws II","rarity":5,"endlineTag":"","attack":180,"affinity":-10,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",8]],"rampSkills":[[["attack_boost_2",null],["hellion_mode",null],["buddy_rally",null]]],"baseSharpness":[130,50,90,70,10,0,0],"maxSharpness":[130,50,90,70,10,50,0]},{"id":"36c","name":"Raging Claws","rarity":6,"endlineTag":"hr","attack":190,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["paralysis",10]],"rampSkills":[[["attack_boost_3",null],["hellion_mode",null],["buddy_rally",null],["attack_boost_2","36b"]]],"baseSharpness":[120,50,80,90,10,0,0],"maxSharpness":[120,50,80,90,10,50,0]}]],["Jelly Tree",[{"id":"37a","name":"Rainy Jelly I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",10]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["paralysis_boost_1",null]]],"baseSharpness":[80,100,90,20,10,0,0],"maxSharpness":[80,100,90,20,60,0,0]},{"id":"37b","name":"Rainy Jelly II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["paralysis",15]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["paralysis_boost_1",null],["affinity_boost_1","37a"]]],"baseSharpness":[70,110,80,20,20,0,0],"maxSharpness":[70,110,80,20,60,10,0]},{"id":"37c","name":"Rain of Gore","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["paralysis",19]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["paralysis_boost_1",null],["attack_boost_1","37b"],["affinity_boost_2","37b"],["affinity_boost_1","37a"]]],"baseSharpness":[100,130,80,10,30,0,0],"maxSharpness":[100,130,80,10,60,20,0]}]],["Aelucanth Tree",[{"id":"38a","name":"Qornu Waga I","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",12]],"rampSkills":[[["attack_boost_1",null],["dragon_boost_2",null],["wyvern_exploit",null]]],"baseSharpness":[60,60,90,40,0,0,0],"maxSharpness":[60,60,90,90,0,0,0]},{"id":"38b","name":"Qornu Waga II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["dragon",15]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_1","38a"]]],"baseSharpness":[30,30,170,60,10,0,0],"maxSharpness":[30,30,170,60,60,0,0]},{"id":"38c","name":"Ro Waga","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["dragon",18]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_3",null],["wyvern_exploit",null],["attack_boost_2","38b"],["dragon_boost_2","38b"],["attack_boost_1","38a"]]],"baseSharpness":[50,70,110,100,20,0,0],"maxSharpness":[50,70,110,100,50,20,0]}]],["Guild Tree",[{"id":"39a","name":"Sworn Rapiers I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",13]],"rampSkills":[[["attack_boost_2",null],["water_boost_2",null],["anti_aerial_species",null]]],"baseSharpness":[90,90,40,30,0,0,0],"maxSharpness":[90,90,40,80,0,0,0]},{"id":"39b","name":"Sworn Rapiers II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["water",13]],"rampSkills":[[["attack_boost_2",null],["water_boost_2",null],["anti_aerial_species",null]]],"baseSharpness":[50,70,60,50,20,0,0],"maxSharpness":[50,70,60,50,70,0,0]},{"id":"39c","name":"Holy Sabers","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_3",null],["water_boost_3",null],["anti_aerial_species",null],["attack_boost_2","39b"],["water_boost_2","39b"]]],"baseSharpness":[50,90,70,40,50,0,0],"maxSharpness":[50,90,70,40,90,10,0]}]],["Guild Tree 2",[{"id":"40a","name":"Altair I","rarity":3,"endlineTag":"","attack":130,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["dragon",13]],"rampSkills":[[["attack_boost_2",null],["master_rider",null],["wyvern_exploit",null]]],"baseSharpness":[110,60,30,30,20,0,0],"maxSharpness":[110,60,30,30,70,0,0]},{"id":"40b","name":"Altair II","rarity":5,"endlineTag":"","attack":160,"affinity":12,"defense":0,"decoSlots":[],"eleStat":[["dragon",22]],"rampSkills":[[["attack_boost_3",null],["master_rider",null],["wyvern_exploit",null],["attack_boost_2","40a"]]],"baseSharpness":[110,80,60,20,30,0,0],"maxSharpness":[110,80,60,20,70,10,0]},{"id":"40c","name":"Fortis Gran","rarity":6,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["dragon",24]],"rampSkills":[[["attack_boost_4",null],["master_rider",null],["wyvern_exploit",null],["attack_boost_3","40b"],["attack_boost_2","40a"]]],"baseSharpness":[110,80,80,30,50,0,0],"maxSharpness":[110,80,80,30,60,40,0]}]],["Smithy Tree",[{"id":"41a","name":"Stealth Dango I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",3]],"rampSkills":[[["attack_boost_2",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[90,30,90,40,0,0,0],"maxSharpness":[90,30,90,90,0,0,0]},{"id":"41b","name":"Stealth Dango II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["sleep",5]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["spiribird_doubled",null],["attack_boost_2","41a"]]],"baseSharpness":[110,30,100,60,0,0,0],"maxSharpness":[110,30,100,90,20,0,0]},{"id":"41c","name":"Perfected Dango","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["sleep",8]],"rampSkills":[[["attack_boost_4",null],["dulling_strike",null],["spiribird_doubled",null],["attack_boost_3","41b"],["attack_boost_2","41a"]]],"baseSharpness":[130,40,110,70,0,0,0],"maxSharpness":[130,40,110,70,50,0,0]}]],["Rampage Tree",[{"id":"ra","name":"Rampage Twinblades I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"rb","name":"Rampage Twinblades II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null],["secondary_fire_1",null],["secondary_water_1",null],["secondary_thunder_1",null],["secondary_ice_1",null],["secondary_dragon_1",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"rc","name":"Rampage Twinblades III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null],["secondary_fire_1",null],["secondary_water_1",null],["secondary_thunder_1",null],["secondary_ice_1",null],["secondary_dragon_1",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"rd","name":"Rampage Twinblades IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null],["secondary_fire_2",null],["secondary_water_2",null],["secondary_thunder_2",null],["secondary_ice_2",null],["secondary_dragon_2",null],["secondary_fire_1","rc"],["secondary_water_1","rc"],["secondary_thunder_1","rc"],["secondary_ice_1","rc"],["secondary_dragon_1","rc"]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0]},{"id":"re","name":"Rampage Twinblades V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_1",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["secondary_fire_2",null],["secondary_water_2",null],["secondary_thunder_2",null],["secondary_ice_2",null],["secondary_dragon_2",null],["secondary_fire_1","rc"],["secondary_water_1","rc"],["secondary_thunder_1","rc"],["secondary_ice_1","rc"],["secondary_dragon_1","rc"]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0]},{"id":"rf","name":"Rampage Twinblades S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_1",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["secondary_fire_3",null],["secondary_water_3",null],["secondary_thunder_3",null],["secondary_ice_3",null],["secondary_dragon_3",null],["secondary_fire_2","re"],["secondary_water_2","re"],["secondary_thunder_2","re"],["secondary_ice_2","re"],["secondary_dragon_2","re"],["secondary_fire_1","rc"],["secondary_water_1","rc"],["secondary_thunder_1","rc"],["secondary_ice_1","rc"],["secondary_dragon_1","rc"]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0]}]]]}';
 
-export const dualbladessArray: Readonly<DualBlades[]> = [
-    __generated_dualblades__1a,
-    __generated_dualblades__1b,
-    __generated_dualblades__1c,
-    __generated_dualblades__1d,
-    __generated_dualblades__1e,
-    __generated_dualblades__1f,
-    __generated_dualblades__2a,
-    __generated_dualblades__2b,
-    __generated_dualblades__2c,
-    __generated_dualblades__3a,
-    __generated_dualblades__3b,
-    __generated_dualblades__3c,
-    __generated_dualblades__4a,
-    __generated_dualblades__4b,
-    __generated_dualblades__4c,
-    __generated_dualblades__5a,
-    __generated_dualblades__5b,
-    __generated_dualblades__5c,
-    __generated_dualblades__6a,
-    __generated_dualblades__6b,
-    __generated_dualblades__6c,
-    __generated_dualblades__7a,
-    __generated_dualblades__7b,
-    __generated_dualblades__7c,
-    __generated_dualblades__7d,
-    __generated_dualblades__7e,
-    __generated_dualblades__7f,
-    __generated_dualblades__8a,
-    __generated_dualblades__8b,
-    __generated_dualblades__8c,
-    __generated_dualblades__9a,
-    __generated_dualblades__9b,
-    __generated_dualblades__9c,
-    __generated_dualblades__10a,
-    __generated_dualblades__10b,
-    __generated_dualblades__10c,
-    __generated_dualblades__11a,
-    __generated_dualblades__11b,
-    __generated_dualblades__11c,
-    __generated_dualblades__12a,
-    __generated_dualblades__12b,
-    __generated_dualblades__12c,
-    __generated_dualblades__13a,
-    __generated_dualblades__13b,
-    __generated_dualblades__13c,
-    __generated_dualblades__14a,
-    __generated_dualblades__14b,
-    __generated_dualblades__14c,
-    __generated_dualblades__15a,
-    __generated_dualblades__15b,
-    __generated_dualblades__15c,
-    __generated_dualblades__16a,
-    __generated_dualblades__16b,
-    __generated_dualblades__16c,
-    __generated_dualblades__17a,
-    __generated_dualblades__17b,
-    __generated_dualblades__17c,
-    __generated_dualblades__18a,
-    __generated_dualblades__18b,
-    __generated_dualblades__18c,
-    __generated_dualblades__18d,
-    __generated_dualblades__18e,
-    __generated_dualblades__18f,
-    __generated_dualblades__19a,
-    __generated_dualblades__19b,
-    __generated_dualblades__19c,
-    __generated_dualblades__20a,
-    __generated_dualblades__20b,
-    __generated_dualblades__20c,
-    __generated_dualblades__21a,
-    __generated_dualblades__21b,
-    __generated_dualblades__21c,
-    __generated_dualblades__22a,
-    __generated_dualblades__22b,
-    __generated_dualblades__22c,
-    __generated_dualblades__23a,
-    __generated_dualblades__23b,
-    __generated_dualblades__23c,
-    __generated_dualblades__24a,
-    __generated_dualblades__24b,
-    __generated_dualblades__24c,
-    __generated_dualblades__25a,
-    __generated_dualblades__25b,
-    __generated_dualblades__25c,
-    __generated_dualblades__26a,
-    __generated_dualblades__26b,
-    __generated_dualblades__26c,
-    __generated_dualblades__27a,
-    __generated_dualblades__27b,
-    __generated_dualblades__27c,
-    __generated_dualblades__28a,
-    __generated_dualblades__28b,
-    __generated_dualblades__28c,
-    __generated_dualblades__29a,
-    __generated_dualblades__29b,
-    __generated_dualblades__29c,
-    __generated_dualblades__30a,
-    __generated_dualblades__30b,
-    __generated_dualblades__31a,
-    __generated_dualblades__31b,
-    __generated_dualblades__31c,
-    __generated_dualblades__32a,
-    __generated_dualblades__32b,
-    __generated_dualblades__33a,
-    __generated_dualblades__33b,
-    __generated_dualblades__34a,
-    __generated_dualblades__34b,
-    __generated_dualblades__35a,
-    __generated_dualblades__35b,
-    __generated_dualblades__36a,
-    __generated_dualblades__36b,
-    __generated_dualblades__36c,
-    __generated_dualblades__37a,
-    __generated_dualblades__37b,
-    __generated_dualblades__37c,
-    __generated_dualblades__38a,
-    __generated_dualblades__38b,
-    __generated_dualblades__38c,
-    __generated_dualblades__39a,
-    __generated_dualblades__39b,
-    __generated_dualblades__39c,
-    __generated_dualblades__40a,
-    __generated_dualblades__40b,
-    __generated_dualblades__40c,
-    __generated_dualblades__41a,
-    __generated_dualblades__41b,
-    __generated_dualblades__41c,
-    __generated_dualblades__ra,
-    __generated_dualblades__rb,
-    __generated_dualblades__rc,
-    __generated_dualblades__rd,
-    __generated_dualblades__re,
-    __generated_dualblades__rf,
-];
+export const dualbladessArray: Readonly<DualBlades[]> = loadWeaponPayload<DualBlades>(payload);
@@ -36,5058 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type Greatsword,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_3,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__defense_grinder_1,
-    __generated_ramp__defense_grinder_2,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_4,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_boost_3,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_4,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_4,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_3,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_3,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_3,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__sleep_boost_2,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_4,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_4,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_greatsword__1a: Greatsword = {
-    category: "greatsword",
-    id: "1a",
-
-    name: "Kamura Cleaver I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuracleaveri",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_greatsword__1b: Greatsword = {
-    category: "greatsword",
-    id: "1b",
-
-    name: "Kamura Cleaver II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuracleaverii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_greatsword__1c: Greatsword = {
-    category: "greatsword",
-    id: "1c",
-
-    name: "Kamura Cleaver III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuracleaveriii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_greatsword__1d: Greatsword = {
-    category: "greatsword",
-    id: "1d",
-
-    name: "Kamura Cleaver IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 20, 10, 0, 0],
-    maxSharpness:  [60, 80, 80, 20, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuracleaveriv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_greatsword__1e: Greatsword = {
-    category: "greatsword",
-    id: "1e",
-
-    name: "Kamura Cleaver V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__1d],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1d],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "kamuracleaverv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_greatsword__1f: Greatsword = {
-    category: "greatsword",
-    id: "1f",
-
-    name: "Kamura Ninja Cleaver",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_greatsword__1e],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__1d],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1d],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraninjacleaver",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_greatsword__2a: Greatsword = {
-    category: "greatsword",
-    id: "2a",
-
-    name: "Gossblade I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 90, 30, 0, 0, 0],
-    maxSharpness:  [100, 30, 90, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gossbladei",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_greatsword__2b: Greatsword = {
-    category: "greatsword",
-    id: "2b",
-
-    name: "Gossblade II",
-    treeName: "Goss Harag Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_greatsword__2a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 110, 40, 20, 0, 0],
-    maxSharpness:  [100, 30, 110, 40, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gossbladeii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_greatsword__2c: Greatsword = {
-    category: "greatsword",
-    id: "2c",
-
-    name: "Abominable Great Sword",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_2, __generated_greatsword__2b],
-            [__generated_ramp__ice_boost_1, __generated_greatsword__2a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 100, 40, 30, 0, 0],
-    maxSharpness:  [100, 30, 100, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "abominablegreatsword",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_greatsword__3a: Greatsword = {
-    category: "greatsword",
-    id: "3a",
-
-    name: "Hanayako Yohino I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 40, 40, 0, 0, 0],
-    maxSharpness:  [70, 50, 40, 60, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hanayakoyohinoi",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_greatsword__3b: Greatsword = {
-    category: "greatsword",
-    id: "3b",
-
-    name: "Hanayako Yohino II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__3a],
-            [__generated_ramp__water_boost_1, __generated_greatsword__3a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 80, 30, 30, 0, 0],
-    maxSharpness:  [110, 100, 80, 30, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "hanayakoyohinoii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_greatsword__3c: Greatsword = {
-    category: "greatsword",
-    id: "3c",
-
-    name: "Akanesasu",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__3b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__3a],
-            [__generated_ramp__water_boost_1, __generated_greatsword__3a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 90, 50, 40, 0, 0],
-    maxSharpness:  [100, 70, 90, 50, 40, 50, 0],
-
-    filterHelpers: {
-        nameLower: "akanesasu",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_greatsword__4a: Greatsword = {
-    category: "greatsword",
-    id: "4a",
-
-    name: "Axeblade I",
-    treeName: "Great Sword Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 80, 10, 0, 0, 0],
-    maxSharpness:  [100, 60, 80, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "axebladei",
-        treeNameLower: "greatswordtree",
-    },
-};
-
-const __generated_greatsword__4b: Greatsword = {
-    category: "greatsword",
-    id: "4b",
-
-    name: "Axeblade II",
-    treeName: "Great Sword Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 80, 20, 0, 0, 0],
-    maxSharpness:  [70, 80, 80, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "axebladeii",
-        treeNameLower: "greatswordtree",
-    },
-};
-
-const __generated_greatsword__4c: Greatsword = {
-    category: "greatsword",
-    id: "4c",
-
-    name: "Colossal Axeblade",
-    treeName: "Great Sword Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__4b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1c],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 50, 40, 0, 0, 0],
-    maxSharpness:  [110, 100, 50, 70, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "colossalaxeblade",
-        treeNameLower: "greatswordtree",
-    },
-};
-
-const __generated_greatsword__5a: Greatsword = {
-    category: "greatsword",
-    id: "5a",
-
-    name: "Carapace Sword I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 120, 20, 0, 0, 0],
-    maxSharpness:  [50, 60, 120, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "carapaceswordi",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_greatsword__5b: Greatsword = {
-    category: "greatsword",
-    id: "5b",
-
-    name: "Carapace Sword II",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 30, 0, 0, 0],
-    maxSharpness:  [50, 60, 110, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "carapaceswordii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_greatsword__5c: Greatsword = {
-    category: "greatsword",
-    id: "5c",
-
-    name: "Carapace Blade",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__5b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 190, 50, 10, 0, 0],
-    maxSharpness:  [60, 40, 190, 50, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "carapaceblade",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_greatsword__6a: Greatsword = {
-    category: "greatsword",
-    id: "6a",
-
-    name: "Tiger Jawblade I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__5b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tigerjawbladei",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_greatsword__6b: Greatsword = {
-    category: "greatsword",
-    id: "6b",
-
-    name: "Tiger Jawblade II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__6a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__5b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 130, 100, 40, 0, 0],
-    maxSharpness:  [50, 30, 130, 100, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigerjawbladeii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_greatsword__6c: Greatsword = {
-    category: "greatsword",
-    id: "6c",
-
-    name: "Tigrex Great Sword",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__6b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__6a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__5b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 50, 20, 0],
-    maxSharpness:  [50, 40, 120, 120, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrexgreatsword",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_greatsword__7a: Greatsword = {
-    category: "greatsword",
-    id: "7a",
-
-    name: "Khezu Shock Sword I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 50, 30, 0, 0, 0],
-    maxSharpness:  [70, 50, 50, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "khezushockswordi",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_greatsword__7b: Greatsword = {
-    category: "greatsword",
-    id: "7b",
-
-    name: "Khezu Shock Sword II",
-    treeName: "Khezu Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__7a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 70, 40, 0, 0, 0],
-    maxSharpness:  [70, 70, 70, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "khezushockswordii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_greatsword__7c: Greatsword = {
-    category: "greatsword",
-    id: "7c",
-
-    name: "Khezu Shock Blade",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__7b],
-            [__generated_ramp__thunder_boost_1, __generated_greatsword__7b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__7a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1b],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 70, 70, 20, 0, 0],
-    maxSharpness:  [100, 40, 70, 70, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "khezushockblade",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_greatsword__8a: Greatsword = {
-    category: "greatsword",
-    id: "8a",
-
-    name: "Izuchi Blade I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 100, 0, 0, 0, 0],
-    maxSharpness:  [30, 70, 140, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "izuchibladei",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_greatsword__8b: Greatsword = {
-    category: "greatsword",
-    id: "8b",
-
-    name: "Izuchi Blade II",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 12,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 70, 30, 0, 0, 0],
-    maxSharpness:  [30, 70, 70, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "izuchibladeii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_greatsword__8c: Greatsword = {
-    category: "greatsword",
-    id: "8c",
-
-    name: "Snapper Blade",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 70, 70, 20, 0, 0],
-    maxSharpness:  [50, 90, 70, 70, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snapperblade",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_greatsword__9a: Greatsword = {
-    category: "greatsword",
-    id: "9a",
-
-    name: "Deadly Serpentblade I",
-    treeName: "Remobra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 80, 20, 0, 0, 0],
-    maxSharpness:  [40, 60, 80, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "deadlyserpentbladei",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_greatsword__9b: Greatsword = {
-    category: "greatsword",
-    id: "9b",
-
-    name: "Deadly Serpentblade II",
-    treeName: "Remobra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__9a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 50, 50, 0, 0, 0],
-    maxSharpness:  [60, 40, 50, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "deadlyserpentbladeii",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_greatsword__9c: Greatsword = {
-    category: "greatsword",
-    id: "9c",
-
-    name: "Poison Serpentblade",
-    treeName: "Remobra Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__9b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__9a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [130, 20, 70, 70, 10, 0, 0],
-    maxSharpness:  [130, 20, 70, 70, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "poisonserpentblade",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_greatsword__10a: Greatsword = {
-    category: "greatsword",
-    id: "10a",
-
-    name: "Hidden Blade I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__poison_boost_1, __generated_greatsword__9a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__9a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenbladei",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_greatsword__10b: Greatsword = {
-    category: "greatsword",
-    id: "10b",
-
-    name: "Hidden Blade II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__10a],
-            [__generated_ramp__poison_boost_1, __generated_greatsword__9a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__9a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 100, 50, 0, 0],
-    maxSharpness:  [100, 30, 70, 100, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenbladeii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_greatsword__10c: Greatsword = {
-    category: "greatsword",
-    id: "10c",
-
-    name: "Dark of Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__10b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__10a],
-            [__generated_ramp__poison_boost_1, __generated_greatsword__9a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__9a],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__1a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 120, 90, 60, 20, 0],
-    maxSharpness:  [70, 40, 120, 90, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "darkofnight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_greatsword__11a: Greatsword = {
-    category: "greatsword",
-    id: "11a",
-
-    name: "Frilled Blade I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 30, 0, 0, 0],
-    maxSharpness:  [50, 50, 120, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledbladei",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_greatsword__11b: Greatsword = {
-    category: "greatsword",
-    id: "11b",
-
-    name: "Frilled Blade II",
-    treeName: "Somnacanth Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__11a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 110, 40, 0, 0, 0],
-    maxSharpness:  [40, 60, 110, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledbladeii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_greatsword__11c: Greatsword = {
-    category: "greatsword",
-    id: "11c",
-
-    name: "Illusory Frilled Blade",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__11b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__11a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__8b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__8b],
-            [__generated_ramp__buddy_rally, __generated_greatsword__8b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__8a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__1a],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 120, 90, 0, 0, 0],
-    maxSharpness:  [50, 90, 120, 120, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "illusoryfrilledblade",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_greatsword__12a: Greatsword = {
-    category: "greatsword",
-    id: "12a",
-
-    name: "Iron Sword I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironswordi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_greatsword__12b: Greatsword = {
-    category: "greatsword",
-    id: "12b",
-
-    name: "Steel Sword",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 120, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "steelsword",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_greatsword__12c: Greatsword = {
-    category: "greatsword",
-    id: "12c",
-
-    name: "Buster Sword I",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 20, 0, 0, 0],
-    maxSharpness:  [60, 60, 60, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "busterswordi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_greatsword__12d: Greatsword = {
-    category: "greatsword",
-    id: "12d",
-
-    name: "Buster Blade",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 50, 0, 0, 0],
-    maxSharpness:  [70, 60, 70, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "busterblade",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_greatsword__12e: Greatsword = {
-    category: "greatsword",
-    id: "12e",
-
-    name: "Chrome Razor I",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12d],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 100, 70, 0, 0, 0],
-    maxSharpness:  [60, 70, 100, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "chromerazori",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_greatsword__12f: Greatsword = {
-    category: "greatsword",
-    id: "12f",
-
-    name: "Chrome Quietus",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__12e],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12d],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [80, 40, 90, 70, 20, 0, 0],
-    maxSharpness:  [80, 40, 90, 70, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "chromequietus",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_greatsword__13a: Greatsword = {
-    category: "greatsword",
-    id: "13a",
-
-    name: "Barbaroi Blade I",
-    treeName: "Fire Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__12c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 120, 20, 0, 0, 0],
-    maxSharpness:  [70, 40, 120, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "barbaroibladei",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_greatsword__13b: Greatsword = {
-    category: "greatsword",
-    id: "13b",
-
-    name: "Barbaroi Blade II",
-    treeName: "Fire Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__12c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 110, 30, 0, 0, 0],
-    maxSharpness:  [60, 50, 110, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "barbaroibladeii",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_greatsword__13c: Greatsword = {
-    category: "greatsword",
-    id: "13c",
-
-    name: "Crimson Goat",
-    treeName: "Fire Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_2, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__13b],
-            [__generated_ramp__defense_grinder_1, __generated_greatsword__13b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__12c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 150, 30, 10, 0, 0],
-    maxSharpness:  [50, 60, 150, 30, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "crimsongoat",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_greatsword__14a: Greatsword = {
-    category: "greatsword",
-    id: "14a",
-
-    name: "Pukei Edge I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 30, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 30, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeiedgei",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_greatsword__14b: Greatsword = {
-    category: "greatsword",
-    id: "14b",
-
-    name: "Pukei Edge II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 40, 60, 0, 0, 0],
-    maxSharpness:  [60, 90, 40, 110, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeiedgeii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_greatsword__14c: Greatsword = {
-    category: "greatsword",
-    id: "14c",
-
-    name: "Datura Cleaver",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__poison_boost_1, __generated_greatsword__14b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12c],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12c],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 50, 90, 40, 0, 0],
-    maxSharpness:  [60, 60, 50, 90, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "daturacleaver",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_greatsword__15a: Greatsword = {
-    category: "greatsword",
-    id: "15a",
-
-    name: "Icicle Fang I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "iciclefangi",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_greatsword__15b: Greatsword = {
-    category: "greatsword",
-    id: "15b",
-
-    name: "Icicle Fang II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__15a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 70, 100, 20, 0, 0],
-    maxSharpness:  [40, 70, 70, 100, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "iciclefangii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_greatsword__15c: Greatsword = {
-    category: "greatsword",
-    id: "15c",
-
-    name: "Paladire",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__15b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__15a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "paladire",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_greatsword__16a: Greatsword = {
-    category: "greatsword",
-    id: "16a",
-
-    name: "Aknosom Blade I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 80, 40, 0, 0, 0],
-    maxSharpness:  [30, 50, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "aknosombladei",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_greatsword__16b: Greatsword = {
-    category: "greatsword",
-    id: "16b",
-
-    name: "Aknosom Blade II",
-    treeName: "Aknosom Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__16a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 90, 80, 0, 0, 0],
-    maxSharpness:  [30, 50, 90, 130, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "aknosombladeii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_greatsword__16c: Greatsword = {
-    category: "greatsword",
-    id: "16c",
-
-    name: "Daybreak Cleaver",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_greatsword__16b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__16a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 80, 130, 10, 0, 0],
-    maxSharpness:  [30, 50, 80, 130, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "daybreakcleaver",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_greatsword__17a: Greatsword = {
-    category: "greatsword",
-    id: "17a",
-
-    name: "Tetranadon Edge I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [30, 60, 90, 20, 0, 0, 0],
-    maxSharpness:  [30, 60, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tetranadonedgei",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_greatsword__17b: Greatsword = {
-    category: "greatsword",
-    id: "17b",
-
-    name: "Tetranadon Edge II",
-    treeName: "Tetranadon Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_greatsword__17a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [30, 90, 100, 30, 0, 0, 0],
-    maxSharpness:  [30, 90, 100, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tetranadonedgeii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_greatsword__17c: Greatsword = {
-    category: "greatsword",
-    id: "17c",
-
-    name: "Tetranadon Cutter",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_2, __generated_greatsword__17b],
-            [__generated_ramp__water_boost_1, __generated_greatsword__17a],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__12b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__12b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 60, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 100, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tetranadoncutter",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_greatsword__18a: Greatsword = {
-    category: "greatsword",
-    id: "18a",
-
-    name: "Bone Cleaver I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonecleaveri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_greatsword__18b: Greatsword = {
-    category: "greatsword",
-    id: "18b",
-
-    name: "Bone Slasher",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "boneslasher",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_greatsword__18c: Greatsword = {
-    category: "greatsword",
-    id: "18c",
-
-    name: "Jawblade I",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 60, 0, 0, 0, 0],
-    maxSharpness:  [100, 40, 110, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "jawbladei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_greatsword__18d: Greatsword = {
-    category: "greatsword",
-    id: "18d",
-
-    name: "Giant Jawblade",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 70, 0, 0, 0, 0],
-    maxSharpness:  [90, 90, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "giantjawblade",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_greatsword__18e: Greatsword = {
-    category: "greatsword",
-    id: "18e",
-
-    name: "Wyvern Fang I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 30, 110, 20, 0, 0, 0],
-    maxSharpness:  [90, 30, 110, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernfangi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_greatsword__18f: Greatsword = {
-    category: "greatsword",
-    id: "18f",
-
-    name: "Great Wyvern Fang",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__18e],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 120, 40, 0, 0, 0],
-    maxSharpness:  [90, 50, 120, 70, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "greatwyvernfang",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_greatsword__19a: Greatsword = {
-    category: "greatsword",
-    id: "19a",
-
-    name: "Golem Blade I",
-    treeName: "Bone Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [110, 60, 70, 40, 20, 0, 0],
-    maxSharpness:  [110, 60, 70, 40, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "golembladei",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_greatsword__19b: Greatsword = {
-    category: "greatsword",
-    id: "19b",
-
-    name: "Blade of Talos",
-    treeName: "Bone Tree 2",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 80, 80, 30, 0, 0],
-    maxSharpness:  [90, 70, 80, 80, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "bladeoftalos",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_greatsword__20a: Greatsword = {
-    category: "greatsword",
-    id: "20a",
-
-    name: "Valkyrie Blade I",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 80, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 100, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "valkyriebladei",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_greatsword__20b: Greatsword = {
-    category: "greatsword",
-    id: "20b",
-
-    name: "Valkyrie Blade II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__20a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 110, 20, 0, 0],
-    maxSharpness:  [60, 60, 100, 110, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "valkyriebladeii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_greatsword__20c: Greatsword = {
-    category: "greatsword",
-    id: "20c",
-
-    name: "Sieglinde",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__20a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 110, 70, 40, 0, 0],
-    maxSharpness:  [90, 40, 110, 70, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "sieglinde",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_greatsword__21a: Greatsword = {
-    category: "greatsword",
-    id: "21a",
-
-    name: "Jyura Mudblade I",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-        ],
-    ],
-
-    baseSharpness: [130, 90, 30, 90, 10, 0, 0],
-    maxSharpness:  [130, 90, 30, 90, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "jyuramudbladei",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_greatsword__21b: Greatsword = {
-    category: "greatsword",
-    id: "21b",
-
-    name: "Jyura Mudblade II",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__water_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-        ],
-    ],
-
-    baseSharpness: [130, 70, 30, 90, 30, 0, 0],
-    maxSharpness:  [130, 70, 30, 90, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "jyuramudbladeii",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_greatsword__21c: Greatsword = {
-    category: "greatsword",
-    id: "21c",
-
-    name: "Terracutter",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__21b],
-            [__generated_ramp__water_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-        ],
-    ],
-
-    baseSharpness: [120, 70, 30, 80, 50, 0, 0],
-    maxSharpness:  [120, 70, 30, 80, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "terracutter",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_greatsword__22a: Greatsword = {
-    category: "greatsword",
-    id: "22a",
-
-    name: "Red Wing I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__water_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__brutal_strike, __generated_greatsword__21a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 80, 110, 10, 0, 0],
-    maxSharpness:  [70, 80, 80, 110, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "redwingi",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_greatsword__22b: Greatsword = {
-    category: "greatsword",
-    id: "22b",
-
-    name: "Red Wing II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__water_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__brutal_strike, __generated_greatsword__21a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 20, 0, 0],
-    maxSharpness:  [50, 40, 120, 120, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "redwingii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_greatsword__22c: Greatsword = {
-    category: "greatsword",
-    id: "22c",
-
-    name: "Rathalos Fogosword",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__22b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__water_boost_1, __generated_greatsword__21a],
-            [__generated_ramp__brutal_strike, __generated_greatsword__21a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__19a],
-            [__generated_ramp__silkbind_boost, __generated_greatsword__19a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18c],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 110, 120, 30, 0, 0],
-    maxSharpness:  [50, 40, 110, 120, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rathalosfiresword",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_greatsword__23a: Greatsword = {
-    category: "greatsword",
-    id: "23a",
-
-    name: "Quarrel Hornsword I",
-    treeName: "Diablos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -25,
-    defense: 8,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__18d],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 50, 100, 0, 0, 0],
-    maxSharpness:  [60, 40, 50, 110, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "quarrelhornswordi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_greatsword__23b: Greatsword = {
-    category: "greatsword",
-    id: "23b",
-
-    name: "Quarrel Hornsword II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -25,
-    defense: 12,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__23a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__23a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 30, 120, 30, 0, 0],
-    maxSharpness:  [100, 70, 30, 120, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "quarrelhornswordii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_greatsword__23c: Greatsword = {
-    category: "greatsword",
-    id: "23c",
-
-    name: "Feud Hornsword",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -25,
-    defense: 16,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__23b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__23b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__23a],
-            [__generated_ramp__dulling_strike, __generated_greatsword__23a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18d],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 80, 120, 50, 0, 0],
-    maxSharpness:  [40, 60, 80, 120, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "feudhornsword",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_greatsword__24a: Greatsword = {
-    category: "greatsword",
-    id: "24a",
-
-    name: "Hack Blade I",
-    treeName: "Jaggi & Jaggia Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [40, 110, 30, 20, 0, 0, 0],
-    maxSharpness:  [40, 110, 30, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hackbladei",
-        treeNameLower: "jaggi&jaggiatree",
-    },
-};
-
-const __generated_greatsword__24b: Greatsword = {
-    category: "greatsword",
-    id: "24b",
-
-    name: "Hack Blade II",
-    treeName: "Jaggi & Jaggia Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 140, 30, 30, 0, 0, 0],
-    maxSharpness:  [50, 140, 30, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hackbladeii",
-        treeNameLower: "jaggi&jaggiatree",
-    },
-};
-
-const __generated_greatsword__24c: Greatsword = {
-    category: "greatsword",
-    id: "24c",
-
-    name: "Jaggi Greatblade",
-    treeName: "Jaggi & Jaggia Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_grinder_1, null],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 30, 30, 30, 0, 0],
-    maxSharpness:  [50, 160, 30, 30, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "jaggigreatblade",
-        treeNameLower: "jaggi&jaggiatree",
-    },
-};
-
-const __generated_greatsword__25a: Greatsword = {
-    category: "greatsword",
-    id: "25a",
-
-    name: "Flammenzahn I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__24b],
-            [__generated_ramp__dulling_strike, __generated_greatsword__24b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [120, 70, 30, 30, 0, 0, 0],
-    maxSharpness:  [120, 70, 30, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammenzahni",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_greatsword__25b: Greatsword = {
-    category: "greatsword",
-    id: "25b",
-
-    name: "Flammenzahn II",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_greatsword__25a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__24b],
-            [__generated_ramp__dulling_strike, __generated_greatsword__24b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [120, 100, 30, 50, 0, 0, 0],
-    maxSharpness:  [120, 100, 30, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammenzahnii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_greatsword__25c: Greatsword = {
-    category: "greatsword",
-    id: "25c",
-
-    name: "Gnashing Flammenzahn",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__25b],
-            [__generated_ramp__fire_boost_2, __generated_greatsword__25b],
-            [__generated_ramp__fire_boost_1, __generated_greatsword__25a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__24b],
-            [__generated_ramp__dulling_strike, __generated_greatsword__24b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [130, 120, 40, 50, 10, 0, 0],
-    maxSharpness:  [130, 120, 40, 50, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gnashingflammenzahn",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_greatsword__26a: Greatsword = {
-    category: "greatsword",
-    id: "26a",
-
-    name: "Usurper's Storm I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__24b],
-            [__generated_ramp__dulling_strike, __generated_greatsword__24b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 50, 90, 0, 0, 0],
-    maxSharpness:  [70, 40, 50, 140, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sstormi",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_greatsword__26b: Greatsword = {
-    category: "greatsword",
-    id: "26b",
-
-    name: "Usurper's Storm II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__26a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__24b],
-            [__generated_ramp__dulling_strike, __generated_greatsword__24b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 100, 100, 10, 0, 0],
-    maxSharpness:  [60, 30, 100, 100, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sstormii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_greatsword__26c: Greatsword = {
-    category: "greatsword",
-    id: "26c",
-
-    name: "Despot's Blackstorm",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_greatsword__26b],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__26a],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__24b],
-            [__generated_ramp__dulling_strike, __generated_greatsword__24b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__24b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__24a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 100, 30, 0, 0],
-    maxSharpness:  [60, 40, 120, 100, 40, 40, 0],
-
-    filterHelpers: {
-        nameLower: "despot'sblackstorm",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_greatsword__27a: Greatsword = {
-    category: "greatsword",
-    id: "27a",
-
-    name: "Cataclysm Sword I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 50, 40, 0, 0, 0],
-    maxSharpness:  [40, 70, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cataclysmswordi",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_greatsword__27b: Greatsword = {
-    category: "greatsword",
-    id: "27b",
-
-    name: "Cataclysm Sword II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 50, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cataclysmswordii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_greatsword__27c: Greatsword = {
-    category: "greatsword",
-    id: "27c",
-
-    name: "Cataclysm Blade",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__27b],
-            [__generated_ramp__water_boost_1, __generated_greatsword__27b],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 80, 0, 0, 0],
-    maxSharpness:  [60, 40, 120, 100, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cataclysmblade",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_greatsword__28a: Greatsword = {
-    category: "greatsword",
-    id: "28a",
-
-    name: "Snowclad I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18a],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 50, 0, 0, 0, 0],
-    maxSharpness:  [70, 80, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snowcladi",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_greatsword__28b: Greatsword = {
-    category: "greatsword",
-    id: "28b",
-
-    name: "Snowclad II",
-    treeName: "Lagombi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_greatsword__28a],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__18a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18a],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 40, 30, 0, 0, 0],
-    maxSharpness:  [70, 60, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snowcladii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_greatsword__28c: Greatsword = {
-    category: "greatsword",
-    id: "28c",
-
-    name: "Lagombi Charlotte",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__28b],
-            [__generated_ramp__small_monster_exploit, __generated_greatsword__28b],
-            [__generated_ramp__ice_boost_1, __generated_greatsword__28a],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__18a],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 100, 100, 10, 0, 0],
-    maxSharpness:  [60, 30, 100, 100, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "lagombicharlotte",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_greatsword__29a: Greatsword = {
-    category: "greatsword",
-    id: "29a",
-
-    name: "Sinister Blade I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterbladei",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_greatsword__29b: Greatsword = {
-    category: "greatsword",
-    id: "29b",
-
-    name: "Sinister Blade II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__29a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterbladeii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_greatsword__29c: Greatsword = {
-    category: "greatsword",
-    id: "29c",
-
-    name: "Sinister Shadowblade",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_greatsword__29b],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__29a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "sinistershadowblade",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_greatsword__30a: Greatsword = {
-    category: "greatsword",
-    id: "30a",
-
-    name: "Demon Rod I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 130, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "demonrodi",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_greatsword__30b: Greatsword = {
-    category: "greatsword",
-    id: "30b",
-
-    name: "Demon Rod II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_greatsword__30a],
-        ],
-    ],
-
-    baseSharpness: [20, 40, 100, 90, 0, 0, 0],
-    maxSharpness:  [20, 40, 100, 130, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "demonrodii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_greatsword__30c: Greatsword = {
-    category: "greatsword",
-    id: "30c",
-
-    name: "Great Demon Rod",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__30b],
-            [__generated_ramp__thunder_boost_1, __generated_greatsword__30a],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 80, 100, 10, 0, 0],
-    maxSharpness:  [50, 60, 80, 100, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "greatdemonrod",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_greatsword__31a: Greatsword = {
-    category: "greatsword",
-    id: "31a",
-
-    name: "Azure Elder Great Sword I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azureeldergreatswordi",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_greatsword__31b: Greatsword = {
-    category: "greatsword",
-    id: "31b",
-
-    name: "Azure Elder Great Sword II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    filterHelpers: {
-        nameLower: "azureeldergreatswordii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_greatsword__31c: Greatsword = {
-    category: "greatsword",
-    id: "31c",
-
-    name: "Abyssal Galeblade",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_greatsword__31b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalgaleblade",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_greatsword__32a: Greatsword = {
-    category: "greatsword",
-    id: "32a",
-
-    name: "Thunderbolt Great Sword I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 46]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "thunderboltgreatswordi",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_greatsword__32b: Greatsword = {
-    category: "greatsword",
-    id: "32b",
-
-    name: "Abyssal Storm Cleaver",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 50]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__32a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalstormcleaver",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_greatsword__33a: Greatsword = {
-    category: "greatsword",
-    id: "33a",
-
-    name: "Gelosteel Edge I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 120, 90, 30, 0, 0],
-    maxSharpness:  [70, 40, 120, 90, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "icesteeledgei",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_greatsword__33b: Greatsword = {
-    category: "greatsword",
-    id: "33b",
-
-    name: "Daora's Decimator",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__33a],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__33a],
-        ],
-    ],
-
-    baseSharpness: [80, 120, 70, 40, 30, 10, 0],
-    maxSharpness:  [80, 120, 70, 40, 30, 60, 0],
-
-    filterHelpers: {
-        nameLower: "daora'sdecimator",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_greatsword__34a: Greatsword = {
-    category: "greatsword",
-    id: "34a",
-
-    name: "Teostra Blade I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 80, 90, 10, 0, 0],
-    maxSharpness:  [150, 20, 80, 90, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "teostrabladei",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_greatsword__34b: Greatsword = {
-    category: "greatsword",
-    id: "34b",
-
-    name: "King Teostra Blade",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__34a],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 30, 90, 20, 0, 0],
-    maxSharpness:  [160, 50, 30, 90, 40, 30, 0],
-
-    filterHelpers: {
-        nameLower: "kingteostrablade",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_greatsword__35a: Greatsword = {
-    category: "greatsword",
-    id: "35a",
-
-    name: "Grand Shamshir I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 60]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 80, 90, 50, 0, 0],
-    maxSharpness:  [100, 30, 80, 90, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "grandshamshiri",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_greatsword__35b: Greatsword = {
-    category: "greatsword",
-    id: "35b",
-
-    name: "Foreboding Shamshir",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 66]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__35a],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 100, 90, 80, 0, 0],
-    maxSharpness:  [50, 30, 100, 90, 80, 50, 0],
-
-    filterHelpers: {
-        nameLower: "forebodingshamshir",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_greatsword__36a: Greatsword = {
-    category: "greatsword",
-    id: "36a",
-
-    name: "Redwing Claymore I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    filterHelpers: {
-        nameLower: "redwingclaymorei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_greatsword__36b: Greatsword = {
-    category: "greatsword",
-    id: "36b",
-
-    name: "Reddnaught Claymore",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    filterHelpers: {
-        nameLower: "reddnaughtclaymore",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_greatsword__37a: Greatsword = {
-    category: "greatsword",
-    id: "37a",
-
-    name: "Wyvern's Perch I",
-    treeName: "Chaos Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [20, 30, 150, 0, 0, 0, 0],
-    maxSharpness:  [20, 30, 200, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvern'sperchi",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_greatsword__37b: Greatsword = {
-    category: "greatsword",
-    id: "37b",
-
-    name: "Wyvern's Perch II",
-    treeName: "Chaos Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [30, 40, 170, 10, 0, 0, 0],
-    maxSharpness:  [30, 40, 170, 50, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvern'sperchii",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_greatsword__37c: Greatsword = {
-    category: "greatsword",
-    id: "37c",
-
-    name: "Roguish Deathcap",
-    treeName: "Chaos Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [30, 30, 170, 20, 0, 0, 0],
-    maxSharpness:  [30, 30, 170, 50, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "roguishdeathcap",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_greatsword__38a: Greatsword = {
-    category: "greatsword",
-    id: "38a",
-
-    name: "Sleepy Shellblade I",
-    treeName: "Shell-Studded Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 90, 10, 0, 0, 0],
-    maxSharpness:  [50, 50, 90, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sleepyshellbladei",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_greatsword__38b: Greatsword = {
-    category: "greatsword",
-    id: "38b",
-
-    name: "Sleepy Shellblade II",
-    treeName: "Shell-Studded Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 17,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__38a],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 100, 20, 0, 0, 0],
-    maxSharpness:  [40, 90, 100, 60, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sleepyshellbladeii",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_greatsword__38c: Greatsword = {
-    category: "greatsword",
-    id: "38c",
-
-    name: "Soporific Shellblade",
-    treeName: "Shell-Studded Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__38b],
-            [__generated_ramp__sleep_boost_1, __generated_greatsword__38b],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__38a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 130, 50, 0, 0, 0],
-    maxSharpness:  [50, 70, 130, 70, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "soporificshellblade",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_greatsword__39a: Greatsword = {
-    category: "greatsword",
-    id: "39a",
-
-    name: "Frozen Speartuna I",
-    treeName: "Speartuna Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 50]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__iceblight_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [80, 40, 110, 70, 0, 0, 0],
-    maxSharpness:  [80, 40, 110, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frozenspeartunai",
-        treeNameLower: "speartunatree",
-    },
-};
-
-const __generated_greatsword__39b: Greatsword = {
-    category: "greatsword",
-    id: "39b",
-
-    name: "Frozen Speartuna II",
-    treeName: "Speartuna Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 60]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__iceblight_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [80, 40, 110, 100, 20, 0, 0],
-    maxSharpness:  [80, 40, 110, 100, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frozenspeartunaii",
-        treeNameLower: "speartunatree",
-    },
-};
-
-const __generated_greatsword__39c: Greatsword = {
-    category: "greatsword",
-    id: "39c",
-
-    name: "Freezer Speartuna",
-    treeName: "Speartuna Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 70]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__39b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 90, 110, 30, 0, 0],
-    maxSharpness:  [50, 70, 90, 110, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "freezerspeartuna",
-        treeNameLower: "speartunatree",
-    },
-};
-
-const __generated_greatsword__40a: Greatsword = {
-    category: "greatsword",
-    id: "40a",
-
-    name: "Ninja Parasol I",
-    treeName: "Smithy Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [120, 110, 50, 20, 0, 0, 0],
-    maxSharpness:  [120, 110, 50, 50, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ninjaparasoli",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_greatsword__40b: Greatsword = {
-    category: "greatsword",
-    id: "40b",
-
-    name: "Ninja Parasol II",
-    treeName: "Smithy Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__40a],
-        ],
-    ],
-
-    baseSharpness: [110, 110, 50, 30, 0, 0, 0],
-    maxSharpness:  [110, 110, 50, 40, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ninjaparasolii",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_greatsword__40c: Greatsword = {
-    category: "greatsword",
-    id: "40c",
-
-    name: "Dragãoslayer Parasol",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__dragon_boost_2, __generated_greatsword__40b],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__40a],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 60, 60, 0, 0, 0],
-    maxSharpness:  [80, 100, 60, 60, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dragonslayerparasol",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_greatsword__41a: Greatsword = {
-    category: "greatsword",
-    id: "41a",
-
-    name: "Cat's Soul I",
-    treeName: "Felyne Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 50, 40, 0, 0, 0],
-    maxSharpness:  [70, 40, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cat'ssouli",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_greatsword__41b: Greatsword = {
-    category: "greatsword",
-    id: "41b",
-
-    name: "Cat's Soul II",
-    treeName: "Felyne Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 50, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cat'ssoulii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_greatsword__41c: Greatsword = {
-    category: "greatsword",
-    id: "41c",
-
-    name: "Cat's Curse",
-    treeName: "Felyne Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__41b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 80, 70, 0, 0, 0],
-    maxSharpness:  [40, 60, 80, 90, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cat'scurse",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_greatsword__ra: Greatsword = {
-    category: "greatsword",
-    id: "ra",
-
-    name: "Rampage Cleaver I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagecleaveri",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_greatsword__rb: Greatsword = {
-    category: "greatsword",
-    id: "rb",
-
-    name: "Rampage Cleaver II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagecleaverii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_greatsword__rc: Greatsword = {
-    category: "greatsword",
-    id: "rc",
-
-    name: "Rampage Cleaver III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_greatsword__rb],
-            [__generated_ramp__water_1, __generated_greatsword__rb],
-            [__generated_ramp__thunder_1, __generated_greatsword__rb],
-            [__generated_ramp__ice_1, __generated_greatsword__rb],
-            [__generated_ramp__dragon_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagecleaveriii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_greatsword__rd: Greatsword = {
-    category: "greatsword",
-    id: "rd",
-
-    name: "Rampage Cleaver IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_greatsword__rc],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_greatsword__rc],
-            [__generated_ramp__paralysis_1, __generated_greatsword__rc],
-            [__generated_ramp__sleep_1, __generated_greatsword__rc],
-            [__generated_ramp__blast_1, __generated_greatsword__rc],
-            [__generated_ramp__fire_1, __generated_greatsword__rb],
-            [__generated_ramp__water_1, __generated_greatsword__rb],
-            [__generated_ramp__thunder_1, __generated_greatsword__rb],
-            [__generated_ramp__ice_1, __generated_greatsword__rb],
-            [__generated_ramp__dragon_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagecleaveriv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_greatsword__re: Greatsword = {
-    category: "greatsword",
-    id: "re",
-
-    name: "Rampage Cleaver V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__rd],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__rd],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__rd],
-            [__generated_ramp__elemental_boost_1, __generated_greatsword__rc],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__fire_2, __generated_greatsword__rd],
-            [__generated_ramp__water_2, __generated_greatsword__rd],
-            [__generated_ramp__thunder_2, __generated_greatsword__rd],
-            [__generated_ramp__ice_2, __generated_greatsword__rd],
-            [__generated_ramp__dragon_2, __generated_greatsword__rd],
-            [__generated_ramp__poison_1, __generated_greatsword__rc],
-            [__generated_ramp__paralysis_1, __generated_greatsword__rc],
-            [__generated_ramp__sleep_1, __generated_greatsword__rc],
-            [__generated_ramp__blast_1, __generated_greatsword__rc],
-            [__generated_ramp__fire_1, __generated_greatsword__rb],
-            [__generated_ramp__water_1, __generated_greatsword__rb],
-            [__generated_ramp__thunder_1, __generated_greatsword__rb],
-            [__generated_ramp__ice_1, __generated_greatsword__rb],
-            [__generated_ramp__dragon_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rampagecleaverv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_greatsword__rf: Greatsword = {
-    category: "greatsword",
-    id: "rf",
-
-    name: "Rampage Cleaver S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_3, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_greatsword__re],
-            [__generated_ramp__elemental_boost_2, __generated_greatsword__re],
-            [__generated_ramp__affinity_boost_3, __generated_greatsword__re],
-            [__generated_ramp__attack_boost_2, __generated_greatsword__rd],
-            [__generated_ramp__affinity_boost_2, __generated_greatsword__rd],
-            [__generated_ramp__defense_boost_2, __generated_greatsword__rd],
-            [__generated_ramp__elemental_boost_1, __generated_greatsword__rc],
-            [__generated_ramp__attack_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_greatsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_4, null],
-            [__generated_ramp__water_4, null],
-            [__generated_ramp__thunder_4, null],
-            [__generated_ramp__ice_4, null],
-            [__generated_ramp__dragon_4, null],
-            [__generated_ramp__poison_3, null],
-            [__generated_ramp__paralysis_3, null],
-            [__generated_ramp__sleep_3, null],
-            [__generated_ramp__blast_3, null],
-            [__generated_ramp__fire_3, __generated_greatsword__re],
-            [__generated_ramp__water_3, __generated_greatsword__re],
-            [__generated_ramp__thunder_3, __generated_greatsword__re],
-            [__generated_ramp__ice_3, __generated_greatsword__re],
-            [__generated_ramp__dragon_3, __generated_greatsword__re],
-            [__generated_ramp__poison_2, __generated_greatsword__re],
-            [__generated_ramp__paralysis_2, __generated_greatsword__re],
-            [__generated_ramp__sleep_2, __generated_greatsword__re],
-            [__generated_ramp__blast_2, __generated_greatsword__re],
-            [__generated_ramp__fire_2, __generated_greatsword__rd],
-            [__generated_ramp__water_2, __generated_greatsword__rd],
-            [__generated_ramp__thunder_2, __generated_greatsword__rd],
-            [__generated_ramp__ice_2, __generated_greatsword__rd],
-            [__generated_ramp__dragon_2, __generated_greatsword__rd],
-            [__generated_ramp__poison_1, __generated_greatsword__rc],
-            [__generated_ramp__paralysis_1, __generated_greatsword__rc],
-            [__generated_ramp__sleep_1, __generated_greatsword__rc],
-            [__generated_ramp__blast_1, __generated_greatsword__rc],
-            [__generated_ramp__fire_1, __generated_greatsword__rb],
-            [__generated_ramp__water_1, __generated_greatsword__rb],
-            [__generated_ramp__thunder_1, __generated_greatsword__rb],
-            [__generated_ramp__ice_1, __generated_greatsword__rb],
-            [__generated_ramp__dragon_1, __generated_greatsword__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagecleavers",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"greatsword","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Cleaver I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0]},{"id":"1b","name":"Kamura Cleaver II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0]},{"id":"1c","name":"Kamura Cleaver III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"1d","name":"Kamura Cleaver IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,80,20,10,0,0],"maxSharpness":[60,80,80,20,60,0,0]},{"id":"1e","name":"Kamura Cleaver V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0]},{"id":"1f","name":"Kamura Ninja Cleaver","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0]}]],["Goss Harag Tree",[{"id":"2a","name":"Gossblade I","rarity":3,"endlineTag":"","attack":170,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_1",null],["brutal_strike",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,90,30,0,0,0],"maxSharpness":[100,30,90,70,10,0,0]},{"id":"2b","name":"Gossblade II","rarity":5,"endlineTag":"","attack":200,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",17]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,110,40,20,0,0],"maxSharpness":[100,30,110,40,70,0,0]},{"id":"2c","name":"Abominable Great Sword","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",20]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_3",null],["brutal_strike",null],["ice_boost_2","2b"],["ice_boost_1","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,100,40,30,0,0],"maxSharpness":[100,30,100,40,70,10,0]}]],["Mizutsune Tree",[{"id":"3a","name":"Hanayako Yohino I","rarity":3,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,50,40,40,0,0,0],"maxSharpness":[70,50,40,60,30,0,0]},{"id":"3b","name":"Hanayako Yohino II","rarity":5,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",25]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,100,80,30,30,0,0],"maxSharpness":[110,100,80,30,60,20,0]},{"id":"3c","name":"Akanesasu","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",30]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","3b"],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,70,90,50,40,0,0],"maxSharpness":[100,70,90,50,40,50,0]}]],["Great Sword Tree",[{"id":"4a","name":"Axeblade I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["dulling_strike",null],["defense_grinder_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,60,80,10,0,0,0],"maxSharpness":[100,60,80,60,0,0,0]},{"id":"4b","name":"Axeblade II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["dulling_strike",null],["defense_grinder_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,80,80,20,0,0,0],"maxSharpness":[70,80,80,70,0,0,0]},{"id":"4c","name":"Colossal Axeblade","rarity":4,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["dulling_strike",null],["defense_grinder_1",null],["defense_boost_2","4b"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,100,50,40,0,0,0],"maxSharpness":[110,100,50,70,20,0,0]}]],["Barroth Tree",[{"id":"5a","name":"Carapace Sword I","rarity":2,"endlineTag":"","attack":120,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[50,60,120,20,0,0,0],"maxSharpness":[50,60,120,70,0,0,0]},{"id":"5b","name":"Carapace Sword II","rarity":2,"endlineTag":"","attack":130,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[50,60,110,30,0,0,0],"maxSharpness":[50,60,110,70,10,0,0]},{"id":"5c","name":"Carapace Blade","rarity":5,"endlineTag":"hr","attack":200,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","5b"],["defense_boost_1","5a"],["attack_boost_1","1b"]]],"baseSharpness":[60,40,190,50,10,0,0],"maxSharpness":[60,40,190,50,40,20,0]}]],["Tigrex Tree",[{"id":"6a","name":"Tiger Jawblade I","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","5b"],["defense_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0]},{"id":"6b","name":"Tiger Jawblade II","rarity":6,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","6a"],["defense_boost_2","5b"],["defense_boost_1","5a"],["attack_boost_1","1b"]]],"baseSharpness":[50,30,130,100,40,0,0],"maxSharpness":[50,30,130,100,70,20,0]},{"id":"6c","name":"Tigrex Great Sword","rarity":6,"endlineTag":"hr","attack":210,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","6b"],["affinity_boost_1","6a"],["defense_boost_2","5b"],["defense_boost_1","5a"],["attack_boost_1","1b"]]],"baseSharpness":[50,40,120,120,50,20,0],"maxSharpness":[50,40,120,120,50,20,0]}]],["Khezu Tree",[{"id":"7a","name":"Khezu Shock Sword I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",30]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,50,50,30,0,0,0],"maxSharpness":[70,50,50,80,0,0,0]},{"id":"7b","name":"Khezu Shock Sword II","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",35]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","7a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,70,70,40,0,0,0],"maxSharpness":[70,70,70,90,0,0,0]},{"id":"7c","name":"Khezu Shock Blade","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",40]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_3","7b"],["thunder_boost_1","7b"],["attack_boost_2","7a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[100,40,70,70,20,0,0],"maxSharpness":[100,40,70,70,50,20,0]}]],["Izuchi Tree",[{"id":"8a","name":"Izuchi Blade I","rarity":1,"endlineTag":"","attack":60,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","1a"],["affinity_boost_2","1a"],["defense_boost_1","1a"]]],"baseSharpness":[30,70,100,0,0,0,0],"maxSharpness":[30,70,140,10,0,0,0]},{"id":"8b","name":"Izuchi Blade II","rarity":1,"endlineTag":"","attack":80,"affinity":12,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","8a"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[30,70,70,30,0,0,0],"maxSharpness":[30,70,70,80,0,0,0]},{"id":"8c","name":"Snapper Blade","rarity":4,"endlineTag":"hr","attack":150,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","8b"],["affinity_boost_1","8a"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[50,90,70,70,20,0,0],"maxSharpness":[50,90,70,70,70,0,0]}]],["Remobra Tree",[{"id":"9a","name":"Deadly Serpentblade I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["dulling_strike",null],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["affinity_boost_1","8a"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[40,60,80,20,0,0,0],"maxSharpness":[40,60,80,70,0,0,0]},{"id":"9b","name":"Deadly Serpentblade II","rarity":3,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",42]],"rampSkills":[[["attack_boost_3",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","9a"],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["affinity_boost_1","8a"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[60,40,50,50,0,0,0],"maxSharpness":[60,40,50,100,0,0,0]},{"id":"9c","name":"Poison Serpentblade","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",45]],"rampSkills":[[["attack_boost_4",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_3","9b"],["attack_boost_2","9a"],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["affinity_boost_1","8a"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[130,20,70,70,10,0,0],"maxSharpness":[130,20,70,70,50,10,0]}]],["Nargacuga Tree",[{"id":"10a","name":"Hidden Blade I","rarity":3,"endlineTag":"","attack":110,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["poison_boost_1","9a"],["dulling_strike","9a"],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0]},{"id":"10b","name":"Hidden Blade II","rarity":5,"endlineTag":"","attack":160,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","10a"],["poison_boost_1","9a"],["dulling_strike","9a"],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[100,30,70,100,50,0,0],"maxSharpness":[100,30,70,100,80,20,0]},{"id":"10c","name":"Dark of Night","rarity":6,"endlineTag":"hr","attack":180,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","10b"],["attack_boost_2","10a"],["poison_boost_1","9a"],["dulling_strike","9a"],["small_monster_exploit","8b"],["buddy_rally","8b"],["attack_boost_1","1a"],["defense_boost_1","1a"]]],"baseSharpness":[70,40,120,90,60,20,0],"maxSharpness":[70,40,120,90,60,20,0]}]],["Somnacanth Tree",[{"id":"11a","name":"Frilled Blade I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",16]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["dulling_strike",null],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["affinity_boost_1","8a"],["defense_boost_1","1a"]]],"baseSharpness":[50,50,120,30,0,0,0],"maxSharpness":[50,50,120,80,0,0,0]},{"id":"11b","name":"Frilled Blade II","rarity":4,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",19]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_1","11a"],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["affinity_boost_1","8a"],["defense_boost_1","1a"]]],"baseSharpness":[40,60,110,40,0,0,0],"maxSharpness":[40,60,110,90,0,0,0]},{"id":"11c","name":"Illusory Frilled Blade","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["sleep",22]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","11b"],["attack_boost_1","11a"],["affinity_boost_2","8b"],["small_monster_exploit","8b"],["buddy_rally","8b"],["affinity_boost_1","8a"],["defense_boost_1","1a"]]],"baseSharpness":[50,90,120,90,0,0,0],"maxSharpness":[50,90,120,120,20,0,0]}]],["Ore Tree",[{"id":"12a","name":"Iron Sword I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"12b","name":"Steel Sword","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,120,0,0,0,0]},{"id":"12c","name":"Buster Sword I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","12b"]]],"baseSharpness":[60,60,60,20,0,0,0],"maxSharpness":[60,60,60,70,0,0,0]},{"id":"12d","name":"Buster Blade","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","12c"],["attack_boost_1","12b"]]],"baseSharpness":[70,60,70,50,0,0,0],"maxSharpness":[70,60,70,100,0,0,0]},{"id":"12e","name":"Chrome Razor I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",35]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["silkbind_boost",null],["defense_boost_2","12d"],["affinity_boost_1","12c"],["attack_boost_1","12b"]]],"baseSharpness":[60,70,100,70,0,0,0],"maxSharpness":[60,70,100,100,20,0,0]},{"id":"12f","name":"Chrome Quietus","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_3",null],["poison_boost_1",null],["silkbind_boost",null],["attack_boost_2","12e"],["defense_boost_2","12d"],["affinity_boost_1","12c"],["attack_boost_1","12b"]]],"baseSharpness":[80,40,90,70,20,0,0],"maxSharpness":[80,40,90,70,50,20,0]}]],["Fire Tree",[{"id":"13a","name":"Barbaroi Blade I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["fire",40]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["defense_grinder_1",null],["attack_boost_2","12c"],["affinity_boost_1","12c"],["attack_boost_1","12b"]]],"baseSharpness":[70,40,120,20,0,0,0],"maxSharpness":[70,40,120,70,0,0,0]},{"id":"13b","name":"Barbaroi Blade II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["fire",42]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["defense_grinder_1",null],["attack_boost_2","12c"],["affinity_boost_1","12c"],["attack_boost_1","12b"]]],"baseSharpness":[60,50,110,30,0,0,0],"maxSharpness":[60,50,110,80,0,0,0]},{"id":"13c","name":"Crimson Goat","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":20,"decoSlots":[2,1],"eleStat":[["fire",45]],"rampSkills":[[["attack_boost_4",null],["defense_boost_2",null],["defense_grinder_2",null],["attack_boost_3","13b"],["defense_grinder_1","13b"],["attack_boost_2","12c"],["affinity_boost_1","12c"],["attack_boost_1","12b"]]],"baseSharpness":[50,60,150,30,10,0,0],"maxSharpness":[50,60,150,30,60,0,0]}]],["Pukei-Pukei Tree",[{"id":"14a","name":"Pukei Edge I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",24]],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["poison_boost_1",null],["affinity_boost_1","12c"],["defense_boost_2","12c"],["attack_boost_1","12b"]]],"baseSharpness":[60,70,30,40,0,0,0],"maxSharpness":[60,70,30,90,0,0,0]},{"id":"14b","name":"Pukei Edge II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",30]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_1",null],["attack_boost_2","14a"],["affinity_boost_1","12c"],["defense_boost_2","12c"],["attack_boost_1","12b"]]],"baseSharpness":[60,90,40,60,0,0,0],"maxSharpness":[60,90,40,110,0,0,0]},{"id":"14c","name":"Datura Cleaver","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",36]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_2",null],["poison_boost_1","14b"],["attack_boost_2","14a"],["affinity_boost_1","12c"],["defense_boost_2","12c"],["attack_boost_1","12b"]]],"baseSharpness":[60,60,50,90,40,0,0],"maxSharpness":[60,60,50,90,90,0,0]}]],["Barioth Tree",[{"id":"15a","name":"Icicle Fang I","rarity":2,"endlineTag":"","attack":100,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",30]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","12b"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0]},{"id":"15b","name":"Icicle Fang II","rarity":3,"endlineTag":"","attack":120,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",34]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","15a"],["attack_boost_1","12b"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[40,70,70,100,20,0,0],"maxSharpness":[40,70,70,100,70,0,0]},{"id":"15c","name":"Paladire","rarity":5,"endlineTag":"hr","attack":160,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[["ice",38]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","15b"],["attack_boost_2","15a"],["attack_boost_1","12b"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,70,30,0]}]],["Aknosom Tree",[{"id":"16a","name":"Aknosom Blade I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",20]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[30,50,80,40,0,0,0],"maxSharpness":[30,50,80,90,0,0,0]},{"id":"16b","name":"Aknosom Blade II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",23]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["fireblight_exploit",null],["attack_boost_1","16a"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[30,50,90,80,0,0,0],"maxSharpness":[30,50,90,130,0,0,0]},{"id":"16c","name":"Daybreak Cleaver","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",27]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["fire_boost_1","16b"],["attack_boost_1","16a"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[30,50,80,130,10,0,0],"maxSharpness":[30,50,80,130,40,20,0]}]],["Tetranadon Tree",[{"id":"17a","name":"Tetranadon Edge I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",18]],"rampSkills":[[["defense_boost_1",null],["water_boost_1",null],["dulling_strike",null],["attack_boost_1","12b"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[30,60,90,20,0,0,0],"maxSharpness":[30,60,90,70,0,0,0]},{"id":"17b","name":"Tetranadon Edge II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["defense_boost_1",null],["water_boost_2",null],["dulling_strike",null],["water_boost_1","17a"],["attack_boost_1","12b"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[30,90,100,30,0,0,0],"maxSharpness":[30,90,100,80,0,0,0]},{"id":"17c","name":"Tetranadon Cutter","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["water",24]],"rampSkills":[[["defense_boost_1",null],["water_boost_3",null],["dulling_strike",null],["water_boost_2","17b"],["water_boost_1","17a"],["attack_boost_1","12b"],["affinity_boost_1","12b"],["defense_boost_2","12b"]]],"baseSharpness":[40,90,110,60,0,0,0],"maxSharpness":[40,90,110,100,10,0,0]}]],["Bone Tree",[{"id":"18a","name":"Bone Cleaver I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0]},{"id":"18b","name":"Bone Slasher","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"18c","name":"Jawblade I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","18b"]]],"baseSharpness":[100,40,60,0,0,0,0],"maxSharpness":[100,40,110,0,0,0,0]},{"id":"18d","name":"Giant Jawblade","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[90,90,70,0,0,0,0],"maxSharpness":[90,90,110,10,0,0,0]},{"id":"18e","name":"Wyvern Fang I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",27]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_1",null],["dulling_strike",null],["attack_boost_2","18d"],["affinity_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[90,30,110,20,0,0,0],"maxSharpness":[90,30,110,70,0,0,0]},{"id":"18f","name":"Great Wyvern Fang","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["dragon",30]],"rampSkills":[[["attack_boost_4",null],["dragon_boost_1",null],["dulling_strike",null],["attack_boost_3","18e"],["attack_boost_2","18d"],["affinity_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[90,50,120,40,0,0,0],"maxSharpness":[90,50,120,70,20,0,0]}]],["Bone Tree 2",[{"id":"19a","name":"Golem Blade I","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["attack_boost_2","18d"],["dulling_strike","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[110,60,70,40,20,0,0],"maxSharpness":[110,60,70,40,70,0,0]},{"id":"19b","name":"Blade of Talos","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_2","19a"],["attack_boost_2","18d"],["dulling_strike","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[90,70,80,80,30,0,0],"maxSharpness":[90,70,80,80,60,20,0]}]],["Rathian Tree",[{"id":"20a","name":"Valkyrie Blade I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",22]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["attack_boost_2","18d"],["dulling_strike","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[60,70,90,80,0,0,0],"maxSharpness":[60,70,90,100,30,0,0]},{"id":"20b","name":"Valkyrie Blade II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",25]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","20a"],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["dulling_strike","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[60,60,100,110,20,0,0],"maxSharpness":[60,60,100,110,70,0,0]},{"id":"20c","name":"Sieglinde","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",28]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","20a"],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["dulling_strike","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[90,40,110,70,40,0,0],"maxSharpness":[90,40,110,70,70,20,0]}]],["Jyuratodus Tree",[{"id":"21a","name":"Jyura Mudblade I","rarity":5,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",15]],"rampSkills":[[["affinity_boost_1",null],["water_boost_1",null],["brutal_strike",null],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["attack_boost_2","18d"],["dulling_strike","18d"],["defense_boost_1","18c"]]],"baseSharpness":[130,90,30,90,10,0,0],"maxSharpness":[130,90,30,90,60,0,0]},{"id":"21b","name":"Jyura Mudblade II","rarity":5,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",17]],"rampSkills":[[["affinity_boost_1",null],["water_boost_2",null],["brutal_strike",null],["water_boost_1","21a"],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["attack_boost_2","18d"],["dulling_strike","18d"],["defense_boost_1","18c"]]],"baseSharpness":[130,70,30,90,30,0,0],"maxSharpness":[130,70,30,90,60,20,0]},{"id":"21c","name":"Terracutter","rarity":6,"endlineTag":"hr","attack":210,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["affinity_boost_2",null],["water_boost_2",null],["brutal_strike",null],["affinity_boost_1","21b"],["water_boost_1","21a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["attack_boost_2","18d"],["dulling_strike","18d"],["defense_boost_1","18c"]]],"baseSharpness":[120,70,30,80,50,0,0],"maxSharpness":[120,70,30,80,80,20,0]}]],["Rathalos Tree",[{"id":"22a","name":"Red Wing I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",36]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["affinity_boost_1","21a"],["water_boost_1","21a"],["brutal_strike","21a"],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["dulling_strike","18d"],["defense_boost_1","18c"]]],"baseSharpness":[70,80,80,110,10,0,0],"maxSharpness":[70,80,80,110,50,10,0]},{"id":"22b","name":"Red Wing II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",38]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["affinity_boost_1","21a"],["water_boost_1","21a"],["brutal_strike","21a"],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["dulling_strike","18d"],["defense_boost_1","18c"]]],"baseSharpness":[50,40,120,120,20,0,0],"maxSharpness":[50,40,120,120,50,20,0]},{"id":"22c","name":"Rathalos Fogosword","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",40]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","22b"],["affinity_boost_1","21a"],["water_boost_1","21a"],["brutal_strike","21a"],["affinity_boost_2","19a"],["defense_boost_2","19a"],["silkbind_boost","19a"],["dulling_strike","18d"],["defense_boost_1","18c"]]],"baseSharpness":[50,40,110,120,30,0,0],"maxSharpness":[50,40,110,120,60,20,0]}]],["Diablos Tree",[{"id":"23a","name":"Quarrel Hornsword I","rarity":3,"endlineTag":"","attack":170,"affinity":-25,"defense":8,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","18d"],["affinity_boost_2","18d"]]],"baseSharpness":[60,40,50,100,0,0,0],"maxSharpness":[60,40,50,110,40,0,0]},{"id":"23b","name":"Quarrel Hornsword II","rarity":6,"endlineTag":"","attack":210,"affinity":-25,"defense":12,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["defense_grinder_1",null],["affinity_boost_1","23a"],["dulling_strike","23a"],["attack_boost_2","18d"]]],"baseSharpness":[100,70,30,120,30,0,0],"maxSharpness":[100,70,30,120,70,10,0]},{"id":"23c","name":"Feud Hornsword","rarity":6,"endlineTag":"hr","attack":230,"affinity":-25,"defense":16,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["defense_grinder_1",null],["affinity_boost_2","23b"],["defense_boost_1","23b"],["affinity_boost_1","23a"],["dulling_strike","23a"],["attack_boost_2","18d"]]],"baseSharpness":[40,60,80,120,50,0,0],"maxSharpness":[40,60,80,120,80,20,0]}]],["Jaggi & Jaggia Tree",[{"id":"24a","name":"Hack Blade I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["dulling_strike",null],["small_monster_exploit",null],["attack_boost_2","18b"],["affinity_boost_1","18b"]]],"baseSharpness":[40,110,30,20,0,0,0],"maxSharpness":[40,110,30,70,0,0,0]},{"id":"24b","name":"Hack Blade II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["dulling_strike",null],["small_monster_exploit",null],["defense_boost_1","24a"],["attack_boost_2","18b"],["affinity_boost_1","18b"]]],"baseSharpness":[50,140,30,30,0,0,0],"maxSharpness":[50,140,30,80,0,0,0]},{"id":"24c","name":"Jaggi Greatblade","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["dulling_strike",null],["defense_grinder_1",null],["small_monster_exploit","24b"],["defense_boost_1","24a"],["attack_boost_2","18b"],["affinity_boost_1","18b"]]],"baseSharpness":[50,160,30,30,30,0,0],"maxSharpness":[50,160,30,30,50,30,0]}]],["Anjanath Tree",[{"id":"25a","name":"Flammenzahn I","rarity":3,"endlineTag":"","attack":140,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["fire",20]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["defense_boost_2","24b"],["dulling_strike","24b"],["small_monster_exploit","24b"],["defense_boost_1","24a"],["attack_boost_2","18b"]]],"baseSharpness":[120,70,30,30,0,0,0],"maxSharpness":[120,70,30,80,0,0,0]},{"id":"25b","name":"Flammenzahn II","rarity":5,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[["fire",24]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","25a"],["defense_boost_2","24b"],["dulling_strike","24b"],["small_monster_exploit","24b"],["defense_boost_1","24a"],["attack_boost_2","18b"]]],"baseSharpness":[120,100,30,50,0,0,0],"maxSharpness":[120,100,30,90,10,0,0]},{"id":"25c","name":"Gnashing Flammenzahn","rarity":6,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[["fire",26]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","25b"],["fire_boost_2","25b"],["fire_boost_1","25a"],["defense_boost_2","24b"],["dulling_strike","24b"],["small_monster_exploit","24b"],["defense_boost_1","24a"],["attack_boost_2","18b"]]],"baseSharpness":[130,120,40,50,10,0,0],"maxSharpness":[130,120,40,50,60,0,0]}]],["Zinogre Tree",[{"id":"26a","name":"Usurper\'s Storm I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",30]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["defense_boost_2","24b"],["dulling_strike","24b"],["small_monster_exploit","24b"],["defense_boost_1","24a"],["attack_boost_2","18b"],["affinity_boost_1","18b"]]],"baseSharpness":[70,40,50,90,0,0,0],"maxSharpness":[70,40,50,140,0,0,0]},{"id":"26b","name":"Usurper\'s Storm II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["thunder",35]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","26a"],["defense_boost_2","24b"],["dulling_strike","24b"],["small_monster_exploit","24b"],["defense_boost_1","24a"],["affinity_boost_1","18b"]]],"baseSharpness":[60,30,100,100,10,0,0],"maxSharpness":[60,30,100,100,60,0,0]},{"id":"26c","name":"Despot\'s Blackstorm","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",38]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","26b"],["attack_boost_1","26a"],["defense_boost_2","24b"],["dulling_strike","24b"],["small_monster_exploit","24b"],["defense_boost_1","24a"],["affinity_boost_1","18b"]]],"baseSharpness":[60,40,120,100,30,0,0],"maxSharpness":[60,40,120,100,40,40,0]}]],["Royal Ludroth Tree",[{"id":"27a","name":"Cataclysm Sword I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",30]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[40,70,50,40,0,0,0],"maxSharpness":[40,70,50,90,0,0,0]},{"id":"27b","name":"Cataclysm Sword II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",32]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[50,70,80,50,0,0,0],"maxSharpness":[50,70,80,100,0,0,0]},{"id":"27c","name":"Cataclysm Blade","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",35]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","27b"],["water_boost_1","27b"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[60,40,120,80,0,0,0],"maxSharpness":[60,40,120,100,30,0,0]}]],["Lagombi Tree",[{"id":"28a","name":"Snowclad I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["small_monster_exploit",null],["attack_boost_2","18a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[70,80,50,0,0,0,0],"maxSharpness":[70,80,100,0,0,0,0]},{"id":"28b","name":"Snowclad II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",25]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["small_monster_exploit",null],["ice_boost_1","28a"],["attack_boost_2","18a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[70,60,40,30,0,0,0],"maxSharpness":[70,60,40,80,0,0,0]},{"id":"28c","name":"Lagombi Charlotte","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",35]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["dulling_strike",null],["attack_boost_1","28b"],["small_monster_exploit","28b"],["ice_boost_1","28a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,30,100,100,10,0,0],"maxSharpness":[60,30,100,100,40,20,0]}]],["Magnamalo Tree",[{"id":"29a","name":"Sinister Blade I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",15]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0]},{"id":"29b","name":"Sinister Blade II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",18]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","29a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0]},{"id":"29c","name":"Sinister Shadowblade","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",25]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","29b"],["attack_boost_2","29a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0]}]],["Rajang Tree",[{"id":"30a","name":"Demon Rod I","rarity":5,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",20]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,130,0,0,0]},{"id":"30b","name":"Demon Rod II","rarity":6,"endlineTag":"","attack":190,"affinity":10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",24]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","30a"]]],"baseSharpness":[20,40,100,90,0,0,0],"maxSharpness":[20,40,100,130,10,0,0]},{"id":"30c","name":"Great Demon Rod","rarity":7,"endlineTag":"hr","attack":210,"affinity":10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",26]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","30b"],["thunder_boost_1","30a"]]],"baseSharpness":[50,60,80,100,10,0,0],"maxSharpness":[50,60,80,100,50,10,0]}]],["Ibushi Tree",[{"id":"31a","name":"Azure Elder Great Sword I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",10]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0]},{"id":"31b","name":"Azure Elder Great Sword II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",12]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","31a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0]},{"id":"31c","name":"Abyssal Galeblade","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",15]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","31b"],["defense_boost_1","31a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0]}]],["Narwa Tree",[{"id":"32a","name":"Thunderbolt Great Sword I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",46]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0]},{"id":"32b","name":"Abyssal Storm Cleaver","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",50]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","32a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0]}]],["Kushala Daora Tree",[{"id":"33a","name":"Gelosteel Edge I","rarity":6,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",40]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[70,40,120,90,30,0,0],"maxSharpness":[70,40,120,90,60,20,0]},{"id":"33b","name":"Daora\'s Decimator","rarity":7,"endlineTag":"hr","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",45]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","33a"],["affinity_boost_2","33a"]]],"baseSharpness":[80,120,70,40,30,10,0],"maxSharpness":[80,120,70,40,30,60,0]}]],["Teostra Tree",[{"id":"34a","name":"Teostra Blade I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",38]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[150,20,80,90,10,0,0],"maxSharpness":[150,20,80,90,40,20,0]},{"id":"34b","name":"King Teostra Blade","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",45]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","34a"]]],"baseSharpness":[160,50,30,90,20,0,0],"maxSharpness":[160,50,30,90,40,30,0]}]],["Chameleos Tree",[{"id":"35a","name":"Grand Shamshir I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",60]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[100,30,80,90,50,0,0],"maxSharpness":[100,30,80,90,50,50,0]},{"id":"35b","name":"Foreboding Shamshir","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",66]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","35a"]]],"baseSharpness":[50,30,100,90,80,0,0],"maxSharpness":[50,30,100,90,80,50,0]}]],["Valstrax Tree",[{"id":"36a","name":"Redwing Claymore I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",42]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0]},{"id":"36b","name":"Reddnaught Claymore","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",45]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0]}]],["Chaos Tree",[{"id":"37a","name":"Wyvern\'s Perch I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",30]],"rampSkills":[[["poison_boost_1",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[20,30,150,0,0,0,0],"maxSharpness":[20,30,200,0,0,0,0]},{"id":"37b","name":"Wyvern\'s Perch II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",32]],"rampSkills":[[["poison_boost_1",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[30,40,170,10,0,0,0],"maxSharpness":[30,40,170,50,10,0,0]},{"id":"37c","name":"Roguish Deathcap","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",35]],"rampSkills":[[["poison_boost_1",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[30,30,170,20,0,0,0],"maxSharpness":[30,30,170,50,20,0,0]}]],["Shell-Studded Tree",[{"id":"38a","name":"Sleepy Shellblade I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["sleep",8]],"rampSkills":[[["defense_boost_1",null],["sleep_boost_1",null],["anti_aquatic_species",null]]],"baseSharpness":[50,50,90,10,0,0,0],"maxSharpness":[50,50,90,60,0,0,0]},{"id":"38b","name":"Sleepy Shellblade II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":17,"decoSlots":[],"eleStat":[["sleep",10]],"rampSkills":[[["defense_boost_2",null],["sleep_boost_1",null],["anti_aquatic_species",null],["defense_boost_1","38a"]]],"baseSharpness":[40,90,100,20,0,0,0],"maxSharpness":[40,90,100,60,10,0,0]},{"id":"38c","name":"Soporific Shellblade","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":20,"decoSlots":[3,1],"eleStat":[["sleep",15]],"rampSkills":[[["defense_boost_3",null],["sleep_boost_2",null],["anti_aquatic_species",null],["defense_boost_2","38b"],["sleep_boost_1","38b"],["defense_boost_1","38a"]]],"baseSharpness":[50,70,130,50,0,0,0],"maxSharpness":[50,70,130,70,30,0,0]}]],["Speartuna Tree",[{"id":"39a","name":"Frozen Speartuna I","rarity":4,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",50]],"rampSkills":[[["attack_boost_3",null],["element_exploit",null],["iceblight_exploit",null]]],"baseSharpness":[80,40,110,70,0,0,0],"maxSharpness":[80,40,110,100,20,0,0]},{"id":"39b","name":"Frozen Speartuna II","rarity":5,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",60]],"rampSkills":[[["attack_boost_3",null],["element_exploit",null],["iceblight_exploit",null]]],"baseSharpness":[80,40,110,100,20,0,0],"maxSharpness":[80,40,110,100,70,0,0]},{"id":"39c","name":"Freezer Speartuna","rarity":6,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",70]],"rampSkills":[[["attack_boost_4",null],["element_exploit",null],["iceblight_exploit",null],["attack_boost_3","39b"]]],"baseSharpness":[50,70,90,110,30,0,0],"maxSharpness":[50,70,90,110,70,10,0]}]],["Smithy Tree",[{"id":"40a","name":"Ninja Parasol I","rarity":3,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",20]],"rampSkills":[[["defense_boost_2",null],["dragon_boost_2",null],["wyvern_exploit",null]]],"baseSharpness":[120,110,50,20,0,0,0],"maxSharpness":[120,110,50,50,20,0,0]},{"id":"40b","name":"Ninja Parasol II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["dragon",22]],"rampSkills":[[["defense_boost_3",null],["dragon_boost_2",null],["wyvern_exploit",null],["defense_boost_2","40a"]]],"baseSharpness":[110,110,50,30,0,0,0],"maxSharpness":[110,110,50,40,40,0,0]},{"id":"40c","name":"Drag\\u00e3oslayer Parasol","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["dragon",25]],"rampSkills":[[["defense_boost_3",null],["dragon_boost_3",null],["wyvern_exploit",null],["dragon_boost_2","40b"],["defense_boost_2","40a"]]],"baseSharpness":[80,100,60,60,0,0,0],"maxSharpness":[80,100,60,60,50,0,0]}]],["Felyne Tree",[{"id":"41a","name":"Cat\'s Soul I","rarity":4,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",36]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["buddy_rally",null]]],"baseSharpness":[70,40,50,40,0,0,0],"maxSharpness":[70,40,50,90,0,0,0]},{"id":"41b","name":"Cat\'s Soul II","rarity":5,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",40]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["buddy_rally",null]]],"baseSharpness":[50,70,80,50,0,0,0],"maxSharpness":[50,70,80,90,10,0,0]},{"id":"41c","name":"Cat\'s Curse","rarity":6,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["paralysis",45]],"rampSkills":[[["attack_boost_4",null],["dulling_strike",null],["buddy_rally",null],["attack_boost_3","41b"]]],"baseSharpness":[40,60,80,70,0,0,0],"maxSharpness":[40,60,80,90,30,0,0]}]],["Rampage Tree",[{"id":"ra","name":"Rampage Cleaver I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"rb","name":"Rampage Cleaver II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"rc","name":"Rampage Cleaver III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"rd","name":"Rampage Cleaver IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0]},{"id":"re","name":"Rampage Cleaver V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0]},{"id":"rf","name":"Rampage Cleaver S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_3",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["elemental_boost_2","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_4",null],["water_4",null],["thunder_4",null],["ice_4",null],["dragon_4",null],["poison_3",null],["paralysis_3",null],["sleep_3",null],["blast_3",null],["fire_3","re"],["water_3","re"],["thunder_3","re"],["ice_3","re"],["dragon_3","re"],["poison_2","re"],["paralysis_2","re"],["sleep_2","re"],["blast_2","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0]}]]]}';
 
-export const greatswordsArray: Readonly<Greatsword[]> = [
-    __generated_greatsword__1a,
-    __generated_greatsword__1b,
-    __generated_greatsword__1c,
-    __generated_greatsword__1d,
-    __generated_greatsword__1e,
-    __generated_greatsword__1f,
-    __generated_greatsword__2a,
-    __generated_greatsword__2b,
-    __generated_greatsword__2c,
-    __generated_greatsword__3a,
-    __generated_greatsword__3b,
-    __generated_greatsword__3c,
-    __generated_greatsword__4a,
-    __generated_greatsword__4b,
-    __generated_greatsword__4c,
-    __generated_greatsword__5a,
-    __generated_greatsword__5b,
-    __generated_greatsword__5c,
-    __generated_greatsword__6a,
-    __generated_greatsword__6b,
-    __generated_greatsword__6c,
-    __generated_greatsword__7a,
-    __generated_greatsword__7b,
-    __generated_greatsword__7c,
-    __generated_greatsword__8a,
-    __generated_greatsword__8b,
-    __generated_greatsword__8c,
-    __generated_greatsword__9a,
-    __generated_greatsword__9b,
-    __generated_greatsword__9c,
-    __generated_greatsword__10a,
-    __generated_greatsword__10b,
-    __generated_greatsword__10c,
-    __generated_greatsword__11a,
-    __generated_greatsword__11b,
-    __generated_greatsword__11c,
-    __generated_greatsword__12a,
-    __generated_greatsword__12b,
-    __generated_greatsword__12c,
-    __generated_greatsword__12d,
-    __generated_greatsword__12e,
-    __generated_greatsword__12f,
-    __generated_greatsword__13a,
-    __generated_greatsword__13b,
-    __generated_greatsword__13c,
-    __generated_greatsword__14a,
-    __generated_greatsword__14b,
-    __generated_greatsword__14c,
-    __generated_greatsword__15a,
-    __generated_greatsword__15b,
-    __generated_greatsword__15c,
-    __generated_greatsword__16a,
-    __generated_greatsword__16b,
-    __generated_greatsword__16c,
-    __generated_greatsword__17a,
-    __generated_greatsword__17b,
-    __generated_greatsword__17c,
-    __generated_greatsword__18a,
-    __generated_greatsword__18b,
-    __generated_greatsword__18c,
-    __generated_greatsword__18d,
-    __generated_greatsword__18e,
-    __generated_greatsword__18f,
-    __generated_greatsword__19a,
-    __generated_greatsword__19b,
-    __generated_greatsword__20a,
-    __generated_greatsword__20b,
-    __generated_greatsword__20c,
-    __generated_greatsword__21a,
-    __generated_greatsword__21b,
-    __generated_greatsword__21c,
-    __generated_greatsword__22a,
-    __generated_greatsword__22b,
-    __generated_greatsword__22c,
-    __generated_greatsword__23a,
-    __generated_greatsword__23b,
-    __generated_greatsword__23c,
-    __generated_greatsword__24a,
-    __generated_greatsword__24b,
-    __generated_greatsword__24c,
-    __generated_greatsword__25a,
-    __generated_greatsword__25b,
-    __generated_greatsword__25c,
-    __generated_greatsword__26a,
-    __generated_greatsword__26b,
-    __generated_greatsword__26c,
-    __generated_greatsword__27a,
-    __generated_greatsword__27b,
-    __generated_greatsword__27c,
-    __generated_greatsword__28a,
-    __generated_greatsword__28b,
-    __generated_greatsword__28c,
-    __generated_greatsword__29a,
-    __generated_greatsword__29b,
-    __generated_greatsword__29c,
-    __generated_greatsword__30a,
-    __generated_greatsword__30b,
-    __generated_greatsword__30c,
-    __generated_greatsword__31a,
-    __generated_greatsword__31b,
-    __generated_greatsword__31c,
-    __generated_greatsword__32a,
-    __generated_greatsword__32b,
-    __generated_greatsword__33a,
-    __generated_greatsword__33b,
-    __generated_greatsword__34a,
-    __generated_greatsword__34b,
-    __generated_greatsword__35a,
-    __generated_greatsword__35b,
-    __generated_greatsword__36a,
-    __generated_greatsword__36b,
-    __generated_greatsword__37a,
-    __generated_greatsword__37b,
-    __generated_greatsword__37c,
-    __generated_greatsword__38a,
-    __generated_greatsword__38b,
-    __generated_greatsword__38c,
-    __generated_greatsword__39a,
-    __generated_greatsword__39b,
-    __generated_greatsword__39c,
-    __generated_greatsword__40a,
-    __generated_greatsword__40b,
-    __generated_greatsword__40c,
-    __generated_greatsword__41a,
-    __generated_greatsword__41b,
-    __generated_greatsword__41c,
-    __generated_greatsword__ra,
-    __generated_greatsword__rb,
-    __generated_greatsword__rc,
-    __generated_greatsword__rd,
-    __generated_greatsword__re,
-    __generated_greatsword__rf,
-];
+export const greatswordsArray: Readonly<Greatsword[]> = loadWeaponPayload<Greatsword>(payload);
@@ -36,5934 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type Gunlance,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_3,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__blast_boost_3,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_4,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_boost_3,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_4,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_4,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_3,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__paralysis_boost_2,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_3,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__poison_boost_3,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__shelling_long_1,
-    __generated_ramp__shelling_long_2,
-    __generated_ramp__shelling_long_3,
-    __generated_ramp__shelling_normal_1,
-    __generated_ramp__shelling_normal_2,
-    __generated_ramp__shelling_normal_3,
-    __generated_ramp__shelling_wide_1,
-    __generated_ramp__shelling_wide_2,
-    __generated_ramp__shelling_wide_3,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_3,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__sleep_boost_2,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_4,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_4,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyrmstake_boost,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_gunlance__1a: Gunlance = {
-    category: "gunlance",
-    id: "1a",
-
-    name: "Kamura Gunlance I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuragunlancei",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_gunlance__1b: Gunlance = {
-    category: "gunlance",
-    id: "1b",
-
-    name: "Kamura Gunlance II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuragunlanceii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_gunlance__1c: Gunlance = {
-    category: "gunlance",
-    id: "1c",
-
-    name: "Kamura Gunlance III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuragunlanceiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_gunlance__1d: Gunlance = {
-    category: "gunlance",
-    id: "1d",
-
-    name: "Kamura Gunlance IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuragunlanceiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_gunlance__1e: Gunlance = {
-    category: "gunlance",
-    id: "1e",
-
-    name: "Kamura Gunlance V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__1d],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1d],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuragunlancev",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_gunlance__1f: Gunlance = {
-    category: "gunlance",
-    id: "1f",
-
-    name: "Kamura Ninja Gunlance",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_gunlance__1e],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__1d],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1d],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjagunlance",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_gunlance__2a: Gunlance = {
-    category: "gunlance",
-    id: "2a",
-
-    name: "Ukiyo no Yamiwo I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 50, 70, 0, 0, 0],
-    maxSharpness:  [90, 40, 50, 90, 30, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "ukiyonoyamiwoi",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_gunlance__2b: Gunlance = {
-    category: "gunlance",
-    id: "2b",
-
-    name: "Ukiyo no Yamiwo II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__2a],
-            [__generated_ramp__water_boost_1, __generated_gunlance__2a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 70, 80, 30, 0, 0],
-    maxSharpness:  [90, 80, 70, 80, 60, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "ukiyonoyamiwoii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_gunlance__2c: Gunlance = {
-    category: "gunlance",
-    id: "2c",
-
-    name: "Mizumori",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__2b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__2a],
-            [__generated_ramp__water_boost_1, __generated_gunlance__2a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 70, 80, 40, 0, 0],
-    maxSharpness:  [90, 70, 70, 80, 40, 50, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "mizumori",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_gunlance__3a: Gunlance = {
-    category: "gunlance",
-    id: "3a",
-
-    name: "Princess Panoply I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 30, 70, 70, 0, 0, 0],
-    maxSharpness:  [80, 30, 70, 120, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "princesspanoplyi",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_gunlance__3b: Gunlance = {
-    category: "gunlance",
-    id: "3b",
-
-    name: "Princess Panoply II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 30, 60, 130, 0, 0, 0],
-    maxSharpness:  [80, 30, 60, 130, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "princesspanoplyii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_gunlance__3c: Gunlance = {
-    category: "gunlance",
-    id: "3c",
-
-    name: "Ortlinde",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 30, 80, 140, 20, 0, 0],
-    maxSharpness:  [80, 30, 80, 140, 40, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "ortlinde",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_gunlance__4a: Gunlance = {
-    category: "gunlance",
-    id: "4a",
-
-    name: "Red Rook I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__poison_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__3b],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 90, 100, 10, 0, 0],
-    maxSharpness:  [70, 80, 90, 100, 50, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "redrooki",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_gunlance__4b: Gunlance = {
-    category: "gunlance",
-    id: "4b",
-
-    name: "Red Rook II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__poison_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__3b],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 70, 110, 20, 0, 0],
-    maxSharpness:  [70, 80, 70, 110, 50, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "redrookii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_gunlance__4c: Gunlance = {
-    category: "gunlance",
-    id: "4c",
-
-    name: "Crimson Rook",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__4b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__poison_boost_1, __generated_gunlance__3b],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__3b],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__1c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 50, 120, 30, 0, 0],
-    maxSharpness:  [70, 80, 50, 120, 50, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "crimsonrook",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_gunlance__5a: Gunlance = {
-    category: "gunlance",
-    id: "5a",
-
-    name: "Delex Harpoon I",
-    treeName: "Delex Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 50, 20, 0, 0, 0],
-    maxSharpness:  [50, 80, 50, 70, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "delexharpooni",
-        treeNameLower: "delextree",
-    },
-};
-
-const __generated_gunlance__5b: Gunlance = {
-    category: "gunlance",
-    id: "5b",
-
-    name: "Delex Harpoon II",
-    treeName: "Delex Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 110, 70, 30, 0, 0, 0],
-    maxSharpness:  [40, 110, 70, 80, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "delexharpoonii",
-        treeNameLower: "delextree",
-    },
-};
-
-const __generated_gunlance__5c: Gunlance = {
-    category: "gunlance",
-    id: "5c",
-
-    name: "Sand Blaster Gunlance",
-    treeName: "Delex Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__5b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 110, 80, 50, 30, 0, 0],
-    maxSharpness:  [30, 110, 80, 50, 70, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "sandblastergunlance",
-        treeNameLower: "delextree",
-    },
-};
-
-const __generated_gunlance__6a: Gunlance = {
-    category: "gunlance",
-    id: "6a",
-
-    name: "Usurper's Roar I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__5b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5b],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__5b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 50, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 100, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'sroari",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_gunlance__6b: Gunlance = {
-    category: "gunlance",
-    id: "6b",
-
-    name: "Usurper's Roar II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__6a],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__5b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5b],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__5b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 50, 30, 0, 0],
-    maxSharpness:  [60, 60, 100, 50, 70, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'sroarii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_gunlance__6c: Gunlance = {
-    category: "gunlance",
-    id: "6c",
-
-    name: "Despot's Phlogiston",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__6b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__6a],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__5b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5b],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__5b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 120, 50, 30, 0, 0],
-    maxSharpness:  [60, 90, 120, 50, 50, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "despot'sphlogiston",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_gunlance__7a: Gunlance = {
-    category: "gunlance",
-    id: "7a",
-
-    name: "Twinfang I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__5a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "twinfangi",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_gunlance__7b: Gunlance = {
-    category: "gunlance",
-    id: "7b",
-
-    name: "Twinfang II",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__7a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__5a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 70, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "twinfangii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_gunlance__7c: Gunlance = {
-    category: "gunlance",
-    id: "7c",
-
-    name: "Ambermarch",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__7b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__7a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__5a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__5a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 90, 60, 0, 0],
-    maxSharpness:  [50, 70, 80, 90, 60, 50, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "ambermarch",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_gunlance__8a: Gunlance = {
-    category: "gunlance",
-    id: "8a",
-
-    name: "Iron Gunlance I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "irongunlancei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_gunlance__8b: Gunlance = {
-    category: "gunlance",
-    id: "8b",
-
-    name: "Iron Gunlance II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 70, 50, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "irongunlanceii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_gunlance__8c: Gunlance = {
-    category: "gunlance",
-    id: "8c",
-
-    name: "Eizenlitter",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 50, 40, 0, 0, 0],
-    maxSharpness:  [80, 80, 50, 90, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "eizenlitter",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_gunlance__8d: Gunlance = {
-    category: "gunlance",
-    id: "8d",
-
-    name: "Striker's Gunlance I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "striker'sgunlancei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_gunlance__8e: Gunlance = {
-    category: "gunlance",
-    id: "8e",
-
-    name: "Striker's Gunlance II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 60, 50, 20, 0, 0],
-    maxSharpness:  [90, 80, 60, 50, 50, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "striker'sgunlanceii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_gunlance__8f: Gunlance = {
-    category: "gunlance",
-    id: "8f",
-
-    name: "Imperial Guardlance",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8e],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 50, 50, 30, 0, 0],
-    maxSharpness:  [90, 80, 50, 50, 50, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "imperialguardlance",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_gunlance__9a: Gunlance = {
-    category: "gunlance",
-    id: "9a",
-
-    name: "General's Arbalance I",
-    treeName: "Ore Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 70, 50, 30, 0, 0],
-    maxSharpness:  [80, 70, 70, 50, 80, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "general'sarbalancei",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_gunlance__9b: Gunlance = {
-    category: "gunlance",
-    id: "9b",
-
-    name: "General's Arbalance II",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 60, 40, 0, 0],
-    maxSharpness:  [60, 70, 70, 60, 80, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "general'sarbalanceii",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_gunlance__9c: Gunlance = {
-    category: "gunlance",
-    id: "9c",
-
-    name: "Admiral's Arbalance",
-    treeName: "Ore Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__9b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 70, 70, 50, 0, 0],
-    maxSharpness:  [90, 70, 70, 70, 70, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "admiral'sarbalance",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_gunlance__10a: Gunlance = {
-    category: "gunlance",
-    id: "10a",
-
-    name: "Pukei Gunlance I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__wyvern_exploit, __generated_gunlance__9a],
-            [__generated_ramp__wyrmstake_boost, __generated_gunlance__9a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 70, 10, 0, 0],
-    maxSharpness:  [60, 70, 90, 70, 60, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "pukeigunlancei",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_gunlance__10b: Gunlance = {
-    category: "gunlance",
-    id: "10b",
-
-    name: "Pukei Gunlance II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__10a],
-            [__generated_ramp__wyvern_exploit, __generated_gunlance__9a],
-            [__generated_ramp__wyrmstake_boost, __generated_gunlance__9a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 90, 90, 20, 0, 0],
-    maxSharpness:  [80, 70, 90, 90, 60, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "pukeigunlanceii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_gunlance__10c: Gunlance = {
-    category: "gunlance",
-    id: "10c",
-
-    name: "Datura Gunlance",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__poison_boost_3, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__10b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__10b],
-            [__generated_ramp__poison_boost_2, __generated_gunlance__10b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__10a],
-            [__generated_ramp__wyvern_exploit, __generated_gunlance__9a],
-            [__generated_ramp__wyrmstake_boost, __generated_gunlance__9a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 80, 40, 0, 0],
-    maxSharpness:  [70, 70, 90, 80, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "daturagunlance",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_gunlance__11a: Gunlance = {
-    category: "gunlance",
-    id: "11a",
-
-    name: "Diablos Gunlance I",
-    treeName: "Diablos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -10,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 70, 0, 0, 0],
-    maxSharpness:  [60, 60, 60, 80, 40, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "diablosgunlancei",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_gunlance__11b: Gunlance = {
-    category: "gunlance",
-    id: "11b",
-
-    name: "Diablos Gunlance II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 240,
-    affinity: -10,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__11a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 100, 0, 0, 0],
-    maxSharpness:  [90, 80, 80, 100, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "diablosgunlanceii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_gunlance__11c: Gunlance = {
-    category: "gunlance",
-    id: "11c",
-
-    name: "Diablos Cannon",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 250,
-    affinity: -10,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__11b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__11b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__11a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__8d],
-            [__generated_ramp__silkbind_boost, __generated_gunlance__8d],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 80, 120, 0, 0, 0],
-    maxSharpness:  [90, 60, 80, 120, 30, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "diabloscannon",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_gunlance__12a: Gunlance = {
-    category: "gunlance",
-    id: "12a",
-
-    name: "Aknosom Gunlance I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 80, 40, 0, 0, 0],
-    maxSharpness:  [30, 50, 80, 90, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "aknosomgunlancei",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_gunlance__12b: Gunlance = {
-    category: "gunlance",
-    id: "12b",
-
-    name: "Aknosom Gunlance II",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 100, 50, 0, 0, 0],
-    maxSharpness:  [40, 60, 100, 100, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "aknosomgunlanceii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_gunlance__12c: Gunlance = {
-    category: "gunlance",
-    id: "12c",
-
-    name: "Aknosom Gunlance III",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 60, 20, 0, 0],
-    maxSharpness:  [50, 60, 110, 60, 50, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "aknosomgunlanceiii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_gunlance__12d: Gunlance = {
-    category: "gunlance",
-    id: "12d",
-
-    name: "Dawnbreaker Gunlance",
-    treeName: "Aknosom Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 100, 60, 30, 0, 0],
-    maxSharpness:  [50, 60, 100, 60, 50, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "dawnbreakergunlance",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_gunlance__13a: Gunlance = {
-    category: "gunlance",
-    id: "13a",
-
-    name: "Almudron Gunlance I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fireblight_exploit, __generated_gunlance__12b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 80, 20, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "almudrongunlancei",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_gunlance__13b: Gunlance = {
-    category: "gunlance",
-    id: "13b",
-
-    name: "Almudron Gunlance II",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__13a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fireblight_exploit, __generated_gunlance__12b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 60, 40, 0, 0],
-    maxSharpness:  [60, 60, 80, 60, 90, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "almudrongunlanceii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_gunlance__13c: Gunlance = {
-    category: "gunlance",
-    id: "13c",
-
-    name: "Doombringer Gunlance",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 46]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_gunlance__13b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__13a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__12b],
-            [__generated_ramp__fireblight_exploit, __generated_gunlance__12b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 100, 50, 0, 0],
-    maxSharpness:  [60, 60, 80, 100, 100, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "doombringergunlance",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_gunlance__14a: Gunlance = {
-    category: "gunlance",
-    id: "14a",
-
-    name: "Full Voltage I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 40, 30, 0, 0, 0],
-    maxSharpness:  [40, 90, 40, 80, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "fullvoltagei",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_gunlance__14b: Gunlance = {
-    category: "gunlance",
-    id: "14b",
-
-    name: "Full Voltage II",
-    treeName: "Khezu Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__14a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [40, 100, 70, 40, 0, 0, 0],
-    maxSharpness:  [40, 100, 70, 40, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "fullvoltageii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_gunlance__14c: Gunlance = {
-    category: "gunlance",
-    id: "14c",
-
-    name: "High Volt Gunlance",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__14b],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__14b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__14a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [40, 100, 80, 50, 30, 0, 0],
-    maxSharpness:  [40, 100, 80, 50, 30, 50, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "highvoltgunlance",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_gunlance__15a: Gunlance = {
-    category: "gunlance",
-    id: "15a",
-
-    name: "Shattershot I",
-    treeName: "Volvidon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__14a],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__14a],
-            [__generated_ramp__thunderblight_exploit, __generated_gunlance__14a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [130, 40, 50, 30, 0, 0, 0],
-    maxSharpness:  [130, 40, 50, 80, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "shattershoti",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_gunlance__15b: Gunlance = {
-    category: "gunlance",
-    id: "15b",
-
-    name: "Shattershot II",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__15a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__15a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__14a],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__14a],
-            [__generated_ramp__thunderblight_exploit, __generated_gunlance__14a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [140, 40, 50, 70, 0, 0, 0],
-    maxSharpness:  [140, 40, 50, 70, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "shattershotii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_gunlance__15c: Gunlance = {
-    category: "gunlance",
-    id: "15c",
-
-    name: "Shatter God",
-    treeName: "Volvidon Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__15b],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__15a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__15a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__14a],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__14a],
-            [__generated_ramp__thunderblight_exploit, __generated_gunlance__14a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__8b],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 50, 70, 20, 0, 0],
-    maxSharpness:  [160, 50, 50, 70, 60, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "shattergod",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_gunlance__16a: Gunlance = {
-    category: "gunlance",
-    id: "16a",
-
-    name: "Baggi Gunlance I",
-    treeName: "Baggi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 50, 20, 0, 0, 0],
-    maxSharpness:  [100, 30, 50, 70, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "baggigunlancei",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_gunlance__16b: Gunlance = {
-    category: "gunlance",
-    id: "16b",
-
-    name: "Baggi Gunlance II",
-    treeName: "Baggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__16a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 50, 40, 0, 0, 0],
-    maxSharpness:  [100, 60, 50, 90, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "baggigunlanceii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_gunlance__16c: Gunlance = {
-    category: "gunlance",
-    id: "16c",
-
-    name: "Baggi Gunlance III",
-    treeName: "Baggi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__sleep_boost_1, __generated_gunlance__16b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__16a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 60, 70, 0, 0, 0],
-    maxSharpness:  [100, 70, 60, 70, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "baggigunlanceiii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_gunlance__16d: Gunlance = {
-    category: "gunlance",
-    id: "16d",
-
-    name: "Lullabyte Sleeplance",
-    treeName: "Baggi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__16c],
-            [__generated_ramp__sleep_boost_1, __generated_gunlance__16b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__16a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__8a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 80, 60, 30, 0, 0],
-    maxSharpness:  [90, 90, 80, 60, 60, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "lullabytesleeplance",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_gunlance__17a: Gunlance = {
-    category: "gunlance",
-    id: "17a",
-
-    name: "Kadachi Striker I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__sleep_boost_1, __generated_gunlance__16a],
-            [__generated_ramp__buddy_rally, __generated_gunlance__16a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [120, 50, 40, 40, 0, 0, 0],
-    maxSharpness:  [120, 50, 40, 80, 10, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "kadachistrikeri",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_gunlance__17b: Gunlance = {
-    category: "gunlance",
-    id: "17b",
-
-    name: "Kadachi Striker II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__17a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__17a],
-            [__generated_ramp__thunder_boost_2, __generated_gunlance__17a],
-            [__generated_ramp__sleep_boost_1, __generated_gunlance__16a],
-            [__generated_ramp__buddy_rally, __generated_gunlance__16a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [120, 80, 50, 80, 20, 0, 0],
-    maxSharpness:  [120, 80, 50, 80, 60, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kadachistrikerii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_gunlance__17c: Gunlance = {
-    category: "gunlance",
-    id: "17c",
-
-    name: "Mythic Kadachi Striker",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__17b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__17a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__17a],
-            [__generated_ramp__thunder_boost_2, __generated_gunlance__17a],
-            [__generated_ramp__sleep_boost_1, __generated_gunlance__16a],
-            [__generated_ramp__buddy_rally, __generated_gunlance__16a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__8a],
-        ],
-    ],
-
-    baseSharpness: [110, 80, 30, 100, 30, 0, 0],
-    maxSharpness:  [110, 80, 30, 100, 50, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "mythickadachistriker",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_gunlance__18a: Gunlance = {
-    category: "gunlance",
-    id: "18a",
-
-    name: "Bone Gunlance I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "bonegunlancei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_gunlance__18b: Gunlance = {
-    category: "gunlance",
-    id: "18b",
-
-    name: "Bone Gunlance II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "bonegunlanceii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_gunlance__18c: Gunlance = {
-    category: "gunlance",
-    id: "18c",
-
-    name: "Wyvern Bone Gunlance",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 0, 0, 0, 0],
-    maxSharpness:  [90, 50, 110, 0, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "wyvernbonegunlance",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_gunlance__18d: Gunlance = {
-    category: "gunlance",
-    id: "18d",
-
-    name: "Golem Gunlance I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 60, 10, 0, 0, 0],
-    maxSharpness:  [100, 80, 60, 60, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "golemgunlancei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_gunlance__18e: Gunlance = {
-    category: "gunlance",
-    id: "18e",
-
-    name: "Golem Gunlance II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18d],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "golemgunlanceii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_gunlance__18f: Gunlance = {
-    category: "gunlance",
-    id: "18f",
-
-    name: "Behemoth Gunlance",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__18e],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18d],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 100, 20, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "behemothgunlance",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_gunlance__19a: Gunlance = {
-    category: "gunlance",
-    id: "19a",
-
-    name: "Hidden Gunlance I",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__18e],
-            [__generated_ramp__dulling_strike, __generated_gunlance__18e],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18d],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 100, 80, 50, 0, 0],
-    maxSharpness:  [50, 70, 100, 80, 90, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "hiddengunlancei",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_gunlance__19b: Gunlance = {
-    category: "gunlance",
-    id: "19b",
-
-    name: "Hidden Gunlance II",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__18e],
-            [__generated_ramp__dulling_strike, __generated_gunlance__18e],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18d],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 90, 80, 60, 0, 0],
-    maxSharpness:  [50, 70, 90, 80, 90, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "hiddengunlanceii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_gunlance__19c: Gunlance = {
-    category: "gunlance",
-    id: "19c",
-
-    name: "Fading Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__19b],
-            [__generated_ramp__dulling_strike, __generated_gunlance__18e],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18d],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 100, 90, 70, 20, 0],
-    maxSharpness:  [50, 70, 100, 90, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "fadingnight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_gunlance__20a: Gunlance = {
-    category: "gunlance",
-    id: "20a",
-
-    name: "Flaming Gunlance I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 30, 30, 0, 0, 0],
-    maxSharpness:  [100, 90, 30, 80, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "flaminggunlancei",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_gunlance__20b: Gunlance = {
-    category: "gunlance",
-    id: "20b",
-
-    name: "Flaming Gunlance II",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 30, 50, 0, 0, 0],
-    maxSharpness:  [100, 70, 30, 100, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "flaminggunlanceii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_gunlance__20c: Gunlance = {
-    category: "gunlance",
-    id: "20c",
-
-    name: "Flaming Gunlance III",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__20b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [150, 60, 20, 70, 0, 0, 0],
-    maxSharpness:  [150, 60, 20, 90, 30, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "flaminggunlanceiii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_gunlance__20d: Gunlance = {
-    category: "gunlance",
-    id: "20d",
-
-    name: "Barbarous Fogolance",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__20c],
-            [__generated_ramp__fire_boost_2, __generated_gunlance__20c],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__20b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18c],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18c],
-        ],
-    ],
-
-    baseSharpness: [180, 60, 20, 90, 0, 0, 0],
-    maxSharpness:  [180, 60, 20, 90, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "barbarousfirelance",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_gunlance__21a: Gunlance = {
-    category: "gunlance",
-    id: "21a",
-
-    name: "Barroth Loader I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: -20,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 140, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 140, 50, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "barrothloaderi",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_gunlance__21b: Gunlance = {
-    category: "gunlance",
-    id: "21b",
-
-    name: "Barroth Loader II",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__21a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 130, 10, 0, 0, 0],
-    maxSharpness:  [50, 60, 130, 50, 10, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "barrothloaderii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_gunlance__21c: Gunlance = {
-    category: "gunlance",
-    id: "21c",
-
-    name: "Rugged Loader",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -20,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__21b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__21a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 190, 50, 10, 0, 0],
-    maxSharpness:  [60, 40, 190, 50, 40, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "ruggedloader",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_gunlance__22a: Gunlance = {
-    category: "gunlance",
-    id: "22a",
-
-    name: "Tiger Blast I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__21b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__21a],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "tigerblasti",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_gunlance__22b: Gunlance = {
-    category: "gunlance",
-    id: "22b",
-
-    name: "Tiger Blast II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__22a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__21b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__21a],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 130, 100, 40, 0, 0],
-    maxSharpness:  [50, 30, 130, 100, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "tigerblastii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_gunlance__22c: Gunlance = {
-    category: "gunlance",
-    id: "22c",
-
-    name: "Tigrex Gunlance",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__22b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__22a],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__21b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__21a],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 40, 30, 0],
-    maxSharpness:  [50, 40, 120, 120, 40, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexgunlance",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_gunlance__23a: Gunlance = {
-    category: "gunlance",
-    id: "23a",
-
-    name: "Lagomberator I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 50, 20, 0, 0, 0],
-    maxSharpness:  [60, 70, 50, 70, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "lagomberatori",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_gunlance__23b: Gunlance = {
-    category: "gunlance",
-    id: "23b",
-
-    name: "Lagomberator II",
-    treeName: "Lagombi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__18a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 60, 50, 0, 0, 0],
-    maxSharpness:  [60, 80, 60, 100, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "lagomberatorii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_gunlance__23c: Gunlance = {
-    category: "gunlance",
-    id: "23c",
-
-    name: "Lagomberator III",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__23b],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 70, 80, 10, 0, 0],
-    maxSharpness:  [60, 80, 70, 80, 50, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "lagomberatoriii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_gunlance__23d: Gunlance = {
-    category: "gunlance",
-    id: "23d",
-
-    name: "Lagomberatrix",
-    treeName: "Lagombi Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__23c],
-            [__generated_ramp__ice_boost_2, __generated_gunlance__23c],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__23b],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 90, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 90, 60, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "lagomberatrix",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_gunlance__24a: Gunlance = {
-    category: "gunlance",
-    id: "24a",
-
-    name: "Ludroth Harpoon I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__23a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 100, 40, 0, 0, 0],
-    maxSharpness:  [50, 60, 100, 90, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "ludrothharpooni",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_gunlance__24b: Gunlance = {
-    category: "gunlance",
-    id: "24b",
-
-    name: "Ludroth Harpoon II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_gunlance__24a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__23a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 120, 40, 20, 0, 0],
-    maxSharpness:  [60, 60, 120, 40, 70, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "ludrothharpoonii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_gunlance__24c: Gunlance = {
-    category: "gunlance",
-    id: "24c",
-
-    name: "Ludroth Harpoon III",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__24b],
-            [__generated_ramp__water_boost_1, __generated_gunlance__24a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__23a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 50, 30, 0, 0],
-    maxSharpness:  [60, 60, 100, 50, 70, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "ludrothharpooniii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_gunlance__24d: Gunlance = {
-    category: "gunlance",
-    id: "24d",
-
-    name: "Ludroth Shellbreaker",
-    treeName: "Royal Ludroth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__water_boost_2, __generated_gunlance__24c],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__24b],
-            [__generated_ramp__water_boost_1, __generated_gunlance__24a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__ice_boost_1, __generated_gunlance__23a],
-            [__generated_ramp__small_monster_exploit, __generated_gunlance__23a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__18a],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__18a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 60, 40, 0, 0],
-    maxSharpness:  [60, 60, 130, 60, 60, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "ludrothshellbreaker",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_gunlance__25a: Gunlance = {
-    category: "gunlance",
-    id: "25a",
-
-    name: "Fiore Nulo I",
-    treeName: "Bnahabra Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 40, 10, 0, 0, 0],
-    maxSharpness:  [100, 50, 40, 60, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenuloi",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_gunlance__25b: Gunlance = {
-    category: "gunlance",
-    id: "25b",
-
-    name: "Fiore Nulo II",
-    treeName: "Bnahabra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 60, 10, 0, 0],
-    maxSharpness:  [140, 20, 20, 60, 60, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenuloii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_gunlance__25c: Gunlance = {
-    category: "gunlance",
-    id: "25c",
-
-    name: "Fiore Unu",
-    treeName: "Bnahabra Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 30, 50, 40, 0, 0],
-    maxSharpness:  [150, 30, 30, 50, 50, 40, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "fioreunu",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_gunlance__26a: Gunlance = {
-    category: "gunlance",
-    id: "26a",
-
-    name: "Rakna Gunlance I",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__wyvern_exploit, __generated_gunlance__25c],
-            [__generated_ramp__master_rider, __generated_gunlance__25c],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [190, 40, 40, 30, 50, 0, 0],
-    maxSharpness:  [190, 40, 40, 30, 50, 50, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "raknagunlancei",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_gunlance__26b: Gunlance = {
-    category: "gunlance",
-    id: "26b",
-
-    name: "Rakna Gunlance II",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__26a],
-            [__generated_ramp__wyvern_exploit, __generated_gunlance__25c],
-            [__generated_ramp__master_rider, __generated_gunlance__25c],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [190, 40, 40, 30, 40, 10, 0],
-    maxSharpness:  [190, 40, 40, 30, 40, 60, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "raknagunlanceii",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_gunlance__26c: Gunlance = {
-    category: "gunlance",
-    id: "26c",
-
-    name: "Araknalance",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__26b],
-            [__generated_ramp__fire_boost_1, __generated_gunlance__26a],
-            [__generated_ramp__wyvern_exploit, __generated_gunlance__25c],
-            [__generated_ramp__master_rider, __generated_gunlance__25c],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [190, 30, 40, 30, 40, 20, 0],
-    maxSharpness:  [190, 30, 40, 30, 40, 70, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "araknalance",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_gunlance__27a: Gunlance = {
-    category: "gunlance",
-    id: "27a",
-
-    name: "Fiore Nulo Black I",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__master_rider, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 30, 60, 30, 0, 0],
-    maxSharpness:  [150, 30, 30, 60, 70, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenuloblacki",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_gunlance__27b: Gunlance = {
-    category: "gunlance",
-    id: "27b",
-
-    name: "Fiore Nulo Black II",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__27a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__master_rider, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 80, 40, 0, 0],
-    maxSharpness:  [140, 20, 20, 80, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenuloblackii",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_gunlance__27c: Gunlance = {
-    category: "gunlance",
-    id: "27c",
-
-    name: "Fiore Unu Black",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__27b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__27a],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__25b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__25b],
-            [__generated_ramp__master_rider, __generated_gunlance__25b],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 20, 90, 60, 0, 0],
-    maxSharpness:  [160, 20, 20, 90, 70, 40, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "fioreunublack",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_gunlance__28a: Gunlance = {
-    category: "gunlance",
-    id: "28a",
-
-    name: "Fiore Nulo White I",
-    treeName: "Bnahabra (Ice)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__master_rider, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [100, 20, 30, 50, 0, 0, 0],
-    maxSharpness:  [100, 20, 30, 100, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenulowhitei",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_gunlance__28b: Gunlance = {
-    category: "gunlance",
-    id: "28b",
-
-    name: "Fiore Nulo White II",
-    treeName: "Bnahabra (Ice)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__28a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__master_rider, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 60, 10, 0, 0],
-    maxSharpness:  [140, 20, 20, 60, 60, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenulowhiteii",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_gunlance__28c: Gunlance = {
-    category: "gunlance",
-    id: "28c",
-
-    name: "Fiore Unu White",
-    treeName: "Bnahabra (Ice)",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__28b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__28a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__master_rider, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 80, 40, 0, 0],
-    maxSharpness:  [140, 20, 20, 80, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "fioreunuwhite",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_gunlance__29a: Gunlance = {
-    category: "gunlance",
-    id: "29a",
-
-    name: "Fiore Nulo Green I",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__master_rider, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 30, 40, 0, 0, 0],
-    maxSharpness:  [100, 30, 30, 90, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenulogreeni",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_gunlance__29b: Gunlance = {
-    category: "gunlance",
-    id: "29b",
-
-    name: "Fiore Nulo Green II",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__29a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__master_rider, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 70, 0, 0, 0],
-    maxSharpness:  [140, 20, 20, 70, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "fiorenulogreenii",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_gunlance__29c: Gunlance = {
-    category: "gunlance",
-    id: "29c",
-
-    name: "Fiore Unu Green",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__29b],
-            [__generated_ramp__paralysis_boost_1, __generated_gunlance__29b],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__29a],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__25a],
-            [__generated_ramp__master_rider, __generated_gunlance__25a],
-        ],
-    ],
-
-    baseSharpness: [160, 30, 30, 60, 20, 0, 0],
-    maxSharpness:  [160, 30, 30, 60, 60, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "fioreunugreen",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_gunlance__30a: Gunlance = {
-    category: "gunlance",
-    id: "30a",
-
-    name: "Sinister Gunlance I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "sinistergunlancei",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_gunlance__30b: Gunlance = {
-    category: "gunlance",
-    id: "30b",
-
-    name: "Sinister Gunlance II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__30a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "sinistergunlanceii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_gunlance__30c: Gunlance = {
-    category: "gunlance",
-    id: "30c",
-
-    name: "Sinister Shadowshot",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_gunlance__30b],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__30a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "sinistershadowshot",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_gunlance__31a: Gunlance = {
-    category: "gunlance",
-    id: "31a",
-
-    name: "Demon Gunlance I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 80, 40, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "demongunlancei",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_gunlance__31b: Gunlance = {
-    category: "gunlance",
-    id: "31b",
-
-    name: "Demon Gunlance II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__31a],
-        ],
-    ],
-
-    baseSharpness: [40, 20, 100, 90, 0, 0, 0],
-    maxSharpness:  [40, 20, 100, 90, 30, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "demongunlanceii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_gunlance__31c: Gunlance = {
-    category: "gunlance",
-    id: "31c",
-
-    name: "Great Demon Gunlance",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__31b],
-            [__generated_ramp__thunder_boost_1, __generated_gunlance__31a],
-        ],
-    ],
-
-    baseSharpness: [40, 20, 120, 120, 0, 0, 0],
-    maxSharpness:  [40, 20, 120, 120, 10, 40, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "greatdemongunlance",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_gunlance__32a: Gunlance = {
-    category: "gunlance",
-    id: "32a",
-
-    name: "Azure Elder Gunlance I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "azureeldergunlancei",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_gunlance__32b: Gunlance = {
-    category: "gunlance",
-    id: "32b",
-
-    name: "Azure Elder Gunlance II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__32a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "azureeldergunlanceii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_gunlance__32c: Gunlance = {
-    category: "gunlance",
-    id: "32c",
-
-    name: "Abyssal Gale Gunlance",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_gunlance__32b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__32a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgalegunlance",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_gunlance__33a: Gunlance = {
-    category: "gunlance",
-    id: "33a",
-
-    name: "Thunderbolt Gunlance I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltgunlancei",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_gunlance__33b: Gunlance = {
-    category: "gunlance",
-    id: "33b",
-
-    name: "Abyssal Storm Gunlance",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 41]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__33a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormgunlance",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_gunlance__34a: Gunlance = {
-    category: "gunlance",
-    id: "34a",
-
-    name: "Bazel Buster I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__wyrmstake_boost, null],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 60, 90, 0, 0, 0],
-    maxSharpness:  [60, 90, 60, 90, 50, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "bazelbusteri",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_gunlance__34b: Gunlance = {
-    category: "gunlance",
-    id: "34b",
-
-    name: "Bazel Buster II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__wyrmstake_boost, null],
-        ],
-    ],
-
-    baseSharpness: [60, 110, 90, 80, 10, 0, 0],
-    maxSharpness:  [60, 110, 90, 80, 30, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "bazelbusterii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_gunlance__34c: Gunlance = {
-    category: "gunlance",
-    id: "34c",
-
-    name: "Bazel Destroyer",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__34b],
-            [__generated_ramp__blast_boost_2, __generated_gunlance__34b],
-        ],
-    ],
-
-    baseSharpness: [60, 110, 80, 70, 30, 0, 0],
-    maxSharpness:  [60, 110, 80, 70, 30, 50, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "bazeldestroyer",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_gunlance__35a: Gunlance = {
-    category: "gunlance",
-    id: "35a",
-
-    name: "Gelosteel Gunlance I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 90, 40, 40, 0, 0],
-    maxSharpness:  [100, 80, 90, 40, 60, 30, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "icesteelgunlancei",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_gunlance__35b: Gunlance = {
-    category: "gunlance",
-    id: "35b",
-
-    name: "Daora's Brigia",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 44]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__35a],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__35a],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 90, 50, 40, 10, 0],
-    maxSharpness:  [80, 80, 90, 50, 40, 60, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sbrigia",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_gunlance__36a: Gunlance = {
-    category: "gunlance",
-    id: "36a",
-
-    name: "Venomous Cologne I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 130, 70, 40, 0, 0],
-    maxSharpness:  [50, 60, 130, 70, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "venomouscolognei",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_gunlance__36b: Gunlance = {
-    category: "gunlance",
-    id: "36b",
-
-    name: "Venomous Attar",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__36a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 110, 70, 50, 0, 0],
-    maxSharpness:  [60, 60, 110, 70, 60, 40, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "venomousattar",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_gunlance__37a: Gunlance = {
-    category: "gunlance",
-    id: "37a",
-
-    name: "Redwing Gunlance I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "redwinggunlancei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_gunlance__37b: Gunlance = {
-    category: "gunlance",
-    id: "37b",
-
-    name: "Reddnaught Gunlance",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "reddnaughtgunlance",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_gunlance__38a: Gunlance = {
-    category: "gunlance",
-    id: "38a",
-
-    name: "Canyne Cannon I",
-    treeName: "Canyne Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    baseSharpness: [70, 100, 60, 70, 0, 0, 0],
-    maxSharpness:  [70, 100, 60, 80, 40, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "canynecannoni",
-        treeNameLower: "canynetree",
-    },
-};
-
-const __generated_gunlance__38b: Gunlance = {
-    category: "gunlance",
-    id: "38b",
-
-    name: "Canyne Cannon II",
-    treeName: "Canyne Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__38a],
-        ],
-    ],
-
-    baseSharpness: [80, 120, 60, 80, 10, 0, 0],
-    maxSharpness:  [80, 120, 60, 80, 60, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "canynecannonii",
-        treeNameLower: "canynetree",
-    },
-};
-
-const __generated_gunlance__38c: Gunlance = {
-    category: "gunlance",
-    id: "38c",
-
-    name: "Howlitzer",
-    treeName: "Canyne Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__wyrmstake_boost, __generated_gunlance__38b],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__38a],
-        ],
-    ],
-
-    baseSharpness: [80, 120, 60, 70, 50, 20, 0],
-    maxSharpness:  [80, 120, 60, 70, 50, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "long",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "howlitzer",
-        treeNameLower: "canynetree",
-    },
-};
-
-const __generated_gunlance__39a: Gunlance = {
-    category: "gunlance",
-    id: "39a",
-
-    name: "Cornpopper I",
-    treeName: "Guild Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 140, 70, 0, 0, 0],
-    maxSharpness:  [50, 40, 140, 110, 10, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "cornpopperi",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_gunlance__39b: Gunlance = {
-    category: "gunlance",
-    id: "39b",
-
-    name: "Cornpopper II",
-    treeName: "Guild Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__wyrmstake_boost, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 160, 80, 0, 0, 0],
-    maxSharpness:  [50, 60, 160, 110, 20, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "cornpopperii",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_gunlance__39c: Gunlance = {
-    category: "gunlance",
-    id: "39c",
-
-    name: "Mighty Cornpopper",
-    treeName: "Guild Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__wyrmstake_boost, __generated_gunlance__39b],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 180, 90, 0, 0, 0],
-    maxSharpness:  [40, 40, 180, 110, 30, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "mightycornpopper",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_gunlance__40a: Gunlance = {
-    category: "gunlance",
-    id: "40a",
-
-    name: "Sleepy Shellgun I",
-    treeName: "Shell-Studded Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 140, 0, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "sleepyshellguni",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_gunlance__40b: Gunlance = {
-    category: "gunlance",
-    id: "40b",
-
-    name: "Sleepy Shellgun II",
-    treeName: "Shell-Studded Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__40a],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 80, 30, 0, 0, 0],
-    maxSharpness:  [50, 90, 80, 70, 10, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "sleepyshellgunii",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_gunlance__40c: Gunlance = {
-    category: "gunlance",
-    id: "40c",
-
-    name: "Soporific Shellgun",
-    treeName: "Shell-Studded Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__40b],
-            [__generated_ramp__sleep_boost_1, __generated_gunlance__40b],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__40a],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 100, 50, 0, 0, 0],
-    maxSharpness:  [60, 90, 100, 60, 40, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "wide",
-        shellingLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "soporificshellgun",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_gunlance__ra: Gunlance = {
-    category: "gunlance",
-    id: "ra",
-
-    name: "Rampage Gunlance I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagegunlancei",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_gunlance__rb: Gunlance = {
-    category: "gunlance",
-    id: "rb",
-
-    name: "Rampage Gunlance II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__shelling_normal_1, null],
-            [__generated_ramp__shelling_long_1, null],
-            [__generated_ramp__shelling_wide_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagegunlanceii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_gunlance__rc: Gunlance = {
-    category: "gunlance",
-    id: "rc",
-
-    name: "Rampage Gunlance III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_gunlance__rb],
-            [__generated_ramp__water_1, __generated_gunlance__rb],
-            [__generated_ramp__thunder_1, __generated_gunlance__rb],
-            [__generated_ramp__ice_1, __generated_gunlance__rb],
-            [__generated_ramp__dragon_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__shelling_normal_1, null],
-            [__generated_ramp__shelling_long_1, null],
-            [__generated_ramp__shelling_wide_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagegunlanceiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_gunlance__rd: Gunlance = {
-    category: "gunlance",
-    id: "rd",
-
-    name: "Rampage Gunlance IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_gunlance__rc],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_gunlance__rc],
-            [__generated_ramp__paralysis_1, __generated_gunlance__rc],
-            [__generated_ramp__sleep_1, __generated_gunlance__rc],
-            [__generated_ramp__blast_1, __generated_gunlance__rc],
-            [__generated_ramp__fire_1, __generated_gunlance__rb],
-            [__generated_ramp__water_1, __generated_gunlance__rb],
-            [__generated_ramp__thunder_1, __generated_gunlance__rb],
-            [__generated_ramp__ice_1, __generated_gunlance__rb],
-            [__generated_ramp__dragon_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__shelling_normal_2, null],
-            [__generated_ramp__shelling_long_2, null],
-            [__generated_ramp__shelling_wide_2, null],
-            [__generated_ramp__shelling_normal_1, __generated_gunlance__rc],
-            [__generated_ramp__shelling_long_1, __generated_gunlance__rc],
-            [__generated_ramp__shelling_wide_1, __generated_gunlance__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagegunlanceiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_gunlance__re: Gunlance = {
-    category: "gunlance",
-    id: "re",
-
-    name: "Rampage Gunlance V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__rd],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__rd],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__rd],
-            [__generated_ramp__elemental_boost_1, __generated_gunlance__rc],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__fire_2, __generated_gunlance__rd],
-            [__generated_ramp__water_2, __generated_gunlance__rd],
-            [__generated_ramp__thunder_2, __generated_gunlance__rd],
-            [__generated_ramp__ice_2, __generated_gunlance__rd],
-            [__generated_ramp__dragon_2, __generated_gunlance__rd],
-            [__generated_ramp__poison_1, __generated_gunlance__rc],
-            [__generated_ramp__paralysis_1, __generated_gunlance__rc],
-            [__generated_ramp__sleep_1, __generated_gunlance__rc],
-            [__generated_ramp__blast_1, __generated_gunlance__rc],
-            [__generated_ramp__fire_1, __generated_gunlance__rb],
-            [__generated_ramp__water_1, __generated_gunlance__rb],
-            [__generated_ramp__thunder_1, __generated_gunlance__rb],
-            [__generated_ramp__ice_1, __generated_gunlance__rb],
-            [__generated_ramp__dragon_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__shelling_normal_2, null],
-            [__generated_ramp__shelling_long_2, null],
-            [__generated_ramp__shelling_wide_2, null],
-            [__generated_ramp__shelling_normal_1, __generated_gunlance__rc],
-            [__generated_ramp__shelling_long_1, __generated_gunlance__rc],
-            [__generated_ramp__shelling_wide_1, __generated_gunlance__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagegunlancev",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_gunlance__rf: Gunlance = {
-    category: "gunlance",
-    id: "rf",
-
-    name: "Rampage Gunlance S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_3, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_gunlance__re],
-            [__generated_ramp__elemental_boost_2, __generated_gunlance__re],
-            [__generated_ramp__affinity_boost_3, __generated_gunlance__re],
-            [__generated_ramp__attack_boost_2, __generated_gunlance__rd],
-            [__generated_ramp__affinity_boost_2, __generated_gunlance__rd],
-            [__generated_ramp__defense_boost_2, __generated_gunlance__rd],
-            [__generated_ramp__elemental_boost_1, __generated_gunlance__rc],
-            [__generated_ramp__attack_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_gunlance__rb],
-            [__generated_ramp__defense_boost_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_4, null],
-            [__generated_ramp__water_4, null],
-            [__generated_ramp__thunder_4, null],
-            [__generated_ramp__ice_4, null],
-            [__generated_ramp__dragon_4, null],
-            [__generated_ramp__poison_3, null],
-            [__generated_ramp__paralysis_3, null],
-            [__generated_ramp__sleep_3, null],
-            [__generated_ramp__blast_3, null],
-            [__generated_ramp__fire_3, __generated_gunlance__re],
-            [__generated_ramp__water_3, __generated_gunlance__re],
-            [__generated_ramp__thunder_3, __generated_gunlance__re],
-            [__generated_ramp__ice_3, __generated_gunlance__re],
-            [__generated_ramp__dragon_3, __generated_gunlance__re],
-            [__generated_ramp__poison_2, __generated_gunlance__re],
-            [__generated_ramp__paralysis_2, __generated_gunlance__re],
-            [__generated_ramp__sleep_2, __generated_gunlance__re],
-            [__generated_ramp__blast_2, __generated_gunlance__re],
-            [__generated_ramp__fire_2, __generated_gunlance__rd],
-            [__generated_ramp__water_2, __generated_gunlance__rd],
-            [__generated_ramp__thunder_2, __generated_gunlance__rd],
-            [__generated_ramp__ice_2, __generated_gunlance__rd],
-            [__generated_ramp__dragon_2, __generated_gunlance__rd],
-            [__generated_ramp__poison_1, __generated_gunlance__rc],
-            [__generated_ramp__paralysis_1, __generated_gunlance__rc],
-            [__generated_ramp__sleep_1, __generated_gunlance__rc],
-            [__generated_ramp__blast_1, __generated_gunlance__rc],
-            [__generated_ramp__fire_1, __generated_gunlance__rb],
-            [__generated_ramp__water_1, __generated_gunlance__rb],
-            [__generated_ramp__thunder_1, __generated_gunlance__rb],
-            [__generated_ramp__ice_1, __generated_gunlance__rb],
-            [__generated_ramp__dragon_1, __generated_gunlance__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__shelling_normal_3, null],
-            [__generated_ramp__shelling_long_3, null],
-            [__generated_ramp__shelling_wide_3, null],
-            [__generated_ramp__shelling_normal_2, __generated_gunlance__re],
-            [__generated_ramp__shelling_long_2, __generated_gunlance__re],
-            [__generated_ramp__shelling_wide_2, __generated_gunlance__re],
-            [__generated_ramp__shelling_normal_1, __generated_gunlance__rc],
-            [__generated_ramp__shelling_long_1, __generated_gunlance__rc],
-            [__generated_ramp__shelling_wide_1, __generated_gunlance__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
-
-    gunlanceStats: {
-        shellingType: "normal",
-        shellingLevel: 2,
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagegunlances",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"gunlance","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Gunlance I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":1}},{"id":"1b","name":"Kamura Gunlance II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":1}},{"id":"1c","name":"Kamura Gunlance III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"1d","name":"Kamura Gunlance IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"1e","name":"Kamura Gunlance V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"1f","name":"Kamura Ninja Gunlance","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Mizutsune Tree",[{"id":"2a","name":"Ukiyo no Yamiwo I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[90,40,50,70,0,0,0],"maxSharpness":[90,40,50,90,30,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"2b","name":"Ukiyo no Yamiwo II","rarity":5,"endlineTag":"","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[90,80,70,80,30,0,0],"maxSharpness":[90,80,70,80,60,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}},{"id":"2c","name":"Mizumori","rarity":6,"endlineTag":"hr","attack":210,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",24]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","2b"],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[90,70,70,80,40,0,0],"maxSharpness":[90,70,70,80,40,50,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Rathian Tree",[{"id":"3a","name":"Princess Panoply I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",18]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,30,70,70,0,0,0],"maxSharpness":[80,30,70,120,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"3b","name":"Princess Panoply II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",21]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,30,60,130,0,0,0],"maxSharpness":[80,30,60,130,50,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}},{"id":"3c","name":"Ortlinde","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",26]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","3b"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,30,80,140,20,0,0],"maxSharpness":[80,30,80,140,40,30,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":5}}]],["Rathalos Tree",[{"id":"4a","name":"Red Rook I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",33]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_1","3b"],["poison_boost_1","3b"],["small_monster_exploit","3b"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,80,90,100,10,0,0],"maxSharpness":[70,80,90,100,50,10,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"4b","name":"Red Rook II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",35]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_1","3b"],["poison_boost_1","3b"],["small_monster_exploit","3b"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,80,70,110,20,0,0],"maxSharpness":[70,80,70,110,50,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}},{"id":"4c","name":"Crimson Rook","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",37]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","4b"],["attack_boost_1","3b"],["poison_boost_1","3b"],["small_monster_exploit","3b"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,80,50,120,30,0,0],"maxSharpness":[70,80,50,120,50,30,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Delex Tree",[{"id":"5a","name":"Delex Harpoon I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",12]],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["small_monster_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[50,80,50,20,0,0,0],"maxSharpness":[50,80,50,70,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":1}},{"id":"5b","name":"Delex Harpoon II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",14]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["small_monster_exploit",null],["affinity_boost_1","5a"],["attack_boost_1","1b"]]],"baseSharpness":[40,110,70,30,0,0,0],"maxSharpness":[40,110,70,80,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"5c","name":"Sand Blaster Gunlance","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["water",18]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["small_monster_exploit",null],["affinity_boost_2","5b"],["defense_boost_1","5b"],["affinity_boost_1","5a"],["attack_boost_1","1b"]]],"baseSharpness":[30,110,80,50,30,0,0],"maxSharpness":[30,110,80,50,70,10,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}}]],["Zinogre Tree",[{"id":"6a","name":"Usurper\'s Roar I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",28]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["affinity_boost_2","5b"],["defense_boost_1","5b"],["small_monster_exploit","5b"],["affinity_boost_1","5a"]]],"baseSharpness":[80,70,50,50,0,0,0],"maxSharpness":[80,70,50,100,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"6b","name":"Usurper\'s Roar II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",30]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","6a"],["affinity_boost_2","5b"],["defense_boost_1","5b"],["small_monster_exploit","5b"],["affinity_boost_1","5a"]]],"baseSharpness":[60,60,100,50,30,0,0],"maxSharpness":[60,60,100,50,70,10,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"6c","name":"Despot\'s Phlogiston","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",32]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","6b"],["attack_boost_1","6a"],["affinity_boost_2","5b"],["defense_boost_1","5b"],["small_monster_exploit","5b"],["affinity_boost_1","5a"]]],"baseSharpness":[60,90,120,50,30,0,0],"maxSharpness":[60,90,120,50,50,30,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Barioth Tree",[{"id":"7a","name":"Twinfang I","rarity":2,"endlineTag":"","attack":80,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",22]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["affinity_boost_1","5a"],["defense_boost_1","5a"],["small_monster_exploit","5a"],["attack_boost_1","1b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"7b","name":"Twinfang II","rarity":5,"endlineTag":"","attack":160,"affinity":35,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",24]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","7a"],["affinity_boost_1","5a"],["defense_boost_1","5a"],["small_monster_exploit","5a"],["attack_boost_1","1b"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,70,30,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"7c","name":"Ambermarch","rarity":6,"endlineTag":"hr","attack":190,"affinity":40,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",26]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_3",null],["iceblight_exploit",null],["affinity_boost_2","7b"],["attack_boost_2","7a"],["affinity_boost_1","5a"],["defense_boost_1","5a"],["small_monster_exploit","5a"],["attack_boost_1","1b"]]],"baseSharpness":[50,70,80,90,60,0,0],"maxSharpness":[50,70,80,90,60,50,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Ore Tree",[{"id":"8a","name":"Iron Gunlance I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":1}},{"id":"8b","name":"Iron Gunlance II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,70,50,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":1}},{"id":"8c","name":"Eizenlitter","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","8b"]]],"baseSharpness":[80,80,50,40,0,0,0],"maxSharpness":[80,80,50,90,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"8d","name":"Striker\'s Gunlance I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"8e","name":"Striker\'s Gunlance II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,80,60,50,20,0,0],"maxSharpness":[90,80,60,50,50,20,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"8f","name":"Imperial Guardlance","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,80,50,50,30,0,0],"maxSharpness":[90,80,50,50,50,30,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Ore Tree 2",[{"id":"9a","name":"General\'s Arbalance I","rarity":4,"endlineTag":"","attack":150,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["wyrmstake_boost",null],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[80,70,70,50,30,0,0],"maxSharpness":[80,70,70,50,80,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"9b","name":"General\'s Arbalance II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["wyrmstake_boost",null],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[60,70,70,60,40,0,0],"maxSharpness":[60,70,70,60,80,10,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"9c","name":"Admiral\'s Arbalance","rarity":6,"endlineTag":"hr","attack":210,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["wyvern_exploit",null],["wyrmstake_boost",null],["attack_boost_3","9b"],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,70,70,70,50,0,0],"maxSharpness":[90,70,70,70,70,30,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Pukei-Pukei Tree",[{"id":"10a","name":"Pukei Gunlance I","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",34]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_2",null],["wyvern_exploit","9a"],["wyrmstake_boost","9a"],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[60,70,90,70,10,0,0],"maxSharpness":[60,70,90,70,60,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"10b","name":"Pukei Gunlance II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["poison_boost_2",null],["defense_boost_1","10a"],["wyvern_exploit","9a"],["wyrmstake_boost","9a"],["attack_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[80,70,90,90,20,0,0],"maxSharpness":[80,70,90,90,60,10,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"10c","name":"Datura Gunlance","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",45]],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["poison_boost_3",null],["attack_boost_3","10b"],["defense_boost_2","10b"],["poison_boost_2","10b"],["defense_boost_1","10a"],["wyvern_exploit","9a"],["wyrmstake_boost","9a"],["attack_boost_2","8d"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[70,70,90,80,40,0,0],"maxSharpness":[70,70,90,80,70,20,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Diablos Tree",[{"id":"11a","name":"Diablos Gunlance I","rarity":3,"endlineTag":"","attack":160,"affinity":-10,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[60,60,60,70,0,0,0],"maxSharpness":[60,60,60,80,40,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"11b","name":"Diablos Gunlance II","rarity":6,"endlineTag":"","attack":240,"affinity":-10,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_1","11a"],["attack_boost_2","8d"],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[90,80,80,100,0,0,0],"maxSharpness":[90,80,80,100,50,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"11c","name":"Diablos Cannon","rarity":6,"endlineTag":"hr","attack":250,"affinity":-10,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["affinity_boost_2","11b"],["defense_boost_1","11b"],["affinity_boost_1","11a"],["attack_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[90,60,80,120,0,0,0],"maxSharpness":[90,60,80,120,30,20,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Aknosom Tree",[{"id":"12a","name":"Aknosom Gunlance I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",20]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[30,50,80,40,0,0,0],"maxSharpness":[30,50,80,90,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"12b","name":"Aknosom Gunlance II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",23]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[40,60,100,50,0,0,0],"maxSharpness":[40,60,100,100,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"12c","name":"Aknosom Gunlance III","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",27]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["attack_boost_1","12b"],["fire_boost_1","12b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[50,60,110,60,20,0,0],"maxSharpness":[50,60,110,60,50,20,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"12d","name":"Dawnbreaker Gunlance","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",29]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["attack_boost_1","12b"],["fire_boost_1","12b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[50,60,100,60,30,0,0],"maxSharpness":[50,60,100,60,50,30,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Almudron Tree",[{"id":"13a","name":"Almudron Gunlance I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",40]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["attack_boost_1","12b"],["fire_boost_1","12b"],["fireblight_exploit","12b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[50,50,100,50,0,0,0],"maxSharpness":[50,50,100,80,20,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"13b","name":"Almudron Gunlance II","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",45]],"rampSkills":[[["attack_boost_3",null],["water_boost_1",null],["element_exploit",null],["attack_boost_2","13a"],["attack_boost_1","12b"],["fire_boost_1","12b"],["fireblight_exploit","12b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[60,60,80,60,40,0,0],"maxSharpness":[60,60,80,60,90,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"13c","name":"Doombringer Gunlance","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",46]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["element_exploit",null],["water_boost_1","13b"],["attack_boost_2","13a"],["attack_boost_1","12b"],["fire_boost_1","12b"],["fireblight_exploit","12b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[60,60,80,100,50,0,0],"maxSharpness":[60,60,80,100,100,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":5}}]],["Khezu Tree",[{"id":"14a","name":"Full Voltage I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",13]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[40,90,40,30,0,0,0],"maxSharpness":[40,90,40,80,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":1}},{"id":"14b","name":"Full Voltage II","rarity":3,"endlineTag":"","attack":150,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",15]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","14a"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[40,100,70,40,0,0,0],"maxSharpness":[40,100,70,40,50,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"14c","name":"High Volt Gunlance","rarity":4,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",17]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_3","14b"],["thunder_boost_1","14b"],["attack_boost_2","14a"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[40,100,80,50,30,0,0],"maxSharpness":[40,100,80,50,30,50,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}}]],["Volvidon Tree",[{"id":"15a","name":"Shattershot I","rarity":2,"endlineTag":"","attack":100,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["paralysis",24]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","14a"],["thunder_boost_1","14a"],["thunderblight_exploit","14a"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[130,40,50,30,0,0,0],"maxSharpness":[130,40,50,80,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"15b","name":"Shattershot II","rarity":5,"endlineTag":"","attack":160,"affinity":-10,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",26]],"rampSkills":[[["attack_boost_4",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_3","15a"],["defense_boost_1","15a"],["attack_boost_2","14a"],["thunder_boost_1","14a"],["thunderblight_exploit","14a"],["attack_boost_1","8b"],["affinity_boost_1","8b"]]],"baseSharpness":[140,40,50,70,0,0,0],"maxSharpness":[140,40,50,70,50,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"15c","name":"Shatter God","rarity":6,"endlineTag":"hr","attack":180,"affinity":-10,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",28]],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["dulling_strike",null],["defense_boost_2","15b"],["attack_boost_3","15a"],["defense_boost_1","15a"],["attack_boost_2","14a"],["thunder_boost_1","14a"],["thunderblight_exploit","14a"],["attack_boost_1","8b"],["affinity_boost_1","8b"]]],"baseSharpness":[160,50,50,70,20,0,0],"maxSharpness":[160,50,50,70,60,10,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Baggi Tree",[{"id":"16a","name":"Baggi Gunlance I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",20]],"rampSkills":[[["affinity_boost_1",null],["sleep_boost_1",null],["buddy_rally",null],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[100,30,50,20,0,0,0],"maxSharpness":[100,30,50,70,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":1}},{"id":"16b","name":"Baggi Gunlance II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",22]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_1",null],["buddy_rally",null],["affinity_boost_1","16a"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[100,60,50,40,0,0,0],"maxSharpness":[100,60,50,90,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"16c","name":"Baggi Gunlance III","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",25]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_2",null],["buddy_rally",null],["sleep_boost_1","16b"],["affinity_boost_1","16a"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[100,70,60,70,0,0,0],"maxSharpness":[100,70,60,70,50,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"16d","name":"Lullabyte Sleeplance","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",27]],"rampSkills":[[["affinity_boost_3",null],["sleep_boost_2",null],["buddy_rally",null],["affinity_boost_2","16c"],["sleep_boost_1","16b"],["affinity_boost_1","16a"],["attack_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[90,90,80,60,30,0,0],"maxSharpness":[90,90,80,60,60,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Tobi-Kadachi Tree",[{"id":"17a","name":"Kadachi Striker I","rarity":2,"endlineTag":"","attack":100,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["thunder",19]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunder_boost_2",null],["sleep_boost_1","16a"],["buddy_rally","16a"],["defense_boost_2","8a"]]],"baseSharpness":[120,50,40,40,0,0,0],"maxSharpness":[120,50,40,80,10,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"17b","name":"Kadachi Striker II","rarity":5,"endlineTag":"","attack":180,"affinity":15,"defense":0,"decoSlots":[2],"eleStat":[["thunder",24]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunder_boost_3",null],["attack_boost_1","17a"],["affinity_boost_1","17a"],["thunder_boost_2","17a"],["sleep_boost_1","16a"],["buddy_rally","16a"],["defense_boost_2","8a"]]],"baseSharpness":[120,80,50,80,20,0,0],"maxSharpness":[120,80,50,80,60,10,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"17c","name":"Mythic Kadachi Striker","rarity":6,"endlineTag":"hr","attack":200,"affinity":20,"defense":0,"decoSlots":[2],"eleStat":[["thunder",27]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["thunder_boost_3",null],["attack_boost_2","17b"],["attack_boost_1","17a"],["affinity_boost_1","17a"],["thunder_boost_2","17a"],["sleep_boost_1","16a"],["buddy_rally","16a"],["defense_boost_2","8a"]]],"baseSharpness":[110,80,30,100,30,0,0],"maxSharpness":[110,80,30,100,50,30,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Bone Tree",[{"id":"18a","name":"Bone Gunlance I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":1}},{"id":"18b","name":"Bone Gunlance II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":1}},{"id":"18c","name":"Wyvern Bone Gunlance","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","18b"]]],"baseSharpness":[90,50,60,0,0,0,0],"maxSharpness":[90,50,110,0,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"18d","name":"Golem Gunlance I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[100,80,60,10,0,0,0],"maxSharpness":[100,80,60,60,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"18e","name":"Golem Gunlance II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"18f","name":"Behemoth Gunlance","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,100,20,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Nargacuga Tree",[{"id":"19a","name":"Hidden Gunlance I","rarity":5,"endlineTag":"","attack":160,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["affinity_boost_2","18e"],["dulling_strike","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"]]],"baseSharpness":[50,70,100,80,50,0,0],"maxSharpness":[50,70,100,80,90,10,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"19b","name":"Hidden Gunlance II","rarity":6,"endlineTag":"","attack":170,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["affinity_boost_2","18e"],["dulling_strike","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"]]],"baseSharpness":[50,70,90,80,60,0,0],"maxSharpness":[50,70,90,80,90,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}},{"id":"19c","name":"Fading Night","rarity":6,"endlineTag":"hr","attack":180,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","19b"],["dulling_strike","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"]]],"baseSharpness":[50,70,100,90,70,20,0],"maxSharpness":[50,70,100,90,70,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Anjanath Tree",[{"id":"20a","name":"Flaming Gunlance I","rarity":3,"endlineTag":"","attack":140,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["fire",15]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[100,90,30,30,0,0,0],"maxSharpness":[100,90,30,80,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"20b","name":"Flaming Gunlance II","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["fire",17]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[100,70,30,50,0,0,0],"maxSharpness":[100,70,30,100,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"20c","name":"Flaming Gunlance III","rarity":5,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",21]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","20b"],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[150,60,20,70,0,0,0],"maxSharpness":[150,60,20,90,30,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"20d","name":"Barbarous Fogolance","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",24]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","20c"],["fire_boost_2","20c"],["fire_boost_1","20b"],["attack_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[180,60,20,90,0,0,0],"maxSharpness":[180,60,20,90,50,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Barroth Tree",[{"id":"21a","name":"Barroth Loader I","rarity":2,"endlineTag":"","attack":130,"affinity":-20,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_2","18b"]]],"baseSharpness":[50,60,140,0,0,0,0],"maxSharpness":[50,60,140,50,0,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"21b","name":"Barroth Loader II","rarity":2,"endlineTag":"","attack":140,"affinity":-20,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","21a"],["attack_boost_2","18b"]]],"baseSharpness":[50,60,130,10,0,0,0],"maxSharpness":[50,60,130,50,10,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"21c","name":"Rugged Loader","rarity":5,"endlineTag":"hr","attack":200,"affinity":-20,"defense":20,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","21b"],["defense_boost_1","21a"],["attack_boost_2","18b"]]],"baseSharpness":[60,40,190,50,10,0,0],"maxSharpness":[60,40,190,50,40,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Tigrex Tree",[{"id":"22a","name":"Tiger Blast I","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","21b"],["defense_boost_1","21a"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"22b","name":"Tiger Blast II","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","22a"],["defense_boost_2","21b"],["defense_boost_1","21a"]]],"baseSharpness":[50,30,130,100,40,0,0],"maxSharpness":[50,30,130,100,70,20,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"22c","name":"Tigrex Gunlance","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","22b"],["affinity_boost_1","22a"],["defense_boost_2","21b"],["defense_boost_1","21a"]]],"baseSharpness":[50,40,120,120,40,30,0],"maxSharpness":[50,40,120,120,40,30,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Lagombi Tree",[{"id":"23a","name":"Lagomberator I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",23]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["small_monster_exploit",null],["attack_boost_2","18a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,70,50,20,0,0,0],"maxSharpness":[60,70,50,70,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":1}},{"id":"23b","name":"Lagomberator II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",25]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["small_monster_exploit",null],["ice_boost_1","23a"],["attack_boost_2","18a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,80,60,50,0,0,0],"maxSharpness":[60,80,60,100,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"23c","name":"Lagomberator III","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["ice",27]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["small_monster_exploit",null],["attack_boost_1","23b"],["ice_boost_1","23a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,80,70,80,10,0,0],"maxSharpness":[60,80,70,80,50,10,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"23d","name":"Lagomberatrix","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["ice",29]],"rampSkills":[[["attack_boost_3",null],["ice_boost_3",null],["small_monster_exploit",null],["attack_boost_2","23c"],["ice_boost_2","23c"],["attack_boost_1","23b"],["ice_boost_1","23a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,80,90,90,30,0,0],"maxSharpness":[60,80,90,90,60,20,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Royal Ludroth Tree",[{"id":"24a","name":"Ludroth Harpoon I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",24]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["attack_boost_1","23a"],["ice_boost_1","23a"],["small_monster_exploit","23a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[50,60,100,40,0,0,0],"maxSharpness":[50,60,100,90,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"24b","name":"Ludroth Harpoon II","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[["water",33]],"rampSkills":[[["attack_boost_2",null],["water_boost_2",null],["waterblight_exploit",null],["water_boost_1","24a"],["attack_boost_1","23a"],["ice_boost_1","23a"],["small_monster_exploit","23a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,60,120,40,20,0,0],"maxSharpness":[60,60,120,40,70,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"24c","name":"Ludroth Harpoon III","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":15,"decoSlots":[2,1,1],"eleStat":[["water",35]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","24b"],["water_boost_1","24a"],["attack_boost_1","23a"],["ice_boost_1","23a"],["small_monster_exploit","23a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,60,100,50,30,0,0],"maxSharpness":[60,60,100,50,70,10,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"24d","name":"Ludroth Shellbreaker","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":15,"decoSlots":[2,1,1],"eleStat":[["water",37]],"rampSkills":[[["attack_boost_3",null],["water_boost_3",null],["waterblight_exploit",null],["water_boost_2","24c"],["attack_boost_2","24b"],["water_boost_1","24a"],["attack_boost_1","23a"],["ice_boost_1","23a"],["small_monster_exploit","23a"],["affinity_boost_1","18a"],["defense_boost_1","18a"]]],"baseSharpness":[60,60,130,60,40,0,0],"maxSharpness":[60,60,130,60,60,30,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Bnahabra Tree",[{"id":"25a","name":"Fiore Nulo I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["master_rider",null]]],"baseSharpness":[100,50,40,10,0,0,0],"maxSharpness":[100,50,40,60,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":1}},{"id":"25b","name":"Fiore Nulo II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["master_rider",null],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[140,20,20,60,10,0,0],"maxSharpness":[140,20,20,60,60,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"25c","name":"Fiore Unu","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["master_rider",null],["attack_boost_2","25b"],["defense_boost_1","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[150,30,30,50,40,0,0],"maxSharpness":[150,30,30,50,50,40,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}}]],["Rakna-Kadaki Tree",[{"id":"26a","name":"Rakna Gunlance I","rarity":6,"endlineTag":"","attack":150,"affinity":25,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["silkbind_boost",null],["wyvern_exploit","25c"],["master_rider","25c"],["attack_boost_2","25b"],["defense_boost_1","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[190,40,40,30,50,0,0],"maxSharpness":[190,40,40,30,50,50,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"26b","name":"Rakna Gunlance II","rarity":6,"endlineTag":"","attack":160,"affinity":25,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_3",null],["fire_boost_2",null],["silkbind_boost",null],["fire_boost_1","26a"],["wyvern_exploit","25c"],["master_rider","25c"],["attack_boost_2","25b"],["defense_boost_1","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[190,40,40,30,40,10,0],"maxSharpness":[190,40,40,30,40,60,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}},{"id":"26c","name":"Araknalance","rarity":7,"endlineTag":"hr","attack":170,"affinity":25,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",27]],"rampSkills":[[["attack_boost_4",null],["fire_boost_2",null],["silkbind_boost",null],["attack_boost_3","26b"],["fire_boost_1","26a"],["wyvern_exploit","25c"],["master_rider","25c"],["attack_boost_2","25b"],["defense_boost_1","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[190,30,40,30,40,20,0],"maxSharpness":[190,30,40,30,40,70,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":5}}]],["Bnahabra (Drag\\u00e3o)",[{"id":"27a","name":"Fiore Nulo Black I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",21]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["element_exploit",null],["attack_boost_2","25b"],["defense_boost_1","25b"],["master_rider","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[150,30,30,60,30,0,0],"maxSharpness":[150,30,30,60,70,10,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"27b","name":"Fiore Nulo Black II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",23]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_3",null],["element_exploit",null],["defense_boost_2","27a"],["attack_boost_2","25b"],["defense_boost_1","25b"],["master_rider","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[140,20,20,80,40,0,0],"maxSharpness":[140,20,20,80,70,20,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"27c","name":"Fiore Unu Black","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",26]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_3",null],["element_exploit",null],["affinity_boost_2","27b"],["defense_boost_2","27a"],["attack_boost_2","25b"],["defense_boost_1","25b"],["master_rider","25b"],["attack_boost_1","25a"],["affinity_boost_1","25a"]]],"baseSharpness":[160,20,20,90,60,0,0],"maxSharpness":[160,20,20,90,70,40,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Bnahabra (Ice)",[{"id":"28a","name":"Fiore Nulo White I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["defense_boost_1",null],["element_exploit",null],["silkbind_boost",null],["attack_boost_1","25a"],["affinity_boost_1","25a"],["master_rider","25a"]]],"baseSharpness":[100,20,30,50,0,0,0],"maxSharpness":[100,20,30,100,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"28b","name":"Fiore Nulo White II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",17]],"rampSkills":[[["defense_boost_2",null],["element_exploit",null],["silkbind_boost",null],["defense_boost_1","28a"],["attack_boost_1","25a"],["affinity_boost_1","25a"],["master_rider","25a"]]],"baseSharpness":[140,20,20,60,10,0,0],"maxSharpness":[140,20,20,60,60,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}},{"id":"28c","name":"Fiore Unu White","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",20]],"rampSkills":[[["defense_boost_3",null],["element_exploit",null],["silkbind_boost",null],["defense_boost_2","28b"],["defense_boost_1","28a"],["attack_boost_1","25a"],["affinity_boost_1","25a"],["master_rider","25a"]]],"baseSharpness":[140,20,20,80,40,0,0],"maxSharpness":[140,20,20,80,70,20,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Bnahabra (Paralysis)",[{"id":"29a","name":"Fiore Nulo Green I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",12]],"rampSkills":[[["affinity_boost_1",null],["paralysis_boost_1",null],["anti_aerial_species",null],["attack_boost_1","25a"],["master_rider","25a"]]],"baseSharpness":[100,30,30,40,0,0,0],"maxSharpness":[100,30,30,90,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":1}},{"id":"29b","name":"Fiore Nulo Green II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",18]],"rampSkills":[[["affinity_boost_2",null],["paralysis_boost_1",null],["anti_aerial_species",null],["affinity_boost_1","29a"],["attack_boost_1","25a"],["master_rider","25a"]]],"baseSharpness":[140,20,20,70,0,0,0],"maxSharpness":[140,20,20,70,50,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"29c","name":"Fiore Unu Green","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",19]],"rampSkills":[[["affinity_boost_3",null],["paralysis_boost_2",null],["anti_aerial_species",null],["affinity_boost_2","29b"],["paralysis_boost_1","29b"],["affinity_boost_1","29a"],["attack_boost_1","25a"],["master_rider","25a"]]],"baseSharpness":[160,30,30,60,20,0,0],"maxSharpness":[160,30,30,60,60,10,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":3}}]],["Magnamalo Tree",[{"id":"30a","name":"Sinister Gunlance I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",25]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"30b","name":"Sinister Gunlance II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",29]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","30a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"30c","name":"Sinister Shadowshot","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",33]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","30b"],["attack_boost_2","30a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Rajang Tree",[{"id":"31a","name":"Demon Gunlance I","rarity":5,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,80,40,10,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"31b","name":"Demon Gunlance II","rarity":6,"endlineTag":"","attack":210,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",18]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","31a"]]],"baseSharpness":[40,20,100,90,0,0,0],"maxSharpness":[40,20,100,90,30,20,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"31c","name":"Great Demon Gunlance","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",20]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","31b"],["thunder_boost_1","31a"]]],"baseSharpness":[40,20,120,120,0,0,0],"maxSharpness":[40,20,120,120,10,40,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Ibushi Tree",[{"id":"32a","name":"Azure Elder Gunlance I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",11]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"32b","name":"Azure Elder Gunlance II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",13]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","32a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"32c","name":"Abyssal Gale Gunlance","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",15]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","32b"],["defense_boost_1","32a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Narwa Tree",[{"id":"33a","name":"Thunderbolt Gunlance I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",35]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}},{"id":"33b","name":"Abyssal Storm Gunlance","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",41]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","33a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":4}}]],["Bazelgeuse Tree",[{"id":"34a","name":"Bazel Buster I","rarity":6,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["blast",12]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["wyrmstake_boost",null]]],"baseSharpness":[60,90,60,90,0,0,0],"maxSharpness":[60,90,60,90,50,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"34b","name":"Bazel Buster II","rarity":6,"endlineTag":"","attack":210,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["blast",14]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["wyrmstake_boost",null]]],"baseSharpness":[60,110,90,80,10,0,0],"maxSharpness":[60,110,90,80,30,30,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}},{"id":"34c","name":"Bazel Destroyer","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["blast",16]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["wyrmstake_boost",null],["defense_boost_1","34b"],["blast_boost_2","34b"]]],"baseSharpness":[60,110,80,70,30,0,0],"maxSharpness":[60,110,80,70,30,50,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}}]],["Kushala Daora Tree",[{"id":"35a","name":"Gelosteel Gunlance I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",42]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[100,80,90,40,40,0,0],"maxSharpness":[100,80,90,40,60,30,0],"gunlanceStats":{"shellingType":"long","shellingLevel":5}},{"id":"35b","name":"Daora\'s Brigia","rarity":7,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",44]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","35a"],["affinity_boost_2","35a"]]],"baseSharpness":[80,80,90,50,40,10,0],"maxSharpness":[80,80,90,50,40,60,0],"gunlanceStats":{"shellingType":"long","shellingLevel":5}}]],["Chameleos Tree",[{"id":"36a","name":"Venomous Cologne I","rarity":6,"endlineTag":"","attack":220,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["poison",27]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[50,60,130,70,40,0,0],"maxSharpness":[50,60,130,70,70,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"36b","name":"Venomous Attar","rarity":7,"endlineTag":"hr","attack":230,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["poison",31]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","36a"]]],"baseSharpness":[60,60,110,70,50,0,0],"maxSharpness":[60,60,110,70,60,40,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}}]],["Valstrax Tree",[{"id":"37a","name":"Redwing Gunlance I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",35]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}},{"id":"37b","name":"Reddnaught Gunlance","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",38]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0],"gunlanceStats":{"shellingType":"long","shellingLevel":4}}]],["Canyne Tree",[{"id":"38a","name":"Canyne Cannon I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["wyrmstake_boost",null],["buddy_rally",null]]],"baseSharpness":[70,100,60,70,0,0,0],"maxSharpness":[70,100,60,80,40,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":2}},{"id":"38b","name":"Canyne Cannon II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["wyrmstake_boost",null],["buddy_rally",null],["defense_boost_2","38a"]]],"baseSharpness":[80,120,60,80,10,0,0],"maxSharpness":[80,120,60,80,60,0,0],"gunlanceStats":{"shellingType":"long","shellingLevel":3}},{"id":"38c","name":"Howlitzer","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":10,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_3",null],["buddy_rally",null],["wyrmstake_boost","38b"],["defense_boost_2","38a"]]],"baseSharpness":[80,120,60,70,50,20,0],"maxSharpness":[80,120,60,70,50,20,0],"gunlanceStats":{"shellingType":"long","shellingLevel":5}}]],["Guild Tree",[{"id":"39a","name":"Cornpopper I","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["wyrmstake_boost",null],["anti_aquatic_species",null],["spiribird_doubled",null]]],"baseSharpness":[50,40,140,70,0,0,0],"maxSharpness":[50,40,140,110,10,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"39b","name":"Cornpopper II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["wyrmstake_boost",null],["anti_aquatic_species",null],["spiribird_doubled",null]]],"baseSharpness":[50,60,160,80,0,0,0],"maxSharpness":[50,60,160,110,20,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":4}},{"id":"39c","name":"Mighty Cornpopper","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["anti_aquatic_species",null],["spiribird_doubled",null],["wyrmstake_boost","39b"]]],"baseSharpness":[40,40,180,90,0,0,0],"maxSharpness":[40,40,180,110,30,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":5}}]],["Shell-Studded Tree",[{"id":"40a","name":"Sleepy Shellgun I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["sleep",13]],"rampSkills":[[["defense_boost_1",null],["sleep_boost_1",null],["anti_aquatic_species",null]]],"baseSharpness":[50,60,90,0,0,0,0],"maxSharpness":[50,60,140,0,0,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"40b","name":"Sleepy Shellgun II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["sleep",17]],"rampSkills":[[["defense_boost_2",null],["sleep_boost_1",null],["anti_aquatic_species",null],["defense_boost_1","40a"]]],"baseSharpness":[50,90,80,30,0,0,0],"maxSharpness":[50,90,80,70,10,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":2}},{"id":"40c","name":"Soporific Shellgun","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[["sleep",20]],"rampSkills":[[["defense_boost_3",null],["sleep_boost_2",null],["anti_aquatic_species",null],["defense_boost_2","40b"],["sleep_boost_1","40b"],["defense_boost_1","40a"]]],"baseSharpness":[60,90,100,50,0,0,0],"maxSharpness":[60,90,100,60,40,0,0],"gunlanceStats":{"shellingType":"wide","shellingLevel":3}}]],["Rampage Tree",[{"id":"ra","name":"Rampage Gunlance I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"rb","name":"Rampage Gunlance II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null],["shelling_normal_1",null],["shelling_long_1",null],["shelling_wide_1",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"rc","name":"Rampage Gunlance III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null],["shelling_normal_1",null],["shelling_long_1",null],["shelling_wide_1",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"rd","name":"Rampage Gunlance IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null],["shelling_normal_2",null],["shelling_long_2",null],["shelling_wide_2",null],["shelling_normal_1","rc"],["shelling_long_1","rc"],["shelling_wide_1","rc"]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"re","name":"Rampage Gunlance V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["shelling_normal_2",null],["shelling_long_2",null],["shelling_wide_2",null],["shelling_normal_1","rc"],["shelling_long_1","rc"],["shelling_wide_1","rc"]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}},{"id":"rf","name":"Rampage Gunlance S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_3",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["elemental_boost_2","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_4",null],["water_4",null],["thunder_4",null],["ice_4",null],["dragon_4",null],["poison_3",null],["paralysis_3",null],["sleep_3",null],["blast_3",null],["fire_3","re"],["water_3","re"],["thunder_3","re"],["ice_3","re"],["dragon_3","re"],["poison_2","re"],["paralysis_2","re"],["sleep_2","re"],["blast_2","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["shelling_normal_3",null],["shelling_long_3",null],["shelling_wide_3",null],["shelling_normal_2","re"],["shelling_long_2","re"],["shelling_wide_2","re"],["shelling_normal_1","rc"],["shelling_long_1","rc"],["shelling_wide_1","rc"]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0],"gunlanceStats":{"shellingType":"normal","shellingLevel":2}}]]]}';
 
-export const gunlancesArray: Readonly<Gunlance[]> = [
-    __generated_gunlance__1a,
-    __generated_gunlance__1b,
-    __generated_gunlance__1c,
-    __generated_gunlance__1d,
-    __generated_gunlance__1e,
-    __generated_gunlance__1f,
-    __generated_gunlance__2a,
-    __generated_gunlance__2b,
-    __generated_gunlance__2c,
-    __generated_gunlance__3a,
-    __generated_gunlance__3b,
-    __generated_gunlance__3c,
-    __generated_gunlance__4a,
-    __generated_gunlance__4b,
-    __generated_gunlance__4c,
-    __generated_gunlance__5a,
-    __generated_gunlance__5b,
-    __generated_gunlance__5c,
-    __generated_gunlance__6a,
-    __generated_gunlance__6b,
-    __generated_gunlance__6c,
-    __generated_gunlance__7a,
-    __generated_gunlance__7b,
-    __generated_gunlance__7c,
-    __generated_gunlance__8a,
-    __generated_gunlance__8b,
-    __generated_gunlance__8c,
-    __generated_gunlance__8d,
-    __generated_gunlance__8e,
-    __generated_gunlance__8f,
-    __generated_gunlance__9a,
-    __generated_gunlance__9b,
-    __generated_gunlance__9c,
-    __generated_gunlance__10a,
-    __generated_gunlance__10b,
-    __generated_gunlance__10c,
-    __generated_gunlance__11a,
-    __generated_gunlance__11b,
-    __generated_gunlance__11c,
-    __generated_gunlance__12a,
-    __generated_gunlance__12b,
-    __generated_gunlance__12c,
-    __generated_gunlance__12d,
-    __generated_gunlance__13a,
-    __generated_gunlance__13b,
-    __generated_gunlance__13c,
-    __generated_gunlance__14a,
-    __generated_gunlance__14b,
-    __generated_gunlance__14c,
-    __generated_gunlance__15a,
-    __generated_gunlance__15b,
-    __generated_gunlance__15c,
-    __generated_gunlance__16a,
-    __generated_gunlance__16b,
-    __generated_gunlance__16c,
-    __generated_gunlance__16d,
-    __generated_gunlance__17a,
-    __generated_gunlance__17b,
-    __generated_gunlance__17c,
-    __generated_gunlance__18a,
-    __generated_gunlance__18b,
-    __generated_gunlance__18c,
-    __generated_gunlance__18d,
-    __generated_gunlance__18e,
-    __generated_gunlance__18f,
-    __generated_gunlance__19a,
-    __generated_gunlance__19b,
-    __generated_gunlance__19c,
-    __generated_gunlance__20a,
-    __generated_gunlance__20b,
-    __generated_gunlance__20c,
-    __generated_gunlance__20d,
-    __generated_gunlance__21a,
-    __generated_gunlance__21b,
-    __generated_gunlance__21c,
-    __generated_gunlance__22a,
-    __generated_gunlance__22b,
-    __generated_gunlance__22c,
-    __generated_gunlance__23a,
-    __generated_gunlance__23b,
-    __generated_gunlance__23c,
-    __generated_gunlance__23d,
-    __generated_gunlance__24a,
-    __generated_gunlance__24b,
-    __generated_gunlance__24c,
-    __generated_gunlance__24d,
-    __generated_gunlance__25a,
-    __generated_gunlance__25b,
-    __generated_gunlance__25c,
-    __generated_gunlance__26a,
-    __generated_gunlance__26b,
-    __generated_gunlance__26c,
-    __generated_gunlance__27a,
-    __generated_gunlance__27b,
-    __generated_gunlance__27c,
-    __generated_gunlance__28a,
-    __generated_gunlance__28b,
-    __generated_gunlance__28c,
-    __generated_gunlance__29a,
-    __generated_gunlance__29b,
-    __generated_gunlance__29c,
-    __generated_gunlance__30a,
-    __generated_gunlance__30b,
-    __generated_gunlance__30c,
-    __generated_gunlance__31a,
-    __generated_gunlance__31b,
-    __generated_gunlance__31c,
-    __generated_gunlance__32a,
-    __generated_gunlance__32b,
-    __generated_gunlance__32c,
-    __generated_gunlance__33a,
-    __generated_gunlance__33b,
-    __generated_gunlance__34a,
-    __generated_gunlance__34b,
-    __generated_gunlance__34c,
-    __generated_gunlance__35a,
-    __generated_gunlance__35b,
-    __generated_gunlance__36a,
-    __generated_gunlance__36b,
-    __generated_gunlance__37a,
-    __generated_gunlance__37b,
-    __generated_gunlance__38a,
-    __generated_gunlance__38b,
-    __generated_gunlance__38c,
-    __generated_gunlance__39a,
-    __generated_gunlance__39b,
-    __generated_gunlance__39c,
-    __generated_gunlance__40a,
-    __generated_gunlance__40b,
-    __generated_gunlance__40c,
-    __generated_gunlance__ra,
-    __generated_gunlance__rb,
-    __generated_gunlance__rc,
-    __generated_gunlance__rd,
-    __generated_gunlance__re,
-    __generated_gunlance__rf,
-];
+export const gunlancesArray: Readonly<Gunlance[]> = loadWeaponPayload<Gunlance>(payload);
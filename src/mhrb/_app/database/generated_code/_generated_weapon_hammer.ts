@@ -36,5362 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type Hammer,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_3,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_4,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_boost_3,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_4,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_4,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_3,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__paralysis_boost_2,
-    __generated_ramp__paralysis_boost_3,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_3,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_3,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_4,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_4,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_hammer__1a: Hammer = {
-    category: "hammer",
-    id: "1a",
-
-    name: "Kamura Hammer I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurahammeri",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_hammer__1b: Hammer = {
-    category: "hammer",
-    id: "1b",
-
-    name: "Kamura Hammer II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurahammerii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_hammer__1c: Hammer = {
-    category: "hammer",
-    id: "1c",
-
-    name: "Kamura Hammer III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurahammeriii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_hammer__1d: Hammer = {
-    category: "hammer",
-    id: "1d",
-
-    name: "Kamura Hammer IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 20, 10, 0, 0],
-    maxSharpness:  [60, 80, 80, 20, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurahammeriv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_hammer__1e: Hammer = {
-    category: "hammer",
-    id: "1e",
-
-    name: "Kamura Hammer V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__1d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1d],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "kamurahammerv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_hammer__1f: Hammer = {
-    category: "hammer",
-    id: "1f",
-
-    name: "Kamura Ninja Hammer",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_hammer__1e],
-            [__generated_ramp__attack_boost_2, __generated_hammer__1d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1d],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraninjahammer",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_hammer__2a: Hammer = {
-    category: "hammer",
-    id: "2a",
-
-    name: "Purity Hammer I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 80, 40, 0, 0, 0],
-    maxSharpness:  [80, 50, 80, 60, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "purityhammeri",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_hammer__2b: Hammer = {
-    category: "hammer",
-    id: "2b",
-
-    name: "Purity Hammer II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__water_boost_1, __generated_hammer__2a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 80, 30, 30, 0, 0],
-    maxSharpness:  [110, 100, 80, 30, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "purityhammerii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_hammer__2c: Hammer = {
-    category: "hammer",
-    id: "2c",
-
-    name: "Sinter Hammer",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__2b],
-            [__generated_ramp__water_boost_1, __generated_hammer__2a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 90, 40, 50, 0, 0],
-    maxSharpness:  [100, 70, 90, 40, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "sinterhammer",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_hammer__3a: Hammer = {
-    category: "hammer",
-    id: "3a",
-
-    name: "Binding Bludgeon I",
-    treeName: "Volvidon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [140, 40, 40, 30, 0, 0, 0],
-    maxSharpness:  [140, 40, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bindingbludgeoni",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_hammer__3b: Hammer = {
-    category: "hammer",
-    id: "3b",
-
-    name: "Binding Bludgeon II",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__3a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 40, 70, 0, 0, 0],
-    maxSharpness:  [150, 40, 40, 70, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bindingbludgeonii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_hammer__3c: Hammer = {
-    category: "hammer",
-    id: "3c",
-
-    name: "Armored Gogue",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__3b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__3b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__3a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 50, 70, 20, 0, 0],
-    maxSharpness:  [160, 50, 50, 70, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "armoredgogue",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_hammer__4a: Hammer = {
-    category: "hammer",
-    id: "4a",
-
-    name: "Almudron Hammer I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__3a],
-            [__generated_ramp__dulling_strike, __generated_hammer__3a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "almudronhammeri",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_hammer__4b: Hammer = {
-    category: "hammer",
-    id: "4b",
-
-    name: "Almudron Hammer II",
-    treeName: "Almudron Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 48]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__3a],
-            [__generated_ramp__dulling_strike, __generated_hammer__3a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 60, 20, 0, 0],
-    maxSharpness:  [60, 60, 100, 60, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "almudronhammerii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_hammer__4c: Hammer = {
-    category: "hammer",
-    id: "4c",
-
-    name: "Doom Bringer Hammer",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 51]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__4b],
-            [__generated_ramp__water_boost_1, __generated_hammer__4b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__3a],
-            [__generated_ramp__dulling_strike, __generated_hammer__3a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1c],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 60, 40, 0, 0],
-    maxSharpness:  [60, 60, 130, 60, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "doombringerhammer",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_hammer__5a: Hammer = {
-    category: "hammer",
-    id: "5a",
-
-    name: "Five-Pronged Hammer I",
-    treeName: "Bishaten Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 120, 50, 50, 0, 0, 0],
-    maxSharpness:  [30, 120, 50, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "five-prongedhammeri",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_hammer__5b: Hammer = {
-    category: "hammer",
-    id: "5b",
-
-    name: "Five-Pronged Hammer II",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__5a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 140, 60, 50, 20, 0, 0],
-    maxSharpness:  [30, 140, 60, 50, 30, 40, 0],
-
-    filterHelpers: {
-        nameLower: "five-prongedhammerii",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_hammer__5c: Hammer = {
-    category: "hammer",
-    id: "5c",
-
-    name: "Great Pronged Hammer",
-    treeName: "Bishaten Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__5a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__1c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 160, 80, 50, 30, 0, 0],
-    maxSharpness:  [30, 160, 80, 50, 30, 50, 0],
-
-    filterHelpers: {
-        nameLower: "greatprongedhammer",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_hammer__6a: Hammer = {
-    category: "hammer",
-    id: "6a",
-
-    name: "Wroggi Hammer I",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1b],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 40, 20, 0, 0, 0],
-    maxSharpness:  [90, 50, 40, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wroggihammeri",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_hammer__6b: Hammer = {
-    category: "hammer",
-    id: "6b",
-
-    name: "Wroggi Hammer II",
-    treeName: "Wroggi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__6a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 90, 30, 0, 0, 0],
-    maxSharpness:  [90, 40, 90, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wroggihammerii",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_hammer__6c: Hammer = {
-    category: "hammer",
-    id: "6c",
-
-    name: "Dirty Hammer",
-    treeName: "Wroggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__poison_boost_1, __generated_hammer__6b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__6a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [100, 50, 100, 70, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dirtyhammer",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_hammer__7a: Hammer = {
-    category: "hammer",
-    id: "7a",
-
-    name: "Gun Hammer I",
-    treeName: "Fire Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 4,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1b],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 50, 20, 0, 0, 0],
-    maxSharpness:  [80, 50, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gunhammeri",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_hammer__7b: Hammer = {
-    category: "hammer",
-    id: "7b",
-
-    name: "Gun Hammer II",
-    treeName: "Fire Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 8,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__7a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1b],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 80, 40, 0, 0, 0],
-    maxSharpness:  [90, 90, 80, 50, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gunhammerii",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_hammer__7c: Hammer = {
-    category: "hammer",
-    id: "7c",
-
-    name: "Deadeye Revolver",
-    treeName: "Fire Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 50]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__7b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__7a],
-            [__generated_ramp__attack_boost_1, __generated_hammer__1b],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__1b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 100, 30, 50, 20, 0, 0],
-    maxSharpness:  [100, 100, 30, 50, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "deadeyerevolver",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_hammer__8a: Hammer = {
-    category: "hammer",
-    id: "8a",
-
-    name: "Iron Hammer I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 50, 0, 0, 0, 0],
-    maxSharpness:  [90, 60, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironhammeri",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_hammer__8b: Hammer = {
-    category: "hammer",
-    id: "8b",
-
-    name: "Iron Devil",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 120, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "irondevil",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_hammer__8c: Hammer = {
-    category: "hammer",
-    id: "8c",
-
-    name: "War Hammer I",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 70, 10, 0, 0, 0],
-    maxSharpness:  [60, 60, 70, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "warhammeri",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_hammer__8d: Hammer = {
-    category: "hammer",
-    id: "8d",
-
-    name: "War Mace",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "warmace",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_hammer__8e: Hammer = {
-    category: "hammer",
-    id: "8e",
-
-    name: "War Stamp I",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 80, 50, 20, 0, 0],
-    maxSharpness:  [70, 80, 80, 50, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "warstampi",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_hammer__8f: Hammer = {
-    category: "hammer",
-    id: "8f",
-
-    name: "War Basher",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8e],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 110, 50, 40, 0, 0],
-    maxSharpness:  [50, 50, 110, 50, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "warbasher",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_hammer__9a: Hammer = {
-    category: "hammer",
-    id: "9a",
-
-    name: "Great Nova I",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8e],
-            [__generated_ramp__silkbind_boost, __generated_hammer__8e],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 90, 60, 10, 0, 0],
-    maxSharpness:  [100, 40, 90, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "greatnovai",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_hammer__9b: Hammer = {
-    category: "hammer",
-    id: "9b",
-
-    name: "Great Nova II",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8e],
-            [__generated_ramp__silkbind_boost, __generated_hammer__8e],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 120, 60, 20, 0, 0],
-    maxSharpness:  [100, 50, 120, 60, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "greatnovaii",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_hammer__9c: Hammer = {
-    category: "hammer",
-    id: "9c",
-
-    name: "Super Nova",
-    treeName: "Thunder Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8e],
-            [__generated_ramp__silkbind_boost, __generated_hammer__8e],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 90, 70, 30, 0, 0],
-    maxSharpness:  [100, 60, 90, 70, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "supernova",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_hammer__10a: Hammer = {
-    category: "hammer",
-    id: "10a",
-
-    name: "Striped Striker I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__silkbind_boost, __generated_hammer__8d],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "stripedstrikeri",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_hammer__10b: Hammer = {
-    category: "hammer",
-    id: "10b",
-
-    name: "Striped Striker II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__10a],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__silkbind_boost, __generated_hammer__8d],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 130, 100, 40, 0, 0],
-    maxSharpness:  [50, 30, 130, 100, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "stripedstrikerii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_hammer__10c: Hammer = {
-    category: "hammer",
-    id: "10c",
-
-    name: "Tigrex Hammer",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__10b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__10a],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8d],
-            [__generated_ramp__silkbind_boost, __generated_hammer__8d],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 50, 20, 0],
-    maxSharpness:  [50, 40, 120, 120, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrexhammer",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_hammer__11a: Hammer = {
-    category: "hammer",
-    id: "11a",
-
-    name: "Flaming Fury I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [120, 70, 30, 30, 0, 0, 0],
-    maxSharpness:  [120, 70, 30, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flamingfuryi",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_hammer__11b: Hammer = {
-    category: "hammer",
-    id: "11b",
-
-    name: "Flaming Fury II",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_hammer__11a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [120, 100, 30, 40, 10, 0, 0],
-    maxSharpness:  [120, 100, 30, 40, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flamingfuryii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_hammer__11c: Hammer = {
-    category: "hammer",
-    id: "11c",
-
-    name: "Phoenix Fury",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__11b],
-            [__generated_ramp__fire_boost_2, __generated_hammer__11b],
-            [__generated_ramp__fire_boost_1, __generated_hammer__11a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__8c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [130, 120, 30, 50, 20, 0, 0],
-    maxSharpness:  [130, 120, 30, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "phoenixfury",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_hammer__12a: Hammer = {
-    category: "hammer",
-    id: "12a",
-
-    name: "Glacial Bash I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "glacialbashi",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_hammer__12b: Hammer = {
-    category: "hammer",
-    id: "12b",
-
-    name: "Glacial Bash II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__12a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 80, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 80, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "glacialbashii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_hammer__12c: Hammer = {
-    category: "hammer",
-    id: "12c",
-
-    name: "Glacial Crunch",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__12b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__12a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8c],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8c],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 60, 40, 0],
-
-    filterHelpers: {
-        nameLower: "glacialcrunch",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_hammer__13a: Hammer = {
-    category: "hammer",
-    id: "13a",
-
-    name: "Kulu Bludgeon I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 40, 40, 0, 0, 0],
-    maxSharpness:  [70, 50, 40, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulubludgeoni",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_hammer__13b: Hammer = {
-    category: "hammer",
-    id: "13b",
-
-    name: "Kulu Bludgeon II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 50, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulubludgeonii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_hammer__13c: Hammer = {
-    category: "hammer",
-    id: "13c",
-
-    name: "Kulu Crusher",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__13b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 70, 60, 10, 0, 0],
-    maxSharpness:  [80, 80, 70, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulucrusher",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_hammer__14a: Hammer = {
-    category: "hammer",
-    id: "14a",
-
-    name: "Devil Masher I",
-    treeName: "Paralysis Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__13b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__13b],
-            [__generated_ramp__spiribird_doubled, __generated_hammer__13b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [30, 30, 200, 40, 0, 0, 0],
-    maxSharpness:  [30, 30, 200, 70, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "devilmasheri",
-        treeNameLower: "paralysistree",
-    },
-};
-
-const __generated_hammer__14b: Hammer = {
-    category: "hammer",
-    id: "14b",
-
-    name: "Devil Masher II",
-    treeName: "Paralysis Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__paralysis_boost_1, __generated_hammer__14a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__13b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__13b],
-            [__generated_ramp__spiribird_doubled, __generated_hammer__13b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 200, 60, 0, 0, 0],
-    maxSharpness:  [20, 20, 200, 70, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "devilmasherii",
-        treeNameLower: "paralysistree",
-    },
-};
-
-const __generated_hammer__14c: Hammer = {
-    category: "hammer",
-    id: "14c",
-
-    name: "Iron Devil's Soul",
-    treeName: "Paralysis Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__paralysis_boost_3, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_3, __generated_hammer__14b],
-            [__generated_ramp__paralysis_boost_2, __generated_hammer__14b],
-            [__generated_ramp__paralysis_boost_1, __generated_hammer__14a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__13b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__13b],
-            [__generated_ramp__spiribird_doubled, __generated_hammer__13b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__8b],
-        ],
-    ],
-
-    baseSharpness: [30, 30, 200, 90, 0, 0, 0],
-    maxSharpness:  [30, 30, 200, 90, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "irondevil'ssoul",
-        treeNameLower: "paralysistree",
-    },
-};
-
-const __generated_hammer__15a: Hammer = {
-    category: "hammer",
-    id: "15a",
-
-    name: "Unbearable Hammer I",
-    treeName: "Arzuros Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [140, 30, 30, 0, 0, 0, 0],
-    maxSharpness:  [140, 30, 60, 20, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "unbearablehammeri",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_hammer__15b: Hammer = {
-    category: "hammer",
-    id: "15b",
-
-    name: "Unbearable Hammer II",
-    treeName: "Arzuros Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [110, 40, 50, 0, 0, 0, 0],
-    maxSharpness:  [110, 40, 50, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "unbearablehammerii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_hammer__15c: Hammer = {
-    category: "hammer",
-    id: "15c",
-
-    name: "Barbearic Hammer",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__15b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [130, 30, 80, 60, 0, 0, 0],
-    maxSharpness:  [130, 30, 80, 60, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "barbearichammer",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_hammer__16a: Hammer = {
-    category: "hammer",
-    id: "16a",
-
-    name: "Frilled Blow I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__15b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__15b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 30, 0, 0, 0],
-    maxSharpness:  [50, 50, 120, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledblowi",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_hammer__16b: Hammer = {
-    category: "hammer",
-    id: "16b",
-
-    name: "Frilled Blow II",
-    treeName: "Somnacanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__15b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__15b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 120, 50, 0, 0, 0],
-    maxSharpness:  [40, 40, 120, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledblowii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_hammer__16c: Hammer = {
-    category: "hammer",
-    id: "16c",
-
-    name: "Illusory Frilled Blow",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__16b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__15b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__15b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 120, 90, 0, 0, 0],
-    maxSharpness:  [50, 90, 120, 100, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "illusoryfrilledblow",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_hammer__17a: Hammer = {
-    category: "hammer",
-    id: "17a",
-
-    name: "Bag o' Horrors I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__defense_boost_2, __generated_hammer__15a],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 40, 30, 0, 0, 0],
-    maxSharpness:  [70, 60, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bago'horrorsi",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_hammer__17b: Hammer = {
-    category: "hammer",
-    id: "17b",
-
-    name: "Bag o' Horrors II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 43]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__defense_boost_2, __generated_hammer__15a],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 50, 40, 0, 0, 0],
-    maxSharpness:  [100, 60, 50, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bago'horrorsii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_hammer__17c: Hammer = {
-    category: "hammer",
-    id: "17c",
-
-    name: "Bag o' Thunder",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 46]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__17b],
-            [__generated_ramp__thunder_boost_1, __generated_hammer__17b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__15a],
-            [__generated_ramp__defense_boost_2, __generated_hammer__15a],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__15a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 70, 70, 20, 0, 0],
-    maxSharpness:  [100, 40, 70, 70, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "bago'thunder",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_hammer__18a: Hammer = {
-    category: "hammer",
-    id: "18a",
-
-    name: "Frozen Core I",
-    treeName: "Ice Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 0, 0, 0, 0],
-    maxSharpness:  [90, 50, 90, 20, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frozencorei",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_hammer__18b: Hammer = {
-    category: "hammer",
-    id: "18b",
-
-    name: "Frozen Core II",
-    treeName: "Ice Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 60, 20, 0, 0, 0],
-    maxSharpness:  [70, 50, 60, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frozencoreii",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_hammer__18c: Hammer = {
-    category: "hammer",
-    id: "18c",
-
-    name: "Cocytus",
-    treeName: "Ice Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__18b],
-            [__generated_ramp__ice_boost_1, __generated_hammer__18b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__8a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__8a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 80, 40, 20, 0, 0],
-    maxSharpness:  [100, 60, 80, 40, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "cocytus",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_hammer__19a: Hammer = {
-    category: "hammer",
-    id: "19a",
-
-    name: "Bone Hammer I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonehammeri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_hammer__19b: Hammer = {
-    category: "hammer",
-    id: "19b",
-
-    name: "Bone Hammer II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonehammerii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_hammer__19c: Hammer = {
-    category: "hammer",
-    id: "19c",
-
-    name: "Hard Bone Hammer",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 70, 0, 0, 0, 0],
-    maxSharpness:  [90, 90, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hardbonehammer",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_hammer__19d: Hammer = {
-    category: "hammer",
-    id: "19d",
-
-    name: "Bone Bludgeon I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 80, 0, 0, 0, 0],
-    maxSharpness:  [100, 70, 80, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonebludgeoni",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_hammer__19e: Hammer = {
-    category: "hammer",
-    id: "19e",
-
-    name: "Bone Bludgeon II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 110, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 110, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonebludgeonii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_hammer__19f: Hammer = {
-    category: "hammer",
-    id: "19f",
-
-    name: "Heavy Bone Bludgeon",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__19e],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "heavybonebludgeon",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_hammer__20a: Hammer = {
-    category: "hammer",
-    id: "20a",
-
-    name: "Diablos Hammer I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -25,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_4, __generated_hammer__19f],
-            [__generated_ramp__dulling_strike, __generated_hammer__19f],
-            [__generated_ramp__attack_boost_3, __generated_hammer__19e],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 30, 100, 10, 0, 0],
-    maxSharpness:  [50, 160, 30, 100, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "diabloshammeri",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_hammer__20b: Hammer = {
-    category: "hammer",
-    id: "20b",
-
-    name: "Diablos Hammer II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -25,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__20a],
-            [__generated_ramp__attack_boost_4, __generated_hammer__19f],
-            [__generated_ramp__dulling_strike, __generated_hammer__19f],
-            [__generated_ramp__attack_boost_3, __generated_hammer__19e],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 20, 100, 20, 0, 0],
-    maxSharpness:  [50, 160, 20, 100, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "diabloshammerii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_hammer__20c: Hammer = {
-    category: "hammer",
-    id: "20c",
-
-    name: "Diablos Tail",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: -25,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__20b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__20a],
-            [__generated_ramp__attack_boost_4, __generated_hammer__19f],
-            [__generated_ramp__dulling_strike, __generated_hammer__19f],
-            [__generated_ramp__attack_boost_3, __generated_hammer__19e],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 10, 100, 30, 0, 0],
-    maxSharpness:  [50, 160, 10, 100, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "diablostail",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_hammer__21a: Hammer = {
-    category: "hammer",
-    id: "21a",
-
-    name: "Cyclo-Hammer I",
-    treeName: "Bone Tree 2",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__19d],
-            [__generated_ramp__dulling_strike, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 50, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cyclo-hammeri",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_hammer__21b: Hammer = {
-    category: "hammer",
-    id: "21b",
-
-    name: "Cyclo-Hammer II",
-    treeName: "Bone Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__21a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__19d],
-            [__generated_ramp__dulling_strike, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 100, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 130, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cyclo-hammerii",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_hammer__21c: Hammer = {
-    category: "hammer",
-    id: "21c",
-
-    name: "Atlas Hammer",
-    treeName: "Bone Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__21a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__19d],
-            [__generated_ramp__dulling_strike, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 150, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 160, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "atlashammer",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_hammer__22a: Hammer = {
-    category: "hammer",
-    id: "22a",
-
-    name: "Pukei Hammer I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__master_rider, __generated_hammer__21a],
-            [__generated_ramp__spiribird_doubled, __generated_hammer__21a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__19d],
-            [__generated_ramp__dulling_strike, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 80, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 100, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeihammeri",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_hammer__22b: Hammer = {
-    category: "hammer",
-    id: "22b",
-
-    name: "Pukei Hammer II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 47]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__master_rider, __generated_hammer__21a],
-            [__generated_ramp__spiribird_doubled, __generated_hammer__21a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__19d],
-            [__generated_ramp__dulling_strike, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 90, 110, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 120, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeihammerii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_hammer__22c: Hammer = {
-    category: "hammer",
-    id: "22c",
-
-    name: "Datura Club",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 54]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__22b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__22b],
-            [__generated_ramp__master_rider, __generated_hammer__21a],
-            [__generated_ramp__spiribird_doubled, __generated_hammer__21a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19d],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__19d],
-            [__generated_ramp__dulling_strike, __generated_hammer__19d],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19c],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 120, 40, 70, 40, 0, 0],
-    maxSharpness:  [80, 120, 40, 70, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "daturaclub",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_hammer__23a: Hammer = {
-    category: "hammer",
-    id: "23a",
-
-    name: "Basarios Blow I",
-    treeName: "Basarios Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 140, 50, 20, 0, 0, 0],
-    maxSharpness:  [40, 140, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "basariosblowi",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_hammer__23b: Hammer = {
-    category: "hammer",
-    id: "23b",
-
-    name: "Basarios Blow II",
-    treeName: "Basarios Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 130, 50, 30, 0, 0, 0],
-    maxSharpness:  [40, 130, 50, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "basariosblowii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_hammer__23c: Hammer = {
-    category: "hammer",
-    id: "23c",
-
-    name: "Basarios Bash",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 130, 70, 50, 10, 0, 0],
-    maxSharpness:  [40, 130, 70, 50, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "basariosbash",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_hammer__24a: Hammer = {
-    category: "hammer",
-    id: "24a",
-
-    name: "Red Bludgeon I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__23c],
-            [__generated_ramp__attack_boost_3, __generated_hammer__23c],
-            [__generated_ramp__dulling_strike, __generated_hammer__23c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [240, 10, 10, 70, 20, 0, 0],
-    maxSharpness:  [240, 10, 10, 70, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "redbludgeoni",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_hammer__24b: Hammer = {
-    category: "hammer",
-    id: "24b",
-
-    name: "Red Bludgeon II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__23c],
-            [__generated_ramp__attack_boost_3, __generated_hammer__23c],
-            [__generated_ramp__dulling_strike, __generated_hammer__23c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [230, 10, 10, 70, 30, 0, 0],
-    maxSharpness:  [230, 10, 10, 70, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "redbludgeonii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_hammer__24c: Hammer = {
-    category: "hammer",
-    id: "24c",
-
-    name: "Huracan Hammer",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__24b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__23c],
-            [__generated_ramp__dulling_strike, __generated_hammer__23c],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [220, 10, 10, 70, 40, 0, 0],
-    maxSharpness:  [220, 10, 10, 70, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "huracanhammer",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_hammer__25a: Hammer = {
-    category: "hammer",
-    id: "25a",
-
-    name: "Yeti Hammer I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 90, 30, 0, 0, 0],
-    maxSharpness:  [100, 30, 90, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "yetihammeri",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_hammer__25b: Hammer = {
-    category: "hammer",
-    id: "25b",
-
-    name: "Yeti Hammer II",
-    treeName: "Goss Harag Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_hammer__25a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 110, 40, 20, 0, 0],
-    maxSharpness:  [100, 30, 110, 40, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "yetihammerii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_hammer__25c: Hammer = {
-    category: "hammer",
-    id: "25c",
-
-    name: "Yeti Hammer III",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_hammer__25a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 100, 40, 30, 0, 0],
-    maxSharpness:  [100, 30, 100, 40, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "yetihammeriii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_hammer__25d: Hammer = {
-    category: "hammer",
-    id: "25d",
-
-    name: "Abominable Hammer",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_2, __generated_hammer__25c],
-            [__generated_ramp__ice_boost_1, __generated_hammer__25a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 90, 50, 30, 0, 0],
-    maxSharpness:  [100, 30, 90, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "abominablehammer",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_hammer__26a: Hammer = {
-    category: "hammer",
-    id: "26a",
-
-    name: "Usurper's Thunder I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 90, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 90, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sthunderi",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_hammer__26b: Hammer = {
-    category: "hammer",
-    id: "26b",
-
-    name: "Usurper's Thunder II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__26a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 70, 90, 30, 0, 0],
-    maxSharpness:  [70, 40, 70, 90, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sthunderii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_hammer__26c: Hammer = {
-    category: "hammer",
-    id: "26c",
-
-    name: "Despot's Crackle",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_hammer__26b],
-            [__generated_ramp__attack_boost_1, __generated_hammer__26a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__23a],
-            [__generated_ramp__dulling_strike, __generated_hammer__23a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 100, 40, 0, 0],
-    maxSharpness:  [70, 40, 100, 100, 50, 40, 0],
-
-    filterHelpers: {
-        nameLower: "despot'scrackle",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_hammer__27a: Hammer = {
-    category: "hammer",
-    id: "27a",
-
-    name: "Calamitous Portent I",
-    treeName: "Remobra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 80, 20, 0, 0, 0],
-    maxSharpness:  [90, 60, 80, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "calamitousportenti",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_hammer__27b: Hammer = {
-    category: "hammer",
-    id: "27b",
-
-    name: "Calamitous Portent II",
-    treeName: "Remobra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__27a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [120, 50, 50, 30, 0, 0, 0],
-    maxSharpness:  [120, 50, 50, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "calamitousportentii",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_hammer__27c: Hammer = {
-    category: "hammer",
-    id: "27c",
-
-    name: "Catastrophic Portent",
-    treeName: "Remobra Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_1, __generated_hammer__27b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__27a],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [130, 60, 50, 50, 10, 0, 0],
-    maxSharpness:  [130, 60, 50, 50, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "catastrophicportent",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_hammer__28a: Hammer = {
-    category: "hammer",
-    id: "28a",
-
-    name: "Droth Splashhammer I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 90, 30, 0, 0, 0],
-    maxSharpness:  [40, 40, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "drothsplashhammeri",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_hammer__28b: Hammer = {
-    category: "hammer",
-    id: "28b",
-
-    name: "Droth Splashhammer II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 100, 40, 0, 0, 0],
-    maxSharpness:  [50, 60, 100, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "drothsplashhammerii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_hammer__28c: Hammer = {
-    category: "hammer",
-    id: "28c",
-
-    name: "Ludroth Dousehammer",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__28b],
-            [__generated_ramp__water_boost_1, __generated_hammer__28b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__19b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 60, 20, 0, 0],
-    maxSharpness:  [60, 40, 120, 60, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "ludrothdousehammer",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_hammer__29a: Hammer = {
-    category: "hammer",
-    id: "29a",
-
-    name: "Izuchi Hammer I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 100, 0, 0, 0, 0],
-    maxSharpness:  [30, 70, 140, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "izuchihammeri",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_hammer__29b: Hammer = {
-    category: "hammer",
-    id: "29b",
-
-    name: "Izuchi Hammer II",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 12,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__29a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [30, 60, 80, 30, 0, 0, 0],
-    maxSharpness:  [30, 60, 80, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "izuchihammerii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_hammer__29c: Hammer = {
-    category: "hammer",
-    id: "29c",
-
-    name: "Snapper Hammer",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__29b],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__29a],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19a],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [30, 80, 50, 70, 20, 0, 0],
-    maxSharpness:  [30, 80, 50, 70, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snapperhammer",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_hammer__30a: Hammer = {
-    category: "hammer",
-    id: "30a",
-
-    name: "Hidden Breaker I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__29b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__29b],
-            [__generated_ramp__buddy_rally, __generated_hammer__29b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenbreakeri",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_hammer__30b: Hammer = {
-    category: "hammer",
-    id: "30b",
-
-    name: "Hidden Breaker II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__30a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__29b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__29b],
-            [__generated_ramp__buddy_rally, __generated_hammer__29b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 100, 50, 0, 0],
-    maxSharpness:  [100, 30, 70, 100, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenbreakerii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_hammer__30c: Hammer = {
-    category: "hammer",
-    id: "30c",
-
-    name: "Night Eternal",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 45,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__30b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__30a],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__29b],
-            [__generated_ramp__buddy_rally, __generated_hammer__29b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 120, 90, 60, 20, 0],
-    maxSharpness:  [70, 40, 120, 90, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "nighteternal",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_hammer__31a: Hammer = {
-    category: "hammer",
-    id: "31a",
-
-    name: "Carapace Hammer I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -10,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__29b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__29b],
-            [__generated_ramp__buddy_rally, __generated_hammer__29b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 140, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 140, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "carapacehammeri",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_hammer__31b: Hammer = {
-    category: "hammer",
-    id: "31b",
-
-    name: "Carapace Hammer II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -10,
-    defense: 8,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__31a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__29b],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__29b],
-            [__generated_ramp__buddy_rally, __generated_hammer__29b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 160, 20, 0, 0, 0],
-    maxSharpness:  [60, 60, 160, 60, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "carapacehammerii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_hammer__31c: Hammer = {
-    category: "hammer",
-    id: "31c",
-
-    name: "Barroth Hammer",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -5,
-    defense: 10,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__31b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__31a],
-            [__generated_ramp__small_monster_exploit, __generated_hammer__29b],
-            [__generated_ramp__buddy_rally, __generated_hammer__29b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__19a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 180, 50, 0, 0, 0],
-    maxSharpness:  [60, 60, 180, 50, 30, 20, 0],
-
-    filterHelpers: {
-        nameLower: "barrothhammer",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_hammer__32a: Hammer = {
-    category: "hammer",
-    id: "32a",
-
-    name: "Sinister Hammer I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterhammeri",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_hammer__32b: Hammer = {
-    category: "hammer",
-    id: "32b",
-
-    name: "Sinister Hammer II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__32a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterhammerii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_hammer__32c: Hammer = {
-    category: "hammer",
-    id: "32c",
-
-    name: "Sinister Shade Hammer",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_hammer__32b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__32a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "sinistershadehammer",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_hammer__33a: Hammer = {
-    category: "hammer",
-    id: "33a",
-
-    name: "Egg Hammer I",
-    treeName: "Gargwa Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 100, 0, 0, 0, 0],
-    maxSharpness:  [50, 100, 140, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "egghammeri",
-        treeNameLower: "gargwatree",
-    },
-};
-
-const __generated_hammer__33b: Hammer = {
-    category: "hammer",
-    id: "33b",
-
-    name: "Egg Hammer II",
-    treeName: "Gargwa Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 240,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 150, 0, 0, 0, 0],
-    maxSharpness:  [50, 100, 180, 20, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "egghammerii",
-        treeNameLower: "gargwatree",
-    },
-};
-
-const __generated_hammer__33c: Hammer = {
-    category: "hammer",
-    id: "33c",
-
-    name: "Gargwa Hammer",
-    treeName: "Gargwa Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 260,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 200, 0, 0, 0, 0],
-    maxSharpness:  [50, 100, 230, 10, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gargwahammer",
-        treeNameLower: "gargwatree",
-    },
-};
-
-const __generated_hammer__34a: Hammer = {
-    category: "hammer",
-    id: "34a",
-
-    name: "Mane Malice I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 130, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "manemalicei",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_hammer__34b: Hammer = {
-    category: "hammer",
-    id: "34b",
-
-    name: "Mane Malice II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_hammer__34a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 100, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "manemaliceii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_hammer__34c: Hammer = {
-    category: "hammer",
-    id: "34c",
-
-    name: "Mane Malice Rajang",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__34b],
-            [__generated_ramp__thunder_boost_1, __generated_hammer__34a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 80, 120, 0, 0, 0],
-    maxSharpness:  [50, 50, 80, 120, 30, 20, 0],
-
-    filterHelpers: {
-        nameLower: "manemalicerajang",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_hammer__35a: Hammer = {
-    category: "hammer",
-    id: "35a",
-
-    name: "Azure Elder Hammer I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderhammeri",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_hammer__35b: Hammer = {
-    category: "hammer",
-    id: "35b",
-
-    name: "Azure Elder Hammer II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_hammer__35a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderhammerii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_hammer__35c: Hammer = {
-    category: "hammer",
-    id: "35c",
-
-    name: "Abyssal Gale Mauler",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_hammer__35b],
-            [__generated_ramp__defense_boost_1, __generated_hammer__35a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalgalemauler",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_hammer__36a: Hammer = {
-    category: "hammer",
-    id: "36a",
-
-    name: "Thunderbolt Hammer I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 47]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "thunderbolthammeri",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_hammer__36b: Hammer = {
-    category: "hammer",
-    id: "36b",
-
-    name: "Abyssal Storm Mauler",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 49]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__36a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalstormmauler",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_hammer__37a: Hammer = {
-    category: "hammer",
-    id: "37a",
-
-    name: "Gelosteel Hammer I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 110, 90, 40, 0, 0],
-    maxSharpness:  [70, 40, 110, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "icesteelhammeri",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_hammer__37b: Hammer = {
-    category: "hammer",
-    id: "37b",
-
-    name: "Daora's Colossus",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__37a],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__37a],
-        ],
-    ],
-
-    baseSharpness: [80, 110, 70, 40, 40, 10, 0],
-    maxSharpness:  [80, 110, 70, 40, 40, 60, 0],
-
-    filterHelpers: {
-        nameLower: "daora'scolossus",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_hammer__38a: Hammer = {
-    category: "hammer",
-    id: "38a",
-
-    name: "Teostra Cratermaker I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 50, 90, 40, 0, 0],
-    maxSharpness:  [150, 20, 50, 90, 80, 10, 0],
-
-    filterHelpers: {
-        nameLower: "teostracratermakeri",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_hammer__38b: Hammer = {
-    category: "hammer",
-    id: "38b",
-
-    name: "Teostra Cratergouger",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 46]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__38a],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 30, 90, 50, 0, 0],
-    maxSharpness:  [160, 20, 30, 90, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "teostracratergouger",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_hammer__39a: Hammer = {
-    category: "hammer",
-    id: "39a",
-
-    name: "Genie's Expanse I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 80, 90, 50, 0, 0],
-    maxSharpness:  [100, 30, 80, 90, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "genie'sexpansei",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_hammer__39b: Hammer = {
-    category: "hammer",
-    id: "39b",
-
-    name: "Diamalto's Dream",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__39a],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 50, 10, 0],
-    maxSharpness:  [70, 30, 100, 90, 50, 60, 0],
-
-    filterHelpers: {
-        nameLower: "diamalto'sdream",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_hammer__40a: Hammer = {
-    category: "hammer",
-    id: "40a",
-
-    name: "Redwing Drill I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    filterHelpers: {
-        nameLower: "redwingdrilli",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_hammer__40b: Hammer = {
-    category: "hammer",
-    id: "40b",
-
-    name: "Reddnaught Hammer",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 43]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    filterHelpers: {
-        nameLower: "reddnaughthammer",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_hammer__41a: Hammer = {
-    category: "hammer",
-    id: "41a",
-
-    name: "Teddybear I",
-    treeName: "Guild Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 120, 60, 0, 0, 0],
-    maxSharpness:  [50, 20, 120, 110, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "teddybeari",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_hammer__41b: Hammer = {
-    category: "hammer",
-    id: "41b",
-
-    name: "Teddybear II",
-    treeName: "Guild Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__41a],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 130, 60, 40, 0, 0],
-    maxSharpness:  [50, 20, 130, 60, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "teddybearii",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_hammer__41c: Hammer = {
-    category: "hammer",
-    id: "41c",
-
-    name: "Sleepy Bear",
-    treeName: "Guild Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_3, __generated_hammer__41b],
-            [__generated_ramp__defense_boost_2, __generated_hammer__41b],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__41a],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 190, 60, 40, 40, 0],
-    maxSharpness:  [50, 20, 190, 60, 40, 40, 0],
-
-    filterHelpers: {
-        nameLower: "sleepybear",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_hammer__42a: Hammer = {
-    category: "hammer",
-    id: "42a",
-
-    name: "Graceful Death I",
-    treeName: "Death Stench Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 3,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 60, 0, 0, 0],
-    maxSharpness:  [50, 70, 70, 110, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gracefuldeathi",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_hammer__42b: Hammer = {
-    category: "hammer",
-    id: "42b",
-
-    name: "Graceful Death II",
-    treeName: "Death Stench Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__42a],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [30, 70, 80, 120, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gracefuldeathii",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_hammer__42c: Hammer = {
-    category: "hammer",
-    id: "42c",
-
-    name: "Graceful Death III",
-    treeName: "Death Stench Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 8,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__dragon_boost_1, __generated_hammer__42b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__42a],
-        ],
-    ],
-
-    baseSharpness: [20, 100, 100, 80, 0, 0, 0],
-    maxSharpness:  [20, 100, 100, 80, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gracefuldeathiii",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_hammer__42d: Hammer = {
-    category: "hammer",
-    id: "42d",
-
-    name: "Yadora Morte",
-    treeName: "Death Stench Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__42c],
-            [__generated_ramp__dragon_boost_1, __generated_hammer__42b],
-            [__generated_ramp__attack_boost_2, __generated_hammer__42a],
-        ],
-    ],
-
-    baseSharpness: [200, 20, 20, 100, 10, 0, 0],
-    maxSharpness:  [200, 20, 20, 100, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "yadoramorte",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_hammer__43a: Hammer = {
-    category: "hammer",
-    id: "43a",
-
-    name: "Pumpking I",
-    treeName: "Mosgharl Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 30, 40, 0, 0, 0],
-    maxSharpness:  [80, 100, 30, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pumpkingi",
-        treeNameLower: "mosgharltree",
-    },
-};
-
-const __generated_hammer__43b: Hammer = {
-    category: "hammer",
-    id: "43b",
-
-    name: "Pumpking II",
-    treeName: "Mosgharl Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 20, 50, 0, 0, 0],
-    maxSharpness:  [80, 100, 20, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pumpkingii",
-        treeNameLower: "mosgharltree",
-    },
-};
-
-const __generated_hammer__43c: Hammer = {
-    category: "hammer",
-    id: "43c",
-
-    name: "Jack-'o-lantern King",
-    treeName: "Mosgharl Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__defense_boost_2, __generated_hammer__43b],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 40, 60, 20, 0, 0],
-    maxSharpness:  [80, 100, 40, 60, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "jack-'o-lanternking",
-        treeNameLower: "mosgharltree",
-    },
-};
-
-const __generated_hammer__ra: Hammer = {
-    category: "hammer",
-    id: "ra",
-
-    name: "Rampage Hammer I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagehammeri",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_hammer__rb: Hammer = {
-    category: "hammer",
-    id: "rb",
-
-    name: "Rampage Hammer II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagehammerii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_hammer__rc: Hammer = {
-    category: "hammer",
-    id: "rc",
-
-    name: "Rampage Hammer III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_hammer__rb],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__rb],
-            [__generated_ramp__defense_boost_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_hammer__rb],
-            [__generated_ramp__water_1, __generated_hammer__rb],
-            [__generated_ramp__thunder_1, __generated_hammer__rb],
-            [__generated_ramp__ice_1, __generated_hammer__rb],
-            [__generated_ramp__dragon_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagehammeriii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_hammer__rd: Hammer = {
-    category: "hammer",
-    id: "rd",
-
-    name: "Rampage Hammer IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_hammer__rc],
-            [__generated_ramp__attack_boost_1, __generated_hammer__rb],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__rb],
-            [__generated_ramp__defense_boost_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_hammer__rc],
-            [__generated_ramp__paralysis_1, __generated_hammer__rc],
-            [__generated_ramp__sleep_1, __generated_hammer__rc],
-            [__generated_ramp__blast_1, __generated_hammer__rc],
-            [__generated_ramp__fire_1, __generated_hammer__rb],
-            [__generated_ramp__water_1, __generated_hammer__rb],
-            [__generated_ramp__thunder_1, __generated_hammer__rb],
-            [__generated_ramp__ice_1, __generated_hammer__rb],
-            [__generated_ramp__dragon_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagehammeriv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_hammer__re: Hammer = {
-    category: "hammer",
-    id: "re",
-
-    name: "Rampage Hammer V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_hammer__rd],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__rd],
-            [__generated_ramp__defense_boost_2, __generated_hammer__rd],
-            [__generated_ramp__elemental_boost_1, __generated_hammer__rc],
-            [__generated_ramp__attack_boost_1, __generated_hammer__rb],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__rb],
-            [__generated_ramp__defense_boost_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__fire_2, __generated_hammer__rd],
-            [__generated_ramp__water_2, __generated_hammer__rd],
-            [__generated_ramp__thunder_2, __generated_hammer__rd],
-            [__generated_ramp__ice_2, __generated_hammer__rd],
-            [__generated_ramp__dragon_2, __generated_hammer__rd],
-            [__generated_ramp__poison_1, __generated_hammer__rc],
-            [__generated_ramp__paralysis_1, __generated_hammer__rc],
-            [__generated_ramp__sleep_1, __generated_hammer__rc],
-            [__generated_ramp__blast_1, __generated_hammer__rc],
-            [__generated_ramp__fire_1, __generated_hammer__rb],
-            [__generated_ramp__water_1, __generated_hammer__rb],
-            [__generated_ramp__thunder_1, __generated_hammer__rb],
-            [__generated_ramp__ice_1, __generated_hammer__rb],
-            [__generated_ramp__dragon_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rampagehammerv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_hammer__rf: Hammer = {
-    category: "hammer",
-    id: "rf",
-
-    name: "Rampage Hammer S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_3, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_hammer__re],
-            [__generated_ramp__elemental_boost_2, __generated_hammer__re],
-            [__generated_ramp__affinity_boost_3, __generated_hammer__re],
-            [__generated_ramp__attack_boost_2, __generated_hammer__rd],
-            [__generated_ramp__affinity_boost_2, __generated_hammer__rd],
-            [__generated_ramp__defense_boost_2, __generated_hammer__rd],
-            [__generated_ramp__elemental_boost_1, __generated_hammer__rc],
-            [__generated_ramp__attack_boost_1, __generated_hammer__rb],
-            [__generated_ramp__affinity_boost_1, __generated_hammer__rb],
-            [__generated_ramp__defense_boost_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_4, null],
-            [__generated_ramp__water_4, null],
-            [__generated_ramp__thunder_4, null],
-            [__generated_ramp__ice_4, null],
-            [__generated_ramp__dragon_4, null],
-            [__generated_ramp__poison_3, null],
-            [__generated_ramp__paralysis_3, null],
-            [__generated_ramp__sleep_3, null],
-            [__generated_ramp__blast_3, null],
-            [__generated_ramp__fire_3, __generated_hammer__re],
-            [__generated_ramp__water_3, __generated_hammer__re],
-            [__generated_ramp__thunder_3, __generated_hammer__re],
-            [__generated_ramp__ice_3, __generated_hammer__re],
-            [__generated_ramp__dragon_3, __generated_hammer__re],
-            [__generated_ramp__poison_2, __generated_hammer__re],
-            [__generated_ramp__paralysis_2, __generated_hammer__re],
-            [__generated_ramp__sleep_2, __generated_hammer__re],
-            [__generated_ramp__blast_2, __generated_hammer__re],
-            [__generated_ramp__fire_2, __generated_hammer__rd],
-            [__generated_ramp__water_2, __generated_hammer__rd],
-            [__generated_ramp__thunder_2, __generated_hammer__rd],
-            [__generated_ramp__ice_2, __generated_hammer__rd],
-            [__generated_ramp__dragon_2, __generated_hammer__rd],
-            [__generated_ramp__poison_1, __generated_hammer__rc],
-            [__generated_ramp__paralysis_1, __generated_hammer__rc],
-            [__generated_ramp__sleep_1, __generated_hammer__rc],
-            [__generated_ramp__blast_1, __generated_hammer__rc],
-            [__generated_ramp__fire_1, __generated_hammer__rb],
-            [__generated_ramp__water_1, __generated_hammer__rb],
-            [__generated_ramp__thunder_1, __generated_hammer__rb],
-            [__generated_ramp__ice_1, __generated_hammer__rb],
-            [__generated_ramp__dragon_1, __generated_hammer__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagehammers",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"hammer","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Hammer I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0]},{"id":"1b","name":"Kamura Hammer II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0]},{"id":"1c","name":"Kamura Hammer III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"1d","name":"Kamura Hammer IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,80,20,10,0,0],"maxSharpness":[60,80,80,20,60,0,0]},{"id":"1e","name":"Kamura Hammer V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0]},{"id":"1f","name":"Kamura Ninja Hammer","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0]}]],["Mizutsune Tree",[{"id":"2a","name":"Purity Hammer I","rarity":3,"endlineTag":"","attack":120,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["water",21]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_1",null],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,50,80,40,0,0,0],"maxSharpness":[80,50,80,60,30,0,0]},{"id":"2b","name":"Purity Hammer II","rarity":5,"endlineTag":"","attack":170,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",26]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,100,80,30,30,0,0],"maxSharpness":[110,100,80,30,60,20,0]},{"id":"2c","name":"Sinter Hammer","rarity":6,"endlineTag":"hr","attack":200,"affinity":20,"defense":0,"decoSlots":[1],"eleStat":[["water",31]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","2b"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,70,90,40,50,0,0],"maxSharpness":[100,70,90,40,50,50,0]}]],["Volvidon Tree",[{"id":"3a","name":"Binding Bludgeon I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",23]],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[140,40,40,30,0,0,0],"maxSharpness":[140,40,40,80,0,0,0]},{"id":"3b","name":"Binding Bludgeon II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["paralysis",27]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_2","3a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[150,40,40,70,0,0,0],"maxSharpness":[150,40,40,70,50,0,0]},{"id":"3c","name":"Armored Gogue","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["paralysis",30]],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["dulling_strike",null],["attack_boost_3","3b"],["defense_boost_2","3b"],["attack_boost_2","3a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[160,50,50,70,20,0,0],"maxSharpness":[160,50,50,70,70,0,0]}]],["Almudron Tree",[{"id":"4a","name":"Almudron Hammer I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",40]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["defense_boost_2","3a"],["dulling_strike","3a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,50,100,50,0,0,0],"maxSharpness":[50,50,100,80,20,0,0]},{"id":"4b","name":"Almudron Hammer II","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",48]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["defense_boost_2","3a"],["dulling_strike","3a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,60,100,60,20,0,0],"maxSharpness":[60,60,100,60,70,0,0]},{"id":"4c","name":"Doom Bringer Hammer","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",51]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["element_exploit",null],["attack_boost_2","4b"],["water_boost_1","4b"],["defense_boost_2","3a"],["dulling_strike","3a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,60,130,60,40,0,0],"maxSharpness":[60,60,130,60,90,0,0]}]],["Bishaten Tree",[{"id":"5a","name":"Five-Pronged Hammer I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["anti_aerial_species",null],["silkbind_boost",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,120,50,50,0,0,0],"maxSharpness":[30,120,50,90,10,0,0]},{"id":"5b","name":"Five-Pronged Hammer II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["silkbind_boost",null],["attack_boost_1","5a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,140,60,50,20,0,0],"maxSharpness":[30,140,60,50,30,40,0]},{"id":"5c","name":"Great Pronged Hammer","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["silkbind_boost",null],["attack_boost_1","5a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,160,80,50,30,0,0],"maxSharpness":[30,160,80,50,30,50,0]}]],["Wroggi Tree",[{"id":"6a","name":"Wroggi Hammer I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",27]],"rampSkills":[[["affinity_boost_1",null],["poison_boost_1",null],["buddy_rally",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,50,40,20,0,0,0],"maxSharpness":[90,50,40,70,0,0,0]},{"id":"6b","name":"Wroggi Hammer II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",31]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_1",null],["buddy_rally",null],["affinity_boost_1","6a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,40,90,30,0,0,0],"maxSharpness":[90,40,90,70,10,0,0]},{"id":"6c","name":"Dirty Hammer","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["poison",36]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_2",null],["buddy_rally",null],["poison_boost_1","6b"],["affinity_boost_1","6a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[100,50,100,50,0,0,0],"maxSharpness":[100,50,100,70,30,0,0]}]],["Fire Tree",[{"id":"7a","name":"Gun Hammer I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":4,"decoSlots":[],"eleStat":[["fire",37]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["small_monster_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[80,50,50,20,0,0,0],"maxSharpness":[80,50,50,70,0,0,0]},{"id":"7b","name":"Gun Hammer II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":8,"decoSlots":[1,1,1],"eleStat":[["fire",45]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["small_monster_exploit",null],["attack_boost_2","7a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,90,80,40,0,0,0],"maxSharpness":[90,90,80,50,40,0,0]},{"id":"7c","name":"Deadeye Revolver","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[["fire",50]],"rampSkills":[[["attack_boost_4",null],["fireblight_exploit",null],["small_monster_exploit",null],["attack_boost_3","7b"],["attack_boost_2","7a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[100,100,30,50,20,0,0],"maxSharpness":[100,100,30,50,50,20,0]}]],["Ore Tree",[{"id":"8a","name":"Iron Hammer I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[90,60,50,0,0,0,0],"maxSharpness":[90,60,100,0,0,0,0]},{"id":"8b","name":"Iron Devil","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,120,0,0,0,0]},{"id":"8c","name":"War Hammer I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","8b"]]],"baseSharpness":[60,60,70,10,0,0,0],"maxSharpness":[60,60,70,60,0,0,0]},{"id":"8d","name":"War Mace","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0]},{"id":"8e","name":"War Stamp I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[70,80,80,50,20,0,0],"maxSharpness":[70,80,80,50,50,20,0]},{"id":"8f","name":"War Basher","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[50,50,110,50,40,0,0],"maxSharpness":[50,50,110,50,60,30,0]}]],["Thunder Tree",[{"id":"9a","name":"Great Nova I","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":5,"decoSlots":[1,1,1],"eleStat":[["thunder",35]],"rampSkills":[[["defense_boost_3",null],["wyvern_exploit",null],["element_exploit",null],["attack_boost_2","8e"],["silkbind_boost","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[100,40,90,60,10,0,0],"maxSharpness":[100,40,90,60,60,0,0]},{"id":"9b","name":"Great Nova II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":5,"decoSlots":[1,1,1],"eleStat":[["thunder",37]],"rampSkills":[[["defense_boost_3",null],["wyvern_exploit",null],["element_exploit",null],["attack_boost_2","8e"],["silkbind_boost","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[100,50,120,60,20,0,0],"maxSharpness":[100,50,120,60,60,10,0]},{"id":"9c","name":"Super Nova","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":5,"decoSlots":[1,1,1],"eleStat":[["thunder",40]],"rampSkills":[[["defense_boost_3",null],["wyvern_exploit",null],["element_exploit",null],["attack_boost_2","8e"],["silkbind_boost","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[100,60,90,70,30,0,0],"maxSharpness":[100,60,90,70,50,30,0]}]],["Tigrex Tree",[{"id":"10a","name":"Striped Striker I","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0]},{"id":"10b","name":"Striped Striker II","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","10a"],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[50,30,130,100,40,0,0],"maxSharpness":[50,30,130,100,70,20,0]},{"id":"10c","name":"Tigrex Hammer","rarity":6,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","10b"],["affinity_boost_1","10a"],["defense_boost_2","8d"],["silkbind_boost","8d"],["attack_boost_1","8b"]]],"baseSharpness":[50,40,120,120,50,20,0],"maxSharpness":[50,40,120,120,50,20,0]}]],["Anjanath Tree",[{"id":"11a","name":"Flaming Fury I","rarity":3,"endlineTag":"","attack":140,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["fire",17]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","8c"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[120,70,30,30,0,0,0],"maxSharpness":[120,70,30,80,0,0,0]},{"id":"11b","name":"Flaming Fury II","rarity":5,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",20]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","11a"],["attack_boost_2","8c"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[120,100,30,40,10,0,0],"maxSharpness":[120,100,30,40,60,0,0]},{"id":"11c","name":"Phoenix Fury","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",22]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","11b"],["fire_boost_2","11b"],["fire_boost_1","11a"],["attack_boost_2","8c"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[130,120,30,50,20,0,0],"maxSharpness":[130,120,30,50,70,0,0]}]],["Barioth Tree",[{"id":"12a","name":"Glacial Bash I","rarity":2,"endlineTag":"","attack":90,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",21]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["affinity_boost_1","8c"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0]},{"id":"12b","name":"Glacial Bash II","rarity":3,"endlineTag":"","attack":100,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",23]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","12a"],["affinity_boost_1","8c"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[50,70,80,80,20,0,0],"maxSharpness":[50,70,80,80,60,10,0]},{"id":"12c","name":"Glacial Crunch","rarity":5,"endlineTag":"hr","attack":160,"affinity":35,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",27]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","12b"],["attack_boost_2","12a"],["affinity_boost_1","8c"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,60,40,0]}]],["Kulu-Ya-Ku Tree",[{"id":"13a","name":"Kulu Bludgeon I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["spiribird_doubled",null],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[70,50,40,40,0,0,0],"maxSharpness":[70,50,40,90,0,0,0]},{"id":"13b","name":"Kulu Bludgeon II","rarity":2,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["spiribird_doubled",null],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[80,70,50,50,0,0,0],"maxSharpness":[80,70,50,90,10,0,0]},{"id":"13c","name":"Kulu Crusher","rarity":4,"endlineTag":"hr","attack":160,"affinity":20,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["spiribird_doubled",null],["affinity_boost_2","13b"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[80,80,70,60,10,0,0],"maxSharpness":[80,80,70,60,60,0,0]}]],["Paralysis Tree",[{"id":"14a","name":"Devil Masher I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["paralysis",10]],"rampSkills":[[["affinity_boost_3",null],["paralysis_boost_1",null],["anti_aquatic_species",null],["affinity_boost_2","13b"],["small_monster_exploit","13b"],["spiribird_doubled","13b"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[30,30,200,40,0,0,0],"maxSharpness":[30,30,200,70,20,0,0]},{"id":"14b","name":"Devil Masher II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["paralysis",14]],"rampSkills":[[["affinity_boost_3",null],["paralysis_boost_2",null],["anti_aquatic_species",null],["paralysis_boost_1","14a"],["affinity_boost_2","13b"],["small_monster_exploit","13b"],["spiribird_doubled","13b"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[20,20,200,60,0,0,0],"maxSharpness":[20,20,200,70,40,0,0]},{"id":"14c","name":"Iron Devil\'s Soul","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["paralysis",17]],"rampSkills":[[["affinity_boost_4",null],["paralysis_boost_3",null],["anti_aquatic_species",null],["affinity_boost_3","14b"],["paralysis_boost_2","14b"],["paralysis_boost_1","14a"],["affinity_boost_2","13b"],["small_monster_exploit","13b"],["spiribird_doubled","13b"],["attack_boost_1","8b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[30,30,200,90,0,0,0],"maxSharpness":[30,30,200,90,50,0,0]}]],["Arzuros Tree",[{"id":"15a","name":"Unbearable Hammer I","rarity":1,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_2",null],["small_monster_exploit",null],["affinity_boost_1","8a"]]],"baseSharpness":[140,30,30,0,0,0,0],"maxSharpness":[140,30,60,20,0,0,0]},{"id":"15b","name":"Unbearable Hammer II","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["small_monster_exploit",null],["attack_boost_1","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[110,40,50,0,0,0,0],"maxSharpness":[110,40,50,50,0,0,0]},{"id":"15c","name":"Barbearic Hammer","rarity":4,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["small_monster_exploit",null],["attack_boost_2","15b"],["attack_boost_1","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[130,30,80,60,0,0,0],"maxSharpness":[130,30,80,60,50,0,0]}]],["Somnacanth Tree",[{"id":"16a","name":"Frilled Blow I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",18]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["defense_boost_2","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[50,50,120,30,0,0,0],"maxSharpness":[50,50,120,80,0,0,0]},{"id":"16b","name":"Frilled Blow II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",21]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["defense_boost_2","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[40,40,120,50,0,0,0],"maxSharpness":[40,40,120,80,20,0,0]},{"id":"16c","name":"Illusory Frilled Blow","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",26]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","16b"],["defense_boost_2","15b"],["small_monster_exploit","15b"],["attack_boost_1","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[50,90,120,90,0,0,0],"maxSharpness":[50,90,120,100,40,0,0]}]],["Khezu Tree",[{"id":"17a","name":"Bag o\' Horrors I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",42]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","15a"],["defense_boost_2","15a"],["small_monster_exploit","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[70,60,40,30,0,0,0],"maxSharpness":[70,60,40,80,0,0,0]},{"id":"17b","name":"Bag o\' Horrors II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",43]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","15a"],["defense_boost_2","15a"],["small_monster_exploit","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[100,60,50,40,0,0,0],"maxSharpness":[100,60,50,80,10,0,0]},{"id":"17c","name":"Bag o\' Thunder","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",46]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_2","17b"],["thunder_boost_1","17b"],["attack_boost_1","15a"],["defense_boost_2","15a"],["small_monster_exploit","15a"],["affinity_boost_1","8a"]]],"baseSharpness":[100,40,70,70,20,0,0],"maxSharpness":[100,40,70,70,50,20,0]}]],["Ice Tree",[{"id":"18a","name":"Frozen Core I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",20]],"rampSkills":[[["defense_boost_2",null],["ice_boost_1",null],["buddy_rally",null],["attack_boost_1","8a"],["affinity_boost_1","8a"]]],"baseSharpness":[90,50,60,0,0,0,0],"maxSharpness":[90,50,90,20,0,0,0]},{"id":"18b","name":"Frozen Core II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",22]],"rampSkills":[[["defense_boost_2",null],["ice_boost_1",null],["buddy_rally",null],["attack_boost_1","8a"],["affinity_boost_1","8a"]]],"baseSharpness":[70,50,60,20,0,0,0],"maxSharpness":[70,50,60,70,0,0,0]},{"id":"18c","name":"Cocytus","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["ice",32]],"rampSkills":[[["defense_boost_3",null],["element_exploit",null],["buddy_rally",null],["defense_boost_2","18b"],["ice_boost_1","18b"],["attack_boost_1","8a"],["affinity_boost_1","8a"]]],"baseSharpness":[100,60,80,40,20,0,0],"maxSharpness":[100,60,80,40,60,10,0]}]],["Bone Tree",[{"id":"19a","name":"Bone Hammer I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0]},{"id":"19b","name":"Bone Hammer II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"19c","name":"Hard Bone Hammer","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","19b"]]],"baseSharpness":[90,90,70,0,0,0,0],"maxSharpness":[90,90,110,10,0,0,0]},{"id":"19d","name":"Bone Bludgeon I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[100,70,80,0,0,0,0],"maxSharpness":[100,70,80,50,0,0,0]},{"id":"19e","name":"Bone Bludgeon II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,110,40,0,0,0],"maxSharpness":[80,70,110,80,10,0,0]},{"id":"19f","name":"Heavy Bone Bludgeon","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","19e"],["attack_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,100,20,0,0]}]],["Diablos Tree",[{"id":"20a","name":"Diablos Hammer I","rarity":6,"endlineTag":"","attack":220,"affinity":-25,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_4","19f"],["dulling_strike","19f"],["attack_boost_3","19e"],["attack_boost_2","19d"],["affinity_boost_1","19b"]]],"baseSharpness":[50,160,30,100,10,0,0],"maxSharpness":[50,160,30,100,60,0,0]},{"id":"20b","name":"Diablos Hammer II","rarity":6,"endlineTag":"","attack":230,"affinity":-25,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","20a"],["attack_boost_4","19f"],["dulling_strike","19f"],["attack_boost_3","19e"],["attack_boost_2","19d"],["affinity_boost_1","19b"]]],"baseSharpness":[50,160,20,100,20,0,0],"maxSharpness":[50,160,20,100,70,0,0]},{"id":"20c","name":"Diablos Tail","rarity":7,"endlineTag":"hr","attack":240,"affinity":-25,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_2","20b"],["defense_boost_1","20a"],["attack_boost_4","19f"],["dulling_strike","19f"],["attack_boost_3","19e"],["attack_boost_2","19d"],["affinity_boost_1","19b"]]],"baseSharpness":[50,160,10,100,30,0,0],"maxSharpness":[50,160,10,100,70,10,0]}]],["Bone Tree 2",[{"id":"21a","name":"Cyclo-Hammer I","rarity":3,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["master_rider",null],["spiribird_doubled",null],["attack_boost_2","19d"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,50,50,0,0,0],"maxSharpness":[80,70,50,100,0,0,0]},{"id":"21b","name":"Cyclo-Hammer II","rarity":5,"endlineTag":"","attack":220,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["master_rider",null],["spiribird_doubled",null],["defense_boost_2","21a"],["attack_boost_2","19d"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,50,100,0,0,0],"maxSharpness":[80,70,50,130,20,0,0]},{"id":"21c","name":"Atlas Hammer","rarity":6,"endlineTag":"hr","attack":230,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["master_rider",null],["spiribird_doubled",null],["defense_boost_2","21a"],["attack_boost_2","19d"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,50,150,0,0,0],"maxSharpness":[80,70,50,160,40,0,0]}]],["Pukei-Pukei Tree",[{"id":"22a","name":"Pukei Hammer I","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["poison_boost_2",null],["master_rider","21a"],["spiribird_doubled","21a"],["attack_boost_2","19d"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,70,90,80,0,0,0],"maxSharpness":[60,70,90,100,30,0,0]},{"id":"22b","name":"Pukei Hammer II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",47]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["poison_boost_2",null],["master_rider","21a"],["spiribird_doubled","21a"],["attack_boost_2","19d"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,90,110,0,0,0],"maxSharpness":[80,70,90,120,40,0,0]},{"id":"22c","name":"Datura Club","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",54]],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["poison_boost_2",null],["attack_boost_3","22b"],["defense_boost_2","22b"],["master_rider","21a"],["spiribird_doubled","21a"],["attack_boost_2","19d"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,120,40,70,40,0,0],"maxSharpness":[80,120,40,70,90,0,0]}]],["Basarios Tree",[{"id":"23a","name":"Basarios Blow I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["attack_boost_2",null],["dulling_strike",null],["affinity_boost_1","19b"]]],"baseSharpness":[40,140,50,20,0,0,0],"maxSharpness":[40,140,50,70,0,0,0]},{"id":"23b","name":"Basarios Blow II","rarity":3,"endlineTag":"","attack":160,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["attack_boost_3",null],["dulling_strike",null],["attack_boost_2","23a"],["affinity_boost_1","19b"]]],"baseSharpness":[40,130,50,30,0,0,0],"maxSharpness":[40,130,50,70,10,0,0]},{"id":"23c","name":"Basarios Bash","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":20,"decoSlots":[1],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["attack_boost_3",null],["dulling_strike",null],["defense_boost_1","23b"],["attack_boost_2","23a"],["affinity_boost_1","19b"]]],"baseSharpness":[40,130,70,50,10,0,0],"maxSharpness":[40,130,70,50,50,10,0]}]],["Rathalos Tree",[{"id":"24a","name":"Red Bludgeon I","rarity":5,"endlineTag":"","attack":190,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["fire",27]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_2","23c"],["attack_boost_3","23c"],["dulling_strike","23c"],["defense_boost_1","23b"],["affinity_boost_1","19b"]]],"baseSharpness":[240,10,10,70,20,0,0],"maxSharpness":[240,10,10,70,70,0,0]},{"id":"24b","name":"Red Bludgeon II","rarity":6,"endlineTag":"","attack":200,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["fire",31]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_2","23c"],["attack_boost_3","23c"],["dulling_strike","23c"],["defense_boost_1","23b"],["affinity_boost_1","19b"]]],"baseSharpness":[230,10,10,70,30,0,0],"maxSharpness":[230,10,10,70,70,10,0]},{"id":"24c","name":"Huracan Hammer","rarity":6,"endlineTag":"hr","attack":210,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["fire",34]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","24b"],["defense_boost_2","23c"],["dulling_strike","23c"],["defense_boost_1","23b"],["affinity_boost_1","19b"]]],"baseSharpness":[220,10,10,70,40,0,0],"maxSharpness":[220,10,10,70,70,20,0]}]],["Goss Harag Tree",[{"id":"25a","name":"Yeti Hammer I","rarity":3,"endlineTag":"","attack":170,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["ice",13]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_1",null],["brutal_strike",null],["defense_boost_1","23a"],["attack_boost_2","23a"],["dulling_strike","23a"]]],"baseSharpness":[100,30,90,30,0,0,0],"maxSharpness":[100,30,90,70,10,0,0]},{"id":"25b","name":"Yeti Hammer II","rarity":5,"endlineTag":"","attack":190,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",15]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","25a"],["defense_boost_1","23a"],["attack_boost_2","23a"],["dulling_strike","23a"]]],"baseSharpness":[100,30,110,40,20,0,0],"maxSharpness":[100,30,110,40,70,0,0]},{"id":"25c","name":"Yeti Hammer III","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",17]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","25a"],["defense_boost_1","23a"],["attack_boost_2","23a"],["dulling_strike","23a"]]],"baseSharpness":[100,30,100,40,30,0,0],"maxSharpness":[100,30,100,40,80,0,0]},{"id":"25d","name":"Abominable Hammer","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",20]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_3",null],["brutal_strike",null],["ice_boost_2","25c"],["ice_boost_1","25a"],["defense_boost_1","23a"],["attack_boost_2","23a"],["dulling_strike","23a"]]],"baseSharpness":[100,30,90,50,30,0,0],"maxSharpness":[100,30,90,50,70,10,0]}]],["Zinogre Tree",[{"id":"26a","name":"Usurper\'s Thunder I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",25]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["defense_boost_1","23a"],["attack_boost_2","23a"],["dulling_strike","23a"],["affinity_boost_1","19b"]]],"baseSharpness":[70,40,90,50,0,0,0],"maxSharpness":[70,40,90,100,0,0,0]},{"id":"26b","name":"Usurper\'s Thunder II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",28]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","26a"],["defense_boost_1","23a"],["dulling_strike","23a"],["affinity_boost_1","19b"]]],"baseSharpness":[70,40,70,90,30,0,0],"maxSharpness":[70,40,70,90,80,0,0]},{"id":"26c","name":"Despot\'s Crackle","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",33]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","26b"],["attack_boost_1","26a"],["defense_boost_1","23a"],["dulling_strike","23a"],["affinity_boost_1","19b"]]],"baseSharpness":[70,40,100,100,40,0,0],"maxSharpness":[70,40,100,100,50,40,0]}]],["Remobra Tree",[{"id":"27a","name":"Calamitous Portent I","rarity":2,"endlineTag":"","attack":110,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["poison",12]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["dulling_strike",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[90,60,80,20,0,0,0],"maxSharpness":[90,60,80,70,0,0,0]},{"id":"27b","name":"Calamitous Portent II","rarity":3,"endlineTag":"","attack":120,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["poison",14]],"rampSkills":[[["attack_boost_3",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","27a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[120,50,50,30,0,0,0],"maxSharpness":[120,50,50,70,10,0,0]},{"id":"27c","name":"Catastrophic Portent","rarity":4,"endlineTag":"hr","attack":170,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["poison",16]],"rampSkills":[[["attack_boost_3",null],["poison_boost_2",null],["dulling_strike",null],["poison_boost_1","27b"],["attack_boost_2","27a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[130,60,50,50,10,0,0],"maxSharpness":[130,60,50,50,40,20,0]}]],["Royal Ludroth Tree",[{"id":"28a","name":"Droth Splashhammer I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",25]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[40,40,90,30,0,0,0],"maxSharpness":[40,40,90,80,0,0,0]},{"id":"28b","name":"Droth Splashhammer II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",31]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,60,100,40,0,0,0],"maxSharpness":[50,60,100,90,0,0,0]},{"id":"28c","name":"Ludroth Dousehammer","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",37]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","28b"],["water_boost_1","28b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[60,40,120,60,20,0,0],"maxSharpness":[60,40,120,60,50,20,0]}]],["Izuchi Tree",[{"id":"29a","name":"Izuchi Hammer I","rarity":1,"endlineTag":"","attack":70,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[30,70,100,0,0,0,0],"maxSharpness":[30,70,140,10,0,0,0]},{"id":"29b","name":"Izuchi Hammer II","rarity":1,"endlineTag":"","attack":90,"affinity":12,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","29a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[30,60,80,30,0,0,0],"maxSharpness":[30,60,80,80,0,0,0]},{"id":"29c","name":"Snapper Hammer","rarity":4,"endlineTag":"hr","attack":160,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","29b"],["affinity_boost_1","29a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[30,80,50,70,20,0,0],"maxSharpness":[30,80,50,70,70,0,0]}]],["Nargacuga Tree",[{"id":"30a","name":"Hidden Breaker I","rarity":3,"endlineTag":"","attack":130,"affinity":40,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["defense_boost_1","19a"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0]},{"id":"30b","name":"Hidden Breaker II","rarity":5,"endlineTag":"","attack":170,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","30a"],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["defense_boost_1","19a"]]],"baseSharpness":[100,30,70,100,50,0,0],"maxSharpness":[100,30,70,100,80,20,0]},{"id":"30c","name":"Night Eternal","rarity":6,"endlineTag":"hr","attack":180,"affinity":45,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","30b"],["attack_boost_2","30a"],["small_monster_exploit","29b"],["buddy_rally","29b"],["defense_boost_1","19a"]]],"baseSharpness":[70,40,120,90,60,20,0],"maxSharpness":[70,40,120,90,60,20,0]}]],["Barroth Tree",[{"id":"31a","name":"Carapace Hammer I","rarity":2,"endlineTag":"","attack":120,"affinity":-10,"defense":5,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["attack_boost_2","19a"]]],"baseSharpness":[50,60,140,0,0,0,0],"maxSharpness":[50,60,140,50,0,0,0]},{"id":"31b","name":"Carapace Hammer II","rarity":3,"endlineTag":"","attack":150,"affinity":-10,"defense":8,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["dulling_strike",null],["defense_boost_1","31a"],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["attack_boost_2","19a"]]],"baseSharpness":[60,60,160,20,0,0,0],"maxSharpness":[60,60,160,60,10,0,0]},{"id":"31c","name":"Barroth Hammer","rarity":5,"endlineTag":"hr","attack":200,"affinity":-5,"defense":10,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["dulling_strike",null],["affinity_boost_1","31b"],["defense_boost_1","31a"],["small_monster_exploit","29b"],["buddy_rally","29b"],["attack_boost_2","19a"]]],"baseSharpness":[60,60,180,50,0,0,0],"maxSharpness":[60,60,180,50,30,20,0]}]],["Magnamalo Tree",[{"id":"32a","name":"Sinister Hammer I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",15]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0]},{"id":"32b","name":"Sinister Hammer II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",18]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","32a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0]},{"id":"32c","name":"Sinister Shade Hammer","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",25]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","32b"],["attack_boost_2","32a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0]}]],["Gargwa Tree",[{"id":"33a","name":"Egg Hammer I","rarity":4,"endlineTag":"","attack":200,"affinity":-30,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["wyvern_exploit",null],["anti_aerial_species",null],["anti_aquatic_species",null]]],"baseSharpness":[50,100,100,0,0,0,0],"maxSharpness":[50,100,140,10,0,0,0]},{"id":"33b","name":"Egg Hammer II","rarity":5,"endlineTag":"","attack":240,"affinity":-30,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["wyvern_exploit",null],["anti_aerial_species",null],["anti_aquatic_species",null]]],"baseSharpness":[50,100,150,0,0,0,0],"maxSharpness":[50,100,180,20,0,0,0]},{"id":"33c","name":"Gargwa Hammer","rarity":6,"endlineTag":"hr","attack":260,"affinity":-30,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["wyvern_exploit",null],["anti_aerial_species",null],["anti_aquatic_species",null]]],"baseSharpness":[50,100,200,0,0,0,0],"maxSharpness":[50,100,230,10,10,0,0]}]],["Rajang Tree",[{"id":"34a","name":"Mane Malice I","rarity":5,"endlineTag":"","attack":190,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["thunder",11]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,130,0,0,0]},{"id":"34b","name":"Mane Malice II","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":0,"decoSlots":[3],"eleStat":[["thunder",13]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","34a"]]],"baseSharpness":[50,50,100,100,0,0,0],"maxSharpness":[50,50,100,100,50,0,0]},{"id":"34c","name":"Mane Malice Rajang","rarity":7,"endlineTag":"hr","attack":230,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",16]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","34b"],["thunder_boost_1","34a"]]],"baseSharpness":[50,50,80,120,0,0,0],"maxSharpness":[50,50,80,120,30,20,0]}]],["Ibushi Tree",[{"id":"35a","name":"Azure Elder Hammer I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",15]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0]},{"id":"35b","name":"Azure Elder Hammer II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",16]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","35a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0]},{"id":"35c","name":"Abyssal Gale Mauler","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",17]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","35b"],["defense_boost_1","35a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0]}]],["Narwa Tree",[{"id":"36a","name":"Thunderbolt Hammer I","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",47]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0]},{"id":"36b","name":"Abyssal Storm Mauler","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",49]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","36a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0]}]],["Kushala Daora Tree",[{"id":"37a","name":"Gelosteel Hammer I","rarity":6,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",36]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[70,40,110,90,40,0,0],"maxSharpness":[70,40,110,90,60,30,0]},{"id":"37b","name":"Daora\'s Colossus","rarity":7,"endlineTag":"hr","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",42]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","37a"],["affinity_boost_2","37a"]]],"baseSharpness":[80,110,70,40,40,10,0],"maxSharpness":[80,110,70,40,40,60,0]}]],["Teostra Tree",[{"id":"38a","name":"Teostra Cratermaker I","rarity":6,"endlineTag":"","attack":180,"affinity":5,"defense":0,"decoSlots":[1,1],"eleStat":[["blast",40]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[150,20,50,90,40,0,0],"maxSharpness":[150,20,50,90,80,10,0]},{"id":"38b","name":"Teostra Cratergouger","rarity":7,"endlineTag":"hr","attack":190,"affinity":5,"defense":0,"decoSlots":[1,1],"eleStat":[["blast",46]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","38a"]]],"baseSharpness":[160,20,30,90,50,0,0],"maxSharpness":[160,20,30,90,80,20,0]}]],["Chameleos Tree",[{"id":"39a","name":"Genie\'s Expanse I","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["poison",28]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[100,30,80,90,50,0,0],"maxSharpness":[100,30,80,90,50,50,0]},{"id":"39b","name":"Diamalto\'s Dream","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["poison",32]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","39a"]]],"baseSharpness":[70,30,100,90,50,10,0],"maxSharpness":[70,30,100,90,50,60,0]}]],["Valstrax Tree",[{"id":"40a","name":"Redwing Drill I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",40]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0]},{"id":"40b","name":"Reddnaught Hammer","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",43]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0]}]],["Guild Tree",[{"id":"41a","name":"Teddybear I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",30]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["silkbind_boost",null]]],"baseSharpness":[50,20,120,60,0,0,0],"maxSharpness":[50,20,120,110,0,0,0]},{"id":"41b","name":"Teddybear II","rarity":4,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["sleep",34]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_2","41a"]]],"baseSharpness":[50,20,130,60,40,0,0],"maxSharpness":[50,20,130,60,90,0,0]},{"id":"41c","name":"Sleepy Bear","rarity":5,"endlineTag":"hr","attack":130,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["sleep",38]],"rampSkills":[[["affinity_boost_4",null],["defense_boost_3",null],["silkbind_boost",null],["affinity_boost_3","41b"],["defense_boost_2","41b"],["affinity_boost_2","41a"]]],"baseSharpness":[50,20,190,60,40,40,0],"maxSharpness":[50,20,190,60,40,40,0]}]],["Death Stench Tree",[{"id":"42a","name":"Graceful Death I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":3,"decoSlots":[],"eleStat":[["dragon",18]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_1",null],["wyvern_exploit",null]]],"baseSharpness":[50,70,70,60,0,0,0],"maxSharpness":[50,70,70,110,0,0,0]},{"id":"42b","name":"Graceful Death II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[["dragon",22]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_1",null],["wyvern_exploit",null],["attack_boost_2","42a"]]],"baseSharpness":[30,70,80,70,0,0,0],"maxSharpness":[30,70,80,120,0,0,0]},{"id":"42c","name":"Graceful Death III","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":8,"decoSlots":[2,2],"eleStat":[["dragon",29]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["wyvern_exploit",null],["dragon_boost_1","42b"],["attack_boost_2","42a"]]],"baseSharpness":[20,100,100,80,0,0,0],"maxSharpness":[20,100,100,80,50,0,0]},{"id":"42d","name":"Yadora Morte","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":10,"decoSlots":[2,2],"eleStat":[["dragon",34]],"rampSkills":[[["attack_boost_4",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_3","42c"],["dragon_boost_1","42b"],["attack_boost_2","42a"]]],"baseSharpness":[200,20,20,100,10,0,0],"maxSharpness":[200,20,20,100,50,10,0]}]],["Mosgharl Tree",[{"id":"43a","name":"Pumpking I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",8]],"rampSkills":[[["defense_boost_2",null],["master_rider",null],["spiribird_doubled",null]]],"baseSharpness":[80,100,30,40,0,0,0],"maxSharpness":[80,100,30,90,0,0,0]},{"id":"43b","name":"Pumpking II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",11]],"rampSkills":[[["defense_boost_2",null],["master_rider",null],["spiribird_doubled",null]]],"baseSharpness":[80,100,20,50,0,0,0],"maxSharpness":[80,100,20,80,20,0,0]},{"id":"43c","name":"Jack-\'o-lantern King","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["fire",14]],"rampSkills":[[["defense_boost_3",null],["master_rider",null],["spiribird_doubled",null],["defense_boost_2","43b"]]],"baseSharpness":[80,100,40,60,20,0,0],"maxSharpness":[80,100,40,60,60,10,0]}]],["Rampage Tree",[{"id":"ra","name":"Rampage Hammer I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"rb","name":"Rampage Hammer II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"rc","name":"Rampage Hammer III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"rd","name":"Rampage Hammer IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0]},{"id":"re","name":"Rampage Hammer V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0]},{"id":"rf","name":"Rampage Hammer S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_3",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["elemental_boost_2","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_4",null],["water_4",null],["thunder_4",null],["ice_4",null],["dragon_4",null],["poison_3",null],["paralysis_3",null],["sleep_3",null],["blast_3",null],["fire_3","re"],["water_3","re"],["thunder_3","re"],["ice_3","re"],["dragon_3","re"],["poison_2","re"],["paralysis_2","re"],["sleep_2","re"],["blast_2","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0]}]]]}';
 
-export const hammersArray: Readonly<Hammer[]> = [
-    __generated_hammer__1a,
-    __generated_hammer__1b,
-    __generated_hammer__1c,
-    __generated_hammer__1d,
-    __generated_hammer__1e,
-    __generated_hammer__1f,
-    __generated_hammer__2a,
-    __generated_hammer__2b,
-    __generated_hammer__2c,
-    __generated_hammer__3a,
-    __generated_hammer__3b,
-    __generated_hammer__3c,
-    __generated_hammer__4a,
-    __generated_hammer__4b,
-    __generated_hammer__4c,
-    __generated_hammer__5a,
-    __generated_hammer__5b,
-    __generated_hammer__5c,
-    __generated_hammer__6a,
-    __generated_hammer__6b,
-    __generated_hammer__6c,
-    __generated_hammer__7a,
-    __generated_hammer__7b,
-    __generated_hammer__7c,
-    __generated_hammer__8a,
-    __generated_hammer__8b,
-    __generated_hammer__8c,
-    __generated_hammer__8d,
-    __generated_hammer__8e,
-    __generated_hammer__8f,
-    __generated_hammer__9a,
-    __generated_hammer__9b,
-    __generated_hammer__9c,
-    __generated_hammer__10a,
-    __generated_hammer__10b,
-    __generated_hammer__10c,
-    __generated_hammer__11a,
-    __generated_hammer__11b,
-    __generated_hammer__11c,
-    __generated_hammer__12a,
-    __generated_hammer__12b,
-    __generated_hammer__12c,
-    __generated_hammer__13a,
-    __generated_hammer__13b,
-    __generated_hammer__13c,
-    __generated_hammer__14a,
-    __generated_hammer__14b,
-    __generated_hammer__14c,
-    __generated_hammer__15a,
-    __generated_hammer__15b,
-    __generated_hammer__15c,
-    __generated_hammer__16a,
-    __generated_hammer__16b,
-    __generated_hammer__16c,
-    __generated_hammer__17a,
-    __generated_hammer__17b,
-    __generated_hammer__17c,
-    __generated_hammer__18a,
-    __generated_hammer__18b,
-    __generated_hammer__18c,
-    __generated_hammer__19a,
-    __generated_hammer__19b,
-    __generated_hammer__19c,
-    __generated_hammer__19d,
-    __generated_hammer__19e,
-    __generated_hammer__19f,
-    __generated_hammer__20a,
-    __generated_hammer__20b,
-    __generated_hammer__20c,
-    __generated_hammer__21a,
-    __generated_hammer__21b,
-    __generated_hammer__21c,
-    __generated_hammer__22a,
-    __generated_hammer__22b,
-    __generated_hammer__22c,
-    __generated_hammer__23a,
-    __generated_hammer__23b,
-    __generated_hammer__23c,
-    __generated_hammer__24a,
-    __generated_hammer__24b,
-    __generated_hammer__24c,
-    __generated_hammer__25a,
-    __generated_hammer__25b,
-    __generated_hammer__25c,
-    __generated_hammer__25d,
-    __generated_hammer__26a,
-    __generated_hammer__26b,
-    __generated_hammer__26c,
-    __generated_hammer__27a,
-    __generated_hammer__27b,
-    __generated_hammer__27c,
-    __generated_hammer__28a,
-    __generated_hammer__28b,
-    __generated_hammer__28c,
-    __generated_hammer__29a,
-    __generated_hammer__29b,
-    __generated_hammer__29c,
-    __generated_hammer__30a,
-    __generated_hammer__30b,
-    __generated_hammer__30c,
-    __generated_hammer__31a,
-    __generated_hammer__31b,
-    __generated_hammer__31c,
-    __generated_hammer__32a,
-    __generated_hammer__32b,
-    __generated_hammer__32c,
-    __generated_hammer__33a,
-    __generated_hammer__33b,
-    __generated_hammer__33c,
-    __generated_hammer__34a,
-    __generated_hammer__34b,
-    __generated_hammer__34c,
-    __generated_hammer__35a,
-    __generated_hammer__35b,
-    __generated_hammer__35c,
-    __generated_hammer__36a,
-    __generated_hammer__36b,
-    __generated_hammer__37a,
-    __generated_hammer__37b,
-    __generated_hammer__38a,
-    __generated_hammer__38b,
-    __generated_hammer__39a,
-    __generated_hammer__39b,
-    __generated_hammer__40a,
-    __generated_hammer__40b,
-    __generated_hammer__41a,
-    __generated_hammer__41b,
-    __generated_hammer__41c,
-    __generated_hammer__42a,
-    __generated_hammer__42b,
-    __generated_hammer__42c,
-    __generated_hammer__42d,
-    __generated_hammer__43a,
-    __generated_hammer__43b,
-    __generated_hammer__43c,
-    __generated_hammer__ra,
-    __generated_hammer__rb,
-    __generated_hammer__rc,
-    __generated_hammer__rd,
-    __generated_hammer__re,
-    __generated_hammer__rf,
-];
+export const hammersArray: Readonly<Hammer[]> = loadWeaponPayload<Hammer>(payload);
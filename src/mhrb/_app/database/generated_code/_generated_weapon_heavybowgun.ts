@@ -36,10877 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type HeavyBowgun,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__add_normal_ammo_1,
-    __generated_ramp__add_normal_ammo_2,
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__cluster_effect_1,
-    __generated_ramp__cluster_effect_2,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_effect_1,
-    __generated_ramp__dragon_effect_2,
-    __generated_ramp__exhaust_effect_1,
-    __generated_ramp__exhaust_effect_2,
-    __generated_ramp__fire_effect_1,
-    __generated_ramp__fire_effect_2,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_effect_1,
-    __generated_ramp__ice_effect_2,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__normal_effect_1,
-    __generated_ramp__normal_effect_2,
-    __generated_ramp__paralysis_effect_1,
-    __generated_ramp__paralysis_effect_2,
-    __generated_ramp__pierce_effect_1,
-    __generated_ramp__pierce_effect_2,
-    __generated_ramp__poison_effect_1,
-    __generated_ramp__poison_effect_2,
-    __generated_ramp__recoil_down_boost,
-    __generated_ramp__recoil_down_surge,
-    __generated_ramp__reload_speed_boost,
-    __generated_ramp__reload_speed_surge,
-    __generated_ramp__shrapnel_effect_1,
-    __generated_ramp__shrapnel_effect_2,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_effect_1,
-    __generated_ramp__sleep_effect_2,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__special_wyvernheart,
-    __generated_ramp__special_wyvernsnipe,
-    __generated_ramp__spread_effect_1,
-    __generated_ramp__spread_effect_2,
-    __generated_ramp__steadiness_boost,
-    __generated_ramp__steadiness_surge,
-    __generated_ramp__sticky_effect_1,
-    __generated_ramp__sticky_effect_2,
-    __generated_ramp__stickycluster_effect_1,
-    __generated_ramp__stickycluster_effect_2,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_effect_1,
-    __generated_ramp__thunder_effect_2,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_effect_1,
-    __generated_ramp__water_effect_2,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_heavybowgun__1a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "1a",
-
-    name: "Kamura H. Bowgun I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamurah.bowguni",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_heavybowgun__1b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "1b",
-
-    name: "Kamura H. Bowgun II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamurah.bowgunii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_heavybowgun__1c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "1c",
-
-    name: "Kamura H. Bowgun III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamurah.bowguniii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_heavybowgun__1d: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "1d",
-
-    name: "Kamura H. Bowgun IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamurah.bowguniv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_heavybowgun__1e: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "1e",
-
-    name: "Kamura H. Bowgun V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__1d],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1d],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamurah.bowgunv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_heavybowgun__1f: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "1f",
-
-    name: "Kamura Ninja H. Bowgun",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_heavybowgun__1e],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__1d],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1d],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjah.bowgun",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_heavybowgun__2a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "2a",
-
-    name: "Tigrex Howl I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 1},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexhowli",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_heavybowgun__2b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "2b",
-
-    name: "Tigrex Howl II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__cluster_effect_2, null],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexhowlii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_heavybowgun__2c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "2c",
-
-    name: "Tigrex Skull",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__cluster_effect_2, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__2b],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 5},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexskull",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_heavybowgun__3a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "3a",
-
-    name: "Cirrus Blaster I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 3},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "cirrusblasteri",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_heavybowgun__3b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "3b",
-
-    name: "Cirrus Blaster II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__3a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 3},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "cirrusblasterii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_heavybowgun__3c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "3c",
-
-    name: "Mountainous Roar",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__3b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__3a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 5},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 3},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "mountainousroar",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_heavybowgun__4a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "4a",
-
-    name: "Reversal Shot I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reversalshoti",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_heavybowgun__4b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "4b",
-
-    name: "Reversal Shot II",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reversalshotii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_heavybowgun__4c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "4c",
-
-    name: "Reversal Shot III",
-    treeName: "Tetranadon Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 17,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reversalshotiii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_heavybowgun__4d: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "4d",
-
-    name: "Reversal Barrage",
-    treeName: "Tetranadon Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__cluster_effect_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: true, ammoCapacity: 6},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 5},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reversalbarrage",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_heavybowgun__5a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "5a",
-
-    name: "Queen's Longfire I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4a],
-            [__generated_ramp__waterblight_exploit, __generated_heavybowgun__4a],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "queen'slongfirei",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_heavybowgun__5b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "5b",
-
-    name: "Queen's Longfire II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__5a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4a],
-            [__generated_ramp__waterblight_exploit, __generated_heavybowgun__4a],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "queen'slongfireii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_heavybowgun__5c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "5c",
-
-    name: "Queen's Farflier",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__5b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__5a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4a],
-            [__generated_ramp__waterblight_exploit, __generated_heavybowgun__4a],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 8},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "queen'sfarflier",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_heavybowgun__6a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "6a",
-
-    name: "Guerrera Cannon I",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__5b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__5b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__5a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4a],
-            [__generated_ramp__waterblight_exploit, __generated_heavybowgun__4a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: false, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 4},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "guerreracannoni",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_heavybowgun__6b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "6b",
-
-    name: "Guerrera Cannon II",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__6a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__5b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__5b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__5a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4a],
-            [__generated_ramp__waterblight_exploit, __generated_heavybowgun__4a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: false, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 4},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "guerreracannonii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_heavybowgun__6c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "6c",
-
-    name: "Thorn Cannon",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_heavybowgun__6b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__6a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__5b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__5b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__5a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__4a],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__4a],
-            [__generated_ramp__waterblight_exploit, __generated_heavybowgun__4a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: false, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 7},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 6},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 5},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "thorncannon",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_heavybowgun__7a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "7a",
-
-    name: "Arzuros Gun I",
-    treeName: "Arzuros Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosguni",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_heavybowgun__7b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "7b",
-
-    name: "Arzuros Gun II",
-    treeName: "Arzuros Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__7a],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosgunii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_heavybowgun__7c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "7c",
-
-    name: "Arzuros Fishergun",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__7b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__7b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__7a],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosfishergun",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_heavybowgun__8a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "8a",
-
-    name: "Usurper's Tremor I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__7b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__7b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: false, ammoCapacity: 7},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'stremori",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_heavybowgun__8b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "8b",
-
-    name: "Usurper's Tremor II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__8a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__7b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__7b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 8},
-            normal_3: {available: false, ammoCapacity: 7},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 3},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'stremorii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_heavybowgun__8c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "8c",
-
-    name: "Despot's Paroxysm",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__8b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__8a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__7b],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__7b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 8},
-            normal_3: {available: true, ammoCapacity: 7},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 5},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 3},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "despot'sparoxysm",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_heavybowgun__9a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "9a",
-
-    name: "Iron Assault I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ironassaulti",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_heavybowgun__9b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "9b",
-
-    name: "Iron Assault II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ironassaultii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_heavybowgun__9c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "9c",
-
-    name: "Steel Assault",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: false, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "steelassault",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_heavybowgun__9d: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "9d",
-
-    name: "Striker's Bowgun I",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9c],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "striker'sbowguni",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_heavybowgun__9e: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "9e",
-
-    name: "Striker's Bowgun II",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9d],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9c],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "striker'sbowgunii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_heavybowgun__9f: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "9f",
-
-    name: "Elite Bowgun",
-    treeName: "Ore Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9d],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9c],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "elitebowgun",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_heavybowgun__10a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "10a",
-
-    name: "Flammenkanone I",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_3, __generated_heavybowgun__9e],
-            [__generated_ramp__silkbind_boost, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9d],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flammenkanonei",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_heavybowgun__10b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "10b",
-
-    name: "Flammenkanone II",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_3, __generated_heavybowgun__9e],
-            [__generated_ramp__silkbind_boost, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9d],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 6},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flammenkanoneii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_heavybowgun__10c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "10c",
-
-    name: "Gnashing Flammenkanone",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__10b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_3, __generated_heavybowgun__9e],
-            [__generated_ramp__silkbind_boost, __generated_heavybowgun__9e],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9d],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 5,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 7},
-            spread_2: {available: true, ammoCapacity: 6},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 6},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "gnashingflammenkanone",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_heavybowgun__11a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "11a",
-
-    name: "Meteor Bazooka I",
-    treeName: "Ore Tree 2",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "meteorbazookai",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_heavybowgun__11b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "11b",
-
-    name: "Meteor Bazooka II",
-    treeName: "Ore Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "meteorbazookaii",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_heavybowgun__11c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "11c",
-
-    name: "Meteor Cannon",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__attack_boost_3, __generated_heavybowgun__11b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 4},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: true, ammoCapacity: 3},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "meteorcannon",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_heavybowgun__12a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "12a",
-
-    name: "Rock Eater I",
-    treeName: "Basarios Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__11a],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__11a],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rockeateri",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_heavybowgun__12b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "12b",
-
-    name: "Rock Eater II",
-    treeName: "Basarios Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__12a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__11a],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__11a],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 4},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rockeaterii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_heavybowgun__12c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "12c",
-
-    name: "Earth Eater",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__12b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__12a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__11a],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__11a],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 5},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "eartheater",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_heavybowgun__13a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "13a",
-
-    name: "Marino Burst I",
-    treeName: "Rhenoplos Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "marinobursti",
-        treeNameLower: "rhenoplostree",
-    },
-};
-
-const __generated_heavybowgun__13b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "13b",
-
-    name: "Marino Burst II",
-    treeName: "Rhenoplos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "marinoburstii",
-        treeNameLower: "rhenoplostree",
-    },
-};
-
-const __generated_heavybowgun__13c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "13c",
-
-    name: "Marino Cannon",
-    treeName: "Rhenoplos Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__13b],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__13b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 3},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "marinocannon",
-        treeNameLower: "rhenoplostree",
-    },
-};
-
-const __generated_heavybowgun__14a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "14a",
-
-    name: "Carom Shot I",
-    treeName: "Volvidon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "caromshoti",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_heavybowgun__14b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "14b",
-
-    name: "Carom Shot II",
-    treeName: "Volvidon Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__14a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "caromshotii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_heavybowgun__14c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "14c",
-
-    name: "Rebound Shot",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__14b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__14b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__14a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__13a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 6},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 5},
-            paralysis_2: {available: true, ammoCapacity: 4},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reboundshot",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_heavybowgun__15a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "15a",
-
-    name: "Wind Thief Crossbow I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefcrossbowi",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_heavybowgun__15b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "15b",
-
-    name: "Wind Thief Crossbow II",
-    treeName: "Izuchi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__15a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefcrossbowii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_heavybowgun__15c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "15c",
-
-    name: "Wind Thief Crossbow III",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__15b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__15a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefcrossbowiii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_heavybowgun__15d: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "15d",
-
-    name: "Gale Crossbow",
-    treeName: "Izuchi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_3, __generated_heavybowgun__15c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__15b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__15a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "galecrossbow",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_heavybowgun__16a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "16a",
-
-    name: "Fulgent Shot I",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_3, __generated_heavybowgun__15c],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__15c],
-            [__generated_ramp__buddy_rally, __generated_heavybowgun__15c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__15b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__15a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 4},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "fulgentshoti",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_heavybowgun__16b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "16b",
-
-    name: "Fulgent Shot II",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_3, __generated_heavybowgun__15c],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__15c],
-            [__generated_ramp__buddy_rally, __generated_heavybowgun__15c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__15b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__15a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 5},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "fulgentshotii",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_heavybowgun__16c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "16c",
-
-    name: "Araknamortar",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_heavybowgun__16b],
-            [__generated_ramp__affinity_boost_3, __generated_heavybowgun__15c],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__15c],
-            [__generated_ramp__buddy_rally, __generated_heavybowgun__15c],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__15b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__15a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 5},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "araknamortar",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_heavybowgun__17a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "17a",
-
-    name: "Bone Shooter I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "boneshooteri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_heavybowgun__17b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "17b",
-
-    name: "Bone Shooter II",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "boneshooterii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_heavybowgun__17c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "17c",
-
-    name: "Bone Buster",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bonebuster",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_heavybowgun__17d: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "17d",
-
-    name: "Pukei Launcher I",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 1},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "pukeilauncheri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_heavybowgun__17e: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "17e",
-
-    name: "Pukei Launcher II",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17d],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 1},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "pukeilauncherii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_heavybowgun__17f: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "17f",
-
-    name: "Venomhail",
-    treeName: "Bone Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__17e],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17d],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17c],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 6},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 1},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "venomhail",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_heavybowgun__18a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "18a",
-
-    name: "Anteka Burst I",
-    treeName: "Anteka Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "antekabursti",
-        treeNameLower: "antekatree",
-    },
-};
-
-const __generated_heavybowgun__18b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "18b",
-
-    name: "Anteka Burst II",
-    treeName: "Anteka Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__18a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "antekaburstii",
-        treeNameLower: "antekatree",
-    },
-};
-
-const __generated_heavybowgun__18c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "18c",
-
-    name: "Anteka Blaster",
-    treeName: "Anteka Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__18a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "antekablaster",
-        treeNameLower: "antekatree",
-    },
-};
-
-const __generated_heavybowgun__19a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "19a",
-
-    name: "Dual Threat I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__18b],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "dualthreati",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_heavybowgun__19b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "19b",
-
-    name: "Dual Threat II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 240,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__19a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__19a],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "dualthreatii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_heavybowgun__19c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "19c",
-
-    name: "Diablazooka",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 250,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__19a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__19a],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__18b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "diablazooka",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_heavybowgun__20a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "20a",
-
-    name: "Kadachi Cannon I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: false, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 2},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kadachicannoni",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_heavybowgun__20b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "20b",
-
-    name: "Kadachi Cannon II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__20a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: false, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 2},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 4},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kadachicannonii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_heavybowgun__20c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "20c",
-
-    name: "Kadachi Raijodo",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__20b],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__20b],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__20a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: false, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 8},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 4},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kadachiraijodo",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_heavybowgun__21a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "21a",
-
-    name: "Rapidcaster I",
-    treeName: "Kelbi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rapidcasteri",
-        treeNameLower: "kelbitree",
-    },
-};
-
-const __generated_heavybowgun__21b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "21b",
-
-    name: "Rapidcaster II",
-    treeName: "Kelbi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rapidcasterii",
-        treeNameLower: "kelbitree",
-    },
-};
-
-const __generated_heavybowgun__21c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "21c",
-
-    name: "Cyclecaster",
-    treeName: "Kelbi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "cyclecaster",
-        treeNameLower: "kelbitree",
-    },
-};
-
-const __generated_heavybowgun__22a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "22a",
-
-    name: "Hidden Gambit I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_2, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 1},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hiddengambiti",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_heavybowgun__22b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "22b",
-
-    name: "Hidden Gambit II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__22a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_2, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 1},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hiddengambitii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_heavybowgun__22c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "22c",
-
-    name: "Baleful Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__22b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__22a],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_2, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 1},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "balefulnight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_heavybowgun__23a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "23a",
-
-    name: "Highpriest Bowgun I",
-    treeName: "Bishaten Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__normal_effect_2, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "highpriestbowguni",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_heavybowgun__23b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "23b",
-
-    name: "Highpriest Bowgun II",
-    treeName: "Bishaten Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__23a],
-            [__generated_ramp__normal_effect_2, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "highpriestbowgunii",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_heavybowgun__23c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "23c",
-
-    name: "Bishaten's Grace",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__23b],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__23b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__23a],
-            [__generated_ramp__normal_effect_2, __generated_heavybowgun__21b],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__21b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__21a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 4},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 4},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bishaten'sgrace",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_heavybowgun__24a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "24a",
-
-    name: "Spheniscine Slayer I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__17a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "spheniscineslayeri",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_heavybowgun__24b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "24b",
-
-    name: "Spheniscine Slayer II",
-    treeName: "Lagombi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__24a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "spheniscineslayerii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_heavybowgun__24c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "24c",
-
-    name: "Spheniscine Ruler",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__small_monster_exploit, __generated_heavybowgun__24b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__24a],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__17a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__17a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 7},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 5},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 5},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 3},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "spheniscineruler",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_heavybowgun__25a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "25a",
-
-    name: "Sinister Volley I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinistervolleyi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_heavybowgun__25b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "25b",
-
-    name: "Sinister Volley II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__25a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 2},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 4},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinistervolleyii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_heavybowgun__25c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "25c",
-
-    name: "Sinister Dreadvolley",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__cluster_effect_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__25b],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__25a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 5,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: true, ammoCapacity: 5},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 2},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 3},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 3},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 5},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterdreadvolley",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_heavybowgun__26a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "26a",
-
-    name: "Rajang Shooter I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rajangshooteri",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_heavybowgun__26b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "26b",
-
-    name: "Rajang Shooter II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__26a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rajangshooterii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_heavybowgun__26c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "26c",
-
-    name: "Rajang's Rage",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__sticky_effect_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__sticky_effect_1, __generated_heavybowgun__26b],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__26a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rajang'srage",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_heavybowgun__27a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "27a",
-
-    name: "Azure Elder Cannon I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 2},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureeldercannoni",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_heavybowgun__27b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "27b",
-
-    name: "Azure Elder Cannon II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__27a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__27a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 2},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureeldercannonii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_heavybowgun__27c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "27c",
-
-    name: "Abyssal Gale Barrage",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__27a],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__27a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 7},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 3},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgalebarrage",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_heavybowgun__28a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "28a",
-
-    name: "Thunderbolt Cannon I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 6},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 4},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltcannoni",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_heavybowgun__28b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "28b",
-
-    name: "Abyssal Storm Barrage",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__28a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 7},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 5},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormbarrage",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_heavybowgun__29a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "29a",
-
-    name: "Daora's Delphinidae I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sdelphinidaei",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_heavybowgun__29b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "29b",
-
-    name: "Daora Grande",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__29a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 2},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 1},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "daoragrande",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_heavybowgun__30a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "30a",
-
-    name: "Teostra's Artillery I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 7},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sartilleryi",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_heavybowgun__30b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "30b",
-
-    name: "Teostra's Flames",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__sticky_effect_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__sticky_effect_1, __generated_heavybowgun__30a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 8},
-            normal_3: {available: true, ammoCapacity: 8},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 2},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 6},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sflames",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_heavybowgun__31a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "31a",
-
-    name: "Kamaeleon I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 0,
-    defense: 30,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 8},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamaeleoni",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_heavybowgun__31b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "31b",
-
-    name: "Veiled Kamaeleon",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 30,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__31a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__31a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 8},
-            normal_3: {available: true, ammoCapacity: 9},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "veiledkamaeleon",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_heavybowgun__32a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "32a",
-
-    name: "Redwing Cannon I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 3},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "redwingcannoni",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_heavybowgun__32b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "32b",
-
-    name: "Diabolica",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-            [__generated_ramp__normal_effect_1, __generated_heavybowgun__32a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 3},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "diabolica",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_heavybowgun__33a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "33a",
-
-    name: "Carrozza Bazooka I",
-    treeName: "Mosgharl Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "carrozzabazookai",
-        treeNameLower: "mosgharltree",
-    },
-};
-
-const __generated_heavybowgun__33b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "33b",
-
-    name: "Carrozza Bazooka II",
-    treeName: "Mosgharl Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__33a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "carrozzabazookaii",
-        treeNameLower: "mosgharltree",
-    },
-};
-
-const __generated_heavybowgun__33c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "33c",
-
-    name: "Cendrillon",
-    treeName: "Mosgharl Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__33a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: true, ammoCapacity: 6},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 5},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "cendrillon",
-        treeNameLower: "mosgharltree",
-    },
-};
-
-const __generated_heavybowgun__34a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "34a",
-
-    name: "Journey Jelly I",
-    treeName: "Jelly Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__normal_effect_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 5},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "journeyjellyi",
-        treeNameLower: "jellytree",
-    },
-};
-
-const __generated_heavybowgun__34b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "34b",
-
-    name: "Journey Jelly II",
-    treeName: "Jelly Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__34a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 5},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "journeyjellyii",
-        treeNameLower: "jellytree",
-    },
-};
-
-const __generated_heavybowgun__34c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "34c",
-
-    name: "Guiding Light",
-    treeName: "Jelly Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__34b],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__34a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 7},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 7},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 7},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: true, ammoCapacity: 5},
-            thunder: {available: true, ammoCapacity: 5},
-            ice: {available: true, ammoCapacity: 5},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 5},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "guidinglight",
-        treeNameLower: "jellytree",
-    },
-};
-
-const __generated_heavybowgun__35a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "35a",
-
-    name: "Ladybug Cannon I",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 9},
-            normal_3: {available: true, ammoCapacity: 9},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ladybugcannoni",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_heavybowgun__35b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "35b",
-
-    name: "Ladybug Cannon II",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__35a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 9},
-            normal_3: {available: true, ammoCapacity: 9},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ladybugcannonii",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_heavybowgun__35c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "35c",
-
-    name: "Ladybug Mortar",
-    treeName: "Smithy Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__35b],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__35a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 9},
-            normal_3: {available: true, ammoCapacity: 9},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 4},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: true, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "ladybugmortar",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_heavybowgun__36a: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "36a",
-
-    name: "Felyne Bowgun I",
-    treeName: "Felyne Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: true, ammoCapacity: 2},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "felynebowguni",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_heavybowgun__36b: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "36b",
-
-    name: "Felyne Bowgun II",
-    treeName: "Felyne Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__36a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__36a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: true, ammoCapacity: 2},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "felynebowgunii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_heavybowgun__36c: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "36c",
-
-    name: "Felyne Cannon",
-    treeName: "Felyne Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__cluster_effect_2, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__36b],
-            [__generated_ramp__cluster_effect_1, __generated_heavybowgun__36b],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__36a],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__36a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 3},
-            cluster_3: {available: true, ammoCapacity: 2},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: true, ammoCapacity: 2},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "felynecannon",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_heavybowgun__ra: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "ra",
-
-    name: "Rampage H. Bowgun I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-        ],
-        [
-            [__generated_ramp__special_wyvernheart, null],
-            [__generated_ramp__special_wyvernsnipe, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampageh.bowguni",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_heavybowgun__rb: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "rb",
-
-    name: "Rampage H. Bowgun II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-            [__generated_ramp__dragon_effect_1, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-        ],
-        [
-            [__generated_ramp__special_wyvernheart, null],
-            [__generated_ramp__special_wyvernsnipe, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampageh.bowgunii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_heavybowgun__rc: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "rc",
-
-    name: "Rampage H. Bowgun III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-            [__generated_ramp__dragon_effect_1, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__paralysis_effect_1, null],
-            [__generated_ramp__sleep_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-        ],
-        [
-            [__generated_ramp__special_wyvernheart, null],
-            [__generated_ramp__special_wyvernsnipe, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampageh.bowguniii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_heavybowgun__rd: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "rd",
-
-    name: "Rampage H. Bowgun IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-            [__generated_ramp__add_normal_ammo_1, __generated_heavybowgun__rc],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__rc],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__rc],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__rc],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-            [__generated_ramp__dragon_effect_1, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__paralysis_effect_1, null],
-            [__generated_ramp__sleep_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-        ],
-        [
-            [__generated_ramp__special_wyvernheart, null],
-            [__generated_ramp__special_wyvernsnipe, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampageh.bowguniv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_heavybowgun__re: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "re",
-
-    name: "Rampage H. Bowgun V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__rd],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__rd],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__rd],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__recoil_down_surge, null],
-            [__generated_ramp__reload_speed_surge, null],
-            [__generated_ramp__steadiness_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-            [__generated_ramp__add_normal_ammo_1, __generated_heavybowgun__rc],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__rc],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__rc],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__rc],
-        ],
-        [
-            [__generated_ramp__fire_effect_2, null],
-            [__generated_ramp__water_effect_2, null],
-            [__generated_ramp__thunder_effect_2, null],
-            [__generated_ramp__ice_effect_2, null],
-            [__generated_ramp__dragon_effect_2, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__paralysis_effect_1, null],
-            [__generated_ramp__sleep_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-            [__generated_ramp__fire_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__water_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__thunder_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__ice_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__dragon_effect_1, __generated_heavybowgun__rd],
-        ],
-        [
-            [__generated_ramp__special_wyvernheart, null],
-            [__generated_ramp__special_wyvernsnipe, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampageh.bowgunv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_heavybowgun__rf: HeavyBowgun = {
-    category: "heavybowgun",
-    id: "rf",
-
-    name: "Rampage H. Bowgun S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_heavybowgun__re],
-            [__generated_ramp__affinity_boost_3, __generated_heavybowgun__re],
-            [__generated_ramp__attack_boost_2, __generated_heavybowgun__rd],
-            [__generated_ramp__affinity_boost_2, __generated_heavybowgun__rd],
-            [__generated_ramp__defense_boost_2, __generated_heavybowgun__rd],
-            [__generated_ramp__attack_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_heavybowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_heavybowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__recoil_down_surge, null],
-            [__generated_ramp__reload_speed_surge, null],
-            [__generated_ramp__steadiness_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__stickycluster_effect_2, null],
-            [__generated_ramp__stickycluster_effect_1, __generated_heavybowgun__re],
-            [__generated_ramp__add_normal_ammo_1, __generated_heavybowgun__rc],
-            [__generated_ramp__pierce_effect_1, __generated_heavybowgun__rc],
-            [__generated_ramp__spread_effect_1, __generated_heavybowgun__rc],
-            [__generated_ramp__shrapnel_effect_1, __generated_heavybowgun__rc],
-        ],
-        [
-            [__generated_ramp__fire_effect_2, null],
-            [__generated_ramp__water_effect_2, null],
-            [__generated_ramp__thunder_effect_2, null],
-            [__generated_ramp__ice_effect_2, null],
-            [__generated_ramp__dragon_effect_2, null],
-            [__generated_ramp__poison_effect_2, null],
-            [__generated_ramp__paralysis_effect_2, null],
-            [__generated_ramp__sleep_effect_2, null],
-            [__generated_ramp__exhaust_effect_2, null],
-            [__generated_ramp__poison_effect_1, __generated_heavybowgun__re],
-            [__generated_ramp__paralysis_effect_1, __generated_heavybowgun__re],
-            [__generated_ramp__sleep_effect_1, __generated_heavybowgun__re],
-            [__generated_ramp__exhaust_effect_1, __generated_heavybowgun__re],
-            [__generated_ramp__fire_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__water_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__thunder_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__ice_effect_1, __generated_heavybowgun__rd],
-            [__generated_ramp__dragon_effect_1, __generated_heavybowgun__rd],
-        ],
-        [
-            [__generated_ramp__special_wyvernheart, null],
-            [__generated_ramp__special_wyvernsnipe, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampageh.bowguns",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"heavybowgun","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura H. Bowgun I","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"1b","name":"Kamura H. Bowgun II","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"1c","name":"Kamura H. Bowgun III","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"1d","name":"Kamura H. Bowgun IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,4],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[false,4],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"1e","name":"Kamura H. Bowgun V","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,4],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"1f","name":"Kamura Ninja H. Bowgun","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,5],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[true,1],"tranq":[true,2]}}}]],["Tigrex Tree",[{"id":"2a","name":"Tigrex Howl I","rarity":3,"endlineTag":"","attack":160,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["sticky_effect_1",null],["cluster_effect_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[false,2],"pierce_2":[false,3],"pierce_3":[true,3],"spread_1":[false,2],"spread_2":[false,3],"spread_3":[true,3],"shrapnel_1":[false,2],"shrapnel_2":[false,3],"shrapnel_3":[true,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[true,1],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"2b","name":"Tigrex Howl II","rarity":6,"endlineTag":"","attack":230,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["sticky_effect_1",null],["cluster_effect_2",null],["cluster_effect_1","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[true,4],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[true,4],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[true,4],"sticky_1":[true,3],"sticky_2":[true,3],"sticky_3":[true,2],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"2c","name":"Tigrex Skull","rarity":6,"endlineTag":"hr","attack":240,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["sticky_effect_1",null],["cluster_effect_2",null],["attack_boost_2","2b"],["cluster_effect_1","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,6],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[true,5],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[true,5],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[true,5],"sticky_1":[true,3],"sticky_2":[true,3],"sticky_3":[true,2],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Mizutsune Tree",[{"id":"3a","name":"Cirrus Blaster I","rarity":3,"endlineTag":"","attack":130,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["normal_effect_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,1],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,3],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"3b","name":"Cirrus Blaster II","rarity":5,"endlineTag":"","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["normal_effect_1",null],["affinity_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,3],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,1],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,3],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"3c","name":"Mountainous Roar","rarity":6,"endlineTag":"hr","attack":210,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["normal_effect_1",null],["attack_boost_2","3b"],["affinity_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,4],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,1],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,5],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,3],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Tetranadon Tree",[{"id":"4a","name":"Reversal Shot I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["cluster_effect_1",null],["waterblight_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,2],"normal_3":[false,2],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"4b","name":"Reversal Shot II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":15,"decoSlots":[2],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["cluster_effect_1",null],["waterblight_exploit",null],["defense_boost_1","4a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[false,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[true,3],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"4c","name":"Reversal Shot III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":17,"decoSlots":[2],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["cluster_effect_1",null],["waterblight_exploit",null],["defense_boost_1","4a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":3,"ammo":{"normal_1":[true,7],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[false,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,5],"spread_2":[true,5],"spread_3":[true,4],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"4d","name":"Reversal Barrage","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["cluster_effect_2",null],["waterblight_exploit",null],["cluster_effect_1","4c"],["defense_boost_1","4a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":3,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[false,3],"pierce_1":[false,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,6],"spread_2":[true,5],"spread_3":[true,5],"shrapnel_1":[true,6],"shrapnel_2":[true,5],"shrapnel_3":[false,5],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rathian Tree",[{"id":"5a","name":"Queen\'s Longfire I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["spread_effect_1",null],["small_monster_exploit",null],["defense_boost_1","4a"],["cluster_effect_1","4a"],["waterblight_exploit","4a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,2],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[true,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"5b","name":"Queen\'s Longfire II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spread_effect_1",null],["small_monster_exploit",null],["attack_boost_1","5a"],["defense_boost_1","4a"],["cluster_effect_1","4a"],["waterblight_exploit","4a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,7],"normal_2":[true,7],"normal_3":[true,5],"pierce_1":[true,2],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"5c","name":"Queen\'s Farflier","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spread_effect_2",null],["small_monster_exploit",null],["spread_effect_1","5b"],["attack_boost_1","5a"],["defense_boost_1","4a"],["cluster_effect_1","4a"],["waterblight_exploit","4a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,8],"normal_2":[true,8],"normal_3":[true,6],"pierce_1":[true,2],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Barioth Tree",[{"id":"6a","name":"Guerrera Cannon I","rarity":5,"endlineTag":"","attack":180,"affinity":20,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["spread_effect_1","5b"],["small_monster_exploit","5b"],["attack_boost_1","5a"],["defense_boost_1","4a"],["cluster_effect_1","4a"],["waterblight_exploit","4a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,3],"normal_2":[false,3],"normal_3":[false,3],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,5],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,4],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"6b","name":"Guerrera Cannon II","rarity":6,"endlineTag":"","attack":190,"affinity":20,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","6a"],["spread_effect_1","5b"],["small_monster_exploit","5b"],["attack_boost_1","5a"],["defense_boost_1","4a"],["cluster_effect_1","4a"],["waterblight_exploit","4a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,3],"normal_2":[false,3],"normal_3":[false,3],"pierce_1":[true,6],"pierce_2":[true,6],"pierce_3":[true,5],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,4],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"6c","name":"Thorn Cannon","rarity":6,"endlineTag":"hr","attack":200,"affinity":20,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","6b"],["attack_boost_2","6a"],["spread_effect_1","5b"],["small_monster_exploit","5b"],["attack_boost_1","5a"],["defense_boost_1","4a"],["cluster_effect_1","4a"],["waterblight_exploit","4a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,3],"normal_2":[false,3],"normal_3":[false,3],"pierce_1":[true,7],"pierce_2":[true,6],"pierce_3":[true,6],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,5],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}}]],["Arzuros Tree",[{"id":"7a","name":"Arzuros Gun I","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[false,3],"pierce_1":[false,2],"pierce_2":[false,2],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}},{"id":"7b","name":"Arzuros Gun II","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["small_monster_exploit",null],["attack_boost_1","7a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[false,3],"pierce_1":[true,2],"pierce_2":[false,2],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}},{"id":"7c","name":"Arzuros Fishergun","rarity":4,"endlineTag":"hr","attack":170,"affinity":0,"defense":15,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["spread_effect_1",null],["attack_boost_2","7b"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["attack_boost_1","7a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,6],"normal_3":[false,4],"pierce_1":[true,2],"pierce_2":[true,1],"pierce_3":[false,2],"spread_1":[true,5],"spread_2":[true,5],"spread_3":[true,3],"shrapnel_1":[false,3],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}}]],["Zinogre Tree",[{"id":"8a","name":"Usurper\'s Tremor I","rarity":3,"endlineTag":"","attack":140,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["anti_aquatic_species",null],["attack_boost_2","7b"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,7],"normal_3":[false,7],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[false,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"8b","name":"Usurper\'s Tremor II","rarity":5,"endlineTag":"","attack":200,"affinity":10,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","8a"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,8],"normal_3":[false,7],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[false,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,3],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"8c","name":"Despot\'s Paroxysm","rarity":6,"endlineTag":"hr","attack":220,"affinity":10,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["anti_aquatic_species",null],["affinity_boost_1","8b"],["attack_boost_1","8a"],["defense_boost_1","7b"],["small_monster_exploit","7b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,9],"normal_2":[true,8],"normal_3":[true,7],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,2],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,2],"sticky_1":[false,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,5],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,3],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,1],"tranq":[true,2]}}}]],["Ore Tree",[{"id":"9a","name":"Iron Assault I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,3],"pierce_1":[true,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,2],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9b","name":"Iron Assault II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,2],"pierce_2":[false,2],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,2],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9c","name":"Steel Assault","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,3],"pierce_1":[true,3],"pierce_2":[true,2],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[true,2],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[false,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,2],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9d","name":"Striker\'s Bowgun I","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[false,2],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,3],"demon":[true,1],"armor":[true,1],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"9e","name":"Striker\'s Bowgun II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[false,2],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,3],"demon":[true,1],"armor":[true,1],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"9f","name":"Elite Bowgun","rarity":6,"endlineTag":"hr","attack":230,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[false,2],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,3],"demon":[true,2],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Anjanath Tree",[{"id":"10a","name":"Flammenkanone I","rarity":5,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["cluster_effect_1",null],["brutal_strike",null],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":5,"reload":3,"ammo":{"normal_1":[true,7],"normal_2":[true,7],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,6],"spread_2":[true,5],"spread_3":[true,5],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,3],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[true,1],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"10b","name":"Flammenkanone II","rarity":6,"endlineTag":"","attack":220,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["cluster_effect_1",null],["brutal_strike",null],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":5,"reload":3,"ammo":{"normal_1":[true,8],"normal_2":[true,7],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,6],"spread_2":[true,6],"spread_3":[true,5],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,3],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[true,1],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"10c","name":"Gnashing Flammenkanone","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["cluster_effect_1",null],["brutal_strike",null],["affinity_boost_1","10b"],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":5,"reload":3,"ammo":{"normal_1":[true,8],"normal_2":[true,7],"normal_3":[true,6],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,7],"spread_2":[true,6],"spread_3":[true,5],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,3],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[true,6],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[true,1],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Ore Tree 2",[{"id":"11a","name":"Meteor Bazooka I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_1",null],["shrapnel_effect_1",null],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"11b","name":"Meteor Bazooka II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["pierce_effect_1",null],["shrapnel_effect_1",null],["attack_boost_2","11a"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"11c","name":"Meteor Cannon","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["pierce_effect_1",null],["shrapnel_effect_1",null],["attack_boost_3","11b"],["attack_boost_2","11a"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[false,3],"sticky_1":[true,4],"sticky_2":[true,3],"sticky_3":[true,3],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Basarios Tree",[{"id":"12a","name":"Rock Eater I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["spread_effect_1",null],["cluster_effect_1",null],["attack_boost_2","11a"],["pierce_effect_1","11a"],["shrapnel_effect_1","11a"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[true,2],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"12b","name":"Rock Eater II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["spread_effect_1",null],["cluster_effect_1",null],["defense_boost_1","12a"],["attack_boost_2","11a"],["pierce_effect_1","11a"],["shrapnel_effect_1","11a"],["attack_boost_1","9b"],["affinity_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[true,4],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[true,2],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"12c","name":"Earth Eater","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":10,"decoSlots":[2],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["spread_effect_2",null],["cluster_effect_1",null],["spread_effect_1","12b"],["defense_boost_1","12a"],["attack_boost_2","11a"],["pierce_effect_1","11a"],["shrapnel_effect_1","11a"],["attack_boost_1","9b"],["affinity_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[true,5],"sticky_2":[true,3],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[true,2],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Rhenoplos Tree",[{"id":"13a","name":"Marino Burst I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["normal_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,5],"normal_3":[false,5],"pierce_1":[false,2],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[true,3],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[true,2],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"13b","name":"Marino Burst II","rarity":3,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["spread_effect_1",null],["shrapnel_effect_1",null],["normal_effect_1","13a"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,5],"pierce_1":[false,2],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[true,3],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[true,2],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"13c","name":"Marino Cannon","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["spread_effect_1","13b"],["shrapnel_effect_1","13b"],["normal_effect_1","13a"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[false,5],"pierce_1":[false,2],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,4],"spread_2":[true,4],"spread_3":[false,4],"shrapnel_1":[false,4],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[true,3],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Volvidon Tree",[{"id":"14a","name":"Carom Shot I","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":20,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["normal_effect_1",null],["spread_effect_1","13a"],["shrapnel_effect_1","13a"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[true,4],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,2],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,4],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"14b","name":"Carom Shot II","rarity":3,"endlineTag":"","attack":160,"affinity":0,"defense":20,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["normal_effect_1",null],["defense_boost_1","14a"],["spread_effect_1","13a"],["shrapnel_effect_1","13a"],["attack_boost_1","9b"],["affinity_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[true,5],"spread_3":[true,4],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,2],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,4],"paralysis_2":[true,3],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,2],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"14c","name":"Rebound Shot","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":20,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["normal_effect_2",null],["attack_boost_2","14b"],["normal_effect_1","14b"],["defense_boost_1","14a"],["spread_effect_1","13a"],["shrapnel_effect_1","13a"],["attack_boost_1","9b"],["affinity_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[true,6],"spread_3":[true,5],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,2],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,5],"paralysis_2":[true,4],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,2],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}}]],["Izuchi Tree",[{"id":"15a","name":"Wind Thief Crossbow I","rarity":1,"endlineTag":"","attack":80,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[false,1],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"15b","name":"Wind Thief Crossbow II","rarity":2,"endlineTag":"","attack":90,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","15a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,1],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"15c","name":"Wind Thief Crossbow III","rarity":4,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","15b"],["affinity_boost_1","15a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,1],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,2],"armor":[true,2],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"15d","name":"Gale Crossbow","rarity":5,"endlineTag":"hr","attack":180,"affinity":10,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_3","15c"],["affinity_boost_2","15b"],["affinity_boost_1","15a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,1],"pierce_1":[true,6],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,2],"armor":[true,2],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rakna-Kadaki Tree",[{"id":"16a","name":"Fulgent Shot I","rarity":6,"endlineTag":"","attack":170,"affinity":40,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["pierce_effect_1",null],["silkbind_boost",null],["affinity_boost_3","15c"],["small_monster_exploit","15c"],["buddy_rally","15c"],["affinity_boost_2","15b"],["affinity_boost_1","15a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[false,2],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,4],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"16b","name":"Fulgent Shot II","rarity":6,"endlineTag":"","attack":180,"affinity":40,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["pierce_effect_1",null],["silkbind_boost",null],["affinity_boost_3","15c"],["small_monster_exploit","15c"],["buddy_rally","15c"],["affinity_boost_2","15b"],["affinity_boost_1","15a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[false,2],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,5],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"16c","name":"Araknamortar","rarity":7,"endlineTag":"hr","attack":190,"affinity":40,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["pierce_effect_1",null],["silkbind_boost",null],["attack_boost_3","16b"],["affinity_boost_3","15c"],["small_monster_exploit","15c"],["buddy_rally","15c"],["affinity_boost_2","15b"],["affinity_boost_1","15a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,5],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Bone Tree",[{"id":"17a","name":"Bone Shooter I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,5],"pierce_1":[true,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,3],"shrapnel_1":[true,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17b","name":"Bone Shooter II","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,5],"pierce_1":[true,2],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[true,2],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17c","name":"Bone Buster","rarity":3,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,5],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17d","name":"Pukei Launcher I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["normal_effect_1",null],["spread_effect_1",null],["affinity_boost_2","17c"],["defense_boost_1","17c"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,5],"normal_3":[false,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,6],"spread_2":[true,5],"spread_3":[true,4],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,1],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"17e","name":"Pukei Launcher II","rarity":5,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["normal_effect_1",null],["spread_effect_1",null],["attack_boost_2","17d"],["affinity_boost_2","17c"],["defense_boost_1","17c"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,6],"normal_3":[false,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,6],"spread_2":[true,5],"spread_3":[true,5],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,2],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,1],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"17f","name":"Venomhail","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["normal_effect_1",null],["spread_effect_2",null],["spread_effect_1","17e"],["attack_boost_2","17d"],["affinity_boost_2","17c"],["defense_boost_1","17c"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,6],"normal_3":[false,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,6],"spread_2":[true,6],"spread_3":[true,5],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,2],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,1],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,1],"tranq":[true,2]}}}]],["Anteka Tree",[{"id":"18a","name":"Anteka Burst I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["pierce_effect_1",null],["spread_effect_1",null],["attack_boost_2","17b"],["affinity_boost_2","17b"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"18b","name":"Anteka Burst II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["pierce_effect_1",null],["spread_effect_1",null],["defense_boost_1","18a"],["attack_boost_2","17b"],["affinity_boost_2","17b"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[true,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"18c","name":"Anteka Blaster","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["pierce_effect_1",null],["spread_effect_2",null],["spread_effect_1","18b"],["defense_boost_1","18a"],["attack_boost_2","17b"],["affinity_boost_2","17b"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Diablos Tree",[{"id":"19a","name":"Dual Threat I","rarity":6,"endlineTag":"","attack":220,"affinity":-30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["brutal_strike",null],["defense_boost_2","18b"],["pierce_effect_1","18b"],["spread_effect_1","18b"],["attack_boost_2","17b"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":2,"ammo":{"normal_1":[true,1],"normal_2":[true,5],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"19b","name":"Dual Threat II","rarity":6,"endlineTag":"","attack":240,"affinity":-30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_2","19a"],["defense_boost_1","19a"],["pierce_effect_1","18b"],["spread_effect_1","18b"],["attack_boost_2","17b"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":2,"ammo":{"normal_1":[true,1],"normal_2":[true,6],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"19c","name":"Diablazooka","rarity":7,"endlineTag":"hr","attack":250,"affinity":-30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_2","19a"],["defense_boost_1","19a"],["pierce_effect_1","18b"],["spread_effect_1","18b"],["attack_boost_2","17b"],["affinity_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":2,"ammo":{"normal_1":[true,1],"normal_2":[true,6],"normal_3":[true,4],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}}]],["Tobi-Kadachi Tree",[{"id":"20a","name":"Kadachi Cannon I","rarity":2,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["normal_effect_1",null],["attack_boost_2","17b"],["affinity_boost_2","17b"],["defense_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[false,4],"normal_3":[false,4],"pierce_1":[true,6],"pierce_2":[true,5],"pierce_3":[true,5],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,2],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"20b","name":"Kadachi Cannon II","rarity":4,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["normal_effect_1",null],["affinity_boost_1","20a"],["attack_boost_2","17b"],["defense_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[false,4],"normal_3":[false,4],"pierce_1":[true,6],"pierce_2":[true,6],"pierce_3":[true,5],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,2],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,4],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"20c","name":"Kadachi Raijodo","rarity":5,"endlineTag":"hr","attack":200,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["normal_effect_1",null],["attack_boost_1","20b"],["affinity_boost_2","20b"],["affinity_boost_1","20a"],["defense_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[false,4],"normal_3":[false,4],"pierce_1":[true,8],"pierce_2":[true,6],"pierce_3":[true,5],"spread_1":[false,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,4],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}}]],["Kelbi Tree",[{"id":"21a","name":"Rapidcaster I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["normal_effect_1",null],["spread_effect_1",null],["attack_boost_2","17a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"21b","name":"Rapidcaster II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["normal_effect_2",null],["spread_effect_1",null],["normal_effect_1","21a"],["attack_boost_2","17a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"21c","name":"Cyclecaster","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["normal_effect_2",null],["spread_effect_2",null],["attack_boost_1","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["attack_boost_2","17a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[false,4],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Nargacuga Tree",[{"id":"22a","name":"Hidden Gambit I","rarity":3,"endlineTag":"","attack":110,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_1","21b"],["normal_effect_2","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,1],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"22b","name":"Hidden Gambit II","rarity":5,"endlineTag":"","attack":170,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","22a"],["attack_boost_1","21b"],["normal_effect_2","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,5],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,4],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,1],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"22c","name":"Baleful Night","rarity":6,"endlineTag":"hr","attack":190,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","22b"],["attack_boost_2","22a"],["attack_boost_1","21b"],["normal_effect_2","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,5],"pierce_1":[true,6],"pierce_2":[true,5],"pierce_3":[true,5],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,2],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,1],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}}]],["Bishaten Tree",[{"id":"23a","name":"Highpriest Bowgun I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["shrapnel_effect_1",null],["silkbind_boost",null],["normal_effect_2","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["attack_boost_2","17a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,3],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"23b","name":"Highpriest Bowgun II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["shrapnel_effect_1",null],["silkbind_boost",null],["attack_boost_1","23a"],["normal_effect_2","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,3],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"23c","name":"Bishaten\'s Grace","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["shrapnel_effect_2",null],["silkbind_boost",null],["attack_boost_2","23b"],["shrapnel_effect_1","23b"],["attack_boost_1","23a"],["normal_effect_2","21b"],["spread_effect_1","21b"],["normal_effect_1","21a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[false,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,4],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,4],"paralysis_1":[true,4],"paralysis_2":[true,3],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Lagombi Tree",[{"id":"24a","name":"Spheniscine Slayer I","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["pierce_effect_1",null],["small_monster_exploit",null],["attack_boost_2","17a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"24b","name":"Spheniscine Slayer II","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_1",null],["small_monster_exploit",null],["attack_boost_1","24a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"24c","name":"Spheniscine Ruler","rarity":4,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_1",null],["normal_effect_2",null],["small_monster_exploit","24b"],["attack_boost_1","24a"],["affinity_boost_1","17a"],["defense_boost_1","17a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,7],"pierce_2":[true,5],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,5],"thunder":[false,0],"ice":[true,5],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,3],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}}]],["Magnamalo Tree",[{"id":"25a","name":"Sinister Volley I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["cluster_effect_1",null],["magnamalo_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":6,"ammo":{"normal_1":[true,9],"normal_2":[false,1],"normal_3":[true,3],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[true,3],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[true,4],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"25b","name":"Sinister Volley II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["cluster_effect_1",null],["magnamalo_soul",null],["attack_boost_2","25a"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":6,"ammo":{"normal_1":[true,9],"normal_2":[false,1],"normal_3":[true,4],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[true,4],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,2],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,4],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"25c","name":"Sinister Dreadvolley","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["cluster_effect_2",null],["magnamalo_soul",null],["cluster_effect_1","25b"],["attack_boost_2","25a"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":5,"reload":6,"ammo":{"normal_1":[true,9],"normal_2":[false,1],"normal_3":[true,4],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[true,5],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[true,5],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[true,2],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,3],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,3],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,5],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rajang Tree",[{"id":"26a","name":"Rajang Shooter I","rarity":5,"endlineTag":"","attack":190,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["normal_effect_1",null],["sticky_effect_1",null],["brutal_strike",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[true,4],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"26b","name":"Rajang Shooter II","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["sticky_effect_1",null],["brutal_strike",null],["normal_effect_1","26a"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,6],"normal_3":[true,6],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[true,4],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"26c","name":"Rajang\'s Rage","rarity":7,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["sticky_effect_2",null],["brutal_strike",null],["sticky_effect_1","26b"],["normal_effect_1","26a"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,6],"normal_3":[true,6],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[true,4],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Ibushi Tree",[{"id":"27a","name":"Azure Elder Cannon I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["pierce_effect_1",null],["anti_aerial_species",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,1],"normal_2":[true,7],"normal_3":[true,6],"pierce_1":[false,1],"pierce_2":[true,4],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[true,4],"spread_3":[true,2],"shrapnel_1":[false,1],"shrapnel_2":[true,4],"shrapnel_3":[true,2],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[true,1],"water":[true,1],"thunder":[false,0],"ice":[true,1],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,2],"poison_1":[false,0],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"27b","name":"Azure Elder Cannon II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["pierce_effect_2",null],["anti_aerial_species",null],["ibushi_soul",null],["pierce_effect_1","27a"],["defense_boost_1","27a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,1],"normal_2":[true,7],"normal_3":[true,6],"pierce_1":[false,1],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[false,1],"spread_2":[true,4],"spread_3":[true,3],"shrapnel_1":[false,1],"shrapnel_2":[true,4],"shrapnel_3":[true,3],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[true,1],"water":[true,1],"thunder":[false,0],"ice":[true,1],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,2],"poison_1":[false,0],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,2],"exhaust_1":[false,0],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"27c","name":"Abyssal Gale Barrage","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["pierce_effect_2",null],["anti_aerial_species",null],["ibushi_soul",null],["pierce_effect_1","27a"],["defense_boost_1","27a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,1],"normal_2":[true,7],"normal_3":[true,7],"pierce_1":[false,1],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[false,1],"spread_2":[true,4],"spread_3":[true,3],"shrapnel_1":[false,1],"shrapnel_2":[true,4],"shrapnel_3":[true,3],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[true,1],"water":[true,1],"thunder":[false,0],"ice":[true,1],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,3],"poison_1":[false,0],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,2],"exhaust_1":[false,0],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Narwa Tree",[{"id":"28a","name":"Thunderbolt Cannon I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[false,1],"normal_3":[false,1],"pierce_1":[true,4],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,6],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,4],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"28b","name":"Abyssal Storm Barrage","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","28a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[false,1],"normal_3":[false,1],"pierce_1":[true,4],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,7],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,5],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,3],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Kushala Daora Tree",[{"id":"29a","name":"Daora\'s Delphinidae I","rarity":6,"endlineTag":"","attack":210,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["pierce_effect_1",null],["kushala_daora_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[true,5],"pierce_3":[true,4],"spread_1":[true,4],"spread_2":[false,4],"spread_3":[false,4],"shrapnel_1":[false,4],"shrapnel_2":[false,4],"shrapnel_3":[false,4],"sticky_1":[true,3],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,1],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}},{"id":"29b","name":"Daora Grande","rarity":7,"endlineTag":"hr","attack":220,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["pierce_effect_1",null],["kushala_daora_soul",null],["affinity_boost_2","29a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,7],"normal_2":[true,7],"normal_3":[true,6],"pierce_1":[true,4],"pierce_2":[true,5],"pierce_3":[true,5],"spread_1":[true,4],"spread_2":[false,4],"spread_3":[false,4],"shrapnel_1":[false,4],"shrapnel_2":[false,4],"shrapnel_3":[false,4],"sticky_1":[true,3],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,2],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,1],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[true,1],"tranq":[true,2]}}}]],["Teostra Tree",[{"id":"30a","name":"Teostra\'s Artillery I","rarity":6,"endlineTag":"","attack":210,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["sticky_effect_1",null],["fireblight_exploit",null],["teostra_soul",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,9],"normal_2":[true,7],"normal_3":[true,7],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[true,4],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}},{"id":"30b","name":"Teostra\'s Flames","rarity":7,"endlineTag":"hr","attack":230,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["sticky_effect_2",null],["fireblight_exploit",null],["teostra_soul",null],["sticky_effect_1","30a"]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,9],"normal_2":[true,8],"normal_3":[true,8],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[true,2],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[true,1],"fire":[true,6],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}}]],["Chameleos Tree",[{"id":"31a","name":"Kamaeleon I","rarity":6,"endlineTag":"","attack":210,"affinity":0,"defense":30,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["spread_effect_1",null],["chameleos_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,7],"normal_2":[true,7],"normal_3":[true,8],"pierce_1":[false,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,4],"spread_2":[true,4],"spread_3":[false,4],"shrapnel_1":[false,4],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"31b","name":"Veiled Kamaeleon","rarity":7,"endlineTag":"hr","attack":220,"affinity":0,"defense":30,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["spread_effect_2",null],["chameleos_soul",null],["defense_boost_2","31a"],["spread_effect_1","31a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,8],"normal_2":[true,8],"normal_3":[true,9],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,4],"spread_2":[true,4],"spread_3":[false,4],"shrapnel_1":[false,4],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,3],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[true,3],"sleep_2":[true,2],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Valstrax Tree",[{"id":"32a","name":"Redwing Cannon I","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["normal_effect_1",null],["wyvern_exploit",null],["valstrax_soul",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":6,"ammo":{"normal_1":[true,4],"normal_2":[true,6],"normal_3":[false,4],"pierce_1":[true,2],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,3],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,2],"tranq":[true,2]}}},{"id":"32b","name":"Diabolica","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["wyvern_exploit",null],["valstrax_soul",null],["normal_effect_1","32a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":6,"ammo":{"normal_1":[true,5],"normal_2":[true,6],"normal_3":[false,4],"pierce_1":[true,2],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,3],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[true,2],"tranq":[true,2]}}}]],["Mosgharl Tree",[{"id":"33a","name":"Carrozza Bazooka I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[true,2],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,4],"spread_3":[false,4],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[true,2],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,2],"armor":[true,2],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"33b","name":"Carrozza Bazooka II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["pierce_effect_2",null],["spread_effect_1",null],["shrapnel_effect_1",null],["pierce_effect_1","33a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[true,2],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,4],"spread_2":[false,4],"spread_3":[false,4],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[true,2],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,2],"armor":[true,2],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"33c","name":"Cendrillon","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["pierce_effect_2",null],["spread_effect_1",null],["shrapnel_effect_1",null],["pierce_effect_1","33a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,6],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,4],"spread_2":[false,4],"spread_3":[false,4],"shrapnel_1":[true,6],"shrapnel_2":[true,5],"shrapnel_3":[false,5],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[true,2],"exhaust_1":[true,3],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[true,2],"demon":[true,3],"armor":[true,3],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Jelly Tree",[{"id":"34a","name":"Journey Jelly I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["normal_effect_1",null]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,8],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[true,3],"thunder":[true,3],"ice":[true,3],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,5],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"34b","name":"Journey Jelly II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":10,"decoSlots":[3,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["normal_effect_1",null],["defense_boost_1","34a"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,8],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,5],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,5],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[true,3],"thunder":[true,3],"ice":[true,3],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,5],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"34c","name":"Guiding Light","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":10,"decoSlots":[3,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["normal_effect_1",null],["attack_boost_2","34b"],["defense_boost_1","34a"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,9],"normal_2":[true,7],"normal_3":[true,5],"pierce_1":[true,7],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,7],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,7],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[true,5],"thunder":[true,5],"ice":[true,5],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,5],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Smithy Tree",[{"id":"35a","name":"Ladybug Cannon I","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["pierce_effect_1",null],["spread_effect_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":2,"ammo":{"normal_1":[true,9],"normal_2":[true,9],"normal_3":[true,9],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[true,3],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[true,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"35b","name":"Ladybug Cannon II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["pierce_effect_2",null],["spread_effect_1",null],["pierce_effect_1","35a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":2,"ammo":{"normal_1":[true,9],"normal_2":[true,9],"normal_3":[true,9],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[true,3],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[true,3],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[true,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"35c","name":"Ladybug Mortar","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["pierce_effect_2",null],["spread_effect_2",null],["spread_effect_1","35b"],["pierce_effect_1","35a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":2,"ammo":{"normal_1":[true,9],"normal_2":[true,9],"normal_3":[true,9],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[true,4],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[true,4],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[true,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Felyne Tree",[{"id":"36a","name":"Felyne Bowgun I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["spread_effect_1",null],["cluster_effect_1",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[true,2],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}},{"id":"36b","name":"Felyne Bowgun II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spread_effect_2",null],["cluster_effect_1",null],["attack_boost_1","36a"],["spread_effect_1","36a"]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[true,2],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}},{"id":"36c","name":"Felyne Cannon","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["spread_effect_2",null],["cluster_effect_2",null],["attack_boost_2","36b"],["cluster_effect_1","36b"],["attack_boost_1","36a"],["spread_effect_1","36a"]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,3],"cluster_3":[true,2],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[true,2],"tranq":[true,2]}}}]],["Rampage Tree",[{"id":"ra","name":"Rampage H. Bowgun I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["attack_surge",null]],[["add_normal_ammo_1",null],["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null]],[["special_wyvernheart",null],["special_wyvernsnipe",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rb","name":"Rampage H. Bowgun II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null]],[["attack_surge",null]],[["add_normal_ammo_1",null],["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null],["stickycluster_effect_1",null]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null],["dragon_effect_1",null],["poison_effect_1",null],["exhaust_effect_1",null]],[["special_wyvernheart",null],["special_wyvernsnipe",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rc","name":"Rampage H. Bowgun III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null]],[["add_normal_ammo_1",null],["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null],["stickycluster_effect_1",null]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null],["dragon_effect_1",null],["poison_effect_1",null],["paralysis_effect_1",null],["sleep_effect_1",null],["exhaust_effect_1",null]],[["special_wyvernheart",null],["special_wyvernsnipe",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rd","name":"Rampage H. Bowgun IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null]],[["add_normal_ammo_2",null],["pierce_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["stickycluster_effect_1",null],["add_normal_ammo_1","rc"],["pierce_effect_1","rc"],["spread_effect_1","rc"],["shrapnel_effect_1","rc"]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null],["dragon_effect_1",null],["poison_effect_1",null],["paralysis_effect_1",null],["sleep_effect_1",null],["exhaust_effect_1",null]],[["special_wyvernheart",null],["special_wyvernsnipe",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"re","name":"Rampage H. Bowgun V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["defense_boost_3",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null],["recoil_down_surge",null],["reload_speed_surge",null],["steadiness_surge",null]],[["add_normal_ammo_2",null],["pierce_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["stickycluster_effect_1",null],["add_normal_ammo_1","rc"],["pierce_effect_1","rc"],["spread_effect_1","rc"],["shrapnel_effect_1","rc"]],[["fire_effect_2",null],["water_effect_2",null],["thunder_effect_2",null],["ice_effect_2",null],["dragon_effect_2",null],["poison_effect_1",null],["paralysis_effect_1",null],["sleep_effect_1",null],["exhaust_effect_1",null],["fire_effect_1","rd"],["water_effect_1","rd"],["thunder_effect_1","rd"],["ice_effect_1","rd"],["dragon_effect_1","rd"]],[["special_wyvernheart",null],["special_wyvernsnipe",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rf","name":"Rampage H. Bowgun S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_4",null],["defense_boost_3",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null],["recoil_down_surge",null],["reload_speed_surge",null],["steadiness_surge",null]],[["add_normal_ammo_2",null],["pierce_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["stickycluster_effect_2",null],["stickycluster_effect_1","re"],["add_normal_ammo_1","rc"],["pierce_effect_1","rc"],["spread_effect_1","rc"],["shrapnel_effect_1","rc"]],[["fire_effect_2",null],["water_effect_2",null],["thunder_effect_2",null],["ice_effect_2",null],["dragon_effect_2",null],["poison_effect_2",null],["paralysis_effect_2",null],["sleep_effect_2",null],["exhaust_effect_2",null],["poison_effect_1","re"],["paralysis_effect_1","re"],["sleep_effect_1","re"],["exhaust_effect_1","re"],["fire_effect_1","rd"],["water_effect_1","rd"],["thunder_effect_1","rd"],["ice_effect_1","rd"],["dragon_effect_1","rd"]],[["special_wyvernheart",null],["special_wyvernsnipe",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]]]}';
 
-export const heavybowgunsArray: Readonly<HeavyBowgun[]> = [
-    __generated_heavybowgun__1a,
-    __generated_heavybowgun__1b,
-    __generated_heavybowgun__1c,
-    __generated_heavybowgun__1d,
-    __generated_heavybowgun__1e,
-    __generated_heavybowgun__1f,
-    __generated_heavybowgun__2a,
-    __generated_heavybowgun__2b,
-    __generated_heavybowgun__2c,
-    __generated_heavybowgun__3a,
-    __generated_heavybowgun__3b,
-    __generated_heavybowgun__3c,
-    __generated_heavybowgun__4a,
-    __generated_heavybowgun__4b,
-    __generated_heavybowgun__4c,
-    __generated_heavybowgun__4d,
-    __generated_heavybowgun__5a,
-    __generated_heavybowgun__5b,
-    __generated_heavybowgun__5c,
-    __generated_heavybowgun__6a,
-    __generated_heavybowgun__6b,
-    __generated_heavybowgun__6c,
-    __generated_heavybowgun__7a,
-    __generated_heavybowgun__7b,
-    __generated_heavybowgun__7c,
-    __generated_heavybowgun__8a,
-    __generated_heavybowgun__8b,
-    __generated_heavybowgun__8c,
-    __generated_heavybowgun__9a,
-    __generated_heavybowgun__9b,
-    __generated_heavybowgun__9c,
-    __generated_heavybowgun__9d,
-    __generated_heavybowgun__9e,
-    __generated_heavybowgun__9f,
-    __generated_heavybowgun__10a,
-    __generated_heavybowgun__10b,
-    __generated_heavybowgun__10c,
-    __generated_heavybowgun__11a,
-    __generated_heavybowgun__11b,
-    __generated_heavybowgun__11c,
-    __generated_heavybowgun__12a,
-    __generated_heavybowgun__12b,
-    __generated_heavybowgun__12c,
-    __generated_heavybowgun__13a,
-    __generated_heavybowgun__13b,
-    __generated_heavybowgun__13c,
-    __generated_heavybowgun__14a,
-    __generated_heavybowgun__14b,
-    __generated_heavybowgun__14c,
-    __generated_heavybowgun__15a,
-    __generated_heavybowgun__15b,
-    __generated_heavybowgun__15c,
-    __generated_heavybowgun__15d,
-    __generated_heavybowgun__16a,
-    __generated_heavybowgun__16b,
-    __generated_heavybowgun__16c,
-    __generated_heavybowgun__17a,
-    __generated_heavybowgun__17b,
-    __generated_heavybowgun__17c,
-    __generated_heavybowgun__17d,
-    __generated_heavybowgun__17e,
-    __generated_heavybowgun__17f,
-    __generated_heavybowgun__18a,
-    __generated_heavybowgun__18b,
-    __generated_heavybowgun__18c,
-    __generated_heavybowgun__19a,
-    __generated_heavybowgun__19b,
-    __generated_heavybowgun__19c,
-    __generated_heavybowgun__20a,
-    __generated_heavybowgun__20b,
-    __generated_heavybowgun__20c,
-    __generated_heavybowgun__21a,
-    __generated_heavybowgun__21b,
-    __generated_heavybowgun__21c,
-    __generated_heavybowgun__22a,
-    __generated_heavybowgun__22b,
-    __generated_heavybowgun__22c,
-    __generated_heavybowgun__23a,
-    __generated_heavybowgun__23b,
-    __generated_heavybowgun__23c,
-    __generated_heavybowgun__24a,
-    __generated_heavybowgun__24b,
-    __generated_heavybowgun__24c,
-    __generated_heavybowgun__25a,
-    __generated_heavybowgun__25b,
-    __generated_heavybowgun__25c,
-    __generated_heavybowgun__26a,
-    __generated_heavybowgun__26b,
-    __generated_heavybowgun__26c,
-    __generated_heavybowgun__27a,
-    __generated_heavybowgun__27b,
-    __generated_heavybowgun__27c,
-    __generated_heavybowgun__28a,
-    __generated_heavybowgun__28b,
-    __generated_heavybowgun__29a,
-    __generated_heavybowgun__29b,
-    __generated_heavybowgun__30a,
-    __generated_heavybowgun__30b,
-    __generated_heavybowgun__31a,
-    __generated_heavybowgun__31b,
-    __generated_heavybowgun__32a,
-    __generated_heavybowgun__32b,
-    __generated_heavybowgun__33a,
-    __generated_heavybowgun__33b,
-    __generated_heavybowgun__33c,
-    __generated_heavybowgun__34a,
-    __generated_heavybowgun__34b,
-    __generated_heavybowgun__34c,
-    __generated_heavybowgun__35a,
-    __generated_heavybowgun__35b,
-    __generated_heavybowgun__35c,
-    __generated_heavybowgun__36a,
-    __generated_heavybowgun__36b,
-    __generated_heavybowgun__36c,
-    __generated_heavybowgun__ra,
-    __generated_heavybowgun__rb,
-    __generated_heavybowgun__rc,
-    __generated_heavybowgun__rd,
-    __generated_heavybowgun__re,
-    __generated_heavybowgun__rf,
-];
+export const heavybowgunsArray: Readonly<HeavyBowgun[]> = loadWeaponPayload<HeavyBowgun>(payload);
@@ -36,5880 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type HuntingHorn,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_melody_1,
-    __generated_ramp__attack_melody_2,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_3,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__blast_boost_3,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__defensive_melody_1,
-    __generated_ramp__defensive_melody_2,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_4,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_boost_3,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_4,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__healing_melody_1,
-    __generated_ramp__healing_melody_2,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_4,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__maximum_volume,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_3,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_3,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__resilient_melody_1,
-    __generated_ramp__resilient_melody_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_3,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_4,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_4,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_huntinghorn__1a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "1a",
-
-    name: "Kamura Chorus I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "attack_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurachorusi",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_huntinghorn__1b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "1b",
-
-    name: "Kamura Chorus II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "attack_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurachorusii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_huntinghorn__1c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "1c",
-
-    name: "Kamura Chorus III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "attack_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurachorusiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_huntinghorn__1d: HuntingHorn = {
-    category: "huntinghorn",
-    id: "1d",
-
-    name: "Kamura Chorus IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 20, 10, 0, 0],
-    maxSharpness:  [60, 80, 80, 20, 60, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "attack_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurachorusiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_huntinghorn__1e: HuntingHorn = {
-    category: "huntinghorn",
-    id: "1e",
-
-    name: "Kamura Chorus V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__1d],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "attack_up",
-        xa: "health_recovery_s_plus_antidote",
-    },
-
-    filterHelpers: {
-        nameLower: "kamurachorusv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_huntinghorn__1f: HuntingHorn = {
-    category: "huntinghorn",
-    id: "1f",
-
-    name: "Kamura Ninja Horn",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_huntinghorn__1e],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__1d],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "attack_up",
-        xa: "health_recovery_s_plus_antidote",
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjahorn",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_huntinghorn__2a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "2a",
-
-    name: "Poetic Bell I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 90, 60, 0, 0, 0],
-    maxSharpness:  [60, 40, 90, 90, 20, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "blight_negated",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "poeticbelli",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_huntinghorn__2b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "2b",
-
-    name: "Poetic Bell II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 100, 80, 30, 0, 0],
-    maxSharpness:  [60, 80, 100, 80, 60, 20, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "blight_negated",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "poeticbellii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_huntinghorn__2c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "2c",
-
-    name: "Summoning Bell",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 90, 40, 0, 0],
-    maxSharpness:  [60, 40, 120, 90, 40, 50, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "blight_negated",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "summoningbell",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_huntinghorn__3a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "3a",
-
-    name: "Sublime Bell I",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__element_exploit, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [190, 40, 40, 30, 50, 0, 0],
-    maxSharpness:  [190, 40, 40, 30, 50, 50, 0],
-
-    huntinghornSongs: {
-        x: "blight_negated",
-        a: "elemental_attack_boost",
-        xa: "knockbacks_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "sublimebelli",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_huntinghorn__3b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "3b",
-
-    name: "Sublime Bell II",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__3a],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__element_exploit, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [190, 40, 40, 30, 40, 10, 0],
-    maxSharpness:  [190, 40, 40, 30, 40, 60, 0],
-
-    huntinghornSongs: {
-        x: "blight_negated",
-        a: "elemental_attack_boost",
-        xa: "knockbacks_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "sublimebellii",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_huntinghorn__3c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "3c",
-
-    name: "Araknahorn",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__3b],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__3a],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__2b],
-            [__generated_ramp__element_exploit, __generated_huntinghorn__2b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__2a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [190, 30, 40, 30, 40, 20, 0],
-    maxSharpness:  [190, 30, 40, 30, 40, 70, 0],
-
-    huntinghornSongs: {
-        x: "blight_negated",
-        a: "elemental_attack_boost",
-        xa: "knockbacks_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "araknahorn",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_huntinghorn__4a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "4a",
-
-    name: "Basarios Rock I",
-    treeName: "Basarios Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 180, 30, 0, 0, 0],
-    maxSharpness:  [20, 20, 180, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "tremors_negated",
-        a: "sonic_barrier",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "basariosrocki",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_huntinghorn__4b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "4b",
-
-    name: "Basarios Rock Mk.II",
-    treeName: "Basarios Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-        ],
-    ],
-
-    baseSharpness: [20, 10, 180, 40, 0, 0, 0],
-    maxSharpness:  [20, 10, 180, 80, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "tremors_negated",
-        a: "sonic_barrier",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "basariosrockmk.ii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_huntinghorn__4c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "4c",
-
-    name: "Gigant Rock",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__4b],
-            [__generated_ramp__fire_boost_2, __generated_huntinghorn__4b],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__1c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-        ],
-    ],
-
-    baseSharpness: [20, 30, 180, 70, 0, 0, 0],
-    maxSharpness:  [20, 30, 180, 80, 40, 0, 0],
-
-    huntinghornSongs: {
-        x: "tremors_negated",
-        a: "sonic_barrier",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "gigantrock",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_huntinghorn__5a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "5a",
-
-    name: "Usurper's Growl I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__dulling_strike, __generated_huntinghorn__4a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 50, 100, 0, 0, 0],
-    maxSharpness:  [60, 40, 50, 150, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "stun_negated",
-        a: "attack_up",
-        xa: "knockbacks_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'sgrowli",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_huntinghorn__5b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "5b",
-
-    name: "Usurper's Growl II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__5a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__dulling_strike, __generated_huntinghorn__4a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 100, 90, 20, 0, 0],
-    maxSharpness:  [60, 30, 100, 90, 70, 0, 0],
-
-    huntinghornSongs: {
-        x: "stun_negated",
-        a: "attack_up",
-        xa: "knockbacks_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'sgrowlii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_huntinghorn__5c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "5c",
-
-    name: "Despot's Thunderclap",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_huntinghorn__5b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__5a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__4a],
-            [__generated_ramp__dulling_strike, __generated_huntinghorn__4a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__1c],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 100, 30, 0, 0],
-    maxSharpness:  [60, 40, 120, 100, 50, 30, 0],
-
-    huntinghornSongs: {
-        x: "stun_negated",
-        a: "attack_up",
-        xa: "knockbacks_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "despot'sthunderclap",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_huntinghorn__6a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "6a",
-
-    name: "Zurogong Primo I",
-    treeName: "Arzuros Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 40, 0, 0, 0, 0],
-    maxSharpness:  [140, 20, 70, 20, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_up",
-        a: "defense_up",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "zurogongprimoi",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_huntinghorn__6b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "6b",
-
-    name: "Zurogong Primo II",
-    treeName: "Arzuros Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [140, 30, 50, 30, 0, 0, 0],
-    maxSharpness:  [140, 30, 50, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_up",
-        a: "defense_up",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "zurogongprimoii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_huntinghorn__6c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "6c",
-
-    name: "Zurogong Secundo",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__6b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6b],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [20, 50, 150, 80, 0, 0, 0],
-    maxSharpness:  [20, 50, 150, 100, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_up",
-        a: "defense_up",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "zurogongsecundo",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_huntinghorn__7a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "7a",
-
-    name: "Striped Dragãoga I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6b],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "attack_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "stripeddragongai",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_huntinghorn__7b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "7b",
-
-    name: "Striped Dragãoga II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__7a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6b],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 50, 30, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "attack_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "stripeddragongaii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_huntinghorn__7c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "7c",
-
-    name: "Tigrex Horn",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__7b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__7a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6b],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 120, 30, 30, 0],
-    maxSharpness:  [50, 50, 120, 120, 30, 30, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "attack_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexhorn",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_huntinghorn__8a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "8a",
-
-    name: "Bariguiro I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 80, 70, 0, 0, 0],
-    maxSharpness:  [50, 50, 80, 100, 20, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "health_recovery_s",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "bariguiroi",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_huntinghorn__8b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "8b",
-
-    name: "Bariguiro II",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__8a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6a],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 130, 100, 40, 0, 0],
-    maxSharpness:  [50, 30, 130, 100, 80, 10, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "health_recovery_s",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "bariguiroii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_huntinghorn__8c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "8c",
-
-    name: "Algiguiro",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__8b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__8a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 80, 20, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "health_recovery_s",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "algiguiro",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_huntinghorn__9a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "9a",
-
-    name: "Frilled Flute I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 30, 0, 0, 0],
-    maxSharpness:  [50, 50, 120, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_up",
-        a: "earplugs_s",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "frilledflutei",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_huntinghorn__9b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "9b",
-
-    name: "Frilled Flute II",
-    treeName: "Somnacanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__9a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 110, 40, 0, 0, 0],
-    maxSharpness:  [40, 60, 110, 90, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_up",
-        a: "earplugs_s",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "frilledfluteii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_huntinghorn__9c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "9c",
-
-    name: "Illusory Flute",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__9b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__9a],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__6a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__6a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 120, 90, 0, 0, 0],
-    maxSharpness:  [50, 90, 120, 110, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_up",
-        a: "earplugs_s",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "illusoryflute",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_huntinghorn__10a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "10a",
-
-    name: "Iron Horn I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "sonic_wave",
-        a: "stamina_recovery_up",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "ironhorni",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_huntinghorn__10b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "10b",
-
-    name: "Wind Horn",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 110, 10, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "sonic_wave",
-        a: "stamina_recovery_up",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "windhorn",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_huntinghorn__10c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "10c",
-
-    name: "Metal Bagpipe I",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 20, 0, 0, 0],
-    maxSharpness:  [60, 60, 60, 70, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "sonic_wave",
-        a: "stamina_recovery_up",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "metalbagpipei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_huntinghorn__10d: HuntingHorn = {
-    category: "huntinghorn",
-    id: "10d",
-
-    name: "Great Bagpipe",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 50, 0, 0, 0],
-    maxSharpness:  [70, 60, 70, 100, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "sonic_wave",
-        a: "stamina_recovery_up",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "greatbagpipe",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_huntinghorn__10e: HuntingHorn = {
-    category: "huntinghorn",
-    id: "10e",
-
-    name: "Heavy Bagpipe I",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 12,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10d],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 90, 50, 20, 0, 0],
-    maxSharpness:  [100, 90, 90, 50, 50, 20, 0],
-
-    huntinghornSongs: {
-        x: "sonic_wave",
-        a: "stamina_recovery_up",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "heavybagpipei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_huntinghorn__10f: HuntingHorn = {
-    category: "huntinghorn",
-    id: "10f",
-
-    name: "Fortissimo",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__10e],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10d],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 90, 50, 30, 0, 0],
-    maxSharpness:  [90, 90, 90, 50, 50, 30, 0],
-
-    huntinghornSongs: {
-        x: "sonic_wave",
-        a: "stamina_recovery_up",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "fortissimo",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_huntinghorn__11a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "11a",
-
-    name: "Hidden Harmonic I",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__defense_boost_3, __generated_huntinghorn__10e],
-            [__generated_ramp__silkbind_boost, __generated_huntinghorn__10e],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 100, 50, 0, 0],
-    maxSharpness:  [100, 30, 70, 100, 80, 20, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "attack_up",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenharmonici",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_huntinghorn__11b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "11b",
-
-    name: "Hidden Harmonic II",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__11a],
-            [__generated_ramp__defense_boost_3, __generated_huntinghorn__10e],
-            [__generated_ramp__silkbind_boost, __generated_huntinghorn__10e],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 120, 90, 60, 20, 0],
-    maxSharpness:  [70, 40, 120, 90, 60, 20, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "attack_up",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenharmonicii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_huntinghorn__11c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "11c",
-
-    name: "Cry in the Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__11b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__11a],
-            [__generated_ramp__defense_boost_3, __generated_huntinghorn__10e],
-            [__generated_ramp__silkbind_boost, __generated_huntinghorn__10e],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10d],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 90, 70, 30, 0],
-    maxSharpness:  [70, 40, 100, 90, 70, 30, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "attack_up",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "cryinthenight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_huntinghorn__12a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "12a",
-
-    name: "Pukei Bagpipe I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 20, 50, 0, 0, 0],
-    maxSharpness:  [60, 70, 20, 100, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "stamina_recovery_up",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "pukeibagpipei",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_huntinghorn__12b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "12b",
-
-    name: "Pukei Bagpipe II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__12a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 70, 90, 20, 0, 0],
-    maxSharpness:  [60, 60, 70, 90, 70, 0, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "stamina_recovery_up",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "pukeibagpipeii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_huntinghorn__12c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "12c",
-
-    name: "Datura Lurr",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__poison_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__12a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 100, 30, 0, 0],
-    maxSharpness:  [60, 60, 100, 100, 70, 10, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "stamina_recovery_up",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "daturalurr",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_huntinghorn__13a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "13a",
-
-    name: "Flammenkornett I",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__12b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__poison_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__12a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [140, 120, 30, 60, 0, 0, 0],
-    maxSharpness:  [140, 120, 30, 90, 20, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "health_recovery_s",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "flammenkornetti",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_huntinghorn__13b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "13b",
-
-    name: "Flammenkornett II",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__13a],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__12b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__poison_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__12a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [130, 120, 20, 80, 0, 0, 0],
-    maxSharpness:  [130, 120, 20, 100, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "health_recovery_s",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "flammenkornettii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_huntinghorn__13c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "13c",
-
-    name: "Forte Flammenkornett",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__13b],
-            [__generated_ramp__fire_boost_2, __generated_huntinghorn__13b],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__13a],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__12b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__poison_boost_1, __generated_huntinghorn__12b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__12a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [120, 120, 30, 60, 20, 0, 0],
-    maxSharpness:  [120, 120, 30, 60, 70, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "health_recovery_s",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "forteflammenkornett",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_huntinghorn__14a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "14a",
-
-    name: "Valkyrie Chordmaker I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__10c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 100, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_use_reduced",
-        xa: "divine_protection",
-    },
-
-    filterHelpers: {
-        nameLower: "valkyriechordmakeri",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_huntinghorn__14b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "14b",
-
-    name: "Valkyrie Chordmaker II",
-    treeName: "Rathian Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__14a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 90, 70, 0, 0, 0],
-    maxSharpness:  [40, 50, 90, 120, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_use_reduced",
-        xa: "divine_protection",
-    },
-
-    filterHelpers: {
-        nameLower: "valkyriechordmakerii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_huntinghorn__14c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "14c",
-
-    name: "Queen Chordmaker",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_huntinghorn__14b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__14a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10c],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10c],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 90, 90, 20, 0, 0],
-    maxSharpness:  [40, 60, 90, 90, 50, 20, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_use_reduced",
-        xa: "divine_protection",
-    },
-
-    filterHelpers: {
-        nameLower: "queenchordmaker",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_huntinghorn__15a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "15a",
-
-    name: "Sandpipe I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -30,
-    defense: 8,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 0, 0, 0, 0],
-    maxSharpness:  [60, 60, 140, 40, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "sonic_wave",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "sandpipei",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_huntinghorn__15b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "15b",
-
-    name: "Sandpipe II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -30,
-    defense: 8,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__15a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 120, 40, 0, 0, 0],
-    maxSharpness:  [70, 70, 120, 80, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "sonic_wave",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "sandpipeii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_huntinghorn__15c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "15c",
-
-    name: "Sandcrier",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -30,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__15b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__15a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 130, 90, 0, 0, 0],
-    maxSharpness:  [60, 70, 130, 110, 10, 20, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "sonic_wave",
-        xa: "stamina_use_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "sandcrier",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_huntinghorn__16a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "16a",
-
-    name: "Frog Flute I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 80, 20, 0, 0, 0],
-    maxSharpness:  [30, 70, 80, 70, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "attack_up",
-        xa: "tremors_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "frogflutei",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_huntinghorn__16b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "16b",
-
-    name: "Frog Flute II",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__16a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 60, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 100, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "attack_up",
-        xa: "tremors_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "frogfluteii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_huntinghorn__16c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "16c",
-
-    name: "Amphibia Allargando",
-    treeName: "Tetranadon Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_2, __generated_huntinghorn__16b],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__16a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__10b],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 110, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 130, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "attack_up",
-        xa: "tremors_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "amphibiaallargando",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_huntinghorn__17a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "17a",
-
-    name: "Wind Thief Horn I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10a],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 50, 30, 0, 0, 0],
-    maxSharpness:  [70, 50, 50, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "affinity_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefhorni",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_huntinghorn__17b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "17b",
-
-    name: "Wind Thief Horn II",
-    treeName: "Izuchi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__17a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10a],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 70, 50, 0, 0, 0],
-    maxSharpness:  [80, 50, 70, 50, 50, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "affinity_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefhornii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_huntinghorn__17c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "17c",
-
-    name: "Gale Horn",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__17b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__17a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10a],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 30, 70, 50, 0, 0],
-    maxSharpness:  [80, 70, 30, 70, 50, 50, 0],
-
-    huntinghornSongs: {
-        x: "stamina_recovery_up",
-        a: "affinity_up",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "galehorn",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_huntinghorn__18a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "18a",
-
-    name: "Droth Drone I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__17a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__17a],
-            [__generated_ramp__buddy_rally, __generated_huntinghorn__17a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10a],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 70, 40, 0, 0, 0],
-    maxSharpness:  [50, 40, 70, 90, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "blight_negated",
-        a: "defense_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "drothdronei",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_huntinghorn__18b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "18b",
-
-    name: "Droth Drone II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__17a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__17a],
-            [__generated_ramp__buddy_rally, __generated_huntinghorn__17a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 50, 0, 0, 0],
-    maxSharpness:  [60, 60, 80, 100, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "blight_negated",
-        a: "defense_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "drothdroneii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_huntinghorn__18c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "18c",
-
-    name: "Droth Roar",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__18b],
-            [__generated_ramp__water_boost_1, __generated_huntinghorn__18b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__17a],
-            [__generated_ramp__small_monster_exploit, __generated_huntinghorn__17a],
-            [__generated_ramp__buddy_rally, __generated_huntinghorn__17a],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__10a],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__10a],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 70, 90, 30, 0, 0],
-    maxSharpness:  [60, 50, 70, 90, 60, 20, 0],
-
-    huntinghornSongs: {
-        x: "blight_negated",
-        a: "defense_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "drothroar",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_huntinghorn__19a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "19a",
-
-    name: "Bone Horn I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "defense_up",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "bonehorni",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_huntinghorn__19b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "19b",
-
-    name: "Bone Horn II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "defense_up",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "bonehornii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_huntinghorn__19c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "19c",
-
-    name: "Hardened Bone Horn",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 70, 10, 0, 0, 0],
-    maxSharpness:  [100, 70, 70, 60, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "defense_up",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "hardenedbonehorn",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_huntinghorn__19d: HuntingHorn = {
-    category: "huntinghorn",
-    id: "19d",
-
-    name: "Hunter's Horn I",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "divine_protection",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'shorni",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_huntinghorn__19e: HuntingHorn = {
-    category: "huntinghorn",
-    id: "19e",
-
-    name: "Native's Horn",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__19d],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [150, 120, 20, 60, 0, 0, 0],
-    maxSharpness:  [150, 120, 20, 60, 50, 0, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "divine_protection",
-        xa: "attack_up",
-    },
-
-    filterHelpers: {
-        nameLower: "native'shorn",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_huntinghorn__20a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "20a",
-
-    name: "Duo Horn I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__19d],
-            [__generated_ramp__dulling_strike, __generated_huntinghorn__19d],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 100, 0, 0, 0],
-    maxSharpness:  [90, 80, 80, 130, 20, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_use_reduced",
-        xa: "earplugs_l",
-    },
-
-    filterHelpers: {
-        nameLower: "duohorni",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_huntinghorn__20b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "20b",
-
-    name: "Duo Horn II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__20a],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__19d],
-            [__generated_ramp__dulling_strike, __generated_huntinghorn__19d],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 80, 120, 0, 0, 0],
-    maxSharpness:  [90, 60, 80, 140, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_use_reduced",
-        xa: "earplugs_l",
-    },
-
-    filterHelpers: {
-        nameLower: "duohornii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_huntinghorn__20c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "20c",
-
-    name: "Duo Risoluto",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__20b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__20a],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__19d],
-            [__generated_ramp__dulling_strike, __generated_huntinghorn__19d],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 60, 80, 120, 10, 0, 0],
-    maxSharpness:  [80, 60, 80, 120, 50, 10, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_use_reduced",
-        xa: "earplugs_l",
-    },
-
-    filterHelpers: {
-        nameLower: "duorisoluto",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_huntinghorn__21a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "21a",
-
-    name: "Bull Grunt I",
-    treeName: "Bullfango Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 110, 20, 10, 0, 0],
-    maxSharpness:  [70, 90, 110, 20, 50, 10, 0],
-
-    huntinghornSongs: {
-        x: "divine_protection",
-        a: "knockbacks_negated",
-        xa: "stun_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "bullgrunti",
-        treeNameLower: "bullfangotree",
-    },
-};
-
-const __generated_huntinghorn__21b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "21b",
-
-    name: "Bull Grunt II",
-    treeName: "Bullfango Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__21a],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 90, 50, 10, 0, 0],
-    maxSharpness:  [70, 80, 90, 50, 40, 20, 0],
-
-    huntinghornSongs: {
-        x: "divine_protection",
-        a: "knockbacks_negated",
-        xa: "stun_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "bullgruntii",
-        treeNameLower: "bullfangotree",
-    },
-};
-
-const __generated_huntinghorn__21c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "21c",
-
-    name: "Wild Grunt",
-    treeName: "Bullfango Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__21b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__21a],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__19c],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 90, 110, 60, 10, 0, 0],
-    maxSharpness:  [80, 90, 110, 60, 20, 40, 0],
-
-    huntinghornSongs: {
-        x: "divine_protection",
-        a: "knockbacks_negated",
-        xa: "stun_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "wildgrunt",
-        treeNameLower: "bullfangotree",
-    },
-};
-
-const __generated_huntinghorn__22a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "22a",
-
-    name: "Flame Feroce I",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 70, 50, 0, 0, 0],
-    maxSharpness:  [50, 80, 70, 80, 20, 0, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "sonic_wave",
-        xa: "stamina_recovery_up",
-    },
-
-    filterHelpers: {
-        nameLower: "flameferocei",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_huntinghorn__22b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "22b",
-
-    name: "Flame Feroce II",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 80, 90, 20, 0, 0],
-    maxSharpness:  [70, 90, 80, 90, 60, 10, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "sonic_wave",
-        xa: "stamina_recovery_up",
-    },
-
-    filterHelpers: {
-        nameLower: "flameferoceii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_huntinghorn__22c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "22c",
-
-    name: "Rathalos Feroce",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__22b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 80, 90, 40, 0, 0],
-    maxSharpness:  [70, 70, 80, 90, 70, 20, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "sonic_wave",
-        xa: "stamina_recovery_up",
-    },
-
-    filterHelpers: {
-        nameLower: "rathalosferoce",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_huntinghorn__23a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "23a",
-
-    name: "Kulu Mosso I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__19b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 40, 40, 0, 0, 0],
-    maxSharpness:  [60, 60, 40, 90, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_recovery_up",
-        xa: "stun_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "kulumossoi",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_huntinghorn__23b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "23b",
-
-    name: "Kulu Mosso II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__23a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 40, 70, 0, 0, 0],
-    maxSharpness:  [70, 70, 40, 120, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_recovery_up",
-        xa: "stun_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "kulumossoii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_huntinghorn__23c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "23c",
-
-    name: "Kulu Grosso",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__23b],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__23a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 50, 90, 30, 0, 0],
-    maxSharpness:  [70, 60, 50, 90, 80, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "stamina_recovery_up",
-        xa: "stun_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "kulugrosso",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_huntinghorn__24a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "24a",
-
-    name: "Khezu Horn I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 30, 110, 20, 0, 0, 0],
-    maxSharpness:  [40, 30, 110, 70, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_regeneration",
-        xa: "elemental_attack_boost",
-    },
-
-    filterHelpers: {
-        nameLower: "khezuhorni",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_huntinghorn__24b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "24b",
-
-    name: "Khezu Horn II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__24a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 40, 0, 0, 0],
-    maxSharpness:  [50, 40, 120, 90, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_regeneration",
-        xa: "elemental_attack_boost",
-    },
-
-    filterHelpers: {
-        nameLower: "khezuhornii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_huntinghorn__24c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "24c",
-
-    name: "Khezu Flute",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__24b],
-            [__generated_ramp__thunder_boost_1, __generated_huntinghorn__24b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__24a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__19b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 110, 70, 20, 0, 0],
-    maxSharpness:  [60, 40, 110, 70, 50, 20, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_regeneration",
-        xa: "elemental_attack_boost",
-    },
-
-    filterHelpers: {
-        nameLower: "khezuflute",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_huntinghorn__25a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "25a",
-
-    name: "Vicello Nulo I",
-    treeName: "Bnahabra Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [110, 20, 70, 0, 0, 0, 0],
-    maxSharpness:  [110, 20, 70, 50, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "stamina_use_reduced",
-        xa: "earplugs_s",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonuloi",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_huntinghorn__25b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "25b",
-
-    name: "Vicello Nulo II",
-    treeName: "Bnahabra Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [110, 20, 30, 40, 0, 0, 0],
-    maxSharpness:  [110, 20, 30, 90, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "stamina_use_reduced",
-        xa: "earplugs_s",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonuloii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_huntinghorn__25c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "25c",
-
-    name: "Vicello Unu",
-    treeName: "Bnahabra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [130, 20, 30, 70, 0, 0, 0],
-    maxSharpness:  [130, 20, 30, 120, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "stamina_use_reduced",
-        xa: "earplugs_s",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellounu",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_huntinghorn__25d: HuntingHorn = {
-    category: "huntinghorn",
-    id: "25d",
-
-    name: "Vicello Nulo Black I",
-    treeName: "Bnahabra Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__25c],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 30, 60, 30, 0, 0],
-    maxSharpness:  [150, 30, 30, 60, 70, 10, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "stamina_use_reduced",
-        xa: "earplugs_l",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonuloblacki",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_huntinghorn__25e: HuntingHorn = {
-    category: "huntinghorn",
-    id: "25e",
-
-    name: "Vicello Nulo Black II",
-    treeName: "Bnahabra Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__dragon_boost_2, __generated_huntinghorn__25d],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__25c],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 80, 40, 0, 0],
-    maxSharpness:  [140, 20, 20, 80, 70, 20, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "stamina_use_reduced",
-        xa: "earplugs_l",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonuloblackii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_huntinghorn__25f: HuntingHorn = {
-    category: "huntinghorn",
-    id: "25f",
-
-    name: "Vicello Uno Black",
-    treeName: "Bnahabra Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__25e],
-            [__generated_ramp__dragon_boost_2, __generated_huntinghorn__25d],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__25c],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 20, 90, 60, 0, 0],
-    maxSharpness:  [160, 20, 20, 90, 70, 40, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "stamina_use_reduced",
-        xa: "earplugs_l",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellounoblack",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_huntinghorn__26a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "26a",
-
-    name: "Vicello Nulo Green I",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 30, 30, 0, 0, 0],
-    maxSharpness:  [150, 40, 30, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "tremors_negated",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonulogreeni",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_huntinghorn__26b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "26b",
-
-    name: "Vicello Nulo Green II",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__26a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 80, 40, 0, 0],
-    maxSharpness:  [140, 20, 20, 80, 70, 20, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "tremors_negated",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonulogreenii",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_huntinghorn__26c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "26c",
-
-    name: "Vicello Unu Green",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__26b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__26a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__25b],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 20, 90, 50, 0, 0],
-    maxSharpness:  [150, 40, 20, 90, 70, 30, 0],
-
-    huntinghornSongs: {
-        x: "defense_up",
-        a: "tremors_negated",
-        xa: "health_recovery_s",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellounugreen",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_huntinghorn__27a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "27a",
-
-    name: "Vicello Nulo White I",
-    treeName: "Bnahabra (Ice)",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 10, 20, 30, 0, 0, 0],
-    maxSharpness:  [140, 10, 20, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_regeneration",
-        a: "stamina_use_reduced",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonulowhitei",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_huntinghorn__27b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "27b",
-
-    name: "Vicello Nulo White II",
-    treeName: "Bnahabra (Ice)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__27a],
-            [__generated_ramp__ice_boost_1, __generated_huntinghorn__27a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [130, 20, 30, 70, 0, 0, 0],
-    maxSharpness:  [130, 20, 30, 120, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_regeneration",
-        a: "stamina_use_reduced",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellonulowhiteii",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_huntinghorn__27c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "27c",
-
-    name: "Vicello Unu White",
-    treeName: "Bnahabra (Ice)",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__27b],
-            [__generated_ramp__ice_boost_2, __generated_huntinghorn__27b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__27a],
-            [__generated_ramp__ice_boost_1, __generated_huntinghorn__27a],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__25a],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 80, 40, 0, 0],
-    maxSharpness:  [140, 20, 20, 80, 70, 20, 0],
-
-    huntinghornSongs: {
-        x: "health_regeneration",
-        a: "stamina_use_reduced",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "vicellounuwhite",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_huntinghorn__28a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "28a",
-
-    name: "Sinister Strum I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    huntinghornSongs: {
-        x: "sonic_barrier",
-        a: "attack_and_defense_up",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterstrumi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_huntinghorn__28b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "28b",
-
-    name: "Sinister Strum II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__28a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "sonic_barrier",
-        a: "attack_and_defense_up",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterstrumii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_huntinghorn__28c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "28c",
-
-    name: "Sinister Shadestrum",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_huntinghorn__28b],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__28a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 50, 40, 0],
-
-    huntinghornSongs: {
-        x: "sonic_barrier",
-        a: "attack_and_defense_up",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "sinistershadestrum",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_huntinghorn__29a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "29a",
-
-    name: "Denden Daiko I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__maximum_volume, null],
-        ],
-    ],
-
-    baseSharpness: [30, 40, 150, 80, 0, 0, 0],
-    maxSharpness:  [30, 40, 150, 130, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_and_defense_up",
-        a: "environment_damage_negated",
-        xa: "tremors_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "dendendaikoi",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_huntinghorn__29b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "29b",
-
-    name: "Denden Daiko II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__maximum_volume, null],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 180, 80, 10, 0, 0],
-    maxSharpness:  [30, 50, 180, 80, 60, 0, 0],
-
-    huntinghornSongs: {
-        x: "attack_and_defense_up",
-        a: "environment_damage_negated",
-        xa: "tremors_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "dendendaikoii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_huntinghorn__29c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "29c",
-
-    name: "Denden Doomsounder",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__thunder_boost_1, __generated_huntinghorn__29b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 170, 80, 20, 0, 0],
-    maxSharpness:  [30, 50, 170, 80, 60, 10, 0],
-
-    huntinghornSongs: {
-        x: "attack_and_defense_up",
-        a: "environment_damage_negated",
-        xa: "tremors_negated",
-    },
-
-    filterHelpers: {
-        nameLower: "dendendoomsounder",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_huntinghorn__30a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "30a",
-
-    name: "Azure Elder Horn I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_use_reduced",
-        a: "divine_protection",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderhorni",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_huntinghorn__30b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "30b",
-
-    name: "Azure Elder Horn II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__30a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    huntinghornSongs: {
-        x: "stamina_use_reduced",
-        a: "divine_protection",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderhornii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_huntinghorn__30c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "30c",
-
-    name: "Abyssal Gale Horn",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_huntinghorn__30b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__30a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    huntinghornSongs: {
-        x: "stamina_use_reduced",
-        a: "divine_protection",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgalehorn",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_huntinghorn__31a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "31a",
-
-    name: "Thunderbolt Horn I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    huntinghornSongs: {
-        x: "stun_negated",
-        a: "health_recovery_l",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "thunderbolthorni",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_huntinghorn__31b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "31b",
-
-    name: "Abyssal Storm Horn",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 41]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__31a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    huntinghornSongs: {
-        x: "stun_negated",
-        a: "health_recovery_l",
-        xa: "health_regeneration",
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormhorn",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_huntinghorn__32a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "32a",
-
-    name: "Rookslayer Drum I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__maximum_volume, null],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 60, 90, 0, 0, 0],
-    maxSharpness:  [60, 90, 60, 90, 50, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "attack_up",
-        xa: "health_recovery_l",
-    },
-
-    filterHelpers: {
-        nameLower: "rookslayerdrumi",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_huntinghorn__32b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "32b",
-
-    name: "Rookslayer Drum II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__maximum_volume, null],
-        ],
-    ],
-
-    baseSharpness: [60, 110, 90, 80, 10, 0, 0],
-    maxSharpness:  [60, 110, 90, 80, 30, 30, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "attack_up",
-        xa: "health_recovery_l",
-    },
-
-    filterHelpers: {
-        nameLower: "rookslayerdrumii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_huntinghorn__32c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "32c",
-
-    name: "Bazelreid Rookslayer",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__maximum_volume, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__32b],
-            [__generated_ramp__blast_boost_2, __generated_huntinghorn__32b],
-        ],
-    ],
-
-    baseSharpness: [60, 110, 80, 80, 20, 0, 0],
-    maxSharpness:  [60, 110, 80, 80, 30, 40, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "attack_up",
-        xa: "health_recovery_l",
-    },
-
-    filterHelpers: {
-        nameLower: "bazelreidrookslayer",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_huntinghorn__33a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "33a",
-
-    name: "Daora's Taus I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 130, 70, 40, 0, 0],
-    maxSharpness:  [50, 60, 130, 70, 60, 30, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "stamina_use_reduced",
-        xa: "sharpness_loss_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "daora'stausi",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_huntinghorn__33b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "33b",
-
-    name: "Daora's Baphophone",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__33a],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__33a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 130, 50, 40, 10, 0],
-    maxSharpness:  [50, 70, 130, 50, 40, 60, 0],
-
-    huntinghornSongs: {
-        x: "environment_damage_negated",
-        a: "stamina_use_reduced",
-        xa: "sharpness_loss_reduced",
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sbaphophone",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_huntinghorn__34a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "34a",
-
-    name: "Teostra's Tiple I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 130, 10, 0, 0],
-    maxSharpness:  [60, 70, 80, 130, 50, 10, 0],
-
-    huntinghornSongs: {
-        x: "health_regeneration",
-        a: "health_recovery_s_plus_antidote",
-        xa: "attack_and_defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'stiplei",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_huntinghorn__34b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "34b",
-
-    name: "Teostra's Orph\u00e9e",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__34a],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 110, 40, 0, 0],
-    maxSharpness:  [60, 70, 70, 110, 70, 20, 0],
-
-    huntinghornSongs: {
-        x: "health_regeneration",
-        a: "health_recovery_s_plus_antidote",
-        xa: "attack_and_defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sorph\u00e9e",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_huntinghorn__35a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "35a",
-
-    name: "Blessed Ocarina I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [170, 30, 60, 70, 20, 0, 0],
-    maxSharpness:  [170, 30, 60, 70, 40, 30, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_l",
-        a: "wind_pressure_negated",
-        xa: "elemental_attack_boost",
-    },
-
-    filterHelpers: {
-        nameLower: "blessedocarinai",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_huntinghorn__35b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "35b",
-
-    name: "Cursed Ocarina",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__35a],
-        ],
-    ],
-
-    baseSharpness: [170, 30, 60, 50, 40, 0, 0],
-    maxSharpness:  [170, 30, 60, 50, 40, 50, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_l",
-        a: "wind_pressure_negated",
-        xa: "elemental_attack_boost",
-    },
-
-    filterHelpers: {
-        nameLower: "cursedocarina",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_huntinghorn__36a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "36a",
-
-    name: "Redwing Flute I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "attack_and_affinity_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "redwingflutei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_huntinghorn__36b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "36b",
-
-    name: "Reddnaught Ritmico",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    huntinghornSongs: {
-        x: "elemental_attack_boost",
-        a: "attack_and_affinity_up",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "reddnaughtritmico",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_huntinghorn__37a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "37a",
-
-    name: "Poison Fungasax I",
-    treeName: "Chaos Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 150, 0, 0, 0, 0],
-    maxSharpness:  [40, 60, 200, 0, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_use_reduced",
-        a: "health_recovery_s",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "poisonfungasaxi",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_huntinghorn__37b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "37b",
-
-    name: "Poison Fungasax II",
-    treeName: "Chaos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 170, 30, 0, 0, 0],
-    maxSharpness:  [40, 60, 170, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_use_reduced",
-        a: "health_recovery_s",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "poisonfungasaxii",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_huntinghorn__37c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "37c",
-
-    name: "Toxic Fungasax",
-    treeName: "Chaos Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__37b],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 140, 60, 0, 0, 0],
-    maxSharpness:  [30, 70, 140, 80, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "stamina_use_reduced",
-        a: "health_recovery_s",
-        xa: "defense_up",
-    },
-
-    filterHelpers: {
-        nameLower: "toxicfungasax",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_huntinghorn__38a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "38a",
-
-    name: "Magia Charm I",
-    treeName: "Magia Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 110, 10, 0, 0, 0],
-    maxSharpness:  [50, 30, 110, 60, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "sonic_barrier",
-        xa: "health_recovery_s_plus_antidote",
-    },
-
-    filterHelpers: {
-        nameLower: "magiacharmi",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_huntinghorn__38b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "38b",
-
-    name: "Magia Charm II",
-    treeName: "Magia Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 30, 0, 0, 0],
-    maxSharpness:  [50, 60, 110, 80, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "sonic_barrier",
-        xa: "health_recovery_s_plus_antidote",
-    },
-
-    filterHelpers: {
-        nameLower: "magiacharmii",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_huntinghorn__38c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "38c",
-
-    name: "Magia Charm III",
-    treeName: "Magia Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__ice_boost_1, __generated_huntinghorn__38b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 80, 0, 0, 0],
-    maxSharpness:  [50, 60, 110, 120, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "sonic_barrier",
-        xa: "health_recovery_s_plus_antidote",
-    },
-
-    filterHelpers: {
-        nameLower: "magiacharmiii",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_huntinghorn__38d: HuntingHorn = {
-    category: "huntinghorn",
-    id: "38d",
-
-    name: "Magia Charmbell",
-    treeName: "Magia Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__ice_boost_2, __generated_huntinghorn__38c],
-            [__generated_ramp__ice_boost_1, __generated_huntinghorn__38b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 120, 10, 0, 0],
-    maxSharpness:  [50, 60, 110, 120, 60, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s",
-        a: "sonic_barrier",
-        xa: "health_recovery_s_plus_antidote",
-    },
-
-    filterHelpers: {
-        nameLower: "magiacharmbell",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_huntinghorn__39a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "39a",
-
-    name: "Cornupion I",
-    treeName: "Spio Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 100, 60, 0, 0, 0],
-    maxSharpness:  [50, 40, 100, 100, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s_plus_antidote",
-        a: "defense_up",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "cornupioni",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_huntinghorn__39b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "39b",
-
-    name: "Cornupion II",
-    treeName: "Spio Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__39a],
-        ],
-    ],
-
-    baseSharpness: [40, 30, 100, 80, 0, 0, 0],
-    maxSharpness:  [40, 30, 100, 100, 30, 0, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s_plus_antidote",
-        a: "defense_up",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "cornupionii",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_huntinghorn__39c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "39c",
-
-    name: "Webbed Cornupion",
-    treeName: "Spio Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__39b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__39a],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 90, 100, 20, 0, 0],
-    maxSharpness:  [40, 50, 90, 100, 50, 20, 0],
-
-    huntinghornSongs: {
-        x: "health_recovery_s_plus_antidote",
-        a: "defense_up",
-        xa: "affinity_up",
-    },
-
-    filterHelpers: {
-        nameLower: "webbedcornupion",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_huntinghorn__40a: HuntingHorn = {
-    category: "huntinghorn",
-    id: "40a",
-
-    name: "Grass Flute I",
-    treeName: "Bombadgy Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 80, 20, 0, 0, 0],
-    maxSharpness:  [90, 60, 80, 70, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "wind_pressure_negated",
-        a: "health_regeneration",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "grassflutei",
-        treeNameLower: "bombadgytree",
-    },
-};
-
-const __generated_huntinghorn__40b: HuntingHorn = {
-    category: "huntinghorn",
-    id: "40b",
-
-    name: "Grass Flute II",
-    treeName: "Bombadgy Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__40a],
-            [__generated_ramp__blast_boost_1, __generated_huntinghorn__40a],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 60, 90, 0, 0, 0],
-    maxSharpness:  [90, 60, 60, 130, 10, 0, 0],
-
-    huntinghornSongs: {
-        x: "wind_pressure_negated",
-        a: "health_regeneration",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "grassfluteii",
-        treeNameLower: "bombadgytree",
-    },
-};
-
-const __generated_huntinghorn__40c: HuntingHorn = {
-    category: "huntinghorn",
-    id: "40c",
-
-    name: "Bombadgy's Cry",
-    treeName: "Bombadgy Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__blast_boost_2, __generated_huntinghorn__40b],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__40a],
-            [__generated_ramp__blast_boost_1, __generated_huntinghorn__40a],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 60, 130, 10, 0, 0],
-    maxSharpness:  [90, 60, 60, 130, 60, 0, 0],
-
-    huntinghornSongs: {
-        x: "wind_pressure_negated",
-        a: "health_regeneration",
-        xa: "sonic_barrier",
-    },
-
-    filterHelpers: {
-        nameLower: "bombadgy'scry",
-        treeNameLower: "bombadgytree",
-    },
-};
-
-const __generated_huntinghorn__ra: HuntingHorn = {
-    category: "huntinghorn",
-    id: "ra",
-
-    name: "Rampage Agitato I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_recovery_s",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "rampageagitatoi",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_huntinghorn__rb: HuntingHorn = {
-    category: "huntinghorn",
-    id: "rb",
-
-    name: "Rampage Agitato II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__attack_melody_1, null],
-            [__generated_ramp__defensive_melody_1, null],
-            [__generated_ramp__healing_melody_1, null],
-            [__generated_ramp__resilient_melody_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_recovery_s",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "rampageagitatoii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_huntinghorn__rc: HuntingHorn = {
-    category: "huntinghorn",
-    id: "rc",
-
-    name: "Rampage Agitato III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_huntinghorn__rb],
-            [__generated_ramp__water_1, __generated_huntinghorn__rb],
-            [__generated_ramp__thunder_1, __generated_huntinghorn__rb],
-            [__generated_ramp__ice_1, __generated_huntinghorn__rb],
-            [__generated_ramp__dragon_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__attack_melody_1, null],
-            [__generated_ramp__defensive_melody_1, null],
-            [__generated_ramp__healing_melody_1, null],
-            [__generated_ramp__resilient_melody_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_recovery_s",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "rampageagitatoiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_huntinghorn__rd: HuntingHorn = {
-    category: "huntinghorn",
-    id: "rd",
-
-    name: "Rampage Agitato IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_huntinghorn__rc],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_huntinghorn__rc],
-            [__generated_ramp__paralysis_1, __generated_huntinghorn__rc],
-            [__generated_ramp__sleep_1, __generated_huntinghorn__rc],
-            [__generated_ramp__blast_1, __generated_huntinghorn__rc],
-            [__generated_ramp__fire_1, __generated_huntinghorn__rb],
-            [__generated_ramp__water_1, __generated_huntinghorn__rb],
-            [__generated_ramp__thunder_1, __generated_huntinghorn__rb],
-            [__generated_ramp__ice_1, __generated_huntinghorn__rb],
-            [__generated_ramp__dragon_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__attack_melody_2, null],
-            [__generated_ramp__defensive_melody_2, null],
-            [__generated_ramp__healing_melody_2, null],
-            [__generated_ramp__resilient_melody_2, null],
-            [__generated_ramp__attack_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__defensive_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__healing_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__resilient_melody_1, __generated_huntinghorn__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_recovery_s",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "rampageagitatoiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_huntinghorn__re: HuntingHorn = {
-    category: "huntinghorn",
-    id: "re",
-
-    name: "Rampage Agitato V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__rd],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__rd],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__rd],
-            [__generated_ramp__elemental_boost_1, __generated_huntinghorn__rc],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__fire_2, __generated_huntinghorn__rd],
-            [__generated_ramp__water_2, __generated_huntinghorn__rd],
-            [__generated_ramp__thunder_2, __generated_huntinghorn__rd],
-            [__generated_ramp__ice_2, __generated_huntinghorn__rd],
-            [__generated_ramp__dragon_2, __generated_huntinghorn__rd],
-            [__generated_ramp__poison_1, __generated_huntinghorn__rc],
-            [__generated_ramp__paralysis_1, __generated_huntinghorn__rc],
-            [__generated_ramp__sleep_1, __generated_huntinghorn__rc],
-            [__generated_ramp__blast_1, __generated_huntinghorn__rc],
-            [__generated_ramp__fire_1, __generated_huntinghorn__rb],
-            [__generated_ramp__water_1, __generated_huntinghorn__rb],
-            [__generated_ramp__thunder_1, __generated_huntinghorn__rb],
-            [__generated_ramp__ice_1, __generated_huntinghorn__rb],
-            [__generated_ramp__dragon_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__attack_melody_2, null],
-            [__generated_ramp__defensive_melody_2, null],
-            [__generated_ramp__healing_melody_2, null],
-            [__generated_ramp__resilient_melody_2, null],
-            [__generated_ramp__attack_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__defensive_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__healing_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__resilient_melody_1, __generated_huntinghorn__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_recovery_s",
-        xa: "sonic_wave",
-    },
-
-    filterHelpers: {
-        nameLower: "rampageagitatov",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_huntinghorn__rf: HuntingHorn = {
-    category: "huntinghorn",
-    id: "rf",
-
-    name: "Rampage Agitato S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_3, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_huntinghorn__re],
-            [__generated_ramp__elemental_boost_2, __generated_huntinghorn__re],
-            [__generated_ramp__affinity_boost_3, __generated_huntinghorn__re],
-            [__generated_ramp__attack_boost_2, __generated_huntinghorn__rd],
-            [__generated_ramp__affinity_boost_2, __generated_huntinghorn__rd],
-            [__generated_ramp__defense_boost_2, __generated_huntinghorn__rd],
-            [__generated_ramp__elemental_boost_1, __generated_huntinghorn__rc],
-            [__generated_ramp__attack_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__affinity_boost_1, __generated_huntinghorn__rb],
-            [__generated_ramp__defense_boost_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_4, null],
-            [__generated_ramp__water_4, null],
-            [__generated_ramp__thunder_4, null],
-            [__generated_ramp__ice_4, null],
-            [__generated_ramp__dragon_4, null],
-            [__generated_ramp__poison_3, null],
-            [__generated_ramp__paralysis_3, null],
-            [__generated_ramp__sleep_3, null],
-            [__generated_ramp__blast_3, null],
-            [__generated_ramp__fire_3, __generated_huntinghorn__re],
-            [__generated_ramp__water_3, __generated_huntinghorn__re],
-            [__generated_ramp__thunder_3, __generated_huntinghorn__re],
-            [__generated_ramp__ice_3, __generated_huntinghorn__re],
-            [__generated_ramp__dragon_3, __generated_huntinghorn__re],
-            [__generated_ramp__poison_2, __generated_huntinghorn__re],
-            [__generated_ramp__paralysis_2, __generated_huntinghorn__re],
-            [__generated_ramp__sleep_2, __generated_huntinghorn__re],
-            [__generated_ramp__blast_2, __generated_huntinghorn__re],
-            [__generated_ramp__fire_2, __generated_huntinghorn__rd],
-            [__generated_ramp__water_2, __generated_huntinghorn__rd],
-            [__generated_ramp__thunder_2, __generated_huntinghorn__rd],
-            [__generated_ramp__ice_2, __generated_huntinghorn__rd],
-            [__generated_ramp__dragon_2, __generated_huntinghorn__rd],
-            [__generated_ramp__poison_1, __generated_huntinghorn__rc],
-            [__generated_ramp__paralysis_1, __generated_huntinghorn__rc],
-            [__generated_ramp__sleep_1, __generated_huntinghorn__rc],
-            [__generated_ramp__blast_1, __generated_huntinghorn__rc],
-            [__generated_ramp__fire_1, __generated_huntinghorn__rb],
-            [__generated_ramp__water_1, __generated_huntinghorn__rb],
-            [__generated_ramp__thunder_1, __generated_huntinghorn__rb],
-            [__generated_ramp__ice_1, __generated_huntinghorn__rb],
-            [__generated_ramp__dragon_1, __generated_huntinghorn__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__attack_melody_2, null],
-            [__generated_ramp__defensive_melody_2, null],
-            [__generated_ramp__healing_melody_2, null],
-            [__generated_ramp__resilient_melody_2, null],
-            [__generated_ramp__attack_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__defensive_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__healing_melody_1, __generated_huntinghorn__rc],
-            [__generated_ramp__resilient_melody_1, __generated_huntinghorn__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
-
-    huntinghornSongs: {
-        x: "earplugs_s",
-        a: "health_recovery_s",
-        xa: "sonic_wave",
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampageagitatos",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"huntinghorn","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Chorus I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"attack_up","xa":"health_recovery_s"}},{"id":"1b","name":"Kamura Chorus II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"attack_up","xa":"health_recovery_s"}},{"id":"1c","name":"Kamura Chorus III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"attack_up","xa":"health_recovery_s"}},{"id":"1d","name":"Kamura Chorus IV","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,80,20,10,0,0],"maxSharpness":[60,80,80,20,60,0,0],"huntinghornSongs":{"x":"defense_up","a":"attack_up","xa":"health_recovery_s"}},{"id":"1e","name":"Kamura Chorus V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0],"huntinghornSongs":{"x":"defense_up","a":"attack_up","xa":"health_recovery_s_plus_antidote"}},{"id":"1f","name":"Kamura Ninja Horn","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0],"huntinghornSongs":{"x":"defense_up","a":"attack_up","xa":"health_recovery_s_plus_antidote"}}]],["Mizutsune Tree",[{"id":"2a","name":"Poetic Bell I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,40,90,60,0,0,0],"maxSharpness":[60,40,90,90,20,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"blight_negated","xa":"stamina_use_reduced"}},{"id":"2b","name":"Poetic Bell II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",24]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["element_exploit",null],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,100,80,30,0,0],"maxSharpness":[60,80,100,80,60,20,0],"huntinghornSongs":{"x":"health_recovery_s","a":"blight_negated","xa":"stamina_use_reduced"}},{"id":"2c","name":"Summoning Bell","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",28]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["element_exploit",null],["affinity_boost_2","2b"],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,40,120,90,40,0,0],"maxSharpness":[60,40,120,90,40,50,0],"huntinghornSongs":{"x":"health_recovery_s","a":"blight_negated","xa":"stamina_use_reduced"}}]],["Rakna-Kadaki Tree",[{"id":"3a","name":"Sublime Bell I","rarity":6,"endlineTag":"","attack":130,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",24]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["silkbind_boost",null],["attack_boost_2","2b"],["affinity_boost_2","2b"],["element_exploit","2b"],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[190,40,40,30,50,0,0],"maxSharpness":[190,40,40,30,50,50,0],"huntinghornSongs":{"x":"blight_negated","a":"elemental_attack_boost","xa":"knockbacks_negated"}},{"id":"3b","name":"Sublime Bell II","rarity":6,"endlineTag":"","attack":140,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",26]],"rampSkills":[[["attack_boost_3",null],["fire_boost_2",null],["silkbind_boost",null],["fire_boost_1","3a"],["attack_boost_2","2b"],["affinity_boost_2","2b"],["element_exploit","2b"],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[190,40,40,30,40,10,0],"maxSharpness":[190,40,40,30,40,60,0],"huntinghornSongs":{"x":"blight_negated","a":"elemental_attack_boost","xa":"knockbacks_negated"}},{"id":"3c","name":"Araknahorn","rarity":7,"endlineTag":"hr","attack":180,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[["fire",29]],"rampSkills":[[["attack_boost_4",null],["fire_boost_2",null],["silkbind_boost",null],["attack_boost_3","3b"],["fire_boost_1","3a"],["attack_boost_2","2b"],["affinity_boost_2","2b"],["element_exploit","2b"],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[190,30,40,30,40,20,0],"maxSharpness":[190,30,40,30,40,70,0],"huntinghornSongs":{"x":"blight_negated","a":"elemental_attack_boost","xa":"knockbacks_negated"}}]],["Basarios Tree",[{"id":"4a","name":"Basarios Rock I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["fire",10]],"rampSkills":[[["defense_boost_1",null],["fire_boost_1",null],["dulling_strike",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"]]],"baseSharpness":[20,20,180,30,0,0,0],"maxSharpness":[20,20,180,80,0,0,0],"huntinghornSongs":{"x":"tremors_negated","a":"sonic_barrier","xa":"stamina_use_reduced"}},{"id":"4b","name":"Basarios Rock Mk.II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["fire",12]],"rampSkills":[[["defense_boost_1",null],["fire_boost_2",null],["dulling_strike",null],["fire_boost_1","4a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"]]],"baseSharpness":[20,10,180,40,0,0,0],"maxSharpness":[20,10,180,80,10,0,0],"huntinghornSongs":{"x":"tremors_negated","a":"sonic_barrier","xa":"stamina_use_reduced"}},{"id":"4c","name":"Gigant Rock","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["fire",15]],"rampSkills":[[["defense_boost_2",null],["fire_boost_3",null],["dulling_strike",null],["defense_boost_1","4b"],["fire_boost_2","4b"],["fire_boost_1","4a"],["attack_boost_1","1c"],["affinity_boost_2","1c"]]],"baseSharpness":[20,30,180,70,0,0,0],"maxSharpness":[20,30,180,80,40,0,0],"huntinghornSongs":{"x":"tremors_negated","a":"sonic_barrier","xa":"stamina_use_reduced"}}]],["Zinogre Tree",[{"id":"5a","name":"Usurper\'s Growl I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["defense_boost_1","4a"],["fire_boost_1","4a"],["dulling_strike","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"]]],"baseSharpness":[60,40,50,100,0,0,0],"maxSharpness":[60,40,50,150,0,0,0],"huntinghornSongs":{"x":"stun_negated","a":"attack_up","xa":"knockbacks_negated"}},{"id":"5b","name":"Usurper\'s Growl II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",24]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","5a"],["defense_boost_1","4a"],["fire_boost_1","4a"],["dulling_strike","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"]]],"baseSharpness":[60,30,100,90,20,0,0],"maxSharpness":[60,30,100,90,70,0,0],"huntinghornSongs":{"x":"stun_negated","a":"attack_up","xa":"knockbacks_negated"}},{"id":"5c","name":"Despot\'s Thunderclap","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",28]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","5b"],["attack_boost_1","5a"],["defense_boost_1","4a"],["fire_boost_1","4a"],["dulling_strike","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"]]],"baseSharpness":[60,40,120,100,30,0,0],"maxSharpness":[60,40,120,100,50,30,0],"huntinghornSongs":{"x":"stun_negated","a":"attack_up","xa":"knockbacks_negated"}}]],["Arzuros Tree",[{"id":"6a","name":"Zurogong Primo I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1b"]]],"baseSharpness":[140,20,40,0,0,0,0],"maxSharpness":[140,20,70,20,0,0,0],"huntinghornSongs":{"x":"attack_up","a":"defense_up","xa":"sonic_barrier"}},{"id":"6b","name":"Zurogong Primo II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["small_monster_exploit",null],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"baseSharpness":[140,30,50,30,0,0,0],"maxSharpness":[140,30,50,80,0,0,0],"huntinghornSongs":{"x":"attack_up","a":"defense_up","xa":"sonic_barrier"}},{"id":"6c","name":"Zurogong Secundo","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_2","6b"],["defense_boost_1","6b"],["small_monster_exploit","6b"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"baseSharpness":[20,50,150,80,0,0,0],"maxSharpness":[20,50,150,100,30,0,0],"huntinghornSongs":{"x":"attack_up","a":"defense_up","xa":"sonic_barrier"}}]],["Tigrex Tree",[{"id":"7a","name":"Striped Drag\\u00e3oga I","rarity":3,"endlineTag":"","attack":140,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["maximum_volume",null],["defense_boost_1","6b"],["small_monster_exploit","6b"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"attack_up","xa":"sonic_wave"}},{"id":"7b","name":"Striped Drag\\u00e3oga II","rarity":6,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["maximum_volume",null],["affinity_boost_1","7a"],["defense_boost_1","6b"],["small_monster_exploit","6b"],["attack_boost_1","6a"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,50,30,0],"huntinghornSongs":{"x":"earplugs_s","a":"attack_up","xa":"sonic_wave"}},{"id":"7c","name":"Tigrex Horn","rarity":6,"endlineTag":"hr","attack":210,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["maximum_volume",null],["affinity_boost_2","7b"],["affinity_boost_1","7a"],["defense_boost_1","6b"],["small_monster_exploit","6b"],["attack_boost_1","6a"]]],"baseSharpness":[50,50,120,120,30,30,0],"maxSharpness":[50,50,120,120,30,30,0],"huntinghornSongs":{"x":"earplugs_s","a":"attack_up","xa":"sonic_wave"}}]],["Barioth Tree",[{"id":"8a","name":"Bariguiro I","rarity":2,"endlineTag":"","attack":90,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_1","6a"],["defense_boost_1","6a"],["small_monster_exploit","6a"]]],"baseSharpness":[50,50,80,70,0,0,0],"maxSharpness":[50,50,80,100,20,0,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"health_recovery_s","xa":"affinity_up"}},{"id":"8b","name":"Bariguiro II","rarity":5,"endlineTag":"","attack":150,"affinity":20,"defense":0,"decoSlots":[2],"eleStat":[["ice",18]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","8a"],["attack_boost_1","6a"],["defense_boost_1","6a"],["small_monster_exploit","6a"]]],"baseSharpness":[50,30,130,100,40,0,0],"maxSharpness":[50,30,130,100,80,10,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"health_recovery_s","xa":"affinity_up"}},{"id":"8c","name":"Algiguiro","rarity":6,"endlineTag":"hr","attack":170,"affinity":20,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","8b"],["attack_boost_2","8a"],["attack_boost_1","6a"],["defense_boost_1","6a"],["small_monster_exploit","6a"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,80,20,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"health_recovery_s","xa":"affinity_up"}}]],["Somnacanth Tree",[{"id":"9a","name":"Frilled Flute I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",12]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["dulling_strike",null],["defense_boost_1","6a"],["small_monster_exploit","6a"],["affinity_boost_2","1b"]]],"baseSharpness":[50,50,120,30,0,0,0],"maxSharpness":[50,50,120,80,0,0,0],"huntinghornSongs":{"x":"attack_up","a":"earplugs_s","xa":"defense_up"}},{"id":"9b","name":"Frilled Flute II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",15]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_1","9a"],["defense_boost_1","6a"],["small_monster_exploit","6a"],["affinity_boost_2","1b"]]],"baseSharpness":[40,60,110,40,0,0,0],"maxSharpness":[40,60,110,90,0,0,0],"huntinghornSongs":{"x":"attack_up","a":"earplugs_s","xa":"defense_up"}},{"id":"9c","name":"Illusory Flute","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["sleep",19]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","9b"],["attack_boost_1","9a"],["defense_boost_1","6a"],["small_monster_exploit","6a"],["affinity_boost_2","1b"]]],"baseSharpness":[50,90,120,90,0,0,0],"maxSharpness":[50,90,120,110,30,0,0],"huntinghornSongs":{"x":"attack_up","a":"earplugs_s","xa":"defense_up"}}]],["Ore Tree",[{"id":"10a","name":"Iron Horn I","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0],"huntinghornSongs":{"x":"sonic_wave","a":"stamina_recovery_up","xa":"defense_up"}},{"id":"10b","name":"Wind Horn","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,110,10,0,0,0],"huntinghornSongs":{"x":"sonic_wave","a":"stamina_recovery_up","xa":"defense_up"}},{"id":"10c","name":"Metal Bagpipe I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","10b"]]],"baseSharpness":[60,60,60,20,0,0,0],"maxSharpness":[60,60,60,70,0,0,0],"huntinghornSongs":{"x":"sonic_wave","a":"stamina_recovery_up","xa":"defense_up"}},{"id":"10d","name":"Great Bagpipe","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","10b"]]],"baseSharpness":[70,60,70,50,0,0,0],"maxSharpness":[70,60,70,100,0,0,0],"huntinghornSongs":{"x":"sonic_wave","a":"stamina_recovery_up","xa":"defense_up"}},{"id":"10e","name":"Heavy Bagpipe I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":12,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["affinity_boost_1","10d"],["defense_boost_2","10d"],["attack_boost_1","10b"]]],"baseSharpness":[100,90,90,50,20,0,0],"maxSharpness":[100,90,90,50,50,20,0],"huntinghornSongs":{"x":"sonic_wave","a":"stamina_recovery_up","xa":"attack_up"}},{"id":"10f","name":"Fortissimo","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":15,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","10e"],["affinity_boost_1","10d"],["defense_boost_2","10d"],["attack_boost_1","10b"]]],"baseSharpness":[90,90,90,50,30,0,0],"maxSharpness":[90,90,90,50,50,30,0],"huntinghornSongs":{"x":"sonic_wave","a":"stamina_recovery_up","xa":"attack_up"}}]],["Nargacuga Tree",[{"id":"11a","name":"Hidden Harmonic I","rarity":5,"endlineTag":"","attack":140,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["defense_boost_3","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["attack_boost_1","10b"]]],"baseSharpness":[100,30,70,100,50,0,0],"maxSharpness":[100,30,70,100,80,20,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"attack_up","xa":"affinity_up"}},{"id":"11b","name":"Hidden Harmonic II","rarity":6,"endlineTag":"","attack":160,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","11a"],["defense_boost_3","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["attack_boost_1","10b"]]],"baseSharpness":[70,40,120,90,60,20,0],"maxSharpness":[70,40,120,90,60,20,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"attack_up","xa":"affinity_up"}},{"id":"11c","name":"Cry in the Night","rarity":6,"endlineTag":"hr","attack":170,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","11b"],["attack_boost_2","11a"],["defense_boost_3","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["attack_boost_1","10b"]]],"baseSharpness":[70,40,100,90,70,30,0],"maxSharpness":[70,40,100,90,70,30,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"attack_up","xa":"affinity_up"}}]],["Pukei-Pukei Tree",[{"id":"12a","name":"Pukei Bagpipe I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",18]],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["poison_boost_1",null],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[60,70,20,50,0,0,0],"maxSharpness":[60,70,20,100,0,0,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"stamina_recovery_up","xa":"health_regeneration"}},{"id":"12b","name":"Pukei Bagpipe II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",24]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_1",null],["attack_boost_2","12a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[60,60,70,90,20,0,0],"maxSharpness":[60,60,70,90,70,0,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"stamina_recovery_up","xa":"health_regeneration"}},{"id":"12c","name":"Datura Lurr","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",27]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_2",null],["poison_boost_1","12b"],["attack_boost_2","12a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[60,60,100,100,30,0,0],"maxSharpness":[60,60,100,100,70,10,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"stamina_recovery_up","xa":"health_regeneration"}}]],["Anjanath Tree",[{"id":"13a","name":"Flammenkornett I","rarity":5,"endlineTag":"","attack":190,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",18]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_3","12b"],["defense_boost_1","12b"],["poison_boost_1","12b"],["attack_boost_2","12a"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[140,120,30,60,0,0,0],"maxSharpness":[140,120,30,90,20,0,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"health_recovery_s","xa":"attack_up"}},{"id":"13b","name":"Flammenkornett II","rarity":6,"endlineTag":"","attack":200,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",20]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","13a"],["attack_boost_3","12b"],["defense_boost_1","12b"],["poison_boost_1","12b"],["attack_boost_2","12a"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[130,120,20,80,0,0,0],"maxSharpness":[130,120,20,100,30,0,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"health_recovery_s","xa":"attack_up"}},{"id":"13c","name":"Forte Flammenkornett","rarity":6,"endlineTag":"hr","attack":210,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",22]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","13b"],["fire_boost_2","13b"],["fire_boost_1","13a"],["attack_boost_3","12b"],["defense_boost_1","12b"],["poison_boost_1","12b"],["attack_boost_2","12a"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[120,120,30,60,20,0,0],"maxSharpness":[120,120,30,60,70,0,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"health_recovery_s","xa":"attack_up"}}]],["Rathian Tree",[{"id":"14a","name":"Valkyrie Chordmaker I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",16]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["small_monster_exploit",null],["attack_boost_2","10c"],["affinity_boost_1","10c"],["defense_boost_2","10c"]]],"baseSharpness":[50,50,100,50,0,0,0],"maxSharpness":[50,50,100,100,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_use_reduced","xa":"divine_protection"}},{"id":"14b","name":"Valkyrie Chordmaker II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",18]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["small_monster_exploit",null],["attack_boost_1","14a"],["affinity_boost_1","10c"],["defense_boost_2","10c"]]],"baseSharpness":[40,50,90,70,0,0,0],"maxSharpness":[40,50,90,120,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_use_reduced","xa":"divine_protection"}},{"id":"14c","name":"Queen Chordmaker","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["small_monster_exploit",null],["fire_boost_1","14b"],["attack_boost_1","14a"],["affinity_boost_1","10c"],["defense_boost_2","10c"]]],"baseSharpness":[40,60,90,90,20,0,0],"maxSharpness":[40,60,90,90,50,20,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_use_reduced","xa":"divine_protection"}}]],["Barroth Tree",[{"id":"15a","name":"Sandpipe I","rarity":2,"endlineTag":"","attack":120,"affinity":-30,"defense":8,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[60,60,130,0,0,0,0],"maxSharpness":[60,60,140,40,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"sonic_wave","xa":"stamina_use_reduced"}},{"id":"15b","name":"Sandpipe II","rarity":3,"endlineTag":"","attack":150,"affinity":-30,"defense":8,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","15a"],["attack_boost_1","10b"]]],"baseSharpness":[70,70,120,40,0,0,0],"maxSharpness":[70,70,120,80,10,0,0],"huntinghornSongs":{"x":"defense_up","a":"sonic_wave","xa":"stamina_use_reduced"}},{"id":"15c","name":"Sandcrier","rarity":5,"endlineTag":"hr","attack":200,"affinity":-30,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","15b"],["defense_boost_1","15a"],["attack_boost_1","10b"]]],"baseSharpness":[60,70,130,90,0,0,0],"maxSharpness":[60,70,130,110,10,20,0],"huntinghornSongs":{"x":"defense_up","a":"sonic_wave","xa":"stamina_use_reduced"}}]],["Tetranadon Tree",[{"id":"16a","name":"Frog Flute I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",12]],"rampSkills":[[["defense_boost_1",null],["water_boost_1",null],["dulling_strike",null],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[30,70,80,20,0,0,0],"maxSharpness":[30,70,80,70,0,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"attack_up","xa":"tremors_negated"}},{"id":"16b","name":"Frog Flute II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":10,"decoSlots":[2],"eleStat":[["water",16]],"rampSkills":[[["defense_boost_1",null],["water_boost_2",null],["dulling_strike",null],["water_boost_1","16a"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[40,90,110,60,0,0,0],"maxSharpness":[40,90,110,100,10,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"attack_up","xa":"tremors_negated"}},{"id":"16c","name":"Amphibia Allargando","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["water",18]],"rampSkills":[[["defense_boost_1",null],["water_boost_3",null],["dulling_strike",null],["water_boost_2","16b"],["water_boost_1","16a"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[40,90,110,110,0,0,0],"maxSharpness":[40,90,110,130,30,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"attack_up","xa":"tremors_negated"}}]],["Izuchi Tree",[{"id":"17a","name":"Wind Thief Horn I","rarity":1,"endlineTag":"","attack":80,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[70,50,50,30,0,0,0],"maxSharpness":[70,50,50,80,0,0,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"affinity_up","xa":"health_recovery_s"}},{"id":"17b","name":"Wind Thief Horn II","rarity":2,"endlineTag":"","attack":90,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","17a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[80,50,70,50,0,0,0],"maxSharpness":[80,50,70,50,50,0,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"affinity_up","xa":"health_recovery_s"}},{"id":"17c","name":"Gale Horn","rarity":4,"endlineTag":"hr","attack":150,"affinity":10,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","17b"],["affinity_boost_1","17a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[80,70,30,70,50,0,0],"maxSharpness":[80,70,30,70,50,50,0],"huntinghornSongs":{"x":"stamina_recovery_up","a":"affinity_up","xa":"health_recovery_s"}}]],["Royal Ludroth Tree",[{"id":"18a","name":"Droth Drone I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",30]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","17a"],["small_monster_exploit","17a"],["buddy_rally","17a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[50,40,70,40,0,0,0],"maxSharpness":[50,40,70,90,0,0,0],"huntinghornSongs":{"x":"blight_negated","a":"defense_up","xa":"sonic_wave"}},{"id":"18b","name":"Droth Drone II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",32]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","17a"],["small_monster_exploit","17a"],["buddy_rally","17a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[60,60,80,50,0,0,0],"maxSharpness":[60,60,80,100,0,0,0],"huntinghornSongs":{"x":"blight_negated","a":"defense_up","xa":"sonic_wave"}},{"id":"18c","name":"Droth Roar","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",35]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","18b"],["water_boost_1","18b"],["affinity_boost_1","17a"],["small_monster_exploit","17a"],["buddy_rally","17a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[60,50,70,90,30,0,0],"maxSharpness":[60,50,70,90,60,20,0],"huntinghornSongs":{"x":"blight_negated","a":"defense_up","xa":"sonic_wave"}}]],["Bone Tree",[{"id":"19a","name":"Bone Horn I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"defense_up","xa":"attack_up"}},{"id":"19b","name":"Bone Horn II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"defense_up","xa":"attack_up"}},{"id":"19c","name":"Hardened Bone Horn","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","19b"]]],"baseSharpness":[100,70,70,10,0,0,0],"maxSharpness":[100,70,70,60,0,0,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"defense_up","xa":"attack_up"}},{"id":"19d","name":"Hunter\'s Horn I","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"divine_protection","xa":"attack_up"}},{"id":"19e","name":"Native\'s Horn","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","19d"],["attack_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[150,120,20,60,0,0,0],"maxSharpness":[150,120,20,60,50,0,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"divine_protection","xa":"attack_up"}}]],["Diablos Tree",[{"id":"20a","name":"Duo Horn I","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_3","19d"],["dulling_strike","19d"],["attack_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[90,80,80,100,0,0,0],"maxSharpness":[90,80,80,130,20,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_use_reduced","xa":"earplugs_l"}},{"id":"20b","name":"Duo Horn II","rarity":6,"endlineTag":"","attack":230,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","20a"],["attack_boost_3","19d"],["dulling_strike","19d"],["attack_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[90,60,80,120,0,0,0],"maxSharpness":[90,60,80,140,30,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_use_reduced","xa":"earplugs_l"}},{"id":"20c","name":"Duo Risoluto","rarity":7,"endlineTag":"hr","attack":240,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_2","20b"],["defense_boost_1","20a"],["attack_boost_3","19d"],["dulling_strike","19d"],["attack_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,60,80,120,10,0,0],"maxSharpness":[80,60,80,120,50,10,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_use_reduced","xa":"earplugs_l"}}]],["Bullfango Tree",[{"id":"21a","name":"Bull Grunt I","rarity":4,"endlineTag":"","attack":180,"affinity":-5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["dulling_strike",null],["maximum_volume",null],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[70,90,110,20,10,0,0],"maxSharpness":[70,90,110,20,50,10,0],"huntinghornSongs":{"x":"divine_protection","a":"knockbacks_negated","xa":"stun_negated"}},{"id":"21b","name":"Bull Grunt II","rarity":5,"endlineTag":"","attack":190,"affinity":-5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["dulling_strike",null],["maximum_volume",null],["defense_boost_1","21a"],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[70,80,90,50,10,0,0],"maxSharpness":[70,80,90,50,40,20,0],"huntinghornSongs":{"x":"divine_protection","a":"knockbacks_negated","xa":"stun_negated"}},{"id":"21c","name":"Wild Grunt","rarity":6,"endlineTag":"hr","attack":230,"affinity":-5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_3",null],["dulling_strike",null],["maximum_volume",null],["defense_boost_2","21b"],["defense_boost_1","21a"],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,90,110,60,10,0,0],"maxSharpness":[80,90,110,60,20,40,0],"huntinghornSongs":{"x":"divine_protection","a":"knockbacks_negated","xa":"stun_negated"}}]],["Rathalos Tree",[{"id":"22a","name":"Flame Feroce I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,80,70,50,0,0,0],"maxSharpness":[50,80,70,80,20,0,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"sonic_wave","xa":"stamina_recovery_up"}},{"id":"22b","name":"Flame Feroce II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",32]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,90,80,90,20,0,0],"maxSharpness":[70,90,80,90,60,10,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"sonic_wave","xa":"stamina_recovery_up"}},{"id":"22c","name":"Rathalos Feroce","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",35]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","22b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,70,80,90,40,0,0],"maxSharpness":[70,70,80,90,70,20,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"sonic_wave","xa":"stamina_recovery_up"}}]],["Kulu-Ya-Ku Tree",[{"id":"23a","name":"Kulu Mosso I","rarity":2,"endlineTag":"","attack":90,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["spiribird_doubled",null],["attack_boost_2","19b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[60,60,40,40,0,0,0],"maxSharpness":[60,60,40,90,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_recovery_up","xa":"stun_negated"}},{"id":"23b","name":"Kulu Mosso II","rarity":3,"endlineTag":"","attack":110,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["spiribird_doubled",null],["attack_boost_1","23a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,70,40,70,0,0,0],"maxSharpness":[70,70,40,120,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_recovery_up","xa":"stun_negated"}},{"id":"23c","name":"Kulu Grosso","rarity":4,"endlineTag":"hr","attack":150,"affinity":25,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["spiribird_doubled",null],["affinity_boost_2","23b"],["attack_boost_1","23a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,60,50,90,30,0,0],"maxSharpness":[70,60,50,90,80,0,0],"huntinghornSongs":{"x":"defense_up","a":"stamina_recovery_up","xa":"stun_negated"}}]],["Khezu Tree",[{"id":"24a","name":"Khezu Horn I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[40,30,110,20,0,0,0],"maxSharpness":[40,30,110,70,0,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_regeneration","xa":"elemental_attack_boost"}},{"id":"24b","name":"Khezu Horn II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",24]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","24a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,40,120,40,0,0,0],"maxSharpness":[50,40,120,90,0,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_regeneration","xa":"elemental_attack_boost"}},{"id":"24c","name":"Khezu Flute","rarity":4,"endlineTag":"hr","attack":130,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",32]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_3","24b"],["thunder_boost_1","24b"],["attack_boost_2","24a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[60,40,110,70,20,0,0],"maxSharpness":[60,40,110,70,50,20,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_regeneration","xa":"elemental_attack_boost"}}]],["Bnahabra Tree",[{"id":"25a","name":"Vicello Nulo I","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["silkbind_boost",null]]],"baseSharpness":[110,20,70,0,0,0,0],"maxSharpness":[110,20,70,50,0,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"stamina_use_reduced","xa":"earplugs_s"}},{"id":"25b","name":"Vicello Nulo II","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["silkbind_boost",null],["affinity_boost_1","25a"]]],"baseSharpness":[110,20,30,40,0,0,0],"maxSharpness":[110,20,30,90,0,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"stamina_use_reduced","xa":"earplugs_s"}},{"id":"25c","name":"Vicello Unu","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["silkbind_boost",null],["attack_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[130,20,30,70,0,0,0],"maxSharpness":[130,20,30,120,0,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"stamina_use_reduced","xa":"earplugs_s"}},{"id":"25d","name":"Vicello Nulo Black I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",15]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["silkbind_boost",null],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[150,30,30,60,30,0,0],"maxSharpness":[150,30,30,60,70,10,0],"huntinghornSongs":{"x":"health_recovery_s","a":"stamina_use_reduced","xa":"earplugs_l"}},{"id":"25e","name":"Vicello Nulo Black II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",17]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_3",null],["silkbind_boost",null],["dragon_boost_2","25d"],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[140,20,20,80,40,0,0],"maxSharpness":[140,20,20,80,70,20,0],"huntinghornSongs":{"x":"health_recovery_s","a":"stamina_use_reduced","xa":"earplugs_l"}},{"id":"25f","name":"Vicello Uno Black","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",20]],"rampSkills":[[["attack_boost_4",null],["dragon_boost_3",null],["silkbind_boost",null],["attack_boost_3","25e"],["dragon_boost_2","25d"],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[160,20,20,90,60,0,0],"maxSharpness":[160,20,20,90,70,40,0],"huntinghornSongs":{"x":"health_recovery_s","a":"stamina_use_reduced","xa":"earplugs_l"}}]],["Bnahabra (Paralysis)",[{"id":"26a","name":"Vicello Nulo Green I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",15]],"rampSkills":[[["attack_boost_2",null],["paralysis_boost_1",null],["silkbind_boost",null],["affinity_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[150,40,30,30,0,0,0],"maxSharpness":[150,40,30,80,0,0,0],"huntinghornSongs":{"x":"defense_up","a":"tremors_negated","xa":"health_recovery_s"}},{"id":"26b","name":"Vicello Nulo Green II","rarity":5,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",18]],"rampSkills":[[["attack_boost_3",null],["paralysis_boost_1",null],["silkbind_boost",null],["attack_boost_2","26a"],["affinity_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[140,20,20,80,40,0,0],"maxSharpness":[140,20,20,80,70,20,0],"huntinghornSongs":{"x":"defense_up","a":"tremors_negated","xa":"health_recovery_s"}},{"id":"26c","name":"Vicello Unu Green","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",21]],"rampSkills":[[["attack_boost_4",null],["paralysis_boost_1",null],["silkbind_boost",null],["attack_boost_3","26b"],["attack_boost_2","26a"],["affinity_boost_2","25b"],["affinity_boost_1","25a"]]],"baseSharpness":[150,40,20,90,50,0,0],"maxSharpness":[150,40,20,90,70,30,0],"huntinghornSongs":{"x":"defense_up","a":"tremors_negated","xa":"health_recovery_s"}}]],["Bnahabra (Ice)",[{"id":"27a","name":"Vicello Nulo White I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",8]],"rampSkills":[[["attack_boost_2",null],["ice_boost_1",null],["silkbind_boost",null],["affinity_boost_1","25a"]]],"baseSharpness":[140,10,20,30,0,0,0],"maxSharpness":[140,10,20,80,0,0,0],"huntinghornSongs":{"x":"health_regeneration","a":"stamina_use_reduced","xa":"sonic_wave"}},{"id":"27b","name":"Vicello Nulo White II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",10]],"rampSkills":[[["attack_boost_3",null],["ice_boost_2",null],["silkbind_boost",null],["attack_boost_2","27a"],["ice_boost_1","27a"],["affinity_boost_1","25a"]]],"baseSharpness":[130,20,30,70,0,0,0],"maxSharpness":[130,20,30,120,0,0,0],"huntinghornSongs":{"x":"health_regeneration","a":"stamina_use_reduced","xa":"sonic_wave"}},{"id":"27c","name":"Vicello Unu White","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["ice",13]],"rampSkills":[[["attack_boost_4",null],["ice_boost_3",null],["silkbind_boost",null],["attack_boost_3","27b"],["ice_boost_2","27b"],["attack_boost_2","27a"],["ice_boost_1","27a"],["affinity_boost_1","25a"]]],"baseSharpness":[140,20,20,80,40,0,0],"maxSharpness":[140,20,20,80,70,20,0],"huntinghornSongs":{"x":"health_regeneration","a":"stamina_use_reduced","xa":"sonic_wave"}}]],["Magnamalo Tree",[{"id":"28a","name":"Sinister Strum I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",13]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0],"huntinghornSongs":{"x":"sonic_barrier","a":"attack_and_defense_up","xa":"health_regeneration"}},{"id":"28b","name":"Sinister Strum II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",16]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","28a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0],"huntinghornSongs":{"x":"sonic_barrier","a":"attack_and_defense_up","xa":"health_regeneration"}},{"id":"28c","name":"Sinister Shadestrum","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",23]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","28b"],["attack_boost_2","28a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,50,40,0],"huntinghornSongs":{"x":"sonic_barrier","a":"attack_and_defense_up","xa":"health_regeneration"}}]],["Rajang Tree",[{"id":"29a","name":"Denden Daiko I","rarity":5,"endlineTag":"","attack":170,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["thunder",15]],"rampSkills":[[["thunder_boost_1",null],["dulling_strike",null],["maximum_volume",null]]],"baseSharpness":[30,40,150,80,0,0,0],"maxSharpness":[30,40,150,130,0,0,0],"huntinghornSongs":{"x":"attack_and_defense_up","a":"environment_damage_negated","xa":"tremors_negated"}},{"id":"29b","name":"Denden Daiko II","rarity":6,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",17]],"rampSkills":[[["thunder_boost_1",null],["dulling_strike",null],["maximum_volume",null]]],"baseSharpness":[30,50,180,80,10,0,0],"maxSharpness":[30,50,180,80,60,0,0],"huntinghornSongs":{"x":"attack_and_defense_up","a":"environment_damage_negated","xa":"tremors_negated"}},{"id":"29c","name":"Denden Doomsounder","rarity":7,"endlineTag":"hr","attack":210,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",20]],"rampSkills":[[["thunder_boost_2",null],["dulling_strike",null],["maximum_volume",null],["thunder_boost_1","29b"]]],"baseSharpness":[30,50,170,80,20,0,0],"maxSharpness":[30,50,170,80,60,10,0],"huntinghornSongs":{"x":"attack_and_defense_up","a":"environment_damage_negated","xa":"tremors_negated"}}]],["Ibushi Tree",[{"id":"30a","name":"Azure Elder Horn I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",9]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0],"huntinghornSongs":{"x":"stamina_use_reduced","a":"divine_protection","xa":"sonic_barrier"}},{"id":"30b","name":"Azure Elder Horn II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",11]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","30a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0],"huntinghornSongs":{"x":"stamina_use_reduced","a":"divine_protection","xa":"sonic_barrier"}},{"id":"30c","name":"Abyssal Gale Horn","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",14]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","30b"],["defense_boost_1","30a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0],"huntinghornSongs":{"x":"stamina_use_reduced","a":"divine_protection","xa":"sonic_barrier"}}]],["Narwa Tree",[{"id":"31a","name":"Thunderbolt Horn I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",34]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0],"huntinghornSongs":{"x":"stun_negated","a":"health_recovery_l","xa":"health_regeneration"}},{"id":"31b","name":"Abyssal Storm Horn","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",41]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","31a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0],"huntinghornSongs":{"x":"stun_negated","a":"health_recovery_l","xa":"health_regeneration"}}]],["Bazelgeuse Tree",[{"id":"32a","name":"Rookslayer Drum I","rarity":6,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["blast",15]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["maximum_volume",null]]],"baseSharpness":[60,90,60,90,0,0,0],"maxSharpness":[60,90,60,90,50,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"attack_up","xa":"health_recovery_l"}},{"id":"32b","name":"Rookslayer Drum II","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["blast",16]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["maximum_volume",null]]],"baseSharpness":[60,110,90,80,10,0,0],"maxSharpness":[60,110,90,80,30,30,0],"huntinghornSongs":{"x":"earplugs_s","a":"attack_up","xa":"health_recovery_l"}},{"id":"32c","name":"Bazelreid Rookslayer","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["blast",18]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["maximum_volume",null],["defense_boost_1","32b"],["blast_boost_2","32b"]]],"baseSharpness":[60,110,80,80,20,0,0],"maxSharpness":[60,110,80,80,30,40,0],"huntinghornSongs":{"x":"earplugs_s","a":"attack_up","xa":"health_recovery_l"}}]],["Kushala Daora Tree",[{"id":"33a","name":"Daora\'s Taus I","rarity":6,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",32]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[50,60,130,70,40,0,0],"maxSharpness":[50,60,130,70,60,30,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"stamina_use_reduced","xa":"sharpness_loss_reduced"}},{"id":"33b","name":"Daora\'s Baphophone","rarity":7,"endlineTag":"hr","attack":180,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",35]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","33a"],["affinity_boost_2","33a"]]],"baseSharpness":[50,70,130,50,40,10,0],"maxSharpness":[50,70,130,50,40,60,0],"huntinghornSongs":{"x":"environment_damage_negated","a":"stamina_use_reduced","xa":"sharpness_loss_reduced"}}]],["Teostra Tree",[{"id":"34a","name":"Teostra\'s Tiple I","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",40]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[60,70,80,130,10,0,0],"maxSharpness":[60,70,80,130,50,10,0],"huntinghornSongs":{"x":"health_regeneration","a":"health_recovery_s_plus_antidote","xa":"attack_and_defense_up"}},{"id":"34b","name":"Teostra\'s Orph\\u00e9e","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",42]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","34a"]]],"baseSharpness":[60,70,70,110,40,0,0],"maxSharpness":[60,70,70,110,70,20,0],"huntinghornSongs":{"x":"health_regeneration","a":"health_recovery_s_plus_antidote","xa":"attack_and_defense_up"}}]],["Chameleos Tree",[{"id":"35a","name":"Blessed Ocarina I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",37]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[170,30,60,70,20,0,0],"maxSharpness":[170,30,60,70,40,30,0],"huntinghornSongs":{"x":"earplugs_l","a":"wind_pressure_negated","xa":"elemental_attack_boost"}},{"id":"35b","name":"Cursed Ocarina","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","35a"]]],"baseSharpness":[170,30,60,50,40,0,0],"maxSharpness":[170,30,60,50,40,50,0],"huntinghornSongs":{"x":"earplugs_l","a":"wind_pressure_negated","xa":"elemental_attack_boost"}}]],["Valstrax Tree",[{"id":"36a","name":"Redwing Flute I","rarity":6,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",32]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"attack_and_affinity_up","xa":"sonic_wave"}},{"id":"36b","name":"Reddnaught Ritmico","rarity":7,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",37]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0],"huntinghornSongs":{"x":"elemental_attack_boost","a":"attack_and_affinity_up","xa":"sonic_wave"}}]],["Chaos Tree",[{"id":"37a","name":"Poison Fungasax I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",30]],"rampSkills":[[["attack_boost_2",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[40,60,150,0,0,0,0],"maxSharpness":[40,60,200,0,0,0,0],"huntinghornSongs":{"x":"stamina_use_reduced","a":"health_recovery_s","xa":"defense_up"}},{"id":"37b","name":"Poison Fungasax II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",32]],"rampSkills":[[["attack_boost_2",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[40,60,170,30,0,0,0],"maxSharpness":[40,60,170,80,0,0,0],"huntinghornSongs":{"x":"stamina_use_reduced","a":"health_recovery_s","xa":"defense_up"}},{"id":"37c","name":"Toxic Fungasax","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",35]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["spiribird_doubled",null],["attack_boost_2","37b"]]],"baseSharpness":[30,70,140,60,0,0,0],"maxSharpness":[30,70,140,80,30,0,0],"huntinghornSongs":{"x":"stamina_use_reduced","a":"health_recovery_s","xa":"defense_up"}}]],["Magia Tree",[{"id":"38a","name":"Magia Charm I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",12]],"rampSkills":[[["ice_boost_1",null],["dulling_strike",null],["silkbind_boost",null]]],"baseSharpness":[50,30,110,10,0,0,0],"maxSharpness":[50,30,110,60,0,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"sonic_barrier","xa":"health_recovery_s_plus_antidote"}},{"id":"38b","name":"Magia Charm II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",14]],"rampSkills":[[["ice_boost_1",null],["dulling_strike",null],["silkbind_boost",null]]],"baseSharpness":[50,60,110,30,0,0,0],"maxSharpness":[50,60,110,80,0,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"sonic_barrier","xa":"health_recovery_s_plus_antidote"}},{"id":"38c","name":"Magia Charm III","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",16]],"rampSkills":[[["ice_boost_2",null],["dulling_strike",null],["silkbind_boost",null],["ice_boost_1","38b"]]],"baseSharpness":[50,60,110,80,0,0,0],"maxSharpness":[50,60,110,120,10,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"sonic_barrier","xa":"health_recovery_s_plus_antidote"}},{"id":"38d","name":"Magia Charmbell","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["ice",20]],"rampSkills":[[["ice_boost_3",null],["dulling_strike",null],["silkbind_boost",null],["ice_boost_2","38c"],["ice_boost_1","38b"]]],"baseSharpness":[50,60,110,120,10,0,0],"maxSharpness":[50,60,110,120,60,0,0],"huntinghornSongs":{"x":"health_recovery_s","a":"sonic_barrier","xa":"health_recovery_s_plus_antidote"}}]],["Spio Tree",[{"id":"39a","name":"Cornupion I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["paralysis",10]],"rampSkills":[[["defense_boost_1",null],["paralysis_boost_1",null],["silkbind_boost",null]]],"baseSharpness":[50,40,100,60,0,0,0],"maxSharpness":[50,40,100,100,10,0,0],"huntinghornSongs":{"x":"health_recovery_s_plus_antidote","a":"defense_up","xa":"affinity_up"}},{"id":"39b","name":"Cornupion II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["paralysis",12]],"rampSkills":[[["defense_boost_2",null],["paralysis_boost_1",null],["silkbind_boost",null],["defense_boost_1","39a"]]],"baseSharpness":[40,30,100,80,0,0,0],"maxSharpness":[40,30,100,100,30,0,0],"huntinghornSongs":{"x":"health_recovery_s_plus_antidote","a":"defense_up","xa":"affinity_up"}},{"id":"39c","name":"Webbed Cornupion","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":10,"decoSlots":[2],"eleStat":[["paralysis",15]],"rampSkills":[[["defense_boost_3",null],["paralysis_boost_1",null],["silkbind_boost",null],["defense_boost_2","39b"],["defense_boost_1","39a"]]],"baseSharpness":[40,50,90,100,20,0,0],"maxSharpness":[40,50,90,100,50,20,0],"huntinghornSongs":{"x":"health_recovery_s_plus_antidote","a":"defense_up","xa":"affinity_up"}}]],["Bombadgy Tree",[{"id":"40a","name":"Grass Flute I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",10]],"rampSkills":[[["defense_boost_1",null],["blast_boost_1",null],["dulling_strike",null]]],"baseSharpness":[90,60,80,20,0,0,0],"maxSharpness":[90,60,80,70,0,0,0],"huntinghornSongs":{"x":"wind_pressure_negated","a":"health_regeneration","xa":"sonic_barrier"}},{"id":"40b","name":"Grass Flute II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["blast",12]],"rampSkills":[[["defense_boost_2",null],["blast_boost_2",null],["dulling_strike",null],["defense_boost_1","40a"],["blast_boost_1","40a"]]],"baseSharpness":[90,60,60,90,0,0,0],"maxSharpness":[90,60,60,130,10,0,0],"huntinghornSongs":{"x":"wind_pressure_negated","a":"health_regeneration","xa":"sonic_barrier"}},{"id":"40c","name":"Bombadgy\'s Cry","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["blast",15]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["dulling_strike",null],["blast_boost_2","40b"],["defense_boost_1","40a"],["blast_boost_1","40a"]]],"baseSharpness":[90,60,60,130,10,0,0],"maxSharpness":[90,60,60,130,60,0,0],"huntinghornSongs":{"x":"wind_pressure_negated","a":"health_regeneration","xa":"sonic_barrier"}}]],["Rampage Tree",[{"id":"ra","name":"Rampage Agitato I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_recovery_s","xa":"sonic_wave"}},{"id":"rb","name":"Rampage Agitato II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null],["attack_melody_1",null],["defensive_melody_1",null],["healing_melody_1",null],["resilient_melody_1",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_recovery_s","xa":"sonic_wave"}},{"id":"rc","name":"Rampage Agitato III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null],["attack_melody_1",null],["defensive_melody_1",null],["healing_melody_1",null],["resilient_melody_1",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_recovery_s","xa":"sonic_wave"}},{"id":"rd","name":"Rampage Agitato IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["affinity_surge",null],["attack_melody_2",null],["defensive_melody_2",null],["healing_melody_2",null],["resilient_melody_2",null],["attack_melody_1","rc"],["defensive_melody_1","rc"],["healing_melody_1","rc"],["resilient_melody_1","rc"]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_recovery_s","xa":"sonic_wave"}},{"id":"re","name":"Rampage Agitato V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["attack_melody_2",null],["defensive_melody_2",null],["healing_melody_2",null],["resilient_melody_2",null],["attack_melody_1","rc"],["defensive_melody_1","rc"],["healing_melody_1","rc"],["resilient_melody_1","rc"]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_recovery_s","xa":"sonic_wave"}},{"id":"rf","name":"Rampage Agitato S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_3",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["elemental_boost_2","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_4",null],["water_4",null],["thunder_4",null],["ice_4",null],["dragon_4",null],["poison_3",null],["paralysis_3",null],["sleep_3",null],["blast_3",null],["fire_3","re"],["water_3","re"],["thunder_3","re"],["ice_3","re"],["dragon_3","re"],["poison_2","re"],["paralysis_2","re"],["sleep_2","re"],["blast_2","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["poison_1","rc"],["paralysis_1","rc"],["sleep_1","rc"],["blast_1","rc"],["fire_1","rb"],["water_1","rb"],["thunder_1","rb"],["ice_1","rb"],["dragon_1","rb"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["attack_melody_2",null],["defensive_melody_2",null],["healing_melody_2",null],["resilient_melody_2",null],["attack_melody_1","rc"],["defensive_melody_1","rc"],["healing_melody_1","rc"],["resilient_melody_1","rc"]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0],"huntinghornSongs":{"x":"earplugs_s","a":"health_recovery_s","xa":"sonic_wave"}}]]]}';
 
-export const huntinghornsArray: Readonly<HuntingHorn[]> = [
-    __generated_huntinghorn__1a,
-    __generated_huntinghorn__1b,
-    __generated_huntinghorn__1c,
-    __generated_huntinghorn__1d,
-    __generated_huntinghorn__1e,
-    __generated_huntinghorn__1f,
-    __generated_huntinghorn__2a,
-    __generated_huntinghorn__2b,
-    __generated_huntinghorn__2c,
-    __generated_huntinghorn__3a,
-    __generated_huntinghorn__3b,
-    __generated_huntinghorn__3c,
-    __generated_huntinghorn__4a,
-    __generated_huntinghorn__4b,
-    __generated_huntinghorn__4c,
-    __generated_huntinghorn__5a,
-    __generated_huntinghorn__5b,
-    __generated_huntinghorn__5c,
-    __generated_huntinghorn__6a,
-    __generated_huntinghorn__6b,
-    __generated_huntinghorn__6c,
-    __generated_huntinghorn__7a,
-    __generated_huntinghorn__7b,
-    __generated_huntinghorn__7c,
-    __generated_huntinghorn__8a,
-    __generated_huntinghorn__8b,
-    __generated_huntinghorn__8c,
-    __generated_huntinghorn__9a,
-    __generated_huntinghorn__9b,
-    __generated_huntinghorn__9c,
-    __generated_huntinghorn__10a,
-    __generated_huntinghorn__10b,
-    __generated_huntinghorn__10c,
-    __generated_huntinghorn__10d,
-    __generated_huntinghorn__10e,
-    __generated_huntinghorn__10f,
-    __generated_huntinghorn__11a,
-    __generated_huntinghorn__11b,
-    __generated_huntinghorn__11c,
-    __generated_huntinghorn__12a,
-    __generated_huntinghorn__12b,
-    __generated_huntinghorn__12c,
-    __generated_huntinghorn__13a,
-    __generated_huntinghorn__13b,
-    __generated_huntinghorn__13c,
-    __generated_huntinghorn__14a,
-    __generated_huntinghorn__14b,
-    __generated_huntinghorn__14c,
-    __generated_huntinghorn__15a,
-    __generated_huntinghorn__15b,
-    __generated_huntinghorn__15c,
-    __generated_huntinghorn__16a,
-    __generated_huntinghorn__16b,
-    __generated_huntinghorn__16c,
-    __generated_huntinghorn__17a,
-    __generated_huntinghorn__17b,
-    __generated_huntinghorn__17c,
-    __generated_huntinghorn__18a,
-    __generated_huntinghorn__18b,
-    __generated_huntinghorn__18c,
-    __generated_huntinghorn__19a,
-    __generated_huntinghorn__19b,
-    __generated_huntinghorn__19c,
-    __generated_huntinghorn__19d,
-    __generated_huntinghorn__19e,
-    __generated_huntinghorn__20a,
-    __generated_huntinghorn__20b,
-    __generated_huntinghorn__20c,
-    __generated_huntinghorn__21a,
-    __generated_huntinghorn__21b,
-    __generated_huntinghorn__21c,
-    __generated_huntinghorn__22a,
-    __generated_huntinghorn__22b,
-    __generated_huntinghorn__22c,
-    __generated_huntinghorn__23a,
-    __generated_huntinghorn__23b,
-    __generated_huntinghorn__23c,
-    __generated_huntinghorn__24a,
-    __generated_huntinghorn__24b,
-    __generated_huntinghorn__24c,
-    __generated_huntinghorn__25a,
-    __generated_huntinghorn__25b,
-    __generated_huntinghorn__25c,
-    __generated_huntinghorn__25d,
-    __generated_huntinghorn__25e,
-    __generated_huntinghorn__25f,
-    __generated_huntinghorn__26a,
-    __generated_huntinghorn__26b,
-    __generated_huntinghorn__26c,
-    __generated_huntinghorn__27a,
-    __generated_huntinghorn__27b,
-    __generated_huntinghorn__27c,
-    __generated_huntinghorn__28a,
-    __generated_huntinghorn__28b,
-    __generated_huntinghorn__28c,
-    __generated_huntinghorn__29a,
-    __generated_huntinghorn__29b,
-    __generated_huntinghorn__29c,
-    __generated_huntinghorn__30a,
-    __generated_huntinghorn__30b,
-    __generated_huntinghorn__30c,
-    __generated_huntinghorn__31a,
-    __generated_huntinghorn__31b,
-    __generated_huntinghorn__32a,
-    __generated_huntinghorn__32b,
-    __generated_huntinghorn__32c,
-    __generated_huntinghorn__33a,
-    __generated_huntinghorn__33b,
-    __generated_huntinghorn__34a,
-    __generated_huntinghorn__34b,
-    __generated_huntinghorn__35a,
-    __generated_huntinghorn__35b,
-    __generated_huntinghorn__36a,
-    __generated_huntinghorn__36b,
-    __generated_huntinghorn__37a,
-    __generated_huntinghorn__37b,
-    __generated_huntinghorn__37c,
-    __generated_huntinghorn__38a,
-    __generated_huntinghorn__38b,
-    __generated_huntinghorn__38c,
-    __generated_huntinghorn__38d,
-    __generated_huntinghorn__39a,
-    __generated_huntinghorn__39b,
-    __generated_huntinghorn__39c,
-    __generated_huntinghorn__40a,
-    __generated_huntinghorn__40b,
-    __generated_huntinghorn__40c,
-    __generated_huntinghorn__ra,
-    __generated_huntinghorn__rb,
-    __generated_huntinghorn__rc,
-    __generated_huntinghorn__rd,
-    __generated_huntinghorn__re,
-    __generated_huntinghorn__rf,
-];
+export const huntinghornsArray: Readonly<HuntingHorn[]> = loadWeaponPayload<HuntingHorn>(payload);
@@ -36,5428 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type InsectGlaive,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kinsect_level_boost,
-    __generated_ramp__kinsect_level_boost_1,
-    __generated_ramp__kinsect_level_boost_2,
-    __generated_ramp__kinsect_level_boost_3,
-    __generated_ramp__kinsect_level_boost_4,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__water_boost_4,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_insectglaive__1a: InsectGlaive = {
-    category: "insectglaive",
-    id: "1a",
-
-    name: "Kamura Glaive I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraglaivei",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_insectglaive__1b: InsectGlaive = {
-    category: "insectglaive",
-    id: "1b",
-
-    name: "Kamura Glaive II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraglaiveii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_insectglaive__1c: InsectGlaive = {
-    category: "insectglaive",
-    id: "1c",
-
-    name: "Kamura Glaive III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraglaiveiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_insectglaive__1d: InsectGlaive = {
-    category: "insectglaive",
-    id: "1d",
-
-    name: "Kamura Glaive IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraglaiveiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_insectglaive__1e: InsectGlaive = {
-    category: "insectglaive",
-    id: "1e",
-
-    name: "Kamura Glaive V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__1d],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1d],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraglaivev",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_insectglaive__1f: InsectGlaive = {
-    category: "insectglaive",
-    id: "1f",
-
-    name: "Kamura Ninja Glaive",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_insectglaive__1e],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__1d],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1d],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjaglaive",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_insectglaive__2a: InsectGlaive = {
-    category: "insectglaive",
-    id: "2a",
-
-    name: "Hidden Scythe I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenscythei",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_insectglaive__2b: InsectGlaive = {
-    category: "insectglaive",
-    id: "2b",
-
-    name: "Hidden Scythe II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__2a],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 100, 50, 0, 0],
-    maxSharpness:  [100, 30, 70, 100, 70, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenscytheii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_insectglaive__2c: InsectGlaive = {
-    category: "insectglaive",
-    id: "2c",
-
-    name: "Evening Calm",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__2b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__2a],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 110, 90, 60, 30, 0],
-    maxSharpness:  [70, 40, 110, 90, 60, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "eveningcalm",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_insectglaive__3a: InsectGlaive = {
-    category: "insectglaive",
-    id: "3a",
-
-    name: "Fox Halberd I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 40, 30, 70, 0, 0, 0],
-    maxSharpness:  [110, 40, 30, 90, 30, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "foxhalberdi",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_insectglaive__3b: InsectGlaive = {
-    category: "insectglaive",
-    id: "3b",
-
-    name: "Fox Halberd II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__3a],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__3a],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 90, 70, 50, 30, 0, 0],
-    maxSharpness:  [110, 90, 70, 50, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "foxhalberdii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_insectglaive__3c: InsectGlaive = {
-    category: "insectglaive",
-    id: "3c",
-
-    name: "Curved Naganagi",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__3b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__3a],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__3a],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 70, 50, 50, 0, 0],
-    maxSharpness:  [110, 70, 70, 50, 50, 50, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "curvednaganagi",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_insectglaive__4a: InsectGlaive = {
-    category: "insectglaive",
-    id: "4a",
-
-    name: "Frilled Jab I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 30, 0, 0, 0],
-    maxSharpness:  [50, 50, 120, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "frilledjabi",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_insectglaive__4b: InsectGlaive = {
-    category: "insectglaive",
-    id: "4b",
-
-    name: "Frilled Jab II",
-    treeName: "Somnacanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__4a],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 110, 40, 0, 0, 0],
-    maxSharpness:  [40, 60, 110, 80, 10, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "frilledjabii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_insectglaive__4c: InsectGlaive = {
-    category: "insectglaive",
-    id: "4c",
-
-    name: "Illusory Frilled Jab",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__4b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__4a],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 120, 90, 0, 0, 0],
-    maxSharpness:  [50, 90, 120, 110, 30, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "illusoryfrilledjab",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_insectglaive__5a: InsectGlaive = {
-    category: "insectglaive",
-    id: "5a",
-
-    name: "Tigrex Kaina I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__sleep_boost_1, __generated_insectglaive__4b],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__4b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__4a],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexkainai",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_insectglaive__5b: InsectGlaive = {
-    category: "insectglaive",
-    id: "5b",
-
-    name: "Tigrex Kaina II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__5a],
-            [__generated_ramp__sleep_boost_1, __generated_insectglaive__4b],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__4b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__4a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexkainaii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_insectglaive__5c: InsectGlaive = {
-    category: "insectglaive",
-    id: "5c",
-
-    name: "Tigerclaw Glaive",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__5b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__5a],
-            [__generated_ramp__sleep_boost_1, __generated_insectglaive__4b],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__4b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__4a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__1c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 50, 20, 0],
-    maxSharpness:  [50, 40, 120, 120, 50, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "tigerclawglaive",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_insectglaive__6a: InsectGlaive = {
-    category: "insectglaive",
-    id: "6a",
-
-    name: "Leaping Glaive I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 80, 20, 0, 0, 0],
-    maxSharpness:  [30, 70, 80, 70, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "leapingglaivei",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_insectglaive__6b: InsectGlaive = {
-    category: "insectglaive",
-    id: "6b",
-
-    name: "Leaping Glaive II",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__6a],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 60, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 100, 10, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "leapingglaiveii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_insectglaive__6c: InsectGlaive = {
-    category: "insectglaive",
-    id: "6c",
-
-    name: "Leapfrog",
-    treeName: "Tetranadon Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_2, __generated_insectglaive__6b],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__6a],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__1b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 110, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 110, 50, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "leapfrog",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_insectglaive__7a: InsectGlaive = {
-    category: "insectglaive",
-    id: "7a",
-
-    name: "Iron Blade I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "ironbladei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_insectglaive__7b: InsectGlaive = {
-    category: "insectglaive",
-    id: "7b",
-
-    name: "Iron Blade II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 50, 20, 0, 0, 0],
-    maxSharpness:  [70, 60, 50, 70, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 1,
-    },
-
-    filterHelpers: {
-        nameLower: "ironbladeii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_insectglaive__7c: InsectGlaive = {
-    category: "insectglaive",
-    id: "7c",
-
-    name: "Steel Blade",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 50, 40, 0, 0, 0],
-    maxSharpness:  [80, 80, 50, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "steelblade",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_insectglaive__7d: InsectGlaive = {
-    category: "insectglaive",
-    id: "7d",
-
-    name: "Iron Bayonet I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 30, 60, 0, 0, 0],
-    maxSharpness:  [90, 70, 30, 90, 20, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "ironbayoneti",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_insectglaive__7e: InsectGlaive = {
-    category: "insectglaive",
-    id: "7e",
-
-    name: "Iron Bayonet II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 60, 50, 20, 0, 0],
-    maxSharpness:  [90, 80, 60, 50, 50, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "ironbayonetii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_insectglaive__7f: InsectGlaive = {
-    category: "insectglaive",
-    id: "7f",
-
-    name: "Hiten Blade",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__7e],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 40, 50, 40, 0, 0],
-    maxSharpness:  [90, 80, 40, 50, 60, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "hitenblade",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_insectglaive__8a: InsectGlaive = {
-    category: "insectglaive",
-    id: "8a",
-
-    name: "Rathmaul I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_3, __generated_insectglaive__7e],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__7e],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 90, 100, 10, 0, 0],
-    maxSharpness:  [70, 80, 90, 100, 60, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "rathmauli",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_insectglaive__8b: InsectGlaive = {
-    category: "insectglaive",
-    id: "8b",
-
-    name: "Rathmaul II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_3, __generated_insectglaive__7e],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__7e],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 140, 100, 20, 0, 0],
-    maxSharpness:  [60, 30, 140, 100, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "rathmaulii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_insectglaive__8c: InsectGlaive = {
-    category: "insectglaive",
-    id: "8c",
-
-    name: "Fogodance Rathmaul",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__8b],
-            [__generated_ramp__defense_boost_3, __generated_insectglaive__7e],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__7e],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 70, 100, 30, 0, 0],
-    maxSharpness:  [100, 50, 70, 100, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "firedancerathmaul",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_insectglaive__9a: InsectGlaive = {
-    category: "insectglaive",
-    id: "9a",
-
-    name: "Bolt Chamber I",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 80, 70, 10, 0, 0],
-    maxSharpness:  [70, 70, 80, 70, 60, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "boltchamberi",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_insectglaive__9b: InsectGlaive = {
-    category: "insectglaive",
-    id: "9b",
-
-    name: "Bolt Chamber II",
-    treeName: "Khezu Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__9a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 80, 20, 0, 0],
-    maxSharpness:  [60, 70, 70, 80, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "boltchamberii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_insectglaive__9c: InsectGlaive = {
-    category: "insectglaive",
-    id: "9c",
-
-    name: "Full Bolt Chamber",
-    treeName: "Khezu Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__9b],
-            [__generated_ramp__thunder_boost_1, __generated_insectglaive__9b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__9a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7d],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__7d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7c],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 100, 30, 0, 0],
-    maxSharpness:  [60, 70, 90, 100, 50, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "fullboltchamber",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_insectglaive__10a: InsectGlaive = {
-    category: "insectglaive",
-    id: "10a",
-
-    name: "Princess Regalia I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [30, 90, 80, 50, 0, 0, 0],
-    maxSharpness:  [30, 90, 80, 100, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "princessregaliai",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_insectglaive__10b: InsectGlaive = {
-    category: "insectglaive",
-    id: "10b",
-
-    name: "Princess Regalia II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__10a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [10, 90, 90, 90, 20, 0, 0],
-    maxSharpness:  [10, 90, 90, 90, 50, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "princessregaliaii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_insectglaive__10c: InsectGlaive = {
-    category: "insectglaive",
-    id: "10c",
-
-    name: "Queen Regalia",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__10a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [30, 90, 70, 120, 40, 0, 0],
-    maxSharpness:  [30, 90, 70, 120, 60, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "queenregalia",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_insectglaive__11a: InsectGlaive = {
-    category: "insectglaive",
-    id: "11a",
-
-    name: "Aknosom Pike I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 90, 40, 0, 0, 0],
-    maxSharpness:  [60, 60, 90, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "aknosompikei",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_insectglaive__11b: InsectGlaive = {
-    category: "insectglaive",
-    id: "11b",
-
-    name: "Aknosom Pike II",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__11a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 50, 0, 0, 0],
-    maxSharpness:  [50, 60, 90, 100, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "aknosompikeii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_insectglaive__11c: InsectGlaive = {
-    category: "insectglaive",
-    id: "11c",
-
-    name: "Daybreak Glaive",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_insectglaive__11b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__11a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 60, 20, 0, 0],
-    maxSharpness:  [50, 50, 120, 60, 50, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "daybreakglaive",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_insectglaive__12a: InsectGlaive = {
-    category: "insectglaive",
-    id: "12a",
-
-    name: "Kulu Glaive I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 30, 0, 0, 0],
-    maxSharpness:  [60, 80, 80, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kuluglaivei",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_insectglaive__12b: InsectGlaive = {
-    category: "insectglaive",
-    id: "12b",
-
-    name: "Kulu Glaive II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 90, 40, 0, 0, 0],
-    maxSharpness:  [60, 60, 90, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kuluglaiveii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_insectglaive__12c: InsectGlaive = {
-    category: "insectglaive",
-    id: "12c",
-
-    name: "Kulu Pike",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__12b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7b],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 50, 30, 0, 0],
-    maxSharpness:  [60, 80, 80, 50, 80, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "kulupike",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_insectglaive__13a: InsectGlaive = {
-    category: "insectglaive",
-    id: "13a",
-
-    name: "Kadachi Glaive I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__12a],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__12a],
-            [__generated_ramp__spiribird_doubled, __generated_insectglaive__12a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [130, 30, 50, 40, 0, 0, 0],
-    maxSharpness:  [130, 30, 50, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kadachiglaivei",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_insectglaive__13b: InsectGlaive = {
-    category: "insectglaive",
-    id: "13b",
-
-    name: "Kadachi Glaive II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__13a],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__12a],
-            [__generated_ramp__spiribird_doubled, __generated_insectglaive__12a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [130, 20, 40, 60, 0, 0, 0],
-    maxSharpness:  [130, 20, 40, 110, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "kadachiglaiveii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_insectglaive__13c: InsectGlaive = {
-    category: "insectglaive",
-    id: "13c",
-
-    name: "Shocking Pike",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__13b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__13b],
-            [__generated_ramp__thunder_boost_2, __generated_insectglaive__13b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__13a],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__12a],
-            [__generated_ramp__spiribird_doubled, __generated_insectglaive__12a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 30, 30, 50, 0, 0],
-    maxSharpness:  [100, 90, 30, 30, 70, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "shockingpike",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_insectglaive__14a: InsectGlaive = {
-    category: "insectglaive",
-    id: "14a",
-
-    name: "Lagombaglaive I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7a],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 110, 10, 0, 0, 0],
-    maxSharpness:  [80, 50, 110, 60, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "lagombaglaivei",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_insectglaive__14b: InsectGlaive = {
-    category: "insectglaive",
-    id: "14b",
-
-    name: "Lagombaglaive II",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__14a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 100, 90, 10, 0, 0],
-    maxSharpness:  [60, 40, 100, 90, 50, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "lagombaglaiveii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_insectglaive__14c: InsectGlaive = {
-    category: "insectglaive",
-    id: "14c",
-
-    name: "Lagombavarice",
-    treeName: "Lagombi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__14b],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__14a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__7a],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__7a],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 80, 90, 30, 0, 0],
-    maxSharpness:  [60, 40, 80, 90, 50, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "lagombavarice",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_insectglaive__15a: InsectGlaive = {
-    category: "insectglaive",
-    id: "15a",
-
-    name: "Bone Staff I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "bonestaffi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_insectglaive__15b: InsectGlaive = {
-    category: "insectglaive",
-    id: "15b",
-
-    name: "Bone Staff II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "bonestaffii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_insectglaive__15c: InsectGlaive = {
-    category: "insectglaive",
-    id: "15c",
-
-    name: "Aerial Glaive",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 60, 0, 0, 0, 0],
-    maxSharpness:  [100, 40, 110, 0, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "aerialglaive",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_insectglaive__15d: InsectGlaive = {
-    category: "insectglaive",
-    id: "15d",
-
-    name: "Sturdy Glaive I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 60, 20, 0, 0, 0],
-    maxSharpness:  [100, 70, 60, 70, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "sturdyglaivei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_insectglaive__15e: InsectGlaive = {
-    category: "insectglaive",
-    id: "15e",
-
-    name: "Sturdy Glaive II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "sturdyglaiveii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_insectglaive__15f: InsectGlaive = {
-    category: "insectglaive",
-    id: "15f",
-
-    name: "Sturdy Glaive Redux",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__15e],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 70, 20, 0, 0],
-    maxSharpness:  [80, 70, 60, 70, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "sturdyglaiveredux",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_insectglaive__16a: InsectGlaive = {
-    category: "insectglaive",
-    id: "16a",
-
-    name: "Sky-High Glaive I",
-    treeName: "Paralysis Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__15d],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [80, 60, 120, 30, 10, 0, 0],
-    maxSharpness:  [80, 60, 120, 30, 60, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "sky-highglaivei",
-        treeNameLower: "paralysistree",
-    },
-};
-
-const __generated_insectglaive__16b: InsectGlaive = {
-    category: "insectglaive",
-    id: "16b",
-
-    name: "Sky-High Glaive II",
-    treeName: "Paralysis Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__15d],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 120, 30, 20, 0, 0],
-    maxSharpness:  [80, 50, 120, 30, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "sky-highglaiveii",
-        treeNameLower: "paralysistree",
-    },
-};
-
-const __generated_insectglaive__16c: InsectGlaive = {
-    category: "insectglaive",
-    id: "16c",
-
-    name: "Highest of Glaives",
-    treeName: "Paralysis Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__16b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__15d],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 120, 20, 30, 0, 0],
-    maxSharpness:  [80, 50, 120, 20, 50, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "highestofglaives",
-        treeNameLower: "paralysistree",
-    },
-};
-
-const __generated_insectglaive__17a: InsectGlaive = {
-    category: "insectglaive",
-    id: "17a",
-
-    name: "Diablos Rod I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__16b],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__16b],
-            [__generated_ramp__anti_aerial_species, __generated_insectglaive__16b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__15d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [180, 30, 80, 40, 20, 0, 0],
-    maxSharpness:  [180, 30, 80, 40, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "diablosrodi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_insectglaive__17b: InsectGlaive = {
-    category: "insectglaive",
-    id: "17b",
-
-    name: "Diablos Rod II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__17a],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__16b],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__16b],
-            [__generated_ramp__anti_aerial_species, __generated_insectglaive__16b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__15d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [180, 30, 70, 40, 30, 0, 0],
-    maxSharpness:  [180, 30, 70, 40, 80, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "diablosrodii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_insectglaive__17c: InsectGlaive = {
-    category: "insectglaive",
-    id: "17c",
-
-    name: "Tyrant Rod",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__17b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__17a],
-            [__generated_ramp__silkbind_boost, __generated_insectglaive__16b],
-            [__generated_ramp__anti_aerial_species, __generated_insectglaive__16b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15d],
-            [__generated_ramp__dulling_strike, __generated_insectglaive__15d],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [170, 30, 60, 50, 40, 0, 0],
-    maxSharpness:  [170, 30, 60, 50, 80, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "tyrantrod",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_insectglaive__18a: InsectGlaive = {
-    category: "insectglaive",
-    id: "18a",
-
-    name: "Flammenkaefer I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 40, 20, 0, 0, 0],
-    maxSharpness:  [100, 90, 40, 70, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "flammenkaeferi",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_insectglaive__18b: InsectGlaive = {
-    category: "insectglaive",
-    id: "18b",
-
-    name: "Flammenkaefer II",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_insectglaive__18a],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-        ],
-    ],
-
-    baseSharpness: [140, 70, 80, 40, 20, 0, 0],
-    maxSharpness:  [140, 70, 80, 40, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "flammenkaeferii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_insectglaive__18c: InsectGlaive = {
-    category: "insectglaive",
-    id: "18c",
-
-    name: "Gnashing Flammenkaefer",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__18b],
-            [__generated_ramp__fire_boost_2, __generated_insectglaive__18b],
-            [__generated_ramp__fire_boost_1, __generated_insectglaive__18a],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-        ],
-    ],
-
-    baseSharpness: [130, 60, 80, 50, 30, 0, 0],
-    maxSharpness:  [130, 60, 80, 50, 80, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "gnashingflammenkaefer",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_insectglaive__19a: InsectGlaive = {
-    category: "insectglaive",
-    id: "19a",
-
-    name: "Gossglaive I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_insectglaive__18a],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-        ],
-    ],
-
-    baseSharpness: [90, 30, 90, 40, 0, 0, 0],
-    maxSharpness:  [90, 30, 90, 80, 10, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "gossglaivei",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_insectglaive__19b: InsectGlaive = {
-    category: "insectglaive",
-    id: "19b",
-
-    name: "Gossglaive II",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_insectglaive__19a],
-            [__generated_ramp__fire_boost_1, __generated_insectglaive__18a],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 110, 40, 20, 0, 0],
-    maxSharpness:  [90, 40, 110, 40, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "gossglaiveii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_insectglaive__19c: InsectGlaive = {
-    category: "insectglaive",
-    id: "19c",
-
-    name: "Abominable Glaive",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__19b],
-            [__generated_ramp__ice_boost_2, __generated_insectglaive__19b],
-            [__generated_ramp__ice_boost_1, __generated_insectglaive__19a],
-            [__generated_ramp__fire_boost_1, __generated_insectglaive__18a],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 100, 40, 30, 0, 0],
-    maxSharpness:  [90, 40, 100, 40, 70, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "abominableglaive",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_insectglaive__20a: InsectGlaive = {
-    category: "insectglaive",
-    id: "20a",
-
-    name: "Pukei Rod I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 50, 20, 0, 0, 0],
-    maxSharpness:  [110, 70, 50, 70, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "pukeirodi",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_insectglaive__20b: InsectGlaive = {
-    category: "insectglaive",
-    id: "20b",
-
-    name: "Pukei Rod II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__20a],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [110, 80, 70, 40, 0, 0, 0],
-    maxSharpness:  [110, 80, 70, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "pukeirodii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_insectglaive__20c: InsectGlaive = {
-    category: "insectglaive",
-    id: "20c",
-
-    name: "Datura Pike",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__poison_boost_1, __generated_insectglaive__20b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__20a],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__15c],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15c],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 70, 60, 0, 0, 0],
-    maxSharpness:  [90, 80, 70, 90, 20, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "daturapike",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_insectglaive__21a: InsectGlaive = {
-    category: "insectglaive",
-    id: "21a",
-
-    name: "Amber Piton I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 80, 70, 0, 0, 0],
-    maxSharpness:  [50, 50, 80, 100, 20, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "amberpitoni",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_insectglaive__21b: InsectGlaive = {
-    category: "insectglaive",
-    id: "21b",
-
-    name: "Amber Piton II",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__21a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 70, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "amberpitonii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_insectglaive__21c: InsectGlaive = {
-    category: "insectglaive",
-    id: "21c",
-
-    name: "Fenrir Storm",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__21b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__21a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 90, 100, 40, 0, 0],
-    maxSharpness:  [50, 70, 90, 100, 70, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "fenrirstorm",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_insectglaive__22a: InsectGlaive = {
-    category: "insectglaive",
-    id: "22a",
-
-    name: "Royal Bloom I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 110, 30, 0, 0, 0],
-    maxSharpness:  [50, 60, 110, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 2,
-    },
-
-    filterHelpers: {
-        nameLower: "royalbloomi",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_insectglaive__22b: InsectGlaive = {
-    category: "insectglaive",
-    id: "22b",
-
-    name: "Royal Bloom II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 120, 50, 0, 0, 0],
-    maxSharpness:  [60, 70, 120, 90, 10, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "royalbloomii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_insectglaive__22c: InsectGlaive = {
-    category: "insectglaive",
-    id: "22c",
-
-    name: "Bloom Royale",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__22b],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__22b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [90, 20, 80, 90, 20, 0, 0],
-    maxSharpness:  [90, 20, 80, 90, 50, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "bloomroyale",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_insectglaive__23a: InsectGlaive = {
-    category: "insectglaive",
-    id: "23a",
-
-    name: "Royal Bolt Scepter I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__22a],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__22a],
-            [__generated_ramp__waterblight_exploit, __generated_insectglaive__22a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 90, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 90, 100, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "royalboltscepteri",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_insectglaive__23b: InsectGlaive = {
-    category: "insectglaive",
-    id: "23b",
-
-    name: "Royal Bolt Scepter II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__23a],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__22a],
-            [__generated_ramp__waterblight_exploit, __generated_insectglaive__22a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 70, 100, 20, 0, 0],
-    maxSharpness:  [70, 40, 70, 100, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "royalboltscepterii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_insectglaive__23c: InsectGlaive = {
-    category: "insectglaive",
-    id: "23c",
-
-    name: "Despot's Twinbolt",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_insectglaive__23b],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__23a],
-            [__generated_ramp__water_boost_1, __generated_insectglaive__22a],
-            [__generated_ramp__waterblight_exploit, __generated_insectglaive__22a],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__15b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__15b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 110, 100, 30, 0, 0],
-    maxSharpness:  [70, 40, 110, 100, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 8,
-    },
-
-    filterHelpers: {
-        nameLower: "despot'stwinbolt",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_insectglaive__24a: InsectGlaive = {
-    category: "insectglaive",
-    id: "24a",
-
-    name: "Hortadent I",
-    treeName: "Altaroth Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__small_monster_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 50, 0, 0, 0, 0],
-    maxSharpness:  [70, 80, 70, 30, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "hortadenti",
-        treeNameLower: "altarothtree",
-    },
-};
-
-const __generated_insectglaive__24b: InsectGlaive = {
-    category: "insectglaive",
-    id: "24b",
-
-    name: "Hortadent II",
-    treeName: "Altaroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 50, 30, 0, 0, 0],
-    maxSharpness:  [60, 60, 50, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "hortadentii",
-        treeNameLower: "altarothtree",
-    },
-};
-
-const __generated_insectglaive__24c: InsectGlaive = {
-    category: "insectglaive",
-    id: "24c",
-
-    name: "Hortadent Brada",
-    treeName: "Altaroth Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__kinsect_level_boost, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__24b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 30, 40, 0, 0],
-    maxSharpness:  [60, 80, 90, 30, 90, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "hortadentbrada",
-        treeNameLower: "altarothtree",
-    },
-};
-
-const __generated_insectglaive__25a: InsectGlaive = {
-    category: "insectglaive",
-    id: "25a",
-
-    name: "Rielle Nulo I",
-    treeName: "Bnahabra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [120, 20, 20, 40, 0, 0, 0],
-    maxSharpness:  [120, 20, 20, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenuloi",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_insectglaive__25b: InsectGlaive = {
-    category: "insectglaive",
-    id: "25b",
-
-    name: "Rielle Nulo II",
-    treeName: "Bnahabra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 30, 50, 0, 0, 0],
-    maxSharpness:  [150, 20, 30, 100, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenuloii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_insectglaive__25c: InsectGlaive = {
-    category: "insectglaive",
-    id: "25c",
-
-    name: "Rielle Unu",
-    treeName: "Bnahabra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [120, 20, 30, 80, 0, 0, 0],
-    maxSharpness:  [120, 20, 30, 130, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "rielleunu",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_insectglaive__25d: InsectGlaive = {
-    category: "insectglaive",
-    id: "25d",
-
-    name: "Rielle Nulo Red I",
-    treeName: "Bnahabra Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__25c],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 30, 60, 20, 0, 0],
-    maxSharpness:  [150, 40, 30, 60, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenuloredi",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_insectglaive__25e: InsectGlaive = {
-    category: "insectglaive",
-    id: "25e",
-
-    name: "Rielle Nulo Red II",
-    treeName: "Bnahabra Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__25c],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 20, 60, 30, 0, 0],
-    maxSharpness:  [150, 40, 20, 60, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenuloredii",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_insectglaive__25f: InsectGlaive = {
-    category: "insectglaive",
-    id: "25f",
-
-    name: "Rielle Vermiglio",
-    treeName: "Bnahabra Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__25e],
-            [__generated_ramp__fire_boost_2, __generated_insectglaive__25e],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__25c],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [160, 40, 20, 40, 40, 0, 0],
-    maxSharpness:  [160, 40, 20, 40, 50, 40, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 8,
-    },
-
-    filterHelpers: {
-        nameLower: "riellevermiglio",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_insectglaive__26a: InsectGlaive = {
-    category: "insectglaive",
-    id: "26a",
-
-    name: "Rielle Nulo Black I",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__25c],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 30, 60, 20, 0, 0],
-    maxSharpness:  [150, 40, 30, 60, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenuloblacki",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_insectglaive__26b: InsectGlaive = {
-    category: "insectglaive",
-    id: "26b",
-
-    name: "Rielle Nulo Black II",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__25c],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 20, 60, 30, 0, 0],
-    maxSharpness:  [150, 40, 20, 60, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenuloblackii",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_insectglaive__26c: InsectGlaive = {
-    category: "insectglaive",
-    id: "26c",
-
-    name: "Rielle Nerissimo",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__26b],
-            [__generated_ramp__dragon_boost_2, __generated_insectglaive__26b],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__25c],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [160, 40, 20, 40, 40, 0, 0],
-    maxSharpness:  [160, 40, 20, 40, 50, 40, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 8,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenerissimo",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_insectglaive__27a: InsectGlaive = {
-    category: "insectglaive",
-    id: "27a",
-
-    name: "Rielle Nulo White I",
-    treeName: "Bnahabra (Ice)",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [120, 20, 30, 80, 0, 0, 0],
-    maxSharpness:  [120, 20, 30, 130, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenulowhitei",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_insectglaive__27b: InsectGlaive = {
-    category: "insectglaive",
-    id: "27b",
-
-    name: "Rielle Nulo White II",
-    treeName: "Bnahabra (Ice)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 20, 80, 30, 0, 0],
-    maxSharpness:  [150, 20, 20, 80, 60, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenulowhiteii",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_insectglaive__27c: InsectGlaive = {
-    category: "insectglaive",
-    id: "27c",
-
-    name: "Rielle Unu White",
-    treeName: "Bnahabra (Ice)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__27b],
-            [__generated_ramp__ice_boost_2, __generated_insectglaive__27b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__25b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25b],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [160, 40, 20, 40, 40, 0, 0],
-    maxSharpness:  [160, 40, 20, 40, 50, 40, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 8,
-    },
-
-    filterHelpers: {
-        nameLower: "rielleunuwhite",
-        treeNameLower: "bnahabra(ice)",
-    },
-};
-
-const __generated_insectglaive__28a: InsectGlaive = {
-    category: "insectglaive",
-    id: "28a",
-
-    name: "Rielle Nulo Green I",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25a],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [120, 20, 20, 40, 0, 0, 0],
-    maxSharpness:  [120, 20, 20, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenulogreeni",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_insectglaive__28b: InsectGlaive = {
-    category: "insectglaive",
-    id: "28b",
-
-    name: "Rielle Nulo Green II",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25a],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 30, 60, 20, 0, 0],
-    maxSharpness:  [150, 40, 30, 60, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "riellenulogreenii",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_insectglaive__28c: InsectGlaive = {
-    category: "insectglaive",
-    id: "28c",
-
-    name: "Rielle Unu Green",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__28b],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__25a],
-            [__generated_ramp__kinsect_level_boost, __generated_insectglaive__24a],
-            [__generated_ramp__small_monster_exploit, __generated_insectglaive__24a],
-        ],
-    ],
-
-    baseSharpness: [160, 40, 20, 40, 40, 0, 0],
-    maxSharpness:  [160, 40, 20, 40, 70, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "rielleunugreen",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_insectglaive__29a: InsectGlaive = {
-    category: "insectglaive",
-    id: "29a",
-
-    name: "Sinister Staff I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterstaffi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_insectglaive__29b: InsectGlaive = {
-    category: "insectglaive",
-    id: "29b",
-
-    name: "Sinister Staff II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__29a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterstaffii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_insectglaive__29c: InsectGlaive = {
-    category: "insectglaive",
-    id: "29c",
-
-    name: "Sinister Shadowstaff",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_insectglaive__29b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__29a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "sinistershadowstaff",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_insectglaive__30a: InsectGlaive = {
-    category: "insectglaive",
-    id: "30a",
-
-    name: "Metal Mauler I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 80, 0, 0, 0],
-    maxSharpness:  [60, 40, 120, 110, 20, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "metalmauleri",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_insectglaive__30b: InsectGlaive = {
-    category: "insectglaive",
-    id: "30b",
-
-    name: "Metal Mauler II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_insectglaive__30a],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 150, 100, 10, 0, 0],
-    maxSharpness:  [60, 30, 150, 100, 60, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "metalmaulerii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_insectglaive__30c: InsectGlaive = {
-    category: "insectglaive",
-    id: "30c",
-
-    name: "Metalmangler",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__30b],
-            [__generated_ramp__thunder_boost_1, __generated_insectglaive__30a],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 80, 100, 20, 0, 0],
-    maxSharpness:  [100, 50, 80, 100, 60, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "metalmangler",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_insectglaive__31a: InsectGlaive = {
-    category: "insectglaive",
-    id: "31a",
-
-    name: "Azure Elder Glaive I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderglaivei",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_insectglaive__31b: InsectGlaive = {
-    category: "insectglaive",
-    id: "31b",
-
-    name: "Azure Elder Glaive II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderglaiveii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_insectglaive__31c: InsectGlaive = {
-    category: "insectglaive",
-    id: "31c",
-
-    name: "Abyssal Gale Glaive",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_insectglaive__31b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgaleglaive",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_insectglaive__32a: InsectGlaive = {
-    category: "insectglaive",
-    id: "32a",
-
-    name: "Thunderbolt Glaive I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltglaivei",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_insectglaive__32b: InsectGlaive = {
-    category: "insectglaive",
-    id: "32b",
-
-    name: "Abyssal Storm Glaive",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__32a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 8,
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormglaive",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_insectglaive__33a: InsectGlaive = {
-    category: "insectglaive",
-    id: "33a",
-
-    name: "Daora's Entom I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 110, 60, 30, 0, 0],
-    maxSharpness:  [50, 100, 110, 60, 40, 40, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sentomi",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_insectglaive__33b: InsectGlaive = {
-    category: "insectglaive",
-    id: "33b",
-
-    name: "Daora's Tethidine",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__33a],
-            [__generated_ramp__ice_boost_1, __generated_insectglaive__33a],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 90, 60, 50, 0, 0],
-    maxSharpness:  [50, 100, 90, 60, 50, 50, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "daora'stethidine",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_insectglaive__34a: InsectGlaive = {
-    category: "insectglaive",
-    id: "34a",
-
-    name: "Caster's Rod I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 130, 40, 100, 20, 0, 0],
-    maxSharpness:  [60, 130, 40, 100, 40, 30, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "caster'srodi",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_insectglaive__34b: InsectGlaive = {
-    category: "insectglaive",
-    id: "34b",
-
-    name: "Hazy Caster",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__34a],
-        ],
-    ],
-
-    baseSharpness: [30, 140, 40, 110, 30, 0, 0],
-    maxSharpness:  [30, 140, 40, 110, 30, 50, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "hazycaster",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_insectglaive__35a: InsectGlaive = {
-    category: "insectglaive",
-    id: "35a",
-
-    name: "Redwing Glaive I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "redwingglaivei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_insectglaive__35b: InsectGlaive = {
-    category: "insectglaive",
-    id: "35b",
-
-    name: "Reddnaught Shuma",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "reddnaughtshuma",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_insectglaive__36a: InsectGlaive = {
-    category: "insectglaive",
-    id: "36a",
-
-    name: "Deathport Staff I",
-    treeName: "Death Stench Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 40, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 40, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "deathportstaffi",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_insectglaive__36b: InsectGlaive = {
-    category: "insectglaive",
-    id: "36b",
-
-    name: "Deathport Staff II",
-    treeName: "Death Stench Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__dragon_boost_1, __generated_insectglaive__36a],
-        ],
-    ],
-
-    baseSharpness: [90, 100, 40, 70, 0, 0, 0],
-    maxSharpness:  [90, 100, 40, 120, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "deathportstaffii",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_insectglaive__36c: InsectGlaive = {
-    category: "insectglaive",
-    id: "36c",
-
-    name: "Garamorse",
-    treeName: "Death Stench Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__36b],
-            [__generated_ramp__dragon_boost_1, __generated_insectglaive__36a],
-        ],
-    ],
-
-    baseSharpness: [90, 100, 60, 100, 0, 0, 0],
-    maxSharpness:  [90, 100, 60, 110, 40, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 7,
-    },
-
-    filterHelpers: {
-        nameLower: "garamorse",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_insectglaive__37a: InsectGlaive = {
-    category: "insectglaive",
-    id: "37a",
-
-    name: "Magia Pitareen I",
-    treeName: "Magia Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [120, 40, 40, 0, 0, 0, 0],
-    maxSharpness:  [120, 40, 80, 10, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "magiapitareeni",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_insectglaive__37b: InsectGlaive = {
-    category: "insectglaive",
-    id: "37b",
-
-    name: "Magia Pitareen II",
-    treeName: "Magia Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__37a],
-        ],
-    ],
-
-    baseSharpness: [120, 40, 80, 10, 0, 0, 0],
-    maxSharpness:  [120, 40, 80, 60, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "magiapitareenii",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_insectglaive__37c: InsectGlaive = {
-    category: "insectglaive",
-    id: "37c",
-
-    name: "Magia Pitareen III",
-    treeName: "Magia Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__37b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__37b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__37a],
-        ],
-    ],
-
-    baseSharpness: [120, 50, 70, 50, 10, 0, 0],
-    maxSharpness:  [120, 50, 70, 50, 50, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "magiapitareeniii",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_insectglaive__37d: InsectGlaive = {
-    category: "insectglaive",
-    id: "37d",
-
-    name: "Magia Crescent",
-    treeName: "Magia Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__37c],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__37b],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__37b],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__37a],
-        ],
-    ],
-
-    baseSharpness: [120, 60, 80, 70, 20, 0, 0],
-    maxSharpness:  [120, 60, 80, 70, 50, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 8,
-    },
-
-    filterHelpers: {
-        nameLower: "magiacrescent",
-        treeNameLower: "magiatree",
-    },
-};
-
-const __generated_insectglaive__38a: InsectGlaive = {
-    category: "insectglaive",
-    id: "38a",
-
-    name: "Brush Glaive I",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__master_rider, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 4,
-    },
-
-    filterHelpers: {
-        nameLower: "brushglaivei",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_insectglaive__38b: InsectGlaive = {
-    category: "insectglaive",
-    id: "38b",
-
-    name: "Brush Glaive II",
-    treeName: "Smithy Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__water_boost_2, __generated_insectglaive__38a],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 120, 40, 0, 0, 0],
-    maxSharpness:  [60, 80, 120, 80, 10, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 5,
-    },
-
-    filterHelpers: {
-        nameLower: "brushglaiveii",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_insectglaive__38c: InsectGlaive = {
-    category: "insectglaive",
-    id: "38c",
-
-    name: "Watercolor Glaive",
-    treeName: "Smithy Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__water_boost_4, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__water_boost_3, __generated_insectglaive__38b],
-            [__generated_ramp__water_boost_2, __generated_insectglaive__38a],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 120, 60, 20, 0, 0],
-    maxSharpness:  [40, 60, 120, 60, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 6,
-    },
-
-    filterHelpers: {
-        nameLower: "watercolorglaive",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_insectglaive__ra: InsectGlaive = {
-    category: "insectglaive",
-    id: "ra",
-
-    name: "Rampage Glaive I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageglaivei",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_insectglaive__rb: InsectGlaive = {
-    category: "insectglaive",
-    id: "rb",
-
-    name: "Rampage Glaive II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__kinsect_level_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageglaiveii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_insectglaive__rc: InsectGlaive = {
-    category: "insectglaive",
-    id: "rc",
-
-    name: "Rampage Glaive III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__kinsect_level_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageglaiveiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_insectglaive__rd: InsectGlaive = {
-    category: "insectglaive",
-    id: "rd",
-
-    name: "Rampage Glaive IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_insectglaive__rc],
-            [__generated_ramp__water_1, __generated_insectglaive__rc],
-            [__generated_ramp__thunder_1, __generated_insectglaive__rc],
-            [__generated_ramp__ice_1, __generated_insectglaive__rc],
-            [__generated_ramp__dragon_1, __generated_insectglaive__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__kinsect_level_boost_2, null],
-            [__generated_ramp__kinsect_level_boost_1, __generated_insectglaive__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageglaiveiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_insectglaive__re: InsectGlaive = {
-    category: "insectglaive",
-    id: "re",
-
-    name: "Rampage Glaive V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_insectglaive__rd],
-            [__generated_ramp__water_2, __generated_insectglaive__rd],
-            [__generated_ramp__thunder_2, __generated_insectglaive__rd],
-            [__generated_ramp__ice_2, __generated_insectglaive__rd],
-            [__generated_ramp__dragon_2, __generated_insectglaive__rd],
-            [__generated_ramp__fire_1, __generated_insectglaive__rc],
-            [__generated_ramp__water_1, __generated_insectglaive__rc],
-            [__generated_ramp__thunder_1, __generated_insectglaive__rc],
-            [__generated_ramp__ice_1, __generated_insectglaive__rc],
-            [__generated_ramp__dragon_1, __generated_insectglaive__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__kinsect_level_boost_3, null],
-            [__generated_ramp__kinsect_level_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__kinsect_level_boost_1, __generated_insectglaive__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageglaivev",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_insectglaive__rf: InsectGlaive = {
-    category: "insectglaive",
-    id: "rf",
-
-    name: "Rampage Glaive S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_insectglaive__re],
-            [__generated_ramp__affinity_boost_3, __generated_insectglaive__re],
-            [__generated_ramp__attack_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__affinity_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__defense_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__attack_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__affinity_boost_1, __generated_insectglaive__rb],
-            [__generated_ramp__defense_boost_1, __generated_insectglaive__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_insectglaive__re],
-            [__generated_ramp__paralysis_1, __generated_insectglaive__re],
-            [__generated_ramp__sleep_1, __generated_insectglaive__re],
-            [__generated_ramp__blast_1, __generated_insectglaive__re],
-            [__generated_ramp__fire_2, __generated_insectglaive__rd],
-            [__generated_ramp__water_2, __generated_insectglaive__rd],
-            [__generated_ramp__thunder_2, __generated_insectglaive__rd],
-            [__generated_ramp__ice_2, __generated_insectglaive__rd],
-            [__generated_ramp__dragon_2, __generated_insectglaive__rd],
-            [__generated_ramp__fire_1, __generated_insectglaive__rc],
-            [__generated_ramp__water_1, __generated_insectglaive__rc],
-            [__generated_ramp__thunder_1, __generated_insectglaive__rc],
-            [__generated_ramp__ice_1, __generated_insectglaive__rc],
-            [__generated_ramp__dragon_1, __generated_insectglaive__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__kinsect_level_boost_4, null],
-            [__generated_ramp__kinsect_level_boost_3, __generated_insectglaive__re],
-            [__generated_ramp__kinsect_level_boost_2, __generated_insectglaive__rd],
-            [__generated_ramp__kinsect_level_boost_1, __generated_insectglaive__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
-
-    insectglaiveStats: {
-        kinsectLevel: 3,
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampageglaives",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"insectglaive","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Glaive I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0],"insectglaiveStats":{"kinsectLevel":1}},{"id":"1b","name":"Kamura Glaive II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0],"insectglaiveStats":{"kinsectLevel":1}},{"id":"1c","name":"Kamura Glaive III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"1d","name":"Kamura Glaive IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"1e","name":"Kamura Glaive V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"1f","name":"Kamura Ninja Glaive","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Nargacuga Tree",[{"id":"2a","name":"Hidden Scythe I","rarity":3,"endlineTag":"","attack":100,"affinity":40,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"2b","name":"Hidden Scythe II","rarity":5,"endlineTag":"","attack":170,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,70,100,50,0,0],"maxSharpness":[100,30,70,100,70,30,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"2c","name":"Evening Calm","rarity":6,"endlineTag":"hr","attack":190,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,110,90,60,30,0],"maxSharpness":[70,40,110,90,60,30,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Mizutsune Tree",[{"id":"3a","name":"Fox Halberd I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",12]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,40,30,70,0,0,0],"maxSharpness":[110,40,30,90,30,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"3b","name":"Fox Halberd II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",16]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,90,70,50,30,0,0],"maxSharpness":[110,90,70,50,60,20,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"3c","name":"Curved Naganagi","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","3b"],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,70,70,50,50,0,0],"maxSharpness":[110,70,70,50,50,50,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Somnacanth Tree",[{"id":"4a","name":"Frilled Jab I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",10]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["dulling_strike",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,50,120,30,0,0,0],"maxSharpness":[50,50,120,80,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"4b","name":"Frilled Jab II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",12]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,60,110,40,0,0,0],"maxSharpness":[40,60,110,80,10,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"4c","name":"Illusory Frilled Jab","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",15]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","4b"],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,90,120,90,0,0,0],"maxSharpness":[50,90,120,110,30,0,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Tigrex Tree",[{"id":"5a","name":"Tigrex Kaina I","rarity":3,"endlineTag":"","attack":160,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["sleep_boost_1","4b"],["dulling_strike","4b"],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"5b","name":"Tigrex Kaina II","rarity":6,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","5a"],["sleep_boost_1","4b"],["dulling_strike","4b"],["attack_boost_1","4a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,60,20,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"5c","name":"Tigerclaw Glaive","rarity":6,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","5b"],["affinity_boost_1","5a"],["sleep_boost_1","4b"],["dulling_strike","4b"],["attack_boost_1","4a"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,40,120,120,50,20,0],"maxSharpness":[50,40,120,120,50,20,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Tetranadon Tree",[{"id":"6a","name":"Leaping Glaive I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",10]],"rampSkills":[[["defense_boost_1",null],["water_boost_1",null],["dulling_strike",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[30,70,80,20,0,0,0],"maxSharpness":[30,70,80,70,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"6b","name":"Leaping Glaive II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["water",12]],"rampSkills":[[["defense_boost_1",null],["water_boost_2",null],["dulling_strike",null],["water_boost_1","6a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[40,90,110,60,0,0,0],"maxSharpness":[40,90,110,100,10,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"6c","name":"Leapfrog","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["water",14]],"rampSkills":[[["defense_boost_1",null],["water_boost_3",null],["dulling_strike",null],["water_boost_2","6b"],["water_boost_1","6a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[40,90,110,110,0,0,0],"maxSharpness":[40,90,110,110,50,0,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Ore Tree",[{"id":"7a","name":"Iron Blade I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0],"insectglaiveStats":{"kinsectLevel":1}},{"id":"7b","name":"Iron Blade II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,50,20,0,0,0],"maxSharpness":[70,60,50,70,0,0,0],"insectglaiveStats":{"kinsectLevel":1}},{"id":"7c","name":"Steel Blade","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","7b"]]],"baseSharpness":[80,80,50,40,0,0,0],"maxSharpness":[80,80,50,90,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"7d","name":"Iron Bayonet I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[90,70,30,60,0,0,0],"maxSharpness":[90,70,30,90,20,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"7e","name":"Iron Bayonet II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[90,80,60,50,20,0,0],"maxSharpness":[90,80,60,50,50,20,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"7f","name":"Hiten Blade","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","7e"],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[90,80,40,50,40,0,0],"maxSharpness":[90,80,40,50,60,30,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Rathalos Tree",[{"id":"8a","name":"Rathmaul I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_3","7e"],["silkbind_boost","7e"],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[70,80,90,100,10,0,0],"maxSharpness":[70,80,90,100,60,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"8b","name":"Rathmaul II","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",27]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_3","7e"],["silkbind_boost","7e"],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[60,30,140,100,20,0,0],"maxSharpness":[60,30,140,100,60,10,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"8c","name":"Fogodance Rathmaul","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",30]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","8b"],["defense_boost_3","7e"],["silkbind_boost","7e"],["defense_boost_2","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[100,50,70,100,30,0,0],"maxSharpness":[100,50,70,100,60,20,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Khezu Tree",[{"id":"9a","name":"Bolt Chamber I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",25]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["defense_boost_2","7d"],["silkbind_boost","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[70,70,80,70,10,0,0],"maxSharpness":[70,70,80,70,60,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"9b","name":"Bolt Chamber II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["thunder",29]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","9a"],["defense_boost_2","7d"],["silkbind_boost","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[60,70,70,80,20,0,0],"maxSharpness":[60,70,70,80,60,10,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"9c","name":"Full Bolt Chamber","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["thunder",33]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_3","9b"],["thunder_boost_1","9b"],["attack_boost_2","9a"],["defense_boost_2","7d"],["silkbind_boost","7d"],["affinity_boost_1","7c"],["attack_boost_1","7b"]]],"baseSharpness":[60,70,90,100,30,0,0],"maxSharpness":[60,70,90,100,50,30,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Rathian Tree",[{"id":"10a","name":"Princess Regalia I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",19]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[30,90,80,50,0,0,0],"maxSharpness":[30,90,80,100,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"10b","name":"Princess Regalia II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",23]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","10a"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[10,90,90,90,20,0,0],"maxSharpness":[10,90,90,90,50,20,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"10c","name":"Queen Regalia","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",25]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","10a"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[30,90,70,120,40,0,0],"maxSharpness":[30,90,70,120,60,30,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Aknosom Tree",[{"id":"11a","name":"Aknosom Pike I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",12]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,60,90,40,0,0,0],"maxSharpness":[60,60,90,90,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"11b","name":"Aknosom Pike II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",15]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["fireblight_exploit",null],["attack_boost_1","11a"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[50,60,90,50,0,0,0],"maxSharpness":[50,60,90,100,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"11c","name":"Daybreak Glaive","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["fire_boost_1","11b"],["attack_boost_1","11a"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[50,50,120,60,20,0,0],"maxSharpness":[50,50,120,60,50,20,0],"insectglaiveStats":{"kinsectLevel":4}}]],["Kulu-Ya-Ku Tree",[{"id":"12a","name":"Kulu Glaive I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["kinsect_level_boost",null],["spiribird_doubled",null],["attack_boost_1","7b"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,80,80,30,0,0,0],"maxSharpness":[60,80,80,80,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"12b","name":"Kulu Glaive II","rarity":3,"endlineTag":"","attack":140,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["kinsect_level_boost",null],["spiribird_doubled",null],["attack_boost_1","7b"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,60,90,40,0,0,0],"maxSharpness":[60,60,90,90,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"12c","name":"Kulu Pike","rarity":4,"endlineTag":"hr","attack":150,"affinity":15,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["kinsect_level_boost",null],["spiribird_doubled",null],["affinity_boost_2","12b"],["attack_boost_1","7b"],["affinity_boost_1","7b"],["defense_boost_2","7b"]]],"baseSharpness":[60,80,80,50,30,0,0],"maxSharpness":[60,80,80,50,80,0,0],"insectglaiveStats":{"kinsectLevel":4}}]],["Tobi-Kadachi Tree",[{"id":"13a","name":"Kadachi Glaive I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",12]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunder_boost_2",null],["affinity_boost_2","12a"],["kinsect_level_boost","12a"],["spiribird_doubled","12a"],["defense_boost_2","7b"]]],"baseSharpness":[130,30,50,40,0,0,0],"maxSharpness":[130,30,50,90,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"13b","name":"Kadachi Glaive II","rarity":3,"endlineTag":"","attack":140,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",15]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["thunder_boost_2",null],["affinity_boost_1","13a"],["kinsect_level_boost","12a"],["spiribird_doubled","12a"],["defense_boost_2","7b"]]],"baseSharpness":[130,20,40,60,0,0,0],"maxSharpness":[130,20,40,110,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"13c","name":"Shocking Pike","rarity":5,"endlineTag":"hr","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["thunder",22]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunder_boost_3",null],["attack_boost_1","13b"],["affinity_boost_2","13b"],["thunder_boost_2","13b"],["affinity_boost_1","13a"],["kinsect_level_boost","12a"],["spiribird_doubled","12a"],["defense_boost_2","7b"]]],"baseSharpness":[100,90,30,30,50,0,0],"maxSharpness":[100,90,30,30,70,30,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Lagombi Tree",[{"id":"14a","name":"Lagombaglaive I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["small_monster_exploit",null],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[80,50,110,10,0,0,0],"maxSharpness":[80,50,110,60,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"14b","name":"Lagombaglaive II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",23]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["dulling_strike",null],["small_monster_exploit","14a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[60,40,100,90,10,0,0],"maxSharpness":[60,40,100,90,50,10,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"14c","name":"Lagombavarice","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",26]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["dulling_strike",null],["attack_boost_1","14b"],["small_monster_exploit","14a"],["affinity_boost_1","7a"],["defense_boost_2","7a"]]],"baseSharpness":[60,40,80,90,30,0,0],"maxSharpness":[60,40,80,90,50,30,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Bone Tree",[{"id":"15a","name":"Bone Staff I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"15b","name":"Bone Staff II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"15c","name":"Aerial Glaive","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","15b"]]],"baseSharpness":[100,40,60,0,0,0,0],"maxSharpness":[100,40,110,0,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"15d","name":"Sturdy Glaive I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[100,70,60,20,0,0,0],"maxSharpness":[100,70,60,70,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"15e","name":"Sturdy Glaive II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","15d"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"15f","name":"Sturdy Glaive Redux","rarity":5,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","15e"],["attack_boost_2","15d"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[80,70,60,70,20,0,0],"maxSharpness":[80,70,60,70,70,0,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Paralysis Tree",[{"id":"16a","name":"Sky-High Glaive I","rarity":4,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",20]],"rampSkills":[[["attack_boost_3",null],["silkbind_boost",null],["anti_aerial_species",null],["attack_boost_2","15d"],["affinity_boost_2","15d"],["dulling_strike","15d"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[80,60,120,30,10,0,0],"maxSharpness":[80,60,120,30,60,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"16b","name":"Sky-High Glaive II","rarity":5,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["paralysis",22]],"rampSkills":[[["attack_boost_3",null],["silkbind_boost",null],["anti_aerial_species",null],["attack_boost_2","15d"],["affinity_boost_2","15d"],["dulling_strike","15d"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[80,50,120,30,20,0,0],"maxSharpness":[80,50,120,30,60,10,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"16c","name":"Highest of Glaives","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["paralysis",25]],"rampSkills":[[["attack_boost_4",null],["silkbind_boost",null],["anti_aerial_species",null],["attack_boost_3","16b"],["attack_boost_2","15d"],["affinity_boost_2","15d"],["dulling_strike","15d"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[80,50,120,20,30,0,0],"maxSharpness":[80,50,120,20,50,30,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Diablos Tree",[{"id":"17a","name":"Diablos Rod I","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["kinsect_level_boost",null],["attack_boost_3","16b"],["silkbind_boost","16b"],["anti_aerial_species","16b"],["affinity_boost_2","15d"],["dulling_strike","15d"],["affinity_boost_1","15b"]]],"baseSharpness":[180,30,80,40,20,0,0],"maxSharpness":[180,30,80,40,70,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"17b","name":"Diablos Rod II","rarity":6,"endlineTag":"","attack":210,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["kinsect_level_boost",null],["defense_boost_1","17a"],["attack_boost_3","16b"],["silkbind_boost","16b"],["anti_aerial_species","16b"],["affinity_boost_2","15d"],["dulling_strike","15d"],["affinity_boost_1","15b"]]],"baseSharpness":[180,30,70,40,30,0,0],"maxSharpness":[180,30,70,40,80,0,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"17c","name":"Tyrant Rod","rarity":7,"endlineTag":"hr","attack":230,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["kinsect_level_boost",null],["attack_boost_2","17b"],["defense_boost_1","17a"],["silkbind_boost","16b"],["anti_aerial_species","16b"],["affinity_boost_2","15d"],["dulling_strike","15d"],["affinity_boost_1","15b"]]],"baseSharpness":[170,30,60,50,40,0,0],"maxSharpness":[170,30,60,50,80,10,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Anjanath Tree",[{"id":"18a","name":"Flammenkaefer I","rarity":3,"endlineTag":"","attack":140,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["fire",12]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","15c"],["affinity_boost_2","15c"],["defense_boost_1","15c"]]],"baseSharpness":[100,90,40,20,0,0,0],"maxSharpness":[100,90,40,70,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"18b","name":"Flammenkaefer II","rarity":5,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",15]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","18a"],["attack_boost_2","15c"],["affinity_boost_2","15c"],["defense_boost_1","15c"]]],"baseSharpness":[140,70,80,40,20,0,0],"maxSharpness":[140,70,80,40,70,0,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"18c","name":"Gnashing Flammenkaefer","rarity":6,"endlineTag":"hr","attack":220,"affinity":-15,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",18]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","18b"],["fire_boost_2","18b"],["fire_boost_1","18a"],["attack_boost_2","15c"],["defense_boost_1","15c"]]],"baseSharpness":[130,60,80,50,30,0,0],"maxSharpness":[130,60,80,50,80,0,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Goss Harag Tree",[{"id":"19a","name":"Gossglaive I","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["ice",10]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_1",null],["brutal_strike",null],["fire_boost_1","18a"],["attack_boost_2","15c"],["affinity_boost_2","15c"],["defense_boost_1","15c"]]],"baseSharpness":[90,30,90,40,0,0,0],"maxSharpness":[90,30,90,80,10,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"19b","name":"Gossglaive II","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[2],"eleStat":[["ice",12]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","19a"],["fire_boost_1","18a"],["attack_boost_2","15c"],["affinity_boost_2","15c"],["defense_boost_1","15c"]]],"baseSharpness":[90,40,110,40,20,0,0],"maxSharpness":[90,40,110,40,70,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"19c","name":"Abominable Glaive","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[2],"eleStat":[["ice",15]],"rampSkills":[[["affinity_boost_2",null],["ice_boost_3",null],["brutal_strike",null],["affinity_boost_1","19b"],["ice_boost_2","19b"],["ice_boost_1","19a"],["fire_boost_1","18a"],["attack_boost_2","15c"],["defense_boost_1","15c"]]],"baseSharpness":[90,40,100,40,30,0,0],"maxSharpness":[90,40,100,40,70,10,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Pukei-Pukei Tree",[{"id":"20a","name":"Pukei Rod I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",24]],"rampSkills":[[["attack_boost_2",null],["dulling_strike",null],["poison_boost_1",null],["affinity_boost_2","15c"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[110,70,50,20,0,0,0],"maxSharpness":[110,70,50,70,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"20b","name":"Pukei Rod II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",27]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["poison_boost_1",null],["attack_boost_2","20a"],["affinity_boost_2","15c"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[110,80,70,40,0,0,0],"maxSharpness":[110,80,70,90,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"20c","name":"Datura Pike","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",30]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["poison_boost_2",null],["poison_boost_1","20b"],["attack_boost_2","20a"],["affinity_boost_2","15c"],["defense_boost_1","15c"],["affinity_boost_1","15b"]]],"baseSharpness":[90,80,70,60,0,0,0],"maxSharpness":[90,80,70,90,20,0,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Barioth Tree",[{"id":"21a","name":"Amber Piton I","rarity":2,"endlineTag":"","attack":90,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["ice",16]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[50,50,80,70,0,0,0],"maxSharpness":[50,50,80,100,20,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"21b","name":"Amber Piton II","rarity":5,"endlineTag":"","attack":160,"affinity":15,"defense":0,"decoSlots":[1,1,1],"eleStat":[["ice",22]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","21a"],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,70,10,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"21c","name":"Fenrir Storm","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[1,1,1],"eleStat":[["ice",25]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","21b"],["attack_boost_2","21a"],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[50,70,90,100,40,0,0],"maxSharpness":[50,70,90,100,70,20,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Royal Ludroth Tree",[{"id":"22a","name":"Royal Bloom I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[50,60,110,30,0,0,0],"maxSharpness":[50,60,110,80,0,0,0],"insectglaiveStats":{"kinsectLevel":2}},{"id":"22b","name":"Royal Bloom II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",25]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[60,70,120,50,0,0,0],"maxSharpness":[60,70,120,90,10,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"22c","name":"Bloom Royale","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",33]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","22b"],["water_boost_1","22b"],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[90,20,80,90,20,0,0],"maxSharpness":[90,20,80,90,50,20,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Zinogre Tree",[{"id":"23a","name":"Royal Bolt Scepter I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_2","22a"],["water_boost_1","22a"],["waterblight_exploit","22a"],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[70,40,90,50,0,0,0],"maxSharpness":[70,40,90,100,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"23b","name":"Royal Bolt Scepter II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",23]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","23a"],["water_boost_1","22a"],["waterblight_exploit","22a"],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[70,40,70,100,20,0,0],"maxSharpness":[70,40,70,100,70,0,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"23c","name":"Despot\'s Twinbolt","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",25]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","23b"],["attack_boost_1","23a"],["water_boost_1","22a"],["waterblight_exploit","22a"],["affinity_boost_1","15b"],["defense_boost_1","15b"]]],"baseSharpness":[70,40,110,100,30,0,0],"maxSharpness":[70,40,110,100,60,20,0],"insectglaiveStats":{"kinsectLevel":8}}]],["Altaroth Tree",[{"id":"24a","name":"Hortadent I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["kinsect_level_boost",null],["small_monster_exploit",null]]],"baseSharpness":[70,80,50,0,0,0,0],"maxSharpness":[70,80,70,30,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"24b","name":"Hortadent II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["kinsect_level_boost",null],["small_monster_exploit",null],["attack_boost_2","24a"]]],"baseSharpness":[60,60,50,30,0,0,0],"maxSharpness":[60,60,50,80,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"24c","name":"Hortadent Brada","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["kinsect_level_boost",null],["small_monster_exploit",null],["attack_boost_3","24b"],["attack_boost_2","24a"]]],"baseSharpness":[60,80,90,30,40,0,0],"maxSharpness":[60,80,90,30,90,0,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Bnahabra Tree",[{"id":"25a","name":"Rielle Nulo I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["silkbind_boost",null],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[120,20,20,40,0,0,0],"maxSharpness":[120,20,20,90,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"25b","name":"Rielle Nulo II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["silkbind_boost",null],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,20,30,50,0,0,0],"maxSharpness":[150,20,30,100,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"25c","name":"Rielle Unu","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["silkbind_boost",null],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[120,20,30,80,0,0,0],"maxSharpness":[120,20,30,130,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"25d","name":"Rielle Nulo Red I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["fire",14]],"rampSkills":[[["attack_boost_3",null],["fire_boost_2",null],["silkbind_boost",null],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,40,30,60,20,0,0],"maxSharpness":[150,40,30,60,60,10,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"25e","name":"Rielle Nulo Red II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["fire",16]],"rampSkills":[[["attack_boost_3",null],["fire_boost_2",null],["silkbind_boost",null],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,40,20,60,30,0,0],"maxSharpness":[150,40,20,60,60,20,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"25f","name":"Rielle Vermiglio","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["fire",20]],"rampSkills":[[["attack_boost_4",null],["fire_boost_3",null],["silkbind_boost",null],["attack_boost_3","25e"],["fire_boost_2","25e"],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[160,40,20,40,40,0,0],"maxSharpness":[160,40,20,40,50,40,0],"insectglaiveStats":{"kinsectLevel":8}}]],["Bnahabra (Drag\\u00e3o)",[{"id":"26a","name":"Rielle Nulo Black I","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",15]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["silkbind_boost",null],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,40,30,60,20,0,0],"maxSharpness":[150,40,30,60,60,10,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"26b","name":"Rielle Nulo Black II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",17]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["silkbind_boost",null],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,40,20,60,30,0,0],"maxSharpness":[150,40,20,60,60,20,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"26c","name":"Rielle Nerissimo","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",20]],"rampSkills":[[["attack_boost_4",null],["dragon_boost_3",null],["silkbind_boost",null],["attack_boost_3","26b"],["dragon_boost_2","26b"],["affinity_boost_2","25c"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[160,40,20,40,40,0,0],"maxSharpness":[160,40,20,40,50,40,0],"insectglaiveStats":{"kinsectLevel":8}}]],["Bnahabra (Ice)",[{"id":"27a","name":"Rielle Nulo White I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",12]],"rampSkills":[[["attack_boost_3",null],["ice_boost_2",null],["silkbind_boost",null],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[120,20,30,80,0,0,0],"maxSharpness":[120,20,30,130,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"27b","name":"Rielle Nulo White II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["ice",16]],"rampSkills":[[["attack_boost_3",null],["ice_boost_2",null],["silkbind_boost",null],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,20,20,80,30,0,0],"maxSharpness":[150,20,20,80,60,20,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"27c","name":"Rielle Unu White","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["ice",18]],"rampSkills":[[["attack_boost_4",null],["ice_boost_3",null],["silkbind_boost",null],["attack_boost_3","27b"],["ice_boost_2","27b"],["attack_boost_2","25b"],["affinity_boost_1","25b"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[160,40,20,40,40,0,0],"maxSharpness":[160,40,20,40,50,40,0],"insectglaiveStats":{"kinsectLevel":8}}]],["Bnahabra (Paralysis)",[{"id":"28a","name":"Rielle Nulo Green I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",15]],"rampSkills":[[["attack_boost_2",null],["paralysis_boost_1",null],["silkbind_boost",null],["affinity_boost_1","25a"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[120,20,20,40,0,0,0],"maxSharpness":[120,20,20,90,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"28b","name":"Rielle Nulo Green II","rarity":5,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",18]],"rampSkills":[[["attack_boost_2",null],["paralysis_boost_1",null],["silkbind_boost",null],["affinity_boost_1","25a"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[150,40,30,60,20,0,0],"maxSharpness":[150,40,30,60,60,10,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"28c","name":"Rielle Unu Green","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",20]],"rampSkills":[[["attack_boost_3",null],["paralysis_boost_1",null],["silkbind_boost",null],["attack_boost_2","28b"],["affinity_boost_1","25a"],["kinsect_level_boost","24a"],["small_monster_exploit","24a"]]],"baseSharpness":[160,40,20,40,40,0,0],"maxSharpness":[160,40,20,40,70,20,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Magnamalo Tree",[{"id":"29a","name":"Sinister Staff I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",13]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"29b","name":"Sinister Staff II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",15]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","29a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"29c","name":"Sinister Shadowstaff","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",20]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","29b"],["attack_boost_2","29a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Rajang Tree",[{"id":"30a","name":"Metal Mauler I","rarity":5,"endlineTag":"","attack":180,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["thunder",18]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[60,40,120,80,0,0,0],"maxSharpness":[60,40,120,110,20,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"30b","name":"Metal Mauler II","rarity":6,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[["thunder",20]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","30a"]]],"baseSharpness":[60,30,150,100,10,0,0],"maxSharpness":[60,30,150,100,60,0,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"30c","name":"Metalmangler","rarity":7,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[3],"eleStat":[["thunder",22]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","30b"],["thunder_boost_1","30a"]]],"baseSharpness":[100,50,80,100,20,0,0],"maxSharpness":[100,50,80,100,60,10,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Ibushi Tree",[{"id":"31a","name":"Azure Elder Glaive I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",10]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"31b","name":"Azure Elder Glaive II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",12]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","31a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"31c","name":"Abyssal Gale Glaive","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",14]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","31b"],["defense_boost_1","31a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Narwa Tree",[{"id":"32a","name":"Thunderbolt Glaive I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",36]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0],"insectglaiveStats":{"kinsectLevel":7}},{"id":"32b","name":"Abyssal Storm Glaive","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",38]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","32a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0],"insectglaiveStats":{"kinsectLevel":8}}]],["Kushala Daora Tree",[{"id":"33a","name":"Daora\'s Entom I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",34]],"rampSkills":[[["attack_boost_2",null],["ice_boost_1",null],["kushala_daora_soul",null]]],"baseSharpness":[50,100,110,60,30,0,0],"maxSharpness":[50,100,110,60,40,40,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"33b","name":"Daora\'s Tethidine","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",36]],"rampSkills":[[["attack_boost_3",null],["ice_boost_2",null],["kushala_daora_soul",null],["attack_boost_2","33a"],["ice_boost_1","33a"]]],"baseSharpness":[50,100,90,60,50,0,0],"maxSharpness":[50,100,90,60,50,50,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Chameleos Tree",[{"id":"34a","name":"Caster\'s Rod I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",35]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[60,130,40,100,20,0,0],"maxSharpness":[60,130,40,100,40,30,0],"insectglaiveStats":{"kinsectLevel":6}},{"id":"34b","name":"Hazy Caster","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",38]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","34a"]]],"baseSharpness":[30,140,40,110,30,0,0],"maxSharpness":[30,140,40,110,30,50,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Valstrax Tree",[{"id":"35a","name":"Redwing Glaive I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",35]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"35b","name":"Reddnaught Shuma","rarity":7,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",38]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0],"insectglaiveStats":{"kinsectLevel":5}}]],["Death Stench Tree",[{"id":"36a","name":"Deathport Staff I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["dragon",16]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_1",null],["wyvern_exploit",null]]],"baseSharpness":[60,70,40,30,0,0,0],"maxSharpness":[60,70,40,80,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"36b","name":"Deathport Staff II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":15,"decoSlots":[2,2],"eleStat":[["dragon",20]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_2",null],["wyvern_exploit",null],["dragon_boost_1","36a"]]],"baseSharpness":[90,100,40,70,0,0,0],"maxSharpness":[90,100,40,120,0,0,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"36c","name":"Garamorse","rarity":5,"endlineTag":"hr","attack":210,"affinity":0,"defense":20,"decoSlots":[2,2],"eleStat":[["dragon",24]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_2","36b"],["dragon_boost_1","36a"]]],"baseSharpness":[90,100,60,100,0,0,0],"maxSharpness":[90,100,60,110,40,0,0],"insectglaiveStats":{"kinsectLevel":7}}]],["Magia Tree",[{"id":"37a","name":"Magia Pitareen I","rarity":2,"endlineTag":"","attack":70,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[["blast",20]],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["silkbind_boost",null]]],"baseSharpness":[120,40,40,0,0,0,0],"maxSharpness":[120,40,80,10,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"37b","name":"Magia Pitareen II","rarity":3,"endlineTag":"","attack":100,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[["blast",25]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["silkbind_boost",null],["attack_boost_2","37a"]]],"baseSharpness":[120,40,80,10,0,0,0],"maxSharpness":[120,40,80,60,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"37c","name":"Magia Pitareen III","rarity":5,"endlineTag":"","attack":150,"affinity":0,"defense":5,"decoSlots":[1,1,1],"eleStat":[["blast",29]],"rampSkills":[[["attack_boost_4",null],["defense_boost_2",null],["silkbind_boost",null],["attack_boost_3","37b"],["defense_boost_1","37b"],["attack_boost_2","37a"]]],"baseSharpness":[120,50,70,50,10,0,0],"maxSharpness":[120,50,70,50,50,10,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"37d","name":"Magia Crescent","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":5,"decoSlots":[1,1,1],"eleStat":[["blast",33]],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","37c"],["attack_boost_3","37b"],["defense_boost_1","37b"],["attack_boost_2","37a"]]],"baseSharpness":[120,60,80,70,20,0,0],"maxSharpness":[120,60,80,70,50,20,0],"insectglaiveStats":{"kinsectLevel":8}}]],["Smithy Tree",[{"id":"38a","name":"Brush Glaive I","rarity":5,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["water",8]],"rampSkills":[[["water_boost_2",null],["dulling_strike",null],["master_rider",null]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0],"insectglaiveStats":{"kinsectLevel":4}},{"id":"38b","name":"Brush Glaive II","rarity":6,"endlineTag":"","attack":210,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["water",9]],"rampSkills":[[["water_boost_3",null],["dulling_strike",null],["master_rider",null],["water_boost_2","38a"]]],"baseSharpness":[60,80,120,40,0,0,0],"maxSharpness":[60,80,120,80,10,0,0],"insectglaiveStats":{"kinsectLevel":5}},{"id":"38c","name":"Watercolor Glaive","rarity":6,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["water",10]],"rampSkills":[[["water_boost_4",null],["dulling_strike",null],["master_rider",null],["water_boost_3","38b"],["water_boost_2","38a"]]],"baseSharpness":[40,60,120,60,20,0,0],"maxSharpness":[40,60,120,60,70,0,0],"insectglaiveStats":{"kinsectLevel":6}}]],["Rampage Tree",[{"id":"ra","name":"Rampage Glaive I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"rb","name":"Rampage Glaive II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null],["kinsect_level_boost_1",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"rc","name":"Rampage Glaive III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null],["kinsect_level_boost_1",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"rd","name":"Rampage Glaive IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null],["kinsect_level_boost_2",null],["kinsect_level_boost_1","rc"]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"re","name":"Rampage Glaive V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_1",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["kinsect_level_boost_3",null],["kinsect_level_boost_2","rd"],["kinsect_level_boost_1","rc"]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0],"insectglaiveStats":{"kinsectLevel":3}},{"id":"rf","name":"Rampage Glaive S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_1",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["kinsect_level_boost_4",null],["kinsect_level_boost_3","re"],["kinsect_level_boost_2","rd"],["kinsect_level_boost_1","rc"]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0],"insectglaiveStats":{"kinsectLevel":3}}]]]}';
 
-export const insectglaivesArray: Readonly<InsectGlaive[]> = [
-    __generated_insectglaive__1a,
-    __generated_insectglaive__1b,
-    __generated_insectglaive__1c,
-    __generated_insectglaive__1d,
-    __generated_insectglaive__1e,
-    __generated_insectglaive__1f,
-    __generated_insectglaive__2a,
-    __generated_insectglaive__2b,
-    __generated_insectglaive__2c,
-    __generated_insectglaive__3a,
-    __generated_insectglaive__3b,
-    __generated_insectglaive__3c,
-    __generated_insectglaive__4a,
-    __generated_insectglaive__4b,
-    __generated_insectglaive__4c,
-    __generated_insectglaive__5a,
-    __generated_insectglaive__5b,
-    __generated_insectglaive__5c,
-    __generated_insectglaive__6a,
-    __generated_insectglaive__6b,
-    __generated_insectglaive__6c,
-    __generated_insectglaive__7a,
-    __generated_insectglaive__7b,
-    __generated_insectglaive__7c,
-    __generated_insectglaive__7d,
-    __generated_insectglaive__7e,
-    __generated_insectglaive__7f,
-    __generated_insectglaive__8a,
-    __generated_insectglaive__8b,
-    __generated_insectglaive__8c,
-    __generated_insectglaive__9a,
-    __generated_insectglaive__9b,
-    __generated_insectglaive__9c,
-    __generated_insectglaive__10a,
-    __generated_insectglaive__10b,
-    __generated_insectglaive__10c,
-    __generated_insectglaive__11a,
-    __generated_insectglaive__11b,
-    __generated_insectglaive__11c,
-    __generated_insectglaive__12a,
-    __generated_insectglaive__12b,
-    __generated_insectglaive__12c,
-    __generated_insectglaive__13a,
-    __generated_insectglaive__13b,
-    __generated_insectglaive__13c,
-    __generated_insectglaive__14a,
-    __generated_insectglaive__14b,
-    __generated_insectglaive__14c,
-    __generated_insectglaive__15a,
-    __generated_insectglaive__15b,
-    __generated_insectglaive__15c,
-    __generated_insectglaive__15d,
-    __generated_insectglaive__15e,
-    __generated_insectglaive__15f,
-    __generated_insectglaive__16a,
-    __generated_insectglaive__16b,
-    __generated_insectglaive__16c,
-    __generated_insectglaive__17a,
-    __generated_insectglaive__17b,
-    __generated_insectglaive__17c,
-    __generated_insectglaive__18a,
-    __generated_insectglaive__18b,
-    __generated_insectglaive__18c,
-    __generated_insectglaive__19a,
-    __generated_insectglaive__19b,
-    __generated_insectglaive__19c,
-    __generated_insectglaive__20a,
-    __generated_insectglaive__20b,
-    __generated_insectglaive__20c,
-    __generated_insectglaive__21a,
-    __generated_insectglaive__21b,
-    __generated_insectglaive__21c,
-    __generated_insectglaive__22a,
-    __generated_insectglaive__22b,
-    __generated_insectglaive__22c,
-    __generated_insectglaive__23a,
-    __generated_insectglaive__23b,
-    __generated_insectglaive__23c,
-    __generated_insectglaive__24a,
-    __generated_insectglaive__24b,
-    __generated_insectglaive__24c,
-    __generated_insectglaive__25a,
-    __generated_insectglaive__25b,
-    __generated_insectglaive__25c,
-    __generated_insectglaive__25d,
-    __generated_insectglaive__25e,
-    __generated_insectglaive__25f,
-    __generated_insectglaive__26a,
-    __generated_insectglaive__26b,
-    __generated_insectglaive__26c,
-    __generated_insectglaive__27a,
-    __generated_insectglaive__27b,
-    __generated_insectglaive__27c,
-    __generated_insectglaive__28a,
-    __generated_insectglaive__28b,
-    __generated_insectglaive__28c,
-    __generated_insectglaive__29a,
-    __generated_insectglaive__29b,
-    __generated_insectglaive__29c,
-    __generated_insectglaive__30a,
-    __generated_insectglaive__30b,
-    __generated_insectglaive__30c,
-    __generated_insectglaive__31a,
-    __generated_insectglaive__31b,
-    __generated_insectglaive__31c,
-    __generated_insectglaive__32a,
-    __generated_insectglaive__32b,
-    __generated_insectglaive__33a,
-    __generated_insectglaive__33b,
-    __generated_insectglaive__34a,
-    __generated_insectglaive__34b,
-    __generated_insectglaive__35a,
-    __generated_insectglaive__35b,
-    __generated_insectglaive__36a,
-    __generated_insectglaive__36b,
-    __generated_insectglaive__36c,
-    __generated_insectglaive__37a,
-    __generated_insectglaive__37b,
-    __generated_insectglaive__37c,
-    __generated_insectglaive__37d,
-    __generated_insectglaive__38a,
-    __generated_insectglaive__38b,
-    __generated_insectglaive__38c,
-    __generated_insectglaive__ra,
-    __generated_insectglaive__rb,
-    __generated_insectglaive__rc,
-    __generated_insectglaive__rd,
-    __generated_insectglaive__re,
-    __generated_insectglaive__rf,
-];
+export const insectglaivesArray: Readonly<InsectGlaive[]> = loadWeaponPayload<InsectGlaive>(payload);
@@ -36,5051 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type Lance,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__blast_boost_3,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_boost_3,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__paralysis_boost_2,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__sleep_boost_2,
-    __generated_ramp__sleep_boost_3,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_lance__1a: Lance = {
-    category: "lance",
-    id: "1a",
-
-    name: "Kamura Spear I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraspeari",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lance__1b: Lance = {
-    category: "lance",
-    id: "1b",
-
-    name: "Kamura Spear II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraspearii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lance__1c: Lance = {
-    category: "lance",
-    id: "1c",
-
-    name: "Kamura Spear III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraspeariii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lance__1d: Lance = {
-    category: "lance",
-    id: "1d",
-
-    name: "Kamura Spear IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraspeariv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lance__1e: Lance = {
-    category: "lance",
-    id: "1e",
-
-    name: "Kamura Spear V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__1d],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1d],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraspearv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lance__1f: Lance = {
-    category: "lance",
-    id: "1f",
-
-    name: "Kamura Ninja Spear",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_lance__1e],
-            [__generated_ramp__attack_boost_2, __generated_lance__1d],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1d],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraninjaspear",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lance__2a: Lance = {
-    category: "lance",
-    id: "2a",
-
-    name: "Goss Lance I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 90, 30, 0, 0, 0],
-    maxSharpness:  [100, 30, 90, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gosslancei",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lance__2b: Lance = {
-    category: "lance",
-    id: "2b",
-
-    name: "Goss Lance II",
-    treeName: "Goss Harag Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_lance__2a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 110, 40, 20, 0, 0],
-    maxSharpness:  [100, 30, 110, 40, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gosslanceii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lance__2c: Lance = {
-    category: "lance",
-    id: "2c",
-
-    name: "Abominable Lance",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_2, __generated_lance__2b],
-            [__generated_ramp__ice_boost_1, __generated_lance__2a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 100, 40, 30, 0, 0],
-    maxSharpness:  [100, 30, 100, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "abominablelance",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lance__3a: Lance = {
-    category: "lance",
-    id: "3a",
-
-    name: "Hana Mo Hana Nare I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 40, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 40, 70, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hanamohananarei",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_lance__3b: Lance = {
-    category: "lance",
-    id: "3b",
-
-    name: "Hana Mo Hana Nare II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__3a],
-            [__generated_ramp__water_boost_1, __generated_lance__3a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 70, 30, 40, 0, 0],
-    maxSharpness:  [110, 100, 70, 30, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "hanamohananareii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_lance__3c: Lance = {
-    category: "lance",
-    id: "3c",
-
-    name: "Kimi Ga Kiru",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__3b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__3a],
-            [__generated_ramp__water_boost_1, __generated_lance__3a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 70, 20, 50, 0, 0],
-    maxSharpness:  [110, 100, 70, 20, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "kimigakiru",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_lance__4a: Lance = {
-    category: "lance",
-    id: "4a",
-
-    name: "Naag Serpentblade I",
-    treeName: "Remobra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 70, 30, 0, 0, 0],
-    maxSharpness:  [40, 60, 70, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "naagserpentbladei",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lance__4b: Lance = {
-    category: "lance",
-    id: "4b",
-
-    name: "Naag Serpentblade II",
-    treeName: "Remobra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__4a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 50, 40, 0, 0, 0],
-    maxSharpness:  [60, 50, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "naagserpentbladeii",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lance__4c: Lance = {
-    category: "lance",
-    id: "4c",
-
-    name: "Devta Serpentblade",
-    treeName: "Remobra Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 130,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 41]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__4a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_2, __generated_lance__1c],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 70, 0, 0, 0],
-    maxSharpness:  [60, 60, 60, 70, 40, 10, 0],
-
-    filterHelpers: {
-        nameLower: "devtaserpentblade",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lance__5a: Lance = {
-    category: "lance",
-    id: "5a",
-
-    name: "Distension I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 80, 70, 20, 0, 0, 0],
-    maxSharpness:  [30, 80, 70, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "distensioni",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_lance__5b: Lance = {
-    category: "lance",
-    id: "5b",
-
-    name: "Distension II",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_lance__5a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 60, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 100, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "distensionii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_lance__5c: Lance = {
-    category: "lance",
-    id: "5c",
-
-    name: "Croaker",
-    treeName: "Tetranadon Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__5b],
-            [__generated_ramp__water_boost_1, __generated_lance__5a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 110, 110, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 130, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "croaker",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_lance__6a: Lance = {
-    category: "lance",
-    id: "6a",
-
-    name: "Wind Thief Lance I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 30, 50, 40, 0, 0, 0],
-    maxSharpness:  [80, 30, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "windthieflancei",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lance__6b: Lance = {
-    category: "lance",
-    id: "6b",
-
-    name: "Wind Thief Lance II",
-    treeName: "Izuchi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 40, 30, 50, 0, 0, 0],
-    maxSharpness:  [80, 40, 30, 50, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "windthieflanceii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lance__6c: Lance = {
-    category: "lance",
-    id: "6c",
-
-    name: "Gale Lance",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__6b],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__defense_boost_1, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 20, 50, 50, 0, 0],
-    maxSharpness:  [80, 50, 20, 50, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "galelance",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lance__7a: Lance = {
-    category: "lance",
-    id: "7a",
-
-    name: "Sharktooth Spear I",
-    treeName: "Zamite Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 50, 20, 0, 0, 0],
-    maxSharpness:  [70, 60, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sharktoothspeari",
-        treeNameLower: "zamitetree",
-    },
-};
-
-const __generated_lance__7b: Lance = {
-    category: "lance",
-    id: "7b",
-
-    name: "Sharktooth Spear II",
-    treeName: "Zamite Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__7a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 60, 40, 40, 0, 0, 0],
-    maxSharpness:  [110, 60, 40, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sharktoothspearii",
-        treeNameLower: "zamitetree",
-    },
-};
-
-const __generated_lance__7c: Lance = {
-    category: "lance",
-    id: "7c",
-
-    name: "Razortooth Spear",
-    treeName: "Zamite Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_lance__7b],
-            [__generated_ramp__small_monster_exploit, __generated_lance__7b],
-            [__generated_ramp__defense_boost_1, __generated_lance__7a],
-            [__generated_ramp__attack_boost_1, __generated_lance__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__1b],
-        ],
-    ],
-
-    baseSharpness: [130, 60, 40, 50, 20, 0, 0],
-    maxSharpness:  [130, 60, 40, 50, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "razortoothspear",
-        treeNameLower: "zamitetree",
-    },
-};
-
-const __generated_lance__8a: Lance = {
-    category: "lance",
-    id: "8a",
-
-    name: "Iron Lance I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironlancei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lance__8b: Lance = {
-    category: "lance",
-    id: "8b",
-
-    name: "Iron Lance II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironlanceii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lance__8c: Lance = {
-    category: "lance",
-    id: "8c",
-
-    name: "Millennial Lance",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 60, 30, 0, 0, 0],
-    maxSharpness:  [80, 80, 60, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "millenniallance",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lance__8d: Lance = {
-    category: "lance",
-    id: "8d",
-
-    name: "Paladin Lance I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "paladinlancei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lance__8e: Lance = {
-    category: "lance",
-    id: "8e",
-
-    name: "Paladin Lance II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 90, 50, 20, 0, 0],
-    maxSharpness:  [100, 90, 90, 50, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "paladinlanceii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lance__8f: Lance = {
-    category: "lance",
-    id: "8f",
-
-    name: "Rampart",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__8e],
-            [__generated_ramp__defense_boost_2, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 90, 50, 30, 0, 0],
-    maxSharpness:  [90, 90, 90, 50, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "rampart",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lance__9a: Lance = {
-    category: "lance",
-    id: "9a",
-
-    name: "Babel Spear I",
-    treeName: "Ore Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__silkbind_boost, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 120, 40, 20, 0, 0],
-    maxSharpness:  [60, 60, 120, 40, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "babelspeari",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_lance__9b: Lance = {
-    category: "lance",
-    id: "9b",
-
-    name: "Babel Spear II",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__9a],
-            [__generated_ramp__silkbind_boost, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 160, 60, 30, 0, 0],
-    maxSharpness:  [50, 50, 160, 60, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "babelspearii",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_lance__9c: Lance = {
-    category: "lance",
-    id: "9c",
-
-    name: "Elder Babel Spear",
-    treeName: "Ore Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_lance__9b],
-            [__generated_ramp__defense_boost_2, __generated_lance__9b],
-            [__generated_ramp__attack_boost_2, __generated_lance__9a],
-            [__generated_ramp__silkbind_boost, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 80, 40, 0, 0],
-    maxSharpness:  [20, 20, 190, 80, 40, 50, 0],
-
-    filterHelpers: {
-        nameLower: "elderbabelspear",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_lance__10a: Lance = {
-    category: "lance",
-    id: "10a",
-
-    name: "Venom Lance I",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__9a],
-            [__generated_ramp__wyvern_exploit, __generated_lance__9a],
-            [__generated_ramp__silkbind_boost, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 80, 40, 0, 0, 0],
-    maxSharpness:  [90, 90, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "venomlancei",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lance__10b: Lance = {
-    category: "lance",
-    id: "10b",
-
-    name: "Venom Lance II",
-    treeName: "Basarios Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_lance__10a],
-            [__generated_ramp__attack_boost_2, __generated_lance__9a],
-            [__generated_ramp__wyvern_exploit, __generated_lance__9a],
-            [__generated_ramp__silkbind_boost, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 80, 60, 0, 0, 0],
-    maxSharpness:  [80, 80, 80, 100, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "venomlanceii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lance__10c: Lance = {
-    category: "lance",
-    id: "10c",
-
-    name: "Basarios Venom Spear",
-    treeName: "Basarios Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__poison_boost_1, __generated_lance__10b],
-            [__generated_ramp__defense_boost_2, __generated_lance__10a],
-            [__generated_ramp__attack_boost_2, __generated_lance__9a],
-            [__generated_ramp__wyvern_exploit, __generated_lance__9a],
-            [__generated_ramp__silkbind_boost, __generated_lance__8d],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 80, 0, 0, 0],
-    maxSharpness:  [100, 90, 80, 90, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "basariosvenomspear",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lance__11a: Lance = {
-    category: "lance",
-    id: "11a",
-
-    name: "Hidden Stinger I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__defense_boost_2, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenstingeri",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_lance__11b: Lance = {
-    category: "lance",
-    id: "11b",
-
-    name: "Hidden Stinger II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__11a],
-            [__generated_ramp__defense_boost_2, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 100, 50, 0, 0],
-    maxSharpness:  [100, 30, 70, 100, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenstingerii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_lance__11c: Lance = {
-    category: "lance",
-    id: "11c",
-
-    name: "Night Rains Black",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__11b],
-            [__generated_ramp__attack_boost_2, __generated_lance__11a],
-            [__generated_ramp__defense_boost_2, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 110, 90, 60, 30, 0],
-    maxSharpness:  [70, 40, 110, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "nightrainsblack",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_lance__12a: Lance = {
-    category: "lance",
-    id: "12a",
-
-    name: "Growling Wyvern I",
-    treeName: "Dragão Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__8c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 90, 40, 0, 0, 0],
-    maxSharpness:  [90, 80, 90, 60, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "growlingwyverni",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_lance__12b: Lance = {
-    category: "lance",
-    id: "12b",
-
-    name: "Growling Wyvern II",
-    treeName: "Dragão Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__12a],
-            [__generated_ramp__attack_boost_2, __generated_lance__8c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 90, 60, 0, 0, 0],
-    maxSharpness:  [70, 80, 90, 80, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "growlingwyvernii",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_lance__12c: Lance = {
-    category: "lance",
-    id: "12c",
-
-    name: "Roaring Wyvern",
-    treeName: "Dragão Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_3, __generated_lance__12b],
-            [__generated_ramp__defense_boost_2, __generated_lance__12b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__12a],
-            [__generated_ramp__attack_boost_2, __generated_lance__8c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8c],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 90, 90, 20, 0, 0],
-    maxSharpness:  [70, 80, 90, 90, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "roaringwyvern",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_lance__13a: Lance = {
-    category: "lance",
-    id: "13a",
-
-    name: "Kadachi Lance I",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [130, 30, 50, 40, 0, 0, 0],
-    maxSharpness:  [130, 30, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kadachilancei",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_lance__13b: Lance = {
-    category: "lance",
-    id: "13b",
-
-    name: "Kadachi Lance II",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__13a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__13a],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [120, 70, 40, 40, 30, 0, 0],
-    maxSharpness:  [120, 70, 40, 40, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kadachilanceii",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_lance__13c: Lance = {
-    category: "lance",
-    id: "13c",
-
-    name: "Shockspear",
-    treeName: "Tobi-Kadachi Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__13b],
-            [__generated_ramp__attack_boost_1, __generated_lance__13a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__13a],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [150, 80, 40, 40, 40, 0, 0],
-    maxSharpness:  [150, 80, 40, 40, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "shockspear",
-        treeNameLower: "tobi-kadachitree",
-    },
-};
-
-const __generated_lance__14a: Lance = {
-    category: "lance",
-    id: "14a",
-
-    name: "Aknosom Lance I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8b],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 80, 40, 0, 0, 0],
-    maxSharpness:  [30, 50, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "aknosomlancei",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_lance__14b: Lance = {
-    category: "lance",
-    id: "14b",
-
-    name: "Aknosom Lance II",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8b],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 100, 60, 0, 0, 0],
-    maxSharpness:  [40, 50, 100, 100, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "aknosomlanceii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_lance__14c: Lance = {
-    category: "lance",
-    id: "14c",
-
-    name: "Aknosom Lance III",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__14b],
-            [__generated_ramp__fire_boost_1, __generated_lance__14b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8b],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 130, 60, 10, 0, 0],
-    maxSharpness:  [50, 50, 130, 60, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "aknosomlanceiii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_lance__14d: Lance = {
-    category: "lance",
-    id: "14d",
-
-    name: "Dawnbreaker Lance",
-    treeName: "Aknosom Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_2, __generated_lance__14c],
-            [__generated_ramp__attack_boost_1, __generated_lance__14b],
-            [__generated_ramp__fire_boost_1, __generated_lance__14b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8b],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 160, 60, 30, 0, 0],
-    maxSharpness:  [50, 50, 160, 60, 40, 40, 0],
-
-    filterHelpers: {
-        nameLower: "dawnbreakerlance",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_lance__15a: Lance = {
-    category: "lance",
-    id: "15a",
-
-    name: "Rugged Lance I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 0, 0, 0, 0],
-    maxSharpness:  [60, 60, 130, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ruggedlancei",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_lance__15b: Lance = {
-    category: "lance",
-    id: "15b",
-
-    name: "Rugged Lance II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 160, 30, 0, 0, 0],
-    maxSharpness:  [60, 50, 160, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ruggedlanceii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_lance__15c: Lance = {
-    category: "lance",
-    id: "15c",
-
-    name: "Barroth Carver",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15b],
-            [__generated_ramp__defense_boost_1, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 190, 50, 10, 0, 0],
-    maxSharpness:  [60, 40, 190, 50, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "barrothcarver",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_lance__16a: Lance = {
-    category: "lance",
-    id: "16a",
-
-    name: "Drill Lance I",
-    treeName: "Thunder Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15b],
-            [__generated_ramp__brutal_strike, __generated_lance__15b],
-            [__generated_ramp__defense_boost_1, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 120, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "drilllancei",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_lance__16b: Lance = {
-    category: "lance",
-    id: "16b",
-
-    name: "Drill Lance II",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__16a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15b],
-            [__generated_ramp__brutal_strike, __generated_lance__15b],
-            [__generated_ramp__defense_boost_1, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 120, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 150, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "drilllanceii",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_lance__16c: Lance = {
-    category: "lance",
-    id: "16c",
-
-    name: "Gigadrill Lance",
-    treeName: "Thunder Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_3, __generated_lance__16b],
-            [__generated_ramp__defense_boost_2, __generated_lance__16b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__16a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15b],
-            [__generated_ramp__brutal_strike, __generated_lance__15b],
-            [__generated_ramp__defense_boost_1, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 160, 10, 0, 0],
-    maxSharpness:  [50, 60, 70, 160, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gigadrilllance",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_lance__17a: Lance = {
-    category: "lance",
-    id: "17a",
-
-    name: "Volvi Stroke I",
-    treeName: "Volvidon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15a],
-            [__generated_ramp__brutal_strike, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-            [__generated_ramp__defense_boost_2, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 40, 30, 0, 0, 0],
-    maxSharpness:  [100, 30, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "volvistrokei",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_lance__17b: Lance = {
-    category: "lance",
-    id: "17b",
-
-    name: "Volvi Stroke II",
-    treeName: "Volvidon Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__17a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15a],
-            [__generated_ramp__brutal_strike, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 30, 80, 0, 0, 0],
-    maxSharpness:  [100, 40, 30, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "volvistrokeii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_lance__17c: Lance = {
-    category: "lance",
-    id: "17c",
-
-    name: "Volvi Sweep",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_lance__17b],
-            [__generated_ramp__defense_boost_1, __generated_lance__17a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__15a],
-            [__generated_ramp__brutal_strike, __generated_lance__15a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8b],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 50, 80, 20, 0, 0],
-    maxSharpness:  [100, 50, 50, 80, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "volvisweep",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_lance__18a: Lance = {
-    category: "lance",
-    id: "18a",
-
-    name: "Heat Lance I",
-    treeName: "Fire Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__8a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8a],
-            [__generated_ramp__defense_boost_2, __generated_lance__8a],
-        ],
-    ],
-
-    baseSharpness: [110, 20, 50, 20, 0, 0, 0],
-    maxSharpness:  [110, 20, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "heatlancei",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_lance__18b: Lance = {
-    category: "lance",
-    id: "18b",
-
-    name: "Heat Lance II",
-    treeName: "Fire Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__18a],
-            [__generated_ramp__defense_boost_1, __generated_lance__18a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8a],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 50, 30, 0, 0, 0],
-    maxSharpness:  [150, 20, 50, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "heatlanceii",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_lance__18c: Lance = {
-    category: "lance",
-    id: "18c",
-
-    name: "Heatstinger",
-    treeName: "Fire Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_3, __generated_lance__18b],
-            [__generated_ramp__defense_boost_2, __generated_lance__18b],
-            [__generated_ramp__affinity_boost_2, __generated_lance__18a],
-            [__generated_ramp__defense_boost_1, __generated_lance__18a],
-            [__generated_ramp__attack_boost_1, __generated_lance__8a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__8a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 60, 50, 0, 0, 0],
-    maxSharpness:  [170, 20, 60, 70, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "heatstinger",
-        treeNameLower: "firetree",
-    },
-};
-
-const __generated_lance__19a: Lance = {
-    category: "lance",
-    id: "19a",
-
-    name: "Bone Lance I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonelancei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lance__19b: Lance = {
-    category: "lance",
-    id: "19b",
-
-    name: "Hard Bone Lance",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hardbonelance",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lance__19c: Lance = {
-    category: "lance",
-    id: "19c",
-
-    name: "Longhorn Spear I",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 60, 0, 0, 0, 0],
-    maxSharpness:  [90, 50, 110, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "longhornspeari",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lance__19d: Lance = {
-    category: "lance",
-    id: "19d",
-
-    name: "Longtusk Spear",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 70, 10, 0, 0, 0],
-    maxSharpness:  [100, 70, 70, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "longtuskspear",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lance__19e: Lance = {
-    category: "lance",
-    id: "19e",
-
-    name: "Barbarian Tusk I",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "barbariantuski",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lance__19f: Lance = {
-    category: "lance",
-    id: "19f",
-
-    name: "Barbarian Fang",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "barbarianfang",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lance__20a: Lance = {
-    category: "lance",
-    id: "20a",
-
-    name: "Tiger Stinger I",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__dulling_strike, __generated_lance__19f],
-            [__generated_ramp__attack_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 120, 70, 30, 0, 0],
-    maxSharpness:  [50, 30, 120, 70, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigerstingeri",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_lance__20b: Lance = {
-    category: "lance",
-    id: "20b",
-
-    name: "Tiger Stinger II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__dulling_strike, __generated_lance__19f],
-            [__generated_ramp__attack_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 100, 40, 0, 0],
-    maxSharpness:  [50, 40, 120, 100, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigerstingerii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_lance__20c: Lance = {
-    category: "lance",
-    id: "20c",
-
-    name: "Tigrex Lance",
-    treeName: "Tigrex Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__dulling_strike, __generated_lance__19f],
-            [__generated_ramp__attack_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_2, __generated_lance__19d],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 100, 60, 20, 0],
-    maxSharpness:  [50, 50, 120, 100, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrexlance",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_lance__21a: Lance = {
-    category: "lance",
-    id: "21a",
-
-    name: "Tusk Lance I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tusklancei",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_lance__21b: Lance = {
-    category: "lance",
-    id: "21b",
-
-    name: "Tusk Lance II",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__21a],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "tusklanceii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_lance__21c: Lance = {
-    category: "lance",
-    id: "21c",
-
-    name: "Sabertooth",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__21b],
-            [__generated_ramp__attack_boost_2, __generated_lance__21a],
-            [__generated_ramp__defense_boost_1, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 90, 60, 0, 0],
-    maxSharpness:  [50, 70, 80, 90, 60, 50, 0],
-
-    filterHelpers: {
-        nameLower: "sabertooth",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_lance__22a: Lance = {
-    category: "lance",
-    id: "22a",
-
-    name: "Pukei Spear I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 20, 50, 0, 0, 0],
-    maxSharpness:  [60, 70, 20, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeispeari",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_lance__22b: Lance = {
-    category: "lance",
-    id: "22b",
-
-    name: "Pukei Spear II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__22a],
-            [__generated_ramp__poison_boost_1, __generated_lance__22a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 70, 90, 20, 0, 0],
-    maxSharpness:  [60, 60, 70, 90, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeispearii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_lance__22c: Lance = {
-    category: "lance",
-    id: "22c",
-
-    name: "Datura Spear",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__22b],
-            [__generated_ramp__attack_boost_2, __generated_lance__22a],
-            [__generated_ramp__poison_boost_1, __generated_lance__22a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 100, 30, 0, 0],
-    maxSharpness:  [60, 60, 100, 100, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "daturaspear",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_lance__23a: Lance = {
-    category: "lance",
-    id: "23a",
-
-    name: "Red Tail I",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__22a],
-            [__generated_ramp__poison_boost_1, __generated_lance__22a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 50, 40, 0, 0, 0],
-    maxSharpness:  [60, 50, 50, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "redtaili",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_lance__23b: Lance = {
-    category: "lance",
-    id: "23b",
-
-    name: "Red Tail II",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__22a],
-            [__generated_ramp__poison_boost_1, __generated_lance__22a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 80, 100, 20, 0, 0],
-    maxSharpness:  [70, 80, 80, 100, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "redtailii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_lance__23c: Lance = {
-    category: "lance",
-    id: "23c",
-
-    name: "Spear of Prominence",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__23b],
-            [__generated_ramp__defense_boost_1, __generated_lance__22a],
-            [__generated_ramp__poison_boost_1, __generated_lance__22a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__19c],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 110, 110, 40, 0, 0],
-    maxSharpness:  [50, 40, 110, 110, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "spearofprominence",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_lance__24a: Lance = {
-    category: "lance",
-    id: "24a",
-
-    name: "Spiral Lance I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 50, 40, 0, 0, 0],
-    maxSharpness:  [40, 70, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "spirallancei",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_lance__24b: Lance = {
-    category: "lance",
-    id: "24b",
-
-    name: "Spiral Lance II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_lance__24a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 70, 50, 0, 0, 0],
-    maxSharpness:  [50, 80, 70, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "spirallanceii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_lance__24c: Lance = {
-    category: "lance",
-    id: "24c",
-
-    name: "Spiral Splash",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__24b],
-            [__generated_ramp__water_boost_1, __generated_lance__24a],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 80, 70, 20, 0, 0],
-    maxSharpness:  [50, 80, 80, 70, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "spiralsplash",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_lance__25a: Lance = {
-    category: "lance",
-    id: "25a",
-
-    name: "Ploshasta I",
-    treeName: "Rhenoplos Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: -10,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 20, 60, 20, 0, 0, 0],
-    maxSharpness:  [100, 20, 60, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ploshastai",
-        treeNameLower: "rhenoplostree",
-    },
-};
-
-const __generated_lance__25b: Lance = {
-    category: "lance",
-    id: "25b",
-
-    name: "Ploshasta II",
-    treeName: "Rhenoplos Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -10,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__25a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 50, 40, 60, 0, 0, 0],
-    maxSharpness:  [100, 50, 40, 60, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ploshastaii",
-        treeNameLower: "rhenoplostree",
-    },
-};
-
-const __generated_lance__25c: Lance = {
-    category: "lance",
-    id: "25c",
-
-    name: "Rhenohasta",
-    treeName: "Rhenoplos Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: -10,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__25a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 40, 70, 0, 0, 0],
-    maxSharpness:  [100, 90, 40, 70, 30, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rhenohasta",
-        treeNameLower: "rhenoplostree",
-    },
-};
-
-const __generated_lance__26a: Lance = {
-    category: "lance",
-    id: "26a",
-
-    name: "Diablos Lance I",
-    treeName: "Diablos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__small_monster_exploit, __generated_lance__25a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 50, 100, 0, 0, 0],
-    maxSharpness:  [60, 40, 50, 110, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "diabloslancei",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_lance__26b: Lance = {
-    category: "lance",
-    id: "26b",
-
-    name: "Diablos Lance II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 240,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__26a],
-            [__generated_ramp__small_monster_exploit, __generated_lance__25a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 30, 120, 30, 0, 0],
-    maxSharpness:  [100, 70, 30, 120, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "diabloslanceii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_lance__26c: Lance = {
-    category: "lance",
-    id: "26c",
-
-    name: "Diablos Spear",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 250,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__26b],
-            [__generated_ramp__defense_boost_1, __generated_lance__26b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__26a],
-            [__generated_ramp__small_monster_exploit, __generated_lance__25a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 80, 120, 50, 0, 0],
-    maxSharpness:  [40, 60, 80, 120, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "diablosspear",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_lance__27a: Lance = {
-    category: "lance",
-    id: "27a",
-
-    name: "Kulu Spear I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 40, 30, 0, 0, 0],
-    maxSharpness:  [70, 60, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kuluspeari",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_lance__27b: Lance = {
-    category: "lance",
-    id: "27b",
-
-    name: "Kulu Spear II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 50, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 50, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kuluspearii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_lance__27c: Lance = {
-    category: "lance",
-    id: "27c",
-
-    name: "Kulu Skewer",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__27b],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 50, 60, 20, 0, 0],
-    maxSharpness:  [100, 70, 50, 60, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kuluskewer",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_lance__28a: Lance = {
-    category: "lance",
-    id: "28a",
-
-    name: "Usurper's Coming I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__27b],
-            [__generated_ramp__master_rider, __generated_lance__27b],
-            [__generated_ramp__spiribird_doubled, __generated_lance__27b],
-            [__generated_ramp__attack_boost_2, __generated_lance__19b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 50, 90, 0, 0, 0],
-    maxSharpness:  [70, 40, 50, 140, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'scomingi",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_lance__28b: Lance = {
-    category: "lance",
-    id: "28b",
-
-    name: "Usurper's Coming II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__28a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__27b],
-            [__generated_ramp__master_rider, __generated_lance__27b],
-            [__generated_ramp__spiribird_doubled, __generated_lance__27b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 100, 100, 40, 0, 0],
-    maxSharpness:  [60, 50, 100, 100, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'scomingii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_lance__28c: Lance = {
-    category: "lance",
-    id: "28c",
-
-    name: "Despot's Cacophony",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_lance__28b],
-            [__generated_ramp__attack_boost_1, __generated_lance__28a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__27b],
-            [__generated_ramp__master_rider, __generated_lance__27b],
-            [__generated_ramp__spiribird_doubled, __generated_lance__27b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__19b],
-            [__generated_ramp__defense_boost_1, __generated_lance__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 100, 100, 50, 0, 0],
-    maxSharpness:  [60, 40, 100, 100, 60, 40, 0],
-
-    filterHelpers: {
-        nameLower: "despot'scacophony",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_lance__29a: Lance = {
-    category: "lance",
-    id: "29a",
-
-    name: "Azure Crest I",
-    treeName: "Baggi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__19a],
-            [__generated_ramp__defense_boost_1, __generated_lance__19a],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 50, 20, 0, 0, 0],
-    maxSharpness:  [80, 50, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azurecresti",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_lance__29b: Lance = {
-    category: "lance",
-    id: "29b",
-
-    name: "Azure Crest II",
-    treeName: "Baggi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__29a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19a],
-            [__generated_ramp__defense_boost_1, __generated_lance__19a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 40, 50, 0, 0, 0],
-    maxSharpness:  [100, 60, 40, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azurecrestii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_lance__29c: Lance = {
-    category: "lance",
-    id: "29c",
-
-    name: "Azure Crest III",
-    treeName: "Baggi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__sleep_boost_1, __generated_lance__29b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__29a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19a],
-            [__generated_ramp__defense_boost_1, __generated_lance__19a],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 60, 50, 20, 0, 0],
-    maxSharpness:  [100, 70, 60, 50, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "azurecrestiii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_lance__29d: Lance = {
-    category: "lance",
-    id: "29d",
-
-    name: "Great Azure",
-    treeName: "Baggi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_lance__29c],
-            [__generated_ramp__sleep_boost_1, __generated_lance__29b],
-            [__generated_ramp__affinity_boost_1, __generated_lance__29a],
-            [__generated_ramp__attack_boost_2, __generated_lance__19a],
-            [__generated_ramp__defense_boost_1, __generated_lance__19a],
-        ],
-    ],
-
-    baseSharpness: [130, 30, 100, 60, 30, 0, 0],
-    maxSharpness:  [130, 30, 100, 60, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "greatazure",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_lance__30a: Lance = {
-    category: "lance",
-    id: "30a",
-
-    name: "Sinister Spear I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterspeari",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_lance__30b: Lance = {
-    category: "lance",
-    id: "30b",
-
-    name: "Sinister Spear II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__30a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterspearii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_lance__30c: Lance = {
-    category: "lance",
-    id: "30c",
-
-    name: "Sinister Shadespear",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_lance__30b],
-            [__generated_ramp__attack_boost_2, __generated_lance__30a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "sinistershadespear",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_lance__31a: Lance = {
-    category: "lance",
-    id: "31a",
-
-    name: "Demon Lance I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 5]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 130, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "demonlancei",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_lance__31b: Lance = {
-    category: "lance",
-    id: "31b",
-
-    name: "Demon Lance II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 7]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_lance__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 40, 100, 90, 0, 0, 0],
-    maxSharpness:  [20, 40, 100, 130, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "demonlanceii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_lance__31c: Lance = {
-    category: "lance",
-    id: "31c",
-
-    name: "Great Demon Lance",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_lance__31b],
-            [__generated_ramp__thunder_boost_1, __generated_lance__31a],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 100, 0, 0, 0],
-    maxSharpness:  [50, 60, 90, 100, 30, 20, 0],
-
-    filterHelpers: {
-        nameLower: "greatdemonlance",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_lance__32a: Lance = {
-    category: "lance",
-    id: "32a",
-
-    name: "Azure Elder Spear I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 6]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderspeari",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_lance__32b: Lance = {
-    category: "lance",
-    id: "32b",
-
-    name: "Azure Elder Spear II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__32a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderspearii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_lance__32c: Lance = {
-    category: "lance",
-    id: "32c",
-
-    name: "Abyssal Gale Lance",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_lance__32b],
-            [__generated_ramp__defense_boost_1, __generated_lance__32a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalgalelance",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_lance__33a: Lance = {
-    category: "lance",
-    id: "33a",
-
-    name: "Thunderbolt Spear I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "thunderboltspeari",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_lance__33b: Lance = {
-    category: "lance",
-    id: "33b",
-
-    name: "Abyssal Storm Lance",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__33a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalstormlance",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_lance__34a: Lance = {
-    category: "lance",
-    id: "34a",
-
-    name: "Rookslayer Lance I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 80, 20, 0, 0],
-    maxSharpness:  [70, 60, 70, 80, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rookslayerlancei",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_lance__34b: Lance = {
-    category: "lance",
-    id: "34b",
-
-    name: "Rookslayer Lance II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 70, 30, 0, 0],
-    maxSharpness:  [90, 80, 80, 70, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rookslayerlanceii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_lance__34c: Lance = {
-    category: "lance",
-    id: "34c",
-
-    name: "Bazel Myniad Lance",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__34b],
-            [__generated_ramp__blast_boost_2, __generated_lance__34b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 60, 40, 0, 0],
-    maxSharpness:  [90, 80, 80, 60, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "bazelmyniadlance",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_lance__35a: Lance = {
-    category: "lance",
-    id: "35a",
-
-    name: "Gelosteel Spear I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 110, 90, 40, 0, 0],
-    maxSharpness:  [70, 40, 110, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "icesteelspeari",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_lance__35b: Lance = {
-    category: "lance",
-    id: "35b",
-
-    name: "Daora's Fang",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__35a],
-            [__generated_ramp__affinity_boost_2, __generated_lance__35a],
-        ],
-    ],
-
-    baseSharpness: [80, 110, 70, 40, 40, 10, 0],
-    maxSharpness:  [80, 110, 70, 40, 40, 60, 0],
-
-    filterHelpers: {
-        nameLower: "daora'sfang",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_lance__36a: Lance = {
-    category: "lance",
-    id: "36a",
-
-    name: "Teostra's Howl I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 70, 90, 20, 0, 0],
-    maxSharpness:  [150, 20, 70, 90, 20, 50, 0],
-
-    filterHelpers: {
-        nameLower: "teostra'showli",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_lance__36b: Lance = {
-    category: "lance",
-    id: "36b",
-
-    name: "Teostra's Roar",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__36a],
-        ],
-    ],
-
-    baseSharpness: [150, 50, 30, 90, 30, 0, 0],
-    maxSharpness:  [150, 50, 30, 90, 30, 50, 0],
-
-    filterHelpers: {
-        nameLower: "teostra'sroar",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_lance__37a: Lance = {
-    category: "lance",
-    id: "37a",
-
-    name: "Redwing Spear I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    filterHelpers: {
-        nameLower: "redwingspeari",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_lance__37b: Lance = {
-    category: "lance",
-    id: "37b",
-
-    name: "Reddnaught Spear",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    filterHelpers: {
-        nameLower: "reddnaughtspear",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_lance__38a: Lance = {
-    category: "lance",
-    id: "38a",
-
-    name: "Plegis Needle I",
-    treeName: "Chaos Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 0, 0, 0, 0],
-    maxSharpness:  [50, 50, 150, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "plegisneedlei",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_lance__38b: Lance = {
-    category: "lance",
-    id: "38b",
-
-    name: "Plegis Needle II",
-    treeName: "Chaos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 150, 20, 0, 0, 0],
-    maxSharpness:  [40, 40, 150, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "plegisneedleii",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_lance__38c: Lance = {
-    category: "lance",
-    id: "38c",
-
-    name: "Mighty Plegis",
-    treeName: "Chaos Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__paralysis_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__paralysis_boost_1, __generated_lance__38b],
-        ],
-    ],
-
-    baseSharpness: [30, 30, 210, 80, 0, 0, 0],
-    maxSharpness:  [30, 30, 210, 80, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "mightyplegis",
-        treeNameLower: "chaostree",
-    },
-};
-
-const __generated_lance__39a: Lance = {
-    category: "lance",
-    id: "39a",
-
-    name: "Alacrantze I",
-    treeName: "Spio Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-        ],
-    ],
-
-    baseSharpness: [30, 90, 50, 30, 0, 0, 0],
-    maxSharpness:  [30, 90, 50, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "alacrantzei",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_lance__39b: Lance = {
-    category: "lance",
-    id: "39b",
-
-    name: "Alacrantze II",
-    treeName: "Spio Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__39a],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 60, 40, 0, 0, 0],
-    maxSharpness:  [70, 80, 60, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "alacrantzeii",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_lance__39c: Lance = {
-    category: "lance",
-    id: "39c",
-
-    name: "Alacrantze III",
-    treeName: "Spio Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_lance__39a],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 60, 60, 0, 0, 0],
-    maxSharpness:  [100, 80, 60, 80, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "alacrantzeiii",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_lance__39d: Lance = {
-    category: "lance",
-    id: "39d",
-
-    name: "Scorpion Lance",
-    treeName: "Spio Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_lance__39c],
-            [__generated_ramp__defense_boost_1, __generated_lance__39a],
-        ],
-    ],
-
-    baseSharpness: [80, 140, 60, 50, 20, 0, 0],
-    maxSharpness:  [80, 140, 60, 50, 30, 40, 0],
-
-    filterHelpers: {
-        nameLower: "scorpionlance",
-        treeNameLower: "spiotree",
-    },
-};
-
-const __generated_lance__40a: Lance = {
-    category: "lance",
-    id: "40a",
-
-    name: "Fragrance I",
-    treeName: "Melahoa Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [120, 10, 50, 20, 0, 0, 0],
-    maxSharpness:  [120, 10, 50, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "fragrancei",
-        treeNameLower: "melahoatree",
-    },
-};
-
-const __generated_lance__40b: Lance = {
-    category: "lance",
-    id: "40b",
-
-    name: "Fragrance II",
-    treeName: "Melahoa Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__40a],
-            [__generated_ramp__sleep_boost_1, __generated_lance__40a],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 60, 50, 0, 0, 0],
-    maxSharpness:  [100, 40, 60, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "fragranceii",
-        treeNameLower: "melahoatree",
-    },
-};
-
-const __generated_lance__40c: Lance = {
-    category: "lance",
-    id: "40c",
-
-    name: "Classy Fragrance",
-    treeName: "Melahoa Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_3, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__40b],
-            [__generated_ramp__sleep_boost_2, __generated_lance__40b],
-            [__generated_ramp__attack_boost_1, __generated_lance__40a],
-            [__generated_ramp__sleep_boost_1, __generated_lance__40a],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 80, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "classyfragrance",
-        treeNameLower: "melahoatree",
-    },
-};
-
-const __generated_lance__ra: Lance = {
-    category: "lance",
-    id: "ra",
-
-    name: "Rampage Spear I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagespeari",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lance__rb: Lance = {
-    category: "lance",
-    id: "rb",
-
-    name: "Rampage Spear II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagespearii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lance__rc: Lance = {
-    category: "lance",
-    id: "rc",
-
-    name: "Rampage Spear III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_lance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lance__rb],
-            [__generated_ramp__defense_boost_1, __generated_lance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagespeariii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lance__rd: Lance = {
-    category: "lance",
-    id: "rd",
-
-    name: "Rampage Spear IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_lance__rc],
-            [__generated_ramp__attack_boost_1, __generated_lance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lance__rb],
-            [__generated_ramp__defense_boost_1, __generated_lance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_lance__rc],
-            [__generated_ramp__water_1, __generated_lance__rc],
-            [__generated_ramp__thunder_1, __generated_lance__rc],
-            [__generated_ramp__ice_1, __generated_lance__rc],
-            [__generated_ramp__dragon_1, __generated_lance__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagespeariv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lance__re: Lance = {
-    category: "lance",
-    id: "re",
-
-    name: "Rampage Spear V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_lance__rd],
-            [__generated_ramp__affinity_boost_2, __generated_lance__rd],
-            [__generated_ramp__defense_boost_2, __generated_lance__rd],
-            [__generated_ramp__elemental_boost_1, __generated_lance__rc],
-            [__generated_ramp__attack_boost_1, __generated_lance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lance__rb],
-            [__generated_ramp__defense_boost_1, __generated_lance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_lance__rd],
-            [__generated_ramp__water_2, __generated_lance__rd],
-            [__generated_ramp__thunder_2, __generated_lance__rd],
-            [__generated_ramp__ice_2, __generated_lance__rd],
-            [__generated_ramp__dragon_2, __generated_lance__rd],
-            [__generated_ramp__fire_1, __generated_lance__rc],
-            [__generated_ramp__water_1, __generated_lance__rc],
-            [__generated_ramp__thunder_1, __generated_lance__rc],
-            [__generated_ramp__ice_1, __generated_lance__rc],
-            [__generated_ramp__dragon_1, __generated_lance__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rampagespearv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lance__rf: Lance = {
-    category: "lance",
-    id: "rf",
-
-    name: "Rampage Spear S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_3, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_lance__re],
-            [__generated_ramp__elemental_boost_2, __generated_lance__re],
-            [__generated_ramp__affinity_boost_3, __generated_lance__re],
-            [__generated_ramp__attack_boost_2, __generated_lance__rd],
-            [__generated_ramp__affinity_boost_2, __generated_lance__rd],
-            [__generated_ramp__defense_boost_2, __generated_lance__rd],
-            [__generated_ramp__elemental_boost_1, __generated_lance__rc],
-            [__generated_ramp__attack_boost_1, __generated_lance__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lance__rb],
-            [__generated_ramp__defense_boost_1, __generated_lance__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_lance__re],
-            [__generated_ramp__paralysis_1, __generated_lance__re],
-            [__generated_ramp__sleep_1, __generated_lance__re],
-            [__generated_ramp__blast_1, __generated_lance__re],
-            [__generated_ramp__fire_2, __generated_lance__rd],
-            [__generated_ramp__water_2, __generated_lance__rd],
-            [__generated_ramp__thunder_2, __generated_lance__rd],
-            [__generated_ramp__ice_2, __generated_lance__rd],
-            [__generated_ramp__dragon_2, __generated_lance__rd],
-            [__generated_ramp__fire_1, __generated_lance__rc],
-            [__generated_ramp__water_1, __generated_lance__rc],
-            [__generated_ramp__thunder_1, __generated_lance__rc],
-            [__generated_ramp__ice_1, __generated_lance__rc],
-            [__generated_ramp__dragon_1, __generated_lance__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagespears",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"lance","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Spear I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0]},{"id":"1b","name":"Kamura Spear II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0]},{"id":"1c","name":"Kamura Spear III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0]},{"id":"1d","name":"Kamura Spear IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"1e","name":"Kamura Spear V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0]},{"id":"1f","name":"Kamura Ninja Spear","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0]}]],["Goss Harag Tree",[{"id":"2a","name":"Goss Lance I","rarity":3,"endlineTag":"","attack":170,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["ice",10]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_1",null],["brutal_strike",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,90,30,0,0,0],"maxSharpness":[100,30,90,70,10,0,0]},{"id":"2b","name":"Goss Lance II","rarity":5,"endlineTag":"","attack":200,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",12]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,110,40,20,0,0],"maxSharpness":[100,30,110,40,70,0,0]},{"id":"2c","name":"Abominable Lance","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",14]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_3",null],["brutal_strike",null],["ice_boost_2","2b"],["ice_boost_1","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,100,40,30,0,0],"maxSharpness":[100,30,100,40,70,10,0]}]],["Mizutsune Tree",[{"id":"3a","name":"Hana Mo Hana Nare I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",14]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,40,50,0,0,0],"maxSharpness":[70,40,40,70,30,0,0]},{"id":"3b","name":"Hana Mo Hana Nare II","rarity":5,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,100,70,30,40,0,0],"maxSharpness":[110,100,70,30,70,20,0]},{"id":"3c","name":"Kimi Ga Kiru","rarity":6,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",28]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","3b"],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,100,70,20,50,0,0],"maxSharpness":[110,100,70,20,50,50,0]}]],["Remobra Tree",[{"id":"4a","name":"Naag Serpentblade I","rarity":2,"endlineTag":"","attack":80,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[["poison",26]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,60,70,30,0,0,0],"maxSharpness":[40,60,70,80,0,0,0]},{"id":"4b","name":"Naag Serpentblade II","rarity":3,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["poison",31]],"rampSkills":[[["attack_boost_3",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","4a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,50,50,40,0,0,0],"maxSharpness":[60,50,50,90,0,0,0]},{"id":"4c","name":"Devta Serpentblade","rarity":4,"endlineTag":"hr","attack":130,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[["poison",41]],"rampSkills":[[["attack_boost_3",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","4a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,60,60,70,0,0,0],"maxSharpness":[60,60,60,70,40,10,0]}]],["Tetranadon Tree",[{"id":"5a","name":"Distension I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",12]],"rampSkills":[[["defense_boost_1",null],["water_boost_1",null],["dulling_strike",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[30,80,70,20,0,0,0],"maxSharpness":[30,80,70,70,0,0,0]},{"id":"5b","name":"Distension II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":10,"decoSlots":[2],"eleStat":[["water",16]],"rampSkills":[[["defense_boost_1",null],["water_boost_3",null],["dulling_strike",null],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[40,90,110,60,0,0,0],"maxSharpness":[40,90,110,100,10,0,0]},{"id":"5c","name":"Croaker","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["water",18]],"rampSkills":[[["defense_boost_2",null],["water_boost_3",null],["dulling_strike",null],["defense_boost_1","5b"],["water_boost_1","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[40,90,110,110,0,0,0],"maxSharpness":[40,90,110,130,30,0,0]}]],["Izuchi Tree",[{"id":"6a","name":"Wind Thief Lance I","rarity":1,"endlineTag":"","attack":70,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[80,30,50,40,0,0,0],"maxSharpness":[80,30,50,90,0,0,0]},{"id":"6b","name":"Wind Thief Lance II","rarity":2,"endlineTag":"","attack":100,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[80,40,30,50,0,0,0],"maxSharpness":[80,40,30,50,50,0,0]},{"id":"6c","name":"Gale Lance","rarity":4,"endlineTag":"hr","attack":140,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","6b"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[80,50,20,50,50,0,0],"maxSharpness":[80,50,20,50,50,50,0]}]],["Zamite Tree",[{"id":"7a","name":"Sharktooth Spear I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",17]],"rampSkills":[[["defense_boost_1",null],["master_rider",null],["small_monster_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[70,60,50,20,0,0,0],"maxSharpness":[70,60,50,70,0,0,0]},{"id":"7b","name":"Sharktooth Spear II","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",22]],"rampSkills":[[["defense_boost_2",null],["master_rider",null],["small_monster_exploit",null],["defense_boost_1","7a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[110,60,40,40,0,0,0],"maxSharpness":[110,60,40,80,10,0,0]},{"id":"7c","name":"Razortooth Spear","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",29]],"rampSkills":[[["defense_boost_3",null],["master_rider",null],["element_exploit",null],["defense_boost_2","7b"],["small_monster_exploit","7b"],["defense_boost_1","7a"],["attack_boost_1","1b"],["affinity_boost_2","1b"]]],"baseSharpness":[130,60,40,50,20,0,0],"maxSharpness":[130,60,40,50,60,10,0]}]],["Ore Tree",[{"id":"8a","name":"Iron Lance I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0]},{"id":"8b","name":"Iron Lance II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,110,10,0,0,0]},{"id":"8c","name":"Millennial Lance","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","8b"]]],"baseSharpness":[80,80,60,30,0,0,0],"maxSharpness":[80,80,60,80,0,0,0]},{"id":"8d","name":"Paladin Lance I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0]},{"id":"8e","name":"Paladin Lance II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[100,90,90,50,20,0,0],"maxSharpness":[100,90,90,50,50,20,0]},{"id":"8f","name":"Rampart","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","8e"],["defense_boost_2","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,90,90,50,30,0,0],"maxSharpness":[90,90,90,50,50,30,0]}]],["Ore Tree 2",[{"id":"9a","name":"Babel Spear I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":15,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["wyvern_exploit",null],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[60,60,120,40,20,0,0],"maxSharpness":[60,60,120,40,70,0,0]},{"id":"9b","name":"Babel Spear II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":15,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["wyvern_exploit",null],["attack_boost_2","9a"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[50,50,160,60,30,0,0],"maxSharpness":[50,50,160,60,60,20,0]},{"id":"9c","name":"Elder Babel Spear","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["wyvern_exploit",null],["attack_boost_3","9b"],["defense_boost_2","9b"],["attack_boost_2","9a"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[20,20,190,80,40,0,0],"maxSharpness":[20,20,190,80,40,50,0]}]],["Basarios Tree",[{"id":"10a","name":"Venom Lance I","rarity":5,"endlineTag":"","attack":190,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[["poison",14]],"rampSkills":[[["defense_boost_2",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","9a"],["wyvern_exploit","9a"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,90,80,40,0,0,0],"maxSharpness":[90,90,80,90,0,0,0]},{"id":"10b","name":"Venom Lance II","rarity":6,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[["poison",20]],"rampSkills":[[["defense_boost_3",null],["poison_boost_1",null],["dulling_strike",null],["defense_boost_2","10a"],["attack_boost_2","9a"],["wyvern_exploit","9a"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[80,80,80,60,0,0,0],"maxSharpness":[80,80,80,100,10,0,0]},{"id":"10c","name":"Basarios Venom Spear","rarity":6,"endlineTag":"hr","attack":220,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[["poison",23]],"rampSkills":[[["defense_boost_3",null],["poison_boost_2",null],["dulling_strike",null],["poison_boost_1","10b"],["defense_boost_2","10a"],["attack_boost_2","9a"],["wyvern_exploit","9a"],["silkbind_boost","8d"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[100,90,80,80,0,0,0],"maxSharpness":[100,90,80,90,40,0,0]}]],["Nargacuga Tree",[{"id":"11a","name":"Hidden Stinger I","rarity":3,"endlineTag":"","attack":110,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0]},{"id":"11b","name":"Hidden Stinger II","rarity":5,"endlineTag":"","attack":160,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","11a"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[100,30,70,100,50,0,0],"maxSharpness":[100,30,70,100,70,30,0]},{"id":"11c","name":"Night Rains Black","rarity":6,"endlineTag":"hr","attack":180,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","11b"],["attack_boost_2","11a"],["defense_boost_2","8c"],["attack_boost_1","8b"]]],"baseSharpness":[70,40,110,90,60,30,0],"maxSharpness":[70,40,110,90,60,30,0]}]],["Drag\\u00e3o Tree",[{"id":"12a","name":"Growling Wyvern I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["dragon",15]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["element_exploit",null],["attack_boost_2","8c"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[90,80,90,40,0,0,0],"maxSharpness":[90,80,90,60,30,0,0]},{"id":"12b","name":"Growling Wyvern II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":10,"decoSlots":[1,1],"eleStat":[["dragon",15]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["element_exploit",null],["affinity_boost_2","12a"],["attack_boost_2","8c"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[70,80,90,60,0,0,0],"maxSharpness":[70,80,90,80,30,0,0]},{"id":"12c","name":"Roaring Wyvern","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":15,"decoSlots":[1,1],"eleStat":[["dragon",15]],"rampSkills":[[["affinity_boost_4",null],["defense_boost_3",null],["element_exploit",null],["affinity_boost_3","12b"],["defense_boost_2","12b"],["affinity_boost_2","12a"],["attack_boost_2","8c"],["affinity_boost_1","8c"],["attack_boost_1","8b"]]],"baseSharpness":[70,80,90,90,20,0,0],"maxSharpness":[70,80,90,90,70,0,0]}]],["Tobi-Kadachi Tree",[{"id":"13a","name":"Kadachi Lance I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",13]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunderblight_exploit",null],["defense_boost_2","8b"]]],"baseSharpness":[130,30,50,40,0,0,0],"maxSharpness":[130,30,50,90,0,0,0]},{"id":"13b","name":"Kadachi Lance II","rarity":5,"endlineTag":"","attack":180,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunderblight_exploit",null],["attack_boost_1","13a"],["affinity_boost_1","13a"],["defense_boost_2","8b"]]],"baseSharpness":[120,70,40,40,30,0,0],"maxSharpness":[120,70,40,40,80,0,0]},{"id":"13c","name":"Shockspear","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["thunder",20]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["thunderblight_exploit",null],["attack_boost_2","13b"],["attack_boost_1","13a"],["affinity_boost_1","13a"],["defense_boost_2","8b"]]],"baseSharpness":[150,80,40,40,40,0,0],"maxSharpness":[150,80,40,40,70,20,0]}]],["Aknosom Tree",[{"id":"14a","name":"Aknosom Lance I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",11]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[30,50,80,40,0,0,0],"maxSharpness":[30,50,80,90,0,0,0]},{"id":"14b","name":"Aknosom Lance II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",14]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[40,50,100,60,0,0,0],"maxSharpness":[40,50,100,100,10,0,0]},{"id":"14c","name":"Aknosom Lance III","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",19]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["attack_boost_1","14b"],["fire_boost_1","14b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[50,50,130,60,10,0,0],"maxSharpness":[50,50,130,60,40,20,0]},{"id":"14d","name":"Dawnbreaker Lance","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",24]],"rampSkills":[[["attack_boost_2",null],["fire_boost_3",null],["fireblight_exploit",null],["fire_boost_2","14c"],["attack_boost_1","14b"],["fire_boost_1","14b"],["affinity_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[50,50,160,60,30,0,0],"maxSharpness":[50,50,160,60,40,40,0]}]],["Barroth Tree",[{"id":"15a","name":"Rugged Lance I","rarity":2,"endlineTag":"","attack":120,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[60,60,130,0,0,0,0],"maxSharpness":[60,60,130,50,0,0,0]},{"id":"15b","name":"Rugged Lance II","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","15a"],["attack_boost_1","8b"]]],"baseSharpness":[60,50,160,30,0,0,0],"maxSharpness":[60,50,160,80,0,0,0]},{"id":"15c","name":"Barroth Carver","rarity":5,"endlineTag":"hr","attack":200,"affinity":-20,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","15b"],["defense_boost_1","15a"],["attack_boost_1","8b"]]],"baseSharpness":[60,40,190,50,10,0,0],"maxSharpness":[60,40,190,50,40,20,0]}]],["Thunder Tree",[{"id":"16a","name":"Drill Lance I","rarity":4,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[1,1,1],"eleStat":[["thunder",8]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["element_exploit",null],["affinity_boost_1","15b"],["brutal_strike","15b"],["defense_boost_1","15a"],["attack_boost_1","8b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,120,0,0,0]},{"id":"16b","name":"Drill Lance II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[["thunder",11]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["element_exploit",null],["affinity_boost_2","16a"],["affinity_boost_1","15b"],["brutal_strike","15b"],["defense_boost_1","15a"],["attack_boost_1","8b"]]],"baseSharpness":[50,60,70,120,0,0,0],"maxSharpness":[50,60,70,150,20,0,0]},{"id":"16c","name":"Gigadrill Lance","rarity":6,"endlineTag":"hr","attack":210,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[["thunder",15]],"rampSkills":[[["affinity_boost_4",null],["defense_boost_3",null],["element_exploit",null],["affinity_boost_3","16b"],["defense_boost_2","16b"],["affinity_boost_2","16a"],["affinity_boost_1","15b"],["brutal_strike","15b"],["defense_boost_1","15a"],["attack_boost_1","8b"]]],"baseSharpness":[50,60,70,160,10,0,0],"maxSharpness":[50,60,70,160,60,0,0]}]],["Volvidon Tree",[{"id":"17a","name":"Volvi Stroke I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",19]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_1","15a"],["brutal_strike","15a"],["attack_boost_1","8b"],["defense_boost_2","8b"]]],"baseSharpness":[100,30,40,30,0,0,0],"maxSharpness":[100,30,40,80,0,0,0]},{"id":"17b","name":"Volvi Stroke II","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["paralysis",23]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["defense_boost_1","17a"],["affinity_boost_1","15a"],["brutal_strike","15a"],["attack_boost_1","8b"]]],"baseSharpness":[100,40,30,80,0,0,0],"maxSharpness":[100,40,30,110,20,0,0]},{"id":"17c","name":"Volvi Sweep","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["paralysis",27]],"rampSkills":[[["attack_boost_4",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_3","17b"],["defense_boost_1","17a"],["affinity_boost_1","15a"],["brutal_strike","15a"],["attack_boost_1","8b"]]],"baseSharpness":[100,50,50,80,20,0,0],"maxSharpness":[100,50,50,80,60,10,0]}]],["Fire Tree",[{"id":"18a","name":"Heat Lance I","rarity":1,"endlineTag":"","attack":90,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["fire",9]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_1","8a"],["affinity_boost_1","8a"],["defense_boost_2","8a"]]],"baseSharpness":[110,20,50,20,0,0,0],"maxSharpness":[110,20,50,70,0,0,0]},{"id":"18b","name":"Heat Lance II","rarity":3,"endlineTag":"","attack":160,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["fire",12]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["affinity_boost_2","18a"],["defense_boost_1","18a"],["attack_boost_1","8a"],["affinity_boost_1","8a"]]],"baseSharpness":[150,20,50,30,0,0,0],"maxSharpness":[150,20,50,70,10,0,0]},{"id":"18c","name":"Heatstinger","rarity":5,"endlineTag":"hr","attack":190,"affinity":-10,"defense":0,"decoSlots":[1,1,1],"eleStat":[["fire",17]],"rampSkills":[[["affinity_boost_4",null],["defense_boost_3",null],["dulling_strike",null],["affinity_boost_3","18b"],["defense_boost_2","18b"],["affinity_boost_2","18a"],["defense_boost_1","18a"],["attack_boost_1","8a"],["affinity_boost_1","8a"]]],"baseSharpness":[170,20,60,50,0,0,0],"maxSharpness":[170,20,60,70,30,0,0]}]],["Bone Tree",[{"id":"19a","name":"Bone Lance I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0]},{"id":"19b","name":"Hard Bone Lance","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"19c","name":"Longhorn Spear I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","19b"]]],"baseSharpness":[90,50,60,0,0,0,0],"maxSharpness":[90,50,110,0,0,0,0]},{"id":"19d","name":"Longtusk Spear","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[100,70,70,10,0,0,0],"maxSharpness":[100,70,70,60,0,0,0]},{"id":"19e","name":"Barbarian Tusk I","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","19d"],["defense_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0]},{"id":"19f","name":"Barbarian Fang","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","19d"],["defense_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,100,20,0,0]}]],["Tigrex Tree",[{"id":"20a","name":"Tiger Stinger I","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["dulling_strike","19f"],["attack_boost_2","19d"],["defense_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,30,120,70,30,0,0],"maxSharpness":[50,30,120,70,60,20,0]},{"id":"20b","name":"Tiger Stinger II","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["dulling_strike","19f"],["attack_boost_2","19d"],["defense_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,40,120,100,40,0,0],"maxSharpness":[50,40,120,100,70,20,0]},{"id":"20c","name":"Tigrex Lance","rarity":7,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["dulling_strike","19f"],["attack_boost_2","19d"],["defense_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,50,120,100,60,20,0],"maxSharpness":[50,50,120,100,60,20,0]}]],["Barioth Tree",[{"id":"21a","name":"Tusk Lance I","rarity":2,"endlineTag":"","attack":80,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0]},{"id":"21b","name":"Tusk Lance II","rarity":5,"endlineTag":"","attack":160,"affinity":35,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",24]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","21a"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,70,30,0]},{"id":"21c","name":"Sabertooth","rarity":6,"endlineTag":"hr","attack":170,"affinity":40,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",26]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_3",null],["iceblight_exploit",null],["affinity_boost_2","21b"],["attack_boost_2","21a"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,70,80,90,60,0,0],"maxSharpness":[50,70,80,90,60,50,0]}]],["Pukei-Pukei Tree",[{"id":"22a","name":"Pukei Spear I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",16]],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["poison_boost_1",null],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,70,20,50,0,0,0],"maxSharpness":[60,70,20,100,0,0,0]},{"id":"22b","name":"Pukei Spear II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",24]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_2",null],["attack_boost_2","22a"],["poison_boost_1","22a"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,60,70,90,20,0,0],"maxSharpness":[60,60,70,90,70,0,0]},{"id":"22c","name":"Datura Spear","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",27]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["poison_boost_2",null],["defense_boost_1","22b"],["attack_boost_2","22a"],["poison_boost_1","22a"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,60,100,100,30,0,0],"maxSharpness":[60,60,100,100,70,10,0]}]],["Rathalos Tree",[{"id":"23a","name":"Red Tail I","rarity":3,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",29]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_1","22a"],["poison_boost_1","22a"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,50,50,40,0,0,0],"maxSharpness":[60,50,50,80,10,0,0]},{"id":"23b","name":"Red Tail II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",34]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_1","22a"],["poison_boost_1","22a"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[70,80,80,100,20,0,0],"maxSharpness":[70,80,80,100,70,0,0]},{"id":"23c","name":"Spear of Prominence","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["fire",37]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","23b"],["defense_boost_1","22a"],["poison_boost_1","22a"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[50,40,110,110,40,0,0],"maxSharpness":[50,40,110,110,70,20,0]}]],["Royal Ludroth Tree",[{"id":"24a","name":"Spiral Lance I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",16]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[40,70,50,40,0,0,0],"maxSharpness":[40,70,50,90,0,0,0]},{"id":"24b","name":"Spiral Lance II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",25]],"rampSkills":[[["attack_boost_2",null],["water_boost_2",null],["waterblight_exploit",null],["water_boost_1","24a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,80,70,50,0,0,0],"maxSharpness":[50,80,70,90,10,0,0]},{"id":"24c","name":"Spiral Splash","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",31]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","24b"],["water_boost_1","24a"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,80,80,70,20,0,0],"maxSharpness":[50,80,80,70,60,10,0]}]],["Rhenoplos Tree",[{"id":"25a","name":"Ploshasta I","rarity":2,"endlineTag":"","attack":110,"affinity":-10,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["brutal_strike",null],["small_monster_exploit",null],["attack_boost_2","19b"],["affinity_boost_1","19b"]]],"baseSharpness":[100,20,60,20,0,0,0],"maxSharpness":[100,20,60,70,0,0,0]},{"id":"25b","name":"Ploshasta II","rarity":4,"endlineTag":"","attack":180,"affinity":-10,"defense":10,"decoSlots":[3],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["brutal_strike",null],["small_monster_exploit",null],["defense_boost_1","25a"],["attack_boost_2","19b"],["affinity_boost_1","19b"]]],"baseSharpness":[100,50,40,60,0,0,0],"maxSharpness":[100,50,40,60,50,0,0]},{"id":"25c","name":"Rhenohasta","rarity":5,"endlineTag":"hr","attack":190,"affinity":-10,"defense":10,"decoSlots":[3],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["brutal_strike",null],["small_monster_exploit",null],["defense_boost_1","25a"],["attack_boost_2","19b"],["affinity_boost_1","19b"]]],"baseSharpness":[100,90,40,70,0,0,0],"maxSharpness":[100,90,40,70,30,20,0]}]],["Diablos Tree",[{"id":"26a","name":"Diablos Lance I","rarity":3,"endlineTag":"","attack":170,"affinity":-30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["small_monster_exploit","25a"],["attack_boost_2","19b"]]],"baseSharpness":[60,40,50,100,0,0,0],"maxSharpness":[60,40,50,110,40,0,0]},{"id":"26b","name":"Diablos Lance II","rarity":6,"endlineTag":"","attack":240,"affinity":-30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["brutal_strike",null],["affinity_boost_1","26a"],["small_monster_exploit","25a"],["attack_boost_2","19b"]]],"baseSharpness":[100,70,30,120,30,0,0],"maxSharpness":[100,70,30,120,70,10,0]},{"id":"26c","name":"Diablos Spear","rarity":6,"endlineTag":"hr","attack":250,"affinity":-30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_2","26b"],["defense_boost_1","26b"],["affinity_boost_1","26a"],["small_monster_exploit","25a"],["attack_boost_2","19b"]]],"baseSharpness":[40,60,80,120,50,0,0],"maxSharpness":[40,60,80,120,70,30,0]}]],["Kulu-Ya-Ku Tree",[{"id":"27a","name":"Kulu Spear I","rarity":2,"endlineTag":"","attack":100,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["master_rider",null],["spiribird_doubled",null],["attack_boost_2","19b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,60,40,30,0,0,0],"maxSharpness":[70,60,40,80,0,0,0]},{"id":"27b","name":"Kulu Spear II","rarity":2,"endlineTag":"","attack":110,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["master_rider",null],["spiribird_doubled",null],["attack_boost_2","19b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,50,50,50,0,0,0],"maxSharpness":[50,50,50,100,0,0,0]},{"id":"27c","name":"Kulu Skewer","rarity":5,"endlineTag":"hr","attack":160,"affinity":25,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["master_rider",null],["spiribird_doubled",null],["affinity_boost_2","27b"],["attack_boost_2","19b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[100,70,50,60,20,0,0],"maxSharpness":[100,70,50,60,70,0,0]}]],["Zinogre Tree",[{"id":"28a","name":"Usurper\'s Coming I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",17]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["affinity_boost_2","27b"],["master_rider","27b"],["spiribird_doubled","27b"],["attack_boost_2","19b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,40,50,90,0,0,0],"maxSharpness":[70,40,50,140,0,0,0]},{"id":"28b","name":"Usurper\'s Coming II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",21]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","28a"],["affinity_boost_2","27b"],["master_rider","27b"],["spiribird_doubled","27b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[60,50,100,100,40,0,0],"maxSharpness":[60,50,100,100,90,0,0]},{"id":"28c","name":"Despot\'s Cacophony","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",29]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","28b"],["attack_boost_1","28a"],["affinity_boost_2","27b"],["master_rider","27b"],["spiribird_doubled","27b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[60,40,100,100,50,0,0],"maxSharpness":[60,40,100,100,60,40,0]}]],["Baggi Tree",[{"id":"29a","name":"Azure Crest I","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",9]],"rampSkills":[[["affinity_boost_1",null],["sleep_boost_1",null],["buddy_rally",null],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[80,50,50,20,0,0,0],"maxSharpness":[80,50,50,70,0,0,0]},{"id":"29b","name":"Azure Crest II","rarity":3,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",14]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_1",null],["buddy_rally",null],["affinity_boost_1","29a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[100,60,40,50,0,0,0],"maxSharpness":[100,60,40,80,20,0,0]},{"id":"29c","name":"Azure Crest III","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["sleep",24]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_2",null],["buddy_rally",null],["sleep_boost_1","29b"],["affinity_boost_1","29a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[100,70,60,50,20,0,0],"maxSharpness":[100,70,60,50,50,20,0]},{"id":"29d","name":"Great Azure","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["sleep",29]],"rampSkills":[[["affinity_boost_3",null],["sleep_boost_2",null],["buddy_rally",null],["affinity_boost_2","29c"],["sleep_boost_1","29b"],["affinity_boost_1","29a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[130,30,100,60,30,0,0],"maxSharpness":[130,30,100,60,50,30,0]}]],["Magnamalo Tree",[{"id":"30a","name":"Sinister Spear I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",10]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0]},{"id":"30b","name":"Sinister Spear II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",13]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","30a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0]},{"id":"30c","name":"Sinister Shadespear","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",19]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","30b"],["attack_boost_2","30a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0]}]],["Rajang Tree",[{"id":"31a","name":"Demon Lance I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",5]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,130,0,0,0]},{"id":"31b","name":"Demon Lance II","rarity":6,"endlineTag":"","attack":210,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["thunder",7]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","31a"]]],"baseSharpness":[20,40,100,90,0,0,0],"maxSharpness":[20,40,100,130,10,0,0]},{"id":"31c","name":"Great Demon Lance","rarity":7,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["thunder",10]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","31b"],["thunder_boost_1","31a"]]],"baseSharpness":[50,60,90,100,0,0,0],"maxSharpness":[50,60,90,100,30,20,0]}]],["Ibushi Tree",[{"id":"32a","name":"Azure Elder Spear I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",6]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0]},{"id":"32b","name":"Azure Elder Spear II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",9]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","32a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0]},{"id":"32c","name":"Abyssal Gale Lance","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",11]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","32b"],["defense_boost_1","32a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0]}]],["Narwa Tree",[{"id":"33a","name":"Thunderbolt Spear I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",33]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0]},{"id":"33b","name":"Abyssal Storm Lance","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",38]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","33a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0]}]],["Bazelgeuse Tree",[{"id":"34a","name":"Rookslayer Lance I","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",10]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[70,60,70,80,20,0,0],"maxSharpness":[70,60,70,80,70,0,0]},{"id":"34b","name":"Rookslayer Lance II","rarity":6,"endlineTag":"","attack":210,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",12]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[90,80,80,70,30,0,0],"maxSharpness":[90,80,80,70,80,0,0]},{"id":"34c","name":"Bazel Myniad Lance","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",15]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["brutal_strike",null],["defense_boost_1","34b"],["blast_boost_2","34b"]]],"baseSharpness":[90,80,80,60,40,0,0],"maxSharpness":[90,80,80,60,70,20,0]}]],["Kushala Daora Tree",[{"id":"35a","name":"Gelosteel Spear I","rarity":6,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",30]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[70,40,110,90,40,0,0],"maxSharpness":[70,40,110,90,60,30,0]},{"id":"35b","name":"Daora\'s Fang","rarity":7,"endlineTag":"hr","attack":190,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",36]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","35a"],["affinity_boost_2","35a"]]],"baseSharpness":[80,110,70,40,40,10,0],"maxSharpness":[80,110,70,40,40,60,0]}]],["Teostra Tree",[{"id":"36a","name":"Teostra\'s Howl I","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",27]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[150,20,70,90,20,0,0],"maxSharpness":[150,20,70,90,20,50,0]},{"id":"36b","name":"Teostra\'s Roar","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",32]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","36a"]]],"baseSharpness":[150,50,30,90,30,0,0],"maxSharpness":[150,50,30,90,30,50,0]}]],["Valstrax Tree",[{"id":"37a","name":"Redwing Spear I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",30]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0]},{"id":"37b","name":"Reddnaught Spear","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",35]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0]}]],["Chaos Tree",[{"id":"38a","name":"Plegis Needle I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",10]],"rampSkills":[[["paralysis_boost_1",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[50,50,100,0,0,0,0],"maxSharpness":[50,50,150,0,0,0,0]},{"id":"38b","name":"Plegis Needle II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",15]],"rampSkills":[[["paralysis_boost_1",null],["dulling_strike",null],["spiribird_doubled",null]]],"baseSharpness":[40,40,150,20,0,0,0],"maxSharpness":[40,40,150,70,0,0,0]},{"id":"38c","name":"Mighty Plegis","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",18]],"rampSkills":[[["paralysis_boost_2",null],["dulling_strike",null],["spiribird_doubled",null],["paralysis_boost_1","38b"]]],"baseSharpness":[30,30,210,80,0,0,0],"maxSharpness":[30,30,210,80,50,0,0]}]],["Spio Tree",[{"id":"39a","name":"Alacrantze I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["poison",18]],"rampSkills":[[["defense_boost_1",null],["poison_boost_1",null],["silkbind_boost",null]]],"baseSharpness":[30,90,50,30,0,0,0],"maxSharpness":[30,90,50,80,0,0,0]},{"id":"39b","name":"Alacrantze II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["poison",22]],"rampSkills":[[["defense_boost_2",null],["poison_boost_1",null],["silkbind_boost",null],["defense_boost_1","39a"]]],"baseSharpness":[70,80,60,40,0,0,0],"maxSharpness":[70,80,60,90,0,0,0]},{"id":"39c","name":"Alacrantze III","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":10,"decoSlots":[3],"eleStat":[["poison",25]],"rampSkills":[[["defense_boost_2",null],["poison_boost_1",null],["silkbind_boost",null],["defense_boost_1","39a"]]],"baseSharpness":[100,80,60,60,0,0,0],"maxSharpness":[100,80,60,80,30,0,0]},{"id":"39d","name":"Scorpion Lance","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":10,"decoSlots":[3],"eleStat":[["poison",29]],"rampSkills":[[["defense_boost_3",null],["poison_boost_1",null],["silkbind_boost",null],["defense_boost_2","39c"],["defense_boost_1","39a"]]],"baseSharpness":[80,140,60,50,20,0,0],"maxSharpness":[80,140,60,50,30,40,0]}]],["Melahoa Tree",[{"id":"40a","name":"Fragrance I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",13]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["anti_aquatic_species",null]]],"baseSharpness":[120,10,50,20,0,0,0],"maxSharpness":[120,10,50,70,0,0,0]},{"id":"40b","name":"Fragrance II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",17]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_2",null],["anti_aquatic_species",null],["attack_boost_1","40a"],["sleep_boost_1","40a"]]],"baseSharpness":[100,40,60,50,0,0,0],"maxSharpness":[100,40,60,100,0,0,0]},{"id":"40c","name":"Classy Fragrance","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["sleep",20]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_3",null],["anti_aquatic_species",null],["attack_boost_2","40b"],["sleep_boost_2","40b"],["attack_boost_1","40a"],["sleep_boost_1","40a"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,80,40,0,0]}]],["Rampage Tree",[{"id":"ra","name":"Rampage Spear I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"rb","name":"Rampage Spear II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"rc","name":"Rampage Spear III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"rd","name":"Rampage Spear IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0]},{"id":"re","name":"Rampage Spear V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0]},{"id":"rf","name":"Rampage Spear S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_3",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["elemental_boost_2","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0]}]]]}';
 
-export const lancesArray: Readonly<Lance[]> = [
-    __generated_lance__1a,
-    __generated_lance__1b,
-    __generated_lance__1c,
-    __generated_lance__1d,
-    __generated_lance__1e,
-    __generated_lance__1f,
-    __generated_lance__2a,
-    __generated_lance__2b,
-    __generated_lance__2c,
-    __generated_lance__3a,
-    __generated_lance__3b,
-    __generated_lance__3c,
-    __generated_lance__4a,
-    __generated_lance__4b,
-    __generated_lance__4c,
-    __generated_lance__5a,
-    __generated_lance__5b,
-    __generated_lance__5c,
-    __generated_lance__6a,
-    __generated_lance__6b,
-    __generated_lance__6c,
-    __generated_lance__7a,
-    __generated_lance__7b,
-    __generated_lance__7c,
-    __generated_lance__8a,
-    __generated_lance__8b,
-    __generated_lance__8c,
-    __generated_lance__8d,
-    __generated_lance__8e,
-    __generated_lance__8f,
-    __generated_lance__9a,
-    __generated_lance__9b,
-    __generated_lance__9c,
-    __generated_lance__10a,
-    __generated_lance__10b,
-    __generated_lance__10c,
-    __generated_lance__11a,
-    __generated_lance__11b,
-    __generated_lance__11c,
-    __generated_lance__12a,
-    __generated_lance__12b,
-    __generated_lance__12c,
-    __generated_lance__13a,
-    __generated_lance__13b,
-    __generated_lance__13c,
-    __generated_lance__14a,
-    __generated_lance__14b,
-    __generated_lance__14c,
-    __generated_lance__14d,
-    __generated_lance__15a,
-    __generated_lance__15b,
-    __generated_lance__15c,
-    __generated_lance__16a,
-    __generated_lance__16b,
-    __generated_lance__16c,
-    __generated_lance__17a,
-    __generated_lance__17b,
-    __generated_lance__17c,
-    __generated_lance__18a,
-    __generated_lance__18b,
-    __generated_lance__18c,
-    __generated_lance__19a,
-    __generated_lance__19b,
-    __generated_lance__19c,
-    __generated_lance__19d,
-    __generated_lance__19e,
-    __generated_lance__19f,
-    __generated_lance__20a,
-    __generated_lance__20b,
-    __generated_lance__20c,
-    __generated_lance__21a,
-    __generated_lance__21b,
-    __generated_lance__21c,
-    __generated_lance__22a,
-    __generated_lance__22b,
-    __generated_lance__22c,
-    __generated_lance__23a,
-    __generated_lance__23b,
-    __generated_lance__23c,
-    __generated_lance__24a,
-    __generated_lance__24b,
-    __generated_lance__24c,
-    __generated_lance__25a,
-    __generated_lance__25b,
-    __generated_lance__25c,
-    __generated_lance__26a,
-    __generated_lance__26b,
-    __generated_lance__26c,
-    __generated_lance__27a,
-    __generated_lance__27b,
-    __generated_lance__27c,
-    __generated_lance__28a,
-    __generated_lance__28b,
-    __generated_lance__28c,
-    __generated_lance__29a,
-    __generated_lance__29b,
-    __generated_lance__29c,
-    __generated_lance__29d,
-    __generated_lance__30a,
-    __generated_lance__30b,
-    __generated_lance__30c,
-    __generated_lance__31a,
-    __generated_lance__31b,
-    __generated_lance__31c,
-    __generated_lance__32a,
-    __generated_lance__32b,
-    __generated_lance__32c,
-    __generated_lance__33a,
-    __generated_lance__33b,
-    __generated_lance__34a,
-    __generated_lance__34b,
-    __generated_lance__34c,
-    __generated_lance__35a,
-    __generated_lance__35b,
-    __generated_lance__36a,
-    __generated_lance__36b,
-    __generated_lance__37a,
-    __generated_lance__37b,
-    __generated_lance__38a,
-    __generated_lance__38b,
-    __generated_lance__38c,
-    __generated_lance__39a,
-    __generated_lance__39b,
-    __generated_lance__39c,
-    __generated_lance__39d,
-    __generated_lance__40a,
-    __generated_lance__40b,
-    __generated_lance__40c,
-    __generated_lance__ra,
-    __generated_lance__rb,
-    __generated_lance__rc,
-    __generated_lance__rd,
-    __generated_lance__re,
-    __generated_lance__rf,
-];
+export const lancesArray: Readonly<Lance[]> = loadWeaponPayload<Lance>(payload);
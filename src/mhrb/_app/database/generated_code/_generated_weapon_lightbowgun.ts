@@ -36,10580 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type LightBowgun,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__add_normal_ammo_1,
-    __generated_ramp__add_normal_ammo_2,
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__cluster_effect_1,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_effect_1,
-    __generated_ramp__dragon_effect_2,
-    __generated_ramp__element_exploit,
-    __generated_ramp__exhaust_effect_1,
-    __generated_ramp__exhaust_effect_2,
-    __generated_ramp__fire_effect_1,
-    __generated_ramp__fire_effect_2,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_effect_1,
-    __generated_ramp__ice_effect_2,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__normal_effect_1,
-    __generated_ramp__normal_effect_2,
-    __generated_ramp__paralysis_effect_1,
-    __generated_ramp__paralysis_effect_2,
-    __generated_ramp__pierce_effect_1,
-    __generated_ramp__pierce_effect_2,
-    __generated_ramp__poison_effect_1,
-    __generated_ramp__poison_effect_2,
-    __generated_ramp__rapid_fire_dragon,
-    __generated_ramp__rapid_fire_fire,
-    __generated_ramp__rapid_fire_ice,
-    __generated_ramp__rapid_fire_normal,
-    __generated_ramp__rapid_fire_piercing,
-    __generated_ramp__rapid_fire_shrapnel,
-    __generated_ramp__rapid_fire_spread,
-    __generated_ramp__rapid_fire_sticky,
-    __generated_ramp__rapid_fire_thunder,
-    __generated_ramp__rapid_fire_water,
-    __generated_ramp__recoil_down_boost,
-    __generated_ramp__recoil_down_surge,
-    __generated_ramp__reload_speed_boost,
-    __generated_ramp__reload_speed_surge,
-    __generated_ramp__shrapnel_effect_1,
-    __generated_ramp__shrapnel_effect_2,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_effect_1,
-    __generated_ramp__sleep_effect_2,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spread_effect_1,
-    __generated_ramp__spread_effect_2,
-    __generated_ramp__steadiness_boost,
-    __generated_ramp__steadiness_surge,
-    __generated_ramp__sticky_effect_1,
-    __generated_ramp__stickycluster_effect_1,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_effect_1,
-    __generated_ramp__thunder_effect_2,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_effect_1,
-    __generated_ramp__water_effect_2,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_lightbowgun__1a: LightBowgun = {
-    category: "lightbowgun",
-    id: "1a",
-
-    name: "Kamura L. Bowgun I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamural.bowguni",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lightbowgun__1b: LightBowgun = {
-    category: "lightbowgun",
-    id: "1b",
-
-    name: "Kamura L. Bowgun II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamural.bowgunii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lightbowgun__1c: LightBowgun = {
-    category: "lightbowgun",
-    id: "1c",
-
-    name: "Kamura L. Bowgun III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 4},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamural.bowguniii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lightbowgun__1d: LightBowgun = {
-    category: "lightbowgun",
-    id: "1d",
-
-    name: "Kamura L. Bowgun IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 4},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamural.bowguniv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lightbowgun__1e: LightBowgun = {
-    category: "lightbowgun",
-    id: "1e",
-
-    name: "Kamura L. Bowgun V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__1d],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1d],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 5},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamural.bowgunv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lightbowgun__1f: LightBowgun = {
-    category: "lightbowgun",
-    id: "1f",
-
-    name: "Kamura Ninja L. Bowgun",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_lightbowgun__1e],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__1d],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1d],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 5},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjal.bowgun",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_lightbowgun__2a: LightBowgun = {
-    category: "lightbowgun",
-    id: "2a",
-
-    name: "Hidden Eye I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hiddeneyei",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_lightbowgun__2b: LightBowgun = {
-    category: "lightbowgun",
-    id: "2b",
-
-    name: "Hidden Eye II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hiddeneyeii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_lightbowgun__2c: LightBowgun = {
-    category: "lightbowgun",
-    id: "2c",
-
-    name: "Night Owl",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__2b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "nightowl",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_lightbowgun__3a: LightBowgun = {
-    category: "lightbowgun",
-    id: "3a",
-
-    name: "Lumier Bowgun I",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__2b],
-            [__generated_ramp__master_rider, __generated_lightbowgun__2b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "lumierbowguni",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_lightbowgun__3b: LightBowgun = {
-    category: "lightbowgun",
-    id: "3b",
-
-    name: "Lumier Bowgun II",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__2b],
-            [__generated_ramp__master_rider, __generated_lightbowgun__2b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "lumierbowgunii",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_lightbowgun__3c: LightBowgun = {
-    category: "lightbowgun",
-    id: "3c",
-
-    name: "Araknabolt",
-    treeName: "Rakna-Kadaki Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__3b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__2b],
-            [__generated_ramp__master_rider, __generated_lightbowgun__2b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__2a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1c],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "araknabolt",
-        treeNameLower: "rakna-kadakitree",
-    },
-};
-
-const __generated_lightbowgun__4a: LightBowgun = {
-    category: "lightbowgun",
-    id: "4a",
-
-    name: "Lotus Bowgun I",
-    treeName: "Bishaten Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "lotusbowguni",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_lightbowgun__4b: LightBowgun = {
-    category: "lightbowgun",
-    id: "4b",
-
-    name: "Lotus Bowgun II",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__4a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 4},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "lotusbowgunii",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_lightbowgun__4c: LightBowgun = {
-    category: "lightbowgun",
-    id: "4c",
-
-    name: "Great Lotus Bowgun",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__shrapnel_effect_1, __generated_lightbowgun__4b],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__4a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__1c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: true, ammoCapacity: 3},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 4},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "greatlotusbowgun",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_lightbowgun__5a: LightBowgun = {
-    category: "lightbowgun",
-    id: "5a",
-
-    name: "Khezu Syringe I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "khezusyringei",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_lightbowgun__5b: LightBowgun = {
-    category: "lightbowgun",
-    id: "5b",
-
-    name: "Khezu Syringe II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__5a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "khezusyringeii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_lightbowgun__5c: LightBowgun = {
-    category: "lightbowgun",
-    id: "5c",
-
-    name: "Khezu Syringe III",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__5b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__5a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 3},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "khezusyringeiii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_lightbowgun__5d: LightBowgun = {
-    category: "lightbowgun",
-    id: "5d",
-
-    name: "Khezu Hypo",
-    treeName: "Khezu Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__5c],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__5b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__5a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__1b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 4},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "khezuhypo",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_lightbowgun__6a: LightBowgun = {
-    category: "lightbowgun",
-    id: "6a",
-
-    name: "Shotgun (Viper) I",
-    treeName: "Remobra Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "shotgun(viper)i",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lightbowgun__6b: LightBowgun = {
-    category: "lightbowgun",
-    id: "6b",
-
-    name: "Shotgun (Viper) II",
-    treeName: "Remobra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 4},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "shotgun(viper)ii",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lightbowgun__6c: LightBowgun = {
-    category: "lightbowgun",
-    id: "6c",
-
-    name: "Shotgun (Viper) III",
-    treeName: "Remobra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__6b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__6b],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 5},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "shotgun(viper)iii",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lightbowgun__6d: LightBowgun = {
-    category: "lightbowgun",
-    id: "6d",
-
-    name: "Bullet Rain (Viper)",
-    treeName: "Remobra Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__6c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__6c],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__6c],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__6b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__6b],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 6},
-            shrapnel_3: {available: true, ammoCapacity: 5},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 6},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bulletrain(viper)",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_lightbowgun__7a: LightBowgun = {
-    category: "lightbowgun",
-    id: "7a",
-
-    name: "Barro Barrel I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "barrobarreli",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_lightbowgun__7b: LightBowgun = {
-    category: "lightbowgun",
-    id: "7b",
-
-    name: "Barro Barrel II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__7a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "barrobarrelii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_lightbowgun__7c: LightBowgun = {
-    category: "lightbowgun",
-    id: "7c",
-
-    name: "Barro Blaster",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__7a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "barroblaster",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_lightbowgun__8a: LightBowgun = {
-    category: "lightbowgun",
-    id: "8a",
-
-    name: "Gossgun I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__7a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 2,
-        reload: 1,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 6},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "gossguni",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lightbowgun__8b: LightBowgun = {
-    category: "lightbowgun",
-    id: "8b",
-
-    name: "Gossgun II",
-    treeName: "Goss Harag Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__7a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 2,
-        reload: 1,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 7},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "gossgunii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lightbowgun__8c: LightBowgun = {
-    category: "lightbowgun",
-    id: "8c",
-
-    name: "Gossgun III",
-    treeName: "Goss Harag Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__8b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__7a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 2,
-        reload: 1,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 7},
-            shrapnel_2: {available: true, ammoCapacity: 6},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "gossguniii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lightbowgun__8d: LightBowgun = {
-    category: "lightbowgun",
-    id: "8d",
-
-    name: "Abominable Bowgun",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__8b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__7b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__7a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__6a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__1b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 2,
-        reload: 1,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 7},
-            shrapnel_2: {available: true, ammoCapacity: 6},
-            shrapnel_3: {available: true, ammoCapacity: 5},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abominablebowgun",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_lightbowgun__9a: LightBowgun = {
-    category: "lightbowgun",
-    id: "9a",
-
-    name: "Hunter's Rifle I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: true, ammoCapacity: 1},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 4},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'sriflei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lightbowgun__9b: LightBowgun = {
-    category: "lightbowgun",
-    id: "9b",
-
-    name: "Hunter's Rifle II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 2},
-            thunder: {available: true, ammoCapacity: 2},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 4},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "hunter'srifleii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lightbowgun__9c: LightBowgun = {
-    category: "lightbowgun",
-    id: "9c",
-
-    name: "Sniper Shot",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 5},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "snipershot",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lightbowgun__9d: LightBowgun = {
-    category: "lightbowgun",
-    id: "9d",
-
-    name: "Jaeger I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__9c],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 5},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 4},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "jaegeri",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lightbowgun__9e: LightBowgun = {
-    category: "lightbowgun",
-    id: "9e",
-
-    name: "Jaeger II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9d],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__9c],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 5},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 5},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "jaegerii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lightbowgun__9f: LightBowgun = {
-    category: "lightbowgun",
-    id: "9f",
-
-    name: "Jaeger Prime",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__9e],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9d],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__9c],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 5},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 3},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: true, ammoCapacity: 5},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: true, ammoCapacity: 5},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "jaegerprime",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_lightbowgun__10a: LightBowgun = {
-    category: "lightbowgun",
-    id: "10a",
-
-    name: "Usurper's Crime I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__9c],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'scrimei",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_lightbowgun__10b: LightBowgun = {
-    category: "lightbowgun",
-    id: "10b",
-
-    name: "Usurper's Crime II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'scrimeii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_lightbowgun__10c: LightBowgun = {
-    category: "lightbowgun",
-    id: "10c",
-
-    name: "Despot's Wildfire",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__10b],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "despot'swildfire",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_lightbowgun__11a: LightBowgun = {
-    category: "lightbowgun",
-    id: "11a",
-
-    name: "Almudron Bowgun I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__anti_aquatic_species, __generated_lightbowgun__10a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 5},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 4},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "almudronbowguni",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_lightbowgun__11b: LightBowgun = {
-    category: "lightbowgun",
-    id: "11b",
-
-    name: "Almudron Bowgun II",
-    treeName: "Almudron Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__anti_aquatic_species, __generated_lightbowgun__10a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 6},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 4},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 4},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "almudronbowgunii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_lightbowgun__11c: LightBowgun = {
-    category: "lightbowgun",
-    id: "11c",
-
-    name: "Doom Bringer Bowgun",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__11a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__10a],
-            [__generated_ramp__anti_aquatic_species, __generated_lightbowgun__10a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 3,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 7},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 5},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 6},
-            poison_2: {available: true, ammoCapacity: 5},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 3},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "doombringerbowgun",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_lightbowgun__12a: LightBowgun = {
-    category: "lightbowgun",
-    id: "12a",
-
-    name: "Scale Tornado I",
-    treeName: "Uroktor Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "scaletornadoi",
-        treeNameLower: "uroktortree",
-    },
-};
-
-const __generated_lightbowgun__12b: LightBowgun = {
-    category: "lightbowgun",
-    id: "12b",
-
-    name: "Scale Tornado II",
-    treeName: "Uroktor Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__12a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "scaletornadoii",
-        treeNameLower: "uroktortree",
-    },
-};
-
-const __generated_lightbowgun__12c: LightBowgun = {
-    category: "lightbowgun",
-    id: "12c",
-
-    name: "Uroktor Vortex",
-    treeName: "Uroktor Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__12a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 3},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "uroktorvortex",
-        treeNameLower: "uroktortree",
-    },
-};
-
-const __generated_lightbowgun__13a: LightBowgun = {
-    category: "lightbowgun",
-    id: "13a",
-
-    name: "Desolate Mist I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__12a],
-            [__generated_ramp__fireblight_exploit, __generated_lightbowgun__12a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 2},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "desolatemisti",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_lightbowgun__13b: LightBowgun = {
-    category: "lightbowgun",
-    id: "13b",
-
-    name: "Desolate Mist II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__13a],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__12a],
-            [__generated_ramp__fireblight_exploit, __generated_lightbowgun__12a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 7},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 2},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "desolatemistii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_lightbowgun__13c: LightBowgun = {
-    category: "lightbowgun",
-    id: "13c",
-
-    name: "Nifl Mist",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sticky_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__13b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__13a],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__12a],
-            [__generated_ramp__fireblight_exploit, __generated_lightbowgun__12a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 8},
-            pierce_2: {available: true, ammoCapacity: 7},
-            pierce_3: {available: true, ammoCapacity: 6},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: false, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 5},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 2},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "niflmist",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_lightbowgun__14a: LightBowgun = {
-    category: "lightbowgun",
-    id: "14a",
-
-    name: "Wind Thief L. Bowgun I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefl.bowguni",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lightbowgun__14b: LightBowgun = {
-    category: "lightbowgun",
-    id: "14b",
-
-    name: "Wind Thief L. Bowgun II",
-    treeName: "Izuchi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__14a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefl.bowgunii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lightbowgun__14c: LightBowgun = {
-    category: "lightbowgun",
-    id: "14c",
-
-    name: "Wind Thief L. Bowgun III",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__14a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "windthiefl.bowguniii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lightbowgun__14d: LightBowgun = {
-    category: "lightbowgun",
-    id: "14d",
-
-    name: "Gale Bowgun",
-    treeName: "Izuchi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__14c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__14a],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "galebowgun",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_lightbowgun__15a: LightBowgun = {
-    category: "lightbowgun",
-    id: "15a",
-
-    name: "Flammengewehr I",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__14c],
-            [__generated_ramp__small_monster_exploit, __generated_lightbowgun__14c],
-            [__generated_ramp__buddy_rally, __generated_lightbowgun__14c],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flammengewehri",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_lightbowgun__15b: LightBowgun = {
-    category: "lightbowgun",
-    id: "15b",
-
-    name: "Flammengewehr II",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__14c],
-            [__generated_ramp__small_monster_exploit, __generated_lightbowgun__14c],
-            [__generated_ramp__buddy_rally, __generated_lightbowgun__14c],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 6},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "flammengewehrii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_lightbowgun__15c: LightBowgun = {
-    category: "lightbowgun",
-    id: "15c",
-
-    name: "Furious Flammengewehr",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -30,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__15b],
-            [__generated_ramp__small_monster_exploit, __generated_lightbowgun__14c],
-            [__generated_ramp__buddy_rally, __generated_lightbowgun__14c],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__9a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 7},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "furiousflammengewehr",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_lightbowgun__16a: LightBowgun = {
-    category: "lightbowgun",
-    id: "16a",
-
-    name: "Valkyrie Fire I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__14b],
-            [__generated_ramp__buddy_rally, __generated_lightbowgun__14b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__14a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 3},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 1},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "valkyriefirei",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_lightbowgun__16b: LightBowgun = {
-    category: "lightbowgun",
-    id: "16b",
-
-    name: "Valkyrie Fire II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__16a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__14b],
-            [__generated_ramp__buddy_rally, __generated_lightbowgun__14b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__14a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 7},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 4},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "valkyriefireii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_lightbowgun__16c: LightBowgun = {
-    category: "lightbowgun",
-    id: "16c",
-
-    name: "Valkyrie Blaze",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__16a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__14b],
-            [__generated_ramp__buddy_rally, __generated_lightbowgun__14b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__14a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__9a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 8},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 4},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "valkyrieblaze",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_lightbowgun__17a: LightBowgun = {
-    category: "lightbowgun",
-    id: "17a",
-
-    name: "Cross Bowgun I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "crossbowguni",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lightbowgun__17b: LightBowgun = {
-    category: "lightbowgun",
-    id: "17b",
-
-    name: "Cross Bowgun II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "crossbowgunii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lightbowgun__17c: LightBowgun = {
-    category: "lightbowgun",
-    id: "17c",
-
-    name: "Cross Blitz",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 5,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "crossblitz",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lightbowgun__17d: LightBowgun = {
-    category: "lightbowgun",
-    id: "17d",
-
-    name: "Yakt Shooter I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "yaktshooteri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lightbowgun__17e: LightBowgun = {
-    category: "lightbowgun",
-    id: "17e",
-
-    name: "Yakt Shooter II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__17d],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "yaktshooterii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lightbowgun__17f: LightBowgun = {
-    category: "lightbowgun",
-    id: "17f",
-
-    name: "Wyvern Chaser",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__17e],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__17d],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "wyvernchaser",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_lightbowgun__18a: LightBowgun = {
-    category: "lightbowgun",
-    id: "18a",
-
-    name: "Wishing Star I",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__17e],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17e],
-            [__generated_ramp__silkbind_boost, __generated_lightbowgun__17e],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__17d],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 2},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 4},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "wishingstari",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_lightbowgun__18b: LightBowgun = {
-    category: "lightbowgun",
-    id: "18b",
-
-    name: "Wishing Star II",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__18a],
-            [__generated_ramp__normal_effect_1, __generated_lightbowgun__18a],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__17e],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17e],
-            [__generated_ramp__silkbind_boost, __generated_lightbowgun__17e],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__17d],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 2},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: true, ammoCapacity: 4},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 4},
-            sleep_2: {available: true, ammoCapacity: 3},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "wishingstarii",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_lightbowgun__18c: LightBowgun = {
-    category: "lightbowgun",
-    id: "18c",
-
-    name: "Comet Bolt",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__18b],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__18a],
-            [__generated_ramp__normal_effect_1, __generated_lightbowgun__18a],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__17e],
-            [__generated_ramp__silkbind_boost, __generated_lightbowgun__17e],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__17d],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 6},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 6},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 2},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 6},
-            poison_2: {available: true, ammoCapacity: 5},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 5},
-            sleep_2: {available: true, ammoCapacity: 4},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "cometbolt",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_lightbowgun__19a: LightBowgun = {
-    category: "lightbowgun",
-    id: "19a",
-
-    name: "Rathling Gun I",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 3},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rathlingguni",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_lightbowgun__19b: LightBowgun = {
-    category: "lightbowgun",
-    id: "19b",
-
-    name: "Rathling Gun II",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 3},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rathlinggunii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_lightbowgun__19c: LightBowgun = {
-    category: "lightbowgun",
-    id: "19c",
-
-    name: "Rathling Phoenix",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__19b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 4},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rathlingphoenix",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_lightbowgun__20a: LightBowgun = {
-    category: "lightbowgun",
-    id: "20a",
-
-    name: "Blizzard Cannon I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "blizzardcannoni",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_lightbowgun__20b: LightBowgun = {
-    category: "lightbowgun",
-    id: "20b",
-
-    name: "Blizzard Cannon II",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__20a],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "blizzardcannonii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_lightbowgun__20c: LightBowgun = {
-    category: "lightbowgun",
-    id: "20c",
-
-    name: "Blizzard Volley",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__20b],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__20a],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 4},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "blizzardvolley",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_lightbowgun__21a: LightBowgun = {
-    category: "lightbowgun",
-    id: "21a",
-
-    name: "Grenade Launcher I",
-    treeName: "Basarios Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "grenadelauncheri",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lightbowgun__21b: LightBowgun = {
-    category: "lightbowgun",
-    id: "21b",
-
-    name: "Grenade Launcher II",
-    treeName: "Basarios Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "grenadelauncherii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lightbowgun__21c: LightBowgun = {
-    category: "lightbowgun",
-    id: "21c",
-
-    name: "Grenade Launcher III",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__21b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "grenadelauncheriii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lightbowgun__21d: LightBowgun = {
-    category: "lightbowgun",
-    id: "21d",
-
-    name: "Grenade Revolver",
-    treeName: "Basarios Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__21c],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__21c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__21b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 6},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 5},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "grenaderevolver",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_lightbowgun__22a: LightBowgun = {
-    category: "lightbowgun",
-    id: "22a",
-
-    name: "Tigrex Tank I",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__21c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__21b],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__17c],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: true, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 1},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrextanki",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_lightbowgun__22b: LightBowgun = {
-    category: "lightbowgun",
-    id: "22b",
-
-    name: "Tigrex Tank II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__22a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__21c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__21b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 2},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: true, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 1},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrextankii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_lightbowgun__22c: LightBowgun = {
-    category: "lightbowgun",
-    id: "22c",
-
-    name: "Tigrex Wargun",
-    treeName: "Tigrex Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__22b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__22a],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__21c],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__21b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tigrexwargun",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_lightbowgun__23a: LightBowgun = {
-    category: "lightbowgun",
-    id: "23a",
-
-    name: "Royal Launcher I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "royallauncheri",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_lightbowgun__23b: LightBowgun = {
-    category: "lightbowgun",
-    id: "23b",
-
-    name: "Royal Launcher II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 5},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "royallauncherii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_lightbowgun__23c: LightBowgun = {
-    category: "lightbowgun",
-    id: "23c",
-
-    name: "Royal Torrent",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__23b],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__23b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__17b],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__17b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 6},
-            pierce_2: {available: false, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 6},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 3},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "royaltorrent",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_lightbowgun__24a: LightBowgun = {
-    category: "lightbowgun",
-    id: "24a",
-
-    name: "Sinister Bowgun I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 5,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: true, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterbowguni",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_lightbowgun__24b: LightBowgun = {
-    category: "lightbowgun",
-    id: "24b",
-
-    name: "Sinister Bowgun II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__24a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 5,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 2},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 2},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinisterbowgunii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_lightbowgun__24c: LightBowgun = {
-    category: "lightbowgun",
-    id: "24c",
-
-    name: "Sinister Shadow Bolt",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__cluster_effect_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__24a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: false,
-        },
-        recoil: 5,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 7},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: true, ammoCapacity: 7},
-            spread_1: {available: true, ammoCapacity: 5},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 5},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: true, ammoCapacity: 6},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 3},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 3},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 4},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "sinistershadowbolt",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_lightbowgun__25a: LightBowgun = {
-    category: "lightbowgun",
-    id: "25a",
-
-    name: "Rajang Barrage I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__master_rider, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 3},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rajangbarragei",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_lightbowgun__25b: LightBowgun = {
-    category: "lightbowgun",
-    id: "25b",
-
-    name: "Rajang Barrage II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__master_rider, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: false, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rajangbarrageii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_lightbowgun__25c: LightBowgun = {
-    category: "lightbowgun",
-    id: "25c",
-
-    name: "Ten Thousand Volts",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__25b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: false, ammoCapacity: 4},
-            spread_2: {available: false, ammoCapacity: 4},
-            spread_3: {available: false, ammoCapacity: 4},
-            shrapnel_1: {available: false, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 4},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 3},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "tenthousandvolts",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_lightbowgun__26a: LightBowgun = {
-    category: "lightbowgun",
-    id: "26a",
-
-    name: "Azure Elder Bowgun I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderbowguni",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_lightbowgun__26b: LightBowgun = {
-    category: "lightbowgun",
-    id: "26b",
-
-    name: "Azure Elder Bowgun II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__normal_effect_1, __generated_lightbowgun__26a],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__26a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderbowgunii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_lightbowgun__26c: LightBowgun = {
-    category: "lightbowgun",
-    id: "26c",
-
-    name: "Abyssal Gale Bolt",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__normal_effect_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__normal_effect_1, __generated_lightbowgun__26a],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__26a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 1},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 1},
-            sticky_1: {available: false, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: true, ammoCapacity: 2},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 3},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgalebolt",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_lightbowgun__27a: LightBowgun = {
-    category: "lightbowgun",
-    id: "27a",
-
-    name: "Thunderbolt Bowgun I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: false, ammoCapacity: 1},
-            normal_3: {available: false, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 4},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 1},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 1},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 1},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltbowguni",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_lightbowgun__27b: LightBowgun = {
-    category: "lightbowgun",
-    id: "27b",
-
-    name: "Abyssal Storm Bolt",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__27a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: false, ammoCapacity: 2},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: false, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 5},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 3},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: true, ammoCapacity: 1},
-            recover_1: {available: true, ammoCapacity: 3},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormbolt",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_lightbowgun__28a: LightBowgun = {
-    category: "lightbowgun",
-    id: "28a",
-
-    name: "Rookslayer Bowgun I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 3,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 5},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 5},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 1},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 4},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 5},
-            exhaust_2: {available: true, ammoCapacity: 4},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rookslayerbowguni",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_lightbowgun__28b: LightBowgun = {
-    category: "lightbowgun",
-    id: "28b",
-
-    name: "Rookslayer Bowgun II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 3,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: true, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 6},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 6},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 1},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 5},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 3},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 5},
-            exhaust_2: {available: true, ammoCapacity: 4},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rookslayerbowgunii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_lightbowgun__28c: LightBowgun = {
-    category: "lightbowgun",
-    id: "28c",
-
-    name: "Bazelfetter Rookslayer",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__28b],
-            [__generated_ramp__shrapnel_effect_1, __generated_lightbowgun__28b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: false,
-            right: true,
-        },
-        recoil: 3,
-        reload: 2,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 1},
-            normal_2: {available: true, ammoCapacity: 1},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 5},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 1},
-            spread_2: {available: false, ammoCapacity: 1},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: false, ammoCapacity: 1},
-            shrapnel_2: {available: false, ammoCapacity: 1},
-            shrapnel_3: {available: false, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 7},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: true, ammoCapacity: 7},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: true, ammoCapacity: 5},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: true, ammoCapacity: 4},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 6},
-            exhaust_2: {available: true, ammoCapacity: 5},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "bazelfetterrookslayer",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_lightbowgun__29a: LightBowgun = {
-    category: "lightbowgun",
-    id: "29a",
-
-    name: "Gelosteel Wasp I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 2,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 6},
-            pierce_3: {available: true, ammoCapacity: 4},
-            spread_1: {available: true, ammoCapacity: 1},
-            spread_2: {available: true, ammoCapacity: 1},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "icesteelwaspi",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_lightbowgun__29b: LightBowgun = {
-    category: "lightbowgun",
-    id: "29b",
-
-    name: "Daora's Hornet",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__29a],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__29a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 2,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 9},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 6},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: true, ammoCapacity: 7},
-            pierce_3: {available: true, ammoCapacity: 5},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: true, ammoCapacity: 4},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 2},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "daora'shornet",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_lightbowgun__30a: LightBowgun = {
-    category: "lightbowgun",
-    id: "30a",
-
-    name: "Teostra's Dart I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 3},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sdarti",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_lightbowgun__30b: LightBowgun = {
-    category: "lightbowgun",
-    id: "30b",
-
-    name: "Teostra's Flamebolt",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__30a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: true,
-            right: false,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: false, ammoCapacity: 1},
-            pierce_2: {available: false, ammoCapacity: 1},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 3},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 3},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: true, ammoCapacity: 4},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: true, ammoCapacity: 2},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sflamebolt",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_lightbowgun__31a: LightBowgun = {
-    category: "lightbowgun",
-    id: "31a",
-
-    name: "Blessed Lamp I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: true, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: true, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 1},
-            water: {available: true, ammoCapacity: 1},
-            thunder: {available: true, ammoCapacity: 1},
-            ice: {available: true, ammoCapacity: 1},
-            dragon: {available: true, ammoCapacity: 1},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 2},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 3},
-            recover_1: {available: true, ammoCapacity: 5},
-            recover_2: {available: true, ammoCapacity: 4},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "blessedlampi",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_lightbowgun__31b: LightBowgun = {
-    category: "lightbowgun",
-    id: "31b",
-
-    name: "Cursed Lamp",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__31a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 4,
-        reload: 5,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 1},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: true, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: true, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: true, ammoCapacity: 1},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: true, ammoCapacity: 1},
-            sticky_3: {available: true, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: true, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: true, ammoCapacity: 2},
-            water: {available: true, ammoCapacity: 2},
-            thunder: {available: true, ammoCapacity: 2},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: true, ammoCapacity: 1},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 3},
-            paralysis_1: {available: true, ammoCapacity: 3},
-            paralysis_2: {available: true, ammoCapacity: 2},
-            sleep_1: {available: true, ammoCapacity: 3},
-            sleep_2: {available: true, ammoCapacity: 2},
-            exhaust_1: {available: true, ammoCapacity: 4},
-            exhaust_2: {available: true, ammoCapacity: 3},
-            recover_1: {available: true, ammoCapacity: 5},
-            recover_2: {available: true, ammoCapacity: 4},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: true, ammoCapacity: 1},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "cursedlamp",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_lightbowgun__32a: LightBowgun = {
-    category: "lightbowgun",
-    id: "32a",
-
-    name: "Redwing Shooter I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 4},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: false, ammoCapacity: 2},
-            pierce_1: {available: true, ammoCapacity: 2},
-            pierce_2: {available: true, ammoCapacity: 2},
-            pierce_3: {available: false, ammoCapacity: 1},
-            spread_1: {available: true, ammoCapacity: 2},
-            spread_2: {available: true, ammoCapacity: 2},
-            spread_3: {available: false, ammoCapacity: 1},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 2},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 2},
-            piercing_fire: {available: true, ammoCapacity: 1},
-            piercing_water: {available: true, ammoCapacity: 1},
-            piercing_thunder: {available: true, ammoCapacity: 1},
-            piercing_ice: {available: true, ammoCapacity: 1},
-            piercing_dragon: {available: true, ammoCapacity: 2},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "redwingshooteri",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_lightbowgun__32b: LightBowgun = {
-    category: "lightbowgun",
-    id: "32b",
-
-    name: "Reddnaught Bowgun",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 0,
-            left: false,
-            right: false,
-        },
-        recoil: 2,
-        reload: 6,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 3},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 2},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 2},
-            cluster_2: {available: true, ammoCapacity: 2},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: true, ammoCapacity: 3},
-            piercing_fire: {available: true, ammoCapacity: 2},
-            piercing_water: {available: true, ammoCapacity: 2},
-            piercing_thunder: {available: true, ammoCapacity: 2},
-            piercing_ice: {available: true, ammoCapacity: 2},
-            piercing_dragon: {available: true, ammoCapacity: 3},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: true, ammoCapacity: 4},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "reddnaughtbowgun",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_lightbowgun__33a: LightBowgun = {
-    category: "lightbowgun",
-    id: "33a",
-
-    name: "Wooden Dog Bowgun I",
-    treeName: "Canyne Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: false, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: false, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 2},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 6},
-            recover_2: {available: true, ammoCapacity: 4},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 1},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "woodendogbowguni",
-        treeNameLower: "canynetree",
-    },
-};
-
-const __generated_lightbowgun__33b: LightBowgun = {
-    category: "lightbowgun",
-    id: "33b",
-
-    name: "Wooden Dog Bowgun II",
-    treeName: "Canyne Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: false, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 3},
-            sticky_2: {available: true, ammoCapacity: 2},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 3},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 6},
-            recover_2: {available: true, ammoCapacity: 5},
-            demon: {available: true, ammoCapacity: 2},
-            armor: {available: true, ammoCapacity: 2},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "woodendogbowgunii",
-        treeNameLower: "canynetree",
-    },
-};
-
-const __generated_lightbowgun__33c: LightBowgun = {
-    category: "lightbowgun",
-    id: "33c",
-
-    name: "Watchdog's Howl",
-    treeName: "Canyne Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__33b],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 8},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: false, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: true, ammoCapacity: 4},
-            spread_2: {available: true, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 2},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 4},
-            sticky_2: {available: true, ammoCapacity: 3},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: false, ammoCapacity: 2},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: true, ammoCapacity: 4},
-            poison_2: {available: true, ammoCapacity: 1},
-            paralysis_1: {available: true, ammoCapacity: 2},
-            paralysis_2: {available: true, ammoCapacity: 1},
-            sleep_1: {available: true, ammoCapacity: 2},
-            sleep_2: {available: true, ammoCapacity: 1},
-            exhaust_1: {available: true, ammoCapacity: 3},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 7},
-            recover_2: {available: true, ammoCapacity: 5},
-            demon: {available: true, ammoCapacity: 3},
-            armor: {available: true, ammoCapacity: 3},
-            slicing: {available: true, ammoCapacity: 2},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "watchdog'showl",
-        treeNameLower: "canynetree",
-    },
-};
-
-const __generated_lightbowgun__34a: LightBowgun = {
-    category: "lightbowgun",
-    id: "34a",
-
-    name: "Springnight Shot I",
-    treeName: "Makluva Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__small_monster_exploit, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 5},
-            normal_2: {available: true, ammoCapacity: 4},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: true, ammoCapacity: 3},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 2},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 3},
-            shrapnel_2: {available: true, ammoCapacity: 2},
-            shrapnel_3: {available: false, ammoCapacity: 3},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 3},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 2},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "springnightshoti",
-        treeNameLower: "makluvatree",
-    },
-};
-
-const __generated_lightbowgun__34b: LightBowgun = {
-    category: "lightbowgun",
-    id: "34b",
-
-    name: "Springnight Shot II",
-    treeName: "Makluva Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__34a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 6},
-            normal_2: {available: true, ammoCapacity: 5},
-            normal_3: {available: true, ammoCapacity: 4},
-            pierce_1: {available: true, ammoCapacity: 4},
-            pierce_2: {available: true, ammoCapacity: 3},
-            pierce_3: {available: false, ammoCapacity: 3},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 4},
-            shrapnel_2: {available: true, ammoCapacity: 4},
-            shrapnel_3: {available: false, ammoCapacity: 4},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 4},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "springnightshotii",
-        treeNameLower: "makluvatree",
-    },
-};
-
-const __generated_lightbowgun__34c: LightBowgun = {
-    category: "lightbowgun",
-    id: "34c",
-
-    name: "Springnight Spawn",
-    treeName: "Makluva Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__34b],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__34a],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 1,
-            left: true,
-            right: true,
-        },
-        recoil: 3,
-        reload: 4,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 7},
-            normal_2: {available: true, ammoCapacity: 6},
-            normal_3: {available: true, ammoCapacity: 5},
-            pierce_1: {available: true, ammoCapacity: 5},
-            pierce_2: {available: true, ammoCapacity: 4},
-            pierce_3: {available: false, ammoCapacity: 4},
-            spread_1: {available: false, ammoCapacity: 3},
-            spread_2: {available: false, ammoCapacity: 3},
-            spread_3: {available: false, ammoCapacity: 3},
-            shrapnel_1: {available: true, ammoCapacity: 5},
-            shrapnel_2: {available: true, ammoCapacity: 5},
-            shrapnel_3: {available: false, ammoCapacity: 5},
-            sticky_1: {available: true, ammoCapacity: 1},
-            sticky_2: {available: false, ammoCapacity: 1},
-            sticky_3: {available: false, ammoCapacity: 1},
-            cluster_1: {available: true, ammoCapacity: 1},
-            cluster_2: {available: false, ammoCapacity: 1},
-            cluster_3: {available: false, ammoCapacity: 1},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: true, ammoCapacity: 5},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: true, ammoCapacity: 3},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: true, ammoCapacity: 2},
-            recover_2: {available: true, ammoCapacity: 1},
-            demon: {available: true, ammoCapacity: 1},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "springnightspawn",
-        treeNameLower: "makluvatree",
-    },
-};
-
-const __generated_lightbowgun__ra: LightBowgun = {
-    category: "lightbowgun",
-    id: "ra",
-
-    name: "Rampage L. Bowgun I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-        ],
-        [
-            [__generated_ramp__rapid_fire_normal, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagel.bowguni",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lightbowgun__rb: LightBowgun = {
-    category: "lightbowgun",
-    id: "rb",
-
-    name: "Rampage L. Bowgun II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-            [__generated_ramp__dragon_effect_1, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-        ],
-        [
-            [__generated_ramp__rapid_fire_normal, null],
-            [__generated_ramp__rapid_fire_piercing, null],
-            [__generated_ramp__rapid_fire_spread, null],
-            [__generated_ramp__rapid_fire_shrapnel, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagel.bowgunii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lightbowgun__rc: LightBowgun = {
-    category: "lightbowgun",
-    id: "rc",
-
-    name: "Rampage L. Bowgun III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_1, null],
-            [__generated_ramp__pierce_effect_1, null],
-            [__generated_ramp__spread_effect_1, null],
-            [__generated_ramp__shrapnel_effect_1, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-            [__generated_ramp__dragon_effect_1, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__paralysis_effect_1, null],
-            [__generated_ramp__sleep_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-        ],
-        [
-            [__generated_ramp__rapid_fire_normal, null],
-            [__generated_ramp__rapid_fire_piercing, null],
-            [__generated_ramp__rapid_fire_spread, null],
-            [__generated_ramp__rapid_fire_shrapnel, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagel.bowguniii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lightbowgun__rd: LightBowgun = {
-    category: "lightbowgun",
-    id: "rd",
-
-    name: "Rampage L. Bowgun IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-            [__generated_ramp__add_normal_ammo_1, __generated_lightbowgun__rc],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__rc],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__rc],
-            [__generated_ramp__shrapnel_effect_1, __generated_lightbowgun__rc],
-        ],
-        [
-            [__generated_ramp__fire_effect_1, null],
-            [__generated_ramp__water_effect_1, null],
-            [__generated_ramp__thunder_effect_1, null],
-            [__generated_ramp__ice_effect_1, null],
-            [__generated_ramp__dragon_effect_1, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__paralysis_effect_1, null],
-            [__generated_ramp__sleep_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-        ],
-        [
-            [__generated_ramp__rapid_fire_normal, null],
-            [__generated_ramp__rapid_fire_piercing, null],
-            [__generated_ramp__rapid_fire_spread, null],
-            [__generated_ramp__rapid_fire_shrapnel, null],
-            [__generated_ramp__rapid_fire_sticky, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagel.bowguniv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lightbowgun__re: LightBowgun = {
-    category: "lightbowgun",
-    id: "re",
-
-    name: "Rampage L. Bowgun V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__rd],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__rd],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__rd],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__recoil_down_surge, null],
-            [__generated_ramp__reload_speed_surge, null],
-            [__generated_ramp__steadiness_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-            [__generated_ramp__add_normal_ammo_1, __generated_lightbowgun__rc],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__rc],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__rc],
-            [__generated_ramp__shrapnel_effect_1, __generated_lightbowgun__rc],
-        ],
-        [
-            [__generated_ramp__fire_effect_2, null],
-            [__generated_ramp__water_effect_2, null],
-            [__generated_ramp__thunder_effect_2, null],
-            [__generated_ramp__ice_effect_2, null],
-            [__generated_ramp__dragon_effect_2, null],
-            [__generated_ramp__poison_effect_1, null],
-            [__generated_ramp__paralysis_effect_1, null],
-            [__generated_ramp__sleep_effect_1, null],
-            [__generated_ramp__exhaust_effect_1, null],
-            [__generated_ramp__fire_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__water_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__thunder_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__ice_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__dragon_effect_1, __generated_lightbowgun__rd],
-        ],
-        [
-            [__generated_ramp__rapid_fire_normal, null],
-            [__generated_ramp__rapid_fire_piercing, null],
-            [__generated_ramp__rapid_fire_spread, null],
-            [__generated_ramp__rapid_fire_shrapnel, null],
-            [__generated_ramp__rapid_fire_sticky, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
-
-    filterHelpers: {
-        nameLower: "rampagel.bowgunv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_lightbowgun__rf: LightBowgun = {
-    category: "lightbowgun",
-    id: "rf",
-
-    name: "Rampage L. Bowgun S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__recoil_down_boost, null],
-            [__generated_ramp__reload_speed_boost, null],
-            [__generated_ramp__steadiness_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_lightbowgun__re],
-            [__generated_ramp__affinity_boost_3, __generated_lightbowgun__re],
-            [__generated_ramp__attack_boost_2, __generated_lightbowgun__rd],
-            [__generated_ramp__affinity_boost_2, __generated_lightbowgun__rd],
-            [__generated_ramp__defense_boost_2, __generated_lightbowgun__rd],
-            [__generated_ramp__attack_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__affinity_boost_1, __generated_lightbowgun__rb],
-            [__generated_ramp__defense_boost_1, __generated_lightbowgun__rb],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__recoil_down_surge, null],
-            [__generated_ramp__reload_speed_surge, null],
-            [__generated_ramp__steadiness_surge, null],
-        ],
-        [
-            [__generated_ramp__add_normal_ammo_2, null],
-            [__generated_ramp__pierce_effect_2, null],
-            [__generated_ramp__spread_effect_2, null],
-            [__generated_ramp__shrapnel_effect_2, null],
-            [__generated_ramp__stickycluster_effect_1, null],
-            [__generated_ramp__add_normal_ammo_1, __generated_lightbowgun__rc],
-            [__generated_ramp__pierce_effect_1, __generated_lightbowgun__rc],
-            [__generated_ramp__spread_effect_1, __generated_lightbowgun__rc],
-            [__generated_ramp__shrapnel_effect_1, __generated_lightbowgun__rc],
-        ],
-        [
-            [__generated_ramp__fire_effect_2, null],
-            [__generated_ramp__water_effect_2, null],
-            [__generated_ramp__thunder_effect_2, null],
-            [__generated_ramp__ice_effect_2, null],
-            [__generated_ramp__dragon_effect_2, null],
-            [__generated_ramp__poison_effect_2, null],
-            [__generated_ramp__paralysis_effect_2, null],
-            [__generated_ramp__sleep_effect_2, null],
-            [__generated_ramp__exhaust_effect_2, null],
-            [__generated_ramp__poison_effect_1, __generated_lightbowgun__re],
-            [__generated_ramp__paralysis_effect_1, __generated_lightbowgun__re],
-            [__generated_ramp__sleep_effect_1, __generated_lightbowgun__re],
-            [__generated_ramp__exhaust_effect_1, __generated_lightbowgun__re],
-            [__generated_ramp__fire_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__water_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__thunder_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__ice_effect_1, __generated_lightbowgun__rd],
-            [__generated_ramp__dragon_effect_1, __generated_lightbowgun__rd],
-        ],
-        [
-            [__generated_ramp__rapid_fire_normal, null],
-            [__generated_ramp__rapid_fire_piercing, null],
-            [__generated_ramp__rapid_fire_spread, null],
-            [__generated_ramp__rapid_fire_shrapnel, null],
-            [__generated_ramp__rapid_fire_sticky, null],
-            [__generated_ramp__rapid_fire_fire, null],
-            [__generated_ramp__rapid_fire_water, null],
-            [__generated_ramp__rapid_fire_thunder, null],
-            [__generated_ramp__rapid_fire_ice, null],
-            [__generated_ramp__rapid_fire_dragon, null],
-        ],
-    ],
-
-    bowgunStats: {
-        deviation: {
-            severity: 2,
-            left: false,
-            right: true,
-        },
-        recoil: 4,
-        reload: 3,
-        ammo: {
-            normal_1: {available: true, ammoCapacity: 3},
-            normal_2: {available: true, ammoCapacity: 3},
-            normal_3: {available: true, ammoCapacity: 3},
-            pierce_1: {available: false, ammoCapacity: 0},
-            pierce_2: {available: false, ammoCapacity: 0},
-            pierce_3: {available: false, ammoCapacity: 0},
-            spread_1: {available: false, ammoCapacity: 0},
-            spread_2: {available: false, ammoCapacity: 0},
-            spread_3: {available: false, ammoCapacity: 0},
-            shrapnel_1: {available: false, ammoCapacity: 0},
-            shrapnel_2: {available: false, ammoCapacity: 0},
-            shrapnel_3: {available: false, ammoCapacity: 0},
-            sticky_1: {available: false, ammoCapacity: 0},
-            sticky_2: {available: false, ammoCapacity: 0},
-            sticky_3: {available: false, ammoCapacity: 0},
-            cluster_1: {available: false, ammoCapacity: 0},
-            cluster_2: {available: false, ammoCapacity: 0},
-            cluster_3: {available: false, ammoCapacity: 0},
-            fire: {available: false, ammoCapacity: 0},
-            water: {available: false, ammoCapacity: 0},
-            thunder: {available: false, ammoCapacity: 0},
-            ice: {available: false, ammoCapacity: 0},
-            dragon: {available: false, ammoCapacity: 0},
-            piercing_fire: {available: false, ammoCapacity: 0},
-            piercing_water: {available: false, ammoCapacity: 0},
-            piercing_thunder: {available: false, ammoCapacity: 0},
-            piercing_ice: {available: false, ammoCapacity: 0},
-            piercing_dragon: {available: false, ammoCapacity: 0},
-            poison_1: {available: false, ammoCapacity: 0},
-            poison_2: {available: false, ammoCapacity: 0},
-            paralysis_1: {available: false, ammoCapacity: 0},
-            paralysis_2: {available: false, ammoCapacity: 0},
-            sleep_1: {available: false, ammoCapacity: 0},
-            sleep_2: {available: false, ammoCapacity: 0},
-            exhaust_1: {available: false, ammoCapacity: 0},
-            exhaust_2: {available: false, ammoCapacity: 0},
-            recover_1: {available: false, ammoCapacity: 0},
-            recover_2: {available: false, ammoCapacity: 0},
-            demon: {available: false, ammoCapacity: 0},
-            armor: {available: false, ammoCapacity: 0},
-            slicing: {available: false, ammoCapacity: 0},
-            wyvern: {available: false, ammoCapacity: 0},
-            tranq: {available: true, ammoCapacity: 2},
-        },
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampagel.bowguns",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"lightbowgun","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura L. Bowgun I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,4],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"1b","name":"Kamura L. Bowgun II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[false,4],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"1c","name":"Kamura L. Bowgun III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,5],"normal_3":[false,4],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[false,0],"recover_1":[true,4],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"1d","name":"Kamura L. Bowgun IV","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,5],"normal_3":[false,4],"pierce_1":[true,5],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[false,3],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[false,0],"recover_1":[true,4],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"1e","name":"Kamura L. Bowgun V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[true,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[false,3],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,3],"paralysis_1":[true,4],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,2],"recover_1":[true,5],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"1f","name":"Kamura Ninja L. Bowgun","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[false,3],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,3],"paralysis_1":[true,4],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,2],"recover_1":[true,5],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}}]],["Nargacuga Tree",[{"id":"2a","name":"Hidden Eye I","rarity":3,"endlineTag":"","attack":100,"affinity":35,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[true,2],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,3],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"2b","name":"Hidden Eye II","rarity":5,"endlineTag":"","attack":160,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"2c","name":"Night Owl","rarity":6,"endlineTag":"hr","attack":180,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[false,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rakna-Kadaki Tree",[{"id":"3a","name":"Lumier Bowgun I","rarity":6,"endlineTag":"","attack":160,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["spread_effect_2",null],["silkbind_boost",null],["affinity_boost_1","2b"],["master_rider","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,2],"normal_3":[false,2],"pierce_1":[true,3],"pierce_2":[true,4],"pierce_3":[true,2],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"3b","name":"Lumier Bowgun II","rarity":6,"endlineTag":"","attack":170,"affinity":30,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["spread_effect_2",null],["silkbind_boost",null],["affinity_boost_1","2b"],["master_rider","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,2],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"3c","name":"Araknabolt","rarity":7,"endlineTag":"hr","attack":180,"affinity":35,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["spread_effect_2",null],["silkbind_boost",null],["attack_boost_3","3b"],["affinity_boost_1","2b"],["master_rider","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":5,"ammo":{"normal_1":[true,7],"normal_2":[true,4],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[true,6],"pierce_3":[true,5],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[true,3],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,2],"recover_1":[true,3],"recover_2":[true,1],"demon":[true,2],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Bishaten Tree",[{"id":"4a","name":"Lotus Bowgun I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["shrapnel_effect_1",null],["silkbind_boost",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":3,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,2],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[false,4],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[true,2],"piercing_dragon":[true,1],"poison_1":[true,3],"poison_2":[true,3],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"4b","name":"Lotus Bowgun II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["shrapnel_effect_1",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":3,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[true,2],"shrapnel_1":[false,5],"shrapnel_2":[false,5],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[true,2],"piercing_dragon":[true,1],"poison_1":[true,4],"poison_2":[true,3],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,4],"recover_2":[false,0],"demon":[false,0],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"4c","name":"Great Lotus Bowgun","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["shrapnel_effect_2",null],["silkbind_boost",null],["shrapnel_effect_1","4b"],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":3,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,3],"normal_3":[true,4],"pierce_1":[true,6],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[true,2],"shrapnel_1":[false,5],"shrapnel_2":[false,5],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[true,3],"piercing_dragon":[true,1],"poison_1":[true,5],"poison_2":[true,3],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,4],"recover_2":[false,0],"demon":[false,0],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Khezu Tree",[{"id":"5a","name":"Khezu Syringe I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spread_effect_1",null],["thunderblight_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[true,3],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,3],"demon":[true,1],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"5b","name":"Khezu Syringe II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["spread_effect_1",null],["thunderblight_exploit",null],["attack_boost_2","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[true,3],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,3],"demon":[true,1],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"5c","name":"Khezu Syringe III","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["spread_effect_2",null],["thunderblight_exploit",null],["spread_effect_1","5b"],["attack_boost_2","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,3],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[true,3],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,3],"demon":[true,1],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"5d","name":"Khezu Hypo","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["spread_effect_2",null],["thunderblight_exploit",null],["attack_boost_3","5c"],["spread_effect_1","5b"],["attack_boost_2","5a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,7],"normal_2":[true,6],"normal_3":[true,4],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,4],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,4],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[true,3],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,3],"demon":[true,1],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Remobra Tree",[{"id":"6a","name":"Shotgun (Viper) I","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[true,1],"pierce_1":[true,2],"pierce_2":[true,1],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[false,1],"spread_3":[true,1],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,3],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"6b","name":"Shotgun (Viper) II","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["spread_effect_1",null],["attack_boost_1","6a"],["affinity_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[true,2],"pierce_1":[true,2],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[false,1],"spread_3":[true,1],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,4],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"6c","name":"Shotgun (Viper) III","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["spread_effect_1",null],["attack_boost_2","6b"],["defense_boost_1","6b"],["attack_boost_1","6a"],["affinity_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,2],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[false,1],"spread_3":[true,1],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,5],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"6d","name":"Bullet Rain (Viper)","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["defense_boost_3",null],["spread_effect_2",null],["attack_boost_3","6c"],["defense_boost_2","6c"],["spread_effect_1","6c"],["attack_boost_2","6b"],["defense_boost_1","6b"],["attack_boost_1","6a"],["affinity_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[true,4],"spread_2":[false,2],"spread_3":[true,2],"shrapnel_1":[true,5],"shrapnel_2":[true,6],"shrapnel_3":[true,5],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,6],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Barroth Tree",[{"id":"7a","name":"Barro Barrel I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["pierce_effect_1",null],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":2,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,3],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"7b","name":"Barro Barrel II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["pierce_effect_1",null],["defense_boost_1","7a"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":2,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[true,3],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,3],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"7c","name":"Barro Blaster","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":15,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["pierce_effect_1",null],["affinity_boost_1","7b"],["defense_boost_1","7a"],["attack_boost_1","6a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":2,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,3],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[true,3],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Goss Harag Tree",[{"id":"8a","name":"Gossgun I","rarity":3,"endlineTag":"","attack":160,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["pierce_effect_1",null],["brutal_strike",null],["defense_boost_2","7b"],["defense_boost_1","7a"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":2,"reload":1,"ammo":{"normal_1":[true,6],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[true,1],"spread_3":[true,1],"shrapnel_1":[true,6],"shrapnel_2":[true,5],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[true,1],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"8b","name":"Gossgun II","rarity":4,"endlineTag":"","attack":170,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["pierce_effect_1",null],["brutal_strike",null],["defense_boost_2","7b"],["defense_boost_1","7a"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":2,"reload":1,"ammo":{"normal_1":[true,7],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[true,1],"spread_3":[true,1],"shrapnel_1":[true,7],"shrapnel_2":[true,5],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"8c","name":"Gossgun III","rarity":5,"endlineTag":"","attack":190,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["pierce_effect_2",null],["brutal_strike",null],["pierce_effect_1","8b"],["defense_boost_2","7b"],["defense_boost_1","7a"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":2,"reload":1,"ammo":{"normal_1":[true,8],"normal_2":[true,3],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,1],"spread_3":[true,1],"shrapnel_1":[true,7],"shrapnel_2":[true,6],"shrapnel_3":[true,4],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[true,2],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"8d","name":"Abominable Bowgun","rarity":6,"endlineTag":"hr","attack":220,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["pierce_effect_2",null],["brutal_strike",null],["pierce_effect_1","8b"],["defense_boost_2","7b"],["defense_boost_1","7a"],["attack_boost_1","6a"],["affinity_boost_2","1b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":2,"reload":1,"ammo":{"normal_1":[true,9],"normal_2":[true,3],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,1],"spread_3":[true,1],"shrapnel_1":[true,7],"shrapnel_2":[true,6],"shrapnel_3":[true,5],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Ore Tree",[{"id":"9a","name":"Hunter\'s Rifle I","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,2],"normal_3":[false,2],"pierce_1":[true,3],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[false,2],"shrapnel_3":[false,1],"sticky_1":[false,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,1],"thunder":[true,1],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[true,4],"recover_1":[false,0],"recover_2":[true,3],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9b","name":"Hunter\'s Rifle II","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[false,3],"pierce_1":[true,4],"pierce_2":[true,2],"pierce_3":[false,2],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[false,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,2],"thunder":[true,2],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[true,4],"recover_1":[false,0],"recover_2":[true,3],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9c","name":"Sniper Shot","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,5],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[true,3],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[true,5],"recover_1":[false,0],"recover_2":[true,3],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9d","name":"Jaeger I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["wyvern_exploit",null],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,5],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[true,3],"ice":[true,1],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[true,5],"recover_1":[false,0],"recover_2":[true,4],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9e","name":"Jaeger II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["wyvern_exploit",null],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,2],"spread_1":[true,5],"spread_2":[true,4],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,2],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[true,3],"ice":[true,2],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[true,5],"recover_1":[false,0],"recover_2":[true,5],"demon":[false,0],"armor":[true,3],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"9f","name":"Jaeger Prime","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["wyvern_exploit",null],["attack_boost_2","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,4],"spread_1":[true,6],"spread_2":[true,5],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[false,3],"cluster_2":[false,3],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[true,3],"ice":[true,3],"dragon":[true,3],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[true,5],"recover_1":[false,0],"recover_2":[true,5],"demon":[false,0],"armor":[true,3],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Zinogre Tree",[{"id":"10a","name":"Usurper\'s Crime I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["anti_aquatic_species",null],["attack_boost_2","9c"],["defense_boost_2","9c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,3],"normal_3":[true,4],"pierce_1":[false,1],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[false,1],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"10b","name":"Usurper\'s Crime II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_1",null],["anti_aquatic_species",null],["attack_boost_1","10a"],["affinity_boost_1","10a"],["defense_boost_2","9c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[false,1],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[false,1],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"10c","name":"Despot\'s Wildfire","rarity":6,"endlineTag":"hr","attack":190,"affinity":10,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_2",null],["anti_aquatic_species",null],["pierce_effect_1","10b"],["attack_boost_1","10a"],["affinity_boost_1","10a"],["defense_boost_2","9c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,9],"normal_2":[true,4],"normal_3":[true,6],"pierce_1":[false,1],"pierce_2":[true,3],"pierce_3":[false,1],"spread_1":[false,1],"spread_2":[true,3],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[true,3],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[true,2],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[true,2],"armor":[true,2],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Almudron Tree",[{"id":"11a","name":"Almudron Bowgun I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["normal_effect_2",null],["element_exploit",null],["attack_boost_1","10a"],["affinity_boost_1","10a"],["anti_aquatic_species","10a"],["defense_boost_2","9c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[true,1],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,5],"thunder":[false,0],"ice":[true,1],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,4],"piercing_thunder":[true,1],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,3],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[true,1],"demon":[false,0],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"11b","name":"Almudron Bowgun II","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["normal_effect_2",null],["element_exploit",null],["attack_boost_2","11a"],["attack_boost_1","10a"],["affinity_boost_1","10a"],["anti_aquatic_species","10a"],["defense_boost_2","9c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[true,1],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,6],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,4],"piercing_thunder":[true,1],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,4],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"11c","name":"Doom Bringer Bowgun","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["normal_effect_2",null],["element_exploit",null],["attack_boost_2","11a"],["attack_boost_1","10a"],["affinity_boost_1","10a"],["anti_aquatic_species","10a"],["defense_boost_2","9c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":3,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[true,1],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[true,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,7],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,5],"piercing_thunder":[true,1],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,6],"poison_2":[true,5],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,3],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Uroktor Tree",[{"id":"12a","name":"Scale Tornado I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["pierce_effect_1",null],["fireblight_exploit",null],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[true,2],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"12b","name":"Scale Tornado II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["pierce_effect_1",null],["fireblight_exploit",null],["affinity_boost_1","12a"],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[true,2],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"12c","name":"Uroktor Vortex","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["pierce_effect_1",null],["fireblight_exploit",null],["affinity_boost_1","12a"],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[false,3],"pierce_2":[false,3],"pierce_3":[false,1],"spread_1":[true,5],"spread_2":[true,2],"spread_3":[true,2],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[true,2],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,3],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,2],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Mizutsune Tree",[{"id":"13a","name":"Desolate Mist I","rarity":3,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["sticky_effect_1",null],["pierce_effect_1","12a"],["fireblight_exploit","12a"],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,6],"pierce_2":[true,5],"pierce_3":[true,4],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[true,2],"shrapnel_3":[false,4],"sticky_1":[false,2],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,2],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"13b","name":"Desolate Mist II","rarity":5,"endlineTag":"","attack":160,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["sticky_effect_1",null],["affinity_boost_1","13a"],["pierce_effect_1","12a"],["fireblight_exploit","12a"],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,7],"pierce_2":[true,6],"pierce_3":[true,5],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,4],"sticky_1":[false,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,2],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"13c","name":"Nifl Mist","rarity":6,"endlineTag":"hr","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["sticky_effect_1",null],["attack_boost_2","13b"],["affinity_boost_1","13a"],["pierce_effect_1","12a"],["fireblight_exploit","12a"],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[false,3],"pierce_1":[true,8],"pierce_2":[true,7],"pierce_3":[true,6],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[false,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,5],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,2],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Izuchi Tree",[{"id":"14a","name":"Wind Thief L. Bowgun I","rarity":1,"endlineTag":"","attack":70,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,3],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"14b","name":"Wind Thief L. Bowgun II","rarity":2,"endlineTag":"","attack":80,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","14a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,1],"pierce_1":[true,3],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"14c","name":"Wind Thief L. Bowgun III","rarity":4,"endlineTag":"","attack":140,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","14a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[false,1],"pierce_1":[true,4],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[true,2],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"14d","name":"Gale Bowgun","rarity":5,"endlineTag":"hr","attack":160,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","14c"],["affinity_boost_1","14a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[false,1],"pierce_1":[true,5],"pierce_2":[true,6],"pierce_3":[true,3],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,2],"demon":[true,2],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Anjanath Tree",[{"id":"15a","name":"Flammengewehr I","rarity":5,"endlineTag":"","attack":200,"affinity":-30,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["cluster_effect_1",null],["brutal_strike",null],["affinity_boost_2","14c"],["small_monster_exploit","14c"],["buddy_rally","14c"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,2],"normal_3":[true,2],"pierce_1":[true,4],"pierce_2":[true,2],"pierce_3":[true,2],"spread_1":[true,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"15b","name":"Flammengewehr II","rarity":6,"endlineTag":"","attack":220,"affinity":-30,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["cluster_effect_1",null],["brutal_strike",null],["affinity_boost_2","14c"],["small_monster_exploit","14c"],["buddy_rally","14c"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[true,2],"pierce_1":[true,4],"pierce_2":[true,2],"pierce_3":[true,2],"spread_1":[true,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,6],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"15c","name":"Furious Flammengewehr","rarity":6,"endlineTag":"hr","attack":230,"affinity":-30,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["cluster_effect_1",null],["brutal_strike",null],["affinity_boost_1","15b"],["small_monster_exploit","14c"],["buddy_rally","14c"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[true,2],"pierce_1":[true,5],"pierce_2":[true,2],"pierce_3":[true,2],"spread_1":[true,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,7],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,3],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rathian Tree",[{"id":"16a","name":"Valkyrie Fire I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["pierce_effect_1",null],["small_monster_exploit",null],["affinity_boost_2","14b"],["buddy_rally","14b"],["affinity_boost_1","14a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,6],"normal_3":[true,4],"pierce_1":[true,4],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,3],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[true,1],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"16b","name":"Valkyrie Fire II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_1",null],["small_monster_exploit",null],["attack_boost_1","16a"],["affinity_boost_2","14b"],["buddy_rally","14b"],["affinity_boost_1","14a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,7],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[false,3],"pierce_3":[false,2],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,4],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"16c","name":"Valkyrie Blaze","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["pierce_effect_1",null],["small_monster_exploit",null],["attack_boost_1","16a"],["affinity_boost_2","14b"],["buddy_rally","14b"],["affinity_boost_1","14a"],["defense_boost_2","9a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,9],"normal_2":[true,8],"normal_3":[true,6],"pierce_1":[true,5],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,4],"sticky_1":[true,2],"sticky_2":[false,2],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,4],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,1],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Bone Tree",[{"id":"17a","name":"Cross Bowgun I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,2],"normal_3":[true,3],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17b","name":"Cross Bowgun II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,3],"normal_3":[true,4],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17c","name":"Cross Blitz","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":5,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,5],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,3],"shrapnel_2":[false,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17d","name":"Yakt Shooter I","rarity":3,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["silkbind_boost",null],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[true,3],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17e","name":"Yakt Shooter II","rarity":4,"endlineTag":"","attack":150,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["silkbind_boost",null],["attack_boost_2","17d"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,1],"shrapnel_1":[true,4],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"17f","name":"Wyvern Chaser","rarity":5,"endlineTag":"hr","attack":170,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["silkbind_boost",null],["attack_boost_3","17e"],["attack_boost_2","17d"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[true,5],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,4],"spread_3":[false,1],"shrapnel_1":[true,5],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,2],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[true,1],"armor":[true,1],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Jyuratodus Tree",[{"id":"18a","name":"Wishing Star I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["normal_effect_1",null],["attack_boost_3","17e"],["affinity_boost_2","17e"],["silkbind_boost","17e"],["attack_boost_2","17d"],["defense_boost_1","17c"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[true,1],"pierce_3":[false,1],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[true,4],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,2],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,3],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,4],"sleep_2":[true,2],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"18b","name":"Wishing Star II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_3",null],["normal_effect_2",null],["defense_boost_2","18a"],["normal_effect_1","18a"],["attack_boost_3","17e"],["affinity_boost_2","17e"],["silkbind_boost","17e"],["attack_boost_2","17d"],["defense_boost_1","17c"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,2],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[true,5],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[true,5],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,2],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[true,4],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,4],"sleep_2":[true,3],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"18c","name":"Comet Bolt","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_3",null],["normal_effect_2",null],["affinity_boost_1","18b"],["defense_boost_2","18a"],["normal_effect_1","18a"],["attack_boost_3","17e"],["silkbind_boost","17e"],["attack_boost_2","17d"],["defense_boost_1","17c"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,2],"normal_3":[false,1],"pierce_1":[true,3],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[true,6],"spread_2":[true,3],"spread_3":[true,3],"shrapnel_1":[true,6],"shrapnel_2":[false,4],"shrapnel_3":[false,2],"sticky_1":[true,2],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,2],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[true,1],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,6],"poison_2":[true,5],"paralysis_1":[true,3],"paralysis_2":[false,0],"sleep_1":[true,5],"sleep_2":[true,4],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rathalos Tree",[{"id":"19a","name":"Rathling Gun I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["shrapnel_effect_1",null],["element_exploit",null],["affinity_boost_2","17c"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[true,3],"spread_2":[true,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[false,3],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,3],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"19b","name":"Rathling Gun II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["shrapnel_effect_1",null],["element_exploit",null],["affinity_boost_2","17c"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[false,2],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,3],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"19c","name":"Rathling Phoenix","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["shrapnel_effect_1",null],["element_exploit",null],["attack_boost_2","19b"],["affinity_boost_2","17c"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,9],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,2],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[true,5],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,4],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Barioth Tree",[{"id":"20a","name":"Blizzard Cannon I","rarity":2,"endlineTag":"","attack":80,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[false,1],"pierce_1":[true,1],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,1],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"20b","name":"Blizzard Cannon II","rarity":5,"endlineTag":"","attack":150,"affinity":20,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","20a"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[false,1],"pierce_1":[true,1],"pierce_2":[true,5],"pierce_3":[true,3],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,2],"shrapnel_2":[true,2],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"20c","name":"Blizzard Volley","rarity":6,"endlineTag":"hr","attack":170,"affinity":25,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","20b"],["attack_boost_2","20a"],["defense_boost_1","17c"],["affinity_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,6],"normal_3":[false,1],"pierce_1":[true,1],"pierce_2":[true,6],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,3],"shrapnel_3":[false,2],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,4],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}}]],["Basarios Tree",[{"id":"21a","name":"Grenade Launcher I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null],["affinity_boost_2","17c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"21b","name":"Grenade Launcher II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null],["affinity_boost_2","17c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[false,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"21c","name":"Grenade Launcher III","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":20,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["defense_boost_1","21b"],["affinity_boost_2","17c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[false,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"21d","name":"Grenade Revolver","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":20,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["cluster_effect_1",null],["attack_boost_2","21c"],["affinity_boost_1","21c"],["defense_boost_1","21b"],["affinity_boost_2","17c"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":6,"ammo":{"normal_1":[true,5],"normal_2":[true,6],"normal_3":[true,4],"pierce_1":[false,2],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,6],"shrapnel_2":[true,5],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,5],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[false,0],"sleep_1":[true,3],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Tigrex Tree",[{"id":"22a","name":"Tigrex Tank I","rarity":6,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","21c"],["defense_boost_1","21b"],["affinity_boost_2","17c"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[false,2],"pierce_2":[true,2],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,2],"shrapnel_2":[true,2],"shrapnel_3":[true,1],"sticky_1":[true,1],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,1],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"22b","name":"Tigrex Tank II","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","22a"],["defense_boost_2","21c"],["defense_boost_1","21b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[false,3],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,1],"shrapnel_1":[false,2],"shrapnel_2":[true,2],"shrapnel_3":[true,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,1],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"22c","name":"Tigrex Wargun","rarity":7,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","22b"],["affinity_boost_1","22a"],["defense_boost_2","21c"],["defense_boost_1","21b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,8],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[false,3],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,3],"shrapnel_2":[true,3],"shrapnel_3":[true,2],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Royal Ludroth Tree",[{"id":"23a","name":"Royal Launcher I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spread_effect_1",null],["waterblight_exploit",null],["affinity_boost_1","17b"],["defense_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[true,1],"pierce_1":[true,4],"pierce_2":[false,3],"pierce_3":[false,1],"spread_1":[false,4],"spread_2":[false,4],"spread_3":[false,1],"shrapnel_1":[true,5],"shrapnel_2":[false,4],"shrapnel_3":[false,1],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"23b","name":"Royal Launcher II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spread_effect_1",null],["waterblight_exploit",null],["affinity_boost_1","17b"],["defense_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,2],"pierce_1":[true,5],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[false,5],"spread_2":[false,4],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"23c","name":"Royal Torrent","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":10,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["spread_effect_2",null],["waterblight_exploit",null],["attack_boost_2","23b"],["spread_effect_1","23b"],["affinity_boost_1","17b"],["defense_boost_1","17b"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[true,3],"pierce_1":[true,6],"pierce_2":[false,4],"pierce_3":[false,3],"spread_1":[true,5],"spread_2":[false,4],"spread_3":[false,3],"shrapnel_1":[true,6],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[false,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,3],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Magnamalo Tree",[{"id":"24a","name":"Sinister Bowgun I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["cluster_effect_1",null],["magnamalo_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":5,"reload":6,"ammo":{"normal_1":[true,9],"normal_2":[false,1],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[false,1],"pierce_3":[true,4],"spread_1":[true,3],"spread_2":[false,1],"spread_3":[true,3],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[true,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,2],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,3],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"24b","name":"Sinister Bowgun II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["cluster_effect_1",null],["magnamalo_soul",null],["attack_boost_2","24a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":5,"reload":6,"ammo":{"normal_1":[true,9],"normal_2":[false,1],"normal_3":[true,6],"pierce_1":[true,4],"pierce_2":[false,1],"pierce_3":[true,5],"spread_1":[true,4],"spread_2":[false,1],"spread_3":[true,3],"shrapnel_1":[true,4],"shrapnel_2":[false,1],"shrapnel_3":[true,4],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,2],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,2],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,2],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"24c","name":"Sinister Shadow Bolt","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["cluster_effect_1",null],["magnamalo_soul",null],["attack_boost_2","24a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":false},"recoil":5,"reload":6,"ammo":{"normal_1":[true,9],"normal_2":[false,1],"normal_3":[true,7],"pierce_1":[true,5],"pierce_2":[false,1],"pierce_3":[true,7],"spread_1":[true,5],"spread_2":[false,1],"spread_3":[true,5],"shrapnel_1":[true,5],"shrapnel_2":[false,1],"shrapnel_3":[true,6],"sticky_1":[true,2],"sticky_2":[false,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,3],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,4],"exhaust_2":[true,3],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,4],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rajang Tree",[{"id":"25a","name":"Rajang Barrage I","rarity":5,"endlineTag":"","attack":180,"affinity":-15,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["brutal_strike",null],["master_rider",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":4,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[true,4],"normal_3":[true,4],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[true,3],"spread_1":[false,2],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[true,2],"water":[false,0],"thunder":[true,3],"ice":[true,1],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,1],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"25b","name":"Rajang Barrage II","rarity":6,"endlineTag":"","attack":190,"affinity":-15,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["brutal_strike",null],["master_rider",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":4,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,5],"normal_3":[true,5],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[true,4],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[false,3],"shrapnel_2":[false,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[true,4],"ice":[true,1],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"25c","name":"Ten Thousand Volts","rarity":7,"endlineTag":"hr","attack":210,"affinity":-15,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["brutal_strike",null],["master_rider",null],["affinity_boost_1","25b"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":true},"recoil":4,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,6],"pierce_1":[true,5],"pierce_2":[true,5],"pierce_3":[true,5],"spread_1":[false,4],"spread_2":[false,4],"spread_3":[false,4],"shrapnel_1":[false,4],"shrapnel_2":[false,4],"shrapnel_3":[false,4],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,4],"water":[false,0],"thunder":[true,4],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,3],"recover_2":[true,3],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Ibushi Tree",[{"id":"26a","name":"Azure Elder Bowgun I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["normal_effect_1",null],["anti_aerial_species",null],["defense_boost_1",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,1],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[false,1],"pierce_2":[true,3],"pierce_3":[true,1],"spread_1":[false,1],"spread_2":[true,3],"spread_3":[true,1],"shrapnel_1":[false,1],"shrapnel_2":[true,3],"shrapnel_3":[true,1],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,1],"water":[true,1],"thunder":[false,0],"ice":[true,1],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[false,0],"poison_2":[true,1],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"26b","name":"Azure Elder Bowgun II","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["anti_aerial_species",null],["ibushi_soul",null],["normal_effect_1","26a"],["defense_boost_1","26a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,1],"normal_2":[true,6],"normal_3":[true,6],"pierce_1":[false,1],"pierce_2":[true,3],"pierce_3":[true,1],"spread_1":[false,1],"spread_2":[true,3],"spread_3":[true,1],"shrapnel_1":[false,1],"shrapnel_2":[true,3],"shrapnel_3":[true,1],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,1],"water":[true,1],"thunder":[false,0],"ice":[true,1],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,1],"poison_1":[false,0],"poison_2":[true,2],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,2],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"26c","name":"Abyssal Gale Bolt","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["normal_effect_2",null],["anti_aerial_species",null],["ibushi_soul",null],["normal_effect_1","26a"],["defense_boost_1","26a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":5,"ammo":{"normal_1":[true,1],"normal_2":[true,6],"normal_3":[true,6],"pierce_1":[false,1],"pierce_2":[true,4],"pierce_3":[true,1],"spread_1":[false,1],"spread_2":[true,3],"spread_3":[true,1],"shrapnel_1":[false,1],"shrapnel_2":[true,3],"shrapnel_3":[true,1],"sticky_1":[false,1],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,1],"water":[true,1],"thunder":[false,0],"ice":[true,1],"dragon":[true,2],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[true,2],"poison_1":[false,0],"poison_2":[true,3],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[true,2],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,3],"wyvern":[false,0],"tranq":[true,2]}}}]],["Narwa Tree",[{"id":"27a","name":"Thunderbolt Bowgun I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,4],"normal_2":[false,1],"normal_3":[false,1],"pierce_1":[true,3],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,4],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,2],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,1],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,2],"sleep_1":[true,1],"sleep_2":[false,0],"exhaust_1":[true,1],"exhaust_2":[true,1],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,2],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"27b","name":"Abyssal Storm Bolt","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","27a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[false,2],"normal_3":[false,2],"pierce_1":[true,4],"pierce_2":[false,2],"pierce_3":[false,2],"spread_1":[true,3],"spread_2":[false,2],"spread_3":[false,2],"shrapnel_1":[true,4],"shrapnel_2":[false,2],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[true,5],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,3],"piercing_ice":[true,1],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[false,0],"paralysis_1":[true,4],"paralysis_2":[true,3],"sleep_1":[true,2],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[true,1],"recover_1":[true,3],"recover_2":[true,2],"demon":[false,0],"armor":[true,3],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Bazelgeuse Tree",[{"id":"28a","name":"Rookslayer Bowgun I","rarity":6,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["shrapnel_effect_1",null],["brutal_strike",null]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":3,"reload":2,"ammo":{"normal_1":[true,1],"normal_2":[true,1],"normal_3":[true,3],"pierce_1":[true,1],"pierce_2":[true,3],"pierce_3":[true,2],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,5],"water":[false,0],"thunder":[true,5],"ice":[false,0],"dragon":[true,1],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[true,4],"paralysis_1":[false,0],"paralysis_2":[true,3],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,5],"exhaust_2":[true,4],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"28b","name":"Rookslayer Bowgun II","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["shrapnel_effect_1",null],["brutal_strike",null]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":3,"reload":2,"ammo":{"normal_1":[true,1],"normal_2":[true,1],"normal_3":[true,4],"pierce_1":[true,1],"pierce_2":[true,4],"pierce_3":[true,3],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,6],"water":[false,0],"thunder":[true,6],"ice":[false,0],"dragon":[true,1],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[true,5],"paralysis_1":[false,0],"paralysis_2":[true,3],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,5],"exhaust_2":[true,4],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"28c","name":"Bazelfetter Rookslayer","rarity":7,"endlineTag":"hr","attack":210,"affinity":-10,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["shrapnel_effect_2",null],["brutal_strike",null],["defense_boost_1","28b"],["shrapnel_effect_1","28b"]]],"bowgunStats":{"deviation":{"severity":1,"left":false,"right":true},"recoil":3,"reload":2,"ammo":{"normal_1":[true,1],"normal_2":[true,1],"normal_3":[true,5],"pierce_1":[true,1],"pierce_2":[true,5],"pierce_3":[true,4],"spread_1":[false,1],"spread_2":[false,1],"spread_3":[false,1],"shrapnel_1":[false,1],"shrapnel_2":[false,1],"shrapnel_3":[false,1],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,7],"water":[false,0],"thunder":[true,7],"ice":[false,0],"dragon":[true,2],"piercing_fire":[true,1],"piercing_water":[false,0],"piercing_thunder":[true,1],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[true,5],"paralysis_1":[false,0],"paralysis_2":[true,4],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,6],"exhaust_2":[true,5],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Kushala Daora Tree",[{"id":"29a","name":"Gelosteel Wasp I","rarity":6,"endlineTag":"","attack":190,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":2,"reload":3,"ammo":{"normal_1":[true,8],"normal_2":[true,4],"normal_3":[true,5],"pierce_1":[false,1],"pierce_2":[true,6],"pierce_3":[true,4],"spread_1":[true,1],"spread_2":[true,1],"spread_3":[true,1],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,3],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"29b","name":"Daora\'s Hornet","rarity":7,"endlineTag":"hr","attack":200,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","29a"],["affinity_boost_2","29a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":2,"reload":3,"ammo":{"normal_1":[true,9],"normal_2":[true,5],"normal_3":[true,6],"pierce_1":[false,1],"pierce_2":[true,7],"pierce_3":[true,5],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[true,2],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[false,1],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[true,2],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[true,4],"paralysis_2":[true,2],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,2],"demon":[false,0],"armor":[true,3],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Teostra Tree",[{"id":"30a","name":"Teostra\'s Dart I","rarity":6,"endlineTag":"","attack":190,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[true,4],"sticky_1":[true,2],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,3],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"30b","name":"Teostra\'s Flamebolt","rarity":7,"endlineTag":"hr","attack":200,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","30a"]]],"bowgunStats":{"deviation":{"severity":2,"left":true,"right":false},"recoil":4,"reload":3,"ammo":{"normal_1":[true,8],"normal_2":[true,6],"normal_3":[true,4],"pierce_1":[false,1],"pierce_2":[false,1],"pierce_3":[false,1],"spread_1":[true,3],"spread_2":[true,3],"spread_3":[true,2],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[true,4],"sticky_1":[true,2],"sticky_2":[true,1],"sticky_3":[false,1],"cluster_1":[true,3],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[true,3],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[true,4],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[true,2],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Chameleos Tree",[{"id":"31a","name":"Blessed Lamp I","rarity":6,"endlineTag":"","attack":180,"affinity":20,"defense":0,"decoSlots":[3,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[true,1],"pierce_1":[true,2],"pierce_2":[true,2],"pierce_3":[true,1],"spread_1":[true,3],"spread_2":[true,2],"spread_3":[true,1],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[true,1],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,1],"water":[true,1],"thunder":[true,1],"ice":[true,1],"dragon":[true,1],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,1],"piercing_ice":[true,1],"piercing_dragon":[true,1],"poison_1":[true,3],"poison_2":[true,2],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[true,4],"exhaust_2":[true,3],"recover_1":[true,5],"recover_2":[true,4],"demon":[true,1],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"31b","name":"Cursed Lamp","rarity":7,"endlineTag":"hr","attack":190,"affinity":20,"defense":0,"decoSlots":[3,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","31a"]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":4,"reload":5,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,1],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[true,1],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[true,1],"shrapnel_1":[true,4],"shrapnel_2":[true,3],"shrapnel_3":[true,1],"sticky_1":[true,1],"sticky_2":[true,1],"sticky_3":[true,1],"cluster_1":[true,1],"cluster_2":[true,1],"cluster_3":[false,1],"fire":[true,2],"water":[true,2],"thunder":[true,2],"ice":[true,2],"dragon":[true,2],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,1],"piercing_ice":[true,1],"piercing_dragon":[true,1],"poison_1":[true,4],"poison_2":[true,3],"paralysis_1":[true,3],"paralysis_2":[true,2],"sleep_1":[true,3],"sleep_2":[true,2],"exhaust_1":[true,4],"exhaust_2":[true,3],"recover_1":[true,5],"recover_2":[true,4],"demon":[true,1],"armor":[true,1],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}}]],["Valstrax Tree",[{"id":"32a","name":"Redwing Shooter I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":6,"ammo":{"normal_1":[true,4],"normal_2":[true,3],"normal_3":[false,2],"pierce_1":[true,2],"pierce_2":[true,2],"pierce_3":[false,1],"spread_1":[true,2],"spread_2":[true,2],"spread_3":[false,1],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,2],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,2],"piercing_fire":[true,1],"piercing_water":[true,1],"piercing_thunder":[true,1],"piercing_ice":[true,1],"piercing_dragon":[true,2],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,1],"armor":[false,0],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"32b","name":"Reddnaught Bowgun","rarity":7,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"bowgunStats":{"deviation":{"severity":0,"left":false,"right":false},"recoil":2,"reload":6,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[false,4],"pierce_1":[true,4],"pierce_2":[true,4],"pierce_3":[false,2],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,3],"shrapnel_3":[false,3],"sticky_1":[true,2],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[true,2],"cluster_2":[true,2],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[true,3],"piercing_fire":[true,2],"piercing_water":[true,2],"piercing_thunder":[true,2],"piercing_ice":[true,2],"piercing_dragon":[true,3],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[true,3],"armor":[false,0],"slicing":[true,4],"wyvern":[false,0],"tranq":[true,2]}}}]],["Canyne Tree",[{"id":"33a","name":"Wooden Dog Bowgun I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["master_rider",null],["buddy_rally",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[false,4],"pierce_1":[true,4],"pierce_2":[false,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[false,4],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,2],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,6],"recover_2":[true,4],"demon":[true,2],"armor":[true,2],"slicing":[true,1],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"33b","name":"Wooden Dog Bowgun II","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["master_rider",null],["buddy_rally",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,7],"normal_2":[true,5],"normal_3":[false,4],"pierce_1":[true,5],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[true,3],"spread_2":[false,3],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,3],"sticky_2":[true,2],"sticky_3":[false,1],"cluster_1":[false,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,3],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,6],"recover_2":[true,5],"demon":[true,2],"armor":[true,2],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"33c","name":"Watchdog\'s Howl","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["master_rider",null],["buddy_rally",null],["attack_boost_1","33b"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,8],"normal_2":[true,6],"normal_3":[false,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,3],"spread_1":[true,4],"spread_2":[true,3],"spread_3":[false,2],"shrapnel_1":[true,5],"shrapnel_2":[true,4],"shrapnel_3":[false,3],"sticky_1":[true,4],"sticky_2":[true,3],"sticky_3":[false,1],"cluster_1":[false,2],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[true,4],"poison_2":[true,1],"paralysis_1":[true,2],"paralysis_2":[true,1],"sleep_1":[true,2],"sleep_2":[true,1],"exhaust_1":[true,3],"exhaust_2":[false,0],"recover_1":[true,7],"recover_2":[true,5],"demon":[true,3],"armor":[true,3],"slicing":[true,2],"wyvern":[false,0],"tranq":[true,2]}}}]],["Makluva Tree",[{"id":"34a","name":"Springnight Shot I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["anti_aquatic_species",null],["small_monster_exploit",null]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,5],"normal_2":[true,4],"normal_3":[true,3],"pierce_1":[true,3],"pierce_2":[true,3],"pierce_3":[false,2],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,3],"shrapnel_2":[true,2],"shrapnel_3":[false,3],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,3],"thunder":[false,0],"ice":[true,2],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"34b","name":"Springnight Shot II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["anti_aquatic_species",null],["small_monster_exploit",null],["affinity_boost_1","34a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,6],"normal_2":[true,5],"normal_3":[true,4],"pierce_1":[true,4],"pierce_2":[true,3],"pierce_3":[false,3],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,4],"shrapnel_2":[true,4],"shrapnel_3":[false,4],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,4],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"34c","name":"Springnight Spawn","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["anti_aquatic_species",null],["small_monster_exploit",null],["affinity_boost_2","34b"],["affinity_boost_1","34a"]]],"bowgunStats":{"deviation":{"severity":1,"left":true,"right":true},"recoil":3,"reload":4,"ammo":{"normal_1":[true,7],"normal_2":[true,6],"normal_3":[true,5],"pierce_1":[true,5],"pierce_2":[true,4],"pierce_3":[false,4],"spread_1":[false,3],"spread_2":[false,3],"spread_3":[false,3],"shrapnel_1":[true,5],"shrapnel_2":[true,5],"shrapnel_3":[false,5],"sticky_1":[true,1],"sticky_2":[false,1],"sticky_3":[false,1],"cluster_1":[true,1],"cluster_2":[false,1],"cluster_3":[false,1],"fire":[false,0],"water":[true,5],"thunder":[false,0],"ice":[true,3],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[true,2],"recover_2":[true,1],"demon":[true,1],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]],["Rampage Tree",[{"id":"ra","name":"Rampage L. Bowgun I","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["attack_surge",null]],[["add_normal_ammo_1",null],["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null]],[["rapid_fire_normal",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rb","name":"Rampage L. Bowgun II","rarity":5,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null]],[["attack_surge",null]],[["add_normal_ammo_1",null],["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null],["stickycluster_effect_1",null]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null],["dragon_effect_1",null],["poison_effect_1",null],["exhaust_effect_1",null]],[["rapid_fire_normal",null],["rapid_fire_piercing",null],["rapid_fire_spread",null],["rapid_fire_shrapnel",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rc","name":"Rampage L. Bowgun III","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null]],[["add_normal_ammo_1",null],["pierce_effect_1",null],["spread_effect_1",null],["shrapnel_effect_1",null],["stickycluster_effect_1",null]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null],["dragon_effect_1",null],["poison_effect_1",null],["paralysis_effect_1",null],["sleep_effect_1",null],["exhaust_effect_1",null]],[["rapid_fire_normal",null],["rapid_fire_piercing",null],["rapid_fire_spread",null],["rapid_fire_shrapnel",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rd","name":"Rampage L. Bowgun IV","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null]],[["add_normal_ammo_2",null],["pierce_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["stickycluster_effect_1",null],["add_normal_ammo_1","rc"],["pierce_effect_1","rc"],["spread_effect_1","rc"],["shrapnel_effect_1","rc"]],[["fire_effect_1",null],["water_effect_1",null],["thunder_effect_1",null],["ice_effect_1",null],["dragon_effect_1",null],["poison_effect_1",null],["paralysis_effect_1",null],["sleep_effect_1",null],["exhaust_effect_1",null]],[["rapid_fire_normal",null],["rapid_fire_piercing",null],["rapid_fire_spread",null],["rapid_fire_shrapnel",null],["rapid_fire_sticky",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"re","name":"Rampage L. Bowgun V","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["defense_boost_3",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null],["recoil_down_surge",null],["reload_speed_surge",null],["steadiness_surge",null]],[["add_normal_ammo_2",null],["pierce_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["stickycluster_effect_1",null],["add_normal_ammo_1","rc"],["pierce_effect_1","rc"],["spread_effect_1","rc"],["shrapnel_effect_1","rc"]],[["fire_effect_2",null],["water_effect_2",null],["thunder_effect_2",null],["ice_effect_2",null],["dragon_effect_2",null],["poison_effect_1",null],["paralysis_effect_1",null],["sleep_effect_1",null],["exhaust_effect_1",null],["fire_effect_1","rd"],["water_effect_1","rd"],["thunder_effect_1","rd"],["ice_effect_1","rd"],["dragon_effect_1","rd"]],[["rapid_fire_normal",null],["rapid_fire_piercing",null],["rapid_fire_spread",null],["rapid_fire_shrapnel",null],["rapid_fire_sticky",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}},{"id":"rf","name":"Rampage L. Bowgun S","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_4",null],["defense_boost_3",null],["recoil_down_boost",null],["reload_speed_boost",null],["steadiness_boost",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["attack_surge",null],["affinity_surge",null],["recoil_down_surge",null],["reload_speed_surge",null],["steadiness_surge",null]],[["add_normal_ammo_2",null],["pierce_effect_2",null],["spread_effect_2",null],["shrapnel_effect_2",null],["stickycluster_effect_1",null],["add_normal_ammo_1","rc"],["pierce_effect_1","rc"],["spread_effect_1","rc"],["shrapnel_effect_1","rc"]],[["fire_effect_2",null],["water_effect_2",null],["thunder_effect_2",null],["ice_effect_2",null],["dragon_effect_2",null],["poison_effect_2",null],["paralysis_effect_2",null],["sleep_effect_2",null],["exhaust_effect_2",null],["poison_effect_1","re"],["paralysis_effect_1","re"],["sleep_effect_1","re"],["exhaust_effect_1","re"],["fire_effect_1","rd"],["water_effect_1","rd"],["thunder_effect_1","rd"],["ice_effect_1","rd"],["dragon_effect_1","rd"]],[["rapid_fire_normal",null],["rapid_fire_piercing",null],["rapid_fire_spread",null],["rapid_fire_shrapnel",null],["rapid_fire_sticky",null],["rapid_fire_fire",null],["rapid_fire_water",null],["rapid_fire_thunder",null],["rapid_fire_ice",null],["rapid_fire_dragon",null]]],"bowgunStats":{"deviation":{"severity":2,"left":false,"right":true},"recoil":4,"reload":3,"ammo":{"normal_1":[true,3],"normal_2":[true,3],"normal_3":[true,3],"pierce_1":[false,0],"pierce_2":[false,0],"pierce_3":[false,0],"spread_1":[false,0],"spread_2":[false,0],"spread_3":[false,0],"shrapnel_1":[false,0],"shrapnel_2":[false,0],"shrapnel_3":[false,0],"sticky_1":[false,0],"sticky_2":[false,0],"sticky_3":[false,0],"cluster_1":[false,0],"cluster_2":[false,0],"cluster_3":[false,0],"fire":[false,0],"water":[false,0],"thunder":[false,0],"ice":[false,0],"dragon":[false,0],"piercing_fire":[false,0],"piercing_water":[false,0],"piercing_thunder":[false,0],"piercing_ice":[false,0],"piercing_dragon":[false,0],"poison_1":[false,0],"poison_2":[false,0],"paralysis_1":[false,0],"paralysis_2":[false,0],"sleep_1":[false,0],"sleep_2":[false,0],"exhaust_1":[false,0],"exhaust_2":[false,0],"recover_1":[false,0],"recover_2":[false,0],"demon":[false,0],"armor":[false,0],"slicing":[false,0],"wyvern":[false,0],"tranq":[true,2]}}}]]]}';
 
-export const lightbowgunsArray: Readonly<LightBowgun[]> = [
-    __generated_lightbowgun__1a,
-    __generated_lightbowgun__1b,
-    __generated_lightbowgun__1c,
-    __generated_lightbowgun__1d,
-    __generated_lightbowgun__1e,
-    __generated_lightbowgun__1f,
-    __generated_lightbowgun__2a,
-    __generated_lightbowgun__2b,
-    __generated_lightbowgun__2c,
-    __generated_lightbowgun__3a,
-    __generated_lightbowgun__3b,
-    __generated_lightbowgun__3c,
-    __generated_lightbowgun__4a,
-    __generated_lightbowgun__4b,
-    __generated_lightbowgun__4c,
-    __generated_lightbowgun__5a,
-    __generated_lightbowgun__5b,
-    __generated_lightbowgun__5c,
-    __generated_lightbowgun__5d,
-    __generated_lightbowgun__6a,
-    __generated_lightbowgun__6b,
-    __generated_lightbowgun__6c,
-    __generated_lightbowgun__6d,
-    __generated_lightbowgun__7a,
-    __generated_lightbowgun__7b,
-    __generated_lightbowgun__7c,
-    __generated_lightbowgun__8a,
-    __generated_lightbowgun__8b,
-    __generated_lightbowgun__8c,
-    __generated_lightbowgun__8d,
-    __generated_lightbowgun__9a,
-    __generated_lightbowgun__9b,
-    __generated_lightbowgun__9c,
-    __generated_lightbowgun__9d,
-    __generated_lightbowgun__9e,
-    __generated_lightbowgun__9f,
-    __generated_lightbowgun__10a,
-    __generated_lightbowgun__10b,
-    __generated_lightbowgun__10c,
-    __generated_lightbowgun__11a,
-    __generated_lightbowgun__11b,
-    __generated_lightbowgun__11c,
-    __generated_lightbowgun__12a,
-    __generated_lightbowgun__12b,
-    __generated_lightbowgun__12c,
-    __generated_lightbowgun__13a,
-    __generated_lightbowgun__13b,
-    __generated_lightbowgun__13c,
-    __generated_lightbowgun__14a,
-    __generated_lightbowgun__14b,
-    __generated_lightbowgun__14c,
-    __generated_lightbowgun__14d,
-    __generated_lightbowgun__15a,
-    __generated_lightbowgun__15b,
-    __generated_lightbowgun__15c,
-    __generated_lightbowgun__16a,
-    __generated_lightbowgun__16b,
-    __generated_lightbowgun__16c,
-    __generated_lightbowgun__17a,
-    __generated_lightbowgun__17b,
-    __generated_lightbowgun__17c,
-    __generated_lightbowgun__17d,
-    __generated_lightbowgun__17e,
-    __generated_lightbowgun__17f,
-    __generated_lightbowgun__18a,
-    __generated_lightbowgun__18b,
-    __generated_lightbowgun__18c,
-    __generated_lightbowgun__19a,
-    __generated_lightbowgun__19b,
-    __generated_lightbowgun__19c,
-    __generated_lightbowgun__20a,
-    __generated_lightbowgun__20b,
-    __generated_lightbowgun__20c,
-    __generated_lightbowgun__21a,
-    __generated_lightbowgun__21b,
-    __generated_lightbowgun__21c,
-    __generated_lightbowgun__21d,
-    __generated_lightbowgun__22a,
-    __generated_lightbowgun__22b,
-    __generated_lightbowgun__22c,
-    __generated_lightbowgun__23a,
-    __generated_lightbowgun__23b,
-    __generated_lightbowgun__23c,
-    __generated_lightbowgun__24a,
-    __generated_lightbowgun__24b,
-    __generated_lightbowgun__24c,
-    __generated_lightbowgun__25a,
-    __generated_lightbowgun__25b,
-    __generated_lightbowgun__25c,
-    __generated_lightbowgun__26a,
-    __generated_lightbowgun__26b,
-    __generated_lightbowgun__26c,
-    __generated_lightbowgun__27a,
-    __generated_lightbowgun__27b,
-    __generated_lightbowgun__28a,
-    __generated_lightbowgun__28b,
-    __generated_lightbowgun__28c,
-    __generated_lightbowgun__29a,
-    __generated_lightbowgun__29b,
-    __generated_lightbowgun__30a,
-    __generated_lightbowgun__30b,
-    __generated_lightbowgun__31a,
-    __generated_lightbowgun__31b,
-    __generated_lightbowgun__32a,
-    __generated_lightbowgun__32b,
-    __generated_lightbowgun__33a,
-    __generated_lightbowgun__33b,
-    __generated_lightbowgun__33c,
-    __generated_lightbowgun__34a,
-    __generated_lightbowgun__34b,
-    __generated_lightbowgun__34c,
-    __generated_lightbowgun__ra,
-    __generated_lightbowgun__rb,
-    __generated_lightbowgun__rc,
-    __generated_lightbowgun__rd,
-    __generated_lightbowgun__re,
-    __generated_lightbowgun__rf,
-];
+export const lightbowgunsArray: Readonly<LightBowgun[]> = loadWeaponPayload<LightBowgun>(payload);
@@ -36,5340 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type Longsword,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__blast_boost_3,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_boost_3,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__paralysis_boost_2,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_4,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_longsword__1a: Longsword = {
-    category: "longsword",
-    id: "1a",
-
-    name: "Kamura Blade I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurabladei",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_longsword__1b: Longsword = {
-    category: "longsword",
-    id: "1b",
-
-    name: "Kamura Blade II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurabladeii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_longsword__1c: Longsword = {
-    category: "longsword",
-    id: "1c",
-
-    name: "Kamura Blade III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurabladeiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_longsword__1d: Longsword = {
-    category: "longsword",
-    id: "1d",
-
-    name: "Kamura Blade IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurabladeiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_longsword__1e: Longsword = {
-    category: "longsword",
-    id: "1e",
-
-    name: "Kamura Blade V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__1d],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1d],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamurabladev",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_longsword__1f: Longsword = {
-    category: "longsword",
-    id: "1f",
-
-    name: "Kamura Ninja Blade",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_longsword__1e],
-            [__generated_ramp__attack_boost_2, __generated_longsword__1d],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1d],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraninjablade",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_longsword__2a: Longsword = {
-    category: "longsword",
-    id: "2a",
-
-    name: "Usurper Boltslicer I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 50, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurperboltsliceri",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_longsword__2b: Longsword = {
-    category: "longsword",
-    id: "2b",
-
-    name: "Usurper Boltslicer II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__2a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 100, 80, 30, 0, 0],
-    maxSharpness:  [60, 30, 100, 80, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "usurperboltslicerii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_longsword__2c: Longsword = {
-    category: "longsword",
-    id: "2c",
-
-    name: "Despot Boltbreaker",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_longsword__2b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__2a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__1c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 90, 40, 0, 0],
-    maxSharpness:  [60, 40, 120, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "despotboltbreaker",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_longsword__3a: Longsword = {
-    category: "longsword",
-    id: "3a",
-
-    name: "Aknosom Sabre I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 70, 50, 0, 0, 0],
-    maxSharpness:  [30, 50, 70, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "aknosomsabrei",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_longsword__3b: Longsword = {
-    category: "longsword",
-    id: "3b",
-
-    name: "Aknosom Sabre II",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__3a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 110, 40, 20, 0, 0],
-    maxSharpness:  [30, 50, 110, 40, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "aknosomsabreii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_longsword__3c: Longsword = {
-    category: "longsword",
-    id: "3c",
-
-    name: "Daybreak Blade",
-    treeName: "Aknosom Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_longsword__3b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__3a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 120, 70, 30, 0, 0],
-    maxSharpness:  [30, 50, 120, 70, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "daybreakblade",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_longsword__4a: Longsword = {
-    category: "longsword",
-    id: "4a",
-
-    name: "Ivory Rabbit I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 60, 0, 0, 0, 0],
-    maxSharpness:  [70, 70, 80, 30, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ivoryrabbiti",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_longsword__4b: Longsword = {
-    category: "longsword",
-    id: "4b",
-
-    name: "Ivory Rabbit II",
-    treeName: "Lagombi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_longsword__4a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 90, 30, 0, 0, 0],
-    maxSharpness:  [70, 60, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ivoryrabbitii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_longsword__4c: Longsword = {
-    category: "longsword",
-    id: "4c",
-
-    name: "Gelod Rabbit",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__4b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__4b],
-            [__generated_ramp__ice_boost_1, __generated_longsword__4a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 140, 70, 0, 0, 0],
-    maxSharpness:  [60, 30, 140, 70, 40, 10, 0],
-
-    filterHelpers: {
-        nameLower: "icedrabbit",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_longsword__5a: Longsword = {
-    category: "longsword",
-    id: "5a",
-
-    name: "Guardian Sword I",
-    treeName: "Long Sword Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 0, 0, 0, 0],
-    maxSharpness:  [90, 80, 80, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "guardianswordi",
-        treeNameLower: "longswordtree",
-    },
-};
-
-const __generated_longsword__5b: Longsword = {
-    category: "longsword",
-    id: "5b",
-
-    name: "Guardian Sword II",
-    treeName: "Long Sword Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 50, 70, 0, 0, 0],
-    maxSharpness:  [50, 80, 50, 110, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "guardianswordii",
-        treeNameLower: "longswordtree",
-    },
-};
-
-const __generated_longsword__5c: Longsword = {
-    category: "longsword",
-    id: "5c",
-
-    name: "Imperial Sword",
-    treeName: "Long Sword Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 70, 90, 50, 0, 0],
-    maxSharpness:  [40, 50, 70, 90, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "imperialsword",
-        treeNameLower: "longswordtree",
-    },
-};
-
-const __generated_longsword__6a: Longsword = {
-    category: "longsword",
-    id: "6a",
-
-    name: "Castello Saif I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 0, 0, 0, 0],
-    maxSharpness:  [60, 60, 130, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "castellosaifi",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_longsword__6b: Longsword = {
-    category: "longsword",
-    id: "6b",
-
-    name: "Castello Saif II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 130, 40, 0, 0, 0],
-    maxSharpness:  [70, 60, 130, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "castellosaifii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_longsword__6c: Longsword = {
-    category: "longsword",
-    id: "6c",
-
-    name: "Castellum Long Sword",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__6a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 130, 100, 10, 0, 0],
-    maxSharpness:  [60, 50, 130, 100, 20, 40, 0],
-
-    filterHelpers: {
-        nameLower: "castellumlongsword",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_longsword__7a: Longsword = {
-    category: "longsword",
-    id: "7a",
-
-    name: "Gigant Makra I",
-    treeName: "Basarios Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6a],
-            [__generated_ramp__brutal_strike, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 60, 10, 0, 0, 0],
-    maxSharpness:  [100, 80, 60, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gigantmakrai",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_longsword__7b: Longsword = {
-    category: "longsword",
-    id: "7b",
-
-    name: "Gigant Makra II",
-    treeName: "Basarios Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_longsword__7a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6a],
-            [__generated_ramp__brutal_strike, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 70, 20, 0, 0, 0],
-    maxSharpness:  [110, 100, 70, 60, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gigantmakraii",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_longsword__7c: Longsword = {
-    category: "longsword",
-    id: "7c",
-
-    name: "Titanic Makra",
-    treeName: "Basarios Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__7b],
-            [__generated_ramp__fire_boost_2, __generated_longsword__7b],
-            [__generated_ramp__fire_boost_1, __generated_longsword__7a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6a],
-            [__generated_ramp__brutal_strike, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 90, 50, 0, 0, 0],
-    maxSharpness:  [110, 100, 90, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "titanicmakra",
-        treeNameLower: "basariostree",
-    },
-};
-
-const __generated_longsword__8a: Longsword = {
-    category: "longsword",
-    id: "8a",
-
-    name: "Almudron Blade I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__7a],
-            [__generated_ramp__fire_boost_1, __generated_longsword__7a],
-            [__generated_ramp__dulling_strike, __generated_longsword__7a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6a],
-            [__generated_ramp__brutal_strike, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "almudronbladei",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_longsword__8b: Longsword = {
-    category: "longsword",
-    id: "8b",
-
-    name: "Almudron Blade II",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 41]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__8a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__7a],
-            [__generated_ramp__fire_boost_1, __generated_longsword__7a],
-            [__generated_ramp__dulling_strike, __generated_longsword__7a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6a],
-            [__generated_ramp__brutal_strike, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 60, 40, 0, 0],
-    maxSharpness:  [60, 60, 80, 60, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "almudronbladeii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_longsword__8c: Longsword = {
-    category: "longsword",
-    id: "8c",
-
-    name: "Doom Bringer Blade",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 48]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_longsword__8b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__8a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__7a],
-            [__generated_ramp__fire_boost_1, __generated_longsword__7a],
-            [__generated_ramp__dulling_strike, __generated_longsword__7a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__6a],
-            [__generated_ramp__brutal_strike, __generated_longsword__6a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__5a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__5a],
-            [__generated_ramp__silkbind_boost, __generated_longsword__5a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 90, 60, 0, 0],
-    maxSharpness:  [60, 60, 80, 90, 110, 0, 0],
-
-    filterHelpers: {
-        nameLower: "doombringerblade",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_longsword__9a: Longsword = {
-    category: "longsword",
-    id: "9a",
-
-    name: "Iron Katana I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironkatanai",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_longsword__9b: Longsword = {
-    category: "longsword",
-    id: "9b",
-
-    name: "Iron Katana II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironkatanaii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_longsword__9c: Longsword = {
-    category: "longsword",
-    id: "9c",
-
-    name: "Iron Gospel",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "irongospel",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_longsword__9d: Longsword = {
-    category: "longsword",
-    id: "9d",
-
-    name: "Keen Edge I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "keenedgei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_longsword__9e: Longsword = {
-    category: "longsword",
-    id: "9e",
-
-    name: "Keen Edge II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9d],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 90, 50, 20, 0, 0],
-    maxSharpness:  [100, 90, 90, 50, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "keenedgeii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_longsword__9f: Longsword = {
-    category: "longsword",
-    id: "9f",
-
-    name: "Julienne Blade",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__9e],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9d],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 80, 50, 40, 0, 0],
-    maxSharpness:  [90, 90, 80, 50, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "julienneblade",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_longsword__10a: Longsword = {
-    category: "longsword",
-    id: "10a",
-
-    name: "Tigrine Edge I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9d],
-            [__generated_ramp__silkbind_boost, __generated_longsword__9d],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tigrineedgei",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_longsword__10b: Longsword = {
-    category: "longsword",
-    id: "10b",
-
-    name: "Tigrine Edge II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__10a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9d],
-            [__generated_ramp__silkbind_boost, __generated_longsword__9d],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrineedgeii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_longsword__10c: Longsword = {
-    category: "longsword",
-    id: "10c",
-
-    name: "Tigrine Need",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__10b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__10a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9d],
-            [__generated_ramp__silkbind_boost, __generated_longsword__9d],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 130, 40, 20, 0],
-    maxSharpness:  [50, 40, 120, 130, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrineneed",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_longsword__11a: Longsword = {
-    category: "longsword",
-    id: "11a",
-
-    name: "Kakaru Kumo Naki I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 40, 40, 0, 0, 0],
-    maxSharpness:  [70, 50, 40, 60, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kakarukumonakii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_longsword__11b: Longsword = {
-    category: "longsword",
-    id: "11b",
-
-    name: "Kakaru Kumo Naki II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__11a],
-            [__generated_ramp__water_boost_1, __generated_longsword__11a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [110, 100, 80, 30, 30, 0, 0],
-    maxSharpness:  [110, 100, 80, 30, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kakarukumonakiii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_longsword__11c: Longsword = {
-    category: "longsword",
-    id: "11c",
-
-    name: "Tamonowo",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__11b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__11a],
-            [__generated_ramp__water_boost_1, __generated_longsword__11a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 70, 50, 40, 0, 0],
-    maxSharpness:  [100, 90, 70, 50, 50, 40, 0],
-
-    filterHelpers: {
-        nameLower: "tamonowo",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_longsword__12a: Longsword = {
-    category: "longsword",
-    id: "12a",
-
-    name: "Hidden Saber I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hiddensaberi",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_longsword__12b: Longsword = {
-    category: "longsword",
-    id: "12b",
-
-    name: "Hidden Saber II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__12a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 40, 120, 50, 0, 0],
-    maxSharpness:  [70, 70, 40, 120, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "hiddensaberii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_longsword__12c: Longsword = {
-    category: "longsword",
-    id: "12c",
-
-    name: "Deepest Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__12b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__12a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9c],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 90, 70, 30, 0],
-    maxSharpness:  [70, 40, 100, 90, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "deepestnight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_longsword__13a: Longsword = {
-    category: "longsword",
-    id: "13a",
-
-    name: "Eager Cleaver I",
-    treeName: "Thunder Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 50, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 50, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "eagercleaveri",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_longsword__13b: Longsword = {
-    category: "longsword",
-    id: "13b",
-
-    name: "Eager Cleaver II",
-    treeName: "Thunder Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 90, 80, 0, 0, 0],
-    maxSharpness:  [40, 40, 90, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "eagercleaverii",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_longsword__13c: Longsword = {
-    category: "longsword",
-    id: "13c",
-
-    name: "Devil Slicer",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__thunder_boost_1, __generated_longsword__13b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__9b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [40, 50, 90, 120, 0, 0, 0],
-    maxSharpness:  [40, 50, 90, 120, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "devilslicer",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_longsword__14a: Longsword = {
-    category: "longsword",
-    id: "14a",
-
-    name: "Kulu Katana I",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 30, 50, 0, 0, 0],
-    maxSharpness:  [70, 50, 30, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulukatanai",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_longsword__14b: Longsword = {
-    category: "longsword",
-    id: "14b",
-
-    name: "Kulu Katana II",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 40, 60, 0, 0, 0],
-    maxSharpness:  [80, 70, 40, 90, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kulukatanaii",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_longsword__14c: Longsword = {
-    category: "longsword",
-    id: "14c",
-
-    name: "Kulu Slicer",
-    treeName: "Kulu-Ya-Ku Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 70, 60, 10, 0, 0],
-    maxSharpness:  [80, 80, 70, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kuluslicer",
-        treeNameLower: "kulu-ya-kutree",
-    },
-};
-
-const __generated_longsword__15a: Longsword = {
-    category: "longsword",
-    id: "15a",
-
-    name: "Chillblade I",
-    treeName: "Ice Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__14b],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14b],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 50, 20, 0, 0],
-    maxSharpness:  [60, 60, 60, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "chillbladei",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_longsword__15b: Longsword = {
-    category: "longsword",
-    id: "15b",
-
-    name: "Chillblade II",
-    treeName: "Ice Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__ice_boost_1, __generated_longsword__15a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__14b],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14b],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 70, 50, 30, 0, 0],
-    maxSharpness:  [80, 70, 70, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "chillbladeii",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_longsword__15c: Longsword = {
-    category: "longsword",
-    id: "15c",
-
-    name: "Rimeblossom",
-    treeName: "Ice Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__15b],
-            [__generated_ramp__ice_boost_1, __generated_longsword__15a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14b],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 70, 50, 40, 0, 0],
-    maxSharpness:  [70, 70, 70, 50, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rimeblossom",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_longsword__16a: Longsword = {
-    category: "longsword",
-    id: "16a",
-
-    name: "Wyvern Blade Verde I",
-    treeName: "Rathian Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14a],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 50, 40, 0, 0, 0],
-    maxSharpness:  [80, 80, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernbladeverdei",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_longsword__16b: Longsword = {
-    category: "longsword",
-    id: "16b",
-
-    name: "Wyvern Blade Verde II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__16a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14a],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 60, 60, 20, 0, 0],
-    maxSharpness:  [80, 80, 60, 60, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernbladeverdeii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_longsword__16c: Longsword = {
-    category: "longsword",
-    id: "16c",
-
-    name: "Wyvern Blade Holly",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__16a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14a],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 70, 70, 20, 0, 0],
-    maxSharpness:  [100, 90, 70, 70, 40, 30, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernbladeholly",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_longsword__17a: Longsword = {
-    category: "longsword",
-    id: "17a",
-
-    name: "Wyvern Blade Blood I",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__poison_boost_1, __generated_longsword__16b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__16b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__16a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14a],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [160, 10, 10, 50, 20, 0, 0],
-    maxSharpness:  [160, 10, 10, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernbladebloodi",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_longsword__17b: Longsword = {
-    category: "longsword",
-    id: "17b",
-
-    name: "Wyvern Blade Blood II",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__poison_boost_1, __generated_longsword__16b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__16b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__16a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14a],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 10, 60, 30, 0, 0],
-    maxSharpness:  [190, 10, 10, 60, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernbladebloodii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_longsword__17c: Longsword = {
-    category: "longsword",
-    id: "17c",
-
-    name: "Wyvern Blade Maple",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__17b],
-            [__generated_ramp__poison_boost_1, __generated_longsword__16b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__16b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__16a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__14a],
-            [__generated_ramp__spiribird_doubled, __generated_longsword__14a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__9b],
-            [__generated_ramp__defense_boost_2, __generated_longsword__9b],
-        ],
-    ],
-
-    baseSharpness: [220, 10, 10, 70, 40, 0, 0],
-    maxSharpness:  [220, 10, 10, 70, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wyvernblademaple",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_longsword__18a: Longsword = {
-    category: "longsword",
-    id: "18a",
-
-    name: "Serrated Jaw I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "serratedjawi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_longsword__18b: Longsword = {
-    category: "longsword",
-    id: "18b",
-
-    name: "Serrated Jaw II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "serratedjawii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_longsword__18c: Longsword = {
-    category: "longsword",
-    id: "18c",
-
-    name: "Serrated Maw",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 70, 0, 0, 0, 0],
-    maxSharpness:  [90, 90, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "serratedmaw",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_longsword__18d: Longsword = {
-    category: "longsword",
-    id: "18d",
-
-    name: "Canine Katana I",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "caninekatanai",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_longsword__18e: Longsword = {
-    category: "longsword",
-    id: "18e",
-
-    name: "Canine Katana II",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [130, 100, 20, 50, 0, 0, 0],
-    maxSharpness:  [130, 100, 20, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "caninekatanaii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_longsword__18f: Longsword = {
-    category: "longsword",
-    id: "18f",
-
-    name: "Gnash Katana",
-    treeName: "Bone Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_longsword__18e],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18d],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18c],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [150, 120, 20, 60, 0, 0, 0],
-    maxSharpness:  [150, 120, 20, 60, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gnashkatana",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_longsword__19a: Longsword = {
-    category: "longsword",
-    id: "19a",
-
-    name: "Flammenschwert I",
-    treeName: "Anjanath Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18c],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__18c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18c],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 40, 30, 0, 0, 0],
-    maxSharpness:  [100, 80, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammenschwerti",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_longsword__19b: Longsword = {
-    category: "longsword",
-    id: "19b",
-
-    name: "Flammenschwert II",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_longsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18c],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__18c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18c],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 60, 60, 0, 0, 0],
-    maxSharpness:  [100, 80, 60, 60, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammenschwertii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_longsword__19c: Longsword = {
-    category: "longsword",
-    id: "19c",
-
-    name: "Fervid Flammenschwert",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__19b],
-            [__generated_ramp__fire_boost_2, __generated_longsword__19b],
-            [__generated_ramp__fire_boost_1, __generated_longsword__19a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18c],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 60, 20, 0, 0],
-    maxSharpness:  [100, 90, 80, 60, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "fervidflammenschwert",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_longsword__20a: Longsword = {
-    category: "longsword",
-    id: "20a",
-
-    name: "Bastine Edge I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bastineedgei",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_longsword__20b: Longsword = {
-    category: "longsword",
-    id: "20b",
-
-    name: "Bastine Edge II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__20a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 70, 100, 20, 0, 0],
-    maxSharpness:  [40, 70, 70, 100, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bastineedgeii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_longsword__20c: Longsword = {
-    category: "longsword",
-    id: "20c",
-
-    name: "Bastizan Edge",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_longsword__20b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__20a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 90, 50, 10, 0],
-    maxSharpness:  [50, 70, 80, 90, 50, 60, 0],
-
-    filterHelpers: {
-        nameLower: "bastizanedge",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_longsword__21a: Longsword = {
-    category: "longsword",
-    id: "21a",
-
-    name: "Wroggi Sword I",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 40, 30, 0, 0, 0],
-    maxSharpness:  [90, 40, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wroggiswordi",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_longsword__21b: Longsword = {
-    category: "longsword",
-    id: "21b",
-
-    name: "Wroggi Sword II",
-    treeName: "Wroggi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__21a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wroggiswordii",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_longsword__21c: Longsword = {
-    category: "longsword",
-    id: "21c",
-
-    name: "Poison Barb",
-    treeName: "Wroggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__poison_boost_1, __generated_longsword__21b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__21a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 60, 80, 0, 0, 0],
-    maxSharpness:  [90, 70, 60, 100, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "poisonbarb",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_longsword__22a: Longsword = {
-    category: "longsword",
-    id: "22a",
-
-    name: "Ananta Blade I",
-    treeName: "Baggi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18a],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 40, 20, 0, 0, 0],
-    maxSharpness:  [100, 40, 40, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "anantabladei",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_longsword__22b: Longsword = {
-    category: "longsword",
-    id: "22b",
-
-    name: "Ananta Blade II",
-    treeName: "Baggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__22a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18a],
-        ],
-    ],
-
-    baseSharpness: [100, 20, 40, 40, 0, 0, 0],
-    maxSharpness:  [100, 20, 40, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "anantabladeii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_longsword__22c: Longsword = {
-    category: "longsword",
-    id: "22c",
-
-    name: "Shadow Slasher",
-    treeName: "Baggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__paralysis_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__paralysis_boost_1, __generated_longsword__22b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__22a],
-            [__generated_ramp__attack_boost_2, __generated_longsword__18a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__18a],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 60, 60, 10, 0, 0],
-    maxSharpness:  [100, 70, 60, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "shadowslasher",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_longsword__23a: Longsword = {
-    category: "longsword",
-    id: "23a",
-
-    name: "Bone Scythe I",
-    treeName: "Bone Scythe Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [130, 20, 50, 0, 0, 0, 0],
-    maxSharpness:  [130, 20, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonescythei",
-        treeNameLower: "bonescythetree",
-    },
-};
-
-const __generated_longsword__23b: Longsword = {
-    category: "longsword",
-    id: "23b",
-
-    name: "Bone Scythe II",
-    treeName: "Bone Scythe Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [120, 20, 60, 0, 0, 0, 0],
-    maxSharpness:  [120, 20, 110, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonescytheii",
-        treeNameLower: "bonescythetree",
-    },
-};
-
-const __generated_longsword__23c: Longsword = {
-    category: "longsword",
-    id: "23c",
-
-    name: "Bone Reaper",
-    treeName: "Bone Scythe Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [100, 20, 80, 0, 0, 0, 0],
-    maxSharpness:  [100, 20, 110, 20, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonereaper",
-        treeNameLower: "bonescythetree",
-    },
-};
-
-const __generated_longsword__23d: Longsword = {
-    category: "longsword",
-    id: "23d",
-
-    name: "Spark Slicer I",
-    treeName: "Bone Scythe Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [130, 30, 50, 40, 0, 0, 0],
-    maxSharpness:  [130, 30, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sparksliceri",
-        treeNameLower: "bonescythetree",
-    },
-};
-
-const __generated_longsword__23e: Longsword = {
-    category: "longsword",
-    id: "23e",
-
-    name: "Spark Slicer II",
-    treeName: "Bone Scythe Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23d],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [110, 60, 70, 60, 0, 0, 0],
-    maxSharpness:  [110, 60, 70, 90, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sparkslicerii",
-        treeNameLower: "bonescythetree",
-    },
-};
-
-const __generated_longsword__23f: Longsword = {
-    category: "longsword",
-    id: "23f",
-
-    name: "Shocking Slicer",
-    treeName: "Bone Scythe Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23d],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [150, 100, 30, 30, 40, 0, 0],
-    maxSharpness:  [150, 100, 30, 30, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "shockingslicer",
-        treeNameLower: "bonescythetree",
-    },
-};
-
-const __generated_longsword__24a: Longsword = {
-    category: "longsword",
-    id: "24a",
-
-    name: "Jyura Saber I",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 70, 50, 10, 0, 0],
-    maxSharpness:  [90, 80, 70, 50, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "jyurasaberi",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_longsword__24b: Longsword = {
-    category: "longsword",
-    id: "24b",
-
-    name: "Jyura Saber II",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__water_boost_1, __generated_longsword__24a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 60, 40, 30, 0, 0],
-    maxSharpness:  [90, 80, 60, 40, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "jyurasaberii",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_longsword__24c: Longsword = {
-    category: "longsword",
-    id: "24c",
-
-    name: "Jyura Reaver",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__24b],
-            [__generated_ramp__water_boost_1, __generated_longsword__24a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 70, 50, 40, 0, 0],
-    maxSharpness:  [100, 90, 70, 50, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "jyurareaver",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_longsword__25a: Longsword = {
-    category: "longsword",
-    id: "25a",
-
-    name: "Anteka Blade I",
-    treeName: "Anteka Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23d],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [10, 120, 10, 60, 0, 0, 0],
-    maxSharpness:  [10, 120, 10, 110, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "antekabladei",
-        treeNameLower: "antekatree",
-    },
-};
-
-const __generated_longsword__25b: Longsword = {
-    category: "longsword",
-    id: "25b",
-
-    name: "Anteka Blade II",
-    treeName: "Anteka Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23d],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [10, 160, 10, 60, 10, 0, 0],
-    maxSharpness:  [10, 160, 10, 60, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "antekabladeii",
-        treeNameLower: "antekatree",
-    },
-};
-
-const __generated_longsword__25c: Longsword = {
-    category: "longsword",
-    id: "25c",
-
-    name: "Anteka Rack",
-    treeName: "Anteka Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__25b],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__23e],
-            [__generated_ramp__thunder_boost_2, __generated_longsword__23e],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23d],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [10, 230, 10, 70, 30, 0, 0],
-    maxSharpness:  [10, 230, 10, 70, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "antekarack",
-        treeNameLower: "antekatree",
-    },
-};
-
-const __generated_longsword__26a: Longsword = {
-    category: "longsword",
-    id: "26a",
-
-    name: "Frilled Slash I",
-    treeName: "Somnacanth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 120, 30, 0, 0, 0],
-    maxSharpness:  [50, 50, 120, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledslashi",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_longsword__26b: Longsword = {
-    category: "longsword",
-    id: "26b",
-
-    name: "Frilled Slash II",
-    treeName: "Somnacanth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__26a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 110, 40, 0, 0, 0],
-    maxSharpness:  [40, 60, 110, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frilledslashii",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_longsword__26c: Longsword = {
-    category: "longsword",
-    id: "26c",
-
-    name: "Illusory Frilled Slash",
-    treeName: "Somnacanth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__26b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__26a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 120, 90, 0, 0, 0],
-    maxSharpness:  [50, 90, 120, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "illusoryfrilledslash",
-        treeNameLower: "somnacanthtree",
-    },
-};
-
-const __generated_longsword__27a: Longsword = {
-    category: "longsword",
-    id: "27a",
-
-    name: "Drowning Shaft I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23c],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 30, 0, 0, 0],
-    maxSharpness:  [50, 70, 50, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "drowningshafti",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_longsword__27b: Longsword = {
-    category: "longsword",
-    id: "27b",
-
-    name: "Drowning Shaft II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23c],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "drowningshaftii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_longsword__27c: Longsword = {
-    category: "longsword",
-    id: "27c",
-
-    name: "Douser Bardiche",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__27b],
-            [__generated_ramp__water_boost_1, __generated_longsword__27b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23c],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_2, __generated_longsword__23c],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23b],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 100, 100, 20, 0, 0],
-    maxSharpness:  [40, 40, 100, 100, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "douserbardiche",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_longsword__28a: Longsword = {
-    category: "longsword",
-    id: "28a",
-
-    name: "Arzuros Naginata I",
-    treeName: "Arzuros Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 110, 0, 0, 0, 0],
-    maxSharpness:  [50, 40, 160, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "arzurosnaginatai",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_longsword__28b: Longsword = {
-    category: "longsword",
-    id: "28b",
-
-    name: "Arzuros Naginata II",
-    treeName: "Arzuros Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__28a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 120, 0, 0, 0, 0],
-    maxSharpness:  [40, 40, 120, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "arzurosnaginataii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_longsword__28c: Longsword = {
-    category: "longsword",
-    id: "28c",
-
-    name: "Arzuros Strikequill",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__28b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__28b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__28b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__28a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 40, 130, 0, 0, 0],
-    maxSharpness:  [40, 40, 40, 130, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "arzurosstrikequill",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_longsword__29a: Longsword = {
-    category: "longsword",
-    id: "29a",
-
-    name: "Wind Thief Scimitar I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 30, 40, 0, 0, 0],
-    maxSharpness:  [80, 50, 30, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "windthiefscimitari",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_longsword__29b: Longsword = {
-    category: "longsword",
-    id: "29b",
-
-    name: "Wind Thief Scimitar II",
-    treeName: "Izuchi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__29a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 20, 50, 0, 0, 0],
-    maxSharpness:  [80, 50, 20, 50, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "windthiefscimitarii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_longsword__29c: Longsword = {
-    category: "longsword",
-    id: "29c",
-
-    name: "Gale Scimitar",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__29b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__29a],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 20, 50, 50, 0, 0],
-    maxSharpness:  [80, 50, 20, 50, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "galescimitar",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_longsword__30a: Longsword = {
-    category: "longsword",
-    id: "30a",
-
-    name: "Dark Scythe I",
-    treeName: "Bone Scythe Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__29b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__29b],
-            [__generated_ramp__buddy_rally, __generated_longsword__29b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 70, 60, 0, 0, 0],
-    maxSharpness:  [100, 70, 70, 90, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "darkscythei",
-        treeNameLower: "bonescythetree2",
-    },
-};
-
-const __generated_longsword__30b: Longsword = {
-    category: "longsword",
-    id: "30b",
-
-    name: "Tormentor",
-    treeName: "Bone Scythe Tree 2",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__30a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__30a],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__29b],
-            [__generated_ramp__buddy_rally, __generated_longsword__29b],
-            [__generated_ramp__attack_boost_1, __generated_longsword__23a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 50, 70, 0, 0, 0],
-    maxSharpness:  [100, 80, 50, 90, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "tormentor",
-        treeNameLower: "bonescythetree2",
-    },
-};
-
-const __generated_longsword__31a: Longsword = {
-    category: "longsword",
-    id: "31a",
-
-    name: "Scythe of Menace I",
-    treeName: "Poison Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__30a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__30a],
-            [__generated_ramp__dulling_strike, __generated_longsword__30a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__29b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__29b],
-            [__generated_ramp__buddy_rally, __generated_longsword__29b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 150, 50, 20, 0, 0],
-    maxSharpness:  [40, 40, 150, 50, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "scytheofmenacei",
-        treeNameLower: "poisontree",
-    },
-};
-
-const __generated_longsword__31b: Longsword = {
-    category: "longsword",
-    id: "31b",
-
-    name: "Scythe of Menace II",
-    treeName: "Poison Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__30a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__30a],
-            [__generated_ramp__dulling_strike, __generated_longsword__30a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__29b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__29b],
-            [__generated_ramp__buddy_rally, __generated_longsword__29b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 150, 40, 30, 0, 0],
-    maxSharpness:  [40, 40, 150, 40, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "scytheofmenaceii",
-        treeNameLower: "poisontree",
-    },
-};
-
-const __generated_longsword__31c: Longsword = {
-    category: "longsword",
-    id: "31c",
-
-    name: "Big Menacing Scythe",
-    treeName: "Poison Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__poison_boost_1, __generated_longsword__31b],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__30a],
-            [__generated_ramp__defense_boost_2, __generated_longsword__30a],
-            [__generated_ramp__dulling_strike, __generated_longsword__30a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__29b],
-            [__generated_ramp__small_monster_exploit, __generated_longsword__29b],
-            [__generated_ramp__buddy_rally, __generated_longsword__29b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__23a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 190, 40, 40, 0, 0],
-    maxSharpness:  [40, 40, 190, 40, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "bigmenacingscythe",
-        treeNameLower: "poisontree",
-    },
-};
-
-const __generated_longsword__32a: Longsword = {
-    category: "longsword",
-    id: "32a",
-
-    name: "Sinister Long Sword I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterlongswordi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_longsword__32b: Longsword = {
-    category: "longsword",
-    id: "32b",
-
-    name: "Sinister Long Sword II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__32a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterlongswordii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_longsword__32c: Longsword = {
-    category: "longsword",
-    id: "32c",
-
-    name: "Sinister Shade Sword",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_longsword__32b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__32a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 50, 40, 0],
-
-    filterHelpers: {
-        nameLower: "sinistershadesword",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_longsword__33a: Longsword = {
-    category: "longsword",
-    id: "33a",
-
-    name: "Demon Halberd I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 80, 80, 0, 0, 0],
-    maxSharpness:  [70, 70, 80, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "demonhalberdi",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_longsword__33b: Longsword = {
-    category: "longsword",
-    id: "33b",
-
-    name: "Demon Halberd II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_longsword__33a],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 90, 100, 0, 0, 0],
-    maxSharpness:  [80, 80, 90, 110, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "demonhalberdii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_longsword__33c: Longsword = {
-    category: "longsword",
-    id: "33c",
-
-    name: "Great Demon Halberd",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__33b],
-            [__generated_ramp__thunder_boost_1, __generated_longsword__33a],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 90, 100, 10, 0, 0],
-    maxSharpness:  [70, 80, 90, 100, 40, 20, 0],
-
-    filterHelpers: {
-        nameLower: "greatdemonhalberd",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_longsword__34a: Longsword = {
-    category: "longsword",
-    id: "34a",
-
-    name: "Azure Elder Long Sword I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderlongswordi",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_longsword__34b: Longsword = {
-    category: "longsword",
-    id: "34b",
-
-    name: "Azure Elder Long Sword II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__34a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderlongswordii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_longsword__34c: Longsword = {
-    category: "longsword",
-    id: "34c",
-
-    name: "Abyssal Gale Sword",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_longsword__34b],
-            [__generated_ramp__defense_boost_1, __generated_longsword__34a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalgalesword",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_longsword__35a: Longsword = {
-    category: "longsword",
-    id: "35a",
-
-    name: "Thunderbolt Long Sword I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 38]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "thunderboltlongswordi",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_longsword__35b: Longsword = {
-    category: "longsword",
-    id: "35b",
-
-    name: "Abyssal Storm Sword",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__35a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalstormsword",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_longsword__36a: Longsword = {
-    category: "longsword",
-    id: "36a",
-
-    name: "Rookslayer Saber I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 80, 20, 0, 0],
-    maxSharpness:  [70, 60, 70, 80, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rookslayersaberi",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_longsword__36b: Longsword = {
-    category: "longsword",
-    id: "36b",
-
-    name: "Rookslayer Saber II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 70, 30, 0, 0],
-    maxSharpness:  [90, 80, 80, 70, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rookslayersaberii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_longsword__36c: Longsword = {
-    category: "longsword",
-    id: "36c",
-
-    name: "Bazel Varga Rookslayer",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_longsword__36b],
-            [__generated_ramp__blast_boost_2, __generated_longsword__36b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 60, 40, 0, 0],
-    maxSharpness:  [90, 80, 80, 60, 80, 10, 0],
-
-    filterHelpers: {
-        nameLower: "bazelvargarookslayer",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_longsword__37a: Longsword = {
-    category: "longsword",
-    id: "37a",
-
-    name: "Gelosteel Blade I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 43]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 40, 40, 0, 0],
-    maxSharpness:  [100, 90, 80, 40, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "icesteelbladei",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_longsword__37b: Longsword = {
-    category: "longsword",
-    id: "37b",
-
-    name: "Daora's Raid",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 45]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__37a],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__37a],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 40, 30, 10, 0],
-    maxSharpness:  [100, 90, 80, 40, 30, 60, 0],
-
-    filterHelpers: {
-        nameLower: "daora'sraid",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_longsword__38a: Longsword = {
-    category: "longsword",
-    id: "38a",
-
-    name: "Imperial Saber I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 70, 60, 30, 0, 0],
-    maxSharpness:  [100, 90, 70, 60, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "imperialsaberi",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_longsword__38b: Longsword = {
-    category: "longsword",
-    id: "38b",
-
-    name: "Imperial Shimmer",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 41]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__38a],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 70, 50, 40, 0, 0],
-    maxSharpness:  [100, 90, 70, 50, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "imperialshimmer",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_longsword__39a: Longsword = {
-    category: "longsword",
-    id: "39a",
-
-    name: "Mirage Finsword I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 15,
-    defense: 10,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [100, 70, 50, 50, 30, 50, 0],
-
-    filterHelpers: {
-        nameLower: "miragefinswordi",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_longsword__39b: Longsword = {
-    category: "longsword",
-    id: "39b",
-
-    name: "Phantom Mirage",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 15,
-    defense: 10,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__39a],
-        ],
-    ],
-
-    baseSharpness: [100, 100, 50, 60, 40, 0, 0],
-    maxSharpness:  [100, 100, 50, 60, 40, 50, 0],
-
-    filterHelpers: {
-        nameLower: "phantommirage",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_longsword__40a: Longsword = {
-    category: "longsword",
-    id: "40a",
-
-    name: "Redwing Long Sword I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    filterHelpers: {
-        nameLower: "redwinglongswordi",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_longsword__40b: Longsword = {
-    category: "longsword",
-    id: "40b",
-
-    name: "Reddnaught Blade",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 39]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    filterHelpers: {
-        nameLower: "reddnaughtblade",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_longsword__41a: Longsword = {
-    category: "longsword",
-    id: "41a",
-
-    name: "Cawscythe I",
-    treeName: "Death Stench Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 50, 40, 0, 0, 0],
-    maxSharpness:  [60, 50, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cawscythei",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_longsword__41b: Longsword = {
-    category: "longsword",
-    id: "41b",
-
-    name: "Cawscythe II",
-    treeName: "Death Stench Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__41a],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 60, 60, 0, 0, 0],
-    maxSharpness:  [50, 80, 60, 90, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cawscytheii",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_longsword__41c: Longsword = {
-    category: "longsword",
-    id: "41c",
-
-    name: "Cawscythe III",
-    treeName: "Death Stench Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__dragon_boost_1, __generated_longsword__41b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__41a],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 60, 60, 20, 0, 0],
-    maxSharpness:  [80, 80, 60, 60, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cawscytheiii",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_longsword__41d: Longsword = {
-    category: "longsword",
-    id: "41d",
-
-    name: "Squawkscythe",
-    treeName: "Death Stench Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_longsword__41c],
-            [__generated_ramp__dragon_boost_1, __generated_longsword__41b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__41a],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 70, 60, 30, 0, 0],
-    maxSharpness:  [100, 90, 70, 60, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "squawkscythe",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_longsword__42a: Longsword = {
-    category: "longsword",
-    id: "42a",
-
-    name: "Hand-Me-Down Sword I",
-    treeName: "Hand-Me-Down Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 7]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 100, 40, 0, 0, 0],
-    maxSharpness:  [50, 60, 100, 70, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hand-me-downswordi",
-        treeNameLower: "hand-me-downtree",
-    },
-};
-
-const __generated_longsword__42b: Longsword = {
-    category: "longsword",
-    id: "42b",
-
-    name: "Hand-Me-Down Sword II",
-    treeName: "Hand-Me-Down Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__42a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__42a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__42a],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 80, 70, 30, 0, 0],
-    maxSharpness:  [60, 60, 80, 70, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "hand-me-downswordii",
-        treeNameLower: "hand-me-downtree",
-    },
-};
-
-const __generated_longsword__42c: Longsword = {
-    category: "longsword",
-    id: "42c",
-
-    name: "Kamura's Inheritance",
-    treeName: "Hand-Me-Down Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_3, __generated_longsword__42b],
-            [__generated_ramp__attack_boost_2, __generated_longsword__42a],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__42a],
-            [__generated_ramp__defense_boost_1, __generated_longsword__42a],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 70, 80, 50, 0, 0],
-    maxSharpness:  [70, 80, 70, 80, 50, 50, 0],
-
-    filterHelpers: {
-        nameLower: "kamura'sinheritance",
-        treeNameLower: "hand-me-downtree",
-    },
-};
-
-const __generated_longsword__43a: Longsword = {
-    category: "longsword",
-    id: "43a",
-
-    name: "Azure Star Blade I",
-    treeName: "<TODO: Find out the name of this tree.>",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__water_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 50, 120, 20, 10, 0],
-    maxSharpness:  [50, 100, 50, 120, 20, 60, 0],
-
-    filterHelpers: {
-        nameLower: "azurestarbladei",
-        treeNameLower: "<todo:findoutthenameofthistree.>",
-    },
-};
-
-const __generated_longsword__43b: Longsword = {
-    category: "longsword",
-    id: "43b",
-
-    name: "Azure Star \"Dragão Dance\"",
-    treeName: "<TODO: Find out the name of this tree.>",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__water_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 100, 50, 100, 30, 20, 0],
-    maxSharpness:  [50, 100, 50, 100, 30, 70, 0],
-
-    filterHelpers: {
-        nameLower: "azurestar\"dragondance\"",
-        treeNameLower: "<todo:findoutthenameofthistree.>",
-    },
-};
-
-const __generated_longsword__ra: Longsword = {
-    category: "longsword",
-    id: "ra",
-
-    name: "Rampage Blade I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagebladei",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_longsword__rb: Longsword = {
-    category: "longsword",
-    id: "rb",
-
-    name: "Rampage Blade II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagebladeii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_longsword__rc: Longsword = {
-    category: "longsword",
-    id: "rc",
-
-    name: "Rampage Blade III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_longsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_longsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagebladeiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_longsword__rd: Longsword = {
-    category: "longsword",
-    id: "rd",
-
-    name: "Rampage Blade IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_longsword__rc],
-            [__generated_ramp__attack_boost_1, __generated_longsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_longsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_longsword__rc],
-            [__generated_ramp__water_1, __generated_longsword__rc],
-            [__generated_ramp__thunder_1, __generated_longsword__rc],
-            [__generated_ramp__ice_1, __generated_longsword__rc],
-            [__generated_ramp__dragon_1, __generated_longsword__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampagebladeiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_longsword__re: Longsword = {
-    category: "longsword",
-    id: "re",
-
-    name: "Rampage Blade V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_longsword__rd],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__rd],
-            [__generated_ramp__defense_boost_2, __generated_longsword__rd],
-            [__generated_ramp__elemental_boost_1, __generated_longsword__rc],
-            [__generated_ramp__attack_boost_1, __generated_longsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_longsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_longsword__rd],
-            [__generated_ramp__water_2, __generated_longsword__rd],
-            [__generated_ramp__thunder_2, __generated_longsword__rd],
-            [__generated_ramp__ice_2, __generated_longsword__rd],
-            [__generated_ramp__dragon_2, __generated_longsword__rd],
-            [__generated_ramp__fire_1, __generated_longsword__rc],
-            [__generated_ramp__water_1, __generated_longsword__rc],
-            [__generated_ramp__thunder_1, __generated_longsword__rc],
-            [__generated_ramp__ice_1, __generated_longsword__rc],
-            [__generated_ramp__dragon_1, __generated_longsword__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rampagebladev",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_longsword__rf: Longsword = {
-    category: "longsword",
-    id: "rf",
-
-    name: "Rampage Blade S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_3, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_longsword__re],
-            [__generated_ramp__elemental_boost_2, __generated_longsword__re],
-            [__generated_ramp__affinity_boost_3, __generated_longsword__re],
-            [__generated_ramp__attack_boost_2, __generated_longsword__rd],
-            [__generated_ramp__affinity_boost_2, __generated_longsword__rd],
-            [__generated_ramp__defense_boost_2, __generated_longsword__rd],
-            [__generated_ramp__elemental_boost_1, __generated_longsword__rc],
-            [__generated_ramp__attack_boost_1, __generated_longsword__rb],
-            [__generated_ramp__affinity_boost_1, __generated_longsword__rb],
-            [__generated_ramp__defense_boost_1, __generated_longsword__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_longsword__re],
-            [__generated_ramp__paralysis_1, __generated_longsword__re],
-            [__generated_ramp__sleep_1, __generated_longsword__re],
-            [__generated_ramp__blast_1, __generated_longsword__re],
-            [__generated_ramp__fire_2, __generated_longsword__rd],
-            [__generated_ramp__water_2, __generated_longsword__rd],
-            [__generated_ramp__thunder_2, __generated_longsword__rd],
-            [__generated_ramp__ice_2, __generated_longsword__rd],
-            [__generated_ramp__dragon_2, __generated_longsword__rd],
-            [__generated_ramp__fire_1, __generated_longsword__rc],
-            [__generated_ramp__water_1, __generated_longsword__rc],
-            [__generated_ramp__thunder_1, __generated_longsword__rc],
-            [__generated_ramp__ice_1, __generated_longsword__rc],
-            [__generated_ramp__dragon_1, __generated_longsword__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampageblades",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"longsword","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Blade I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0]},{"id":"1b","name":"Kamura Blade II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0]},{"id":"1c","name":"Kamura Blade III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0]},{"id":"1d","name":"Kamura Blade IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"1e","name":"Kamura Blade V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,80,0,0]},{"id":"1f","name":"Kamura Ninja Blade","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0]}]],["Zinogre Tree",[{"id":"2a","name":"Usurper Boltslicer I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,70,50,50,0,0,0],"maxSharpness":[80,70,50,100,0,0,0]},{"id":"2b","name":"Usurper Boltslicer II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",31]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","2a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,30,100,80,30,0,0],"maxSharpness":[60,30,100,80,60,20,0]},{"id":"2c","name":"Despot Boltbreaker","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",34]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","2b"],["attack_boost_1","2a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,40,120,90,40,0,0],"maxSharpness":[60,40,120,90,60,30,0]}]],["Aknosom Tree",[{"id":"3a","name":"Aknosom Sabre I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",13]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,50,70,50,0,0,0],"maxSharpness":[30,50,70,100,0,0,0]},{"id":"3b","name":"Aknosom Sabre II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",19]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["fireblight_exploit",null],["attack_boost_1","3a"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,50,110,40,20,0,0],"maxSharpness":[30,50,110,40,60,10,0]},{"id":"3c","name":"Daybreak Blade","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",26]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["fire_boost_1","3b"],["attack_boost_1","3a"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,50,120,70,30,0,0],"maxSharpness":[30,50,120,70,60,20,0]}]],["Lagombi Tree",[{"id":"4a","name":"Ivory Rabbit I","rarity":1,"endlineTag":"","attack":100,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["ice",10]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,70,60,0,0,0,0],"maxSharpness":[70,70,80,30,0,0,0]},{"id":"4b","name":"Ivory Rabbit II","rarity":2,"endlineTag":"","attack":110,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["ice",12]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["small_monster_exploit",null],["ice_boost_1","4a"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,60,90,30,0,0,0],"maxSharpness":[70,60,90,80,0,0,0]},{"id":"4c","name":"Gelod Rabbit","rarity":4,"endlineTag":"hr","attack":180,"affinity":-10,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["dulling_strike",null],["attack_boost_1","4b"],["small_monster_exploit","4b"],["ice_boost_1","4a"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[60,30,140,70,0,0,0],"maxSharpness":[60,30,140,70,40,10,0]}]],["Long Sword Tree",[{"id":"5a","name":"Guardian Sword I","rarity":1,"endlineTag":"","attack":90,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,80,80,0,0,0,0],"maxSharpness":[90,80,80,50,0,0,0]},{"id":"5b","name":"Guardian Sword II","rarity":2,"endlineTag":"","attack":100,"affinity":5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[50,80,50,70,0,0,0],"maxSharpness":[50,80,50,110,10,0,0]},{"id":"5c","name":"Imperial Sword","rarity":4,"endlineTag":"hr","attack":140,"affinity":10,"defense":0,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["affinity_boost_2","5b"],["defense_boost_2","5b"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[40,50,70,90,50,0,0],"maxSharpness":[40,50,70,90,80,20,0]}]],["Barroth Tree",[{"id":"6a","name":"Castello Saif I","rarity":2,"endlineTag":"","attack":120,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["affinity_boost_2","5a"],["defense_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[60,60,130,0,0,0,0],"maxSharpness":[60,60,130,50,0,0,0]},{"id":"6b","name":"Castello Saif II","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","6a"],["affinity_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[70,60,130,40,0,0,0],"maxSharpness":[70,60,130,80,10,0,0]},{"id":"6c","name":"Castellum Long Sword","rarity":5,"endlineTag":"hr","attack":200,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","6b"],["defense_boost_1","6a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[60,50,130,100,10,0,0],"maxSharpness":[60,50,130,100,20,40,0]}]],["Basarios Tree",[{"id":"7a","name":"Gigant Makra I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":20,"decoSlots":[],"eleStat":[["fire",12]],"rampSkills":[[["defense_boost_1",null],["fire_boost_1",null],["dulling_strike",null],["affinity_boost_1","6a"],["brutal_strike","6a"],["affinity_boost_2","5a"],["defense_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[100,80,60,10,0,0,0],"maxSharpness":[100,80,60,60,0,0,0]},{"id":"7b","name":"Gigant Makra II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":20,"decoSlots":[],"eleStat":[["fire",18]],"rampSkills":[[["defense_boost_1",null],["fire_boost_2",null],["dulling_strike",null],["fire_boost_1","7a"],["affinity_boost_1","6a"],["brutal_strike","6a"],["affinity_boost_2","5a"],["defense_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[110,100,70,20,0,0,0],"maxSharpness":[110,100,70,60,10,0,0]},{"id":"7c","name":"Titanic Makra","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":20,"decoSlots":[1],"eleStat":[["fire",22]],"rampSkills":[[["defense_boost_2",null],["fire_boost_3",null],["dulling_strike",null],["defense_boost_1","7b"],["fire_boost_2","7b"],["fire_boost_1","7a"],["affinity_boost_1","6a"],["brutal_strike","6a"],["affinity_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[110,100,90,50,0,0,0],"maxSharpness":[110,100,90,80,20,0,0]}]],["Almudron Tree",[{"id":"8a","name":"Almudron Blade I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",33]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["defense_boost_1","7a"],["fire_boost_1","7a"],["dulling_strike","7a"],["affinity_boost_1","6a"],["brutal_strike","6a"],["affinity_boost_2","5a"],["defense_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[50,50,100,50,0,0,0],"maxSharpness":[50,50,100,80,20,0,0]},{"id":"8b","name":"Almudron Blade II","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",41]],"rampSkills":[[["attack_boost_3",null],["water_boost_1",null],["element_exploit",null],["attack_boost_2","8a"],["defense_boost_1","7a"],["fire_boost_1","7a"],["dulling_strike","7a"],["affinity_boost_1","6a"],["brutal_strike","6a"],["affinity_boost_2","5a"],["defense_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[60,60,80,60,40,0,0],"maxSharpness":[60,60,80,60,90,0,0]},{"id":"8c","name":"Doom Bringer Blade","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",48]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["element_exploit",null],["water_boost_1","8b"],["attack_boost_2","8a"],["defense_boost_1","7a"],["fire_boost_1","7a"],["dulling_strike","7a"],["affinity_boost_1","6a"],["brutal_strike","6a"],["affinity_boost_2","5a"],["defense_boost_2","5a"],["silkbind_boost","5a"],["attack_boost_1","1b"]]],"baseSharpness":[60,60,80,90,60,0,0],"maxSharpness":[60,60,80,90,110,0,0]}]],["Ore Tree",[{"id":"9a","name":"Iron Katana I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0]},{"id":"9b","name":"Iron Katana II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,110,10,0,0,0]},{"id":"9c","name":"Iron Gospel","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","9b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,90,0,0,0]},{"id":"9d","name":"Keen Edge I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0]},{"id":"9e","name":"Keen Edge II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"baseSharpness":[100,90,90,50,20,0,0],"maxSharpness":[100,90,90,50,50,20,0]},{"id":"9f","name":"Julienne Blade","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"baseSharpness":[90,90,80,50,40,0,0],"maxSharpness":[90,90,80,50,60,30,0]}]],["Tigrex Tree",[{"id":"10a","name":"Tigrine Edge I","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["defense_boost_2","9d"],["silkbind_boost","9d"],["attack_boost_1","9b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0]},{"id":"10b","name":"Tigrine Edge II","rarity":6,"endlineTag":"","attack":220,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","10a"],["defense_boost_2","9d"],["silkbind_boost","9d"],["attack_boost_1","9b"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,60,20,0]},{"id":"10c","name":"Tigrine Need","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["brutal_strike",null],["affinity_boost_2","10b"],["affinity_boost_1","10a"],["defense_boost_2","9d"],["silkbind_boost","9d"],["attack_boost_1","9b"]]],"baseSharpness":[50,40,120,130,40,20,0],"maxSharpness":[50,40,120,130,40,20,0]}]],["Mizutsune Tree",[{"id":"11a","name":"Kakaru Kumo Naki I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",16]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["defense_boost_2","9c"],["attack_boost_1","9b"]]],"baseSharpness":[70,50,40,40,0,0,0],"maxSharpness":[70,50,40,60,30,0,0]},{"id":"11b","name":"Kakaru Kumo Naki II","rarity":5,"endlineTag":"","attack":190,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",19]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","11a"],["water_boost_1","11a"],["defense_boost_2","9c"],["attack_boost_1","9b"]]],"baseSharpness":[110,100,80,30,30,0,0],"maxSharpness":[110,100,80,30,60,20,0]},{"id":"11c","name":"Tamonowo","rarity":6,"endlineTag":"hr","attack":210,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["water",22]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","11b"],["affinity_boost_1","11a"],["water_boost_1","11a"],["defense_boost_2","9c"],["attack_boost_1","9b"]]],"baseSharpness":[100,90,70,50,40,0,0],"maxSharpness":[100,90,70,50,50,40,0]}]],["Nargacuga Tree",[{"id":"12a","name":"Hidden Saber I","rarity":3,"endlineTag":"","attack":120,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["defense_boost_2","9c"],["attack_boost_1","9b"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0]},{"id":"12b","name":"Hidden Saber II","rarity":5,"endlineTag":"","attack":160,"affinity":35,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","12a"],["defense_boost_2","9c"],["attack_boost_1","9b"]]],"baseSharpness":[70,70,40,120,50,0,0],"maxSharpness":[70,70,40,120,70,30,0]},{"id":"12c","name":"Deepest Night","rarity":6,"endlineTag":"hr","attack":180,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","12b"],["attack_boost_2","12a"],["defense_boost_2","9c"],["attack_boost_1","9b"]]],"baseSharpness":[70,40,100,90,70,30,0],"maxSharpness":[70,40,100,90,70,30,0]}]],["Thunder Tree",[{"id":"13a","name":"Eager Cleaver I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",18]],"rampSkills":[[["thunder_boost_1",null],["dulling_strike",null],["thunderblight_exploit",null],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[50,50,50,50,0,0,0],"maxSharpness":[50,50,50,100,0,0,0]},{"id":"13b","name":"Eager Cleaver II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",24]],"rampSkills":[[["thunder_boost_1",null],["dulling_strike",null],["thunderblight_exploit",null],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[40,40,90,80,0,0,0],"maxSharpness":[40,40,90,110,20,0,0]},{"id":"13c","name":"Devil Slicer","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",27]],"rampSkills":[[["thunder_boost_2",null],["dulling_strike",null],["thunderblight_exploit",null],["thunder_boost_1","13b"],["attack_boost_1","9b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[40,50,90,120,0,0,0],"maxSharpness":[40,50,90,120,50,0,0]}]],["Kulu-Ya-Ku Tree",[{"id":"14a","name":"Kulu Katana I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["spiribird_doubled",null],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[70,50,30,50,0,0,0],"maxSharpness":[70,50,30,100,0,0,0]},{"id":"14b","name":"Kulu Katana II","rarity":3,"endlineTag":"","attack":130,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["spiribird_doubled",null],["attack_boost_1","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[80,70,40,60,0,0,0],"maxSharpness":[80,70,40,90,20,0,0]},{"id":"14c","name":"Kulu Slicer","rarity":4,"endlineTag":"hr","attack":160,"affinity":20,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["spiribird_doubled",null],["affinity_boost_2","14b"],["attack_boost_1","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[80,80,70,60,10,0,0],"maxSharpness":[80,80,70,60,60,0,0]}]],["Ice Tree",[{"id":"15a","name":"Chillblade I","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",18]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["silkbind_boost",null],["attack_boost_2","14b"],["affinity_boost_2","14b"],["spiribird_doubled","14b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[60,60,60,50,20,0,0],"maxSharpness":[60,60,60,50,70,0,0]},{"id":"15b","name":"Chillblade II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["silkbind_boost",null],["ice_boost_1","15a"],["attack_boost_2","14b"],["affinity_boost_2","14b"],["spiribird_doubled","14b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[80,70,70,50,30,0,0],"maxSharpness":[80,70,70,50,70,10,0]},{"id":"15c","name":"Rimeblossom","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",27]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["silkbind_boost",null],["attack_boost_1","15b"],["ice_boost_1","15a"],["affinity_boost_2","14b"],["spiribird_doubled","14b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[70,70,70,50,40,0,0],"maxSharpness":[70,70,70,50,70,20,0]}]],["Rathian Tree",[{"id":"16a","name":"Wyvern Blade Verde I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",18]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","14a"],["spiribird_doubled","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[80,80,50,40,0,0,0],"maxSharpness":[80,80,50,90,0,0,0]},{"id":"16b","name":"Wyvern Blade Verde II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",20]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","16a"],["affinity_boost_2","14a"],["spiribird_doubled","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[80,80,60,60,20,0,0],"maxSharpness":[80,80,60,60,70,0,0]},{"id":"16c","name":"Wyvern Blade Holly","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["poison",22]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","16a"],["affinity_boost_2","14a"],["spiribird_doubled","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[100,90,70,70,20,0,0],"maxSharpness":[100,90,70,70,40,30,0]}]],["Rathalos Tree",[{"id":"17a","name":"Wyvern Blade Blood I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["poison_boost_1","16b"],["small_monster_exploit","16b"],["attack_boost_1","16a"],["affinity_boost_2","14a"],["spiribird_doubled","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[160,10,10,50,20,0,0],"maxSharpness":[160,10,10,50,70,0,0]},{"id":"17b","name":"Wyvern Blade Blood II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",32]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["poison_boost_1","16b"],["small_monster_exploit","16b"],["attack_boost_1","16a"],["affinity_boost_2","14a"],["spiribird_doubled","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[190,10,10,60,30,0,0],"maxSharpness":[190,10,10,60,80,0,0]},{"id":"17c","name":"Wyvern Blade Maple","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",36]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","17b"],["poison_boost_1","16b"],["small_monster_exploit","16b"],["attack_boost_1","16a"],["affinity_boost_2","14a"],["spiribird_doubled","14a"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[220,10,10,70,40,0,0],"maxSharpness":[220,10,10,70,90,0,0]}]],["Bone Tree",[{"id":"18a","name":"Serrated Jaw I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0]},{"id":"18b","name":"Serrated Jaw II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"18c","name":"Serrated Maw","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","18b"]]],"baseSharpness":[90,90,70,0,0,0,0],"maxSharpness":[90,90,110,10,0,0,0]},{"id":"18d","name":"Canine Katana I","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0]},{"id":"18e","name":"Canine Katana II","rarity":5,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[130,100,20,50,0,0,0],"maxSharpness":[130,100,20,80,20,0,0]},{"id":"18f","name":"Gnash Katana","rarity":6,"endlineTag":"hr","attack":230,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","18e"],["attack_boost_2","18d"],["defense_boost_1","18c"],["affinity_boost_1","18b"]]],"baseSharpness":[150,120,20,60,0,0,0],"maxSharpness":[150,120,20,60,50,0,0]}]],["Anjanath Tree",[{"id":"19a","name":"Flammenschwert I","rarity":3,"endlineTag":"","attack":140,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["fire",11]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[100,80,40,30,0,0,0],"maxSharpness":[100,80,40,80,0,0,0]},{"id":"19b","name":"Flammenschwert II","rarity":5,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",20]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","19a"],["attack_boost_2","18c"],["affinity_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[100,80,60,60,0,0,0],"maxSharpness":[100,80,60,60,50,0,0]},{"id":"19c","name":"Fervid Flammenschwert","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",24]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","19b"],["fire_boost_2","19b"],["fire_boost_1","19a"],["attack_boost_2","18c"],["defense_boost_1","18c"]]],"baseSharpness":[100,90,80,60,20,0,0],"maxSharpness":[100,90,80,60,70,0,0]}]],["Barioth Tree",[{"id":"20a","name":"Bastine Edge I","rarity":2,"endlineTag":"","attack":90,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0]},{"id":"20b","name":"Bastine Edge II","rarity":3,"endlineTag":"","attack":120,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",19]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","20a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[40,70,70,100,20,0,0],"maxSharpness":[40,70,70,100,70,0,0]},{"id":"20c","name":"Bastizan Edge","rarity":5,"endlineTag":"hr","attack":160,"affinity":35,"defense":0,"decoSlots":[1,1],"eleStat":[["ice",27]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","20b"],["attack_boost_2","20a"],["affinity_boost_1","18b"],["defense_boost_1","18b"]]],"baseSharpness":[50,70,80,90,50,10,0],"maxSharpness":[50,70,80,90,50,60,0]}]],["Wroggi Tree",[{"id":"21a","name":"Wroggi Sword I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",19]],"rampSkills":[[["affinity_boost_1",null],["poison_boost_1",null],["buddy_rally",null],["attack_boost_2","18b"],["defense_boost_1","18b"]]],"baseSharpness":[90,40,40,30,0,0,0],"maxSharpness":[90,40,40,80,0,0,0]},{"id":"21b","name":"Wroggi Sword II","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",23]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_1",null],["buddy_rally",null],["affinity_boost_1","21a"],["attack_boost_2","18b"],["defense_boost_1","18b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,100,0,0,0]},{"id":"21c","name":"Poison Barb","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",28]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_2",null],["buddy_rally",null],["poison_boost_1","21b"],["affinity_boost_1","21a"],["attack_boost_2","18b"],["defense_boost_1","18b"]]],"baseSharpness":[90,70,60,80,0,0,0],"maxSharpness":[90,70,60,100,30,0,0]}]],["Baggi Tree",[{"id":"22a","name":"Ananta Blade I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",9]],"rampSkills":[[["affinity_boost_1",null],["paralysis_boost_1",null],["buddy_rally",null],["attack_boost_2","18a"],["defense_boost_1","18a"]]],"baseSharpness":[100,40,40,20,0,0,0],"maxSharpness":[100,40,40,70,0,0,0]},{"id":"22b","name":"Ananta Blade II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",12]],"rampSkills":[[["affinity_boost_2",null],["paralysis_boost_1",null],["buddy_rally",null],["affinity_boost_1","22a"],["attack_boost_2","18a"],["defense_boost_1","18a"]]],"baseSharpness":[100,20,40,40,0,0,0],"maxSharpness":[100,20,40,90,0,0,0]},{"id":"22c","name":"Shadow Slasher","rarity":4,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["paralysis",17]],"rampSkills":[[["affinity_boost_2",null],["paralysis_boost_2",null],["buddy_rally",null],["paralysis_boost_1","22b"],["affinity_boost_1","22a"],["attack_boost_2","18a"],["defense_boost_1","18a"]]],"baseSharpness":[100,70,60,60,10,0,0],"maxSharpness":[100,70,60,60,60,0,0]}]],["Bone Scythe Tree",[{"id":"23a","name":"Bone Scythe I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[130,20,50,0,0,0,0],"maxSharpness":[130,20,100,0,0,0,0]},{"id":"23b","name":"Bone Scythe II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[120,20,60,0,0,0,0],"maxSharpness":[120,20,110,0,0,0,0]},{"id":"23c","name":"Bone Reaper","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null],["defense_boost_1","23b"]]],"baseSharpness":[100,20,80,0,0,0,0],"maxSharpness":[100,20,110,20,0,0,0]},{"id":"23d","name":"Spark Slicer I","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",19]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["thunder_boost_2",null],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[130,30,50,40,0,0,0],"maxSharpness":[130,30,50,90,0,0,0]},{"id":"23e","name":"Spark Slicer II","rarity":3,"endlineTag":"","attack":140,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",21]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["thunder_boost_2",null],["affinity_boost_1","23d"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[110,60,70,60,0,0,0],"maxSharpness":[110,60,70,90,20,0,0]},{"id":"23f","name":"Shocking Slicer","rarity":5,"endlineTag":"hr","attack":180,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["thunder",24]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["thunder_boost_3",null],["attack_boost_1","23e"],["affinity_boost_2","23e"],["thunder_boost_2","23e"],["affinity_boost_1","23d"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[150,100,30,30,40,0,0],"maxSharpness":[150,100,30,30,60,30,0]}]],["Jyuratodus Tree",[{"id":"24a","name":"Jyura Saber I","rarity":5,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",14]],"rampSkills":[[["affinity_boost_1",null],["water_boost_1",null],["brutal_strike",null],["attack_boost_1","23e"],["affinity_boost_2","23e"],["thunder_boost_2","23e"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[90,80,70,50,10,0,0],"maxSharpness":[90,80,70,50,60,0,0]},{"id":"24b","name":"Jyura Saber II","rarity":5,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",15]],"rampSkills":[[["affinity_boost_1",null],["water_boost_2",null],["brutal_strike",null],["water_boost_1","24a"],["attack_boost_1","23e"],["affinity_boost_2","23e"],["thunder_boost_2","23e"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[90,80,60,40,30,0,0],"maxSharpness":[90,80,60,40,80,0,0]},{"id":"24c","name":"Jyura Reaver","rarity":6,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["water",16]],"rampSkills":[[["affinity_boost_2",null],["water_boost_2",null],["brutal_strike",null],["affinity_boost_1","24b"],["water_boost_1","24a"],["attack_boost_1","23e"],["thunder_boost_2","23e"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[100,90,70,50,40,0,0],"maxSharpness":[100,90,70,50,70,20,0]}]],["Anteka Tree",[{"id":"25a","name":"Anteka Blade I","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":5,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["spiribird_doubled",null],["master_rider",null],["affinity_boost_2","23e"],["thunder_boost_2","23e"],["affinity_boost_1","23d"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[10,120,10,60,0,0,0],"maxSharpness":[10,120,10,110,0,0,0]},{"id":"25b","name":"Anteka Blade II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":10,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["spiribird_doubled",null],["master_rider",null],["affinity_boost_2","23e"],["thunder_boost_2","23e"],["affinity_boost_1","23d"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[10,160,10,60,10,0,0],"maxSharpness":[10,160,10,60,60,0,0]},{"id":"25c","name":"Anteka Rack","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":15,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["spiribird_doubled",null],["master_rider",null],["attack_boost_1","25b"],["affinity_boost_2","23e"],["thunder_boost_2","23e"],["affinity_boost_1","23d"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[10,230,10,70,30,0,0],"maxSharpness":[10,230,10,70,70,10,0]}]],["Somnacanth Tree",[{"id":"26a","name":"Frilled Slash I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",12]],"rampSkills":[[["attack_boost_1",null],["sleep_boost_1",null],["dulling_strike",null],["affinity_boost_1","23c"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[50,50,120,30,0,0,0],"maxSharpness":[50,50,120,80,0,0,0]},{"id":"26b","name":"Frilled Slash II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",15]],"rampSkills":[[["attack_boost_2",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_1","26a"],["affinity_boost_1","23c"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[40,60,110,40,0,0,0],"maxSharpness":[40,60,110,90,0,0,0]},{"id":"26c","name":"Illusory Frilled Slash","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["sleep",19]],"rampSkills":[[["attack_boost_3",null],["sleep_boost_1",null],["dulling_strike",null],["attack_boost_2","26b"],["attack_boost_1","26a"],["affinity_boost_1","23c"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[50,90,120,90,0,0,0],"maxSharpness":[50,90,120,110,30,0,0]}]],["Royal Ludroth Tree",[{"id":"27a","name":"Drowning Shaft I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["attack_boost_1","23c"],["affinity_boost_1","23c"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[50,70,50,30,0,0,0],"maxSharpness":[50,70,50,80,0,0,0]},{"id":"27b","name":"Drowning Shaft II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",23]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["attack_boost_1","23c"],["affinity_boost_1","23c"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"27c","name":"Douser Bardiche","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",28]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","27b"],["water_boost_1","27b"],["attack_boost_1","23c"],["affinity_boost_1","23c"],["defense_boost_2","23c"],["defense_boost_1","23b"]]],"baseSharpness":[40,40,100,100,20,0,0],"maxSharpness":[40,40,100,100,60,10,0]}]],["Arzuros Tree",[{"id":"28a","name":"Arzuros Naginata I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_1",null],["small_monster_exploit",null],["affinity_boost_1","23a"]]],"baseSharpness":[50,40,110,0,0,0,0],"maxSharpness":[50,40,160,0,0,0,0]},{"id":"28b","name":"Arzuros Naginata II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["small_monster_exploit",null],["attack_boost_1","28a"],["affinity_boost_1","23a"]]],"baseSharpness":[40,40,120,0,0,0,0],"maxSharpness":[40,40,120,50,0,0,0]},{"id":"28c","name":"Arzuros Strikequill","rarity":4,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_2","28b"],["defense_boost_1","28b"],["small_monster_exploit","28b"],["attack_boost_1","28a"],["affinity_boost_1","23a"]]],"baseSharpness":[40,40,40,130,0,0,0],"maxSharpness":[40,40,40,130,50,0,0]}]],["Izuchi Tree",[{"id":"29a","name":"Wind Thief Scimitar I","rarity":1,"endlineTag":"","attack":70,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_1","23a"],["defense_boost_1","23a"]]],"baseSharpness":[80,50,30,40,0,0,0],"maxSharpness":[80,50,30,90,0,0,0]},{"id":"29b","name":"Wind Thief Scimitar II","rarity":2,"endlineTag":"","attack":100,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","29a"],["attack_boost_1","23a"],["defense_boost_1","23a"]]],"baseSharpness":[80,50,20,50,0,0,0],"maxSharpness":[80,50,20,50,50,0,0]},{"id":"29c","name":"Gale Scimitar","rarity":4,"endlineTag":"hr","attack":140,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","29b"],["affinity_boost_1","29a"],["attack_boost_1","23a"],["defense_boost_1","23a"]]],"baseSharpness":[80,50,20,50,50,0,0],"maxSharpness":[80,50,20,50,50,50,0]}]],["Bone Scythe Tree 2",[{"id":"30a","name":"Dark Scythe I","rarity":4,"endlineTag":"","attack":180,"affinity":-15,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["dulling_strike",null],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["attack_boost_1","23a"],["defense_boost_1","23a"]]],"baseSharpness":[100,70,70,60,0,0,0],"maxSharpness":[100,70,70,90,20,0,0]},{"id":"30b","name":"Tormentor","rarity":5,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_3",null],["dulling_strike",null],["affinity_boost_1","30a"],["defense_boost_2","30a"],["small_monster_exploit","29b"],["buddy_rally","29b"],["attack_boost_1","23a"],["defense_boost_1","23a"]]],"baseSharpness":[100,80,50,70,0,0,0],"maxSharpness":[100,80,50,90,30,0,0]}]],["Poison Tree",[{"id":"31a","name":"Scythe of Menace I","rarity":5,"endlineTag":"","attack":170,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["poison",25]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["brutal_strike",null],["affinity_boost_1","30a"],["defense_boost_2","30a"],["dulling_strike","30a"],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["defense_boost_1","23a"]]],"baseSharpness":[40,40,150,50,20,0,0],"maxSharpness":[40,40,150,50,60,10,0]},{"id":"31b","name":"Scythe of Menace II","rarity":5,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["poison",29]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["brutal_strike",null],["affinity_boost_1","30a"],["defense_boost_2","30a"],["dulling_strike","30a"],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["defense_boost_1","23a"]]],"baseSharpness":[40,40,150,40,30,0,0],"maxSharpness":[40,40,150,40,60,20,0]},{"id":"31c","name":"Big Menacing Scythe","rarity":6,"endlineTag":"hr","attack":210,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["poison",34]],"rampSkills":[[["attack_boost_1",null],["poison_boost_2",null],["brutal_strike",null],["poison_boost_1","31b"],["affinity_boost_1","30a"],["defense_boost_2","30a"],["dulling_strike","30a"],["affinity_boost_2","29b"],["small_monster_exploit","29b"],["buddy_rally","29b"],["defense_boost_1","23a"]]],"baseSharpness":[40,40,190,40,40,0,0],"maxSharpness":[40,40,190,40,60,30,0]}]],["Magnamalo Tree",[{"id":"32a","name":"Sinister Long Sword I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",13]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0]},{"id":"32b","name":"Sinister Long Sword II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",16]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","32a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0]},{"id":"32c","name":"Sinister Shade Sword","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",23]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","32b"],["attack_boost_2","32a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,50,40,0]}]],["Rajang Tree",[{"id":"33a","name":"Demon Halberd I","rarity":5,"endlineTag":"","attack":190,"affinity":-10,"defense":0,"decoSlots":[],"eleStat":[["thunder",10]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[70,70,80,80,0,0,0],"maxSharpness":[70,70,80,110,20,0,0]},{"id":"33b","name":"Demon Halberd II","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",12]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","33a"]]],"baseSharpness":[80,80,90,100,0,0,0],"maxSharpness":[80,80,90,110,40,0,0]},{"id":"33c","name":"Great Demon Halberd","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",15]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","33b"],["thunder_boost_1","33a"]]],"baseSharpness":[70,80,90,100,10,0,0],"maxSharpness":[70,80,90,100,40,20,0]}]],["Ibushi Tree",[{"id":"34a","name":"Azure Elder Long Sword I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",10]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0]},{"id":"34b","name":"Azure Elder Long Sword II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",12]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","34a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0]},{"id":"34c","name":"Abyssal Gale Sword","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",13]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","34b"],["defense_boost_1","34a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0]}]],["Narwa Tree",[{"id":"35a","name":"Thunderbolt Long Sword I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",38]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0]},{"id":"35b","name":"Abyssal Storm Sword","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",42]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","35a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0]}]],["Bazelgeuse Tree",[{"id":"36a","name":"Rookslayer Saber I","rarity":6,"endlineTag":"","attack":200,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",13]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[70,60,70,80,20,0,0],"maxSharpness":[70,60,70,80,70,0,0]},{"id":"36b","name":"Rookslayer Saber II","rarity":6,"endlineTag":"","attack":210,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",15]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[90,80,80,70,30,0,0],"maxSharpness":[90,80,80,70,80,0,0]},{"id":"36c","name":"Bazel Varga Rookslayer","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[1],"eleStat":[["blast",17]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["brutal_strike",null],["defense_boost_1","36b"],["blast_boost_2","36b"]]],"baseSharpness":[90,80,80,60,40,0,0],"maxSharpness":[90,80,80,60,80,10,0]}]],["Kushala Daora Tree",[{"id":"37a","name":"Gelosteel Blade I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",43]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[100,90,80,40,40,0,0],"maxSharpness":[100,90,80,40,60,30,0]},{"id":"37b","name":"Daora\'s Raid","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",45]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","37a"],["affinity_boost_2","37a"]]],"baseSharpness":[100,90,80,40,30,10,0],"maxSharpness":[100,90,80,40,30,60,0]}]],["Teostra Tree",[{"id":"38a","name":"Imperial Saber I","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",35]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[100,90,70,60,30,0,0],"maxSharpness":[100,90,70,60,50,30,0]},{"id":"38b","name":"Imperial Shimmer","rarity":7,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",41]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","38a"]]],"baseSharpness":[100,90,70,50,40,0,0],"maxSharpness":[100,90,70,50,60,30,0]}]],["Chameleos Tree",[{"id":"39a","name":"Mirage Finsword I","rarity":6,"endlineTag":"","attack":210,"affinity":15,"defense":10,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[100,70,50,50,30,0,0],"maxSharpness":[100,70,50,50,30,50,0]},{"id":"39b","name":"Phantom Mirage","rarity":7,"endlineTag":"hr","attack":220,"affinity":15,"defense":10,"decoSlots":[2,1,1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","39a"]]],"baseSharpness":[100,100,50,60,40,0,0],"maxSharpness":[100,100,50,60,40,50,0]}]],["Valstrax Tree",[{"id":"40a","name":"Redwing Long Sword I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",35]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0]},{"id":"40b","name":"Reddnaught Blade","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",39]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0]}]],["Death Stench Tree",[{"id":"41a","name":"Cawscythe I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",20]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_1",null],["wyvern_exploit",null]]],"baseSharpness":[60,50,50,40,0,0,0],"maxSharpness":[60,50,50,90,0,0,0]},{"id":"41b","name":"Cawscythe II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",21]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_1",null],["wyvern_exploit",null],["attack_boost_2","41a"]]],"baseSharpness":[50,80,60,60,0,0,0],"maxSharpness":[50,80,60,90,20,0,0]},{"id":"41c","name":"Cawscythe III","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[["dragon",25]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_2",null],["wyvern_exploit",null],["dragon_boost_1","41b"],["attack_boost_2","41a"]]],"baseSharpness":[80,80,60,60,20,0,0],"maxSharpness":[80,80,60,60,70,0,0]},{"id":"41d","name":"Squawkscythe","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[["dragon",27]],"rampSkills":[[["attack_boost_4",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_3","41c"],["dragon_boost_1","41b"],["attack_boost_2","41a"]]],"baseSharpness":[100,90,70,60,30,0,0],"maxSharpness":[100,90,70,60,70,10,0]}]],["Hand-Me-Down Tree",[{"id":"42a","name":"Hand-Me-Down Sword I","rarity":3,"endlineTag":"","attack":120,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["fire",7]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[50,60,100,40,0,0,0],"maxSharpness":[50,60,100,70,20,0,0]},{"id":"42b","name":"Hand-Me-Down Sword II","rarity":5,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[3],"eleStat":[["fire",10]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["anti_aquatic_species",null],["attack_boost_2","42a"],["affinity_boost_1","42a"],["defense_boost_1","42a"]]],"baseSharpness":[60,60,80,70,30,0,0],"maxSharpness":[60,60,80,70,60,20,0]},{"id":"42c","name":"Kamura\'s Inheritance","rarity":7,"endlineTag":"hr","attack":190,"affinity":40,"defense":0,"decoSlots":[3],"eleStat":[["fire",15]],"rampSkills":[[["attack_boost_4",null],["anti_aerial_species",null],["anti_aquatic_species",null],["attack_boost_3","42b"],["attack_boost_2","42a"],["affinity_boost_1","42a"],["defense_boost_1","42a"]]],"baseSharpness":[70,80,70,80,50,0,0],"maxSharpness":[70,80,70,80,50,50,0]}]],["<TODO: Find out the name of this tree.>",[{"id":"43a","name":"Azure Star Blade I","rarity":6,"endlineTag":"","attack":170,"affinity":20,"defense":0,"decoSlots":[3],"eleStat":[["water",20]],"rampSkills":[[["affinity_boost_4",null],["water_boost_4",null],["anti_aerial_species",null]]],"baseSharpness":[50,100,50,120,20,10,0],"maxSharpness":[50,100,50,120,20,60,0]},{"id":"43b","name":"Azure Star \\"Drag\\u00e3o Dance\\"","rarity":7,"endlineTag":"hr","attack":180,"affinity":30,"defense":0,"decoSlots":[3],"eleStat":[["water",37]],"rampSkills":[[["affinity_boost_4",null],["water_boost_4",null],["anti_aerial_species",null]]],"baseSharpness":[50,100,50,100,30,20,0],"maxSharpness":[50,100,50,100,30,70,0]}]],["Rampage Tree",[{"id":"ra","name":"Rampage Blade I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"rb","name":"Rampage Blade II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"rc","name":"Rampage Blade III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"rd","name":"Rampage Blade IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0]},{"id":"re","name":"Rampage Blade V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0]},{"id":"rf","name":"Rampage Blade S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_3",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["elemental_boost_2","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0]}]]]}';
 
-export const longswordsArray: Readonly<Longsword[]> = [
-    __generated_longsword__1a,
-    __generated_longsword__1b,
-    __generated_longsword__1c,
-    __generated_longsword__1d,
-    __generated_longsword__1e,
-    __generated_longsword__1f,
-    __generated_longsword__2a,
-    __generated_longsword__2b,
-    __generated_longsword__2c,
-    __generated_longsword__3a,
-    __generated_longsword__3b,
-    __generated_longsword__3c,
-    __generated_longsword__4a,
-    __generated_longsword__4b,
-    __generated_longsword__4c,
-    __generated_longsword__5a,
-    __generated_longsword__5b,
-    __generated_longsword__5c,
-    __generated_longsword__6a,
-    __generated_longsword__6b,
-    __generated_longsword__6c,
-    __generated_longsword__7a,
-    __generated_longsword__7b,
-    __generated_longsword__7c,
-    __generated_longsword__8a,
-    __generated_longsword__8b,
-    __generated_longsword__8c,
-    __generated_longsword__9a,
-    __generated_longsword__9b,
-    __generated_longsword__9c,
-    __generated_longsword__9d,
-    __generated_longsword__9e,
-    __generated_longsword__9f,
-    __generated_longsword__10a,
-    __generated_longsword__10b,
-    __generated_longsword__10c,
-    __generated_longsword__11a,
-    __generated_longsword__11b,
-    __generated_longsword__11c,
-    __generated_longsword__12a,
-    __generated_longsword__12b,
-    __generated_longsword__12c,
-    __generated_longsword__13a,
-    __generated_longsword__13b,
-    __generated_longsword__13c,
-    __generated_longsword__14a,
-    __generated_longsword__14b,
-    __generated_longsword__14c,
-    __generated_longsword__15a,
-    __generated_longsword__15b,
-    __generated_longsword__15c,
-    __generated_longsword__16a,
-    __generated_longsword__16b,
-    __generated_longsword__16c,
-    __generated_longsword__17a,
-    __generated_longsword__17b,
-    __generated_longsword__17c,
-    __generated_longsword__18a,
-    __generated_longsword__18b,
-    __generated_longsword__18c,
-    __generated_longsword__18d,
-    __generated_longsword__18e,
-    __generated_longsword__18f,
-    __generated_longsword__19a,
-    __generated_longsword__19b,
-    __generated_longsword__19c,
-    __generated_longsword__20a,
-    __generated_longsword__20b,
-    __generated_longsword__20c,
-    __generated_longsword__21a,
-    __generated_longsword__21b,
-    __generated_longsword__21c,
-    __generated_longsword__22a,
-    __generated_longsword__22b,
-    __generated_longsword__22c,
-    __generated_longsword__23a,
-    __generated_longsword__23b,
-    __generated_longsword__23c,
-    __generated_longsword__23d,
-    __generated_longsword__23e,
-    __generated_longsword__23f,
-    __generated_longsword__24a,
-    __generated_longsword__24b,
-    __generated_longsword__24c,
-    __generated_longsword__25a,
-    __generated_longsword__25b,
-    __generated_longsword__25c,
-    __generated_longsword__26a,
-    __generated_longsword__26b,
-    __generated_longsword__26c,
-    __generated_longsword__27a,
-    __generated_longsword__27b,
-    __generated_longsword__27c,
-    __generated_longsword__28a,
-    __generated_longsword__28b,
-    __generated_longsword__28c,
-    __generated_longsword__29a,
-    __generated_longsword__29b,
-    __generated_longsword__29c,
-    __generated_longsword__30a,
-    __generated_longsword__30b,
-    __generated_longsword__31a,
-    __generated_longsword__31b,
-    __generated_longsword__31c,
-    __generated_longsword__32a,
-    __generated_longsword__32b,
-    __generated_longsword__32c,
-    __generated_longsword__33a,
-    __generated_longsword__33b,
-    __generated_longsword__33c,
-    __generated_longsword__34a,
-    __generated_longsword__34b,
-    __generated_longsword__34c,
-    __generated_longsword__35a,
-    __generated_longsword__35b,
-    __generated_longsword__36a,
-    __generated_longsword__36b,
-    __generated_longsword__36c,
-    __generated_longsword__37a,
-    __generated_longsword__37b,
-    __generated_longsword__38a,
-    __generated_longsword__38b,
-    __generated_longsword__39a,
-    __generated_longsword__39b,
-    __generated_longsword__40a,
-    __generated_longsword__40b,
-    __generated_longsword__41a,
-    __generated_longsword__41b,
-    __generated_longsword__41c,
-    __generated_longsword__41d,
-    __generated_longsword__42a,
-    __generated_longsword__42b,
-    __generated_longsword__42c,
-    __generated_longsword__43a,
-    __generated_longsword__43b,
-    __generated_longsword__ra,
-    __generated_longsword__rb,
-    __generated_longsword__rc,
-    __generated_longsword__rd,
-    __generated_longsword__re,
-    __generated_longsword__rf,
-];
+export const longswordsArray: Readonly<Longsword[]> = loadWeaponPayload<Longsword>(payload);
@@ -36,5995 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type SwitchAxe,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__blast_boost_3,
-    __generated_ramp__boost_equipped_coating,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__chameleos_soul,
-    __generated_ramp__coating_switch_boost,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_1,
-    __generated_ramp__dragon_boost_2,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_boost_2,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__phial_dragon_1,
-    __generated_ramp__phial_dragon_2,
-    __generated_ramp__phial_dragon_3,
-    __generated_ramp__phial_element,
-    __generated_ramp__phial_exhaust_1,
-    __generated_ramp__phial_exhaust_2,
-    __generated_ramp__phial_exhaust_3,
-    __generated_ramp__phial_paralysis_1,
-    __generated_ramp__phial_paralysis_2,
-    __generated_ramp__phial_paralysis_3,
-    __generated_ramp__phial_poison_1,
-    __generated_ramp__phial_poison_2,
-    __generated_ramp__phial_poison_3,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__sleep_boost_2,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunder_boost_3,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_switchaxe__1a: SwitchAxe = {
-    category: "switchaxe",
-    id: "1a",
-
-    name: "Kamura Iron Axe I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironaxei",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_switchaxe__1b: SwitchAxe = {
-    category: "switchaxe",
-    id: "1b",
-
-    name: "Kamura Iron Axe II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironaxeii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_switchaxe__1c: SwitchAxe = {
-    category: "switchaxe",
-    id: "1c",
-
-    name: "Kamura Iron Axe III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironaxeiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_switchaxe__1d: SwitchAxe = {
-    category: "switchaxe",
-    id: "1d",
-
-    name: "Kamura Iron Axe IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironaxeiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_switchaxe__1e: SwitchAxe = {
-    category: "switchaxe",
-    id: "1e",
-
-    name: "Kamura Iron Axe V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__1d],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraironaxev",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_switchaxe__1f: SwitchAxe = {
-    category: "switchaxe",
-    id: "1f",
-
-    name: "Kamura Ninja Axe",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_switchaxe__1e],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__1d],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "kamuraninjaaxe",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_switchaxe__2a: SwitchAxe = {
-    category: "switchaxe",
-    id: "2a",
-
-    name: "Fond Farewell I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 40, 60, 0, 0, 0],
-    maxSharpness:  [50, 50, 40, 80, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "fondfarewelli",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_switchaxe__2b: SwitchAxe = {
-    category: "switchaxe",
-    id: "2b",
-
-    name: "Fond Farewell II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__2a],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__2a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 80, 60, 30, 0, 0],
-    maxSharpness:  [90, 90, 80, 60, 60, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "fondfarewellii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_switchaxe__2c: SwitchAxe = {
-    category: "switchaxe",
-    id: "2c",
-
-    name: "Parting Slice",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__2b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__2a],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__2a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 70, 60, 60, 0, 0],
-    maxSharpness:  [80, 80, 70, 60, 60, 50, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "partingslice",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_switchaxe__3a: SwitchAxe = {
-    category: "switchaxe",
-    id: "3a",
-
-    name: "Rath Flamesplitter I",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 100, 30, 40, 0, 0, 0],
-    maxSharpness:  [80, 100, 30, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rathflamesplitteri",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_switchaxe__3b: SwitchAxe = {
-    category: "switchaxe",
-    id: "3b",
-
-    name: "Rath Flamesplitter II",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 30, 50, 0, 0, 0],
-    maxSharpness:  [90, 80, 30, 90, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rathflamesplitterii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_switchaxe__3c: SwitchAxe = {
-    category: "switchaxe",
-    id: "3c",
-
-    name: "Rath Flamesplitter III",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [120, 120, 30, 70, 10, 0, 0],
-    maxSharpness:  [120, 120, 30, 70, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rathflamesplitteriii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_switchaxe__3d: SwitchAxe = {
-    category: "switchaxe",
-    id: "3d",
-
-    name: "Rath Blaze Splitter",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__3c],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 100, 30, 90, 30, 0, 0],
-    maxSharpness:  [100, 100, 30, 90, 60, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rathblazesplitter",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_switchaxe__4a: SwitchAxe = {
-    category: "switchaxe",
-    id: "4a",
-
-    name: "Wheel Axe I",
-    treeName: "Bishaten Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 140, 40, 40, 0, 0, 0],
-    maxSharpness:  [30, 140, 40, 80, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "dragon_phial",
-        phialValue: 20,
-    },
-
-    filterHelpers: {
-        nameLower: "wheelaxei",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_switchaxe__4b: SwitchAxe = {
-    category: "switchaxe",
-    id: "4b",
-
-    name: "Wheel Axe II",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__4a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [20, 150, 60, 40, 30, 0, 0],
-    maxSharpness:  [20, 150, 60, 40, 40, 40, 0],
-
-    switchaxeStats: {
-        phialType: "dragon_phial",
-        phialValue: 23,
-    },
-
-    filterHelpers: {
-        nameLower: "wheelaxeii",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_switchaxe__4c: SwitchAxe = {
-    category: "switchaxe",
-    id: "4c",
-
-    name: "Axe of Wisdom",
-    treeName: "Bishaten Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__4a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__1c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 150, 80, 50, 40, 0, 0],
-    maxSharpness:  [30, 150, 80, 50, 40, 50, 0],
-
-    switchaxeStats: {
-        phialType: "dragon_phial",
-        phialValue: 25,
-    },
-
-    filterHelpers: {
-        nameLower: "axeofwisdom",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_switchaxe__5a: SwitchAxe = {
-    category: "switchaxe",
-    id: "5a",
-
-    name: "Delex Sail I",
-    treeName: "Delex Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 90, 50, 30, 0, 0, 0],
-    maxSharpness:  [30, 90, 50, 70, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "delexsaili",
-        treeNameLower: "delextree",
-    },
-};
-
-const __generated_switchaxe__5b: SwitchAxe = {
-    category: "switchaxe",
-    id: "5b",
-
-    name: "Delex Sail II",
-    treeName: "Delex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 100, 70, 50, 0, 0, 0],
-    maxSharpness:  [30, 100, 70, 60, 40, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "delexsailii",
-        treeNameLower: "delextree",
-    },
-};
-
-const __generated_switchaxe__5c: SwitchAxe = {
-    category: "switchaxe",
-    id: "5c",
-
-    name: "Delex Cleaver",
-    treeName: "Delex Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__5b],
-            [__generated_ramp__water_boost_2, __generated_switchaxe__5b],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 110, 80, 50, 30, 0, 0],
-    maxSharpness:  [30, 110, 80, 50, 70, 10, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "delexcleaver",
-        treeNameLower: "delextree",
-    },
-};
-
-const __generated_switchaxe__6a: SwitchAxe = {
-    category: "switchaxe",
-    id: "6a",
-
-    name: "Khezu Axe I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1b],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 30, 40, 0, 0, 0],
-    maxSharpness:  [70, 60, 30, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "khezuaxei",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_switchaxe__6b: SwitchAxe = {
-    category: "switchaxe",
-    id: "6b",
-
-    name: "Khezu Axe II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__6a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1b],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 100, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "khezuaxeii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_switchaxe__6c: SwitchAxe = {
-    category: "switchaxe",
-    id: "6c",
-
-    name: "Khezu Cleaver",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__6b],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__6b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__6a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__1b],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 60, 50, 30, 0, 0],
-    maxSharpness:  [90, 70, 60, 50, 80, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "khezucleaver",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_switchaxe__7a: SwitchAxe = {
-    category: "switchaxe",
-    id: "7a",
-
-    name: "Arzuros Axe I",
-    treeName: "Arzuros Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 60, 50, 0, 0, 0, 0],
-    maxSharpness:  [90, 60, 80, 20, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "poison_phial",
-        phialValue: 23,
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosaxei",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_switchaxe__7b: SwitchAxe = {
-    category: "switchaxe",
-    id: "7b",
-
-    name: "Arzuros Axe II",
-    treeName: "Arzuros Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__7a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [80, 50, 70, 0, 0, 0, 0],
-    maxSharpness:  [80, 50, 70, 50, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "poison_phial",
-        phialValue: 26,
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosaxeii",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_switchaxe__7c: SwitchAxe = {
-    category: "switchaxe",
-    id: "7c",
-
-    name: "Arzuros Revelax",
-    treeName: "Arzuros Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__7b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__7b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__7b],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__7a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 40, 90, 60, 0, 0, 0],
-    maxSharpness:  [110, 40, 90, 60, 50, 0, 0],
-
-    switchaxeStats: {
-        phialType: "poison_phial",
-        phialValue: 29,
-    },
-
-    filterHelpers: {
-        nameLower: "arzurosrevelax",
-        treeNameLower: "arzurostree",
-    },
-};
-
-const __generated_switchaxe__8a: SwitchAxe = {
-    category: "switchaxe",
-    id: "8a",
-
-    name: "Amber Slash I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__7b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__7b],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 80, 70, 0, 0, 0],
-    maxSharpness:  [50, 50, 80, 100, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "amberslashi",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_switchaxe__8b: SwitchAxe = {
-    category: "switchaxe",
-    id: "8b",
-
-    name: "Amber Slash II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__8a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__7b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__7b],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 80, 70, 10, 0, 0],
-    maxSharpness:  [50, 40, 80, 70, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "amberslashii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_switchaxe__8c: SwitchAxe = {
-    category: "switchaxe",
-    id: "8c",
-
-    name: "Amber Slash III",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__8a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__7b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__7b],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 100, 100, 30, 0, 0],
-    maxSharpness:  [50, 70, 100, 100, 70, 10, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "amberslashiii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_switchaxe__8d: SwitchAxe = {
-    category: "switchaxe",
-    id: "8d",
-
-    name: "Amber Hoarfrost",
-    treeName: "Barioth Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 29]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__8c],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__8a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__7b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__7b],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__7a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 70, 30, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "amberhoarfrost",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_switchaxe__9a: SwitchAxe = {
-    category: "switchaxe",
-    id: "9a",
-
-    name: "Proto Iron Axe I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 70,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 10,
-    },
-
-    filterHelpers: {
-        nameLower: "protoironaxei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_switchaxe__9b: SwitchAxe = {
-    category: "switchaxe",
-    id: "9b",
-
-    name: "Proto Iron Axe II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 0, 0, 0, 0],
-    maxSharpness:  [70, 60, 110, 10, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 12,
-    },
-
-    filterHelpers: {
-        nameLower: "protoironaxeii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_switchaxe__9c: SwitchAxe = {
-    category: "switchaxe",
-    id: "9c",
-
-    name: "Improved Steel Axe",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 14,
-    },
-
-    filterHelpers: {
-        nameLower: "improvedsteelaxe",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_switchaxe__9d: SwitchAxe = {
-    category: "switchaxe",
-    id: "9d",
-
-    name: "Elite Switch Axe I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 50, 0, 0, 0],
-    maxSharpness:  [80, 70, 50, 80, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 17,
-    },
-
-    filterHelpers: {
-        nameLower: "eliteswitchaxei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_switchaxe__9e: SwitchAxe = {
-    category: "switchaxe",
-    id: "9e",
-
-    name: "Elite Switch Axe II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 50, 20, 0, 0],
-    maxSharpness:  [80, 70, 80, 50, 50, 20, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 18,
-    },
-
-    filterHelpers: {
-        nameLower: "eliteswitchaxeii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_switchaxe__9f: SwitchAxe = {
-    category: "switchaxe",
-    id: "9f",
-
-    name: "Czar Switch Axe",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 50, 30, 0, 0],
-    maxSharpness:  [100, 90, 80, 50, 40, 40, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 22,
-    },
-
-    filterHelpers: {
-        nameLower: "czarswitchaxe",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_switchaxe__10a: SwitchAxe = {
-    category: "switchaxe",
-    id: "10a",
-
-    name: "Limus Os I",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_3, __generated_switchaxe__9e],
-            [__generated_ramp__silkbind_boost, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 70, 50, 0, 0, 0],
-    maxSharpness:  [100, 80, 70, 90, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "limusosi",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_switchaxe__10b: SwitchAxe = {
-    category: "switchaxe",
-    id: "10b",
-
-    name: "Limus Os II",
-    treeName: "Jyuratodus Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__10a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_3, __generated_switchaxe__9e],
-            [__generated_ramp__silkbind_boost, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 100, 80, 70, 0, 0, 0],
-    maxSharpness:  [100, 100, 80, 70, 50, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "limusosii",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_switchaxe__10c: SwitchAxe = {
-    category: "switchaxe",
-    id: "10c",
-
-    name: "Luto Ascia",
-    treeName: "Jyuratodus Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__10b],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__10a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_3, __generated_switchaxe__9e],
-            [__generated_ramp__silkbind_boost, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [100, 100, 70, 80, 0, 0, 0],
-    maxSharpness:  [100, 100, 70, 80, 40, 10, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "lutoascia",
-        treeNameLower: "jyuratodustree",
-    },
-};
-
-const __generated_switchaxe__11a: SwitchAxe = {
-    category: "switchaxe",
-    id: "11a",
-
-    name: "Dragãomaiden Axe I",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_3, __generated_switchaxe__9e],
-            [__generated_ramp__silkbind_boost, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 80, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 100, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "dragonmaidenaxei",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_switchaxe__11b: SwitchAxe = {
-    category: "switchaxe",
-    id: "11b",
-
-    name: "Dragãomaiden Axe II",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__11a],
-            [__generated_ramp__defense_boost_3, __generated_switchaxe__9e],
-            [__generated_ramp__silkbind_boost, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 110, 20, 0, 0],
-    maxSharpness:  [60, 60, 100, 110, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "dragonmaidenaxeii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_switchaxe__11c: SwitchAxe = {
-    category: "switchaxe",
-    id: "11c",
-
-    name: "Gr\u00ed\u00f0r's Landmaker",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__11a],
-            [__generated_ramp__defense_boost_3, __generated_switchaxe__9e],
-            [__generated_ramp__silkbind_boost, __generated_switchaxe__9e],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 110, 70, 40, 0, 0],
-    maxSharpness:  [90, 40, 110, 70, 70, 20, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "gr\u00ed\u00f0r'slandmaker",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_switchaxe__12a: SwitchAxe = {
-    category: "switchaxe",
-    id: "12a",
-
-    name: "General's Strongaxe I",
-    treeName: "Ore Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 70, 40, 30, 0, 0],
-    maxSharpness:  [80, 80, 70, 40, 80, 0, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 25,
-    },
-
-    filterHelpers: {
-        nameLower: "general'sstrongaxei",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_switchaxe__12b: SwitchAxe = {
-    category: "switchaxe",
-    id: "12b",
-
-    name: "General's Strongaxe II",
-    treeName: "Ore Tree 2",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__12a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 70, 50, 40, 0, 0],
-    maxSharpness:  [70, 70, 70, 50, 80, 10, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 28,
-    },
-
-    filterHelpers: {
-        nameLower: "general'sstrongaxeii",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_switchaxe__12c: SwitchAxe = {
-    category: "switchaxe",
-    id: "12c",
-
-    name: "Conqueress",
-    treeName: "Ore Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__12b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__12a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9d],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 80, 60, 50, 0, 0],
-    maxSharpness:  [80, 80, 80, 60, 80, 20, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 30,
-    },
-
-    filterHelpers: {
-        nameLower: "conqueress",
-        treeNameLower: "oretree2",
-    },
-};
-
-const __generated_switchaxe__13a: SwitchAxe = {
-    category: "switchaxe",
-    id: "13a",
-
-    name: "The Shredder I",
-    treeName: "Thunder Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 80, 40, 0, 0, 0],
-    maxSharpness:  [40, 90, 80, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "theshredderi",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_switchaxe__13b: SwitchAxe = {
-    category: "switchaxe",
-    id: "13b",
-
-    name: "The Shredder II",
-    treeName: "Thunder Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 50, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 90, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "theshredderii",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_switchaxe__13c: SwitchAxe = {
-    category: "switchaxe",
-    id: "13c",
-
-    name: "The Power Shredder",
-    treeName: "Thunder Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13b],
-            [__generated_ramp__thunder_boost_2, __generated_switchaxe__13b],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 80, 60, 20, 0, 0],
-    maxSharpness:  [60, 80, 80, 60, 50, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "thepowershredder",
-        treeNameLower: "thundertree",
-    },
-};
-
-const __generated_switchaxe__14a: SwitchAxe = {
-    category: "switchaxe",
-    id: "14a",
-
-    name: "Ash Drache I",
-    treeName: "Dragão Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 5,
-    defense: 5,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__master_rider, __generated_switchaxe__13a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [80, 80, 70, 50, 20, 0, 0],
-    maxSharpness:  [80, 80, 70, 50, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "ashdrachei",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_switchaxe__14b: SwitchAxe = {
-    category: "switchaxe",
-    id: "14b",
-
-    name: "Ash Drache II",
-    treeName: "Dragão Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 5,
-    defense: 5,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__14a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__master_rider, __generated_switchaxe__13a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 70, 50, 40, 0, 0],
-    maxSharpness:  [60, 80, 70, 50, 90, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "ashdracheii",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_switchaxe__14c: SwitchAxe = {
-    category: "switchaxe",
-    id: "14c",
-
-    name: "Fall Drache",
-    treeName: "Dragão Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 5,
-    defense: 5,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__14b],
-            [__generated_ramp__dragon_boost_1, __generated_switchaxe__14b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__14a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__master_rider, __generated_switchaxe__13a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__9c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 80, 60, 60, 0, 0],
-    maxSharpness:  [60, 90, 80, 60, 80, 30, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "falldrache",
-        treeNameLower: "dragontree",
-    },
-};
-
-const __generated_switchaxe__15a: SwitchAxe = {
-    category: "switchaxe",
-    id: "15a",
-
-    name: "Almudron Axe I",
-    treeName: "Almudron Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__master_rider, __generated_switchaxe__13a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 50, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 80, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "almudronaxei",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_switchaxe__15b: SwitchAxe = {
-    category: "switchaxe",
-    id: "15b",
-
-    name: "Almudron Axe II",
-    treeName: "Almudron Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__15a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__master_rider, __generated_switchaxe__13a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 100, 60, 20, 0, 0],
-    maxSharpness:  [60, 60, 100, 60, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "almudronaxeii",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_switchaxe__15c: SwitchAxe = {
-    category: "switchaxe",
-    id: "15c",
-
-    name: "Doom Bringer Axe",
-    treeName: "Almudron Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 42]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__15b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__15a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__13a],
-            [__generated_ramp__master_rider, __generated_switchaxe__13a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9c],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9c],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 60, 40, 0, 0],
-    maxSharpness:  [60, 60, 130, 60, 90, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "doombringeraxe",
-        treeNameLower: "almudrontree",
-    },
-};
-
-const __generated_switchaxe__16a: SwitchAxe = {
-    category: "switchaxe",
-    id: "16a",
-
-    name: "Axenosom I",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9b],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [30, 60, 80, 30, 0, 0, 0],
-    maxSharpness:  [30, 60, 80, 80, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "axenosomi",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_switchaxe__16b: SwitchAxe = {
-    category: "switchaxe",
-    id: "16b",
-
-    name: "Axenosom II",
-    treeName: "Aknosom Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9b],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 110, 40, 0, 0, 0],
-    maxSharpness:  [40, 60, 110, 80, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "axenosomii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_switchaxe__16c: SwitchAxe = {
-    category: "switchaxe",
-    id: "16c",
-
-    name: "Axenosom III",
-    treeName: "Aknosom Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__16b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9b],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 120, 60, 20, 0, 0],
-    maxSharpness:  [40, 60, 120, 60, 60, 10, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "axenosomiii",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_switchaxe__16d: SwitchAxe = {
-    category: "switchaxe",
-    id: "16d",
-
-    name: "Daybreak Silvaris",
-    treeName: "Aknosom Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__fire_boost_1, __generated_switchaxe__16c],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__16b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__9b],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [30, 50, 120, 70, 30, 0, 0],
-    maxSharpness:  [30, 50, 120, 70, 40, 40, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "daybreaksilvaris",
-        treeNameLower: "aknosomtree",
-    },
-};
-
-const __generated_switchaxe__17a: SwitchAxe = {
-    category: "switchaxe",
-    id: "17a",
-
-    name: "Assault Axe I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 130, 0, 0, 0, 0],
-    maxSharpness:  [60, 60, 130, 50, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 9,
-    },
-
-    filterHelpers: {
-        nameLower: "assaultaxei",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_switchaxe__17b: SwitchAxe = {
-    category: "switchaxe",
-    id: "17b",
-
-    name: "Assault Axe II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__17a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 130, 40, 0, 0, 0],
-    maxSharpness:  [70, 60, 130, 80, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 11,
-    },
-
-    filterHelpers: {
-        nameLower: "assaultaxeii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_switchaxe__17c: SwitchAxe = {
-    category: "switchaxe",
-    id: "17c",
-
-    name: "Blitzkrieg",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__17b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__17a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9b],
-        ],
-    ],
-
-    baseSharpness: [60, 50, 130, 100, 10, 0, 0],
-    maxSharpness:  [60, 50, 130, 100, 40, 20, 0],
-
-    switchaxeStats: {
-        phialType: "paralysis_phial",
-        phialValue: 15,
-    },
-
-    filterHelpers: {
-        nameLower: "blitzkrieg",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_switchaxe__18a: SwitchAxe = {
-    category: "switchaxe",
-    id: "18a",
-
-    name: "Snowfall Axe I",
-    treeName: "Baggi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9a],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9a],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 40, 20, 0, 0, 0],
-    maxSharpness:  [100, 40, 40, 70, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "snowfallaxei",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_switchaxe__18b: SwitchAxe = {
-    category: "switchaxe",
-    id: "18b",
-
-    name: "Snowfall Axe II",
-    treeName: "Baggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__18a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9a],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 50, 40, 0, 0, 0],
-    maxSharpness:  [100, 60, 50, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "snowfallaxeii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_switchaxe__18c: SwitchAxe = {
-    category: "switchaxe",
-    id: "18c",
-
-    name: "Snowfall Axe III",
-    treeName: "Baggi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__sleep_boost_1, __generated_switchaxe__18b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__18a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9a],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9a],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 60, 70, 0, 0, 0],
-    maxSharpness:  [100, 70, 60, 90, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "snowfallaxeiii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_switchaxe__18d: SwitchAxe = {
-    category: "switchaxe",
-    id: "18d",
-
-    name: "Dewdrop Dream",
-    treeName: "Baggi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__18c],
-            [__generated_ramp__sleep_boost_1, __generated_switchaxe__18b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__18a],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__9a],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__9a],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 60, 20, 0, 0],
-    maxSharpness:  [100, 90, 80, 60, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "dewdropdream",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_switchaxe__19a: SwitchAxe = {
-    category: "switchaxe",
-    id: "19a",
-
-    name: "Bone Axe I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "boneaxei",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_switchaxe__19b: SwitchAxe = {
-    category: "switchaxe",
-    id: "19b",
-
-    name: "Bone Axe II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "boneaxeii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_switchaxe__19c: SwitchAxe = {
-    category: "switchaxe",
-    id: "19c",
-
-    name: "Daidalos Axe",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 60, 0, 0, 0, 0],
-    maxSharpness:  [100, 40, 110, 0, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "daidalosaxe",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_switchaxe__19d: SwitchAxe = {
-    category: "switchaxe",
-    id: "19d",
-
-    name: "Power Gasher I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 70, 10, 0, 0, 0],
-    maxSharpness:  [100, 70, 70, 60, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "powergasheri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_switchaxe__19e: SwitchAxe = {
-    category: "switchaxe",
-    id: "19e",
-
-    name: "Power Gasher II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [80, 70, 60, 80, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "powergasherii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_switchaxe__19f: SwitchAxe = {
-    category: "switchaxe",
-    id: "19f",
-
-    name: "Maximal Gasher",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__19e],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 100, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "maximalgasher",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_switchaxe__20a: SwitchAxe = {
-    category: "switchaxe",
-    id: "20a",
-
-    name: "Flammenbeil I",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__19e],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19e],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__19e],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [140, 120, 40, 50, 0, 0, 0],
-    maxSharpness:  [140, 120, 40, 80, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "flammenbeili",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_switchaxe__20b: SwitchAxe = {
-    category: "switchaxe",
-    id: "20b",
-
-    name: "Flammenbeil II",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__fire_boost_1, __generated_switchaxe__20a],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__19e],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19e],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__19e],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [130, 120, 40, 50, 10, 0, 0],
-    maxSharpness:  [130, 120, 40, 50, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "flammenbeilii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_switchaxe__20c: SwitchAxe = {
-    category: "switchaxe",
-    id: "20c",
-
-    name: "Gnashing Flammenbeil",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__20b],
-            [__generated_ramp__fire_boost_2, __generated_switchaxe__20b],
-            [__generated_ramp__fire_boost_1, __generated_switchaxe__20a],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__19e],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__19e],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [120, 120, 40, 50, 20, 0, 0],
-    maxSharpness:  [120, 120, 40, 50, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "gnashingflammenbeil",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_switchaxe__21a: SwitchAxe = {
-    category: "switchaxe",
-    id: "21a",
-
-    name: "Rex Slasher I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19d],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 17,
-    },
-
-    filterHelpers: {
-        nameLower: "rexslasheri",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_switchaxe__21b: SwitchAxe = {
-    category: "switchaxe",
-    id: "21b",
-
-    name: "Rex Slasher II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__21a],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 50, 30, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 20,
-    },
-
-    filterHelpers: {
-        nameLower: "rexslasherii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_switchaxe__21c: SwitchAxe = {
-    category: "switchaxe",
-    id: "21c",
-
-    name: "Rex Gnasher",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__21b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__21a],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__19d],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 40, 30, 0],
-    maxSharpness:  [50, 40, 120, 120, 40, 30, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 24,
-    },
-
-    filterHelpers: {
-        nameLower: "rexgnasher",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_switchaxe__22a: SwitchAxe = {
-    category: "switchaxe",
-    id: "22a",
-
-    name: "Axe Semper Tyrannis I",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 15,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__21a],
-            [__generated_ramp__brutal_strike, __generated_switchaxe__21a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19d],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 30, 110, 0, 0, 0],
-    maxSharpness:  [50, 160, 30, 110, 40, 10, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 12,
-    },
-
-    filterHelpers: {
-        nameLower: "axesempertyrannisi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_switchaxe__22b: SwitchAxe = {
-    category: "switchaxe",
-    id: "22b",
-
-    name: "Axe Semper Tyrannis II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 230,
-    affinity: -15,
-    defense: 15,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__22a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__21a],
-            [__generated_ramp__brutal_strike, __generated_switchaxe__21a],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 20, 120, 0, 0, 0],
-    maxSharpness:  [50, 160, 20, 120, 30, 20, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 14,
-    },
-
-    filterHelpers: {
-        nameLower: "axesempertyrannisii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_switchaxe__22c: SwitchAxe = {
-    category: "switchaxe",
-    id: "22c",
-
-    name: "Grand Chaos",
-    treeName: "Diablos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 240,
-    affinity: -15,
-    defense: 15,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__22b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__22b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__22a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__21a],
-            [__generated_ramp__brutal_strike, __generated_switchaxe__21a],
-        ],
-    ],
-
-    baseSharpness: [50, 160, 10, 130, 0, 0, 0],
-    maxSharpness:  [50, 160, 10, 130, 20, 30, 0],
-
-    switchaxeStats: {
-        phialType: "exhaust_phial",
-        phialValue: 16,
-    },
-
-    filterHelpers: {
-        nameLower: "grandchaos",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_switchaxe__23a: SwitchAxe = {
-    category: "switchaxe",
-    id: "23a",
-
-    name: "Venom Hatchet I",
-    treeName: "Remobra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 50, 0, 0, 0],
-    maxSharpness:  [60, 70, 70, 100, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "venomhatcheti",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_switchaxe__23b: SwitchAxe = {
-    category: "switchaxe",
-    id: "23b",
-
-    name: "Venom Hatchet II",
-    treeName: "Remobra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__23a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 70, 0, 0, 0],
-    maxSharpness:  [60, 60, 60, 120, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "venomhatchetii",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_switchaxe__23c: SwitchAxe = {
-    category: "switchaxe",
-    id: "23c",
-
-    name: "Mortal Serpent",
-    treeName: "Remobra Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 40]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__coating_switch_boost, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__23b],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__23b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__23a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 60, 70, 30, 0, 0],
-    maxSharpness:  [70, 70, 60, 70, 60, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "mortalserpent",
-        treeNameLower: "remobratree",
-    },
-};
-
-const __generated_switchaxe__24a: SwitchAxe = {
-    category: "switchaxe",
-    id: "24a",
-
-    name: "Hidden Axe I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__poison_boost_1, __generated_switchaxe__23a],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__23a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    switchaxeStats: {
-        phialType: "poison_phial",
-        phialValue: 12,
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenaxei",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_switchaxe__24b: SwitchAxe = {
-    category: "switchaxe",
-    id: "24b",
-
-    name: "Hidden Axe II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__24a],
-            [__generated_ramp__poison_boost_1, __generated_switchaxe__23a],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__23a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 50, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 80, 20, 0],
-
-    switchaxeStats: {
-        phialType: "poison_phial",
-        phialValue: 15,
-    },
-
-    filterHelpers: {
-        nameLower: "hiddenaxeii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_switchaxe__24c: SwitchAxe = {
-    category: "switchaxe",
-    id: "24c",
-
-    name: "Night's Crescent",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 40,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__boost_equipped_coating, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__24b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__24a],
-            [__generated_ramp__poison_boost_1, __generated_switchaxe__23a],
-            [__generated_ramp__dulling_strike, __generated_switchaxe__23a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19c],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 100, 100, 60, 20, 0],
-    maxSharpness:  [50, 70, 100, 100, 60, 20, 0],
-
-    switchaxeStats: {
-        phialType: "poison_phial",
-        phialValue: 17,
-    },
-
-    filterHelpers: {
-        nameLower: "night'screscent",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_switchaxe__25a: SwitchAxe = {
-    category: "switchaxe",
-    id: "25a",
-
-    name: "Binding Roller I",
-    treeName: "Volvidon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [140, 40, 40, 30, 0, 0, 0],
-    maxSharpness:  [140, 40, 40, 80, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "bindingrolleri",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_switchaxe__25b: SwitchAxe = {
-    category: "switchaxe",
-    id: "25b",
-
-    name: "Binding Roller II",
-    treeName: "Volvidon Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [140, 30, 40, 40, 0, 0, 0],
-    maxSharpness:  [140, 30, 40, 60, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "bindingrollerii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_switchaxe__25c: SwitchAxe = {
-    category: "switchaxe",
-    id: "25c",
-
-    name: "Binding Roller III",
-    treeName: "Volvidon Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__25b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [150, 40, 40, 70, 0, 0, 0],
-    maxSharpness:  [150, 40, 40, 70, 50, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "bindingrolleriii",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_switchaxe__25d: SwitchAxe = {
-    category: "switchaxe",
-    id: "25d",
-
-    name: "Vermilingua",
-    treeName: "Volvidon Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__25c],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__25b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__19c],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 50, 60, 30, 0, 0],
-    maxSharpness:  [160, 50, 50, 60, 70, 10, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "vermilingua",
-        treeNameLower: "volvidontree",
-    },
-};
-
-const __generated_switchaxe__26a: SwitchAxe = {
-    category: "switchaxe",
-    id: "26a",
-
-    name: "Ludroth Axe I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 50, 40, 0, 0, 0],
-    maxSharpness:  [40, 70, 50, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "ludrothaxei",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_switchaxe__26b: SwitchAxe = {
-    category: "switchaxe",
-    id: "26b",
-
-    name: "Ludroth Axe II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 70, 50, 0, 0, 0],
-    maxSharpness:  [50, 80, 70, 100, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "ludrothaxeii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_switchaxe__26c: SwitchAxe = {
-    category: "switchaxe",
-    id: "26c",
-
-    name: "Splish Splax",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__26b],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__26b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 80, 70, 20, 0, 0],
-    maxSharpness:  [50, 80, 80, 70, 40, 30, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "splishsplax",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_switchaxe__27a: SwitchAxe = {
-    category: "switchaxe",
-    id: "27a",
-
-    name: "Usurper's Downpour I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__26b],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__26b],
-            [__generated_ramp__waterblight_exploit, __generated_switchaxe__26b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 90, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 90, 80, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'sdownpouri",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_switchaxe__27b: SwitchAxe = {
-    category: "switchaxe",
-    id: "27b",
-
-    name: "Usurper's Downpour II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__27a],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__26b],
-            [__generated_ramp__waterblight_exploit, __generated_switchaxe__26b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 160, 60, 20, 0, 0],
-    maxSharpness:  [70, 40, 160, 60, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "usurper'sdownpourii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_switchaxe__27c: SwitchAxe = {
-    category: "switchaxe",
-    id: "27c",
-
-    name: "Despot's Cloudburst",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__27b],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__27a],
-            [__generated_ramp__water_boost_1, __generated_switchaxe__26b],
-            [__generated_ramp__waterblight_exploit, __generated_switchaxe__26b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 120, 80, 40, 0, 0],
-    maxSharpness:  [70, 40, 120, 80, 50, 40, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "despot'scloudburst",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_switchaxe__28a: SwitchAxe = {
-    category: "switchaxe",
-    id: "28a",
-
-    name: "Longear Axe I",
-    treeName: "Lagombi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19a],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 50, 20, 0, 0, 0],
-    maxSharpness:  [70, 60, 50, 70, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "longearaxei",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_switchaxe__28b: SwitchAxe = {
-    category: "switchaxe",
-    id: "28b",
-
-    name: "Longear Axe II",
-    treeName: "Lagombi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__ice_boost_1, __generated_switchaxe__28a],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__19a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19a],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 90, 40, 0, 0, 0],
-    maxSharpness:  [70, 50, 90, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "longearaxeii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_switchaxe__28c: SwitchAxe = {
-    category: "switchaxe",
-    id: "28c",
-
-    name: "Longear Axe III",
-    treeName: "Lagombi Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__coating_switch_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__28b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__28b],
-            [__generated_ramp__ice_boost_1, __generated_switchaxe__28a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19a],
-        ],
-    ],
-
-    baseSharpness: [60, 30, 100, 100, 10, 0, 0],
-    maxSharpness:  [60, 30, 100, 100, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "longearaxeiii",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_switchaxe__28d: SwitchAxe = {
-    category: "switchaxe",
-    id: "28d",
-
-    name: "Longear Weiss",
-    treeName: "Lagombi Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__coating_switch_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__28b],
-            [__generated_ramp__small_monster_exploit, __generated_switchaxe__28b],
-            [__generated_ramp__ice_boost_1, __generated_switchaxe__28a],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__19a],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__19a],
-        ],
-    ],
-
-    baseSharpness: [40, 30, 100, 100, 30, 0, 0],
-    maxSharpness:  [40, 30, 100, 100, 60, 20, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "longearweiss",
-        treeNameLower: "lagombitree",
-    },
-};
-
-const __generated_switchaxe__29a: SwitchAxe = {
-    category: "switchaxe",
-    id: "29a",
-
-    name: "Sinister Axe I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "sinisteraxei",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_switchaxe__29b: SwitchAxe = {
-    category: "switchaxe",
-    id: "29b",
-
-    name: "Sinister Axe II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__29a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "sinisteraxeii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_switchaxe__29c: SwitchAxe = {
-    category: "switchaxe",
-    id: "29c",
-
-    name: "Sinister Shadowslice",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_switchaxe__29b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__29a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "sinistershadowslice",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_switchaxe__30a: SwitchAxe = {
-    category: "switchaxe",
-    id: "30a",
-
-    name: "Undying Axe I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 120, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "undyingaxei",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_switchaxe__30b: SwitchAxe = {
-    category: "switchaxe",
-    id: "30b",
-
-    name: "Undying Axe II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__30a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 100, 100, 0, 0, 0],
-    maxSharpness:  [50, 50, 100, 120, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "undyingaxeii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_switchaxe__30c: SwitchAxe = {
-    category: "switchaxe",
-    id: "30c",
-
-    name: "Undying Light",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__30b],
-            [__generated_ramp__thunder_boost_1, __generated_switchaxe__30a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 80, 120, 0, 0, 0],
-    maxSharpness:  [50, 50, 80, 120, 50, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "undyinglight",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_switchaxe__31a: SwitchAxe = {
-    category: "switchaxe",
-    id: "31a",
-
-    name: "Azure Elder Axe I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 9]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderaxei",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_switchaxe__31b: SwitchAxe = {
-    category: "switchaxe",
-    id: "31b",
-
-    name: "Azure Elder Axe II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "azureelderaxeii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_switchaxe__31c: SwitchAxe = {
-    category: "switchaxe",
-    id: "31c",
-
-    name: "Abyssal Gale Axe",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_switchaxe__31b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__31a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalgaleaxe",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_switchaxe__32a: SwitchAxe = {
-    category: "switchaxe",
-    id: "32a",
-
-    name: "Thunderbolt Axe I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 190, 40, 30, 0, 0],
-    maxSharpness:  [20, 20, 190, 40, 50, 30, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "thunderboltaxei",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_switchaxe__32b: SwitchAxe = {
-    category: "switchaxe",
-    id: "32b",
-
-    name: "Abyssal Storm Axe",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 43]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__32a],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 220, 40, 60, 0, 0],
-    maxSharpness:  [10, 20, 220, 40, 70, 40, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "abyssalstormaxe",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_switchaxe__33a: SwitchAxe = {
-    category: "switchaxe",
-    id: "33a",
-
-    name: "Rookslayer Axe I",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 70, 80, 20, 0, 0],
-    maxSharpness:  [70, 60, 70, 80, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rookslayeraxei",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_switchaxe__33b: SwitchAxe = {
-    category: "switchaxe",
-    id: "33b",
-
-    name: "Rookslayer Axe II",
-    treeName: "Bazelgeuse Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 70, 30, 0, 0],
-    maxSharpness:  [90, 80, 80, 70, 70, 10, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rookslayeraxeii",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_switchaxe__33c: SwitchAxe = {
-    category: "switchaxe",
-    id: "33c",
-
-    name: "Bazelrush Rookslayer",
-    treeName: "Bazelgeuse Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__blast_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__33b],
-            [__generated_ramp__blast_boost_2, __generated_switchaxe__33b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 60, 40, 0, 0],
-    maxSharpness:  [90, 80, 80, 60, 70, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "bazelrushrookslayer",
-        treeNameLower: "bazelgeusetree",
-    },
-};
-
-const __generated_switchaxe__34a: SwitchAxe = {
-    category: "switchaxe",
-    id: "34a",
-
-    name: "Daora's Farasa I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 39]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 80, 80, 50, 40, 0, 0],
-    maxSharpness:  [100, 80, 80, 50, 60, 30, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sfarasai",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_switchaxe__34b: SwitchAxe = {
-    category: "switchaxe",
-    id: "34b",
-
-    name: "Daora's Janah",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 41]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__34a],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__34a],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 80, 50, 40, 10, 0],
-    maxSharpness:  [100, 70, 80, 50, 40, 60, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "daora'sjanah",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_switchaxe__35a: SwitchAxe = {
-    category: "switchaxe",
-    id: "35a",
-
-    name: "Teostra's Arx I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 60, 20, 0, 0],
-    maxSharpness:  [100, 90, 80, 60, 60, 10, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'sarxi",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_switchaxe__35b: SwitchAxe = {
-    category: "switchaxe",
-    id: "35b",
-
-    name: "Teostra's Castle",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__35a],
-        ],
-    ],
-
-    baseSharpness: [100, 90, 80, 50, 30, 0, 0],
-    maxSharpness:  [100, 90, 80, 50, 60, 20, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "teostra'scastle",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_switchaxe__36a: SwitchAxe = {
-    category: "switchaxe",
-    id: "36a",
-
-    name: "Waxglare Wand I",
-    treeName: "Chameleos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-        ],
-    ],
-
-    baseSharpness: [80, 30, 80, 90, 70, 0, 0],
-    maxSharpness:  [80, 30, 80, 90, 70, 50, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "waxglarewandi",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_switchaxe__36b: SwitchAxe = {
-    category: "switchaxe",
-    id: "36b",
-
-    name: "Balor's Mirage",
-    treeName: "Chameleos Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__chameleos_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__36a],
-        ],
-    ],
-
-    baseSharpness: [50, 30, 100, 90, 80, 0, 0],
-    maxSharpness:  [50, 30, 100, 90, 80, 50, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "balor'smirage",
-        treeNameLower: "chameleostree",
-    },
-};
-
-const __generated_switchaxe__37a: SwitchAxe = {
-    category: "switchaxe",
-    id: "37a",
-
-    name: "Redwing Switch Axe I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "redwingswitchaxei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_switchaxe__37b: SwitchAxe = {
-    category: "switchaxe",
-    id: "37b",
-
-    name: "Reddnaught Dunat",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 37]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "reddnaughtdunat",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_switchaxe__38a: SwitchAxe = {
-    category: "switchaxe",
-    id: "38a",
-
-    name: "Origami Axe I",
-    treeName: "Smithy Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__coating_switch_boost, null],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 50, 30, 10, 0, 0],
-    maxSharpness:  [90, 70, 50, 30, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "dragon_phial",
-        phialValue: 13,
-    },
-
-    filterHelpers: {
-        nameLower: "origamiaxei",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_switchaxe__38b: SwitchAxe = {
-    category: "switchaxe",
-    id: "38b",
-
-    name: "Origami Axe II",
-    treeName: "Smithy Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__coating_switch_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__38a],
-        ],
-    ],
-
-    baseSharpness: [110, 80, 60, 30, 20, 0, 0],
-    maxSharpness:  [110, 80, 60, 30, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "dragon_phial",
-        phialValue: 15,
-    },
-
-    filterHelpers: {
-        nameLower: "origamiaxeii",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_switchaxe__38c: SwitchAxe = {
-    category: "switchaxe",
-    id: "38c",
-
-    name: "Petal Cloud",
-    treeName: "Smithy Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__coating_switch_boost, null],
-            [__generated_ramp__affinity_boost_3, __generated_switchaxe__38b],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__38a],
-        ],
-    ],
-
-    baseSharpness: [120, 90, 70, 30, 20, 20, 0],
-    maxSharpness:  [120, 90, 70, 30, 20, 70, 0],
-
-    switchaxeStats: {
-        phialType: "dragon_phial",
-        phialValue: 17,
-    },
-
-    filterHelpers: {
-        nameLower: "petalcloud",
-        treeNameLower: "smithytree",
-    },
-};
-
-const __generated_switchaxe__39a: SwitchAxe = {
-    category: "switchaxe",
-    id: "39a",
-
-    name: "Grim Cat I",
-    treeName: "Felyne Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 90, 80, 0, 0, 0],
-    maxSharpness:  [50, 80, 90, 100, 30, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "grimcati",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_switchaxe__39b: SwitchAxe = {
-    category: "switchaxe",
-    id: "39b",
-
-    name: "Grim Cat II",
-    treeName: "Felyne Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 25]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__39a],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 100, 120, 0, 0, 0],
-    maxSharpness:  [50, 80, 100, 120, 50, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "grimcatii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_switchaxe__39c: SwitchAxe = {
-    category: "switchaxe",
-    id: "39c",
-
-    name: "Grimmige Katze",
-    treeName: "Felyne Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__39b],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__39b],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__39a],
-        ],
-    ],
-
-    baseSharpness: [50, 80, 90, 120, 10, 0, 0],
-    maxSharpness:  [50, 80, 90, 120, 60, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "grimmigekatze",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_switchaxe__40a: SwitchAxe = {
-    category: "switchaxe",
-    id: "40a",
-
-    name: "Infernal Axe I",
-    treeName: "Death Stench Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 30, 40, 0, 0, 0],
-    maxSharpness:  [150, 30, 30, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "infernalaxei",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_switchaxe__40b: SwitchAxe = {
-    category: "switchaxe",
-    id: "40b",
-
-    name: "Infernal Axe II",
-    treeName: "Death Stench Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dragon_boost_1, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__40a],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 20, 60, 0, 0, 0],
-    maxSharpness:  [150, 20, 20, 90, 20, 0, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "infernalaxeii",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_switchaxe__40c: SwitchAxe = {
-    category: "switchaxe",
-    id: "40c",
-
-    name: "Hellish Edge",
-    treeName: "Death Stench Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__dragon_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__40b],
-            [__generated_ramp__dragon_boost_1, __generated_switchaxe__40b],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__40a],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 20, 130, 20, 0, 0],
-    maxSharpness:  [160, 20, 20, 130, 60, 10, 0],
-
-    switchaxeStats: {
-        phialType: "element_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "hellishedge",
-        treeNameLower: "deathstenchtree",
-    },
-};
-
-const __generated_switchaxe__41a: SwitchAxe = {
-    category: "switchaxe",
-    id: "41a",
-
-    name: "Sleepy Shellslice I",
-    treeName: "Shell-Studded Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 140, 0, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "sleepyshellslicei",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_switchaxe__41b: SwitchAxe = {
-    category: "switchaxe",
-    id: "41b",
-
-    name: "Sleepy Shellslice II",
-    treeName: "Shell-Studded Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 15,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__41a],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 90, 20, 0, 0, 0],
-    maxSharpness:  [50, 90, 90, 60, 10, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "sleepyshellsliceii",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_switchaxe__41c: SwitchAxe = {
-    category: "switchaxe",
-    id: "41c",
-
-    name: "Schale Batis",
-    treeName: "Shell-Studded Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__41b],
-            [__generated_ramp__sleep_boost_1, __generated_switchaxe__41b],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__41a],
-        ],
-    ],
-
-    baseSharpness: [60, 90, 100, 50, 0, 0, 0],
-    maxSharpness:  [60, 90, 100, 60, 40, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "schalebatis",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_switchaxe__ra: SwitchAxe = {
-    category: "switchaxe",
-    id: "ra",
-
-    name: "Rampage Slicer I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__phial_element, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagesliceri",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_switchaxe__rb: SwitchAxe = {
-    category: "switchaxe",
-    id: "rb",
-
-    name: "Rampage Slicer II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__phial_element, null],
-            [__generated_ramp__phial_poison_1, null],
-            [__generated_ramp__phial_paralysis_1, null],
-            [__generated_ramp__phial_dragon_1, null],
-            [__generated_ramp__phial_exhaust_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageslicerii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_switchaxe__rc: SwitchAxe = {
-    category: "switchaxe",
-    id: "rc",
-
-    name: "Rampage Slicer III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-            [__generated_ramp__phial_poison_1, null],
-            [__generated_ramp__phial_paralysis_1, null],
-            [__generated_ramp__phial_dragon_1, null],
-            [__generated_ramp__phial_exhaust_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagesliceriii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_switchaxe__rd: SwitchAxe = {
-    category: "switchaxe",
-    id: "rd",
-
-    name: "Rampage Slicer IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__elemental_boost_1, __generated_switchaxe__rc],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_switchaxe__rc],
-            [__generated_ramp__water_1, __generated_switchaxe__rc],
-            [__generated_ramp__thunder_1, __generated_switchaxe__rc],
-            [__generated_ramp__ice_1, __generated_switchaxe__rc],
-            [__generated_ramp__dragon_1, __generated_switchaxe__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-            [__generated_ramp__phial_poison_2, null],
-            [__generated_ramp__phial_paralysis_2, null],
-            [__generated_ramp__phial_dragon_2, null],
-            [__generated_ramp__phial_exhaust_2, null],
-            [__generated_ramp__phial_poison_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_paralysis_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_dragon_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_exhaust_1, __generated_switchaxe__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rampagesliceriv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_switchaxe__re: SwitchAxe = {
-    category: "switchaxe",
-    id: "re",
-
-    name: "Rampage Slicer V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__rd],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__rd],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__rd],
-            [__generated_ramp__elemental_boost_1, __generated_switchaxe__rc],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_switchaxe__rd],
-            [__generated_ramp__water_2, __generated_switchaxe__rd],
-            [__generated_ramp__thunder_2, __generated_switchaxe__rd],
-            [__generated_ramp__ice_2, __generated_switchaxe__rd],
-            [__generated_ramp__dragon_2, __generated_switchaxe__rd],
-            [__generated_ramp__fire_1, __generated_switchaxe__rc],
-            [__generated_ramp__water_1, __generated_switchaxe__rc],
-            [__generated_ramp__thunder_1, __generated_switchaxe__rc],
-            [__generated_ramp__ice_1, __generated_switchaxe__rc],
-            [__generated_ramp__dragon_1, __generated_switchaxe__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-            [__generated_ramp__phial_poison_2, null],
-            [__generated_ramp__phial_paralysis_2, null],
-            [__generated_ramp__phial_dragon_2, null],
-            [__generated_ramp__phial_exhaust_2, null],
-            [__generated_ramp__phial_poison_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_paralysis_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_dragon_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_exhaust_1, __generated_switchaxe__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
-
-    filterHelpers: {
-        nameLower: "rampageslicerv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_switchaxe__rf: SwitchAxe = {
-    category: "switchaxe",
-    id: "rf",
-
-    name: "Rampage Slicer S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_2, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_switchaxe__re],
-            [__generated_ramp__affinity_boost_3, __generated_switchaxe__re],
-            [__generated_ramp__attack_boost_2, __generated_switchaxe__rd],
-            [__generated_ramp__affinity_boost_2, __generated_switchaxe__rd],
-            [__generated_ramp__defense_boost_2, __generated_switchaxe__rd],
-            [__generated_ramp__elemental_boost_1, __generated_switchaxe__rc],
-            [__generated_ramp__attack_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__affinity_boost_1, __generated_switchaxe__rb],
-            [__generated_ramp__defense_boost_1, __generated_switchaxe__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_switchaxe__re],
-            [__generated_ramp__paralysis_1, __generated_switchaxe__re],
-            [__generated_ramp__sleep_1, __generated_switchaxe__re],
-            [__generated_ramp__blast_1, __generated_switchaxe__re],
-            [__generated_ramp__fire_2, __generated_switchaxe__rd],
-            [__generated_ramp__water_2, __generated_switchaxe__rd],
-            [__generated_ramp__thunder_2, __generated_switchaxe__rd],
-            [__generated_ramp__ice_2, __generated_switchaxe__rd],
-            [__generated_ramp__dragon_2, __generated_switchaxe__rd],
-            [__generated_ramp__fire_1, __generated_switchaxe__rc],
-            [__generated_ramp__water_1, __generated_switchaxe__rc],
-            [__generated_ramp__thunder_1, __generated_switchaxe__rc],
-            [__generated_ramp__ice_1, __generated_switchaxe__rc],
-            [__generated_ramp__dragon_1, __generated_switchaxe__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-            [__generated_ramp__phial_element, null],
-            [__generated_ramp__phial_poison_3, null],
-            [__generated_ramp__phial_paralysis_3, null],
-            [__generated_ramp__phial_dragon_3, null],
-            [__generated_ramp__phial_exhaust_3, null],
-            [__generated_ramp__phial_poison_2, __generated_switchaxe__re],
-            [__generated_ramp__phial_paralysis_2, __generated_switchaxe__re],
-            [__generated_ramp__phial_dragon_2, __generated_switchaxe__re],
-            [__generated_ramp__phial_exhaust_2, __generated_switchaxe__re],
-            [__generated_ramp__phial_poison_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_paralysis_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_dragon_1, __generated_switchaxe__rc],
-            [__generated_ramp__phial_exhaust_1, __generated_switchaxe__rc],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
-
-    switchaxeStats: {
-        phialType: "power_phial",
-        phialValue: null,
-    },
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampageslicers",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"switchaxe","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Iron Axe I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"1b","name":"Kamura Iron Axe II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"1c","name":"Kamura Iron Axe III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"1d","name":"Kamura Iron Axe IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"1e","name":"Kamura Iron Axe V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"1f","name":"Kamura Ninja Axe","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Mizutsune Tree",[{"id":"2a","name":"Fond Farewell I","rarity":3,"endlineTag":"","attack":110,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["water",19]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,50,40,60,0,0,0],"maxSharpness":[50,50,40,80,30,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"2b","name":"Fond Farewell II","rarity":5,"endlineTag":"","attack":170,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["water",24]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[90,90,80,60,30,0,0],"maxSharpness":[90,90,80,60,60,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"2c","name":"Parting Slice","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",29]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","2b"],["affinity_boost_1","2a"],["water_boost_1","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,80,70,60,60,0,0],"maxSharpness":[80,80,70,60,60,50,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Rathalos Tree",[{"id":"3a","name":"Rath Flamesplitter I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",19]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[80,100,30,40,0,0,0],"maxSharpness":[80,100,30,90,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"3b","name":"Rath Flamesplitter II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",22]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[90,80,30,50,0,0,0],"maxSharpness":[90,80,30,90,10,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"3c","name":"Rath Flamesplitter III","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["fire",25]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[120,120,30,70,10,0,0],"maxSharpness":[120,120,30,70,60,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"3d","name":"Rath Blaze Splitter","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["fire",30]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","3c"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,100,30,90,30,0,0],"maxSharpness":[100,100,30,90,60,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Bishaten Tree",[{"id":"4a","name":"Wheel Axe I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["boost_equipped_coating",null],["silkbind_boost",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,140,40,40,0,0,0],"maxSharpness":[30,140,40,80,10,0,0],"switchaxeStats":{"phialType":"dragon_phial","phialValue":20}},{"id":"4b","name":"Wheel Axe II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["boost_equipped_coating",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[20,150,60,40,30,0,0],"maxSharpness":[20,150,60,40,40,40,0],"switchaxeStats":{"phialType":"dragon_phial","phialValue":23}},{"id":"4c","name":"Axe of Wisdom","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["boost_equipped_coating",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,150,80,50,40,0,0],"maxSharpness":[30,150,80,50,40,50,0],"switchaxeStats":{"phialType":"dragon_phial","phialValue":25}}]],["Delex Tree",[{"id":"5a","name":"Delex Sail I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",11]],"rampSkills":[[["attack_boost_1",null],["water_boost_2",null],["master_rider",null],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,90,50,30,0,0,0],"maxSharpness":[30,90,50,70,10,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"5b","name":"Delex Sail II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",13]],"rampSkills":[[["attack_boost_1",null],["water_boost_2",null],["master_rider",null],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,100,70,50,0,0,0],"maxSharpness":[30,100,70,60,40,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"5c","name":"Delex Cleaver","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_2",null],["water_boost_3",null],["master_rider",null],["attack_boost_1","5b"],["water_boost_2","5b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,110,80,50,30,0,0],"maxSharpness":[30,110,80,50,70,10,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Khezu Tree",[{"id":"6a","name":"Khezu Axe I","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",23]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,60,30,40,0,0,0],"maxSharpness":[70,60,30,90,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"6b","name":"Khezu Axe II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",26]],"rampSkills":[[["attack_boost_3",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_2","6a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,100,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"6c","name":"Khezu Cleaver","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",32]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_3","6b"],["thunder_boost_1","6b"],["attack_boost_2","6a"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,70,60,50,30,0,0],"maxSharpness":[90,70,60,50,80,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Arzuros Tree",[{"id":"7a","name":"Arzuros Axe I","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["defense_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","1b"]]],"baseSharpness":[90,60,50,0,0,0,0],"maxSharpness":[90,60,80,20,0,0,0],"switchaxeStats":{"phialType":"poison_phial","phialValue":23}},{"id":"7b","name":"Arzuros Axe II","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["small_monster_exploit",null],["attack_boost_1","7a"],["affinity_boost_2","1b"]]],"baseSharpness":[80,50,70,0,0,0,0],"maxSharpness":[80,50,70,50,0,0,0],"switchaxeStats":{"phialType":"poison_phial","phialValue":26}},{"id":"7c","name":"Arzuros Revelax","rarity":4,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_2","7b"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["attack_boost_1","7a"],["affinity_boost_2","1b"]]],"baseSharpness":[110,40,90,60,0,0,0],"maxSharpness":[110,40,90,60,50,0,0],"switchaxeStats":{"phialType":"poison_phial","phialValue":29}}]],["Barioth Tree",[{"id":"8a","name":"Amber Slash I","rarity":2,"endlineTag":"","attack":80,"affinity":20,"defense":0,"decoSlots":[],"eleStat":[["ice",19]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["defense_boost_1","7b"],["small_monster_exploit","7b"],["attack_boost_1","7a"]]],"baseSharpness":[50,50,80,70,0,0,0],"maxSharpness":[50,50,80,100,20,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"8b","name":"Amber Slash II","rarity":3,"endlineTag":"","attack":120,"affinity":25,"defense":0,"decoSlots":[],"eleStat":[["ice",23]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","8a"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["attack_boost_1","7a"]]],"baseSharpness":[50,40,80,70,10,0,0],"maxSharpness":[50,40,80,70,60,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"8c","name":"Amber Slash III","rarity":5,"endlineTag":"","attack":170,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[["ice",26]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","8a"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["attack_boost_1","7a"]]],"baseSharpness":[50,70,100,100,30,0,0],"maxSharpness":[50,70,100,100,70,10,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"8d","name":"Amber Hoarfrost","rarity":6,"endlineTag":"hr","attack":190,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[["ice",29]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","8c"],["attack_boost_2","8a"],["defense_boost_1","7b"],["small_monster_exploit","7b"],["attack_boost_1","7a"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,70,30,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Ore Tree",[{"id":"9a","name":"Proto Iron Axe I","rarity":1,"endlineTag":"","attack":70,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":10}},{"id":"9b","name":"Proto Iron Axe II","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,60,70,0,0,0,0],"maxSharpness":[70,60,110,10,0,0,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":12}},{"id":"9c","name":"Improved Steel Axe","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","9b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,90,0,0,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":14}},{"id":"9d","name":"Elite Switch Axe I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"baseSharpness":[80,70,50,50,0,0,0],"maxSharpness":[80,70,50,80,20,0,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":17}},{"id":"9e","name":"Elite Switch Axe II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"baseSharpness":[80,70,80,50,20,0,0],"maxSharpness":[80,70,80,50,50,20,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":18}},{"id":"9f","name":"Czar Switch Axe","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"],["attack_boost_1","9b"]]],"baseSharpness":[100,90,80,50,30,0,0],"maxSharpness":[100,90,80,50,40,40,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":22}}]],["Jyuratodus Tree",[{"id":"10a","name":"Limus Os I","rarity":5,"endlineTag":"","attack":190,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["water",17]],"rampSkills":[[["affinity_boost_1",null],["water_boost_1",null],["brutal_strike",null],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"baseSharpness":[100,80,70,50,0,0,0],"maxSharpness":[100,80,70,90,10,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"10b","name":"Limus Os II","rarity":5,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["water",21]],"rampSkills":[[["affinity_boost_1",null],["water_boost_2",null],["brutal_strike",null],["water_boost_1","10a"],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"baseSharpness":[100,100,80,70,0,0,0],"maxSharpness":[100,100,80,70,50,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"10c","name":"Luto Ascia","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["water",25]],"rampSkills":[[["affinity_boost_2",null],["water_boost_2",null],["brutal_strike",null],["affinity_boost_1","10b"],["water_boost_1","10a"],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"baseSharpness":[100,100,70,80,0,0,0],"maxSharpness":[100,100,70,80,40,10,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Rathian Tree",[{"id":"11a","name":"Drag\\u00e3omaiden Axe I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",19]],"rampSkills":[[["attack_boost_1",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_2","9e"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"]]],"baseSharpness":[60,70,90,80,0,0,0],"maxSharpness":[60,70,90,100,30,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"11b","name":"Drag\\u00e3omaiden Axe II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",22]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","11a"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"]]],"baseSharpness":[60,60,100,110,20,0,0],"maxSharpness":[60,60,100,110,70,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"11c","name":"Gr\\u00ed\\u00f0r\'s Landmaker","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",25]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["attack_boost_1","11a"],["defense_boost_3","9e"],["silkbind_boost","9e"],["defense_boost_2","9d"],["affinity_boost_1","9c"]]],"baseSharpness":[90,40,110,70,40,0,0],"maxSharpness":[90,40,110,70,70,20,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Ore Tree 2",[{"id":"12a","name":"General\'s Strongaxe I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["boost_equipped_coating",null],["silkbind_boost",null],["attack_boost_2","9d"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"baseSharpness":[80,80,70,40,30,0,0],"maxSharpness":[80,80,70,40,80,0,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":25}},{"id":"12b","name":"General\'s Strongaxe II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["boost_equipped_coating",null],["silkbind_boost",null],["affinity_boost_1","12a"],["attack_boost_2","9d"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"baseSharpness":[70,70,70,50,40,0,0],"maxSharpness":[70,70,70,50,80,10,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":28}},{"id":"12c","name":"Conqueress","rarity":6,"endlineTag":"hr","attack":210,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["boost_equipped_coating",null],["silkbind_boost",null],["affinity_boost_2","12b"],["affinity_boost_1","12a"],["attack_boost_2","9d"],["defense_boost_2","9d"],["attack_boost_1","9b"]]],"baseSharpness":[80,80,80,60,50,0,0],"maxSharpness":[80,80,80,60,80,20,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":30}}]],["Thunder Tree",[{"id":"13a","name":"The Shredder I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["thunder",15]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["master_rider",null],["attack_boost_2","9c"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[40,90,80,40,0,0,0],"maxSharpness":[40,90,80,90,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"13b","name":"The Shredder II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["thunder",18]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_2",null],["master_rider",null],["thunder_boost_1","13a"],["attack_boost_2","9c"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[50,70,80,50,0,0,0],"maxSharpness":[50,70,80,90,10,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"13c","name":"The Power Shredder","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":10,"decoSlots":[1],"eleStat":[["thunder",21]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_3",null],["master_rider",null],["attack_boost_1","13b"],["thunder_boost_2","13b"],["thunder_boost_1","13a"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[60,80,80,60,20,0,0],"maxSharpness":[60,80,80,60,50,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Drag\\u00e3o Tree",[{"id":"14a","name":"Ash Drache I","rarity":4,"endlineTag":"","attack":150,"affinity":5,"defense":5,"decoSlots":[3],"eleStat":[["dragon",19]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["dragon_boost_1",null],["attack_boost_1","13a"],["thunder_boost_1","13a"],["master_rider","13a"],["attack_boost_2","9c"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[80,80,70,50,20,0,0],"maxSharpness":[80,80,70,50,70,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"14b","name":"Ash Drache II","rarity":5,"endlineTag":"","attack":170,"affinity":5,"defense":5,"decoSlots":[3],"eleStat":[["dragon",21]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["dragon_boost_1",null],["defense_boost_1","14a"],["attack_boost_1","13a"],["thunder_boost_1","13a"],["master_rider","13a"],["attack_boost_2","9c"],["affinity_boost_1","9c"]]],"baseSharpness":[60,80,70,50,40,0,0],"maxSharpness":[60,80,70,50,90,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"14c","name":"Fall Drache","rarity":6,"endlineTag":"hr","attack":200,"affinity":5,"defense":5,"decoSlots":[3],"eleStat":[["dragon",22]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["dragon_boost_2",null],["affinity_boost_2","14b"],["dragon_boost_1","14b"],["defense_boost_1","14a"],["attack_boost_1","13a"],["thunder_boost_1","13a"],["master_rider","13a"],["attack_boost_2","9c"],["affinity_boost_1","9c"]]],"baseSharpness":[60,90,80,60,60,0,0],"maxSharpness":[60,90,80,60,80,30,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Almudron Tree",[{"id":"15a","name":"Almudron Axe I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",31]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["element_exploit",null],["attack_boost_1","13a"],["thunder_boost_1","13a"],["master_rider","13a"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[50,50,100,50,0,0,0],"maxSharpness":[50,50,100,80,20,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"15b","name":"Almudron Axe II","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",36]],"rampSkills":[[["attack_boost_3",null],["water_boost_1",null],["element_exploit",null],["attack_boost_2","15a"],["attack_boost_1","13a"],["thunder_boost_1","13a"],["master_rider","13a"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[60,60,100,60,20,0,0],"maxSharpness":[60,60,100,60,70,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"15c","name":"Doom Bringer Axe","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["water",42]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["element_exploit",null],["water_boost_1","15b"],["attack_boost_2","15a"],["attack_boost_1","13a"],["thunder_boost_1","13a"],["master_rider","13a"],["affinity_boost_1","9c"],["defense_boost_2","9c"]]],"baseSharpness":[60,60,130,60,40,0,0],"maxSharpness":[60,60,130,60,90,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Aknosom Tree",[{"id":"16a","name":"Axenosom I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",13]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[30,60,80,30,0,0,0],"maxSharpness":[30,60,80,80,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"16b","name":"Axenosom II","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",18]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["fireblight_exploit",null],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[40,60,110,40,0,0,0],"maxSharpness":[40,60,110,80,10,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"16c","name":"Axenosom III","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",21]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["fireblight_exploit",null],["attack_boost_1","16b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[40,60,120,60,20,0,0],"maxSharpness":[40,60,120,60,60,10,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"16d","name":"Daybreak Silvaris","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["fire",26]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["fireblight_exploit",null],["fire_boost_1","16c"],["attack_boost_1","16b"],["affinity_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[30,50,120,70,30,0,0],"maxSharpness":[30,50,120,70,40,40,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Barroth Tree",[{"id":"17a","name":"Assault Axe I","rarity":2,"endlineTag":"","attack":120,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_1","9b"],["defense_boost_2","9b"]]],"baseSharpness":[60,60,130,0,0,0,0],"maxSharpness":[60,60,130,50,0,0,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":9}},{"id":"17b","name":"Assault Axe II","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","17a"],["attack_boost_1","9b"]]],"baseSharpness":[70,60,130,40,0,0,0],"maxSharpness":[70,60,130,80,10,0,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":11}},{"id":"17c","name":"Blitzkrieg","rarity":5,"endlineTag":"hr","attack":200,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","17b"],["defense_boost_1","17a"],["attack_boost_1","9b"]]],"baseSharpness":[60,50,130,100,10,0,0],"maxSharpness":[60,50,130,100,40,20,0],"switchaxeStats":{"phialType":"paralysis_phial","phialValue":15}}]],["Baggi Tree",[{"id":"18a","name":"Snowfall Axe I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",13]],"rampSkills":[[["affinity_boost_1",null],["sleep_boost_1",null],["buddy_rally",null],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"baseSharpness":[100,40,40,20,0,0,0],"maxSharpness":[100,40,40,70,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"18b","name":"Snowfall Axe II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",16]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_1",null],["buddy_rally",null],["affinity_boost_1","18a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"baseSharpness":[100,60,50,40,0,0,0],"maxSharpness":[100,60,50,90,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"18c","name":"Snowfall Axe III","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",20]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_2",null],["buddy_rally",null],["sleep_boost_1","18b"],["affinity_boost_1","18a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"baseSharpness":[100,70,60,70,0,0,0],"maxSharpness":[100,70,60,90,30,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"18d","name":"Dewdrop Dream","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",22]],"rampSkills":[[["affinity_boost_3",null],["sleep_boost_2",null],["buddy_rally",null],["affinity_boost_2","18c"],["sleep_boost_1","18b"],["affinity_boost_1","18a"],["attack_boost_1","9a"],["defense_boost_2","9a"]]],"baseSharpness":[100,90,80,60,20,0,0],"maxSharpness":[100,90,80,60,70,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Bone Tree",[{"id":"19a","name":"Bone Axe I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"19b","name":"Bone Axe II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"19c","name":"Daidalos Axe","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","19b"]]],"baseSharpness":[100,40,60,0,0,0,0],"maxSharpness":[100,40,110,0,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"19d","name":"Power Gasher I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[100,70,70,10,0,0,0],"maxSharpness":[100,70,70,60,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"19e","name":"Power Gasher II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,60,40,0,0,0],"maxSharpness":[80,70,60,80,10,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"19f","name":"Maximal Gasher","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","19e"],["attack_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,100,20,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Anjanath Tree",[{"id":"20a","name":"Flammenbeil I","rarity":5,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",14]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_1",null],["brutal_strike",null],["attack_boost_3","19e"],["affinity_boost_2","19e"],["dulling_strike","19e"],["attack_boost_2","19d"],["defense_boost_1","19c"]]],"baseSharpness":[140,120,40,50,0,0,0],"maxSharpness":[140,120,40,80,20,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"20b","name":"Flammenbeil II","rarity":6,"endlineTag":"","attack":220,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",17]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["fire_boost_1","20a"],["attack_boost_3","19e"],["affinity_boost_2","19e"],["dulling_strike","19e"],["attack_boost_2","19d"],["defense_boost_1","19c"]]],"baseSharpness":[130,120,40,50,10,0,0],"maxSharpness":[130,120,40,50,60,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"20c","name":"Gnashing Flammenbeil","rarity":6,"endlineTag":"hr","attack":230,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",20]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","20b"],["fire_boost_2","20b"],["fire_boost_1","20a"],["attack_boost_3","19e"],["dulling_strike","19e"],["attack_boost_2","19d"],["defense_boost_1","19c"]]],"baseSharpness":[120,120,40,50,20,0,0],"maxSharpness":[120,120,40,50,70,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Tigrex Tree",[{"id":"21a","name":"Rex Slasher I","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":17}},{"id":"21b","name":"Rex Slasher II","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","21a"],["dulling_strike","19d"],["defense_boost_1","19c"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,50,30,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":20}},{"id":"21c","name":"Rex Gnasher","rarity":6,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","21b"],["affinity_boost_1","21a"],["dulling_strike","19d"],["defense_boost_1","19c"]]],"baseSharpness":[50,40,120,120,40,30,0],"maxSharpness":[50,40,120,120,40,30,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":24}}]],["Diablos Tree",[{"id":"22a","name":"Axe Semper Tyrannis I","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":15,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","21a"],["brutal_strike","21a"],["affinity_boost_2","19d"]]],"baseSharpness":[50,160,30,110,0,0,0],"maxSharpness":[50,160,30,110,40,10,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":12}},{"id":"22b","name":"Axe Semper Tyrannis II","rarity":6,"endlineTag":"","attack":230,"affinity":-15,"defense":15,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_1",null],["dulling_strike",null],["affinity_boost_1","22a"],["attack_boost_2","21a"],["brutal_strike","21a"]]],"baseSharpness":[50,160,20,120,0,0,0],"maxSharpness":[50,160,20,120,30,20,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":14}},{"id":"22c","name":"Grand Chaos","rarity":7,"endlineTag":"hr","attack":240,"affinity":-15,"defense":15,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["affinity_boost_2","22b"],["defense_boost_1","22b"],["affinity_boost_1","22a"],["attack_boost_2","21a"],["brutal_strike","21a"]]],"baseSharpness":[50,160,10,130,0,0,0],"maxSharpness":[50,160,10,130,20,30,0],"switchaxeStats":{"phialType":"exhaust_phial","phialValue":16}}]],["Remobra Tree",[{"id":"23a","name":"Venom Hatchet I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",27]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["dulling_strike",null],["affinity_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,70,70,50,0,0,0],"maxSharpness":[60,70,70,100,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"23b","name":"Venom Hatchet II","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",34]],"rampSkills":[[["attack_boost_3",null],["poison_boost_1",null],["dulling_strike",null],["attack_boost_2","23a"],["affinity_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,60,60,70,0,0,0],"maxSharpness":[60,60,60,120,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"23c","name":"Mortal Serpent","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["poison",40]],"rampSkills":[[["attack_boost_4",null],["poison_boost_1",null],["coating_switch_boost",null],["attack_boost_3","23b"],["dulling_strike","23b"],["attack_boost_2","23a"],["affinity_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[70,70,60,70,30,0,0],"maxSharpness":[70,70,60,70,60,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Nargacuga Tree",[{"id":"24a","name":"Hidden Axe I","rarity":3,"endlineTag":"","attack":100,"affinity":40,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["boost_equipped_coating",null],["poison_boost_1","23a"],["dulling_strike","23a"],["affinity_boost_2","19c"],["defense_boost_1","19c"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0],"switchaxeStats":{"phialType":"poison_phial","phialValue":12}},{"id":"24b","name":"Hidden Axe II","rarity":5,"endlineTag":"","attack":160,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["boost_equipped_coating",null],["attack_boost_2","24a"],["poison_boost_1","23a"],["dulling_strike","23a"],["affinity_boost_2","19c"],["defense_boost_1","19c"]]],"baseSharpness":[50,70,80,100,50,0,0],"maxSharpness":[50,70,80,100,80,20,0],"switchaxeStats":{"phialType":"poison_phial","phialValue":15}},{"id":"24c","name":"Night\'s Crescent","rarity":6,"endlineTag":"hr","attack":180,"affinity":40,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["boost_equipped_coating",null],["affinity_boost_1","24b"],["attack_boost_2","24a"],["poison_boost_1","23a"],["dulling_strike","23a"],["defense_boost_1","19c"]]],"baseSharpness":[50,70,100,100,60,20,0],"maxSharpness":[50,70,100,100,60,20,0],"switchaxeStats":{"phialType":"poison_phial","phialValue":17}}]],["Volvidon Tree",[{"id":"25a","name":"Binding Roller I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",10]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[140,40,40,30,0,0,0],"maxSharpness":[140,40,40,80,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"25b","name":"Binding Roller II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",11]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["dulling_strike",null],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[140,30,40,40,0,0,0],"maxSharpness":[140,30,40,60,30,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"25c","name":"Binding Roller III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",13]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["dulling_strike",null],["defense_boost_1","25b"],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[150,40,40,70,0,0,0],"maxSharpness":[150,40,40,70,50,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"25d","name":"Vermilingua","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",16]],"rampSkills":[[["attack_boost_4",null],["defense_boost_2",null],["dulling_strike",null],["attack_boost_3","25c"],["defense_boost_1","25b"],["attack_boost_2","19c"],["affinity_boost_2","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[160,50,50,60,30,0,0],"maxSharpness":[160,50,50,60,70,10,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Royal Ludroth Tree",[{"id":"26a","name":"Ludroth Axe I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",18]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[40,70,50,40,0,0,0],"maxSharpness":[40,70,50,90,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"26b","name":"Ludroth Axe II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",26]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,80,70,50,0,0,0],"maxSharpness":[50,80,70,100,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"26c","name":"Splish Splax","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",33]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","26b"],["water_boost_1","26b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[50,80,80,70,20,0,0],"maxSharpness":[50,80,80,70,40,30,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Zinogre Tree",[{"id":"27a","name":"Usurper\'s Downpour I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",25]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_2","26b"],["water_boost_1","26b"],["waterblight_exploit","26b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,40,90,50,0,0,0],"maxSharpness":[70,40,90,80,20,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"27b","name":"Usurper\'s Downpour II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",28]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","27a"],["water_boost_1","26b"],["waterblight_exploit","26b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,40,160,60,20,0,0],"maxSharpness":[70,40,160,60,70,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"27c","name":"Despot\'s Cloudburst","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",32]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","27b"],["attack_boost_1","27a"],["water_boost_1","26b"],["waterblight_exploit","26b"],["affinity_boost_1","19b"],["defense_boost_1","19b"]]],"baseSharpness":[70,40,120,80,40,0,0],"maxSharpness":[70,40,120,80,50,40,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Lagombi Tree",[{"id":"28a","name":"Longear Axe I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",12]],"rampSkills":[[["attack_boost_1",null],["ice_boost_1",null],["small_monster_exploit",null],["attack_boost_2","19a"],["affinity_boost_1","19a"],["defense_boost_1","19a"]]],"baseSharpness":[70,60,50,20,0,0,0],"maxSharpness":[70,60,50,70,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"28b","name":"Longear Axe II","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_1",null],["ice_boost_2",null],["small_monster_exploit",null],["ice_boost_1","28a"],["attack_boost_2","19a"],["affinity_boost_1","19a"],["defense_boost_1","19a"]]],"baseSharpness":[70,50,90,40,0,0,0],"maxSharpness":[70,50,90,90,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"28c","name":"Longear Axe III","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",17]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["coating_switch_boost",null],["attack_boost_1","28b"],["small_monster_exploit","28b"],["ice_boost_1","28a"],["affinity_boost_1","19a"],["defense_boost_1","19a"]]],"baseSharpness":[60,30,100,100,10,0,0],"maxSharpness":[60,30,100,100,60,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"28d","name":"Longear Weiss","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_2",null],["ice_boost_2",null],["coating_switch_boost",null],["attack_boost_1","28b"],["small_monster_exploit","28b"],["ice_boost_1","28a"],["affinity_boost_1","19a"],["defense_boost_1","19a"]]],"baseSharpness":[40,30,100,100,30,0,0],"maxSharpness":[40,30,100,100,60,20,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Magnamalo Tree",[{"id":"29a","name":"Sinister Axe I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",17]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"29b","name":"Sinister Axe II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",20]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","29a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"29c","name":"Sinister Shadowslice","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",23]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","29b"],["attack_boost_2","29a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Rajang Tree",[{"id":"30a","name":"Undying Axe I","rarity":5,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,120,10,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"30b","name":"Undying Axe II","rarity":6,"endlineTag":"","attack":210,"affinity":15,"defense":0,"decoSlots":[3],"eleStat":[["thunder",20]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","30a"]]],"baseSharpness":[50,50,100,100,0,0,0],"maxSharpness":[50,50,100,120,30,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"30c","name":"Undying Light","rarity":7,"endlineTag":"hr","attack":220,"affinity":15,"defense":0,"decoSlots":[3],"eleStat":[["thunder",22]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","30b"],["thunder_boost_1","30a"]]],"baseSharpness":[50,50,80,120,0,0,0],"maxSharpness":[50,50,80,120,50,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Ibushi Tree",[{"id":"31a","name":"Azure Elder Axe I","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",9]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"31b","name":"Azure Elder Axe II","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",11]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","31a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"31c","name":"Abyssal Gale Axe","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",14]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","31b"],["defense_boost_1","31a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Narwa Tree",[{"id":"32a","name":"Thunderbolt Axe I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",35]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,190,40,30,0,0],"maxSharpness":[20,20,190,40,50,30,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"32b","name":"Abyssal Storm Axe","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",43]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","32a"]]],"baseSharpness":[10,20,220,40,60,0,0],"maxSharpness":[10,20,220,40,70,40,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Bazelgeuse Tree",[{"id":"33a","name":"Rookslayer Axe I","rarity":6,"endlineTag":"","attack":200,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[["blast",13]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[70,60,70,80,20,0,0],"maxSharpness":[70,60,70,80,70,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"33b","name":"Rookslayer Axe II","rarity":6,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[["blast",15]],"rampSkills":[[["defense_boost_1",null],["blast_boost_2",null],["brutal_strike",null]]],"baseSharpness":[90,80,80,70,30,0,0],"maxSharpness":[90,80,80,70,70,10,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"33c","name":"Bazelrush Rookslayer","rarity":7,"endlineTag":"hr","attack":220,"affinity":-15,"defense":0,"decoSlots":[1],"eleStat":[["blast",17]],"rampSkills":[[["defense_boost_2",null],["blast_boost_3",null],["brutal_strike",null],["defense_boost_1","33b"],["blast_boost_2","33b"]]],"baseSharpness":[90,80,80,60,40,0,0],"maxSharpness":[90,80,80,60,70,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Kushala Daora Tree",[{"id":"34a","name":"Daora\'s Farasa I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",39]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[100,80,80,50,40,0,0],"maxSharpness":[100,80,80,50,60,30,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"34b","name":"Daora\'s Janah","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[["ice",41]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","34a"],["affinity_boost_2","34a"]]],"baseSharpness":[100,70,80,50,40,10,0],"maxSharpness":[100,70,80,50,40,60,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Teostra Tree",[{"id":"35a","name":"Teostra\'s Arx I","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["blast",31]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[100,90,80,60,20,0,0],"maxSharpness":[100,90,80,60,60,10,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"35b","name":"Teostra\'s Castle","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["blast",36]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","35a"]]],"baseSharpness":[100,90,80,50,30,0,0],"maxSharpness":[100,90,80,50,60,20,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Chameleos Tree",[{"id":"36a","name":"Waxglare Wand I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["poison",24]],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["chameleos_soul",null]]],"baseSharpness":[80,30,80,90,70,0,0],"maxSharpness":[80,30,80,90,70,50,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"36b","name":"Balor\'s Mirage","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["poison",28]],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["chameleos_soul",null],["attack_boost_2","36a"]]],"baseSharpness":[50,30,100,90,80,0,0],"maxSharpness":[50,30,100,90,80,50,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Valstrax Tree",[{"id":"37a","name":"Redwing Switch Axe I","rarity":6,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",32]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"37b","name":"Reddnaught Dunat","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",37]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Smithy Tree",[{"id":"38a","name":"Origami Axe I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["coating_switch_boost",null]]],"baseSharpness":[90,70,50,30,10,0,0],"maxSharpness":[90,70,50,30,60,0,0],"switchaxeStats":{"phialType":"dragon_phial","phialValue":13}},{"id":"38b","name":"Origami Axe II","rarity":4,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["coating_switch_boost",null],["affinity_boost_2","38a"]]],"baseSharpness":[110,80,60,30,20,0,0],"maxSharpness":[110,80,60,30,70,0,0],"switchaxeStats":{"phialType":"dragon_phial","phialValue":15}},{"id":"38c","name":"Petal Cloud","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_4",null],["coating_switch_boost",null],["affinity_boost_3","38b"],["affinity_boost_2","38a"]]],"baseSharpness":[120,90,70,30,20,20,0],"maxSharpness":[120,90,70,30,20,70,0],"switchaxeStats":{"phialType":"dragon_phial","phialValue":17}}]],["Felyne Tree",[{"id":"39a","name":"Grim Cat I","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["paralysis",23]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["paralysis_boost_1",null]]],"baseSharpness":[50,80,90,80,0,0,0],"maxSharpness":[50,80,90,100,30,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"39b","name":"Grim Cat II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["paralysis",25]],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["paralysis_boost_1",null],["affinity_boost_1","39a"]]],"baseSharpness":[50,80,100,120,0,0,0],"maxSharpness":[50,80,100,120,50,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"39c","name":"Grimmige Katze","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["paralysis",27]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_3",null],["paralysis_boost_1",null],["attack_boost_1","39b"],["affinity_boost_2","39b"],["affinity_boost_1","39a"]]],"baseSharpness":[50,80,90,120,10,0,0],"maxSharpness":[50,80,90,120,60,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Death Stench Tree",[{"id":"40a","name":"Infernal Axe I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",18]],"rampSkills":[[["attack_boost_2",null],["dragon_boost_1",null],["wyvern_exploit",null]]],"baseSharpness":[150,30,30,40,0,0,0],"maxSharpness":[150,30,30,90,0,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"40b","name":"Infernal Axe II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",20]],"rampSkills":[[["attack_boost_3",null],["dragon_boost_1",null],["wyvern_exploit",null],["attack_boost_2","40a"]]],"baseSharpness":[150,20,20,60,0,0,0],"maxSharpness":[150,20,20,90,20,0,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}},{"id":"40c","name":"Hellish Edge","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[["dragon",24]],"rampSkills":[[["attack_boost_4",null],["dragon_boost_2",null],["wyvern_exploit",null],["attack_boost_3","40b"],["dragon_boost_1","40b"],["attack_boost_2","40a"]]],"baseSharpness":[160,20,20,130,20,0,0],"maxSharpness":[160,20,20,130,60,10,0],"switchaxeStats":{"phialType":"element_phial","phialValue":null}}]],["Shell-Studded Tree",[{"id":"41a","name":"Sleepy Shellslice I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["sleep",14]],"rampSkills":[[["defense_boost_1",null],["sleep_boost_1",null],["anti_aquatic_species",null]]],"baseSharpness":[50,60,90,0,0,0,0],"maxSharpness":[50,60,140,0,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"41b","name":"Sleepy Shellslice II","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":15,"decoSlots":[],"eleStat":[["sleep",19]],"rampSkills":[[["defense_boost_2",null],["sleep_boost_1",null],["anti_aquatic_species",null],["defense_boost_1","41a"]]],"baseSharpness":[50,90,90,20,0,0,0],"maxSharpness":[50,90,90,60,10,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"41c","name":"Schale Batis","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":20,"decoSlots":[2,1,1],"eleStat":[["sleep",23]],"rampSkills":[[["defense_boost_3",null],["sleep_boost_2",null],["anti_aquatic_species",null],["defense_boost_2","41b"],["sleep_boost_1","41b"],["defense_boost_1","41a"]]],"baseSharpness":[60,90,100,50,0,0,0],"maxSharpness":[60,90,100,60,40,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]],["Rampage Tree",[{"id":"ra","name":"Rampage Slicer I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null],["phial_element",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"rb","name":"Rampage Slicer II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["elemental_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null],["phial_element",null],["phial_poison_1",null],["phial_paralysis_1",null],["phial_dragon_1",null],["phial_exhaust_1",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"rc","name":"Rampage Slicer III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null],["phial_element",null],["phial_poison_1",null],["phial_paralysis_1",null],["phial_dragon_1",null],["phial_exhaust_1",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"rd","name":"Rampage Slicer IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null],["phial_element",null],["phial_poison_2",null],["phial_paralysis_2",null],["phial_dragon_2",null],["phial_exhaust_2",null],["phial_poison_1","rc"],["phial_paralysis_1","rc"],["phial_dragon_1","rc"],["phial_exhaust_1","rc"]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"re","name":"Rampage Slicer V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_2",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["phial_element",null],["phial_poison_2",null],["phial_paralysis_2",null],["phial_dragon_2",null],["phial_exhaust_2",null],["phial_poison_1","rc"],["phial_paralysis_1","rc"],["phial_dragon_1","rc"],["phial_exhaust_1","rc"]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}},{"id":"rf","name":"Rampage Slicer S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_2",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["elemental_boost_1","rc"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null],["phial_element",null],["phial_poison_3",null],["phial_paralysis_3",null],["phial_dragon_3",null],["phial_exhaust_3",null],["phial_poison_2","re"],["phial_paralysis_2","re"],["phial_dragon_2","re"],["phial_exhaust_2","re"],["phial_poison_1","rc"],["phial_paralysis_1","rc"],["phial_dragon_1","rc"],["phial_exhaust_1","rc"]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0],"switchaxeStats":{"phialType":"power_phial","phialValue":null}}]]]}';
 
-export const switchaxesArray: Readonly<SwitchAxe[]> = [
-    __generated_switchaxe__1a,
-    __generated_switchaxe__1b,
-    __generated_switchaxe__1c,
-    __generated_switchaxe__1d,
-    __generated_switchaxe__1e,
-    __generated_switchaxe__1f,
-    __generated_switchaxe__2a,
-    __generated_switchaxe__2b,
-    __generated_switchaxe__2c,
-    __generated_switchaxe__3a,
-    __generated_switchaxe__3b,
-    __generated_switchaxe__3c,
-    __generated_switchaxe__3d,
-    __generated_switchaxe__4a,
-    __generated_switchaxe__4b,
-    __generated_switchaxe__4c,
-    __generated_switchaxe__5a,
-    __generated_switchaxe__5b,
-    __generated_switchaxe__5c,
-    __generated_switchaxe__6a,
-    __generated_switchaxe__6b,
-    __generated_switchaxe__6c,
-    __generated_switchaxe__7a,
-    __generated_switchaxe__7b,
-    __generated_switchaxe__7c,
-    __generated_switchaxe__8a,
-    __generated_switchaxe__8b,
-    __generated_switchaxe__8c,
-    __generated_switchaxe__8d,
-    __generated_switchaxe__9a,
-    __generated_switchaxe__9b,
-    __generated_switchaxe__9c,
-    __generated_switchaxe__9d,
-    __generated_switchaxe__9e,
-    __generated_switchaxe__9f,
-    __generated_switchaxe__10a,
-    __generated_switchaxe__10b,
-    __generated_switchaxe__10c,
-    __generated_switchaxe__11a,
-    __generated_switchaxe__11b,
-    __generated_switchaxe__11c,
-    __generated_switchaxe__12a,
-    __generated_switchaxe__12b,
-    __generated_switchaxe__12c,
-    __generated_switchaxe__13a,
-    __generated_switchaxe__13b,
-    __generated_switchaxe__13c,
-    __generated_switchaxe__14a,
-    __generated_switchaxe__14b,
-    __generated_switchaxe__14c,
-    __generated_switchaxe__15a,
-    __generated_switchaxe__15b,
-    __generated_switchaxe__15c,
-    __generated_switchaxe__16a,
-    __generated_switchaxe__16b,
-    __generated_switchaxe__16c,
-    __generated_switchaxe__16d,
-    __generated_switchaxe__17a,
-    __generated_switchaxe__17b,
-    __generated_switchaxe__17c,
-    __generated_switchaxe__18a,
-    __generated_switchaxe__18b,
-    __generated_switchaxe__18c,
-    __generated_switchaxe__18d,
-    __generated_switchaxe__19a,
-    __generated_switchaxe__19b,
-    __generated_switchaxe__19c,
-    __generated_switchaxe__19d,
-    __generated_switchaxe__19e,
-    __generated_switchaxe__19f,
-    __generated_switchaxe__20a,
-    __generated_switchaxe__20b,
-    __generated_switchaxe__20c,
-    __generated_switchaxe__21a,
-    __generated_switchaxe__21b,
-    __generated_switchaxe__21c,
-    __generated_switchaxe__22a,
-    __generated_switchaxe__22b,
-    __generated_switchaxe__22c,
-    __generated_switchaxe__23a,
-    __generated_switchaxe__23b,
-    __generated_switchaxe__23c,
-    __generated_switchaxe__24a,
-    __generated_switchaxe__24b,
-    __generated_switchaxe__24c,
-    __generated_switchaxe__25a,
-    __generated_switchaxe__25b,
-    __generated_switchaxe__25c,
-    __generated_switchaxe__25d,
-    __generated_switchaxe__26a,
-    __generated_switchaxe__26b,
-    __generated_switchaxe__26c,
-    __generated_switchaxe__27a,
-    __generated_switchaxe__27b,
-    __generated_switchaxe__27c,
-    __generated_switchaxe__28a,
-    __generated_switchaxe__28b,
-    __generated_switchaxe__28c,
-    __generated_switchaxe__28d,
-    __generated_switchaxe__29a,
-    __generated_switchaxe__29b,
-    __generated_switchaxe__29c,
-    __generated_switchaxe__30a,
-    __generated_switchaxe__30b,
-    __generated_switchaxe__30c,
-    __generated_switchaxe__31a,
-    __generated_switchaxe__31b,
-    __generated_switchaxe__31c,
-    __generated_switchaxe__32a,
-    __generated_switchaxe__32b,
-    __generated_switchaxe__33a,
-    __generated_switchaxe__33b,
-    __generated_switchaxe__33c,
-    __generated_switchaxe__34a,
-    __generated_switchaxe__34b,
-    __generated_switchaxe__35a,
-    __generated_switchaxe__35b,
-    __generated_switchaxe__36a,
-    __generated_switchaxe__36b,
-    __generated_switchaxe__37a,
-    __generated_switchaxe__37b,
-    __generated_switchaxe__38a,
-    __generated_switchaxe__38b,
-    __generated_switchaxe__38c,
-    __generated_switchaxe__39a,
-    __generated_switchaxe__39b,
-    __generated_switchaxe__39c,
-    __generated_switchaxe__40a,
-    __generated_switchaxe__40b,
-    __generated_switchaxe__40c,
-    __generated_switchaxe__41a,
-    __generated_switchaxe__41b,
-    __generated_switchaxe__41c,
-    __generated_switchaxe__ra,
-    __generated_switchaxe__rb,
-    __generated_switchaxe__rc,
-    __generated_switchaxe__rd,
-    __generated_switchaxe__re,
-    __generated_switchaxe__rf,
-];
+export const switchaxesArray: Readonly<SwitchAxe[]> = loadWeaponPayload<SwitchAxe>(payload);
@@ -36,5224 +36,13 @@
  */
 
 import {
-    type EleStatStr,
     type SwordAndShield,
 } from "../../common/types";
-import {
-    FrozenMap,
-} from "../../generic/frozen-containers";
 
 import {
-    __generated_ramp__affinity_boost_1,
-    __generated_ramp__affinity_boost_2,
-    __generated_ramp__affinity_boost_3,
-    __generated_ramp__affinity_boost_4,
-    __generated_ramp__affinity_surge,
-    __generated_ramp__anti_aerial_species,
-    __generated_ramp__anti_aquatic_species,
-    __generated_ramp__attack_boost_1,
-    __generated_ramp__attack_boost_2,
-    __generated_ramp__attack_boost_3,
-    __generated_ramp__attack_boost_4,
-    __generated_ramp__attack_surge,
-    __generated_ramp__blast_1,
-    __generated_ramp__blast_2,
-    __generated_ramp__blast_boost_1,
-    __generated_ramp__blast_boost_2,
-    __generated_ramp__brutal_strike,
-    __generated_ramp__buddy_rally,
-    __generated_ramp__defense_boost_1,
-    __generated_ramp__defense_boost_2,
-    __generated_ramp__defense_boost_3,
-    __generated_ramp__dragon_1,
-    __generated_ramp__dragon_2,
-    __generated_ramp__dragon_3,
-    __generated_ramp__dragon_boost_3,
-    __generated_ramp__dragon_boost_4,
-    __generated_ramp__dulling_strike,
-    __generated_ramp__element_exploit,
-    __generated_ramp__elemental_boost_1,
-    __generated_ramp__elemental_surge,
-    __generated_ramp__fire_1,
-    __generated_ramp__fire_2,
-    __generated_ramp__fire_3,
-    __generated_ramp__fire_boost_1,
-    __generated_ramp__fire_boost_2,
-    __generated_ramp__fire_boost_3,
-    __generated_ramp__fireblight_exploit,
-    __generated_ramp__ibushi_soul,
-    __generated_ramp__ice_1,
-    __generated_ramp__ice_2,
-    __generated_ramp__ice_3,
-    __generated_ramp__ice_boost_1,
-    __generated_ramp__ice_boost_2,
-    __generated_ramp__ice_boost_3,
-    __generated_ramp__ice_boost_4,
-    __generated_ramp__iceblight_exploit,
-    __generated_ramp__kushala_daora_soul,
-    __generated_ramp__magnamalo_soul,
-    __generated_ramp__master_rider,
-    __generated_ramp__narwa_soul,
-    __generated_ramp__non_elemental_boost,
-    __generated_ramp__paralysis_1,
-    __generated_ramp__paralysis_2,
-    __generated_ramp__paralysis_boost_1,
-    __generated_ramp__paralysis_boost_2,
-    __generated_ramp__poison_1,
-    __generated_ramp__poison_2,
-    __generated_ramp__poison_boost_1,
-    __generated_ramp__poison_boost_2,
-    __generated_ramp__sharpness_type_1,
-    __generated_ramp__sharpness_type_2,
-    __generated_ramp__sharpness_type_3,
-    __generated_ramp__sharpness_type_4,
-    __generated_ramp__silkbind_boost,
-    __generated_ramp__sleep_1,
-    __generated_ramp__sleep_2,
-    __generated_ramp__sleep_boost_1,
-    __generated_ramp__sleep_boost_2,
-    __generated_ramp__small_monster_exploit,
-    __generated_ramp__spiribird_doubled,
-    __generated_ramp__teostra_soul,
-    __generated_ramp__thunder_1,
-    __generated_ramp__thunder_2,
-    __generated_ramp__thunder_3,
-    __generated_ramp__thunder_boost_1,
-    __generated_ramp__thunder_boost_2,
-    __generated_ramp__thunderblight_exploit,
-    __generated_ramp__valstrax_soul,
-    __generated_ramp__water_1,
-    __generated_ramp__water_2,
-    __generated_ramp__water_3,
-    __generated_ramp__water_boost_1,
-    __generated_ramp__water_boost_2,
-    __generated_ramp__water_boost_3,
-    __generated_ramp__waterblight_exploit,
-    __generated_ramp__wyvern_exploit,
-} from "./_generated_rampage_skills";
-
-const __generated_swordandshield__1a: SwordAndShield = {
-    category: "swordandshield",
-    id: "1a",
-
-    name: "Kamura Sword I",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 50,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [50, 90, 60, 0, 0, 0, 0],
-    maxSharpness:  [50, 90, 100, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraswordi",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_swordandshield__1b: SwordAndShield = {
-    category: "swordandshield",
-    id: "1b",
-
-    name: "Kamura Sword II",
-    treeName: "Kamura Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [60, 70, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraswordii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_swordandshield__1c: SwordAndShield = {
-    category: "swordandshield",
-    id: "1c",
-
-    name: "Kamura Sword III",
-    treeName: "Kamura Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 30, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraswordiii",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_swordandshield__1d: SwordAndShield = {
-    category: "swordandshield",
-    id: "1d",
-
-    name: "Kamura Sword IV",
-    treeName: "Kamura Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraswordiv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_swordandshield__1e: SwordAndShield = {
-    category: "swordandshield",
-    id: "1e",
-
-    name: "Kamura Sword V",
-    treeName: "Kamura Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__1d],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1d],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 80, 90, 40, 30, 0, 0],
-    maxSharpness:  [60, 80, 90, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraswordv",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_swordandshield__1f: SwordAndShield = {
-    category: "swordandshield",
-    id: "1f",
-
-    name: "Kamura Ninja Sword",
-    treeName: "Kamura Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_3, __generated_swordandshield__1e],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__1d],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1d],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 60, 60, 50, 0, 0],
-    maxSharpness:  [40, 90, 60, 60, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "kamuraninjasword",
-        treeNameLower: "kamuratree",
-    },
-};
-
-const __generated_swordandshield__2a: SwordAndShield = {
-    category: "swordandshield",
-    id: "2a",
-
-    name: "Hidden Edge I",
-    treeName: "Nargacuga Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 100, 0, 0, 0],
-    maxSharpness:  [50, 70, 80, 100, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenedgei",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_swordandshield__2b: SwordAndShield = {
-    category: "swordandshield",
-    id: "2b",
-
-    name: "Hidden Edge II",
-    treeName: "Nargacuga Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__2a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 100, 50, 0, 0],
-    maxSharpness:  [100, 30, 70, 100, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "hiddenedgeii",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_swordandshield__2c: SwordAndShield = {
-    category: "swordandshield",
-    id: "2c",
-
-    name: "Flash in the Night",
-    treeName: "Nargacuga Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__2b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__2a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 110, 90, 60, 30, 0],
-    maxSharpness:  [70, 40, 110, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "flashinthenight",
-        treeNameLower: "nargacugatree",
-    },
-};
-
-const __generated_swordandshield__3a: SwordAndShield = {
-    category: "swordandshield",
-    id: "3a",
-
-    name: "Hana no Nagoriwo I",
-    treeName: "Mizutsune Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 40, 30, 70, 0, 0, 0],
-    maxSharpness:  [110, 40, 30, 90, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hananonagoriwoi",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_swordandshield__3b: SwordAndShield = {
-    category: "swordandshield",
-    id: "3b",
-
-    name: "Hana no Nagoriwo II",
-    treeName: "Mizutsune Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__3a],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__3a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 90, 50, 50, 50, 0, 0],
-    maxSharpness:  [110, 90, 50, 50, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "hananonagoriwoii",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_swordandshield__3c: SwordAndShield = {
-    category: "swordandshield",
-    id: "3c",
-
-    name: "Kurenawi Ougi",
-    treeName: "Mizutsune Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__3b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__3a],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__3a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 50, 50, 70, 0, 0],
-    maxSharpness:  [110, 70, 50, 50, 70, 50, 0],
-
-    filterHelpers: {
-        nameLower: "kurenawiougi",
-        treeNameLower: "mizutsunetree",
-    },
-};
-
-const __generated_swordandshield__4a: SwordAndShield = {
-    category: "swordandshield",
-    id: "4a",
-
-    name: "Exorcising Sword I",
-    treeName: "Bishaten Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 140, 40, 40, 0, 0, 0],
-    maxSharpness:  [30, 140, 40, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "exorcisingswordi",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_swordandshield__4b: SwordAndShield = {
-    category: "swordandshield",
-    id: "4b",
-
-    name: "Exorcising Sword II",
-    treeName: "Bishaten Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__4a],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [20, 160, 50, 40, 30, 0, 0],
-    maxSharpness:  [20, 160, 50, 40, 40, 40, 0],
-
-    filterHelpers: {
-        nameLower: "exorcisingswordii",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_swordandshield__4c: SwordAndShield = {
-    category: "swordandshield",
-    id: "4c",
-
-    name: "Shaucha Pureblade",
-    treeName: "Bishaten Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__4a],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 170, 70, 40, 40, 0, 0],
-    maxSharpness:  [30, 170, 70, 40, 40, 50, 0],
-
-    filterHelpers: {
-        nameLower: "shauchapureblade",
-        treeNameLower: "bishatentree",
-    },
-};
-
-const __generated_swordandshield__5a: SwordAndShield = {
-    category: "swordandshield",
-    id: "5a",
-
-    name: "Usurper's Fogobolt I",
-    treeName: "Zinogre Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__anti_aerial_species, __generated_swordandshield__4a],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__4a],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 90, 50, 0, 0, 0],
-    maxSharpness:  [70, 40, 90, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sfirebolti",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_swordandshield__5b: SwordAndShield = {
-    category: "swordandshield",
-    id: "5b",
-
-    name: "Usurper's Fogobolt II",
-    treeName: "Zinogre Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__5a],
-            [__generated_ramp__anti_aerial_species, __generated_swordandshield__4a],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__4a],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 70, 80, 40, 0, 0],
-    maxSharpness:  [70, 40, 70, 80, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "usurper'sfireboltii",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_swordandshield__5c: SwordAndShield = {
-    category: "swordandshield",
-    id: "5c",
-
-    name: "Despot's Crookbolt",
-    treeName: "Zinogre Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__thunder_boost_1, __generated_swordandshield__5b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__5a],
-            [__generated_ramp__anti_aerial_species, __generated_swordandshield__4a],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__4a],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__1c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 40, 100, 90, 50, 0, 0],
-    maxSharpness:  [70, 40, 100, 90, 60, 40, 0],
-
-    filterHelpers: {
-        nameLower: "despot'scrookbolt",
-        treeNameLower: "zinogretree",
-    },
-};
-
-const __generated_swordandshield__6a: SwordAndShield = {
-    category: "swordandshield",
-    id: "6a",
-
-    name: "Dirty Baron I",
-    treeName: "Wroggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 40, 30, 0, 0, 0],
-    maxSharpness:  [90, 40, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dirtybaroni",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_swordandshield__6b: SwordAndShield = {
-    category: "swordandshield",
-    id: "6b",
-
-    name: "Dirty Baron II",
-    treeName: "Wroggi Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__6a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [130, 40, 40, 40, 0, 0, 0],
-    maxSharpness:  [130, 40, 40, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dirtybaronii",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_swordandshield__6c: SwordAndShield = {
-    category: "swordandshield",
-    id: "6c",
-
-    name: "Dirty Marquis",
-    treeName: "Wroggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__6b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__6a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [130, 60, 40, 70, 0, 0, 0],
-    maxSharpness:  [130, 60, 40, 90, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "dirtymarquis",
-        treeNameLower: "wroggitree",
-    },
-};
-
-const __generated_swordandshield__7a: SwordAndShield = {
-    category: "swordandshield",
-    id: "7a",
-
-    name: "Royal Claw I",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 70, 40, 0, 0, 0],
-    maxSharpness:  [50, 40, 70, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "royalclawi",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_swordandshield__7b: SwordAndShield = {
-    category: "swordandshield",
-    id: "7b",
-
-    name: "Royal Claw II",
-    treeName: "Royal Ludroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 50, 0, 0, 0],
-    maxSharpness:  [50, 60, 90, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "royalclawii",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_swordandshield__7c: SwordAndShield = {
-    category: "swordandshield",
-    id: "7c",
-
-    name: "Royal Ludroth Claw",
-    treeName: "Royal Ludroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 27]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__waterblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__7b],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__7b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 120, 60, 20, 0, 0],
-    maxSharpness:  [60, 40, 120, 60, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "royalludrothclaw",
-        treeNameLower: "royalludrothtree",
-    },
-};
-
-const __generated_swordandshield__8a: SwordAndShield = {
-    category: "swordandshield",
-    id: "8a",
-
-    name: "Rex Talon I",
-    treeName: "Tigrex Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__7b],
-            [__generated_ramp__waterblight_exploit, __generated_swordandshield__7b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [70, 30, 100, 90, 10, 0, 0],
-    maxSharpness:  [70, 30, 100, 90, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rextaloni",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_swordandshield__8b: SwordAndShield = {
-    category: "swordandshield",
-    id: "8b",
-
-    name: "Rex Talon II",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__8a],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__7b],
-            [__generated_ramp__waterblight_exploit, __generated_swordandshield__7b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 130, 100, 30, 0, 0],
-    maxSharpness:  [50, 40, 130, 100, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "rextalonii",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_swordandshield__8c: SwordAndShield = {
-    category: "swordandshield",
-    id: "8c",
-
-    name: "Tigrex Sword",
-    treeName: "Tigrex Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__8b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__8a],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__7b],
-            [__generated_ramp__waterblight_exploit, __generated_swordandshield__7b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 120, 120, 50, 20, 0],
-    maxSharpness:  [50, 40, 120, 120, 50, 20, 0],
-
-    filterHelpers: {
-        nameLower: "tigrexsword",
-        treeNameLower: "tigrextree",
-    },
-};
-
-const __generated_swordandshield__9a: SwordAndShield = {
-    category: "swordandshield",
-    id: "9a",
-
-    name: "Frost Edge I",
-    treeName: "Ice Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [40, 90, 70, 0, 0, 0, 0],
-    maxSharpness:  [40, 90, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frostedgei",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_swordandshield__9b: SwordAndShield = {
-    category: "swordandshield",
-    id: "9b",
-
-    name: "Frost Edge II",
-    treeName: "Ice Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 70, 30, 0, 0, 0],
-    maxSharpness:  [30, 70, 70, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "frostedgeii",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_swordandshield__9c: SwordAndShield = {
-    category: "swordandshield",
-    id: "9c",
-
-    name: "Hi Frost Edge",
-    treeName: "Ice Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__9b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__1b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__1b],
-        ],
-    ],
-
-    baseSharpness: [30, 60, 110, 70, 30, 0, 0],
-    maxSharpness:  [30, 60, 110, 70, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "hifrostedge",
-        treeNameLower: "icetree",
-    },
-};
-
-const __generated_swordandshield__10a: SwordAndShield = {
-    category: "swordandshield",
-    id: "10a",
-
-    name: "Hunter's Knife I",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 90, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hunter'sknifei",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_swordandshield__10b: SwordAndShield = {
-    category: "swordandshield",
-    id: "10b",
-
-    name: "Hunter's Knife II",
-    treeName: "Ore Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-        ],
-    ],
-
-    baseSharpness: [70, 50, 80, 0, 0, 0, 0],
-    maxSharpness:  [70, 50, 120, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hunter'sknifeii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_swordandshield__10c: SwordAndShield = {
-    category: "swordandshield",
-    id: "10c",
-
-    name: "Fighter Sword",
-    treeName: "Ore Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 60, 20, 0, 0, 0],
-    maxSharpness:  [60, 60, 60, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "fightersword",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_swordandshield__10d: SwordAndShield = {
-    category: "swordandshield",
-    id: "10d",
-
-    name: "Iron Beater I",
-    treeName: "Ore Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [90, 70, 40, 50, 0, 0, 0],
-    maxSharpness:  [90, 70, 40, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ironbeateri",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_swordandshield__10e: SwordAndShield = {
-    category: "swordandshield",
-    id: "10e",
-
-    name: "Iron Beater II",
-    treeName: "Ore Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10d],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [70, 80, 80, 50, 20, 0, 0],
-    maxSharpness:  [70, 80, 80, 50, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "ironbeaterii",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_swordandshield__10f: SwordAndShield = {
-    category: "swordandshield",
-    id: "10f",
-
-    name: "Smithy's Pride",
-    treeName: "Ore Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10e],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10d],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [80, 90, 90, 60, 30, 0, 0],
-    maxSharpness:  [80, 90, 90, 60, 50, 30, 0],
-
-    filterHelpers: {
-        nameLower: "smithy'spride",
-        treeNameLower: "oretree",
-    },
-};
-
-const __generated_swordandshield__11a: SwordAndShield = {
-    category: "swordandshield",
-    id: "11a",
-
-    name: "Soldier's Dagger I",
-    treeName: "Jaggi & Jaggia Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10e],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__10e],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10d],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [150, 50, 40, 60, 0, 0, 0],
-    maxSharpness:  [150, 50, 40, 60, 30, 20, 0],
-
-    filterHelpers: {
-        nameLower: "soldier'sdaggeri",
-        treeNameLower: "jaggi&jaggiatree",
-    },
-};
-
-const __generated_swordandshield__11b: SwordAndShield = {
-    category: "swordandshield",
-    id: "11b",
-
-    name: "Soldier's Dagger II",
-    treeName: "Jaggi & Jaggia Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10e],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__10e],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10d],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [160, 60, 50, 80, 0, 0, 0],
-    maxSharpness:  [160, 60, 50, 80, 20, 30, 0],
-
-    filterHelpers: {
-        nameLower: "soldier'sdaggerii",
-        treeNameLower: "jaggi&jaggiatree",
-    },
-};
-
-const __generated_swordandshield__11c: SwordAndShield = {
-    category: "swordandshield",
-    id: "11c",
-
-    name: "Commander's Dagger",
-    treeName: "Jaggi & Jaggia Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__11b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10e],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__10e],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10d],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 50, 90, 0, 0, 0],
-    maxSharpness:  [160, 50, 50, 90, 10, 40, 0],
-
-    filterHelpers: {
-        nameLower: "commander'sdagger",
-        treeNameLower: "jaggi&jaggiatree",
-    },
-};
-
-const __generated_swordandshield__12a: SwordAndShield = {
-    category: "swordandshield",
-    id: "12a",
-
-    name: "Odyssey Blade I",
-    treeName: "Water Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 40, 60, 20, 0, 0],
-    maxSharpness:  [90, 90, 40, 60, 60, 10, 0],
-
-    filterHelpers: {
-        nameLower: "odysseybladei",
-        treeNameLower: "watertree",
-    },
-};
-
-const __generated_swordandshield__12b: SwordAndShield = {
-    category: "swordandshield",
-    id: "12b",
-
-    name: "Odyssey Blade II",
-    treeName: "Water Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 40, 50, 30, 0, 0],
-    maxSharpness:  [90, 90, 40, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "odysseybladeii",
-        treeNameLower: "watertree",
-    },
-};
-
-const __generated_swordandshield__12c: SwordAndShield = {
-    category: "swordandshield",
-    id: "12c",
-
-    name: "Master Odyssey",
-    treeName: "Water Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__12b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [100, 100, 50, 60, 40, 0, 0],
-    maxSharpness:  [100, 100, 50, 60, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "masterodyssey",
-        treeNameLower: "watertree",
-    },
-};
-
-const __generated_swordandshield__13a: SwordAndShield = {
-    category: "swordandshield",
-    id: "13a",
-
-    name: "Pukei Sword I",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [110, 50, 50, 40, 0, 0, 0],
-    maxSharpness:  [110, 50, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeiswordi",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_swordandshield__13b: SwordAndShield = {
-    category: "swordandshield",
-    id: "13b",
-
-    name: "Pukei Sword II",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__13a],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 70, 90, 20, 0, 0],
-    maxSharpness:  [60, 60, 70, 90, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "pukeiswordii",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_swordandshield__13c: SwordAndShield = {
-    category: "swordandshield",
-    id: "13c",
-
-    name: "Venomedge",
-    treeName: "Pukei-Pukei Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__13b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__13a],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 80, 80, 30, 0, 0],
-    maxSharpness:  [100, 60, 80, 80, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "venomedge",
-        treeNameLower: "pukei-pukeitree",
-    },
-};
-
-const __generated_swordandshield__14a: SwordAndShield = {
-    category: "swordandshield",
-    id: "14a",
-
-    name: "Djinn I",
-    treeName: "Rathalos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [30, 100, 60, 60, 0, 0, 0],
-    maxSharpness:  [30, 100, 60, 100, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "djinni",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_swordandshield__14b: SwordAndShield = {
-    category: "swordandshield",
-    id: "14b",
-
-    name: "Djinn II",
-    treeName: "Rathalos Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [90, 80, 80, 60, 40, 0, 0],
-    maxSharpness:  [90, 80, 80, 60, 90, 0, 0],
-
-    filterHelpers: {
-        nameLower: "djinnii",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_swordandshield__14c: SwordAndShield = {
-    category: "swordandshield",
-    id: "14c",
-
-    name: "Blazing Falchion",
-    treeName: "Rathalos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__14b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__13a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [50, 40, 110, 100, 50, 0, 0],
-    maxSharpness:  [50, 40, 110, 100, 90, 10, 0],
-
-    filterHelpers: {
-        nameLower: "blazingfalchion",
-        treeNameLower: "rathalostree",
-    },
-};
-
-const __generated_swordandshield__15a: SwordAndShield = {
-    category: "swordandshield",
-    id: "15a",
-
-    name: "Icicle Spike I",
-    treeName: "Barioth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [50, 60, 70, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "iciclespikei",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_swordandshield__15b: SwordAndShield = {
-    category: "swordandshield",
-    id: "15b",
-
-    name: "Icicle Spike II",
-    treeName: "Barioth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 30,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__15a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 70, 100, 20, 0, 0],
-    maxSharpness:  [40, 70, 70, 100, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "iciclespikeii",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_swordandshield__15c: SwordAndShield = {
-    category: "swordandshield",
-    id: "15c",
-
-    name: "Nardebosche",
-    treeName: "Barioth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 35,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 20]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__iceblight_exploit, null],
-            [__generated_ramp__attack_boost_3, __generated_swordandshield__15b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__15a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10c],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10c],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 80, 70, 0, 0],
-    maxSharpness:  [50, 70, 80, 80, 90, 30, 0],
-
-    filterHelpers: {
-        nameLower: "nardebosche",
-        treeNameLower: "bariothtree",
-    },
-};
-
-const __generated_swordandshield__16a: SwordAndShield = {
-    category: "swordandshield",
-    id: "16a",
-
-    name: "Cunning Riposte I",
-    treeName: "Tetranadon Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 8]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 80, 20, 0, 0, 0],
-    maxSharpness:  [30, 70, 80, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cunningripostei",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_swordandshield__16b: SwordAndShield = {
-    category: "swordandshield",
-    id: "16b",
-
-    name: "Cunning Riposte II",
-    treeName: "Tetranadon Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__16a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 100, 50, 0, 0, 0],
-    maxSharpness:  [30, 70, 100, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "cunningriposteii",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_swordandshield__16c: SwordAndShield = {
-    category: "swordandshield",
-    id: "16c",
-
-    name: "Guard Breaker",
-    treeName: "Tetranadon Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["water", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__water_boost_3, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__water_boost_2, __generated_swordandshield__16b],
-            [__generated_ramp__water_boost_1, __generated_swordandshield__16a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [40, 70, 110, 80, 0, 0, 0],
-    maxSharpness:  [40, 70, 110, 120, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "guardbreaker",
-        treeNameLower: "tetranadontree",
-    },
-};
-
-const __generated_swordandshield__17a: SwordAndShield = {
-    category: "swordandshield",
-    id: "17a",
-
-    name: "Khezu Razor I",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [70, 60, 40, 30, 0, 0, 0],
-    maxSharpness:  [70, 60, 40, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "khezurazori",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_swordandshield__17b: SwordAndShield = {
-    category: "swordandshield",
-    id: "17b",
-
-    name: "Khezu Razor II",
-    treeName: "Khezu Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 22]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 50, 40, 0, 0, 0],
-    maxSharpness:  [100, 60, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "khezurazorii",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_swordandshield__17c: SwordAndShield = {
-    category: "swordandshield",
-    id: "17c",
-
-    name: "Painful Razor",
-    treeName: "Khezu Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 30]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__thunderblight_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__17b],
-            [__generated_ramp__thunder_boost_1, __generated_swordandshield__17b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__10b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10b],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 70, 70, 0, 0, 0],
-    maxSharpness:  [100, 60, 70, 70, 40, 10, 0],
-
-    filterHelpers: {
-        nameLower: "painfulrazor",
-        treeNameLower: "khezutree",
-    },
-};
-
-const __generated_swordandshield__18a: SwordAndShield = {
-    category: "swordandshield",
-    id: "18a",
-
-    name: "Hypnos Knife I",
-    treeName: "Baggi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10a],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10a],
-        ],
-    ],
-
-    baseSharpness: [90, 50, 40, 20, 0, 0, 0],
-    maxSharpness:  [90, 50, 40, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hypnosknifei",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_swordandshield__18b: SwordAndShield = {
-    category: "swordandshield",
-    id: "18b",
-
-    name: "Hypnos Knife II",
-    treeName: "Baggi Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__18a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10a],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 50, 40, 0, 0, 0],
-    maxSharpness:  [100, 60, 50, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hypnosknifeii",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_swordandshield__18c: SwordAndShield = {
-    category: "swordandshield",
-    id: "18c",
-
-    name: "Morpheus Knife",
-    treeName: "Baggi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__sleep_boost_1, __generated_swordandshield__18b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__18a],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__10a],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__10a],
-        ],
-    ],
-
-    baseSharpness: [100, 60, 50, 70, 20, 0, 0],
-    maxSharpness:  [100, 60, 50, 70, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "morpheusknife",
-        treeNameLower: "baggitree",
-    },
-};
-
-const __generated_swordandshield__19a: SwordAndShield = {
-    category: "swordandshield",
-    id: "19a",
-
-    name: "Bone Kukri I",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [70, 90, 40, 0, 0, 0, 0],
-    maxSharpness:  [70, 90, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonekukrii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_swordandshield__19b: SwordAndShield = {
-    category: "swordandshield",
-    id: "19b",
-
-    name: "Bone Kukri II",
-    treeName: "Bone Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 50, 0, 0, 0, 0],
-    maxSharpness:  [80, 70, 100, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonekukriii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_swordandshield__19c: SwordAndShield = {
-    category: "swordandshield",
-    id: "19c",
-
-    name: "Chief Kukri",
-    treeName: "Bone Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 90, 70, 0, 0, 0, 0],
-    maxSharpness:  [90, 90, 110, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "chiefkukri",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_swordandshield__19d: SwordAndShield = {
-    category: "swordandshield",
-    id: "19d",
-
-    name: "Bone Barong I",
-    treeName: "Bone Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 70, 70, 10, 0, 0, 0],
-    maxSharpness:  [100, 70, 70, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonebarongi",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_swordandshield__19e: SwordAndShield = {
-    category: "swordandshield",
-    id: "19e",
-
-    name: "Bone Barong II",
-    treeName: "Bone Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19d],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [110, 90, 60, 40, 0, 0, 0],
-    maxSharpness:  [110, 90, 60, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonebarongii",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_swordandshield__19f: SwordAndShield = {
-    category: "swordandshield",
-    id: "19f",
-
-    name: "Grand Barong",
-    treeName: "Bone Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__attack_boost_3, __generated_swordandshield__19e],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19d],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [80, 70, 80, 70, 0, 0, 0],
-    maxSharpness:  [80, 70, 80, 100, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "grandbarong",
-        treeNameLower: "bonetree",
-    },
-};
-
-const __generated_swordandshield__20a: SwordAndShield = {
-    category: "swordandshield",
-    id: "20a",
-
-    name: "Princess Rapier I",
-    treeName: "Rathian Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__19d],
-            [__generated_ramp__dulling_strike, __generated_swordandshield__19d],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 90, 80, 0, 0, 0],
-    maxSharpness:  [60, 70, 90, 100, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "princessrapieri",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_swordandshield__20b: SwordAndShield = {
-    category: "swordandshield",
-    id: "20b",
-
-    name: "Princess Rapier II",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__19d],
-            [__generated_ramp__dulling_strike, __generated_swordandshield__19d],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 110, 70, 30, 0, 0],
-    maxSharpness:  [100, 40, 110, 70, 60, 20, 0],
-
-    filterHelpers: {
-        nameLower: "princessrapierii",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_swordandshield__20c: SwordAndShield = {
-    category: "swordandshield",
-    id: "20c",
-
-    name: "Queen Rapier",
-    treeName: "Rathian Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["poison", 28]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__poison_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__poison_boost_1, __generated_swordandshield__20b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__19d],
-            [__generated_ramp__dulling_strike, __generated_swordandshield__19d],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [90, 40, 110, 70, 40, 0, 0],
-    maxSharpness:  [90, 40, 110, 70, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "queenrapier",
-        treeNameLower: "rathiantree",
-    },
-};
-
-const __generated_swordandshield__21a: SwordAndShield = {
-    category: "swordandshield",
-    id: "21a",
-
-    name: "Bone Tabar I",
-    treeName: "Bone Tree 2",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [110, 70, 70, 0, 0, 0, 0],
-    maxSharpness:  [110, 70, 80, 40, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonetabari",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_swordandshield__21b: SwordAndShield = {
-    category: "swordandshield",
-    id: "21b",
-
-    name: "Bone Tabar II",
-    treeName: "Bone Tree 2",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__21a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [110, 90, 60, 40, 0, 0, 0],
-    maxSharpness:  [110, 90, 60, 70, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "bonetabarii",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_swordandshield__21c: SwordAndShield = {
-    category: "swordandshield",
-    id: "21c",
-
-    name: "Ragdos Tabar",
-    treeName: "Bone Tree 2",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -25,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__affinity_boost_3, __generated_swordandshield__21b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__21a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19c],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [130, 110, 50, 30, 30, 0, 0],
-    maxSharpness:  [130, 110, 50, 30, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "ragdostabar",
-        treeNameLower: "bonetree2",
-    },
-};
-
-const __generated_swordandshield__22a: SwordAndShield = {
-    category: "swordandshield",
-    id: "22a",
-
-    name: "Carapace Mace I",
-    treeName: "Barroth Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 140, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 140, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "carapacemacei",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_swordandshield__22b: SwordAndShield = {
-    category: "swordandshield",
-    id: "22b",
-
-    name: "Carapace Mace II",
-    treeName: "Barroth Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__22a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 60, 140, 40, 0, 0, 0],
-    maxSharpness:  [60, 60, 140, 80, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "carapacemaceii",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_swordandshield__22c: SwordAndShield = {
-    category: "swordandshield",
-    id: "22c",
-
-    name: "Barroth Club",
-    treeName: "Barroth Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__22b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__22a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 180, 50, 20, 0, 0],
-    maxSharpness:  [60, 40, 180, 50, 40, 30, 0],
-
-    filterHelpers: {
-        nameLower: "barrothclub",
-        treeNameLower: "barrothtree",
-    },
-};
-
-const __generated_swordandshield__23a: SwordAndShield = {
-    category: "swordandshield",
-    id: "23a",
-
-    name: "Studded Club I",
-    treeName: "Diablos Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__brutal_strike, __generated_swordandshield__22b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__22a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [60, 40, 50, 100, 0, 0, 0],
-    maxSharpness:  [60, 40, 50, 110, 40, 0, 0],
-
-    filterHelpers: {
-        nameLower: "studdedclubi",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_swordandshield__23b: SwordAndShield = {
-    category: "swordandshield",
-    id: "23b",
-
-    name: "Studded Club II",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__23a],
-            [__generated_ramp__brutal_strike, __generated_swordandshield__22b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__22a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 80, 110, 20, 0, 0],
-    maxSharpness:  [70, 70, 80, 110, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "studdedclubii",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_swordandshield__23c: SwordAndShield = {
-    category: "swordandshield",
-    id: "23c",
-
-    name: "Spiked Bat",
-    treeName: "Diablos Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -5,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__23b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__23a],
-            [__generated_ramp__brutal_strike, __generated_swordandshield__22b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__22a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [40, 60, 80, 120, 50, 0, 0],
-    maxSharpness:  [40, 60, 80, 120, 100, 0, 0],
-
-    filterHelpers: {
-        nameLower: "spikedbat",
-        treeNameLower: "diablostree",
-    },
-};
-
-const __generated_swordandshield__24a: SwordAndShield = {
-    category: "swordandshield",
-    id: "24a",
-
-    name: "Brash Buddies I",
-    treeName: "Bullfango Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [110, 30, 60, 0, 0, 0, 0],
-    maxSharpness:  [110, 30, 60, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "brashbuddiesi",
-        treeNameLower: "bullfangotree",
-    },
-};
-
-const __generated_swordandshield__24b: SwordAndShield = {
-    category: "swordandshield",
-    id: "24b",
-
-    name: "Brash Buddies II",
-    treeName: "Bullfango Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 50, 0, 0, 0],
-    maxSharpness:  [100, 30, 70, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "brashbuddiesii",
-        treeNameLower: "bullfangotree",
-    },
-};
-
-const __generated_swordandshield__24c: SwordAndShield = {
-    category: "swordandshield",
-    id: "24c",
-
-    name: "Cocky Comrades",
-    treeName: "Bullfango Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 25,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__spiribird_doubled, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 60, 70, 10, 0, 0],
-    maxSharpness:  [140, 20, 60, 70, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "cockycomrades",
-        treeNameLower: "bullfangotree",
-    },
-};
-
-const __generated_swordandshield__25a: SwordAndShield = {
-    category: "swordandshield",
-    id: "25a",
-
-    name: "Flammensucher I",
-    treeName: "Anjanath Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__24c],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__24c],
-            [__generated_ramp__spiribird_doubled, __generated_swordandshield__24c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [120, 90, 30, 50, 10, 0, 0],
-    maxSharpness:  [120, 90, 30, 50, 60, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammensucheri",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_swordandshield__25b: SwordAndShield = {
-    category: "swordandshield",
-    id: "25b",
-
-    name: "Flammensucher II",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__25a],
-            [__generated_ramp__fire_boost_2, __generated_swordandshield__25a],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__24c],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__24c],
-            [__generated_ramp__spiribird_doubled, __generated_swordandshield__24c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [130, 110, 40, 50, 20, 0, 0],
-    maxSharpness:  [130, 110, 40, 50, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "flammensucherii",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_swordandshield__25c: SwordAndShield = {
-    category: "swordandshield",
-    id: "25c",
-
-    name: "Gnashing Flammensucher",
-    treeName: "Anjanath Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__25b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__25a],
-            [__generated_ramp__fire_boost_2, __generated_swordandshield__25a],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__24c],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__24c],
-            [__generated_ramp__spiribird_doubled, __generated_swordandshield__24c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [120, 110, 40, 50, 30, 0, 0],
-    maxSharpness:  [120, 110, 40, 50, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "gnashingflammensucher",
-        treeNameLower: "anjanathtree",
-    },
-};
-
-const __generated_swordandshield__26a: SwordAndShield = {
-    category: "swordandshield",
-    id: "26a",
-
-    name: "Mincing Blade I",
-    treeName: "Goss Harag Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_1, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__24a],
-            [__generated_ramp__spiribird_doubled, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 90, 30, 0, 0, 0],
-    maxSharpness:  [100, 30, 90, 70, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "mincingbladei",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_swordandshield__26b: SwordAndShield = {
-    category: "swordandshield",
-    id: "26b",
-
-    name: "Mincing Blade II",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 220,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_1, __generated_swordandshield__26a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__24a],
-            [__generated_ramp__spiribird_doubled, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 110, 40, 20, 0, 0],
-    maxSharpness:  [100, 30, 110, 40, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "mincingbladeii",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_swordandshield__26c: SwordAndShield = {
-    category: "swordandshield",
-    id: "26c",
-
-    name: "Chef's Knife",
-    treeName: "Goss Harag Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 230,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__ice_boost_3, null],
-            [__generated_ramp__brutal_strike, null],
-            [__generated_ramp__ice_boost_2, __generated_swordandshield__26b],
-            [__generated_ramp__ice_boost_1, __generated_swordandshield__26a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__24a],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__24a],
-            [__generated_ramp__spiribird_doubled, __generated_swordandshield__24a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19b],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 100, 40, 30, 0, 0],
-    maxSharpness:  [100, 30, 100, 40, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "chef'sknife",
-        treeNameLower: "gossharagtree",
-    },
-};
-
-const __generated_swordandshield__27a: SwordAndShield = {
-    category: "swordandshield",
-    id: "27a",
-
-    name: "Izuchi Sickle I",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 60,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19a],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 100, 0, 0, 0, 0],
-    maxSharpness:  [30, 70, 140, 10, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "izuchisicklei",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_swordandshield__27b: SwordAndShield = {
-    category: "swordandshield",
-    id: "27b",
-
-    name: "Izuchi Sickle II",
-    treeName: "Izuchi Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 12,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__27a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19a],
-        ],
-    ],
-
-    baseSharpness: [30, 70, 60, 40, 0, 0, 0],
-    maxSharpness:  [30, 70, 60, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "izuchisickleii",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_swordandshield__27c: SwordAndShield = {
-    category: "swordandshield",
-    id: "27c",
-
-    name: "Snapper Sickle",
-    treeName: "Izuchi Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 150,
-    affinity: 15,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__27b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__27a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19a],
-        ],
-    ],
-
-    baseSharpness: [30, 80, 50, 60, 30, 0, 0],
-    maxSharpness:  [30, 80, 50, 60, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "snappersickle",
-        treeNameLower: "izuchitree",
-    },
-};
-
-const __generated_swordandshield__28a: SwordAndShield = {
-    category: "swordandshield",
-    id: "28a",
-
-    name: "Lava Pick I",
-    treeName: "Uroktor Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 120,
-    affinity: 0,
-    defense: 5,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__27b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__27b],
-            [__generated_ramp__buddy_rally, __generated_swordandshield__27b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__27a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19a],
-        ],
-    ],
-
-    baseSharpness: [160, 30, 60, 0, 0, 0, 0],
-    maxSharpness:  [160, 30, 60, 50, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "lavapicki",
-        treeNameLower: "uroktortree",
-    },
-};
-
-const __generated_swordandshield__28b: SwordAndShield = {
-    category: "swordandshield",
-    id: "28b",
-
-    name: "Lava Pick II",
-    treeName: "Uroktor Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 8,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__27b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__27b],
-            [__generated_ramp__buddy_rally, __generated_swordandshield__27b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__27a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19a],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 60, 50, 0, 0, 0],
-    maxSharpness:  [100, 40, 60, 80, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "lavapickii",
-        treeNameLower: "uroktortree",
-    },
-};
-
-const __generated_swordandshield__28c: SwordAndShield = {
-    category: "swordandshield",
-    id: "28c",
-
-    name: "Burly Beak",
-    treeName: "Uroktor Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 10,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__28b],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__27b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__27b],
-            [__generated_ramp__buddy_rally, __generated_swordandshield__27b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__27a],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__19a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__19a],
-        ],
-    ],
-
-    baseSharpness: [40, 40, 70, 150, 0, 0, 0],
-    maxSharpness:  [40, 40, 70, 150, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "burlybeak",
-        treeNameLower: "uroktortree",
-    },
-};
-
-const __generated_swordandshield__29a: SwordAndShield = {
-    category: "swordandshield",
-    id: "29a",
-
-    name: "Secta Nulo I",
-    treeName: "Bnahabra Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [100, 30, 70, 0, 0, 0, 0],
-    maxSharpness:  [100, 30, 120, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectanuloi",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_swordandshield__29b: SwordAndShield = {
-    category: "swordandshield",
-    id: "29b",
-
-    name: "Secta Unu",
-    treeName: "Bnahabra Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-        ],
-    ],
-
-    baseSharpness: [90, 20, 20, 70, 0, 0, 0],
-    maxSharpness:  [90, 20, 20, 120, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectaunu",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_swordandshield__29c: SwordAndShield = {
-    category: "swordandshield",
-    id: "29c",
-
-    name: "Secta Nulo White I",
-    treeName: "Bnahabra Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 110,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__ice_boost_2, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 70, 0, 0, 0],
-    maxSharpness:  [140, 20, 20, 110, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectanulowhitei",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_swordandshield__29d: SwordAndShield = {
-    category: "swordandshield",
-    id: "29d",
-
-    name: "Secta Unu White",
-    treeName: "Bnahabra Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__ice_boost_4, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__29c],
-            [__generated_ramp__ice_boost_2, __generated_swordandshield__29c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 20, 60, 40, 0, 0],
-    maxSharpness:  [150, 30, 20, 60, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "sectaunuwhite",
-        treeNameLower: "bnahabratree",
-    },
-};
-
-const __generated_swordandshield__30a: SwordAndShield = {
-    category: "swordandshield",
-    id: "30a",
-
-    name: "Secta Nulo Black I",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__ice_boost_2, __generated_swordandshield__29c],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__29c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 20, 60, 40, 0, 0],
-    maxSharpness:  [150, 30, 20, 60, 80, 10, 0],
-
-    filterHelpers: {
-        nameLower: "sectanuloblacki",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_swordandshield__30b: SwordAndShield = {
-    category: "swordandshield",
-    id: "30b",
-
-    name: "Secta Nulo Black II",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 21]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__30a],
-            [__generated_ramp__ice_boost_2, __generated_swordandshield__29c],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__29c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [140, 20, 20, 70, 50, 0, 0],
-    maxSharpness:  [140, 20, 20, 70, 80, 20, 0],
-
-    filterHelpers: {
-        nameLower: "sectanuloblackii",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_swordandshield__30c: SwordAndShield = {
-    category: "swordandshield",
-    id: "30c",
-
-    name: "Secta Unu Black",
-    treeName: "Bnahabra (Dragão)",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 24]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__30b],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__30a],
-            [__generated_ramp__ice_boost_2, __generated_swordandshield__29c],
-            [__generated_ramp__silkbind_boost, __generated_swordandshield__29c],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 20, 90, 60, 0, 0],
-    maxSharpness:  [160, 20, 20, 90, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "sectaunublack",
-        treeNameLower: "bnahabra(dragon)",
-    },
-};
-
-const __generated_swordandshield__31a: SwordAndShield = {
-    category: "swordandshield",
-    id: "31a",
-
-    name: "Secta Nulo Green I",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 14]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__paralysis_boost_1, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 30, 40, 0, 0, 0],
-    maxSharpness:  [150, 30, 30, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectanulogreeni",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_swordandshield__31b: SwordAndShield = {
-    category: "swordandshield",
-    id: "31b",
-
-    name: "Secta Unu Green",
-    treeName: "Bnahabra (Paralysis)",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 160,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__paralysis_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__31a],
-            [__generated_ramp__paralysis_boost_1, __generated_swordandshield__31a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [140, 30, 30, 70, 30, 0, 0],
-    maxSharpness:  [140, 30, 30, 70, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "sectaunugreen",
-        treeNameLower: "bnahabra(paralysis)",
-    },
-};
-
-const __generated_swordandshield__32a: SwordAndShield = {
-    category: "swordandshield",
-    id: "32a",
-
-    name: "Secta Nulo Yellow I",
-    treeName: "Bnahabra (Thunder)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 16]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [140, 30, 30, 50, 0, 0, 0],
-    maxSharpness:  [140, 30, 30, 90, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectanuloyellowi",
-        treeNameLower: "bnahabra(thunder)",
-    },
-};
-
-const __generated_swordandshield__32b: SwordAndShield = {
-    category: "swordandshield",
-    id: "32b",
-
-    name: "Secta Unu Yellow",
-    treeName: "Bnahabra (Thunder)",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 23]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__element_exploit, null],
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__32a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__29b],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 20, 100, 50, 0, 0],
-    maxSharpness:  [160, 20, 20, 100, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "sectaunuyellow",
-        treeNameLower: "bnahabra(thunder)",
-    },
-};
-
-const __generated_swordandshield__33a: SwordAndShield = {
-    category: "swordandshield",
-    id: "33a",
-
-    name: "Secta Nulo Red I",
-    treeName: "Bnahabra (Fire)",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__fire_boost_1, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29a],
-        ],
-    ],
-
-    baseSharpness: [100, 40, 30, 30, 0, 0, 0],
-    maxSharpness:  [100, 40, 30, 80, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectanuloredi",
-        treeNameLower: "bnahabra(fire)",
-    },
-};
-
-const __generated_swordandshield__33b: SwordAndShield = {
-    category: "swordandshield",
-    id: "33b",
-
-    name: "Secta Nulo Red II",
-    treeName: "Bnahabra (Fire)",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 90,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fire_boost_2, null],
-            [__generated_ramp__small_monster_exploit, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__33a],
-            [__generated_ramp__fire_boost_1, __generated_swordandshield__33a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29a],
-        ],
-    ],
-
-    baseSharpness: [120, 40, 40, 50, 0, 0, 0],
-    maxSharpness:  [120, 40, 40, 100, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sectanuloredii",
-        treeNameLower: "bnahabra(fire)",
-    },
-};
-
-const __generated_swordandshield__33c: SwordAndShield = {
-    category: "swordandshield",
-    id: "33c",
-
-    name: "Secta Unu Red",
-    treeName: "Bnahabra (Fire)",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["fire", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fire_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__33b],
-            [__generated_ramp__fire_boost_2, __generated_swordandshield__33b],
-            [__generated_ramp__small_monster_exploit, __generated_swordandshield__33b],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__33a],
-            [__generated_ramp__fire_boost_1, __generated_swordandshield__33a],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__29a],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__29a],
-        ],
-    ],
-
-    baseSharpness: [150, 30, 20, 60, 40, 0, 0],
-    maxSharpness:  [150, 30, 20, 60, 80, 10, 0],
-
-    filterHelpers: {
-        nameLower: "sectaunured",
-        treeNameLower: "bnahabra(fire)",
-    },
-};
-
-const __generated_swordandshield__34a: SwordAndShield = {
-    category: "swordandshield",
-    id: "34a",
-
-    name: "Sinister Sword I",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 13]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-        ],
-    ],
-
-    baseSharpness: [160, 20, 40, 80, 0, 0, 0],
-    maxSharpness:  [160, 20, 40, 110, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterswordi",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_swordandshield__34b: SwordAndShield = {
-    category: "swordandshield",
-    id: "34b",
-
-    name: "Sinister Sword II",
-    treeName: "Magnamalo Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 140,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 18]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_1, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__34a],
-        ],
-    ],
-
-    baseSharpness: [170, 20, 20, 90, 0, 0, 0],
-    maxSharpness:  [170, 20, 20, 110, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sinisterswordii",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_swordandshield__34c: SwordAndShield = {
-    category: "swordandshield",
-    id: "34c",
-
-    name: "Sinister Shadekeeper",
-    treeName: "Magnamalo Tree",
-    rarity: 6,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__blast_boost_2, null],
-            [__generated_ramp__magnamalo_soul, null],
-            [__generated_ramp__blast_boost_1, __generated_swordandshield__34b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__34a],
-        ],
-    ],
-
-    baseSharpness: [190, 10, 20, 90, 40, 0, 0],
-    maxSharpness:  [190, 10, 20, 90, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "sinistershadekeeper",
-        treeNameLower: "magnamalotree",
-    },
-};
-
-const __generated_swordandshield__35a: SwordAndShield = {
-    category: "swordandshield",
-    id: "35a",
-
-    name: "Rajang Club I",
-    treeName: "Rajang Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: -20,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_1, null],
-            [__generated_ramp__dulling_strike, null],
-        ],
-    ],
-
-    baseSharpness: [50, 20, 100, 80, 0, 0, 0],
-    maxSharpness:  [50, 20, 100, 130, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rajangclubi",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_swordandshield__35b: SwordAndShield = {
-    category: "swordandshield",
-    id: "35b",
-
-    name: "Rajang Club II",
-    treeName: "Rajang Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 210,
-    affinity: -15,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 17]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__thunder_boost_1, __generated_swordandshield__35a],
-        ],
-    ],
-
-    baseSharpness: [20, 40, 100, 90, 0, 0, 0],
-    maxSharpness:  [20, 40, 100, 130, 10, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rajangclubii",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_swordandshield__35c: SwordAndShield = {
-    category: "swordandshield",
-    id: "35c",
-
-    name: "Banned Rajang Club",
-    treeName: "Rajang Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 220,
-    affinity: -10,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__thunder_boost_2, null],
-            [__generated_ramp__dulling_strike, null],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__35b],
-            [__generated_ramp__thunder_boost_1, __generated_swordandshield__35a],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 80, 100, 10, 0, 0],
-    maxSharpness:  [50, 60, 80, 100, 50, 10, 0],
-
-    filterHelpers: {
-        nameLower: "bannedrajangclub",
-        treeNameLower: "rajangtree",
-    },
-};
-
-const __generated_swordandshield__36a: SwordAndShield = {
-    category: "swordandshield",
-    id: "36a",
-
-    name: "Azure Elder Sword I",
-    treeName: "Ibushi Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 10]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 20, 40, 100, 0, 0],
-    maxSharpness:  [20, 20, 20, 40, 150, 0, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderswordi",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_swordandshield__36b: SwordAndShield = {
-    category: "swordandshield",
-    id: "36b",
-
-    name: "Azure Elder Sword II",
-    treeName: "Ibushi Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 12]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__36a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 50, 50, 110, 0, 0],
-    maxSharpness:  [20, 20, 50, 50, 150, 10, 0],
-
-    filterHelpers: {
-        nameLower: "azureelderswordii",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_swordandshield__36c: SwordAndShield = {
-    category: "swordandshield",
-    id: "36c",
-
-    name: "Abyssal Gale Shredder",
-    treeName: "Ibushi Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__dragon_boost_4, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__ibushi_soul, null],
-            [__generated_ramp__dragon_boost_3, __generated_swordandshield__36b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__36a],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 80, 60, 120, 0, 0],
-    maxSharpness:  [20, 20, 80, 60, 150, 20, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalgaleshredder",
-        treeNameLower: "ibushitree",
-    },
-};
-
-const __generated_swordandshield__37a: SwordAndShield = {
-    category: "swordandshield",
-    id: "37a",
-
-    name: "Thunderbolt Sword I",
-    treeName: "Narwa Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-        ],
-    ],
-
-    baseSharpness: [20, 20, 180, 40, 40, 0, 0],
-    maxSharpness:  [20, 20, 180, 40, 60, 30, 0],
-
-    filterHelpers: {
-        nameLower: "thunderboltswordi",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_swordandshield__37b: SwordAndShield = {
-    category: "swordandshield",
-    id: "37b",
-
-    name: "Abyssal Storm Shredder",
-    treeName: "Narwa Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["thunder", 35]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__anti_aerial_species, null],
-            [__generated_ramp__narwa_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__37a],
-        ],
-    ],
-
-    baseSharpness: [20, 10, 220, 40, 60, 0, 0],
-    maxSharpness:  [20, 10, 220, 40, 70, 40, 0],
-
-    filterHelpers: {
-        nameLower: "abyssalstormshredder",
-        treeNameLower: "narwatree",
-    },
-};
-
-const __generated_swordandshield__38a: SwordAndShield = {
-    category: "swordandshield",
-    id: "38a",
-
-    name: "Gelosteel Dagger I",
-    treeName: "Kushala Daora Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 5,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 31]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__kushala_daora_soul, null],
-        ],
-    ],
-
-    baseSharpness: [70, 100, 60, 70, 50, 0, 0],
-    maxSharpness:  [70, 100, 60, 70, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "icesteeldaggeri",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_swordandshield__38b: SwordAndShield = {
-    category: "swordandshield",
-    id: "38b",
-
-    name: "Daora's Razor",
-    treeName: "Kushala Daora Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 10,
-    defense: 0,
-    decoSlots: [1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["ice", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__kushala_daora_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__38a],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__38a],
-        ],
-    ],
-
-    baseSharpness: [80, 120, 30, 50, 60, 10, 0],
-    maxSharpness:  [80, 120, 30, 50, 60, 60, 0],
-
-    filterHelpers: {
-        nameLower: "daora'srazor",
-        treeNameLower: "kushaladaoratree",
-    },
-};
-
-const __generated_swordandshield__39a: SwordAndShield = {
-    category: "swordandshield",
-    id: "39a",
-
-    name: "Teostra's Spada I",
-    treeName: "Teostra Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 36]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-        ],
-    ],
-
-    baseSharpness: [150, 20, 80, 60, 40, 0, 0],
-    maxSharpness:  [150, 20, 80, 60, 70, 20, 0],
-
-    filterHelpers: {
-        nameLower: "teostra'sspadai",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_swordandshield__39b: SwordAndShield = {
-    category: "swordandshield",
-    id: "39b",
-
-    name: "Teostra's Emblem",
-    treeName: "Teostra Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["blast", 39]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__fireblight_exploit, null],
-            [__generated_ramp__teostra_soul, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__39a],
-        ],
-    ],
-
-    baseSharpness: [160, 50, 30, 60, 50, 0, 0],
-    maxSharpness:  [160, 50, 30, 60, 70, 30, 0],
-
-    filterHelpers: {
-        nameLower: "teostra'semblem",
-        treeNameLower: "teostratree",
-    },
-};
-
-const __generated_swordandshield__40a: SwordAndShield = {
-    category: "swordandshield",
-    id: "40a",
-
-    name: "Redwing Swiftblade I",
-    treeName: "Valstrax Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 32]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [180, 0, 0, 0, 0, 70, 0],
-    maxSharpness:  [180, 0, 0, 0, 0, 120, 0],
-
-    filterHelpers: {
-        nameLower: "redwingswiftbladei",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_swordandshield__40b: SwordAndShield = {
-    category: "swordandshield",
-    id: "40b",
-
-    name: "Vermilion Orgul",
-    treeName: "Valstrax Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [2],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["dragon", 34]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__wyvern_exploit, null],
-            [__generated_ramp__valstrax_soul, null],
-        ],
-    ],
-
-    baseSharpness: [60, 0, 0, 0, 0, 90, 0],
-    maxSharpness:  [60, 0, 0, 0, 0, 140, 0],
-
-    filterHelpers: {
-        nameLower: "vermilionorgul",
-        treeNameLower: "valstraxtree",
-    },
-};
-
-const __generated_swordandshield__41a: SwordAndShield = {
-    category: "swordandshield",
-    id: "41a",
-
-    name: "Sleepy Shellsword I",
-    treeName: "Shell-Studded Tree",
-    rarity: 2,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 16,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 11]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_1, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-        ],
-    ],
-
-    baseSharpness: [50, 60, 90, 0, 0, 0, 0],
-    maxSharpness:  [50, 60, 120, 20, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sleepyshellswordi",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_swordandshield__41b: SwordAndShield = {
-    category: "swordandshield",
-    id: "41b",
-
-    name: "Sleepy Shellsword II",
-    treeName: "Shell-Studded Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 18,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sleep_boost_1, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__41a],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 100, 30, 0, 0, 0],
-    maxSharpness:  [50, 70, 100, 60, 20, 0, 0],
-
-    filterHelpers: {
-        nameLower: "sleepyshellswordii",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_swordandshield__41c: SwordAndShield = {
-    category: "swordandshield",
-    id: "41c",
-
-    name: "Waking Nightmare",
-    treeName: "Shell-Studded Tree",
-    rarity: 5,
-    endlineTag: "hr",
-
-    attack: 180,
-    affinity: 0,
-    defense: 20,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["sleep", 19]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sleep_boost_2, null],
-            [__generated_ramp__anti_aquatic_species, null],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__41b],
-            [__generated_ramp__sleep_boost_1, __generated_swordandshield__41b],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__41a],
-        ],
-    ],
-
-    baseSharpness: [50, 50, 130, 70, 0, 0, 0],
-    maxSharpness:  [50, 50, 130, 70, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "wakingnightmare",
-        treeNameLower: "shell-studdedtree",
-    },
-};
-
-const __generated_swordandshield__42a: SwordAndShield = {
-    category: "swordandshield",
-    id: "42a",
-
-    name: "Catspaw I",
-    treeName: "Felyne Tree",
-    rarity: 1,
-    endlineTag: "",
-
-    attack: 80,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 15]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__buddy_rally, null],
-        ],
-    ],
-
-    baseSharpness: [60, 100, 40, 0, 0, 0, 0],
-    maxSharpness:  [60, 100, 90, 0, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "catspawi",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_swordandshield__42b: SwordAndShield = {
-    category: "swordandshield",
-    id: "42b",
-
-    name: "Catspaw II",
-    treeName: "Felyne Tree",
-    rarity: 3,
-    endlineTag: "",
-
-    attack: 100,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 26]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__42a],
-        ],
-    ],
-
-    baseSharpness: [60, 100, 80, 10, 0, 0, 0],
-    maxSharpness:  [60, 100, 80, 60, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "catspawii",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_swordandshield__42c: SwordAndShield = {
-    category: "swordandshield",
-    id: "42c",
-
-    name: "Catburglar",
-    treeName: "Felyne Tree",
-    rarity: 4,
-    endlineTag: "hr",
-
-    attack: 130,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [3],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([["paralysis", 33]])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__buddy_rally, null],
-            [__generated_ramp__attack_boost_3, __generated_swordandshield__42b],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__42a],
-        ],
-    ],
-
-    baseSharpness: [60, 100, 60, 80, 0, 0, 0],
-    maxSharpness:  [60, 100, 60, 80, 10, 40, 0],
-
-    filterHelpers: {
-        nameLower: "catburglar",
-        treeNameLower: "felynetree",
-    },
-};
-
-const __generated_swordandshield__43a: SwordAndShield = {
-    category: "swordandshield",
-    id: "43a",
-
-    name: "Ninja Sword I",
-    treeName: "Guild Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 50,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 30, 190, 0, 0, 0],
-    maxSharpness:  [10, 20, 30, 210, 30, 0, 0],
-
-    filterHelpers: {
-        nameLower: "ninjaswordi",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_swordandshield__43b: SwordAndShield = {
-    category: "swordandshield",
-    id: "43b",
-
-    name: "Hi Ninja Sword",
-    treeName: "Guild Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 200,
-    affinity: 100,
-    defense: 0,
-    decoSlots: [1, 1, 1],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__silkbind_boost, null],
-            [__generated_ramp__master_rider, null],
-            [__generated_ramp__spiribird_doubled, null],
-        ],
-    ],
-
-    baseSharpness: [10, 20, 30, 240, 0, 0, 0],
-    maxSharpness:  [10, 20, 30, 240, 50, 0, 0],
-
-    filterHelpers: {
-        nameLower: "hininjasword",
-        treeNameLower: "guildtree",
-    },
-};
-
-const __generated_swordandshield__ra: SwordAndShield = {
-    category: "swordandshield",
-    id: "ra",
-
-    name: "Rampage Sword I",
-    treeName: "Rampage Tree",
-    rarity: 4,
-    endlineTag: "",
-
-    attack: 150,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [70, 70, 90, 20, 0, 0, 0],
-    maxSharpness:  [70, 70, 90, 70, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampageswordi",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_swordandshield__rb: SwordAndShield = {
-    category: "swordandshield",
-    id: "rb",
-
-    name: "Rampage Sword II",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 170,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_1, null],
-            [__generated_ramp__affinity_boost_1, null],
-            [__generated_ramp__defense_boost_1, null],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-        ],
-    ],
-
-    baseSharpness: [60, 70, 80, 40, 0, 0, 0],
-    maxSharpness:  [60, 70, 80, 90, 0, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampageswordii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_swordandshield__rc: SwordAndShield = {
-    category: "swordandshield",
-    id: "rc",
-
-    name: "Rampage Sword III",
-    treeName: "Rampage Tree",
-    rarity: 5,
-    endlineTag: "",
-
-    attack: 180,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_1, null],
-            [__generated_ramp__water_1, null],
-            [__generated_ramp__thunder_1, null],
-            [__generated_ramp__ice_1, null],
-            [__generated_ramp__dragon_1, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 80, 30, 20, 0, 0],
-    maxSharpness:  [50, 70, 80, 30, 70, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampageswordiii",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_swordandshield__rd: SwordAndShield = {
-    category: "swordandshield",
-    id: "rd",
-
-    name: "Rampage Sword IV",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 190,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_2, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_2, null],
-            [__generated_ramp__defense_boost_2, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_2, null],
-            [__generated_ramp__water_2, null],
-            [__generated_ramp__thunder_2, null],
-            [__generated_ramp__ice_2, null],
-            [__generated_ramp__dragon_2, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_1, __generated_swordandshield__rc],
-            [__generated_ramp__water_1, __generated_swordandshield__rc],
-            [__generated_ramp__thunder_1, __generated_swordandshield__rc],
-            [__generated_ramp__ice_1, __generated_swordandshield__rc],
-            [__generated_ramp__dragon_1, __generated_swordandshield__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 70, 30, 30, 0, 0],
-    maxSharpness:  [50, 70, 70, 30, 80, 0, 0],
-
-    filterHelpers: {
-        nameLower: "rampageswordiv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_swordandshield__re: SwordAndShield = {
-    category: "swordandshield",
-    id: "re",
-
-    name: "Rampage Sword V",
-    treeName: "Rampage Tree",
-    rarity: 6,
-    endlineTag: "",
-
-    attack: 200,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_3, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_3, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__rd],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__rd],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__rd],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_1, null],
-            [__generated_ramp__paralysis_1, null],
-            [__generated_ramp__sleep_1, null],
-            [__generated_ramp__blast_1, null],
-            [__generated_ramp__fire_2, __generated_swordandshield__rd],
-            [__generated_ramp__water_2, __generated_swordandshield__rd],
-            [__generated_ramp__thunder_2, __generated_swordandshield__rd],
-            [__generated_ramp__ice_2, __generated_swordandshield__rd],
-            [__generated_ramp__dragon_2, __generated_swordandshield__rd],
-            [__generated_ramp__fire_1, __generated_swordandshield__rc],
-            [__generated_ramp__water_1, __generated_swordandshield__rc],
-            [__generated_ramp__thunder_1, __generated_swordandshield__rc],
-            [__generated_ramp__ice_1, __generated_swordandshield__rc],
-            [__generated_ramp__dragon_1, __generated_swordandshield__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 50, 50, 30, 0, 0],
-    maxSharpness:  [50, 70, 50, 50, 70, 10, 0],
-
-    filterHelpers: {
-        nameLower: "rampageswordv",
-        treeNameLower: "rampagetree",
-    },
-};
-
-const __generated_swordandshield__rf: SwordAndShield = {
-    category: "swordandshield",
-    id: "rf",
-
-    name: "Rampage Sword S",
-    treeName: "Rampage Tree",
-    rarity: 7,
-    endlineTag: "hr",
-
-    attack: 210,
-    affinity: 0,
-    defense: 0,
-    decoSlots: [],
-    eleStat: new FrozenMap<EleStatStr, number>(new Map([])),
-
-    rampSkills: [
-        [
-            [__generated_ramp__attack_boost_4, null],
-            [__generated_ramp__elemental_boost_1, null],
-            [__generated_ramp__affinity_boost_4, null],
-            [__generated_ramp__defense_boost_3, null],
-            [__generated_ramp__sharpness_type_1, null],
-            [__generated_ramp__sharpness_type_2, null],
-            [__generated_ramp__sharpness_type_3, null],
-            [__generated_ramp__sharpness_type_4, null],
-            [__generated_ramp__attack_boost_3, __generated_swordandshield__re],
-            [__generated_ramp__affinity_boost_3, __generated_swordandshield__re],
-            [__generated_ramp__attack_boost_2, __generated_swordandshield__rd],
-            [__generated_ramp__affinity_boost_2, __generated_swordandshield__rd],
-            [__generated_ramp__defense_boost_2, __generated_swordandshield__rd],
-            [__generated_ramp__attack_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__affinity_boost_1, __generated_swordandshield__rb],
-            [__generated_ramp__defense_boost_1, __generated_swordandshield__rb],
-        ],
-        [
-            [__generated_ramp__non_elemental_boost, null],
-            [__generated_ramp__fire_3, null],
-            [__generated_ramp__water_3, null],
-            [__generated_ramp__thunder_3, null],
-            [__generated_ramp__ice_3, null],
-            [__generated_ramp__dragon_3, null],
-            [__generated_ramp__poison_2, null],
-            [__generated_ramp__paralysis_2, null],
-            [__generated_ramp__sleep_2, null],
-            [__generated_ramp__blast_2, null],
-            [__generated_ramp__poison_1, __generated_swordandshield__re],
-            [__generated_ramp__paralysis_1, __generated_swordandshield__re],
-            [__generated_ramp__sleep_1, __generated_swordandshield__re],
-            [__generated_ramp__blast_1, __generated_swordandshield__re],
-            [__generated_ramp__fire_2, __generated_swordandshield__rd],
-            [__generated_ramp__water_2, __generated_swordandshield__rd],
-            [__generated_ramp__thunder_2, __generated_swordandshield__rd],
-            [__generated_ramp__ice_2, __generated_swordandshield__rd],
-            [__generated_ramp__dragon_2, __generated_swordandshield__rd],
-            [__generated_ramp__fire_1, __generated_swordandshield__rc],
-            [__generated_ramp__water_1, __generated_swordandshield__rc],
-            [__generated_ramp__thunder_1, __generated_swordandshield__rc],
-            [__generated_ramp__ice_1, __generated_swordandshield__rc],
-            [__generated_ramp__dragon_1, __generated_swordandshield__rc],
-        ],
-        [
-            [__generated_ramp__attack_surge, null],
-            [__generated_ramp__elemental_surge, null],
-            [__generated_ramp__affinity_surge, null],
-        ],
-    ],
-
-    baseSharpness: [50, 70, 30, 60, 40, 0, 0],
-    maxSharpness:  [50, 70, 30, 60, 70, 20, 0],
+    loadWeaponPayload,
+} from "./weapon_payloads";
 
-    filterHelpers: {
-        nameLower: "rampageswords",
-        treeNameLower: "rampagetree",
-    },
-};
+const payload = '{"category":"swordandshield","trees":[["Kamura Tree",[{"id":"1a","name":"Kamura Sword I","rarity":1,"endlineTag":"","attack":50,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[50,90,60,0,0,0,0],"maxSharpness":[50,90,100,10,0,0,0]},{"id":"1b","name":"Kamura Sword II","rarity":1,"endlineTag":"","attack":60,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_1",null]]],"baseSharpness":[60,70,70,0,0,0,0],"maxSharpness":[60,70,110,10,0,0,0]},{"id":"1c","name":"Kamura Sword III","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["defense_boost_1","1b"]]],"baseSharpness":[60,70,90,30,0,0,0],"maxSharpness":[60,70,90,80,0,0,0]},{"id":"1d","name":"Kamura Sword IV","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_2",null],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"1e","name":"Kamura Sword V","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["master_rider",null],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[60,80,90,40,30,0,0],"maxSharpness":[60,80,90,40,70,10,0]},{"id":"1f","name":"Kamura Ninja Sword","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["defense_boost_2",null],["master_rider",null],["affinity_boost_3","1e"],["attack_boost_2","1d"],["affinity_boost_2","1d"],["attack_boost_1","1c"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,60,60,50,0,0],"maxSharpness":[40,90,60,60,80,20,0]}]],["Nargacuga Tree",[{"id":"2a","name":"Hidden Edge I","rarity":3,"endlineTag":"","attack":120,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[50,70,80,100,0,0,0],"maxSharpness":[50,70,80,100,50,0,0]},{"id":"2b","name":"Hidden Edge II","rarity":5,"endlineTag":"","attack":170,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_1",null],["master_rider",null],["attack_boost_2","2a"],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[100,30,70,100,50,0,0],"maxSharpness":[100,30,70,100,70,30,0]},{"id":"2c","name":"Flash in the Night","rarity":6,"endlineTag":"hr","attack":180,"affinity":30,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["master_rider",null],["affinity_boost_1","2b"],["attack_boost_2","2a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,110,90,60,30,0],"maxSharpness":[70,40,110,90,60,30,0]}]],["Mizutsune Tree",[{"id":"3a","name":"Hana no Nagoriwo I","rarity":3,"endlineTag":"","attack":110,"affinity":15,"defense":0,"decoSlots":[],"eleStat":[["water",15]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["water_boost_1",null],["attack_boost_1","1c"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,40,30,70,0,0,0],"maxSharpness":[110,40,30,90,30,0,0]},{"id":"3b","name":"Hana no Nagoriwo II","rarity":5,"endlineTag":"","attack":170,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",17]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["water_boost_2",null],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,90,50,50,50,0,0],"maxSharpness":[110,90,50,50,80,20,0]},{"id":"3c","name":"Kurenawi Ougi","rarity":6,"endlineTag":"hr","attack":190,"affinity":15,"defense":0,"decoSlots":[1],"eleStat":[["water",19]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["water_boost_2",null],["attack_boost_2","3b"],["affinity_boost_1","3a"],["water_boost_1","3a"],["attack_boost_1","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[110,70,50,50,70,0,0],"maxSharpness":[110,70,50,50,70,50,0]}]],["Bishaten Tree",[{"id":"4a","name":"Exorcising Sword I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["anti_aerial_species",null],["silkbind_boost",null],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,140,40,40,0,0,0],"maxSharpness":[30,140,40,80,10,0,0]},{"id":"4b","name":"Exorcising Sword II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[20,160,50,40,30,0,0],"maxSharpness":[20,160,50,40,40,40,0]},{"id":"4c","name":"Shaucha Pureblade","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["silkbind_boost",null],["attack_boost_1","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[30,170,70,40,40,0,0],"maxSharpness":[30,170,70,40,40,50,0]}]],["Zinogre Tree",[{"id":"5a","name":"Usurper\'s Fogobolt I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",15]],"rampSkills":[[["attack_boost_1",null],["thunder_boost_1",null],["anti_aquatic_species",null],["anti_aerial_species","4a"],["silkbind_boost","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,90,50,0,0,0],"maxSharpness":[70,40,90,100,0,0,0]},{"id":"5b","name":"Usurper\'s Fogobolt II","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",24]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["anti_aquatic_species",null],["attack_boost_1","5a"],["anti_aerial_species","4a"],["silkbind_boost","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,70,80,40,0,0],"maxSharpness":[70,40,70,80,90,0,0]},{"id":"5c","name":"Despot\'s Crookbolt","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["thunder",27]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_2",null],["anti_aquatic_species",null],["thunder_boost_1","5b"],["attack_boost_1","5a"],["anti_aerial_species","4a"],["silkbind_boost","4a"],["affinity_boost_2","1c"],["defense_boost_2","1c"],["defense_boost_1","1b"]]],"baseSharpness":[70,40,100,90,50,0,0],"maxSharpness":[70,40,100,90,60,40,0]}]],["Wroggi Tree",[{"id":"6a","name":"Dirty Baron I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",17]],"rampSkills":[[["affinity_boost_1",null],["poison_boost_1",null],["buddy_rally",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[90,40,40,30,0,0,0],"maxSharpness":[90,40,40,80,0,0,0]},{"id":"6b","name":"Dirty Baron II","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",23]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_1",null],["buddy_rally",null],["affinity_boost_1","6a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[130,40,40,40,0,0,0],"maxSharpness":[130,40,40,90,0,0,0]},{"id":"6c","name":"Dirty Marquis","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["poison",34]],"rampSkills":[[["affinity_boost_2",null],["poison_boost_2",null],["buddy_rally",null],["poison_boost_1","6b"],["affinity_boost_1","6a"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[130,60,40,70,0,0,0],"maxSharpness":[130,60,40,90,30,0,0]}]],["Royal Ludroth Tree",[{"id":"7a","name":"Royal Claw I","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",18]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[50,40,70,40,0,0,0],"maxSharpness":[50,40,70,90,0,0,0]},{"id":"7b","name":"Royal Claw II","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["water",20]],"rampSkills":[[["attack_boost_2",null],["water_boost_1",null],["waterblight_exploit",null],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[50,60,90,50,0,0,0],"maxSharpness":[50,60,90,100,0,0,0]},{"id":"7c","name":"Royal Ludroth Claw","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[2,1,1],"eleStat":[["water",27]],"rampSkills":[[["attack_boost_3",null],["water_boost_2",null],["waterblight_exploit",null],["attack_boost_2","7b"],["water_boost_1","7b"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[60,40,120,60,20,0,0],"maxSharpness":[60,40,120,60,50,20,0]}]],["Tigrex Tree",[{"id":"8a","name":"Rex Talon I","rarity":3,"endlineTag":"","attack":160,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["brutal_strike",null],["water_boost_1","7b"],["waterblight_exploit","7b"],["attack_boost_1","1b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[70,30,100,90,10,0,0],"maxSharpness":[70,30,100,90,60,0,0]},{"id":"8b","name":"Rex Talon II","rarity":6,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["brutal_strike",null],["affinity_boost_1","8a"],["water_boost_1","7b"],["waterblight_exploit","7b"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[50,40,130,100,30,0,0],"maxSharpness":[50,40,130,100,60,20,0]},{"id":"8c","name":"Tigrex Sword","rarity":6,"endlineTag":"hr","attack":220,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["brutal_strike",null],["attack_boost_2","8b"],["affinity_boost_1","8a"],["water_boost_1","7b"],["waterblight_exploit","7b"],["attack_boost_1","1b"],["defense_boost_1","1b"]]],"baseSharpness":[50,40,120,120,50,20,0],"maxSharpness":[50,40,120,120,50,20,0]}]],["Ice Tree",[{"id":"9a","name":"Frost Edge I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",18]],"rampSkills":[[["attack_boost_1",null],["dulling_strike",null],["element_exploit",null],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[40,90,70,0,0,0,0],"maxSharpness":[40,90,110,10,0,0,0]},{"id":"9b","name":"Frost Edge II","rarity":2,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",24]],"rampSkills":[[["attack_boost_1",null],["dulling_strike",null],["element_exploit",null],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,70,70,30,0,0,0],"maxSharpness":[30,70,70,80,0,0,0]},{"id":"9c","name":"Hi Frost Edge","rarity":5,"endlineTag":"hr","attack":150,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["ice",30]],"rampSkills":[[["attack_boost_3",null],["dulling_strike",null],["element_exploit",null],["attack_boost_1","9b"],["affinity_boost_2","1b"],["defense_boost_1","1b"]]],"baseSharpness":[30,60,110,70,30,0,0],"maxSharpness":[30,60,110,70,70,10,0]}]],["Ore Tree",[{"id":"10a","name":"Hunter\'s Knife I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,90,10,0,0,0]},{"id":"10b","name":"Hunter\'s Knife II","rarity":1,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_2",null]]],"baseSharpness":[70,50,80,0,0,0,0],"maxSharpness":[70,50,120,10,0,0,0]},{"id":"10c","name":"Fighter Sword","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_2",null],["attack_boost_1","10b"]]],"baseSharpness":[60,60,60,20,0,0,0],"maxSharpness":[60,60,60,70,0,0,0]},{"id":"10d","name":"Iron Beater I","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_2",null],["silkbind_boost",null],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[90,70,40,50,0,0,0],"maxSharpness":[90,70,40,80,20,0,0]},{"id":"10e","name":"Iron Beater II","rarity":4,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["defense_boost_3",null],["silkbind_boost",null],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[70,80,80,50,20,0,0],"maxSharpness":[70,80,80,50,60,10,0]},{"id":"10f","name":"Smithy\'s Pride","rarity":5,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["defense_boost_3",null],["silkbind_boost",null],["attack_boost_2","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[80,90,90,60,30,0,0],"maxSharpness":[80,90,90,60,50,30,0]}]],["Jaggi & Jaggia Tree",[{"id":"11a","name":"Soldier\'s Dagger I","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_3",null],["dulling_strike",null],["attack_boost_2","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[150,50,40,60,0,0,0],"maxSharpness":[150,50,40,60,30,20,0]},{"id":"11b","name":"Soldier\'s Dagger II","rarity":5,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_3",null],["dulling_strike",null],["attack_boost_2","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[160,60,50,80,0,0,0],"maxSharpness":[160,60,50,80,20,30,0]},{"id":"11c","name":"Commander\'s Dagger","rarity":6,"endlineTag":"hr","attack":220,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_3",null],["dulling_strike",null],["affinity_boost_2","11b"],["attack_boost_2","10e"],["silkbind_boost","10e"],["defense_boost_2","10d"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[160,50,50,90,0,0,0],"maxSharpness":[160,50,50,90,10,40,0]}]],["Water Tree",[{"id":"12a","name":"Odyssey Blade I","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["water",24]],"rampSkills":[[["defense_boost_2",null],["wyvern_exploit",null],["element_exploit",null],["attack_boost_2","10c"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[90,90,40,60,20,0,0],"maxSharpness":[90,90,40,60,60,10,0]},{"id":"12b","name":"Odyssey Blade II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["water",26]],"rampSkills":[[["defense_boost_2",null],["wyvern_exploit",null],["element_exploit",null],["attack_boost_2","10c"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[90,90,40,50,30,0,0],"maxSharpness":[90,90,40,50,70,10,0]},{"id":"12c","name":"Master Odyssey","rarity":6,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["water",33]],"rampSkills":[[["defense_boost_3",null],["wyvern_exploit",null],["element_exploit",null],["defense_boost_2","12b"],["attack_boost_2","10c"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[100,100,50,60,40,0,0],"maxSharpness":[100,100,50,60,60,30,0]}]],["Pukei-Pukei Tree",[{"id":"13a","name":"Pukei Sword I","rarity":2,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["poison",15]],"rampSkills":[[["attack_boost_2",null],["defense_boost_1",null],["poison_boost_1",null],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[110,50,50,40,0,0,0],"maxSharpness":[110,50,50,90,0,0,0]},{"id":"13b","name":"Pukei Sword II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",22]],"rampSkills":[[["attack_boost_3",null],["defense_boost_1",null],["poison_boost_2",null],["attack_boost_2","13a"],["poison_boost_1","13a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[60,60,70,90,20,0,0],"maxSharpness":[60,60,70,90,70,0,0]},{"id":"13c","name":"Venomedge","rarity":6,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["poison",30]],"rampSkills":[[["attack_boost_3",null],["defense_boost_2",null],["poison_boost_2",null],["defense_boost_1","13b"],["attack_boost_2","13a"],["poison_boost_1","13a"],["affinity_boost_1","10c"],["attack_boost_1","10b"]]],"baseSharpness":[100,60,80,80,30,0,0],"maxSharpness":[100,60,80,80,70,10,0]}]],["Rathalos Tree",[{"id":"14a","name":"Djinn I","rarity":3,"endlineTag":"","attack":120,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",18]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_1","13a"],["poison_boost_1","13a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[30,100,60,60,0,0,0],"maxSharpness":[30,100,60,100,10,0,0]},{"id":"14b","name":"Djinn II","rarity":5,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",23]],"rampSkills":[[["attack_boost_2",null],["fire_boost_1",null],["element_exploit",null],["defense_boost_1","13a"],["poison_boost_1","13a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[90,80,80,60,40,0,0],"maxSharpness":[90,80,80,60,90,0,0]},{"id":"14c","name":"Blazing Falchion","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",33]],"rampSkills":[[["attack_boost_3",null],["fire_boost_1",null],["element_exploit",null],["attack_boost_2","14b"],["defense_boost_1","13a"],["poison_boost_1","13a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[50,40,110,100,50,0,0],"maxSharpness":[50,40,110,100,90,10,0]}]],["Barioth Tree",[{"id":"15a","name":"Icicle Spike I","rarity":2,"endlineTag":"","attack":90,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",12]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["iceblight_exploit",null],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[50,60,70,70,0,0,0],"maxSharpness":[50,60,70,100,20,0,0]},{"id":"15b","name":"Icicle Spike II","rarity":3,"endlineTag":"","attack":120,"affinity":30,"defense":0,"decoSlots":[],"eleStat":[["ice",15]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_2","15a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[40,70,70,100,20,0,0],"maxSharpness":[40,70,70,100,70,0,0]},{"id":"15c","name":"Nardebosche","rarity":5,"endlineTag":"hr","attack":160,"affinity":35,"defense":0,"decoSlots":[2,1],"eleStat":[["ice",20]],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["iceblight_exploit",null],["attack_boost_3","15b"],["attack_boost_2","15a"],["affinity_boost_1","10c"],["defense_boost_2","10c"],["attack_boost_1","10b"]]],"baseSharpness":[50,70,80,80,70,0,0],"maxSharpness":[50,70,80,80,90,30,0]}]],["Tetranadon Tree",[{"id":"16a","name":"Cunning Riposte I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",8]],"rampSkills":[[["defense_boost_1",null],["water_boost_1",null],["dulling_strike",null],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[30,70,80,20,0,0,0],"maxSharpness":[30,70,80,70,0,0,0]},{"id":"16b","name":"Cunning Riposte II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":10,"decoSlots":[],"eleStat":[["water",11]],"rampSkills":[[["defense_boost_1",null],["water_boost_2",null],["dulling_strike",null],["water_boost_1","16a"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[30,70,100,50,0,0,0],"maxSharpness":[30,70,100,100,0,0,0]},{"id":"16c","name":"Guard Breaker","rarity":4,"endlineTag":"hr","attack":160,"affinity":0,"defense":20,"decoSlots":[2],"eleStat":[["water",13]],"rampSkills":[[["defense_boost_1",null],["water_boost_3",null],["dulling_strike",null],["water_boost_2","16b"],["water_boost_1","16a"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[40,70,110,80,0,0,0],"maxSharpness":[40,70,110,120,10,0,0]}]],["Khezu Tree",[{"id":"17a","name":"Khezu Razor I","rarity":2,"endlineTag":"","attack":80,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",21]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[70,60,40,30,0,0,0],"maxSharpness":[70,60,40,80,0,0,0]},{"id":"17b","name":"Khezu Razor II","rarity":2,"endlineTag":"","attack":100,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["thunder",22]],"rampSkills":[[["attack_boost_2",null],["thunder_boost_1",null],["thunderblight_exploit",null],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[100,60,50,40,0,0,0],"maxSharpness":[100,60,50,90,0,0,0]},{"id":"17c","name":"Painful Razor","rarity":4,"endlineTag":"hr","attack":140,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[["thunder",30]],"rampSkills":[[["attack_boost_4",null],["thunder_boost_2",null],["thunderblight_exploit",null],["attack_boost_2","17b"],["thunder_boost_1","17b"],["attack_boost_1","10b"],["affinity_boost_1","10b"],["defense_boost_2","10b"]]],"baseSharpness":[100,60,70,70,0,0,0],"maxSharpness":[100,60,70,70,40,10,0]}]],["Baggi Tree",[{"id":"18a","name":"Hypnos Knife I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",17]],"rampSkills":[[["affinity_boost_1",null],["sleep_boost_1",null],["buddy_rally",null],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[90,50,40,20,0,0,0],"maxSharpness":[90,50,40,70,0,0,0]},{"id":"18b","name":"Hypnos Knife II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["sleep",23]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_1",null],["buddy_rally",null],["affinity_boost_1","18a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[100,60,50,40,0,0,0],"maxSharpness":[100,60,50,90,0,0,0]},{"id":"18c","name":"Morpheus Knife","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[1,1],"eleStat":[["sleep",26]],"rampSkills":[[["affinity_boost_2",null],["sleep_boost_2",null],["buddy_rally",null],["sleep_boost_1","18b"],["affinity_boost_1","18a"],["attack_boost_1","10a"],["defense_boost_2","10a"]]],"baseSharpness":[100,60,50,70,20,0,0],"maxSharpness":[100,60,50,70,70,0,0]}]],["Bone Tree",[{"id":"19a","name":"Bone Kukri I","rarity":1,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[70,90,40,0,0,0,0],"maxSharpness":[70,90,90,0,0,0,0]},{"id":"19b","name":"Bone Kukri II","rarity":1,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_1",null],["defense_boost_1",null]]],"baseSharpness":[80,70,50,0,0,0,0],"maxSharpness":[80,70,100,0,0,0,0]},{"id":"19c","name":"Chief Kukri","rarity":2,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["defense_boost_1",null],["affinity_boost_1","19b"]]],"baseSharpness":[90,90,70,0,0,0,0],"maxSharpness":[90,90,110,10,0,0,0]},{"id":"19d","name":"Bone Barong I","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["dulling_strike",null],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[100,70,70,10,0,0,0],"maxSharpness":[100,70,70,60,0,0,0]},{"id":"19e","name":"Bone Barong II","rarity":4,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[110,90,60,40,0,0,0],"maxSharpness":[110,90,60,80,10,0,0]},{"id":"19f","name":"Grand Barong","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["affinity_boost_2",null],["dulling_strike",null],["attack_boost_3","19e"],["attack_boost_2","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[80,70,80,70,0,0,0],"maxSharpness":[80,70,80,100,20,0,0]}]],["Rathian Tree",[{"id":"20a","name":"Princess Rapier I","rarity":5,"endlineTag":"","attack":180,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["poison",14]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[60,70,90,80,0,0,0],"maxSharpness":[60,70,90,100,30,0,0]},{"id":"20b","name":"Princess Rapier II","rarity":6,"endlineTag":"","attack":210,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["poison",24]],"rampSkills":[[["attack_boost_2",null],["poison_boost_1",null],["small_monster_exploit",null],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[100,40,110,70,30,0,0],"maxSharpness":[100,40,110,70,60,20,0]},{"id":"20c","name":"Queen Rapier","rarity":6,"endlineTag":"hr","attack":220,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[["poison",28]],"rampSkills":[[["attack_boost_2",null],["poison_boost_2",null],["small_monster_exploit",null],["poison_boost_1","20b"],["affinity_boost_2","19d"],["dulling_strike","19d"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[90,40,110,70,40,0,0],"maxSharpness":[90,40,110,70,60,30,0]}]],["Bone Tree 2",[{"id":"21a","name":"Bone Tabar I","rarity":3,"endlineTag":"","attack":160,"affinity":-25,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["brutal_strike",null],["anti_aquatic_species",null],["attack_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[110,70,70,0,0,0,0],"maxSharpness":[110,70,80,40,0,0,0]},{"id":"21b","name":"Bone Tabar II","rarity":4,"endlineTag":"","attack":190,"affinity":-25,"defense":0,"decoSlots":[2],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["brutal_strike",null],["anti_aquatic_species",null],["affinity_boost_2","21a"],["attack_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[110,90,60,40,0,0,0],"maxSharpness":[110,90,60,70,20,0,0]},{"id":"21c","name":"Ragdos Tabar","rarity":6,"endlineTag":"hr","attack":230,"affinity":-25,"defense":0,"decoSlots":[3],"eleStat":[],"rampSkills":[[["affinity_boost_4",null],["brutal_strike",null],["anti_aquatic_species",null],["affinity_boost_3","21b"],["affinity_boost_2","21a"],["attack_boost_2","19c"],["defense_boost_1","19c"],["affinity_boost_1","19b"]]],"baseSharpness":[130,110,50,30,30,0,0],"maxSharpness":[130,110,50,30,70,10,0]}]],["Barroth Tree",[{"id":"22a","name":"Carapace Mace I","rarity":2,"endlineTag":"","attack":120,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_1",null],["brutal_strike",null],["attack_boost_2","19b"]]],"baseSharpness":[50,60,140,0,0,0,0],"maxSharpness":[50,60,140,50,0,0,0]},{"id":"22b","name":"Carapace Mace II","rarity":3,"endlineTag":"","attack":150,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["brutal_strike",null],["defense_boost_1","22a"],["attack_boost_2","19b"]]],"baseSharpness":[60,60,140,40,0,0,0],"maxSharpness":[60,60,140,80,10,0,0]},{"id":"22c","name":"Barroth Club","rarity":5,"endlineTag":"hr","attack":200,"affinity":-20,"defense":0,"decoSlots":[1,1],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["brutal_strike",null],["affinity_boost_1","22b"],["defense_boost_1","22a"],["attack_boost_2","19b"]]],"baseSharpness":[60,40,180,50,20,0,0],"maxSharpness":[60,40,180,50,40,30,0]}]],["Diablos Tree",[{"id":"23a","name":"Studded Club I","rarity":3,"endlineTag":"","attack":160,"affinity":-5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["defense_boost_2",null],["small_monster_exploit",null],["brutal_strike","22b"],["defense_boost_1","22a"],["attack_boost_2","19b"]]],"baseSharpness":[60,40,50,100,0,0,0],"maxSharpness":[60,40,50,110,40,0,0]},{"id":"23b","name":"Studded Club II","rarity":6,"endlineTag":"","attack":220,"affinity":-5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["small_monster_exploit",null],["affinity_boost_1","23a"],["brutal_strike","22b"],["defense_boost_1","22a"],["attack_boost_2","19b"]]],"baseSharpness":[70,70,80,110,20,0,0],"maxSharpness":[70,70,80,110,70,0,0]},{"id":"23c","name":"Spiked Bat","rarity":6,"endlineTag":"hr","attack":230,"affinity":-5,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["defense_boost_2",null],["small_monster_exploit",null],["affinity_boost_2","23b"],["affinity_boost_1","23a"],["brutal_strike","22b"],["defense_boost_1","22a"],["attack_boost_2","19b"]]],"baseSharpness":[40,60,80,120,50,0,0],"maxSharpness":[40,60,80,120,100,0,0]}]],["Bullfango Tree",[{"id":"24a","name":"Brash Buddies I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":20,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["small_monster_exploit",null],["spiribird_doubled",null],["attack_boost_2","19b"],["affinity_boost_1","19b"]]],"baseSharpness":[110,30,60,0,0,0,0],"maxSharpness":[110,30,60,50,0,0,0]},{"id":"24b","name":"Brash Buddies II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":20,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["small_monster_exploit",null],["spiribird_doubled",null],["defense_boost_1","24a"],["attack_boost_2","19b"],["affinity_boost_1","19b"]]],"baseSharpness":[100,30,70,50,0,0,0],"maxSharpness":[100,30,70,90,10,0,0]},{"id":"24c","name":"Cocky Comrades","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":25,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["defense_boost_2",null],["small_monster_exploit",null],["spiribird_doubled",null],["defense_boost_1","24a"],["attack_boost_2","19b"],["affinity_boost_1","19b"]]],"baseSharpness":[140,20,60,70,10,0,0],"maxSharpness":[140,20,60,70,50,10,0]}]],["Anjanath Tree",[{"id":"25a","name":"Flammensucher I","rarity":5,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",15]],"rampSkills":[[["affinity_boost_1",null],["fire_boost_2",null],["brutal_strike",null],["defense_boost_2","24c"],["small_monster_exploit","24c"],["spiribird_doubled","24c"],["defense_boost_1","24a"],["attack_boost_2","19b"]]],"baseSharpness":[120,90,30,50,10,0,0],"maxSharpness":[120,90,30,50,60,0,0]},{"id":"25b","name":"Flammensucher II","rarity":6,"endlineTag":"","attack":210,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",18]],"rampSkills":[[["affinity_boost_2",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_1","25a"],["fire_boost_2","25a"],["defense_boost_2","24c"],["small_monster_exploit","24c"],["spiribird_doubled","24c"],["defense_boost_1","24a"],["attack_boost_2","19b"]]],"baseSharpness":[130,110,40,50,20,0,0],"maxSharpness":[130,110,40,50,70,0,0]},{"id":"25c","name":"Gnashing Flammensucher","rarity":6,"endlineTag":"hr","attack":220,"affinity":-20,"defense":0,"decoSlots":[2,1],"eleStat":[["fire",21]],"rampSkills":[[["affinity_boost_3",null],["fire_boost_3",null],["brutal_strike",null],["affinity_boost_2","25b"],["affinity_boost_1","25a"],["fire_boost_2","25a"],["defense_boost_2","24c"],["small_monster_exploit","24c"],["spiribird_doubled","24c"],["defense_boost_1","24a"],["attack_boost_2","19b"]]],"baseSharpness":[120,110,40,50,30,0,0],"maxSharpness":[120,110,40,50,80,0,0]}]],["Goss Harag Tree",[{"id":"26a","name":"Mincing Blade I","rarity":3,"endlineTag":"","attack":170,"affinity":-15,"defense":0,"decoSlots":[],"eleStat":[["ice",10]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_1",null],["brutal_strike",null],["defense_boost_1","24a"],["small_monster_exploit","24a"],["spiribird_doubled","24a"],["attack_boost_2","19b"]]],"baseSharpness":[100,30,90,30,0,0,0],"maxSharpness":[100,30,90,70,10,0,0]},{"id":"26b","name":"Mincing Blade II","rarity":6,"endlineTag":"","attack":220,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",11]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_2",null],["brutal_strike",null],["ice_boost_1","26a"],["defense_boost_1","24a"],["small_monster_exploit","24a"],["spiribird_doubled","24a"],["attack_boost_2","19b"]]],"baseSharpness":[100,30,110,40,20,0,0],"maxSharpness":[100,30,110,40,70,0,0]},{"id":"26c","name":"Chef\'s Knife","rarity":6,"endlineTag":"hr","attack":230,"affinity":-15,"defense":0,"decoSlots":[2],"eleStat":[["ice",14]],"rampSkills":[[["affinity_boost_1",null],["ice_boost_3",null],["brutal_strike",null],["ice_boost_2","26b"],["ice_boost_1","26a"],["defense_boost_1","24a"],["small_monster_exploit","24a"],["spiribird_doubled","24a"],["attack_boost_2","19b"]]],"baseSharpness":[100,30,100,40,30,0,0],"maxSharpness":[100,30,100,40,70,10,0]}]],["Izuchi Tree",[{"id":"27a","name":"Izuchi Sickle I","rarity":1,"endlineTag":"","attack":60,"affinity":10,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_1",null],["small_monster_exploit",null],["buddy_rally",null],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[30,70,100,0,0,0,0],"maxSharpness":[30,70,140,10,0,0,0]},{"id":"27b","name":"Izuchi Sickle II","rarity":1,"endlineTag":"","attack":80,"affinity":12,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["affinity_boost_2",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_1","27a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[30,70,60,40,0,0,0],"maxSharpness":[30,70,60,90,0,0,0]},{"id":"27c","name":"Snapper Sickle","rarity":4,"endlineTag":"hr","attack":150,"affinity":15,"defense":0,"decoSlots":[2,1],"eleStat":[],"rampSkills":[[["affinity_boost_3",null],["small_monster_exploit",null],["buddy_rally",null],["affinity_boost_2","27b"],["affinity_boost_1","27a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[30,80,50,60,30,0,0],"maxSharpness":[30,80,50,60,80,0,0]}]],["Uroktor Tree",[{"id":"28a","name":"Lava Pick I","rarity":2,"endlineTag":"","attack":120,"affinity":0,"defense":5,"decoSlots":[],"eleStat":[["fire",10]],"rampSkills":[[["defense_boost_2",null],["fireblight_exploit",null],["dulling_strike",null],["affinity_boost_2","27b"],["small_monster_exploit","27b"],["buddy_rally","27b"],["affinity_boost_1","27a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[160,30,60,0,0,0,0],"maxSharpness":[160,30,60,50,0,0,0]},{"id":"28b","name":"Lava Pick II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":8,"decoSlots":[],"eleStat":[["fire",15]],"rampSkills":[[["defense_boost_2",null],["fireblight_exploit",null],["dulling_strike",null],["affinity_boost_2","27b"],["small_monster_exploit","27b"],["buddy_rally","27b"],["affinity_boost_1","27a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[100,40,60,50,0,0,0],"maxSharpness":[100,40,60,80,20,0,0]},{"id":"28c","name":"Burly Beak","rarity":5,"endlineTag":"hr","attack":190,"affinity":0,"defense":10,"decoSlots":[1,1,1],"eleStat":[["fire",17]],"rampSkills":[[["defense_boost_3",null],["fireblight_exploit",null],["dulling_strike",null],["defense_boost_2","28b"],["affinity_boost_2","27b"],["small_monster_exploit","27b"],["buddy_rally","27b"],["affinity_boost_1","27a"],["attack_boost_2","19a"],["defense_boost_1","19a"]]],"baseSharpness":[40,40,70,150,0,0,0],"maxSharpness":[40,40,70,150,50,0,0]}]],["Bnahabra Tree",[{"id":"29a","name":"Secta Nulo I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["affinity_boost_1",null],["small_monster_exploit",null]]],"baseSharpness":[100,30,70,0,0,0,0],"maxSharpness":[100,30,120,0,0,0,0]},{"id":"29b","name":"Secta Unu","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["defense_boost_1",null],["affinity_boost_1",null],["small_monster_exploit",null]]],"baseSharpness":[90,20,20,70,0,0,0],"maxSharpness":[90,20,20,120,0,0,0]},{"id":"29c","name":"Secta Nulo White I","rarity":3,"endlineTag":"","attack":110,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["ice",17]],"rampSkills":[[["defense_boost_2",null],["ice_boost_2",null],["silkbind_boost",null],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[140,20,20,70,0,0,0],"maxSharpness":[140,20,20,110,10,0,0]},{"id":"29d","name":"Secta Unu White","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["ice",19]],"rampSkills":[[["defense_boost_3",null],["ice_boost_4",null],["silkbind_boost",null],["defense_boost_2","29c"],["ice_boost_2","29c"],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[150,30,20,60,40,0,0],"maxSharpness":[150,30,20,60,70,20,0]}]],["Bnahabra (Drag\\u00e3o)",[{"id":"30a","name":"Secta Nulo Black I","rarity":4,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",19]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_2",null],["element_exploit",null],["ice_boost_2","29c"],["silkbind_boost","29c"],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[150,30,20,60,40,0,0],"maxSharpness":[150,30,20,60,80,10,0]},{"id":"30b","name":"Secta Nulo Black II","rarity":5,"endlineTag":"","attack":160,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",21]],"rampSkills":[[["affinity_boost_2",null],["defense_boost_3",null],["element_exploit",null],["defense_boost_2","30a"],["ice_boost_2","29c"],["silkbind_boost","29c"],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[140,20,20,70,50,0,0],"maxSharpness":[140,20,20,70,80,20,0]},{"id":"30c","name":"Secta Unu Black","rarity":6,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["dragon",24]],"rampSkills":[[["affinity_boost_3",null],["defense_boost_3",null],["element_exploit",null],["affinity_boost_2","30b"],["defense_boost_2","30a"],["ice_boost_2","29c"],["silkbind_boost","29c"],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[160,20,20,90,60,0,0],"maxSharpness":[160,20,20,90,70,40,0]}]],["Bnahabra (Paralysis)",[{"id":"31a","name":"Secta Nulo Green I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",14]],"rampSkills":[[["affinity_boost_1",null],["paralysis_boost_1",null],["anti_aerial_species",null],["defense_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[150,30,30,40,0,0,0],"maxSharpness":[150,30,30,90,0,0,0]},{"id":"31b","name":"Secta Unu Green","rarity":5,"endlineTag":"hr","attack":160,"affinity":0,"defense":0,"decoSlots":[1,1,1],"eleStat":[["paralysis",19]],"rampSkills":[[["affinity_boost_3",null],["paralysis_boost_2",null],["anti_aerial_species",null],["affinity_boost_1","31a"],["paralysis_boost_1","31a"],["defense_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[140,30,30,70,30,0,0],"maxSharpness":[140,30,30,70,70,10,0]}]],["Bnahabra (Thunder)",[{"id":"32a","name":"Secta Nulo Yellow I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",16]],"rampSkills":[[["defense_boost_2",null],["element_exploit",null],["silkbind_boost",null],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[140,30,30,50,0,0,0],"maxSharpness":[140,30,30,90,10,0,0]},{"id":"32b","name":"Secta Unu Yellow","rarity":5,"endlineTag":"hr","attack":170,"affinity":0,"defense":0,"decoSlots":[2,2],"eleStat":[["thunder",23]],"rampSkills":[[["defense_boost_3",null],["element_exploit",null],["silkbind_boost",null],["defense_boost_2","32a"],["defense_boost_1","29b"],["affinity_boost_1","29b"],["small_monster_exploit","29b"]]],"baseSharpness":[160,20,20,100,50,0,0],"maxSharpness":[160,20,20,100,70,30,0]}]],["Bnahabra (Fire)",[{"id":"33a","name":"Secta Nulo Red I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",11]],"rampSkills":[[["attack_boost_1",null],["fire_boost_1",null],["small_monster_exploit",null],["defense_boost_1","29a"],["affinity_boost_1","29a"]]],"baseSharpness":[100,40,30,30,0,0,0],"maxSharpness":[100,40,30,80,0,0,0]},{"id":"33b","name":"Secta Nulo Red II","rarity":2,"endlineTag":"","attack":90,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["fire",13]],"rampSkills":[[["attack_boost_2",null],["fire_boost_2",null],["small_monster_exploit",null],["attack_boost_1","33a"],["fire_boost_1","33a"],["defense_boost_1","29a"],["affinity_boost_1","29a"]]],"baseSharpness":[120,40,40,50,0,0,0],"maxSharpness":[120,40,40,100,0,0,0]},{"id":"33c","name":"Secta Unu Red","rarity":4,"endlineTag":"hr","attack":140,"affinity":0,"defense":0,"decoSlots":[3,1],"eleStat":[["fire",19]],"rampSkills":[[["attack_boost_3",null],["fire_boost_3",null],["wyvern_exploit",null],["attack_boost_2","33b"],["fire_boost_2","33b"],["small_monster_exploit","33b"],["attack_boost_1","33a"],["fire_boost_1","33a"],["defense_boost_1","29a"],["affinity_boost_1","29a"]]],"baseSharpness":[150,30,20,60,40,0,0],"maxSharpness":[150,30,20,60,80,10,0]}]],["Magnamalo Tree",[{"id":"34a","name":"Sinister Sword I","rarity":3,"endlineTag":"","attack":130,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",13]],"rampSkills":[[["attack_boost_2",null],["blast_boost_1",null],["magnamalo_soul",null]]],"baseSharpness":[160,20,40,80,0,0,0],"maxSharpness":[160,20,40,110,20,0,0]},{"id":"34b","name":"Sinister Sword II","rarity":3,"endlineTag":"","attack":140,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",18]],"rampSkills":[[["attack_boost_3",null],["blast_boost_1",null],["magnamalo_soul",null],["attack_boost_2","34a"]]],"baseSharpness":[170,20,20,90,0,0,0],"maxSharpness":[170,20,20,110,30,0,0]},{"id":"34c","name":"Sinister Shadekeeper","rarity":6,"endlineTag":"hr","attack":200,"affinity":0,"defense":0,"decoSlots":[2,1],"eleStat":[["blast",26]],"rampSkills":[[["attack_boost_3",null],["blast_boost_2",null],["magnamalo_soul",null],["blast_boost_1","34b"],["attack_boost_2","34a"]]],"baseSharpness":[190,10,20,90,40,0,0],"maxSharpness":[190,10,20,90,60,30,0]}]],["Rajang Tree",[{"id":"35a","name":"Rajang Club I","rarity":5,"endlineTag":"","attack":200,"affinity":-20,"defense":0,"decoSlots":[],"eleStat":[["thunder",11]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_1",null],["dulling_strike",null]]],"baseSharpness":[50,20,100,80,0,0,0],"maxSharpness":[50,20,100,130,0,0,0]},{"id":"35b","name":"Rajang Club II","rarity":6,"endlineTag":"","attack":210,"affinity":-15,"defense":0,"decoSlots":[3],"eleStat":[["thunder",17]],"rampSkills":[[["affinity_boost_1",null],["thunder_boost_2",null],["dulling_strike",null],["thunder_boost_1","35a"]]],"baseSharpness":[20,40,100,90,0,0,0],"maxSharpness":[20,40,100,130,10,0,0]},{"id":"35c","name":"Banned Rajang Club","rarity":7,"endlineTag":"hr","attack":220,"affinity":-10,"defense":0,"decoSlots":[3],"eleStat":[["thunder",19]],"rampSkills":[[["affinity_boost_2",null],["thunder_boost_2",null],["dulling_strike",null],["affinity_boost_1","35b"],["thunder_boost_1","35a"]]],"baseSharpness":[50,60,80,100,10,0,0],"maxSharpness":[50,60,80,100,50,10,0]}]],["Ibushi Tree",[{"id":"36a","name":"Azure Elder Sword I","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",10]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["defense_boost_1",null]]],"baseSharpness":[20,20,20,40,100,0,0],"maxSharpness":[20,20,20,40,150,0,0]},{"id":"36b","name":"Azure Elder Sword II","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",12]],"rampSkills":[[["dragon_boost_3",null],["anti_aerial_species",null],["ibushi_soul",null],["defense_boost_1","36a"]]],"baseSharpness":[20,20,50,50,110,0,0],"maxSharpness":[20,20,50,50,150,10,0]},{"id":"36c","name":"Abyssal Gale Shredder","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["dragon",15]],"rampSkills":[[["dragon_boost_4",null],["anti_aerial_species",null],["ibushi_soul",null],["dragon_boost_3","36b"],["defense_boost_1","36a"]]],"baseSharpness":[20,20,80,60,120,0,0],"maxSharpness":[20,20,80,60,150,20,0]}]],["Narwa Tree",[{"id":"37a","name":"Thunderbolt Sword I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",33]],"rampSkills":[[["attack_boost_2",null],["anti_aerial_species",null],["narwa_soul",null]]],"baseSharpness":[20,20,180,40,40,0,0],"maxSharpness":[20,20,180,40,60,30,0]},{"id":"37b","name":"Abyssal Storm Shredder","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["thunder",35]],"rampSkills":[[["attack_boost_3",null],["anti_aerial_species",null],["narwa_soul",null],["attack_boost_2","37a"]]],"baseSharpness":[20,10,220,40,60,0,0],"maxSharpness":[20,10,220,40,70,40,0]}]],["Kushala Daora Tree",[{"id":"38a","name":"Gelosteel Dagger I","rarity":6,"endlineTag":"","attack":170,"affinity":5,"defense":0,"decoSlots":[1],"eleStat":[["ice",31]],"rampSkills":[[["attack_boost_2",null],["affinity_boost_2",null],["kushala_daora_soul",null]]],"baseSharpness":[70,100,60,70,50,0,0],"maxSharpness":[70,100,60,70,70,30,0]},{"id":"38b","name":"Daora\'s Razor","rarity":7,"endlineTag":"hr","attack":180,"affinity":10,"defense":0,"decoSlots":[1],"eleStat":[["ice",36]],"rampSkills":[[["attack_boost_3",null],["affinity_boost_3",null],["kushala_daora_soul",null],["attack_boost_2","38a"],["affinity_boost_2","38a"]]],"baseSharpness":[80,120,30,50,60,10,0],"maxSharpness":[80,120,30,50,60,60,0]}]],["Teostra Tree",[{"id":"39a","name":"Teostra\'s Spada I","rarity":6,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",36]],"rampSkills":[[["attack_boost_2",null],["fireblight_exploit",null],["teostra_soul",null]]],"baseSharpness":[150,20,80,60,40,0,0],"maxSharpness":[150,20,80,60,70,20,0]},{"id":"39b","name":"Teostra\'s Emblem","rarity":7,"endlineTag":"hr","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["blast",39]],"rampSkills":[[["attack_boost_3",null],["fireblight_exploit",null],["teostra_soul",null],["attack_boost_2","39a"]]],"baseSharpness":[160,50,30,60,50,0,0],"maxSharpness":[160,50,30,60,70,30,0]}]],["Valstrax Tree",[{"id":"40a","name":"Redwing Swiftblade I","rarity":6,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",32]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[180,0,0,0,0,70,0],"maxSharpness":[180,0,0,0,0,120,0]},{"id":"40b","name":"Vermilion Orgul","rarity":7,"endlineTag":"hr","attack":180,"affinity":0,"defense":0,"decoSlots":[2],"eleStat":[["dragon",34]],"rampSkills":[[["attack_boost_3",null],["wyvern_exploit",null],["valstrax_soul",null]]],"baseSharpness":[60,0,0,0,0,90,0],"maxSharpness":[60,0,0,0,0,140,0]}]],["Shell-Studded Tree",[{"id":"41a","name":"Sleepy Shellsword I","rarity":2,"endlineTag":"","attack":100,"affinity":0,"defense":16,"decoSlots":[],"eleStat":[["sleep",11]],"rampSkills":[[["defense_boost_1",null],["sleep_boost_1",null],["anti_aquatic_species",null]]],"baseSharpness":[50,60,90,0,0,0,0],"maxSharpness":[50,60,120,20,0,0,0]},{"id":"41b","name":"Sleepy Shellsword II","rarity":3,"endlineTag":"","attack":150,"affinity":0,"defense":18,"decoSlots":[],"eleStat":[["sleep",15]],"rampSkills":[[["defense_boost_2",null],["sleep_boost_1",null],["anti_aquatic_species",null],["defense_boost_1","41a"]]],"baseSharpness":[50,70,100,30,0,0,0],"maxSharpness":[50,70,100,60,20,0,0]},{"id":"41c","name":"Waking Nightmare","rarity":5,"endlineTag":"hr","attack":180,"affinity":0,"defense":20,"decoSlots":[3],"eleStat":[["sleep",19]],"rampSkills":[[["defense_boost_3",null],["sleep_boost_2",null],["anti_aquatic_species",null],["defense_boost_2","41b"],["sleep_boost_1","41b"],["defense_boost_1","41a"]]],"baseSharpness":[50,50,130,70,0,0,0],"maxSharpness":[50,50,130,70,50,0,0]}]],["Felyne Tree",[{"id":"42a","name":"Catspaw I","rarity":1,"endlineTag":"","attack":80,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",15]],"rampSkills":[[["attack_boost_2",null],["master_rider",null],["buddy_rally",null]]],"baseSharpness":[60,100,40,0,0,0,0],"maxSharpness":[60,100,90,0,0,0,0]},{"id":"42b","name":"Catspaw II","rarity":3,"endlineTag":"","attack":100,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[["paralysis",26]],"rampSkills":[[["attack_boost_3",null],["master_rider",null],["buddy_rally",null],["attack_boost_2","42a"]]],"baseSharpness":[60,100,80,10,0,0,0],"maxSharpness":[60,100,80,60,0,0,0]},{"id":"42c","name":"Catburglar","rarity":4,"endlineTag":"hr","attack":130,"affinity":0,"defense":0,"decoSlots":[3],"eleStat":[["paralysis",33]],"rampSkills":[[["attack_boost_4",null],["master_rider",null],["buddy_rally",null],["attack_boost_3","42b"],["attack_boost_2","42a"]]],"baseSharpness":[60,100,60,80,0,0,0],"maxSharpness":[60,100,60,80,10,40,0]}]],["Guild Tree",[{"id":"43a","name":"Ninja Sword I","rarity":6,"endlineTag":"","attack":190,"affinity":50,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["silkbind_boost",null],["master_rider",null],["spiribird_doubled",null]]],"baseSharpness":[10,20,30,190,0,0,0],"maxSharpness":[10,20,30,210,30,0,0]},{"id":"43b","name":"Hi Ninja Sword","rarity":7,"endlineTag":"hr","attack":200,"affinity":100,"defense":0,"decoSlots":[1,1,1],"eleStat":[],"rampSkills":[[["silkbind_boost",null],["master_rider",null],["spiribird_doubled",null]]],"baseSharpness":[10,20,30,240,0,0,0],"maxSharpness":[10,20,30,240,50,0,0]}]],["Rampage Tree",[{"id":"ra","name":"Rampage Sword I","rarity":4,"endlineTag":"","attack":150,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null]],[["attack_surge",null]]],"baseSharpness":[70,70,90,20,0,0,0],"maxSharpness":[70,70,90,70,0,0,0]},{"id":"rb","name":"Rampage Sword II","rarity":5,"endlineTag":"","attack":170,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_1",null],["affinity_boost_1",null],["defense_boost_1",null]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null]],[["attack_surge",null]]],"baseSharpness":[60,70,80,40,0,0,0],"maxSharpness":[60,70,80,90,0,0,0]},{"id":"rc","name":"Rampage Sword III","rarity":5,"endlineTag":"","attack":180,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_1",null],["water_1",null],["thunder_1",null],["ice_1",null],["dragon_1",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,80,30,20,0,0],"maxSharpness":[50,70,80,30,70,0,0]},{"id":"rd","name":"Rampage Sword IV","rarity":6,"endlineTag":"","attack":190,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_2",null],["elemental_boost_1",null],["affinity_boost_2",null],["defense_boost_2",null],["sharpness_type_1",null],["sharpness_type_2",null],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_2",null],["water_2",null],["thunder_2",null],["ice_2",null],["dragon_2",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,70,30,30,0,0],"maxSharpness":[50,70,70,30,80,0,0]},{"id":"re","name":"Rampage Sword V","rarity":6,"endlineTag":"","attack":200,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_3",null],["elemental_boost_1",null],["affinity_boost_3",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_1",null],["paralysis_1",null],["sleep_1",null],["blast_1",null],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,50,50,30,0,0],"maxSharpness":[50,70,50,50,70,10,0]},{"id":"rf","name":"Rampage Sword S","rarity":7,"endlineTag":"hr","attack":210,"affinity":0,"defense":0,"decoSlots":[],"eleStat":[],"rampSkills":[[["attack_boost_4",null],["elemental_boost_1",null],["affinity_boost_4",null],["defense_boost_3",null],["sharpness_type_1",null],["sharpness_type_2",null],["sharpness_type_3",null],["sharpness_type_4",null],["attack_boost_3","re"],["affinity_boost_3","re"],["attack_boost_2","rd"],["affinity_boost_2","rd"],["defense_boost_2","rd"],["attack_boost_1","rb"],["affinity_boost_1","rb"],["defense_boost_1","rb"]],[["non_elemental_boost",null],["fire_3",null],["water_3",null],["thunder_3",null],["ice_3",null],["dragon_3",null],["poison_2",null],["paralysis_2",null],["sleep_2",null],["blast_2",null],["poison_1","re"],["paralysis_1","re"],["sleep_1","re"],["blast_1","re"],["fire_2","rd"],["water_2","rd"],["thunder_2","rd"],["ice_2","rd"],["dragon_2","rd"],["fire_1","rc"],["water_1","rc"],["thunder_1","rc"],["ice_1","rc"],["dragon_1","rc"]],[["attack_surge",null],["elemental_surge",null],["affinity_surge",null]]],"baseSharpness":[50,70,30,60,40,0,0],"maxSharpness":[50,70,30,60,70,20,0]}]]]}';
 
-export const swordandshieldsArray: Readonly<SwordAndShield[]> = [
-    __generated_swordandshield__1a,
-    __generated_swordandshield__1b,
-    __generated_swordandshield__1c,
-    __generated_swordandshield__1d,
-    __generated_swordandshield__1e,
-    __generated_swordandshield__1f,
-    __generated_swordandshield__2a,
-    __generated_swordandshield__2b,
-    __generated_swordandshield__2c,
-    __generated_swordandshield__3a,
-    __generated_swordandshield__3b,
-    __generated_swordandshield__3c,
-    __generated_swordandshield__4a,
-    __generated_swordandshield__4b,
-    __generated_swordandshield__4c,
-    __generated_swordandshield__5a,
-    __generated_swordandshield__5b,
-    __generated_swordandshield__5c,
-    __generated_swordandshield__6a,
-    __generated_swordandshield__6b,
-    __generated_swordandshield__6c,
-    __generated_swordandshield__7a,
-    __generated_swordandshield__7b,
-    __generated_swordandshield__7c,
-    __generated_swordandshield__8a,
-    __generated_swordandshield__8b,
-    __generated_swordandshield__8c,
-    __generated_swordandshield__9a,
-    __generated_swordandshield__9b,
-    __generated_swordandshield__9c,
-    __generated_swordandshield__10a,
-    __generated_swordandshield__10b,
-    __generated_swordandshield__10c,
-    __generated_swordandshield__10d,
-    __generated_swordandshield__10e,
-    __generated_swordandshield__10f,
-    __generated_swordandshield__11a,
-    __generated_swordandshield__11b,
-    __generated_swordandshield__11c,
-    __generated_swordandshield__12a,
-    __generated_swordandshield__12b,
-    __generated_swordandshield__12c,
-    __generated_swordandshield__13a,
-    __generated_swordandshield__13b,
-    __generated_swordandshield__13c,
-    __generated_swordandshield__14a,
-    __generated_swordandshield__14b,
-    __generated_swordandshield__14c,
-    __generated_swordandshield__15a,
-    __generated_swordandshield__15b,
-    __generated_swordandshield__15c,
-    __generated_swordandshield__16a,
-    __generated_swordandshield__16b,
-    __generated_swordandshield__16c,
-    __generated_swordandshield__17a,
-    __generated_swordandshield__17b,
-    __generated_swordandshield__17c,
-    __generated_swordandshield__18a,
-    __generated_swordandshield__18b,
-    __generated_swordandshield__18c,
-    __generated_swordandshield__19a,
-    __generated_swordandshield__19b,
-    __generated_swordandshield__19c,
-    __generated_swordandshield__19d,
-    __generated_swordandshield__19e,
-    __generated_swordandshield__19f,
-    __generated_swordandshield__20a,
-    __generated_swordandshield__20b,
-    __generated_swordandshield__20c,
-    __generated_swordandshield__21a,
-    __generated_swordandshield__21b,
-    __generated_swordandshield__21c,
-    __generated_swordandshield__22a,
-    __generated_swordandshield__22b,
-    __generated_swordandshield__22c,
-    __generated_swordandshield__23a,
-    __generated_swordandshield__23b,
-    __generated_swordandshield__23c,
-    __generated_swordandshield__24a,
-    __generated_swordandshield__24b,
-    __generated_swordandshield__24c,
-    __generated_swordandshield__25a,
-    __generated_swordandshield__25b,
-    __generated_swordandshield__25c,
-    __generated_swordandshield__26a,
-    __generated_swordandshield__26b,
-    __generated_swordandshield__26c,
-    __generated_swordandshield__27a,
-    __generated_swordandshield__27b,
-    __generated_swordandshield__27c,
-    __generated_swordandshield__28a,
-    __generated_swordandshield__28b,
-    __generated_swordandshield__28c,
-    __generated_swordandshield__29a,
-    __generated_swordandshield__29b,
-    __generated_swordandshield__29c,
-    __generated_swordandshield__29d,
-    __generated_swordandshield__30a,
-    __generated_swordandshield__30b,
-    __generated_swordandshield__30c,
-    __generated_swordandshield__31a,
-    __generated_swordandshield__31b,
-    __generated_swordandshield__32a,
-    __generated_swordandshield__32b,
-    __generated_swordandshield__33a,
-    __generated_swordandshield__33b,
-    __generated_swordandshield__33c,
-    __generated_swordandshield__34a,
-    __generated_swordandshield__34b,
-    __generated_swordandshield__34c,
-    __generated_swordandshield__35a,
-    __generated_swordandshield__35b,
-    __generated_swordandshield__35c,
-    __generated_swordandshield__36a,
-    __generated_swordandshield__36b,
-    __generated_swordandshield__36c,
-    __generated_swordandshield__37a,
-    __generated_swordandshield__37b,
-    __generated_swordandshield__38a,
-    __generated_swordandshield__38b,
-    __generated_swordandshield__39a,
-    __generated_swordandshield__39b,
-    __generated_swordandshield__40a,
-    __generated_swordandshield__40b,
-    __generated_swordandshield__41a,
-    __generated_swordandshield__41b,
-    __generated_swordandshield__41c,
-    __generated_swordandshield__42a,
-    __generated_swordandshield__42b,
-    __generated_swordandshield__42c,
-    __generated_swordandshield__43a,
-    __generated_swordandshield__43b,
-    __generated_swordandshield__ra,
-    __generated_swordandshield__rb,
-    __generated_swordandshield__rc,
-    __generated_swordandshield__rd,
-    __generated_swordandshield__re,
-    __generated_swordandshield__rf,
-];
+export const swordandshieldsArray: Readonly<SwordAndShield[]> = loadWeaponPayload<SwordAndShield>(payload);
@@ -0,0 +1,113 @@
+/*
+ * Author:  simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ *
+ * This file is NOT generated code.
+ * The generated code files are the '_generated_*.ts' files.
+ *
+ * This file resolves the lookup indexes precomputed by the code generator into the objects they refer to.
+ * (See '/dev_scripts/mhrb/code_generators/indexes.py' for the index format.)
+ *
+ * Each lookup only touches the entries that match, rather than scanning the whole catalogue. Skill lookups are cached.
+ */
+
+import {
+    type ArmourSlot,
+    type Skill,
+    type Decoration,
+    type ArmourPiece,
+    type RampageSkill,
+    type Weapon,
+} from "../../common/types";
+
+import {decosArray} from "./_generated_decorations";
+import {armourSetsArray} from "./_generated_armour";
+import {
+    skillToArmourPieces,
+    skillToDecos,
+    rampToWeapons,
+} from "./_generated_indexes";
+
+import {
+    skillsById,
+    rampsById,
+} from "./lookups";
+import {
+    getLoadedWeaponArray,
+    weaponCategories,
+} from "./weapons";
+
+const armourSlotsByIndex: Readonly<ArmourSlot[]> = ["head", "chest", "arms", "waist", "legs"];
+
+const armourPiecesCache = new Map<Skill, Readonly<Readonly<[ArmourPiece, number]>[]>>();
+const decosCache = new Map<Skill, Readonly<Readonly<[Decoration, number]>[]>>();
+
+function getRow(rows: Readonly<Readonly<number[]>[]>, i: number | undefined): Readonly<number[]> {
+    if (i === undefined) return [];
+    const ret = rows[i];
+    if (ret === undefined) throw new Error(`Index row out of range: ${i}`);
+    return ret;
+}
+
+function getElement<T>(arr: Readonly<T[]>, i: number): T {
+    const ret = arr[i];
+    if (ret === undefined) throw new Error(`Index refers to a nonexistent element: ${i}`);
+    return ret;
+}
+
+/*
+ * Returns [armour piece, skill level] for every armour piece with the skill.
+ */
+export function armourPiecesWithSkill(skill: Skill): Readonly<Readonly<[ArmourPiece, number]>[]> {
+    let ret = armourPiecesCache.get(skill);
+    if (ret === undefined) {
+        const row = getRow(skillToArmourPieces, skillsById.indexOf(skill.id));
+        const tmp: Readonly<[ArmourPiece, number]>[] = [];
+        for (let i = 0; i < row.length; i += 2) {
+            const ref = row[i]!; // DANGER: Type assertion! Rows are always made of pairs.
+            const armourSet = getElement(armourSetsArray, Math.floor(ref / 5));
+            const armourPiece = armourSet[getElement(armourSlotsByIndex, ref % 5)];
+            if (armourPiece === undefined) throw new Error(`Index refers to a nonexistent armour piece: ${ref}`);
+            tmp.push([armourPiece, row[i + 1]!]);
+        }
+        ret = tmp;
+        armourPiecesCache.set(skill, ret);
+    }
+    return ret;
+}
+
+/*
+ * Returns [decoration, skill level] for every decoration with the skill.
+ */
+export function decosWithSkill(skill: Skill): Readonly<Readonly<[Decoration, number]>[]> {
+    let ret = decosCache.get(skill);
+    if (ret === undefined) {
+        const row = getRow(skillToDecos, skillsById.indexOf(skill.id));
+        const tmp: Readonly<[Decoration, number]>[] = [];
+        for (let i = 0; i < row.length; i += 2) {
+            tmp.push([getElement(decosArray, row[i]!), row[i + 1]!]); // DANGER: Type assertion!
+        }
+        ret = tmp;
+        decosCache.set(skill, ret);
+    }
+    return ret;
+}
+
+
+/*
+ * Returns every weapon that can have the rampage skill, in weapon category order.
+ *
+ * Weapons are loaded one category at a time (see weapons.ts), so only categories that have finished loading are
+ * included. This isn't cached since more categories can load later.
+ */
+export function weaponsWithRampSkill(rampSkill: RampageSkill): Readonly<Weapon[]> {
+    const row = getRow(rampToWeapons, rampsById.indexOf(rampSkill.id));
+    const ret: Weapon[] = [];
+    // Each run is [category index, number of weapons, weapon index, ...]
+    for (let i = 0; i < row.length; i += 2 + row[i + 1]!) { // DANGER: Type assertion! Runs always have a count.
+        const weapons = getLoadedWeaponArray(getElement(weaponCategories, row[i]!));
+        if (weapons === null) continue;
+        for (const j of row.slice(i + 2, i + 2 + row[i + 1]!)) ret.push(getElement(weapons, j));
+    }
+    return ret;
+}
@@ -0,0 +1,48 @@
+/*
+ * Author:  simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ *
+ * This file is NOT generated code.
+ * The generated code files are the '_generated_*.ts' files.
+ *
+ * This file has the by-ID lookups over the generated arrays. They use the sort orders precomputed by the code generator
+ * (see '/dev_scripts/mhrb/code_generators/indexes.py'), so no maps need to be built at startup.
+ */
+
+import {
+    IndexedFrozenMap,
+} from "../../generic/frozen-containers";
+
+import {
+    type Skill,
+    type RampageSkill,
+    type Decoration,
+    type ArmourSet,
+} from "../../common/types";
+
+import {skillsArray} from "./_generated_skills";
+import {rampsArray} from "./_generated_rampage_skills";
+import {decosArray} from "./_generated_decorations";
+import {armourSetsArray} from "./_generated_armour";
+import {
+    skillIdOrder,
+    skillShortIdOrder,
+    rampIdOrder,
+    rampShortIdOrder,
+    decoIdOrder,
+    armourSetIdOrder,
+} from "./_generated_indexes";
+
+export const skillsById = new IndexedFrozenMap<string, Skill>(skillsArray, skillIdOrder, (x) => x.id);
+export const skillsByShortId = new IndexedFrozenMap<number, Skill>(skillsArray, skillShortIdOrder, (x) => x.shortId);
+
+export const rampsById = new IndexedFrozenMap<string, RampageSkill>(rampsArray, rampIdOrder, (x) => x.id);
+export const rampsByShortId = new IndexedFrozenMap<string, RampageSkill>(
+    rampsArray,
+    rampShortIdOrder,
+    (x) => x.shortID,
+);
+
+export const decosById = new IndexedFrozenMap<number, Decoration>(decosArray, decoIdOrder, (x) => x.id);
+
+export const armourSetsById = new IndexedFrozenMap<number, ArmourSet>(armourSetsArray, armourSetIdOrder, (x) => x.id);
@@ -0,0 +1,205 @@
+/*
+ * Author:  simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ *
+ * This file is NOT generated code.
+ * The generated code files are the '_generated_*.ts' files.
+ *
+ * This file searches every skill, decoration, armour piece and weapon by name, using the trigram index precomputed
+ * by the code generator. (See '/dev_scripts/mhrb/code_generators/search_index.py' for the index format.)
+ *
+ * Results are the same as checking each object's filter helpers with includes(), but only the objects that have
+ * every trigram of the query get checked. Weapon tree names are indexed once per tree, and a matching tree matches
+ * all of its weapons.
+ *
+ * Weapons are loaded one category at a time (see weapons.ts), so only the weapon categories that have finished
+ * loading are searched. Callers that want every weapon need to load the categories first.
+ */
+
+import {
+    type ArmourSlot,
+    type Skill,
+    type Decoration,
+    type ArmourPiece,
+    type Weapon,
+    type WeaponCategory,
+} from "../../common/types";
+import {
+    toNameFilterString,
+    toTrigrams,
+} from "../../common/mappings";
+
+import {skillsArray} from "./_generated_skills";
+import {decosArray} from "./_generated_decorations";
+import {armourSetsArray} from "./_generated_armour";
+import {weaponChunkManifest} from "./_generated_weapon_chunks";
+import {weaponTreeOffsets} from "./_generated_indexes";
+import {
+    searchNumDocs,
+    searchTrigrams,
+    searchPostings,
+} from "./_generated_search_index";
+
+import {
+    getLoadedWeaponArray,
+    weaponCategories,
+} from "./weapons";
+
+export interface NameSearchResults {
+    readonly skills:       Readonly<Skill[]>;
+    readonly decorations:  Readonly<Decoration[]>;
+    readonly armourPieces: Readonly<ArmourPiece[]>;
+    readonly weapons:      Readonly<Weapon[]>;
+}
+
+type SearchDoc = Readonly<{kind: "skill",       obj: Skill,       fields: Readonly<string[]>}
+                        | {kind: "decoration",  obj: Decoration,  fields: Readonly<string[]>}
+                        | {kind: "armourPiece", obj: ArmourPiece, fields: Readonly<string[]>}
+                        | {kind: "weapon",      category: WeaponCategory, index: number}
+                        // Weapons start to (but not including) end of the category's array, starting at document startDoc
+                        | {kind: "weaponTree",  category: WeaponCategory, start: number, end: number, startDoc: number}>;
+
+const armourSlots: Readonly<ArmourSlot[]> = ["head", "chest", "arms", "waist", "legs"];
+
+// Built on the first search, since most page loads never search
+let docs: Readonly<SearchDoc[]> | null = null;
+let trigramIndices: ReadonlyMap<string, number> | null = null;
+
+// Must be in the same order as search_index.py numbers the documents
+function buildDocs(): SearchDoc[] {
+    const ret: SearchDoc[] = [];
+    for (const obj of skillsArray) {
+        ret.push({kind: "skill", obj, fields: [obj.filterHelpers.nameLower]});
+    }
+    for (const obj of decosArray) {
+        ret.push({kind: "decoration", obj, fields: [obj.filterHelpers.nameLower]});
+    }
+    for (const armourSet of armourSetsArray) {
+        for (const slotID of armourSlots) {
+            const obj = armourSet[slotID];
+            if (obj === undefined) continue;
+            const h = obj.filterHelpers;
+            ret.push({kind: "armourPiece", obj, fields: [h.nameLower, h.setNameLower, h.hintStrLower]});
+        }
+    }
+    // Weapons are only looked up when they're searched, since their category might not be loaded yet
+    const weaponStartDocs = new Map<WeaponCategory, number>();
+    for (const category of weaponCategories) {
+        weaponStartDocs.set(category, ret.length);
+        for (let index = 0; index < weaponChunkManifest[category].numWeapons; ++index) {
+            ret.push({kind: "weapon", category, index});
+        }
+    }
+    for (const category of weaponCategories) {
+        const offsets = weaponTreeOffsets[category];
+        const startDoc = weaponStartDocs.get(category)!; // DANGER: Type assertion! Set by the loop above.
+        for (let tree = 0; tree + 1 < offsets.length; ++tree) {
+            const start = offsets[tree]!; // DANGER: Type assertion!
+            ret.push({kind: "weaponTree", category, start, end: offsets[tree + 1]!, startDoc: startDoc + start});
+        }
+    }
+    console.assert(ret.length === searchNumDocs);
+    return ret;
+}
+
+function getDocs(): Readonly<SearchDoc[]> {
+    if (docs === null) docs = buildDocs();
+    return docs;
+}
+
+function getPostings(trigram: string): Readonly<number[]> | null {
+    if (trigramIndices === null) {
+        trigramIndices = new Map<string, number>(searchTrigrams.map((x, i): [string, number] => [x, i]));
+    }
+    const i = trigramIndices.get(trigram);
+    if (i === undefined) return null;
+    const deltas = searchPostings[i]!; // DANGER: Type assertion! There's one postings list per trigram.
+
+    const ret: number[] = [];
+    let doc = 0;
+    for (const delta of deltas) {
+        doc += delta;
+        ret.push(doc);
+    }
+    return ret;
+}
+
+// Returns every document number that has all of the trigrams
+function getCandidates(trigrams: Set<string>): Readonly<number[]> {
+    const lists: Readonly<number[]>[] = [];
+    for (const trigram of trigrams) {
+        const postings = getPostings(trigram);
+        if (postings === null) return [];
+        lists.push(postings);
+    }
+    lists.sort((a, b) => a.length - b.length); // Smallest first, so each intersection is as cheap as possible
+
+    let ret = lists[0] ?? [];
+    for (const other of lists.slice(1)) {
+        const tmp: number[] = [];
+        let j = 0;
+        for (const doc of ret) {
+            while ((j < other.length) && (other[j]! < doc)) ++j; // DANGER: Type assertion!
+            if (other[j] === doc) tmp.push(doc);
+        }
+        ret = tmp;
+        if (ret.length === 0) break;
+    }
+    return ret;
+}
+
+/*
+ * Finds every skill, decoration, armour piece and weapon whose name (or set name, search hint, or weapon tree name)
+ * contains the query, after both are converted with toNameFilterString().
+ *
+ * Queries shorter than three characters can't use the index, so they check everything.
+ *
+ * Weapons from categories that haven't been loaded yet are left out.
+ */
+export function searchByName(query: string): NameSearchResults {
+    const q = toNameFilterString(query);
+    const allDocs = getDocs();
+    const trigrams = toTrigrams(q);
+
+    const candidates: Readonly<number[]> = (trigrams.size === 0)
+        ? allDocs.map((_, i) => i)
+        : getCandidates(trigrams);
+
+    const skills: Skill[] = [];
+    const decorations: Decoration[] = [];
+    const armourPieces: ArmourPiece[] = [];
+    const weaponDocs = new Set<number>(); // Matching weapons, as document numbers (since trees can match them too)
+    for (const i of candidates) {
+        const doc = allDocs[i]!; // DANGER: Type assertion!
+        if (doc.kind === "weapon") {
+            const arr = getLoadedWeaponArray(doc.category);
+            if (arr === null) continue;
+            const obj = arr[doc.index]!; // DANGER: Type assertion! The manifest has each category's weapon count.
+            if (obj.filterHelpers.nameLower.includes(q)) weaponDocs.add(i);
+            continue;
+        }
+        if (doc.kind === "weaponTree") {
+            const arr = getLoadedWeaponArray(doc.category);
+            if (arr === null) continue;
+            const first = arr[doc.start]!; // DANGER: Type assertion! Trees always have weapons.
+            if (!first.filterHelpers.treeNameLower.includes(q)) continue;
+            for (let j = 0; j < doc.end - doc.start; ++j) weaponDocs.add(doc.startDoc + j);
+            continue;
+        }
+        if (!doc.fields.some((x) => x.includes(q))) continue;
+        switch (doc.kind) {
+            case "skill":       skills.push(doc.obj);       break;
+            case "decoration":  decorations.push(doc.obj);  break;
+            case "armourPiece": armourPieces.push(doc.obj); break;
+        }
+    }
+
+    // In document order, which is weapon category order, then array order
+    const weapons: Weapon[] = [];
+    for (const i of Array.from(weaponDocs).sort((a, b) => a - b)) {
+        const doc = allDocs[i]!; // DANGER: Type assertion!
+        if (doc.kind !== "weapon") throw new Error(`Not a weapon document: ${i}`);
+        weapons.push(getLoadedWeaponArray(doc.category)![doc.index]!); // DANGER: Type assertion! Checked above.
+    }
+    return {skills, decorations, armourPieces, weapons};
+}
@@ -0,0 +1,322 @@
+/*
+ * Author:  simshadows <contact@simshadows.com>
+ * License: GNU Affero General Public License v3 (AGPL-3.0)
+ *
+ * This file is NOT generated code.
+ * The generated code files are the '_generated_*.ts' files.
+ *
+ * This file loads weapon data from the JSON payloads written by the code generator's JSON weapon format.
+ * (See '/dev_scripts/mhrb/code_generators/weapons_json.py' for the payload format.)
+ */
+
+import {
+    FrozenMap,
+    IndexedFrozenMap,
+} from "../../generic/frozen-containers";
+
+import {
+    type Rarity,
+    type EndlineTag,
+    type EleStatStr,
+    type Sharpness,
+    type DecoSlotsArray,
+    type RampageSkill,
+
+    type GLStats,
+    type HHSongs,
+    type SAStats,
+    type CBStats,
+    type IGStats,
+    type BowStats,
+    type BowgunStats,
+    type BowgunAmmoType,
+    type BowgunAmmoMap,
+
+    type Weapon,
+    type WeaponCategory,
+
+    isMeleeCategory,
+    isBowgunCategory,
+    isElementStr,
+    isStatStr,
+    isDecoSlotsArray,
+    isBowgunAmmoType,
+    isBowgunRecoil,
+    isBowgunReload,
+} from "../../common/types";
+import {
+    toNameFilterString,
+} from "../../common/mappings";
+
+import {rampsById} from "./lookups";
+import {weaponIdOrders} from "./_generated_indexes";
+
+interface PayloadBowgunStats {
+    readonly deviation: BowgunStats["deviation"];
+    readonly recoil:    BowgunStats["recoil"];
+    readonly reload:    BowgunStats["reload"];
+    readonly ammo:      {readonly [K in BowgunAmmoType]: Readonly<[boolean, number]>}; // [available, ammo capacity]
+}
+
+interface PayloadWeapon {
+    readonly id:         string;
+    readonly name:       string;
+    readonly rarity:     Rarity;
+    readonly endlineTag: EndlineTag;
+
+    readonly attack:    number;
+    readonly affinity:  number;
+    readonly defense:   number;
+    readonly decoSlots: Readonly<DecoSlotsArray>;
+    readonly eleStat:   Readonly<Readonly<[EleStatStr, number]>[]>;
+
+    // [rampage skill ID, ID of the weapon it's inherited from]
+    readonly rampSkills: Readonly<Readonly<Readonly<[string, string | null]>[]>[]>;
+
+    readonly baseSharpness?: Sharpness;
+    readonly maxSharpness?:  Sharpness;
+
+    readonly gunlanceStats?:     GLStats;
+    readonly huntinghornSongs?:  HHSongs;
+    readonly switchaxeStats?:    SAStats;
+    readonly chargebladeStats?:  CBStats;
+    readonly insectglaiveStats?: IGStats;
+    readonly bowgunStats?:       PayloadBowgunStats;
+    readonly bowStats?:          BowStats;
+}
+
+interface Payload {
+    readonly category: WeaponCategory;
+    readonly trees:    Readonly<Readonly<[string, Readonly<PayloadWeapon[]>]>[]>;
+}
+
+type SpecialMechanics = Pick<Weapon, "baseSharpness"
+                                   | "maxSharpness"
+                                   | "gunlanceStats"
+                                   | "huntinghornSongs"
+                                   | "switchaxeStats"
+                                   | "chargebladeStats"
+                                   | "insectglaiveStats"
+                                   | "bowgunStats"
+                                   | "bowStats">;
+
+type RampSkillSlot = Readonly<[RampageSkill, Weapon | null]>[];
+
+/*** Payload Validation ***/
+
+// JSON.parse() can't check anything, so payloads are checked against the format before anything is built from them.
+// Only the shape is checked (down to each special mechanic being an object), not whether the game data makes sense.
+
+type UnknownRecord = {readonly [key: string]: unknown};
+
+const weaponCategories: ReadonlySet<string> = new Set<WeaponCategory>([
+    "greatsword", "longsword", "swordandshield", "dualblades", "lance", "gunlance", "hammer",
+    "huntinghorn", "switchaxe", "chargeblade", "insectglaive", "lightbowgun", "heavybowgun", "bow",
+]);
+
+// Special mechanics that each category's weapons must have, on top of the sharpness that all melee weapons must have.
+const requiredCategoryMechanics = new Map<WeaponCategory, keyof PayloadWeapon>([
+    ["gunlance",     "gunlanceStats"    ],
+    ["huntinghorn",  "huntinghornSongs" ],
+    ["switchaxe",    "switchaxeStats"   ],
+    ["chargeblade",  "chargebladeStats" ],
+    ["insectglaive", "insectglaiveStats"],
+    ["lightbowgun",  "bowgunStats"      ],
+    ["heavybowgun",  "bowgunStats"      ],
+    ["bow",          "bowStats"         ],
+]);
+const otherMechanics: Readonly<(keyof PayloadWeapon)[]> = [
+    "gunlanceStats", "huntinghornSongs", "switchaxeStats", "chargebladeStats", "insectglaiveStats", "bowStats",
+];
+
+function isRecord(x: unknown): x is UnknownRecord {
+    return (typeof x === "object") && (x !== null) && (!Array.isArray(x));
+}
+
+function isArrayOf<T>(x: unknown, isT: (y: unknown) => y is T): x is T[] {
+    return Array.isArray(x) && x.every((y) => isT(y));
+}
+
+function isString(x: unknown): x is string {
+    return typeof x === "string";
+}
+
+function isStringOrNull(x: unknown): x is string | null {
+    return (x === null) || (typeof x === "string");
+}
+
+function isInteger(x: unknown): x is number {
+    return (typeof x === "number") && (x % 1 === 0);
+}
+
+function isWeaponCategory(x: unknown): x is WeaponCategory {
+    return (typeof x === "string") && weaponCategories.has(x);
+}
+
+function isSharpness(x: unknown): x is Sharpness {
+    return isArrayOf(x, isInteger) && (x.length === 7);
+}
+
+function isEleStatEntry(x: unknown): x is Readonly<[EleStatStr, number]> {
+    if (!Array.isArray(x) || (x.length !== 2)) return false;
+    const [eleStat, value] = x;
+    return isString(eleStat) && (isElementStr(eleStat) || isStatStr(eleStat)) && isInteger(value);
+}
+
+function isRampSkillEntry(x: unknown): x is Readonly<[string, string | null]> {
+    return Array.isArray(x) && (x.length === 2) && isString(x[0]) && isStringOrNull(x[1]);
+}
+
+function isRampSkillSlot(x: unknown): x is Readonly<[string, string | null]>[] {
+    return isArrayOf(x, isRampSkillEntry);
+}
+
+function isBowgunAmmoEntry(x: unknown): x is Readonly<[boolean, number]> {
+    return Array.isArray(x) && (x.length === 2) && (typeof x[0] === "boolean") && isInteger(x[1]);
+}
+
+function isPayloadBowgunStats(x: unknown): x is PayloadBowgunStats {
+    if (!isRecord(x)) return false;
+    const recoil = x["recoil"];
+    const reload = x["reload"];
+    const ammo = x["ammo"];
+    if (!isRecord(x["deviation"]) || !isRecord(ammo)) return false;
+    if (!isInteger(recoil) || !isBowgunRecoil(recoil)) return false;
+    if (!isInteger(reload) || !isBowgunReload(reload)) return false;
+    return Object.keys(ammo).every((k) => isBowgunAmmoType(k) && isBowgunAmmoEntry(ammo[k]));
+}
+
+function isPayloadWeapon(category: WeaponCategory, x: unknown): x is PayloadWeapon {
+    if (!isRecord(x)) return false;
+    const rarity = x["rarity"];
+    const endlineTag = x["endlineTag"];
+    const decoSlots = x["decoSlots"];
+    const baseSharpness = x["baseSharpness"];
+    const maxSharpness = x["maxSharpness"];
+    const bowgunStats = x["bowgunStats"];
+
+    if (!isString(x["id"]) || !isString(x["name"]) || ((endlineTag !== "") && (endlineTag !== "hr"))) return false;
+    if (!isInteger(rarity) || (rarity < 1) || (rarity > 10)) return false;
+    if (!isInteger(x["attack"]) || !isInteger(x["affinity"]) || !isInteger(x["defense"])) return false;
+    if (!isArrayOf(decoSlots, isInteger) || !isDecoSlotsArray(decoSlots)) return false;
+    if (!isArrayOf(x["eleStat"], isEleStatEntry) || !isArrayOf(x["rampSkills"], isRampSkillSlot)) return false;
+
+    if (isMeleeCategory(category) && ((baseSharpness === undefined) || (maxSharpness === undefined))) return false;
+    if ((baseSharpness !== undefined) && !isSharpness(baseSharpness)) return false;
+    if ((maxSharpness  !== undefined) && !isSharpness(maxSharpness )) return false;
+
+    const requiredMechanic = requiredCategoryMechanics.get(category);
+    if ((requiredMechanic !== undefined) && (x[requiredMechanic] === undefined)) return false;
+    for (const k of otherMechanics) {
+        if ((x[k] !== undefined) && !isRecord(x[k])) return false;
+    }
+    if (isBowgunCategory(category) !== (bowgunStats !== undefined)) return false;
+    if ((bowgunStats !== undefined) && !isPayloadBowgunStats(bowgunStats)) return false;
+    return true;
+}
+
+function isPayloadTree(category: WeaponCategory, x: unknown): x is Readonly<[string, Readonly<PayloadWeapon[]>]> {
+    if (!Array.isArray(x) || (x.length !== 2)) return false;
+    const [treeName, weapons] = x;
+    return isString(treeName) && Array.isArray(weapons) && weapons.every((y) => isPayloadWeapon(category, y));
+}
+
+function isPayload(x: unknown): x is Payload {
+    if (!isRecord(x)) return false;
+    const category = x["category"];
+    const trees = x["trees"];
+    return isWeaponCategory(category) && Array.isArray(trees) && trees.every((y) => isPayloadTree(category, y));
+}
+
+/*** Loading ***/
+
+function loadBowgunStats(so: PayloadBowgunStats): BowgunStats {
+    const ammo: {[key: string]: {available: boolean, ammoCapacity: number}} = {};
+    for (const k of Object.keys(so.ammo)) {
+        const [available, ammoCapacity] = so.ammo[k as BowgunAmmoType]; // DANGER: Type assertion!
+        ammo[k] = {available, ammoCapacity};
+    }
+    return {
+        deviation: so.deviation,
+        recoil:    so.recoil,
+        reload:    so.reload,
+        ammo:      ammo as BowgunAmmoMap, // DANGER: Type assertion! The payload has an entry for every ammo type.
+    };
+}
+
+function loadSpecialMechanics(p: PayloadWeapon): SpecialMechanics {
+    const ret: {-readonly [K in keyof SpecialMechanics]: SpecialMechanics[K]} = {};
+    if (p.baseSharpness     !== undefined) ret.baseSharpness     = p.baseSharpness;
+    if (p.maxSharpness      !== undefined) ret.maxSharpness      = p.maxSharpness;
+    if (p.gunlanceStats     !== undefined) ret.gunlanceStats     = p.gunlanceStats;
+    if (p.huntinghornSongs  !== undefined) ret.huntinghornSongs  = p.huntinghornSongs;
+    if (p.switchaxeStats    !== undefined) ret.switchaxeStats    = p.switchaxeStats;
+    if (p.chargebladeStats  !== undefined) ret.chargebladeStats  = p.chargebladeStats;
+    if (p.insectglaiveStats !== undefined) ret.insectglaiveStats = p.insectglaiveStats;
+    if (p.bowgunStats       !== undefined) ret.bowgunStats       = loadBowgunStats(p.bowgunStats);
+    if (p.bowStats          !== undefined) ret.bowStats          = p.bowStats;
+    return ret;
+}
+
+/*
+ * Parses a payload, and rebuilds the weapon objects exactly as the object literal format would have defined them.
+ */
+export function loadWeaponPayload<W extends Weapon>(payloadStr: string): W[] {
+    const payload: unknown = JSON.parse(payloadStr);
+    if (!isPayload(payload)) throw new Error("Weapon payload doesn't match the payload format.");
+
+    const ret: W[] = [];
+    const unresolvedRampSkills: [RampSkillSlot[], PayloadWeapon][] = [];
+
+    for (const [treeName, treeData] of payload.trees) {
+        for (const p of treeData) {
+            const rampSkills: RampSkillSlot[] = []; // Filled in below, once every weapon exists
+            const weapon: Weapon = {
+                category: payload.category,
+                id:       p.id,
+
+                name:       p.name,
+                treeName:   treeName,
+                rarity:     p.rarity,
+                endlineTag: p.endlineTag,
+
+                attack:    p.attack,
+                affinity:  p.affinity,
+                defense:   p.defense,
+                decoSlots: p.decoSlots,
+                eleStat:   new FrozenMap<EleStatStr, number>(new Map(p.eleStat)),
+
+                rampSkills: rampSkills,
+
+                ...loadSpecialMechanics(p),
+
+                filterHelpers: {
+                    nameLower:     toNameFilterString(p.name),
+                    treeNameLower: toNameFilterString(treeName),
+                },
+            };
+            // DANGER: Type assertion! The payload's category determines which special mechanics are present.
+            ret.push(weapon as W);
+            unresolvedRampSkills.push([rampSkills, p]);
+        }
+    }
+
+    // Rampage skills can be inherited from any weapon in the category, so they can only be resolved now.
+    const weaponsByID = new IndexedFrozenMap<string, W>(ret, weaponIdOrders[payload.category], (x) => x.id);
+    for (const [rampSkills, p] of unresolvedRampSkills) {
+        for (const slot of p.rampSkills) {
+            rampSkills.push(slot.map(([rampID, inheritedFromID]): Readonly<[RampageSkill, Weapon | null]> => {
+                const rampSkill = rampsById.get(rampID);
+                if (rampSkill === undefined) throw new Error(`Unknown rampage skill: ${rampID}`);
+                if (inheritedFromID === null) return [rampSkill, null];
+
+                const inheritedFrom = weaponsByID.get(inheritedFromID);
+                if (inheritedFrom === undefined) {
+                    throw new Error(`Unknown weapon: ${payload.category} ${inheritedFromID}`);
+                }
+                return [rampSkill, inheritedFrom];
+            }));
+        }
+    }
+    return ret;
+}
@@ -5,7 +5,11 @@
  * This file is NOT generated code.
  * The generated code files are the '_generated_*.ts' files.
  *
- * This file specifically processes weapon data.
+ * This file validates weapon data, and loads it one category at a time, on demand.
+ *
+ * Each category is imported through the dynamic import() entry points in '_generated_weapon_chunks.ts', so webpack
+ * puts each one in its own chunk that's only downloaded when it's first asked for. Nothing in the app imports the
+ * weapon data statically, so only the categories that are actually used get loaded.
  */
 
 import {
@@ -16,27 +20,13 @@ import {
 } from "../../generic/utils";
 import {
     FrozenMap,
+    IndexedFrozenMap,
 } from "../../generic/frozen-containers";
 
 import {
     type Weapon,
     type MeleeWeapon,
-    
-    type Greatsword,
-    type Longsword,
-    type SwordAndShield,
-    type DualBlades,
-    type Lance,
-    type Gunlance,
-    type Hammer,
-    type HuntingHorn,
-    type SwitchAxe,
-    type ChargeBlade,
-    type InsectGlaive,
-    type LightBowgun,
-    type HeavyBowgun,
-    type Bow,
-
+    type WeaponCategory,
     type WeaponMap,
 
     isMelee, // Type Predicate
@@ -44,24 +34,14 @@ import {
 import {
     toNameFilterString,
 } from "../../common/mappings";
+
 import {
-    populate,
-} from "../../common/utils";
-
-import {greatswordsArray    } from "./_generated_weapon_greatsword";
-import {longswordsArray     } from "./_generated_weapon_longsword";
-import {swordandshieldsArray} from "./_generated_weapon_swordandshield";
-import {dualbladessArray    } from "./_generated_weapon_dualblades";
-import {lancesArray         } from "./_generated_weapon_lance";
-import {gunlancesArray      } from "./_generated_weapon_gunlance";
-import {hammersArray        } from "./_generated_weapon_hammer";
-import {huntinghornsArray   } from "./_generated_weapon_huntinghorn";
-import {switchaxesArray     } from "./_generated_weapon_switchaxe";
-import {chargebladesArray   } from "./_generated_weapon_chargeblade";
-import {insectglaivesArray  } from "./_generated_weapon_insectglaive";
-import {lightbowgunsArray   } from "./_generated_weapon_lightbowgun";
-import {heavybowgunsArray   } from "./_generated_weapon_heavybowgun";
-import {bowsArray           } from "./_generated_weapon_bow";
+    weaponChunkManifest,
+    weaponChunkLoaders,
+} from "./_generated_weapon_chunks";
+import {weaponIdOrders} from "./_generated_indexes";
+
+/*** Validation ***/
 
 function validateMeleeWeapon(w: MeleeWeapon): void {
     const baseSum = sumArray(w.baseSharpness);
@@ -91,52 +71,99 @@ function validateMeleeWeapon(w: MeleeWeapon): void {
     }
 }
 
-function processWeapon<W extends Weapon>(arr: Readonly<W[]>): FrozenMap<string, W> {
-    return populate<W>(
-        arr,
-        (obj) => {
-
-            // Validate common invariants
-            console.assert(/^[a-z0-9]+$/.test(obj.id));
-            console.assert(obj.name !== "");
-            console.assert(obj.treeName !== "");
-            console.assert(isPositiveNZInt(obj.attack));
-            console.assert(obj.affinity % 1 === 0);
-            console.assert((obj.defense % 1 === 0) && (obj.defense >= 0));
-            for (const [_, eleStatValue] of obj.eleStat.entries()) {
-                console.assert(isPositiveNZInt(eleStatValue));
-            }
-
-            console.assert(obj.filterHelpers.nameLower !== "");
-            console.assert(obj.filterHelpers.nameLower === toNameFilterString(obj.name));
-
-            console.assert(obj.filterHelpers.treeNameLower !== "");
-            console.assert(obj.filterHelpers.treeNameLower === toNameFilterString(obj.treeName));
-
-            if (isMelee(obj)) validateMeleeWeapon(obj);
-            return obj;
-        },
-    );
+function validateWeapon(obj: Weapon): void {
+    console.assert(/^[a-z0-9]+$/.test(obj.id));
+    console.assert(obj.name !== "");
+    console.assert(obj.treeName !== "");
+    console.assert(isPositiveNZInt(obj.attack));
+    console.assert(obj.affinity % 1 === 0);
+    console.assert((obj.defense % 1 === 0) && (obj.defense >= 0));
+    for (const [_, eleStatValue] of obj.eleStat.entries()) {
+        console.assert(isPositiveNZInt(eleStatValue));
+    }
+
+    console.assert(obj.filterHelpers.nameLower !== "");
+    console.assert(obj.filterHelpers.nameLower === toNameFilterString(obj.name));
+
+    console.assert(obj.filterHelpers.treeNameLower !== "");
+    console.assert(obj.filterHelpers.treeNameLower === toNameFilterString(obj.treeName));
+
+    if (isMelee(obj)) validateMeleeWeapon(obj);
+}
+
+// The map is looked up through the code generator's precomputed ID order, so it doesn't need to be built
+function processWeapons(category: WeaponCategory, arr: Readonly<Weapon[]>): FrozenMap<string, Weapon> {
+    for (const obj of arr) {
+        console.assert(obj.category === category);
+        validateWeapon(obj);
+    }
+    return new IndexedFrozenMap<string, Weapon>(arr, weaponIdOrders[category], (x) => x.id);
+}
+
+/*** Loading ***/
+
+interface LoadedCategory {
+    readonly array: Readonly<Weapon[]>; // In generated order, which is how the search index numbers them
+    readonly map:   FrozenMap<string, Weapon>;
 }
 
-const weaponsMap: Readonly<WeaponMap> = {
-    greatsword:     processWeapon<Greatsword    >(greatswordsArray    ),
-    longsword:      processWeapon<Longsword     >(longswordsArray     ),
-    swordandshield: processWeapon<SwordAndShield>(swordandshieldsArray),
-    dualblades:     processWeapon<DualBlades    >(dualbladessArray    ),
-    lance:          processWeapon<Lance         >(lancesArray         ),
-    gunlance:       processWeapon<Gunlance      >(gunlancesArray      ),
-    hammer:         processWeapon<Hammer        >(hammersArray        ),
-    huntinghorn:    processWeapon<HuntingHorn   >(huntinghornsArray   ),
-    switchaxe:      processWeapon<SwitchAxe     >(switchaxesArray     ),
-    chargeblade:    processWeapon<ChargeBlade   >(chargebladesArray   ),
-    insectglaive:   processWeapon<InsectGlaive  >(insectglaivesArray  ),
-    lightbowgun:    processWeapon<LightBowgun   >(lightbowgunsArray   ),
-    heavybowgun:    processWeapon<HeavyBowgun   >(heavybowgunsArray   ),
-    bow:            processWeapon<Bow           >(bowsArray           ),
-};
+const loading = new Map<WeaponCategory, Promise<LoadedCategory>>();
+const loaded = new Map<WeaponCategory, LoadedCategory>();
+
+// In the same order as the code generator's WEAPON_CATEGORIES
+const weaponCategories = Object.keys(weaponChunkManifest) as WeaponCategory[]; // DANGER: Type assertion!
+
+/*
+ * Loads a weapon category's chunk (if it hasn't been loaded already), and resolves to its weapon map.
+ *
+ * Concurrent calls for the same category share the same request. A failed load isn't cached, so it can be retried.
+ */
+export function loadWeaponCategory<K extends WeaponCategory>(category: K): Promise<WeaponMap[K]> {
+    let ret = loading.get(category);
+    if (ret === undefined) {
+        ret = weaponChunkLoaders[category]().then(
+            (arr) => {
+                const map = processWeapons(category, arr);
+                console.assert(map.size === weaponChunkManifest[category].numWeapons);
+                const obj = {array: arr, map};
+                loaded.set(category, obj);
+                return obj;
+            },
+            (err) => {
+                loading.delete(category);
+                throw err;
+            },
+        );
+        loading.set(category, ret);
+    }
+    // DANGER: Type assertion! Each category's chunk only has weapons of that category.
+    return ret.then((x) => x.map as WeaponMap[K]);
+}
+
+/*
+ * Returns a weapon category's map if it has already finished loading, or null otherwise.
+ */
+export function getLoadedWeaponCategory<K extends WeaponCategory>(category: K): WeaponMap[K] | null {
+    const ret = loaded.get(category);
+    // DANGER: Type assertion! Each category's chunk only has weapons of that category.
+    return (ret === undefined) ? null : (ret.map as WeaponMap[K]);
+}
+
+/*
+ * Same as getLoadedWeaponCategory(), but returns the weapons as an array in generated order.
+ */
+export function getLoadedWeaponArray(category: WeaponCategory): Readonly<Weapon[]> | null {
+    const ret = loaded.get(category);
+    return (ret === undefined) ? null : ret.array;
+}
+
+/*
+ * Starts loading every weapon category in the background, e.g. once the rest of the page has finished loading.
+ */
+export function preloadAllWeaponCategories(): Promise<void> {
+    return Promise.all(weaponCategories.map((x) => loadWeaponCategory(x))).then(() => undefined);
+}
 
 export {
-    weaponsMap,
+    weaponCategories,
 };
-
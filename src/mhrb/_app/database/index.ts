@@ -12,7 +12,6 @@ import {
     type RampageSkill,
     type WeaponSpecialSelection,
     type Weapon,
-    type WeaponMap,
     type ArmourSlot,
     type ArmourPiece,
     type ArmourSet,
@@ -26,9 +25,23 @@ import {
     rampageSkillsMap,
     rampageSkillsMapShortIds,
     decosMap,
-    weaponsMap,
     armourMap,
     armourArrays,
+
+    loadWeaponCategory,
+} from "./generated_code";
+export {
+    loadWeaponCategory,
+    getLoadedWeaponCategory,
+    preloadAllWeaponCategories,
+    weaponCategories,
+
+    armourPiecesWithSkill,
+    decosWithSkill,
+    weaponsWithRampSkill,
+
+    type NameSearchResults,
+    searchByName,
 } from "./generated_code";
 import {
     petalaceMap,
@@ -52,10 +65,6 @@ export interface MHRDatabase {
         readonly shortIdsMap: Readonly<FrozenMap<string, RampageSkill>>;
     },
     readonly weaponSpecialSelections: ArrayMapPair<number, WeaponSpecialSelection>;
-    readonly weapons: {
-        readonly array: Readonly<Weapon[]>;
-        readonly map:   WeaponMap;
-    },
     readonly armour: {
         readonly arrays: Readonly<{[Key in ArmourSlot]: Readonly<ArmourPiece[]>}>;
         readonly map:    Readonly<FrozenMap<number, ArmourSet>>;
@@ -64,17 +73,6 @@ export interface MHRDatabase {
     readonly decorations: ArrayMapPair<number, Decoration>;
 }
 
-function getWeaponsArray() {
-    let ret: Weapon[] = [];
-    for (const [_, dataMap] of Object.entries(weaponsMap)) {
-        //ret = ret.concat(Array.from(dataMap.values()));
-        for (const [_, weapon] of dataMap.entries()) {
-            ret.push(weapon);
-        }
-    }
-    return ret;
-}
-
 export const db: MHRDatabase = {
     skills: {
         array:       Array.from(skillMap.values()),
@@ -89,10 +87,6 @@ export const db: MHRDatabase = {
         array: Array.from(specialSelectionTypesMap.values()),
         map:   specialSelectionTypesMap,
     },
-    weapons: {
-        array: getWeaponsArray(),
-        map:   weaponsMap,
-    },
     armour: {
         arrays: armourArrays,
         map:    armourMap,
@@ -107,8 +101,10 @@ export const db: MHRDatabase = {
     },
 };
 
-export function getDefaultWeapon(): Weapon {
-    const ret = db.weapons.map.greatsword.get("1f");
+// Weapons aren't part of the database object since they're loaded one category at a time (see
+// generated_code/weapons.ts). Only the default weapon's category needs to be loaded at startup.
+export async function loadDefaultWeapon(): Promise<Weapon> {
+    const ret = (await loadWeaponCategory("greatsword")).get("1f");
     if (ret === undefined) throw "Expected to find something.";
     return ret;
 }
@@ -39,3 +39,71 @@ export class FrozenMap<K, V> {
     }
 }
 
+
+/*
+ * A FrozenMap over an array that's already sorted by a precomputed order, so nothing needs to be built.
+ *
+ * `order` has the array's positions sorted by key (e.g. as emitted by the code generator), and lookups are binary
+ * searches over it. Iteration is in array order, the same as a FrozenMap populated from the array would be.
+ */
+export class IndexedFrozenMap<K extends string | number, V> extends FrozenMap<K, V> {
+    private readonly _array: Readonly<V[]>;
+    private readonly _order: Readonly<number[]>;
+    private readonly _keyFn: (v: V) => K;
+
+    constructor(array: Readonly<V[]>, order: Readonly<number[]>, keyFn: (v: V) => K) {
+        super(new Map<K, V>());
+        this._array = array;
+        this._order = order;
+        this._keyFn = keyFn;
+
+        // Keys must be strictly increasing in order, which also means they're unique
+        console.assert(order.length === array.length);
+        for (let i = 1; i < order.length; ++i) {
+            console.assert(this._keyAt(i - 1) < this._keyAt(i));
+        }
+    }
+
+    private _keyAt(i: number): K {
+        const v = this._array[this._order[i]!]; // DANGER: Type assertion!
+        if (v === undefined) throw new Error(`Order refers to a nonexistent element: ${this._order[i]}`);
+        return this._keyFn(v);
+    }
+
+    /*
+     * Returns the key's position in the array, or undefined if the key isn't in the map.
+     */
+    indexOf(key: K): number | undefined {
+        let lo = 0;
+        let hi = this._order.length;
+        while (lo < hi) {
+            const mid = (lo + hi) >>> 1;
+            if (this._keyAt(mid) < key) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return ((lo < this._order.length) && (this._keyAt(lo) === key)) ? this._order[lo] : undefined;
+    }
+
+    override get(key: K): V | undefined {
+        const i = this.indexOf(key);
+        return (i === undefined) ? undefined : this._array[i];
+    }
+    override has(key: K): boolean {
+        return (this.indexOf(key) !== undefined);
+    }
+    override keys(): IterableIterator<K> {
+        return this._array.map(this._keyFn).values();
+    }
+    override values(): IterableIterator<V> {
+        return this._array.values();
+    }
+    override entries(): IterableIterator<[K, V]> {
+        return this._array.map((v): [K, V] => [this._keyFn(v), v]).values();
+    }
+    override get size(): number {
+        return this._array.length;
+    }
+}
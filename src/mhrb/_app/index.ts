@@ -14,6 +14,7 @@ import * as check from "./check";
 import {removeElementByID} from "./utils";
 
 import {db} from "./database";
+import {getBuildFromQueryString} from "./query_strings";
 import {MHRBuilderAppInner} from "./components/MHRBuilderAppInner";
 
 import "./css/index.css";
@@ -64,6 +65,7 @@ class MHRBuilderApp extends React.Component {
 
                 // Two states: Either it's null, or it's a fully-constructed raw data object. Don't modify it once it's built.
                 rawData: null,
+                initialBuild: null, // Set at the same time as rawData
             };
 
         this.myRefs = {
@@ -92,7 +94,9 @@ class MHRBuilderApp extends React.Component {
 
     async componentDidMount() {
         const rawData = {"readonly": db};
-        this.setState({rawData: rawData});
+        // The initial build needs its weapon's category to be loaded first
+        const initialBuild = await getBuildFromQueryString(rawData);
+        this.setState({rawData: rawData, initialBuild: initialBuild});
         removeElementByID("loading-spinner");
 
         document.addEventListener("keydown", this.handleKeypress);
@@ -153,6 +157,7 @@ class MHRBuilderApp extends React.Component {
                         {
                         ref: this.myRefs.appInner,
                         rawDataRO: this.state.rawData,
+                        initialBuild: this.state.initialBuild,
                         },
                         null,
                     ),
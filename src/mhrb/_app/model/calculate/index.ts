@@ -506,9 +506,11 @@ function getSharpnessValues(
     const realSharpnessBar: SharpnessMutable = applyHandicraft(maxSharpness, handicraftLevel);
 
     let r = sharpnessLevelReduction;
-    for (const [i, sharpnessValue] of realSharpnessBar.slice().reverse().entries()) {
-    //for (let i = realSharpnessBar.length - 1; i > 0; --i) {
+    // Red is never removed
+    for (let i = realSharpnessBar.length - 1; i > 0; --i) {
         if (r <= 0) break;
+        const sharpnessValue = realSharpnessBar[i];
+        if (sharpnessValue === undefined) throw new Error("Unexpected undefined.");
         if (sharpnessValue > 0) {
             realSharpnessBar[i] = 0;
             --r;
@@ -548,8 +550,9 @@ function applyHandicraft(
         throw new Error("Unexpected value.");
     }
 
-    for (const [i, sharpnessValue] of realSharpnessBar.slice().reverse().entries()) {
-        const currHits = sharpnessValue;
+    for (let i = realSharpnessBar.length - 1; i >= 0; --i) {
+        const currHits = realSharpnessBar[i];
+        if (currHits === undefined) throw new Error("Unexpected undefined.");
         const newHits = currHits - hitsToSubtract;
         if (newHits < 0) {
             hitsToSubtract = -newHits;
@@ -565,7 +568,9 @@ function applyHandicraft(
 
 function getHighestSharpnessIndex(realSharpnessBar: Sharpness): number {
     let highestIndex = -1;
-    for (const [i, sharpnessValue] of realSharpnessBar.slice().reverse().entries()) {
+    for (let i = realSharpnessBar.length - 1; i >= 0; --i) {
+        const sharpnessValue = realSharpnessBar[i];
+        if (sharpnessValue === undefined) throw new Error("Unexpected undefined.");
         if (sharpnessValue > 0) {
             highestIndex = i;
             break;
@@ -619,10 +624,14 @@ function applyBuffsToBowgunAmmoAndClamp(
         const subtable1 = bowgunRecoilPerAmmoTable.get(k);
         if (!subtable1) throw new Error("Key must exist.");
         const recoil = subtable1[recoilStage];
-        if (typeof recoil !== "number") throw new Error("Must be a number");
-        if (!isBowgunRecoil(recoil)) throw new Error("Invalid number.");
-        if (recoil > 3) throw new Error("Invalid number.");
-        bowgunStats.ammo[k].recoil = recoil;
+        if (recoil === null) {
+            bowgunStats.ammo[k].recoil = null; // Wyvern ammo, which the UI writes "Wyvern" for
+        } else {
+            if (typeof recoil !== "number") throw new Error("Must be a number");
+            if (!isBowgunRecoil(recoil)) throw new Error("Invalid number.");
+            if (recoil > 3) throw new Error("Invalid number.");
+            bowgunStats.ammo[k].recoil = recoil;
+        }
 
         const subtable2 = bowgunReloadPerAmmoTable.get(k);
         if (!subtable2) throw new Error("Key must exist.");
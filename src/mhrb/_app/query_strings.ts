@@ -10,8 +10,11 @@ import * as check from "./check";
 import {Build} from "./model/build";
 
 import {
-    getDefaultWeapon,
+    loadWeaponCategory,
+    getLoadedWeaponCategory,
+    loadDefaultWeapon,
 } from "./database";
+import {isWeaponCategoryStr} from "./common";
 
 const assert = console.assert;
 
@@ -40,8 +43,18 @@ function updateQueryKeys(map) {
 /*** BUILD DESERIALIZATION **************************************************************/
 /****************************************************************************************/
 
-export function getBuildFromQueryString(db) {
-    const build = new Build(db, getDefaultWeapon());
+// Async since the weapon categories it needs (the default weapon's, and the query string weapon's) might not have
+// been loaded yet. Everything else is parsed synchronously once they're loaded.
+export async function getBuildFromQueryString(db) {
+    const basicEquipsStr = getQueryValue("a");
+    const weaponCategory = (typeof basicEquipsStr === "string") ? basicEquipsStr.split(SPLIT_CHAR)[0] : undefined;
+
+    const defaultWeapon = await loadDefaultWeapon();
+    if (isWeaponCategoryStr(weaponCategory)) {
+        await loadWeaponCategory(weaponCategory);
+    }
+
+    const build = new Build(db, defaultWeapon);
 
     function processIfQueryIsValid(queryStringValue, expectedLength, processingFunction) {
         if (queryStringValue === "") return; // Do nothing for empty value
@@ -60,7 +73,6 @@ export function getBuildFromQueryString(db) {
         }
     }
 
-    const basicEquipsStr = getQueryValue("a");
     processIfQueryIsValid(basicEquipsStr, 8, readDecomposedBasicEquipsStr);
 
     // IMPORTANT: Parsing rampage skills is dependent on first parsing the weapon.
@@ -100,8 +112,8 @@ function readDecomposedBasicEquipsStr(arr, db, build) {
         };
     const petalaceID     = arr[7];
 
-    const weaponCategoryMap = db.readonly.weapons.map[weaponCategory];
-    if (weaponCategoryMap !== undefined) {
+    const weaponCategoryMap = isWeaponCategoryStr(weaponCategory) ? getLoadedWeaponCategory(weaponCategory) : null;
+    if (weaponCategoryMap !== null) {
         const weaponRO = weaponCategoryMap.get(weaponID);
         if (weaponRO !== undefined) {
             build.setWeapon(db, weaponRO);